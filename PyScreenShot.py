@@ -11,13 +11,18 @@ import argparse
 import logging
 import logging.handlers
 import os
+import sqlite3
 import sys
+import threading
+from collections.abc import Iterable
+from concurrent.futures import Future
 from datetime import datetime
-from itertools import pairwise
 from pathlib import Path
 from queue import Queue
+from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo
 
+import mss.screenshot
 import wx
 from screeninfo import get_monitors
 from wx.adv import (
@@ -29,16 +34,29 @@ from wx.adv import (
 
 import version as ver
 from app_settings import AppSettings
-from capture_manager import CaptureManager
+from burst_capture import BurstCapture
+from capture_filename import date_filename, sequence_filename
+from capture_history import CaptureHistory
+from capture_manager import CaptureManager, ImageEncoder, get_encoder
+from capture_request import ACTIVE_WINDOW, CaptureRequest, target_from_setting, trimming_for
 from config_manager import ConfigManager
-from dialogs import PeriodicDialog, SettingsDialog
+from dialogs import DiagnosticsDialog, HistoryDialog, PeriodicDialog, SettingsDialog
 from hotkey_manager import HotkeyManager
 from myutils.util import (
     get_special_directory,
     platform_info,
-    scan_directory,
 )
+from periodic_scheduler import PeriodicScheduler
+from redaction import Redactor
 from res import app_icon, menu_image
+from ring_buffer import PreEventRecorder
+from sequence_index import SequenceIndex
+from tile_recorder import TileRecorder
+from video_recorder import VideoRecorder
+from wx_notifier import WxNotifier
+
+if TYPE_CHECKING:
+    from capture_timing import CaptureTrace
 
 logger = logging.getLogger(__name__)
 
@@ -69,6 +87,7 @@ class ScreenShot(TaskBarIcon):
     # バージョン情報
     ID_MENU_HELP: int  = 901         # ヘルプを表示
     ID_MENU_ABOUT: int = 902         # バージョン情報
+    ID_MENU_DIAGNOSTICS: int = 903   # 診断情報
     # 環境設定
     ID_MENU_SETTINGS: int = 101
     # クイック設定
@@ -77,11 +96,14 @@ class ScreenShot(TaskBarIcon):
     ID_MENU_DELAYED: int  = 104      # 遅延キャプチャーを有効
     ID_MENU_TRIMMING: int = 105      # トリミングを有効
     ID_MENU_RESET: int    = 106      # シーケンス番号のリセット
+    ID_MENU_TIMING: int   = 107      # 処理時間を計測する
     # 保存先フォルダ(Base)
     ID_MENU_FOLDER1: int = 201
     # フォルダを開く
     ID_MENU_OPEN_AUTO: int     = 301 # 自動保存フォルダ(選択中)
     ID_MENU_OPEN_PERIODIC: int = 302 # 定期実行フォルダ
+    # キャプチャーを検索
+    ID_MENU_FIND: int = 351
     # 定期実行設定
     ID_MENU_PERIODIC: int = 401
     # クリップボードへコピー
@@ -91,6 +113,7 @@ class ScreenShot(TaskBarIcon):
     # PNG保存
     ID_MENU_SCREEN0: int = 601       # デスクトップ
     # ID_MENU_SCREEN1: int = 602       # ディスプレイ1
+    ID_MENU_ALL_DISPLAYS: int = 680  # 全ディスプレイ（個別ファイル）
     ID_MENU_ACTIVE: int  = 690       # アクティブウィンドウ
     # 終了
     ID_MENU_EXIT: int = 991
@@ -113,6 +136,8 @@ class ScreenShot(TaskBarIcon):
     CONFIG_FILE: Path = Path()
     # ヘルプファイル（現在未使用）
     HELP_FILE: Path = Path()
+    # キャプチャー履歴のインデックス
+    HISTORY_FILE: Path = Path()
 
     MY_PICTURES: Path = Path()
     disable_hotkeys: bool = False
@@ -128,17 +153,33 @@ class ScreenShot(TaskBarIcon):
         self.config = ConfigManager(ScreenShot.CONFIG_FILE, ScreenShot.MY_PICTURES, ScreenShot.MAX_SAVE_FOLDERS)
         self.settings = AppSettings()
         # キャプチャー管理、サウンド管理オブジェクト生成
-        self.capture = CaptureManager()
+        self.capture = CaptureManager(notifier=WxNotifier())
         # ホット・キー管理オブジェクト生成
         self.hotkey = HotkeyManager()
 
         # キャプチャーHotkeyアクセレーターリスト（0:デスクトップ、1～:ディスプレイ、last:アクティブウィンドウ）
         self.menu_clipboard: list[tuple] = []
         self.menu_imagefile: list[tuple] = []
+        self.menu_all_displays: tuple | None = None
         # シーケンス番号保持用
         self.sequence: int = -1
+        # 保存フォルダ毎のシーケンス番号インデックス（key: (フォルダ, 接頭語, 桁数, 拡張子)）
+        self.sequence_indexes: dict[tuple[str, str, int, str], SequenceIndex] = {}
+        # 書き込み完了待ちのシーケンス番号（key: ファイル名）
+        self.sequence_reserved: dict[str, tuple[SequenceIndex, int]] = {}
+        # シーケンス番号関連の排他（定期実行はスケジューラーのスレッドで動く）
+        self.sequence_lock = threading.RLock()
+        # 定期実行スケジューラー
+        self.periodic = PeriodicScheduler(self.do_periodic)
+        # 定期実行の1ファイルへの記録（差分（タイル）、動画）
+        self.periodic_recorder: TileRecorder | VideoRecorder | None = None
+        # 連写キャプチャー
+        self.burst = BurstCapture(self.grab_target, self.save_burst_frames)
+        # プリイベントバッファ（直前N秒のキャプチャー）
+        self.prebuffer = PreEventRecorder(self.grab_target)
+        self.prebuffer_flush: threading.Thread | None = None
         # キャプチャー要求Queue
-        self.req_queue: Queue = Queue()
+        self.req_queue: Queue[CaptureRequest] = Queue()
         # 初期処理
         self.initialize()
 
@@ -162,8 +203,22 @@ class ScreenShot(TaskBarIcon):
         # 設定値の初期設定
         self.config.config_from_settings(self.settings)
         # 設定ファイルの読み込み
-        if not self.config.load():
+        if self.config.load() != 0:
             logger.warning(f"設定ファイルの読み込み/解析に失敗しました。")
+        elif self.config.config_to_settings(self.settings):
+            # 設定不整合を修正したので再保存
+            self.config.config_from_settings(self.settings)
+            self.config.save()
+        # 処理時間の計測
+        self.capture.timings.enabled = self.settings.diagnostics
+        # 墨消し（設定ファイルでのみ指定する）
+        self.capture.redactor = Redactor.from_settings(self.settings)
+        # キャプチャー履歴（インデックスが使えなくてもキャプチャーは続ける）
+        if self.settings.capture_history:
+            try:
+                self.capture.history = CaptureHistory(ScreenShot.HISTORY_FILE)
+            except sqlite3.Error:
+                logger.exception(f"Capture history '{ScreenShot.HISTORY_FILE}' is not available")
         # メニューアイコン画像の展開
         w, h = menu_image.image_size
         self._icon_img = wx.ImageList(w, h)
@@ -174,6 +229,13 @@ class ScreenShot(TaskBarIcon):
         self.add_caputure_hotkeys()
         # 定期実行停止用Hotkey展開、設定
         self.add_periodic_stop_hotkey()
+        # 連写キャプチャー用Hotkey設定
+        self.add_burst_hotkey()
+        # プリイベントバッファの記録開始、保存用Hotkey設定
+        self.start_prebuffer()
+        self.add_prebuffer_hotkey()
+        # アクティブウィンドウの追跡開始（UIスレッドのメッセージループでイベントを受ける）
+        self.capture.backend.start()
 
     def add_caputure_hotkeys(self) -> None:
         """キャプチャー用ホット・キー登録処理
@@ -226,6 +288,12 @@ class ScreenShot(TaskBarIcon):
             self.hotkey.add_clipboard(hotkey_clipboard, id_clipboard, self.copy_to_clipboard)
             self.hotkey.add_imagefile(hotkey_imagefile, id_imagefile, self.save_to_imagefile)
 
+        # 全ディスプレイ（個別ファイル、ディスプレイが複数の場合のみ）
+        self.menu_all_displays = None
+        if disp > 1:
+            self.menu_all_displays = (f"{hk_imagef}+A", ScreenShot.ID_MENU_ALL_DISPLAYS, "全ディスプレイ（個別ファイル）")
+            self.hotkey.add_imagefile(self.menu_all_displays[0], ScreenShot.ID_MENU_ALL_DISPLAYS, self.save_to_imagefile)
+
     def remove_capture_hotkey(self) -> None:
         """キャプチャー用ホット・キー削除処理
 
@@ -274,6 +342,54 @@ class ScreenShot(TaskBarIcon):
         # 現在のHotkeyを削除
         self.hotkey.remove_periodic_stop()
 
+    def add_burst_hotkey(self) -> None:
+        """連写キャプチャー用ホット・キー登録処理
+
+        * 連写キャプチャーが有効な場合のみ登録する（修飾キーはキャプチャー用と同じ選択肢）
+
+        Args:
+            none
+
+        Returns:
+            none
+
+        """
+        if ScreenShot.disable_hotkeys or not self.settings.burst_capture:
+            return
+
+        modifire: str = self.hotkey.get_capture_hotkey(self.settings.burst_modifier)
+        fkey: str = f"F{self.settings.burst_fkey + 1}"
+
+        self.hotkey.add_burst(f"{modifire}+{fkey}", self.start_burst_capture)
+
+    def remove_burst_hotkey(self) -> None:
+        """連写キャプチャー用ホット・キー削除処理"""
+        self.hotkey.remove_burst()
+
+    def add_prebuffer_hotkey(self) -> None:
+        """プリイベントバッファ保存用ホット・キー登録処理
+
+        * プリイベントバッファが有効な場合のみ登録する（修飾キーはキャプチャー用と同じ選択肢）
+
+        Args:
+            none
+
+        Returns:
+            none
+
+        """
+        if ScreenShot.disable_hotkeys or not self.settings.prebuffer:
+            return
+
+        modifire: str = self.hotkey.get_capture_hotkey(self.settings.prebuffer_modifier)
+        fkey: str = f"F{self.settings.prebuffer_fkey + 1}"
+
+        self.hotkey.add_prebuffer(f"{modifire}+{fkey}", self.flush_prebuffer)
+
+    def remove_prebuffer_hotkey(self) -> None:
+        """プリイベントバッファ保存用ホット・キー削除処理"""
+        self.hotkey.remove_prebuffer()
+
     def CreatePopupMenu(self) -> wx.Menu:
         """Popupメニューの生成 (override)
 
@@ -307,46 +423,7 @@ class ScreenShot(TaskBarIcon):
         )
         item.SetBitmap(wx.BitmapBundle(self._icon_img.GetBitmap(ScreenShot.ICON_SETTINGS)))
         # クイック設定
-        sub_menu = wx.Menu()
-        sub_item = create_menu_item(
-            sub_menu,
-            ScreenShot.ID_MENU_MCURSOR,
-            "マウスカーソルをキャプチャーする",
-            self.on_menu_toggle_item,
-            kind=wx.ITEM_CHECK,
-        )
-        # Windowsでは現状マウスカーソルがキャプチャー出来ないので「無効」にしておく
-        sub_item.Enable(enable=False)
-        sub_item = create_menu_item(
-            sub_menu,
-            ScreenShot.ID_MENU_SOUND,
-            "キャプチャー終了時に音を鳴らす",
-            self.on_menu_toggle_item,
-            kind=wx.ITEM_CHECK,
-        )
-        sub_item.Check(self.settings.sound_on_capture)
-        sub_item = create_menu_item(
-            sub_menu,
-            ScreenShot.ID_MENU_DELAYED,
-            "遅延キャプチャーをする",
-            self.on_menu_toggle_item,
-            kind=wx.ITEM_CHECK,
-        )
-        sub_item.Check(self.settings.delayed_capture)
-        sub_item = create_menu_item(
-            sub_menu,
-            ScreenShot.ID_MENU_TRIMMING,
-            "トリミングをする",
-            self.on_menu_toggle_item,
-            kind=wx.ITEM_CHECK,
-        )
-        sub_item.Check(self.settings.trimming)
-        sub_item = create_menu_item(
-            sub_menu,
-            ScreenShot.ID_MENU_RESET,
-            "シーケンス番号のリセット",
-            self.on_menu_reset_sequence,
-        )
+        sub_menu = self._create_quick_settings_menu()
         item = menu.AppendSubMenu(sub_menu, "クイック設定")
         item.SetBitmap(wx.BitmapBundle(self._icon_img.GetBitmap(ScreenShot.ICON_QUICK_SETTINGS)))
         menu.AppendSeparator()
@@ -380,6 +457,8 @@ class ScreenShot(TaskBarIcon):
         )
         item = menu.AppendSubMenu(sub_menu, "フォルダを開く")
         item.SetBitmap(wx.BitmapBundle(self._icon_img.GetBitmap(ScreenShot.ICON_OPEN_FOLDER)))
+        # キャプチャーの検索、診断情報
+        self._append_tool_items(menu)
         menu.AppendSeparator()
         # 定期実行設定
         item = create_menu_item(
@@ -390,7 +469,7 @@ class ScreenShot(TaskBarIcon):
         )
         item.SetBitmap(wx.BitmapBundle(self._icon_img.GetBitmap(ScreenShot.ICON_PERIODIC)))
         menu.AppendSeparator()
-        # キャプチャー（クリップボード、PNGファイル）
+        # キャプチャー（クリップボード、画像ファイル）
         sub_menu1 = wx.Menu()
         sub_menu2 = wx.Menu()
         for n in range(len(self.menu_clipboard)):
@@ -406,9 +485,19 @@ class ScreenShot(TaskBarIcon):
                 f"{self.menu_imagefile[n][2]}\t{self.menu_imagefile[n][0] if not ScreenShot.disable_hotkeys else ''}",
                 self.on_menu_imagefile,
             )
+        if self.menu_all_displays is not None:
+            hotkey, menu_id, name = self.menu_all_displays
+            create_menu_item(
+                sub_menu2,
+                menu_id,
+                f"{name}\t{hotkey if not ScreenShot.disable_hotkeys else ''}",
+                self.on_menu_imagefile,
+            )
         item = menu.AppendSubMenu(sub_menu1, "クリップボードへコピー")
         item.SetBitmap(wx.BitmapBundle(self._icon_img.GetBitmap(ScreenShot.ICON_COPY_TO_CB)))
-        item = menu.AppendSubMenu(sub_menu2, "PNGファイルへ保存")
+        # 保存形式は画像エンコーダーの拡張子から表示する
+        extension: str = self.get_image_encoder().extension
+        item = menu.AppendSubMenu(sub_menu2, f"{extension.removeprefix('.').upper()}ファイルへ保存")
         item.SetBitmap(wx.BitmapBundle(self._icon_img.GetBitmap(ScreenShot.ICON_SAVE_TO_PNG)))
         menu.AppendSeparator()
         # 終了
@@ -417,10 +506,97 @@ class ScreenShot(TaskBarIcon):
 
         return menu
 
+    def _create_quick_settings_menu(self) -> wx.Menu:
+        """クイック設定のサブメニューの生成
+
+        Args:
+            none
+
+        Returns:
+            wx.Menuオブジェクト
+
+        """
+        sub_menu = wx.Menu()
+        sub_item = create_menu_item(
+            sub_menu,
+            ScreenShot.ID_MENU_MCURSOR,
+            "マウスカーソルをキャプチャーする",
+            self.on_menu_toggle_item,
+            kind=wx.ITEM_CHECK,
+        )
+        # Windowsでは現状マウスカーソルがキャプチャー出来ないので「無効」にしておく
+        sub_item.Enable(enable=False)
+        sub_item = create_menu_item(
+            sub_menu,
+            ScreenShot.ID_MENU_SOUND,
+            "キャプチャー終了時に音を鳴らす",
+            self.on_menu_toggle_item,
+            kind=wx.ITEM_CHECK,
+        )
+        sub_item.Check(self.settings.sound_on_capture)
+        sub_item = create_menu_item(
+            sub_menu,
+            ScreenShot.ID_MENU_DELAYED,
+            "遅延キャプチャーをする",
+            self.on_menu_toggle_item,
+            kind=wx.ITEM_CHECK,
+        )
+        sub_item.Check(self.settings.delayed_capture)
+        sub_item = create_menu_item(
+            sub_menu,
+            ScreenShot.ID_MENU_TRIMMING,
+            "トリミングをする",
+            self.on_menu_toggle_item,
+            kind=wx.ITEM_CHECK,
+        )
+        sub_item.Check(self.settings.trimming)
+        sub_item = create_menu_item(
+            sub_menu,
+            ScreenShot.ID_MENU_TIMING,
+            "処理時間を計測する",
+            self.on_menu_toggle_item,
+            kind=wx.ITEM_CHECK,
+        )
+        sub_item.Check(self.settings.diagnostics)
+        sub_item = create_menu_item(
+            sub_menu,
+            ScreenShot.ID_MENU_RESET,
+            "シーケンス番号のリセット",
+            self.on_menu_reset_sequence,
+        )
+
+        return sub_menu
+
+    def _append_tool_items(self, menu: wx.Menu) -> None:
+        """ツール（キャプチャーの検索、診断情報）のメニュー項目の追加
+
+        Args:
+            menu(wx.Menu): 追加先のメニュー
+
+        Returns:
+            none
+
+        """
+        # キャプチャーを検索
+        if self.capture.history is not None:
+            create_menu_item(
+                menu,
+                ScreenShot.ID_MENU_FIND,
+                "キャプチャーを検索...",
+                self.on_menu_find_capture,
+            )
+        # 診断情報
+        create_menu_item(
+            menu,
+            ScreenShot.ID_MENU_DIAGNOSTICS,
+            "診断情報...",
+            self.on_menu_diagnostics,
+        )
+
     def do_capture(self) -> None:
         """キャプチャー実行
 
-        * Queueの要求に従い、キャプチャー画像を処理する
+        * Queueの要求に従い、キャプチャーを実行する
 
         Args:
             none
@@ -429,20 +605,93 @@ class ScreenShot(TaskBarIcon):
             none
 
         """
-        moni_no, filename = self.req_queue.get()
-        logger.debug(f"do_capture {moni_no=}, {filename=}")
+        # UIスレッドなので、処理待ちが上限なら待たずに破棄する
+        self.execute_request(self.req_queue.get(), block=False)
+
+    def execute_request(
+        self,
+        request: CaptureRequest,
+        sct_img: mss.screenshot.ScreenShot | None = None,
+        *,
+        block: bool = True,
+    ) -> None:
+        """キャプチャー要求の実行
+
+        * 画面の取得は呼び出しスレッド（UIまたは定期実行スケジューラー）で行う
+        * 変換・エンコード・書き込みはCaptureManagerのワーカーで行われる
+
+        Args:
+            request (CaptureRequest): キャプチャー要求
+            sct_img (ScreenShot): 取得済みの画像（None=ここで取得する）
+            block (bool): True=ワーカーの処理待ちが上限なら空きを待つ、False=待たずに破棄する（UIスレッド用）
 
+        Returns:
+            none
+
+        """
+        logger.debug(f"execute_request {request!r}")
+
+        with self.sequence_lock:
+            reserved: tuple[SequenceIndex, int] | None = self.sequence_reserved.pop(request.filename, None)
+        future = None
         try:
-            self.capture.execute_capture(
-                moni_no=moni_no,
-                filename=filename,
-                settings=self.settings,
-            )
+            future = self.capture.execute_capture(request, sct_img=sct_img, block=block)
             logger.debug(
-                f"Capture request completed for {filename if filename else 'clipboard'}",
+                f"Capture request submitted for {request.filename if request.filename else 'clipboard'}",
             )
         except Exception:
             logger.exception(f"Capture failed")
+        finally:
+            self.settle_sequence(reserved, future)
+
+    def execute_display_requests(self, requests: list[CaptureRequest]) -> None:
+        """全ディスプレイ（個別ファイル）のキャプチャー要求の実行
+
+        * デスクトップ全体を1回だけ取得し、ディスプレイ毎のファイルをワーカーで並列にエンコードする
+        * UIスレッドから呼ばれるので、ワーカーの処理待ちが上限なら待たずに破棄する
+
+        Args:
+            requests (list): ディスプレイ1～の順のキャプチャー要求
+
+        Returns:
+            none
+
+        """
+        logger.debug(f"execute_display_requests {requests!r}")
+
+        with self.sequence_lock:
+            reserved = [self.sequence_reserved.pop(request.filename, None) for request in requests]
+        futures: list[Future] = []
+        try:
+            futures = self.capture.execute_displays(requests, sound=self.settings.sound_on_capture, block=False)
+        except Exception:
+            logger.exception(f"Capture failed")
+        finally:
+            for n, item in enumerate(reserved):
+                self.settle_sequence(item, futures[n] if n < len(futures) else None)
+
+    def settle_sequence(self, reserved: tuple[SequenceIndex, int] | None, future: Future | None) -> None:
+        """確保したシーケンス番号の書き込み完了をインデックスへ通知する
+
+        Args:
+            reserved (tuple): 確保したシーケンス番号（インデックス, 番号）、None=確保していない
+            future (Future): ワーカー処理のFuture、None=保存しなかった
+
+        Returns:
+            none
+
+        """
+        if reserved is None:
+            return
+
+        index, number = reserved
+        if future is None:
+            # 保存しなかった番号は返却して次回に再利用する
+            with self.sequence_lock:
+                index.cancel(number)
+                self.sequence = min(self.sequence, number)
+        else:
+            future.add_done_callback(lambda _f: index.complete(number))
 
     def on_menu_show_about(self, _event: wx.Event) -> None:
         """Aboutメニューイベントハンドラ
@@ -471,6 +720,34 @@ class ScreenShot(TaskBarIcon):
         # 表示する
         AboutBox(info, self.frame)
 
+    def on_menu_diagnostics(self, _event: wx.Event) -> None:
+        """Diagnosticsメニューイベントハンドラ
+
+        * 段階毎の処理時間の集計を表示する。
+
+        Args:
+            event (wx.EVENT): EVENTオブジェクト
+
+        Returns:
+            none
+
+        """
+        with DiagnosticsDialog(self.frame, self.capture.timings) as dlg:
+            dlg.ShowModal()
+
+    def save_settings(self) -> None:
+        """設定値の保存（遅延保存、連続した変更はまとめてバックグラウンドで書き込む）
+
+        Args:
+            none
+
+        Returns:
+            none
+
+        """
+        self.config.config_from_settings(self.settings)
+        self.config.save_later()
+
     def on_menu_settings(self, _event: wx.Event) -> None:
         """Settingメニューイベントハンドラ
 
@@ -522,6 +799,7 @@ class ScreenShot(TaskBarIcon):
                     self.remove_capture_hotkey()
                     self.add_caputure_hotkeys()
                     logger.debug("Change capture Hotkey.")
+                self.save_settings()
 
     def on_menu_toggle_item(self, event: wx.Event) -> None:
         """クイック設定メニューイベントハンドラ
@@ -530,6 +808,7 @@ class ScreenShot(TaskBarIcon):
         * 「キャプチャー終了時に音を鳴らすの有効/無効」を切り替える。
         * 「遅延キャプチャーの有効/無効」を切り替える。
         * 「トリミングの有効/無効」を切り替える。
+        * 「処理時間の計測の有効/無効」を切り替える。
 
         Args:
             event (wx.EVENT): EVENTオブジェクト
@@ -547,8 +826,12 @@ class ScreenShot(TaskBarIcon):
                 self.settings.delayed_capture = not self.settings.delayed_capture
             case ScreenShot.ID_MENU_TRIMMING:  # トリミング
                 self.settings.trimming = not self.settings.trimming
+            case ScreenShot.ID_MENU_TIMING:  # 処理時間の計測
+                self.settings.diagnostics = not self.settings.diagnostics
+                self.capture.timings.enabled = self.settings.diagnostics
             case _:
-                pass
+                return
+        self.save_settings()
 
     def on_menu_reset_sequence(self, _event: wx.Event) -> None:
         """シーケンス番号のリセット
@@ -581,6 +864,7 @@ class ScreenShot(TaskBarIcon):
         for n in range(len(self.settings.save_folders)):
             if menu_id == (ScreenShot.ID_MENU_FOLDER1 + n):
                 self.settings.save_folder_index = n
+                self.save_settings()
                 break
 
     def on_menu_open_folder(self, event: wx.Event) -> None:
@@ -605,6 +889,24 @@ class ScreenShot(TaskBarIcon):
             # ruff: noqa: S606
             os.startfile(folder_path)
 
+    def on_menu_find_capture(self, _event: wx.Event) -> None:
+        """Find captureメニューイベントハンドラ
+
+        * キャプチャー履歴を検索する（インデックスのみを参照する）。
+
+        Args:
+            event (wx.EVENT): EVENTオブジェクト
+
+        Returns:
+            none
+
+        """
+        if self.capture.history is None:
+            return
+
+        with HistoryDialog(self.frame, self.capture.history) as dlg:
+            dlg.ShowModal()
+
     def on_menu_periodic_settings(self, _event: wx.Event) -> None:
         """Periodic settingsメニューイベントハンドラ
 
@@ -646,35 +948,120 @@ class ScreenShot(TaskBarIcon):
                         self.remove_periodic_stop_hotkey()
                         self.add_periodic_stop_hotkey()
                         logger.debug("Change periodic stop Hotkey.")
+                    self.save_settings()
                 case wx.ID_EXECUTE:
                     logger.debug("on_menu_periodic_settings closed 'Start'")
                     # 実行開始
-                    self.settings.periodic_capture = True
-                    wx.CallLater(self.settings.periodic_interval_to_ms(), self.do_periodic)
+                    self.start_periodic_capture()
                 case wx.ID_STOP:
                     logger.debug("on_menu_periodic_settings closed 'Stop'")
                     # 実行停止
-                    self.settings.periodic_capture = False
+                    self.end_periodic_capture()
+
+    def log_periodic_skipped(self) -> None:
+        """定期実行でスキップした（変化の無い）フレーム数のログ出力"""
+        if self.settings.periodic_skip_unchanged:
+            logger.info(f"Periodic capture: {self.capture.frame_filter.skipped} unchanged frame(s) skipped.")
+
+    def start_periodic_capture(self) -> None:
+        """定期実行開始処理"""
+        if self.periodic.running:
+            # 停止を待ち切れなかった前回の処理が実行中
+            wx.MessageBox("前回の定期実行の処理が終わっていません。しばらくしてから開始してください。", "ERROR", wx.ICON_ERROR)
+            return
+
+        if self.settings.periodic_output in {"tiles", "video"}:
+            # 差分（タイル）記録、動画記録は1回の実行で1ファイル
+            save_dir = Path(self.settings.periodic_save_folder)
+            if not save_dir.exists():
+                wx.MessageBox(f"保存フォルダ '{save_dir}' が見つかりません。", "ERROR", wx.ICON_ERROR)
+                return
+            basename: str = datetime.now(ZoneInfo("Asia/Tokyo")).strftime("%Y%m%d_%H%M%S")
+            try:
+                if self.settings.periodic_output == "tiles":
+                    self.periodic_recorder = TileRecorder(
+                        save_dir / (basename + TileRecorder.EXTENSION),
+                        self.settings.periodic_tile_size,
+                        self.settings.periodic_keyframe_interval,
+                        on_error=lambda _e: wx.CallAfter(self.on_periodic_record_error),
+                    )
+                else:
+                    self.periodic_recorder = VideoRecorder(
+                        save_dir / (basename + VideoRecorder.EXTENSION),
+                        self.settings.periodic_interval_to_ms(),
+                        self.settings.jpeg_quality,
+                        on_error=lambda _e: wx.CallAfter(self.on_periodic_record_error),
+                    )
+            except OSError as e:
+                wx.MessageBox(f"記録ファイルの作成に失敗しました\n ({e})", "ERROR", wx.ICON_ERROR)
+                return
+
+        self.settings.periodic_capture = True
+        self.capture.frame_filter.reset()
+        if not self.periodic.start(self.settings.periodic_interval_to_ms()):
+            self.end_periodic_capture()
+
+    def end_periodic_capture(self) -> None:
+        """定期実行終了処理（スケジューラー停止後に記録ファイルを閉じる）"""
+        self.settings.periodic_capture = False
+        self.periodic.stop()
+        if (recorder := self.periodic_recorder) is not None:
+            self.periodic_recorder = None
+            try:
+                recorder.close()
+            except OSError as e:
+                wx.MessageBox(f"記録ファイルの書き込みに失敗しました\n ({e})", "ERROR", wx.ICON_ERROR)
+        self.log_periodic_skipped()
+
+    def on_periodic_record_error(self) -> None:
+        """差分（タイル）記録、動画記録の失敗時処理（記録スレッドからwx.CallAfterで呼ばれる、定期実行を停止する）"""
+        if self.periodic_recorder is not None and self.periodic_recorder.error is not None:
+            logger.debug("Stop periodic capture (recording failed)")
+            self.end_periodic_capture()
 
     def stop_periodic_capture(self) -> None:
         """定期実行停止処理"""
         # 実行停止
-        self.settings.periodic_capture = False
+        self.end_periodic_capture()
         logger.debug("Stop periodic capture")
         if self.settings.sound_on_capture:
             self.capture.success()
 
+    def get_sequence_index(self, save_dir: Path, prefix: str, digits: int, extension: str) -> SequenceIndex:
+        """シーケンス番号インデックスの取得（無ければ生成する）"""
+        key: tuple[str, str, int, str] = (str(save_dir), prefix, digits, extension)
+        if (index := self.sequence_indexes.get(key)) is None:
+            index = SequenceIndex(save_dir, prefix, digits, extension)
+            self.sequence_indexes[key] = index
+
+        return index
+
     # ruff: noqa: FBT001, FBT002
-    def create_filename(self, periodic: bool = False) -> str:
-        """PNGファイル名生成処理
+    def get_image_encoder(self, periodic: bool = False) -> ImageEncoder:
+        """画像エンコーダーの取得
 
-        * PNGファイル名を生成する。
+        Args:
+            periodic (bool): True=定期実行向け
+
+        Returns:
+            画像エンコーダー
+
+        """
+        preset: str = self.settings.periodic_image_encoder if periodic else self.settings.image_encoder
+        return get_encoder(preset, self.settings)
+
+    def create_filename(self, periodic: bool = False, extension: str = ".png", serial: int = -1) -> str:
+        """画像ファイル名生成処理
+
+        * 画像ファイル名を生成する。
 
         Args:
             periodic (bool): True=定期実行向け
+            extension (str): 拡張子
+            serial (int): 連写のフレーム番号、全ディスプレイのディスプレイ番号（0～、日時のファイル名に付ける。-1=付けない）
 
         Returns:
-            PNGファイル名 (str)
+            画像ファイル名 (str)
 
         """
         # 選択中の保存フォルダを取得する
@@ -683,7 +1070,7 @@ class ScreenShot(TaskBarIcon):
         )
         save_dir = Path(path_str)
         if not save_dir.exists():
-            wx.MessageBox(f"保存フォルダ '{save_dir}' が見つかりません。", "ERROR", wx.ICON_ERROR)
+            wx.CallAfter(wx.MessageBox, f"保存フォルダ '{save_dir}' が見つかりません。", "ERROR", wx.ICON_ERROR)
             return ""
 
         # ナンバリング種別を取得する
@@ -693,60 +1080,191 @@ class ScreenShot(TaskBarIcon):
             else (self.settings.periodic_numbering if self.settings.periodic_numbering == 0 else self.settings.numbering)
         )
         if kind == 0:  # 日時
-            filename: str = datetime.now(ZoneInfo("Asia/Tokyo")).strftime("%Y%m%d_%H%M%S") + ".png"
+            # 1秒未満の定期実行ではミリ秒まで付ける
+            milliseconds: bool = periodic and self.settings.periodic_interval_to_ms() < 1000
+            now: datetime = datetime.now(ZoneInfo("Asia/Tokyo"))
+            filename: str = date_filename(now, extension, milliseconds=milliseconds, serial=serial)
         else:  # 接頭語＋シーケンス番号
             prefix: str = self.settings.prefix
-            prefix_len: int = len(prefix)
             digits: int = self.settings.sequence_digits
-            begin: int = max(self.settings.sequence_begin, self.sequence)
-            logger.debug(f"Sequence No.={begin}")
-
-            filename = f"{prefix}{begin:0>{digits}}.png"
-            if (save_dir / filename).exists():
-                # 現在のシーケンス番号のファイルが存在した場合、空きを探す
-                ptn: str = rf"{prefix}\d{{{digits}}}\.png"
-                files: list[str] = scan_directory(str(save_dir), pattern=ptn)
-                if not files:
-                    # 存在しない -> プレフィックス＋開始番号
-                    logger.debug("Sequencial file not found.")
-                    filename = f"{prefix}{begin:0>{digits}}.png"
-                else:
-                    # ファイル名からシーケンス番号のlistを作る
-                    nums: list[int] = [int(Path(file).stem[prefix_len:]) for file in files]
-                    logger.debug(f"Sequencial No. list is {nums}")
-                    # 空きを確認
-                    # snos: list[int] = [y - 1 for x, y in zip(nums, nums[1:], strict=False) if x != y - 1 and y - 1 >= begin]
-                    snos: list[int] = [y - 1 for x, y in pairwise(nums) if x != y - 1 and y - 1 >= begin]
-                    # 空きがなければシーケンス番号の最大値+1
-                    begin = snos[0] if snos else nums[len(nums) - 1] + 1
-                    logger.debug(f"Sequence No. changed to {begin}")
-                    filename = f"{prefix}{begin:0>{digits}}.png"
-            else:
-                logger.debug(f"No duplicates '{filename}'")
-
-            self.sequence = begin + 1  # 次回のシーケンス番号
-            logger.debug(f"Next sequence No.={self.sequence}")
+            with self.sequence_lock:
+                begin: int = max(self.settings.sequence_begin, self.sequence)
+                logger.debug(f"Sequence No.={begin}")
+
+                # 現在のシーケンス番号以降で空いている番号を確保する（フォルダの再走査はインデックス側で必要時のみ）
+                index: SequenceIndex = self.get_sequence_index(save_dir, prefix, digits, extension)
+                number: int = index.reserve(begin)
+                if number != begin:
+                    logger.debug(f"Sequence No. changed to {number}")
+                begin = number
+                filename = sequence_filename(prefix, begin, digits, extension)
+                self.sequence_reserved[str(save_dir / filename)] = (index, begin)
+
+                self.sequence = begin + 1  # 次回のシーケンス番号
+                logger.debug(f"Next sequence No.={self.sequence}")
 
         return str(save_dir / filename)
 
     def do_periodic(self) -> None:
         """定期実行処理
 
+        * 定期実行スケジューラーのスレッドから呼ばれる（UIスレッドを経由せずにキャプチャーする）
+
+        Args:
+            none
+
+        Returns:
+            none
+
+        """
+        if not self.settings.periodic_capture:
+            return
+
+        # ターゲットを取得
+        moni_no: int = target_from_setting(self.settings.periodic_target)
+        if (recorder := self.periodic_recorder) is not None:
+            # 差分（タイル）記録、動画記録（トリミング、墨消ししてから記録する）
+            self.record_periodic_frame(recorder, moni_no)
+            return
+
+        encoder: ImageEncoder = self.get_image_encoder(periodic=True)
+        filename: str = self.create_filename(periodic=True, extension=encoder.extension)
+        if len(filename) == 0:
+            # 保存フォルダが無い -> 定期実行を停止する
+            wx.CallAfter(self.stop_periodic_capture)
+            return
+
+        request = CaptureRequest.from_settings(
+            self.settings,
+            "periodic",
+            moni_no,
+            filename=filename,
+            encoder=encoder,
+            trace=self.capture.timings.begin("periodic"),
+        )
+        self.execute_request(request)
+
+    def record_periodic_frame(self, recorder: TileRecorder | VideoRecorder, moni_no: int) -> None:
+        """定期実行の1ファイルへの記録（差分（タイル）、動画）
+
+        * 変化の無いフレームは記録しない（記録の失敗時は定期実行を停止するので、判定時に比較対象にする）
+        * 所要時間は取得と記録待ち（記録スレッドの空き待ち）までを計測する（種別は出力形式）
+
         Args:
+            recorder (TileRecorder | VideoRecorder): 記録先
+            moni_no (int): キャプチャー対象
+
+        Returns:
             none
 
+        """
+        trace: CaptureTrace = self.capture.timings.begin(self.settings.periodic_output)
+        sct_img, _window = self.grab_target(moni_no)
+        if sct_img is None:
+            return
+        if self.settings.periodic_skip_unchanged and self.capture.frame_filter.is_unchanged(
+            moni_no,
+            sct_img.size,
+            sct_img.raw,
+            self.settings.periodic_skip_threshold,
+        ):
+            return
+        trace.lap("grab")
+
+        recorder.add_frame(sct_img.size, sct_img.raw)
+        trace.lap("queue_wait")
+        self.capture.timings.end(trace)
+
+    def grab_target(self, moni_no: int) -> tuple[mss.screenshot.ScreenShot | None, tuple[str, dict] | None]:
+        """画面の取得（連写、プリイベントバッファ用、トリミングは設定値に従って取得領域に含め、取得時に墨消しする）
+
+        Args:
+            moni_no (int): キャプチャー対象
+
+        Returns:
+            (mssのキャプチャー画像、対象が無い場合はNone, アクティブウィンドウの(タイトル, 領域)、ウィンドウ以外はNone)
+
+        """
+        sct_img, window = self.capture.grab_with_window(moni_no, trimming_for(self.settings, moni_no))
+        if sct_img is not None:
+            self.capture.redact(sct_img, window)
+        return sct_img, window
+
+    def start_burst_capture(self) -> None:
+        """連写キャプチャー開始処理（ホット・キーから呼ばれる）"""
+        moni_no: int = target_from_setting(self.settings.burst_target)
+        self.burst.start(moni_no, self.settings.burst_frames, self.settings.burst_interval_ms)
+
+    def save_burst_frames(self, moni_no: int, frames: Iterable[tuple[mss.screenshot.ScreenShot, str, float]]) -> None:
+        """連写したフレームの保存
+
+        * 連写（またはプリイベントバッファ保存）スレッドから呼ばれ、フレーム毎にファイル名を確保してワーカーへ渡す
+        * サウンドは最後に1回
+
+        Args:
+            moni_no (int): キャプチャー対象
+            frames (Iterable): 取得したフレーム(画像, ウィンドウタイトル, 取得時刻)
+
         Returns:
             none
 
         """
-        if self.settings.periodic_capture:
-            # ターゲットを取得
-            moni_no: int = self.settings.periodic_target if self.settings.periodic_target != -1 else 90
-            filename: str = self.create_filename(periodic=True)
-            self.req_queue.put((moni_no, filename))
-            wx.CallAfter(self.do_capture)
-            # 次回を予約
-            wx.CallLater(self.settings.periodic_interval_to_ms(), self.do_periodic)
+        encoder: ImageEncoder = self.get_image_encoder()
+        saved: int = 0
+        for n, (sct_img, title, timestamp) in enumerate(frames):
+            filename: str = self.create_filename(extension=encoder.extension, serial=n)
+            if not filename:
+                break
+            request = CaptureRequest.from_settings(
+                self.settings,
+                "burst",
+                moni_no,
+                filename=filename,
+                encoder=encoder,
+                sound=False,
+                title=title,
+                timestamp=timestamp,
+                trace=self.capture.timings.begin("burst"),
+            )
+            self.execute_request(request, sct_img=sct_img)
+            saved += 1
+
+        logger.debug(f"Burst capture: {saved} frame(s) submitted")
+        if saved and self.settings.sound_on_capture:
+            wx.CallAfter(self.capture.success)
+
+    def start_prebuffer(self) -> None:
+        """プリイベントバッファの記録開始（無効なら停止）"""
+        if not self.settings.prebuffer:
+            self.prebuffer.stop()
+            return
+
+        self.prebuffer.start(
+            target_from_setting(self.settings.prebuffer_target),
+            self.settings.prebuffer_interval_ms,
+            self.settings.prebuffer_memory_bytes(),
+        )
+
+    def flush_prebuffer(self) -> None:
+        """プリイベントバッファの保存（ホット・キーから呼ばれる）
+
+        * 直前「prebuffer_seconds」秒のフレームを、連写と同じ連番のファイル名で保存する
+        * フレームの展開と保存は専用スレッドで行う
+        """
+        if not self.prebuffer.running:
+            return
+
+        if self.prebuffer_flush is not None and self.prebuffer_flush.is_alive():
+            logger.warning("Pre-event buffer is already being saved.")
+            return
+
+        self.prebuffer_flush = threading.Thread(
+            target=self.save_burst_frames,
+            args=(self.prebuffer.moni_no, self.prebuffer.frames(self.settings.prebuffer_seconds)),
+            name="prebuffer_flush",
+            daemon=True,
+        )
+        self.prebuffer_flush.start()
 
     def copy_to_clipboard(self, menu_id: int, from_menu: bool = True) -> None:
         """キャプチャー要求処理（Clipboardコピー）
@@ -762,8 +1280,7 @@ class ScreenShot(TaskBarIcon):
 
         """
         # ターゲット取得
-        moni_no: int = 90 if menu_id == ScreenShot.ID_MENU_ACTIVE_CB else (menu_id - ScreenShot.ID_MENU_SCREEN0_CB)
-        self.req_queue.put((moni_no, ""))
+        moni_no: int = ACTIVE_WINDOW if menu_id == ScreenShot.ID_MENU_ACTIVE_CB else (menu_id - ScreenShot.ID_MENU_SCREEN0_CB)
         # 遅延時間算出（遅延キャプチャー以外でメニュー経由は"BASE_DELAY_TIME"遅延させる）
         delay_ms: int = (
             self.settings.delayed_time_to_ms()
@@ -772,6 +1289,8 @@ class ScreenShot(TaskBarIcon):
             if not from_menu
             else ScreenShot.BASE_DELAY_TIME
         )
+        trace: CaptureTrace = self.capture.timings.begin("clipboard", delay_ms)
+        self.req_queue.put(CaptureRequest.from_settings(self.settings, "clipboard", moni_no, delay_ms=delay_ms, trace=trace))
         # キャプチャー実行
         wx.CallLater(delay_ms, self.do_capture)
 
@@ -788,14 +1307,18 @@ class ScreenShot(TaskBarIcon):
             none
 
         """
+        if menu_id == ScreenShot.ID_MENU_ALL_DISPLAYS:
+            self.save_all_displays(from_menu)
+            return
+
         # ターゲット取得
-        moni_no: int = 90 if menu_id == ScreenShot.ID_MENU_ACTIVE else (menu_id - ScreenShot.ID_MENU_SCREEN0)
+        moni_no: int = ACTIVE_WINDOW if menu_id == ScreenShot.ID_MENU_ACTIVE else (menu_id - ScreenShot.ID_MENU_SCREEN0)
         # 保存ファイル名生成
-        filename: str = self.create_filename(self.settings.periodic_capture)
+        encoder: ImageEncoder = self.get_image_encoder(self.settings.periodic_capture)
+        filename: str = self.create_filename(self.settings.periodic_capture, encoder.extension)
         if len(filename) == 0:
             return
 
-        self.req_queue.put((moni_no, filename))
         delay_ms: int = (
             self.settings.delayed_time_to_ms()
             if self.settings.delayed_capture
@@ -803,9 +1326,61 @@ class ScreenShot(TaskBarIcon):
             if from_menu
             else 0
         )
+        request = CaptureRequest.from_settings(
+            self.settings,
+            "file",
+            moni_no,
+            filename=filename,
+            encoder=encoder,
+            delay_ms=delay_ms,
+            trace=self.capture.timings.begin("file", delay_ms),
+        )
+        self.req_queue.put(request)
         # キャプチャー実行
         wx.CallLater(delay_ms, self.do_capture)
 
+    def save_all_displays(self, from_menu: bool = True) -> None:
+        """キャプチャー要求処理（全ディスプレイを個別ファイルに保存）
+
+        * ディスプレイ毎にファイル名（連番）を確保し、デスクトップ全体の1回の取得から保存する
+
+        Args:
+            from_menu (bool): True = Menuから
+
+        Returns:
+            none
+
+        """
+        encoder: ImageEncoder = self.get_image_encoder(self.settings.periodic_capture)
+        delay_ms: int = (
+            self.settings.delayed_time_to_ms()
+            if self.settings.delayed_capture
+            else ScreenShot.BASE_DELAY_TIME
+            if from_menu
+            else 0
+        )
+        requests: list[CaptureRequest] = []
+        for n in range(1, self.display_count + 1):
+            filename: str = self.create_filename(self.settings.periodic_capture, encoder.extension, serial=n)
+            if not filename:
+                break
+            request = CaptureRequest.from_settings(
+                self.settings,
+                "displays",
+                n,
+                filename=filename,
+                encoder=encoder,
+                delay_ms=delay_ms,
+                sound=False,
+                trace=self.capture.timings.begin("displays", delay_ms),
+            )
+            requests.append(request)
+        if not requests:
+            return
+
+        # キャプチャー実行
+        wx.CallLater(delay_ms, self.execute_display_requests, requests)
+
     def on_menu_clipboard(self, event: wx.Event) -> None:
         """クリップボードへコピーメニューイベントハンドラ
 
@@ -846,8 +1421,23 @@ class ScreenShot(TaskBarIcon):
             none
 
         """
-        # 設定値を保存
+        # 定期実行を停止
+        self.end_periodic_capture()
+        # 設定値を保存（保存待ちの遅延保存も含めて書き込む）
+        self.config.config_from_settings(self.settings)
         self.config.save()
+        # 連写の保存待ちを完了させてから、キャプチャーセッションを解放（待つ間に新たに開始しないようホット・キーを先に削除）
+        self.remove_burst_hotkey()
+        self.remove_prebuffer_hotkey()
+        self.burst.join()
+        self.prebuffer.stop()
+        if self.prebuffer_flush is not None:
+            self.prebuffer_flush.join()
+        self.capture.backend.stop()
+        self.capture.close()
+        # キャプチャー履歴の書き込み待ちを完了させる（ワーカーの停止後）
+        if self.capture.history is not None:
+            self.capture.history.close()
 
         wx.CallAfter(self.Destroy)
         self.frame.Close()
@@ -890,6 +1480,7 @@ def app_init() -> None:
     # 設定ファイルは実行ファイル（スクリプト）ディレクトリ下
     ScreenShot.CONFIG_FILE = exe_path / f"{ver.INFO['APP_NAME']}.ini"
     ScreenShot.HELP_FILE = exe_path / "manual.html"
+    ScreenShot.HISTORY_FILE = exe_path / f"{ver.INFO['APP_NAME']}_history.db"
 
 
 if __name__ == "__main__":
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+# ruff: noqa: S101, ANN201
+"""Test-capture_backend.py"""
+
+import io
+import unittest
+from unittest import mock
+
+from PIL import Image
+
+from capture_backend import MssBackend, SyntheticBackend
+from capture_manager import FrameView, bgra_to_dib
+
+
+class MssBackendTest(unittest.TestCase):
+    def test_clipboard(self):
+        """DIBにBMPファイルヘッダーを付けてxclipへ渡す（元の画像として読める）"""
+        sct_img = SyntheticBackend([(40, 30)]).grab({"left": 0, "top": 0, "width": 40, "height": 30})
+        view = FrameView.of(sct_img)
+        backend = MssBackend()
+        with (
+            mock.patch("capture_backend.shutil.which", return_value="/usr/bin/xclip"),
+            mock.patch("capture_backend.subprocess.run") as run,
+        ):
+            backend.set_clipboard_dib(bgra_to_dib(view.data, view.size))
+        args, kwargs = run.call_args
+        assert args[0] == ["/usr/bin/xclip", "-selection", "clipboard", "-t", "image/bmp"]
+        with Image.open(io.BytesIO(kwargs["input"])) as img:
+            assert img.format == "BMP"
+            assert img.convert("RGB").tobytes() == view.to_image().tobytes()
+
+    def test_no_xclip(self):
+        with mock.patch("capture_backend.shutil.which", return_value=None), self.assertRaises(OSError):
+            MssBackend().set_clipboard_dib(b"")
+
+
+if __name__ == "__main__":
+    unittest.main()
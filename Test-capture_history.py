@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# ruff: noqa: S101, ANN201
+"""Test-capture_history.py"""
+
+import sqlite3
+import tempfile
+import unittest
+from contextlib import closing
+from pathlib import Path
+
+from capture_history import CaptureHistory, HistoryEntry, content_digest
+
+
+def entry(n: int, title: str = "", path: str = "") -> HistoryEntry:
+    return HistoryEntry(1700000000.0 + n, "file", 1, title, 0, 0, 640, 480, path or f"C:\\SS\\SS{n:06}.png", n, f"{n:032x}")
+
+
+class CaptureHistoryTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "history.db"
+        self.history = CaptureHistory(self.path)
+
+    def tearDown(self):
+        self.history.close()
+        self.temp_dir.cleanup()
+
+    def test_batched_write(self):
+        """まとめて書き込み、閉じた後も残る"""
+        for n in range(CaptureHistory.BATCH_SIZE + 10):
+            self.history.add(entry(n))
+        self.history.flush()
+        with closing(sqlite3.connect(self.path)) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM captures").fetchone()[0] == CaptureHistory.BATCH_SIZE + 10
+
+        self.history.add(entry(1000))
+        self.history.close()
+        self.history.add(entry(1001))  # 閉じた後は記録しない
+        reopened = CaptureHistory(self.path)
+        try:
+            assert [e.timestamp for e in reopened.search(limit=1)] == [entry(1000).timestamp]
+        finally:
+            reopened.close()
+
+    def test_search(self):
+        """空白区切りの語を全て含む記録を新しい順に返す"""
+        self.history.add(entry(1, "Report.docx - Word", "D:\\Work\\SS000001.png"))
+        self.history.add(entry(2, "report 100% draft", "D:\\Work\\SS000002.png"))
+        self.history.add(entry(3, "", "D:\\Periodic\\20261018_101500.png"))
+        self.history.flush()
+
+        # fmt: off
+        patterns = [
+            # text           , expected（連番）
+            (""              , [3, 2, 1]),
+            ("report"        , [2, 1]),
+            ("REPORT work"   , [2, 1]),
+            ("report word"   , [1]),
+            ("100%"          , [2]),
+            ("1_"            , []),     # 「_」はワイルドカードとして扱わない
+            ("20261018"      , [3]),
+            ("missing"       , []),
+        ]
+        # fmt: on
+        for text, expected in patterns:
+            with self.subTest(text=text):
+                assert [e.size for e in self.history.search(text)] == expected
+
+        assert len(self.history.search(limit=2)) == 2
+        assert self.history.search("word")[0] == entry(1, "Report.docx - Word", "D:\\Work\\SS000001.png")
+
+    def test_digest(self):
+        assert content_digest(b"abc") == content_digest(memoryview(bytearray(b"abc")))
+        assert content_digest(b"abc") != content_digest(b"abd")
+        assert len(content_digest(b"")) == 32
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+# ruff: noqa: S101, ANN201
+"""Test-capture_manager.py"""
+
+import io
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from app_settings import ENCODER_PRESETS, AppSettings
+from capture_backend import SyntheticBackend
+from capture_history import CaptureHistory, content_digest
+from capture_manager import (
+    ENCODER_FACTORIES,
+    CaptureManager,
+    FrameView,
+    bgra_to_dib,
+    display_views,
+    get_encoder,
+    trimming_box,
+)
+from capture_notifier import CaptureNotifier
+from capture_request import ACTIVE_WINDOW, CaptureRequest
+from redaction import Redactor
+from redaction_rule import parse_rule
+
+# アクティブウィンドウの領域（デスクトップの端にかかる位置）
+WINDOW: dict = {"left": 40, "top": 20, "width": 300, "height": 200}
+
+
+class EncoderTest(unittest.TestCase):
+    def test_presets(self):
+        """プリセット毎の形式、拡張子、オプション（設定値を使うものは設定値を反映する）"""
+        settings = AppSettings(png_compress_level=3, png_strategy=1, jpeg_quality=75)
+        # fmt: off
+        patterns = [
+            # preset     , format, extension, options
+            ("png"       , "PNG" , ".png"   , {"compress_level": 3, "compress_type": 1}),
+            ("png_fast"  , "PNG" , ".png"   , {"compress_level": 1}),
+            ("png_small" , "PNG" , ".png"   , {"compress_level": 9}),
+            ("webp"      , "WEBP", ".webp"  , {"lossless": True, "quality": 0, "method": 0}),
+            ("jpeg"      , "JPEG", ".jpg"   , {"quality": 75}),
+            ("fast"      , "BMP" , ".bmp"   , {}),
+        ]
+        # fmt: on
+        assert [preset for preset, *_ in patterns] == list(ENCODER_PRESETS)
+        assert list(ENCODER_FACTORIES) == list(ENCODER_PRESETS)
+        image = Image.new("RGB", (16, 8), (10, 20, 30))
+        for preset, image_format, extension, options in patterns:
+            with self.subTest(preset=preset):
+                encoder = get_encoder(preset, settings)
+                assert (encoder.format, encoder.extension, encoder.options) == (image_format, extension, options)
+                with io.BytesIO() as output:
+                    encoder.encode(image, output)
+                    output.seek(0)
+                    with Image.open(output) as img:
+                        assert (img.format, img.size) == (image_format, (16, 8))
+
+    def test_unknown(self):
+        """不明なプリセットは警告してPNG（既定の圧縮）"""
+        with self.assertLogs("capture_manager", "WARNING"):
+            encoder = get_encoder("qoi", AppSettings())
+        assert (encoder.format, encoder.extension, encoder.options) == ("PNG", ".png", {})
+
+
+class TrimmedGrabTest(unittest.TestCase):
+    def setUp(self):
+        self.backend = SyntheticBackend([(640, 480)], window=WINDOW)
+        self.capture = CaptureManager(self.backend)
+
+    def tearDown(self):
+        self.capture.close()
+
+    def test_bit_identical(self):
+        """トリミング量を含めて取得した画像が、全体を取得して切り出した画像と一致する"""
+        # fmt: off
+        patterns = [
+            # trimming_size [上, 下, 左, 右]
+            [0, 0, 0, 0],
+            [10, 5, 3, 2],
+            [32, 8, 8, 8],
+            [0, 200, 0, 300],   # 下、右が画像サイズ以上なら無視される
+            [199, 0, 299, 0],   # 1ピクセルだけ残る
+        ]
+        # fmt: on
+        for frame_no, trimming_size in enumerate(patterns):
+            with self.subTest(trimming_size=trimming_size):
+                full = self.backend.frame(WINDOW, frame_no)
+                expected = Image.frombytes("RGB", full.size, full.bgra, "raw", "BGRX").crop(
+                    trimming_box(full.size, trimming_size),
+                )
+
+                self.backend.frame_no = frame_no
+                sct_img = self.capture.grab(ACTIVE_WINDOW, trimming_size)
+                assert sct_img is not None
+                image = Image.frombytes("RGB", sct_img.size, sct_img.bgra, "raw", "BGRX")
+                assert image.size == expected.size
+                assert image.tobytes() == expected.tobytes()
+
+                # クリップボード（DIB）も同じ画素になる
+                box = trimming_box(full.size, trimming_size)
+                assert bgra_to_dib(sct_img.raw, sct_img.size) == bgra_to_dib(full.raw, full.size, box)
+
+    def test_empty_area(self):
+        """トリミングで範囲が空になる場合は取得しない"""
+        assert self.capture.grab(ACTIVE_WINDOW, [200, 0, 0, 0]) is None
+        assert self.capture.grab(ACTIVE_WINDOW, [0, 0, 300, 0]) is None
+
+
+class DisplayViewsTest(unittest.TestCase):
+    def test_display_views(self):
+        """デスクトップ全体から切り出したディスプレイ毎の画像が、ディスプレイ毎に取得した画像と一致する"""
+        backend = SyntheticBackend([(320, 200), (160, 240), (200, 100)])
+        capture = CaptureManager(backend)
+        try:
+            desktop = capture.grab(0)
+            assert desktop is not None
+            views = display_views(desktop, backend.monitors())
+            assert len(views) == 3
+            for n, view in enumerate(views, 1):
+                with self.subTest(display=n):
+                    expected = backend.frame(backend.monitors()[n], 0)
+                    assert view.size == expected.size
+                    assert view.to_image().tobytes() == FrameView.of(expected).to_image().tobytes()
+                    assert bgra_to_dib(view.data, view.size, stride=view.stride) == bgra_to_dib(expected.raw, expected.size)
+        finally:
+            capture.close()
+
+
+class CaptureHookTest(unittest.TestCase):
+    def setUp(self):
+        self.backend = SyntheticBackend([(320, 200)])
+        self.capture = CaptureManager(self.backend)
+        self.request = CaptureRequest("file", 1)
+
+    def tearDown(self):
+        self.capture.close()
+
+    def test_array_view(self):
+        """NumPy配列は取得した画素データを参照する（コピーしない）"""
+        sct_img = self.capture.grab(1)
+        assert sct_img is not None
+        array = FrameView.of(sct_img).as_array()
+        assert array.shape == (200, 320, 4)
+        assert np.shares_memory(array, np.frombuffer(sct_img.raw, dtype=np.uint8))
+        assert tuple(array[5, 7]) == tuple(sct_img.raw[(5 * 320 + 7) * 4 : (5 * 320 + 7) * 4 + 4])
+
+    def test_hooks(self):
+        """フックは登録順に呼ばれ、配列の書き換えと置き換えが出力に反映される"""
+        sct_img = self.capture.grab(1)
+        assert sct_img is not None
+
+        def mask(array: np.ndarray, _request: CaptureRequest) -> None:
+            array[:10, :, :3] = 0
+
+        def half(array: np.ndarray, _request: CaptureRequest) -> np.ndarray:
+            return array[::2, ::2]
+
+        self.capture.add_hook(mask)
+        self.capture.add_hook(half)
+        view = self.capture._apply_hooks(FrameView.of(sct_img), self.request)  # noqa: SLF001
+        assert view.size == (160, 100)
+        assert not view.as_array()[:5, :, :3].any()
+        # 書き換えは元の画素データに対して行われる
+        assert not np.frombuffer(sct_img.raw, dtype=np.uint8)[: 10 * 320 * 4].reshape(10, 320, 4)[:, :, :3].any()
+
+        self.capture.remove_hook(mask)
+        self.capture.remove_hook(half)
+        original = FrameView.of(sct_img)
+        assert self.capture._apply_hooks(original, self.request) is original  # noqa: SLF001
+
+
+class RedactionTest(unittest.TestCase):
+    def setUp(self):
+        self.backend = SyntheticBackend([(640, 480)], window=WINDOW)
+        self.capture = CaptureManager(self.backend)
+        # ウィンドウ基準の範囲（トリミングで一部が領域外）と、ディスプレイ基準の範囲（ウィンドウと重なる）
+        self.capture.redactor = Redactor([parse_rule("title:synthetic, 0, 0, 100, 50"), parse_rule("1, 300, 200, 100, 100")])
+        self.trimming = (10, 0, 20, 0)
+
+    def tearDown(self):
+        self.capture.close()
+
+    def expected(self) -> FrameView:
+        """取得した画像（1回目のフレーム）を後から墨消しした結果（ウィンドウ左上から(20, 10)をトリミング）"""
+        self.backend.frame_no = 0
+        sct_img = self.capture.grab(ACTIVE_WINDOW, self.trimming)
+        assert sct_img is not None
+        array = FrameView.of(sct_img).as_array()
+        array[0:40, 0:80] = 0
+        array[170:190, 240:280] = 0
+        return FrameView.of(sct_img)
+
+    def test_clipboard(self):
+        """クリップボード（DIB）は墨消ししてから作成する"""
+        request = CaptureRequest("clipboard", ACTIVE_WINDOW, trimming=self.trimming)
+        future = self.capture.execute_capture(request)
+        assert future is not None
+        future.result()
+        expected = self.expected()
+        assert self.backend.clipboard == bgra_to_dib(expected.data, expected.size)
+
+    def test_file(self):
+        """画像ファイルは墨消ししてからエンコードする、タイトルが一致しなければウィンドウ基準の範囲は適用しない"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filename = str(Path(temp_dir) / "redacted.png")
+            request = CaptureRequest("file", ACTIVE_WINDOW, filename=filename, trimming=self.trimming)
+            future = self.capture.execute_capture(request)
+            assert future is not None
+            future.result()
+            with Image.open(filename) as image:
+                assert image.tobytes() == self.expected().to_image().tobytes()
+
+        self.capture.redactor = Redactor([parse_rule("title:other, 0, 0, 100, 50")])
+        sct_img, window = self.capture.grab_with_window(ACTIVE_WINDOW, self.trimming)
+        assert sct_img is not None
+        before = bytes(sct_img.raw)
+        self.capture.redact(sct_img, window)
+        assert bytes(sct_img.raw) == before
+
+
+class SkipUnchangedTest(unittest.TestCase):
+    def test_failed_write(self):
+        """書き込みに失敗したフレームは変化の判定の比較対象にしない（以降の同じフレームを保存する）"""
+        capture = CaptureManager(SyntheticBackend([(64, 48)]))
+        try:
+            sct_img = capture.grab(0)
+            assert sct_img is not None
+            with tempfile.TemporaryDirectory() as temp_dir:
+                for name, saved in (("missing/SS000000.png", False), ("SS000001.png", True), ("SS000002.png", None)):
+                    filename = str(Path(temp_dir) / name)
+                    request = CaptureRequest("periodic", 0, filename=filename, skip_unchanged=True, skip_threshold=100)
+                    future = capture.execute_capture(request, sct_img)
+                    with self.subTest(name=name):
+                        if saved is None:
+                            # 保存したフレームと同じなのでスキップ
+                            assert future is None
+                            continue
+                        assert future is not None
+                        assert (future.exception() is None) == saved
+                        assert Path(filename).exists() == saved
+            assert capture.frame_filter.skipped == 1
+        finally:
+            capture.close()
+
+
+class RecordingNotifier(CaptureNotifier):
+    def __init__(self) -> None:
+        self.sounds: list[str] = []
+
+    def success(self) -> None:
+        self.sounds.append("success")
+
+    def beep(self) -> None:
+        self.sounds.append("beep")
+
+
+class NotifierTest(unittest.TestCase):
+    def test_sound(self):
+        """完了時のサウンドは要求のsound指定時のみ、取得できなければエラー音（UIが無くても動く）"""
+        notifier = RecordingNotifier()
+        capture = CaptureManager(SyntheticBackend([(64, 48)]), notifier)
+        try:
+            for sound in (True, False):
+                future = capture.execute_capture(CaptureRequest("clipboard", 0, sound=sound))
+                assert future is not None
+            assert capture.execute_capture(CaptureRequest("clipboard", ACTIVE_WINDOW, sound=True)) is None
+        finally:
+            capture.close()
+        assert sorted(notifier.sounds) == ["beep", "success"]
+
+    def test_drop(self):
+        """処理待ちが上限なら、待たない指定（UIスレッド）では破棄してエラー音"""
+        notifier = RecordingNotifier()
+        capture = CaptureManager(SyntheticBackend([(64, 48), (32, 48)]), notifier)
+        pending = capture._pending  # noqa: SLF001
+        for _ in range(CaptureManager.MAX_PENDING):
+            pending.acquire()
+        try:
+            assert capture.execute_capture(CaptureRequest("clipboard", 0), block=False) is None
+            assert notifier.sounds == ["beep"]
+            # 全ディスプレイは空きが無くなった時点で以降を破棄する（エラー音は1回）
+            assert capture.execute_displays([CaptureRequest("clipboard", 1), CaptureRequest("clipboard", 2)], block=False) == []
+            assert notifier.sounds == ["beep", "beep"]
+        finally:
+            for _ in range(CaptureManager.MAX_PENDING):
+                pending.release()
+            capture.close()
+
+
+class HistoryTest(unittest.TestCase):
+    def test_record(self):
+        """画像ファイルは内容のハッシュ、アクティブウィンドウのタイトルとともに記録する（クリップボードは記録しない）"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            capture = CaptureManager(SyntheticBackend([(640, 480)], window=WINDOW, window_title="Notes - Editor"))
+            capture.history = CaptureHistory(Path(temp_dir) / "history.db")
+            try:
+                filename = str(Path(temp_dir) / "SS000001.png")
+                for request in (
+                    CaptureRequest("file", ACTIVE_WINDOW, filename=filename, trimming=(10, 0, 20, 0)),
+                    CaptureRequest("clipboard", 0),
+                ):
+                    future = capture.execute_capture(request)
+                    assert future is not None
+                    future.result()
+                capture.history.flush()
+
+                entries = capture.history.search("notes")
+                assert len(entries) == 1
+                data = Path(filename).read_bytes()
+                assert entries[0].path == filename
+                assert (entries[0].size, entries[0].digest) == (len(data), content_digest(data))
+                assert entries[0][2:8] == (ACTIVE_WINDOW, "Notes - Editor", 60, 30, 280, 190)
+                assert len(capture.history.search()) == 1
+            finally:
+                capture.close()
+                capture.history.close()
+
+    def test_pregrabbed(self):
+        """取得済みの画像（連写、プリイベントバッファ）は要求のウィンドウタイトルと取得時刻で記録する"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            capture = CaptureManager(SyntheticBackend([(640, 480)], window=WINDOW, window_title="Notes - Editor"))
+            capture.history = CaptureHistory(Path(temp_dir) / "history.db")
+            try:
+                sct_img, window = capture.grab_with_window(ACTIVE_WINDOW)
+                assert sct_img is not None
+                assert window is not None
+                filename = str(Path(temp_dir) / "SS000001.png")
+                request = CaptureRequest("burst", ACTIVE_WINDOW, filename=filename, title=window[0], timestamp=1_700_000_000.5)
+                future = capture.execute_capture(request, sct_img)
+                assert future is not None
+                future.result()
+                capture.history.flush()
+                entries = capture.history.search("notes")
+                assert [(entry.title, entry.timestamp) for entry in entries] == [("Notes - Editor", 1_700_000_000.5)]
+            finally:
+                capture.close()
+                capture.history.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
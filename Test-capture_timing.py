@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# ruff: noqa: S101, ANN201
+"""Test-capture_timing.py"""
+
+import csv
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from capture_timing import NULL_TRACE, STAGES, CaptureTimings, CaptureTrace
+
+
+def add_record(timings: CaptureTimings, spans: dict[str, float], kind: str = "file") -> None:
+    """所要時間を指定して計測結果を追加する"""
+    trace = CaptureTrace(kind)
+    with mock.patch.object(CaptureTrace, "finish", return_value=dict(spans)):
+        timings.end(trace)
+
+
+class CaptureTimingsTest(unittest.TestCase):
+    def test_disabled(self):
+        timings = CaptureTimings()
+        assert timings.begin("file") is NULL_TRACE
+        timings.end(NULL_TRACE)
+        assert len(timings) == 0
+        assert isinstance(CaptureTimings(enabled=True).begin("file"), CaptureTrace)
+
+    def test_percentiles(self):
+        """段階毎の件数、平均、パーセンタイル（最近傍順位法）、最大"""
+        timings = CaptureTimings(enabled=True)
+        for n in range(1, 101):
+            add_record(timings, {"grab": float(n), "encode": 2.0 * n} if n % 2 else {"grab": float(n)})
+
+        summary = timings.summary()
+        assert list(summary) == ["grab", "encode"]
+        # fmt: off
+        patterns = [
+            # stage   , key    , expected
+            ("grab"   , "count", 100),
+            ("grab"   , "mean" , 50.5),
+            ("grab"   , "p50"  , 50.0),
+            ("grab"   , "p90"  , 90.0),
+            ("grab"   , "p99"  , 99.0),
+            ("grab"   , "max"  , 100.0),
+            ("encode" , "count", 50),     # 記録の無いキャプチャーは数えない
+            ("encode" , "p50"  , 98.0),   # 2, 6, 10, ... の25番目
+            ("encode" , "max"  , 198.0),
+        ]
+        # fmt: on
+        for stage, key, expected in patterns:
+            with self.subTest(stage=stage, key=key):
+                assert summary[stage][key] == expected
+
+        assert timings.format_summary().splitlines()[1].split()[:2] == ["grab", "100"]
+
+    def test_window(self):
+        """直近WINDOW件だけを保持する（古いものから捨てる）"""
+        with mock.patch.object(CaptureTimings, "WINDOW", 5):
+            timings = CaptureTimings(enabled=True)
+        for n in range(8):
+            add_record(timings, {"grab": float(n)})
+        assert len(timings) == 5
+        assert timings.summary()["grab"]["count"] == 5
+        assert timings.summary()["grab"]["p50"] == 5.0
+        timings.clear()
+        assert len(timings) == 0
+
+    def test_dump(self):
+        """拡張子が.csvならCSV（記録の無い段階は空欄）、それ以外はJSON"""
+        timings = CaptureTimings(enabled=True)
+        add_record(timings, {"grab": 1.5, "total": 3.0}, "clipboard")
+        add_record(timings, {"grab": 2.5, "encode": 4.0, "total": 7.0})
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "timings.csv"
+            timings.dump(path)
+            with path.open(newline="", encoding="utf-8") as f:
+                rows = list(csv.DictReader(f))
+            assert list(rows[0]) == ["timestamp", "kind", *STAGES]
+            assert [(row["kind"], row["grab"], row["encode"], row["total"]) for row in rows] == [
+                ("clipboard", "1.500", "", "3.000"),
+                ("file", "2.500", "4.000", "7.000"),
+            ]
+
+            path = Path(tmp) / "timings.json"
+            timings.dump(path)
+            data = json.loads(path.read_text(encoding="utf-8"))
+            assert data["summary"]["grab"]["count"] == 2
+            assert [{k: v for k, v in record.items() if k != "timestamp"} for record in data["records"]] == [
+                {"kind": "clipboard", "grab": 1.5, "total": 3.0},
+                {"kind": "file", "grab": 2.5, "encode": 4.0, "total": 7.0},
+            ]
+
+
+class CaptureTraceTest(unittest.TestCase):
+    def test_lap(self):
+        """同じ段階のlapは合算し、差し引く時間と遅延指定分を除く"""
+        with mock.patch("capture_timing.time.perf_counter", side_effect=[10.0, 10.1, 10.3, 10.4, 10.5, 11.0]):
+            trace = CaptureTrace("file", delay_ms=200)
+            trace.lap("call_later", 50)
+            trace.lap("grab")
+            trace.skip()
+            trace.lap("grab")
+            spans = trace.finish()
+        assert {k: round(v, 6) for k, v in spans.items()} == {"call_later": 50.0, "grab": 300.0, "total": 800.0}
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,7 +4,9 @@
 
 import unittest
 from pathlib import Path
+from unittest import mock
 
+from app_settings import AppSettings
 from config_manager import ConfigManager
 from myutils.util import strtobool
 
@@ -29,7 +31,7 @@ class ConfigManagerTest(unittest.TestCase):
             (r"test\config_manager\test.ini", r"test\config_manager\test_empty.ini"),
         ]
         # fmt: on
-        print(f"\test_empty_ini [{len(patterns)}]: ", end="")
+        print(f"\ntest_empty_ini [{len(patterns)}]: ", end="")
         for result, expected in patterns:
             with self.subTest(result=result, expected=expected):
                 config = ConfigManager(Path(result), Path(".\\"), 10)
@@ -43,7 +45,7 @@ class ConfigManagerTest(unittest.TestCase):
             r"test\config_manager\test_default.ini", r"test\config_manager\test_default.ini",
         ]
         # fmt: on
-        print(f"\test_load_ini [{len(patterns)}]: ", end="")
+        print(f"\ntest_load_ini [{len(patterns)}]: ", end="")
         result = patterns[0]
         with self.subTest(result=result):
             config = ConfigManager(Path(result), Path(".\\"), 10)
@@ -74,6 +76,65 @@ class ConfigManagerTest(unittest.TestCase):
             assert int(config.config["periodic"]["target"]) == -1
             assert int(config.config["periodic"]["numbering"]) == 0
 
+    def test_invalid_values(self):
+        """不正な値、無いオプションは既定値で補い、全てのエラーをまとめて返す"""
+        # fmt: off
+        patterns = [
+            # section , option          , value  , field                    , expected
+            ("basic"    , "jpeg_quality"  , "500"  , "jpeg_quality"           , 90),
+            ("other"    , "diagnostics"   , "maybe", "diagnostics"            , False),
+            ("periodic" , "output"        , "gif"  , "periodic_output"        , "image"),
+            ("periodic" , "skip_threshold", "0"    , "periodic_skip_threshold", 100),
+            ("redaction", "rule1"         , "1, 0" , "redaction_rules"        , []),
+        ]
+        # fmt: on
+        print(f"\ntest_invalid_values [{len(patterns)}]: ", end="")
+        config = ConfigManager(Path("test.ini"), Path(".\\"), 10)
+        config.config_from_settings(AppSettings(save_folders=["a"], save_folder_index=0, periodic_save_folder="b"))
+        for section, option, value, _name, _expected in patterns:
+            config.config[section][option] = value
+        config.config.remove_option("prebuffer", "seconds")
+
+        settings = AppSettings()
+        with mock.patch("config_manager.wx.MessageBox") as message_box:
+            assert config.config_to_settings(settings)
+        message_box.assert_called_once()
+        assert len(config.errors) == len(patterns)
+        assert settings.prebuffer_seconds == AppSettings().prebuffer_seconds
+        for section, option, value, name, expected in patterns:
+            with self.subTest(section=section, option=option, value=value):
+                assert getattr(settings, name) == expected
+
+    def test_encoder_options(self):
+        """画像エンコーダーの設定（[basic]、[periodic]）の読み込みと書き戻し"""
+        # fmt: off
+        patterns = [
+            # section  , option              , value , field                   , expected
+            ("basic"   , "image_encoder"     , "webp", "image_encoder"         , "webp"),
+            ("basic"   , "png_compress_level", "1"   , "png_compress_level"    , 1),
+            ("basic"   , "png_strategy"      , "3"   , "png_strategy"          , 3),
+            ("basic"   , "jpeg_quality"      , "75"  , "jpeg_quality"          , 75),
+            ("periodic", "image_encoder"     , "fast", "periodic_image_encoder", "fast"),
+        ]
+        # fmt: on
+        print(f"\ntest_encoder_options [{len(patterns)}]: ", end="")
+        config = ConfigManager(Path("test.ini"), Path(".\\"), 10)
+        config.config_from_settings(AppSettings(save_folders=["a"], save_folder_index=0, periodic_save_folder="b"))
+        for section, option, _value, name, _expected in patterns:
+            # 既定値が書き出されている
+            assert config.config[section][option] == str(getattr(AppSettings(), name))
+        for section, option, value, _name, _expected in patterns:
+            config.config[section][option] = value
+
+        settings = AppSettings()
+        assert not config.config_to_settings(settings)
+        assert config.errors == []
+        config.config_from_settings(settings)
+        for section, option, value, name, expected in patterns:
+            with self.subTest(section=section, option=option, value=value):
+                assert getattr(settings, name) == expected
+                assert config.config[section][option] == value
+
 
 if __name__ == "__main__":
     # unittest.main()
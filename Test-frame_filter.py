@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# ruff: noqa: S101, ANN201
+"""Test-frame_filter.py"""
+
+import unittest
+
+from frame_filter import UnchangedFrameFilter, frame_fingerprint
+
+# 画像サイズ（1行が1帯になる高さ）
+SIZE: tuple[int, int] = (8, UnchangedFrameFilter.BANDS)
+
+
+def frame(changed_rows: int = 0) -> bytes:
+    """先頭から指定行数だけ変更したフレーム"""
+    width, height = SIZE
+    return b"".join(bytes([0xFF if y < changed_rows else 0x00]) * width * 4 for y in range(height))
+
+
+class FrameFingerprintTest(unittest.TestCase):
+    def test_bands(self):
+        assert len(frame_fingerprint(frame(), SIZE[1], UnchangedFrameFilter.BANDS)) == UnchangedFrameFilter.BANDS
+        # 帯の数より行が少なければ1行1帯
+        assert len(frame_fingerprint(bytes(8 * 4 * 3), 3, 64)) == 3
+        assert frame_fingerprint(b"", 0, 64) == ()
+
+
+class UnchangedFrameFilterTest(unittest.TestCase):
+    def test_threshold(self):
+        """一致した帯の割合がしきい値以上なら変化なし"""
+        bands = UnchangedFrameFilter.BANDS
+        # fmt: off
+        patterns = [
+            # changed_rows       , threshold, expected
+            (0                   , 100      , True),
+            (1                   , 100      , False),
+            (bands // 10         , 90       , True),     # 6/64 変更 -> 90.6%一致
+            (bands // 10 + 1     , 90       , False),    # 7/64 変更 -> 89.1%一致
+            (bands // 2          , 50       , True),
+            (bands - 1           , 1        , True),     # 1/64一致 -> 1.6%一致
+            (bands               , 1        , False),
+        ]
+        # fmt: on
+        for changed_rows, threshold, expected in patterns:
+            with self.subTest(changed_rows=changed_rows, threshold=threshold):
+                frame_filter = UnchangedFrameFilter()
+                assert not frame_filter.is_unchanged(1, SIZE, frame(), threshold)
+                assert frame_filter.is_unchanged(1, SIZE, frame(changed_rows), threshold) == expected
+                assert frame_filter.skipped == int(expected)
+
+    def test_compare_with_saved(self):
+        """比較対象は最後に保存した（変化ありと判定した）フレーム"""
+        frame_filter = UnchangedFrameFilter()
+        assert not frame_filter.is_unchanged(1, SIZE, frame(), 95)
+        # 少しずつの変化（2/64）は、積み重なって保存したフレームとの差がしきい値を超えたら変化あり
+        assert frame_filter.is_unchanged(1, SIZE, frame(2), 95)
+        assert not frame_filter.is_unchanged(1, SIZE, frame(4), 95)
+        assert frame_filter.is_unchanged(1, SIZE, frame(4), 95)
+
+    def test_per_target(self):
+        """キャプチャー対象毎に前回フレームを保持する、サイズが変われば変化あり"""
+        frame_filter = UnchangedFrameFilter()
+        assert not frame_filter.is_unchanged(1, SIZE, frame(), 100)
+        assert not frame_filter.is_unchanged(2, SIZE, frame(SIZE[1]), 100)
+        assert frame_filter.is_unchanged(1, SIZE, frame(), 100)
+        assert frame_filter.is_unchanged(2, SIZE, frame(SIZE[1]), 100)
+        # 同じ画素データでもサイズが違えば別のフレーム
+        assert not frame_filter.is_unchanged(1, (SIZE[0] * 2, SIZE[1] // 2), frame(), 100)
+        assert frame_filter.skipped == 2
+
+    def test_check_commit(self):
+        """checkは比較だけを行い、commitした（保存に成功した）フレームを比較対象にする"""
+        frame_filter = UnchangedFrameFilter()
+        fingerprint = frame_filter.check(1, SIZE, frame(), 100)
+        assert fingerprint is not None
+        # 保存に失敗した（commitしなかった）フレームと同じフレームは変化ありのまま
+        assert frame_filter.check(1, SIZE, frame(), 100) == fingerprint
+        frame_filter.commit(1, fingerprint)
+        assert frame_filter.check(1, SIZE, frame(), 100) is None
+        assert frame_filter.skipped == 1
+
+    def test_reset(self):
+        """前回フレームとスキップ数をクリアする"""
+        frame_filter = UnchangedFrameFilter()
+        assert not frame_filter.is_unchanged(1, SIZE, frame(), 100)
+        assert frame_filter.is_unchanged(1, SIZE, frame(), 100)
+        frame_filter.reset()
+        assert frame_filter.skipped == 0
+        assert not frame_filter.is_unchanged(1, SIZE, frame(), 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# ruff: noqa: S101, ANN201
+"""Test-periodic_scheduler.py"""
+
+import threading
+import time
+import unittest
+from unittest import mock
+
+from periodic_scheduler import PeriodicScheduler
+
+
+def run_ticks(durations: list[float], interval_ms: int) -> PeriodicScheduler:
+    """回毎の処理時間を指定して、全ての回を実行し終えるまで定期実行する
+
+    * 時計（time.monotonic）を差し替え、待ち時間と処理時間の分だけ進める（実時間のずれに左右されない）
+    """
+    clock: list[float] = [0.0]
+    remaining = list(durations)
+
+    def wait(timeout: float) -> bool:
+        clock[0] += timeout
+        return not remaining
+
+    def callback() -> None:
+        clock[0] += remaining.pop(0)
+
+    stop = mock.Mock()
+    stop.wait.side_effect = wait
+    scheduler = PeriodicScheduler(callback, name="test")
+    scheduler.interval_ms = interval_ms
+    with mock.patch("periodic_scheduler.time.monotonic", side_effect=lambda: clock[0]):
+        scheduler._run(stop)  # noqa: SLF001
+    return scheduler
+
+
+class PeriodicSchedulerTest(unittest.TestCase):
+    def test_on_time(self):
+        scheduler = run_ticks([0.0, 0.0, 0.0], 50)
+        assert (scheduler.ticks, scheduler.late, scheduler.missed) == (3, 0, 0)
+
+    def test_late(self):
+        """間隔内に実行できたが、目標時刻から遅れた回（間隔の10%超）"""
+        # 1回目の処理が1.5間隔かかり、2回目は0.5間隔遅れる
+        scheduler = run_ticks([0.15, 0.0, 0.0], 100)
+        assert (scheduler.ticks, scheduler.late, scheduler.missed) == (3, 1, 0)
+
+    def test_missed(self):
+        """間に合わなかった回は飛ばし、次の予定は元の時刻系列のまま"""
+        # 1回目の処理が3.5間隔かかり、2回分を飛ばす（3回目の予定の0.5間隔後に実行）
+        scheduler = run_ticks([0.35, 0.0, 0.0], 100)
+        assert (scheduler.ticks, scheduler.missed) == (3, 2)
+
+    def test_stop_timeout(self):
+        """処理が終わらなくても停止は待ち時間の上限で戻る、処理が終わるまでは再開しない"""
+        release = threading.Event()
+        entered = threading.Event()
+
+        def callback() -> None:
+            entered.set()
+            release.wait(5.0)
+
+        scheduler = PeriodicScheduler(callback, name="test")
+        scheduler.start(10)
+        assert entered.wait(5.0)
+        with mock.patch.object(PeriodicScheduler, "STOP_TIMEOUT", 0.1), self.assertLogs("periodic_scheduler", "WARNING"):
+            start = time.monotonic()
+            scheduler.stop()
+            assert time.monotonic() - start < 1.0
+            assert scheduler.running
+            # 実行中の処理と並行して呼ばないよう、再開しない
+            assert not scheduler.start(10)
+        release.set()
+        assert scheduler.start(10)
+        scheduler.stop()
+        assert not scheduler.running
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# ruff: noqa: S101, ANN201
+"""Test-redaction.py"""
+
+import unittest
+
+import numpy as np
+
+from redaction import Redactor, redact
+from redaction_rule import RedactionRule, parse_rule
+
+# ディスプレイ構成（[0]はデスクトップ全体、ディスプレイ2はディスプレイ1の右）
+MONITORS: list[dict] = [
+    {"left": 0, "top": 0, "width": 300, "height": 100},
+    {"left": 0, "top": 0, "width": 200, "height": 100},
+    {"left": 200, "top": 0, "width": 100, "height": 80},
+]
+
+
+class ParseRuleTest(unittest.TestCase):
+    def test_parse(self):
+        assert parse_rule("1, 0, 10, 400, 1080") == RedactionRule(1, "", 0, 10, 400, 1080)
+        # タイトルにはカンマを含められる
+        assert parse_rule("title:Keys, Passwords, -8, 0, 300, 600") == RedactionRule(-1, "Keys, Passwords", -8, 0, 300, 600)
+
+    def test_invalid(self):
+        for text in ("1, 0, 0, 400", "x, 0, 0, 1, 1", "1, 0, 0, 0, 5", "title: , 0, 0, 1, 1", "-1, 0, 0, 1, 1"):
+            with self.subTest(text=text), self.assertRaises(ValueError):
+                parse_rule(text)
+
+
+class RedactorTest(unittest.TestCase):
+    def test_boxes(self):
+        """指定はキャプチャー領域基準に変換し、領域外は切り捨てる"""
+        redactor = Redactor([parse_rule("2, 10, 10, 50, 50"), parse_rule("title:secret, 5, 5, 20, 20")])
+        # デスクトップ全体
+        assert redactor.boxes(MONITORS[0], MONITORS) == [(210, 10, 260, 60)]
+        # ディスプレイ2のみ（高さ80で切り捨て）
+        assert Redactor([parse_rule("2, 10, 60, 50, 50")]).boxes(MONITORS[2], MONITORS) == [(10, 60, 60, 80)]
+        # ディスプレイ1には重ならない
+        assert redactor.boxes(MONITORS[1], MONITORS) == []
+        # トリミングしたアクティブウィンドウ（タイトルは大文字小文字を区別しない部分一致）
+        window = ("My SECRET notes", {"left": 180, "top": 0, "width": 100, "height": 60})
+        area = {"left": 188, "top": 8, "width": 84, "height": 44}
+        assert redactor.boxes(area, MONITORS, window) == [(22, 2, 72, 44), (0, 0, 17, 17)]
+        assert redactor.boxes(area, MONITORS, ("notes", window[1])) == [(22, 2, 72, 44)]
+
+    def test_black(self):
+        array = np.full((20, 30, 4), 200, dtype=np.uint8)
+        redact(array[5:15], [(2, 3, 10, 8)])
+        assert not array[8:13, 2:10].any()
+        assert (array[:8] == 200).all()
+        assert (array[8:13, 10:] == 200).all()
+
+    def test_pixelate(self):
+        """ブロック毎の平均値（端の半端なブロックはその範囲の平均値）、範囲外は変更しない"""
+        rng = np.random.default_rng(0)
+        array = rng.integers(0, 256, (40, 50, 4), dtype=np.uint8)
+        expected = array.copy()
+        box, block = (3, 2, 40, 35), 8
+        left, top, right, bottom = box
+        region = expected[top:bottom, left:right]
+        for y in range(0, bottom - top, block):
+            for x in range(0, right - left, block):
+                cell = region[y : y + block, x : x + block]
+                cell[:] = cell.sum(axis=(0, 1), dtype=np.uint32) // (cell.shape[0] * cell.shape[1])
+
+        redact(array, [box], "pixelate", block)
+        assert (array == expected).all()
+
+
+if __name__ == "__main__":
+    unittest.main()
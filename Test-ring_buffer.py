@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# ruff: noqa: S101, ANN201
+"""Test-ring_buffer.py"""
+
+import unittest
+
+from capture_backend import SyntheticBackend
+from ring_buffer import BufferedFrame, FrameRingBuffer, PreEventRecorder
+
+
+def _frame(timestamp: float, size: int) -> BufferedFrame:
+    return BufferedFrame(timestamp, {}, (1, 1), bytes(size))
+
+
+class FrameRingBufferTest(unittest.TestCase):
+    def test_memory_limit(self):
+        """上限を超えたら古いフレームから捨てる"""
+        buffer = FrameRingBuffer(100)
+        for n in range(10):
+            buffer.append(_frame(n, 30))
+            assert buffer.bytes_used <= 100
+        assert len(buffer) == 3
+        assert [f.timestamp for f in buffer.snapshot(100, now=9)] == [7, 8, 9]
+
+        # 上限より大きいフレームは保持しない
+        buffer.append(_frame(10, 101))
+        assert [f.timestamp for f in buffer.snapshot(100, now=10)] == [7, 8, 9]
+
+    def test_snapshot_seconds(self):
+        """直前N秒のフレーム"""
+        buffer = FrameRingBuffer(1000)
+        for n in range(10):
+            buffer.append(_frame(n, 1))
+        assert [f.timestamp for f in buffer.snapshot(3, now=9)] == [6, 7, 8, 9]
+        # 時刻0も指定値として扱う（現在時刻にしない）
+        assert [f.timestamp for f in buffer.snapshot(1, now=0)] == [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+
+
+class PreEventRecorderTest(unittest.TestCase):
+    def test_frames(self):
+        """圧縮して保持したフレームが元の画素データに戻る"""
+        backend = SyntheticBackend([(320, 200)])
+        area: dict = backend.monitors()[1]
+        window = ("Editor", area)
+        recorder = PreEventRecorder(lambda _moni_no: (backend.grab(area), window))
+        recorder.buffer.max_bytes = 1 << 20
+        recorder._tick()  # noqa: SLF001
+        recorder._tick()  # noqa: SLF001
+        frames = list(recorder.frames(60))
+        assert len(frames) == 2
+        assert [timestamp for _sct_img, _title, timestamp in frames] == [f.timestamp for f in recorder.buffer.snapshot(60)]
+        for n, (sct_img, title, _timestamp) in enumerate(frames):
+            assert title == "Editor"
+            assert sct_img.size == (320, 200)
+            assert sct_img.raw == backend.frame(area, n).raw
+
+
+if __name__ == "__main__":
+    unittest.main()
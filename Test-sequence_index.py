@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# ruff: noqa: S101, ANN201
+"""Test-sequence_index.py"""
+
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+from capture_filename import date_filename, sequence_filename
+from sequence_index import SequenceIndex
+
+
+class SequenceIndexTest(unittest.TestCase):
+    def test_next_free(self):
+        """空き番号の検索"""
+        # fmt: off
+        patterns = [
+            # files               , begin, expected
+            ([]                   , 0    , 0),
+            ([0, 1, 2, 3, 4, 5]   , 0    , 6),
+            ([0, 1, 3, 4, 5, 6]   , 0    , 2),
+            ([0, 1, 3, 4, 6, 7]   , 3    , 5),
+            ([0, 1, 2, 5]         , 1    , 3),
+            ([0, 1, 2]            , 10   , 10),
+            ([5, 6, 7]            , 0    , 0),
+        ]
+        # fmt: on
+        for files, begin, expected in patterns:
+            with self.subTest(files=files, begin=begin), tempfile.TemporaryDirectory() as tmp:
+                for n in files:
+                    (Path(tmp) / f"SS{n:06}.png").touch()
+                (Path(tmp) / "SS12.png").touch()  # 桁数違いは対象外
+                index = SequenceIndex(Path(tmp), "SS", 6)
+                assert index.next_free(begin) == expected
+
+    def test_reserve(self):
+        """確保した番号は書き込み前でも再利用されない"""
+        with tempfile.TemporaryDirectory() as tmp:
+            (Path(tmp) / "SS000000.png").touch()
+            index = SequenceIndex(Path(tmp), "SS", 6)
+            assert index.reserve(0) == 1
+            assert index.reserve(0) == 2
+            # 外部でのファイル追加（フォルダの更新日時変更）で作り直しても確保済みは残る
+            (Path(tmp) / "SS000003.png").touch()
+            index.invalidate()
+            assert index.reserve(0) == 4
+            # 書き込み中止（ファイル無し）は再走査後に空き番号に戻る
+            index.complete(1)
+            index.invalidate()
+            assert index.next_free(0) == 1
+
+    def test_external_file(self):
+        """走査後に外部で作られたファイルは、更新日時を取り込んだ後でも上書きしない"""
+        with tempfile.TemporaryDirectory() as tmp:
+            index = SequenceIndex(Path(tmp), "SS", 6)
+            assert index.reserve(0) == 0
+            (Path(tmp) / "SS000000.png").touch()
+            (Path(tmp) / "SS000001.png").touch()  # 外部での追加
+            index.complete(0)
+            assert index.reserve(0) == 2
+
+    def test_concurrent_writes(self):
+        """書き込み中の確保済み番号による更新日時の変化では作り直さない（外部の変更は作り直す）"""
+        with tempfile.TemporaryDirectory() as tmp:
+            (Path(tmp) / "SS000000.png").touch()
+            index = SequenceIndex(Path(tmp), "SS", 6)
+
+            def write(number: int) -> None:
+                (Path(tmp) / sequence_filename("SS", number, 6, ".png")).touch()
+                index.complete(number)
+
+            numbers: list[int] = []
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = []
+                for _ in range(60):
+                    numbers.append(index.reserve(0))
+                    futures.append(executor.submit(write, numbers[-1]))
+                for future in futures:
+                    future.result()
+            assert sorted(numbers) == list(range(1, 61))
+            assert index.rebuilds == 1
+
+            # 書き込み中の番号が無い時の外部の変更は作り直す
+            (Path(tmp) / "SS000061.png").touch()
+            assert index.reserve(0) == 62
+            assert index.rebuilds == 2
+
+
+class CaptureFilenameTest(unittest.TestCase):
+    def test_date(self):
+        now = datetime(2026, 10, 18, 10, 15, 0, 123456, ZoneInfo("Asia/Tokyo"))
+        # fmt: off
+        patterns = [
+            # milliseconds, serial, expected
+            (False        , -1    , "20261018_101500.png"),
+            (True         , -1    , "20261018_101500_123.png"),
+            (False        , 4     , "20261018_101500_004.png"),
+            (True         , 0     , "20261018_101500_123_000.png"),
+        ]
+        # fmt: on
+        for milliseconds, serial, expected in patterns:
+            with self.subTest(milliseconds=milliseconds, serial=serial):
+                assert date_filename(now, ".png", milliseconds=milliseconds, serial=serial) == expected
+
+    def test_sequence(self):
+        assert sequence_filename("SS", 12, 6, ".png") == "SS000012.png"
+        assert sequence_filename("", 1234567, 6, ".webp") == "1234567.webp"
+
+
+if __name__ == "__main__":
+    unittest.main()
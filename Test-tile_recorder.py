@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# ruff: noqa: S101, S311, ANN201
+"""Test-tile_recorder.py"""
+
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+from tile_recorder import TileReader, TileRecorder, changed_tiles
+
+
+class TileRecorderTest(unittest.TestCase):
+    def test_changed_tiles(self):
+        """変化したタイルの検出"""
+        width, height, tile = 100, 70, 32  # 4x3タイル（端は半端なサイズ）
+        previous = bytearray(width * height * 4)
+        # fmt: off
+        patterns = [
+            # (x, y)    , expected
+            ((0, 0)     , [0]),
+            ((31, 31)   , [0]),
+            ((32, 0)    , [1]),
+            ((99, 69)   , [11]),
+            ((64, 40)   , [6]),
+        ]
+        # fmt: on
+        for (x, y), expected in patterns:
+            with self.subTest(x=x, y=y):
+                current = bytearray(previous)
+                current[(y * width + x) * 4] = 0xFF
+                assert changed_tiles(previous, memoryview(current), width, height, tile) == expected
+        assert changed_tiles(previous, memoryview(bytearray(previous)), width, height, tile) == []
+
+    def test_round_trip(self):
+        """記録したフレームが元通りに復元できる"""
+        rnd = random.Random(0)
+        width, height = 150, 90
+        frames: list[tuple[tuple[int, int], bytes]] = []
+        data = bytearray(rnd.randbytes(width * height * 4))
+        for n in range(10):
+            data = bytearray(data)
+            for _ in range(n % 3):
+                pos = rnd.randrange(len(data))
+                data[pos] ^= 0x5A
+            if n == 6:  # 画面サイズ変更 -> キーフレーム
+                width, height = 80, 60
+                data = bytearray(rnd.randbytes(width * height * 4))
+            frames.append(((width, height), bytes(data)))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / f"test{TileRecorder.EXTENSION}"
+            recorder = TileRecorder(path, tile_size=16, keyframe_interval=4)
+            for size, pixels in frames:
+                recorder.add_frame(size, pixels)
+            recorder.close()
+
+            reader = TileReader(path)
+            try:
+                assert len(reader) == len(frames)
+                assert [kind for kind, *_ in reader.frames] == [0, 1, 1, 1, 0, 1, 0, 1, 1, 1]
+                for n, (size, pixels) in enumerate(frames):
+                    with self.subTest(frame=n):
+                        assert reader.frame(n) == (size, bytearray(pixels))
+            finally:
+                reader.close()
+
+    def test_write_error(self):
+        """書き込みに失敗したら1回だけ通知し、以降は記録せず、閉じる時にOSError"""
+        errors: list[BaseException] = []
+        with tempfile.TemporaryDirectory() as tmp:
+            recorder = TileRecorder(Path(tmp) / f"error{TileRecorder.EXTENSION}", tile_size=16, on_error=errors.append)
+            recorder._file.close()  # noqa: SLF001
+            for _ in range(3):
+                recorder.add_frame((16, 16), bytes(16 * 16 * 4))
+            with self.assertRaises(OSError):
+                recorder.close()
+            assert len(errors) == 1
+            assert recorder.error is errors[0]
+            assert recorder.frames == 0
+
+
+    def test_closed(self):
+        """閉じた後に届いたフレームは記録しない（例外にしない）"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / f"closed{TileRecorder.EXTENSION}"
+            recorder = TileRecorder(path, tile_size=16)
+            recorder.add_frame((16, 16), bytes(16 * 16 * 4))
+            recorder.close()
+            recorder.add_frame((16, 16), bytes(16 * 16 * 4))
+            assert recorder.closed
+            assert recorder.frames == 1
+            reader = TileReader(path)
+            try:
+                assert len(reader) == 1
+            finally:
+                reader.close()
+
+if __name__ == "__main__":
+    unittest.main()
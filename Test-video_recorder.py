@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# ruff: noqa: S101, ANN201
+"""Test-video_recorder.py"""
+
+import io
+import struct
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from PIL import Image
+
+from capture_backend import SyntheticBackend
+from video_recorder import AviWriter, VideoRecorder
+
+
+def read_avi(path: Path) -> tuple[dict, list[bytes], list[tuple]]:
+    """AVIファイルを解析して（avihの値, フレーム, idx1）を返す"""
+    data: bytes = path.read_bytes()
+    riff, riff_size, form = struct.unpack_from("<4sI4s", data, 0)
+    assert (riff, form) == (b"RIFF", b"AVI ")
+    assert riff_size == len(data) - 8
+
+    header: dict = {}
+    frames: list[bytes] = []
+    index: list[tuple] = []
+    movi_base: int = 0
+
+    def walk(start: int, end: int) -> None:
+        nonlocal movi_base
+        pos: int = start
+        while pos < end:
+            fourcc, size = struct.unpack_from("<4sI", data, pos)
+            body: int = pos + 8
+            if fourcc == b"LIST":
+                if data[body : body + 4] == b"movi":
+                    movi_base = body
+                walk(body + 4, body + size)
+            elif fourcc == b"avih":
+                values = struct.unpack_from("<14I", data, body)
+                header.update(total_frames=values[4], width=values[8], height=values[9])
+            elif fourcc == b"00dc":
+                frames.append(data[body : body + size])
+            elif fourcc == b"idx1":
+                index.extend(struct.iter_unpack("<4sIII", data[body : body + size]))
+            pos = body + size + (size & 1)
+
+    walk(12, len(data))
+    for _ckid, _flags, offset, size in index:
+        assert data[movi_base + offset : movi_base + offset + 4] == b"00dc"
+        assert struct.unpack_from("<I", data, movi_base + offset + 4)[0] == size
+    return (header, frames, index)
+
+
+class VideoRecorderTest(unittest.TestCase):
+    def test_record(self):
+        """記録したフレームがAVI（Motion JPEG）として読めること"""
+        backend = SyntheticBackend([(320, 200)])
+        area: dict = backend.monitors()[1]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "test.avi"
+            recorder = VideoRecorder(path, 500, 90)
+            for _ in range(15):
+                sct_img = backend.grab(area)
+                recorder.add_frame(sct_img.size, sct_img.raw)
+            recorder.close()
+
+            header, frames, index = read_avi(path)
+            assert header == {"total_frames": 15, "width": 320, "height": 200}
+            assert len(frames) == len(index) == 15
+            for jpeg in frames:
+                with Image.open(io.BytesIO(jpeg)) as img:
+                    assert img.format == "JPEG"
+                    assert img.size == (320, 200)
+
+    def test_flush(self):
+        """フラッシュ後は閉じていなくてもヘッダーのフレーム数とサイズが正しいこと"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "flush.avi"
+            writer = AviWriter(path, (16, 16), 100)
+            for n in range(3):
+                writer.write_frame(bytes([n]) * (n + 1))
+            writer.flush()
+            header, frames, index = read_avi(path)
+            assert header["total_frames"] == 3
+            assert frames == [b"\x00", b"\x01\x01", b"\x02\x02\x02"]
+            assert index == []
+            writer.close()
+
+    def test_rollover(self):
+        """画面サイズが変わったら次のファイルへ切り替えること"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "roll.avi"
+            recorder = VideoRecorder(path, 1000)
+            recorder.add_frame((8, 8), bytes(8 * 8 * 4))
+            recorder.add_frame((16, 8), bytes(16 * 8 * 4))
+            recorder.close()
+            assert [p.name for p in recorder.files] == ["roll.avi", "roll_001.avi"]
+            assert read_avi(recorder.files[1])[0]["width"] == 16
+
+    def test_create_error(self):
+        """最初のファイルが作成できなければ開始時にOSError"""
+        with tempfile.TemporaryDirectory() as tmp, self.assertRaises(OSError):
+            VideoRecorder(Path(tmp) / "missing" / "test.avi", 1000)
+
+    def test_no_frames(self):
+        """フレームが無ければ作成しておいたファイルを削除する"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "empty.avi"
+            recorder = VideoRecorder(path, 1000)
+            assert path.exists()
+            recorder.close()
+            assert not path.exists()
+
+    def test_closed(self):
+        """閉じた後に届いたフレームは記録しない（例外にしない）"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "closed.avi"
+            recorder = VideoRecorder(path, 1000)
+            recorder.add_frame((8, 8), bytes(8 * 8 * 4))
+            recorder.close()
+            recorder.add_frame((8, 8), bytes(8 * 8 * 4))
+            assert recorder.closed
+            assert recorder.frames == 1
+            assert read_avi(path)[0]["total_frames"] == 1
+
+    def test_write_error(self):
+        """書き込みに失敗したら1回だけ通知し、以降は記録せず、閉じる時にOSError（書き込めたフレームは読める）"""
+        errors: list[BaseException] = []
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "error.avi"
+            write_frame = AviWriter.write_frame
+
+            def fail_after_first(writer: AviWriter, jpeg: bytes) -> None:
+                if writer.frames > 0:
+                    msg = "disk full"
+                    raise OSError(msg)
+                write_frame(writer, jpeg)
+
+            recorder = VideoRecorder(path, 1000, on_error=errors.append)
+            with mock.patch.object(AviWriter, "write_frame", fail_after_first):
+                for _ in range(4):
+                    recorder.add_frame((8, 8), bytes(8 * 8 * 4))
+                with self.assertRaises(OSError):
+                    recorder.close()
+            assert len(errors) == 1
+            assert recorder.error is errors[0]
+            assert read_avi(path)[0]["total_frames"] == 1
+
+
+if __name__ == "__main__":
+    unittest.main()
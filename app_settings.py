@@ -1,34 +1,132 @@
+from collections.abc import Callable
 from dataclasses import dataclass, field
 
+from redaction_rule import REDACTION_MODES, parse_rule
+
+# 画像エンコーダーのプリセット
+ENCODER_PRESETS: tuple[str, ...] = ("png", "png_fast", "png_small", "webp", "jpeg", "fast")
+# 定期実行の出力形式
+PERIODIC_OUTPUTS: tuple[str, ...] = ("image", "tiles", "video")
+
+
+# metadataの項目毎のキーワード専用引数（呼び出し側で必要な項目だけを指定する）
+def ini(  # noqa: PLR0913
+    section: str,
+    option: str = "",
+    *,
+    options: tuple[str, ...] = (),
+    minimum: int | None = None,
+    maximum: int | None = None,
+    choices: tuple = (),
+    count: int = 0,
+    validate: Callable[[str], object] | None = None,
+) -> dict:
+    """設定ファイルとの対応（dataclasses.fieldのmetadata）
+
+    Args:
+        section(str): セクション名
+        option(str): オプション名（省略時はフィールド名、「folder{}」のように{}を含む場合は1からの連番のlist）
+        options(tuple): 固定長のlistの各要素のオプション名
+        minimum(int): 最小値
+        maximum(int): 最大値
+        choices(tuple): 取り得る値
+        count(int): 連番のlistの最大数（0=保存フォルダ履歴の最大数）
+        validate: 値の検証（不正な値はValueError）
+
+    Returns:
+        metadata
+
+    """
+    return {
+        "section": section,
+        "option": option,
+        "options": options,
+        "minimum": minimum,
+        "maximum": maximum,
+        "choices": choices,
+        "count": count,
+        "validate": validate,
+    }
+
 
 @dataclass
 class AppSettings:
-    auto_save: bool = True
-    save_folders: list[str] = field(default_factory=list)
-    save_folder_index: int = -1
-    numbering: int = 0
-    prefix: str = "SS"
-    sequence_digits: int = 6
-    sequence_begin: int = 0
-    capture_mcursor: bool = False
-    sound_on_capture: bool = False
-    delayed_capture: bool = False
-    delayed_time: int = 5
-    trimming: bool = False
-    trimming_size: list[int] = field(default_factory=lambda: [0, 0, 0, 0])
-    hotkey_clipboard: int = 0
-    hotkey_imagefile: int = 1
-    hotkey_activewin: int = 8
+    # basic section
+    auto_save: bool = field(default=True, metadata=ini("basic"))
+    save_folder_index: int = field(default=-1, metadata=ini("basic"))
+    save_folders: list[str] = field(default_factory=list, metadata=ini("basic", "folder{}"))
+    numbering: int = field(default=0, metadata=ini("basic", choices=(0, 1)))
+    prefix: str = field(default="SS", metadata=ini("basic"))
+    sequence_digits: int = field(default=6, metadata=ini("basic", minimum=1, maximum=6))
+    sequence_begin: int = field(default=0, metadata=ini("basic", minimum=0))
+    image_encoder: str = field(default="png", metadata=ini("basic", choices=ENCODER_PRESETS))
+    png_compress_level: int = field(default=6, metadata=ini("basic", minimum=0, maximum=9))
+    png_strategy: int = field(default=0, metadata=ini("basic", minimum=0, maximum=4))
+    jpeg_quality: int = field(default=90, metadata=ini("basic", minimum=1, maximum=100))
+    # other section
+    capture_mcursor: bool = field(default=False, metadata=ini("other", "mouse_cursor"))
+    sound_on_capture: bool = field(default=False, metadata=ini("other"))
+    diagnostics: bool = field(default=False, metadata=ini("other"))
+    # delayed_capture section
+    delayed_capture: bool = field(default=False, metadata=ini("delayed_capture"))
+    delayed_time: int = field(default=5, metadata=ini("delayed_capture", minimum=1, maximum=60))
+    # trimming section
+    trimming: bool = field(default=False, metadata=ini("trimming"))
+    trimming_size: list[int] = field(
+        default_factory=lambda: [0, 0, 0, 0],
+        metadata=ini("trimming", options=("top", "bottom", "left", "right"), minimum=0),
+    )
+    # hotkey section
+    hotkey_clipboard: int = field(default=0, metadata=ini("hotkey", "clipboard", choices=(0, 1)))
+    hotkey_imagefile: int = field(default=1, metadata=ini("hotkey", "imagefile", choices=(0, 1)))
+    hotkey_activewin: int = field(default=8, metadata=ini("hotkey", "activewin", minimum=0, maximum=11))
+    # periodic section
     periodic_capture: bool = False
-    periodic_save_folder: str = ""
-    periodic_interval: int = 3
-    periodic_stop_modifier: int = 0
-    periodic_stop_fkey: int = 11
-    periodic_target: int = -1
-    periodic_numbering: int = 0
+    periodic_save_folder: str = field(default="", metadata=ini("periodic", "save_folder"))
+    periodic_interval: int = field(default=3, metadata=ini("periodic", "interval", minimum=1))
+    periodic_interval_ms: int = field(default=0, metadata=ini("periodic", "interval_ms", minimum=0))
+    periodic_stop_modifier: int = field(default=0, metadata=ini("periodic", "stop_modifier", minimum=0, maximum=3))
+    periodic_stop_fkey: int = field(default=11, metadata=ini("periodic", "stop_fkey", minimum=0, maximum=11))
+    periodic_target: int = field(default=-1, metadata=ini("periodic", "target"))
+    periodic_numbering: int = field(default=0, metadata=ini("periodic", "numbering", choices=(0, 1)))
+    periodic_image_encoder: str = field(default="png", metadata=ini("periodic", "image_encoder", choices=ENCODER_PRESETS))
+    periodic_skip_unchanged: bool = field(default=False, metadata=ini("periodic", "skip_unchanged"))
+    periodic_skip_threshold: int = field(default=100, metadata=ini("periodic", "skip_threshold", minimum=1, maximum=100))
+    periodic_output: str = field(default="image", metadata=ini("periodic", "output", choices=PERIODIC_OUTPUTS))
+    periodic_tile_size: int = field(default=64, metadata=ini("periodic", "tile_size", minimum=8))
+    periodic_keyframe_interval: int = field(default=30, metadata=ini("periodic", "keyframe_interval", minimum=1))
+    # burst section
+    burst_capture: bool = field(default=False, metadata=ini("burst"))
+    burst_modifier: int = field(default=0, metadata=ini("burst", "modifier", choices=(0, 1)))
+    burst_fkey: int = field(default=9, metadata=ini("burst", "fkey", minimum=0, maximum=11))
+    burst_target: int = field(default=-1, metadata=ini("burst", "target"))
+    burst_frames: int = field(default=10, metadata=ini("burst", "frames", minimum=1, maximum=100))
+    burst_interval_ms: int = field(default=100, metadata=ini("burst", "interval_ms", minimum=0))
+    # prebuffer section
+    prebuffer: bool = field(default=False, metadata=ini("prebuffer"))
+    prebuffer_target: int = field(default=0, metadata=ini("prebuffer", "target"))
+    prebuffer_interval_ms: int = field(default=1000, metadata=ini("prebuffer", "interval_ms", minimum=1))
+    prebuffer_memory_mb: int = field(default=256, metadata=ini("prebuffer", "memory_mb", minimum=1))
+    prebuffer_seconds: int = field(default=10, metadata=ini("prebuffer", "seconds", minimum=1))
+    prebuffer_modifier: int = field(default=0, metadata=ini("prebuffer", "modifier", choices=(0, 1)))
+    prebuffer_fkey: int = field(default=10, metadata=ini("prebuffer", "fkey", minimum=0, maximum=11))
+    # redaction section
+    redaction: bool = field(default=False, metadata=ini("redaction"))
+    redaction_mode: str = field(default="black", metadata=ini("redaction", "mode", choices=REDACTION_MODES))
+    redaction_block: int = field(default=16, metadata=ini("redaction", "block", minimum=2, maximum=256))
+    redaction_rules: list[str] = field(
+        default_factory=list,
+        metadata=ini("redaction", "rule{}", count=32, validate=parse_rule),
+    )
+    # history section
+    capture_history: bool = field(default=True, metadata=ini("history"))
+
+    def prebuffer_memory_bytes(self) -> int:
+        return self.prebuffer_memory_mb * 1024 * 1024
 
     def delayed_time_to_ms(self) -> int:
         return self.delayed_time * 1000
 
     def periodic_interval_to_ms(self) -> int:
-        return self.periodic_interval * 1000
+        # interval_ms（1秒未満の指定用）が有効ならそちらを優先する
+        return self.periodic_interval_ms if self.periodic_interval_ms > 0 else self.periodic_interval * 1000
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+#
+"""bench_capture.py
+
+キャプチャー処理の段階毎のベンチマーク
+
+* 解像度（1080p、4K、4K×3のデスクトップ）毎に、各段階の処理時間とピークメモリを計測する
+    * grab          : 画面の取得（CaptureManager.grab、デスクトップ全体、トリミング量を含めた領域）
+    * frombytes     : Image.frombytes("BGRX")による変換
+    * encode        : 画像ファイル出力（エンコーダーのプリセット毎）
+    * clipboard_dib : クリップボード出力（bgra_to_dib）
+    * redact        : 墨消し（REDACTION_RULESの範囲、方法毎、1フレームあたり）
+    * create_filename : ファイル名生成（日時、シーケンス番号の確保を含めたScreenShot.create_filenameと同じ経路）
+* 既定では合成フレームのバックエンド（synthetic）を使うので、画面の無い環境でも実行できる
+* ピークメモリはtracemallocで計測する（Pillow内部の画像バッファはPythonのアロケーター外のため含まれない）
+* 結果はJSONで出力し、リリース間の比較に使う
+
+"""
+
+import argparse
+import io
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from app_settings import AppSettings
+from capture_backend import SyntheticBackend, create_backend
+from capture_filename import date_filename, sequence_filename
+from capture_manager import CaptureManager, FrameView, bgra_to_dib, get_encoder
+from redaction import Redactor
+from redaction_rule import REDACTION_MODES, parse_rule
+from sequence_index import SequenceIndex
+from version import INFO
+
+# 解像度（ディスプレイ毎の解像度のlist）
+RESOLUTIONS: dict[str, list[tuple[int, int]]] = {
+    "1080p": [(1920, 1080)],
+    "4k": [(3840, 2160)],
+    "3x4k": [(3840, 2160)] * 3,
+}
+# 画像ファイル出力で計測するエンコーダーのプリセット
+ENCODERS: tuple[str, ...] = ("png", "png_fast", "fast")
+# トリミング量[上, 下, 左, 右]（アクティブウィンドウのタイトルバーと枠を想定）
+TRIMMING_SIZE: list[int] = [32, 8, 8, 8]
+# 墨消しの指定（ディスプレイ1の左端のパネル、中央付近のウィンドウを想定）
+REDACTION_RULES: tuple[str, ...] = ("1, 0, 0, 400, 1080", "0, 760, 340, 800, 600")
+# シーケンス番号のベンチマークで保存フォルダに置いておくファイル数
+SEQUENCE_FILES: int = 10000
+
+
+def measure(func: Callable[[], object], repeat: int) -> dict:
+    """処理時間とピークメモリの計測
+
+    Args:
+        func: 計測する処理
+        repeat(int): 繰り返し回数
+
+    Returns:
+        計測結果（ミリ秒、KiB）
+
+    """
+    func()  # ウォームアップ
+    results: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        results.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    func()
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "min_ms": round(min(results), 3),
+        "median_ms": round(statistics.median(results), 3),
+        "mean_ms": round(statistics.mean(results), 3),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def bench_resolution(name: str, capture: CaptureManager, settings: AppSettings, repeat: int) -> list[dict]:
+    """1解像度分のベンチマーク"""
+    results: list[dict] = []
+
+    def add(stage: str, mode: str, func: Callable[[], object]) -> None:
+        result: dict = {"resolution": name, "stage": stage, "mode": mode, **measure(func, repeat)}
+        results.append(result)
+        print(
+            f"{name:<6} {stage:<15} {mode:<10}: median={result['median_ms']:9.3f}ms, "
+            f"min={result['min_ms']:9.3f}ms, peak={result['peak_kib']:10.1f}KiB",
+        )
+
+    add("grab", "desktop", lambda: capture.grab(0))
+    add("grab", "trimmed", lambda: capture.grab(0, TRIMMING_SIZE))
+    sct_img = capture.grab(0)
+    if sct_img is None:
+        return results
+
+    add("frombytes", "BGRX", lambda: Image.frombytes("RGB", sct_img.size, sct_img.bgra, "raw", "BGRX"))
+    img = Image.frombytes("RGB", sct_img.size, sct_img.bgra, "raw", "BGRX")
+
+    for preset in ENCODERS:
+        encoder = get_encoder(preset, settings)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / f"bench{encoder.extension}"
+
+            def encode(encoder=encoder, path=path) -> None:  # noqa: ANN001
+                # CaptureManager._processと同じく、メモリ上でエンコードしてから書き込む
+                with io.BytesIO() as output:
+                    encoder.encode(img, output)
+                    with path.open("wb") as f:
+                        f.write(output.getbuffer())
+
+            add("encode", preset, encode)
+
+    add("clipboard_dib", "CF_DIB", lambda: bgra_to_dib(sct_img.raw, sct_img.size))
+
+    # 墨消しは画素データを直接書き換えるので最後に計測する
+    area: dict = {"left": sct_img.left, "top": sct_img.top, "width": sct_img.width, "height": sct_img.height}
+    array = FrameView.of(sct_img).as_array()
+    for mode in REDACTION_MODES:
+        capture.redactor = Redactor([parse_rule(rule) for rule in REDACTION_RULES], mode)
+        if (redaction := capture.redaction_for(area)) is not None:
+            add("redact", mode, lambda redaction=redaction: redaction(array))
+    capture.redactor = None
+    return results
+
+
+def bench_filename(settings: AppSettings, repeat: int) -> list[dict]:
+    """ファイル名生成のベンチマーク（ScreenShot.create_filenameと同じ関数、インデックスを使う）"""
+    results: list[dict] = []
+
+    def date_name() -> str:
+        return date_filename(datetime.now(ZoneInfo("Asia/Tokyo")), ".png")
+
+    results.append({"resolution": "-", "stage": "create_filename", "mode": "date", **measure(date_name, repeat)})
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        folder = Path(temp_dir)
+        prefix: str = settings.prefix
+        digits: int = settings.sequence_digits
+        for n in range(SEQUENCE_FILES):
+            (folder / sequence_filename(prefix, n, digits, ".png")).touch()
+        index = SequenceIndex(folder, prefix, digits, ".png")
+
+        def sequence_name() -> str:
+            # 確保した番号はすぐに返却し、毎回同じ条件（使用済みの番号が続いた後の空き番号探索）で計測する
+            number: int = index.reserve(settings.sequence_begin)
+            index.cancel(number)
+            return str(folder / sequence_filename(prefix, number, digits, ".png"))
+
+        results.append(
+            {"resolution": "-", "stage": "create_filename", "mode": "sequence", **measure(sequence_name, repeat)},
+        )
+
+    for result in results:
+        print(f"{'-':<6} {result['stage']:<15} {result['mode']:<10}: median={result['median_ms']:9.3f}ms")
+
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Capture pipeline benchmark.")
+    parser.add_argument(
+        "-r",
+        "--resolution",
+        action="append",
+        choices=list(RESOLUTIONS),
+        help="Resolution to measure (repeatable, default: all).",
+    )
+    parser.add_argument("-b", "--backend", default="synthetic", help="Capture backend (synthetic, mss, win32, auto).")
+    parser.add_argument("-n", "--repeat", type=int, default=10, help="Number of repetitions.")
+    parser.add_argument("-o", "--output", type=Path, help="JSON output file.")
+    args = parser.parse_args()
+
+    settings = AppSettings()
+    results: list[dict] = []
+    for name in args.resolution or list(RESOLUTIONS):
+        # 実画面のバックエンドは解像度を選べないので、実際のデスクトップで1回だけ計測する
+        if args.backend != "synthetic" and results:
+            break
+        backend = SyntheticBackend(RESOLUTIONS[name]) if args.backend == "synthetic" else create_backend(args.backend)
+        capture = CaptureManager(backend)
+        try:
+            label: str = name if args.backend == "synthetic" else "desktop"
+            results.extend(bench_resolution(label, capture, settings, args.repeat))
+        finally:
+            capture.close()
+
+    results.extend(bench_filename(settings, args.repeat))
+
+    report: dict = {
+        "version": INFO["VERSION"],
+        "timestamp": datetime.now().astimezone().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "backend": args.backend,
+        "repeat": args.repeat,
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"Results saved to '{args.output}'")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,6 +8,7 @@
 --noinclude-setuptools-mode=allow ^
 --windows-console-mode=disable ^
 --windows-icon-from-ico=./resource_data/ScreenShot.ico ^
+--include-data-files=./res/resources.bin=res/resources.bin ^
 --company-name="Nakayoshi Studio" ^
 --file-description="PyScreenShot: XN[VbgAvP[V" ^
 --file-version=2.0.0.0 ^
@@ -0,0 +1,93 @@
+import logging
+import threading
+import time
+from collections.abc import Callable
+
+import mss.screenshot
+
+logger = logging.getLogger(__name__)
+
+
+class BurstCapture:
+    """連写キャプチャー
+
+    * 専用スレッドで、指定間隔（開始時刻からの絶対時刻）毎に画面を取得してメモリに保持する
+    * エンコード、書き込みは全フレームの取得後に行う（取得間隔は画面の取得時間だけで決まる）
+    """
+
+    # 1回の連写の最大フレーム数（保持する画素データの上限）
+    MAX_FRAMES: int = 100
+
+    def __init__(
+        self,
+        grab: Callable[[int], tuple[mss.screenshot.ScreenShot | None, tuple[str, dict] | None]],
+        on_finished: Callable[[int, list[tuple[mss.screenshot.ScreenShot, str, float]]], None],
+    ) -> None:
+        """初期処理
+
+        Args:
+            grab: 画面の取得処理（引数はキャプチャー対象、戻り値は画像とアクティブウィンドウの(タイトル, 領域)）
+            on_finished: 取得完了時の処理（キャプチャー対象とフレーム(画像, タイトル, 取得時刻)のlist、連写スレッドで呼ぶ）
+
+        Returns:
+            none
+
+        """
+        self._grab = grab
+        self._on_finished = on_finished
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, moni_no: int, count: int, interval_ms: int) -> bool:
+        """連写の開始
+
+        Args:
+            moni_no(int): キャプチャー対象
+            count(int): フレーム数
+            interval_ms(int): 間隔（ミリ秒）
+
+        Returns:
+            True=開始した、False=連写中のため開始しなかった
+
+        """
+        if self.running:
+            logger.warning("Burst capture is already running.")
+            return False
+
+        count = max(1, min(count, BurstCapture.MAX_FRAMES))
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(moni_no, count, max(0, interval_ms) / 1000),
+            name="burst",
+            daemon=True,
+        )
+        self._thread.start()
+        return True
+
+    def join(self) -> None:
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self, moni_no: int, count: int, interval: float) -> None:
+        frames: list[tuple[mss.screenshot.ScreenShot, str, float]] = []
+        start: float = time.monotonic()
+        for n in range(count):
+            if (delay := start + n * interval - time.monotonic()) > 0:
+                time.sleep(delay)
+            try:
+                sct_img, window = self._grab(moni_no)
+                if sct_img is not None:
+                    frames.append((sct_img, window[0] if window else "", time.time()))
+            except Exception:
+                logger.exception("Burst capture grab failed")
+                break
+
+        elapsed: float = time.monotonic() - start
+        logger.info(f"Burst capture grabbed {len(frames)}/{count} frames in {elapsed * 1000:.0f}ms")
+        try:
+            self._on_finished(moni_no, frames)
+        except Exception:
+            logger.exception("Burst capture failed")
@@ -0,0 +1,306 @@
+"""capture_backend.py
+
+キャプチャーバックエンド（画面の取得、ディスプレイ情報、アクティブウィンドウ、クリップボード）
+
+* CaptureBackend : バックエンドの基底クラス
+* MssBackend     : mssによる画面の取得（Linux/X11、Xvfb等）
+* SyntheticBackend : 決まった内容のフレームを生成する（画面の無い環境でのテスト、ベンチマーク用）
+* Win32Backend   : Windows用（win32_backend.py、Windowsでのみ読み込む）
+
+"""
+
+import importlib
+import logging
+import shutil
+import struct
+import subprocess
+import sys
+import threading
+from abc import ABC, abstractmethod
+
+import mss
+import mss.base
+import mss.models
+import mss.screenshot
+
+logger = logging.getLogger(__name__)
+
+# バックエンド名
+BACKENDS: tuple[str, ...] = ("auto", "win32", "mss", "synthetic")
+# BMPファイルヘッダー（識別子, ファイルサイズ, 予約, 予約, 画素データの位置）
+BITMAPFILEHEADER = struct.Struct("<2sIHHI")
+
+
+class CaptureBackend(ABC):
+    """キャプチャーバックエンド"""
+
+    @abstractmethod
+    def monitors(self) -> list[dict]:
+        """ディスプレイ情報の取得
+
+        Returns:
+            mss形式のディスプレイ情報のlist（0=全ディスプレイを含む領域、1～=各ディスプレイ）
+
+        """
+
+    @abstractmethod
+    def grab(self, area: dict) -> mss.screenshot.ScreenShot:
+        """指定領域の取得
+
+        Args:
+            area(dict): 領域（left, top, width, height）
+
+        Returns:
+            mssのキャプチャー画像
+
+        """
+
+    def active_window(self) -> tuple[str, dict] | None:
+        """アクティブウィンドウの取得
+
+        Returns:
+            (ウィンドウタイトル, 領域)、対象が無い（または非対応の）場合はNone
+
+        """
+        return None
+
+    @abstractmethod
+    def set_clipboard_dib(self, data: bytes | bytearray) -> None:
+        """クリップボードへDIB（CF_DIB）を設定する
+
+        Args:
+            data: BITMAPINFOHEADERと画素データ（bgra_to_dibの出力）
+
+        Returns:
+            none
+
+        """
+
+    @abstractmethod
+    def start(self) -> None:
+        """UIスレッドでの開始処理（イベントの追跡等）"""
+
+    @abstractmethod
+    def stop(self) -> None:
+        """UIスレッドでの終了処理"""
+
+    @abstractmethod
+    def close(self) -> None:
+        """資源の解放"""
+
+
+class MssBackend(CaptureBackend):
+    """mssによる画面の取得
+
+    * mssのセッションは呼び出しスレッド毎に初回に生成し、以降は再利用する
+    * ディスプレイ構成が変わっていたら作り直す（sct.monitorsの再取得）
+    * 構成変更の検出は_display_layoutを実装したサブクラス（Win32Backend）のみ
+      mssはsct.monitorsをセッション生成時の値のまま保持するため、このクラスでは検出できない
+      （Linux等でディスプレイ構成を変更した場合は、close()でセッションを破棄するか、アプリを再起動する）
+    """
+
+    # クリップボードへの設定（xclip）の待ち時間の上限（秒）
+    CLIPBOARD_TIMEOUT: float = 5.0
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._sessions: list[mss.base.MSSBase] = []
+        self._sessions_lock = threading.Lock()
+
+    def _display_layout(self) -> tuple:
+        """ディスプレイ構成の取得（構成変更の検出用、このクラスは検出しないので常に空）"""
+        return ()
+
+    def _get_session(self) -> mss.base.MSSBase:
+        layout: tuple = self._display_layout()
+        sct: mss.base.MSSBase | None = getattr(self._local, "sct", None)
+        if sct is not None and self._local.layout != layout:
+            logger.debug("Display layout changed, re-create capture session.")
+            self._close_session(sct)
+            sct = None
+
+        if sct is None:
+            sct = mss.mss()
+            self._local.sct = sct
+            self._local.layout = layout
+            with self._sessions_lock:
+                self._sessions.append(sct)
+
+        return sct
+
+    def _close_session(self, sct: mss.base.MSSBase) -> None:
+        with self._sessions_lock:
+            if sct in self._sessions:
+                self._sessions.remove(sct)
+        sct.close()
+        if getattr(self._local, "sct", None) is sct:
+            self._local.sct = None
+
+    def monitors(self) -> list[dict]:
+        return self._get_session().monitors
+
+    def grab(self, area: dict) -> mss.screenshot.ScreenShot:
+        return self._get_session().grab(area)
+
+    def set_clipboard_dib(self, data: bytes | bytearray) -> None:
+        """クリップボードへDIBをBMP（image/bmp）として設定する（X11、xclipを使う）"""
+        if (xclip := shutil.which("xclip")) is None:
+            msg = "xclip が見つかりません（クリップボードへのコピーにはxclipが必要です）"
+            raise OSError(msg)
+
+        # BMPファイルヘッダー（画素データはBITMAPINFOHEADERの直後、32bitなのでカラーテーブルは無い）
+        (info_size,) = struct.unpack_from("<I", data)
+        size: int = BITMAPFILEHEADER.size + len(data)
+        header: bytes = BITMAPFILEHEADER.pack(b"BM", size, 0, 0, BITMAPFILEHEADER.size + info_size)
+        # xclipは入力を読み終えるとバックグラウンドでクリップボードの所有者として残り、呼び出し元へすぐ戻る
+        subprocess.run(  # noqa: S603
+            [xclip, "-selection", "clipboard", "-t", "image/bmp"],
+            input=header + data,
+            check=True,
+            timeout=MssBackend.CLIPBOARD_TIMEOUT,
+        )
+
+    def start(self) -> None:
+        """開始処理（追跡するイベントは無い）"""
+
+    def stop(self) -> None:
+        """終了処理（追跡するイベントは無い）"""
+
+    def close(self) -> None:
+        """全キャプチャーセッションの解放"""
+        with self._sessions_lock:
+            sessions = self._sessions.copy()
+            self._sessions.clear()
+        for sct in sessions:
+            sct.close()
+        self._local = threading.local()
+
+
+class SyntheticBackend(CaptureBackend):
+    """決まった内容のフレームを生成するバックエンド
+
+    * ディスプレイは指定した解像度で左から横に並べる
+    * 背景は座標から決まる模様で、取得毎に位置の変わる四角形（マーカー）を描く（フレーム番号が同じなら同じ画像）
+    * クリップボードへの設定内容はclipboardに保持する
+    """
+
+    # マーカーの大きさ（ピクセル）
+    MARKER_SIZE: int = 64
+
+    def __init__(
+        self,
+        resolutions: list[tuple[int, int]] | None = None,
+        window: dict | None = None,
+        window_title: str = "Synthetic window",
+    ) -> None:
+        """初期処理
+
+        Args:
+            resolutions(list): ディスプレイ毎の解像度(幅, 高さ)、None=1920x1080が1台
+            window(dict): アクティブウィンドウの領域、None=ウィンドウ無し
+            window_title(str): アクティブウィンドウのタイトル
+
+        Returns:
+            none
+
+        """
+        self._monitors: list[dict] = [{}]
+        left: int = 0
+        for width, height in resolutions or [(1920, 1080)]:
+            self._monitors.append({"left": left, "top": 0, "width": width, "height": height})
+            left += width
+        self._width: int = left
+        self._height: int = max(m["height"] for m in self._monitors[1:])
+        self._monitors[0] = {"left": 0, "top": 0, "width": self._width, "height": self._height}
+        self._window: dict | None = window
+        self._window_title: str = window_title
+        self._desktop: bytes = self._make_desktop(self._width, self._height)
+        self._lock = threading.Lock()
+        self.frame_no: int = 0
+        self.clipboard: bytes | bytearray | None = None
+
+    @staticmethod
+    def _make_desktop(width: int, height: int) -> bytes:
+        """背景の模様を作る（行毎に1ピクセルずらしたグラデーション）"""
+        period: int = 256
+        pattern = bytes(v for x in range(width + period) for v in (x & 0xFF, (x * 3) & 0xFF, (x * 7) & 0xFF, 0xFF))
+        stride: int = width * 4
+        return b"".join(pattern[(y % period) * 4 : (y % period) * 4 + stride] for y in range(height))
+
+    def monitors(self) -> list[dict]:
+        return self._monitors
+
+    def frame(self, area: dict, frame_no: int) -> mss.screenshot.ScreenShot:
+        """指定フレーム番号の画像を生成する"""
+        left, top, width, height = area["left"], area["top"], area["width"], area["height"]
+        stride: int = width * 4
+        data = bytearray(stride * height)
+        # 仮想デスクトップと重なる範囲だけ背景をコピーする（範囲外は黒）
+        x0, x1 = max(left, 0), min(left + width, self._width)
+        y0, y1 = max(top, 0), min(top + height, self._height)
+        if x0 < x1:
+            length: int = (x1 - x0) * 4
+            for y in range(y0, y1):
+                src: int = (y * self._width + x0) * 4
+                dst: int = (y - top) * stride + (x0 - left) * 4
+                data[dst : dst + length] = self._desktop[src : src + length]
+
+        # マーカー（フレーム番号で位置を決める）
+        size: int = SyntheticBackend.MARKER_SIZE
+        mx: int = (frame_no * 97) % max(1, self._width - size)
+        my: int = (frame_no * 53) % max(1, self._height - size)
+        mx0, mx1 = max(mx, left), min(mx + size, left + width)
+        if mx0 < mx1:
+            fill: bytes = bytes((frame_no & 0xFF, 0x00, 0xFF, 0xFF)) * (mx1 - mx0)
+            for y in range(max(my, top), min(my + size, top + height)):
+                dst = (y - top) * stride + (mx0 - left) * 4
+                data[dst : dst + len(fill)] = fill
+
+        return mss.screenshot.ScreenShot(data, area, size=mss.models.Size(width, height))
+
+    def grab(self, area: dict) -> mss.screenshot.ScreenShot:
+        with self._lock:
+            frame_no: int = self.frame_no
+            self.frame_no += 1
+        return self.frame(area, frame_no)
+
+    def active_window(self) -> tuple[str, dict] | None:
+        return (self._window_title, self._window) if self._window else None
+
+    def set_clipboard_dib(self, data: bytes | bytearray) -> None:
+        self.clipboard = data
+
+    def start(self) -> None:
+        """開始処理（追跡するイベントは無い）"""
+
+    def stop(self) -> None:
+        """終了処理（追跡するイベントは無い）"""
+
+    def close(self) -> None:
+        """資源の解放（保持する資源は無い）"""
+
+
+def create_backend(name: str = "auto") -> CaptureBackend:
+    """バックエンドの生成
+
+    Args:
+        name(str): バックエンド名（auto=Windowsはwin32、それ以外はmss）
+
+    Returns:
+        バックエンド
+
+    """
+    if name == "auto":
+        name = "win32" if sys.platform == "win32" else "mss"
+
+    match name:
+        case "win32":
+            # win32系モジュールはWindowsでのみ読み込む
+            return importlib.import_module("win32_backend").Win32Backend()
+        case "mss":
+            return MssBackend()
+        case "synthetic":
+            return SyntheticBackend()
+        case _:
+            msg = f"Unknown capture backend '{name}'."
+            raise ValueError(msg)
@@ -0,0 +1,46 @@
+"""capture_filename.py
+
+画像ファイル名の生成（日時、接頭語＋シーケンス番号）
+
+* ScreenShot.create_filename、SequenceIndex、ベンチマークで同じ命名規則を使う（wxPythonに依存しない）
+
+"""
+
+from datetime import datetime
+
+
+def date_filename(now: datetime, extension: str, *, milliseconds: bool = False, serial: int = -1) -> str:
+    """日時のファイル名（例: 20261018_101500.png、20261018_101500_123_004.png）
+
+    Args:
+        now(datetime): 日時
+        extension(str): 拡張子
+        milliseconds(bool): True=ミリ秒まで付ける（1秒未満の定期実行）
+        serial(int): 連写のフレーム番号、全ディスプレイのディスプレイ番号（0～、-1=付けない）
+
+    Returns:
+        ファイル名
+
+    """
+    filename: str = now.strftime("%Y%m%d_%H%M%S")
+    if milliseconds:
+        filename += f"_{now.microsecond // 1000:03}"
+    if serial >= 0:
+        filename += f"_{serial:03}"
+    return filename + extension
+
+
+def sequence_filename(prefix: str, number: int, digits: int, extension: str) -> str:
+    """接頭語＋シーケンス番号のファイル名（例: SS000001.png）
+
+    Args:
+        prefix(str): 接頭語
+        number(int): シーケンス番号
+        digits(int): シーケンス番号の桁数（足りない分は0で埋める）
+        extension(str): 拡張子
+
+    Returns:
+        ファイル名
+
+    """
+    return f"{prefix}{number:0>{digits}}{extension}"
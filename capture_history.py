@@ -0,0 +1,180 @@
+"""capture_history.py
+
+キャプチャー履歴のインデックス（SQLite）
+
+* 画像ファイルへのキャプチャー（手動、定期実行、連写等）毎に記録する
+    日時、対象、ウィンドウタイトル、領域、ファイル、サイズ、ハッシュ
+* 書き込みは専用スレッドで、一定時間内の記録をまとめて1トランザクションで行う（キャプチャーのワーカー、UIスレッドは待たない）
+* 検索はインデックスだけを参照し、ファイルシステムには触れない（WALモードなので書き込み中でも読める）
+
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+from queue import Empty, Queue
+from typing import NamedTuple
+
+logger = logging.getLogger(__name__)
+
+_CREATE_TABLE: str = """
+CREATE TABLE IF NOT EXISTS captures (
+    id INTEGER PRIMARY KEY,
+    timestamp REAL NOT NULL,
+    kind TEXT NOT NULL,
+    target INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    "left" INTEGER NOT NULL,
+    "top" INTEGER NOT NULL,
+    width INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    digest TEXT NOT NULL
+)
+"""
+_CREATE_INDEXES: tuple[str, ...] = (
+    "CREATE INDEX IF NOT EXISTS captures_timestamp ON captures (timestamp)",
+    "CREATE INDEX IF NOT EXISTS captures_digest ON captures (digest)",
+)
+_COLUMNS: str = 'timestamp, kind, target, title, "left", "top", width, height, path, size, digest'
+_INSERT: str = f"INSERT INTO captures ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"  # noqa: S608
+
+
+class HistoryEntry(NamedTuple):
+    timestamp: float  # キャプチャー時刻（UNIX時間）
+    kind: str  # 種別（file, periodic, burst, displays, prebuffer）
+    target: int  # キャプチャー対象（0=デスクトップ、1～=ディスプレイ、ACTIVE_WINDOW=アクティブウィンドウ）
+    title: str  # アクティブウィンドウのタイトル（ウィンドウ以外、不明な場合は空文字列）
+    left: int  # キャプチャー領域（画面座標）
+    top: int
+    width: int
+    height: int
+    path: str  # 保存ファイル
+    size: int  # ファイルサイズ（バイト）
+    digest: str  # ファイル内容のハッシュ（BLAKE2b、16進数）
+
+
+def content_digest(data: bytes | bytearray | memoryview) -> str:
+    """ファイル内容のハッシュ（同じ画像の検出用）"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _escape_like(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class CaptureHistory:
+    """キャプチャー履歴のインデックス"""
+
+    # 1トランザクションにまとめる記録の上限
+    BATCH_SIZE: int = 256
+    # 最初の記録から書き込むまでに、後続の記録を待つ時間（秒）
+    FLUSH_DELAY: float = 1.0
+    # 検索結果の上限
+    MAX_RESULTS: int = 200
+
+    def __init__(self, path: Path) -> None:
+        """初期処理（インデックスが無ければ作成し、書き込みスレッドを開始する）
+
+        Args:
+            path(pathlib.Path): インデックスのファイル
+
+        Returns:
+            none
+
+        """
+        self.path = path
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_CREATE_TABLE)
+            for sql in _CREATE_INDEXES:
+                conn.execute(sql)
+        self._queue: Queue[HistoryEntry | None] = Queue()
+        self._closed: bool = False
+        self._thread = threading.Thread(target=self._run, name="capture_history", daemon=True)
+        self._thread.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=5.0)
+        # WALモードではコミット毎の同期は不要（チェックポイントで同期する）
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def add(self, entry: HistoryEntry) -> None:
+        """記録の追加（書き込みは専用スレッドで行う、どのスレッドからでも呼べる）"""
+        if not self._closed:
+            self._queue.put(entry)
+
+    def flush(self) -> None:
+        """書き込み待ちの記録が書き込まれるまで待つ"""
+        self._queue.join()
+
+    def close(self) -> None:
+        """書き込み待ちの記録を書き込んで終了する"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        with closing(self._connect()) as conn:
+            stop: bool = False
+            while not stop:
+                entry: HistoryEntry | None = self._queue.get()
+                batch: list[HistoryEntry] = []
+                if entry is None:
+                    stop = True
+                else:
+                    batch.append(entry)
+                    # 後続の記録をまとめる（定期実行、連写、全ディスプレイの保存は1トランザクションになる）
+                    deadline: float = time.monotonic() + CaptureHistory.FLUSH_DELAY
+                    while len(batch) < CaptureHistory.BATCH_SIZE and (remaining := deadline - time.monotonic()) > 0:
+                        try:
+                            entry = self._queue.get(timeout=remaining)
+                        except Empty:
+                            break
+                        if entry is None:
+                            stop = True
+                            break
+                        batch.append(entry)
+                self._write(conn, batch)
+                for _ in range(len(batch) + stop):
+                    self._queue.task_done()
+
+    def _write(self, conn: sqlite3.Connection, batch: list[HistoryEntry]) -> None:
+        if not batch:
+            return
+        try:
+            with conn:
+                conn.executemany(_INSERT, batch)
+        except sqlite3.Error:
+            logger.exception(f"Capture history write failed ({len(batch)} entries dropped)")
+        else:
+            logger.debug(f"Capture history: {len(batch)} entries written")
+
+    def search(self, text: str = "", limit: int | None = None) -> list[HistoryEntry]:
+        """記録の検索（新しい順）
+
+        * 空白で区切った語を全て含む（ウィンドウタイトルまたはファイルのパス、大文字小文字を区別しない）記録を返す
+
+        Args:
+            text(str): 検索する語（空文字列は全て）
+            limit(int): 件数の上限（None=MAX_RESULTS）
+
+        Returns:
+            HistoryEntryのlist
+
+        """
+        words: list[str] = text.split()
+        where: str = " AND ".join(["(title LIKE ? ESCAPE '\\' OR path LIKE ? ESCAPE '\\')"] * len(words)) or "1"
+        params: list = [pattern for word in words for pattern in [f"%{_escape_like(word)}%"] * 2]
+        sql: str = f"SELECT {_COLUMNS} FROM captures WHERE {where} ORDER BY timestamp DESC LIMIT ?"  # noqa: S608
+        with closing(self._connect()) as conn:
+            rows = conn.execute(sql, [*params, limit or CaptureHistory.MAX_RESULTS]).fetchall()
+        return [HistoryEntry(*row) for row in rows]
@@ -1,128 +1,655 @@
 import io
 import logging
+import os
+import struct
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
 
-import mss
-import mss.tools
-import win32clipboard
-import win32gui
+import mss.screenshot
+import numpy as np
 from PIL import Image
-from wx.adv import Sound
 
 from app_settings import AppSettings
-from res import sound
+from capture_backend import CaptureBackend, create_backend
+from capture_history import CaptureHistory, HistoryEntry, content_digest
+from capture_notifier import CaptureNotifier
+from capture_request import ACTIVE_WINDOW, CaptureRequest
+from capture_timing import CaptureTimings, CaptureTrace
+from frame_filter import UnchangedFrameFilter
+
+if TYPE_CHECKING:
+    from frame_filter import SavedFingerprint
+    from redaction import Redactor
 
 logger = logging.getLogger(__name__)
 
 
-def _enum_window_callback(hwnd: int, _lparam: int, window_titles: list[str]) -> None:
-    if win32gui.IsWindowEnabled(hwnd) == 0:
-        return
+@dataclass(frozen=True)
+class ImageEncoder:
+    """画像エンコーダー（Pillowの保存形式とオプション）"""
+
+    format: str
+    extension: str
+    options: dict = field(default_factory=dict)
+
+    def encode(self, image: Image.Image, output: io.BytesIO) -> None:
+        image.save(output, self.format, **self.options)
+
+
+class FrameView(NamedTuple):
+    """取得した画像（またはその一部分）のBGRA画素データの参照（コピーしない）"""
+
+    data: memoryview  # 左上の画素からの画素データ
+    size: tuple[int, int]  # 画像サイズ(幅, 高さ)
+    stride: int  # 1行のバイト数
+
+    @classmethod
+    def of(cls, sct_img: mss.screenshot.ScreenShot) -> "FrameView":
+        return cls(memoryview(sct_img.raw), tuple(sct_img.size), sct_img.width * 4)
+
+    @classmethod
+    def from_array(cls, array: np.ndarray) -> "FrameView":
+        """NumPy配列（高さ×幅×4、BGRA）からの生成（行が連続していない場合のみコピーする）"""
+        array = np.ascontiguousarray(array, dtype=np.uint8)
+        height, width, _channels = array.shape
+        return cls(memoryview(array).cast("B"), (width, height), width * 4)
+
+    def as_array(self) -> np.ndarray:
+        """画素データを参照するNumPy配列（高さ×幅×4、BGRA、コピーしない）"""
+        width, height = self.size
+        return np.ndarray((height, width, 4), dtype=np.uint8, buffer=self.data, strides=(self.stride, 4, 1))
+
+    def to_image(self) -> Image.Image:
+        """RGB画像への変換（1行毎にstrideで読み進める）"""
+        return Image.frombuffer("RGB", self.size, self.data, "raw", "BGRX", self.stride, 1)
+
+
+# キャプチャー後処理フック（引数はBGRAのNumPy配列と要求、配列を直接書き換えるか、置き換える配列を返す）
+CaptureHook = Callable[[np.ndarray, CaptureRequest], np.ndarray | None]
+# 墨消しの処理（引数はBGRAのNumPy配列、配列を直接書き換える）
+Redaction = Callable[[np.ndarray], None]
+# 書き込み後の処理（履歴への記録など、引数は書き込んだファイルの内容）
+HistoryRecord = Callable[[memoryview], None]
+
+
+def screenshot_area(sct_img: mss.screenshot.ScreenShot) -> dict:
+    """取得した画像の領域（left, top, width, height、画面座標）"""
+    return {"left": sct_img.left, "top": sct_img.top, "width": sct_img.width, "height": sct_img.height}
+
+
+def display_views(sct_img: mss.screenshot.ScreenShot, monitors: list[dict]) -> list[FrameView]:
+    """デスクトップ全体の画像からディスプレイ毎の部分を切り出す（画素データはコピーしない）
+
+    Args:
+        sct_img(ScreenShot): デスクトップ全体（monitors[0]）の画像
+        monitors(list): ディスプレイの領域（[0]はデスクトップ全体）
+
+    Returns:
+        ディスプレイ1～の順のFrameViewのlist
+
+    """
+    data = memoryview(sct_img.raw)
+    stride: int = sct_img.width * 4
+    views: list[FrameView] = []
+    for monitor in monitors[1:]:
+        x: int = monitor["left"] - sct_img.left
+        y: int = monitor["top"] - sct_img.top
+        width: int = min(monitor["width"], sct_img.width - x)
+        height: int = min(monitor["height"], sct_img.height - y)
+        start: int = y * stride + x * 4
+        views.append(FrameView(data[start : start + (height - 1) * stride + width * 4], (width, height), stride))
+
+    return views
+
+
+# 画像エンコーダーのプリセット（プリセット名: 設定値からエンコーダーを生成する処理）
+#   png       : PNG（圧縮レベル、zlib圧縮戦略は設定値）
+#   png_fast  : PNG（低圧縮・高速）
+#   png_small : PNG（最大圧縮）
+#   webp      : WebP（ロスレス）
+#   jpeg      : JPEG（品質は設定値）
+#   fast      : 無圧縮BMP（エンコードはほぼメモリコピーのみ）
+ENCODER_FACTORIES: dict[str, Callable[[AppSettings], ImageEncoder]] = {
+    "png": lambda settings: ImageEncoder(
+        "PNG",
+        ".png",
+        {"compress_level": settings.png_compress_level, "compress_type": settings.png_strategy},
+    ),
+    "png_fast": lambda _settings: ImageEncoder("PNG", ".png", {"compress_level": 1}),
+    "png_small": lambda _settings: ImageEncoder("PNG", ".png", {"compress_level": 9}),
+    "webp": lambda _settings: ImageEncoder("WEBP", ".webp", {"lossless": True, "quality": 0, "method": 0}),
+    "jpeg": lambda settings: ImageEncoder("JPEG", ".jpg", {"quality": settings.jpeg_quality}),
+    "fast": lambda _settings: ImageEncoder("BMP", ".bmp"),
+}
+
+
+def get_encoder(preset: str, settings: AppSettings) -> ImageEncoder:
+    """エンコーダーの取得（ENCODER_FACTORIESのプリセット、不明なプリセットは既定のPNG）
+
+    Args:
+        preset(str): プリセット名
+        settings(AppSettings): 設定値
+
+    Returns:
+        エンコーダー
+
+    """
+    if (factory := ENCODER_FACTORIES.get(preset)) is None:
+        logger.warning(f"Unknown image encoder '{preset}', use 'png'.")
+        return ImageEncoder("PNG", ".png")
+
+    return factory(settings)
+
+
+# BITMAPINFOHEADER（biSize, biWidth, biHeight, biPlanes, biBitCount, biCompression, biSizeImage,
+#                   biXPelsPerMeter, biYPelsPerMeter, biClrUsed, biClrImportant）
+BITMAPINFOHEADER = struct.Struct("<IiiHHIIiiII")
+BI_RGB: int = 0
+
 
-    if win32gui.IsWindowVisible(hwnd) == 0:
-        return
+def trimming_box(size: tuple[int, int], trimming_size: Sequence[int]) -> tuple[int, int, int, int]:
+    """トリミング範囲の取得
 
-    if win32gui.IsIconic(hwnd) != 0:
-        return
+    Args:
+        size(tuple): 画像サイズ(幅, 高さ)
+        trimming_size(list): トリミング量[上, 下, 左, 右]
 
-    if (window_text := win32gui.GetWindowText(hwnd)) == "":
-        return
+    Returns:
+        (left, top, right, bottom)
 
-    class_name = win32gui.GetClassName(hwnd)
-    if class_name is None or True in {x in class_name for x in ["QToolTip", "QPopup", "QWindowPopup", "QWindowToolTip"]}:
-        return
+    """
+    width, height = size
+    top: int = trimming_size[0]
+    temp_bottom: int = trimming_size[1]
+    left: int = trimming_size[2]
+    temp_right: int = trimming_size[3]
+    right: int = (width - temp_right) if width > temp_right else width
+    bottom: int = (height - temp_bottom) if height > temp_bottom else height
 
-    if window_text not in window_titles:
-        window_titles.append(window_text)
+    return (left, top, right, bottom)
+
+
+def trimmed_area(area: dict, trimming_size: Sequence[int]) -> dict | None:
+    """取得領域へのトリミングの適用
+
+    * trimming_boxと同じ範囲を取得領域として求める（画面からは必要な画素だけを読み、後から切り出さない）
+
+    Args:
+        area(dict): 取得領域（left, top, width, height）
+        trimming_size(list): トリミング量[上, 下, 左, 右]
+
+    Returns:
+        トリミング後の取得領域、範囲が空になる場合はNone
+
+    """
+    left, top, right, bottom = trimming_box((area["width"], area["height"]), trimming_size)
+    left, top = max(0, left), max(0, top)
+    if right <= left or bottom <= top:
+        return None
+
+    return {"left": area["left"] + left, "top": area["top"] + top, "width": right - left, "height": bottom - top}
+
+
+def bgra_to_dib(
+    data: bytes | bytearray | memoryview,
+    size: tuple[int, int],
+    box: tuple[int, int, int, int] | None = None,
+    stride: int | None = None,
+) -> bytearray:
+    """BGRA画素データからクリップボード用のDIB（CF_DIB）を作成する
+
+    * BITMAPINFOHEADER + ボトムアップの32bit BI_RGB画素（最上位バイトは未使用）
+    * 出力バッファを確保し、行を下から順に1回だけコピーする（Pillowの変換、BMPエンコードを経由しない）
+
+    Args:
+        data: BGRA画素データ（トップダウン）
+        size(tuple): 画像サイズ(幅, 高さ)
+        box(tuple): 切り出し範囲(left, top, right, bottom)、None=全体
+        stride(int): 1行のバイト数、None=幅×4
+
+    Returns:
+        DIBデータ
+
+    """
+    width, height = size
+    left, top, right, bottom = box or (0, 0, width, height)
+    left, right = max(0, min(left, width)), max(0, min(right, width))
+    top, bottom = max(0, min(top, height)), max(0, min(bottom, height))
+    dib_width: int = max(0, right - left)
+    dib_height: int = max(0, bottom - top)
+
+    stride = stride or width * 4
+    row_bytes: int = dib_width * 4
+    image_size: int = row_bytes * dib_height
+    dib = bytearray(BITMAPINFOHEADER.size + image_size)
+    BITMAPINFOHEADER.pack_into(dib, 0, BITMAPINFOHEADER.size, dib_width, dib_height, 1, 32, BI_RGB, image_size, 0, 0, 0, 0)
+
+    src = memoryview(data)
+    pos: int = BITMAPINFOHEADER.size
+    for y in range(bottom - 1, top - 1, -1):
+        start: int = y * stride + left * 4
+        dib[pos : pos + row_bytes] = src[start : start + row_bytes]
+        pos += row_bytes
+
+    return dib
 
 
 class CaptureManager:
-    def __init__(self) -> None:
-        self._beep: Sound = Sound()
-        self._beep.CreateFromData(sound.get_snd_beep_bytearray())
-        self._success: Sound = Sound()
-        self._success.CreateFromData(sound.get_snd_success_bytearray())
-
-    def _get_active_window(self) -> tuple[str, dict] | None:
-        window_titles: list[str] = []
-        win32gui.EnumWindows(partial(_enum_window_callback, window_titles=window_titles), 0)
-        if not window_titles:
-            return None
+    # エンコード・書き込み用ワーカー数
+    MAX_WORKERS: int = min(4, os.cpu_count() or 1)
+    # 処理待ちキャプチャーの上限（超えた場合はgrab側で空きを待つ、UIスレッドからは待たずに破棄する）
+    MAX_PENDING: int = MAX_WORKERS * 2
 
-        window_title: str = window_titles[0]
-        if (hwnd := win32gui.FindWindow(None, window_title)) == 0:
-            return None
+    def __init__(self, backend: CaptureBackend | None = None, notifier: CaptureNotifier | None = None) -> None:
+        """初期処理
+
+        Args:
+            backend(CaptureBackend): キャプチャーバックエンド（None=実行環境に合わせて選択）
+            notifier(CaptureNotifier): 完了通知（UIスレッドへの受け渡し、サウンド）、None=UIを持たない（テスト、ベンチマーク用）
+
+        Returns:
+            none
+
+        """
+        # 完了通知（UIスレッドへの受け渡し、サウンド）
+        self.notifier: CaptureNotifier = notifier or CaptureNotifier()
+        # キャプチャーバックエンド
+        self.backend: CaptureBackend = backend or create_backend()
+        # 変換・エンコード・書き込み用ワーカー
+        self._executor = ThreadPoolExecutor(max_workers=CaptureManager.MAX_WORKERS, thread_name_prefix="capture")
+        self._pending = threading.BoundedSemaphore(CaptureManager.MAX_PENDING)
+        # 変化の無いフレームの判定（定期実行向け）
+        self.frame_filter = UnchangedFrameFilter()
+        # 段階毎の所要時間の計測（診断用、既定は無効）
+        self.timings = CaptureTimings()
+        # キャプチャー後処理フック（ワーカーから参照するので、変更時は置き換える）
+        self._hooks: tuple[CaptureHook, ...] = ()
+        # 墨消しの指定（None=墨消ししない、変更時は置き換える）
+        self.redactor: Redactor | None = None
+        # キャプチャー履歴（None=記録しない）
+        self.history: CaptureHistory | None = None
+
+    def close(self) -> None:
+        """ワーカーの停止（処理待ちは完了させる）とバックエンドの解放"""
+        self._executor.shutdown(wait=True)
+        self.backend.close()
+
+    def add_hook(self, hook: CaptureHook) -> None:
+        """キャプチャー後処理フックの登録
+
+        * フックはワーカースレッドで、エンコード（クリップボードはDIBの作成）の前に登録順に呼ばれる
+        * 引数の配列は取得した画素データそのもの（高さ×幅×4、BGRA）なので、直接書き換えればコピーは発生しない
+        * 大きさを変える場合等は新しい配列を返す（以降のフックとエンコードはその配列を使う）
 
-        left, top, right, bottom = win32gui.GetWindowRect(hwnd)
-        width: int = abs(right - left)
-        height: int = abs(bottom - top)
-        area: dict = {"left": left, "top": top, "width": width, "height": height}
+        Args:
+            hook: フック（引数はNumPy配列とCaptureRequest、戻り値は置き換える配列またはNone）
 
-        return (window_title, area)
+        Returns:
+            none
 
-    def _copy_bitmap_to_clipboard(self, data: bytes) -> None:
-        win32clipboard.OpenClipboard()
-        win32clipboard.EmptyClipboard()
-        win32clipboard.SetClipboardData(win32clipboard.CF_DIB, data)
-        win32clipboard.CloseClipboard()
+        """
+        self._hooks = (*self._hooks, hook)
 
-    def _trim_image(self, image: Image.Image, trimming_size: list[int]) -> Image.Image:
-        width, height = image.size
+    def remove_hook(self, hook: CaptureHook) -> None:
+        """キャプチャー後処理フックの削除"""
+        self._hooks = tuple(h for h in self._hooks if h is not hook)
 
-        top: int = trimming_size[0]
-        temp_bottom: int = trimming_size[1]
-        left: int = trimming_size[2]
-        temp_right: int = trimming_size[3]
-        right: int = (width - temp_right) if width > temp_right else width
-        bottom: int = (height - temp_bottom) if height > temp_bottom else height
+    def _apply_hooks(self, view: FrameView, request: CaptureRequest) -> FrameView:
+        """キャプチャー後処理フックの実行（フックが無ければ何もしない）"""
+        if not (hooks := self._hooks):
+            return view
 
-        logger.debug(f"Trimming ({top}, {left})-({right}, {bottom})")
-        return image.crop((left, top, right, bottom))
+        array: np.ndarray = view.as_array()
+        replaced: bool = False
+        for hook in hooks:
+            if (result := hook(array, request)) is not None:
+                array = result
+                replaced = True
+        request.trace.lap("hooks")
+        return FrameView.from_array(array) if replaced else view
 
     def success(self) -> None:
         """成功時サウンド"""
-        self._success.Play()
+        self.notifier.success()
 
     def beep(self) -> None:
         """エラー時サウンド"""
-        self._beep.Play()
-
-    def execute_capture(self, moni_no: int, filename: str, settings: AppSettings) -> None:
-        img = None
-        with mss.mss() as sct:
-            area_coord: dict = {}
-            if moni_no == 90:  # Active window magic number
-                info = self._get_active_window()
-                if info:
-                    window_title, area_coord = info
-                    logger.debug(f"Capture 'Active window - [{window_title}]', {area_coord}")
-            elif 0 <= moni_no < len(sct.monitors):
-                area_coord = sct.monitors[moni_no]
-                logger.debug(f"Capture 'Desktop'" if moni_no == 0 else f"'Display-{moni_no}'")
-
-            if area_coord:
-                if (sct_img := sct.grab(area_coord)) is not None:
-                    img = Image.frombytes("RGB", sct_img.size, sct_img.bgra, "raw", "BGRX")
-            else:
-                self.beep()
-
-        if img:
-            logger.debug(
-                f"Captured image has been {'copied to clipboard' if not filename else f'saved to {filename}'}",
+        self.notifier.beep()
+
+    def grab(self, moni_no: int, trimming_size: Sequence[int] | None = None) -> mss.screenshot.ScreenShot | None:
+        """画面の取得
+
+        Args:
+            moni_no(int): 0=デスクトップ、1～=ディスプレイ、ACTIVE_WINDOW=アクティブウィンドウ
+            trimming_size(list): トリミング量[上, 下, 左, 右]（取得領域を狭める）、None=トリミングしない
+
+        Returns:
+            mssのキャプチャー画像、対象が無い場合はNone
+
+        """
+        sct_img, _window = self.grab_with_window(moni_no, trimming_size)
+        return sct_img
+
+    def grab_with_window(
+        self,
+        moni_no: int,
+        trimming_size: Sequence[int] | None = None,
+    ) -> tuple[mss.screenshot.ScreenShot | None, tuple[str, dict] | None]:
+        """画面の取得（アクティブウィンドウの場合はタイトルと領域も返す）
+
+        * 墨消しのウィンドウタイトル指定は、取得時点のウィンドウで判定する（取得後に問い合わせるとフォーカスの移動と競合する）
+
+        Args:
+            moni_no(int): 0=デスクトップ、1～=ディスプレイ、ACTIVE_WINDOW=アクティブウィンドウ
+            trimming_size(list): トリミング量[上, 下, 左, 右]（取得領域を狭める）、None=トリミングしない
+
+        Returns:
+            (mssのキャプチャー画像、対象が無い場合はNone,
+             アクティブウィンドウの(タイトル, トリミング前の領域)、ウィンドウ以外はNone)
+
+        """
+        area_coord: dict = {}
+        window: tuple[str, dict] | None = None
+        if moni_no == ACTIVE_WINDOW:
+            info = self.backend.active_window()
+            if info:
+                window_title, area_coord = info
+                window = (window_title, area_coord)
+                logger.debug(f"Capture 'Active window - [{window_title}]', {area_coord}")
+        elif 0 <= moni_no < len(monitors := self.backend.monitors()):
+            area_coord = monitors[moni_no]
+            logger.debug(f"Capture 'Desktop'" if moni_no == 0 else f"'Display-{moni_no}'")
+
+        if not area_coord:
+            return None, None
+
+        if trimming_size is not None:
+            if (trimmed := trimmed_area(area_coord, trimming_size)) is None:
+                logger.warning(f"Trimming {list(trimming_size)} leaves no area in {area_coord}")
+                return None, None
+            logger.debug(f"Trimming {area_coord} -> {trimmed}")
+            area_coord = trimmed
+
+        return self.backend.grab(area_coord), window
+
+    def redaction_for(self, area: dict, window: tuple[str, dict] | None = None) -> Redaction | None:
+        """キャプチャー領域に適用する墨消しの処理
+
+        * 範囲は取得時点の指定、ディスプレイ構成で確定させる（ワーカーは設定値、バックエンドに触れない）
+
+        Args:
+            area(dict): キャプチャー領域（left, top, width, height、画面座標）
+            window(tuple): キャプチャーしたアクティブウィンドウ(タイトル, 領域)、None=ウィンドウ以外
+
+        Returns:
+            墨消しの処理、墨消しする範囲が無い場合はNone
+
+        """
+        if (redactor := self.redactor) is None:
+            return None
+        if not (boxes := redactor.boxes(area, self.backend.monitors(), window)):
+            return None
+
+        return partial(redactor.apply, boxes=boxes)
+
+    def redact(self, sct_img: mss.screenshot.ScreenShot, window: tuple[str, dict] | None = None) -> None:
+        """取得した画像の墨消し（呼び出しスレッドで画素データを直接書き換える、記録・バッファ向け）
+
+        Args:
+            sct_img(ScreenShot): 取得した画像
+            window(tuple): キャプチャーしたアクティブウィンドウ(タイトル, 領域)、None=ウィンドウ以外
+
+        Returns:
+            none
+
+        """
+        if (redaction := self.redaction_for(screenshot_area(sct_img), window)) is not None:
+            redaction(FrameView.of(sct_img).as_array())
+
+    def history_record(self, request: CaptureRequest, area: dict, title: str = "") -> HistoryRecord | None:
+        """キャプチャー履歴への記録処理（画像ファイルのみ、ワーカーで書き込み後に呼ぶ）
+
+        Args:
+            request(CaptureRequest): キャプチャー要求
+            area(dict): キャプチャー領域（left, top, width, height、画面座標）
+            title(str): アクティブウィンドウのタイトル（ウィンドウ以外、不明な場合は空文字列）
+
+        Returns:
+            記録処理、記録しない場合はNone
+
+        """
+        if (history := self.history) is None or request.is_clipboard:
+            return None
+
+        def record(data: memoryview) -> None:
+            history.add(
+                HistoryEntry(
+                    request.timestamp,
+                    request.kind,
+                    request.target,
+                    title,
+                    area["left"],
+                    area["top"],
+                    area["width"],
+                    area["height"],
+                    request.filename,
+                    len(data),
+                    content_digest(data),
+                ),
             )
-            if moni_no == 90 and settings.trimming:
-                img = self._trim_image(img, settings.trimming_size)
-
-            if not filename:  # Empty filename means copy to clipboard
-                output = io.BytesIO()
-                img.convert("RGB").save(output, "BMP")
-                data = output.getvalue()[14:]
-                output.close()
-                self._copy_bitmap_to_clipboard(data)
-            else:
-                img.save(filename)
-
-            if settings.sound_on_capture:
-                self.success()
-        else:
+
+        return record
+
+    def _commit_on_saved(self, record: HistoryRecord | None, key: object, fingerprint: "SavedFingerprint") -> HistoryRecord:
+        """書き込み後に、保存したフレームを変化の判定の比較対象にする（書き込みに失敗したフレームは比較対象にしない）
+
+        Args:
+            record: 書き込み後の履歴への記録処理
+            key: キャプチャー対象の識別子
+            fingerprint: UnchangedFrameFilter.checkが返した指紋
+
+        Returns:
+            書き込み後の処理
+
+        """
+        frame_filter: UnchangedFrameFilter = self.frame_filter
+
+        def on_saved(data: memoryview) -> None:
+            frame_filter.commit(key, fingerprint)
+            if record is not None:
+                record(data)
+
+        return on_saved
+
+    def _process(
+        self,
+        frame: mss.screenshot.ScreenShot | FrameView,
+        request: CaptureRequest,
+        redaction: Redaction | None = None,
+        record: HistoryRecord | None = None,
+    ) -> None:
+        """キャプチャー画像の墨消し、変換、エンコード、書き込み、履歴への記録（ワーカースレッドで実行）"""
+        trace: CaptureTrace = request.trace
+        trace.lap("queue_wait")
+        view: FrameView = frame if isinstance(frame, FrameView) else FrameView.of(frame)
+        if redaction is not None:
+            # フック、エンコード（クリップボードを含む）より前に行う
+            redaction(view.as_array())
+            trace.lap("redact")
+        view = self._apply_hooks(view, request)
+        if request.is_clipboard:
+            dib: bytearray = bgra_to_dib(view.data, view.size, stride=view.stride)
+            trace.lap("encode")
+            self.backend.set_clipboard_dib(dib)
+            trace.lap("clipboard")
+            return
+
+        img: Image.Image = view.to_image()
+        trace.lap("convert")
+
+        with io.BytesIO() as output:
+            (request.encoder or ImageEncoder("PNG", ".png")).encode(img, output)
+            trace.lap("encode")
+            with output.getbuffer() as data:
+                with Path(request.filename).open("wb") as f:
+                    f.write(data)
+                trace.lap("write")
+                if record is not None:
+                    record(data)
+                    trace.lap("history")
+
+    def _on_processed(self, future: Future, request: CaptureRequest) -> None:
+        """ワーカー処理の完了通知（ワーカースレッドから呼ばれる）"""
+        self._pending.release()
+        self.notifier.call_after(self._complete, future.exception(), request)
+
+    def _complete(self, error: BaseException | None, request: CaptureRequest) -> None:
+        """キャプチャー完了処理（UIスレッドで実行）"""
+        if error is not None:
+            logger.error(f"Capture failed ({error!r})")
+            return
+
+        request.trace.lap("notify")
+        logger.debug(
+            f"Captured image has been {'copied to clipboard' if request.is_clipboard else f'saved to {request.filename}'}",
+        )
+        if request.sound:
+            self.success()
+            request.trace.lap("sound")
+        self.timings.end(request.trace)
+
+    def _acquire_pending(self, *, block: bool) -> bool:
+        """処理待ちの枠の確保（待たない場合、空きが無ければ破棄してエラー音）"""
+        if self._pending.acquire(blocking=block):
+            return True
+
+        logger.warning(f"Capture dropped ({CaptureManager.MAX_PENDING} captures are pending)")
+        self.notifier.call_after(self.beep)
+        return False
+
+    def execute_capture(
+        self,
+        request: CaptureRequest,
+        sct_img: mss.screenshot.ScreenShot | None = None,
+        *,
+        block: bool = True,
+    ) -> Future | None:
+        """キャプチャー実行
+
+        * 画面の取得のみ呼び出しスレッドで即時に行い、変換・エンコード・書き込みはワーカーで行う
+        * トリミングは取得領域に含めて行う（取得済みの画像はトリミング済みとして扱う）
+        * 墨消しはワーカーでエンコードの前に行う（取得済みの画像は取得側で墨消し済みとして扱う）
+        * 画像ファイルはワーカーで書き込み後にキャプチャー履歴へ記録する（記録の書き込みは履歴の専用スレッド）
+        * ワーカーは要求（生成時に確定した設定値）だけを参照する
+        * 完了時のサウンド、ログ出力はUIスレッドで行う
+
+        Args:
+            request(CaptureRequest): キャプチャー要求
+            sct_img(ScreenShot): 取得済みの画像（None=ここで取得する、ウィンドウタイトルは要求のtitle）
+            block(bool): True=処理待ちが上限なら空きを待つ、False=待たずに破棄してエラー音（UIスレッド用）
+
+        Returns:
+            ワーカー処理のFuture、キャプチャー出来なかった（またはスキップした）場合はNone
+
+        """
+        trace: CaptureTrace = request.trace
+        trace.lap("call_later", request.delay_ms)
+        redaction: Redaction | None = None
+        window: tuple[str, dict] | None = None
+        if sct_img is None:
+            sct_img, window = self.grab_with_window(request.target, request.trimming)
+            if sct_img is not None:
+                redaction = self.redaction_for(screenshot_area(sct_img), window)
+        if sct_img is None:
             logger.error("Can not captured!")
+            self.notifier.call_after(self.beep)
+            return None
+
+        fingerprint: SavedFingerprint | None = None
+        if request.skip_unchanged:
+            fingerprint = self.frame_filter.check(request.target, sct_img.size, sct_img.raw, request.skip_threshold)
+            if fingerprint is None:
+                return None
+        trace.lap("grab")
+
+        if not self._acquire_pending(block=block):
+            return None
+        title: str = window[0] if window else request.title
+        record: HistoryRecord | None = self.history_record(request, screenshot_area(sct_img), title)
+        if fingerprint is not None:
+            record = self._commit_on_saved(record, request.target, fingerprint)
+        future: Future = self._executor.submit(self._process, sct_img, request, redaction, record)
+        future.add_done_callback(partial(self._on_processed, request=request))
+        return future
+
+    def execute_displays(self, requests: list[CaptureRequest], *, sound: bool = False, block: bool = True) -> list[Future]:
+        """全ディスプレイの個別ファイルへのキャプチャー実行
+
+        * デスクトップ全体を1回だけ取得し、ディスプレイ毎の部分をコピーせずにワーカーへ渡す（並列にエンコード）
+        * 完了時のサウンドは全ファイルの書き込み後に1回だけ鳴らす
+
+        Args:
+            requests(list): ディスプレイ1～の順のキャプチャー要求
+            sound(bool): 完了時のサウンド
+            block(bool): True=処理待ちが上限なら空きを待つ、False=待たずに以降のディスプレイを破棄する（UIスレッド用）
+
+        Returns:
+            ワーカー処理のFutureのlist（ディスプレイ1～の順、破棄した分は含まない）、キャプチャー出来なかった場合は空のlist
+
+        """
+        for request in requests:
+            request.trace.lap("call_later", request.delay_ms)
+        monitors: list[dict] = self.backend.monitors()
+        if (sct_img := self.grab(0)) is None:
+            logger.error("Can not captured!")
+            self.notifier.call_after(self.beep)
+            return []
+        for request in requests:
+            request.trace.lap("grab")
+
+        futures: list[Future] = []
+        for request, monitor, view in zip(requests, monitors[1:], display_views(sct_img, monitors), strict=False):
+            width, height = view.size
+            area: dict = {"left": monitor["left"], "top": monitor["top"], "width": width, "height": height}
+            redaction = self.redaction_for(area)
+            record = self.history_record(request, area)
+            if not self._acquire_pending(block=block):
+                break
+            future: Future = self._executor.submit(self._process, view, request, redaction, record)
+            future.add_done_callback(partial(self._on_processed, request=request))
+            futures.append(future)
+        logger.debug(f"Capture 'All displays' ({len(futures)} files)")
+
+        if sound and futures:
+            self._success_when_all_done(futures)
+
+        return futures
+
+    def _success_when_all_done(self, futures: list[Future]) -> None:
+        """全てのワーカー処理が成功で完了した時に成功時サウンドを1回だけ鳴らす
+
+        Args:
+            futures(list): ワーカー処理のFuture
+
+        Returns:
+            none
+
+        """
+        remaining: list[int] = [len(futures)]
+        lock = threading.Lock()
+
+        def on_done(_future: Future) -> None:
+            with lock:
+                remaining[0] -= 1
+                if remaining[0] > 0:
+                    return
+            if all(f.exception() is None for f in futures):
+                self.notifier.call_after(self.success)
+
+        for future in futures:
+            future.add_done_callback(on_done)
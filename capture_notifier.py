@@ -0,0 +1,34 @@
+"""capture_notifier.py
+
+キャプチャーの完了通知（UIスレッドへの受け渡し、サウンド）
+
+* CaptureNotifier : 基底クラス（呼び出しスレッドでそのまま実行し、サウンドは鳴らさない、テスト、ベンチマーク用）
+* WxNotifier      : wxPython用（wx.CallAfterでUIスレッドへ渡し、wx.adv.Soundで鳴らす、wx_notifier.py）
+* CaptureManagerは通知を注入して使い、wxPythonをimportしない（画面やwxの無い環境でもパイプラインを実行できる）
+
+"""
+
+from collections.abc import Callable
+
+
+class CaptureNotifier:
+    """キャプチャーの完了通知（UIを持たない環境向け）"""
+
+    def call_after(self, func: Callable[..., object], *args: object) -> None:
+        """UIスレッドでの実行（UIが無いので呼び出しスレッドでそのまま実行する）
+
+        Args:
+            func: 実行する処理
+            args: 引数
+
+        Returns:
+            none
+
+        """
+        func(*args)
+
+    def success(self) -> None:
+        """成功時サウンド（鳴らさない）"""
+
+    def beep(self) -> None:
+        """エラー時サウンド（鳴らさない）"""
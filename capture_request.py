@@ -0,0 +1,181 @@
+"""capture_request.py
+
+キャプチャー要求
+
+* 要求時点の設定値（トリミング、サウンド、スキップ判定等）を確定させて保持する不変オブジェクト
+* ワーカーは要求だけを参照し、共有の設定値（AppSettings）には触れない（設定ダイアログでの変更と競合しない）
+
+"""
+
+import time
+from typing import TYPE_CHECKING
+
+from app_settings import AppSettings
+from capture_timing import NULL_TRACE, CaptureTrace
+
+if TYPE_CHECKING:
+    from capture_manager import ImageEncoder
+
+# キャプチャー対象: アクティブウィンドウ（0=デスクトップ、1～=ディスプレイ）
+ACTIVE_WINDOW: int = 90
+
+
+def target_from_setting(target: int) -> int:
+    """設定値のキャプチャー対象（-1=アクティブウィンドウ）をキャプチャー対象に変換する"""
+    return ACTIVE_WINDOW if target == -1 else target
+
+
+def trimming_for(settings: AppSettings, target: int) -> tuple[int, int, int, int] | None:
+    """キャプチャー対象に適用するトリミング量(上, 下, 左, 右)、None=トリミングしない（アクティブウィンドウのみ）"""
+    if target != ACTIVE_WINDOW or not settings.trimming:
+        return None
+
+    top, bottom, left, right = settings.trimming_size
+    return (top, bottom, left, right)
+
+
+class CaptureRequest:
+    """キャプチャー要求（生成後は変更できない）"""
+
+    __slots__ = (
+        "delay_ms",
+        "encoder",
+        "filename",
+        "kind",
+        "skip_threshold",
+        "skip_unchanged",
+        "sound",
+        "target",
+        "timestamp",
+        "title",
+        "trace",
+        "trimming",
+    )
+
+    kind: str
+    target: int
+    filename: str
+    encoder: "ImageEncoder | None"
+    trimming: tuple[int, int, int, int] | None
+    sound: bool
+    skip_unchanged: bool
+    skip_threshold: int
+    delay_ms: int
+    title: str
+    timestamp: float
+    trace: CaptureTrace
+
+    def __init__(  # noqa: PLR0913
+        self,
+        kind: str,
+        target: int,
+        *,
+        filename: str = "",
+        encoder: "ImageEncoder | None" = None,
+        trimming: tuple[int, int, int, int] | None = None,
+        sound: bool = False,
+        skip_unchanged: bool = False,
+        skip_threshold: int = 0,
+        delay_ms: int = 0,
+        title: str = "",
+        timestamp: float | None = None,
+        trace: CaptureTrace = NULL_TRACE,
+    ) -> None:
+        """初期処理
+
+        Args:
+            kind(str): 種別（clipboard, file, periodic, burst）
+            target(int): キャプチャー対象（0=デスクトップ、1～=ディスプレイ、ACTIVE_WINDOW=アクティブウィンドウ）
+            filename(str): 保存ファイル名（空文字列はクリップボード）
+            encoder(ImageEncoder): 画像エンコーダー
+            trimming(tuple): トリミング量(上, 下, 左, 右)、取得領域に含める、None=トリミングしない
+            sound(bool): 完了時のサウンド
+            skip_unchanged(bool): True=前回保存から変化が無ければ保存しない
+            skip_threshold(int): 変化無しと判定する差分の閾値
+            delay_ms(int): 実行までの遅延指定（ミリ秒）
+            title(str): 取得済みの画像のウィンドウタイトル（キャプチャー履歴用、取得時に確定したもの）
+            timestamp(float): 取得済みの画像のキャプチャー時刻（UNIX時間、None=要求時刻）
+            trace(CaptureTrace): 所要時間の計測
+
+        Returns:
+            none
+
+        """
+        for name, value in (
+            ("kind", kind),
+            ("target", target),
+            ("filename", filename),
+            ("encoder", encoder),
+            ("trimming", trimming),
+            ("sound", sound),
+            ("skip_unchanged", skip_unchanged),
+            ("skip_threshold", skip_threshold),
+            ("delay_ms", delay_ms),
+            ("title", title),
+            ("timestamp", time.time() if timestamp is None else timestamp),
+            ("trace", trace),
+        ):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        msg = f"CaptureRequest is immutable (can not set '{name}')"
+        raise AttributeError(msg)
+
+    def __delattr__(self, name: str) -> None:
+        msg = f"CaptureRequest is immutable (can not delete '{name}')"
+        raise AttributeError(msg)
+
+    def __repr__(self) -> str:
+        return f"CaptureRequest(kind={self.kind!r}, target={self.target}, filename={self.filename!r})"
+
+    @classmethod
+    def from_settings(  # noqa: PLR0913
+        cls,
+        settings: AppSettings,
+        kind: str,
+        target: int,
+        *,
+        filename: str = "",
+        encoder: "ImageEncoder | None" = None,
+        delay_ms: int = 0,
+        sound: bool | None = None,
+        title: str = "",
+        timestamp: float | None = None,
+        trace: CaptureTrace = NULL_TRACE,
+    ) -> "CaptureRequest":
+        """設定値から要求を生成する（要求時点の設定値を確定させる）
+
+        Args:
+            settings(AppSettings): 設定値
+            kind(str): 種別（clipboard, file, periodic, burst）
+            target(int): キャプチャー対象
+            filename(str): 保存ファイル名（空文字列はクリップボード）
+            encoder(ImageEncoder): 画像エンコーダー
+            delay_ms(int): 実行までの遅延指定（ミリ秒）
+            sound(bool): 完了時のサウンド（None=設定値の「sound_on_capture」）
+            title(str): 取得済みの画像のウィンドウタイトル（キャプチャー履歴用）
+            timestamp(float): 取得済みの画像のキャプチャー時刻（None=要求時刻）
+            trace(CaptureTrace): 所要時間の計測
+
+        Returns:
+            CaptureRequest
+
+        """
+        return cls(
+            kind,
+            target,
+            filename=filename,
+            encoder=encoder,
+            trimming=trimming_for(settings, target),
+            sound=settings.sound_on_capture if sound is None else sound,
+            skip_unchanged=kind == "periodic" and settings.periodic_skip_unchanged,
+            skip_threshold=settings.periodic_skip_threshold,
+            delay_ms=delay_ms,
+            title=title,
+            timestamp=timestamp,
+            trace=trace,
+        )
+
+    @property
+    def is_clipboard(self) -> bool:
+        return not self.filename
@@ -0,0 +1,210 @@
+"""capture_timing.py
+
+キャプチャー処理の段階毎の所要時間の計測（診断用）
+
+* 1回のキャプチャー毎にCaptureTraceを生成し、各段階の終わりでlap()を呼んで直前からの経過時間を記録する
+* 完了したトレースは直近WINDOW件を保持し、段階毎のパーセンタイルを求めたり、JSON/CSVへ出力したりできる
+* 計測が無効な場合は何もしないトレース（NULL_TRACE）を返すので、呼び出し側は分岐せずに済む
+
+"""
+
+import csv
+import json
+import logging
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# 段階
+STAGES: tuple[str, ...] = (
+    "call_later",  # 要求から実行までの遅れ（遅延指定分を除く）
+    "grab",  # 画面の取得
+    "queue_wait",  # ワーカーの空き待ち
+    "redact",  # 墨消し
+    "hooks",  # キャプチャー後処理フック
+    "convert",  # BGRAからの変換
+    "encode",  # エンコード（クリップボードはDIBの作成）
+    "write",  # ファイル書き込み
+    "history",  # キャプチャー履歴への記録（ハッシュの計算）
+    "clipboard",  # クリップボードへの設定
+    "notify",  # ワーカー完了からUIスレッドでの完了処理まで
+    "sound",  # 完了サウンドの再生
+    "total",  # 要求から完了まで（遅延指定分を除く）
+)
+
+
+class CaptureTrace:
+    """1回のキャプチャーの計測"""
+
+    __slots__ = ("delay_ms", "kind", "last", "spans", "start", "timestamp")
+
+    def __init__(self, kind: str, delay_ms: int = 0) -> None:
+        """初期処理
+
+        Args:
+            kind(str): 種別（clipboard, file, periodic等）
+            delay_ms(int): 実行までの遅延指定（ミリ秒）
+
+        Returns:
+            none
+
+        """
+        self.kind: str = kind
+        self.delay_ms: int = delay_ms
+        self.timestamp: float = time.time()
+        self.start: float = time.perf_counter()
+        self.last: float = self.start
+        self.spans: dict[str, float] = {}
+
+    def lap(self, stage: str, offset_ms: float = 0.0) -> None:
+        """直前のlapからの経過時間を段階の所要時間として記録する
+
+        Args:
+            stage(str): 段階
+            offset_ms(float): 差し引く時間（ミリ秒）
+
+        Returns:
+            none
+
+        """
+        now: float = time.perf_counter()
+        self.spans[stage] = self.spans.get(stage, 0.0) + (now - self.last) * 1000 - offset_ms
+        self.last = now
+
+    def skip(self) -> None:
+        """直前のlapからの経過時間を記録せずに読み飛ばす"""
+        self.last = time.perf_counter()
+
+    def finish(self) -> dict[str, float]:
+        self.spans["total"] = (time.perf_counter() - self.start) * 1000 - self.delay_ms
+        return self.spans
+
+
+class _NullTrace(CaptureTrace):
+    """計測無効時のトレース（何もしない）"""
+
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        self.kind = ""
+        self.delay_ms = 0
+        self.spans = {}
+
+    def lap(self, stage: str, offset_ms: float = 0.0) -> None:
+        pass
+
+    def skip(self) -> None:
+        pass
+
+    def finish(self) -> dict[str, float]:
+        return {}
+
+
+NULL_TRACE: CaptureTrace = _NullTrace()
+
+
+def _percentile(values: list[float], percent: int) -> float:
+    """パーセンタイル（最近傍順位法、valuesはソート済み）"""
+    rank: int = max(1, -(-len(values) * percent // 100))
+    return values[rank - 1]
+
+
+class CaptureTimings:
+    """キャプチャー処理の計測結果"""
+
+    # 保持するキャプチャー数
+    WINDOW: int = 500
+    # 集計するパーセンタイル
+    PERCENTILES: tuple[int, ...] = (50, 90, 99)
+
+    def __init__(self, *, enabled: bool = False) -> None:
+        self.enabled: bool = enabled
+        self._records: deque[tuple[float, str, dict[str, float]]] = deque(maxlen=CaptureTimings.WINDOW)
+        self._lock = threading.Lock()
+
+    def begin(self, kind: str, delay_ms: int = 0) -> CaptureTrace:
+        """計測の開始（無効時はNULL_TRACEを返す）"""
+        return CaptureTrace(kind, delay_ms) if self.enabled else NULL_TRACE
+
+    def end(self, trace: CaptureTrace) -> None:
+        """計測の終了（結果を保持する）"""
+        if trace is NULL_TRACE:
+            return
+
+        spans: dict[str, float] = trace.finish()
+        with self._lock:
+            self._records.append((trace.timestamp, trace.kind, spans))
+        detail: str = ", ".join(f"{k}={v:.1f}ms" for k, v in spans.items())
+        logger.debug(f"Capture timing ({trace.kind}): {detail}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """段階毎の集計（件数、平均、パーセンタイル、最大）
+
+        Returns:
+            {段階: {"count": 件数, "mean": 平均, "p50": ..., "max": 最大}}（ミリ秒）
+
+        """
+        with self._lock:
+            records = list(self._records)
+
+        result: dict[str, dict[str, float]] = {}
+        for stage in STAGES:
+            values: list[float] = sorted(spans[stage] for _timestamp, _kind, spans in records if stage in spans)
+            if not values:
+                continue
+            summary: dict[str, float] = {"count": len(values), "mean": sum(values) / len(values)}
+            summary.update({f"p{p}": _percentile(values, p) for p in CaptureTimings.PERCENTILES})
+            summary["max"] = values[-1]
+            result[stage] = summary
+
+        return result
+
+    def format_summary(self) -> str:
+        """集計結果の表形式の文字列"""
+        columns: list[str] = ["count", "mean", *(f"p{p}" for p in CaptureTimings.PERCENTILES), "max"]
+        lines: list[str] = [f"{'stage':<12}" + "".join(f"{c:>10}" for c in columns)]
+        for stage, summary in self.summary().items():
+            cells: str = f"{summary['count']:>10}" + "".join(f"{summary[c]:>10.1f}" for c in columns[1:])
+            lines.append(f"{stage:<12}{cells}")
+
+        return "\n".join(lines)
+
+    def dump(self, path: Path) -> None:
+        """計測結果の出力（拡張子が.csvならCSV、それ以外はJSON）
+
+        Args:
+            path(pathlib.Path): 出力ファイル
+
+        Returns:
+            none
+
+        """
+        with self._lock:
+            records = list(self._records)
+
+        if path.suffix.lower() == ".csv":
+            with path.open("w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(["timestamp", "kind", *STAGES])
+                for timestamp, kind, spans in records:
+                    writer.writerow(
+                        [f"{timestamp:.3f}", kind, *(f"{spans[s]:.3f}" if s in spans else "" for s in STAGES)],
+                    )
+        else:
+            data: dict = {
+                "summary": self.summary(),
+                "records": [{"timestamp": timestamp, "kind": kind, **spans} for timestamp, kind, spans in records],
+            }
+            path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+        logger.info(f"Capture timings saved to '{path}' ({len(records)} records)")
@@ -1,24 +1,99 @@
 import configparser
+import io
+import logging
+import os
+import threading
+from collections.abc import Callable
+from dataclasses import MISSING, fields
 from pathlib import Path
+from typing import NamedTuple, get_args, get_origin
 
 import wx
 
 from app_settings import AppSettings
 from myutils.util import strtobool
 
-_CONFIG_EMPTY = {
-    "basic": {},
-    "other": {},
-    "delayed_capture": {},
-    "trimming": {},
-    "hotkey": {},
-    "periodic": {},
-}
+logger = logging.getLogger(__name__)
+
+
+class ConfigOption(NamedTuple):
+    """設定ファイルのオプションとAppSettingsのフィールドの対応"""
+
+    name: str  # フィールド名
+    section: str  # セクション名
+    option: str  # オプション名（連番のlistは「folder{}」の形式）
+    options: tuple[str, ...]  # 固定長のlistの各要素のオプション名
+    kind: type  # 値（listは要素）の型
+    is_list: bool
+    minimum: int | None
+    maximum: int | None
+    choices: tuple
+    count: int  # 連番のlistの最大数（0=保存フォルダ履歴の最大数）
+    validate: Callable[[str], object] | None
+    default_factory: Callable[[], object]
+
+    @property
+    def numbered(self) -> bool:
+        return "{}" in self.option
+
+    def default(self) -> object:
+        return self.default_factory()
+
+    def parse(self, text: str) -> object:
+        """文字列の値の変換と検証（不正な値はValueError）"""
+        value = bool(strtobool(text)) if self.kind is bool else self.kind(text)
+        if self.minimum is not None and value < self.minimum:
+            msg = f"{self.minimum}以上を指定してください"
+            raise ValueError(msg)
+        if self.maximum is not None and value > self.maximum:
+            msg = f"{self.maximum}以下を指定してください"
+            raise ValueError(msg)
+        if self.choices and value not in self.choices:
+            msg = f"{', '.join(map(str, self.choices))}のいずれかを指定してください"
+            raise ValueError(msg)
+        if self.validate is not None:
+            self.validate(value)
+        return value
+
+
+def _build_schema() -> tuple[ConfigOption, ...]:
+    """AppSettingsのフィールド（metadata）からスキーマを作成する"""
+    schema: list[ConfigOption] = []
+    for f in fields(AppSettings):
+        if "section" not in f.metadata:
+            continue  # 保存しない設定値
+        is_list: bool = get_origin(f.type) is list
+        default_factory = f.default_factory if f.default is MISSING else (lambda value=f.default: value)
+        schema.append(
+            ConfigOption(
+                name=f.name,
+                section=f.metadata["section"],
+                option=f.metadata["option"] or f.name,
+                options=f.metadata["options"],
+                kind=get_args(f.type)[0] if is_list else f.type,
+                is_list=is_list,
+                minimum=f.metadata["minimum"],
+                maximum=f.metadata["maximum"],
+                choices=f.metadata["choices"],
+                count=f.metadata["count"],
+                validate=f.metadata["validate"],
+                default_factory=default_factory,
+            ),
+        )
+    return tuple(schema)
+
+
+# 設定ファイルのスキーマ（AppSettingsのフィールド順）
+SCHEMA: tuple[ConfigOption, ...] = _build_schema()
+_CONFIG_EMPTY: dict[str, dict] = {option.section: {} for option in SCHEMA}
 
 
 class ConfigManager:
     """設定ファイル管理クラス"""
 
+    # 保存要求をまとめる時間（秒）
+    SAVE_DELAY: float = 1.0
+
     def __init__(self, config_path: Path, my_pictures_path: Path, max_save_folders: int) -> None:
         """初期処理
 
@@ -37,6 +112,14 @@ class ConfigManager:
         # 設定ファイル、設定値オブジェクトの生成
         self.config = configparser.ConfigParser()
         self.config.read_dict(_CONFIG_EMPTY)  # 初期化（セクション作成）
+        # 最後に読み込んだ（書き込んだ）ファイルの内容（変更が無ければ書き込まない）
+        self._saved: str | None = None
+        # 遅延保存（保存待ちの内容とタイマー）
+        self._pending: str | None = None
+        self._timer: threading.Timer | None = None
+        self._save_lock = threading.Lock()
+        # 直近の読み込みで見つかった不正な値
+        self.errors: list[str] = []
 
     def load(self) -> int:
         """設定値読み込み処理
@@ -54,8 +137,9 @@ class ConfigManager:
             self.save()
 
         try:
-            with self.config_path.open(encoding="utf-8") as fc:
-                self.config.read_file(fc)
+            text: str = self.config_path.read_text(encoding="utf-8")
+            self.config.read_string(text, source=str(self.config_path))
+            self._saved = text
 
         except OSError as e:
             wx.MessageBox(f"設定ファイルの読み込みに失敗しました\n ({e})", "エラー", wx.ICON_ERROR)
@@ -66,8 +150,28 @@ class ConfigManager:
 
         return 0
 
+    def _serialize(self) -> str:
+        with io.StringIO() as output:
+            self.config.write(output)
+            return output.getvalue()
+
+    def _write(self, text: str) -> None:
+        """設定ファイルの書き込み（一時ファイルに書いてから置き換える、内容が同じなら書き込まない）"""
+        if text == self._saved:
+            logger.debug("Config unchanged, skip saving.")
+            return
+
+        temp_path: Path = self.config_path.with_name(self.config_path.name + ".tmp")
+        with temp_path.open("w", encoding="utf-8") as fc:
+            fc.write(text)
+            fc.flush()
+            os.fsync(fc.fileno())
+        temp_path.replace(self.config_path)
+        self._saved = text
+        logger.debug(f"Config saved to '{self.config_path}'")
+
     def save(self) -> int:
-        """設定値保存処理
+        """設定値保存処理（保存待ちの遅延保存も含めて、呼び出しスレッドで書き込む）
 
         Args:
             none
@@ -76,20 +180,62 @@ class ConfigManager:
             結果(int): 0=正常、-1=I/Oエラー
 
         """
-        try:
-            with self.config_path.open("w", encoding="utf-8") as fc:
-                self.config.write(fc)
+        with self._save_lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._pending = None
+            try:
+                self._write(self._serialize())
+
+            except OSError as e:
+                wx.MessageBox(f"設定ファイルの書き込みに失敗しました\n ({e})", "エラー", wx.ICON_ERROR)
+                return -1
+            else:
+                return 0
+
+    def save_later(self) -> None:
+        """設定値の遅延保存
+
+        * 現在の設定内容を確定させ、SAVE_DELAY秒以内の要求をまとめてバックグラウンドで書き込む
+        * UIスレッドではファイルの書き込みを行わない
 
-        except OSError as e:
-            wx.MessageBox(f"設定ファイルの書き込みに失敗しました\n ({e})", "エラー", wx.ICON_ERROR)
-            return -1
-        else:
-            return 0
+        Args:
+            none
+
+        Returns:
+            none
+
+        """
+        text: str = self._serialize()
+        with self._save_lock:
+            self._pending = text
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(ConfigManager.SAVE_DELAY, self._write_pending)
+            self._timer.name = "config_save"
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _write_pending(self) -> None:
+        with self._save_lock:
+            text: str | None = self._pending
+            self._pending = None
+            self._timer = None
+            if text is None:
+                return
+            try:
+                self._write(text)
+            except OSError as e:
+                logger.exception("Config save failed")
+                wx.CallAfter(wx.MessageBox, f"設定ファイルの書き込みに失敗しました\n ({e})", "エラー", wx.ICON_ERROR)
 
     def config_to_settings(self, settings: AppSettings) -> bool:
         """設定情報展開処理
 
-        設定ファイル管理オブジェクトの情報を設定値管理オブジェクトに展開する
+        * 設定ファイル管理オブジェクトの情報を、SCHEMAに従って設定値管理オブジェクトに展開する
+        * 全てのオプションを1回で検証し、不正な値は既定値に置き換えて、まとめてエラー表示する
+        * 無いオプション（以前のバージョンの設定ファイル）は既定値で補う
 
         Args:
             settings(AppSettings): 設定値管理オブジェクト
@@ -99,17 +245,20 @@ class ConfigManager:
 
         """
         resave_req: bool = False
-        # basic section
-        settings.auto_save = strtobool(self.config["basic"]["auto_save"])
-        settings.save_folder_index = int(self.config["basic"]["save_folder_index"])
-
-        settings.save_folders.clear()
-        for n in range(1, self.max_save_folders + 1):
-            option_name: str = f"folder{n}"
-            if not self.config.has_option("basic", option_name):
-                break
-            settings.save_folders.append(self.config["basic"][option_name])
-
+        self.errors = []
+        for option in SCHEMA:
+            value, fixed = self._parse_option(option)
+            setattr(settings, option.name, value)
+            resave_req |= fixed
+
+        self._check_unknown_options()
+        if self.errors:
+            for error in self.errors:
+                logger.warning(f"Config: {error}")
+            message: str = "\n".join(self.errors)
+            wx.MessageBox(f"設定ファイルに不正な値があります、既定値を使用します。\n\n{message}", "エラー", wx.ICON_ERROR)
+
+        # 設定値間の整合性
         if settings.save_folders:
             if not (0 <= settings.save_folder_index < len(settings.save_folders)):
                 settings.save_folder_index = 0
@@ -119,51 +268,67 @@ class ConfigManager:
             settings.save_folder_index = 0
             resave_req = True
 
-        settings.numbering = int(self.config["basic"]["numbering"])
-        settings.prefix = self.config["basic"]["prefix"]
-        settings.sequence_digits = int(self.config["basic"]["sequence_digits"])
-        settings.sequence_begin = int(self.config["basic"]["sequence_begin"])
-
-        # other section
-        settings.capture_mcursor = strtobool(self.config["other"]["mouse_cursor"])
-        settings.sound_on_capture = strtobool(self.config["other"]["sound_on_capture"])
-
-        # delayed_capture section
-        settings.delayed_capture = strtobool(self.config["delayed_capture"]["delayed_capture"])
-        settings.delayed_time = int(self.config["delayed_capture"]["delayed_time"])
-
-        # trimming section
-        settings.trimming = strtobool(self.config["trimming"]["trimming"])
-        settings.trimming_size = [
-            int(self.config["trimming"]["top"]),
-            int(self.config["trimming"]["bottom"]),
-            int(self.config["trimming"]["left"]),
-            int(self.config["trimming"]["right"]),
-        ]
-
-        # hotkey section
-        settings.hotkey_clipboard = int(self.config["hotkey"]["clipboard"])
-        settings.hotkey_imagefile = int(self.config["hotkey"]["imagefile"])
-        settings.hotkey_activewin = int(self.config["hotkey"]["activewin"])
-
-        # periodic section
-        settings.periodic_save_folder = self.config["periodic"]["save_folder"]
-        settings.periodic_interval = int(self.config["periodic"]["interval"])
-        settings.periodic_stop_modifier = int(self.config["periodic"]["stop_modifier"])
-        settings.periodic_stop_fkey = int(self.config["periodic"]["stop_fkey"])
-        settings.periodic_target = int(self.config["periodic"]["target"])
-        settings.periodic_numbering = int(self.config["periodic"]["numbering"])
-
         if not settings.periodic_save_folder:
             settings.periodic_save_folder = str(self.my_pictures_path)
             resave_req = True
 
         return resave_req
 
+    def _option_names(self, option: ConfigOption) -> list[str]:
+        """フィールドに対応するオプション名のlist"""
+        if option.options:
+            return list(option.options)
+        if option.numbered:
+            return [option.option.format(n) for n in range(1, (option.count or self.max_save_folders) + 1)]
+        return [option.option]
+
+    def _parse_option(self, option: ConfigOption) -> tuple[object, bool]:
+        """1フィールド分の読み込みと検証
+
+        Args:
+            option(ConfigOption): スキーマ
+
+        Returns:
+            (値, 既定値で補ったか)
+
+        """
+        section = self.config[option.section]
+        default = option.default()
+        values: list = []
+        fixed: bool = False
+        for n, name in enumerate(self._option_names(option)):
+            value = None
+            if name in section:
+                try:
+                    value = option.parse(section[name])
+                except ValueError as e:
+                    self.errors.append(f"[{option.section}] {name} = {section[name]} ({e})")
+            elif option.numbered:
+                break
+            if value is None:
+                # 無い、または不正な値は既定値で補う（連番のlistは詰める）
+                fixed = True
+                if option.numbered:
+                    continue
+                value = default[n] if option.options else default
+            values.append(value)
+
+        return (values if option.is_list else values[0]), fixed
+
+    def _check_unknown_options(self) -> None:
+        """スキーマに無いオプションの警告（綴り間違い等、値は無視する）"""
+        known: set[tuple[str, str]] = {(o.section, name) for o in SCHEMA for name in self._option_names(o)}
+        for section in _CONFIG_EMPTY:
+            for name in self.config[section]:
+                if (section, name) not in known and not any(
+                    o.numbered and o.section == section and name.startswith(o.option.format("")) for o in SCHEMA
+                ):
+                    logger.warning(f"Config: [{section}] {name} is unknown option, ignored.")
+
     def config_from_settings(self, settings: AppSettings) -> None:
         """設定情報反映処理
 
-        設定値管理オブジェクトの内容を設定ファイル管理オブジェクトに反映する
+        設定値管理オブジェクトの内容を、SCHEMAに従って設定ファイル管理オブジェクトに反映する
 
         Args:
             settings(AppSettings): 設定値管理オブジェクト
@@ -172,41 +337,14 @@ class ConfigManager:
             none
 
         """
-        # basic section
-        self.config["basic"]["auto_save"] = str(settings.auto_save)
-        self.config["basic"]["save_folder_index"] = str(settings.save_folder_index)
-        for n, folder_name in enumerate(settings.save_folders):
-            self.config["basic"][f"folder{n + 1}"] = folder_name
-        self.config["basic"]["numbering"] = str(settings.numbering)
-        self.config["basic"]["prefix"] = settings.prefix
-        self.config["basic"]["sequence_digits"] = str(settings.sequence_digits)
-        self.config["basic"]["sequence_begin"] = str(settings.sequence_begin)
-
-        # other section
-        self.config["other"]["mouse_cursor"] = str(settings.capture_mcursor)
-        self.config["other"]["sound_on_capture"] = str(settings.sound_on_capture)
-
-        # delayed_capture section
-        self.config["delayed_capture"]["delayed_capture"] = str(settings.delayed_capture)
-        self.config["delayed_capture"]["delayed_time"] = str(settings.delayed_time)
-
-        # trimming section
-        self.config["trimming"]["trimming"] = str(settings.trimming)
-        trim_top, trim_bottom, trim_left, trim_right = settings.trimming_size
-        self.config["trimming"]["top"] = str(trim_top)
-        self.config["trimming"]["bottom"] = str(trim_bottom)
-        self.config["trimming"]["left"] = str(trim_left)
-        self.config["trimming"]["right"] = str(trim_right)
-
-        # hotkey section
-        self.config["hotkey"]["clipboard"] = str(settings.hotkey_clipboard)
-        self.config["hotkey"]["imagefile"] = str(settings.hotkey_imagefile)
-        self.config["hotkey"]["activewin"] = str(settings.hotkey_activewin)
-
-        # periodic section
-        self.config["periodic"]["save_folder"] = settings.periodic_save_folder
-        self.config["periodic"]["interval"] = str(settings.periodic_interval)
-        self.config["periodic"]["stop_modifier"] = str(settings.periodic_stop_modifier)
-        self.config["periodic"]["stop_fkey"] = str(settings.periodic_stop_fkey)
-        self.config["periodic"]["target"] = str(settings.periodic_target)
-        self.config["periodic"]["numbering"] = str(settings.periodic_numbering)
+        for option in SCHEMA:
+            value = getattr(settings, option.name)
+            section = self.config[option.section]
+            if option.options:
+                for name, item in zip(option.options, value, strict=True):
+                    section[name] = str(item)
+            elif option.numbered:
+                for n, item in enumerate(value, 1):
+                    section[option.option.format(n)] = str(item)
+            else:
+                section[option.option] = str(value)
@@ -1,10 +1,16 @@
 # -*- coding: UTF-8 -*-
+import os
+from datetime import datetime
 from pathlib import Path
+from zoneinfo import ZoneInfo
 
 import wx
 import wx.lib.agw.multidirdialog as mdd
 
 from app_settings import AppSettings
+from capture_history import CaptureHistory, HistoryEntry
+from capture_request import ACTIVE_WINDOW
+from capture_timing import CaptureTimings
 from PeriodicDialogBase import PeriodicDialogBase
 from res import app_icon
 from SettingsDialogBase import SettingsDialogBase
@@ -278,3 +284,204 @@ class PeriodicDialog(PeriodicDialogBase):
             settings.periodic_numbering = 0
         else:
             settings.periodic_numbering = 1
+
+
+class DiagnosticsDialog(wx.Dialog):
+    """診断情報ダイアログ（段階毎の処理時間の集計）"""
+
+    def __init__(self, parent: wx.Window, timings: CaptureTimings) -> None:
+        super().__init__(parent, wx.ID_ANY, "診断情報", style=wx.DEFAULT_DIALOG_STYLE | wx.RESIZE_BORDER)
+        # Load Application ICON
+        icons = wx.IconBundle(app_icon.get_app_icon_stream(), wx.BITMAP_TYPE_ICO)  # pyright: ignore[reportCallIssue,reportArgumentType]
+        self.SetIcon(icons.GetIcon(wx.Size(16, 16)))
+        self.timings = timings
+
+        sizer = wx.BoxSizer(wx.VERTICAL)
+        self.text_ctrl_summary = wx.TextCtrl(self, wx.ID_ANY, "", style=wx.TE_MULTILINE | wx.TE_READONLY | wx.HSCROLL)
+        self.text_ctrl_summary.SetFont(wx.Font(wx.FontInfo(9).Family(wx.FONTFAMILY_TELETYPE)))
+        self.text_ctrl_summary.SetMinSize(wx.Size(640, 320))
+        sizer.Add(self.text_ctrl_summary, 1, wx.ALL | wx.EXPAND, 8)
+
+        buttons = wx.BoxSizer(wx.HORIZONTAL)
+        for label, handler in (
+            ("更新", self.on_refresh),
+            ("保存...", self.on_save),
+            ("クリア", self.on_clear),
+        ):
+            button = wx.Button(self, wx.ID_ANY, label)
+            button.Bind(wx.EVT_BUTTON, handler)
+            buttons.Add(button, 0, wx.RIGHT, 8)
+        buttons.AddStretchSpacer()
+        buttons.Add(wx.Button(self, wx.ID_CLOSE, "閉じる"), 0, 0, 0)
+        self.Bind(wx.EVT_BUTTON, lambda _event: self.EndModal(wx.ID_CLOSE), id=wx.ID_CLOSE)
+        self.SetEscapeId(wx.ID_CLOSE)
+        sizer.Add(buttons, 0, wx.ALL | wx.EXPAND, 8)
+
+        self.SetSizerAndFit(sizer)
+        self.update_summary()
+
+    def update_summary(self) -> None:
+        """集計結果を表示する"""
+        state: str = "有効" if self.timings.enabled else "無効（クイック設定で有効にしてください）"
+        self.text_ctrl_summary.SetValue(
+            f"計測: {state}\n直近 {len(self.timings)} 回のキャプチャー [ms]\n\n{self.timings.format_summary()}",
+        )
+
+    def on_refresh(self, event) -> None:
+        self.update_summary()
+        event.Skip()
+
+    def on_save(self, event) -> None:
+        """計測結果の保存（JSON/CSV）"""
+        with wx.FileDialog(
+            self,
+            "計測結果の保存",
+            defaultFile="capture_timings.json",
+            wildcard="JSON (*.json)|*.json|CSV (*.csv)|*.csv",
+            style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT,
+        ) as dlg:
+            if dlg.ShowModal() != wx.ID_OK:
+                return
+            path = Path(dlg.GetPath())
+
+        try:
+            self.timings.dump(path)
+        except OSError as e:
+            wx.MessageBox(f"計測結果の保存に失敗しました\n ({e})", "ERROR", wx.ICON_ERROR)
+        event.Skip()
+
+    def on_clear(self, event) -> None:
+        self.timings.clear()
+        self.update_summary()
+        event.Skip()
+
+
+class HistoryDialog(wx.Dialog):
+    """キャプチャー検索ダイアログ（キャプチャー履歴のインデックスを検索する）"""
+
+    # 入力から検索までの待ち時間（ミリ秒、入力中は検索しない）
+    SEARCH_DELAY: int = 300
+
+    def __init__(self, parent: wx.Window, history: CaptureHistory) -> None:
+        super().__init__(parent, wx.ID_ANY, "キャプチャーを検索", style=wx.DEFAULT_DIALOG_STYLE | wx.RESIZE_BORDER)
+        # Load Application ICON
+        icons = wx.IconBundle(app_icon.get_app_icon_stream(), wx.BITMAP_TYPE_ICO)  # pyright: ignore[reportCallIssue,reportArgumentType]
+        self.SetIcon(icons.GetIcon(wx.Size(16, 16)))
+        self.history = history
+        self.entries: list[HistoryEntry] = []
+        self._search_timer: wx.CallLater | None = None
+
+        sizer = wx.BoxSizer(wx.VERTICAL)
+        self.search_ctrl_query = wx.SearchCtrl(self, wx.ID_ANY, "", style=wx.TE_PROCESS_ENTER)
+        self.search_ctrl_query.ShowCancelButton(show=True)
+        self.search_ctrl_query.SetDescriptiveText("ウィンドウタイトル、ファイル名（空白区切りで全てを含む）")
+        self.search_ctrl_query.Bind(wx.EVT_TEXT, self.on_text)
+        self.search_ctrl_query.Bind(wx.EVT_SEARCH, self.on_search)
+        self.search_ctrl_query.Bind(wx.EVT_SEARCH_CANCEL, self.on_search_cancel)
+        sizer.Add(self.search_ctrl_query, 0, wx.ALL | wx.EXPAND, 8)
+
+        self.list_ctrl_result = wx.ListCtrl(self, wx.ID_ANY, style=wx.LC_REPORT | wx.LC_SINGLE_SEL)
+        for column, (label, width, align) in enumerate(
+            (
+                ("日時", 140, wx.LIST_FORMAT_LEFT),
+                ("対象", 200, wx.LIST_FORMAT_LEFT),
+                ("サイズ", 80, wx.LIST_FORMAT_RIGHT),
+                ("ファイル", 360, wx.LIST_FORMAT_LEFT),
+            ),
+        ):
+            self.list_ctrl_result.InsertColumn(column, label, align, width)
+        self.list_ctrl_result.SetMinSize(wx.Size(800, 360))
+        self.list_ctrl_result.Bind(wx.EVT_LIST_ITEM_ACTIVATED, self.on_open)
+        sizer.Add(self.list_ctrl_result, 1, wx.LEFT | wx.RIGHT | wx.EXPAND, 8)
+
+        buttons = wx.BoxSizer(wx.HORIZONTAL)
+        for label, handler in (
+            ("開く", self.on_open),
+            ("フォルダを開く", self.on_open_folder),
+        ):
+            button = wx.Button(self, wx.ID_ANY, label)
+            button.Bind(wx.EVT_BUTTON, handler)
+            buttons.Add(button, 0, wx.RIGHT, 8)
+        self.label_count = wx.StaticText(self, wx.ID_ANY, "")
+        buttons.Add(self.label_count, 0, wx.ALIGN_CENTER_VERTICAL, 0)
+        buttons.AddStretchSpacer()
+        buttons.Add(wx.Button(self, wx.ID_CLOSE, "閉じる"), 0, 0, 0)
+        self.Bind(wx.EVT_BUTTON, lambda _event: self.EndModal(wx.ID_CLOSE), id=wx.ID_CLOSE)
+        self.SetEscapeId(wx.ID_CLOSE)
+        sizer.Add(buttons, 0, wx.ALL | wx.EXPAND, 8)
+        # 閉じた後に入力待ちの検索が実行されないようにする
+        self.Bind(wx.EVT_WINDOW_DESTROY, self.on_destroy)
+
+        self.SetSizerAndFit(sizer)
+        self.update_result()
+
+    @staticmethod
+    def target_label(entry: HistoryEntry) -> str:
+        if entry.title:
+            return entry.title
+        if entry.target == ACTIVE_WINDOW:
+            return "アクティブウィンドウ"
+        return "デスクトップ" if entry.target == 0 else f"ディスプレイ {entry.target}"
+
+    def update_result(self) -> None:
+        """検索結果を表示する（インデックスのみを参照し、ファイルの有無は確認しない）"""
+        self.entries = self.history.search(self.search_ctrl_query.GetValue())
+        self.list_ctrl_result.DeleteAllItems()
+        for row, entry in enumerate(self.entries):
+            timestamp = datetime.fromtimestamp(entry.timestamp, ZoneInfo("Asia/Tokyo"))
+            self.list_ctrl_result.InsertItem(row, timestamp.strftime("%Y/%m/%d %H:%M:%S"))
+            self.list_ctrl_result.SetItem(row, 1, self.target_label(entry))
+            self.list_ctrl_result.SetItem(row, 2, f"{(entry.size + 1023) // 1024:,} KB")
+            self.list_ctrl_result.SetItem(row, 3, entry.path)
+        limit: str = "（新しい順、上限）" if len(self.entries) >= CaptureHistory.MAX_RESULTS else ""
+        self.label_count.SetLabel(f"{len(self.entries)} 件{limit}")
+
+    def selected_path(self) -> Path | None:
+        if (row := self.list_ctrl_result.GetFirstSelected()) < 0:
+            return None
+        return Path(self.entries[row].path)
+
+    def stop_search_timer(self) -> None:
+        if self._search_timer is not None:
+            self._search_timer.Stop()
+            self._search_timer = None
+
+    def on_text(self, event) -> None:
+        self.stop_search_timer()
+        self._search_timer = wx.CallLater(HistoryDialog.SEARCH_DELAY, self.update_result)
+        event.Skip()
+
+    def on_search(self, event) -> None:
+        self.stop_search_timer()
+        self.update_result()
+        event.Skip()
+
+    def on_destroy(self, event) -> None:
+        if event.GetEventObject() is self:
+            self.stop_search_timer()
+        event.Skip()
+
+    def on_search_cancel(self, event) -> None:
+        self.search_ctrl_query.SetValue("")
+        event.Skip()
+
+    def on_open(self, event) -> None:
+        """選択したキャプチャーを開く"""
+        if (path := self.selected_path()) is None:
+            return
+        if path.exists():
+            # ruff: noqa: S606
+            os.startfile(path)
+        else:
+            wx.MessageBox(f"ファイルがありません（移動または削除されています）\n{path}", "ERROR", wx.ICON_ERROR)
+        event.Skip()
+
+    def on_open_folder(self, event) -> None:
+        """選択したキャプチャーのフォルダを開く"""
+        if (path := self.selected_path()) is None:
+            return
+        if path.parent.exists():
+            os.startfile(path.parent)
+        else:
+            wx.MessageBox(f"フォルダがありません\n{path.parent}", "ERROR", wx.ICON_ERROR)
+        event.Skip()
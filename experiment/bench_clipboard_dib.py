@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+#
+"""bench_clipboard_dib.py
+
+クリップボード用DIB作成のレイテンシ／メモリ比較
+
+* pillow : Image.frombytes("BGRX") -> BMPエンコード -> 先頭14バイト(BITMAPFILEHEADER)除去（従来方式）
+* direct : mssのBGRA画素データからBITMAPINFOHEADER＋ボトムアップ行を直接作成
+* メモリはtracemallocで計測する（Pillow内部の画像バッファはPythonのアロケーター外のため、
+  ピーク値には含まれない。実際の差はさらに大きい）
+
+"""
+
+import argparse
+import io
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from capture_manager import bgra_to_dib
+
+
+def dib_pillow(data: bytearray, size: tuple[int, int]) -> bytes:
+    """従来方式"""
+    img = Image.frombytes("RGB", size, bytes(data), "raw", "BGRX")
+    with io.BytesIO() as output:
+        img.save(output, "BMP")
+        return output.getvalue()[14:]
+
+
+def dib_direct(data: bytearray, size: tuple[int, int]) -> bytearray:
+    """BGRAから直接作成"""
+    return bgra_to_dib(data, size)
+
+
+def bench(func: Callable, data: bytearray, size: tuple[int, int], count: int) -> tuple[list[float], int]:
+    results: list[float] = []
+    for _ in range(count):
+        start = time.perf_counter()
+        func(data, size)
+        results.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    func(data, size)
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (results, peak)
+
+
+def report(name: str, results: list[float], peak: int) -> None:
+    results.sort()
+    print(
+        f"{name:<8}: mean={statistics.mean(results):8.3f}ms, "
+        f"median={statistics.median(results):8.3f}ms, min={results[0]:8.3f}ms, peak={peak / 1024 / 1024:8.1f}MiB",
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Clipboard DIB benchmark.")
+    parser.add_argument("-W", "--width", type=int, default=7680, help="Image width.")
+    parser.add_argument("-H", "--height", type=int, default=2160, help="Image height.")
+    parser.add_argument("-n", "--count", type=int, default=20, help="Number of conversions.")
+    args = parser.parse_args()
+
+    size: tuple[int, int] = (args.width, args.height)
+    # mssのScreenShot.rawと同じトップダウンのBGRA（デスクトップ画像の代わりにグラデーション）
+    row = bytes(x & 0xFF for x in range(args.width * 4))
+    data = bytearray(row * args.height)
+
+    # ウォームアップ
+    dib_pillow(data, size)
+    dib_direct(data, size)
+
+    report("pillow", *bench(dib_pillow, data, size, args.count))
+    report("direct", *bench(dib_direct, data, size, args.count))
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+#
+"""bench_mss_session.py
+
+mssセッションの使い捨て／使い回しによる1ショット毎のレイテンシ比較
+
+"""
+
+import argparse
+import statistics
+import time
+
+import mss
+
+
+def bench_fresh(moni_no: int, count: int) -> list[float]:
+    """キャプチャー毎にmssを生成する（従来方式）"""
+    results: list[float] = []
+    for _ in range(count):
+        start = time.perf_counter()
+        with mss.mss() as sct:
+            sct.grab(sct.monitors[moni_no])
+        results.append((time.perf_counter() - start) * 1000)
+    return results
+
+
+def bench_persistent(moni_no: int, count: int) -> list[float]:
+    """mssを1度だけ生成して使い回す"""
+    results: list[float] = []
+    with mss.mss() as sct:
+        for _ in range(count):
+            start = time.perf_counter()
+            sct.grab(sct.monitors[moni_no])
+            results.append((time.perf_counter() - start) * 1000)
+    return results
+
+
+def report(name: str, results: list[float]) -> None:
+    results.sort()
+    p95: float = results[int(len(results) * 0.95) - 1]
+    print(
+        f"{name:<12}: mean={statistics.mean(results):8.3f}ms, "
+        f"median={statistics.median(results):8.3f}ms, p95={p95:8.3f}ms, min={results[0]:8.3f}ms",
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="mss session benchmark.")
+    parser.add_argument("-m", "--monitor", type=int, default=1, help="Monitor number (0=desktop).")
+    parser.add_argument("-n", "--count", type=int, default=100, help="Number of shots.")
+    args = parser.parse_args()
+
+    # ウォームアップ
+    bench_persistent(args.monitor, 5)
+
+    report("fresh", bench_fresh(args.monitor, args.count))
+    report("persistent", bench_persistent(args.monitor, args.count))
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+#
+"""extract_tile_frames.py
+
+差分（タイル）記録ファイルからフレームをPNGファイルとして復元するツール
+
+"""
+
+import argparse
+from datetime import datetime
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+from tile_recorder import TileReader
+
+
+def parse_frames(spec: str, count: int) -> list[int]:
+    """フレーム指定（例: "all", "0", "3-10", "1,5,9"）をフレーム番号のlistにする"""
+    if spec == "all":
+        return list(range(count))
+
+    frames: list[int] = []
+    for part in spec.split(","):
+        if "-" in part:
+            begin, end = part.split("-", 1)
+            frames.extend(range(int(begin), int(end) + 1))
+        else:
+            frames.append(int(part))
+    return [n for n in frames if 0 <= n < count]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Extract frames from a PyScreenShot tile recording.")
+    parser.add_argument("recording", help="Tile recording file (*.tiles).")
+    parser.add_argument("-f", "--frames", default="all", help='Frames to extract ("all", "N", "N-M", "N,M,...").')
+    parser.add_argument("-o", "--output", default=".", help="Output folder.")
+    parser.add_argument("-l", "--list", action="store_true", help="List frames only.")
+    args = parser.parse_args()
+
+    src = Path(args.recording)
+    reader = TileReader(src)
+    try:
+        if args.list:
+            for n, (kind, timestamp, width, height, _offset, length) in enumerate(reader.frames):
+                captured = datetime.fromtimestamp(timestamp, ZoneInfo("Asia/Tokyo"))
+                print(f"{n:6}: {'key  ' if kind == 0 else 'delta'} {captured.isoformat()} {width}x{height} {length} bytes")
+        else:
+            out_dir = Path(args.output)
+            out_dir.mkdir(parents=True, exist_ok=True)
+            for n in parse_frames(args.frames, len(reader)):
+                filename = out_dir / f"{src.stem}_{n:06}.png"
+                reader.frame_image(n).save(filename)
+                print(f"Frame {n} -> {filename}")
+    finally:
+        reader.close()
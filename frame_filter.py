@@ -0,0 +1,114 @@
+import logging
+import zlib
+
+logger = logging.getLogger(__name__)
+
+
+def frame_fingerprint(data: bytes | bytearray | memoryview, height: int, bands: int) -> tuple[int, ...]:
+    """フレームの指紋（行の帯毎のCRC32）を求める
+
+    Args:
+        data: BGRA画素データ
+        height(int): 画像の高さ
+        bands(int): 帯（ブロック）の数
+
+    Returns:
+        帯毎のチェックサム
+
+    """
+    view = memoryview(data)
+    if height <= 0 or len(view) == 0:
+        return ()
+
+    row_bytes: int = len(view) // height
+    rows: int = -(-height // min(bands, height))  # 1帯あたりの行数（切り上げ）
+    step: int = rows * row_bytes
+    return tuple(zlib.crc32(view[pos : pos + step]) for pos in range(0, len(view), step))
+
+
+# 保存したフレームの指紋（画像サイズ(幅, 高さ), 帯毎のチェックサム）
+SavedFingerprint = tuple[tuple[int, int], tuple[int, ...]]
+
+
+class UnchangedFrameFilter:
+    """前回保存したフレームから変化の無いフレームを判定する（定期実行向け）
+
+    * 比較対象は保存に成功したフレーム（checkで変化ありと判定し、保存後にcommitしたもの）
+    """
+
+    # 指紋の帯数（類似度の分解能）
+    BANDS: int = 64
+
+    def __init__(self) -> None:
+        self._previous: dict[object, SavedFingerprint] = {}
+        self.skipped: int = 0
+
+    def reset(self) -> None:
+        """前回フレームとスキップ数をクリアする"""
+        self._previous.clear()
+        self.skipped = 0
+
+    def check(
+        self,
+        key: object,
+        size: tuple[int, int],
+        data: bytes | bytearray | memoryview,
+        threshold: int,
+    ) -> SavedFingerprint | None:
+        """前回保存したフレームとの類似度がしきい値以上か判定する
+
+        Args:
+            key: キャプチャー対象の識別子
+            size(tuple): 画像サイズ(幅, 高さ)
+            data: BGRA画素データ
+            threshold(int): しきい値（一致した帯の割合[%]、100=完全一致）
+
+        Returns:
+            変化ありなら保存後にcommitへ渡す指紋、None=変化なし（スキップ対象）
+
+        """
+        fingerprint: tuple[int, ...] = frame_fingerprint(data, size[1], UnchangedFrameFilter.BANDS)
+        previous = self._previous.get(key)
+        if previous is None or previous[0] != size or not fingerprint:
+            return size, fingerprint
+
+        # 比較対象は最後に保存したフレーム（少しずつの変化が積み重なっても見逃さないため）
+        same: int = sum(a == b for a, b in zip(previous[1], fingerprint, strict=True))
+        if same * 100 < threshold * len(fingerprint):
+            return size, fingerprint
+
+        self.skipped += 1
+        logger.debug(f"Skipped unchanged frame ({same}/{len(fingerprint)} blocks matched, total {self.skipped})")
+        return None
+
+    def commit(self, key: object, fingerprint: SavedFingerprint) -> None:
+        """保存に成功したフレームを以降の比較対象にする
+
+        Args:
+            key: キャプチャー対象の識別子
+            fingerprint: checkが返した指紋
+
+        Returns:
+            none
+
+        """
+        self._previous[key] = fingerprint
+
+    def is_unchanged(self, key: object, size: tuple[int, int], data: bytes | bytearray | memoryview, threshold: int) -> bool:
+        """判定して、変化ありなら直ちに比較対象にする（保存の成否を待たない場合）
+
+        Args:
+            key: キャプチャー対象の識別子
+            size(tuple): 画像サイズ(幅, 高さ)
+            data: BGRA画素データ
+            threshold(int): しきい値（一致した帯の割合[%]、100=完全一致）
+
+        Returns:
+            True=変化なし（スキップ対象）
+
+        """
+        if (fingerprint := self.check(key, size, data, threshold)) is None:
+            return True
+
+        self.commit(key, fingerprint)
+        return False
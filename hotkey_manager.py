@@ -28,6 +28,8 @@ class HotkeyManager:
         self._to_clipboard: list[str] = []
         self._to_imagefile: list[str] = []
         self._periodic_stop: str = ""
+        self._burst: str = ""
+        self._prebuffer: str = ""
 
     def get_capture_hotkey(self, kind: int) -> str:
         """キャプチャー用Hotkeyの取得"""
@@ -120,3 +122,43 @@ class HotkeyManager:
         """
         # 現在のHotkeyを削除
         keyboard.remove_hotkey(self._periodic_stop)
+
+    def add_burst(self, hot_key: str, handler) -> None:
+        """連写キャプチャー用ホット・キー登録処理
+
+        Args:
+            hot_key(str): Hot-key
+            handler: 処理関数
+
+        Returns:
+            none
+
+        """
+        self._burst = hot_key
+        keyboard.add_hotkey(hot_key, lambda: wx.CallAfter(handler))
+
+    def remove_burst(self) -> None:
+        """連写キャプチャー用ホット・キー削除処理"""
+        if self._burst:
+            keyboard.remove_hotkey(self._burst)
+            self._burst = ""
+
+    def add_prebuffer(self, hot_key: str, handler) -> None:
+        """プリイベントバッファ保存用ホット・キー登録処理
+
+        Args:
+            hot_key(str): Hot-key
+            handler: 処理関数
+
+        Returns:
+            none
+
+        """
+        self._prebuffer = hot_key
+        keyboard.add_hotkey(hot_key, lambda: wx.CallAfter(handler))
+
+    def remove_prebuffer(self) -> None:
+        """プリイベントバッファ保存用ホット・キー削除処理"""
+        if self._prebuffer:
+            keyboard.remove_hotkey(self._prebuffer)
+            self._prebuffer = ""
@@ -5,93 +5,134 @@
 
 リソースデータ作成ツール
 
+* アイコン、音源、メニュー画像を1つのリソースバンドル(res/resources.bin)にまとめ、
+  アクセス用モジュール(res/*.py)を生成する
+
 """
 
+import zlib
 from pathlib import Path
 
-from wx.tools import img2py
+from res import bundle
+
+
+def create_bundle(resource_files: list, filename: str) -> bool:
+    """ファイルからリソースバンドル(.bin)を生成する
+
+    Args:
+        resource_files(list): (ファイル名, リソース名, 圧縮種別)のlist
+        filename(str): リソースバンドルのファイル名
+
+    Returns:
+        結果(bool): True=成功
+
+    """
+    if not resource_files:
+        print(f"[ERROR] No resource file(s) found.")
+        return False
+
+    entries: list[tuple[bytes, int, bytes, int]] = []
+    for file, name, compression in resource_files:
+        try:
+            raw: bytes = Path(file).read_bytes()
+        except OSError as e:
+            print(f'Resource "{file}" read failed.({e})')
+            return False
+        data: bytes = zlib.compress(raw, 9) if compression == bundle.COMPRESS_ZLIB else raw
+        entries.append((name.encode("utf-8"), compression, data, len(raw)))
+
+    # データ開始位置（ヘッダー＋エントリー）
+    offset: int = bundle.HEADER.size + sum(bundle.ENTRY.size + len(name) for name, *_ in entries)
+    header: list[bytes] = [bundle.HEADER.pack(bundle.MAGIC, len(entries))]
+    for name, compression, data, raw_size in entries:
+        header.append(bundle.ENTRY.pack(len(name), compression, offset, len(data), raw_size))
+        header.append(name)
+        offset += len(data)
+
+    try:
+        with Path(filename).open(mode="wb") as wfd:
+            wfd.writelines(header)
+            wfd.writelines(data for _name, _compression, data, _raw_size in entries)
+
+    except OSError as e:
+        print(f"Resource bundle '{filename}' create failed.({e})")
+        return False
 
-from myutils.res_func import convert_base64
+    for file, name, _compression in resource_files:
+        print(f'Bundled {file} using "{name}" into {filename}')
+    return True
 
 
 def create_resource(resource_files: list, filename: str) -> None:
-    """ファイルからリソースファイル(.py)を生成する"""
+    """リソースバンドルのアクセスモジュール(.py)を生成する"""
     if not resource_files:
         print(f"[ERROR] No resource file(s) found.")
         return
 
-    max_len = 72
     lines = [
         "#----------------------------------------------------------------------\n",
         f"# This file was generated by {Path(__file__).name}\n",
         "#\n",
-        "import sys\n",
+        "import base64\n",
         "from io import BytesIO\n",
-        "from pathlib import Path\n",
         "\n",
-        'sys.path.append(str(Path(__file__).parent.joinpath("..")))\n',
-        "from myutils import res_func\n",
+        "from res import bundle\n",
         "\n",
     ]
-    try:
-        with Path(filename).open(mode="w", encoding="utf-8", newline="\n") as wfd:
-            wfd.writelines(lines)
-
-    except OSError as e:
-        print(f"Resource file '{filename}' create failed.({e})")
-        return
-
     for file in resource_files:
-        data_str = convert_base64(file[0])
-        lines.clear()
-        lines.append("#----------------------------------------------------------------------\n")
-        lines.append(f'_{file[1]}: str = """\n')
-        data_lines = len(data_str) // max_len
-        pos = 0
-        if data_lines > 0:
-            for ln in range(1, data_lines + 1):
-                lines.append(data_str[pos : (max_len * ln)] + "\n")
-                pos += max_len
-        if len(data_str) % max_len > 0:
-            lines.append(data_str[pos:] + "\n")
-        lines.append('"""\n\n')
-
+        lines.append("\n")
         lines.append(f"def get_{file[1]}_stream() -> BytesIO:\n")
-        lines.append(f"    return res_func.convert_stream(_{file[1]})\n")
+        lines.append(f'    return bundle.convert_stream("{file[1]}")\n')
         lines.append("\n\n")
         lines.append(f"def get_{file[1]}_bytearray() -> bytearray:\n")
-        lines.append(f"    return res_func.convert_bytearray(_{file[1]})\n")
+        lines.append(f'    return bundle.convert_bytearray("{file[1]}")\n')
         lines.append("\n\n")
         lines.append(f"def get_{file[1]}() -> str:\n")
-        lines.append(f"    return _{file[1]}\n")
+        lines.append(f'    return base64.b64encode(bundle.get_stored("{file[1]}")).decode()\n')
+        lines.append("\n\n")
+        lines.append(f"def get_{file[1]}_compressed() -> bytes:\n")
+        lines.append(f'    return bundle.get_stored("{file[1]}")\n')
         lines.append("\n")
 
-        try:
-            with Path(filename).open(mode="a", encoding="utf-8", newline="\n") as wfd:
-                wfd.writelines(lines)
+    try:
+        with Path(filename).open(mode="w", encoding="utf-8", newline="\n") as wfd:
+            wfd.writelines(lines)
+
+    except OSError as e:
+        print(f'Resource file "{filename}" create failed.({e})')
+        return
 
-            print(f'Embedded {file[0]} using "{file[1]}" into {filename}')
+    for file in resource_files:
+        print(f'Accessor for "{file[1]}" written into {filename}')
 
-        except OSError as e:
-            print(f'Resource file "{filename}" create failed.({e})')
-            break
+
+def bundle_image_name(getter: str, size: tuple = (16, 16)) -> str:
+    """画像リソースのバンドル内の名前（例: get_icon_info -> menu16/icon_info）"""
+    return f"menu{size[0]}/{getter.removeprefix('get_')}"
 
 
 def create_menu_image_resource(image_files: list, resource_file: str, size: tuple = (16, 16)) -> None:
-    """画像ファイルからリソースファイルを生成する"""
-    append = False
+    """画像リソースのアクセスモジュール(.py)を生成する（catalog, index互換）"""
+    lines = [
+        "#----------------------------------------------------------------------\n",
+        f"# This file was generated by {Path(__file__).name}\n",
+        "#\n",
+        "from res.bundle import BundleImage\n",
+        "\n",
+        "catalog = {}\n",
+        "index = []\n",
+        "\n",
+    ]
     for f in image_files:
-        img2py.img2py(
-            image_file=f[0],
-            python_file=resource_file,
-            imgName=f[1],
-            append=append,
-            catalog=True,
-        )
-        append = True
+        lines.append("#----------------------------------------------------------------------\n")
+        lines.append(f'{f[1]} = BundleImage("{bundle_image_name(f[1], size)}")\n')
+        lines.append(f"index.append('{f[1]}')\n")
+        lines.append(f"catalog['{f[1]}'] = {f[1]}\n")
+        lines.append("\n")
+    lines.append(f"# Image size\nimage_size={size}\n")
 
-    with Path(resource_file).open("a", encoding="utf-8") as fc:
-        fc.write(f"# Image size\nimage_size={size}\n")
+    with Path(resource_file).open("w", encoding="utf-8") as fc:
+        fc.writelines(lines)
 
 
 if __name__ == "__main__":
@@ -101,25 +142,21 @@ if __name__ == "__main__":
     RES_DIR = f".{os.sep}res"
 
     # fmt: off
-    """アイコンリソースファイルの生成
+    """アイコンリソース
     """
     # アイコンファイル、リソース名
     app_icon_files = [(str(Path(SRC_DIR) / "ScreenShot.ico"), "app_icon")]
-    # 生成
-    create_resource(app_icon_files, str(Path(RES_DIR) / "app_icon.py"))
 
-    """音源リソースファイルの生成
+    """音源リソース
     """
     sound_files = [
         (str(Path(SRC_DIR) / "決定、ボタン押下8.wav"), "snd_success"),
         (str(Path(SRC_DIR) / "警告音1.wav"        ), "snd_beep"),
     ]
-    # 生成
-    create_resource(sound_files, str(Path(RES_DIR) / "sound.py"))
 
-    """画像リソースファイルの生成
+    """画像リソース
     """
-    # 画像ファイル、リソース名リスト
+    # 画像ファイル、リソース名、バンドル内の名前
     image_files16 = [
         (str(Path(SRC_DIR) / "icon-info-sign16.png"   ), "get_icon_info"),
         (str(Path(SRC_DIR) / "icon-cog16.png"         ), "get_icon_settings"),
@@ -131,16 +168,17 @@ if __name__ == "__main__":
         (str(Path(SRC_DIR) / "icon-picture16.png"     ), "get_icon_save_to_png"),
         (str(Path(SRC_DIR) / "icon-exit16.png"        ), "get_icon_exit"),
     ]
-    image_files24 = [
-        (str(Path(SRC_DIR) / "icon-info-sign24.png"   ), "get_icon_info"),
-        (str(Path(SRC_DIR) / "icon-cog24.png"         ), "get_icon_settings"),
-        (str(Path(SRC_DIR) / "icon-check24.png"       ), "get_icon_quick_settings"),
-        (str(Path(SRC_DIR) / "icon-folder-close24.png"), "get_icon_auto_save_folder"),
-        (str(Path(SRC_DIR) / "icon-folder-open24.png" ), "get_icon_open_folder"),
-        (str(Path(SRC_DIR) / "icon-time24.png"        ), "get_icon_periodic_capture_settings"),
-        (str(Path(SRC_DIR) / "icon-copy24.png"        ), "get_icon_copy_to_clipboard"),
-        (str(Path(SRC_DIR) / "icon-picture24.png"     ), "get_icon_save_to_png"),
-        (str(Path(SRC_DIR) / "icon-exit24.png"        ), "get_icon_exit"),
+
+    """リソースバンドルの生成（PNGは圧縮済みなので無圧縮で格納する）
+    """
+    bundle_files = [
+        *[(f, name, bundle.COMPRESS_ZLIB) for f, name in app_icon_files],
+        *[(f, name, bundle.COMPRESS_ZLIB) for f, name in sound_files],
+        *[(f, bundle_image_name(name), bundle.COMPRESS_NONE) for f, name in image_files16],
     ]
-    # 生成
-    create_menu_image_resource(image_files16, str(Path(RES_DIR) / "menu_image.py"), (16, 16))
+    # fmt: on
+    if create_bundle(bundle_files, str(bundle.BUNDLE_FILE)):
+        # アクセスモジュールの生成
+        create_resource(app_icon_files, str(Path(RES_DIR) / "app_icon.py"))
+        create_resource(sound_files, str(Path(RES_DIR) / "sound.py"))
+        create_menu_image_resource(image_files16, str(Path(RES_DIR) / "menu_image.py"), (16, 16))
@@ -0,0 +1,113 @@
+import logging
+import threading
+import time
+from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicScheduler:
+    """定期実行スケジューラー
+
+    * 専用スレッドで、開始時刻からの絶対時刻（time.monotonic）を目標に処理を呼び出す
+    * 処理時間やUIの停止で次回の予定がずれない（ドリフトしない）
+    * 目標時刻から遅れた回、間に合わずに飛ばした回を記録する
+    """
+
+    # 遅延とみなす割合（間隔に対する%）
+    LATE_PERCENT: int = 10
+    # 停止時に実行中の処理の完了を待つ時間（秒、UIスレッドから呼ばれても固まらないよう上限を設ける）
+    STOP_TIMEOUT: float = 5.0
+
+    def __init__(self, callback: Callable[[], None], name: str = "periodic") -> None:
+        """初期処理
+
+        Args:
+            callback: 定期実行する処理（スケジューラーのスレッドで呼ばれる）
+            name(str): スレッド名
+
+        Returns:
+            none
+
+        """
+        self._callback = callback
+        self._name = name
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self.interval_ms: int = 0
+        self.ticks: int = 0
+        self.late: int = 0
+        self.missed: int = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, interval_ms: int) -> bool:
+        """定期実行の開始（実行中なら間隔を変えて再開する）
+
+        * 停止を待ち切れなかった処理がまだ実行中なら開始しない（処理を並行して呼ばないため）
+
+        Args:
+            interval_ms(int): 間隔（ミリ秒、1秒未満も可）
+
+        Returns:
+            True=開始した、False=前回の処理が実行中のため開始しなかった
+
+        """
+        self.stop()
+        if self._thread is not None:
+            logger.warning(f"Periodic scheduler '{self._name}' is still running the previous tick, not started")
+            return False
+
+        self.interval_ms = max(1, interval_ms)
+        self.ticks = self.late = self.missed = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(self._stop,), name=self._name, daemon=True)
+        self._thread.start()
+        logger.debug(f"Periodic scheduler started (interval={self.interval_ms}ms)")
+        return True
+
+    def stop(self) -> None:
+        """定期実行の停止（実行中の処理の完了をSTOP_TIMEOUT秒まで待つ）
+
+        * 処理がUIスレッドを待っている場合（UIスレッドからの停止）でも固まらない
+        * 待ち切れなかった処理は停止済みのイベントを見て、完了後にスレッドを終了する（終了するまでrunningはTrue）
+
+        """
+        if self._thread is None:
+            return
+
+        self._stop.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join(PeriodicScheduler.STOP_TIMEOUT)
+            if self._thread.is_alive():
+                # 再開時に処理を並行して呼ばないよう、スレッドの参照を残す（次回のstopで再度待つ）
+                logger.warning(f"Periodic scheduler '{self._name}' did not stop within {PeriodicScheduler.STOP_TIMEOUT}s")
+                return
+        self._thread = None
+        logger.info(f"Periodic scheduler stopped (ticks={self.ticks}, late={self.late}, missed={self.missed})")
+
+    def _run(self, stop: threading.Event) -> None:
+        interval: float = self.interval_ms / 1000
+        late_limit: float = interval * PeriodicScheduler.LATE_PERCENT / 100
+        deadline: float = time.monotonic() + interval
+        while not stop.wait(max(0.0, deadline - time.monotonic())):
+            lateness: float = time.monotonic() - deadline
+            if lateness >= interval:
+                # 間に合わなかった回は実行せずに飛ばす（次の予定は元の時刻系列のまま）
+                skip: int = int(lateness // interval)
+                self.missed += skip
+                deadline += skip * interval
+                logger.warning(f"Periodic capture missed {skip} tick(s) ({lateness * 1000:.0f}ms late)")
+            elif lateness > late_limit:
+                self.late += 1
+                logger.debug(f"Periodic capture tick {lateness * 1000:.0f}ms late")
+
+            self.ticks += 1
+            try:
+                self._callback()
+            except Exception:
+                logger.exception("Periodic capture failed")
+
+            deadline += interval
@@ -0,0 +1,148 @@
+"""redaction.py
+
+キャプチャー画像の墨消し（保存しない領域の塗りつぶし、モザイク）
+
+* 設定ファイルの[redaction]に、ディスプレイ毎またはウィンドウタイトル毎の矩形を「rule1」「rule2」...で指定する
+    rule1 = 1, 0, 0, 400, 1080              ディスプレイ1の左上基準（0=デスクトップ全体）の(left, top, width, height)
+    rule2 = title:KeePass, 0, 0, 300, 600   タイトルに「KeePass」を含むアクティブウィンドウの左上基準
+* 矩形はキャプチャー領域と重なる部分だけを、取得した画素データ（NumPy配列のビュー）上で直接書き換える（コピーしない）
+
+"""
+
+import logging
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from redaction_rule import parse_rule
+
+if TYPE_CHECKING:
+    from app_settings import AppSettings
+    from redaction_rule import RedactionRule
+
+logger = logging.getLogger(__name__)
+
+
+def _pixelate(region: np.ndarray, block: int) -> None:
+    """モザイク（block×blockの平均値で塗りつぶす、端の半端なブロックはその範囲の平均値）
+
+    * 領域を「揃ったブロック」「右端」「下端」「右下」に分け、それぞれを形状の変更（ビュー）でブロックに分割する
+    * ブロック内の行の合計を先に求めてから列を合計する（一時配列は領域の1/block、画像サイズの一時配列を作らない）
+
+    """
+    height, width = region.shape[:2]
+    bottom, right = height - height % block, width - width % block
+    for top, end_y in ((0, bottom), (bottom, height)):
+        for left, end_x in ((0, right), (right, width)):
+            if top == end_y or left == end_x:
+                continue
+            block_h, block_w = min(block, end_y - top), min(block, end_x - left)
+            blocks = region[top:end_y, left:end_x].reshape(
+                (end_y - top) // block_h,
+                block_h,
+                (end_x - left) // block_w,
+                block_w,
+                4,
+            )
+            sums = np.add.reduce(blocks, axis=1, dtype=np.uint32).sum(axis=2)
+            blocks[:] = (sums // (block_h * block_w)).astype(np.uint8)[:, None, :, None]
+
+
+def redact(array: np.ndarray, boxes: list[tuple[int, int, int, int]], mode: str = "black", block: int = 16) -> None:
+    """墨消し（配列を直接書き換える）
+
+    Args:
+        array(np.ndarray): 画素データ（高さ×幅×4、BGRA）
+        boxes(list): 墨消しする範囲(left, top, right, bottom)のlist
+        mode(str): 墨消しの方法（black, pixelate）
+        block(int): モザイクのブロックの大きさ（ピクセル）
+
+    Returns:
+        none
+
+    """
+    for left, top, right, bottom in boxes:
+        region: np.ndarray = array[top:bottom, left:right]
+        if mode == "pixelate":
+            _pixelate(region, max(1, block))
+        else:
+            # 最上位バイト（X）は未使用なので画素単位で0にする（チャンネル毎より速い）
+            region[:] = 0
+
+
+class Redactor:
+    """墨消しの指定（キャプチャー領域毎の範囲の算出と適用）"""
+
+    def __init__(self, rules: "list[RedactionRule]", mode: str = "black", block: int = 16) -> None:
+        """初期処理
+
+        Args:
+            rules(list): 墨消しの指定
+            mode(str): 墨消しの方法（black, pixelate）
+            block(int): モザイクのブロックの大きさ（ピクセル）
+
+        Returns:
+            none
+
+        """
+        self.rules: tuple[RedactionRule, ...] = tuple(rules)
+        self.mode: str = mode
+        self.block: int = block
+
+    @classmethod
+    def from_settings(cls, settings: "AppSettings") -> "Redactor | None":
+        """設定値から生成する（墨消ししない場合はNone）
+
+        Args:
+            settings(AppSettings): 設定値（指定は読み込み時に検証済み）
+
+        Returns:
+            Redactor、無効または指定が無い場合はNone
+
+        """
+        if not settings.redaction or not settings.redaction_rules:
+            return None
+
+        rules: list[RedactionRule] = [parse_rule(text) for text in settings.redaction_rules]
+        logger.info(f"Redaction enabled ({len(rules)} rule(s), mode={settings.redaction_mode})")
+        return cls(rules, settings.redaction_mode, settings.redaction_block)
+
+    def boxes(
+        self,
+        area: dict,
+        monitors: list[dict],
+        window: tuple[str, dict] | None = None,
+    ) -> list[tuple[int, int, int, int]]:
+        """キャプチャー領域内の墨消しする範囲
+
+        Args:
+            area(dict): キャプチャー領域（left, top, width, height、画面座標）
+            monitors(list): ディスプレイの領域（[0]はデスクトップ全体）
+            window(tuple): キャプチャーしたアクティブウィンドウ(タイトル, 領域)、None=ウィンドウ以外
+
+        Returns:
+            キャプチャー領域基準の範囲(left, top, right, bottom)のlist
+
+        """
+        boxes: list[tuple[int, int, int, int]] = []
+        for rule in self.rules:
+            if rule.display < 0:
+                if window is None or rule.title.casefold() not in window[0].casefold():
+                    continue
+                origin: dict = window[1]
+            elif rule.display < len(monitors):
+                origin = monitors[rule.display]
+            else:
+                continue
+
+            left: int = max(0, origin["left"] + rule.left - area["left"])
+            top: int = max(0, origin["top"] + rule.top - area["top"])
+            right: int = min(area["width"], origin["left"] + rule.left + rule.width - area["left"])
+            bottom: int = min(area["height"], origin["top"] + rule.top + rule.height - area["top"])
+            if left < right and top < bottom:
+                boxes.append((left, top, right, bottom))
+
+        return boxes
+
+    def apply(self, array: np.ndarray, boxes: list[tuple[int, int, int, int]]) -> None:
+        redact(array, boxes, self.mode, self.block)
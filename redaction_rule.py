@@ -0,0 +1,55 @@
+"""redaction_rule.py
+
+墨消しの指定（設定ファイルの[redaction]）の解析
+
+* 設定値の検証（AppSettings）でも使うため、NumPyに依存しない
+
+"""
+
+from typing import NamedTuple
+
+# 墨消しの方法（black: 黒で塗りつぶす、pixelate: モザイク）
+REDACTION_MODES: tuple[str, ...] = ("black", "pixelate")
+# ウィンドウタイトル指定の接頭語
+TITLE_PREFIX: str = "title:"
+
+
+class RedactionRule(NamedTuple):
+    display: int  # ディスプレイ番号（0=デスクトップ全体）、-1=ウィンドウタイトル指定
+    title: str  # ウィンドウタイトル（部分一致、大文字小文字を区別しない）
+    left: int
+    top: int
+    width: int
+    height: int
+
+
+def parse_rule(text: str) -> RedactionRule:
+    """墨消しの指定（「対象, left, top, width, height」）の解析
+
+    Args:
+        text(str): 設定値
+
+    Returns:
+        RedactionRule、不正な指定はValueError
+
+    """
+    target, *coords = text.rsplit(",", 4)
+    if len(coords) != 4:
+        msg = "「対象, left, top, width, height」の形式で指定してください"
+        raise ValueError(msg)
+    left, top, width, height = (int(v) for v in coords)
+    if width <= 0 or height <= 0:
+        msg = "幅と高さは1以上を指定してください"
+        raise ValueError(msg)
+
+    target = target.strip()
+    if target.startswith(TITLE_PREFIX):
+        if not (title := target.removeprefix(TITLE_PREFIX).strip()):
+            msg = "ウィンドウタイトルを指定してください"
+            raise ValueError(msg)
+        return RedactionRule(-1, title, left, top, width, height)
+
+    if (display := int(target)) < 0:
+        msg = "ディスプレイ番号は0以上を指定してください"
+        raise ValueError(msg)
+    return RedactionRule(display, "", left, top, width, height)
@@ -1,362 +1,24 @@
 #----------------------------------------------------------------------
 # This file was generated by make_resource_file.py
 #
-import sys
+import base64
 from io import BytesIO
-from pathlib import Path
 
-sys.path.append(str(Path(__file__).parent.joinpath("..")))
-from myutils import res_func
+from res import bundle
 
-#----------------------------------------------------------------------
-_app_icon: str = """
-eJztnQe4FEXWhi9mREWyBJEMApIliQTJkjNIVCQpZl1zwpxzxhzWsKCuCdeIWdacdl2zIqwB
-XFdZfhGsf9669GVCT3d1T3dX90z183zKvXemu7qqTtWpE75TVlapbNuyXXctS/2/Udn8bcrK
-JpaVle22W/nP51cuK3s29btGjcp/vjf1uUG7lJV16LD55+ZlZWsblsmLn1s12qbs2gFlZa1S
-P6c+mvpN+e/zXeK/L94gfrxViB9vqcBnb5wvVn94mbj9mtni5KOGizuvPVh8suK8jM/I71jf
-/XZKCgeJL1+fKA6e0kJU3Xlb0b51dXHuCZ1F9061BI/ZdZft5N++eG2C/Kz8jvXc1M9/f2KC
-aLrHLvKzFnbacVtx3ondRd8e9Sp+16rZruKrFTPK72G195XxYvd6O8m/V991e7FbrR3FLjtt
-K3/edputxIWn9Kj4+zZbVxI3XdRPrHprcsX3Tzi0nRg/rKk4609dxRnH7C2Ond9BPHjzUPHk
-PSPkv+dMbS2Onttefr/qztuJExZ2EvOnt5TfXb/yBnH12d3FsP57iJrVdxCVUp85dFZb8eun
-c4VYdajEL5/MEe89M1nsXGVb0axRVXnPnatsI/71+nli6e2HyjZZ78ffrO+lY9PKQ0SPznXE
-pJHNxPABe8jPMi6LThhd8d1+PeuLz1+bbvt9cMoRXcSi47pW9M1ZJ46R4N/8jr+demSXvN/n
-3jzDeh7PvuOag+W/aRNt69llN9lWu+/zbtZ3eWfenT6gL/gb408f0Vfp/ce/6VP6lj6mr69K
-9Tl9zxgwFowJY8O9GSvGjHsyhowl/2ZseUfGmjG3xp+5wJywxoG5wpxh7lhjzpxibll/Z85V
-yEJqLjInmZvW+zFnmbvM4fQ5zTsy17fM3y3yg2zMntxCygqfRXaQIWQJmeJvyFiG/NjIL33K
-uCC7yDCyjEzbyW/ehUHxYp1JLVVlHdzWmY0/9xf/ff4L8Z/HhPjP43nx2Ts3iyf+skg898j5
-4t2XrhFrv7zP4fOpe3FP697fzk71C2vDzAps/Hq6WHJTXzF2aMPUeHQSrz2yvxjUu3w92apS
-mahXp7IYM6ShWLq4r/xs+nfL7zVbVLSbn9Pm86uPjJMymT6+HdrUFMuXjhYnH9454/eAz/Kd
-DLngnlaf8MzNv2c+WvMvG5V32FosWTwkNTe65/yN79x62X5p95+5pb8235972903HVtvVUk8
-ducwKUfZf+vYtqb4/esFtvfn/fhudntZX3bYfuuM3yPLrz82XrRoUjWnnx66Zah4fsnojPv/
-9sU00W7PGmLHytuIyaOaiWvP6y0euX2YlPHH7xou2/v0fSPFZWf0EqMGNxbbb7eVlHX6I/3+
-Q/s1FFef01uOlRzzzfdfvmSwOP3ovcVLD40V11/QR34XmabtyP9fbhqSMXYr35yZWof2FR88
-NzlD9g+Z2VauNfybeWXdf+Ub48VJqXlRK/Xe6e2pXaOyeGHpmLzrLjjxsE4Vn198cT8xclAj
-+W/mLvf+ZeWS1LhUzxmrOjUri3efnuR4b8Cc5fOsv/S71UbkAxlEFu3mmlu7LXz//kFy3KaP
-ayluuLBvxjzj3sh79v3PPLarWPH4eLHxmwWu92c+Mm8Y/71aZfYD986+P5/hs3ynYi47gDbQ
-FtqU3U5rrUqf97zjtLEtRJXUO/PuKn1EX9rJvLUO1q1dWf7M2DBGjBU/M3Zu92YOMM9yZbm6
-nDvModGDd5e/Y24xx6zPMPfc2p19b9rIXGfOW/OfdZi/IRsLZrSt+OyezapJGUKWkKn0eyNz
-lj6HjI3bv4mUTWQUWUVmrfsjy+1b15CyPaRvw4z2sAbwXdYE1obLz+wlx581g7WDNYS15Lrz
-+8i1hbnKWsOak76+0e8P37p/zrrPGsZaVqPa9hm/Z82j7dwve32Ve4HN+sx8ZI3NHqu501qL
-R+8YlrO+2oE1Pt/6D265dD/bucaewt6SvVany3zFvTPub78/du9UJ+ce7I3MWdbf9N/z2bz7
-o8v+ztxFPtjTuRd7PHs9ez5rJJ9x3N8V9BNrHUTe0VHQVZx0mXT9pCzkCz2sUQp9y1z0MCGq
-ig2rbxW/vPab+OVVoYINa18Ua75aJn78shy//vtZpe9tQepZPNN69veXp/p9+mbMsMXaDyeJ
-R27rl9J3x4r/fjxFzBjfRJ4Taqbkq/HuO6XOGbVS+2xLub/+9NHkvPepeA7PLH/v9fLnPGvZ
-d+8dKOdng7pV5DxCF+fMsObD2bb6FuCzfIfv5l0neabV53mef8eV/VP77Y62z+jcrpb4+MWp
-4ql7R1as+9ngu9wj//M3j0eWnLK3pa/H+cBzn7l/lNwH87UBcK//+2J+rhzbPJ9nc250e7YF
-1p9nHxgl/vbnkfI8mO9zOf2Q5/kq723XD4wF57t8n2F/Yd/foifnPv/2K/o7vid7Vb61nvnw
-88dzcvYhC+gfVyzqJfdKu+f/+90Dpf7NZ9mbOK+yL7O3cT79aPkU8c8XDhBvPTlRLLt7hLjm
-3N7iwEmt5F5tPQN5ePHBMbbPv+/6QVJX4uws5SLr+UfNaS/39UvP2EfaFTg///W2/cVpR3UR
-B4xpLgb12V3uB4cdtJf432fzKsaLecUewe/btqwuvnh9uvxs9vPRD+ZPb1Ox36Q/f92nB4gH
-bhwsx+eJu4eLEQMb2c5n+sTJnoKuwrpw/w2DM77HmZ929epat2J9kGtU2vszh+32Rgvs9fns
-KNmgDXVrb1k3unWsI755Y2aFvQLIc8jm5198au7ZNB3YWlSemw50q/R5gZ6Sfk/Wauv53Trm
-6jYWJo5o5vnZgDMf30dmPnl5as6awn7Bs9m7GjWoYvvsNi2qS1udn+ezLnKPGeNbik9fmSbP
-vOn3Zs/i2eyftWvskPNs1rKXHx4r/nztIPHtW7M8P/8fyw+QuifvPm9am5z780xr/7Z7Pt/5
-10tT5T2Qe6/Pp820nXewW5et59v1P31Fn9F3/Ixs+BkDxo4xtBtbq/+ZA8yF9L+h79NvzB1r
-7fbzfOZuvnnNnLfm/4IZLTL+hqycc3y3ip+xO3h9NjLrJNPIvPV81gLr96wRrBVdO9Su+B1r
-CWuKynNZo1ir8r93nfLxTFt/0e0s/WrfbnXlWpltJ2V9/vGD2Y6ywNqc7huwwFrOms7azhrP
-vVjz09ffkzbb59gj7PawwX13l+1ijzl8djvx2qPjxG9fbtFp1n06Vyw8cC+5hrP/TBndXO5d
-7GFfrpgu28bexh7HXme3/7I3skfee90g275jD7PmBTLF3ssejN2L8yp7M7LKXs2ezd7NHk6f
-WOdNzuE8y07/4Kx75Vn7Zthj0oFugY7RaS/79RrdBJnJZ6cEFXqYzfPRjRgf5C3f988/qYd8
-Ryd9Mx/Q7SrmSx79D9DGfPeg39G5Wd+d3jMb7D8ZdiuH56PTOOmh2A8YX+wVKv3AvXJsZhnP
-t9dp0EfT9YjsNtAP6L355gPfdT9/OJ+/mKsnpZ2/soHOzdrEmczyk1jnLznP861V1vnLw/mT
-dZK1mv2C/YOzJ2fQmROayjMpZ1POqGs+mKR+/txy/l7v5Qxt6Q6Aszhncg/n7/XWs8s0X9gp
-8BXNKnO2U/DnVHvrij82Xpdq+0/it5Ui1qCNtDXV5oq2b/z5Q7H2L6n5d0RqDqBXzin/vw98
-/MIEccMFvcRFp3QTi47tLHHJad3EHVf0FcuXDBdfr5giNn1zsPd7W22ijbSVNlv9zs/4GVdZ
-a8khSvj96/ni+SWjUnvb3nJv5Xc/fnBQxXnMDuyFe7evLY5b0EG8sHS0vIfq88rbtqC8rbTZ
-mjOrj0hruzvwM7Mnpq9v2BPRxyydmD25dfNqrmsw9+Be6X5sdywoHwdrvn+rfha555qBomXT
-XfO2Bz8E5zJLd5kwvKnSPsY9ubdaOw4pb7MlE8ytVc5nWHTPMUMbK++rA3s3EKvfKdcJ0+MJ
-3MAzeJZr+1eptx+91oor8YI96u8s3lw2Ud7D8hOqgGc5n43U+x+d0zrv+EG1qttvlm1v48Az
-8bkU0v+0XcUH4gbOPtY4IOOq38Mn7rf/Gb9C+t1uLiEPnH2d5D8dU8e2kG35zz8P9tR+5Cef
-XlYIBuzbQN7/ub+MrvDfOAHdms//6ZCO0mahOn9GD1FfZ5xsy3ZAL+UZbufw9P7HRwlU+v/u
-qwfa3ovzJf1HzBPnOHyZ2Eff/ttEeT7EHsOZlHMe51XOhsQEZN+H8zc2kB9S5zG7v6eD+Aba
-1L9XA/nzlv3Bvv3MzfQYD2Kgjji4nRzvdWn7I2cWzoO04/1nJ0ufMOcNa723QBs5i7DupNt7
-2NP4u52PPh2cqfmc5X9Ebsr3afv5Y51P6Tv80ZZNn3MIsWVHzmkn/9Z4952lHpNut+eMgq81
-35rN2Y+zJXOC7zJevF+2HzkdrH/YxNPPaugadv2//vO50j6DbcB6JvNh7NAmGfZhO9AvOf5Y
-BzBeVixCPpsQ/cLYYrNIj3tEX5I6X1b7f/tyi+0fH352bEc+EOPzg2LchR2seJhssN4y/nde
-NSDnby/Id8+dP6z5XdrVUmo3mDmhpdjw1XzfbQfrP5+X4auxYNnXD5q8Z87f0L2z+/+UI5x9
-BdnIvzd6B+tM9v1ZB//49hAZR5v9N84P8gy0uf1f/31KTtyFE6x9JShk+4VYV//7rzly3bN7
-PvJPm632L186XLnt+JrS/WRBgLU33Y/B/sHvZ01slbcdnEWt9t9xZV+lttMv2FqDbDtgb2ne
-uHyeEM/C+2BPtuKE7cB52mr/xad1U2o/48zzMnWRYMDezjPwz/AzOo9TWy45vVtF+8881l12
-rTmPr9gtzssPWMs4e2KbY4yt2PN8wK6h2n7uha2de/MMnhV0+4krR3fi3ypxCuntd5s/xx/a
-Ud7X2is52wbdfmtOZq9FKvPn9iv65P0ceg2yhExZsWLI2jpP9g41MG/cdFI7+X1+Sf71kzWM
-e6fr6+wVvE+QbWdNtuIAVJC+frIX5Fur2EPwzWTHXVprUVDwEptD/33zxpb9a9PKg+WenP05
-9m728LtsdCg/sQf5YBe77gR0nWz9x862MXvKnvL+djY0bIM5sU8ege7HWqbabnTLcrtQrv5v
-p8fS7zwDXdbufqox3XZA50b3Vmk3unz62ahc189s/4av5mXEwnJm4OzAGSKfDcjaK3l3ziSq
-bees42ZD4cyELZEzlPU9zlas4Zy17M6/nM2s73NmY03I5/MFxGXh+8bWjPwTR84Z0Wle3XxJ
-vwp/GDaU7bbdSn6XM2mf7vXkeZuzquXX56xNnK/lPy+PeXA/vzMWfP/s4533NvxzfC7drsZZ
-/bgFHaUfM/tsxhmftZdxJf+LfQtbQLofk72FdY/zdnquIG1zOr/zXct+Ytma7M4W6WC/YQyw
-RWTHJlh/p++IQyNunfnA2R27yztPTZLxAsQf3HhhX3HMvA7yufl8q272E+v9iUmw7EXYC9zk
-y9LX88Wt2qFSmTfbF7KwZRyd28/4or+q7ivMY8ueYNmaggT29EyfgLv92bKZEqOo8gxyFpib
-q96eJRrW9+4ryAdsTLm+AHX7/8EH5J7/88Gyq72xbIK0+xfadtZt1r/cdqm3n5gp1jjVZ7Lu
-8D32tkLegX63b7va/EkH4+fFno5d0xqHfHu3E3hWUP4jC1//fYYnu7o1DsiDdbZVgS//nQf/
-KftDdh5iPmBDs8452JKdbEy+/acbVq+RvmAP/mv2aXQNu9yhbLAXs1/xPWJHid9N971Y/mtv
-8bCptq4+YksshM/4AXQ+1n10b84PTvaaBTPapHSag+T3sL/iTyX2oOD4Aaf4jVXq/8YeyTmO
-s+jtl/eRNgHsGmce01lceEpXccOFvWRsh5d7Zvw7T/xGWWb8zBrt8THu8TNr0uNnysyl9SJO
-S47CVu5xWoUgNd61xIZvDhO/ff6k2PDtN2LjT+vFH79tEn/8IcxlLnMFcCFLyBSyhYxJWUvJ
-XEr2CpVfnzJfRWxcc4T4/YfPxB+bdPeOucxVmheyhwwiiymZjEbu154nNq1fr/vVzWUuc6Vd
-yCSyGdI6IDb9b0IKP+t+TXOZy1wOFzKaktVg9/yfH8z7PM4mG74S4pcnhVh7oxDfLxJi9TFC
-rFrowe5oYGCQHwvLZQrZQsaQNWTOyca28T+PiAJ1gdT3dxebfv3Cfp1ZV96O706PQf8YGJQg
-kD1kEFm0ldFfv0KGfcp+05Qe8VPufr8x9cy/pdajY/W/v4GBQbksIpPIZu55ABlu7n3ft5H9
-DatSOsg5+t/XwMAgF8jmhpX51gAlPYAzg63Ov/7t1DpzlP53LHGQuwqPGbHkxKHDzUk8PXHV
-xKnBWUZeEvmh8GQT4wzXKHkNjRrsLPnEyLVK58Li3/yOv/EZ8k75DnHn3APOMuJ+Lzl9Hxln
-Rwzih89PkXlbtIG2kI+gyndpECaOFOJ/b+c7C7jaA2xtfeteFcaepx/IPRz35E/A8U+cKDkJ
-QfKRqIJnwl0BBwPxw8R6wivPOvTZq9PE2o9my7j5QvPgDfxgYbnMZl8b//OIs49v/bjcff8d
-YWQ/PoCzifpZQeRxhAXy2Ig/hw8YnQGud9YEcsbCyC82sMPCPHqAvW8w9ZfKYtO6TP8+532j
-88cS5E+RU+eUWxEnoCvAjwA3LBxM5PWSQ1RorrWBE47MtQeUx/DknAPExrXnZHwOW+L358bg
-HYoLcD5wdiYvWaUumhPgiCJ3GR08CD7FqNcD9Bjy0OG8g5+VvtE9PkUHbIJ//J51Dlh7Xu7e
-nxXT+8tT+tteJCDnHF4BeDvgG0Be99l7N3HByT0kL3x6XQI/oPYG/JF+corjADhBsDfSN/QR
-fZXLbWrgG/gGM3QAKesVOoD4fc1hWTqC8e8XCOxe8IjAeQm3TD7eS+zy2NaxmxWqC8PLjF1Q
-hz0wSFCzBe4nuIXow0LXx5IHsYPZMUIb1xyxRf5/+MTs/cGAOnjU0YK7B14v1Zoz8CHBaQS3
-kko943yA8wgfYHo966QCvYA+hFOOPoUrUvf4JhbECaZfv//wWVm57l8jJ4f3uzP1tzdBwO+N
-XR7uEmxyNavn1udTRZOGu8i9D32gkDbBDQPvnJeaV3EGfOr0LTXD4YAysQYeQaxwer5AuczX
-Ehu+nZch+xu+0d/WhAAucPYluPzYb1VqX6gCfYA6cFZ9Ez/AB0/dX2J6dMtvUKCP6Wv6nL5n
-DHTPg8SAnKFMWT9M/PbZE0b39wZi7rC79+tZP4e/OWgw1+F1d+fOswc8zfDiYhfQLbtBg75n
-DOB3lzXKYzA3Yo3sM4DF2ZV+rb1JfztjCvzVcPFiq7bjFA4L6PAWn6PfeDp0AdrupZ5KUsBY
-MCZweTJGuudJbLHmxqz9H76+tZl+v+/P0t/OmAEec/jQsdXrtK1TywcOcatuo1ewdsBpbldX
-qhjA2DBGjNX3BdQOK1rAH5B+wSe46f8yjX/G71cBzpYXn9ZTckDHyY5G3SRyALD1+3kvOL+9
-1EtNGvAbMGaMnbEPpAE/YPplx9NrYv2lH/6OK/tLn32QNr0gQbvYx6kB48cWji5A7F16Dc9i
-A33EGDKWJs4YLMySfxv+IO1t1AfiTMhttWoqJQHE/ZKfi30QW5+X9+XzD90yVNSrY1/XqJjA
-mDK2JR9L5Hbpbp8GEG9DbStqKsV1v3cDcQMP3DjY1/ymZluPznW0v0PYYGwZY8a6kBirRMPI
-fwawi+M/Uq1PG2egCxAr58dXSG7ulNHNE5dH5AeMNWPO2Ouef5HDyL8EuXNP3TsylLqUuoEv
-DDu/1z2OPiEXAT+D7neIAow9c4D31j0fjfxHB+LITzuqi9i5SnQ+/KgBL8CFp/TwvMexZlBL
-mnhb3e8QBZgDzIWSyS0oYfnH5o29a99udbXPu6gweVQzmU/rta/gEqT2vO72RwXmBHOj6PnK
-SlT+V745U67zpbKvpQO+ATh3vPYZZ4h2e9bQ3v6owNwgv4i5onu+GvkPDuTUDu3XUPv80gn4
-di46tafk6/XSd6/8dVxJ+AbSwVx55v5R2uetkf/CwFn2ikW9ZC6d7jmlE5U2/3+H7beWXCTf
-vuUtRv7dpyeJ/fapr/09ogRzBh9B0fkJS0T+0eHIoy9mG59fDNi3gWebwL9emipzD3S3PUow
-d/ysl7FGCcg/3Bfw6+meP3EGeTKc7730K3kD+++3h/a2Rwl0p15d68pzkO55beTfHbdf0b+o
-+C7CRP3dqkiOPS/9u/qdWSVpS2FOMbd0z28j//mBfb/6rqVn3y8E9Nf5J/Xw1M9wbZTaWcDq
-K/wDuue5kf9MkOM5c0LLkolbCxrwZxy3oKOnPie/Pkl5UkGBOTZrYivxyycJzSsuMvnnTDqk
-b8PE5u3EBXBnzJ/exlP8C1w73TuVlm8QMNc4AzH3dM//UpZ//FLdOpbe/AsLcAF43ds+f216
-ScUIpYO1j9xJ3XJQivL/0kNjZZ0I3XOg2IC9e/q4lp7yBliHSzXGgrUPf5NueSgl+aeeLPxO
-use+mMEa4IVDj3oFxBjqbrcOMBcLrddg5F8Nj9w+TDRrVFX7mJcCsKl64dW+7/pBkptQd7t1
-YOzQJr75GI38q+HhW/evyEmrpHGsSwnEUP6gqAdQz5jc4ThxpUYF4qOJkdQtI8Uq/0b29YFa
-hqr1eNd9Olccf2jHkvPHUKfwrSf912oy8p8f6PxG9vUCXiDV3EH0YGoP6m5zlGjeuKpYvjQB
-NoCEyT+2Puu8b2RfH/ANnvWnrspc4+jCvbuVTnxQ3do7es6nMPLvDHx8lp3fyL5+UDuMnFjV
-8cMmDi+x7nZHAfjWli4eql1mikX+8Skb/378sOsu24m7rx6oPI43XdRPyobudocNuBW89IuR
-//z4asUME9cXY+Dnh1NJZSypMXL03PZF7xPA3nnjhX21y07S5f/nj+eUZG5Z0kC834fPTzFj
-mgYvZyMj//aYMb5lyfmOkgp4Add8qBbz8t4zk0XD+jtpb3OYgG9dt/wkWf7J3+ccpXscDdSA
-TRZ+cdXxhT8DG6LudocF6qk6vT+5ldQeI07KyH8mbru8v+HuSCBYr884Rp0TAz69YtXv4AZx
-qsH666dzxalHdhFXna3xnBBD+cfPt0d9w9mVVLBu33/DYKWxJq+wWPOFTz68s+PeTp0xbKHY
-T7XxCcZM/qlV2bOL4epMOoh/U82Fh1u/GLmaTkrJvxNfOPJ/4mGd5GepN6SFVzhG8s95iHrM
-usfNIBiMGNhIcrGpjP0pR3TR3t6gQYy0E3/S/30xv+K9sZ1wFoq8vkCM5J9cMcPPXzyAQ4z5
-rTL2rBPFVleIvCcn+Wf/R0ewPk+udOQ+w5jIP/EjpRIbWkrgbKtaa/D5JaNFlSLyB5ykcP4/
-YWGnjO+Q2/LsAxHWGouB/HPmh7NT93gZhAP2dZVceGQFe7ju9gYFdB83+YdnOft71FSJzBag
-Wf7Rj4ppzA3scfjsdnK+q+wFe7evrb29QeDMY7s6+v/In6Zf7L6LDzUSW4Bm+X/w5qHGz18C
-wK6jWi+HOYHtQHebC8W5J3R3fE+4UeZNa2P73ZrVd5AcN8Us/1+8Pl3WUtM9TgbRoHO7WuKj
-5e45AvCNF4Mf6JLT93F8T+J/iG/P9334Er5cMb0o5R9dsBh9PgbOOGpOeznv3ebHq4+MS3zd
-xmvO7e34jvg8xu3fxPEexMCrnJuSJv9P3TtS1pnSPUYG0YI4H/R7t/mB3ey8E7trb69fbL1V
-Jddaqip5kJybVHOrkyL/xHz261lf+xiFCWLaiYXHp8tZDj9Yg7pVZFwz+5qF3evtJOrV2VHU
-Sn0GLg3yYeDW0t3+MEEtdmqFuc2Tfyw/ILF12xlH+M+d3u+nfxysFOvav1cDT/VX4iz/2DSJ
-89E9Pn6Bf5q8VfhdiW+DD5s478vO6CVzluB8QrehBgz8rx88N1nmeH326jR5loPLhDpxFvgd
-NbM+eXmqPBu/89Qk8fpj46Uv/NE7hok/XztIXHd+H5lLdsTB7WR+HWvnns2qyTUjqWsFNYaJ
-f3ObL/AFbbdt8myB2LTd7HfkSqtyWpEjFIo/IGL5/+cLB4jaNSprHx8noLuxX8M5BG/touO6
-iruuGiBlkj2Jmves3ZzfsOFyPsOPic7q5O/xA/g1Gfffvpwv/UXYxuDehlOXtYQ15rE7h4lr
-z+stjpnXQYwc1EjOKXQJ3f3ohBrVthdv/82dHxs/OOus7vZ6BXodXLVO7/bvdw9UznNjPoZS
-TyBC+WcOHziplfaxAZU2g72FsRrUZ3cZrw1n2xvLJsixQd5oM/KnynOrA6w5rD2sQeyprEms
-DS8sHSNuuLCvOHRWW2lLhpMWfSEu3KlTU2urSm1RxqRa1WT5iNHP3OoAovd5eS90TeZjUuUf
-O4auucd5HFnHnkK+KesQ/GzIOvsp8h303h0H8E7W+oDOgF0duzR+J/qB/qBf0Hl0jAtnHLd3
-YHyop6Vbpr0A3ZGznNN7wWnr5WzDHA68rmBE8s++FDX/O/Y39GD0YepYY4/ljB34GppQ0A+c
-x+5MnW2IQ8E/z7kV21VUnBzUzMYO7tZW+ASSVE8UfRKbj9M7cZ70el9sPyp2k7jJP7axsPsc
-3QJ7O/a5of0aSv8R+51qnZpSBzoC9srrL+gjdfM2LapL30XYsXg8z61tjKGbrzxOmDC8qWO9
-ZHSyB24c7OverNdJkn/Wd+ZSWH3NntW6eTUxZXRzaS/+9BXndddADdg4n7xnhMxR69O9nlxX
-w8jPgztYpbb4ksVDEqMDcFZ3itthrcWm7+fee7Wqrsyr4IoI5B8e1KD1SfT69q1ryLr06Bb4
-0nTLSzEDGyh+Sfx22OOpwxTkWgBXnlsbsG/i39At2yqA18ftXeAH8HNvZOni03oGM7Yhyz92
-dLigguhTakawz08a2UzqjPjVdcsFehy6Kb7clW/OlLoHOvSbyybKswc2eGw2xAQsu3uEePyu
-4dLmRQ1T/s/P7LHYRvkc3IfIGb4xbBXYiImVYS8O9NxX4DtjN730jH2kXQ5bd6E+emKgyAdx
-ezY6M75D3fLtBGypxLg4vQdjib7q9xmsvyo6k275J4+x0BgVdD5yoq3zfNR8yfgGiL8iRgfZ
-RI6Jy7n6nN4yx5O4HOyLyMLA3g2kTQsdDS4HYv6Id8DPg22CmGfsa8TBsn/yM/WwOMPUqVlZ
-6tgtmlQVHdrUlLFvxIdylpw9ZU/JFcnz0KdYM1Ti6MMGNkT8XBed2lOMGty4oi6zV2C7OXJO
-O6XnDdi3gXYZd4JKTTTOBoXENrIXUn81zvJP7AZ7g993xD912EF7yXMfMTdRzGfWZfZc9u17
-rxskc7jIWSHujjhM2sRepZO3Hh2I9SfUvBAfYI1kXWLNp6+8crnV362K9Ee4PeeOK/vHmicO
-Hiv6wekd0OcKzW9iHqjEUeuSf9Ynr7ZjdAXWd3TLFY+Pd+RPCwKWT5w5Ra4Vdm8rvhY9My6x
-MlbfkBeL7q1b1t2A74v1c/70NsrnP/Rm1nu3e7PuxbkeZNcOtaVv3+kdiOUrdA9Bttw4BnTJ
-P+f+TnvVVH4X+mLiiGZyX2P/DWteEkvCGRvdnbnJWoNvIm6yng32FGL5aL9u2fYC7NScmciP
-6NvDPf6D84OKDnDFol6x5QjB98z8d2o/nOdBPIuYje/ec36WDvlnfFTye9HjONs+cffwYOwZ
-NmCtxUdwyMzyOFjO5UmqQT1maGO55yc5PpG2k+sEFyg5Ffn0d861cOK53e+H1FwJyq4cNIgt
-dcrVoS9Yy4N4FjJWUP2gEOQff7/bWo/ti/33xQfHBL6n0b/Y3y84udxXhT2N/T1pdaawEWLz
-5IyiW36DBL4S6t2Qb4EtJfu9iddU8QXwfV1xy/mADulW/4z5ia0zqGdyXvUdDxCC/GP7JDfV
-rq34iTjDohMGbb/GZ0auHrVUdNvoCgW2HfLHijlWmfHHp4I/I30vZ9xUzrX4R+Omx+HnufmS
-fo7txp9EfHBQz8S/xLk5DvKPby6fX5Pz/WuPBhuPi06Jr5X4NGJVk5grng36j1gC3fIZFbDx
-coYlpgO/KX2AD1XlPBi3mGDWMTf+fvbqoGtdYLf2laMasPwvXzpaxiakt42zAPEvQcWvkN9K
-/AzrCXpG3HRAv8CehR99XQz8+jrA/MUvxjoALw75mW7fgfsgTuc62u12dvnw+SmB17Vv1WxX
-eZbWLf/pXP740PCrBSH36MH4lNAL0Y11j3PQYD/ABhpnnoEoQSwB8Z1uNk98gZbOEAeMH9bU
-lacHG2jQaxb381J3PQz5J/aVvR7bLrWPsPMUMgeQBWyJ6BTYVOPOaeMXxAzGIZY5iWB9YE/Q
-PYaA+AzmvVub+UwYvmZiruB90SX/xOnh2yGeppAxxYaAf4dYbzd+1CSDcwt596FxO5YIiBeI
-Q91AzqIqNU7CqnWHj8uzHTAg+WevJhaxEJs+co89D/sp9h/d4xkmGCv8k3HJ6UkysB+OHtJY
-+5hyBoeP0amt+LpVOf/8AK43Tz6jgM//foAOR4wOMXleYgaTCuyjxMbqlptiAXsP+57uceXs
-67b/4fcmriOsNsBL7cY7Fif559xLzXPiGHWPXxSg3hn2DN0yU2ygbij5Q7rGlbMc8aVu7WSu
-E+MYVju4962XOdcdiYP8o+fDWa1S/6BYgI6K70e3rBQjiCmZO621trElf9st7gcQ2xG2vxLu
-IeWY2ojlH/8uPJzYvIvFb68CYh7Zo+iDJMfxxxX0KTEhusYX/+37z052bCNrVCH58Kogflql
-tkLU8v/QLUMlRwY8GLrlMSrg5yFO3fKFGtkPD+iUunKC9tunvmvsBmf/qOoY3KXKERqB/GOP
-wM9FnQ3d8hgliEUmtr1U4/miBrVEsH9HPc7EbcLl59Y+OPuCjvvLB3gUVHjVw5R/xoN41jjF
-Z0UF/NGcB4s5fyeOIAYl6rHGlwuPo1vbyOOOimMCe7oKj0JY8k8OBPFISc7B8wviFIldipqn
-0KC8ZjB84lGON/wx2LWc2kV+E7wTUbUJP4DKmhS0/BPLBvexXV53KYAcRPrdxPHrAXYWuFij
-Gm9s2DzPrV0P3jxU+giinIvUjHaNLwtQ/uHM7NG5uOP2nABPMXmOxsanD/T9jQFx66gA/h2V
-mFs4osP0+9thWP893PlBA5B/7Azw1MSdlz1MEHsCp5vu+W9wqOSYiKrGPHztbvx7xATq2BfZ
-j6hFEab8E783fMAe2uVPJ+D4d6v1bhAd8AOGlWOTDuJ4iOdxaw91XXT5vsg1DkP+Od+Sr+63
-3kOxgH1fpYa1QXSAE+DkwzuHPvb4/ahL7NYeeOWj8vtlg1xjR/+zT/mHmwneQd3ypxN1a+/o
-vr4aaMF91w8quO6UG8jjc+O4IOYvSK4/ryDO9gcnHjWf8g9vY1RnrDhCNdfbQA/+/sQEmY8b
-5hwgps2tHc8vGR04158XYAOANyto+ae+kW4Z1AU4Z8lV1j3HDfIDuzdcXGHNAWz5yLZbO6hr
-rJuT1tE25UP+4VugLp5uOdQBcrcLrrlkEDqwT3HuDmsewFPhVn+RWJg48Fchq3nr6PmQf/wZ
-8Hzpfq+ogb2X2jQmpjcZuOeagaFxbRDL7/Z8uInxD+qetzPGt8zPS+JD/lnXqE+t+72iBnXK
-fNdZMYgc1BgKI9+W+G7V+kS65yxAV8nLMelD/uH5jVvdlbBBbfuw6hMahAP4FsKITYGL2i23
-A/s4dah0z1vAepW3pq4P+Se3R/c7RQm4SD3zKhtoBzJK3G2Qc4H8PeJ53J6NbyhOPBd52+xR
-/unToGqXJgGNGuzsyulqEF/gpwky7p6YF7dcP/LeOSvqnrvpuOmifvY5aR7lHzviMfM6aH+f
-KEDuMjGOuuewgX/ACUZ8dlBz4s6rBrjmdlKHK261ybFb2/oAPMo/+YQjBzXS/j5RAH5Sk8eb
-bLz3zGTRrWMwuTfw2Hz9d/dz4Fl/6qp97mYD7lnbXGCP8k8scfvWNbS/T9g4fHa7QOsUG+gB
-dm9st0HMCXx+ef3omwHnTlzsfunAX2c7nz3K/+p3Zok6NYs77peY6R8/MDW5igWs5YXOCWJ4
-4RZyexb1bqPi+PICclX+/a5NnrJH+YfjmLwn3e8TFsjpMBz9xYXLzuhVcP4dcbxu+mDYMceF
-AJm1ndce5f/p+0Zqf5ewQL4Y+XyGv6e4wJgWwkfHnqDiAyLOPs58l/jtc9rtUf6xf+p+j7Bw
-6pFdzJm/CLHi8fEFcVCfsLCTK4c79Xaou6N7DjuBeOictnuUf/jsdb9HGCBOzJUrzSCRYFz7
-dK/na15w7qduh9sz+EzcY2LJA8ppu0f5L0bfPzE+Lz88Vvs8NQgHxKxNGO7vXA6XtRuHLjoj
-9TZ0z2M3kI+Q036P8k8uke73CBLEhlGTVXUuGdtAMnHknHae7fLkDsEj4nZvau0RY697LruB
-vIWc9nuU/2Lj+oS73S2eE+D3JZbEyH8yQR2qKh5tc9iDVOZFEvZ+QBxEzjt4lH/q1+t+j6CA
-TUg1th8+OZU6DwbxBBz9XuJWurSrpeQHZu+PU56PE7CB5LyDR/kvlrz/natsK645V43DCw51
-+Jt7d7PpP4NEgNo0qvW34AxBX3C7J7rgQZPjlefjBGoC5ryHR/lv2TRcTsWoAH+RG38TwLZj
-5TsQ1+kW/2kQT8BZoRq3PmDfBvaxcll49ZFxsfb3Z6N182q57+FR/oPMpdIF9oE3l6np/eef
-1KPCbgSPioqtwCB+wD+vEpdP/UZbP3kW2PtHDGykfS57AX6unHfxKP9x93G6ARsQMq0yZ8jj
-rFZ1S00z+KRV8r8M4gly4NzmB3qhyr0evnX/xMXBw1mf8y4e5T/qGoZBA91OJcYPnr+uHWpn
-fJe60u8+PUn7PDbwB+LznHyAqnG+zJ+929cOdZ6GAfa+nPfxKP+636EQoNtRn1dlrhx/aMec
-+jGcfWxjqA0SAWqC5duzsflRL1vlPuQT6eb09wP27pz3KRH5R5bnT2+jNL7U8bWr1U69I/yA
-uuexgT9cfmavvL46bAMqeiE8kOgJuuezX+S8U4nIP7YPlbM7cyBfjAO2j6vOVo8VNIgXsOtx
-Bs4eV9Z6FU5PQM2vsOsKGvkPFuhqrP0q47vouK55a0aQQ05NGd3z2MAfOPtRrzl9TJFl8vtU
-vk9+b02b9SMpCEL/T6L9Dzueiq8fn6BTvRbq/yyY0Vb7PDbwB2x72fXq4QaEr9ftu+T/9u/V
-QPtcLgRB2P+S5v/D3gMHrNv44s+dqlDTbOzQJtrnsYE/ULMnPX4N3+5LD6nlfZ53YvdExfrY
-IQj/X7b+FHfY5jzY4K6rBijpdsRQq+wXBvHDmg9nV8QA4ge84GS1OJA3lk2Qvl/dc7lQBBH/
-06JJvHjNncB6rcLdAKepqm5H/kPeWkoGsQZ5/PvsvVvFvqAa/62iFyYBQcT/Jin/5+AD9lTK
-14XTSJUfkroOhiskuUD+yeVS5XilfhC5YrrnchAIIv8nKfm/2Cneeco9Vo/cPvpF9b7wKN9/
-w2Dt89jAH6aPa6k8ftiD27b0zxsYNwSR/zusfzL4P6j76Jarh25wyhFdPN13px23lfFfuuex
-gXcw3uwJKjmc5HnB96B7HgeJIPg/WD91v4cbsOuq7P3wwpLT4+Xe+ADhQNQ9lw28wwt30xWL
-eiXS1+2EIPi/jp7bXvt7uIG93y2WE1sQMf5+7j9pZDNTF7CIgU8QW7nueRw0guD/xGei+z2c
-wN7Pvu42xq89Os73GFMDWoUfwiB5+PatWYk543rFpWcUzv9NfTPd7+GEudNaS64HpzEmlsvv
-3g/wIavyhxgkB8wLr/agJCGI+h/EUOt+j3zA36+S34vs4gPy+xxioJYuHqp9vhoEB2wDD9w4
-ONG5PW6wzXHyKP9wYMc195kaD8TyOI0zdgF4nQtdZ7zUDDCIP/ADO+V+JB1B1f+klhJ58Lrf
-JxvY5YnhdRvnj5ZPyckB8YOj5rTXPmcNggG13uGF0j2Hw0RQ9b85IxVSSzEsENvwzxec67P/
-9uX8wOoXjhna2NXOYBB/JKV2V6Ho2LamvU/Mo/zjN4tjDaBzFLib4G5p0yKYtatH5zrKMaQG
-8QQ+XGpA6J67UYD9yraOoUf5J3YK3Vf3+6SDnCS3PE7G+rbLg/NdwAH1+F3Dtc9hA/9g/JKe
-06sKfP+2cY8e5Z9aqted30f7+6SDPJ9fXeqzr/1otu8a0HbABko/6J7DBv4AF0iSefy8YvHF
-/exj1jzKP3j6vvj4AMnzuVPB7gdvb9DPRg8ycYDJw5crpovunepon7tR4vklefgNfcj/Jy9P
-jU3NQ/b0z16d5jje6CwzJwSft0BdMOLFdM9nA3V8996BMg9G97yNEsTE5uWs8CH/6TwqukEc
-n9uYsz6EUZ+d3FDiiHXPaQM1UNMlSfU6gwL57Xnr1vmQf/ivDhjTXPt7cX574m53G1xQPr9s
-kAts6gEkA/h+j1vQUcaJ6J63UQPdN699zIf8B+lHLwRD+jZ0rceJzzNMzqIzj+3qKa/UQA/w
-D6tyPBUb4KvIy3ngQ/4BvhOd70Q84xnH7O067tj9wszjJhfY5ALGG3B4JY23Okg45sT4lP9/
-vTTVtpZKVICP9YWlY1zHnpqPYbYDG4DJBYwvbr+if6JrdhQK4n4d7eM+5R87Knnwut5rcN/d
-7eOZ0vDD+wcVlOenAuIAliweon2eG+SCfD7mv24Z1Al4rb9PyUHQ8v9rgTn0hYD6XCq6/5+v
-HRRJjXZqgrmtRQbR4tE7hol6dUpb9uG3WXb3COcYFZ/yj83r3usGaXkv9vTlS93rNU4e1SwS
-ey98MSq1RQ2iAXX6qNWuW/50gjn58YtT3fvLp/yDd5+epCUXuGeX3Vz5/eABCFv3t4COqcI5
-ZhA+qN2etBpVQaJGte3FuSd0Fz9/rFijqgD5J/YNH1yU78d5WyX3/u6rB0r/fFTtuuXS/bTP
-/VIG+ih27t1qla7OT06qil4clPxTPwn/d5TvSK32h2/d3/W94CnfeqvouJzIQSLHSLcclCI4
-3+KPLlU7P3YOapgTl+u5/wqQf0Bt3SjlrFmjqs72zFXl8cl7NqsW6RiQg+zGP2IQPMjtwM4f
-Rnx33EHu8n771JdnHt99WKD8/2P5AZHVBKRm67j93etvY/vlHBT1eDx0i+EEjRLEod58ST9Z
-1163LEYNOLiIwSWnoaB+LFD+4cBaMKNtJO+M30+l9tax8zto4Sil7ogbD4FBMICHjvkfVy7a
-sIBNG477t/8WUMxZgfIPiLGK4t3JY/z7ExMc24I+GCTPhxdQS8z4AcODlWfB+Q4+m0oxkMeo
-QL49HF6B65gByD/xr1Gct+Huc6vZjk8yCH5fvzCcYOHK/jdvzJS2Vt3yGBWwrcFNjH8pFPty
-APJPu8LOqyaOZ9rYFq5tufHCvlJP0DVeh85q67pGGfgDfKujh5QOdwdxLvCTwlcUWr8GIP8A
-frEw/QDk8NEXbu2YP72N1hxvOAkMJ1DwINerV9e62mUyCsDXQf1hpfi9mMg/ZwA4xsPqE2x/
-bmd/eEl0nf3TgT/KcAIEB+LMWzb1Vqc9iUB+yFVG7iObPwHJPzove29YfcOZ3s3XwfoQh3ky
-fljT/HwLBsogpwobvw5fbpTo1rGOuOmiflLPx37tt7/wiRD37omTNiD5B9TfCuvsTT6D2/Nv
-vWy/WMSA7VxlW8mPoFt+kgxsSvOmtYk0tixqDOqzu7j/hsEynq0QuQfwUM4Y31I8eLNH/0CA
-8g/HaN8ewevf+Hmo2en2fPKR4zJfLjq1pzkD+AT678DexVmPDx6iWRNbST5ucnQK5Y9nnTz5
-8M5yz4GPw40LO0z5B9RPD9oviz3PbV0jFmzs0Cbax9cCZzna5NRmxh49weQNbOkP8tWbNNxF
-+/gFDfzjcBB++so013mhAs5G1L1o3bzc747MnX60OydG2PJPjXFi4YPsO+Kc3WLrWffIf9I9
-zhZYs8hDd+svaghh1yaOlVjKUtUZOLuiM0XB1xIF0EPhx8MWRL7auoDiQpF74v2J+09/HrFn
-Knx4Ycv/718vkLwbQfYlOT/Y9p2eS+4nn9M97umYMrq5a39RTx37D59HZ8CPCm9ZKdkPV745
-MxZ88oWCWGRslft2qysuPWOf/DU3fAC+i9cfG59XtqaObeHvLBGw/APsgEHa4Yb2a+j6bthP
-45YDRq6yih3wrD91lf5N63voiswfdJqg9o04Aj2YdTuomsw6gG4K/ws6HLnw+MGD1OHIJ8Gv
-BY9tvlwHOHjguvP1jBDkHz02SD/8MfM6uPYp9kHdcyEb6IDYZtz6i3pq1jkuHeR6nJT6Put+
-sdkIfvxgtjjvxO4Z614SwLmOdb1546rSJwXXDvJZqP3eToaoaX3IzLauPDbY/XznAYYg/4A8
-vaDyMtGJneQfXTmM+n5BgHgEtxol4Mg57cQ2W9v7LtBrsBmT+/HVihmJtxG8sWyCzGXRPTaq
-IPcGvnn2eGJc8DOHxfWALxAbKPs9Nn23trE2XHnWvv6fGZL8c64NKh4wb+3StGdFzUOmCmrO
-XHuee9zyB89NlnytTveyckEYb/acpOUas6fdcGHf2Nv32d/Rx+DOJteW/sa2prKO+8UXr0+X
-cY7Uk/GybxIrDBd/3OQfcB4q1J7L+oZ+7PQccqG7pPpB97zJB/I4VHw+8Cio5i5gI1h44F4y
-foS5o1u23cC5mLy9MGsxeQU+M+LVsJ0Tt4K9Fv/1bZf3F6/8dZy0w4bZJ9jKWcfRlVnXvfYN
-soVPsaB2hCj/5GrSt4WMEXsF+4bTc6gB6rZ36gR6nIp9Bh3Aa70K4kmII8OGiC3Nra+iBnbr
-e64ZGDkfWzrQweAFxc7IWZk9Fq4W/I20Df0SW2tUeZvs10sXDxWHz25XUB1tdBR037jKP6A2
-Rr5zrQp6d6vnOi7EQcS9vhv1ilRsROQP+42fwv/JuRrfAfGg7C+65Z8zCpwI55/UQ8anYOfA
-lgGPGzF+3TvVkVxWtB3Ofnzm2DtYM7GtYx9EfgE/ow/yd/xL8F6yPyDXXTvUlj5x8oOxBR12
-0F5y7qG7I+PsEa8+Mk7GFmJ7DNpe5wb8V4wJ/YDdsNC6RMjUouO6Ft62kOWffIRC/PL4Nd1q
-6zDf417XmfmqEpvNWadQDmtkBZmYMLypzCN968n41CdEH4C/hxxpYuHQeTgbIJucsanXih6D
-vMIt+9fb9pfxM4CfWUuIqyIGBq5r9HR06PeemSx9reicyDd+00Jja4MA4wknBWcLxiQovjJi
-7Ao690ck/4A1z6984v9yi4WB+1i3fKuAvVll3znxsODeh30U3Zt98eLTekrbe9L9B3EHaxA6
-KXoI3LhBx6UgS5xdAmlvBPKP3dTv+Q/buZPMsJ/MnpIMPij0VZXaBehM8IgE/Xx0Z+6Lnkxc
-wtP3jSycP9ZAglg/OLqIY2SfDzNnmZrTgY1bBPIP6Bs/74qdxGm/QgfiLKlbtlUxcUQzJV8A
-59Yw28EZgTMJZ2/yRsk/wKcdB505CcAmRVzWBSeXn+dZV7FBRcFJCt9uYO8SkfxzhvfD3/Ti
-g845DZyv8J3olmtVoAOwprn1F7mhUfk0iSvA54zfGzsaNkj8FZzP42BDjAM4g7I+4huE65J1
-E98h62iU84e42kBrTUck/wC7jZf1kb59/9nJjvfEtrV3+9ra5doL0AFU9Dfi/XS0j/UAOxVx
-b532qinPV8TtUOOUOGTOY+hkxWhH4J3QgVh/mVvEnvL+nOPpD/pFl60Z2cE+Gug7Ryj/6L1e
-4nTRT924T9EP4sD55QW8F7Febv1FziNrhe72VtoM4lOorYsPHT8eZ7qXHx4r8/ewt7MvsU8i
-P3FeG2gfeg3zEfsRMbfIOmOC7ZVYUvR5ZN16d91jAFiHguAO0CX/4KPlU5RzA/HtutX6I1Y6
-ifWescdj53PrL+z1cctrzAa2LvZH+FfgYCIXk3F556lJ0haOzkBcEusZ8sYcRv6CtjVYezdr
-EGsRaxJ6FvZn7ET4/vExEg9A3Bx7EbGZnMkKiVGJAnVqVg6HDzhi+Wfc8dervDNzyi3vDR1Z
-J9+/X3C2IY/Erb+wMxHbp7u9fsD+ybzFXo2NhvoN5HLiD8Ynft/1g6SfH5nEh89ZjzM2dgdi
-mqmlxPphgZ/Jf+Jv2H3YS4j9JnaAeAB8K/jdsJ0S+0OuzqjBjSW/AvGhKvk0cQXvFIotJmL5
-B8R/ENfn9s7wKLjFs7KWJy2H1AK2HBV+APRriyOkWMFagX8SGyRrBrGA6ODogMSPkX8HB3TD
-+jtJfc+KEyQmMO57d6HAXxta/rcG+Qfoh255TvhVsMM43Qf7TNxj/5xAHIeKHkxNgWLhxjJQ
-B2si8ZBhyaEu+UevJbbP6d3J03Dj/brq7HD95GGDfQ27ult/cY4lpl13ew2iBbw2oeYlaZJ/
-QMyUE2cnfla3HHf2T91jVCjI+1XJ5ed8XEi+mEGywPk31Np/muUfLFk8JK/9jjgUN/67pNrG
-0oEtkDwXlf4iTi8oXiWD+AKfSuC1vmMo//iCTs5zDjh6bnvpL8r3Xc7N2Hl1j1UQIA9WJZeb
-9RB9QXd7DcIF8zoSDmjN8g/w68Bhkd0H+JKdzj7EobnZEJIE8rlVbIH4vZIW82igDviu8flE
-IXtxkH/w5D0jpH8nvR/gYnKKdWZ9/NMhHbWPV1DAP008nUp/EZ8P77PuNhsEC+zB5GVGJXdx
-kX9AXFA61zE6UCnJPyAuQpXXE96DOPHpGRQG1n/4WqKUuTjJP7YAbP5Wf+D7KDX5B6q8TsS1
-xpX32MA74EeNvO5TjOQfYAuwfIKluP8DYtrc8p4tEP8adz5tA3fss/du0Z35Yyz/AF43YkCR
-bSf7H/HQSeH+8grybt1iHy3cffXAROZAGJSDOGdq/eiQtTjKP8AWAF+s01kY+z82Qt3jFwbI
-wYffX7W/8KGa+ODkgXyHQPl8ikT+2dvJBXM6D5HvSY0R3WMYFojzIb9Jpb/wG8KDFpdcdQN3
-EPfFGVeb7MdY/lVBDUnd4xgmONvj71fpC3LcTVxAMkDOGvwDuuUn6fJP7STdYxk2yINU9Qm+
-+/SkULiDDYIFfptYcC8nXP6vv6CP9rEMG+TGYwtV7RM4NUxsUHwBlwN+Lt2yUwzyf8eV/QOr
-qRJnwHWhwhdkAZtS3GuilSLgQkJH0y03xSL/f7lpSKJ5nbygeeOqynEBAB9K1PzUBrmwbLLw
-1Grz8xWp/D925zAZK6B7jKMCXFDwJqj0Df5R7MtJ5kdKOizZh8MM/nvd8lJs8v/cX0bLnAnd
-4xwlDpzUSpkPDrvhUXPaa29zKcKSffLaqF2qW1aKUf7hje3Ytqb2sY4S7OfEPanyQsG3Om9a
-G+3tLiWky75KzUcj//5AjBA8urrHO2oQ63fNub2VOfT//e6BYtbEVtrbXQpIjOwXgfwT8wLH
-u+4x1wF8Aiq1BC1Qb2Tq2Bba210K4LwfW52/iOQfwI+MbVz3mOsAPPlebMroAVNGN9fe7mIG
-dv5Y2vqKVP4BOYN7Nqumfex1oFWzXcWHz6vFCANqqk0epb+uYDEC/37sfHwlIP+AXPioambH
-DZ1T701tLNW+oq4SZwHyDHW3vVhAXF+sYntKTP4BteGoNVeKeXDwxWMPUe0r/AfUlC2F+Mkw
-gT+GeP7YxPSWsPwDeLHY20ox9m1g7wbS36faV+RQU8vb1BTwB+YYeXyxyOUx8p8BuMFLkRdn
-+IA9xI8feKsXSR2VUuyrQgB3h/b8fSP/jqBeDjVjdc+VqIFPFDufl7664cK+ol6dHbW3PQkg
-x1orb4+Rf2XgG6C+ju45EzVGDmokvn3LvaZQOohXadGkNH2pqoCrM1E2/hKXf4BtnLj59PoC
-pQDOAqr5QhaIqe7Xs772tscN5JnC0a2Fp9fIf8GgvgA5sdl1hood1FbzEh8AsGWzXlq+gVL0
-p6QDHrbLz+wVPT+/kf/AQa0x7OS651SUwDf4+mPjPfUTuYPwK9aqvoP29usEvr1Ia3IZ+Q8d
-nAdOLjH/ADUF/Mzje68bJPZqVV17+6OGZd8vKn3fyH8FOA8sWTykot5QKYC8lAduHOy5r95Y
-NkGMH9ZUe/ujAvrSgzcPLT5938h/DrCPnXhYJ1l3S/e8iwJwg5I7DD+Ql3764f2DxNnHdytq
-GyrvRt3JL1d4s5kmFkb+Jf732Tyx7O4Rsv6u7jkYBVjrOP841Ve0A/shea3tW9fQ/g5BA241
-cklVeVWKAkb+M0DcHD6CmiVg89pm60pixviWylxi6WB/nDutdVFwC6IPUXfbTz8kHkb+c8Ae
-R80dZEP33Awb+PU46/5j+QGe+wn7yZ+vHZTY+ErenXrzcEhRb073vNMCI/95gW4Mj0OvrnW1
-z9WwgQw/ftdwmQ/kpY/4PLrAtLEtEqULwBn3zP2j5Bqme55pRfb1xx9Z8r9Qfxs1g3WAPILW
-zaslao57BbE+F57Sw5fNGx7C+64fJHmY4tpHtAt+DuL2vdo9ihMLc2V/0/9tyvjd6mNj0M54
-gLxi4mHwoXF21j2fw8IBY5p7zhuwAP/AobPaxspHwFiR03DRqT2Tm6cbBlYfkyX/v20SG9eu
-z/jd92fpb2fMsOrtWdJHBO8WPLy653cYIN6HWCG/5+JnHxgl+vdqICrvoI+DgbGBE44a8V54
-UUoG3y/KlP+NP60XG779KuN3axfrb2dM8c0bM+Xcov5AMfJnsIezZ8IV5qd/OFtfeda+0le4
-7TbRrZO0Gz40YhX86jElgbU3Zsr/hm+/Eb99/ljG7355Sn87Yw70AeqQY1MqRr8hcX/kBPrt
-H+yDx87vEDpHM3kK5C3iy4PnWPe8iD1+eTJT/n/7/EmxYdWczDVhpf52JgTYB+66aoCYNLKZ
-PG8WU84cNg/4QXhHv/2z4vHxMmagUYPg8i+x6XEOw2ZxzzUDxc8fm/O9MjZ8nbX/r0z9UtQQ
-f2SaAMV3Z+pva4LAmZm6hNTo6tujXtHkGOEfoIbQa4+OK6h/sCvgdy8kboDcHOL1Tj96b/HC
-0jHKdZAMNuO7MzJ9feUyXyvVt5XE7z98knkGeFp/exMKcgvQCeZPbyPtBMXAt92mRfWC4+Ww
-DZCH7UUfwI7Puf6QmW3lXl8yMfph4Je/Ze7xv//wGbIv5X/jTwsy/rbpf0KsPk5/mxMMYsrf
-XDZRLL64n+TVSHqtEuz6Y4c2kTJcSL+Qd0EczjHzOsi6OXbPwmcP784tl+4nazwY332BwKeP
-TKdfG9ceViH/QlQWm9avy9QBntHf7iIB+yZrAXEoC2a0FR3aJFcvgEvp+EM7FrwXsz5yrjjn
-+G6Sq7HdnjVkHMGdKd3prScn+vZBGNgAm37G/r4en39lS/436wBnZXzmj41CfH++/rYXGbCn
-EXtPTh2+xMF9d08c3w56Odwi11/Qp+B4WmIPP35xqvjguclG5sPA9+eWy3Lm3n9Ouuxv0QHW
-/ZR5Rlid0h2O1v8ORQr2QPzV1JCCc4d9FX9WUtYD6hGzfhV6JjAICauPEmLDqqy9f93P2Xt/
-xRqwaf0YkX2tfzd1r8P0v0uRg7wa+PeIW/vXS1Nlbg6x+fi50I132Sk+8bXZwDY/ekhj8cpf
-C/MTGASJhSnZfSdHnFMyPs5O9ivWgI0/L8n5zrrXhFkDoge69S+fzJH1vT55ear0o113fh9x
-1Jz2kuebmF1y2XXU8yPWtk7NyjLWb1j/PcThs9uJv962v8mviwUWlsts9rXxPw86yf6Wc8Cv
-n9nqAeYsoB1weHFmxia+LqUvEIv43jOTJY/NHVf2Fxec3EMcPbe9mD6upZRLcpmxNxKfVH+3
-KqLqztvZxubyO/7WoG4VaZfnO3yXdQZeBOz1xAbj22Qdev/ZyWL1O7OkPZ+2IPclm1MfJ6Dz
-2+77v36R+m8VN/nfvAbUF5v+tybnHtgDjE3QwCCewNa3YbWN7EtZrq8i+2lrQFPbNQBbIr5B
-Ex9gYBAPIIvE7GXb+bfIflMvsp+pB9icBcrvW/5MEytsYKAHyB6+/ezYnkyd39O+b2sPsLMJ
-pl/kDNEOcofhD5AcIoZHyMAgGCwslylkCxlD1pA5p6tcZpXO+0rrAL7B7PgAc5nLXPG6kNGU
-rAYl97m6wE9n5cQKm8tc5tJ7IZPlMby2sT0hrAMLZN5gdu6wucxlrmguZA8Z3Lg2dUgIX+7z
-rAU1JIcIPEJwicEnCKdoNq+wucxlLn+XxdOLbCFjUtYkb0+NAGTYXOYyl7nMZS5zmctc5jKX
-ucxlLnOZy1zmMpe5zGUuc5nLXOYyl7nMZS5zJfz6f9KvoLY=
-"""
 
 def get_app_icon_stream() -> BytesIO:
-    return res_func.convert_stream(_app_icon)
+    return bundle.convert_stream("app_icon")
 
 
 def get_app_icon_bytearray() -> bytearray:
-    return res_func.convert_bytearray(_app_icon)
+    return bundle.convert_bytearray("app_icon")
 
 
 def get_app_icon() -> str:
-    return _app_icon
+    return base64.b64encode(bundle.get_stored("app_icon")).decode()
+
+
+def get_app_icon_compressed() -> bytes:
+    return bundle.get_stored("app_icon")
 
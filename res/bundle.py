@@ -0,0 +1,128 @@
+"""bundle.py
+
+リソースバンドル（make_resource_file.pyで生成したバイナリファイル）の読み込み
+
+* ファイル構成（数値はリトルエンディアン）
+    * ヘッダー: MAGIC(8) + エントリー数(uint32)
+    * エントリー: 名前の長さ(uint16) + 圧縮種別(uint8) + オフセット(uint64)
+                  + 格納サイズ(uint64) + 元サイズ(uint64) + 名前(UTF-8)
+    * データ: 各リソースのデータ（圧縮種別に従い無圧縮またはzlib圧縮）
+* ファイルはメモリマップし、要求されたリソースだけを切り出して展開する
+
+"""
+
+import mmap
+import struct
+import threading
+import zlib
+from io import BytesIO
+from pathlib import Path
+
+MAGIC: bytes = b"PYSSRES1"
+HEADER = struct.Struct("<8sI")
+ENTRY = struct.Struct("<HBQQQ")
+# 圧縮種別
+COMPRESS_NONE: int = 0
+COMPRESS_ZLIB: int = 1
+
+BUNDLE_FILE: Path = Path(__file__).parent / "resources.bin"
+
+
+class ResourceBundle:
+    """リソースバンドル"""
+
+    def __init__(self, path: Path) -> None:
+        """初期処理
+
+        Args:
+            path(pathlib.Path): リソースバンドルファイルのPath
+
+        Returns:
+            none
+
+        """
+        with path.open("rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self._map.close()
+            msg = f"'{path}' is not a resource bundle."
+            raise ValueError(msg)
+
+        # 名前 -> (圧縮種別, オフセット, 格納サイズ, 元サイズ)
+        self._index: dict[str, tuple[int, int, int, int]] = {}
+        pos: int = HEADER.size
+        for _ in range(count):
+            name_len, compression, offset, size, raw_size = ENTRY.unpack_from(self._map, pos)
+            pos += ENTRY.size
+            name: str = self._map[pos : pos + name_len].decode("utf-8")
+            pos += name_len
+            self._index[name] = (compression, offset, size, raw_size)
+
+    def names(self) -> list[str]:
+        return list(self._index)
+
+    def get_stored(self, name: str) -> bytes:
+        """格納されているデータ（圧縮されたまま）を返す"""
+        _compression, offset, size, _raw_size = self._index[name]
+        return self._map[offset : offset + size]
+
+    def get_bytes(self, name: str) -> bytes:
+        """展開済みのデータを返す"""
+        compression, _offset, _size, _raw_size = self._index[name]
+        data: bytes = self.get_stored(name)
+        return zlib.decompress(data) if compression == COMPRESS_ZLIB else data
+
+    def close(self) -> None:
+        self._map.close()
+
+
+_bundle: ResourceBundle | None = None
+_bundle_lock = threading.Lock()
+
+
+def get_bundle() -> ResourceBundle:
+    """リソースバンドルの取得（初回アクセス時に開く）"""
+    global _bundle  # noqa: PLW0603
+    with _bundle_lock:
+        if _bundle is None:
+            _bundle = ResourceBundle(BUNDLE_FILE)
+        return _bundle
+
+
+# res_func互換のアクセス関数
+def convert_stream(name: str) -> BytesIO:
+    return BytesIO(get_bundle().get_bytes(name))
+
+
+def convert_bytearray(name: str) -> bytearray:
+    return bytearray(get_bundle().get_bytes(name))
+
+
+def get_stored(name: str) -> bytes:
+    return get_bundle().get_stored(name)
+
+
+class BundleImage:
+    """リソースバンドル内の画像（wx.lib.embeddedimage.PyEmbeddedImage互換）"""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def GetImage(self):  # noqa: ANN201, N802
+        import wx  # noqa: PLC0415
+
+        return wx.Image(convert_stream(self.name))
+
+    def GetBitmap(self):  # noqa: ANN201, N802
+        import wx  # noqa: PLC0415
+
+        return wx.Bitmap(self.GetImage())
+
+    def GetIcon(self):  # noqa: ANN201, N802
+        import wx  # noqa: PLC0415
+
+        icon = wx.Icon()
+        icon.CopyFromBitmap(self.GetBitmap())
+        return icon
@@ -1,9532 +1,40 @@
 #----------------------------------------------------------------------
 # This file was generated by make_resource_file.py
 #
-import sys
+import base64
 from io import BytesIO
-from pathlib import Path
 
-sys.path.append(str(Path(__file__).parent.joinpath("..")))
-from myutils import res_func
+from res import bundle
 
-#----------------------------------------------------------------------
-_snd_success: str = """
-eJw8ewWUFUfTdvvIvStIcIKF4Bo0SHC34BAsQYO7uwR3CE4IgRAcgluA4O7B3Xf3yly/I91/
-777f+c+cvtMz01JVT/VTVRy2deMGDd6UU0GH2u3r9xk0Mn8yAAACBOrtAiB5PwIEJINmjdu0
-zSXfN27RoGXjNg3aJsp+sx9H96lYpXSFiqXLlS0Lev048sf1chVLOMISthCCy7spQiKS0Qx5
-eURaxpUiW+r/PX0U78UHeaXJ5/9daSIg/CIsr//NCwivfOuVM/zy15C/6XefHOfNWCXl/99T
-xWfZ98rvAflsyF5Q/qavEZK9sIiJqJQoLiVzpISOfI7Luy1/YxnrBuW4gPz9JK90mT7K652U
-76Psf5btk3z6nCHxR/FK9j/IHdOl+pSxu0/uF5JSBeUYn3yfLoeRsW/6ukaG1OnjP2Ssmt58
-cmZYvgnIJ69c1SPvqbKlvw/KFcNytah8Cssv6RpFMywSlf2olJhLXYC0txAQKEAICswMqxNg
-CyzfA4khle/T+1wgwCSSmsQNy7fpPSZn0Yy7W/aSgUu2RJCQ0ZLkb/rlzrhU2XOBLPJtNqCD
-zHJOZvn8hZydJFdLn50omy4vDWTKmK3JXyzfQtkT/ydRVLaQUKWULimRBiJCke+gbLbUy5Ja
-puuXfqUjFZSoGPLuly1Nap1uiaAcmd4CssUydEcgJnWOSSzNjHcReQUy7tH/65uyF5e/6f5k
-ZeDN5RrpeIcz7JiSgXdI3uMSkYhs/+t/li1Ffk/3n1S5+xvxNsMnUuToVNl8GYh/lL8v5dfH
-ctxDOfOxnPFUznwm93klJfwspfPIfpqU0C9bKEM2M0MKCBxpmajELSBHBjMsocqmSAtRaTlV
-YkUAlyPTEU7H1ZE9K8NvAUjH3pZPsQxfsDLOWvppi/+fnpEMuQ0pcVBK6Ui9hHgt930n21s5
-4pWc90HOSJHfPsrx/7NvPMNudobdvHKlz3LkB7nTR/nuc8ZsLp7Id8/krPdSondS4jdS4s8S
-T4/QgVfu4s/Y25RfIxlvmERdAXHhBmH5bMrGRYJ8R2VL1yFdR5bhlwDwDO5IZxAoZ0CJMAbp
-loplnCJ/BpbpaKbjZ8k3VsYZNuSMz3Itjxz5Wa73Ukr1Wq7/Ts5+I58/yfdGhlaOnONkeEe6
-X6TvQTKsnyL1Sh/9XD4/lf3Hsn9X+ultKflD2X8pJfwkx/nkboH/kysdOyHlsmWj8kuyXClZ
-4qjJvZKkrtmlrlnkyCSpVxZ5NrJknKxk2csqT4Vb6osyECby7KTrns5LhtwvJFcwZT+WoW1A
-9tLxS8fumdzvqZTwhRz1Uu75XkqVJnX1ymeP7KfI8/A5wxbRDBYNSt8LS/zS0YbggZT/hlzt
-phxxK6NxcVfOfCIReSZXeSkS5Wy3XAkAf4aHkQz5EuUJ/lLqkUdilVNimlfqmEfq/oX0x2xS
-kzwZpz6dC1wgh9TFJeeoUr9skiUSZQMgHXG3XCFZzlYzuACDdMTTeckndUo/058kKumn5r2U
-NFW2N1KXx1L/pxKp2/L5vLTHXWmf53LcW9lP539DnsqPEqsUcUOOvCP1fJihEwHXpHVuSH3u
-SBRuy/ZYtvcSjTfy3ScpQ0iuHhHpUS5dKlOkx7ysGXoKUUh+zSotkE3imFu2zFKnQnLkl1KL
-LBnoISm/yDhrqRkslH46009cOuemSskCGczhz+ilxzKPRCTdX31SqrBcIyTyS2tnAa/kPs/k
-/Ym0zgeJ3/8wjkgb+DPi1+eMuJGW8TYs8TKljongP+mXtyQSDyUS1+Tee+WqF2W7KXd/kGGd
-FHFf7vUgg6N06XFUWjsR5JcoVZQWgJJbikjti0kkCsivxTLOiSnPZDrPlALlQVVQHZSWY8rL
-8SlShjKgKCgMsst1oqK4XOmjuCrSfTj9DKWzN5NrXxTpdv1aruWSc76Qklhih8TmucgE1ouL
-It1fP8g9EuS6tUFbied/0sLZpbfEpMU10AwUANtELzFF1BQdRH6xX4yQ+u+TfnpTVJUWV6Su
-S0B30FD62EtxUOLnE8fkPaeMQx6J+oMMXkPSKhFRAwwCBUFTsBzsBE3Azxn7tgEjJMZfge/A
-T6AOaCG1/lr6b1QcEn+IglKn+9KHWknJBoHW4JG4LhrLnZqDBuAeeAhugFdyTitwUmLwtWgs
-NSkmbVgM/Cv33CulnCC2S7bMC7qKGWKLlOm0XKu16C4Oi13yWirXKg5OiMUiyi/xmiKHHN9M
-zAb1wXy5/lxQS0pyT2raW4wBNaQ9HolmUvrqIB/YJZZLLghJy74V3UFfiWJOiVEBeS8FRomV
-Yik4AP4Cd8EF4AdvAIQ9wGCwACwDNUFd4AWfwSq5eqr0pnQ+nS7tuQtsBlfBTbBGfomBANgK
-DoIoyAQ1afsaoqfYxG/x2zzGifSAk9JzKoNp4Dfpe8VFX5FP2uyl9MBq0pLp8Xi/tNuPop04
-z4/yiaKV6CwxeyS2SUxGivLiAR8vSoqC4hn/WuIWE+ukHXpKXa6JcaKuqCW5ISAuS2/eLuqC
-ktIjvgS9wAB5UgMS65ESjTagDBguba/BRmAYqAg7wjFSM01+8UvJa0hsPoN34Aw8CE/K1g40
-ApvEnAw7HxGrxT/SKlelVZIl+zSQuBnSS04BU/JWceljz0RrsALMk2ekgVgm5c8u1oh01qwn
-2b8g2CZX7gnWStQZbC2GiPX2CjvR9lhtQBUwSuug3XYtcylsP30l5kmLfi3usxXsQ+K+xG2Z
-BmQq4/7oWsAasg6sIFtMBpOhsBfMIc8GxPlwBXWAekzn+gb2kr2xvrJprH7sKc8l8rjHuV/n
-7ppH5OuY3529RPbWCf0Smik/KjvBRlDFymwdjkyP/Pq5xud/njd7Ll5sfAE/Hf7YJ1AqkDn6
-OjItWDO4NbVP6qiUYSkhf6KxKbAn0Cc4P1ghPi6+23xjFgi1CzU3fpfvPQFqNDTy2XPtMpn/
-zlw6z4o8L3MVy136i65fdNC76yWkBx4WB0QLXAnXRMkor3jCa5iP44NiJHbXnmzfhUPhDdKW
-JNE/yEU6gE5VKirbtJnaVdd5V3lXRddV11tXqYTvE+64I+5/3CwBunu6V2pvtK/1yfrvmQtk
-MbN1z54ruVlyMbWNWpM34zWDBYPM8PprhwqGTgXGBQYaZY0i4UiodOCRUcnzMa2mP7s/j++J
-d+Xn2p+nebp73oeuhlYFfgq89j3xDTOWGt97OnieemzPyVje+HOnAm9tr7EPSjZZgD9hBXVG
-N1gdpVHSkaQ2iYsT87hbuae6fnOtQ6PRPLOT6ZPxISe5jXeKeuI9WoeuseHsovTJmc4XzhpU
-FxVB/8JbeAKOJVxNWJrcP3mne717a/LF5ImZ92belxBKKJi8KHlI1ldZjYSGiae0TPrkpDtJ
-fyQ8TZhL99HL5CVpCWvCv6LTouvDE8O5IoFwV19h3zJPR09C4KLxn2+KL7/3iqdpIGyUMZ74
-A2n70p56tnkme5t5N3hmeBKMzEaDUNdQ/fCIcN74j/H51i1rmxk1szu/OCmgO/warUf12B32
-r6upu7g+X6/HlrPTJEJGieHig3nTXM8Xci84BtY4NZ2+PBvfLOqIzXYhezrMDkvq17W76g8q
-0raoy5K6JU1213IbyjXli+Rvk49l8WbJldg4sUfyseRsmUdkbqxN1T6x8soBV6L7uhpTx7Lf
-WWF9mN6aTqa77BP2C4fxvs5QZ3ikVmRjdGT0QnxZ/JLvB9+XKSc+r/C19D33jvaG0pakXQgt
-D72KbI00MoBxJLAmMCLQJrAzdULqIN80X0qsUrxGfEr8pFnA+gXkhpt4HhGxhzhpeAbZqnyh
-fq9sVKa5Prqeu4q4P+MoniZP6UXJ8mOl/8wDXcEw0oj0kNFUteaaNZyX9jXRUWh4LUpK+Ohe
-lnlk5jqJWmJ7d133SPdQd0Gd6GZCYmL5rMOzpmWimSsktZEW2JO0QDujFaZN6TD1klpKGaR8
-gCH4CnJ427nv5Az+F1jp7+1/EDwd7Gt8ZXT1F/N3DbYO9vYX8Z9N65+WxZ/qC/uP+V3+gz4r
-8irS0Kpp+cJXwyicKZwr1iLWLNwrfEImwud5HckSo8VK55GTiKdLJhiCy/POfCZ8BDPTrnQS
-Wo2akKnkNuW0ieRMw3nmzMUL8UD0DUoDu8Ahtp1dUH5VctPbZIDeWl+bODpxqauR62bCiYT+
-mQdk/itxcmILd2P3+sRziZqepM+nf9EjWqK+UbuuzSWryES2i21le1hhEeaEh5xL4DAIWHus
-aOx6LL+lWuOiJaOngoOD/4bnh3cH6gQueBp7thqdjSyhk8FuftvXLVA3UCJSMrI5uDQ4JLQ0
-9DFWKl442iJaOTIm0se8YdaKL4knRAdEV9gFnCjvJUbbl+xv4F7YmV6mLvgdLA0Hwg3kMbki
-o+h9eQ1Sh6uT1BZqCRak2PVOj2rbtV9IHjJda6bNTmiTcEEdpCque3pScjjpiv6rXl8rpbVO
-6pHUUupYQq2ifkoomZjmzpVwlbwmndk6lkfpoPSQ/t8fLAYFaEM61RngjIy1jQ2z29qVoi8j
-Nf23fV9HnoTfRKdGVxo5jHmhMqHB0VxR27/cXyHgMTrECsVKhZ5JtH8LjI0Pjl8J7wx/8F73
-rgydDfWN7YktCj8LZzdXmEecBjxrfEWcWhutE7ADqgX2gRDoD6+oHbRq6lr1JlFoD327vs51
-y7WSbWbd1aFqEb24Xoa6aSHqkBlqI/U7chV3xq9QZ93S/tZr6IfUGmo9d8TVwfWFq4Dymq3T
-pmtNXLVcYeWTckf/rOdOqp80xbXA9VJL1Y7oN/R2tLksDP2gKvwWqo5hl43B2J3Yzli9sBpe
-7K3g5b79vh+MLMb+tBZpNT2v0k75+vtep05P3ZLWMe164M/AdWOPsc3YaeSKd43viZvxvOEu
-4VmxV7GVJrByRadEsT3NVslycg3XIj3YC9bV/cG9UuXqQZqDLXCTBN3dw72MHCUd2Ri2TFmg
-PABLwR+wFXxAx9PFkmPCcCEsq75UhhBCDsn8a7e0wSxXS1dZxWYDXf1c/yW+SVyuLdVeyjgY
-SiqfHHMVcqfquV31k+cm53R96/ob7Ue1yXekG6qIqlivzYN2bxvwnc7qSK7I3BAOzY2IcIK/
-ve9wajwl5vvZl8v/h++at5/3QXBLsFIoV2iGr7fvX+NfIxbMHLrnS/M9939prAgnR94Fx4Zm
-hitEVjpjeENQHT6GN1Fnpau6R92sdWcFlYlqLu0H/a7eQJmjnFE/qV1cY10TJB98xT7RoUoW
-5TtyCL+T8b80+gVGYBsZDe8Cqk5TPPp4/S+1glradUs/qA/Xr7Pf2BCtn7bGfcr9TvtCT3C1
-cLVI2pFUxDXJVUOdpn7nmuF6QRPZDD6bd5UZ73o+iveJ5o4uitWIHTR/NjOFtgcfG10NOzwj
-3NW44X+WVjFtQuCTMdh472+XeiFlkk/zWcFdwcL+975z/n3+SZFdkfLBScGCgWWBAVYB+3un
-FP/Bru3kJwVoB7Wbdoz8Qf+hm9kJdZVG6F56hFZjjjZEH8+OszP4Om5O69CXaC9aL2qJX1Ah
-VJneJQLPwC3ZDbpV+1obq3nUfXoZPS5jYF2XoXfXErSh8vm4OktNVN6zU9pBbZ5rhesP9w73
-/MQ1iWddt13NaQN6HP2JuoPGoI1V1tKtN+Yda7e1Lzo62kGy47xwqfB/Rj/jhbe3t5/BjL5G
-VqOE77q3j/TbqgYxWnlKeX709/L/Hr4XXhS8HKwenBa0I0OjwdDE8OVg21CydclaJk97XpAG
-6ivZ1RuuDe7CyknJkEz9y5XDvUZ5r8RIHrpS+1f7pAhlEm6Prymrlb/VGWovnICDdDEtr7/U
-+tIYmYYIysLO08WkCRmEciOivlM26rv0jcoGpb72vbbL9Z/rrRJQqirVla9ctV231HvqAtqH
-5leRarKrbDksDCfJWneqzOlVa6pJ4sNiDWMXowNCd4N6oJuRNzgvwALDDe7v5m8UvBuYECwa
-LGHc9e/yDfbV99by9kubk9bNc8QT82826gfzhxpE68cq2N2cWryfaABawjaoK04k2WlupirT
-lQ5qI6nPXdZZaa0eV3tL75WaKl9LTK6ri9WwMk4JKXWVHmwz/SCjzEb6lHCtkzZb92nrdKaP
-cXE9h7pLaU3+w8/JdFKV5qamzB1aa/21gKuM+66SoOZnPzBdrjyF3qRD0Ar0CGPSEU6EW61l
-1kirtTXS7GzOCdcOPwgPDFeO3YiOCD0Jlgz0NFKDpYK9/Bt8WTyV01746/ldwbOBZUY7o02w
-QnBj6ERoquSdC4Evgn/HOsS7myWs/6wjdjHYEU1CD3FEVIXV0RL8O2XKDLqTRZVP6kUpcRN6
-i55DDqpAO9FG9Fu6l/QktdWQclsbrs1VXrBMah1llLZVnta4MlGfo7VwT3Ad0j6rVGnGbilt
-lbLKA1aBvaI9tBoyT73pyiyvIfoUfZC6XI3iBNIMdoH94UyY/q+U3flg7uLf8F7WMCtT7HXU
-F1kT2ROuGC4SXBpoG/jXWBQgAZ+/i7+H/55vhh/7V/ny+Ib5c/u9xjvDMYoFOga2B4LBWaFN
-oWHhApEC0XxWB7uYmAJOQoTr0fGskPKt2pKVUHaxH5UfJJ8eYpWVUfQ6/Ubprmxhm9gdupma
-ynblufKzsomYOC9rQFtpA9TyShtWjQ2gn5QWShpbwt7TtfQb1a/00mppS9UFalHpk5lkXPxV
-vabmVWuqRCutJSqtlApsPNuueJQIKUv7yLpxhWgkntv97Jkxb3RwdGskHM4eLhyoZ6iG2z84
-MNpoY8zx/2U89x8KvQiWCC2QvrvZ2BHoFRgdmBe45a9m7ArWCpWNZo5lijaPnY/ntqrx7eJP
-UREuBjrqjU5hE7bD38LlaA7+h7zEqaQGzkeidBabrGxRerNaLDtbJX24Cn0tY18IvYTTSGm8
-BJdFh/EI9I1i0ovqP8pmLU0t6l4ts70/XQe1plplPahlc2Vy5dC76S3cT9x3EuclnXWPTLju
-Gut+7l6d0F0FWhz2RRBUA/Vkjjszki9yPTwgPC6cV3Kn4Z9lUONOSAktCPxg3PRP94nAayO/
-Udq/1nvP861xwF838NL44F/k7xvuFj4pffJJbLasd1rEv7E7OhusE3Z9q5HdAWyAC1ASyYcW
-4zrsjNJR9Wkabc1as2aKpXq1X0lT2h0egF+gxqiKqCw2OFWchSgGJ9CbpCnphxuxZvSIPLFe
-gskSOorUUpMVRXlAz6hLlTuJemKpJJj0dUKehCnJo5PHZtqdaXbChoQm7pLumzJyzKEmTcLV
-8WT0N7rtlOQ3TMv82q5o34w/iHtDa0Ltg4sDfY01/iRvb89P3r88VfxrfQP9Of0TA3kDBUJH
-gnuNdcav/gV+Ydw21hvXjFIyv+kZPhNeFG0Y62yOt7qLH8Bb+B7NR2/xfVpOGaPcUh0yh70n
-LdlIOpKNQjXxR9Qb72a72Wd6np4nuwlVNrACtBXpDPsBjl+j0bQW6Y+WwcbkOt6ufKlYbAI7
-J/O7LO6/Xf31ivoA7biWL2FKwg235d6lBbWQ62t3DXdLd2flohJlS5SdakA9JrnmLN4mPaMl
-Ome9Mj+HE8KtozMjU8OLQ+2Npn4WzBYYFBwTOO474jX8Ff17gzmDY/x3fQm+bd5mRpLxzLvQ
-O8ez0dM3qIYeR05EReTb2Gb7a94HPkSFwUa4DLaR3pidjUMDSGZ8lxxnZdWGrJzyC31PW2v7
-ta+05VoF0pycR3vQO7gJvuRJPKfgzhzYHXSAj8R99B3sq+RjN5XJzMO60prabqWQNkP5R8nC
-3muX1GKuj/oB3dLLJ3oTN2ZKyXw/qVumcYk42Z14Mumu2lUvgD34CPTAPfwun2z+Yj40r5kz
-zO1mNBKJlI3sCp8M6+Hz/he+ot4raVn9R7wzvSM9i9Kmphbwfett6//Ll+DP71siOXZgaFzw
-SLBS8Hj4n/APcSN+Kv6vudU6bV8B9+FDXJOuZj+rw/XS7jz6Vdc4GRU+Ktm0L5Sg0om0oMNp
-JeZiO9kfqDsOwC5oOh6A78H5cCv8Cr4hGmlNOuNklAfekfWTi/bC2wnDf6rtlZ4JVd0P3AXc
-DRPKJtDko0kksXfCDZnDsIQU9zWZj35g8yQvXVf60Md0DXgPeohN4g++mfeNL4xXkXXf+/Dr
-8DfBRYGYUcRYElwQOGnM9t/yBjxbZNV023jhn+hr6x3oG+1t75vmLek5l9bfl+JLCCWFYUSN
-jjTvWtNhZvw3DhM3mUJnKM20IeopbRPbqgxXt2gBbbM+XjmhrFTKqQW1rdpxeoWWxF3wDeIh
-T1BfVFUM54vATPE9PCQSQBneGN+Aq1lPmQNNJ5UllgP1Cvoarab2QU1VU/XzrmV6KVcuvb2+
-LWGArKQOJ33nquweo+V1PVUmaDXwZVwWBsBjUARktrFVOdYneiD2cyxH9L9IvvDykBJtKivA
-a+EW8tRtClj+UYE8RlHfEU8W79204r613uueDp4m3mseI1AzWD1cLHIrfDrS2FxiFeSrxHH+
-h6iNFPwTO638zPKpi5VxWkl9uPu2+ln/lxVUd8tTUlypqI4h8+lz9A53BaVhP2e2c5/fdvyw
-EBiB/gYbcXnko5fJcXqEpNDRZILahu1Sf2YV1NbMq6/TurlPuPK5n7gaJuZJZEllk/q74+6T
-rvnu2a6f3WeVleovZBBtir8hO8QGELO6ODPtl85Qu7DTL57NLBA7E/sxkidy0shupPmq+z74
-+/uG+n7zfPKsS+vk5WnVPVtSG3iKp4X8hfyhgNfYE3QCnyL3Ihviw+MHzT/MjryyKIk7k1q0
-LFunlNXq6mXcm9SQNpAVUH9QtmjF2a/KE3QDf0Y1yC00FbcFC0BxWBa1xDXICrQINceD8C56
-m+4ml/AB/BuaxU7TM+mZOXtEvtJuKndd2/VTrsn6OXdld/PElwlF3dlkNp6kJ7ltl1/WlmF2
-jbVVTilZWSY2FZWQp/k5HCs6A4+ZwxoVOxirEm0XPR58F1gso8EFyZW6/4T0yruelv6o74U/
-wd/H29Mz2vvQk9s3X0aObp5m/u/956WHFosNjn1hbbImSJaogIrjhegP/DvjSn5tkp5P6aHe
-psOVMbSHopB99BUtoeTRz+hFtQpaUTqaRvAiyTd5cR/YGe7Du1GQxNBBVBouxXG0llWW9XpT
-1lRZzD5pzdWW2m3lNmsrM0CsKGohdbB6S52tn9a/kzya7DrsKqoXcl2W0XI2W888iKPG8CEY
-y9c4Pawr5kjTjv8Q/ztWOnY3WjQWjD4LvwtNMz75Zviinsfebp7qHpz2Ma1xWkHvDs8Mr9+z
-wNfYVyHYOHgkUjx6QUb6CtZgu6AzlzfjmUAiPCfzwY40ShawN2yYOkStpFdXVmhFWB81SOcp
-G8leegY3JDexD99BMTQHHUaliEJukXyyYtyCr7AedJq6huVWCtDTtAypS5/ig3gR2k8ASdKK
-q3/qS7QS+nLtpKub64Zrluuc9l77pFF9sTZBW8wusEX0Nb1I39DT6A1aJxTQSHwF3jnlxZfW
-aPtBfJu5IbIw8qN/m8/nUT0TfL29w30J3j6+mGeZv5lvqm+zd7q3s/eRf7d/YDBfoEO4frBK
-bHZkgNkvXtX+ZHUB28BrcoicY6NomrKRjdaQ9l7dp9rMx8qy/SyFtKHz8SJcgR6lnZX86gv2
-jJk0G5O4UY/EviveCpOU/nid9gPuqT2G89Uoiip9yCClAdmmzKNV1Y7KGybYGNJa+Zoc1ubR
-xfpHVkhvqPr1keo7fSxrrvUhaeps/IdaC92g9UUa3Gmt4cekh70L82j34KoIC4wLj/A3DaZ5
-uxt9/c39K4Pf+u6GJnr7hjp7+wWXe2cZHXwR3x3fApmfxgOFAjvDKNI19jA+zPrLeev0AxtF
-I+mn51CMrKKtWAvFx/rKjLOl0lQdr6Sqz5VXWlQN6tX0f/WZWlgNsK+UU6Qb3YSu4zngDVkF
-Riir4CqlLMzLasBO9BOaTnqQ8dhPuuL7ZDteRmJ4Oh1DDyq3lIvaR1V35dDuuDZpI91Eu+Ue
-roxzP2XQVU9WTt/AoaS4sw9cjP/oFIj+YZWPFrZKx7bFE6PfRnuEF4arhv4OfjI2+7f4Uj2f
-fTvSnvvbpDX1/5uW03/Mk89Y7G0c2OgvEHaHP8buxDbG38VPxL+zCjuZ+WmRCcwVg2VFdhIf
-JlPZR3Zc/U29oS3U52m99NWyv15WievYI1aWtqYH8GE6AJdSHuFZbB6+SxvgbMoxXEO5hX+j
-LjyD3IGD8XOQAteAnfAW6Cs9uhyrpRxQubTQIvd/+s8JE3WQsEfr5/qsPtMbKt31sQSpRdEd
-2g7Wp1tAGXKZn4cL7NMipznB+TEyOp4YvBReagwO6v6J/pa+Vd5WxmbfxUANf8fASp8VmOgv
-FlSMiL+Hr5+/oG9FIK/xIrhX+mmp8KT4Xmmpyg4BKaINCeGPyn72TLHZj2pz9bO2VquiFlG3
-sfxKA/WsMl+trVyRWdgj9ZQySnlJf5L5dUvUC9ZCM0Bu0JmvB7f4X7gIHIj7wtUoCCGtT97Q
-aTKL/ZNA9brMGOaqb+g8NowtUwPaWVdPraErn3bU1cAl3I/Vx1oZko0NxJ/oPbiL9HXawn+s
-B+K5+cYpEu0Tzx+5HK0aqxBvFikS3RooFRwQuCjr+Re+yd6sni6+kZ4+/rneMd4Znqve455f
-DM2vBNcGUsLNIkvN82aqHXfq8nogBqohAw3CV8gjsl1lygjXeLWeS9EcyQK1dSGr8zrKMGU8
-26dWYNuUC6QYq4X/oSXQL/gamAOzg6WoFciDp4M/URv4FO9A7/F1VAMWQRVASzQNVsGn0VtS
-WHLVGtWtf9beSY4ZkfBEq5ewUnW7Sipp2grlkJZfRotUWI6UEHdhUxllc1gNHGGedfqZ3Swj
-4o4OCm8O9w8XCr0wsP+2N5sX+z95u/l7eQ/5mnsLBnb65wbfGkmBqoFoMH94avSb6PDob5Ff
-4qXi7URlXlTmlH74AlVSBirPtYWyan+rbNPTtL7utXpHyfVJah9lhnqG1aA1SDd8E9+jveks
-WoG0wZ/hShKELckguBlMF0VABeEFRCSJp05+gMV/eB+sR3pIdu7DGmmD9NfaDtdtdZ6rn97W
-rervXV2UJnoLZak2jeVUIT5A96C5dIXE8akYhGval0F7q6n4O3rNehM8HK0fOhdODv4Z/Ogb
-axQ2rhovAlUCDYxH/pyBpn53aIb/tdHCd9k/xLskmMOvhI8EXkf6hEfYfeJHwUfnHOoD97A+
-pJQ2n9VWOyj9tfGyRh0jfxurtdhKNkFpx5YqScpCpaSaQ7pAPSU/HYQboynoGNgNTvGQXcFp
-J9nqiigiropPoh08BZeQEiQ3+YrmwltpG7qZHaf1WTvSnY5mu9gT9bo6X3Xpmt7Dtcd13lVW
-K6cXVM6raeyE0gG3oqd4R9TfKQZCVje+I57kbJRsnxKbZi4PX4nuCP4aTghGg938D42fPK+9
-t1MHp6alnPocSiuYdszI7p8bGhdIjnwOVY+/ie6wlsUHOgGrO2wDTpIp+CX9RCLKYXZE+0dp
-oo1T/tCvqe0S3K4Z7nm6rudVu6oGXUEuowi4L0qhrKAC6QcB+RMKUgdVogT9B1+KmiCfWAgL
-gkegPigARoHWcAGsA9xotGgr85z8ygplu35bueQy1RzuPdozVwobrE+jZzSHXtTOYKHUkxkf
-IcPpB1SL9BaFUCveD0y1Ptnx8OvoipAVKhheHfwpsMTg/hb+uPHS18G/wXvX18nbOFjFHwmW
-NUoHihiVQ8WDP0d2hxtFPBFm8vgzsZAfhwwauCUerrZSmDZJW6l8oRHttZpLayDjYSc2R+lE
-U5UDMovpT7vQq6SssolYdAReTubAQvQTOIQ3gRmwv7gGN/KJsD+vD/rzA/C2aIQheoCGyFos
-TtaxNPYPiysP2Tw1r8zp/1I+60xp5cqudnetVNJrX5/2mVxS++LflCbiOXlsOWBc/IUzI5LH
-ehoaFTsd+hzZFVwaHhloGvwmkNmoaczzdfbP8xYzZngfGD19l4xUX2pA9yeG9xhzoiB8xLwb
-Hem0Me+IBrw17ow+0N/JJ1nT9mM/sTSlLgsppVkOqV0DLaRsUsuoO5V66ntVV5uqCayk1G0J
-mYeukEaoECoKV4FUUQBu5Z1EFeegk9NZLLbzVeAHkAn8AC/CZzCEnki+HYcyy2xlplZRn6Jl
-cVOtmfuwa1hCR7eZUFQf6l6pAr0+jbDvwDHclu+Eg5wSILeZzKvGKtk09szME14e6xiYEYbB
-PsHlAcso7x/mv+hb6pvly+Gr4F3sdXznfdHg9sAGWSO3iUwIJ8asSN/4p9hda4dVG9QVBfAD
-WI20lznXBDpf26Gs1ieo1J1fa5AgtD9dlppf2yxjyAjJ9OdkXt4LfyDjUB1yAHbCjUBpfFpU
-QSdENbCeVxNbnHv8omM7e524s8zpJfqKtvAeeo1tOpn9oi5XWupfqsDVRNvg2qtdcZ9VN7lH
-KL/pU+k7tSneomxCpVlzdIOsAFXwCe6G0+yZfEpspXUr1Dw2P3g6vD/wRWiB0S9w23jlR4Gv
-/G4jyV/eCPmWBqr4SwerG88kupPDo4ILIjPD1WLxaEdbtQaCa9xCKfCgzKInq4vYUq2itkq7
-oOXQ2qtEGcEq0kS6nU4hiyWLVmAa+5U2o5w0IpdlJRlHZdB09ERsgDN4WZidI1jZUcEwu7I4
-YOcCZXky2gC+IQ1wa9aZmjLnLitjvpf2Vt+zHNL7sT5d6+Qqr8dcmtbC1ZVV1/figFoRvmOP
-eU8yxr4LiTlDzIw6du2wHR8X9EW+CRQNnTBOB4oabQKF/E2M3b79vue+ud7v/RW9RPrqd4Fx
-vhqhrIYdrR4y7BuxQaCnvQat4ivIFHCazkKb2VxyVp3Ntum11bNademRMVktbWCFlepKFzZX
-+UgHK6NoQWU2GUZ/wWfQENgffM+h2Od0EePFJNAXbALlwK8iB3jNO4tTYi8/Ba+DrmQlLsR6
-EcaG0AP0pdJA+Ue7r03RS7tKuYq7H+jFEtZoB9zT1O76KXqabYWrcQNxGnXma4nLLseS4xXI
-3uhg0CNSy6kUmhovFHgWMn0rjObeqHemt3LqRN/hT5N9Lz75/IVTY8FcvmCoQqBpeHigZWx5
-YKtdIBIR/c2lqK49hgzhN2h7tEpNor+7HtJkdzKjrjdkvH4cl9D20rmssppAb6iDyES1Ln7K
-CuJj+Df8M1yOvMAFb4NDYDVQwd9iGJ/q3HYa2SFno9OF/y0s0QC2QZPwexyjyfSccoPl0bOp
-Tdw7VY+7vtY8IVkrkXBGWe6ayGbo5+lafTqZoOVCl5VNIr+ywWlAi1vVYDC6zf42vDS6Png9
-MDqgGjuM//z5jNfeI/6BnmP+D55vDbfng5GU1j+wyLMseN37KLzf1yW2OFjbKh87ww+bm+A0
-x8KLgMmOwlpaazxX68aaaYOUI2ov1kZpw2axUaw6uy3j2Ta2nYxUctH/qJtuI1dlDe5De6CC
-BotyYKTIJwryb8QD6zkfYX/gkE8Gy/k0WA/shzNQQXwUbyFBWp9u1LawMq4uaivXbNXr/l7t
-mWioYxObqtMT17J7CX1oH1cyTtQaiaOshj0QvY8X406ktVUgXDa2OpQjvCy4Nng1sDNQLDDD
-38hveAZ5L6Y+9D5PGe8vl/aDMd/zMfCP52Q4j0/EzgaY44/YYJfZFQP+gtQAZ9gqNF/5SNYo
-TSnVxtH6+pfKdf2IOtjVUTukxzRTqalNpz3YELKWZMKnJCtthfWgLUaDu+JLkMKzg3lOiDfi
-T+2xXLddzvf2EqeGfYbPcpB4JXrC7XAEfYNzK9UURbumjUvoqW9JXKZH3Ne1zAmPlCbuYQxq
-X9EzynU8Ri2Ot7CZaDXxiG44v51HvIhtNP8Md4nvDU6LZglOCzpG3PjT30dGwrzeob7TaWV9
-zz3b/fs9nwO/e7OGPhmjwsWCHaIFglPj4yIP7ATzGWxgD2JPgUctT6/o37N8LsHeak+VSloz
-RrTGtKdqsdvKdPZCeUCCsjo9Q2fQaTQn7kwOwk1oDNwHvwPF4XTwSbhgMgd8vl3X8lrt7L7O
-NV5GVIdvxEuSHQ5QDqJflId4v3qdfKWvYuf1Cup99yX1x8RH6kJ3M6Ws/pjM177Ge5S/4DI6
-RoTIXudvtMMuJjQzxaoX3RolkcbBmaFSgdnB+4E1wdrG+MAQ30CZmYb92bznA7O9xwJf+scH
-l/m1SFNjUCxT+LVZKZad94vHQBZnLh4BCyhnsa0C1kK9o6SpvZXieh2Z01RV/1YOMKZcIbtp
-JXqCXCGcnpessZKUl9lYK9QPVATT+DPnIJ/rFHIu81P2r7wrP83v8K6gBFgITuHNoBa1UTPa
-gfZVOX2sH2aHtetsqvY9zaSvoXm0h3KnkWqWhLasgSsf/sgygQv0gLMHc/u86GYbvK7JeMNY
-SjwcORY9HA7KKJ4nMi3UKbQsUCVY0Z/q7eLLnNrHdyF1pV/3pAWqeL4NN/LXiIVCV+2KsbZw
-kb0MVwL5yE3RlW4DiWouul5/yQz9ANX1fSxB9ytF9VFKEbW04qbr6ElcDg/FDXFfFEJZYWNR
-BrxwVgIIU+F+FJNVc0B8g77h18Ajp7Ao7lQFY+xboLWzV9QWw+E4eJ0kk0RWkQ1SCyh3XQlq
-wPWPWsyVTW3u7qT87brAkDaV1lGbkQFKb7yLnIWf8WSxD4ft52Jw/JLVJhKJtw2zaPvQ/OB9
-45Ax0D/Ct97o4R0Z6Oa/Z1zwbzHy+3BgpH92sHfwQ6Rt6HgcROpZpeP5+XEzCnfa58kHEFCC
-uJirDh3jesti2lHmV5eQQ8pqGQPr0RLydKQoBzFS2tPV7Bu6g+0mHqLRQ2g83g/7wy5gBZzL
-j4IjTle+087Om1sLeTm7DV/FV8r4sYq0R0tYA/JOyUNuqJmwwyJ4GttP49oFFnR9YON1jdbV
-uqBkdRCkrCQcTheK7iQHPwVqO415T6uVsyzexHwdGxJ1x/JGP0W6hMdEpgYWhAsHagZj/pAR
-9/wYUL2fAxd9dULI3z46I7DO/DnaynkYzwVy2x74PciLO6EbtC2+rM5hF7RXSmntFc2q/kvX
-sN5sNR1JDtOK5A9K2Dayl5TFLVAqXI/OwXpoJwqCUvgNbI2OQw7C/Igoy/fyx3wW/4IP4vOl
-73YDtXhH0ASshF+jpTQrfsimky6sEjsvqzCv/pO6W9+rXnC1UGa5M9OgNhQfU2uikZobXmch
-7kJPrR5CMXs7u+PlrfwxJ549/H20f3B+8FQQBYuGugX/DQ71rwmc9nw0untBsKtvSPioPxrN
-Hrptlo424p/ia0EL5yqkYj8uJAqzHLCheho/0KqQXPo8Yqj9aCW1NtXUsfQIG8TK07t0CGlB
-buPqZDXOS8I4H86Nr6EoyI/KAS94Jg6BUnwuuGaXE3ntnPym2dMpY35hd7K/dgaIb+FJWJKY
-uL/MiyopKUzVflWr6Lu1T65NaiH3K1ZEL8o2aXXpc60ZaSpz7tWsGixMz/EPcLzzHz9lrXcW
-xA6ZIyNWpFh4W/h24HXwrOHzXwq88+cJVg6UC/zu7xNw+/cGtwSsUIngH9FswaPmlsh9u4a5
-TNywWmCbv6YFUBNFQ4O1DviIPoKlaSXYRXUH+U2ZRhuxpnQhVfEz2hwXZi/JfBYgW5UyrJfS
-TvlRRrdC+BzSoRd+IUqCB86XvLUzl++ygRhhT+TLbCp62m/EK3sqaM9noCpgEr0Kr7Cv8Bil
-GzmtFqR31azsmsqUkvpMpa4ri3JZP0Keqm9AEfrCyQK32ymcWt3tx7FVsafRE5G20Q6RW5Hi
-4d8jb4IrI92CkXCrQPHwUqNweE3gbLhrcERUD1UyF0R22mXjAaedmU8UtqfCrKI4eQdcrD9q
-z0bjYfQH9IL0hwuJitqQFmgy+QNlpyEiMy22mVZkx8l3dDPuQNbjvSgX+Q5dwF/i1agGSoC1
-wBRxS/gdwVVnp/PJnsZLykq4Nt8jDsqIOR4aaAppSPsrq5W3SqrWWLmqP1Mqu1xqYfff7Kjr
-LOmiDUVtlf/EAfrGceGoHQbceiaumI+cc/GfpY9uipeVXPpd+HnYF3ocOhnCoe/C9YLdw8cC
-a0Mw8HO4cyAcXRJ6F38XcVswds5G8ZLiuOmFG+x/yVt+lg2CedT2+JUWJkG9HTuquZguY+M9
-RaKrBGlvWpQMJYm4AWmDm5Od0lPP4ucojiB4DW45I4Rl9xCd7GM8yb7vDLLz8Wl2a57X3u/o
-ziM+V/jgZViFdJR1xUfcUhmHVeUBzqkspkGZe7v0rMpWzWBPtRRaVbuAh7K3sI60+CbcGOxD
-BUR+WNvpJkpaE+wCZmFzrDnSfBi/Hq8Z/VKyZSSwIvDY6BCoaiwKXjM6hy8HB0VWhM5Hy4S/
-NfdFz9o5TJfYbk2D5TgkacBDP0Cm/ogH613YQNdupbBrtTJAv6HcUH9j7dlfkr0RqkZc6Dq+
-AB3cH3Ul4zBHZdE1EBFNwD/iLRgM+or2oro9yMli/mQT86F9w6oqdjl7YSd+AQ3h/XB3MYnM
-BDbxgTgZjzYyhygap8+0ALmtrsffK0mSh0aidawEvEUM/g3M5XTgtj3Eqe8ct7fYK6x2Vlbz
-sHkrttbMH4vEh0ZBvElkRXRNqFbkh2C1SNegEU0LNTW/jzaym8Rr8W8tr2jrTIfNRBecGzah
-pfFidpDUZPXJQnocu+ldnInkwVlkTfwHmoheo61oFl6BvPgyeofWwI6wu+gIC4lUqAA/1MFR
-mBNMhKfBKBATVEyS8f57sZWPApv4nPS/VIKdoYV/g8PIQ7SYviW51Ufkg3oXH1cP4H4axUfU
-9/AWaw89dDDITIfymaiDswZsdAaCKzYSx6xk55o12F5i7jdPRXtHV0T2h9VopfCBSEqwSqR0
-MGukUHBRZELwr9iO8CezbSyHvSu+y6lvmWANH0a2QZmV4QXKt+SC2pn20O7SLdoBNkcbqDxV
-orQ/vYVN/EzqNA8ORcPAbVnnVUNYeuYZLsRPfK3oyyeL2fykGCK+F5tEKWe5s8kcae2KV7NG
-mVnsu1YvWQGn/z8fL2oJNpAOsBRbgkor5bHkKLJY5jfZ9HmsjP6GHtZ2kLiq43zKOTiXToD5
-6Fr4I/kOXkJnRGOwyXlsD7cGxI/Gh0TDsXGRgjESbhJtHoLRhaH9ETV0WraJ0c5hHn0Svhpr
-FgnLyHnBLm+lOL/aY8ErsQCPxumW3cQa07LydHylCHJIZteD2WPSkWYneckotINcRQPpRLyG
-dJP8cws2pkPRElIPnkE/i+VwLU8G62QGOtEBvCbfY592Tlqqs92ezNvyZyC7KIXCYjm+AP4i
-uUEXcon3JcP4HzSbWMiSQXalHSyrjoFnlVvAoCosR1eAq3iR2ASfiK9hJ3ALTBPD+Wze1v6S
-77SaO9XME/a0mGZXjGY3i4VnyYp/eyxzaGL8WDgYd0erWGq8qvOl5RY/2pcgEC1IVkRpUVxT
-+uVcup+sItVIflxbcuNEvBbuRPNBG3gT3IP5oAPLyt4vsDE4AKuB3+EAoaORIiB9dCo4z38D
-c/hadB3cREnQBV9yFSzlL8Vikf73F4sAgedAZjxOvEf3xRS8El6ixdFctgydZGfwEHUO3qWm
-wbNMgz56UDwgm53iyLLzwcrOPMmClUFhuwqfaldzNlrXTU/8QrR9PG90amxZ5KdovfDL6IVw
-nngwophlo6r9PHaA77G+B8Kuhvbx3aQlnEo/wqr0T7iYIpzESpECrDi5yIrRGUoVdoZptBcd
-gTnOj57Cc2Iu2MDjYIX4BAYLCNbzbmCNMMEdUQXEnfwibNvOZHue3cEaZXHzlTnP6mK+tkqZ
-t+yGVgr/0bHASdEMD0Dj2GTSWk0jzdTh8u4ifdUHuJX6CmfVduMO2lGUovRBfZQLqIayWEas
-3KgXygl/BePEaacSb2BlcoaaPWWeCc2+0Z3xnNGUWOfIr9GWoUHRaqHOsafh4fGJkezW3mgR
-55q5w+lqq7y6sxtcAMXwWbydPCRFWDn2Hasho/l3pCH5Fhu4Iv4N2bI2vw+n4QqYEIRbksao
-IT2LbtMB6ArpA07gOeItaifawRz8NhjDHXGU13BqS9bLa3Wy79mLnNz8EG8h3ostcCQvD5da
-OUQF6w+wzU7F33NO74n7ynFQTmsFwkpV0J+9hhYriFJpCPyOpwAN/y4ew/q8q8jDc/EpPIfz
-1FlmtuHv4l3FWBPw4bGq9vhIzNodWWuPjobsmrHFTlnzM59i6+Cig9B1UYdshs1pIlpIU5Am
-q4a+OD9uC8ej1aASbgUIPi9yoLEiBV7kG0AxcV+MASeBCa6BN+CIiIEt4kdZE9aGP4kjsKbY
-iiqDAaivOA0VXgdecG6AP536kiH+BJvFHPANvMJ7gpt8KzwItpFGKBe7hoaw3KghSwPtqCn2
-kv+EjI68Bu3rDML37F/RJHsVzGN/FPnts9xvF+bNnQX2CTvVjFjZzPzm++jO2M+RwbHM0TOx
-g9Ep5vvYdmev9RfQ+JdoFJ+AV4i2dDkEiooPqC2pX33IjigG3cL2ke/YEdKUfsAT8CN4Aq2A
-z+Xpqw6qiC6iAT/JM3HEWzluXtFRRDleWtx2bsha8D1fYzM+xnJJH2ro/GkFnKPONGc2T7Cn
-8ElWnPexFXCLL0R3wL/kPVhKDLCX/AM7sBZosdIYQfVflE9bhc9pEZyk5SEd1KK4GPNIDr0G
-/WAW3CQygXv2F7yyOd0eG4+aY2M1zUnRXWbmWENzT3RJPF+ExwtGiLUgSuy3sQ1OaesLYToJ
-4iP/IDqCo0jgS2QCu0hasuE4QWamN/B7WAjfQ5dwZpxZspAfZUdH0RMUQBVxCixMKsN/6FzY
-l90BjygUSRTxPvip/ROcai0C/1hDhNda4JS3ztu7rbCNndZ2qr3JemNnt0/wInZdUEey21bn
-DSnNA+yTPYuVs79iPzjv2DaOlOaSV4eLC/QQ/xf/yvuiUWIsWi6OwmKiODDE76IaLC4KwxzO
-LZDTOgTWx/8V+6JQfIq0Edejb0WJ+HOx0fSJDvZ0sMHpDGdyBXeQ3iKgSRajnOQg2oHmorpw
-GLolnqHfeGV839mELjjd0HCeguK8PdomcsOvQfpf1E7il8QCJy5y8o2goJgIR4o66HexDe7m
-BcCPtgbOWllhAecDrMQLoVPchJlAblhX8v4EmVmUR595GuokZuIE+JacgefpHJBIp/C1eLLd
-FL0yi0O3tQMOtofgdXYz3MqeA3+1CdBkFPrX2eHc53mcN7yeXcapaja3N8bP2TfMgk4ny3aO
-WWXEZLseeGfnRsudneR3sZ4mwWa0CWzJvOgbxUUvsfOyfrhM19BO9DM+iNuiN/ArNBP+Inns
-e/AnfyM+OcnipJPE2zkz+V/On2Iwby3uOSP5JLsU/9vq6Nwyd9t/m0fsndZJ+5x9QHrtP/Zq
-scDeDpLtgyBoT4ZPeRLeIFbhX8QufEf8RF6A+5IBRim/ox5qXrROaQ2/ZN3gUJoPQnIQ/AYN
-8ERwMJhfAEUdG7ywG8IGTnHwg92IzzZD9g/xhVZCbJB5K/LIrBfdb4+J/8XD1jxwiFdEs+Eq
-mS/3Qk9xDSSICdfTV7Ke3gB/J6/BUFwD/IFWgpq4ASxHusBLuBc8iB7AHGgS+h3uk1wyCil8
-D+pgf8QV7KH0B2cxPex0Iy/s26iofQjMtWbyo6bLmWLOsadYeZyszgjJpIrMSUbxJbAhf4tK
-8J4kbk+nY631tLX5hJixEC4S+wHviL/AU+2qdCL/nQ4UA0gTMQst5W9BGt8lEsEWniKqOPVF
-ZasquBS34bN4TXzSfIOfmlvxaNOLvOZ9pNm98FfOHbyJlyRzwffkCVyA86DtqJ1sLbBXZizD
-US86DvQnyLkHC5h/iPvxyWKPWQ4MtHqBEs518LOYBMeC1vAN6A82wJjIh56I/uh7EUM3eHk8
-j3+BQ47MFZyViDpd4EU7BSyxm8GhTjno52vBZXFKVAaz+QNQgE+Dl/lklE8kkWyiLH3BEe3u
-lCVNrB/wHHMEKmn+BkvEvaBFvBqg1hXRym4ontrXnMZOZrumM8Za58y3vhGbrMxAs38V02wA
-9tkz4FLnA1opHPI3/EtpjQtpk8hjLUSa6zGyTt1MctAv8UN5CrOhVjAHbIdi4hdo8PnigrOd
-73Z2cQ8/z0+LJFEYlBYqPC+zMI1zfsV+7yyzpvI89ku+2PngQKeRnc+ab/W2HLs0bynug2si
-CPfJGj0/nwWb85dwL6+EfxbTyABxmai8KMHOONzT6YJVvgzP5OOwyW+hc7wnrC5PwGa+3Vkj
-8jg9gOo0gNQRMsM5Bf32dXDDOiRemjf5OTPG61m5wQL7JsjPv4QuUQV9B47gE2gUuU/akTF0
-Nc7JxqLzrBi06XQxkEA+AL92zqF3fCvaL1z4C1AV1QdZQHZwlBcCeflfIGAfA0Hp69OtKvCm
-uRh9MguRZfY/dJhzifa2P+CfrNGojHUWlrcuy2qgkfOLza2sThVphaJWSfjB3oZ78sl0o7OG
-6fZnutjsTp7EypJ2sX9J8fguUik+jIRir3FlszryWU/AT84ysFtkB4fgV+IcTHMo7GedAMdi
-2eG/sVz4o5mVrbPXKS+duJIg2qvlRR/lXz6Icn6HPBYVaWv4NV2PK9OZ9Cm5K6N9Ei0Ae5C2
-oCppzh/gXFYB9F8sLjpFc4lLkZriVGyziFhLwTvHBGXFXOEHH50KaKqzEB23AcphdQBFzOJC
-MXOCX82bsLf9EOXlJ/FAmV1f5PXILnEKrxPzkSqSQG6xzWkh/rLrgGL2LVTOWkWymHlJ2/hM
-3DU+Ekfim9GX5im4K14Eto//KebHO/GvreZiHm8Df4Rd0GR4HXYGAyWf37S7g4H2BjjW2YoV
-np2G+Sk6HfzH6sAGqhu11d7jsnouWkvPTSeqN8hiWhBvQ01Ad9BW7BMzwCwwHl4GH+Ew0Qv+
-7hzndWxib7VWWq+tFVYZ2zFz2Cut1vYhmzlhe59z0OnI3/LH/HdeXJTnmWQVwUFL0Qm053XE
-NL5J+IQjysNnvCq66pxAO5x16DcnDx7vrMHv7CS00/KLS9Zr8dIRIJ8YDWfx4lDj+cFn54z0
-0gp8EC/BH4t1zjDw1v4StraHo5vWLVTV7ipXWoj+5b+jteJrVAZ+g9agzigTbibj+E48gn6g
-7ZRBbLL6J62rJtASykO8iN2CcUpAAdKH66ij4wXrnbVis9PbOWwfsWo7La1K4kdro7hsenne
-+E4BYv1h7vh/aK65DL+Ll8aR2DlU1LyBe9klCOIPoI+XFR3ER+fV/+PoLKOjRt8+nDxxG6nj
-7rpIcXdZpDgsDsXdbXHXxaVQKO7uroUurou7VUbiyRN55/9+yGk/zJlOMvf9+13XOZOpu8Iq
-gh6ArcAISwG3rQ/YQNgad41JmKgrYL62FktTQ9hWNRu7oVL4Oa0i9tiYicowBWnuVEaKoQ3c
-WGyCcxx7ZwexVKs3NheWAz3gDLAe9sKLW5lEGbsVpdrVmS/OFfYcspBbDM5yN7CxbDWiEL2X
-HEg2o97i06ntoD51FGlNNnBHEa3tSXhHOAl0NG8hu4yuyGt9lLtD/88uZQy1S5m97eGwirXA
-Es1ldgHTcCobdRC/MQfZabRCOhk7kXpGBppl2qCslR+7Cs+B8tYpbJNTi6DQD9gutGck9RfC
-Uc4eMzdSF57CEHgYP2h0xWKMGEwzWmMDzWZgmlEKrWV8QoaZDdGZcAXwWauwXdZWUNyWkeFO
-FaQ5etItind01xML3SSymXuKzHDSSd3dQ3UCngjxzWYWEWuYVWRTtiq5mG1CfGXW4U9oF0wm
-TyEg0sQbkL5uIbebm22NcveZ75xBRl77qP4JynoAJpsnYSMomnPhS/OyVQX+tk/AYMS7FzmN
-nZeuz8WRCe4z94hbAxnkXncN55dTIjLzJZFjyH60AHIZDHD3g4hKgNf2ePSVtQlZb81zj8Ir
-zjiTdrqbSfYGs749x1xsF4az7M7WMnujDZyZbj2nJPrJroqWsLugOZYFajoaVg15Am5GzrUd
-QqCV0LZgAHYNH0q4JEIl0nE0ywyhhzLL6ZH0P/QC8jO1FuepeWA5OR2ZQtx3lmBRdgP0Gtzl
-JFpHLc3uYj11UmBFp6Jxwn6mLXV+6bvdG8Ykt4IRcjL1BOSEUQ58MXeBPnAUmmQ+R44bn9Ea
-Vh0MQUjsGNoWnQMoZACe6t4jCjvziHiYhE/Wd4A/ta0or80GLbQ92CCtG/ZDvQTmqfFAUkcj
-hF7QtY2G7nzrm/PBLm0nOJfhHLcPHAEI6x0+3taJX/Z08oHVjbpoMcwwZyU7zr3Lvncl9i3a
-l8eI4cJWahrfklnO3mOW0HWZ8uRe+jB2iWqG7iGeOrOww1YieGbeRcbp2U5ImWPPkwdZeeW6
-sL78l9lcWWLU13bphrFYn293NrxotDkDO2b6iZ0wSIy2OhDLrMdYWysMkq00QNkqusguFOl7
-Gcm0X6AIch80AV9RCmvmFsYm2XH4bKssgZmr8cfqLOBXZ6OrtE3goj4Qg3pNUMf4jeQ2nyGj
-YRryh7XQjbX6OI+sg3aWM9O+hEh2LJjnVMVruhvIe8g4ehFYys7ElvId8OJCboIQsvDCwmz8
-En8GP8CNxLew67DtdAPsX3wAGItUQwLWGael2dk5qDe0C+thOEXHrB9GSoQ2V1vFrQFWlLXF
-ymPPsu/bl5yO1gJnlrnc6mJ2i8zvK3jVmmnR7ky7E3rWvQKWopWxL+hKAFEMLQYGu6noA/sZ
-Ut5qgJyD/7ptrVlubktzmsCX9hBY2K5grbQ1q2vEzj5Hpn6LM906Y+WHG821VthMcuNsHeng
-5KC0OwyTEIFIwD4RYaw02RrPS00lOGYdtZdNZY6zjdjjzBZmCw3p/FQvWsSLUByWSPqATsSj
-6bjX/YjutFKcXrC7VQfWheVhitkVvjYqWlUMwY4zNtixxjd7p37GLqHHOhP15shRIxWQ8CFo
-C5egyeZBJMm8E+GnyugS9xZyFJkd6Zorznow2lHASPsWqGzVxNLhPawj9OH5zUF4OSMPPkY/
-AF6pIWSfstUV1JXOBvWyPVSrZF8zkq0CVieIOXVhFtLI+oi1se8TmxyWjkO6sGeRP7la6ASu
-AujG9Qe5uJvgJyfjD4RxVA/PInoEv4puxQ6nqzOr6JJUBXoX1odchVTFdZvEmsO2YKw+HElS
-5tm95RNWtDbb+a5vd/pql2ApNaSnq320eP2hWsKspo20Vmj9HFyfhLQ3MtGSZixoauYH8ZDF
-HlqD8ZNOUeKHO5OYhAwiX6L7ySNYDv4n7gf/YaLDYY2tWmCPSQBDJ8BFdRjaUpmJ5FdOutFq
-bTefXtk1jF5ufvjWHWwtRLrZvZGudoNIb+V3Tjjd7JDbyu4IrjlJZAt0ORODrWGLYXfZ9mAq
-Nxrc58fi54VBZBofR+Lsbpyk32AlqX3YSjIP/oT4D8/GH+HTMAe7jjQHVSLcUd3sYf2tK+ZQ
-PQYOND7BHOOO1cg8af8wVTtg5raj4CyLiMzscmu3JVnt7XQ7xqGc6XaqM8L+gAxzH4MktAdY
-gjZHNiDVnEpuDWuHnWAiFmawUNXD5mkdmo/0hvCWgVjz4MLIGbxys53uyMHIrCbB8fZGa50z
-zbnsvkRQtCRmobUjV6gUsRDkIS3QjLwP2pOFscrkTewLMQofTVYh89PH6ZfMArYFC9mC7FH2
-OXuZHcfeYvpRK8hieGesIfoCGWpn2CfMKVA0Dpn39FRjplZcN7Qt2lHjq7YFxujt7cdaG2ep
-VsStpg9GrhsfERL2QWpaj5BZziB0HvIU8aO/kGNobjQLve2WR1PcRmA7koyXcCFGWAKYaaxG
-nmk08lpLRofoW0E5jUJvy+/s09IGeFJJh3X08dZBHY1cywpmjL0ExiPAfo0/clcwq8EMpg86
-n0VAaX8WvSC2iadXNCrU8bVi80WfF6LylImrmb9srkm5asZUjGovJLLVyMv4OnCBaEHiZDbd
-zjbQf8JevUG4uBFEyjG0/3vC6uio3N88OVGrmOFcGfQ7+k75ptT7nef39i+/v5TJ7Jz5QsTF
-b8FfOXtymMx/xbw5o9WZwZLqu8AnpU1gqlo/GCfVz/mZ/ejXk/Cb4DicJupEzYvZ4Fsa3Zgu
-x6egF8k/3GhCt9KwYupOe5XUCc7WFyCxcA3W0hwAVsM2YBiSRnQkXtOlCYq6iZ4Gt9DPaDa2
-AFzDKHQxFY2vjqrpycq9LlZOeBKV7X1Hx7ETQAU+Bze9fZhh3uXMd643tZROIgZgaUh/662x
-Rx+rvtXCyjP5jrQmIAcK/prxu+GP9r/GZs0LNAkXVjJEn/ZQHmqcNbc4ceBuhNff4W+QxW5l
-ON8IwYHmCneCU9kd4Ty3sqy9VjWHR2x0GNYCn4/XwzvSxaib3HlmANOB8hD3sP1gHKgG/sWm
-gSSSxhrSl5BV5Cx3HxEDOlGLnQXoE2O5+QY+M1c5oyzOqWhZZnFzpFnO3A+xiKeUjZj1JThG
-a6/3MOtAym3qxropdiV7iFnXrmZKWFfUYTrSNOdlXzN76G1Eb7wsmhrxhVX2v3Y++7Rd074I
-H8MHVi37uT3WqYrWQ/+hLOIWvYuoTzBoXvDM+oUtcDZSZ7F/iQPYTfe009aJcgJ4a+IRM4dt
-R+dn7pJ3yWN0daotN5YpxjSk/wA7QCfrlbPUaOlC+YDdLDjSyA7EGp1DvMFmjQh/+Uz9qP/J
-86X1r8yfSaHBwWKhOqEZOZsCT6V1yjP7lBtEl4I0BHHPu49gMl7K2UE/Q8oyU9Eo7it203eY
-qR1Xy+fE+aPx3CviL+WPztc4f6F83ROKxH/wXvMkeSXP8Oik6GxfAf85KoOp7iSDB9ZZtIQz
-AitkjUcDyj1jT2i12EfqIc8WKWlwzs+c7dlpOfODMaHH8impgHJeHCl7w0DrKMYbj6UJxkw5
-jzI8tE05H+5vV4QetBXS3d5h19LTjESYy+7oJqDj7LmuCTs6tZ1VyBtQhGwP9lO77d94Dxsh
-h4IB3EDK9ewn8nILsNNkGnWaSuL+ou/SZ/GiWGu3DdCcd8QpzCBcvATIgy4G95EizHoyR/jK
-/MsXohpxs/H3nqLUaP8/TH8hnjLJC2AIdgEh8cpYZbQCmKxXNYeJneQH0mnljjpcvxu+L5XN
-qhx4mVU4eDl4VtRDllQziIg7w5ulhtoyvR28AKvY+yOpZ9kJ2CCsNTGRmIRtx0bhCl6DDTBd
-/Ce97z3feS8dIvJTZ/HtbHFmppAipJMJtGy/RGpYc5FL9hE02arq1tGaGmOMRHOtm9uNRu65
-Tyy/vdi8bqa6g5EDYDx+wL7iztJ3mraumYXdf9yvjmAnm7k0EUbpe5FS9j1wFanpbLSHWBus
-AWgjsAr7G3+OZCO63dceCmqhyYxK6vQc4jxeDb2P30Z7MVspminJCMCL+Z1PTi/AYX2pMdR9
-bBAYakf63ebgRHwc2pomyN3EI9zFbmElyFbkEVKjVqJTMcNa4rR0LrlP3BroT2hZl+W26l1p
-v9pZqwlPK13NtcGNckzWrOCZnG7hbuFDcocgJ/qySwf+yBkdNKV4dYK2UO+pjdZ2wpvmENAa
-WU2+xHxEMbCD4MFwfgMd8t/w/Olf4LH5s2xLbx/Pi9hFsfHxauyk6Mn+6lGVvYkJm6On5lod
-Mz06xrfee1045FnhKesZ6stP3mbqRTa3nJYXVtQWm32V1eq4wKmcLjlZWful7+HpykGpcvhL
-sHB2clbDwITAYPGJ9CP0h9gph8kZkp2ZmTdcK1hNdsPxylMRh+OMstj3iJGtoF9gLcnnSErk
-KvxL4lQP9iz5iGmANSCnYY2pGtRSrjCZn+2KQKyefR3Zj3jwyfhF6ip2kZiCnkf2gTxIZdLC
-AmRz4jLxG8sVabUirEh95ASmBhkCbcAiZzdRCa3AHSBncLWp29RIrDa1H3tAD6PSqHfUccRG
-vhqEudvAzMNmWYjo1fX9UkVpnnROPCi/lglxpjQv1ESsJWnyMu2A8Un9rXuk1vIX2auUsALm
-G3ANqQheIr3doW5v0ARDqLX0bLoyO5D0UH3JdmQzZhlTnq3FVqKrUAOJ/Pg0UidSyM1UBpCJ
-3oiM/+ty+Ci3FDbXbOJcVTbq6dojvbD1GU53Bzqd7Y3wrfG37oGPzPV2tt3UXedWtBNtzUw0
-NbOgcdwIqCP1osp2PUX5an0176MzkXQwFO2J/URziGv4ciadHsa8o3eSJjGCSiG3cz/YU54s
-YR43g+1AXiDaEVcInPhMHETrg+c25WRHOHgR2IUWBgT6xNlnF3Bq2++RBDQDjcKGuEOQizbu
-bHcd9xTaBkxyv7tNrLtWirXFfuTmQUsio1DCam6v0pPNc8pXPT38XPHn9A5N/9Upc/2Pez/P
-/8z69T3zS9byYFRosLJaeWw8MQpEuiIV7jUX2IWtp+AOuoU+TrXnl7IzvIJARDX39YvBYsbH
-irGH4/LF38g1Ilf/vGPyJOZrkVdKeBX/yc/4znKnmHrUEwKSd4lb1JaIIS6iVhNtyD3Ocbel
-huqDxWViR/FseJQcIy1QJkm1lQ3iaBEGx4WzgvdCJ4LlgmrOkGAosDaQEWwdnBBuLJJyT2W8
-2l0fY2zQa5lFjZrwPLxrW46NLEME7LD9DRkPM52aEb4cgn7CSGI2+Y7sTo1gh7KNPR08yd6V
-kW1yhBL8E7YQO5TeS3UlD+HbsSDYgaZgJcE5fB0WiyWDfUjhSGtUczKtLDgDfjKfWCstA62M
-XqWakKeYVnQxhqMDlEZWILOIi8QN0kN+oKoQF8mq2Amsobvdua2f0pLEEeG04LbArlC1YGnp
-WviWskhuqGbJtRQg91X2yTu0aG2ducnIb/eBTdDXzkSiDPabvE9MJE+QjYhZ5DjiNDWM/Idx
-qIncWaac0I7Zz3emh3AT8OYU7y5GN9uj3G12ovvBBshd24cssv3uB+u+Xco8YmrGIuMAbG6e
-sT5FyLcHfGJT8KNT3yoSSdZL9kHYFOrGDP2XNtN4qneBK80a9lcrC7mLlMZugZdYAvYHloEu
-xsagI/D54MP/39tZCK9P/MIv4/OI6kRFqi2ukV/xBdQVehW7WUjy3PNc83TlzrE36AFULtLA
-PKC3O8p9bu1yitmT3UVuB2QMyiFL0cbOYfcH/GU1NUXzlFZGn6qsUDD1kjJar6pPM+eYvYw7
-BqXJmqC21tKUAlp3pZ92V1bUyco79YjaXRui2Mp9Kbe8Sq4n83ojrSmsYOZABLJ2Bfu18wdi
-uC/QGkh1IKAfwTsSpY956/iqxI2K25tQO+FFwvr42bky4rmEPHHfoktEzfKleif6mvr46I9R
-V6PGRV33FvfO5gjWJtZhA9D2ThG4XBumVBAFCQtnhuYF+wa07JFZvTLR7HZZ04IXAt9CHUM1
-xK/hF1Iu6Y4SrXxWOqgHxepyOBQv7QxPlu8o5Yyr5mKnjX0bTUFGErvRu4THrQtUa60b5zRG
-WoIS+HxCIhdQn6gwVY86Q70lGzEj6M/0BuoEpRG16AbkHWYv1Y5rzqxjulIbqdk4R83DzhKp
-oDgxApTC96C9sBT0FlYdO4leAfetfS5rHrBb2X4EQTeCKPQjegi9hL7FFmM/yb3kbbIfWSHS
-rScMxPyqBfVa+k5js1bLyNC+6R3MgNHPTNXvaB/kE2pFMVWnpDowl1oeJmk3zUn6FbOfOTti
-86ftO24ue5c73VERjHxGXeJ6COW5qsIUajxzlqhFlSCWkuvwrqRAPqfnUfu5t9Qafh2RzcxF
-+xMPnYcoZVW3q5opxlHdUl9ovZTF5lntH+u5kd/qarhGcy1R96nrjM/aesiam63V8AusBznr
-P/O2vQ8es3gz2yLM6cgRezKeDApQHSOpcp7kiRvUXPIPtgyZjz2Ji3Qf/AadTqVyq7kkzx/c
-KL4fLdAzyBrEdOpjhOibEj+xbSAXuIkORbuhfcENtAjGgIYgHfkH7emOcNtbw611OmkWVF8b
-hlrXemZmwpPQ1PIZ/WREGyXv1fqo5Y0ktZv+Xv2lfVFxrb9cQI4Tr4cLBe3AqpzcgTtBPeRK
-m5SFumyOsg66m5FRWF3wDvuEDEdHogXRqcRr/Dr3N7fcO9Tb1dvQu0g44PnKjfOcF2r7Cvi+
-+8/57ahusetjJ8X3iDNja8Yc9k/yZgg32BH8Tboml5e6zSQTXclrIDe44+6xz8AO6ny5RbhO
-KDqcHJogJoXriYdCTjBPoEOocGBqeElQCW0LdgstDpYNrg6+DtQOdw72kUqE26v/yb/Ndfp+
-ZywcinSGj51kq7bzD/oTfUCsJyrTLekY+gX9iiBpHidoGutBXcLSSIRIIOvTadQ1IY7b7n3K
-/uZnkhn0CfQQSSM6cQrphL9F2uMHQJP/3a1CrCUWYzK22C2CWPZF56o7ClmBFgf/oTtBGFkK
-VqHz8DpgLPkbOUHg7jKsnYOC/O4bdKU90g0bH81CWhntilxQbigfEk35W3iKVlo6aV3W+iKZ
-ZgCZDV1ng1nIxs00a7G5DvY298FIW9kf7W4gL1aEIumG9PjIJh2mPpI6lZvqzkwjZeYT9oxe
-itdiDWIVR+JbmCJoUfKcexusjLw3o5Ez7i/Htj5Yd82asLSZDEtCYLBGXnWhekZ7pb2D3U3N
-GQGLOIf1JLuCGmtvVzQjVVqojRMvaqXl+pA3yyEl0JZgIf4UfYGPRVfhRIQmnhIfqcnEaqop
-1ZcZy2jcZ3ai5xBbx9uLviikUGuExbQi7GK6CIuZYVyeCJPOYJZR3al43AUV3C/uUrjJNc0k
-JADru7ZZz4ky/7IfGV3gJv2+fl7No3yWXkmtpI9qW3WscVL/yziiP4n0So7qVderWcpv+bqc
-KP4SG4daif3DX+V60n/aUGmuniWnG0DPgdOgZZ+1tztN3XtOFfwr+EiPpcTIe7+Z/IfCyDS6
-DvOR/5tf4dvlSYoq628QXTUmJuavuJoxw2Iu+X769wvT/EGhuz/DU8DX0bODy2YH0jvpv6gR
-VFNsLGhtz4bRRmXVYwxUgFlHPavHKYbyQvwmcuEBIiaKoZPhDjlVgkr24OCYYJOwTywlvQzL
-YtPwQjFdaqHsVCxthrrcuKOx8Lc51untvgNDUB9+DskAqNsSHYtcjCTod+Jv4jh5nRwU6aJj
-9Hb2KZPKvWWOsh8pm51MlRE4ZrTnFJPOF6ZTmUfEK+oK3pM4GSGw8hF6G2PxTmOrA/LGWRx5
-tjzoGaQaWhcw6FPsvdMcy23mQXprE5x95hL0izMLL+Pmw3KsOFewrlqknWHts+7Df81XRgnj
-mZ5ipBpfzDJmGaOlNkYbKpv6WjnRmqQuc35qedw8+lSUgqn4Q3cGfhqV0MboY6Q1OIHvoBCm
-Gt+dWc3/oJvxi5gz/FhmMH8GL0Nzbics2WmFhZGK5G8smqmE3aK6urmxxVYBNxYWsFTzmtnX
-rG6UNDM03tyrLtYuSnOVmAjR9Q4ZegkpwdqiGvCm2gQuVFvBxdpdyzQ62p3gFXjevGmlWd2R
-F0hPvA3xnQxRv6gf9HimRKT58gqtmC3CQ6qXkE3+4SlM/etdT2z0TMN/8i/J7YKHK+XdziMe
-SP9JpxMTsETyEMhFFgUyAO4UdwDc7raBKUg2BM7sSH7Oknbrc8P9zGrSbPhYjjanykX1qvI8
-dbf8OUI/tcSXcoHQRWmICJVyahcjVt2jvxSPytXDr8Vj0kMlSRWMPtoGExrL7F9ONxAC/xJd
-wH58FFIH/EZd8J04QRZix3IxvC0ME5Z4p3i3+D95D/pze/P5tnquekI+0pcY89pfNHqHN9E7
-j+vNF2VUbhNTi+WYKuQOohPeFJOwPCAccQPDOW5l62fUGcpO6YQ0WaTE5+H4UNWwHPgaOhLc
-E1YDV0LPs4sGYrNrZ7cJ1g2clutE/Le5mqaH9VRzq7XfuuT2sGchdWGW3c8saV2yWtubkSHI
-ZBzHJ0SYN5VdwrTkj3JPWcC9pC7SKpmbPsI8Z16yNZk8TDK5lc5H/GaKERL7gXjPVCar0W+J
-/dTNSNJGEdvBHtDV+cf5YMbAqsYjo5hRIeJAo6yKNoWccjtid9z2OG2hADH+dLsbZZ0sM8kZ
-a9V1G9gl3QP2ImeC/dVOsCAUzKBeQ2uvLFEksZ96QixgVJCr2fm15mg9szVew/6IvbEvon/Y
-o7BxSGNKJI7QOFOHbECPwz6TefGfVBFyAFOJ9nM7mbm8n8WFHsxu/h1xjfmK1CJqWr8RwfzX
-0YxftqMPhOuNBmaSVR6ucUpYIWexlWDnjSTpGr2jkaoU0qFUSi8ki/on2TYXqI1hC/WRfkRS
-1JpiSDss5YV9tAL2dnOCc8kuiNxHaqEfQHcskyhI1mBW0+e4i+wWTz6+UtQyvlzsSW5LbGe2
-Tkx7+pa/MLnH85FYxI8gD7JVqFhmEN2E/kZNINMjXbQRWW+r9hUj0wpr5a0MNdpGtHzuIL0N
-UtkIunX0WfYIRTBTxWva8XBefbVEGlFqT+2l8pdcSF4dmUc39Kc0TlqhVFSy1PHKLW2L+spI
-109Zn/S/7fPKLrOHfFGfoSnmNrsrUjGS9+PpM2wSO5+vwVpcL/YD143L5vNzTfhF3HGut3CJ
-P+nd6Znh7+4b7Z/lW+jr5w14ooVBQnOuCt+TvcEmMDy7lq5Px1FF8R9gnlPUHmL01etq09Q4
-daDSSPErScoDpZlSS/VG3H51xJi6h/OK4eCDYNFQdMgjdhA3SqLUW74mV5eXyVWlY9IyaaK8
-Q6mtJhvRhmSfsL+iNUAZ4i3emHpAxDNVqeVsRTqd/UzZ3G7mmMcr/PRZnp8+1jvdc18QuE9s
-NP2MpOg/iUHsTfIWJ1L12ILU3shrK+BssXEYNtubUyNEVxS2NJZbJ6x2bi8AwHW8JvDirdG2
-4J0LkPrOAnugXQEWt+OMmjapfbeuqZet0moF2EL6qtWXOmr/qJjR0ZhlnjPHwwuwFaxhbYk8
-61qjldHEqGONMs+AVLstswj04aYQddnN5AEmk3rJfKd1+gLdl+wamU+ZqkBHsXvpdSxDN2Yr
-knvoolgOMQsxsVi3NnbQuQC2OKtRzl2DKHYbh40w5TTrZaTHx2kJ9hl1k5VHO2rRekv7kT4f
-NtAaaz+lEtKR0Ndw7+BKeWU4I2Ihg4z3al/znX4BVreaWaXd1WYeN7/Zye1oTwHrQG8qmwry
-0zmf/6Dnd3RP/4tY2fcjdrznRsxz7nDUfFbxdWH+9K4iS/FZWDbdBfQmU9BR+DOkIDiJTHS9
-oLndBxw2v6IPdNHF1UQ4I1RF6509WPVlDzPeBjs6CWoLMAXSWDe7lVPPDGg3FK88Rxwrfg71
-EHPCxaTFcgUlj95bLQQ/KK+sPXJL+6iYaB2QYmxai3L7GI/cv60H6FfkKJ6B3yHrUDXps0xV
-9jf3nYvlW/B3+D3CCmG8Zx1fWejHpXKluD/Y8Xxddr9QgyvtLc5X9K/lq/oc9gWfQr+m5xAb
-8fNoC3So63FTnVt2miNbM5x065X9GtLWM/2rnqyOUZvIw6QbYSw0PxQOzA9+DrwJDAheD0wK
-mYGz4WKhK9LH8BolQb6s1lFsdY2yXPupzTXOwwGwqptmT0E010TygzzYcrwmqZN32WIRQia9
-6d4sbzffLw/h3cj3FIZwmUIGF++LdKfP4nzCTaYwEyAfEtewPaBxxAMTkU5OpjPKqeMkuBdt
-wl1gz7SL2elGa1PXfmk39CytpGkafeFRqzbsb3c1f1qn9KJWigbhCO0pLKQFzQr6dvi3sdj6
-anyDGXqqMVKF6t/KN/WaUlnvpy8zH9uFnMmgJ7qVSMObUKXJmdR7XCXrYW0oA4thZTKDL8Fc
-Fw6zk/lLXDJTmHtNzmMW4jfIwdgfRDHcJHrip4l8GIV1RHK7yQ5nJznxdmNbgu1hE5M2Pxj5
-zXVmPDxiPobdjOnwvDbZWKSs0XdL6Xo4vFBrFRqtHQon60GpiP6X/F1tJFdSRspr5Tj1jdLM
-yDBO2AMcHiSgM4h4/CBTjWKF4kwz7162TJTIH4/t7k1OWOu5Gh8jDI/bx1+ODbPBqJFMG+9x
-qhT3DF9ETgZ1wCV0v/MevWUtQ7pDLkLlkazUZsM2MgpHSGvNpdLmSK97rGfKXbu3OtNJUYdZ
-6fJ/xslwWFsULKJuC/6rNBSPKbXkUUo9ZZxySt2n/NYPKhTMlEvA98pkuEDfakcIF+ntrAG4
-2xEMdW9hPdGjFIXfZTPIKXx7mhRGMWuEQ+xCYSl3hHvP+ZhYLkwO5gTK64ll/vTH8xWilnl2
-e8oLJNuJqRNJgmqkgSPkNiIJL0D8Rs+B7i7jDrSuR67ie3Og8cZYo33S5im/1ZJySS1duqvW
-Ehn5ehAJv8mpEPw7UD64PXwt9Fp8H1olyqE74kDRK82XXkqz5G1yu4jh59ZKGoJZyiadl6A9
-9ot6RSXw07gZ3m9CyC963Kjx3or+jZ423lfCVU+ikOrZxD8VhvAv2TUszhyhoxiF6k1fpz6Q
-/anD+NqIJ7xy79pVYHm42ugJd5oYPGqWMpeZ243WcIlZwT5nfXcWWv3sA0YfM05N09LkqcpG
-pYm8SL0ot9X36uPMphGq2+Q2Mpe6uFbdVqQOZnVpsl5NPW2ETMYu4LxwviBj3U1gtuuCzoif
-+Ih1ZNbTkN/GjeeXsBTTjhpNtiTKk+fw+bRMtI+kfR+2PvubNTmZHc6VoCfQncA4rLG912kG
-C1o94ChIONXsa0hj9yHy2ansbrYeWE+ND2ZZfZ4xQL2rF5aD2kgxQ1kZSpFTg4fkQDBJ2RYe
-oHaXL6jj1HIa1FDtkDZWDal/RTawltnLau+2QO9jw8lESuMesbv8Ot84dqdQPl7nS8fn5Ym4
-mVyBmNNslu8UO8dzi3nCX6INrjXznVvDxHAl6VbMFewYnuJ0dqbCl3px05Yvm/9JmPVb6mTj
-cmd7vvQB3hBbQFpqZl4SN+pXxPLaCumiYog+ZUu4vvImdFMtJ9bT78rJOqvd1ksbQX2EeU9/
-BCdG+v2KFu8c1To7G/VEdy1MAu/da2QIa8reow7xuZjtfH86gZtKa0xXpgrzhKGZLsx1uimL
-MJ2F2Szp280v80lCA4/JKdwT+h1bhprCzCfHRhorP1WKCOBtsNvoNrSk88NtbbV2D8K8bjKk
-XcbM55xV75p3pB5qWriNeDB0P+QPx4bLiQ9CA6VNoUrS3dD8CDknyuXk32JReVzYlnJChyRU
-vCbdluspr/S5eppN2SHktytiMSAX5SFmMXvpavxd/rrnmLeCf4N/bBQble1f49N9LT1+3x7u
-l284198/lVc9nblXkR1Lod+QQfw8PgNZhba3ejjPjY1Wpp47YsAZ5nEom8Vhw8iUysZlo6q5
-KpKD/6kTjIBSX8e1h7ocOdrrtfUj2qUIJTfSKqjxuqReMC5pj01Un2lO01PMw0aBiGW3tO9Y
-+dzDTl10BVIIG4lPIpfTQ9lK3GKhBBcW1tPlOYwsSLUkfmM16SD+mL9Gr/L+YNO9aexOIZte
-wFrkEXIB3gfrCP6J2PsMV4680iSzpZNq5NiPjRp22FwDh8C25kA4zxgDMSMZckaWMVKLUerL
-W4OXwguzS0ibcng9j9gavlPGRVK/mvFUba5NUutozfXc2jKT1Xfa88yfyCs7Fq8FZtIO2Vf4
-h4uP2i+UiN0hbIvbKWTFLRamxq4VfkS/5uOj6vKNfQ/5/Z59fHn+C7uNeUMWIFtgjYEX9HX3
-IkMjZ0uZQ+2H2g+zmfKHjkun1avhDxoufTPmKBvgGm0s/FMLaeslVD4fPBG+kFNF7BlIVA6F
-Suip4gSzj3ISvtdPWPWt69Yj+6rxBJ5R7xhb1GPmAqOvwzpBUA9MJb3EWvo4wTNdqeacwR71
-7uGb+cdytb2J9N+cTXymJ5OQmkSlk59oD9me+0YGPRjbzP8v/9Y7l5P5M/Qe5jVpEbFEfRAP
-Wron3JvOcmS2Wxp8Q1piQ5FUcAQ2cJaoG43fYrJaNnRH+phTOdwpu2FwRU7n4I9Q+1BreUt4
-stwoPDU8OZATepqTLWWH1mt/KRWNF9p6Y6G+B241f9ip9ipkIXoSP0r8wcQyDu/yU4UC3nSu
-mSc3l8VP4UZGjKkY34B/zqX5mntaxs3wD4xv588dc9rzxHON3cymUNepXOQLPBr/hP6N1HaK
-WBlwtHkjMpXxRnejufZF66z0UbOldUpDKY/6XtyoJousWibcXqkefqR2F/trhrQz4iMjtAtW
-O1t0BoCAfQAsiFhsE7OTjRqHI8ayHXYymzsFnJFgOpaXvE5tph4yM5mRjML76e/eH9Qc3156
-rMfHFRJIoRnfPdL1T9if+Ct6M7qEmoJWoZqAGlR9dDLVBNlJZrq/8Ppub/SIFbD+NMrCyhpr
-XVPyOGlqMbesOd6Btgq3O2/UE8YW8akUCumhbWFfuKnCSpSxQh5uzlGKGf0UTqsoD1GWSzHy
-RHm/sly/bgCHdz6DEDqFGoZvZJFIZ94ia3pG0P2iGL5hwjhPu9yGZ3jCDOF6zER2rO8x9YF3
-iPJsbbI+05qezHi5FGYHf47SWQE7TY1xHVDa2mLfUZPM3OJDo1YYwn3SKPuw/A5OlIL6ZXG+
-+lO8r1SSefmb9DP0M1QyVCA4RtwVWqaclkqqc+Qc+ZKUIltSWzVHIWFeeMql0O4gB8/ANLI4
-9oscjyaT95BL5HaMYhoxBt9FmOor7TkdVYiL8u8hy/Ox+BuqD1aeuIabeDr1mXzBXWE6eu6w
-9YRt9HbuNLmUEYji5CewHBuBhsEjZBe2C90L+oFCSHXUsJs526061i7rrN0Lznby6SqkFFNr
-J9aSjgcfBW5lH82KyV6atS+QkdNRnBTS1KbyFDNJ42Evvb/RVS+sTdEGqhfUHZFjif7O2GUV
-RlJRlsxDTWFT2Of8X9x3YT6rCZeYIUJzfrK3lv+v6BsxDWI3RbeP0jyN+TL8C/ott4/2CRuZ
-Nx7A4t7qkYbwU4lUZbQcetnoZxVTeCNGHq6XVbxGvOo3V2mDI0n4RbtgtJAy1RuBDmLDHD60
-IzAw/CGUIu2T9ipFlOfqLeWH9lZ19Dp6K7OxucieDm8h72E9MNyaBMo447B26E7yF7hO38AA
-M43MZCaxS3lHuOV96uns44RXQmumKHOJ2IHbeH4sAy8LOhHX0Nd0b3yf0I5+7a3JTOFdvCDZ
-zi2DnDFrWne1+bCZvtt6bD533tkost1tENmAfbCuGW/uUDuYPdXcJlQb6UOU8+p26YlshAtI
-50LpYtfQHMkKNVIOSpJ6XJumL4fFjUdWI2OKlct8YH8zPchWm8T/ws6zGtMg6p1nZvwu75n4
-84ISc4I94v9OlfcmUR08Lem7wiN2rqeFsMh7h//Ab2W2kB3IKLQ/obkdiB2IhudCKuONHQ/6
-1PxiX9H/s4brPSxH/Qt+kz8bO6THemtpnzonnCqpgSixW2B4yMiZFziSEx1cF1wqJcn7dcJI
-MseYJKwPH1kj7ZHOCre5s82daLl2YWcLQuMl6V50Pk8b+onnOLmf30wN5E/RN/np1Dn2HVmc
-/krH0SS/l33AAS4/PY9qT/jxEcRBzKECZDdmFJOfCdHF2DR6GHuRHkvdIrehDdEbFmfFWdvh
-Wvu5LTgZzl743RqoDzZp9ZDeQdqqvAp3EYeKP0JAfh8erXSQqqgVpB3acGmOVlTSZC00Rjod
-nCNPCGP6ePVv+BM+tG45ba2FTgUr0Ul3fqMaep88he9g6v6Pi/ix3oG+vdGj/atiTnrm+Pdw
-NT0n2XT+Bj9emOf9Lszx/yf0jSoVmYwyfF4eoY5RFVEFj3M6YFERXkiBdRzU/GJ+0Zro+9SP
-6m51oPyfPEu8LOaWoqRrynDlvbZFXaCmyqvEZ+HYwNXg6uysYPsgKTWWTLWrusy8pO2zxuqb
-bdqIdtqYf7k1HD/WAHQhixL/0SPoH/w6LsF/SKgYHSOM8N9lFwhzmDPsJ6YV84UNUcPZAcTf
-zEssmvmGFaQrYZWpUmAGeQRdT7aL/OwA+hE3kL3EF+QrEQe2Yd3RVm6sUz/CzIPM/uY8eA9m
-QQf+jvC9oXxSDoiCOCGkBcqHSgYOha8FM6X24ne1gNJMP6/E6yUVSn+mtNSba8uNDcYuqFtb
-3GsgDX8b8YepntfkSi8gJnsW4eM9XclE324m6D/DN4yawd/13mP9wjbmHHeNespcI2pHyKoL
-cZW6QFL8AKa+0J/muV54D4pFAtgwqwhyVN9uedTK1nK1pr1FO2RV0xKMKGWQ3FRcGO4ROhgs
-EOgf/J1NhFsFukrNws+UOXIHVVIUebj6Xaqo5VJe6InGQuuXXRc9jx4g5mC56fXYODoLm0Lf
-wE/RZagJbBv2IX+R3+Y571nmu+3p5NP57sID5judQjTEL4Dh6BnQCj1IZGEz6JZkd2YveZxZ
-TRr0R+IUuQXvguFYbbQEGIz2BzeQ+ajuxCMTrK5ON4O2xmvrzbB6wBimiXorra92Sakud5MS
-Q+VDjbLbBszM9YGR2VNCeHC29DO8Vy0r/2keVGdaA/RilqP/A/ubtax0a7F7GxGxusRf1B9M
-K/aiMIG3/c2EtjHp3JDonozka09/8sygT/K92ffcKX4a38yzQADeHp44T7rwjV/PX+XGsPfY
-jVQvtiqxjs4HihFNIxt63FhpDVDKmMWk+vpaMUslpCfKW/G2XFP0SX3CA4JI8GvWuexnv1Oz
-2mfeyp4caBOuKXfTPuu9rCbGGnuX2tlaoUywGms9nXi4HK3oHozw41pqHjWRPcdU538y8cJp
-Ok6IYm4IHC95+nseCsu9s7guXhBhlFfEJ7o/qEEkIuOJGWhJehLeht1KKkwJcii5AAwHr51F
-7lyrg/MUOk45m0Az3Y3YR4BiUVjQyUFqmuWdz0oLE5P+UJPClUQ9VD/YVrwSqCMzoVvK03AN
-JVkMSH6puzRJriZNUXooT7Vcpgtz3EzkfYSOH+PPiZpkc/o2XZ/3cgm+n9wnfx7O9Y1mN3nz
-RjopiXSYH2AoCdA5eAZII/4lalI/qQA1mT5PraeOkwbJkZeImriE5UOTsEfOZnyO85wc5hrE
-b/suWtN8Y71U8+tvpXKyN7wqvDbQUkwNPJB7h4oqG0P1pDXByyE38DF0IWxKpbRS2hUYNoq4
-K61f6FT3KP4NIch9LkucdjrjH9y6RDn8YsSKZgt/CW19F/lHXh/Tgu9IPqY3EPPIleQ6wscS
-1GL+GPWWK0x+Yprjx2gJ209PIjD6InmPxKgD+FSCBINAa2SxW9CZYJW1zputIQfnmk/hbKOL
-tVVvYG0ydlqtzFswW7O0RvIuqVB4eOhg6HXwlAhDtZRQeKSGSFH6BqmWtlOqoVSUysv3pe0K
-oU7SFmml4EwzDV2CuFRVKp1rw/fmf3km83hkz49H7eKzozoIc6Nye1b4n3t++8Z6Tngb84WF
-Zsxg9iw5jfZTLDOavsvcp15S54kqeHEsGdHQWc5CdIltIiutXuhd6zgK7LJof2u6U8y8YcxR
-8yn3xVXh8cF2oWs5eUOHsweE8mdPChfPKRz2Bx4HGwS1wM0wFvKp+8Vsc5v8xb6mich5Kw2f
-gA6igvguZiLZmAPUaP4xNVkAXBFfE683eqd3uv8OP5ZvxJwm46kpoASVg+yj6iID6GLISzoF
-qcaUASuZerhKNcW/EXswA3+KXSMe46spi7hEzSLyE2WwS24NtyzcaL007lmI8dbap32ADZSL
-eqaYFMn4c2FOSggvkhaHq0n/hJdJS0VJeaN00UX9prHYzDRGma5R37xoeuFn2Mca6h53p+BL
-8YFMDNuDb+Vpz/X2pNPn+KVkDW4QUZANE3OYaGo/PZFuQr+grchvZeh19Hw6hbpMHSObUZ8I
-mzxItCFHEe3wGVhzpD56xnrpmAZhN9T/tDZrxeB1da15VR1n3lRvGW8i+T1F7q1eFj/K2aE8
-UijwVGoXmqLXVR9bHuumvcFJNZvap9RXsJHyh31JFV3VTMD2OijxHSlLkthsSsNv0U2pGO46
-ncnXZBoIMhMtHOPyCKuFy/w/fAqzhv1FHGduRhK3K/iHGgrqU8/BWEoDYfINqI9fRe8iuSNM
-Y9hXrYG2bK9xAs40N8NtgxxyGyD5nUZuttnfPqPONmdIg7UC4dPSjVDP8LfwzNB2cVJwj7Qu
-+FjqFqovDQ1PkaCYR9HljvojLRoKpmbdhqnOYtuPkkgckRefQRP0Pa5gpNm3+W76fTEf/ENj
-r3gORe1g3wvXKJ69Tbam69HlmBdMCruDPcatYxk+kenJxVAV2Mn4W6oGdpPIBiTeDKxCIZrp
-lEB/wq3uHGN3pI8EIyz/pZWTS6hVJUP+Fm4q3w9NkXoFF4gVAkXC+3LSQq8DO8KLwqnyHWWW
-ft/M0R9bM9RqVmO5HIyRh8KOWo4zyN6Is0QftgU7TpjJZQjduNdCUfYlv5R+xq6g5tCLqPVk
-H/oq8ZXei9diWmO7aD94QqGgKq2BYbQBsui9WDIj47/o8gRJ/8R7kADfgJfAaOwkeAhWYsn4
-J2I4vpuchR7AJ1oB16fFmmvFZkq+4P5wnUClUHSwaWTvk8N3xZ7SAWmVnCg/V/bIP9XL8nbt
-ttLdULRkuAcet7+4w5An2EXsCHmY3EJZVAUaY1rS3ZjydD7mIV2JORGZx4lUXXIF0RMvTlTC
-c8g3RGk6i/xOP6OWMzfoIZFHtaHyUOlgAnbdaYJ0tbdFtPWGY0dyvhlWHYnB1rgk+sMaa8/X
-Wxmy1EQpEGooDw8+UuxQjpokPlKrSZz2Qc7QQ1pl46WRqfU1X2o6PGJ43VmWDXLs3cRpey5Z
-ym5MvrAHkAfRY8xtMtkTyzXwTxNM3yh+i9CLKcvUIm/gvfEt6BfsL+Qwfh5pSX0DPNMCH0TP
-wj6RA0EUeQ80ID14G6IndhIz0GfgAYqBBuhZZJh7wW5gdTHvGFf1dka2nmJ8N7YaBYx3mqCO
-lCuIA0IVgsk53QIDc9Bgx2DLcAmxnnxfRtT26nx1hTY3Qk+f5RLGTDXTDBvv7S6uBm4Tw+gp
-XEv+qKeOJ9YX7d3jf+1dG9XWVy66jX9KtOZf4e/r2ytMFzD2KnuFfsd0pXuxNag/2WjyB10S
-95GJ4BzWG+0DbiIKssA96ZazYx3X7GyxJgeXm4nmf3Ci0dAap9ezQhoBObWpti78VPw7JyM4
-L2tm8FfWh9D7nAHixtBv6Y70QK6grlUIfZN60yis+6zn5mx3r30IpLoqXg1ZR95AxkUm7hLL
-k2hkPx7w5bg/hQ3cYr4EJzOAWUYcIbqg50A75yH62sLx6s5b6gLakptMPI301BpeoCGbQ66l
-FxEvqVhyJi1QS+ggmUFVp2aSPag3+HZiEzoXTbXSrNz6fb250lJVJY/STdwivQsuC1/OqRkq
-EjmIYBkxWcyMtFAvc6D+xKqsB2BerRxsr+a3eqoj7HV6F7e6bYFkDNA+Zjy3gV/IBfkMejZr
-4HnoUSCGmo/upBJAHuYOlpu9QjxgUfo5m5vpzUTRI8hvRDoG8JdYf+wSfgLMxb4jVZDBzt+W
-CD8a1cwVOjAUXdXPmoVNwQYwwe1r0s5Q7b2xUmqo5g6/VRaF5+hrFBeWhJR7z52J+EFL9zna
-wXqCTDFOI+/0/GCGmYmdsyYSujOcKosWZ8ZhddmX+IYIufdlv5OD2O90bpZjKWYyI1A1qVn4
-T/xvsAtrjk7BriKLsJZIAv7d1YhuyGnqT3Q+dRTdj2vuZeSG9cFeZKZDj1kSzor4zXH7pJPf
-GeIkWFOtaoZpUlqOvkZuqswOx4opwbiwHGwpzhA1aacyUD6ujYy0fLo4TLsh59Un6rGwpPWn
-+5cLsKPIajwRoSN/rQkZh+XQVegD/DjPbV+rmKiY53GFY0bHHvYNimrOD/R2ZEYIF+mOfEHm
-PYey5//3v3HZHlwWsZtqgD4Hb5zRyFSHQMo69d14J8k5btexRXgALjMeGmnaWC1Frao0USvI
-JbT/5Nn6OqWUvknOVpaI78QNISzcP/QwPEWsJOdSTqpJ2hq9i1HaHAlZ+M0aYfawBxmEM8TY
-676F70AiopBHsJsMTySyaUQqXYV6RKbSt4jhNE7Up9fi/9Ft8MJM7cgcCLhLTMQWRwieJwA+
-napMMGwL0uZKU4U95ekE71p6r5BEj2QnRMyEJyHWmdgJhhDFQRh/gowHpZyOTi9Yy/ym1VcH
-SgPEBcEZwZaBQsEDwWpikXD7yCTU09ODf2u/Ak/V+FBv/bmomdfUj/Ztcz/S2u4Botx12DZ0
-CHEST6LWkOOpJVQUWZfxEwzXH//K7cI2cbdAXXYl6qULI/HkVHckWQXtQ9P4MmYJgbEoWZmt
-TR6m1xE18FxYL7cyMs4u7+ZE0nmbcwi5GUmV4jAPrKCfUW4o1cL5ZCb4QJoTDEXYeJ6xR10E
-V5iH4U67OJzmppntkEJwM5rPno2xSGniDBhIzsLz0u/xrmw3bBDXFl3MDkCC9FD0LP0OO81A
-YiCjkP2oZHIcvhCXkSAo4wjYWTsdv+hGRfxyD/ECK4tvxuaC7+gCdAFyBe2PFMPeImfx8uh8
-gkRfE8ORDPyiMxV9BUm7jX5SHy+nKAvDGfLY0BA1IXxI/yTe0vPK95R60rzw6nCP4EGxc2ic
-2k8cY1yUJ8NDWgmntPkAmWHORhsaC5Anhh+dYL/GpwKDyUttF1LYUt6qwjlvDW8X71XfL2GB
-fzLfOKoVXyZmmzAqdrNnZfQ0YZ6nIFuDTiAfYybmgBxsOZ4PL0v+h90je2E4WR9sA0vcVnY+
-66WeZTRU5xqX5f+MgnIlI0bZqnVTA0qc+lRaJAdCVUUzZ26ofc7EcL7QaHmO/FpN0nWVM7co
-fY1opZYeo1U0ZpsJ1nJrh3PNzkBmIEuxBLwQqRJpVBviK1UF30gVwGtQOfhp8iFZm7ToYcQ7
-5jP2mJYjvj4e2YM3R2LxSWhFYg2WQJlEPgany3KxTDP+Ff2I60d3Yv+h6zFNmUNMQ/Y0O4EN
-sH2YWoyfIggRnHCn2knwob5Kn6tOUBcpQSmfHB1eL/LBHWK/wAy5fc5qZX3Wbzkzq6MSCjTW
-S0lFrA7aC6e+absbYHG0r5UPi3UGExayjOqCxzKJVGnmHd2O+pP5gvWly7jvyI7QTy2BG5h/
-nQb8CvQ9fx1AbhGGcz+xQcxnUJEag54mWDSJuIoOID6Dy/jV/33fNpLLzefOh9CergH4Xdyr
-jgo1VLaEb6j95E7aLjWsJupvNNysbRLWISto53Vz3B7gT3QN8RkdR/UAF6mdYAxVCzynjv3v
-U/ToIXoJStANUEhBdDV9AUuipxAlqf3EuMhepGCxWH8Qi01C72G/kS34IPQjnoVexWYiddGr
-dnP3ljXGTXZYtDEyEyQh07BEtxm+07mJSfYUNB2udDJ1B7bWppoNtW1GV/Whni7d1muKU42+
-4t9GO5HUD4RfKY/CZeXpUrScoaYp702/Nt/+qfZ2JitHnL/lQu5X5TTSyfiFbbBvUwVAkC1A
-RglLmPbeU/wJ/+0Ie/b1fvRneQf7SvizPJWiGgvnojZzU6KeMzt9LnVOWEqG2U94BaYN1ouO
-xaZRTbDrhA/sBr3cg85Wa0TE45YaV83Leh14UF8Ox+g3zH1qD52QmspnAoeD3bOInHuZ0YEB
-OYPDo8Jz5e1yH3WgMlIdpeRXF2oPtHwmbQ4xF5uVzTgIbN6pAAoBHxlD5Iqk0W4yQDYg55MM
-SZJZhEGgZDqxl6iI38Ifoe0x092NlnPrgl7IYaIPNpIuRx6jj1AD6Vg6jb5CdaUXUIuoJvRO
-6kxkLpdyV/lE4Yint3DYw/Lr+K5MFtUHf4vucaZaXjhdTzSmKmdUVB4s11VQJV3jtV56ttpc
-/SY/kCg5S3yoYPIKI15tZwfUJ076/3F0VuFZXF0bHveZV+JCCIEEKFBcS3GKFHd3dyvu7u7u
-XrxYcSfF3SX6uo7rn+8/mGufzcGstZ513yezhaWmnW9gNolGDZtwxtysFIDPDBey2zqKxACD
-oAPAKSAGGgMcQoaAHE5DKMEDR4i/rDJUE+s8vdBiGNRqRB81y1N9rVJkQ2ATkQDmEWehj8QN
-2MAWQathlzXaamsM06pp4+RM9aFIqD8FUB0lJKr5fFX1S3SIMia6U24mNFTHKKPNTHMv9Ars
-ho5FeuExGEHWxv4hV6FfyQnoIuoROoGeic6gOyDXyVzoJvYZnIQcA3PhQVAFZDJcEelYROZ9
-weNAc2uf2cycbRwwNO1P46S60PykjQNVMxkBikg9BFyHRwMmVBP4DWpjHQOOGdWKKPeV6dY0
-87X60jwsx5qyUMdox8/RQ9GN6pXIdjE29CMiB9IiwdCl6OXoCeGacFGKSO3UitpD/YfpMnLA
-7kZf+KV2ET6v9kCy1VPoTY3G5xnviCZADboRfJA5iS5jYGIG46FGsZW5PM7hyLDnO3bbAPtV
-Jof9QNbmVGKzvSh3nL3IBc72RDmbE+1BlgEGwTX0BGu+ektvo7bWu2h1japGvFnTFPXPOqqU
-VoZHD/M9AtvCPbz1wrCnRGSWe1EE8oiRz14bnxP4UzgeWSmOFB3yfGWcAugr1QlmHX0r0NQ8
-C06wXoJXrK+gYSFwcXAG2gGuSIxD88lrKE6lIE+IydBQbBHYGh4HvASWWO2BRICAWkHxSCbS
-EzkM94VvgL3hvWAt9AEyBj9A3CIuUO/JBKYPXZ67zGyxHWe2czVpkulMjiar4cuwI8hLaCjY
-1qxh3FaeyevFt0JnoaTQQKgo/C6s4KsKafw0oZnQWCyQfpcrq8W0zWpvY6Iy1GwrY5YllQB+
-SNvBq9I7qJ/cCc5Uh8J7dBQ5ZNZHulvzivb+MWuJOd+4bl7VRwMFeiZc2tiJ3tYzcFbvTPBa
-mGyh92I6GK+4u1Z1mwTeZa4Xpdw66xQSMIIga24qStBqgG7tsi4WeQhltlA3ayGhUD4SmSG9
-D4dkX2SUvp1PsQ6JFYDDyjGws9EYqQFCuIJ0I9/j5ek25BZGJNLYdvgY5h1ano4gBFUVYcnV
-cFd8BnwU+QFnQcWRZ8Ar+A+gIdTB2mAJht2Q9P+0JXpP/ZTuLjJ1y2yhV7N47RfL1CZZgH7E
-gvW+wOwiSzgHfEJOQh0RJ3gHHGnUBL6pfquJMt60i+u1L+H6ijfYTa4fjpEORF5ET4TfhL6G
-2PD1SEW+nHhRqqiMU8Nad+Od5QQykJPAQuymOR07rE/HTP0IsdtaT3+F6rM4Oojl0cfMRZxn
-DlAObjlzl8tk4rjr1F6mCTWEjlJpVGPmMtGG7YiXYH9Ds5i5EEGXBxIohzWX9JgdyTGWlxgP
-vMX2AwbUwmpmHtJ/KquVAdINqak4TFrDk9Kw8DqhvX9NdJy7V8RW2D3Sr7BVNMGzlk8M3BW2
-RtKlKuKfcl85SYkozxVKr6wNs5LMrvBy8BKmw4uIY8gfxFg4gnUEFbTAIrHPVjr2w1qADrC6
-ow7gP5SDaqHt4b3Qv9BP6yr4wuoOdYMGI+PQGdhu/DbelyxD7qNf0W7GYL/R8dxusjhrI9KZ
-y/ha6jj+FW+C5yNlsNoQiZwpyoMvukurq/SVaPEdf5vfzJcWXgttxVyxv5QnlpN7iR/kdWIV
-lZYf6w+URRalzQBHaquhleo16JycAR0QvwPvhIXWKOlxEcvOtj5b1cHi0E6wAGwE/ATyzRpA
-FzMduGP8DfTSx0N31SHoQ+UjEaveoo9qZxjU2EGPN6aRXYzWeLLBo2nGDvS28RqFrK1oxOqM
-lAdOg6esjkaiuUZurl/g22itIvO1tpEHxmGehnLFY2iCFI8NlRqjp9V+WLaVTQxECqgX+BNG
-IcdyP4tShsBr0FfgHngi3AAlsA1oEjUCu0G3QctRm6E7mGjBMGC+t+boC4y/tN/1NO2Hlqjh
-ekrRmae+UJPUMup9ZVQRGvxuNjAoELZOQ+usl9Btcx14WZ8J1NfWA421ZKCTmm9AUlNtVfSc
-MjGyWrZFx4m1o6+izyKzIz2jw6P7hE1CW/mshKkPlY3aVw0xHxvdwUdWRfQlWEiMgy/RrZEA
-IyF+xkIvMDXxx8xUohtbhdzO7iQ2Mkn4R6o2ZpEPsHqUgvenfid/p2pSTiqd+kJkkAp6iNgD
-hcmfwAAGABexLoBhRlnNSdWIYIrRB3ll7AIea8uLcqipPkypoE6UU4UP/B/BrLDoZcIjvEn8
-RO8UsY7nuJDorsN/8OBi/UAfpVGoq1ox0lv9JD7VvfpsYCY4AWqDbIEiaDnIgfUFZSRkpSAD
-zTNIljkK22VxBAPeIeAiv+gBZOBLgVlof5BACsBSsAe8A/nAi1AtyAkfLnpHT3gnVgmlyInE
-JopgttG7uB3MZdtn5jfbdboC+4jMI0/gNbDVaF/4ElQDHGoWM1l1inpL2i8fEQ/IhLBe3hUt
-LfeNypJedF4X+ik1lVL6TmO5lQIOgBxQZcSyFiLN9AS4lsKApeUSQHFlFdBFywOWGsOB2eZY
-67bx3mio52q3NZ9aoNfXRpuDtaA5SA2aefIrq1AaDD6VFkJdZRDZqBzDq+i7ac3EGNncTu7Q
-r+ADNAbbqzWDV2uHwM761KI07g5vADOhGlCGWQ0UpNJWj+gfZvnoGmC9MAXpKp/CK2ofyCQj
-SsWZd+gSQDY7G7pkqwG3sY1GWnIZxDpuAf2R1eg61GpqH3qcaAIVw/sDh7BR1nHsoslhEeNv
-pIrRCrLpr83BalntgtxOricNko6LNZUzUqJeSultjFNmGJuVa+YUzQfsNp+CD4FcYBPwF9Da
-+g6eNKdArY2xVilll5rAz5CWhKuJW8IFfM+ILfoysjAMRmuFj0a3RF4JQf43pYq0VF+kjLA2
-6b2h0kBJ9Dk8Ef8Lv03eI5/Qd4l6zBQ0nY5FCql1WDL7DznENptqb9tKLeHu0zpXlRG54dQX
-Zj5+n6yGOvEHSE/0AdoNycSOQidQO7APTTFvoPuN62gzcxlW0XqGd7N2EXfNLsQsYyTaR71s
-qcIQdWB0qHQgigmn+W/h9/yFQDn+V9/xKODRo81dq/hSrjThtqeE9COYom0RRLOe2htcY8TC
-6dZ9+Id5DsoxNxYR0SowEx4Inka7g2OJGtAEai7Umr4KnqOmAcfwXOMS8l5bgpJmQ/wrOBYd
-CVFQNbAUEAPGWDLw03xYlFtloF+R2chnrAU2jviAzyQPkRWos9R2cjXZDp+P9UN/Qy6g+5E/
-sI1oOyQDuQU4wPZGFfOd8qdmiT/l2uJ+GZAaqWPlbnojtaHZU1tv9dbWAD20D+Bq7Q6Uokeg
-XKMn3A5wIMfBsggKfoFmm2+sJP2uvlavr1e2jhtbgermVau3Md3cp5PmUL2xMVKDtMvyQ3mF
-wMsYn6CV5Z/rs/i5hsDbzNKi25wpPQFUuRYyS5uOQ2YJsrz1htxi1Sb7WkOxDPMT1NH4HSht
-Fpi9gCGmDS5unEeG6jZ8v7WfLQX9GhMxPthLagT3DtJjLrMDU6/YE4s1YabGO8lX9pXsHudA
-58dYgw7Sz5B20E9bZbpKyUepx8r8XmJDxtfkmom77QfhgXpd//WCUYVgznQPXPBHwfKcvj+n
-fpuZs/KHlvsq58+COflPCl8XVMubm1PdO8k1BV0DDkto4CQdx6lBWHnrjtVSvsX/6zf9VV0v
-Iq8CvaT6wmt5vPzNLAWMg2tiviLjfw30Q6uiPago9pmZzzSNiU1eXWJ1sWGZ97lz8cWgHBKG
-a1F5yBdqNXAV6aDtMCZJWXIF4Sz/XjjMdxJJ4QIvRE9KedILEIR/JyhKR334Y3Q6DpOp1GJ4
-BrxEOSSVVhGxAohqCfAJrT3UR60IkeqfEK/swatYBfYrROuYM3Qz2wDiHJdDOOzNmSNMPJOA
-t6QOg/n4RXkOcD0YlHD/DqGR9yVfJ18Lxv0c6Sv88Z83/cdj95ScmZ5p3qHh1pGZQs/IoEhL
-YXkEAnprOJkKbyUGgS3hE+o3a5D42nwhNLPypJdAmnYZfKGnIr9acXQl7J79DLPHnsE1cO5w
-wIlxSbmJS1Imxk9KTkt+mvZr2p8ZD5Ko1OqxjtgnzsP2QvYEBaErwcFmC+2buIP/4I/49nnH
-+JJ8ywKv8he5K+a8LSjrvh34K5ApjAukixf493oZw4Mc0IYW7fROelexq/acX6pcDGeKVfls
-qbvSSptrNDdSsFtwXXsrppxjPLORfUVcss9gQrFjHH2LTLSkPZ3Nsp9iHhMRZLdBqN8VpzRC
-ShK2B1f4LvgXuyi+qk/mWe+cyO5CVSR9WcrBwKToK/cD4bw/HqyrxcDHrHFmI2MA0KmIaWrB
-/4oJhhJtYbyR+yHrlNFYVyOJzqKUxEH2Eekr2Lppb+xgiU9x1Uu9d/Qu9s3+LDE96VOqJ7li
-8s+Y5rYT9gskYRuCryKrQyfxxYCMTbVAneOPB7XC68FB7tjwVd8tV8OCO7m9cpa7/3TtDlzx
-VQyV85/hV4SC4i+R+pH9/kPBG94+ES1wMeoNjhMrh3eZ26XW0GC1q1lHemHFam7sVzQBy8dy
-webIIixA1qHf2+bjMvsbFuRak96Y52hPxymwgJmK1baj5Fz7M/gK0QuOx56ibXCf2QI4I41R
-qmq8PsPqAoBAR+sqcgYajb9HzgMDzZXGR42GPxR1KgQVN23GRqCyVRfuAfqNk1qCHlVygR5W
-aTAGeAHEW1XIlmgfe3dyEPcPMom9Dm2138Oa2jbjHPMGO8hsIpeRTQkcGAAcUS5qxYVKykd3
-n9Cb76nuaz/m+HJy/EHm50J/RmGvcNXobrWAr616goP5B2FOjPLj5Ab8CmFIEdkeBDvqiwFE
-qWaKQkOkhd4PtYzZ5lZpAWipR5kjWAkbTpXj5lGXnbBjYowrxuFoHJOfcCZ5V/F1JXak7ksd
-lvxH4tlUe1JMLGZfgoDgX5amPzMnGmukWGlGdHJ0qbhXrMv35zH/Rv8Yr+lz+FKD3b0/g4dD
-rURd7m2dU+4CD6Xb1hv1BfxU7YekC93MsHDNmKbHQIqWZp1V5qh7wOFAOXoogTCNiUPMcGK9
-k+NexT2y++PCtoUJS+0e52G6FOo2l2oLpbdyQ+nPSFZkipf08r4nnrjAa3d1945c09U8NzWQ
-4G4YyHZv9791TY9u9o9UOkdqGPcEDl6hh5E+QFsgaPQG3log5sJWohq+FKyPTUXmMV3ITnF1
-yHeJtWi8mO7wltwVdzXz1/iWJVcmjs2on9QlvSD+Rsq8+PFJ3eJmx5fkFrIIfhQ5gK4Cd8Fv
-jbf6ZqGLVCfYSWjs/ytcz3PGezh/s2tlLld4NedmfrGchq41+bC/hbdLAPRfCl70q0KXiFfp
-yfeWOoRmSv8E1+tH+O7mETHLJKVX4FstFn0BOFEvtABbhK0n1lMsnkNVQ7OpJKw3uxUbbMPx
-Eg6exONkclZcBbgH5zAwHNGLI6W1luAA9Znp1GErWytjVFOuy0lattwO3GD8jl0Ak8kGSAdq
-KJpeRK0lkJpAWWhDkVOfAJ4Bg4By1iVzirnXmG6tMr+C1cFe6F7EIuMIN/OCeEqvRf3kQ+ge
-WQ9uSJVA29Dt8ar0WfwutgLOt6YYu9UTyhFxrFQ7OkwgI2WEheFlwuqAETW9K6NjfaPE9b65
-Mu9ZID1y1xckd34E9T0KrwoNiA4RvMIMKV4E5BN8ZfUTLxuYdAAiNBM/CcylXyMQewk7ZRtH
-dnA2Ze4VZRbr+M78jHlsvxQ/PrZS/NXYerE5MX87RjlPc5dsKayDHUNPIpEii80Cxxkriqyu
-mnpHHqzMkOOVLJmQe0v9hW8CGW0lmBGfmCY0VL1ylnVIGwivVCrBl6Ne0x2cr6VHLuvzpSxA
-UoeAuVpHgNLfmesNymoFHYZM4jfiG3eLqeicypWMCbHHneuZ+/Zp1B6uC8GxQ7C61EuoLjrG
-WGocEudFzcBBL+Ep7d7i3uDu5hnvUgoH5kdzSuW//tHLfSE3LvjINYD/NRAv7Q5T0trIBvkl
-/01vq1wEyhjN4CbAUBRDlqGPsGxEIJaTpe3tYuamfE76nAGnjs3cUGxQ6XJp88pMLta8zNnU
-+aXPJ88uJcQtLnba3jXuCPOQi8MVfAWwFuxhFJr9tR36WbGUeCk8NXAqWMqzLFjPvTs4xDM4
-NMIfCv4eDHg3+GLd+92DvSs8W4LrfEcjo/3Tout8L0KWq4W/Uj4aVAv+E38EehhLhDHALXkD
-0t1IIAywMpGG/EeMwlfQD5jL7HJ7kKOctRy22BPOtHjc5ok9S3Rz5oBvuc/SFXRxsK02O9hV
-qhNtJzUXu8mz1Bl6HTMdXG8w4N/6ZmsNeBUaiFfDGpBf0bnUWXQ49Tu6GePBf2AUGIbMBgG0
-G3Qd/gZshEcDUUQCvyMPoNXoa+Qv8j25m4aZDCqJHEdmYS4yH3lMvIS34tsQvKg77dAmeLhy
-t6izpvIYfy/8MuIOzojuCqcLq4T4SAsB9L0M/+Yxwx7fdGFucIwkRZKUZeIB9YGwTz4YHSS6
-o5xUlS8vNeB9QjfREFYooyRSS5XHF3X8OiQdIoqMfAJVZBnsKTLB+YptEjffPjrpUuzw1ImJ
-/yTRCUrMYucSW0/uCTOGukaayN9Fe6w1UqC9tZrJmBon7JKyhaXyB3mggqpblSRlhZIrHZIG
-iyOFr2Ix6aU+VK2I1NCa4Ku0HXgN/SX2XfXADZVJIKVZ0L9GG/SQTsHnVNIap/UwbhurjFNw
-SegSc4165iDs6x0J9pn2cxxh/8R85jqTAGshl6na4Fqkk7ZGHRAtjHwK1A+U8/9wj/G0KJxX
-eLRAzRubv/Lni9w7387lFwmp93DhzECGjwsfDSwRekQmyl/4cupA6bOh6XXAftAcKBv5Dv+K
-fcWXkB24Jra8uD7xvdLepOWULJuZldEuc3uxniU7pdYpNaDYnUxnmlrKV2xUBpz8MHWfrYXz
-PXqE7Aa1wv8z78HllR86J/wUpwSvBuu7vhYm5Cfm9y+YUljfNdpTynPGd9k3K8D5U/ygD/E0
-CU71fuV3BGtL60OfxbWBVcIIbw9+r+ug0MjdUTsePAYlKqPRgLkL3gQMgRZCp+FX6FDiAzXL
-dsE+JaZsDOBc72jBsXaEPmt/gnWwDwUBdpUpkPv0TthVqZ81OzpJMSN7pTfROhLOVxZn8DOE
-eImWumtj1OVgChAhduPl6aJ5J3oRbwgRp+kOxCJ6PDaRuYaGuRRiH5dFushpWMWijYJjEvIa
-/w1rRg8jejGliRCOwSfgCtYK+A6QA6+Hd4Ij4cEmD/yjHtez+LpC78Ck4PbAnVDx0LnoxEBy
-9I6PjSz01Yl89b2PdAzWEJ7xuEopip6u9NFmKnXVgJKo3hIHSleFStINZZI2RD9lvNH/M3pb
-Z4GR8B9oK/QaVg/7htrI0tgAuiOWxgL4X/YFVJZzCHvQvo7NtRXnxtsvcaW5bEokT8LLyPLA
-dXKtmY60Vsobq/gxyqLov+KDyEBxZXStwksNtddaGeWyvkSizU1yDXCqAsN31CxkplkPL7Ca
-EqsNCmtqhNDb1q9EW7A06QAHEdeASfgpwIm1BQ7Ag6Eg3BqribfC/yAK8WbETaodOY1+iY8g
-f0XWEXuh//Cb4EOogtFSvy4Nku3C4ujlkOhf5Inzl3TVDxwtvOKz5bf1nMxp6sr9WSv/4g9v
-rvZjqmtJwfLAaf/r4KlQh5A/8i9vSBeUWnpP87BViExEC6k6dJqto+1FbExc3ZQKqVaxtukJ
-6Y9K9s3cWFbNmvDL94wNpbqUkNLfl7CKC8VepSQnHI8z7GvtLag3VCr0CvZplayD0jD9fmSE
-fCj4tzDcL0XVwu5BR+5TT3qe5ZlR2NFXrnCzO6VgRMEKV6fC+555rs7eRNd6f4HrQRBxjw6P
-dX2TuvpNABcfIFVUAP1ds+H9zY94f6AZJlsgacF/2dYzNRz7HPdZydGNmukI4UvsMnqN+4lk
-Mw/gM2RvYBrs0HP0qupCNUZeqAT5m9IIwS+/Fk+rXfkzcu3ocylVydPHA7Ogv+C3cB1sbdF0
-WfgKsjLWl8SRgUw61ogDyQFcS7q8/RC3wv6Ya8m8J45TrdErtnqk6RhGX2J+YFHsGtQF2gNc
-1z7oDyVEGyMv09eKZ9TV4dtCiWAw2tpPRn9zvwsud50N5nrFyH7fzsh5/5ZwFv9auKdUUe+p
-FbXdWg/d1Gro4+QMKVmsE/2gjBMPGO/VfuYAvQXQ1fwM1QNewzeBSygH3yVLEvXoVdRe4gDR
-kOhILqVasXWoRZxB/sE1ZAZyKcw6qhX5DF5AvLYO4GUNBF4oNzW7CQu1p0VfYGPkLe8LnpUG
-RCYbA+TLVhW9qZllTNCW6zFytnpeNNWoMg2Ybd0gykH32H/Ba9xmoAr3zezD1Lfa0BPgqsxD
-rCJ9GtuFZ2I7UBVtj45G7sJTkdvwMKImsZyqTi8gMkg3Fo8dwVogD5EBUGUgzvKqO9WORS7a
-I3I3sDN0xwOE77obh/e4R4TLetaG0j37vHn5z/N6f6+cG/i6sfBTzjTfNhcRUnwx0eehkrwc
-OR79Hr0ipEpz1H/1PDMROgrXIB6Tq2zHbO/iMuO4lMopK9K3p18t9a7k75kppReUkn8RSoV/
-gUtlZbElXhV/X+xIYs+ks7Znjo9YR3I5WBkZZL4FHUXb5LTU1agUOS3V8bYIFS/M9gn5XfxV
-C/ICPVxvQ2M9d8KvXVWDP/Lbef8u+OKe4VnuPhy46ZoZaeL6wt8tzBfOFp6VunvStPKhOtYX
-8T9I15LQiBmPnwBjKRV9yE6gmzjqOIo70bgHXL/YC2QZexCF6UnoRaIZXpvyYNnUaGgr1lRr
-ZfLR7UKV4LDQ3QAUahTxR1aJJcT3ygu5t75MO282Ny9B86HZ+FpcIBdQBvmTGkQOoABqBL2V
-Vti2bFn7aNtP+wX7B26q3UX1so8mUhx5RA/HfaoqN5eqhp1CP+gvTVzqot4ReinVpY6qLtlU
-Dy8JPwPfg1tdOZ4VefddL/I2eeJc7wKx3sORDr5u/Gt/mvAgzIvPxe5KR22kNtKMaI2Bu+pf
-0Fh1J5KmD8fOWgJ+FT5MFMcqkmPxiWQxAqZeEunMdaosd5cZzOWwnZju7J9EXwpGOOw9WA2+
-AndDWuIKdh/X0ZrIdQA1mypjpfwwxe/zP+dT/EulsYGR6qiQS+PD1bRVkaPKwWg95bQ4REvW
-E82u4AqzDHLRbIi3BFjmEHTQTqK9Y/5F7zqrImVta6F02oXcpX6n+3NbbI/sZ2317GWZVDYX
-HYnvBFvCDNQHLoY+QO/gs/A3eGvsJuIGj1vldY8mybMUTP7Gu/kFwTahyj6Pb7/nuGeDp457
-t8dZCHsCuXM8k3IyfKVymwfCeeXDVwv3RO97Arwj8Ig3QlcjZ8Pzwznhq9FF/F4lV/WDGBIh
-9tFJ7FnbQc6wb+S6OcL2u7FMwvaUvWl7M7qVmp31MHNX5pLMkSW7ZH4ukVXyYtrqYrsSG8at
-sheyjamJxETsAXQPumSkAt8Vw/wpjDJqhmooPd1JUW/exWBq3rrQvHwrklm4JPowXwxMzHEV
-vvjZKi+QZ8s/4m3lrs/XDT6T94a3S8WCr/ij3mL8Bk9baaV/sXEimoeU1MbTjSCZs+HN7FlU
-W3tVJtO2ny3BDrWtJivaB2OPbLnIDfY8PIO8C9VEcyzFOqe9UnqrM8Vr6hPhqHpa7KvukWuq
-hrJI7aJ208JqG+OJUckaA14AUhETKUWMpeoxg5gNTC+6KzWMqkDG0eeoi8xmtj4n29bZGjuU
-ouq8ovtQA8l56C6iOFwW/wRmw02BPWaiUUf9qiTKW+QLwnkpMfwf7/X0DS4t8HmEvDvuGnmj
-PF/zt/rXua+Ed/seRqsG5/PnQnH86Egn/o4oSuf198YQSIKS0OGwhiQD09FrZh08FzhMbkbK
-MW/wfFYsSsgMOoO7R7+0tWP7OhhuuM3GVGXOUQi5hOqB9CAsKxb93cgBm6iz9a3icL5KdInv
-13AXV/vw365/o9leh2wPFdeWRxapf4fD8u3QJblW5J7yWaioZ2vvgTFILjqAmYfrHE68sR0m
-jjgysDRHFlLZwSMHY5aiHWMH4MdizlD9ndvo+twO8jfiDDELLU+txGnKJH4nRhAj8HbEdHQS
-VhtsBbbRW2kjpb5ii2jVaPvw/ggQfllkRtUjHzy0b5zrl4KOrpO5i1xnckd4LhWUCfTxlgtl
-+5YFMzx/BIu7RoS/uHdFy/i+R1f6xvFdAm3ExZFCJU8aCHw3j+MMtobdT8+3n+TO2Ofb7Q4+
-pp6TTDweV6LYpJRFGcfShmd8SjtXrGXaxqQpqePjI0lqzOGEqjHvYi0nZ79h20tR1E/Mj6rQ
-aYgyp1orFcP4xO/R5WBv5YmPES96e/LTPG0i2YXFg6fzKwV25GUFr+dc9D/8Wc37V25vz4v8
-564zrhkFPt+EgubhOPdjIc+/ULvF14J82hL8rsXQeYDGVUbq2SfjEWYjvpeyiJr0EWYNjXHZ
-5EI6jKUS65Az6BkoAV4JlYRaQB2gJHO9+UxZIh9S3vCvtYPR9uZUfipwXdoC4roKQGYnYJdZ
-CE4FgwiLKkRtXGAeERJ7hjzBTqM32p7b3fZO8Y04f9xwaru9EhHHDMTs1HyEJ17Bi4nWcDZe
-CCxGauhnzVYCLdUIVQj1Cnv9//PU5aH40AjPzGDrfM1XmHvdixZs8F9xE+Ed/mzeCEflA9I2
-45jawOqqSHoFpZE2TP9dKwSuaTXRp/pXYoWZzlSElnHTcJt9AV3KwTADHBeoYfaTVCY3uIgt
-pjGv2S62SlwjB0cVsnehVGy5ETWP6unafW23fEg6LzSOvA0X+HK9F13XCw64uhZU8/GFt0Mf
-XF/5N56n0spAQG3AP7Zq6E6sE+KlP5P1OIbpyHZmjzL5NhdbVHfb94TbbInE+tTz2F7YcXsQ
-8jAboR9US7QzjZIfuY30PecR6qiDJroyc9BxmAf6BxwMFli7LadVUe+t15O/yE+jceLYgBr5
-210u0NQ13jPb3cczwn3fM9X1wj2oyOBHemt7ZvqvePDgMc++4Hv3g/Ad91oxzxtQDwU7Gm2j
-6dZooS9Ai7JFiQEgSz6NjjTbk060ODWafEArTBJX3D7A3jWmTcxf8aUT3iTNSWmZ1iqtfol9
-aViJ88m3U0XnqNg3rMo0ZmLIQdQ6/DH+C56BbESvW+PgEfoLaIX6ExojzwQ1XjAyo2W0KdGm
-6sRIcWV4eLjcPDJVPhleLSb7d4bvFVT0jsmdWvg8j3XLhS19pHei/6tvjG+8v433asjp3ylN
-Dd80s8ULyHp9MPkD/IOhsBs0hv9LVkQzqRZoF+ox9oB4hmUQ7bAJ+GDsDurGZkJDkWL/u7dN
-dkspUj9hrhISWhmH5GHAOe01stlKIZpAH9FqAAVW19ZaNZT1cFezONkQ+0k/pX5ncpkmtMhW
-KtpnAvOnrRTb2H6NGez8zN2Pm2G7GzeDAu3roJ74DIMFI9phU5BbaT+i54XTwXNhzD8o1N43
-L3TNmxya6i4W3FRYJrC98LDvkHuj/7yvV6Rc2CNRkqb1ljdog4Qs+bawRZqndFDPG3eMReBu
-6wK817KjNYAFeBJ4nVoJ7qXbQZfp+8hsexvqaOwqrqFjGdueDdMLbQT3zhmyj7Z/5YaQf+Nl
-4PHgv+Z8o41WTzknxfBIeJl/uOdx4aHCt3mO/M05Y3Jn5AQKmxSWCDGB4ULtyB1pbrS48UW8
-juQbZ8hpqMIWMCFHKecO572YVEfz2LWcFTOIccb2Z/D4lmzXhJoMHL8cn+pshry3VcUm20rj
-OjsZcdB7oAbEaqg3mgIuhn4aq62Pesioaiwz0tXx6nDezvf2H/VlFdKu14WH3EHfVP86f9Q/
-1F3FO6lwi2uuZ7O7faCePzucHO4tNubvSW2jJcQZga7SKO8KdYzPZowINba68B0AmzjF2iD9
-75ZcHHkL/ksOI0i6Ed2B2c/ut2GOL44jMWlx3vhpyUuTg8UqpbZJLZk8MMEfu8CJ24uz3ZgZ
-ZEtqLDWbiqErUPHEezwRxuCTBmlkqj21b0oPK01XENCojv+ijIKP8Mnm00i6PjbyVi+IDjPW
-8Olq+1DLaC13Sf+wvFFuNm+ha3h+abdc8MEdcu30DHBleeLcU7z1I8HIK3OUPhNbAa0jqiG/
-EeXgIL4Yak9kQw2pGohIdUEduBPuDH+x5kCrzJX/+4svkA5cBJoCj4Et5nVL1RpagpINHdW6
-4TWsD0Q28ARvAlRH3EZ78JE+AS4J1CaysPJ0X/or5WL+IVfSf5KzqTziDlWZVtn3Nt5Z2REf
-V4+bEFOa6MLZgYb4QOUcWE8cZB4Uquq9o1XlfYHtYdCX7evqTfY+85byuQLR4KLQtMgR/83w
-WM/Z0G1vXmRsGFNKSW7zgdYaOmjmQFuMydYLPU8rZ63VaLC63g8k9K3gdK0DtEEvDi+xFCQL
-dlKpxAWuPX3XdpdaZ3fS7RyZ7M3//79EGpfHXWWC9ECSR9dCS80T6gMZEdfyu6OR8Nfwm8D8
-QKPCbgXtv9/9+ve3X77cLXiUkx0+4SulDOJ7GjeVuUChngW/MnsTXqSAq89Nd2bGJsdUjNvr
-OBWznivjzKEp520mLTbBvjz+Kvd77Feiry0WzWMfwsO5OshqW0esq+MpVtt+Bu5AjTUHQiE1
-yyinXlEbKq+lU9J8wYwOjv7qjw3irgbevoW/eHoX9eVN70a/2w+G/g65Q7sibJDkP/n/ksCw
-U43jKytHo3+IY8K7orWD7fmSIUZuwN/XVktHjOnSM/0Uf1lvxr8Cjiqd8fHQczaRHuEYaOvj
-wGxRe4ytlXOb43LchLghSfsT2ZReSa+TVsU/ivnC/cL0wTeRMB4lj5MU8ZhoAQcR1DwNttUW
-grnaJfiruQHbB5YjjoA+PAKMI0LWM7yB0RrO0JZZB5VfzLlipiaHwnxdz4CAo+Cs92HeYl+5
-vDYBR96XwImc7Z6qP//Mn533T8FX72vfreiFyA21mvwEiDcWIrK5CLGbD5FYaw0+DppMHkCe
-kXnoa+I1chVrAHbCdgMxRCqcQYFIUyoF8uFh6ws625qM/GcWEYIpY/2B18Th/90eaFWEZuu3
-wS76SHQ+kES+xv6hptF9qQxmFu4ld6Dbqc04afuVvuFswcXEHWZLx77Fp7MngZNIa621+VNK
-085G28rT/Ry/3+ULHiso7v9W8MT/w/U9fMnbmfcFItHFITA6J/Q9wkdIYZ68S+lr5VjPkAHI
-RYSHAsBWs5c5X3tpquo08KdxBmoBJIIDzX/Nrto8467Wx6oO1ISboyS+iyxO92IJ7i17lsOY
-V2w3ejvTh+7I6NQACiMGowvAnUBvdas+iO+jbAr1kX4L8NFCT3pgbqFV2DwfzE/M9xY8dB3y
-6oEf4Xd8rPyX3EBvp04E+hss5gYX0V5shO0jHbT/y+XaU+2lbe0dyazhfMslJsQ4H6XEO8XU
-ZbZLSR0YLrYF1d3+niRsN4jpzGR0FcEB5ZB5Km++FEYrl8P1BHtoWXRvcE/4qn95YKyvg3+8
-r5I/yxfnT/SNCFQLTA31jloRVbog9FFaS6rilNPUHOmS3EbME7tHpwpsaA9/LYDxWgARboXG
-yPMFj+pR+mqn1aPaWWWskao1hieDNWiF4OwV2eKOWxzgeMolO8dzN2LSuCmxGezyuMPMgDiJ
-nut4R0xmcpBxZEXkIVGF6Eu8o9dhc6ijsBfbZkFINaMavN1qhEkwRz/FDrIUtp9OBhtjbXUT
-rKKtAb5qr4GpahvgqoDrSaHNQklvu9CzQsp/u7CCL9E9xz/MfTnY2fVLKJLv8e/OU3zHC8oH
-3d4NkWKRbUJFsYFYTukgtDZQ0Qs2UhLx8uYKOha6xLSB/6BpeCV5CMKpC0iE6U3Ktu90B8dr
-8nfbU6QprVrjyeWGi9imT8S/6ZVQv3EdGmpOButZr8FyYEMEQ0cRHenL1F7bCfIEtwDPp+9g
-dmYz8YU7Tm2y/Ul1ZAl8FlUV7IItVssDq/mvSkr4odgy/FU6EtokVfVti+wtrOs/WLDFl+Sx
-wtnBm3KK4NdWK/eNOdpK4KNaAB1QjyIBLQHTjHT0pPXZWgJUUyFwg5wCNpVvggel51BjeT60
-Te4L7pebA0G1GhBnbYVEaBL6BFuE/Ua3wP5mUrBvpB1vgJciRiObieGWg9itLUVaKh2scuJH
-rSe/UgXEgeok+VMRjfr4wUU2jIT9Rd3RO1Qz9Iq/JqlydWO9ds04rY8xNhjNrS2ACDVB/ZhJ
-vqbms/PYWdwWdgn7lrnMZLHduI62KQ48pq/zadx2+/u4E8wr5zWsG1cVqkj9B+xE0oHK5haj
-jKrJVSU3X40fGImJngntjv4SasyfDl7nLwaqC1nBH/yc8DChubBZ7al8AWpp7cApSqpRWtwk
-3xd+Ex7KcvQ37SjfUGvAj5dTQ8n8a29WpLTvXvRTkJN+8s+URkp57YOyRAeUDHOzthioD65E
-K2BxdAj/wZ7Gx3LPsU2cH61ky8Sf2lBKtdWhX3JXyct0Dtac6ojuZr5iD7jT1G9cMS6f3sNN
-IppxKjLA3g/u5qyAzHQ8R87ZkpAAa8BfqFXwAKwC+Dt02lxjHtE3q27ljpQtrhcq88ciH0Od
-wuW9HcJdCtoFX+Yl+PScF+5+P9yFv/2cW9A3v4lrivuNj/d+DzzwLfCv8fv8fLhmZK52WjmP
-ToN70hb1iJHp88w0qi0DFLn4NvYSJzOHnEfYcMw41u24i0+wpYCbmTnmKvKk8R1foudh3/Ta
-WEOzDHbK+AftYzxCCoAXyHPEhi3GCrFYsjQewzzGNbosnkGNRM6R98EZRDcLRkZon8zu4kll
-fQTnA+G7ESI6SvwtelliIpi4M7RO6hAary0My7oVaW6243uAidItyKUh8IGijV0F2IUesHSI
-sFKB9eYnAwdKafWh70pNqIemAiP1FPCD9je4Uq8L2Ixco6GaaRbITcGTxjxkLTwN3YZ8hgyw
-ollontZXGBD4K9AUC8Gz8YrQT7S03hwuobQFJGW9qSl7jedyVX2zckA7pN4q8iZRGSm2kQ5L
-baUhagP5mdZcRLQJPKLIYh9lnrbY3G29QvLgSfgnbBOB403pDTjA7qFrcbXtE513HLXj2zsi
-sYCtk2MguZBdCP+FNwZrg9ngM7MJ5NPvAW3khfo9oaHUSTrEL5RrCp2UG4JNz+eP6435fHmk
-ME9qK3/S5qszrEHqe2uTsgiYq9y3riujtJdKSXm00kHaIZNCc6lEZC5/ONSxKH3vhtO8A8VW
-wS6qVwS0CUoldaqcpbRRdskz1O5qGU03c8wNyN/wcqIe8oH6Ca9h/sIS2MnYHqY7tIepBY5n
-n8FVbYvRcY6HeAdnP6abY6NtnW2mvQQ7wxkhf4ltgE92JmLj7Y9Rpz0JPchOhIeQFjASv2c+
-RWcZ/UBBr2fajfZWglHX+k/to2YKTn5zoH2wluedb4BrnD/F1Sp4yrUm0NzVzXsjv6G7eW5V
-d5XcZ+79eYO8qwoW+Cd4lgeGhOPDA5Wl8lZgL9gZF/G/mHSmDveYO8EVt723L7EdiTUcHxIa
-OLHESuzr2J54L3tfuBJzwyhBdpCHEiflRHKC5iYuaS/x4sY6rCQIooPhBfBk5Bb0DasC48Rt
-pC6+D62Hj0MeYS0hO/LRegs21ssAsfKvGiUAghYF+GQBlBtLnN5Kws1X0VtGbjCo9QpW1WOi
-V4Er8hF0sV6Izdbz0EbqfeSYLEJRmQZJ7Txwx4TAl1DIisADjF/AjWpZ87g80TClm4Zd/mKO
-l9+Cr5TTyEd9EnLWOgT+AWSbLQDGaAa21icBbfR7+lN9jBprntDWA+eMrfC/pg3bYk3Ac605
-eEUrEV9lfcWPgYnkUSgXd4KN4TLmbiOkxqi/KluVK+pt1dTra3LRZItyG6md/F6M0WbJqjlQ
-TYRQYzqyEXTg7bCq1GZyPruepuxr6CP2KmSU64p9oHojCrITXgtMQGKA+ehHoA3SyKoKrNL2
-qLulTHFCURo2ljrIX/XOxktoIrAHtVlTkVraBrCMUg8YrHrB88ZApBUwD65jjTAPqfvlv4Vr
-fGr0dYThY6M/xX58jDyWvy1K0YFCojBBcEgrxIWyIM1SSPmRXEG8KzwVBvMONaGo5msNF0ID
-B9CuVkvklNEY5oy2Rfz2Et8G1WRxfJ5zDlUsLpv2xW6ij8a46MbO7uxORw1bmvO1/ZmjkqOD
-bYJ9MrPX7iMHOb6ibW1PAY0cY2QjmXpvMKytsc7rn6ydBgWe1DXrkTxNqxE9K6iBipF8//XI
-z0BvoW9QE3B/cuRWoeHpk7Mib+53+Wfcj3p5jfM6eZweV+hYgBHKRK5KnLhEm6XywFzrBeZA
-h9FHqTdsA7vGEXGnbGkJi2xl4jO55jEgfc92De3I1geiTKbhZzHjL1sFa7p9J+iwzQWz6HYW
-iU8wmyEPrJpwKQhChqJNUQmfhXzCVoMofMdsC2Qay6xE3TT7aTeNmWqc1l5eLi0VJoll+CHK
-bX6acU4cAYxUjkP/acORV3o6lmhUJEsY3Zh/tGz6rnweeyUuBQyxmz5CbqjN03YaimkHLplN
-jTqaS1yn+KKv1XnCCT1dvmXeVRHwlb4CjNUnWw7Foy+VNurblJlmvtERSAMbAgeAz+Z/xkpT
-0csCWdZu8DgggSWAYrDHktG7QD3yLMgx0+HrbCMsyjTDf6HGo0KR4cP4RzAXbQlWQU6BL8Ee
-4EfjsWHKZ+T+Qr6QyY8ShwrvlDZyVeuOOgXeoE1EXFoKQhkYutS8gj23vuGdwZLET+gJNhq+
-DYOwC9gNPjU3mY+04dpSOVn7IB01nijPgfn6ajjPSkIPwMORHqgXEpGdUF90MfQQOwAOwE+C
-vYil8DZqO3KcugDeQ/tpUWOPQEidolujGN+dfy/sFVeJfmEyfza8JsQF/gh0DiSGJkQ28Iul
-qVKCUknqLGLSHf6zEif7jG16M6ClSYOPja/gVy0N/imXQpfJVcgPxkFuBko4z5OTHS5il20D
-tt7+CVdj+3Kzk77GxSXnJSbHl0i4bnfH1GPm24sREaY1eprug65mb6MdOB2yqEvGWXSe/AKY
-IdiNGLGpVlpeqeriPal05F3kln9EcIF3cuBXT1Kgrdv093JV9lcr+Om2cksVDsl74P5WWBhM
-8CXyWcG5AhipL1USMe1CEZFchubi5an6XA+uv6Mu197eiJ3O3mEFqqmtHbXM/oGqaN9KfGX7
-Q2eo8vpQYojygtigCvRas7mtG/SXvR1cx1YFasFkA1+J89ZcbJf1C7oDsMGjgS3WCWOIXkIL
-qbD+TL1iLlS7WZjS1lgn+tUTPKJuFHrpTvUO1MxaRDYAb9IzrPfkFn09DmvfsSVaY2KKUY8u
-Zw1hrps5RDftB7RbvGmk8GNUlxCvVlS7682MvfpM4578UlvET1G56GoV4wvU78Jd9ZC4Wrsj
-/GHMEEBTkk4YnD7FyDV/MxKsCvoZvVC1K0e07fI/ViuzNopjIXIMNZI9QIvcW+omixPlmKbY
-O3YAsd5xh+rvXE6s5urAZ4lC8zwE6RWNj0qOslth1fWapD0tqnRxq0DdZ3nlh9YS5QqA65nQ
-CL0RuFb9Zn5SH1tdjBg42zCho9op66V8RWfFD8omYZ1kV3orXmOguQzkwepITfgeGof0Qycg
-O5CfSDvsAn6bOk2/4tJYwOaieaou9Q+6lGgDaiiv+8CmiqUflscp2cpyebb8Qp7NZ8rfwrT0
-OFJFgoVx0h2hlHiNryCQ0TMCE3kinI4ME25Hewpro5ejlaMzQg6heGiy0oU/ZDZSAlA/fRv6
-xnTgPKAQS6B67ASUjm1DPUwey7VJu2nXi410ZqTsdH6J32Yf4IRstW0C94wdy1Vks9l59J+c
-Ax/CFgBjyRF6L3Sq1hAeoqdDPfQd4Df1DLhOeQsMlhuaq4Rd6tvQNqGC717wvnuej/Fc98V4
-GX+Gt6qvlsfybnBN89UrXOy/70oNNwvMlLLE1qZq9EEYGCIrw/nkUeAA3g78D/9Q5DN3mGo2
-p60vd5DdR1ehQCKMHYYh9IWVgfytFyDlVIQIKjvonnoN9p7ZiR1i7WWTrJXs38YVerb6llgu
-D8IGqv8hj3US2anvhb9qATCqrTNF7YrWyBDVU4ChDYQLzPeIF3qMH0aS6DrQP3R1syWdoXdm
-UoyB7ExrG3saaML9Z1XnVhqt6I1qIl5VyoILok6zeKSyMjRaRZ4h7lY2yQeU4cq/8gflqNRI
-6c33kRYG64ghXy1Z9J/Vu4fd1loh1ZoqzdZ0vo/8S+SChPK7lL1KjtETUKBH2BH0IVkGfUis
-RjoQ39GT5EJiB9mNSSct+zL6UgzCbXS2ZE7Z/iNGswrWk05Fu5Ijoc5EebA0vgpIRyaZA4Ep
-+mbjhxYsmvCl2t/6VQ2wstW6lix3171SVzVeeqSOFiprFE9rs6NOTYx8VCpGH0rPhJ3yQ2WZ
-fkODLHvR002rDPw0e8ImvBPbS8RTs+h0tjpzmj1e5Fc32Grs9qI6ZDBtiXPUR6wK8RLbDc9H
-4qwjwEE90WyqvdEU+WyRqQ8Vx0UGC1ykuxDlj0mLpcXqR6GeMjl8m+8UyA3X9SeHI357+FR4
-Q7SJVE+eqaaokArJV+XKYiOltTjb6CmPx3abLtsz7GqMQf7n7E10cyr4t5hb5Kd4J1M7xWkv
-nxYfOzHVG3MtoZ6jfIzNPp8by7Ukx1Gd0Lv4EFjHJfACDgEg5jV2IRW0pkVZstpYEi6Q+wa+
-CAP9SPSeXw8dCjQLlwwcCP/0/hIq4XkdkNz/BQ56LgR7+NioLdRGmSkss26ob+CXxkRskfkF
-S7IsNApOw0tiDeguBMjqeAE9Cf9IJRU5jQ+pg58G7KDduKU805MEB9BEOIfclgcRxfR4qqNR
-koox9pAD9CkkqtWjDipf6Dg1kwX1tcxnfRC5UuuNxCvfrB/iR9MlbgP3qW2RgDUB3gWvB2zY
-XusQEQ8OpCZBFelnUFk2Ht5dRLfTY4rDb2JbQXdj7wH7nCvNN9wK7TRVVvqCJkTvABUj24xi
-0VnanMhLqVcI4T8GukQ2BXeF8yJ3QiFxYmifcip0S9VChtojXFyrF/6mzQg1M7hwrjmFbwOU
-VTaA/Y2HEA+UgrPgSlBZeBZ4FcqCzyEK1orMpQx2HTvd/oaz23tyHdmxTCuqP7WFGEv+g6cX
-Leos2oM6qf7wS6wYkA/lGYfMUfo+7aX2r37DgMFfwGfwTOhPaBBw2jipc8pc5akYL7eS+svZ
-clnlmzxPEcQNyl6+u9IsukDOip6Q6vO0/KfYQx0jfzBorS443DqFEEhxohz2nbyNpVJNiRj6
-BPWE+YV9xYL2ttx+51bunXMoW9XmJQeRo9HlcA7wn3FP26H8kDoq++S7akN9ipJsTBA8ytuw
-V4gLNYj+E9wT+RocwvuDYVEIXpa2hW6IRvgfYX10liDy/cX+Yj35qzxPXWZwxmB4vpWNPwHe
-kNXAZ1RvyEXvRbazR7DT9grE3bh3lCPlCxdbbK7jYvIze+V4J9fFeZW27BPoWQ6ObW5/zY6n
-l9A7kVr4SGMK1Ee6bwwW7FqmNFWrIt3RXJEs5Y3/TwH1fghfdW8JaK4jvjruF/5jnm7hB75Z
-fKngJ+FBeLjkEDZrPZVc8LvRjXgC5DMHwKnsZWgZ3RP7Rn+mznMJTFPbGHI0sxh7QexCW6H7
-0ClQDtId/AWaZ+0z5qicOkaopsrRvgYs/ABmiiPh9vI7ZI1yDBkpD4EvCA+gs9FUODH6DJ7C
-b0Cnya8JxlhJN7Vm0hOsVuQTawi+CCyHTUHuIA/wgch/VCx2gBXwHvbfiQ7OVLxpzGdkQUwB
-eNT503LbQ9Z6+26AcDa0xjheqiF6Fj8C/jvwh3bNW01o7dsefh84HQqF2oQTw0A4K1Q+OD6E
-+Asisuej8NW9TEr31lHqBVKNK+GvoMS3RapIq2GfZAOfy6q1Ra8OX4Erk23o4ewX22fWbj9I
-92OfEsXogXgz+iTxlflGL+A6caXtW7jhjufsN/suZgH7hvTjceg4MGJt1bL1lXK8UUZ5Zz3S
-QuAq0wZ+tOqZDczf9F7aLa2v+kXLU11aZfW2tlPO1qrKpbTp0g6pB++KwJHCMMnf5J3yPgnS
-aiqjjRZqxAqpGdA/2iokweyM/wTrkhGkDTUbH8qMo/fbQNtmR6btkL00m8X2oN1Ea/IvrDme
-jJXCd6EmngsfwxCwJfRE36BXljtKiNCE/xotzs/iqwl9xVWCV/rI95ZSoiWFNaE50cLA3Gip
-kIfPjxZI66SuWmdlhr5daaMFlFraSa2Nsd8MmlPBPlYTxAFmEA+QPcwZIt/+hW4bV51LSpph
-g5Lf2dYmbrPFJBK2S4n1uCEJe5nFMXlkLe4BhuP34BZWEghrjS1VHW6+1Wqba9W6RqzYSRkf
-7BvN8BQLvnc1CDz2JIfwwKdor3AXKTaaIIvh76IzVEWsFM6Sx4t9zFhjM7YErEcnwwZ9HV7C
-/oMA9lvoO9u/2Av2GF6Z/YQ3Z/1Ydfoe+h5rgNaExiG1zHZgMbVQay80lMKhruKmoEMpCB/U
-k/lE04pUMqaGZ+vfIhFjP18aXMJfR2oJlfFrkpN4rgjECu0WVdo8Rc8EblJdoGX/R8FZv1dx
-tGF43c4etxgJhOBOcHd3dygkaHGKFQ0NVtytEIq7u7sXdwgQT06OrvuX75o/YK7Zfed57vuX
-oTxYU3NruqXtgz3PWsZ1g67inE/esaXg/pL91zrq4i5PIvGX9y3BeD/jK73JyCrnSr0x3V4Y
-jCQEfWrzQkTYU7CJTSzexOYFZjB7ixsHH+R9KmidPSd7c+7DrLAvM29aJNXXjg8UnxSs/ji5
-R/A/g2DHYXPEP6mdisO0T+9OdgAHEIPhH9RV7Kwl3nTLWs2y03zDuohabrtO/GdbQh60N6cn
-Os9b77j22Gu6aOtXWybhoybDzZAkkASywSFALvwASoc7QtWNa9pjaYD4hB/GbSkhpq/KBqkr
-EFE6AZ/ksmqieEeM5huIy9kt4immmjiUrSIg/CpBFw/J9bRofbMh6wOMVdoAo4UiGROk08Bj
-qSYcr3XBWXALdQddSW/G882biXTLCzLB0st0kY6YIKo8dQhLwdORUdgquC/2GkxHzxok0l9/
-CgSVOKWpIHJ3Ii8Yc/gtU7mEOKO5l0JV0SH+FPtzBt+I+cB52HXCZ75APis30RfqO4HrxgAw
-qFUGnyndwRS1ObQCSEBOomOwvsQtPAOvji9D3yI4ugiqQQyDF1pOEmZ3mjUtyu3s4cXteY7v
-1FnLIiTGPBz8TPcCJaoBuAw/a6xCML052Fb9rGyUovl+Qr/IV35PkOSF4jRG9LWKpPqd7Ppg
-GX5L2CE0YRdJfwgt9UIpFs6X/8TSlUFEbe0FOdmoSB8GVlvmgqOsDRHBep74277ClGn/kzIs
-57BT5GToNpSj11EqqvlsgbQzdEDcEGgpVQy+ldNClOIOTZXSA/eEG/4mguBfLqYGt6kbI/2h
-AXw2liYdIPer20wzjPL0IeA3UzVwpMkKA+Z7WG3r8ZI+GGjr7PzmeOQgnEes/zim0z7HfqqB
-azS5ytOOsEQXYs6YjcjYaBu0xmsFWjpraVXoUtId5D63Ug8yIyQq4uY2B6qGxhYeLdyeXS6n
-0s+UrG+/tmY/yhuU+6voYt5O/9n8UDCm4Ee4Q8FJNrNwh/w2MBk+KmwwWUGH9T90r6Uy9s6y
-Aa9q72pa6xhubm+HzU+sIXMl21fbTFtFxzvLcHtXM+IYaq7lIun9Tj821tIavIBXNg7Asw0S
-2mIMAeIBRj8LfNXv6YJGKtfkaOmtUE3uLvZUc+WKml2dqPZRjimb5K9KIzldPSMF1VZSa62h
-9F5LlF5om8UstZ64Ti0vtdQuKke0EUYd7TzUTI1GliqzkWjVgbn0m0Rd4DjVA8yhdPAQWQQ3
-Jsrg9/Ao6j881XQLu0qugim0pTECYJUGxgbZBb6Xu0ETlVLgv/IH/Zg4UU0QmspT+L2SzO+R
-l0oVlcVqovxBHS2aFZ8QpVSVQ9otLQu4YfwLjTeS4Pq6DzypnQbm6C/BRoAd2QkOQ03gD9Rm
-ABhgNMQ2QNvxfEwlPGQeXpvahMJ0A3SFeSc6y3wOtphLgZnmEcACy2yjGr1fJfAkuT3URqoG
-VJYeGDPlTfprtaNSpNJCRbkbWyzA7FHhHhsrXmNni7uYk+K1yHLpNPNVjfDroNGKH7+p9zOV
-Mvqav6nvzKfkC/Qv5Qz9JzjKtpeIce+iN7g9pvc2KzaKSgX/Qzh9thGjt5Dma+mRLKVlcZRU
-Lv8578s+xXfPnil+yC2Qo3w31UWhaeqnyDD5v0ieRLJP1Fv8DeCs2BzpocQR3YFTpn+QWMtg
-rIn9GPHYXdFcMWqQfae7o3OpbY7zGS04QybVw5gbxL23tSrdxzavtEotKjUC4aIuGT+cOepz
-yx25PwmJ86A+zBD5m/9G5GrRZP+sotNFL4pmFiYXdSlwF1zOTc5Ny/o7J+PXmvw/s6OKS+VR
-oc6FAEP5v3IXQmHpHlvTuCx2Q68r6+k9RnPHYmS1Yxk2x5qClrH+gc1yfjJ99zI21pvpaO8+
-6cp3ZHmb2jpFP6YZbwbl8twgezsfYdvMMPgdPaY+NnLUhVo542/NZLxROyvt5QxuhRAI3eAu
-BNexwyKf2Ez+tXBBVhRSe6pP1Q8Y8UB74yk0SXeiFbQW6BqFRiS5OjRDiTZ+ys/VLMmtP1VO
-AsXGU6MG9JvyBhwg1oIS5RvoI/0WdRS8SF8A+pPbtSNwf+WHQar79F+GX99TwvFfsFtGDbS5
-dgXsJicC+eIt8I5YGlkgnUVuKTXhq3odYBLwSusOXtY/Q3PB+XBD6AM4E5hoLNReqvNKzGii
-fE7K10HtJHwYuAt3hQYD3WBdi0WHaSexE6qCvVbT8b36MLKtwZJdtGb4SDUJOWOURmxoOlqb
-SEPO4FnAPhTTbiKihGCHhdbESL4d2ZyvRuTwS7EUsRz2Tf4Hi9HmYvu1cWgLjYYXaNX0BRos
-1lV3s9OV1dwy1SLW1XtImnFSLAZ/8k+g11wpuJlwFF0rn6WmaJusffSbjkT9qCtHP+M+DeS4
-RkB+exasmbsjOCmBu8GleoE4UPsZLqtX8hdpywufKOG88VKHvHixf35zsVJhI/m+L0GLC/bW
-X4ZnaC2YInUzW06/wwPgP1I6IivfsfPqR3yslkPWAreYl+CDbU/ptva6NsIBuAodl6N6ONrG
-9bKllxpuHR//ytagTND+vOw6y7gyC/HTMS4IdHPGc1sv7RhpExcbLSOD+bP+88EZRWuKiMI7
-eU8Lz+aM8y3JSSsm814WG/nHfFcLIgVjC+rnfymIL5SLLvh/+J9GNod0IYVJ1CbwIDRYeoXD
-2gzLJ9DkDKPdXXfxzq7NxH3XQKqz20f/cHmsu12v7M09hz0bvV9iWrprxgyz9XK3NZW1XkAf
-EE+MdnB35baRIdn1QfI/Wjmlh3ZPkpTe/G1pb+SzAIbvCh8ig+WbfEd9nFwNHKRtgaoC62EO
-SkRuIGGoK7LfSINaq29AXp4FVVXioHnyKSNR3Kp24gvls0KOkqle1y/+/7UeEoBm0zD4u+mF
-ugpl+A+awkbLZURFrqvkyo+U6UJd7Q1bDyzDT0WeiTHIbqkvhMq9oB1qFHzNSIeyAQrygRkw
-i5xHz+EGehX3oqnYW+QiKiL10G/wZNgCfQT2gYNK2mCEcQksBxwFS0PLoJWoHzpNDIcwqhF4
-hhxonCLy1E14O5nGIkIuvIxvCHLcc20Ev0heI74Ufyp5wiTjC98WPsIfRkfzWUg8G4/MjMTj
-tbnHphnyObNDr0aPN1qTz4xO2B5jMdzdWAweNxRgBVAa3A+UAsoa/2kNNIuqao+VB1CR8px4
-rMSZ7arPmqH67BeVFAcnXrA3Ft7ZgyLkrKtuctj0vZZD+jOimTEcHmco2li9svBDvRUcrm4r
-ktWzBbXV3/M7Sg1yNwoLczTxdd4OZX1RSLsRCBv1mO7gTd4F9RV3QC3EH9Ak4TIEChUgn5AP
-LVOq4y+g1BLDE+037cmuePdKl8vrdhpRX+z/xs11JCViTqp8jJ0oJ9GxpasRS2J+h9u703ST
-1S8twv/jCYBjN0nDma3swXD58PRgpUBHfz1fvJ8rfBd4XPRbcJkvIbDfVybQzD8n1CgERYDw
-6lDpwJBArO9QYLRvVLhaIJZrE14tN+R6QDUVjPwOzDMthjnTN6S2JQt3O56YDrgvW2pE2e13
-olc4m8Sku0NRq9xD3Qscl2yzzafoKDKR1NH7yEHorIEYoiKqCfIUdYcQrbjYPVIys1N5xL0B
-VotJKCulYpRsQ2eJs6E1/HpgO98E+EvKA6xGa6g/+jc8ipwAC+QP8D4+yRiLbFE18K3sB27J
-7414ZaP+XGmqm/Vjel+wry5ANrUeeEqM0zrw78VtXDpH8uuYsYKTqSsNZibI15g9CsGl6ofF
-JOi5dgbZCGpoKTgdn4ecIDZjNDGewHAndQ0/Z2pC3jZNJc+TVYgoHMQ+IdXgr9B9YDm43LgD
-LNLXGc11j9EJJKBU7AhegVRMbYjndAQ5TJUB2uAHlT+Ql6IX0nnKaM83UNP5jnI6t1Z4GdnD
-JIenhX5ENgU3CknhdO0Msw2K5R6j07kleAEfT66R15tqGqTlJtTSakOSrX/BLst8KIaeBZ0i
-O8GDsGi4L3QPBIDdYDMARgqAAUQXoIbZrXtsQ+VM6z2+wHKAy7MuEuY5bsqLXVW0X87O2hpr
-qrKF+CDWB1fxOfJYLo1P5++yoyWdOa88D7VUG/jGq0fzN2gTCqINtui1sbm4K/CH/xN4ObAS
-XhVqB9eKrAP/ZrYAw7hC4za/Q5vKVVGaMaBm5SsgM41C0wXykpWwLbC5XfvtidGoq11Cac+o
-pEOeTeUZt6/cJde1sn/YryTkUVOjb8Gxzif6V3NLZTU+RXxu/MUXifXZPEYObQ9VDNwJ7Cge
-7v9YPL94d/CM38RWCR8WPrGbxY68SUhjX7DXQrsi/uLqoV5FRwLWoofBZv6mjBrx8T+E/8Q/
-pTnSRembck+ZVeI6Fck1KGnPpazeo+YWMR0t02LvWR/FjLaz3ks22h22pDs/0q9tlYg0UxcI
-x4cC9dAx0C6oC1ygLQFluSMwT/kTXKxWRjJLmiJTMvAMwY2n8M3R7rwLXsN7wArCP8B6MQ6c
-INcosaZ0rblWQ2H0M/Ja4IsyHHyh9YO2GWdgO2BGhhnH4aNGM7gauAAkwHRd1wapU6Wpyg32
-rQyG20obAgEO9neIWP3ZoS7BrpGBkaXcUK6jhEq4dkz7BsJwf2I70duywlzRnmrbaFtqO2bZ
-aZ1tPm39TNewzTI1s84hskxSiVGtNSqC07TBRmd9GBADPgStyHWoC9oR/owUwtNKzOg00pB4
-gKSRZZFYYh7UDVltFBlblRvqc94llw4f42KLTaFrRQ7/FP/lQPnwb5HzzEr2JbeLvS7uY0Ft
-M8+CIakdlqQ1oQYBby1HYd3RFH3qikdSnb3BLdYNein6iP6Z2gCtIBHsX3Qm+qjk9Dc0Hn2l
-nqYaaZVtR/VEdxdgrvck8Nb9zpjqeKVnWq+rIj1OTCUeM1Xg06Et2peAW/wjuI8by0zjFwkm
-vr30OlJPbhSMUxoX/1CmFU3S2xQXQFKoC3qScSLDIyC8JoQi1cIzEJpJhruzKjiTRcFBTAPg
-Y6Qh+BsPII31/dhMPJ94b11pivXMtvyMnmBfHmdx7Ul47+YSy3tuJ71zZiSusHSO8xHt3S6s
-lP068rvlOdCCNMunwepsLeV8aCv/MkAwiwJ/hnsHT4bTQqPCP0r6O43fFTonVQsvU56EQ8rm
-yAY5P1JHSA0viFQMHAxc8Y3xdy9e7R8SBANzGCD0txBmKsivxN3KZb2XLqG9YdwMkjvsN+kV
-ztnmy66tNO45aLJ5v1Cp3lNkljsGb+cYAS+xPAS6mpKAUUQi2AmfhvTEFxO3kaPkTaMfMVnF
-iE5qHjlZ20XH6VbL39po+r6Sg8tSabit1BmoJa0zeknDgI1SP3CG+MnoyPdUmwhDlO9KSOtu
-vDRwYLJxA5inY5BTewIBCgzXkCZCcwUzcI4F1S2hO0L74ulsj8IrEaFgAZPte8hNCKXzgxk7
-z7H3hC7iNWWF1gqIgTPR8WQ7upbtvu2aS7Vvc5vt811trZOdl+mwnSJnWqqie0kvLKEd4B/I
-E9iJrodSkZFAGNps3IJ2AAfhDtAr+B/kE/wFb4giVDw2g5gL34FFbbpRXXJrT/iP8npujjCV
-rcbUZr76R4fPFaQF7+f1DDYtvB4uG1jITWH+Eg2xrjzJqK6OwLYbreg2cJH1L/SmHcR2OUC0
-lYODFOtnoJguBdQxPQH/oRqh9wgWX11yDyoB0/AvRjvqHtLO3o687XmG6+550Fg7p1U375Bz
-SY9YFm8u/Ics5FPAXUy8+ijoFP7wz2ZH+FH2QHAo25q1c6Wl9VyyMp4to1SPbFJ/hXsDEWYH
-XIZLQ7ozl+BXwf5wmr8ncsP/FakZPANfDnWCKjJTwdf8QYCXG4O6sQP5C1OIiuZVplf2evRf
-rsbmxd5Emy8WcrlKZ3jOltnrMZWu4boXm2F1eKLJvjYJTDc1UjPw2uI++B17VP8n3EZ6HtS4
-hmEfv4ydKNXkZfEdP5NfI23lqmjfuct6b+6J/oFdrOexXnUbg/I/g1AwqfiQjyo2+WNCh0Nb
-uIFMirQ2MldaGkwWHgVnCio3WB1nbILeEV2wjVY7xtvbwiMd78BKrvfwJM9p7IynAu5zDUUn
-OnbD060GdM9UFv5KIOgCYg/ZmvRYGhG/LCfRNPMNpNhcCbPZvmCTbCORleZDRlVyldwJPc5/
-gI5yTaBuwmGoQGwC1RSzjCbcdLVaZIxMRC4rG/kjRoLeGE5GBsEYNs/4giyQt0AKX9MQmJ1y
-k+AUvkvhMdaRS3Clct6zY3NnMFMKVjMP/Me5T8xDYYH4SBqi3lTvAxlANtoCTTGFyWxrZ3Nr
-R8Sy37nSWtf9zLrJc9jW2PvWXt7z3Ra2A/RG02KEwAq1iTAvT4PbKxNhTU0EOxuslgR5NTeK
-G6vwjmAZ8h44iawITCJ+1xpjL+RB8DgpAPglWbsrbxDeieMC1dkl+Y9DL3KTw+/y3zNffX/w
-3cIfRLNgUWKUgDJNDchp2hU5DvqmtaemQzfsZxGXaxTM2KLBVvQFMJP8hAIUT16kVplyqUxT
-MlWdTiSf0gzxyMIQ5ewytthWDR5IFxoQUVHfXJKtpZHeyiHolSQD1wVFn8VuUt+HrkqVgwOE
-0aFnvC9yRshiPwlPuSr8CT63JMsb8pOVyiKkTxfywffsQbwV08i0PUKTwVA0PCdQoHXze1Q2
-4NVSIqlGN34u9FqZjTaEXXgcNRxfYsnE39iGULmORtZhnljXlBiTZ07cQneHuC6u4bGj7Dej
-Jpv6ORchR821gMsUaXQh32kUdk5uCubwC7UwU1/Ji6RLV9ke4lWxn8Apf3L31bzIBHV4uKKa
-H/6h3GUAJZ6bK1XjegqL2XtMZiQUSAk5fDeDWNHXyJqip3wzX0fxP79dasw0VzLkM/ouOBoO
-m+xYoXU3MsTaGThgLlZrm+cqf1keKh77Cv2pIxPab3+HXTDvIVeRj0yviLGWC6Y82xSr0zHE
-8d1x1NnRNc1Rw/3YstZZjVprzUajTAyYhJfR78MD5PEgIZwHqrLpwMhwd2Nt8Kk2PvhePRXq
-oVZkktU/eFjdJEnyCKWStE0pK7SUa7CzxBahH+Iy/1ClXjGkfSjqpOYUZkv9isoLH3wgd9pv
-MKeCQ1g2vIX/wA1UYjQFLML2EW1tR+nL7myac980Sc529GrnVOtU9xxnB+971xHPUftZZy/T
-QauOXDBtAboSsXoZ9JWWCRUYU6DNUBr0BnIBNvCwMhBkxe/IPDGaHCWONNUVx1PRYjIWEHYZ
-T4WtIi+YmGeCGCzg2YDKtQmkcPGBCbwUPC8pkQy1DsepU/jS6hAxQ01W1+gPQAt4CT8Al6cH
-o2stJJZpgbBHdGv0G1EDOYOkwVlQX6QMMhXrh70ivuOppjBezjwJm0BfQ86RMNoFX4Lvx3pS
-q/H5ptvETsKF9wTXg+ulOHUnu0OSw6T0e+iFyIR2Sa+ZX8oE7rR6nYmTc8ObeZzN4ljpg7DF
-mCE2h5rwD8DyzAijRhjUXoUEpWv4nToyEtbbsCJQWXgI1pJbg2Y1BnymTYVygbPoEjSNekot
-tLitnWy1HRZ7HfdBx39R7dxt4457Fpb63WWL/d3SyN2KuGhJQ+9SbdEVZDIynagGJKErZR8g
-lFhBOlNFy2YIVeWvyw2U1VIP/U/Rp3/k32ut2KHq0PBj5UDotZIdmSTNZVEmjmnk6xhumqeH
-r+QcYW7nDGB25vWJ2HwAMynci9spfhT+MM5LOHpQOUOo2kfqhLHXNNDIMXXVJ1uGAmFHK3S6
-O4p86BxE7bSeo5bQ1elXNGOZaavr2OsqcMV72npWuGp6Yux/ukLmhY6KdHP7dqqr9Roxi76G
-lab2wDjxVHMjc/nV+pDwArlzkJSigv9IE4Kb5P8C8yS/X+dLBxvxOPNTWMxXFwv4mmw3vlFg
-pVCnaKtcWBinuYpraHUCW+V7gWh+p/9xZKq/G1McKi8MFX6qGXoi7ELzifPUZdplvWquZ39u
-Huogrd1dI+y/PFmO1KgyDtabZ1nkvkcuspdFK1jioI2mH8Z2/LG+ATqqW/WZerH8UOssVdT2
-iPW1U0IHvTJ/FJzFg/hE6bHpicqYL+ogXVWvhfVRSCMkfJMW8yeE80Jn/j/Jwb5X7oWy1fP+
-JWoLf7R6NvhYXces1n/x+YZfsgMmoyMwDNWAP0kvZKfy4OrkBOxnyaR1JveSx8gsMhdfS8Qg
-OWgm+BBJhyxYE2Qovhgth63E98Expgg01nwWTqH3wDuIpeAmuI9erFdRq6mL1anqQOOnlgiN
-0yZD1eU6QHU+oq5go5VoLk35yHXWyvNz9IG8TfMK9eWWwh3hCVfIHWP/ZRP4Tcxn8VFYlphA
-WBb9jfR7odngc3YH+FnAjcvSYG2l8tlobvTCHqKlLY/Mb5xpzoWetu593gR3/aiF7s5RZz1e
-72nPJ1cH91f7d2cz8y17Ht7dsh9+QB0BvhJbNQafKZdkqZQEpyoQkKc20RLU4/Jj6ZXQQRzM
-fRKqsMPE+dxL6W/RL22UvCX/8EE4zIzw7QptzC3jt2cXFEXnvvOFC1oHThR7QleC1ULXw/WC
-hawlPE/ezRcALdSxWAejHOUB9tHbgZ9WE/zdVYso9p6k23nqW2Kcfax/2nvbvY6nzqqu1Z5r
-7i1RE90LopzOMe6WttO2d5aXdA1rNZPf2sv00FLTNMAUJJ+hLnyvvg5KFGfoe5lm6qXQDqVP
-4Jk8sfi+WOhz8duLRzHnAiMikfBh5gIbx73klrLDuO/h9WyFIMm8KIbDSb5Z4QPFy9mVIbuQ
-GbGIpyIhaQHj1s8Kdvi2th/fDP8gU/EQcYqcj9cxHyeWOT6bu0Q9cf6MzXCvju3tlKLSrFPc
-7U3TbHnYDwpCLuEpcAzeBx6PghAKenW78kIS+NWSWyhWe4tjgMZCGWgqK0N8pDfSib2IMvwe
-LEMSMFw9jvXXDyIw4AQaAK2VgFEg1DQcXD3ta5hUBgS/yXVCT7SRbCWwofQc7KruN16q39RZ
-aj/1nnpPT9cXwA/A5JKsmU1fhyOUHyiDfdN3QtOMb1AhWLrElHD8MHEfG0sdQyqbPPAD0zh4
-OZ2F/E4D6AhTLHyaRIG6+Gr1KzpY6Y0N1QZidmAwMh78AuwAH6gLwYfiIDCDfw9u4NtB2Xxv
-cCTvNp4xunwvNIRfF2rIno1sZ31sGhfk8tnfOX94IvPSHw519VUIVSg+GxkSrCaRbE1wjtQH
-L9b7mEYhmeZlBGLjqTeOduaf7ra2FlFbnJ2iz3ueRw+OuR29plSy92bcabvZW85E2HZi/WgP
-2p7eiR6lX2HjTBCWhpeG7FB77Zl2SbKqA4RlisL6pUPMSWE18xenRFKZ2WFXJDZYKtzQ3yR0
-q3hX8IMvOjC8cK+vfX7/ot35W30TCqf63cUXAnNDU0KnuQ2RV3KAXWiUEqoiraVd5Dl1t/k4
-sNSSjCRYDLzQspfeZH9pP+Ua56njCUa9dSneJg7NlW975lhje21vZq/omOBMcXb2mFx+r8MJ
-e0bYbtuGm5eRheQrcCaySvmldRWOiVvZFXwVZj+/k6kulOay+SbcFo5ix3DlGIHnIwni60hN
-AY3sYL+EwuGLgWCALAaL9/mAYjL4NFjAvmX3SzWF/kp7fo5SkfugJPKgPl/uAtWF6uMc9ZqK
-sm+jw4455pGOveZjdsbcoyRHrzo3WTOduqWcsyE9zl4en2nOghYSOPgZnm780IeqtHRF6sOC
-8s3IUq0nGw+vEo7iHSSW+FtMxscJfRGfcA0GFBJT9TTiMMjjFaAx8Ajgs+bS/5b7aVOkSXoF
-cbkhcJMMF7fXoPksYKTggmqIOSAqHQPmyW2BSooCkMoSCFV3Iov1TtgJYCP2n5GAbFHfGn3l
-g+oCeaY6XTOMvdASNBpPJjrho5B5yEotB5bksnhdvTe9Fq5h74qvdbUl6ngW4ftcDdFMayoU
-ptqAU4g50Bi8EB6MPIIGGU0BVTlmPFfmgKNVE9xR/gqO5pbpg0NllV5+TBpXHCc+8u3j/yha
-yRTkrwzsyylf2Cp7V97Q3DX5r301fFb+VSjTaMhb0dnSUcyq/kWuAvMtF0iPK9fWw0u5maj9
-nu/RCd5R0Ss95qhTbm/UQE8kapxXiuri3ewlPLC7smt4Ce1Nsz6zrqOspgzYjZ7UeoIZ8lYg
-WpKNf8Uz+m1xjtZaGK58iVQXavn9YaOwMLCvcHQALyznf5q3vRDKqZj7W1bPrB5ZjbIKsunc
-qfl00aZiU7A3czWyUv7KeoFG/Bk4U7ThrNbXlII8sUwiB9iO0XPsX6xjnFFOxr3SHeMd7ant
-SfOUcad4T7g6RvlcD6MAz+HoVZ5T0W1duCfaClrbkL2IZUgtZAH0DpoBxUIO0Kc30Gn5qrKS
-uyi9DD8W3gUH8HC4Jv+M3c6/ETz8EyGOvcxdDUezc0N2dmfQylKBOsyN4keRHf4Ig4Tb8XNL
-bP0VP1OUxDNSqvxvyYpT/lHSNdY4Dz/BbKZhdFcrZK1rO2ldbatgm+u4bJvsTrKZvIb5X3dJ
-+9jq4S3IVHhFiak61F96uvzdMCtLwGEKANuVtzAoV0Uqidfg3VxDKIN5A0xkHwNDxDHgItUA
-d+sfkXiwmCyF1i9Jhz2ECr8ERxkX1HoapFTRmymDgNNKXShF9kKUIBirmFL6/fA8vWHkKyAy
-HBTFV4e7ikXgBvkfYL6aCBzUjgK79EPQaD0J6axehQYqHYDVWgdjA9DIeAoiRkVok2HApaHf
-8CXoAVNlYqatI1ngyiBqelditdyN4DbW5sYtcr/ahjqgx9i2IS8cNNHJEoMV4WVhCtUgCkGQ
-PGAkHFCKQbPwAPgWXqpn+CrJy3NJjso6Gx71KzVE/dofGPxjb9GczLp5ub+ic8WCXfk/Q5pv
-hrgt3EpvLjQGDUWB9gPPsaHYY/NOuoZ7pt0d88jVO07w3imVHrsqoWz84zKehN5JqQn2cq3j
-j5e5EQ3EPnU0c8n0D6tA/aRbm04ToygNcuKofg96pHQwbsktVVIsEI3IT+5EcVvGlP93KCOn
-ZaBVXjN/94Klvmd5dfOHZI/Kbv6rffaJnym5F351yB+Rd7zwn8BNfymuSrgq3z3ShHvDPBHG
-ir8ZO414EsPn2CrQLxwXzNsclOWSq6d9RPQkb6tSUKmF8WzCmbj9CeWjmsTlOCZ5x9m6uhLs
-p5yqTXbYzaTNg7tMHeCdaHu4JTAaGSkfhJuw74ENwRWaNZAtnw/elxYyafJlYYMSlg4qkDxN
-3iA9FepLOttTSmcEaXvktGQKDxReBw+wD4IXmJ7BLCY5MJZNCq7k6zKX5DLCWL2m+JdxTLoO
-ZBknSnwDN5+1DHUMsdRw/kX1s/fGH1sz0C6Wk0hr079oHp5PzMe8VG30MVoTHA/sUJcCnpJM
-BNXjVFvlCFlF4JFJzGZwPEuB+eJU0KVugxyahvTSu2BnjTFoTWAiMgM4iaDgcRSHlmGTYQvW
-FDkJf4e3APPhZ9pReLvyA94nn0B2S+vQf/njyB3mANSLnQ02Ey4AjcW6uo1vIYcZUVjIlpUu
-8V+UePGZ2kVspQBSUDqiFCjHjUQQhptiPdECYgc+i2xElicGkHPROHIsHEPNgY/QXVDO2hZP
-dEzCd9hfIjOsMjDdskTvZPuuD3Y5IM7zDm3naoRXNG/GXqCtsUXAPGyQmoJOKLH39qHxqr3g
-Ld85awRT8WdqePSPDoFVmdmFLTNb58mZv+c8/nkzZ0/OjoL5RfuCDUM1eIxzytvkFtpkcCPY
-jbiFDbK+ohd4mjvpWIe3QlyCV4sb7LmT0NRbsWzV6PhyO2KqlasbWz/pZezwRDIuNz4YnRHT
-2P3Bc9lKOzzUT+oCgsMvgbfKUa0791j6FJrBTwuMYO8V3Q6l5EwsavmjZe6YH9k5U7N35Kfn
-GQVz8+CCurnd8lvkgAWDsk8VbM3eUvg173ZxleLc8JpQB343c0nsKsJKU+CNbiIHwS+sG/GZ
-rpApOeqOLSV2mftGqe/Rs+MrlVpcqm3C/VigjD/qfpl/XFVLt7FTpb5Yz0f9oM12HcvGHoAZ
-uqRPkaK0/lyUejjyVd0WIfWpzEHtcMSj7gg9V9BQgj4nshA8z/8Jn5dbwKu1luBLXddK6b8k
-Qn3HNZDPRi5LJ4NWSfQd5ZcXdeR+BE6If/JfdURtCO/Ud6FlARNxHkCpCsBKqjpwisKhgyYU
-6UW3gXdQSYALn63fRUigJ/IX1A2eDNcDDkNFynmwtdgKkvlSiFt8i7aS5+CVtepkC8BLlgV5
-rI5xHk3SumHdSxh8gtICTZe/IL2UathLrS6xDJDJImg9dRl5TXRH66IL0XzQhYeNVWSWfprq
-pH8krdpS/D8JQdZza4HNkQx9XWic1icwSfEXV5VG+jsJYwLJXOvgEuZOOI1tIxSIvPabPhoS
-wRFwObgp7IefIg6Mw73kWmqFqbTpP/ohmUHn4GupfLw5Pso0GVljOwNtc0YAm/OxXs2+VHtl
-u6wvdpSHVrteou3dJPHNmUFssL7CY8hB2GI4C40CLJiorIKL2YB6o9jH/pFbJ/A201546tPY
-3EXvPmTff3s6x/2hTf7+zy2K8Mxu/rM5M8Ip/ku8kxurRMm39SF6AdgP+YF66B7UIWcDCx2d
-bwvGFjiOlTrgvpzQN/pk4uS43eULSl2uPDz+z6rW+B+VkuI+JQ2PTiqT5a0bn+154j3l+E7X
-oPqAGwBJbCdNZStxvSNxzKxQlTDlf+avXtCtsE2Omjsl+2vul5ymBbtypxc1zsF8+369LIr6
-ESi6/32D7/QPoRjI6xBMCqwLP2QORBZwBREPj7GbpHNCN7C5/hd1F71j70Yf8kxwjImRoqqU
-uhfvSdiY2L70H0nDEsxJu2OJMlW82+MQV563td3vqGt+bu6CTyYKjOtglvhBcnNJzEiuUfCl
-MNRPy3eKE5Q9/hEKGGqvTmB+M2YJCchQJRWfrD3DgupV2Kw2AVO0PIMxOukzgP3KYq26eFVk
-2UncYWYCX8iuU8YIOthf+ogtkd4QK4RqxC/2O3aE/QvvL7amNmjlaB+gUlZwIZ6ll4V/qB7j
-glaoDgXraC+QP/X26CP9CbRL+2W0V48b7VQZqqwdwBtrBVQZ9agpWVlLNVauE3OUGXi68hbv
-q9Ylv2kryZX6AeKcvpy4BQyghqG9zFep7tYRlkPmB5Y+xG16H3SFkvSZJbRuJxLlclgB1wkm
-QoxeWNRWthbiQqOiaG5icQqDBl6GVwWSw4OC+yLmiJ+ryjukXfJ4ZfD/GRg+A59AZuHTkRNk
-Z6wlvY16b5li5sz/0o+IVSYRZs034RoODFvluoOddmWhr529UJ+9NZpk5RA/3R0pbe6H6NYG
-2FTHK6KL7SlRl1yFrATX6Zc1QEG1d3LrEhJaFtkn/F4QiEg/lgUGfk30Pf8SLKj/bWl+/rez
-eVu+Lcm/+G1OkfNHveC8XJK/FdijNeJBKE/CodVqJ9AOilBbYhSu2y+ZJ8eNdo1LmhA9rCIe
-Z658oVSXqmmlG9eolkTVDJd7UPVL2YrlJ8R748t6D3j2WJfZ55G9LS3QZOouuA7yar+Jm3g4
-VBDsWGz2YT42/1ZBUt7k3LS82tm/FdLZSf76OceDP3MWB5GcN8UXsu4VEllCft6v1vkVs3Pz
-a+YvL6rvHxLozcyNZIgthRparloDKgdnEltIzOaz/OYe73hcYur9Y6tGHyg1oNS9hBllzpU+
-kpQaX5TEef8tPd4KRf9OzLTHoqPpash+Yjj0GrLoz6S6UrlwHr/K30vwBM+LZOSgXIYV1AZc
-rhZiG2oPGFqPZutDZYVP2EHZQ6hKHLZIeQz3UK5CK9XDUJQxBgqAq4AhsKK64VVSBIoSU5AD
-4lrshnQBryRvx3dKNfFPQg+sGdca+c5QUAL3C1gqZBsfxffaT3G1IovX5FtSA2WbXEuxqFtl
-HNir7EOr6TxRwWCJAfoVIld/SeYCy6nbgEHO1AqJkHQcvy/WxXfJ34gb+kbTfai0WUQOmXdg
-XouF9JvvmDzmNZaK9B17H+qS8xF2ydEN6mptqTWmKgvp8O/hgyodWCpEFw9lXhYmBFsX3C6+
-VXDdH1tUJnTIVy3SKzCJ7RoZIhTz2+RLyistaOwEMPg49DuqwE/x+cgflB3dZD6O17c1o/+y
-dbZusbSydDXHmNpZ3hPXrPPwSrbB2C7bagx2XCPmOOuZnjuLTX875lErrPvwb9R7+BN6ydgB
-Fat9wcHqAaOP+rtSQb7FZrG/+2cHPuSPKXqX4yi6ktXLV/pnjWLuu9u/8vvsQN0fUnBXVlZ4
-Vt429nthUNjuP6mkhwfpcaxXby/QWifjhtHQ1BH7293afD92mfNqwp3opmWbJwwq/y7xYMXN
-Sf0r1y/XvcropEuV1pRunLQwOrpUgiPP28XMuqZR5e3nsDLUXKA86JJ08Xikb+Swf0Px+cKr
-BUABWbCqsH5hRrGtaGugaxEf2FlkCe4s+i94u7Bc+F5BauSPghqRegXJwfP5c4tWFGzJL/L5
-C7aFlvnLc3MZVjKke8ZdYCR2EH9GH7Pstue5lrs6R5u8O+MqxIgJ0+M6Jc6Oe1bmUszz+Fbe
-CjG0/ZrzBPmUPoKcw0NgRWSu7gAmSI2UOew+/kTYy/wemR9uxFMRWabZd/pH/hggi0eBf0UC
-7FviY5/YBGIR/4reqtSwnQFr2GRkIN0NWYzvgvYjK6BCyIDOG8nQP8oB8L10D34p98CnKCxx
-QLISI/j2mIN5Du8MJQIJoV/qoXCaUpvZL//GXBULIiv5r5FhXAx7nLsuoOIF7Ym6BO4BQVgM
-moiOhpOQdsZc9IWyk6ghy6YUeb4FUNdba+pDrYqx3MIA380G+Ld5KHKJXoRvNI2kAqaD5jPm
-bfa2lpeudrTo3knccc1GUu00kExz8mS0Fn9GP8+slw9E7ol/BWdwKwrfB0bm1Clomf0z15pb
-uaBx/uBirvBD6EoglbvP1pZmyqxCAA2MeOwHnEDvIX63N6cz3Nst6731rVs938yxrpemK/Y5
-1ElrgIyzfCEHmAXyBn2VXGrqQ3qo7aRA6GQCkUV8wydgk4kByF7iFRTEegG34c3qIGCtaNHu
-sbHyu/ApYXdoOXskND34T+ifwkDwaAkkorlkMJSbGrTlPg+cyqofCGS9CNXIr8VvLe4tdwhf
-UQ5x+9X7Uo4+RWsH9QN9aBp2hqxsbmM54ezi7Bj1r5eNfRAbVbpL6e5lG5WtkUSWLSg7sMyY
-smcSXpRBSo2JT/Wei15oeeG6g/yw1tO2kC3F2+AmNlXOCKez7wPzgid9N339CnsVtS9cVdTC
-18Y3PfC5+GRkS/AY/yZ8SCgM57J1QlzI5R/v/1mwtTCSZ88/UGQU9A2vC1zkhrIF/FxpkNBB
-vy0mQ03V7WgviKZSyNtWwzLE3cyRHo24VsTmuM/H/hEFxfaKccZkRNujCc89bwPbHZed7Grx
-gdmIosxUFghWbgT7OYIzH5jbzHHOzA/lq0u/uEPqWu4f4zE3AfzIueA8rgaWyX+jakpvrUna
-GUcZyG+7jw40bcU2YT2wtWhV3Inh5AhkNDUNYEs6fKTpkrqfqqxsxRziK+Aol6Z9ZE6pQ0NX
-5G7FdgHw9WLt/kNMtVBTVg/X4NpHpvIEs1C08YDCyefVn0Y7zQOP0jCknuZF5qvn0BOKnaqo
-XrEe0cc4X4KNnKfgQTYW7mneCU+l2yCrLU3xafZM0xl7om2g5a7jOnnC2RZ/53QRmnMyOdDZ
-iahsNyHHzaO0P4iT/HWwHtNTqR7pyJ0Jvgx08FUsep2HFDbJWl9wJXNYfsefdwoO5DcOrAyt
-YBcIpDRURdRdwBh9INYbfGPuhVZ1LiXqOauSy2yHiXzrUHK5A6U9nkTbUW8N10L3bHeBNdXx
-nQTNQcxFRnCayKQ+EI/oS6THNIBIwu7Ad8FuOg7UlDsZCQKi72IXKrUjuXzDYKPw+WLAX6v4
-D99f/izfpWDv4s/h5b6qzMKil8ylotHs+uL73Jhgkjg/fE3CIgmSHBkoVuGLpPPyUO25Xge8
-CLZEn8Em6gtKWy8RqqOfuYznk9Mc83dMXvzthNSyPxL95QaUXZrUqcz4eCy+hbt+zH6T4m6I
-JDquAEstW43dZEetNPxD7Kda2Rj+Y9AWXly8LDDE1zE4w18pMifcl+3Inmc87OXwo8idcB1G
-YUawE7ihjMJ+D8WyoeBQRg2ZI0VhT+hcCSONCa8NHIn0Dc3nFzCkdlyogU5Qx9MDwee2fRjq
-vEgnurs6z3kXRfminkfHeid5PzhbuSR7Xfs72zV6m3k91pxoDHyA/lBu6Yclu1ZNfqX1kM/q
-NaUV2gGxgyxLyXy81o65BVZlCrD93BeKlHrQJvWqqaXej5pu9CcGGR2xPUZFrA18EG9EbsOP
-0PPRVvQd+DVVCt5KzoRkXANIbJs+GMlSnHALaTA4gB+s12bOy7VCtYQ1/htMvs8fGua7E0z2
-JYXm+DLCgF9mioIqn8xulxPl2XpdcB64FF8OVTCtB6fQecYVM2HYbRE9175S/2RHdcnW0bhr
-awC/sA0mKtqqm/tZAPsBaoPDjj2yv4af2RTkb1sKbrItJY9bb1KATSLWWA5C7QlQ7qePZCZx
-qaENoYrB2sFh/lnB/oVKoFp2w+J+PzILj2TxvrG+TeHuzEC+p7BbFKRz8lN9r14XXQNtoFCk
-vbUIeeFqSfwZrdCXYky2NlFdbVGub5YRthRzT7OX9lArqK94fWoI8Tfdi5ppxU2XrcfJB/QJ
-7ABeHjoKDNZeillyRqS3siGYoZYPHlcXhr5KYvgOsyPcz18mtKtICH7xTQknBjCmdvA1U+P/
-r6sFf2PPRdK5ZGGK8FC2ShWVjtJAqXTJmq6sU6eAZcBE4g40ydQZ7GDqCwwyVYXyzM+we45L
-5uHRa1wTEsZ45dLH3Z5SEccPz07HDXt5d8gyNKqFGY5uTR11x6JzrBWM7sRD6S24mjuijWM0
-5QmzT9ZZj5jI7efWsstLZtPLdmFDzHj2NDuRHcJ/YGqL4cgYaV2kWMqObJKvMJQygM0RU5g0
-JiX8OUBFrgVuC+fDu4wGbFX0ADcTL+Sv41fFifhytSsRBedSd6i7ZsH20JrpPGpLcDa2rbBh
-1rD5jrmhCaUL8WZkB2QWOgGwghlqKa2xbFHeSlPlTxIvpkrT+eNyR36uES2fRpfqW8hlxjby
-kXoFPyWF8BkyYppi1DHvQJLprvhNchNREx9ClkYWkH3BTHIE4DC9AcaZaoELyJrgemwKcBD+
-T3tq/JRqKkU8Je7k4oQUdiv/JfySfRx4FaniBxmnvwKX6H/OH/HXE3oHv/H9wpu5OuwL9p3E
-8T1BUf4br649MOWrs6xP1BeOufootwS6ojrivuh1dD9vsqWFrSc9hgRNfbDxdCn8klUipzl3
-mDq575K7nBD2znoPyjbZgdX4Te0+xKptjHraJO1fxaMsEdYJc5kX7LSQGJleTISa5PcvHpv9
-oehm1vLiHzn7gmmFAHMmBAqbxP/kNfoa9RckqNEEbVS11kQaeqZRaTH7LdbYO9aG0Tethz37
-bPVdKx0tHZ1ds22bXRMtlZwW+ontA5Fu7oVcJLYZJ6H96iv1L3Wl2EQfxa8wXnK5+mPOp7xk
-mwtsGGRuBg6EWvh/C27xdw9ioeJwVe4jN0SeJbRQCP6sYGc/MHlMDaYfX5X3ySZlsZFkxIN/
-Aow+z5iqbNQLpWLjkxKFdAHiqQZoqo0hVrrfUM+jVpsmxPxBZ8ecNv8dfdJS5M6wzrHvtd02
-x9mnUkdsf2Edra/BzuaJmkwtkTsRSdIrtLfUHPEonaG1qlVvppBiFSEUIZh54YJwAtuNXSau
-EdqrFaRVOiTVNqqJM/VTwl31ojBUHiAkiwP49sJXrrog8XFCLdngi/Th/DYojX0ApUR2Ah0i
-H4wclgMTJQ86Sd+A70Wmki4qldpLryVf0l/xTuYL+AHLQHK6JYrCTGG8P7oBvmW0Ns6oPbUO
-Wi19BVAFWIVsAr9iHcFENEGPAe9KHuCYWAuer1xEv2lu9Ko2EWmsj8avQ19pP2lYbVbMstlq
-J7Lp8uA50q+OIDSVJzT9HjEBWIFFgflwM8ADNlEHqvGCzoe46VyuqAsPpETpLfuFW+FfE75e
-kBe8lb8w1KEoOdIheJH9xazhF/Af+Euinz+sTBfcBiZehrdLV8mrqm7JM2o6hkBLXEnoAU9l
-4oR3FXXCc40+7zhryaI9tuNkSwdmSnFz9FrPcaq+sy1ygb6kb8FxfS8WD+biduQK3hZ+CGva
-Z/W2YBEaspW4fZHaXN2Qjf1QvDe8quhYUC7Eg42KUoIm3/RQS/+ySNPwc24e91m8IC6Te6kd
-1BMQCPSki9C1nnR6ZVwTe1HsRkdV7x/2h44GNre9gw2yp9k22JZbn1jum4upUaZ01EOcB2PR
-oRADz0QD0E3UarwGZ0pVVTu3nNfCJyKVQ0CkZmh35HEoIZIZwsOjwmTYiLSLzGNbM0PZ8kx1
-hmZaMjCXzM+WCuXj+nmdgeYBNVEP+BDhwePQaOQ2UIM4C6D0c+im5TGSYt2BbLcEoG6WT2Af
-61voka0v+t32E/9guUDeNs2ldhELKA+mUreQhbQJMcxvoakWD9jdEgVMMN8zylE99FLoRmUZ
-cFVU1Sd8C/kDf0yIE5twy8QhXHfxoxQS5wIb5O9IY/UNUl8bD1H6VsBpdDVcxtuS+zdLeieZ
-hCFSKvdL2cYU6Vsi84CWTGWgkP2uf+d2aSy7Qj3KfFT2sveUbmIt1akN1ZaA341/UQfSltxM
-DDXtoa6aupLHKAEdSHyD1qG/wAslXloTSYH3YpegBDILCFEPjN6mLgBLbAS7oSD8BE5AlqKt
-kN7Efpgif4c/YxmIC0nGT8ONqY/oYvoNXtocwT6bxkDTiDSVhytJX4GzUpHh1WaUpPNUUASv
-Ayl6De2q6BTrscuY3yIpYT5cKbI2lMLa/NU4qaAs87RgXrhdcAQzVFzIr9UGCpe0f/hMNZtn
-tLLiLHCstAU3q4RlGTDQnof8tI8j3tu7mjLtPcztHSEL6WRsZodu72J+ay2NHzKdhU8Tk+Eb
-+AxkOTESvUhRaAX6FdSZWmu40CsaVkKSMXopI0pP0a5raWJ35XrYz630XwuZAx2DcPBzcEPx
-qaBa0C4EFk5gzvp/8TvYx+JTxauYIZ8uoxegz3g+eovaRF63tbXc9XxzHI866a7naeXeZ19s
-72J5b75k7kUnmwHqAZWL3se/QM1QHjgPfdXigUJJ1b8K9Q2H2E2vID1WPsv7xCTlIztNeBee
-EakQeRCawj2IuMRlXA3xGf9QOM2bxSzOKdbhCgUPT4iZYpb4Th2mdAD/M86iSehJ8g1RkY4j
-j9CnsSo0D2GmI8YIsq1ehtigVyU6GNPJcUZX6kNJ+10BH+MFsBddge6DauIfwV1EDgiTtcAR
-xEqjATFQ/5N8om+jfgOmUL9DMrED7ofthShkPEDDlfUmUBM1EUiX36pzxS/yHGGBelQqD/5T
-8i1YuBNux1sh8fg9owXqVjtBHyW7ESeRWnvprnpXPKXy3C5ZCrcVkoMiWyXQnz0ROMvVDN0T
-l4fHKkMjM5U7zBDpjWCX3uhm7S16AJpDvcSW0buJJLOX2Grujz02g+gysw0dTQ9DP5C9kH/x
-r9BFvBsUT82B083/YMstmcQI0378EHYUWQ13hXXIim6F44ldsI/MhSZRLJhEVQfvEiuApdgr
-oxdSyRgHhbQ7xlWlhvqvNETKEA+Lq0VdmiDeUTKEVHUJf1dZxY2XH3J7pI98eWlWSSN8ZA+x
-C5iESBPGFTrMjQ9Plqfyp3VZFgGH1hWaooNIHJCK/gBSsKrgdvITfNDSjfjL/oTabpNIvxkg
-XPQXfJ+pLtXHFGXeS3LmbHSsaRaYjVXXv0JP1O7AKe2F8ca4C6wFj4LToRdgaUgE1gLrDb/G
-arvlOLWGeFm+yS+R6nL3BR8D8L2YdewKhmNmsTw7nDsqFHODlNJ8OX2i0Bhwq32QNdA6shb+
-ll5CDrNMNa21bjRftNa2DrCUsxPmN84e9A3XLWq9I5kYYrGjXcg/wRDyXL8IvdL6Qye08uBF
-ta32TKKlGP4Zn8S84waF+3BbQy25UHA4Py2UIe5hEFnhDSlFXCj1kr7+fyLExqpV+lv7quwC
-hgAPEAbaj1FQT+ylEcEe6p/I+8Yi80Lwu8UEnaXnAb8R/2nf4f1qK7C7ngZ+AlvB15GrsIDc
-AmcgPYEh6HhQQudAFPoJfApfBI7CNYC5CAiEkV1GEBWMHYQMYKbVQF3TUZ0nMK0ke9UPYAd9
-mFFk3NT/AK8areEbwAYEBTejJuAohum7MF29hNTUG0PTgaVARVDXKxpVtWS1qfpBilZt4hxl
-LW+Ve3IZYmeWEfpHBL578Bpb2j8qMtz/W/hlKJnJ5oYJ2VJz5Zb2UD8FjYa+YS0RiPwCfyTt
-8J8mCX5qqY9dsKfilDOE/XR8RHXbfLSuZTj+0ZRDHacGWuIoq20A0djyDVlD9iohAI/6Ehgi
-dzPKq52B8sAKSIa6wK2hZ+BTozJ4XhsDZSspkFPONeaInbUUobM6g1+pBLin8nrhl5InL9Ta
-afM0l7ZCXSu/lFmhlthQiOdXi1c5Sf4fRecULsfShtHqrnYPt2Lbts0Tc8e2fWLbtm3b2bFt
-nDjZGLUL//wXfTcX/VTN975rzXQ/NUePR6ZeyqlhXLTTW01RCxSht+hdbjL7Q9oOHyq74XAl
-Av+Vp/MZ5VziSem3sE56xVeVJ/Lr5W/8R+mw8FSoJNTlbsMsLMfEgEQ6hUylOUhHpgw9Gt2N
-G9xoMBSeIKngNBpJKtkbnSSzlOVxFpolwE2rIszlbAIL7dYOb+c0PXidUZita6bnk8zJ3Cxz
-LMxhzuJGG434/MYo7pCVxrWhacJA/qQ4Sl4o/lID0klPN7W/31Cx/5Vcx7uMv6jsBVSsQGSp
-P/kt/UtaSwcQ4rJaM0E5/SKqr22w7kd2Gd/DIw0Y3m3+CNWz+oaTjORwQ32I1sSYbTa0ZTQB
-m6Qmnceo9Ch3ETeQ0tAANRfu6D6P5rlaO5Vlw04SWqDBwmXyRujPHBHusPc4CIuxE2F6JoYb
-zvTlRPYax7LD+arMDT5CO3Ljic68wjvpRozxWLSbrLcXM0fM+1xF85GQ3V4ltsVnpabMT3kx
-V1lW+DHCHFgGOuxRZhq/gGkk52XSq9/AHeUJuCMngFTpLskgNSU9xPPUJ94Ct7mJJIlIdlnz
-gq5FjuiVtRPWG13BC4zHmOiPnUR9fbQfV2jfjRLh2dabYFtrQOiBsTdS0Ygz6pjuqPl0N/+z
-njjQqQ09+Kj6hU7094EvY0YLhWLGybExC13NYkZ4BsVM9eb2X/VudWf25pdLe57yjLsNt1QZ
-yrbnV9Nq1EfOIw+pQ+aTh2ApacWMx91peTQMu9BnvB8dB2VRPtjC3sEmWN9pFkvCHaNzNMD+
-QUajsbAL3sENQX/BM1tx5lu99EXWGu2CfdwohppZVfFVM44sMObRrWZO5gbKAs+xfYVM0lB5
-hFJJmSL/ElvxU+BPepJWwGvIExzPjKGU84CV4mS6VxpAf4o5wDh+MrOPbcseBw74F2Sn30A/
-WgwMZL7iB+w45yY7zLnJfMTdKAb58GW4EWfj19LC3Aiwg2lBH9Hq+Dj9jK7TAPWQ2txL+4lw
-1/gq1NFz89BYATuaH+E08xzf1SwiclYdYZqzi/tKNdidmwz/iJ2i09tLuCzPEVzKRphLnQNm
-uNuBlt6pzADPSHa8KsGRYn3QEzJ2UXArchufDk12OgS/m8XSphl/UpqYX1Lm2e60Hyg5lIZv
-mkG8nKzBFlsfX+Frke7SAzpX1ckb9zxnsKeducA9Wv+kuPTMImdO4Oo6H6GLRKL3co7vyfi5
-TPA9aMYl49ecgdZxfUgj6AGt2BCV4QXSnVuF78Eczgn2pnmMG2YrYiH8rzAJ3eQM6ytsaU2E
-65zxbCMyjo1lZH4M31AKyB/kEa40caXLgCF1D5PR9R+IcV2nUC1Aqsq1UCHxhXWdK2K+YgZZ
-qQSh5agKsOwjTA/7GdPJ0UEY/Ue2IBZ77WTH0efbW7QUo7R+P5xDjwt8i+ipi8O3A3VCV8NN
-gy79axBYo7TheL2dGS6hRK7BnfcScUvMSvVXTGNvJn92/x3PUt9LdwHvbc83zwZPsqem2tZd
-S/yl7OWyS31hAhfP1ieHqdcqiDcbpZ1a1iY7PargUDzf+Y2moNnOLJpIfrInuN4wQR4OMkhV
-0UK409xOfmk5nAPhzDYTzocGRQaSLzokuewXaAZejygtiT+AhuQPoKQYnEEridfAGHkePCaW
-FrxwgnCUvubHkUUwKwnjBHrN/AJSDYtt6dTiF9EBYhLzWzrAqHIGsEKqRmeLXUA5fgpblf3L
-KnQUrYIW2t/tHGbEeWYh/AMXJ3FgKv5GeNIEPaTpnXj2J/oEz4NLXAXuIZdXeMz1+P/pstJg
-OFrJxARcgDBuxx4kZzZfcM+13Uw3bSnIrU0G7SNfQeXIabBW60ZPWwx9STUqC88YrKRwjjtJ
-3OMtLXl9u/m/3rJwr/cs63EvZT4KHhImWc04+07wmv05NYQTArVAmdBosCo0kL4IEbIwch8s
-MHLwPbBbYvlBfGF5EfFIz80GQpoxROxu/5D/oheuariZN87hPZeNwdKbyBDWqxUEY83cTGfk
-gikkkUslR1gTvyJ5aX20ByI0XH5Fp6uPQUEphqxgf5k5aK/IRrolXIRpqQ1nvugjQHnDAyob
-CdCyTkbNdp47i/TeU8w93dXYc13yuffwldQNfESNlQ55K0t//D441nvTbiGHI2Pg1XCj6Hog
-ct2YSrbZhclENBNnxB40mTywg0w/Zz7/CCeIG8EMbjuoRq6j68ZZo3BkfqRZpEdkYORweHYo
-NnA5eD3ZE86ePEWfnDYAvdJrsSPIU24+u4tbBQfyXfgN0kH5mHua91RMzrgPcTPi28SViE/x
-949N9JzzDlQGqnf598Japhebg2zFc+1V5h8jkwbMYZENTkMjAax2qkYdbgcrUTf8AeI5BNdy
-mYRM8DpPyFZ2pHUMG5E89oDQOmtVaKEzTBtE8loO+OgsYsc4hZlwdG93Rlt1B6DcG+G4dFUp
-Kt+Uxwh9+ZpwJ1OALczm4x7w5YXxosj9hnH4O9a1XY4RTk+W6nsYv50TTnfi2KB9GYxwEsAR
-/DJKQDz080O4nMJ12Jy9CUo5R/BvrQguql8h6eytoDw+Dhah96SvXQnzThN8gxiU4+rw4+SK
-KnUXcOfz7pTfuUJcOvUzM0a9BC66dtDZLg7dkV7oG9jMofWod1pxK5S2z3warmU/MM+hR85y
-zJLuZDhTmD3AVxIHyNfl3UpWqZBCuafyfbalPJApJw0Hd/jD+BU7yNwI7ocALZPWm3RKU2mV
-kMIU1rJyQ/UcYnfjoVjNTubWk5zsL/iUbSDf56G7tXg1agmWmofJoLbGVBlqfZOu6mf4CZHp
-7OrgEHortSdenrIFP0pLAGmRoux9uz67l64H5WGQIH46rST1YN7LwxhD2ohv8TnNJHZOZDvY
-E+4PVmg52Snmce6R3U08hzZKfcg9aS1TSx4pzFaCSgNXAY/jGuU9qs71jhO/e0ZH57U5rqcc
-d86IN22OX24hJsHaCuZZT0Ev6wO5b76zHbO9+dneaA3BtXE+ugJUYVrDerAbtxN2Yp8z6cl6
-nGKqVmrkvVYjFBM5mTYrXD6lfCRn8lV9aarfXhyugDtbc8E++iRKzLfFM1Jj11cV+EZ4f/lJ
-zGk/iM/rOxB3wn3VL6q6O5P0TbnIBcTHIBUm20txYW2nfiGUFOwUPpQ21FgbvILTtEGwsc1J
-L8gy9RFb3TWVOynaLKHPabx9Dc80Y0kZOxcY5QxmNttjmWNRE29jHGNymS3ZLfY2eATLwmV6
-SIwDS8S6IIvkgDTpIXtZ2sdPkDJJxaVxclvhH2k5c4Z76ThgpZGF/IlURhki5RxGW+bEG//g
-2VY/kIBy8Y1pBrk+a8r5uWbiGFiZfUs8eIrZ36oQ+WJWjeRz/uqv8RIrPW3pFCOm8wJ9QG/Q
-HLKQ3gFF+YVcdcWWrrt6uvO5q/vnqmJsGdmOqS+KMev4Kr4d7HjXEHxGmGgwzInQJLQg7YF5
-I3lJZNrfn4HPqe2CRfWWel3SDR+HPMzIX+VrcpuFRNhYqMb95BOE13wp8Qq/VPzBXRMYdhg/
-nGTkVOf/z2V9B/5IHkYLr2eLaqXgSO0ee0M7Bj+YD4UCdIJ6WcjnraAe9o5QzrjviesUUZwl
-8FIWsElcbBJ+fugT50kdxB79C+j6ZJ70CrSKEsMxNodRm40x+4O3ZldyzGqE3tiGvR8dsGPB
-E+cATMTV+NG4Jh/8/xnh1ncuzsSwlH4fxms3eNHYJjVCm9TL8JpnpBrx7/F3jy0Q18XfLSbg
-5n1DlGuehsIBV05mrdTZOQ87GP1BZX0E2a9/RYZeFJ3T16Kdek/cRl+K9uq5nftmATTOuUFq
-km3gMfOYGcZ/YdcLQSYdl4vYdK/VGu3R4uyboSrm8cA9bWUqE2mTejPcJXhJL2sMwjbuxvlh
-Lbmr0MWVQx7gKeM6603x7vG9iz3oq5Rw183FD5M/+08IjzxPuIiyirnNf0GfyGjzo/4zMiag
-hYqmcto/gR72ucg+2taazfZEq2Ehkof7QvdFmWEQzI1PccQBQh/8mk+kueA1Opo0Be+tHGwP
-/QN7IbKVDWtTuIw2kvKSO67ftLhnK7jlzsvMUi8yeeRhbLwUhv3EeHG00EGuxqWX6tHzcI4x
-k6QG2tuJae3N6sHrVs5IAo43HtEV1gHmuvOMzUdac2uY5cI07rEYx30QNoJK3G4UxyTaefFZ
-K9W8aN3SbXO+sU3va6/VGpJ7Znm4n06U2oiN1Aaucirvyan4vHHyaX+SeDCutbA7rnLUGA8I
-rdyZ+ZXR+YkD7c1mZv3oxHcMZA33CUihm4HJwYWh3ZG2+gDnpfWWOej84WriQdxcihkPOxX8
-hROYCfxKbovwVcwp1JCSuGHcWDicjGXXR3uvuj2f4e1BzA1zDcOYXdke5nuul91Bbke7e9oJ
-+f2TFN3fXzkTM08e5S8qZXFhTuKPMEk0RIlj4WLGcXtlcIO5OGWHFZeyDudMCzGRQDvIhG4x
-rvAN+jfym3Y2/jB5rN9sc3sXM9DJRGrj6VYrcEwXuUxGO3GnmSiFjGniQv2JmGpulsvRMmpN
-oY7rj1rTPdy73R3j++T+48npzeCl3ke+ox7D51WPudoJ5fmxzHZSy+lgG5F75rZgAbtA8KqT
-J1TAccKzrBX6CeuhNQx9QvVANzIexpOFXDXyCM6lOVg/uEFn0hrYS3fasfS8oeP74aX2wtT7
-+rk/67TcyZnNhaGpaJb1iLlJ30pFxN7eep5KMXliR/m/xtfy8gl/XOGYFsptd4x0Tt4qPJRM
-Lre8mSkvXkR3mZumz0lvpGrZjX8ir42n2i0jZLzWK1tZ9WxWRx0ZhaxbJgsq4TlSRXa0Ox+c
-6n5Nm6rPnIKS207gujpfyHD8zppBqLEYLLb6cgWiTVKdfHD1oq99telz/1GyyeMFqcpZyCjV
-RZ9aR1qnvuIN6TD4zhR0Mps/zcIBnzMq5RFZlXaP+RipAAfaR9hs+DlYh0vTXLQILcX2AyK3
-n2kFZdaipZly9i9aW9tBroR74sORIihRL+X8a4x0thkn8C4znt2LO4jzhC7KQM8hOey7IOoe
-n7TNnU896Lvt5hM6uNLSpQlazGLmnXyGJDAtcHq7GFqkee1tYVU/GmofbB3skBoJTEn9HT4b
-MMzV4Xy4uaHT6qgni5kSfEaxsnRIXqGklxPVdMIXuQ5TmG+HhpP3dla7Ab5lDQOOPYktgtbC
-E2gpNxJ95o+in+JvclD1c018jtIxRvR+8H5Vu6mn4GF5I76tGuig+yfZpa6n9/hKJAsJOoWM
-B/aOcHv8JNSazR4sym1PuQQO/ElAjf9ksnskG/batNP4eWggmKfZNMXIgi7bMeY18kwfC++Y
-d4VrTh/xHSoqLHNG8/WcvuJ1GuuqJXXzZ/Jfj1ufjo9PygBilyRU9XXzXXGnU9+qk8RYpRp3
-RBgKXtLr9lu9Y/hVoEbapCAbbqEvsyV7Illm5yV9rBm4tiXTNOdfuJKel+aCkJyX9OSHOp/I
-N3upfdR5YwponTHb8WoV7WBgsPkseahZIXkZ8oTesw3RO6EN304sq3QWvquScM6VXnriEd2V
-YzLGDImrH3siprMXuZrIseJ3zs3HsrH8ErKefWl7SHRYrKeR0fqQYIZIjUCLyPTQVX2T3sVq
-Zt+w01BrpyT94pRit6JZwkk8TRFIdnWr81GsZNSC9SOVwA5tM3jtbIQTuFn8KvUJtDyzAfb2
-pEf9v8GhuNHwnwRe2BDXSrjgBewOybBzMaY2wxH1ZlasLVt98Fi9E14a/IKkwDjyIlwFJJlL
-QAd0GDSiFZkhzF9Qn71P97H36H9sC2YXI8AVpBBX3BE403jFTIl0oytDBenP8GWaV0/GXiNk
-nzFf22vwYVKTF/l/PJraIuGmr0DGkP9WhnG+++nWuLPHp8ovfIMEQzkAn3NzwXLS3Mlk/KtV
-CjwNMalTw1ygbqRiKHfkbjhbpI8+KeJYf6LGWddaA7piGWYDd2ARphZsysRBE5SDFpjPZmHf
-M73hKPYK+5O9TRswP1BDOhZ7wBp2L5wrfxM3uJcofV1FlPrSTXE+n06oKZTin8nTIXZXZp56
-rxDW08DJr4wzSolHtD5CSF/KT7cyMu2dsHka3Q+WpMPT9rHNAh+57sHOXINQffZEqCKQQnNI
-v1Bp/Eg7gF5Y2dEkO52VwRgfbhm+l8ZFrgav2/nMHVwazeJuJmr+O+4rsc1i38UuSZc1rkPG
-JfE045f4IelGx0z2znf1FxqKLelWbqlDYAf7NvvGrEIDWh47EJ6u7YvUDncy+Mg2u7m+MmrM
-zegSfRTNoB2l+/R07HznM78W/BRvsXv4F6AEhSinUdMEwZJW+rQleE9gCDgROkqnRWZgzViE
-EvFZchku4JYq6dVL3gQP9j13mZ4nSlfXaLWW2tMzSu3ju6cc9DwWv0inYF9mI/A4PH2v/8Qb
-I1NRkfAdu0ywg3UsbZVVNOg4ufUAKYZyAwUMJulAov0TSzqLM0c+0/HabD5slFWCZhH1jZlD
-fmn9EZbjn8J/3FK5nYdzX49f5X6aLos8Iv4D88PPoTeeQ5bftcIOSW9RCteB9I+a/FeUgubZ
-ZZ12Zkv7p3bXqhGeajYKbjbqhN6aBY1xzgH8DE9ht9FRXB6mKbeTWcl+BIPpU2A44+EYK714
-wVgjjtJGwfyhXPhqWtBsEkyz/jWCZCX1cTnFPaLl/iZPiuUUPf61lBz/UyoQX0bpHXtVKeM7
-JJ9yzRZXyOX4hsJ19h6TQPM6Pjt7uJp2Pnl8SP8TDGVLnaNfDr+0n5qV0TxHs0qgqsYfVMno
-Rifb39hR9BfHwouwA6zG3Ge6AB7sB69JV1CKZgf1mdrMMfgMEvhQ+ATOSN9Rc3kR6q/MActc
-EQ65gJgmF5CgsEjpDBe4d4Gf3ur4l6+cfd9zT/fLbUI14I20UkyDUCK7yxwGdcKxyWwDHMeF
-9WT2bagxEw6tByW0GzS77sN/wtms52lT9M/JF7Tryf9FhqblixwJt9JOGpqRYic7GchUNoYt
-rawX8/jcntZx+WMfpqsRPyZDlbjf6QL+YXFPfHt9HX1NVJ/nIPwhZ0WHBN7YKozSkDhG3yw8
-0rsxQ7TO9tdIrch3/XlwiDMpPJ5BUZJ9qS/kKxgeWM7ayB5Bubi79DVswtQBV8Bo+y4eGT5h
-paTc1KulUC0c6GcU0HvbO52O0SbcT5O4Gex/4mUBqt3V5u5FnmnuJt7bajVPZ/m0a76I1YBw
-zVVUfOMuJeZ0beAn8q+Yp84GnDNy00kNGuhpuC3ZrbXGTbQazvJwV7tHaKZdPPzDLqn1th/r
-zYy/Jg4ZyBt8ycSGTvENI9WlpkYD5ZHz2pWb3em9JHv9NfyHfCPTbfeWzzTBHZephrQ6IQC+
-eHs4m+VEqxfXwpZAZbwfJVCv9R7li+wy4gITwl/SPoX+DfeKnDWOaDXsKkYsymbnoafwKliF
-2SGegiOlOVw6/hUng2r8DmcoP9Ncw1v6Xu6T1okZGG2/n4H+zu/gHXTKiGdiwBthkDRflbzF
-Xb6Yf6WX/nrceT8DZ8U+hafj+nGlY1ZxD13z+GrSTGE9P4g/xp5hh5N/gN9y8NnQC9udMsZY
-/6e0tiN5d6RyCGh9zAxaOpRea49a6V9s1q7v9KGXyC64nvmPewT+g19wHGs4lZjRuB7sCt1i
-BXW9VMa3S3jq6w2b+7aCuv6dJFNMPdzbdw0NdpUjSeLOaPrn5DEZKPpwvFQYJQuzLINTtLLw
-SWATm5R6kMOBgtJKI07JSYtH+7asTPknQnv+NszNZWCawvqkPtvJDtJzkaZOqdSMWtnf8YEH
-P9Onjv/zKvVV2qmgHQlrVc1a9mo7TKZjjc/CPPBI3Mj4LnyFdKeEgQlTlA8JrC8l3ZzY0/Fl
-Y93es74IX9yjo4mud/ojNSlSQH0ROSVN1VjO1v8lH8xlVl27k37ASdB7kP1mJvaHc57LiEW+
-mdMUNjVnAkdvS3KYk/Aoeykqh/rZcei8scourW+3shu17Ux2GVQd346m5iv8mqyOOorNVOda
-CZOl4fJbpaZSTwlLFcRDYjsug1QPmnIVmNO1Nnq1h9nka8wR/gmoBTHjZubCzDQZnsCPoR9l
-4D6ZT2GfMAbHU1g09u8WI0Pqp8jF8NlQC+tZ4CnakzaAfE9LpTtCPeFk85I0AmRwz5YWe1p6
-b3gexY3zPk1/zdsgQyWPGN9UTfI0ls7IO/hvfIB9wLynt9BC9MDoa12NrNM/hwtGHoVvhepG
-hoVfaWs029htAHuV9QS9dgowu/By/jPpL5UFllSCySnUZQqACyC3jWlnfR+tGflEH4ZmgUuh
-FewY7TV/0m4uVWa6yKWlgJzg6a1s8ifL+WMLi/NjrrKfvavpHvd8mse9n/G5tsIvUix3gasF
-i4HRzBZ7Ip2qUdIs7KbZwizeFyprPQj9o2fVzmjXzAP6I+eakYC7WhtQTlTIOUMWWyvBabMD
-O8wKssWcjsxKlEjv4hJ0N0BgEf+TLaXsgldcx+E192V4xjMNZvXdYf/6NrM3fW/hAd85bqr3
-FbtfiaM/2aPonlMcy8Y2ei+8m90RLMy3D64UOoXHiZOMr1INPFB5ztZWVvHXxEL8Ye4ybART
-WTd8zWRgkkgfdNbaoVeOvA1WCLROK5zWMe1qYFkwNVxVm2Y+Mi/gCrbFBMy33DYjVtpnye4m
-pETMIiYuLhOrxHxi63q/87PdjvyPetf9XszmL8LpMdvAKX9+fN9d1cYSMD9zz/VLrMf8yKTY
-a4APn6PLSEZmOgO41/wLLiRGQCxf395A62tPnOPhDfadcJI1JSKZp3XWWGB9MxrYtpnBGmEt
-tJKcAJoKuoP1XEVmppAfrBUv04g0HRSTezLfBR+cD9/zL0F/qTYtqHSgq9SjYI9LYP2ufWya
-dJ2tzjePfgLwReBWoRLbUagJ3kKEMPWbF5yzoSTjQtpcbW7wjl5dr2LlsBaZDayd2gDrYKSo
-U8AYQv44Q9g6TD2htSDLR5QdSmnPX7WWv5H7eWx6T7m4pu4VvuKqLh+Q2sDKwgSiwbpOLWak
-2Rk31YqZdULFw/sCOOrIM0JU26hvto84N8lhWprtD2pyW/FKrrTdi0NmDS7GzggXOBnBWaeV
-09d5pS9AHbVz9J2eBgtaxcTMTj7ZS6BaB95QDemEvNjVVSjm2c8N8rbmkrxv4UKPj9vsdgnI
-XV6a694kbpMLcVngVxDBnWkOtJk0c2xUyjxtHw5Ps7IF75mnAoON3cEyer9INv2nUdDgbZ/V
-ye7t/LJkXNG6g31WLprVXsPsc67D06go1xlfgPlpAW4MzMMfkN1CxJsk7Im9LQyP/ZfP5c8G
-T3vaMVtdL8EVpRYYK4VxO+6htYhU1SfYi7T5lmbMsDahgVYXNrfdVZzoyHIutFq8jYA4muaT
-D8KJ6iLhhfKKbyqmYyXYChekj83WqI/W1mkW7ow2hMriYuGWTiCMjauRL9pt/bjWzi6pv8E/
-tYzAr2eGU8zdUl/keP4BFWKfwP/i2gpf4zoKFWNErpvrI+MT2rCnmRi+O8ks1rfzSPOM27Ju
-blTaoMZyIXJbvEEMMRFgMQu7hN/GbGCzgQTmKH1EN9JPeAk55TxAE60BzhGjpWMaxfF9qycd
-YNeiHa3meJb5xIlY89FwfJN+AjfhCLaXsBHECTzqCjcZxcAi7SLubuTCRfFIso+bAIqrtdnb
-nkFwZpQzoEuELmUEO1YaxUJxNkwRrvNjhGtCG+4QX5x1cx1BkGGJTibbvDNC36wrkVrhM+HL
-wT7hZ8EHoV3hmEhf45j+r/PYGke70278d2GX64HrRIzPCxNeerYniB4hvq3ru++znF3NIPl5
-t1iSxvHYSmCWad/QqlC0B4J1rU/BPWbFcMh8qbWy61t3nPJoELqC05wgPmDHkO52bfDXLgln
-OMW4wng7XExCjIaz0pOofLRDqtoZ8R2rC0D2Uj4Fb5BrsY0UQ6gkvVTSC8/dnYSg75BYNbaZ
-tCJ2smT7u4tP3Tf5HtJg3ss95faDBmxWbJMPVguUanS27+ivrEb6a/uFPtqpbBRxMhg97FX6
-UOuq9tD6qrVB3Yx4WsDcR8br9Z3SkWzm0TBv/IhMsLqZN+gAkixA/q+ySl6vPFdPS2fdNcUB
-3rVCXx8nnvavFoXYoPAwZi1Xz3eTqehqSreK3dA8tpX1Gvc19th9jCrWI3OBmdHuZZRzPun7
-UHrTS/LbmelvZy0znWhCQXhfPS4Q12ahqVqXuy2uA1dgPnQKTDLa0m7hcXRR8AXlw9dJROvj
-lDWWG0uN31plO8YYQiVb4z6jMnJuetF1Bnz2EHDWnY8pqm5h3skK81j6TjwCxMPZTXgkmEL7
-UgVgtIbusHYzg6wyYgAPU9czWV3NmO4uDURJnSVyxyhPj2A4uoocxEp0/RrhmoyHutldoCwY
-BV6gCqSRRey/+jqzvz7cnGE0craYHek4awb7x+nDN6dhMYF5Id2k/4jDEIVhaySIWAA/QAft
-k+CMXZ6d4SwEBZ2LxOesBBkJ5UdBS30vmt5k+b53k9xYzSXm5Huze5ijOAbOQ9f4F7gfP5/0
-Yjbjlo7o1NL6GkWCSyI/AhW1heFO1gd9Nqln94GVSQfxHBypLJfbude6RvjuqxNiKst9/UFx
-mOev6CifhPf8I/ibFKV1TD66v02sEqHJdkKwCq4RpGRFaC/ZHOmGkvTblmK9M3s656wHqA2q
-Q/ZTd9Q7vsLbTGfuBZ3HfMd78QF0xE61c1vYzGa/MX/g2c4W9jPNJBAuu9xVPuI6rSzxDlRc
-MXFq57iVrjtxbd2dYzq7unmmyl2VFDiT34qngCxOE2KhecSmiWQr8KEQdpvzrJJhn74kFWvT
-k1+a31NGoDbBMjQ1guk/xl9S24zHsWZhpJh3nBXmCLuM9cMq5IxxruLRpABNZCeBjMJC2Fga
-IiVK0913xZf+zBIfn1mOTSisPIsbJpfyz+Zbqavpdm6NPZIy1iHU2e7oVMYtkE7+kpWoGn1t
-HEN9tTn2M+OW0wT3pc3YH8x4fin7VggxF8WyoIocT3hFc1pKX6wB3FTzBrhkFiEPzIqI6puc
-E1oJ55b+0WplDbZ6oY/OWzAYtBd83HD5OG/KzXhDPsBskY44+/gLxih40DrIZaTXxGqsJgqM
-DRvgpmSp3dGqFk1d5EzRGwHgrOWPgUzyIa6pkkvYp2zivyi5OF5ZxJaR+rAGf4Utwb1jSnBJ
-YA3XiKowAeukMOplT8YZzIHUZ9aNkvxE0MY+D244FHRF38FymwM3zJbUtprTAlinK+kbUJXO
-AuPRayJYCaicoVvprD7ODHyV1GemggrRdhOEdOxK5RR87e4BGe97prVnEHNGldgu8r9sRvkA
-21LOxvYQZpPntHF0xlfrO8OT9UvBIcbR8CTrvCmQFqQN15spIYvsDBfHbvKarBSzhufiFkgl
-49fJl2J6ieXUE7AO+xDcdGaQtVHz9WprHTFy1focvmuo4ZP6ruBxgw1dt3KGMzvHwthZpg3G
-9aysoALeDYvT78I78llcTPbwa6iLbc9MIT/YRJQCG6NlcAWaztRGz2gh1BnMw73gWzBQ/Mhv
-ULeol3yXPXviPrk/xh1RN8RQuZ2vkmR41vOPoo3RUjbBAb4QdZjzpA+pQifZ48gQbarTMOAx
-O6Yc0Uen/DSWpvV0HofS0e+RMHVHEsmw0E8nY2io1TDc3tygGdYW8zea7yzBA9AzZxraYMuU
-QY2566CT+koYFdNSXZcQdoGEfa78MVtdIzy6a6xLdi1Xl0u/5SMwh7iPduP2oZnMSvskCZnX
-ncN6L3N8ZLS+I1zJGKJJtm1tQ2fpblyHX002yKvAdzUrzK1e5dpIrzhVCMKR3HJmO1sBb6Yf
-jETnYvieUTc0Xo8P28ZWfb6zC/Wi7dj87HeuN1zJubhYPgLziTmi38MWdIrQHpfhvmMV/qRP
-2JegFFsLdGXy08ugOOkADqAF1OX4SQbnEnLhzOgveIJO8kdJivQbHJTT2LwygcVkDFmlDeyo
-rGCnSLWZTVGm+YL7EK/dkm6w3oPpzi02hCg7EG8CD3ElcoZUIJlBFtACfGCSyWGWooVsaWcs
-s9ZaSouZS7DXyIn2asvtnZGD1tdINXuG1sJ2G+ut1U51ewMsR+6o87lMvnnyKV+Sus07XN3l
-6SwN8kyAP92vSEOX6dyVTturYWcbkT72WfTe/u1ccurY8aiz6cGTzYngsj2Gf4MrKMtBV/cB
-toW3BjfCt45f7C0pDosynqoG+eHiTzYT3ES600RrqbMx4jEOhG6H9dD+4KFQqbRRoQKpnSKP
-03izQ6gq+hiWmV+R53w2Y6+EreEyRREpG6goDmB/ctNhDvYN24POAX3xKNIYlSd58CjwD8jL
-v4EnlQt8f88hoYkvq8TGfJX2xeyXKsXMl1b7i0mi77tQ0P2O2yfngqlCEvOKe04fMRVwBdLe
-zuWMMU2zgLnbmGF+0yZad0PHneS0RDIttRnNmLKYJqScZ8oEB8NYfTRz3FiCBeO8vUBvYc01
-dpguO5dViFhWN5ax+3Dn7ETewA/Er/CL2lm57z3muRJjeP+JO+YxY5q5gPeOfFoZK2aV3nFd
-hIUgyFZzWpLv+h17XqSf5Y3UsGZGWptY62W8Nd1mWVzOfsWq5Kx4kj0oH+ZfSVf5NWI2LiIs
-Y7bwmcgC+Mfuwgy0GtAxdhc8Fp123qOZzn/oD0pHEsg6WpeITEkSZtqRS0wcbcasZPayd7iu
-/AZ+klCBq8bnYGfDD/Qr24EUhdtwdlgNVWGqWtMR1mKMKZEtkb9aRz2XU8W5zN4Ekjyfm6r+
-w+dVT8OAco69oQ6B9VyJ3HPlOCeKebmK7Ex2Ob4OdtkFwWt7O3iPLjOXSRu4n76HW2l1tgnd
-QFUwl5RhS4OPLAaH6WiS2bnnWOYUx2u1QYlmT/RUv+N806Y4KZHqTkzkpd1RI043O5l2YlbB
-MUIyfCKdY78q39i5nrsciPEIe2Iw995XEM5292UeSlUp4K5iJUqib2lt2p/Eg/+cvMBnGVQ1
-u4FH9hxWAguEr1xhdabY3dNLXO99zy/xLuOKeoZzpnqeC0tF2MJwuD3STgoMC5352zXtc/LQ
-wMhAhuDEcPbAUe1o2jgzfXAMehq+BSTjPPfTOipedj5KQ9EN8aqzgCd2P645Wss1ph+4W2xv
-rrBQAjriRaapGMP84hOjvN2WGyYd5SorD6HflZP75HkluGO+y99iBXVxbEllsL+H6PH44G7l
-PJ0lNaZLxFd0Nf8u2vElrBXRmb0VfhZ+GMiprwhct4YH6+PLUZa7EcjI5E7j2cTUIbB9WhV+
-UGghP1QnzJvoqj42h+g3zKXaR/tfYyTpZneG/XBtuRL1uVuCX+4BbDnPDv6eZ7U817vK/df3
-yBPxxam7XcP4TkJetgK8AArADoRjs9n/kKz6LrtjZLG5JpLHOKvb+hh7qOnga9ZJsNqG3BZ0
-TvxLE5VLLFbfc/NdA4RbSjbhiqjBH/woZhTfmLbjBmM3MwCNQYdRCbMRvqBNwPX0JNzWCpE9
-0fRTSHs2I3nNLqQrYSFYlB8nTBI2CVv4vTCNPUb7ggpoEHluZcAfze44lzWANLAm4O9mI/u9
-9caogcealdh7TgORB1uVEdH8bs9Vl0uxZ4Q8oBH/HXTks0d9ewY/h4+REFwmT2cOSHVoZ2ED
-mcPVokVhMm3CTKF5aD7yCk/Dz3ASMUkcMwIsZhxalBxDta3f5isd6W6jtqEYc8yFWntraTiH
-dTDUxmwaeWOONjOgv/gJOAGL8Jo0QHrhui539DaRL/vbSfXi0ovJcZ357TEE7vYUhE3kXmwT
-NhNT0plPhukfnR3aEaeF2YpccM4wA8hBbhNzV6zB31F2ioVckyXeFRD7qw/43MpcNkaaRM7y
-36xt7BmtMqkQbmXtDmXTGoUmBssHiqbUS13/u1lgy5+aWvW0w+bS0CC7XGQGvq6/YoLWZW4w
-4oXhJJ2Uh5munuUGuJuIx9XJIpDyC3+4BlxD6IfT4RRuJt9JWibGuFjpkxuK690mv9vVSCjm
-RuJI7yC5tX+Q/NR3T5zrLsSNklrTwfCJ0xust93gg5UEkozldHvkrb0q1CtyNvwuraB5N/UO
-3pXGsZMDe+HDwCRYLvgf2y2UmbXCT8FX7SGZZu5xHtnIOOfk0JegQcYLMtLOzGbDlfggOSxu
-Ajfl/Ww6VxVe9VaU/o3ZplyLK6IGYvMp5XyPpLLqZnGTUCDaz3PhSTYv7Qw2WlOcTZGOWpPQ
-58CxcPWA39gfUu0n2gGkWDxIQn24LeCAPAHW96zkMvg6cic8I2BxNTv7SjzB9BMkiLninAWK
-wEdOEkg0j5GSxkosmNfxMvsBXYDHsqnkF5ud/AEl8XyaI9rfkSjRLgSxXDs6h/uDPrGK3Zd2
-MmujLVZn5w9a4aSnd+xDpL61B0vWEzLA+ZddSscIGttFKso9ETfAPEJl9h1nMRX5YdwtYZsY
-JxaW4vmoTjC14E76jSlPe7HpwXwuAnaLR0CMPI+0EPKiOsxLNBUPBqbTAB5wWkO/sxXcN+ui
-sdoPc2q4hrkiMtOsa+zSK5mXQ9D4nNZYPxewjIr6DvSWuOFCYbH4RN4kHpAfcN2UyfCQe6Uw
-zJ8rii2dvQ39L9xXXLz8S5gJe0VTsiTTEnxhJrMPGMo2AD2YP2QLOEnHsbnZhXxVTpOq8Irr
-CLfT1Z2do3SlTcXvqCcs7GSgnF3OmWNOM3ZoKDwmJITeBZ4E1wa2Bk8GqgTeBrKm1g3uTi4S
-7ppCjbPBtmShuZU9hl9BnTyAO/FCbiGyhKfki3yOa6DOUE4qya6WcgfXU3G0skv4KS0Qr8tr
-lH2ufu5W3gKe+r4jrv887xTb1UKp556iVPYelS96ewlfXeWYEdJgVIofbvWGFU2GeWFUQo2M
-mrpfnxN8EHmXeibSOjWk6dEsXxIqh0pHntBekYHMvfA8EBfeSZaH92JDSyOrrKdMfuywNtFp
-EhljdyPFDQFcN7NwpXEJuTkz0T0QTvJm5y578/CvvB6xvzefvN8NlSyqI0WkLkJHsRA8xgPm
-GvyHVgSH0TO7nfVAG6NNCbnD/lBy5Eckvf3cuEpLmXF8FnOW3NTuqXLkgvqNzeKOldt5vrl4
-dz/1sjRNyAY3MSyVaArOTH/+/zx3+ohWpPXoNVwIBJ3qjNs5wUSc0+wozHMd8Vr42vnClHea
-M6udMdHEfQN4UpE+I8VRIxxrjbfrmufMPVa8Vdxp77RH00k9/IH2Qz1oeqc2+IEGwIFMRBwg
-ZHAdlce558o91QbiIzFe0PheYi9hoXxRqKO84iZKcUwq15T0ZyfiscxO7AY+WopsYLbikXAl
-6csy1CAsKRnN+lXOa/usc8sYY/eLPDd+hhprSeEn4Uba2bBXXx1Zp9XRw5E9Zl3dcdY5I5m9
-XJqY033A1cK/yJPJb7hHeeq76rri1A7qUvWJMth1Ri6hVhE90gfYmkvHVGCLMsVhdi6eXyz0
-5Y8IMfAzt5iWge1JE64jyCuOhrJUg1/MN+G3sx9hIeYs2E5foh84aM5zOms79E6h8oHlqa6/
-Y3+Hfrp++H52+7Xz94W0pNR2xpXwvyhsbCT5neNkMM5Nc4B1zAq4hZ8vjJYTpb3qPPmtkiiz
-0nHRFPYKslxImO9qLNz2bJEae3q4brs2e2epNfw3lUJ+Xc7jPSPmdyn8eeUxdKlluMVqXS5F
-bsrO5vrQTGQGmmS9tgK6YFbUSxld9bwG1loaTSNvjfmh7mZsqJw5NtTQOhI+gr5qNUApMyd7
-2rrJTLc5utxOdOZZbnuqVcmxnBxR866OWjFN0Ua4EyG+JhkjZWGnq7WFYZ6xIvHeFVT/EqGd
-v4x4z7tYGuweIL2TW/MjuUbgHBkebdEtWqyuh/eHu+pjw/PtLJE8uFikPJmrLaUjzE9sbhQR
-+zOPXW3Eg957yjPPLXmE6vBBqTW7QpoNSHQaLilh9rZYFmaL2hDGj0BrzIAT2APeO9tAeqMh
-WB9KJXrwIKkZWUBnGCxo7BQHieQIuEnOg2coPRjtPKfU2UGa4fHOU5zLLIl2aaJdRPtk6cb4
-aOYNY6Zxs4VVSmM5zj1fOq9c5wsJhzg/l1/Yyk0R0/EGH/f//3bZ62w6GMvP5aqIB/n7YnQd
-hAL8X/gSutiJ7DFQiblNF1Ob9EH78ABzqTNK62GVjUwz+oRL6SVCRfUHwaA+IfRLrx96FSkZ
-aBEqmrYh3CGc1bYRZC+LTYQj7vzCHPci7rDq5/ery+UP7njvdt8L3xe/y1PQ91Eu6pohDZXz
-KH+lZOWa2Etawv0Df4CjZBpdieIYgAOwE/3LT2JVYSOfV/hPGCWIvJsXYVN4k41ln0YJoCKp
-aajW1TQ1supPpUDyz+Wp7X+FU5P+5gv8TusbHBbOHuqlp4R2mN207XZ2qw6+6Myj6VA68NbJ
-BFT8AgwHjdju/AKuuUKEje7RUjnPC2m/e5Hc29NO7ePb7H7un+bN7/N5d6hnXB9E6DotTHcP
-Ec96Dkj9PI3l56674i/pGOzK3qB+fAWn2P3RGeup3cJ8bL7QexvftAtGCz2H5Tfe2bbuxt2N
-xWSE1Qi7nVn2MDunPcoqgUpZK/AY04UbGJWdJ7rH+qwfN5YaNc3NdjonBuwj97lbdKHgJ0To
-jxl5KRDdiC/tvynfivkmD/WtExeoF7gywkxWYusxI6KT5+AYchG9s/+xK5rtjClmPr2hs0EX
-SH3jJWlpniGZnF20FM3C1mObCFm55up4/qhnPL/W25Ar620Dj3r8sIDHYV+4wowpl6GN+US0
-hNrOettFFPML6GoW4Xg7r1jU3iMuMFfxLuMkm8GYADJbY+hopxVJco5HK2CQmWS49Gf6Yu2h
-yRmD8VprF3MVbWMbgWZMLW4VaCgNY14ru9nrSixcL3WHpQQ/t4f7ArfAFrA1nMFxnC6U4LpL
-iD0lVmJ281lBPHcMpMB2bDEulR0F07ENmdugDllF5jiTnb92Fpug7lErfO70R6Osm1YN/b45
-J/zA/BRINculLrWqpXS0D6RVsj9HLX6Dc8UZzJ7DS8RkMkoZSQupj0FXtRr3wf1G6us/7eJj
-LniqeNN7F6qX3U/EZcoT7pX4jGsrqmJLcZj0gydSE5go3wNTJZNmEJsxz///C7KQl9vOl+R2
-wp/sCVAfXEVVSXGrKympzyaXgvGoQ/Iq8/nvunr+vxW1gamhSPFQ50gprVxotX469ac+NbmJ
-uSfll7M1mAf80i32pu1iZZSNYNQZPSQZyFCmDNjAB5gFSk6uqTuJP+rqKqSqLaSC7umuhZ4E
-fwbvyLj83vXx/3paxgvuUNwQtWtsF2WQ97K8Wx4sXWQz8wucs+CaXpzs0keS61ZbWhV1JAuc
-ZOeZ+cESjNnmYMMyPpirzfdmxNql17QvhJ+aLULnjD/hzmZRo42d2y6GFLQFzYk21An0HRXC
-a9ALXA7NpjfQYvYUaSz0Beflh8DjLst08e1jCvpvMLk9OmNKndlC3Hl2KnOI3QA2sH6wlm1H
-fjNDnc9UtpqiO0YO65h5xTyPvtgyUx9TpjUZCaoTiY4kpUh1ZjqpKLrBJPckkM6/ieT1H3F+
-edz2Sldep6T6AkfkrOCDeJXZzA/n7rNhcQLJolR2qBJ1LWWxPVnMYXvgGbMdDeh/cU7Ni2dH
-fM5j/Yk5w2aNfaiYXhi90vc5ey2B1CHNmAlMMfYyEw/yMKPwNvYQ6i3E4cLyFdxIzk5zSA0Z
-n5jMEt5hk2FJ6IA6/HYyT+pLUpT99KqSkRHlO/CZeFGsL16TCV9SfAFHMZWYwagcXm5Vs1qa
-w82TRnNb1oc4lUOLLSOllLEvxWfcDN4yXmq3zP7mdru9PRLFoTWoLsnn/MNssn9zQ9FscT7Y
-JmXic8oDxJGyW+qkDJB+KvekYXKMMkvs6ZorXnH75bdqSaWXdEKdItx0r+Nzuk9xGRWWWyCF
-WVWuxuyRi4FNckGmYnTOKnJXuZ2kLVxrPqYrQvHkbNoquj0wgFkbGANOpwTRvuQOZrrAplDb
-SCClg5Er5Zk1IHWq8y21EaqQ+sYpnfrRLhIYb3sjJ6wPZti4g9L0O7SH9ZKZQmqwC9hrMCe/
-XLotjvMcUpL9w93LYhxfutg6CbNjy2TMFtM8g+itE9dWfefOJRWSz/FBYSP3iJ/GL+ag+JKp
-IZhoCJvD9NPqhkrr2N0ARonAg0vTQc4Yst2ujUc41+zbzkCruX3CFszlqJAOUL3IO1MMd9Bb
-Rurp6/QbxkEjmxVrxtpvrB7OL9IGlRFSEev+gW/6LKL6NtBUNRudIP4gqfxFMDOaMBF+pHQF
-jlJ3guPKUzxEuIkOMcdx9WiKDiLPmDRUGfy2DqMZ+hznW0QktbTPtLzRmXR1VCQwk50xfF/U
-WXyNX0pbaCW1HFjsnkAGefujn74J6JrfoNX9E6I21k021bpKDqmiMobdrShOE2WSll8+Ejks
-/tVGwvZ6LyTob7WDWoYQ0L8GcxjB8GNrllaO6FoPtr95GcaT7Exh2B5PFgC6JGXHuaIuXl6g
-4LFQn4mXZXBUnkESpBWE4XOBQJS7hpIQk0irsN3YBZwqFJBuS+sVWb6pnBep1FaMFaqJVeFp
-zmY6gM5Mc0eipyPlnWBqYzNHahtjbmC1oQYbW0/SqqMZaUewJ9AFvQl+tGpqc03BamN1QJ3t
-o2SEPQfstr/Bec57KSMariYiTapBF0T3shVfSS0jXnRvlct7nqtjva3cyf6Q53NMT/9kX+24
-ea7z6U7L9TLFiMcz/mFvx7ag6dWX+CS3EVl0uz3B+WsF9bBTLDSKelN5+CCZ8pHU90LZ0DO4
-MtyWlAx9sn8HFKdw+JnTzVxj9UWZIhnx89T/nN7JN62+ycuNQikH9TYph/RqKTP0bKkntczB
-i5GN+j6tNE62XrMTwDbBLe6WO7s6uRv6WvrbxZaKu5FwMO5qhkIxLzLInksJVxU1Jq8S726h
-bpJ2qRn4YsoM9pmYDhzjS+EpXAH7OffG3COMcVTpAOgmvIRTmUHsLDSZFLctW7CnmEXsJP2U
-tUgTrNaR92ZSaLSlhpba38I+55iRxx7onDNLkFlmZ9DaTmbz4UZCHN0ityLl1Tt2USW9UUcs
-oo+GXa0F4Am1wP/fqSopjGKXQIrDbHZngTAIxatHKeMeAPcqH/ms3DbuBLrJ7DDLM8PMDexg
-axNsYYlwvLGY3tW62UuNE8ZupJjHmcVmA161eolDLVaaZe6Ta1tfPM3osrhm4rX4Sa6qMeO8
-R1xx/gXCJG8c01OtQwQpjL/x79EOVrAK4DmR2fqf0LJgLa1JMI/VN7LPaaaXRKo+0Smm74r6
-WHcnnTORDALZWI9wHjaSP7LxSjbmP/k/sFjZyr51DYFL3HUYXhlOTvKvcBNOoN/hH5AbfoeJ
-3H7hvvBNGCQ+5seKNYWicnEpqGyUeyg1JVXwwoZ4H+oYvm5mTllufPuz3fjze7L59dcUy/Nr
-mJXu1wiz/J8h5si0AfZ2fRjqgXYjnmZDvcEhJ4a9YK+Gy2w//xSdEa7Q4uJVsIrvALrC2UwT
-+InfJlRWC6uVPXfcrT3XPdvdA/y33TjB9OzJbPm+ZkvyP82W6G6V8Ru87oVopXDOTgdlcppx
-onQuMJP0tvRmaj7S5s89nOFPflLy7y8ak/yXmZdSkF2ZhsCw0C660Pgn6nJpqC/bw2kC+5u7
-mQrhouRXSnv73t+R5ofkM0bu1NZaw9TvwRqpUwJ30r6FrkZSzVMoCZzkUsWqis9d23Xbu1RN
-8WElR8xwV/nYw57RMVO9o7yJnoVqKVcXqZhyScgls8Io+RHni1IUkEuB7sIi0ombSypzg8AQ
-vjj0C7m4+Vx3dhlTExSgd8guUgc/oDVRC6DbOUhTQ7blcB59aHBdhAnHGnmMvk4+lIZy05rO
-E/DQasf9Z6VJe+z+ag3UTy1DBslNSIDrid7Rcs4wvBmNwg3BYDyMy4H2CJ+tl8InM704yOkn
-fqazBIOdxX/gTnNthN9MFqEi/svlsk5zFXQP9y68C5wNIadqpLRVzkwxi6Pp1nny2OrCCHYR
-/r59VeqHvikbSAXXfeawe7vww9NJdXkXukt63rmHuma4M8mH1DguRtLIfXjV6UCX2Z/sr5at
-F7cGR+pZT8J/rU2R+5ZP62NV0A7Zs42eOOrrNIHZB5pyq5h9QojJIXVkBOkqGCfuApmkNmCv
-dIr+J+Sh02AvkodJw02Ym+QPPAsui21gTfWGcM2dRRnmba5Kvrnyec9LvpD6P4rOKcCOpA3D
-1ebheDKxjYl2s7HNCXdjb2zbdja2ObFtO5mYMxkdtlH1n//iXNeprvre93luuodhkedgd7La
-m7HSG1PzLbGv5WyD37O7wMzsoOXNSTVyss5rPzKPa4VzWKNQcKFRUzmrPzIma9AurzrREmU4
-OKnOIuKMTlRd6yD5yC5JzIMXwAvYC5JYEVCY3k8tFEbyZV1Vnec8hve/qBLxr6KP5h0eYxfK
-icpfJJ+rWP4zLBHXntjuPI46Mn/az7E4M9LPels5QX/pX2dcz11n7skZZx3Nro1+5Uwi/gmU
-o5eE51CNZYo4r2aB0paIvqF5VjVQ0jgJB2v/2QXlneYjf4Y6IKe+XCmXkB/7ssOXfc7gNP/F
-AAgvkTV1tH3N4ikBFOH2YMO4+cRVrhBzWkR8LfdiB/Cazn2ey84pzhPiMW6EQDC1xbt0ccdr
-qpYI8cvcA3SErgAtogeaix/D2+AvqRWEk91I5bIu6jF1FZsOjqJNsBT6BB/ZBaw2Vrxa3toU
-3mL9CnnsqrJmNzJwNArNQu1xFcYQYXsS8dPORyXA9kwvqwZzXqtCvJKD9gy5iLlXWWT011KM
-QWasMRDV1TPwgLqbaqx1Y+eYbv4SesaJxK3Iqg3ZYfR4tiLXhZkpaniGuN2qxp9RHlPLQ5dQ
-p0BYKxCQw+VCY0PJ8unwMfW8nKavUH5YCeorLN4U2Wu47mjNj/LOcuWP7uZxeau4cGeGkDeS
-KX05j9CM+crcIAvhy7D7ZoYdUr4YreU92lH5PzVBKaq5FFKvLs/VJ0tfzY0Rq49HHD6CKoEJ
-zG7UlnKhQ8Rl1IocBj5S28BDuiU2l5mBH2duRkxtM3aCrIfNoK7hx5j7ZBvuN71U6MEucExg
-AiJHlhHugzh+Oohnn2JViOmYzyyO3ofvW09yE8yF2Q+1u5mjlG7pq5TfP//VszJUs2BuLStv
-WDKLGbx1AE03z2PzjBJ4qh7EquvNsCj9BpipJaNPyiVznHxLm6ok6L/0uVY1lIxfoFJYRmgq
-VnEVdPeP6ho7KvZOUt74mQXD8esK/xm/o+DEmEdJIz1ynE/Y4B1E6vxluxvxSO9pLVZ6hAtJ
-/qyj0v6MsqqS0Vv//DvZdGa/tVr42sMpwaVggfIfXt3uGnG7H0QJclLEBSeAQ6CKNdl+oV0w
-/1JW6dnhc3KNUOfQq4AWuOlPD77xv5TrBl+Y46W/setaCXKWtYacgBDZGPfRLakS/B26hoDR
-ldg69BLqFtudLil4WFa8z34XOnES74+QkZ9y0n3w1mQr7B45kGjOHGAacZP4DLYql48ZStOU
-j4zG7+Pj4Bs4yxpn7rDyaT+tQhJt7w0vsyupLMzU+0HO7IfK2UfAazQH+4jL2CQGAqfwBDrF
-nnZaJD97sN2MwpiulTSP6xO0WaZL6WKFQ0/MyoGixtrc4Xq0b7nFyPcwJ4ylP5Pdueq8U6jp
-WMkXdrbhFFctBrrW4xO4G9YCEKMtMXBpuPIpgMsf/b3U7oF72qbQXrWV+od23MLMhlh3eIrq
-R5jsXeY5pzKz+UXMePElV8RpCPGun2JR137HcfGi4GBXUiFChXNBJyPNgsp2o5rMGwlSaaNX
-+Ji5Su5gNzbe2yPQATiXbI7u0Bfs+cQ4szbsara21lgMHGc/Bg/gPZzDKhENiVjiIHmZCJE9
-qOPkI3YzudQxkmzutomXrm4kcAk079rDZDm6sd/5XexlegPDYIuI6nol+0agrRqV9ZekpdeX
-sIz88uCMt3LD3zfUazmz9R3havpZ7ZvW2KxoHLC+mz57uHUTDTaD2Az9DmGq7cjuajN8oeqB
-9fS7xlYr1biFTKsRPjXSfbtIB7eO7SzeFX2u095+0eMSN8XvLlgzcUqR7vE3CzaOJpIWu67G
-FBe2uEhGZYfhl8BT26++1D3BjUpi7hupcI4gn/TNUlCosHZOijeC4RT7uFwQO24cILJhE3IN
-KEc0QM/AA2MgHKlo1gG5tjVSPWIq+jDju7lYNY2x0j3tSniEfl/6ae6V+9k3lSJon/YWfDUo
-bLpdGH+LbLIdFqAr4S7mObaLrIVNALWJpcjLNCcKcLG0k6WoJ1QZYg4ZwqZThfEQe4/+Jpx2
-dBRGeCqzwz0LyYJODJ/N1MM9+HhyDihDTYP3iJ/GVXy1fg17pBUEj5T3iNG2guXWClAIHAVD
-ictYMlMNf8SGMIudiXXlZHSe6WVXJK8ZjcBx7btRQXslA/2I5NIzpTpqQqh+hFA6yu1yA1rf
-QFmsgF6Sb0A2c1TmE4TjfFv2Py6bXs8gehgt0zOYrUQq/dG6gGlKEftluK2RN3Rf+TMUJT8N
-J6ix8lR9sHLC6KyfskrBGWAyMYN6yCQL7flzrpGCxzNb7OSe5Fjm7Okw+NHiYHoTPwCfR/+2
-h2AztJpopAxRlDILtNe+I9soD2vYL83CsKtBwrHmSbgKjgQiaAxWQMtubdWwZpmfzcZ2im2h
-qkAB1fCOYHDkRnzBL+N1qUxqFbuC/SQM4Zo5a7CTXI3pN64M4pHjOz6J70aN5mPYLGEX3Y3d
-gXVA/1qz5TTtj9zjqvj7t3Yx47neNtOnbsscLXXP+hSKyf0pVQgW0/9TOXs22m3/IAqYhcj+
-WhtCkd+j3VJ38478yuDVAeZ1ZaY+SL2qFTYx8yuaY08nmmJj6HmRW3dMzCsu8OTxrIjvFHcq
-3/m89woNLNi66ND8ewsNjz+f0MP91DWP/8QMo1WwGV9vvbYn6t+USuHz/m05C3LE7Er+hbk1
-ZF/wl/5EOWu81AL6Nm2SWd68Az/C26APug0IVB0F4A67kr3DLmQWQunGS5DH/A8QRsCep/1n
-TFG/afm0Ofo6808TBz3tz0RPGKQ6WslkP709eKN9tEeZW2w/fGCXB6qVD80xr9t1jNv2ZGME
-yrTa4HWwtZREl2RWCLl0E0cr5rGjD5fomhjhpE78UUcDimJ3oyC2zo6BseC7tZHMsgLMSXsE
-MxraeK7VExYwXtmkaWJFsdt0f+YXe5F/wc4XLbqtuJycyp8mdnJdyPfcaWIDewnmIS4oz/Xd
-ATvQw982p3WwVnZ6iMgeF76ZvUI64xuorg5PtTgjG2+FfWVT2AFCsqMgt8ZxlZrO16RSmIHM
-fCqR2xHJ9oHgOzbAKmdW1I7IH6TEsCBh0gBljaIbolYRNdY0MFk/gN2z75AlyMvcSXaKGORK
-i0fZK9xQugR9mhpO8IwL38xCTGGu4w5yFfYD9YlwS2NbwNJhUfw+eoRVAM1ABwxaHUAX44Ct
-G7+sGPut1QBeNz2wlnnd6mHWNauY382q9laUhq0jTpDPqftUHmYAO5r5zi9hGogLuU6u/mJi
-lCb2ii4v1I16wHZw3aUnswuoSvgCYqM1Az2WthnBnL5Kp98J0ob0UtKHjK7y1Zy38ongDOla
-+HAoVf4WeqNVUFpbHc1i2A5oE3vtfqCtUckcrn7Sk5UhhqJ2svJZ8eCV3RzUMNPN/7Rteju9
-q8nADmgrJVO2uNRR0fsgqmTMnvhhsa8TPfElE+PztE0cm9QrjxrviZ/oKeeawbWm8pJO2B3L
-1UugKO2AuUxRZBiuFWgfyuuPkmaGt2sd9BF2SWsfumVk2kjhjRbSEvW7vF8rZu4wR6KF1h3U
-2SgFX6iFYQ+tNFhsjcD/xNYTvYjGxCCiLd6ZqIB/ImYSPrI59YsaSLUgl+EBWAXKWm/zszzK
-3CT3tdopxcxdSpq6RRko19e6y/9Ym9StQDFNogH2hGlMNRMe0ePE7rRTHE39IZyJzHkv5jI/
-kp3GT2au0p2oGlgb4qJdBy9tncSTzWiyltmcnGTWxmVjK8i11uCrImeeLMQJx93lHalRg8V3
-3lbcGydJr+JNogf9Cj+DiUAyn+t1JRAu5Gvpb5C7ynff98BfI5AUbh9OVOPV7nqKThhnzctG
-ZRRtn8Kd+IyI8Z5hS3EmlcZcAYj+aP9L0/ZEspS1Hk+yumFXrY+wunXczGMmG5oxw3BZfcze
-cL3VHDsJKbI7tp0eROxiVXIB9zddiStA76OnEB3x1agJqm7dgE2t16gaqI81JK6B8XgJSINe
-djK8BC7bh6gJaBtr4sW4l+T0SBc8xV/YDezcSMPK1nbtCpSVX+iXooLa+jv8uHWHpLB8VB6q
-BvkXE0tKbHFqmHCM7uXYzia5vgvdPdFuxTPVU8WJO+sxK9gg6ERssgJ2XU3VK4RXRTzkH+O6
-r4t2LjctLOVk+lf4WN/TYDffVylPsKJGyPPM7qrD3qu2sYurre0y6kvri5bHHmyOgaYVgxbZ
-H+BSm4HFIjtvrOfX2mpDNdpabffC81NluYqOQp4H0fkTzibWT8pMehhfKRFGPY8pGTUgKhQN
-3fOiBwl73cdIQ9gEljHZcCi+zv5sNbUGaJ1NQXloEPIhY3h4tPEr0E6/7W+p3Qi20JZKtdU8
-SnfZoV1Udpn7zMJoJQqBK2gHdtqei2WZBtpsfrULR5olFbWIUF4W/h2rwqzEn/GPyUrCVjrM
-/KIWEMXx68BpU9gOfSWWpJZDZ8NR1sjQe90hzZbLSTcCpFQj1FufoiHsrHmWlox5zDDDZESz
-OtvCWs9uRZf5OeRS8RQzg09iSeo3XQaOoKL1ydS/+mm6r+1hHoO1dGViBF2LLMM0IR+wX+k6
-fE+RFOZ5soUp0Z+EUd5c7m6EXQeT6SxLzKXb4AXxeaCL3QNW1g4bidJsZWmwtNTQ/yJUz/cz
-uM6/LHQ+MCl8PpAabhOuoWboXVAXsIeaTJSlD5K/iQ6UAe5TeeEi5rM9lyuIWHaknUg20Fdg
-g5UuoJ7CoCVaMlxlCbAW6Apt7Bl6iXfDLhBFsXvEZhBNjMJu4Zuwd9hU1BcdsVvALnAnYMEr
-ogcWoM5ifZnjqANT0DpAlTGqUsXNDFqAJHsHHKUPgl34dnuDlW1+1+rD80Y6FgPdZEtUiKoJ
-tpDTQDR+GjbClqAXxB4yP3WbOUh62Cy6Nz+Vb+IYLfodf7n2OGt6bzuTPKKwTjxIeRgJdMYu
-mDbMp40CPdUc+DQ8RquTUz086ffp4KhsKTArcCKwXV4eOmdslRi7tmSYfUKXja7B40bvUDkz
-Rd5ojtEGGJE8Vy+ZPxXOHqQn23OtepYCXVYPbK89jtiBkqjCmE2nkEc5H1fQITsfuG55Grvz
-R712geiBbizW7d0b3z2qVXx+rze6qmOx8wm9kzuEn6ZX4T2oMWRXPId4Y9VD/dTyejB0Smrv
-D4ZEX3vphv+hGhOqalwLLdDrhR+oQ5RbWitzljUJxqJ7cBP8Zg+xM+yAfRA1AsfwE8Q6Oh/T
-mj/CThG2Mw7+LuVjb5PNOZpsxjXAqzOlYH1irxqCJ4NXzNu+mkZ+f1NDCpczWpvZ6ht4QGoJ
-F4W6QjnQBtYI8DA1VAi7rswmVa0ZgYyt2AhUiyhGPiFrMbnkei430tK9CYtNBSWZDWAFvRJf
-RwNiCDMCn8rWwtOZO9hCJj/5k38gfHM99yZ6X0W9cT9wXxCXCU0Ygi5FPif9xG/6Mk7S/dFi
-7LX53kpTn2pWaKQy3T9MHeV7pF/MDej1c56oiTkllOH+N0pvuZM+xihoHrMmG5pdWV8M1uh5
-ydamwdj2LqE6VsuxGr8rvAUFucWwJzMJ/qIvgepMaSKLrk9sID1gAlbAHITOqZfsseppM0NT
-jHZmeSsD/rJ/Yxg6RWyCB6nf5l36jdaMprUZ9HQtH1NUW0LFaFWJCYaGL4R/k5OwXVQqdova
-Cw6T/bDdhE1swptQ49BrcoB5lyxteMlY8zG20ML+/4ZFeiX/k2/m7ijWczcRWzrXC3HiXf4n
-V0boxxUQx3O4WIapKWh4An8GdmHeGGuJEtpEkKiWth/KrTVvOD20ODDNN9//K3ubf3n2+kDz
-3MOhm/6B8oxAa/WRb55a1ndCPRAcpq9V65iy9chcjGpaMbCb3cfsgwSrDJGDCjKNiWdMabIV
-tYsoRYSIl0QSbdEMl8p/EeY4drqKuwtEL/Qysd88z6LyOL+4uwgnXHN43ZnJbnbspLP5m+RI
-eje+Cy+J3QDHwQV7MQxqxc11cjXjWzje7BwabdQO1dco6YicIudGqONHcL8yWErQvmov9CQb
-ixB8a9CByoedoX8Bkk7ED1PXiSdUQ2oGVYTdTx0WetCWOJ8aLDyL+E0BUJC5aJejt5gHqEmm
-Tfxn3UXfzdbGYH21LKg7ggGpiK++tDvbrxzLijF/Zk+xR/n3QYf0GsVpj9AUU4LX4TS0AVsA
-BpPfQCJ7EUP8eay7sB5NEqahJIebqOzMpAIORDd3Qnar645wznXHMdkxxDlccDhbiTsdpxxd
-xOPCBbY7U4lqQz4jixDbqfdYI/IhHI2NN4KonuICxUL7UDvfNXt+zhXzVU5JQ83ppj7LuR6e
-4tse+h6Mk9rK1+Tieg/tT1jFGkWMgROZpmgTVxCEudGoKd8MbhSKIEPohEryyfY3Jq/lZhz2
-CaZYJPkaofX0czSGLIh+4DY8CHzwqL3ESrOuGk/sQjZjJYEHakOsjNKCzFFymRpyG7pvsAtW
-J7ACLQ578V7aVup05O7utFPIw+gpOIoZkCWewr3kINSSWRdZfxveRJhLbRXGs7SYX5ghtnAs
-EXdEdlxdrCY2EQKCwRcTQtxn7gDbgy3O4ExF8iJdEUtl7qO5zHm7I2UZswnWTMF+G6vMPHJZ
-6WPuNP+6bDm3Uu4kX8HgbX9PpYk/rxafe0NekvNO6uPrrtwK7FTHhWk9Xilk+BRbq6gW0K7o
-p41TdiLksLfoEPEVS6Z2ku+pVXQ35il7j2sndhTjXT+cs11F3c8dC10DhU/ORfwEly509sQ7
-q0S9cy70Yo63zjFcXn4mfYG6SQ7HqxHDQCksGV60Zxu4vk7ZL7eUhsptwn8qDUJ5lfyhsQor
-ddKaKQeMW2peu52+Ez0wToF4qyOoCxuAc4DHKuAQz8T3Uv8SY2lIDKaWUE2p0uwBCvDFKBef
-QF3mAuRiLgGfzBaCs+hKVg2ildkCTtR7GifVz1qsek7ZqBwKPZUb+mcpjXxBfaw/0+4WfAWH
-hQZYMeE1eneprzZK2a6N1GvrNe11+kDsb+Mlddm6wsWAiqKb2OeYQr12skwNVxtmhTNCpY7N
-bH0HyWtikpDl6CsudSc7+3pLuWt6HJ5pjjmuHmxf8SHxlRuDudjRwEeNhIuIx/qfAISXm4m5
-+bRGWdfUF5kztOysndqjnM1aok/T7vnW6VRgsv4kfEprY6brBl7WHkCvge0ZDwyxGtzMv0av
-hW2wlCMPzO84BfMLn+1vXDN7P/8XrCpMtzm+iTmc2WykEnuMaqCAWQzOt1mrMkowVsHhBo+u
-GLuAQ7sDvkocVjZ8EVsVnAj+Ce5F9aSJWAO1EN5aOwke6aPAKKsG6A2fw4EAB8+I0qRFi0w1
-zmDCfDz7kZ9O9+I6k0W482QMz7PDhEGi4ljvquuOcjd3f3Q2dkU5xzlLOHs4NEdQWCyU5M9T
-t5hDsD61Wz+CeyO9/kv+pteVSXl1eGTwWcDl3+Mfl7srsCpnavBkTlrwSG6eCPdwwQ2+2oFL
-gcHhkVJQm6OWtxzGYWuf1cD6Yh81u9iVrVh7T+QflsbO4I/w/MwTciN3kb7PHWVWcW+4I1wf
-RyWugrMqN1b8IXCO2a6armvuui7omuqc5/zLmSrsFmqxkH5NpRA+oltkDl/YlZDfWmylmHcN
-SY0xx6hfzaqGYD4zZuhL9KPaZL2ANlcTNVb9qn3RzmnLzaNqHWuOfhcWggbeFksmD+Aeqjz5
-iG1OXeOPU+O4J7SH28k2Z7vyhalksS6Z6thE13ccoa/y9ckH9Dz8CRiFNuhNjGlSYbVpqLVy
-LfBGmuM/EO7mby6V8deRq/g+yg9z5yt7/Jx6MSxoz9QbeoIx2/jHFIxk+7B+F7zUU+leZmeH
-E9X3zMDvuB8QrxyTydPCcOq9UIm+6ejMdnJ3Emt7x7qeeUPuid6W3gqeW97xzgTPaj7amZ+e
-wJN4WaYS+oeqZ7NkO3MwXk7Ph09RxuCO8AFw0X/ZHpl72lya01yvlrtfifbPUJzB2trQUF0d
-k47oXdSlxmlrjzkUz7Bq0zhcwXSAv5hBcBRbDU7lBlsbhLyG36Hri5y9zTRHL6up47I9XrTR
-Yj4RS6fbgF9YYxQDb8BxVnW4zVhmn1TvWkXlP6yzob3WG385u5avpdXef9EEoXP2Aik/EJXl
-4Kyig3nqOLyxvhEfY3WPUOsBbCO7nxjjWEnlOpswz5x5uSPOe/wJpy0McF4Rxjm68iUchYSu
-zs/Owa5Onmmuee4E105nlmgKUexM5k+iLRGLNcQgGIy2gl6WA13UX1rFNY8xQSmvlpfmyB+D
-n6XpgRrhtECqf0Cwe/Y7/+7f93NXZG7zbchdFmwf8khe5YDSQlupY/oBI1aPMT7qvYxMU7RK
-o9qwAVEWK8/cIFm+A8uKbYU+jidiXGQyejtZVwPHDndjfolrAfvQ4eSzHfnFTY5eYnshQejG
-/ct+YjLIdPIjBrCL6EnEDL6Zn63PRrRxUVuoXpKc2uRQAbOM9NNuryaiGUYsemjnhWWQx54E
-o+2zcLFNRDhAAS/gLVwDDFUW70XVxSlqN/4fVZdoQX0mtkZcfRtdgAlwjdmBQiY7UhjGQq4+
-tZzygclgJywHE+A2+5F93rpu/2uWtArpkjJV3heYHwrnBII7ctjwW98lqXuwsHIydELZIV1Q
-e6mb9HPqd22zckXqqKeHEKKUDdRvPZXl7JFCXayu8xu5yD2eXuQl2NlRfbiYKIsrF3VQHBId
-cu+PzuN95+3nPuWq6jorXHGkMeOEF1RZYRO1QJxCPhI+o1PMQO0h1jt4xaqde80IZF8xVuUU
-Ne/5NKt4MD+aGOwCoX+FGec/pq8J1NNryueNuWZbuyB4aIfxiVZF+qFVl/sTvubnwwkCiORm
-Xasw31ZP4V9r84U3ZkWxP8TFgugDh6GiVIK9EFtkHseKwTx4CnYMdQaM1RA21zrbN6XJZmr4
-qfFIKmbPkDLs9FCCtTzksH6FVlkwRJgpUi3zT/Ur9BiR/Vo9sYewBb4Ur0H2Zn7TPcWh/FPX
-XqGruzW3wLWHGeSO4UZHDRK7x353f4wtGN07umnUUPc692qxuas0l+w8SNtCGao69w1/Tc6B
-I+ALPVs7E+nN65IYPh4eGOwnxYVGyJmhZOls0Aq+DqwOFgxdCVYJlwvEh2r6lgYu+l4F7GBG
-SJGvyCFtmOYzJuuXrNWaAqdrRbB55my8LIgh/yYv0GOZhexGdgmrMhh3kj3GexzzhVreMfz2
-qBT2hHsI/f+vKPhZnezGxFIU66GbcMuYhyzDHqHG0S4wjziqHwallctwjXLKnqpWty1lud1L
-9aAnekkw1HoPm0LNrIQa641hVbWE9UJ5bRzUH5vX4X50AB9P9CA24vmI2agNlR9L5uozs4Xv
-4nShl7sBP8CTyCa4TpCFhdXgDPPdnk9l2xxl2DJR13wPYzSobVRz1e/qMy1F+a3MlFZISuTJ
-HAv3D90MDwqVlgsoP5V/DFW9b87S1hmx2iy1gzpPWqZtlVpazdTW4InWBs+r7sX/kkJEEekC
-c1STxP4gxruLfRazx1k67qN7euwP98boaM8HTztPZVdfT1cH5l0lDPP8x0U5h7OlhFTmJ89T
-EyLUOI0crp2EU0I3jS/+CgYMHLNnh1Px99JiyiX9IhcE82Fd/PesSf6VZp9gO9sMj4NhJWQt
-1Ovrn83p8ii0SupN9lGncXvNp46F8LtrJbznvGc2FXO0asJXPUs4DFuJK4nDPKSaMbuoOuQ8
-oilxFzuEh0At1BnN1ZtZv8LxWqZvSljL/ju4LHdWeFhIV1YoG7QH6iNtngL0kvIrY5+ioXfG
-BHoAFLhJ6DvVAN0HS1ADuBdrBzh6NVVG+M6luGKFjl6Ffxn1m38S9UbIiTrsKhl9PPqCt0Bs
-TfeLqFrOup5t4nNXLYF2teU6Oj6R49l+8DGI1z3GKSVXGaWcU6YqlDpa7i2vDYvB/KF5OTWC
-vbKLBr7lbvV/CdYIvpH7haepR0LlpFx/dd8Bf4+ci+Gawat6MW0T9JtNsBRrO/7YvE2MtRZT
-G1B+diaZj89gM7lvQm82wZnALncf4/DoaOFW7D98lZgKTMDZCX/EjIKrieVwHHEbq0ClEl+J
-sniqnYraqvPRDLkydk5pjcdrLYgBRi5Z2R5LalY6+Kg/sItpDnuN3steZ3nhBPQaPgcBWAa8
-hEXQRLQU6aAAJkbccRD1N1mSqcvsZTrzJdhijlL8OvdKYav3MvvItR3vyq+w2zMFTQ/T0xjK
-ZBiVmb/NauQa/b5dQ1mrng03lF6GksN9wu/Dx6X30lK5vlRNORR+rJySopWF8giZVaaqndVm
-Ri01zgRyfnNzuK9ZMnzRxEO37KvBL9iWcHm6gvqOX24PcGdS6dFIaBc31NkhvqiLjSNdnqjv
-zuKuyu79jkneoONn1CHHKu8RPsVRhrpF70SViHvmHHyTvgnrqnVFm5X5ViicazSKdGxUuAFW
-UdYpn3KIfaAOYNeoPSgk38GywofQrXB/mKYMtThznD7XjlO+wIrSEEyWe1IuYzl33KrqeGM9
-dTqsLHGPmT/Cnxm0D/vJtGS28R+4/cIf7B72HqHgzVGG/crKNmKtNG2F0VE5rzwKPw7lCa0N
-uoLHQjcDe6Q7wV3K2vB3dZJM6R3VxuZl7bU9S5+GeKMmWGX8Rh/MZugXfA1GE39EEiiJL+li
-HVuj8ztqxcULl+Juca3jO4rL4/N4sbiicWuitfjiXiN2u9PhjeaPOBLo/GJRIlHYA64yQduN
-3zf+sk6pnbSr0m55abBbiPWv8m/35fEfC1wJJEjp4YtKrupRrxqydEk/GAxKTQMjAh1C+/x+
-aUqwqXIhvEIbL1+1RGUA1lEZRhXWTjL3zftMdWwyc475yrwR49nVrsns3x6Wz/BKkcmJ4sZH
-MbTTM5N0OHqRPblAxOrPYrOxLDveso2L6lSjifSX9TE0BcQoM6hSZmuGsKdTray9uMucgjx6
-dauz1tuQjDtGIbTYSsJrw5fYY7QcbsA7Wt3pw/ZZdhlYx77A3zLHyXhuEjNcPClEuVj3L2di
-VB5xYPRJxvR+xnVnU9RASLcr81et31xzrSNdOcijVTmyOiInWVrvuxc+GGwjV5Tzq2mqqm7V
-HikP1E9hp5oW2quWUiZrLY2gdtOsbxwzsswY9ZnJh8Yakq+/8dS3xNL8b1C50AHiq1yQrWkE
-xBuwt+c9UT96Obs3uoyQL/qFuCP6jkuJHh21IioxtpRnYmyS0x11kCsm1iLvkwlgASiLdoN9
-6AaGwVNos+GyPqvfDEU2rN/SO6yS3IcdKvdwACnNcTw4k8sI1CDCoWaIVAh4Tk2xLmt+/ZYx
-QFtrb1T3gWnqCPKYdpn907grCGY/sZmFiZPQJjFA1Hc2Yfe4zgnfnGPFpvwxthNO4lFGRytG
-fq/Hybr+S/XpZ7XTyhF5ZaBP6GH2x1CJnMrK60CSPkKpZ/xnbNdZ6676t/ld6WJW0S5adY0T
-9nwzP3RZr+Av6yL6F7XEWhN38RrMBPyucB3/5T5Ev4j6IdSI7uxuEnMzRo2Ly9My8UJS1UQ5
-UYt5HMc7l0U9oZ+7PhE1nSnEK2EElkJ1sPPZlrpa2R8qGdrsfx945S8QPhY4IJcNNFCwwDYl
-Loir54ItlKXBpvL5oFfKDpKhaUEY6BjMChYNXw/l0eRQNowLPyTOhlLJyuFs4p0ymupoFxAW
-UXu9Lx0nYw962ehqUUUcQ6ISmG0xVchLcdcIOk4nZE9Z3Mltt6YgS36nVg2/C32WTwXTjIth
-Dn6RTsCt0k40R+mLu40k6m/LRReE06jm4DVxChOwEvgLeyTGW2nwHxuzdoGzhoEJxnF0VZ9u
-vzD/QyYqTA0nUoSB9A13OaF41E53imdc9FbnpVjWWS+uv3NzzAvxhnc33cB5zwozYekn/i7I
-AEfgu3Uk96tO51zWpmQb6vyc7ooQKCdfkWh5gbZVbmtUVzH9p9ZCXqNND8tKitJZeWk8lmvY
-I8N17I8BwTL9kjkncAbFhT5SJaXl/GhloGOnUcKVjCW6FjP3ndXEKp5Yd+WYa94usXe9l707
-3UfE1Y7vDMUXof30KOo4uQ9fih2B7+251k/zjLnA2Gh215vBuZaO3SBqYIlcFSuD/6x+FX4p
-l8UL2gbxpGHyi/RibB35MDkrmACmBJcZteX5SjejoXzS9so87CY/sTdE7ukIU6fLoaLOvsSK
-qLNsjRhLfOi97ISOvM6G7Az+DD6a2g/b4JXMAOqiZBnDg4/D2/3TIqbRNysgbcxur6b6X6sw
-vFFZq5SXHytLlCHKEmOuOt9StT5GGT1XXalX1Yeav+0MaxPe27pEPjU3k9PtUuQNkIdqR1Zm
-W7O9HOniragHHjk+b+zSRCl+REKtxNy4BQlxsRmxtndldBHnYe9M5h/nIjCW2W4uAEWMt2aS
-+dm4Zjwxpys3jeRgnDbQ71aTQnO05kqm0VfVzZ6SaTwOhHTRP1nP71+iDgjWki5IUrCh8jFw
-Vu7rLyRbuX2Vf30vDTWwGD8gG7zP+tM9imzlWczV8RRwdvZWj64Y1TvhtadBnojoJ/zDVo4Z
-hf8UG8G9xHUr12pv9dHXGjFqObWf9DpcJpgVuu+jlK3+6uaT8DJ4S5uPomwRUGARgGhGxOWn
-E1nWVbI37Et4AQCpKNUqY383mxj14RBNxIdri6gosyWbhhbwy6gUR65w1vPVmxzbP6FMXEze
-olFT8rRz/BnbgdvqmUH3dFbCx/J7zONUgnQdPMpdZS7NcqmLsmrLT3PSlCF+wSgT6G318+ex
-oX+hJYWbmb/1T8Yxe4WZYolmslZWk+Wp0h2lT6Cb/ibbYU/JLAWGZXUFN7J7onK5U7FAMIa5
-qDdyPMeKeOdyq6MHuFKi63raRi12F4165GoUVds10RtylnOddnRhx7LnQHtQwr5nZNkt9MWw
-qv7UymM0MzpZY7TkiJ88Rc+MMsQ0uJMpAU4KB2AlV5zpcH9V94gXVA9r6LtJxegHNuiy8UNN
-VVqqNaVc7Wi4rV1TycK+GQ+Iy/As+RgzmXg6VewiPHYlu2RXKXesY6vzJdNRyMLq0V3tBFDE
-7GRWM15rydpepY70O/zC3ynYLrel/7Fvie91uG1grH5NSrLrGh/sgfY+q7c1yqpvLIIX9b5g
-szYGjZTvW59Cm827oRJ2WakwildsxOh1sfr2L8KLT2ZSmH3ibMfMKDF6eMK5hGZ5qLz/xack
-NYneFT/YY0c/camez46/nS5hOr+S7kRfQafBR+2hMUTeqU6Un6tVlbKGJXNwhDQKI0IeHAt+
-BLtCy9AiabV9XPpptAwfUusE8fCrgOybHh7om614/UPU4b7t6ijfE61a4JnZMHwI66DX4C7h
-uGue8MW90/3AxUcVdPaOnupA0W8jv0WOH1Gn+QruP6kuXD1YAIxSSyp6mPK/ky/lntXvBHYZ
-GeG9WpZUS9skN7D8Whjbar8kX6JPJAM6kiOBl+iLQsBj5Qfv9CJYBaM61tuYH7mXfc3bcldz
-o+xCO/Ur5CxQgr/MVHPEOQ84ZG9FZ0rsSU/1xKJxGflaJ/yTf2B0j3iJH+GcgF+mG9q7sDf6
-AJhfOWpdC141R+aeMxdnIpPKqGPG/a5u3s4J2H8Fa4Jpoa3wXOiV+UI+b5Y1t1hHYZaxEsYr
-Q6x9/nGGmtnCOJjR0yqRaaJ3OU8JLliNrinVYMqqDbkL1mSHh2rjHeO4G/Mq6kXMkZhYz1t3
-EX4nW4iuRwylP2FVmHisOdUMzcbK2bftTKOzyeiTzRN6SbuwXdfeDjqbCE82/NQjczK/EJnO
-E/gLdxf8l3MDjOVXGn3JstozVEUtZxfQ0s1sI8MYaon6vxES6KgVlmYYFdRM0APlsF9Z4Crp
-OuH2eGq6prnLO9Y6Dws+oZQQxa/hs9iLtJ+6CeuAiUpxY04wj9LUD6RquY+Cf2Wf8xfObhOw
-chLCrQMP5fbySW2nsc08bJ8x39rbtVj7pbzO3iHpaGf4L+J2qB/1IxhHxQVO4cP9CeBz6BCa
-qJcjNmFfuIpCHRcbFXTdilnsbB5b1kXEv/PUSDCjnsZ5o+tHQ89+V0+nQ3jKD2e6sbvIRnQb
-/AWejjx2V4tXn+vlJaeVIO/Hiqnvqc9qLj1OqUHVCf8GawLHrQrBU2Y9SY7ka1t9inwxNCyY
-nXUm90S6L3fT72qhnr4C2gXplN3cmIg9s+sSn5Ea6ajpwh+OZR5nzKXo5ITEqM/xpJOIpvl0
-Rw8uzGWwLno4tRjdQde0WzomLZcXBw/LfUJd9BPydmub+sU6qgwxCeWh8USdbM4wftmyNQY/
-B5/TDriFOWNkkUXUL9hMeSForXwGSXpn7JKZjfJab6xrJmd2tWfZVfEsoiLfgT/sHe3IiEtx
-fIvPEuPj/3U+iR3jPhq1xt3KtcLRShjGDGc4QJOTjD54YW0J1lg9gubKh+yJwb+tAjk/zK6Z
-A+C/2RuIV4GX9BilADVWP4AK6gn6P+qzcB+1adBjeAP7rDa5Je3mmV2tGum66f913A5lDsHj
-Q/3YGmYZsSfe1vGLGeRoKI5wHHfedZ5xxXlWueZ5vI4yzgtMd7YRNoH4YrXFJpkA480a4JC+
-wz6lPtW/KdOVVO29vMlup50gRKspewH25iug6nx75OT7YW+FDuQWx0eqnbiL7MJcA7tAceuO
-sU0fq9aOeFoP6w/9o/3c1O1ecBFsgtP4Z2YHM1d8LxZ0LXK53fWci5xBrpgwnSrJ7iIe0I3J
-NGo32YNw4SKKsSYYNeWzarnAW2Vr7iplbe4gJeST5fJ+Vu6bO1aKzU2PnBapR5rKeGOHlUJg
-QIQoqub8C0pnncXn53SgZwVDbCX5DvtGoRldH007QBM2njH42o4b4kXPekfXaNqZGZPsLBSH
-Rc6DcBnRtzxrvU289x2tnffpXewBbCa5F2zDcbwP1hrfCA+js7puVpC9Vq9wP6y4dJypqE4S
-phuIH2xI5Felt/UkHKNWCS+TybAV2hy65cPCZXK00PbsOSFvbgOpV3CcrqlFQAZcQg0nj7Jn
-2JbcA3Eu+9o9mW0cNYjr5R3N/3TWE57xLYXjTCLXmypApeJ/4ENQFEg33lgl5f26GMxU/wiO
-UCvKA7XT+i5zqDUZPbYeg28GANW1Hyi/mhdvrv1BIQ2jbymfidISg7WQfqEY9W9wwbgNytmt
-sS2wO74YA0Rd5gg+2bEU/+lJJ7SoePqGdyX7w7Wfr+jqJjxylxFSPX6ugSuJ6cflEgPwJthL
-2wlv2+P1puCXHMJ/SiZZX8pDtQ/l4OUCmcAZmI3lCw3ACXkFaKX9FUm3Qfp4U5Ui/hY8Yfzr
-v2vX9fXEuuR0JkplIwLmPCCSQo2IW1ozIts2yHTAs1WJ9fxa6rwwnz0vfBAmCdsdaTwtuLkE
-sjPts6oRffU2oJwx1v7LIs0cq4aRbj3Wr1rztbZ2tFYBVDZKUgXgES4FcwjHcYzPiy9jk0Es
-swgK1Ht7GXYSVrEzQZKxBv+ie3DLLAY0OBoVxneDlQRG5CUuU1XIisx/zCimUGQew+IFJllc
-wJ3nXgnlmNfCFcrJLaReUNPoCsRT+jnqQTBmB9uS7mud/S/VZ9mMviVzgM5kvtBKZ7/QUn09
-9U7BSnqj8AZ1moLL1Y1tgftWelYtdClDwmtlFWYSg7/ZMcobZosazQS0Z0x5+wD7Lw5ZH/OU
-6+x0C429u4QEz0/ho/OnsN55Qmjkqi063ZMdi1zlnWXEpmJPOj8bgy0gn8AUvC16BfJh+1E5
-/B1cgX+wC5DlrDn0ICOV6aMp1HTlPPZFZmwk5zVU+Y7eXa6ij5CSlU5hPXgoNMdXQCrgq6Q2
-CaXrL/T+Zio4ZPUm76Mcujp5j7vEnBLrcimu/pzszuBqebryV5x9uJfsJUbFO9OzQRbBo0ro
-q7HPWKe01/6QU1VOeaNd0R4Zx8x1VkfrX3jF+IqitAQMyl5iqnKWAvpm+rp2nSwhPcXrBdrh
-RQJFib3hnWRLoyrVCCtHdqCG4A/ozlgWsxvcZnejNdwZOE94bs9yNIdNXbfAVfd4IsPlp9yO
-DmxFfjF3isnDPiHzUIPxrsQRvAm+m7yHdlOy+Ywcpa0k4pUaxFXpN5EhPaSy5Jv0c6U9+a/a
-GKUpW7SjSqeQra31B03LX9fOE7hpB33TkeA/gN0JjMZDoda4W7mB1zISqWUokU2mnnKVuMW8
-xR/gv/F5eJx7xj6mPtEf8MrkApAKjtrn7EUmZT00ks0+RjsjpL9V07Rl8iotTUmy8pn/4g/g
-K7oLiGHrYNfYRVhbtiVG0tF4LDmGuIZ3IG0gkkfgdXy01Qj3WHMJAk4jw8jCW4En4BL2DOWh
-WqN0ZgfoxYeIQ8J9+v/fJm7LXON7MG+EOLaMcI25wh2im7NlyV/UL/AVW4lGmAB5JQec7o9B
-O31tsOb+vdhBH4nq5rzUySwzTGfZgbk5/QKH/HtztfCvrBJG7ZyBqLTvL2KMvwHzT7gjX0GT
-+XgzzOPooVCEmi2cYQvyJbmDHM4f4vIIHThcZDjMuYfr49Z5wV1RnCMWd8xhZ4uryMucDIbQ
-P+EUsgp8QP6Ceaj+oAaxETuB7uP1rTTyi/EX09V8x3Qwn1EN9TpYlvLNrKpc0S7JhdQEeYc0
-Uz4b3KeQwYrqsvAXuZ36XWKta0ofbKzOkSfNMaSIyjA7cVb8j7jpDBCHXVvoku6D7DjHFLYU
-l8J8o5eS/ciy2FNwA42Bb1G6tQsNM/ejw+YBxFp1YWnjlV1V34Wm6Qbor90Ay9Q2aJKSadcK
-j4EdAt+B6jtElPX1pesGpnBJSlnhD7MBXwluiliFkzGwU+RaYhEYwLSz8ouiuc+dapbyXrLq
-u97Bk6IDOy2uBav4gL2DqmiPwdugs2AZjpBKNsO/EMWpIaAd44H3uRL2Lv6FRfHfrL/4a5bO
-rTNnM6WMb0Q1fRok9AHaJSNO+WqJimFPkXsiXW4PnLKCSgVZ8NjfHosNJ+N3FAtbrg/CR1iQ
-iIF/0mNALLvi/++F41yUzRbB99I0aIxfRrXgE/DDDoNFcCLErVqmXyujf1fzaIp6S7trSHo/
-9Emvi7/TnxEXjE5kM6s8UQll4D/wNuRXci+RQjmwEfRMNI5pZfdlr5rLuBuwJMsTjckoaiIW
-oVqsF/0Vr01XoxJYkb7LbSH2MZWxNlQJHJIMVYDE2Q5kSW4rVZcZSqaQI/DaeDS+FjzDSqHV
-eHW4nupmbqFuydNBtWArq6M/yvrgW2lP9k2y5+UWMKJyO8iBXC6QEiiRvVtKynqq5+TctF/7
-uwAU/E48kxi2g7qVb2r0EceBlY4qbF/xg2MUG+s6RK4Xh5Oi8IRuIlbiNjja8d/F39xwTuAC
-RCJ3BnXkdyBM2Ihd5o7iJ+j32AT8ESwE2tuDsLngCz6EHIvdJBvAD1gVywMfmA+Na+YKLc1s
-qE03f+oj9XTjnPxQ6xiepCyRLqhV1M8GppeG/+gYpmt98Gb6NKK7sYxabjXjaoFM51qiStQW
-crt3M1He1RpfIC7DivCnsTSmBj6aWoqVAM2BovdA3dXlMI92GD4zgmg+nAI+oBcwxupoz1Ye
-wELSKeyslE4EpX3k59AqcqnfIrfm1KQvZl9i0/yS0E9t76hte4WeYA9tYgF8EzEIzGTmwHZi
-DfuuI97qKlY0Jf6hEcOtNo+xY+zywnHYSYBwElMXfsIV8xz8w3hozzXX4j9ge7YftoFLxtux
-U7BH9CpUgboFM6hqIIUtg7dhn2GLyRX2QPhbXaTFKSuV/OYo/TV+2KxBr9J+R/K8Da6H9gFW
-7o790s8Q6fA7qaIkMh3+RfwNhuJp+CwsP/kKG0D1xluQe7FOaBqKNTpYb5VzxmN1nFnBXmou
-B8OMC/CDftxqoUVby+Qk66qSALab48njMA3PQR7wFjxFNzAapJNz8epcLaqV4CBai29BtngG
-X8sp+ASyOO4kSNLCSaILpsH84CZcDxrhlYhUpgSdx9GTEsUV2HTyOboH74DtdhZWFd0m4ohP
-1CbSSZfHTpMDYD98D2wKOCwGLKezUTHhtBXLvVWmEMMDN9CrLMZe8HuP8Tmrs37dp8lXgwUD
-MdLHnBPKIt8uY1WoNTLlxcRsrQqjGtu50nA6txdPYzoz85itfJA5yiO6LzOSakhWJXuQLwme
-+ZPazk1gWnNe9iBJMJnQQT+0XpM97crkVliTXgJ6sv3APSbNTqdK2XvIf1Ff8gu+gjxJtSAL
-USeJQZhIKPZ5QJmPrRj9HyO/UU7foZfV5ssB7a1k6cN0oFdF+1SLHKo+YHepw1lKu047tV30
-TPUQm6bddGy2yntT0Rn3B3BSaAAy6HHoK5GM/UH6iNfkBHICPoUYBo5jr9EteMeuZrPWW/t8
-xGoea+2sjtICu1bIA9jQU7x++AP5NXySqhbszWD+d9wn/wV+bXC8UFw54ygDTYcH389XAj/p
-5ugm0RbLiyXRD1GUoyb67Z4F/a4rVmlHfv0HW1G+RD4KPyBYWcZ1pT9qoEfZ68xX9nOLBvNt
-H/ESPmDqYXW44aSPC1LzeQ/5H8dgddlraDfTCN0g68FD0APT9DXwb+0uPKr9RNuNLrhu5SUv
-WjZxNGJWO/V3qIm+A/Y3hoFsux6+GfXE18A+eAoajHXFGqIB+HC0mkjC8xH7iDZoLX7OXAIn
-65naZHWIMkx7o5wykLxUPydf13xqV2uWHmlzoyPuN4cRybAtPiNCQruAbW/Dv6HmdFHiLk/Q
-/zgS6SeOS0QRR3HcIzjxNWxz/Clzk9jPnqE7s68Ym7xEJYJtRGVLwm8Yf+DlrXbYN9gRfEb7
-7e9wkDEJphgTkW4tx4qBkSRGUrQWydqzzCiiF9sNe8tOg3/TZU0HnqESqI7UzG4dCJqFfcmm
-4Z9idpE6m2mKpa5U2oUZZVdwquIMbdD6hZdZ+5UaWEXjC/XRfssWIk4zafQPchE7lqoi1mRr
-OdtwBo/YauxypiZTlfxNBMELlIPWWuexTcYaSrVeM+cjWbMABKgQOsbkwXLZ2yidnWK3Y9Ps
-BfQX+JjsiXqTCvSSla3aRGH9GHZC7YBS1DhYRj8P+0e6+KdNAAwVgffBWO0uSA2xmC+QRCaG
-aKa5VIwrqeQIA5W8junKBLGcVlK8YNwVHtt7hLJYBbEwQQv1iJtsK7wgsxkcI8JoPCqKlYYJ
-WLq1HWbpxe0EvQyM0s+iDPkbSApVxbb5z6DrOUvhn9ktMTUnP3PDX0ScGNrt6C3XF5arOUxV
-Iw/TEC1lF5ALeJ4tI1YTVL6ZYzY1QHSgjfwWQ2ZHacl0G60B+UDrTbbR/iKfqC4yU61J1teS
-cZ8+A02y2qLONgBuuwoWsHXiT6BRFQid7kIOY9ZjT8gXsALeDHwgVhKQrEHXJ+qzURFwyoKN
-8O56C7hSvW/N0xbaNfU9YJ+1Hl8PxmI9sCtgGr4H/E0UQieBiIqjIdhQcBB/hni8MtwL1ts7
-4Bezuh3Qv5mEDrWKWoL6UM9Vc+152n2UqLnROG1iZALG2cNUp/Wvcsecr7H2SPgB/SaH4CvZ
-L3geniIk/ieRInQhD4tJVC2Xg05xX6NSnCwF+HdEf8qHDSDi8eHEAGIfZmEr4VNw0K5JFIEy
-icEsvD8siFJRHXM8qKwvBx+M0+AzXINVJlxEK7oE8Y06CjbhM20VFDBv43/oCdRybT7FGbPJ
-tWZzvJfRAK5ULuhpIUtJCk1X7kmi+kql1UztkPJb368tto5aHVDXyEz2xARiM1mNmEUPx+fR
-d/GSzFEiL7ONyCYLET3wmzgfWeUF/IH3AoOI7vhVci+eSkvYSvowPENu1p+TGyMn19qMoWta
-AWq7WZz5bpZmN1gk28CuTT+zDhEJ5l7imzGf7mMx7CC7Cs3Djfgm+wDsYx4zzxrf9STbp04H
-SN5OFZO3ik8kn3uDtN7tlf92bpUJcb9scU2UgVw/rStf10zjb9oPuC/oKvsBG8N+xD/SCOtM
-OMFKdB4mWZVRJd2LMaoScfFloFRwHBQCO2wUeAxh8Aw2IDSUvBUqSk0Ln4n0aAlqmFSO2SuP
-4Npqf/BNzUb8UJTLC9R1fhc7lf3E9qVKsePxpcw1VIvpbN9nVphb2KbmVW6lGeLW6DK1SPkT
-JCqNYWc1DQ7UZqAGRhVsgHUFe2SXAYORgN0HJckH2DFqPXmSvsUkM6eYj+Qsqgm+k2iI0bgX
-ebC2lgx2mC1AYSse9bH3wHqgFOofudenyKLYFGIg9h9YjxWBFvbcvo0tQBNAbcyAQVAEESAD
-0KAM9gmWQFusC/ZEK8k+aPU1H+o99SqKoN2UfisN5K5KL7WkslSH8mtjnPrermacwgta56lR
-MJtuhu9mplHfKT+zDU8RpuPLnB2poGs5c9E1jB3mfMNMEatSFP83vpNOAy2JtsCJ18K24Nvw
-gv+j2CyDrLi2MHq05doIGlyDBgnuEiQwuGtwJ7i7Dja4W4Jb0OAOwd2HYCEE15m597YfefN+
-dFV3VVf16T7f3nutH41ug7qyMSvL+jltPcu+weq742UynwBTQEb4EBSTqfIVLwc6CQEIzI/X
-4c70KppEDsuv6Tl9iHU2gbxwC+DS7iXwj52Pl7bSadisyToZVcWkaC1R33D5WzOJvbZvuRe9
-qyzC94CO8hnyo2NkGmmiDCHTlOG4iPoBrVET0CG6CU5Cp0B/MQk47jF01ntDpvNW+Ko7Fpw3
-38pEQ4NNzRL4kBOlx8VK9SFgqilLaAvS2boyS9FeunX89XjGYCtwPDAOjPVhOUPhLAIHuSXl
-GWeEfMF6wNfwJxigc1knksNsjU6G2+B14W9K7sgafVJkqv+76N/BLdFsMT2M3jF1rCGxJ5xZ
-sRO8k8EnbIf+uwjTG+ATKoQ5GERyyxK4l3cS5DIby21pReWQ1BdyT3gLqGckg3wmhJoZgm2j
-f4PTqRlRxZRG5HHaXTLUmE7u2nF0L6tAy8oZdD6YoW7Ev+iL1F76X3pGbYhvKX2pP0InVR8s
-SxPkEvyG6Vh1N6LHZnvYyLgAilvdUB0XklPeBlzQGwnLO7f5BPuta6Qb9FF0F+TQR6XTezlf
-nD9ZH6l2Ugi10S8kG4whMt0j20AMV8kwf8Sms2SvN8/KfpRxfCioKvdIBM/yZ3A2z4x3ihhy
-QoTxTR7Ee1kO2J7Nk+tFLOiERoPxpICsSlbx3DDe07yB5nnjt/CGqBLuZL6IPLRXW9vd694o
-dzd/ZffhBe0GvJ2TQZRgZcFpaWCJGqhz6Uytsfqf1kUrra/RC+n/pa+zfOipr0TolbbCfxwX
-16vJOdoONl1753ZRV7pZyAjvmTzv2bwCKyev8nMgVXQDttjKJb/oHPQsy3AuO2G3Db/Fr4Ez
-cDXyKcvgU3WlzKqWldeU6/If5bnMpNjCRw+zNHTMqShnWd+xzeZWN2KOdD+n9/ki9lSxy1JB
-ETsDzO/WR2tZAXxUHMJnZV5yTo4kZYGPVkV9aT8aJQ21eHJDa42O0kOiEuzu1pcB+xxIsNeh
-Fk4LNNHpBYrZt8RMo65cFBmOQsZyZYPTUfOJG0pjcIKcAWXpYPBA/SKT9UT5Xs8EXmjV4GI1
-Ayyq3JEHyHZhoj0Mw1xenOzD97JO6LnzXrlp3fGdMxOCqUah0Oto1pin4Y2hpql/+nOnAt+Y
-SC1fLzuv7zIb4puV7scTeCO6i08En0A5gYjjnaDN3AfKGPcGHeRkxkfNHbBV9E9YJJyAhqd9
-h8tFpqLk6EZwx/hDFrCWyafmQTndmArumCVgSXcVnMyH40FwtvIPLakn6o18V/17tW1+h4zV
-GZyl7gEDlfdyFN0qhqT772lUxbHlUTMnO2ystjJaicZMt4YdI5LZXXAZcNSf2PgtLUUeksm0
-En2oNlTL6VfUU1oGFauHaIQMQDkwkAlwFn8jfuD92S2+wFstL7FOcLbg6Ce5jhQUB8kurzIG
-bms0yT2KmrLueI7IToqA2+SpzECGi+rwC5/L84r1zl98kdGaTQ33c/9MreqsTqniJKe8cE6n
-LfdyGfvFZLcpNMFx2Ec5ARbrWcGv+gxQXB0AKyoEzVYSULwCcALNQW8SrM+k7wJCbRm8qr7T
-k9EepYzsr/wsh6sn5Wz1Mciu9EfHcR74L3zOD4Jr7oP0JOXlK81U9pu9itV0W3rt3RnuWHe4
-e9k95q1jDwQDBWCEPAL3lCR5Tx0gZqn3eG5lipC0nOytZBbPyV3vH5TBbYBmOjvhDmck6O4c
-k6Xtk+KhWYLXsCS74n4QQ+QnGELn6Vh0V2+OHvmfoSq++cSkx2giHEzuiIOwKB8ki7nDxUYj
-KvTwWamlrpTvvv0uq6UWhrujC/BsZwNN5DeUv0FhtT56qhyDh+kIMIIQ+f8/XUbSa+CKuhFN
-1A/DiNpFJBDFq4RWO5XQCmcbgt4wNFtWAF9Jb7ZFLeSO0mu6H/2J7j/Buu67//fMjA3tMRm7
-mHdjxxqeP4+5TjlqjcNf7Qb4hd0YVnHusuWsp/svzOj9QsuxptT2vqJybjtw0WotvxnrQU0z
-A+5mx5I4h6AS1o+iXzS7x1O/uJlTBovL4bdohJNEgKhGFsC3pDBdqExUkrXM6nT/Zn2gf5x/
-rLJEzwla0+2sL9zE8sn1vJroxk6zSXays9P413pqDrXfuGPcSfIYd9FMuAhPRUEUhA1QW9SJ
-vlSmaKq/gC9jqIDvt1ADrbkvg3KGrCd7YX+UIk7LlexHIdh9bwhbaOVxBhjtnTXWdDHQ+4zm
-iIxKBVDEFw+2BMrJxoHM0vJ1lA01W7zDXXmM3OtedLra66O57CVpQ5z6qY/c0imPvf7fhrEm
-396yvCl5RY1wVbDRvgl7gDh0mJ6G7dUucEh6ykaoRcA79bZcpkdlGX9bcMaXCb7WRqBJyq+E
-khzpVvM43e4y+XOQJ75dqKpvICyob5ML1RLiEi0uLNSJj5dT3Z78gPWK3TeGssvR9V5NY417
-wjjtfBd94JSKFPVemNX5cf67fEYyoAr+j7hPKDt5HVAw8v2A0rQk+EULgT7aGq4pY91R8Bfr
-ON9s1OL1jR/EWOOwmGmulC3sybCx25Rk563U9+Cj3pGUCPRUYLCmstdn4vvKUXgZD4AOAGg4
-HwCf2jNljsg0nv3bz2z5527s1OfjPG/KB3Ek0kiONxaBgmYsnuXcJDlFb5oN7acz6Ui6WOlB
-J9OyykZyXBmFD6YvbqeyFUyha9hh3NGaheeZLUin9GxsYFMIhb3xe/IFLFN+k+X1azJvcL/I
-HvPZmxSzww6Hhhq5A0siObVukU9kUmQU/j76ivQ1j6kRZ7j2q9iopKI3+AWdClurs8F0tbds
-Rtd7HuxivZe7jWuiunGea8YSVsYY7iZHxtqF09JnX+pzd1q4Ee9kJIDOznPUmf9OZoIFKqI5
-/LG+3IHFgXG+PUGhZg+lkUu+Z7AQ+b/P3ePjnbasmt3Vm+hcc+bZWe3mxjr7efSpW8EqyHO5
-5yWSfrSOZMJV1LvkP62yVjGQ0T8h9GOgamivf3mA6F218rQgCsOlXIjS3nJ2x1nr5XEXuAW8
-y3Ytr5fzhPXnb2C59Bz1RAV8m2F932M5Tn/GL6htWD5KvOV4t5OE/fZj2Mh0WFmzrlXS3h1u
-4D5PGct+Ttkge6UWQ33DNbFqPMHQzkdeewtINZhCflHy4/HaU4nUVmIPqSw6ktW8I73OetFK
-rD6pyF4iLAqhp3AWvqQ4Sj3/Ht/o4IpAvWBF//3ATTUaWE+CgSpgqbbaKYQbRZfwnWnZnRkp
-rjnyW4LlSzlm7Uk/b5Q2zxwVPWZVs8p52b3OYBssSOaqVPnLX1p7HdNUzxh3Vq0SukU9fyqe
-4D8O6vlieUEt1ilDrkcHi8TILO+lcYv9bNcST537codXCjfj22kZWUjJhzaqd8g8Xx96PrAE
-rw2MACO10qIlrCL+9tZJZgMwK/pIdPjWhXuf/Gzip2rei09X2dhvncEfRgscYJVofZCseOi5
-2gx/1n7Dc/W5NLcaonvRTbhF7pULeU0+29vpjPBmOtl5DbZC6DwJJLNZ+CwforwSW/T9sGCw
-o/opWCWQ23csOJAUDrYDv/uni9f6WZZb32oL9XX4IMmSUhW2SokHTcObQCGzCsrpniGZxWSl
-BRqszFWO0DHpz83lI0p3rR8dSibCjvIvb5t33Lrk1jBOuLfDD+ynqeOMXCnJYfHlWXj6lybW
-5ZQbgprbyHA+Sk0jlfW8/r/11OBwvVKwnW+e/4p/un7Bt4amKZlgBZiXz/Ey2P84i6It2A2z
-D//kbHM32uXtUVaas8g5K0qyBfi5XK3koPvVjdpndYWvjPbSn6aO8Cmqpt+g2XxnUFVtC8eo
-ntOOZbBKWuetLZHP3gjzuPzDaw2qpk/sJqg5VrRYYvpK0HCwvtI1juL4mP48oH/nLqXD7bvo
-pLVNRKxS3jPzqjUiOjDSLhKfui5a5Fs/e+fXtXxWaiLMZk7ERbxitIO8rQ7Gx32v6Wn/JiXO
-d0a9rozW2qOxynL+I2rnbueTnQNeee+yyChsPFgOULqBIepzvFjfr532nQ4k6yVj4rUfQwYp
-7dsIaitxvDI+43YHg+xOvJLxp6OH25pJqa2j61NGRuZ+3Rld9CVgB1MSvEg0pxjN18DvaWta
-V8+lxwWH+S/H9dU/xh8gb2NGwc3+D3KaclBUSnemd2C8Vwq8tF+IJVYzedfeCruwXaQ0mKXt
-gcf8qaBdQAXv/EyWDzSFTQJxBPg/0N4aJJnT+0UyX8NmWcu9yeFR7q2vW+34Tz9aPT5S68an
-BfbyL8+9zKl5YW5zmvqMnfS/Q2/9g9QcPqmt1raoV9WJFKq5iIvzYJLunDvs7NxnPXSS7Xt2
-CVbR9sQncy1YZfVHFbzstIb0a3F4hG+e+rO/tv+2vj4wQbntP4mu6K/kDfUKp8oObyee72yB
-cVZmOCtK4IFoA/jEXo1fi9baXTwrmIXWjz2LM8ZUIqX8j5Sdyr9qd5RBaS9KwQzuO+e5kRC1
-w2PDJdNmhMemTItc+LY3WjD1n+jOsN+8a8x1n7vN4QQ4T/1T2e57rx32xestfY9Vxzda6RD4
-QVkfKE887aPoi3T3Attu/uq8CB+2s6QlubPC95kbzSx3OQfh8XTL3IqqkCB9rXXw1Q4WCrUN
-Do55qq+IPYMrh+qJstoFfglvl+XABvncKyKGOw29XtZoy4pUsl5H33hF2E4wDVdDqnYDxvqr
-wEH+X2FlfQYKaB3xEK0wCmoF5XTlH28M3mMvFTXN5e5WI9nuZbSxWkWnmD9FsdXezGm2dn3R
-WLAnepx2tlvq2fkbXzyivob0mfKJ1CZbUWkcD0MwLyD8N3HUWcr/cnLKC6wZ6g1qUz/x6X7t
-l2B5f3zMiOD60IGYe8GOsbd8VULnaaKvN9xLd7IN4F9zJB8X/s5L/lbUmv9pZjjuw4tv+z7U
-/trtc8+U2qn5jQ7mKy+ObYC/oTNkgt6DFAx6eEPovtI/doNeJma3ltm3gGZQ3sLduIsoBP9l
-b8AS1hmd926ji15vXJbFkbwMk0WirVIC1/YNpkP9/9Bd/l5KSiCWfvM/R1e1E+iFMhylkVJy
-IsjpfnQmGXPCyZF7X2qYGT67zvXPk9jTL23F0pQ84O/oW3jYbUb+lGXUKfiSlp0uUL8nLUh7
-9BVsAz+LXqIJX8oqifrsN/HVQ1zx6nsf3AvePO+lXM6/0FPwlpabjlLn0RqKjxZSf6fvtQlK
-Cd9pmqRvwz2V8qhlOtdv8yLiguXxveZacdbcJx+ZY2AjC5AGzn71G+8cPI3Lx/+q/ZRBCZD4
-YcHFMcd9Lf2llPNKIRyPL4JyMsyoi61ikcmpO75U/trlU5tv/b6oabNT+kV5eKGNrOpeB3c0
-W8Mnya6oNv1Phf45/k7B174r/tXKca0TitCMMhn/7U5C3FgM6oYNXjptPE+LtJcP7Ch4xNag
-7OAa3YBXa1G6QDuk3FF6aSZF/q/0o681fZX+RTLRkug2yiL7gnlsnFRYVlCenZFrvBY86g71
-Gnq5eA+WAP8So2hJnKYNVCv4BmlE58pDrQst51uML+iDwGClsTcGvI0S51PKlmjDb4WN4il9
-zSdp18wEs7/d383ozmB53M1ig/cUrQG31fH0iS+38tmXhqrqu2UhtYn4lTThC2GyVxV8772S
-pbx9oq3Xi3fjybwJWiyfK0vgZG0zOaUnay0CPQKbQztDImZCzLQQCYXVBH8APFWzuzXRX9G2
-rFA46KyInDV3RhIjM1L11BJfm37t+XnP1x+/ZQ8rZmMryDt4BdNn111yEg1VL5PZ2hAlo+87
-tYL/KZ2gu3gQDaGu8LxsLwuKb/I7sQ0ukONxZbSDViF71d/JGx0rE4Ol9WOxuj93XF9fh5jf
-tRqBX+gBtQfIiyNebnDXmcgP2g9s25wV3he983VbePaXpPBv324YwyMP3MIOE2N5IuwibbRP
-diS7QCdlMJqmxeIdegP0Vk2SQRx1/xUn7ENcd5N4B3c9G2xfdC+a8+0j5kbrX7uF04hlFB1l
-eToEXfA9JwP810gW3yYyw9dOzeNfqzu6p75Tj5G8pChM4rvYbOucW8osIz7avfAdb6SS5l1T
-DPeo0pJf98XgMvF/q9FMn3Q7Q37f7Ziu2l7fbXKb/ApfyyXpadDFGtvv5Tenm08iBcJH08qk
-7g8npPnNLNGR1jZrh/XR7e10Yn96JXl9kQ3sgcfJRhxRFZSqLuX7aD/nIcpmf5Nl7J/EGytF
-lLTbgj7ONQA8BmbyP9BWeEbhSj7/Gd/FwA3fiMASvWWgoX7Pn1+f59unFdA95aMSiyU6I/7k
-bbzy9i37SbS7PTU6yrkaLeocjS6yn5jLvDivMEoQ57XjIBJIxX8HFysn/FnVFtp42ojGovG4
-guiOanqTQQPnLq9oP/G6WSO9+0ZX1j4KeEr0CXtiJfK77mvenK1ihUUWXhW1BCHVgMv0/KCN
-nsyOaXFeXW0wK6yMFi3xFVEcFRI3YDE+CuxlH8UforEcjc+hnjpQ8wRb6t0DH30hHwke1wcG
-p+gn03O+VykNPKS4JeSyaHN3WeoUo3XKsfDN1PFpB8Na6vPw4pSX4XLhZFM3b/I69jC02N1B
-isrmag6yWOuhDFb+oYvwLmLBC3gByIsGCATysJqykXdJ/s4PyHfwo+hF/UDXa5D+wQ5aakjz
-HQiZvsZxln96ho/+o7E3fd39llZVKaE0Qh3QAvCEp4j3zkgvgwWtydF64WAYpySmpqbsTu0a
-LRAp6FSz+rJB3gAxSK4B3+NOeA39iZxWJsF/1PxipTaXrVF2O+NQ2Ngnq5qp4kdnqJjmKmKK
-W1cI542IccfL1ywPOA/2wza4InHIanoKPyZXJCEgvVeNhnMRhcfBeNEVfOS9wFTRRE4FG3hD
-gthBRWV3tbniRmA4DMWMIzliG2lG/AF9V/xBtW2wlfJOm6lkVJ7R2ygRh8EbyeU5L4Znsh/Z
-fqOm4YY3hLeEM4YnR15FX0cK2JFI0MlhvnSPu12lIRqgkbAKKonnwpLkohyKb6d3gbLWGSmi
-b8EVszBKdf4B5bwb4qE3XfjFHvkUpMKSeLzys1I28JfeN6akL2/M92qu0DmCQ/fJiOBHstv3
-DGVSHouVcKWbT/S3E733dhMHup2svF5H8w0vb84By82sEDnt8Xd8uJZVxvl/EfN1h5dRC8vN
-dB/IQixwAmLwPcgu74I9/AF468bKa3Ye+c2eAO85j9AzZzs86/SRuve3eMeXgQUwikrQbaSN
-2gJnULfyerSatRifijTDZSJjSXNjMRlpV4aWXZjNtNq4Abe4eAAjpLUe9eUPXQ9WjKsYmBq7
-U3P9XdVR2gLtkpJNr42bqQaP4C/ORlDQXspTLO5ssk+aNR0r+syuFbHNP1LrRqumXo2q0Ype
-NWcNCvFZ9L3YSYaKrtDiN/hssJS/wVlkRZJPDIVdvP58kWO7tdxu7AkfChy0j6xTZ6vM59dy
-h3qql+O6aOMzXvOHMvljrscrMesCz/w9aZo6HA4hd+UA2FQ8E5tYDjbQ2WdXNxoZpyKjIkXN
-DNGVbiczJE/Yg1AN9wmu5GXDfv4A9gbH4HYcB3eTonw6tq1+8GfjL1Eluovli/zI46IN5GZz
-j9xndRe2fYA34qNEPlQHrCSbUYg2oD1JknIFNSTHwUmwXVYGk8BAlCf9OidaRIbJCvgkKw13
-sKuysugkU4Ahc9CTYLLmA5t8O8T3we9Bh5gL9Me4Sf5M8WWDOWLa+L/qd9Rkuho/hz+BSWKb
-+MLe8e+8C2yks90Z5eyONnD2ph10pkT+YuOtT+K+04E3dRt5b5you9J23H+ts+7vTg13Bfve
-kXy1pfBNRqL3OZrqXbKgaMHWyCOSAhM60kSt4FecSemhxgRb+WfEfxf4J8NCfWFcHXo5dAl+
-CvYAj4JbRcXAO7eRttZMQ39HJvNc0Zv2JrOcOdqxzRusn/MVNHO3kf/S3W+21TWQZO+NjfPu
-xS7nzQNBcFSNgjUkRjaDjXgOuUT8JifCrLAcygXbiclypH1KjDDGg7HmEPTU+YhqilG4EsRk
-NBiJLL5IlhNJvDGyvX+Vh04N7VfrJs1ueLBHdL/sYa6XLW0VLrPn4lpuUeWoMJWR+ApV1Xq0
-hu+I8iqwXq0VOKdk1OKUWeQkLYynkuJwCq4tzuCqfCseI56Co2Kyl8z6WUGmWVfYOSsHq2fV
-8LqYS9leY4Gwjf7yP/ttegXv5g78i1WBnbwl7JM9wG5iPrAyR+PcPNFhrL1Vj7f0zvNmYKF8
-pTZCp0Kb6fH4+frSTEf8gzIP9i3NcF27FhrjG+M7FEpWc8Y/Upy4ufRAMBU1VysCDQ7nmVjU
-Kez2sMa6w6yPdprdLOo5I1NdN3PaY55gnoe92O/4lJyPv8nk9GnxRTZkt13EK5ktwdWIilMj
-mfAsYyVMMRuBT/bv8jtvkHS99rI07yKyy24st3zszuOt0ldeTBDeEKaJH1EyqAPvgTpgvpwM
-OksPDYVNlSJkmjqNPkon1NwoTl0keqovBdEb4TrBpur42PfqiJhdSpbAWGWPJtQadKiekE7Q
-EAylZ/gg0Jr95/VnsW4HnskbIG96f8HTTk6kWGXgc/M9WG4HQDcnP0+2O7mX7XtudmctK2IP
-8vJYin3S3mjMZXFGNznQXCPG2ovckLPVFHYts4eb6nYX11EOOkj7wV9Lfx/4TUvw5/f106qE
-8tNo/Bb0JmNlMDe+OssRymD39KUaSVpdo7y2ztikHrR3kEH8pmgtz9r3xN/GZvCb8YbUN0pq
-46N+X9PoS9+QaAW9i7GYvrPr49m8Em4js+H8YgrKxWehy/wGaisv4v1gl1IQdtZng6B+VGxQ
-1rAHeA/7GZ6UdcA+5Af10QJeVpZ2drHBxml2NIxlhXAIGpEn6b4wU8421sthNoefveJKSVDf
-t1ih/ne+Teoq3z78TDuNlqkTyUc6SWmN96p7wC6VieX0Z34YdfP+gYe9b6ir0HFhmACuoZ5e
-FvTFnC0/Rx/yn43HPI+1W4x1bskXbimwxf0spPPF6+cetlK9sdFe3Ig05/Wiad6o6Htvs/Wa
-3+d15CA0VJpkoxyuFZWTAn+KzjF/gGxxrUjHOL+6IuZHrVOAaYX1Qv4EdVYolzIhdhv5N2Y9
-/jP4GcX7ukBOAulE/4mVF3nYEv6BdWGlxV2nPOhjXkMDI7vQ7HBW2Tx62CtsdXfq2poZb3UO
-rzM3pw5yxqb1FcujX9EYm1DsNSIDGYP3+TR5R6wV22Qu4IDysBdsLO/KS2wc/5v1ZmPkAr4E
-rZKZSRJIxrGwDh6LzqC1mMMiWEMz0QL8Ah8lD5RR+L42Nd1rh6GOvgxKn0CMXjWQ19dLX6J3
-V6JKRjwct5WZERVzcTVZiSaBEWR5umEdguW5BJW9d/CVkwVntW14zBwLWhlhMSyy2YuEp9o/
-R2tbJ40uVnZruP2r3ccu7+w1n7pXzYu8l3NWlmdNgCbzgd3woKiBJ/PEdLZqoJxFjbVrdL1e
-R82kvVVy4XQG51m1vk4x/2tzbnCiocZ8M3wxR6y8wUS7mf+gfcPX3kvUl8k5tC18Lj+Cqt7v
-MJNTnzS166grrInae3O9ut8YofSL5KBJ4QfovnEZtvbq4xviHWklzpFD3kw81M2HVZaPporq
-moQf9O7kip6CTXU5CJJ3/J7cye+y1bypM4LFGjlZg8hOPjb6RFrGRBhjrUCD7JKkm9tbCfHX
-ChPVaRfZnywAzch9tARNwXPATRQEmdEksAfUQ5VlGj0tz+sWHO0vQxL17PQ6aUsGwBN4I5xO
-F6LvtcLwmHqC5ydBNy8cbl2RDc1lvLIZ5y43+1gxZmMjW3RqWpnI6a9+s/m3xe7S8E52zBjP
-rpsteCfnvDwp8sN/8VPQXt0Fn/qzkotxyWRpxs+oafw0mBC6hSr6JXW06Xo7tVKgk9IsWJ0O
-CLTHo3zz4TS9Nhzga4rq+tNQe3073EIKyF/AYtFGZIFx7AFaYZ0BBSKleYm0S+6wtNLO67Bj
-bYpSq77Z0uxmx5oFvdWGKqoYl0HE3IoauSPQJrYfbOSHRXmRzK7zZ14ZJtkcr7pM4BNAddkH
-+GVS+gR7IvKAfyTBrZFJa5Cz6hsyWR1IGikv8V26iuZVr2lMX6eX9j9Rj2tvKaIF0nn7HWol
-X6Ip/A6qw+bBh64KarhhedWriGrLJzQncVWfvlRZ6f+IFvueyLfq3/wjneM1JpZdFCWZa+Xt
-SC42O62d3TZtr1k1csusY/5t/uB0spq6r6y9zlWzhzPJbJbuTwe9jvwonwiLgZFKyXTr2Axm
-6G9AA13HU/QdtIa6SdkOY5QG3m2li3VLb2Y+DrhGzhifOSeWm0kxzawRgRbWKb2RU1zrwI4p
-lqhHPsOhoCDJwVqSB3Yq6WSNVWtYh/SW1u/6XZOq3EjDD41f8BszO91gd1O7uDP01uxPPUXs
-Ue/Dv5UkvFL9EQ9VH8N5CgBlyVxWN90Cy1h1rQGRHM70SFc2xDgobpv9xFazNq9rpvE5pgKS
-rGUowY2jV/l4+oP0cFa5ELcAD8hHNFKpTV+q2ZUB2u+kpmbBMlovsFVNAKWU3DAzjcPdSQ+6
-Dp2iHcE3XAxAkhv5tIx4lj8P7OUbyqsqUScPXG4letXNLOnZzGb0t8ZFx9qByCLzbErNSOAr
-D/f5xswN4Y6sh3lZZnOyAL/nCJUrci1cA25oBOWPqYdyxg+EBeJGARZMhK0DcbREMIu+MzQo
-4IvZH+oXyBUTq44OjUKFQ4PBglBzeD3UhzQI/EdilJVgv9zGUrwb3lhnvDfG+uZWMJe6Mt0t
-fk/ZadT/ciMc/Xo+MivykzXNTrIvuDWsFl6cVZDNdbqJy7wYfAi/oCC20G4wB/7LpDzrBsBH
-7zosKXfhZ7ABzoLOyHiQi5UVMayF/CKm4fcwpF3BnX17yRT9Z9pWGan8gRdqLr7gY/SF7yNd
-pSahX3Bn0QkOZLvgTN4B95Sv6GDZSq0o2isPeXvyWAzHR2FrskNJI418PvRQq8E6kcnWTZhk
-vIdvjP/QXMvEje0x+LLZVSak+3SlyCmjnuE3DzsDnETWgDXwlntxzgYn1Znu7uc/ii5QxcdR
-d/V7WFf7wqtT06uJJvMYJMGv6DlqJ/uj4g5AA6Od8aTIFmWfcdJ3yCkbescGxKawp7G33YUx
-g53coa9uruA+MdnfAs3TPpNNuLpSke+iWewrpKT5js4wTfWuOV3bYhRSb0WukXaRa+iEMQzf
-cePVJfKS7oHyeiPQUisAItp6kFcPgxfqTVCMnpD35ByezY7zcof7uR/T6rHapiayuqt5Kfcy
-228N4ZlNKBaYQ/l6q6Oo7q6HP0iJ18A4Ul6+x/V5G5pXltVWo+6+WvSNvo8OUnORjPQGqkC6
-4B9oYeW9Yutr1Mf+tUqKrxolvqukva8xKeKriV6or/lkVMKq5H5NnR0+++1kSunUZ2nvw3Oj
-s43G0Vfml7T2VouUs/ayr+u94ikjZHK0Jr7vbqFF5d/0e3wMb1QscFbvA04H38G6cWnoZlwj
-FBOzALTzr5Al9W+gl1aH/KL217Iot/wN6ftALzohMFI5EghqO4NN9ErBPWpR31W4l97xlkHo
-VhDn3IJeK2+YXdbLaM52skQuGMdSioZ/+vYmLS3lbnR5pLhd36rqJjnH3LXuHPeql9+by1uw
-+uAS740JiOBfYXF4BWRNN/OefCEMyzvoAH6L+pI3MDfqDD+AsjiAFijdyTVtlLpI26KfpQ21
-njAbOSk+gLNyJbgDZ8F98BysLAmc6bUEOe1l4DfzO9TcekVyukfVGHFR+wlqWnbyRJmpmvQX
-X3eaP1CS5Aycgj31n+R36ji+SA16CeoOKwUTwxaHIzedxuFfzaTUu2bh1KDrC4/ho4zUdC69
-lf6uD+wqfLi3Ru6Vx2E7nIn41TW0pbYM16SLpABj+CKBxFp+UbZnB0BLJ0XOMT7KDpE2aEKk
-s7LUWOovYC+IfWmXia9jV4zN7cwJvma2/zU65TuvHtAKaI2VLzQ7+Zl+BZeUNmyV1sf+Vf9i
-/qFtsBT1m32cvrRH0hFWSbWqNc7Xx/kpsJK18zeQ+/QPsp76G/+M9rtdRDa3r9fMi9pNvVSj
-mzM20sJeF3nlTDT7sgQnRixwnok69l3Zwa4Jj7iN0Y70Wn4jW9GN4DelkKyozOX/0TiZQpvj
-PHSPUgVfoyYIwI6gDR+EDvFDpDuwqUJma4F0krofnBxMjPnZvyh0Qm0TLENm+sMghwZFaSLd
-qvK1lWivi94Pt0tLTElIHf11cLjOlwvRZ596G/0+fjL6fn5u7Us75naxRzKNDeS9eX/QGwwl
-45RJyvfBT8qy+ARlRqYZJE9GA4nQVHRW74Rzaslkj26Tfr5LZI0eUTLrrX3z1LmBmaRXcBn6
-NXgeLg4UBGf0kbwSjboJcLy7kYe8eXZH50mknXkgrZgxNw0YB8NZjZPRstYls7Yba5fwmtlX
-nDT7NzsDu+LuBYmgMz5Gk1FudRTYTy3O0U/sk5zsXec3vAzcYSX4d+IhzygrpNv5CfgH7k9z
-Khe0imp7PZvaSC2gVqHr1GQ8SO2Fdirr4CK6D6zE1Xlf2MDeBHIYO2EOA+Ae1gZ0zbkNLruH
-5Ee3B3jgfUCXxEnlPi7oe6/v8PeKCft6xn+vPY7LQHaHfgb5/JTX1lbbU0jjyCf5Q2oPfiil
-F0tL2efitJdOu0h/d7WB3FdmwJlhT3DWsUIsB9woG8FjoIioBFT2DvT13oAbXlmZyHOJLvIL
-myvfOR5/Yjj8Sngt6hkpq2+z5gbfet1ijgknZi6oF9sXPIydKSvEbQMy9jHqGZOCR/gF/kYz
-4hBMRL1EffIr20szOLdIIVOlVY3+SjZjmVLCbKzmcoroo9l53yZx2l9JZPDdYWOU7fwLoTKe
-GOlc3cKbxdra8VZO86+0nUazlH1mYmoFp0w0N5thNeMj7FT+m10N9HA34QSxnn6EAToIxZNi
-qDY5iJPIA5JEJpJO5F464d9E+XEUJMOx4gP8XuSnE2Bn7T/SQ/9HeaVV0dYoi9RqpL6yFP+n
-xJHG+njaIbCQLPRtE8nwiD3YyWM+ihQwklOyGP+l3IqeSm0V9VKgkTstMaqlZY7+mZJgf4vk
-EmOcPnCftxnvlg3oIeJTzmnNlDPBCOkcMwitCjQEEV+ED9a/Y6fViyyzfls29qXg6/pUdYw+
-VJ+k7vUvVYIxC/TGsV90J7RMGRZcjKv7Bou55KM9XX4zl7DyRnmvd3SDw6Jpxv7wsEjL8LHI
-G2NneJfRJe1d9GBYswdHG7vZrfyihzeWGOKU2jTdtjbgpT4EY5Xt6b7fCQTxInlQDpEXBQZ/
-yn6ykTgirwopW4EsICdk6BfyC02kq8hA9CPJBgeTDqAN2S6mkNdiHL7GG6GR7hSUbP8Km1sr
-5SzjtSxoloedrNdot92aHvO6q63la71Feo318OsxFWK9YKm4Zf5PsXXUfTHj4bPgKDYrMNqe
-pkMjIxkd/iIepMZ701NzuZvTjrL54Ud8b2Qo+8s8xdY5M1gb94n73J3F7ngZ5C1WVC4WMQCB
-4qAyuMtV0JeNFs8dz/vBGOJliUxiF8MbeNHIfJlkXkZj3dEqEKMC3eGhmAtwfHx31CTTSTop
-UyX1eAZF6xS3VAsEJ5E/1P6gL0qVS/lNWc3Lhmq7lPazP2LX6k6yOlgd6ExUxjg9lNZOW7Wd
-U0Np705XSrnd1drOMZrPXYL3usfkDGeVs8VOMl7bRaKT3VrR6myEUZIfNLfIHs5MZLEz6KiY
-i1aCNXgBXkl0Cmg98hGbsBfaB5qi0rAgPC4HiLJ8Er/AlogLbCxYzYeiE/I//DNspwTJK+2O
-kl3fpezTQ9pS/xr/Vb8b2OZ7EziiZffF0oO4LSgm8rpLbBANhtem1UkZlqp9u/E18rnI1+Qv
-/6VsS0mK5oxkcafY23g5tlNWFQ0xQYuVYnSa+kqdq/4QIErp0CI0K/BCWNpwdoE84nXIRyiV
-dTiPuhmXUf4jO5Xc9BMdRXbQgLJY3a9V13L5iJrBd5R01E6A8UoV/oMy3LtBMzp3cQlTg8Fo
-G/4hbamdPS2P8WN0aTRixxpnvK/RMSzBWMquW13FQe82ShLblMlyuDZQZtULig9KKTYDd/e6
-o/5eO9jDKwa6e1mA57p8tzeVPRYXZByqhPuRxXS3kkM9qH7ET1QMktQ38i3NCDLTy6AE7Spr
-4YtWD9gyPA3ItKziWuoR1iUMxQbzd3nH+go/O01IQb5C2SIt/x71l7i8cXbcDxmNmNSMZQJu
-hqhyKHYqLhSjwjn+piJ3Oj82glms3jw59VdX/dabDf46nj/8mszWpeTjPVLHutfTCjv7jY58
-lD1CXnJryHXp1ZQAtvDXUrjlwTLvN3nDPcRbOoc924pzV0Rqed3Trojz0Z5whN2Jmqx2oDYe
-F/cffRafhdaPVyiOa0tx7Dl6OzSWFgo0QPH6dlFTWcIb41qiO8wHJ4Ir5JS4QGYzgDd6d3FR
-FqucY5Ym3Jz+TNZZraMRoJ2t8UR3e5H8rAJJ5EdxN5YovtrLzRzGhdSz4VbfAtGq4VFWNaeZ
-092b7xVi88F1mYd+RZnUMso4dYvmqg+UjvpaAvR36DMNy3d4tUSYyWTwLz8jvrCG/Jb3nhV1
-34ttbBpYJXPBhvAxrk1vKq+US1oZ5b0/s/578KH/nf+nwHGtsr8VWU3myNterXQzWp3OmtMi
-4dTD4ZhIg7ASuRn5FiltIeuUc9M+6D32arKJ4rCHRT3xRD6GVfDP6CNZhoJab7xUr4ZeKIdB
-JZoF/EJ+BYk4J8JKGmqgNUMd1FvoEy1F4kgF2g7fUBooY/Xxui/QTq8Y6EMf6P+ISWp15xR9
-aBTGXuQfWTnaku2IDnIeRZraw6LF7WzWLzZzCjpF+EtnG1jtxuCKrCD5T/RVZsJ5vpZQDRDR
-Wb/gnVOme0lkpcvABSdRLHAPiqpeHTnZzSyuOotYXu8aV0RpUA4kwW0QkveoNh2C58BRpBpP
-VC66U9U89lWlg6XR2dZp1NCoD4dFkkE0MgeMMDaB+xaFo5yC6I07mXaSUh9D5wSZr1VMz5hD
-oXmxmwIVYwxfOBinFwwUUeb4HqI4X5ycqu11zxNmDAOv0jqJEykDZGpKAnyQ1gunRK6S2dGJ
-MEP0trc9usoJWalOdXede9F77u53hT3U6W0OdRTjrnM22so1jP3uRbOQ19VsxevbzWECK6cs
-AsLXnz4OJqufQ/OV7TE7yfmYe+h+TBf0U+wDvD0mM64QWgHC/i3iinrf24uZq8CcooJcDdvL
-mnS1TFL3s/q0iJMT37c+4S52adrTrayq3q9qPyeCWzvX4VgXwfMulLk8P7/oDHHKmweMAdGl
-ZkoUO0OtJ948VhnWAAvxaXAAdoXbYQBXwPOpSQprtZR76gPci66SG/Bidgn+5E4FTT0AU8Ro
-WBN0hodAK9gGJsHfwCnUF17D1fBPZC3upmyi9bXn6kflBv1Ar+Ac2h9kpj4Pe0pD2Qq2cCu4
-3Y2N0UBkcuRydJXR1Dpi2fY4u4mbbJ11J1pfvbdOAZkgDsJCqDl+hSeQdWg96gxWgGSpoGvy
-MtqQfjQHGuVyNp0p7uI40QS3F/+gs7IBMeFbNQGN1lagFNUmJbQdSlGaXyuezvA5YVH/cL5G
-2+0cINksBX6OJICV0fGAWAfFv6ZfnHY6ivF8Cp/L54vboAuYTuvK8vQQP0vGsakk1Q3iv7xf
-6FH+Tr3OTyjF2Hta1FmHT1j35UsnUWbxHssR7jtJvfmogjcTP3R11JE1h2GxQDJo8U9EcoUe
-8Gah4VYI/BvpK4umNYQt00rhSun+MS9iyR+ip0U+6wUozVy6C5X1CSV7IFarEyyrR4JXfWdC
-YX+h2Dyh8bHTYk+GKsRW9b8IHFP6aYvRcHJRxKJRbg7U3iyM4yP58ajUaijl223QIuWRHJPW
-FIyLlJe/RP/2thpL3cPWF3e0o7pj3B+dtu5he77z3ALOFfOA3cLwu9fMmfy05wef+AMQZrPh
-v+wPNDjdyH8GyXpTesZvKPUDUKkQHEtFIA31DgyXRwPxYkcgj9jp3/l/lxMLCOdPURzsgX8k
-NfEKshD1psfBDGrzrfgqK4Kbsdl4mdcXt/Ii6IpzWja3rnn3zIZeXiszU6xPrL21Wsy1dorN
-Voi/sZazKrbgB92csK48SD4hRbVIN5XRY7SqshxPVTbAxkpL+ZX0FPPRI15SNvd6struAW+t
-14SVY5d5d95CFpIzZWU5TU6RpWA8XEWScEmts3JVDyqv9edY9+3DUN+EsqqrAVTWAwf/JoKg
-vhPLJhthO6+x0hpqP7Zes/p2gmjj7BW9XF3+6CZyy93HO6VzTBF5WxLwSC6UVeBEMQ71ku/J
-dNBAaS2fkXiB6QoeozxkD8gc1oK04yXpB/mK/Iwn4mqkMFyDO8pKZJtsQo/J3soNUSvdEksp
-19w+pIOVC78w9sMHZhCddMuQU+n3pcLsqASMpBPZGVgKzMUrYFsSwF3wZTISAmWNgPSsdw2P
-c2/hEc5uVMqqBfIZL0VydKrcZxSADUyAfkjvhludjKQGG4Y/sMmgCftRNGTn+HvucRUOZg1J
-fWchVSw/6Ru9jh6nDSCx0XvpKf+CD3mzQHsvlzjvzBSF3FwoJKYrf8DivgBJDHRRngeS1ITg
-fP1S6GPgdqhfqFnwfOiur3rwsPKTVhMvoAoMqJv4SvWNs1y5Yq4kTyLNYM9wWKxOC7MWqaO8
-smnXmBFx2DpjhDPJhGYu62jEtrJEy7mL7Zeenz3x/mPbvW48m5eBXfNueZtlbylRK3gK7wTV
-yT3wHZ0CEhQIb6gZ8SStO5qrZwMD/H1l4cBpccCfKEr6usj9qpD5FQ5sMgIeQR/BN3ADPpdl
-cFY5ASfLcfgDGIKOgjWgOtghr8udspysBbeITrggT0Uf3B/gQqcbqOsImcPZKaN2c1nPSRO3
-nbeiuVtS7vLOgo18EX4vetPlMhMF4BZqD0qBsXCXxHg0+AMvA2tRORmReVl+0c4dJMqy/uKr
-aMx/A/vYJZCbnxdXRCe+AHThxeEwNgwlsZbUE2G1Ehyv90ardQ63aPlgRa0/aqYuRb+TqbIN
-+sjbwkQBwGkxj58Vud0dPMXSWcCJeE/d5l4b77xble3kGr8IRjI/7Mweglk8FxwpjqObfCqF
-Xrwyzq5OyzoP6ABWSykGNEXFA+g8PAtPQNVQGzgU7gC9pA/VlVGSA96if8tBxPBMXNjpRkfZ
-/dXrznStOYuoisygtAF78LV0c9vKfoJJ7ACM8GqIywC6CGdCDUsQwX3Sv3VPPgANY42I4YaU
-pVZTmi1aHH8MN4L7oxwiqw6ebo2Bk63Z8ncLyL7WdX7E/pOnetdFTLo7ZYNn+QrY3v0X9jWn
-k1HWUTWfF6sNYH/RP7zcOM1pjKo5fXFHtxgd7K1Qq4rGekHUQgug5uoLsE5/gjcHq2lLYyr7
-jcBH/zJ1l74HP1Ifwb1qBLxQcsKJSliuVu54f5Kd1mLU2VBR1+gxOChaFVaK9padI0e9PpFK
-Ts9oot3LbGFndF85vfg9NkTcF3/zYnIOO82/Z3XYOr6HVZTdeG4wjk8Gq/g3eZLlBhVYNWyI
-TWoV/EAvTUdrn3ELqsOueJ8gpJFopHyQ19SOcEv6DpzHufkY2NvrBRvwjngedEhh0oGswFlQ
-Krgjz/EKchjvDX4Du+A6/CPaS/vAhooUzzDgD+E65sGKHKGyYgmaxvcizXsEaruTwF5vH9zD
-q6OwXIv7AExqimKoHSsFbW8i8PM5kgshu8hzIsLPuXtYZtvz7lpL2U2npWjN/xIXxO70HnqB
-PXMFG2HflrncRNIVnFdr0uPaP/Sx5idp2kx0VYekp2+IwrQ/aDflGdqKP0gFAv5Sdmb5ARRZ
-ABOl5U3xkI3k+ZxE74v5HQtbHeUa9yjsyPrDbuy0nMH88jCPyAriVPpOXyNNeWl1PmtON3iX
-wGSvlljACsrZIgn6gYqLg03ouZwO+oF2Yj2qLBfTb7CoOhllUMvBL1SVvUlnNoQwL1l5x8/o
-02Vz3wbZRh3GMZnjbcd5+e8kIjE14HpyGl1CVnrNfxQn+RehekNAZ2cXzmSvpA2MFDQgXEB+
-TlX4j2mp7HHkirxlLkIr7XcotzsdHXbbwFivNjjBz8Ff0xl0P/aRR/g1qIlyMQEHuttJMXZB
-KcwSlZHONlrZGkt+Mb+i+eYQ1Nr+B//pdVaOiHjtlKylaWC59hdc6ltHKwUP+3qFuoVIcFdo
-kD4lMJPk1MfIInQoW4nWsN1I5c1xinMS1oqWEo9Tqnt5UiwXh/Pza0ZGed5aJTrYLivqNORn
-3SDow9ehCeATikccNEmvxwayJnvAC/IO4oyYB3bKjMgVI+FiLycYazcGs53p6ASvRhFqrLTH
-kFaAudBkUU2OYNVkI9YPlZF3yW9gAKkuFqBV7BbozD2QKP9FQfQEd0Gr8SyYA3+Aa9CfqAo+
-S46QZWp9elq9Qy7TKrguvgCegdviHhiUXv9N2Rf0p/cVVvT2yqxeJzHPWyezss5wFB+Op8hr
-tDaoRZvJzSiRS1CF1Qfn2QF5hT/jWXlrF3hHrFLORzOnk8W67ba141gx57g30pZuN6uol9tq
-zhV3A+wI2irj6AA9qOb3Keo1/YXSyjdHjQkM0nsFE32LAsu13votvIIG5CNUkGeAUXZWWmy8
-eMF7sus84nz2qtmTvHzWXRawhvEJ9ki+31VEcfZJTPDyyk1OF/nQ2QEDrBjJwJfiH9hSOMF9
-K3c4T8V+7waIkVnJRtiAHsGryVsyEF2jw2F/9SS+pvYgQ5XDsBEtL6uRNWw9/uQ2II5nkhns
-Il3JQup73lwtJ2LVi2KL8gfwUQbO4WvpVP4ZTEULZAJYKA/wfuiI+wTntEejISYGlY2G/EUk
-l1cz/NytkdaKr0pbCXpG/oOZzePwuH0cZvRaoCO8HvkKbirf8E7lND2Hc6b7xkI6i7eh7bxX
-NJNXTKnuraVBNz8tbvvpT1ZXssp+gTd7Lj7G2pPxXhrdziprd8BfekHaw3dc+0Mf4JuvbtD7
-0BKaRr5XR6Nj6eZalJ5nZZT87nua3ZmNi9sOOG1mkOXM0eJn8x9x3AzJsnYL+ZfTQtZ3R/Go
-W5vNZtd4RnFd/CEHiHfgHS8GZ/CacK54DdpLPygjesnXrKfI4X3llx0vvcMWws/BAjIYNcJ1
-4T1QSZQFO9hqeJ5nQMN5fTiB/SFXsBt8nfeer/Hyyz28jcwoe4IacAr6hC/j4eQ83U+baBfU
-BN1Vp+i1tZDeRJulfq9E6HJcjEThUdgOLpQOfMnroSzsIKjk7RLdvCN8vxcQy9hROZI/hy14
-YVyKLUYv3SC8484A/3ljQDO2SzruGu5zsnjS+maPsv82T7gxZmV2zezh3bKGuGn2FXe3w1hh
-7yQIyJv4EJpGfyBH1MbKLN8KbUTAp70JzlN/CY3RXgTyaP19U5SFagLuQPfIraSDXIoHg6Kw
-llwqtnHE1rAZDvCm2Rk91Yky6aTxmW5xEe+U5a7ZyuPmIS+rfZk/tcvLac4okORUgl2dtrCw
-eweu8G6nW2NF1B0OJSHs0YuY0Qk0VtmrZlDy6Xvp9/pUckslqJMyXY6lg7lOe3pVlINede0I
-r6id4gGlHSuGVa8u7O4OgIC9Q4tkQdILjcHJKBbehy6/Iod5T/g6N1Fcc/bI1pZftIru81qF
-b3k90q7wAWk5wcnwSdgv+h7uNNvhZOcrXcyXKWVQB7UePaYiWotcwudlIdyPM9SC9cc92HaS
-i7+lZdlQ5V+3C9Xcu+iY1QXtN1+T8k5E6cZ2KP1EMhkti5GlYCS9jM4q2eh09U8loAn1ndJF
-u4+7qifBUzpAuDjAP6NO3hr0n9UPLDGqCWDWkg/Nf+Apu0J6Ff5BmvAcaA/rKX3M5o9Zfn4c
-jBI/kOdyAe4oaqAS/CU8wpPAYF5YdmVnRYo3RqR6f/ODXlMWdf9H0VkGt5FsYfQ2zUiyHWZm
-3DBsstkwMzMzM3M2nGyYmZmZmZmZmTZsSzM9TW/eD1epynJZ0933+84pqTQvvJ3eFblQDoXM
-5hc6aKahfboyjFCLdIzKpeJkc7lIdpLXxTb5zmsgN4nFYq2arMbDFXyH/meNtU/b+e22VtBK
-wrawTiyDNdG6aiUItLRHB3vZOmBbTawMZD7dhsZShA+RL5AZFzMjzBY1UM6SjURi/Y+f93d5
-ctRXaNxK2bSYeoZDcgna670yPflcmY0v4OvdHZFmTrG4SCRt+H6kvpPOaeY25Ff5T9FOFFRf
-xAl1URY21U1N4uL3gUoWjp5n14r+bZeNThi8FbUzWCKqcvB81KtA8+ivdkxUNzbPbof+Iq9k
-Pmjr3dOdvBx+PqcXP3l/nsxL56YSZ5wdapej9WanuirkvhH53DSynHNC1nB669J8MhQQ6WGr
-HGe+qEmopPqFF4sv//8eHdoK1tjl2V4/tZsFjrNPLJaepP2tvfRYYDdJHTqCOkZFoz5RXSBd
-sI7ewpqJyiQRz0z68RqkvZiJ90rAq9VUPNUkJrVQFXwFSqEvOj2MVK9UAlXTSy7rOhc8FXHE
-wUg9NTcuizz3u5Po/jukWOxpMzTuPOrlRLAWBVlZaBqojSoG/zMDAnlhge/ZCQPfaEOrvVWU
-zrQ6Q8gC1ZftEmnpJjclyRsnSHRsW5o2vMTv9zpooMiO4+Q8Ek8fJbkMJtnNRZwVhpPx5BXd
-Zd1iR+22LM6aQz5RgvKQptrBD2VHWkitt77JudYWcZ1y7wmRvAcuzhMgzTfDBhlrzpoSpiQI
-XUU31/VUW7XElFV5SXPl0EaqH32vvuOmeirKqQ+bjrK0WevtgoGCm5eysJqqCos8+rsH5ru4
-pe+JvHK1N4dn9hi/yBFPyD+4ybzEXiY1W84ySc1l2Iayo5L0BUpsvyJbg6/pyWANdjzQyJ4T
-6BNsGogfemEfDy618gW70+RBjpMF8+PW9mZ4Qo+bf0l8OINSmGN6u7wh74gRMlrnlxyWiTsI
-yctol2qI/9Kz0AwRMondP1TpiBL3w2e9QpGTvHWkm+tEKrut3M18qnuZC8fi0d5Pnka3l+Ph
-sf6JuqNn5DFZzFqwPvZSljK4gkZFtWEJYwoFysYEgrWiL1k8ajDpHT0PzYu6BZ/tD+YDJnBd
-34Jsqj0slM30PLFRPuU5ZT5nmkgRXuBNiyvFV4XTuauda84td527xh0oFjuf9CDnKVrsjiLb
-vN8km37DhsO9wFToENoLH4MC7bH70nNsr92ABUJJ2OTQS9ojVJklDbUhR4Oj9IngJO+X/bc7
-jVZyKuKzTmVUyj2ElvEMJJ4sQ/zUw2EDeDS5byaQcupfWC0H6YayqprtnZLDnUryRByIb3GF
-RC5nhrrnFDfpndaQ1BmE70UWk2uRruRftymJiJr0rGlvjUNZ7ZY4vZWATWGFA23Y+aBDHge3
-Q/bgRDXHfil6sxNeAfLR3Y/yO8Xwfec/1J8vNXe8LHqSdJSSbc1UOQW3UKnYHXOZtsLN8UzS
-EjIRDCXwDfSc/EGmWZXQEau2zmd1kJrNEP1Yc1GCLRd/sfWyATuqbCuoD7LU+sv/39mBk7iG
-aUNmyh6Y8zmoprsB9XG+4mtuWZLWi6Aa3jTYKVKZPmqZGqYDqiy4Mg6Vl8vQCDHW3PPTcSKf
-zA+6690r/LqbR27jf+heYp0aI496nvzHfaXK8rd6mJwOCUxBvMikIS+hKOtJswb6Bj4Hp0Y9
-Da2MaRoVL97okIyeE3gVNdjaFVJkor9j2QL/QhSrqE+i4b6TTZWJTDcVqwbr16o69NAd8E1Z
-AE/hj80dJ71e6r5Rz3lFVYq/9jY7xXnGiHZjwl3d2eEm7rfI3zzihsRBL4Oq4b1UI3lQj/BK
-mwlqKiqMypNb5D65zMrTEoFlNEFUcpY95hibFa+/VT/+EOtHzHkCURZMCSQ3tr0OUrKqKDEu
-DV1MVXNYdtN+V6top60kzk9xxu0oL/NtYrc7l7+PzHNjw4PdsZGCvKl7W2zz3ujPYh/8K06h
-tGIqfiUwPaYP29Nxy6iLNHf0YbYmqpR1LLTcahZcZFe1hwY80iVwBRIHGuqWgdEyfrCDbBm8
-I/35lR/tiEjMToiseKnE0Fzf1Qf0Jp+FF2umTqgU4qy46x7kf/PufIlo4H2U1bwDkvIxcruz
-SdWJDDBVwuWgUDgaJoZLwrzIUvzD6cq686rWQ5nIXoSuB+qzjcGflhUoZF+kzezL6Jhd3VQI
-pFW37TbiofXF28BKe7vwJue9UZEeJsZbCovVK6T1DVRf10TVdXbU3+yHeFDVlDZ59RvVxyBd
-HA01T1Ab9B1V8C35E+XQyQIAe6EuZVdUP+1aMn9gi6hunxUhq6D6h/XW0fSwPgiLTU/9ASUy
-G2nYxLEyuralRDlrvLeZZuF+d3CM6kjHnNUHzTaTw39uW986QrKF3iESQhGvv87obvAeOUnc
-pW4zZ547xFFOBve8k5gPcWO8anyCl4nP9u7zyqqMvI/BbLFq45SBPax9MFdgdahN8HrocrBA
-qEjU5mDWmCKBPjFr6KWoHyZRCPTsYAgaBePjvIEEuAPbDSPwY7MTQiib2YF/qfFkk6xN7nst
-0T73udrpvBVv3I+ymadVOjFXXfRyirFcuyvcLbyHk8erHDnL20f6eGedo+KQW0BmcJ+JpW5R
-NV/chDVwjkZbH6yiwSHWqNBJeinUHb8ONUVnolLgk9Ft8broF+hWKDvy7CtQgZ1GbUh38gxd
-IhRe4HWqLlrvvdcz3ORqlDNUuOF1bqW4L+FSsQ9jA3EPYudERjtJeC65wjuk54rXZqdsjH6p
-oiSpGcQ+me82Q0tDKcn56KasX/Qh605wk93VvhnYz7IHKUkcXAUNgpNNnWA+vS24XBULDlaf
-rfzyT1pXPEf/iMZwRfxnPsuO8Nnkhqtok74LXdQ8fVqeFqnUNa+umiiGyGdijrgnbS+kPjlV
-RCRc1Fsft15Ex43Qy2OzoAWxa3CK8FeSniM7j8LBwWZeoCJ6bR/BG9g/9A1uZP2F3tkMpgT3
-m8yhWeZ2cLDeHtgqK9ubRGprvahPM8rleKX6Ah11FtNIvVG/vLnyrnNOrI1cl4n4Y+3IABQ2
-L2CP2YLumltoB9xDhPyNZjNhUtnr9GI7LHGgiygbbCJ+h67I21GZdYPQSLPKNtCcfUC78Ao8
-wBQmfeVu8ox/JM+dTqSKsx4r5y98nefFXKbCfUxxfBaW4Dz4M56JHdQJFTd/wjTJdV5vkEzr
-rubI+R1ZELkdXhKZ7AQjbd074eTuk8h2t7h7jcfnXeQut6+ZwaPx3zIPPaTr0feoLc1k5bEh
-1CeUMHpF6Eb0jkCjmAfsd8xAcjHePPItnkeyx/uPXIm6TvbYGt0jQUiNXplN5hkU1FE4SgZJ
-EW8ArsarwHjeRQ/ho2Utvkr85kXkXO+WiC/+86Z41b3svJ2X2vX8TlunVkQK60iknE7i3tI5
-vCYwTu3H8VFnmpksIUPITOhLxipJ28pTtieThDroOlEbzJWoQ7A4KgpvCL3BN4OCNA8MY9VZ
-E/YXGkqw2on+8t7BUrclDIrEmIxxXPSKXe++iCvu/Omsiwjez6HyC88vW4hCYo0o59WVpbw+
-qpS4ZS6p/fQjrAv2JrHR1dnXmIXsbKiPNdt+F5hjvQr9zQ5HvSTpot6i5KFx5kIgmf5kpVGj
-2HeZkU5WR/FhlQ9VU2fNftXZlDEPTTL03ixAH1VhfcZrwA+4ByMD3V+R+fwCTypuywayvO4g
-n+g8wtUzeQqzxz0BTXwquMdvkJXcJZP5IjqQC1rbO8hGyeeMms40CXqCduLqphrtq3tazcy7
-QBC6hUJmYWipvB+87L2we4oEvq8VJEPNKnwDYvBXUwayqrmyjveAt+TzvNneZNVH7oI+agxq
-I9NBbdFLXxZ5VTo1UNkwTM8gOc0Sq4ApFByio6IK6H+j25pHMQ9QqngdycCo5GS89cBvqS5Q
-2WQBrhaioqo1HSazWPnFNjbY+0wzy8P0tm7PfkItVh1GkZWqLfpPNtBZlCVSq0F8gdrEq6hT
-vKko6N5x20WqOxPDo5xkkUb8jnPHu+2O9eq5X/j1SEHvUHidPBuJRoqfpsn1YqsDamfVJ38y
-j05iC+yp1pXQO9Y2Zj5ZEq8WLIp3Ru+KeQs5o6eSfVE7Wefoofb7qLGWCjSip+lX8hBtolfg
-b4YgNz2uj0IZ2Usxt53IGZfJmxxbQawKR6l//BzVPFaU49+8kHvU2xx5InZHNqq2vK9P0Gcg
-r06INqtU0E7+A6mVhRea+agGzmBOk8XiPt3j1bRiVXTgb3Q8VAdPjDmHtsYLQ0z0c3hkZcEu
-jk/zoBE0K9zHGfRqw8RslcBNpheEi+nVccVl18hyfpqfcYxXOJKSi/DwyGJ3Wvia3OXsh3Ji
-Hn6kd5HKmNpAM0Y1plExq1jG6HmBvMGLobSsfrAdas1mmRF4g1mMK0M2dswct4vqFYFuumwg
-BbpgVSTvaTFyle5Fn5hrBrPsJgaf0B1UBrOCTzOjHVc+ctrzLHyOE8tLO7m8sW5HrnhzPsP7
-4Z0Xh+Qc/U1mRYlFSUL4YDbA7WvF975ak+Qvq7v+zGqYgeyp7k9P6OWoL2zRM8lhuc93scVs
-t/hA62igLSEjPQSHWXHzyuqrwK6mv9E2Ji/ieq2epZ7oGDEYqnJtUrs9VFtnukjAN4kewlJP
-xCw/1VtCE4iPmtO65pLVXJWxM+oa9mCEg6noqtA5Ei9qFJoaVdKMCFG90eqlE+E55k/9zGSR
-201Wecg0l31RZvWC5Tb3g1PhbfA2PLTOwnRSGU1HI7CFVuHJCOECuBpOiLKhaN97B/H5bio+
-MDLGsyLPvH8jvgNEmoR/RXb9budu/PUPv/g7mZgSrq1fuAtwQe8TXeXdo1nVeXIEtqIwOWM2
-sM66opVEF7QHGmn/A6WDR+BnVGncJH4P9jVBDrtt/CXW3OhS1s7QQmtIKJ6NQ3Ot0XaQ/cA7
-SXfVEu/hK+G0e17X4ovVGK5kP3erLO1cks8jA+Q95085jIMa6mnfslNhzH+RiU41ksAtha95
-H1B3VQ69V23NcFVRNtUN+Sg44eQmcZG/rEdOdLCPSBmKMlcDL2GQvRz/tNfQJ4F/rAOBQ/YU
-i1h9SVJ/VeqjiOY6Vk5Wtuyhqni7xc7IBHfD7y1x+X+d+v3sd7pw4XBd92xkrVfLram7e5vR
-TJme3Dal2GCaMjAuUC3qdnBazFU7YdQuNsVaws6SbVZXfN5eisP2GfzYPo9q2tegj1UFulrZ
-4KO1GxyrJcrAFkJWvMxEwX4zS+80S1V3U0a91H1lRpXGO8VnOz0iXyOxcb+dTuFzvLLb39sr
-/uSL1Cx3rknJR6EyXhHSTVaymuj1gWHmWaAHPLQzw0bKYAhKi99DdRKCUai8z7Ot1SR1Uz3U
-JWE5SoMT0PHoHUuDIqwZLKHNdBrWXxeyP5rddhtYwFpBDzRFn1Z9xAvxzWXiWWStWBSZJc85
-3WQZd7Jg7mdvpptYlvct+o4phB7TW2hNYB36HLqIikQHcfnogmRvVEc6MFSIOnZe3JB+1y9g
-k+pmapj7+iPqoneQZXo4Oasb46xmN0oNuXFxvJDsocC6sgZM0cN+A5ZBZeEPSKgT++nTB9WU
-lhnkbfAWuZ/Dc8JVYzfG7YudFbHDz91VYUcsiYtSv2KXCC9yUu4TQ818HQ/lMfdRTd0E9vgE
-n0gPlwFTR/ZCp1QnqnUsS6U/Wq66HXhhWPQ9fMA/m98TjgymTfgkdDwmRdSEYMrgIyu5fc5a
-YTe2RtmPyANWHnqT42KuLuIe4ked604HXp4P9nqoD+4vUzly1RyOo1A+nAe9cS+Q8uqIlUH/
-ZDfEFNzF2wiFxUU9UyX1Z7q+twAV562QzbPAMX8XtZsX15InWWfzrx0P6tpXTCHrmg5a530u
-F9DMOkW6WcNZO1aEFcddcGr1n4p2b/MEkW5u30hF3i8ccZfHLncex7533obH8WduPzlPdITR
-6huJBy3s1cgNTEbtA0fIp+A8+0tU5mDVYJ2A37FWGbjCFpnv1jfIG9CoQrAv/h3Mh/MFrsFe
-mha64DZoJh5EmtACPhcOpaPRM7igH6v5qrDcLXd4Q+Uzfkl47jJezakSuRJXMXZxbK/YaOdD
-OIWMc1boXHyvyeMdhbuiAi6qH9MVKHdgHysZ2m2fDZRh3eh82Apl9UeTwtRHCdBRPAGnwC9w
-ekiE1+piUEIlhPcqN/n/t/TvJO2seuQruYCSo4nwFBKhG6gzdEXL5Hlz3c2kToc7eBNjb/Oc
-cffFyshBPYJXhM7yiK6lUspRfsM/xpVVV+uYuWSvxEUC60h/qyVeQQ/AIFoapWZp6ClrLmti
-laZZfM/fq/ebHXqp+QF/oL3kEb5GG1BONtLLOD/xnQSXIf3pFaugPT9Q3L7CHpErvkvlU6VV
-JRkrLggQ9bw73ll3Bt8SuR3JFr4W1y+SMgy+Ox9ShzxtMslckEnc1ut5If0Pl3qm19l0kcd1
-RZVDNpFp3BsiHK6rujnV0XaR1zoMSwNFSbvAY/wzYNPOoUPWwVB6+0zUcXtyTMfgu+jkgQmh
-+4wEztFkVj7SgRXEyelKFIX6mXvqvVojGpmk3id02t1DxrvzaTc+iHJX4Q2R6xDtlEfvxV66
-3TRme0xJHFbfdD/RQnTko90hfKr7VBh+XWf3xkE074tWuGPwNb6R5ldx9k+0PPgfKeiflyoW
-QpXYcpyVHMMHYBEaD+VRXiine6kb/umMiryO1I+MDE91voS38U5OUI5y68v7/hUO4411lNiO
-B+oM1ihSMTjNqhlqy9La3cgIupSWse5bq+0udj7rvP03e2i3oMusXXg2m4sXsr5kOZuOld+p
-u8gJ/RkR3RqvMldYZZLETke30HFoOzqi++vb4pzXk1dwN/HOziqfZea7BcLBMI47EjcyLqN7
-PXJUbuQZUT25h3TTT3El8xt6mSyohxmH28AQOhgfZ/fwMtwWjVSX4LeYhobrgmQddulWdp8t
-s6qyrWwAqUbao2n4OSynI/BlVoTuplfIJvwdfukjKpMIywreE1XNm6dL81N6oFNaPY0r5U2K
-nei2Dnf0iJdSD9MrzFJ9X2dTw3V7E2cKkoV4KMvIctix1g/7gNXK0iQLTYnmk2smDQWYT5rB
-b5hpbP2P3uK3Qyk4bxBpCM/IJHyCNmUH2EWGWSrfBK7RSfZjWj3wJ9vNCtN5EIVcUU3F8YZi
-vCdFSuXI8/qirK6ai9sedpNzFffFXR1ZJoPiJUyRDUx+kVzc4I14A56Il/KwV0J+ECd1WlkJ
-vvHixnKXqOl8l/qu+hoLn0RjSVvSHk+nI9B+thBr6zgtGGxi14jOHuoWb25obcx0669QVnSA
-Ndfj8G3dAt+G7zg1KoYe629qo2osjGnjvSYzRTv7lo4JjYXMwWm6Nusqm9DCMpf1WWb6/70I
-yRV5Sa8R3cVa7w2v7q3iM733fKSI423VNl5OI/5ZjnOfy2XeDFhrZtLO+AsrA5JtUJ3Zc1mY
-plHXySfdgzaCV/SnTkh6iBz6mnPT/SfSKxJxRzrn5Rb3oLLd/LKXc0ncdEqpLT6HPFHvWAKS
-LiSsziHHnmzPs+qz46y2dcx6GxhurwrutLrYRVkj2oz8hyehs+QZZGYl8RN/D1NZ/a20NC/7
-bEaSYWorrqgFXmL+IKV0btzcKwxDI73lwtjW7ujYFk4JZ6v7ypvNlXfU7cZPRh7wmpEqqqXb
-AI3wnuC7YhvqoCrBS30ZENzAr2ExuYPzkppWftLcvoAqswqwnMTD7fBQ2goVZk1RPtYM1aL7
-4CtuaAbhQzoVvQjPrcr0jH3QOsJyW7lQVzxV5DAVeXXd0lOSu65IHZkkT4Z/eoXCD53S4ZXO
-WD7Aa6q5OmSWmVf6iFmtG4MN6dB8fBy3ZONZLzbeXojj7IFoDyuL+6OxOCu8JqlwDTYfI1IF
-pYX75iYk8mdrgmpHq5nS1mDc0a7JJIswjyRn2ehecp6sxl9RcjIVzcb3TBGYLGuY9OqknmL+
-lNPMQT5PD3CF/NdJJYo4Q4VxTqkrvot8F6v0YjVHPNSadzfxxV3dW95RfVQOVVlOUTvdiDoW
-eS/KOQP5LF7HG6z/VR/xYxhMWpBe+DVrSMoHCrKWgZ4sl92M7rYTkTbBCehNsC0cCSyGPPYm
-9Mq6iFPaM0lnlofMxEXwPViP95tbNIFuZfWWM9lB+ZBW1CPZbZWMFZRJWX552sqqqPVDtcYj
-9BzTTN/xfXOFWMSLez+c+t4ady+f5I10J8uVfIr6Wx5XI1VKk0enQ411NbxN9qTjZFb7on5m
-DdKZ6UqxAR3hCWGWu16ndgfKDbyxl0O+cHOrhG5alZEvVZ43VWWUD1UqfQ71h8PWL9Q68IUO
-DMwMVA3MDkTZqyxtf2bpoyK0RWgE+chc3I50JfH89d7KZuGd1gw4zdaZgngxXNdB/FBlxs3V
-S/RJZiY91BA6WhrfwP8gNXkxvNd7rhd4q71v/L7bzXvlNvHPZ1vf0hbxGZG9onQkna7rTDOj
-fHMpKW+blCYXFEZt0VlUFN9BffEHHEFj6WBIwq6YWXQDkuQlLU/+skP4oL3Gf903zFWW25/Q
-HCi5lQuvpi1IWtyY7jbH/XnJ7zfTOb1aXPOtOU7m4FfEfaeBmOtcE+vd3j5vZpdc3vSeyqLe
-SjlZVJajVFp52ZTXHq6DO7EHlFl/0P9YJXyGDUdb2UKUi6XFA8kD/BkOoAV6rMmjLpto9RpF
-6/eknxnFzsAHegodxivwWJyaNqS92VrWnPVnC+kmYtGDsIrM1pnJAR2F54E2ifAr2Q+14WkM
-OOdkrcgycSiyX+R3J8kmXil1UyyU7eVJb588xQupT14/PUxNMbd1F7NGXdAPRF49RFA9WDE9
-A7jsjErJVLBKPdNLTCU1G12R2ekfZjJbC/3ZYvOVfdOjfaq/YEXp2fY6kzrQE92zDb5nBRiw
-RX7rEbYP92WpyWgLk0dWUvSNbdKGflNgvdM37b0wJ5AXBwL7/VxYaULotvylSvBK4kQknnc2
-8qf8FZmjMkUO+8TUQRTmndVGsVpdlmPkFRXlc/IhryB8cVPi+Hw2LeiVsCxx1Cood7IlMozX
-i10AMiF46qfOpMv5/bCW5/KSu594One6t95rp/7TA/AxXM5PzB32AmtLgFibA4ZGBVqwxsEP
-bHUoC5sW/E4qB5KS8fYpvMOKT3LaMWSvvR0NYxdNa3RPn1OVDMj1cEokxc3EM3zZG4RLe38g
-zIfAZ7crXPLJ6aD4oLaLDGqZfCTyqnL8lCzgxMrKzh2FeW390quuG8sx2m9xfUmV11p11pnN
-NjPF3NUP9ANZ26TQR2Ewio+/0UXkdeAH6Rrqi4OB8egZq4I3szVkGbtEB/rNythUKzHZYp2H
-bawFfCQtfH8qoUvDG9EbjnnVTDW3vAyHv/Mezk7nPG8djuU/wtu9S2472Ut0ULk0N1shN12N
-JrJ96BXJgZPjauSUGUUnKIdO1pvoGrSF/EmG+w68C2Wm8eE67qEqwnYZBXV1BRSCd/AT3YQO
-9IzPQQlpSfaThGkfEsVOoSiWFgbTDOgIjiJ/ACYv1X3UUR6GwSLaTPImqrX8purGV2rDB+qP
-XlU9X0xSieUJ8VYuFjPVZNlIvRaOHCt+yPJyuoyWAdlTPhR79SyRBh6J/ea4cnQd6K1b4rM6
-O90Fndh3nICtxploMzOVtpErWSvxk/UWHazeaoN9G7QdH0+3dqJd9ChuT+rRf3AHlhLvtwwa
-aB9EM/2ErRJAeEvgN0KBHaid/S9qZvWDCXSzLk6WqSF4uVyCOnkDYZiTQC8Ou16GSGc+16nI
-ZznbeE3nnnfOHSOa+hxTU//FvwLwBPg2r4JveB9wBnGRWMKi9bympCevg897dVFRVQgKqMQm
-s7yn/hMPZAK5SC3Up8xt3ARNptXwcpqEuHQauUyT0h+sMT0f2ExuBhOQZMEYMi+wBAs7gi7b
-jXGqYFEyI5SUTA+W8/t9k59yd2GiTgC95FhwxZ+oo0iExvCfcMFV8JjvhK3eMjgplkMT1djs
-k8sk9SbzhLyA08k7FomSz90T6qlornOo4qqsaqmOq6zmpTrrJ8Arw9Rvk80/pzeUrQaahPo9
-BFF3dJMeQK3teWiS3QmNsIbjsozSjnQmLU5X0cr0Lf1NarGK2GE9YaWVB22zJuDHLDcqTY9r
-hHfLkSaeWKiaiWpynJzgZZJf3a3isPtBlOM9xAivqb/vh81sFY36q1YmWvfT6U0uvRQuqFSk
-vzlN5+GcdC2d7HvQK8hORpk66L6+DTlMDHpszsA7M9WkgJpmOnoLzcgN1IBFcD17Efvbbs3m
-smJ4Cu0HC8lfsAhPQWGUg+SAf1F3tVu/EMdVKpldN1EE1qtL6KlohCZwy2C3vPjhOO4K3sJb
-LYrI9Gq2qqHzmCx6uCmkzpjiqqHPZW/NNX0Itpq/UGJTTlv6s7A1lXd1KfkUaqs8pIBeS/Ko
-TWSZvEsnq2/sq95o9YdEdim02HoNaaxq0NPage5YNazRVi3fPQaFLJoqOA3ftVqiXuQJisWv
-cSlWGbusIrrN2kIa9ocmOE7khnNeA1SNZ0F3nGMmq1PZnImEVc8IyKqR2SKfs05W5dP81soi
-y8rxvJlK5FJdw7lvfjuVcUleEQ90uqMbYYrHO0PxT5eSieIpWQQ78VY0Gu7pNWajWm+06gkV
-zHv0Anm4Nd1OhlvJ6GWb0pf2JVI10JDUD+YlJ4M7CQRnklX2e9zZDuNegesYBfahvmwGXMUV
-zGRIrePp3vqX38wp/JU6o+eDlv3MBV5Qp3Z66qdOIVgvVqAKOi3CJokBc0omUynFXS+xyCXa
-ykQqu4rRq2U11UDcEx6fIH7wrhILLnuKm3KwSKC+iSr6uMwNN3QT0gQJqwPuEXiCj9rZCLUG
-4t9kKH5A/iOIZWDN/cnaipdbLuy1nuh/rBlqp3VBLbDHmx/+fqxkBOaiM+qVqqqOeOukcQvI
-f/kOdcxLaa56s0w875zJ6B0xS0R6KKWKAdJKZ9Y59QH9UNeGC2YwQjAUZYbrKIg+ovVoDByH
-RGaVmeOz2Dx9zZTz8/6WKWNW+8yVCWYohhuYFvQtamNNIins0WwLW85G+f7yJ7kP0+kLdIvm
-xR3JXtwRGUxMYbRI3tNh77hE3kvRlC+QX9xusp+7UQTd1uKdO1+UFL31G1kXIXUAGqkF8F1V
-RV9UfSiiZ8ELfROe6dZ6kl4i1+lacpRpLbOj3SorWa6nUUdNp0vkJrLTy0YO8EbknXeYXlKd
-7A3oU6AEXWTnZW/pTMvFFezepK+ViiWxTtLPbAFOxQoixJKgsewcmszK+Y2Qw7fwTmYX2a/n
-4jraIqnVeXxT9EBHPQIr3TxqYHgYLxkb59SKjcdPh8uL3fyVbC2LyGRyJBdeXWeCOOmcVQ14
-E7TR685+yO72WD3AqqNcml8Ooa4oRieIPaSIXIUDqjwaqObBWVMSMuGv5jLeAj3JHvSJFES9
-qDEZrcVwIrCVfIyaa92J3mBlDm2lW+z2OKGVGPWhMfgS1SQtG0NLkH6kGNoHQ3UKFefNEb94
-LXnZm6xai5CpJj+ZYmqCua6ampd6q7+Xa02c9h+pV3K13OFZsorXVQ4VBdRmuV5uk8YbKHJ6
-rbw/RSVvusomZpmUajckNk9hoZlnLutderZ6aiaoX+ijKUav4XZ+ezaht0h/koW8xt9xYXSf
-foUNdgw+EjiIAoFUyLKXozPWKNzQrk7W2F/xaIuhZSSPiYbTOqcqYoh4oCt7o7UtDuoI7y+3
-RJbxBmFbjIpMVevdlLqNnOUzRk00yVhopP4JM/Uw33AOkBL4FQnRtWQo+Y4GoZ/6m3mtpOmu
-k6B3ah/aorahiRqjX3qTGWNOmN0wHW9HG1hufNNqgn+z+/gamUJq4eS0Fu5NBZL4DrSDg6ae
-8fy+uOKTckikVod9008sf4kz3gEvlbvdWxkZK1O51cx4keD/dxPEq6AqnmueQQsldEu5UI1T
-LdQLs0UNR1lVZVRGHTX59F5dVleEefoGiWfWWpv0arueyWafhqrWKlTdiiFLrDVEsbfoLt0M
-l8k5dAfPJZl9/2yLe9Kk5Alpim/515sbd1Pz8Tq5mbTTZ9gCFBV4jI1dFVWwrujU7IcYR9rz
-WLPFrS3b8ofeBz7XK8bbeMecZt7jSFGe0CFOBndz+DgvFP5L1I5c9lOhiG8aT9Eo9ZQk1JLO
-V1tobdWSfFMC79W/yFGzknY1r8lO9QTVVF3NFdVTVzPHTXyyE6WwBpHfdj3WLbSbvQmlo/WC
-J3HXwB4csC+Q6qw4S8mWsX/ZDDqA3cDNaBn0G7WDgGlr5kiid4rx6qAEnVwX9BNFQVDvRPFV
-V8iuJugWuoZKbUao/Xq87qNW6mOivaL+eRTun7w6X+HU9o47S0Q//kHlFEVhrMiGbHEOvfXa
-4BPC30E1H02Ar+gEeo2eowA+jTh+i0bhJTg5jCdUXyVFVHL/eqrjX7o6uWwyWw1hY+AmjAo2
-QZcD8UhX+xttZ7VjC9k7Opl+xRlIBtgEG/V12UBV4VpkdRvKvnyxjC86yedeGpWU51WPnPxq
-nPtb9/JGwThZA43Qz/FbU5lmhBH0p3lBusBD3A8VQo2wp9vg2yofSuqnaGb9wzTUldAXXRJv
-0CcxMlV9bw/RHvQqy2sZ3zrnBlKwZHZpXJw+Ne8huX6rN8uuuoF8o4ZJV+4QG0ScN5FPE/Wd
-XTJvZK7CTiY9k9/VTcUH00Lchr5iJaosj6J+KpG/8o11xFxVA/yV/aA/qzymuf5lXPkCjgoL
-pZLl4LXsB2HdGffAn+kM+od9mVYNBGlGu6RPKc+hLrmA6pBO5AY9RM5YmUka+yqaw1pCUVIV
-NkJ6n1Y2mPRQBTVB3Uk2P7fumwzWCT3OLmNW2FtgtL0AHrFnOju5Kzui6X4PbXbfiyRuOf7a
-ee5EOU3dm+G3bttwfbeHE+LDRGMv2iz0tsNDLwtU9nbqjXyJPif+hiH6Bc5iLrO7urvlqFlk
-ut+WtcUxnVe81iPlDJNNN4RVgP7/SVaU1b4CfwbeocnBt+RLsAy7E1zPLoUysZqhH3SS3cE6
-So/YOfEDKyP0oAcNw/nhOiyEMMTAeJRb30dHZTJ0Q97Rq9UxmdF0leNhs9oHN0w1SIBu6OMm
-hXwuR3jjvUv8ET/nJhI1eB8ZI86LZPI1b6A+ud90at4RzvP/0EHvD3xLlMfz5VXyRj4lj1R3
-/M08RxrGwl+Q12/TWHPbnDSTfDPJQCr616aVsAupFAGim9s7zBirF9pgXyYdQn9YK6Oa22lC
-Daz09jXylKRDB0CoI3qemOjPSUSVl/3ELVHNjS/3hrn4ENdc7I/0V8dcAY14N9zJq0oeybH0
-molHz/tuc5q2JZXoSTLTN53phqCB8NsUwJVNAvxWNYM+Mou+JH7KhrKudnUXlAAvo9eJtBay
-39Y06wxdTWuSMng1iUHD6Evzm4Z1E5pcv0YrZTF9RuwSj8R2wUUfWUO2EJXVHbei7uBU1R3c
-DPq+l8/0l/UgvhwKQbEfnns/4Z5IDk30TF0DfZP3UHsxwizzDslUwrdjGdEf9DdcDHVmxYhl
-naC3aRGmcX46nyjc2RqK2wYOoyKB5CiflRZJMg4GkEFmKmlvLmDXtEcToaz5AT9lYdReHkPd
-NCUeasFG0/V2mAQDGC+2R6ET9gJ81VpNlN9ep+GA2aPiCc/rHDnuHovFzo64GZGdzgXnD16F
-l3c78NrObTed24dX9254mVRD+Tfs0LmwZ0J+Zm5BddR+/F1G0aES0buyOW6lL5sEZqGi+pXU
-0m9TvURPQclNTfa3uW5Xg+OBkiR9cL29Ofg5VCxYMfTVemC1oalpXlKJjPXbbRvqwzaiblZJ
-3JQ1wxdxUjwKvoNjbugTsE1lRXFqF0zXz01880JX1/8pLGepoR7TSzysI94X0dfLxkfz+u4w
-HsM3eeP4LJ+3uB7tEBSOtMPj3FWkiuhJu2hgB6ANywPx6RzVHLWWzGTQi1UJNEv9RcbrDuSa
-/oyNb5PnZAv8pxxPpqmFLBVQuzyub68geexhdLP9mMYFStGBweRkUeA5LmJ/wO9owDe7Z2qJ
-uS1G6IVik4wvC3EjkodriZSxZcWTuJ1yhntU3xKLYIeqhKN0BG9TDfF2ZdAZHUNOwEmqUTs2
-AB3wk+YqXDY/dS6IZ1Ki8vAZPYEReA+8xgfgKG4F8Ul7sFhdfMC6Q1JbjAyjA9Bo0tGkJuVV
-GMfKDfiA38ev1b/6sGorNqnW/Jyax0voNqKcOSOrQRfpmaDPH429OJ+gNqlm8rVKqxvp8mac
-6qO3ij1yoHfC/1mjD4h4cFg9MBvNen0HzqqfUEZPRi3gFslPXrJsjLNG7ASdQouTPbQZ3mvV
-x4MCCfEOOzHqwWLNThJtBuA+ui/a7nffK58cVkBZqAwJfD5Zo69iCxKyNnib1YpmCOykLQKX
-8Aq2DG6if/yE7ab/fxfYmaa9SmlKiRh1wsngzYjc5CG3uFjL04ukXknvIU/g3eP7+GhPupll
-M+7paDEP+a6Bb8mLEFRhU1Z1h1fqrp/3o4xtFqgVvjPu8NshCk1V01Ebf0bKoI4sAc1p9WQj
-2GZWjvVg1dkR1p6tsCTbZDVjE9kp3J4auElqoiOkLP5JEvt5xMhtLNAvqIG2mT6Im6NoJFT1
-TeKECUE5Pd1392qQTIL57RXXh7x+eqBH9Qz+Vex2m/Pt7nenviedjaq3y6Grew0vdUeQOnwa
-ucnTkJteXpJC/Udu6o2kg5/OrdR+c0EN9ll2rf6IuptzZLd5SaeZEfSKTkK2qUl4pBpDVqgl
-7LN6ZK8zLQM/YZ19C0jgAnoesMjUQFc8yHZgGMtiliMu06m6/s4SvZSngN1uPpjjXNN9nWuq
-p9tX3eWldAlRDF7Jaui6LoqumQborS6NVqmcKL2OwRPNeixNBlwESuAKKDu5j5KQ41AKz/PT
-ND3sx93QPFwSX0X1yT+oLPuOMtse6mIfhgirrd/Q6fIIfSDnkFEK+6y4Q89Qi1RxvV/WVEzc
-Fmm8XjLiN+BJn3Xqi5Sw2uP6pFdWlxVjdELRTwfFNNVXzpa1/WdQ00Qs0U/EMB2lItqoozpG
-a5XD54aT5hRaizkpxV6Qn6w9+eWn9wfSxwJy0tqMrrPXYLNhKJp+RXWxAzlQErgH9SAvfIag
-2Yjy6Kk4TodIJnQO78dB3JKUxzNIR/IbLyXJcGai0Tt8FC/ELi6Hi6PxqJBuDIfEGNPQa6f7
-86vyphstb7iDZIA/ldy9Kcrx9fxfr79bUN12u8Jx3hx/8d7h3nIY3qeSoDdqscmhrvgGOFSP
-U49Udj1abtNhsdSkVfNhqu6PhpibeAYsoz9QKesRfmHVJy6bRg/RXtYIWteeSAtZTchI+gQ1
-8qk+OftMcrJ/6Cnal6ajAZqNjMY/0H+mM5qnNuJ56i3pZRzful7DZF3U3JBb9HDRRi/1fkjN
-+4hD3kdvhhzjvZWSj5RL+Cw1gJcwBfhFmONG0Dt3DD7qAVkqv+DFKgUuql+htZqjQXoCaqcn
-QmPT17yD5X6fToYT6JdZBp11HExXZXEGNYjUUkXZYr3cCkLQHgCd7EWmRmCs3h88oIOhrSZ7
-YLppyDroK/iS+u2ny1/G6EfyqpniLYWD7hso4eyEdZF3ZqiT0KzlFWGU+APfET/RW6FhpFwH
-ZdU46KmfoG7QmS7Dua3KpJTloTS0NlyDx+aVfgnjzWPUHqXGK9FRvNMMIHl0NppV12FfdTqr
-AqSw0vne3ggW4EV6PWqtPqKCqgIarcqZG+qErKAriCgzXLwxB2V8yKnPm8O6BaxXxVC0oPDa
-bay28T9kdvlDrlbHlVQv1Cc13X+0WbZSa0QFtUkU17XVO9/Kdurf4OnTkAHmQUlcFa2mWfBG
-Nhk3YU3xWfoeHaAbURJWEhVkI+AYLQML8V7oYsahHHo+dnUC8sq0wwAjUCtTDc3WLXyybo5O
-63I45JP0XlLFT63z7Bytzm7jP8huVAStRMlQR1QZfTEzQMm+Jom3ThV1Y8QW9xWfLhKJ+uqm
-eCPvesVlIi8spvJiaq8bDxBPggt6p1BZgc1N+VJ00ElFDfNL9vFX8RoqA0Xxdd0YFfObGNQq
-f/+b4HXw0Z/69vg60bgniUPjcVp0Cy9Cv8genIEVoXVZLlaObqAhkplkwjvQSFwAIToNTaIR
-tIacQjNwLJzA9aEZvWsas8RmAC2gl/l78FY9lK1EtOrgjZYBkU22lI/kNJFFNeNlVFO3nj7u
-JoOv3MZbvH4EhEveiDektMxJLBnEl2QYjuo28BBcWIvWo10wGMaZp/qQ2aovQim/j5L6zZtT
-ZSQfVDw/Q9NSKU9YM2XzYBs5J/SvHBEoo/5gNXQJOtX8SzlcoK3QcNobOuImcFtXRjXFQXSc
-uyiLNwPX8l7hafw3au5awJ2deiR/psaKVeovVcIc9feotGmEv+hpuKX+G6/SX9AZkxlfNtPw
-K9+EbujLmJvtmODm/no1Nv1ZQVPB+m7GsmomG62iD5Jrai3do/ay9eocTalm4tTqPhzW73zO
-ywXF8BLohyPmEV6p05Hv8jP6LZJAPBnf1JNfdT/Z3qTzuz4kY9AZ2RJqqZI6Vk2SbXQGWV31
-/v9nfORTb5/I6VPrdr/zu4G/cmiNvApFdRjSwlyfNZLRRT5nZEDFWT/0mpRFNXA+9B80RXdM
-Dj/vgyQOGpAFaCwJo02kHppCesAi3B7m+dP2BdXyz8RdNAW3QtGkE3ZwSapxRTaCHCWlyFbo
-RwZom05WVchltRul0nmhphL6lDik/vBGypN8l/jh5fJSq45uK7POyQSFnU7mg1NGH+SD1Wev
-iK7tn+gO+qCpCNlMC7RGFUdM5UefVGP0Uo2Fg2qWnyS7UR+9AvU0OdAY1AptJ11QwM/+PHQe
-yo+To9n+jDi4LMasCT7BIgix1rghWYJ3oXr4JdqOepJUaCVNjHbQbvCALDU/cTMzFq3QT8wk
-/Ubf1l3UGB0jJxtHTIZPYrcxQuhM8pueItaZA94RWME3Qg5+zVT16utSspearC/rBeYhLNb3
-8UI/jY+o/jifCUMe9AN2oMaoIERQGX0DBfw8fWDu6pw4oapG08iuLCDHsEKyIzsoIvRvrxRb
-yMdY8z2wx8t5VozpytbDQ7IApuNO4MFulNa0o4tlwFrNK7IJ7nVcjr8zq73f+oNAME8cg/7e
-fAjzoWa+958CtVB1NMj8Nh5MNS9QPlMZ9zG5yDPThsSDRKQB9MC94QGEUCcjfKNojO+oFkSp
-U3SLTszumMX0mDlO4ul9ZJKq7M/tSp9NWuMXKDXagS+Z5fis6Y3vwC8UhvNokIlGb9U2GKdq
-olh1B5KZzPDTHDF/my/a5wszRTQwGb2fur2X3nz1uvnrOF2llCV8yn8hzspz3iS9yfsHFnud
-cDPB8Q3ZGTdQ51AdCXi56Eg+yzckmUlLKqJWuDVpg+5T8Nt+ChplrUc9rd0QzXrq+eSZrEae
-qgU4KaxH6fBAdB5vgml4CCQj31FVEiDZyCQSSxaSKj7PZiSbfUO65ufsFfRYbkBpVTFYrmaZ
-f1Qq81auV5VkMnlMRHsPxWFntiweeSZjI7PkIN5I/vJ2//+uvzDaLEKP4RvE4GzmDe6jdqDF
-6gv00HPgrl5rxplos9lM1nnNSP1TL9NbzBs9CjWCWfg+3MJ54TZeDnNQM3QesuHu/gwVwBlJ
-aXILE9oKF6EBvJWuQ59pNdhN1+tBZJUqjGaoONNDB2CUqesTTSafs5H5D0aqtjiBdHBAYHLL
-O4WTiFFoiygLv0UhM0FM1V3FTV1cdjJh1Rj6mD9hj9mlr5kh/issbT7paNiiC6B3GuFPZg8u
-iTbiGigFTo2eoqVoj6mNz8v7eJDoiuN5J1AF/hxd4BNxAe8OOeMVYp3FfZZJtWHJIIqWxgIH
-aVL8hlZGBek9WE9ymQb4gXwK/UUpVNObjLbzrlDCS2xeCa6Xqik+A23XK0WMvilamuMyCk1W
-73FbPYm2MnF0KSyk3dBIcgM9RwhPhBvo3f/vpGsu4iiVjPYXw+hJL0iSeuvRDa8HEvIZGmxO
-4jUoAdmLt+Fu/m4/IotgF1lh3pDK5ggpYxqTuSYVaWaGoiRmutllMpnccMRETCIoaRb4q/rB
-XFb7IL8aAqlVDvhLFTeZVDKdTw1TZ2R6UV/W5O/lV/5bHeWNTEU+HXrx9VCOXzbreDKzyisC
-riyJC0Iqcho1ItNxSdKJHMZN6RvksMxQ24o299gQ84d1ytRh78w33N13iSZoFgI8B7fz0yoZ
-qo++ormoHd6Jd+A+NAG5yb7gkyw/3kktNI00gfV+FwxFiVA6GAS/1BE11bvkNXWf8DdOae+C
-U0NkcXfJ5e4BtZen0CdEPH1c+Qzh+/9F3BgqkRBMxD1NXzTAlEDnTDZ0xOw1GeCY3gRDdUd4
-71tYF5XG3JOzYZm6juuYaqS0qYZ36xn+CatsesExsw5bKEiu4s44C43Bf5LHUNI/uanhNqoB
-BVA7tMHYuKZvEDdVC9TafDB5cEZTmlYzCdkjc4blh20s2uwizdULtFtmQlfkQJB+f02SI9VD
-MUnGk8PUn6qFbmoKmgGoImxFmyA3nIFpOitCOhU+qz/4OdUEJ8FvYQDObu4gopOgBHopPFZX
-4YMohC67A1BiZzl660xA4H1C0Worrm8KkeXGokMgLa2ML+FVpAaqTdPCEf9crMD1zEKkfE+s
-LaegDOIW/CHKmPHyhy6sIuqCTKi4eK0yiMt6tBgLhVQaktNUo6+B+nt6l9TFG2g1vMOnunH4
-PkoNS9AedQLy+MTYwrthlFcYPJEJBVUZXFK/wQ98GsiFEuI8+AO67KdnPZwJI3zMJ6VGEIdz
-mPJkiS5BzumXeLZ5hbpCUt9Wtpp1sBz98H+30MzAt4yN2sNIaAh/Qi0/V1PoslBQKZ3XZ6hr
-aqmXUed1QSd1bGU5n8SYSDVZMPJWFXGmm8/+WX0h38MHnRc9geQoJ74Kx3AEEvrGO4/1h+LW
-YLOfvdKV6DIzFe+GnRCFSsJrqOLvrvZby49nlIhUwQVRCTIGDaZD6Gw6wFpC/rK/4ix2brKK
-lSXjSC/soWvwH+zRvU0tdVqtlFo8Fl/5DjGKR8vqIiTnyK+ir6wiP8oCqrdvcxPMQp/fMpht
-aLj5DwXhN7RB2WALHme24M06Neqk/jbg21IRMcUUEAfgkfgCHWQR/9RsMRt1I3PRtDPnTD1Y
-Bz3RNjTR5+DykAgSGqVHmuF6Gfyp86NafrK1MyfhExQDhH/5DjsXyuCq+BFpQpZZh/CRQDP0
-OtAdSttZoSSbZvKTlb7vlNWX4KO6YbKrMvqYrC4Xqn+8C6aeKIFc5XONOWGEuW2emtmQ38RH
-98w82IjGm3P4jV6E85o9yJihMAuu6RHwTk4zwqupy/EParU7VWfkD0wxbyCqL/f6u/4Y10FJ
-cWO8F/30jXMEkeQY6UhXkDIkHumLzqIQfDPNzP/fb/+lyvsOPED20te81/oJT6KLeAtUFtnf
-EF3dd4QQvqIbkuFakVE+JzbwO3k/tPcZ5wPCuBT8iz6q1ii3HIQuikvooqyGe+imeIUZj7JA
-B6gNCWAjTPMTFtB0ktq3FA7t6Wx47/d7UZTT9Ia25iac8e1vrckPC8xVf7b3mbXww3zw/+I+
-Toiv4iv+Vdwk99FEGh8loO3BwVXgIbLglbmjF8rW6m++UA6LlJDN4x6IQNxmsSIcEWOdEzIe
-z6cHeMK8F9NQe70Qa1QWt6Xj/P9f1NwlRQ2itU1xv/3GkjO+k85X1J/4gXBCMzhlvpr/cXQW
-QFYdTRvunplz7+Lu7u4ESXDX4E4gOAR3grtbcHcJrsHdCe7u7gTbe87MdP/z/UWdgqKovffM
-6X7f52F3ay30gbjibxwjXomEoo08gSnUE/HY66MyhTN7ccN5vbahT8pXXdRzcU8WxXfiHJfH
-tPQrb3DuVlTv1l/8lHpW0E4vMxt0brrmHLCA+YHnzR73WrPFere5JaCoHILvRWFnWjFgOk1h
-z8SAI8F9iBlkwMn+TvjXHwWgJ0IXMwhS2J9wgu0kptICsYuX4grIAwkxG/eFGPwbH6ZeNMUW
-s+2Mr3/o/rq2ua372k32Ji2FBxxDDoNVKhkmDiUQQ8L55PWoHXJpjOFyR4x/RfUY/+KucGqM
-5SXGpaIJDoM2mJi2uJ0oxOeDE7alTmXLm9S2kRlpL5sOVIOecAr3b/KL1GKETCDSyr3O4N6B
-xXX8gCfTr3aJba63msZ+TfNb5KX57j+yE83P1NvmooT2Pn20uSEbJMcy4iBWVFVFaW+ZSKSa
-yCeisMrqnlBG6KSGUn0VphhygvkPGuqCnM6ssuNNcRPPPNA3zWkTxTvsAJxoM8szJiIXGOGV
-tGlCX+x57w/aIOvxV1gK0jXRIHsRvrr9LmaEe7rboD8tc/NenHNyJ9d3INLIfuKD/IC51ChM
-oPbhKJlelBeFxGvYizmgh6OZVbSaOttWtrXtZwvSBirMIzk2jIMH0EFcdPO4R2TyRsuP3n2Z
-I5RddvaGoJB3uS5Xc+2zgn/WKxmDKzQossxGfjQ1N79P1ml/eCY6+oCtHazgQyYXPKdTtJnz
-2795oeuLLdxDtnFO/hS16I1VRUxI4JJmHZ2xY2wnKk7/0k06RjP5C8XAZRxfxMaccpUY7v0i
-O4XzyJXhwbJV+Kg8Gzojy3g11F15U10TRdQy6CpG2o7QVefhePo9JTAz6YH7iGWc613k1Xou
-XNH3cbCZKDrZiyKgjTIxpFR1eZmoTp3gCK13THfDdIHfdDf4HAC0DHLCbL82Gr+GiK3ziZ26
-Cs4wm13Xf4TE3A3TwT585Mh9P9zEwfwI4tuLlDHoYe5GCulcQR1dxrzRV20P04M3mwL4xiRw
-pjrSG8MU/hcfxDgmZaxCalPMP+SDKBIi3Fx293Y7ei0nW7kpm2ffwzw9DcYHFWBEYHiZfs4J
-7EDOTj+oAbfh3XAXsjgzayIbisYS8Q/RkWdidnrDmWw9O8c80yvNOr3OFNYRbYNrwXc9NGhh
-h+l8lMO+oC/0GzSBJCIlzpNP8Kb6Kmap/+RaAc6TnniXSIVy2KXeWHNRfdUD5NQAxA5/DGQL
-blIXncfmttlMfm5gpmEju1/GoK4qFZFMQB/d1VJdsh/kBLsGk1Ihjsf96SD9RCnsZFvA3LZJ
-bVw+QL1gM8cWEY6S+6GGPIZLZBLRQXYSe8VK14IL1FU0chAMF5dpAwp7Ep/oFbhZl4SUJj1d
-sEvMf1zeXIf0dhyW5gbyMq7yystD4Y/ir6iYYmg4teji9RObxBxswYZ7mdUUP/jTpoocMubH
-TXPix692dfRy28yvZQ8H/UxEDzdb7HebhIfwfa4BXyEVdhS/iCdij6iLucQr6or97QnYZFbx
-a52BYpubprHNYr5SEvMLbDE1sRwNkN3gdCgat0b1FgOipolH4RsiFC4sm3nt5Ua5WeYQBVVn
-KKPe0zhZmnqLyZQSZ3BVLuhY+STv1dN5n34Hw8xnEdemUl/tMTWFM3q34aBMjqvgHuSlb5Db
-lsLh5iPU18d4pj+Oakba0alIBi4VtHSTXYd726zQnvthOUgj0sN7x/pr8QrvxwJcCTPajLA6
-2MvbfMOxgs48JFhhU+p+ur7JHhQg8utDxWCX6KkhNMDWj/GC7sbMDzlj1RWlY4VUoph71Jxw
-Qe+7muxNFMO8JtBV5aPMoqApAK31eG6lf+dvQU++HXzlxmYcFOO9UF20hFxqF+dXnfmNOMYN
-sCykgEmQjx9CN0KcYY/zCZ3NnvbTaBn0DEqYzEE/ShTshl7BPrEySCVT6v2CTQ15nYuqriK9
-6q4uicveJdgROkZ5wvFtJLRMZwk98zN5CSO51IzoZPJQZCvqoAFUpWa8GMtQdhnXNpb9TGPZ
-3BSSc01T2c0ukENoqlA8CJa4vBtmC9vdZpWJb1/ak9aD1fYRPDHLYIlpjSGbVo61ddU0quHN
-h9feHrFU5VcNRUGPYZeXBfp6J92krzU7xRM/PR6NTgFJI/04oU7K/9Er2oFjKZ98YieqnTZj
-aD6tDzeDh1EhES9GZ1E6PBEHy3ewn+vhKvsGOxqDaXRnzBR84jz+HVsyUsqciKzVp4KzeqwZ
-YabaD3Yr7eMvXByfQIBjUIl6eBKbuuc73hzHFcElPO23wHPODKODfFzTXLLvzSGThhqZEBYz
-J1RP8zA80DaKcYY+Ri3j6WEB5UMdIIm3CHOosfJPuU2dwmHqI+2Xye190cxuwblUEQKOwXmx
-IP2FG93fDLYJ5Tpb2ctAVULnqZ83jsvI5lAbGmMlyiJm2WZisnmDt4MfMN/fw4cjDal8ZJDt
-6O6ntblJdXmbI7xFMAga4v++T7Izj8OttAZj0mksbFOLlKa8eOuYbrV/j1P4dalgkN2lRQqT
-lvLpZtAjSCff+NprEGyKuqV/ibnI7o0xnBdH/YVjoyrKcVFdVcNwJu+mauWVce0+2h6X14Kb
-uMBfBCUcY8wx1/Em5RVd+DCW4xz43hFYJbcVvcR4fiLGQwaxC7Y5huvKYbdn6zmZLcsDjKBl
-upCJpfPoVmZOkIuX+SvwTSSzNJGN8rzfTrbQ5eQk20o949deSLT0XssZoquXgbOE+uisodOR
-+KElkTSh6n7lUBq/VSiuP9eLHUyTJc06bMK3HHGFoLT8To3kTTenyXmbmEkxhMs2dO7uWDQE
-++ia3Wn3OwP43+eeK4PQW8Ty4Bd5yO8gOvmnMW/QWCzWxdUOWz60HA6GishdqpfKgJ9VESru
-dTUdvRvBaG+CH+XtiHySAyJnxAm/Ly41n/kAP3bbu4DOyUtU2TlL9fACKhKjHfWJMYN0uBIf
-8aY79owSKeGNyEELRRPbAK+aZ7xOj6RkQQJbyP+gb/kXdCoTsm9pN42AgZwVRvMVSgdHbEdc
-ameJpO7OOtjdMp2uLBP7t7B1pCU08M/xTb2Va1AubsYJKSZ8MrlFOVPJe6YHhTfo4VEZTP6o
-8bZa6FceovZBLPUIU6n6Lj3PqExCeGd4oqxCxXAvted/HL8KeZCeyn8pjzxA08Vg+t1dvUUL
-ji/3wBMxD5/DaYxBh3G4/oSlg1IiYeDjPf8Q/O+77X/3U/DVoBgfsufpBTyyD8QHM1MMc+mV
-wr6jfvSY4kIXx+aleZXcY9uot8F1mSXSStSLXgtx/OxcwpD9QQ9MXtijb0BGPVDM0iu81+Zz
-1CTqF3M954gZBSaqMfQIJ8Cv3n84VK0XjiPlMqorx+pW8lyQWb7Ss8V4+xUfUFpM62yoMGXk
-NjagVpSU78Ik/iG+wmo5UnhisZhHZbGiOcPNjOTcdjb9ZM/ZI6a/eWRuBxVosX8N2vij5C4/
-pZcuiO29CHx5TeeQb00Z+YW2OvZ+ILpLn5+qtqZVaLd/LZzXnxEVS6eKimf3hRrY66qUOSfa
-62Y40OyCLLwGGF/AW7kEhsptnB1vUELOS7UoHl10JzOR/+HyPIirUCI6YLOa0bQmiMLF/iK5
-wSVxg8gt+SSSRr3wh6nuOuQ9sN28BTDHJWd6ESVnk1SfdAevmC4TSqTzh1oHVbwrkazqSHRH
-OcifKEbbJvgUe0JSb4vbq1VUy5tht3g5bflwYJtG7eWH4dG42GsqYouRuJ6IlR3NU+xYR68L
-6IuNa7/pS/p10EYf11nMZnvRfqbenJi7wmw6CYvt/34e/Rp8YSrIefZnr5Ut597DGG90pLEU
-EcQnfheuaWfQQChLGiUlEilsObFBH5TXgzihuvpZeI85GX5np3hLqI7syX3EYegoCog04r1I
-hNMFwAHc485uNLThn8Vxx5Y73BZ0okOYkxpie+ovfuUpsoBj6Txyr3goT9IY2S/IJG30HnE3
-Or6o5+/H4no/rjExMaXtyzfsUXubc5tPeCv4WY4Jmsr5Woqq9j4voEz0nU/Zn8RZu1NNNeSt
-DVJ6s935ffCnwF+a+bTtwGEeQGn4rX3G9W1eMcac9GqZOTF+syljVeI9MWbCh9AsKKs0zxVX
-uDYmwBbQXC5m9I7YfJ6vp0qjq0LY7nLWPNyxUXt6Rim5B9XjZK4X+sFLqoxTOTNuhF08Fzfb
-+zjCNMBqjgmMicOb7DiqYlNTXnvM/EN3g0G40a+nnvlvvKba99LbHyomPZcedZCt6aDoAlWd
-NWfmmKGMtns4q0kY9UNPDOc317x15olsZVsKbf/BEnQXa/ED/Ag1cTOuh6ZY2bl9Q7hNCyAe
-l4TH1NNlSyFm24rB5ucHOi5NNA91KR7n/ypaRJqpy5H/VIpgp+Igo0dBgtDYoFJoZtDJa2sG
-y1ywAcqpBnZvSOkXoWbBHm++f0sFkXVqqT9AvQtYXjB5ZUDHMBZ+4niyKTVQJ+xL1Yg6e/E4
-RegLdQ0toI5eRq4qW8NraISaivzvs5KchMo7o/rZAEXZtvZnSmPX0jibnf6iVnYzr7SFoT9b
-fuoMd4/sTWPVBttZpTeP5NZgrFzur5Pl/VNyvCOiM6aG6+WNlJb7mhZ8Q5+H8eaGyGkvqVsm
-dSinSRRqZrJ4u+xEOcOdkoXPMABfQwXcg8OhspjIQizg6zgCaooWUFP+Q556YG7LQia+DLn5
-WEITcJZj3wniB7eQd2xumU+Xl5/9O3K3X13t9LOojkE+WV73xhQmL/8wtZ3lzjc3IZOpK6vq
-DfJl8Fyc0MXFdjsH+7KCDBCbmoGw20Hrqtg7GC8e+Jvl5mCf/KaviHb2LhR0c6ywKLWW9zlr
-aCSuCc/Hj+Hv3CSs7XHvD1tanaC5sgp2la1lPHFM5ubZIq9NjPNMA5hmSkBeu59zUh93Hmjr
-/88H6JB5SrfsUr5EleAvrguP+DFLSOXSVNtXWNrGEmltVhxuu3ITKmdP0QTdhIWOjRv0W7HM
-fJZPTQHV17RWtUxR1d/GkW/5Fk4Wz6CXmsXDvW32nXdRxwhV1ewZvdaLbf9Tv9MeOYGzi9+g
-JF6ByhgNtTEz3nXznBjqYWJuBVtcMu3gITYNDjBLsLlOjYX1Ol6vj9lDZos5TftMI3xvVssh
-JspLrv/0yvotvSGR196v/uXQjABCu/VH+ZPNKlJzLijv9myM/Fsrb3KQyVvtT1YlfFS7/BVy
-XNBSdjNhGc8lzzu4DqPESH4ti/Ap9Yo7eWlxmdfEMUp9EUf9BWtwFHXnvTYPzXFe9oq30hV+
-RvVpJG8x8Z1xLuN3jmKX22n83LnkSzpHlo7ZLjDBvhQnTUSd03u8bbqZl9e0U7nNIPnIPc8e
-5iMetOugsvO9zJDFFoVxup6jwa8ikd4kIzqWKmi/ynyUXM6lVgg8khNCXm6FSWC+qIx/ytni
-pugvPzgXn85P1GWq6aWh2F56equW0Dt1mg7K8izFUndnm7Amb8PP5iZmCJaKB9GJZeRHMTkq
-Or+s7L/DhHoVjzYPbXqKa/9lYxKL5JbkSnNIftR9xB1d3T2FFNDTDqfttNPd7Up9DeLoT3A+
-6I2t9SDR3jR0hn5DtuResgfEFAPxIfSU++C+1wx/Cv8qZoRPil/C6cVULy5elTchruyGqcQZ
-bAfb8A75UIiKu+zdZ6/aUXY/bbK+m8f39Nb251yuqXKazhzH7OCrZhpb29DlaXtjuaOeDX31
-dTips+Jqt+OL3FkPoRu0jgvZc5DZKNHE/CETuH2oaYuo2ja1GmZjqa6UU7aDq7hSjIX+qiDn
-9W7ZM+qqWaWSWOnFoYqORet4e6G2+h0bi8ZuJi9iPGiFD/kJVIYm2AFyYna4zZ5jtuqQ3GTC
-RboNPgzmQL3gEmfRJymnaWe72nlmAz/VhzC73ipXBd+9C/670EE/ZTi2/jXczCz3/rZ55A8a
-iD25L5/nefY8RJkOIpcurUhfUcfNfpnN9hMJ6Bvepi7iP0c1MbG3qITj8R3+BTFkL87unm1/
-kRX2YwBTISay48gy1Jm/kuEWMBFeQRimwxHaCaXtC+hmFsNUkxOK2CfcgJJBI97K3/kG3XCb
-dgEf292itPkuc+ht6nFQSD1xlD7Z9hCdaJtr4HjuKuYcdDb1hrHmDjbVxeUCfUGOMHlkDvsn
-drYz+bvd7TpEchuXHuReuxTmE6WwmcyMWdVHqOj9DhVCa7hj6BnFDY2jNl4O3qeioK/sDb/g
-dyjLPTCNPY2Tgl4i7F8TzyMDxSg/tkgbDMXBwWwopRfzerObplMsagkz7SKMZ4WYY3qgr/tD
-Tt2JM+jmNMR0tHupiTkDu/VZ/KQLipvmqfjP1pJ/khXVeIoogVlES7kO83nTcXjoGSYNlxCn
-Q9PFHu9vcU3VFjFUAvFZZBTP8DTuBg3NeAF0pnUwhsbCGMeao0DTK9hra8Apl+ZJzAgqpFNS
-l+C+7R4MtcX1GtPDXNDxKKN+wZl1Jbyub2I6swcbm4rY1T50xJ8TTuFBqib72jgqqf0ga9jP
-4p0dLiZTfDmfFsqHVEFWgr34qxjC8VRg36vXNpvXjeZ6QzlWyIetXjfsoKrgGjECa6MQ5+GW
-GAm+EHAOk7ipDFN8Kkv9zHmOo6/AXP8gnIy0gUORSnDAee4TnQOGEvBraG77iC+uqVLoBGpt
-EKj6QbxQoSBjuFWQMMxBGS+NWSXa23JwjTZQOUhEud37jy2emRmyk63qxaNuoZVUNiT4nnpI
-A+RTriDyoIZCWAM2YGzILLbyL9iDb3Md11bnOR8lxUV0Al9TAezl5i7iuKgOd7TfaIBtDWtt
-WzHVxlU9bAe3q2tFZ9d+CagAx+VqNgxoIrBe5xBvdX35h0mgxpq/1M/2hppOC1VjXiqv8FSM
-cFtuDtNoFrakjzjavoH05jo7IiHQ/9naZonNSq2pB3fgN3yMi0JyOAfDsBFul2vwjTcKv4V3
-woeo49wxqib/Fe7PG0OJoYXXBf6Q8WEBLOQz9h7307nwtv9c1PCfyuz+cVnJnyDG+Y/hkm+5
-sd7DD+xwl+Gd+C7uoF9ERjsU7+kBUFP/wuN0d+po4lO0SWDr2M+6GP2hu3I1fQsGmbwiQqvE
-GughVmMB8UKUFYelkJvVRbnE+yxXegdlE6+EvK1miDSqgRgom4jaoq24DzXEOa7lbPwld+Lh
-XNURXQARvgP5+Qt/cy520/SnrXod5Qp2UhG/Kh3019sy+k8TtheD2TTYn81D3TyU0emwic2I
-U+ggbOXS0BLL8wrRwbl1OzJyAj1QM+mR+kQVVXl+LmrzSxjB6fl3+NumEEnsffnQRquhvMhL
-j5u80djLi4UrvVL4h7cAv8k9+BUXCIQFMpqSybacH2/zN2rGdewJGmfO0RI9h4cErYD9kvDZ
-H8t9goY0VD8zE80q05WK2VUQx9Z0zTJfddNrQ5WDOaE0QT7vaNBeLtIf8a0Zgt9sC/yLomEb
-Z4GG2IeayXg2s1fO/urloT9Ub74jo2G6HI7DZT7sIPs6RuvosikBd3Wkc48O24CL25W41VYU
-k2gk1mXfneRdusAL6ThcprBIwWedeVb30thUXrTuIDObAvjM5OekVtBlc8OmdyyQi6LcJF81
-L6GbriJRH3MO8DLk0QvvODdVc+CH/AqL5DqIJybDBs6Fsew1yK//5T1BZc6nK1Ee89mkto1d
-cmUxk211U57K2MU8hm+5nS6H8UJ/4o/wYfwQ1R4PRN2Gl+GlUCycDzqFWnMJb69jQORpMBj+
-tc/xlK4jfgvqiu9+CzElqCk66geIpj4WMFlxpJkNNW2Ys9EYe45uGcF/m6SuRYfxGV2bR+hH
-NpPJb96YynqoHahb0HjTgZ/a4o6wv0FKfIypxX9ildgtL8lrcoNXST4MzRd+qKxoGkLxm0ru
-WCSFbMUsF/KfcgbkF0dhEVr2xAgeLyzPE1cgvpiIzWEn3rQJ8IvuBAl1dtgSWP4pqMJt/ey2
-id8iWB5cjZzXRyNDzXb/st2kd7mdcifGh7EFP0OEezgQS2J/mROyeiU4gXee8smk3BNH8hSY
-xmXhK5+B9e79psf68AnbcDX5jaqoYjxcxYFF6ipU9rbjBu+0OKAOy6ryvsolans5EVRJ+AO7
-OS8P6JxWnF5fp6x6Ne0OOnKBoCcs9S9DL38UbA56cg+71p6Cf3R2OScIqWcBqAm6t8yuH4uM
-wQSx3/fEomAnVjR78YUth834TxjltjIhLuYZWJJvi3Z8U8XDiqGKkr3rcr8KxD/yGkrXgmPF
-Pq4v0kFi0RNy4wY2fNQCjNc9MW4wRYggmdij20AqukQ/eDwtxG90RSTgpPISPRKvbBdR0eQT
-64JofOlfhLnBVn6r8/EqE6KVdrUZwQd0ZRyirfjZ7lLJYacXU7z0UsgS3leRUS3FpfIIxHQz
-mgx3QiUKuISb7Timo/5kqvqzbeJIEnrqp6BcNr89ToFR8Ae1EOlhqoqF5UIahoVjw+lwDB4e
-3k29w+X4z3At2BpKiN9VDhwtMmJhno1FTU1xM9giGgQbxYzgifiue8hcdoosZp+KWDadSOqc
-r6xjklPom9vYQk+CIABqq+OalXqCbqOV7qrPBF90cb3IlNbb7FCdjW84nzlGV+A/19OXxQsc
-rrrI/qEbskf4tZDhPCJmqKZorraJDuKokHhGtIJK8iOMl8uwgIyFbZxtllMLoK2KwkRyBn5w
-UxuXG4oNtpLbmJeUR381rfV4c1L3Ntl0oN/7LfVP/oDgqN/J/1ln9veYNsFb28P8RyNIQCrH
-YH/JDrhIDcCKXms84p2AOaoinBVTXJePgSXw3DXUa55Gh2GxvYDjzFVRxWyVK2xzlRUmqwvu
-OQRuKt96G2Qnb458pErJNaqumCvToEYPWrk8qkSZKLs5SGeDaTzJP8R5I5t5UPRIlpFq/Mkv
-zpdMTK7HbWmCM7xbrjEjMD6ohL+4RKgVPJMiGKrO+s/lviC5bGziibH2KEyi5PCZx0BjR5Xx
-BWE5MQhLyHKYzjuLA0LlxIvQKbE4lEDW8oqLKfI4VBCJ+IqzrtyijC4hpgUZsHlAnElHuICd
-CA14OWyBtLAUL/BgMYbXirKOHgeZs85pMjlmPIc5dAZ8FZTlKN3OdtDVzS3dyKVfW3uYRtM8
-Z54FxWloIBdiWdVZtPe2yUOuAWepHSKxHOG6ZDi8c6eQHRa7Zn8cjOI0QU8a6J81hyJpTGP/
-qflFP7Np7UjSdIfOuJSfJRpzUa8tJ4vKzjdidOcWMX+CnTF6wp1wTLjp/ct11W1eLJJDDbgC
-jegiDrMjRSkbT9axW+Rr28AZ1F2VjservBxPTqVGeN2mhR62JmvTmn41b81G3UFX0zWCW0F1
-/4Cf3w/7L4LKwWfTxlywj20SasxD6TZ8oBU4n6uIrVBGXsYiaqzI780TG71WorX3VNTy0qqP
-6ozSYpJKhtnVGTggn0AT+cWR8V94QXYU3RwNPHQJwTxa1OCfxCHegj84AzymB7amma37+LmD
-bJG//L2RKZHKwdnovXpyJJZJHMzUOc0prSm+zYPnaKVoB1GqLY52215LtcE56huMU1vdRiTH
-fnjZ5etVTG2boGfOY05bTf7BXdVD+EuNwRKqrTjj0rK4HCK/i2ayhdwh98hK6rxIoU5Bahmb
-d+BE2sOpeKJdz9t1Rn7uf7QbI+VslN/H1g960R19lMfZGLCC9lIituYBxzNl8L2eJJboC+JD
-8BwfBZ9hvv6PG5vhVMHmoGaUgx/TXmcnWWEN5XCGGGB5eCXWi4rqhornGS+t96/3UM1TgZwm
-a4olsgP0VJp6qsv2tmjgWnqcZshn3mJKm1jOt9tkTooWexy5l+U1VMB5bDEs4LbwrUki8jpP
-rK/zYgKdHpbo8ZzfXHf0/N7+Y3rYacaaemahKeWSrx8fpp8dd/2uToqDapC8KkdIX4yR64UR
-aeVHvCg7Q32Zlrbgc50Q2gVZub8fTc39l3TBr0U9g302n7nlGrg9bccf9FBm4pveJPoemmtP
-hhrZX0NJHE2H+ZzXkaeqLPxYHKR38J62c0pYwcq5QCb1K1/x3nHOUHf4rCpAR1kHEkqCvfIP
-lKovFJZ7qRYetKsoiS1mTugK+rdgja7h+7pL5Df9NLptkDzSLrjsX9R9TTFrbCs7ne6YrzzZ
-nMOvJpFcRAlVYiT1QuzwWsob3j3xULUXTWUSWUKMUYNwiVcdVSibGOFlkb+qXnKD3Oqm4Jv8
-w5suj3j7RR41FjPhHu5CXemtAcps5ptpOvCvBaMjF/3k/stI7QD97rpncMq81lnoiBY8NbjD
-PYOumMjEdLz5r6wMyZRDKLkNUrp0tngM+jubSEQfnJt+lUf1Z7lVF5YtzAXXFwXkbq6hWuMM
-lxOvvb+9Y2p2KKH8GqosPoUGC/LGik1yAm6CY1yIStJg88520XPoWJCWYwVX6KN/yF4OJps5
-uoOpaM7Yh+75Pubj3B87k3Mxs1A00iexq94Kh80dzkgjOBON5SumMB/W7amyiUPN6RFNhIzw
-O76CFHgAn0MOWQ+Lql/FL6qB3CZnyPhyg+gvxuIz3O12bIAsie/UOJipCnNsWYr+xte2AmYg
-xlT8VLzgiyI+TMLDjq8X4mLbDNGOh7n2Fit6Qr3salvSjDXp9XS9IVgbNNZxg3h2eTCK2phV
-VNftyyCIy2XlSVjhDRWDQpXkbe+TWK7SiVWyC04SgHshoSPlPK53isONYC5d8e/YMv5gSuzv
-523+P/CTlv/73kIogyv5u1xP+b261Ns76Cj2D/4R2sfXwh24f/gznfOqcU+3bYehOQ6infjD
-DnbpUgB78grndVnlGn6jtsFIbyceV9dxtayFu0V/SCbW8UT0qRActuescY0+KOgWpPD7BQ+j
-O+hikVzmuz9PD9FVgtumh5+EtvuGEul0cML8jI8siBy0QVShdaIMP8DsmMGl4XlIpKKhrksy
-X7bEO+5JP1NbxJJQWvU6nM2DqJre09BUtdU7LnN7JeUZVdWl1nQ5CyeK1wSw0+S2a3UiPVqf
-8AfpPP7HYI8/3z8RZIos17ujF5hNkae2S7CKn+gFONR0lhPMTTXNxPfq2MQqoO1iO+zDFngf
-bsJTGgGrzO+u3S6IicFD2Sior1rqXqqZnatGcilvJpYObZbbQ128rKHZodZqSegRPlX5oK+I
-8H1o5uYnKbTgF1SHFtlh9rQ54n5F63X2h/6bnpntdNkibaGxdhOXshkghV0Lw9yJJ6ZR+Cfl
-xLq0HPrbEhzLTrM7bG8zmf4wZyijfU1p6aiz5+K4k/eLSlhVTpCtxSplYL1KBJ9lNjglsjvb
-/FX0EkfEPJFOdMJ8+K+j51f0EQbQMvzgtiAebBDH4ISb7OdQFH/BWkIJLdKL8SIRLsMEnBzG
-2GYErnNfmQwm2mTRUTZ+cNNk8qcZjng2a1CMBrmNqcKb+SAu4DiyPLeVNXm2jObXMhcWU0lE
-UnUVfTEdNkMvR7WluZnr13imCRfUM7m4Ls+J9RTqoevQN/OUqvILvoC94LT8CWp6o1h7+d31
-gC96DP+qA6jFZjzr2Dk174dq9Bl22nrO68bIklBZlse/xWCxRJSR6WRM+be7TsossoRcLh5g
-CawIf3MibuF2Opd9bquYT6aUXqOv+reDL5FdQR5/fyCDIcGFYHOQ0HTWl+wTHcUP9XXeqcdC
-QvMYYtqFUJ/Swkd+xR3wuPOdI9xGnuCb8h0vdZ3e2ssvFnij5TqvqLLeP2p9qIGXIHzOWxiy
-XmPvkEqr3oh6Mp9oItJgT3zFreEM5aahZo9eHpQJ2gZP/N76h//FbPB9W9z/nbP6ebC/f1cc
-9b/LgsElOUyHZTr7F86mKxzwW0qNJekj/mFLitymtWvYTeJWsEs01XdEITNOLrWLVFmu692F
-N86ApOooW8nmqqScphLIqi4zNksfdgoPijtyb85PaJXNzHvMfl5uLvBZE4P/sU9tZUebfaCX
-GYntTFHRwWQRH81hHGfXoqC9+A89hLN8m6fDYbdtfU00bQyO0tygHj/XsWGsnQ1jXKtf4/r4
-P+fIhynxhoiDXZytbxOXII5zi/IuURLjCB6KJWE77oOsaGE7TMPFuB1rip7Y2k21lKlwkPwP
-FrrmzSV9ji2aOhcohfdcSlyioXjC1oUJ5g6F9F070I9BkyPH6a9ISz7oV+XGehltN92oFA2k
-1LCR6gjJpdUZSuLVIK2SUxnViurJ4pxV/Ab3oDZO44J4wBYEz6Thw0E7Wh7kogzmke1sF9i2
-NMk24nu2PdTgASImZlDfMaanRGFvjOO9NnjW5U4CucR1wDasDf9hRq4jBtJvogh1FLnpsTjB
-OeVhzCmvO86tJRPKdvKEKCqf4F1R2N3jKvhJKpgtBnNG3ET7KNruNdnsBv1EbwuuBXmDpEGR
-YIhfIUjsTwqq+Ad1xmCo/Ri0pb46O03RQ1zatrDL7RE7lM/bM7DadsMhNq44Yas4c5ygRsJk
-b5yIE7opv3hFvePe6tAgb0+onNcpFPZueGtUeu9PtVCtUDWl8nKK3122dxfHaDXEpgRcxDa2
-xc0hHd9sD7aZpsFKivb/gL/9yXjLHyAqBPPE8mCWOBG0FD10SfG3KS5W2u8wjM5Qc65nFkPb
-IL5Y738UK/zSsmGQWv6k34mPeo0QtpLo485nAPwmqolmorwj4C+Ot1qrBKqdSimF6o+pZS2Y
-gE/5u2vtf2gFn7VtuY17T+c4HrUHsE1hskFAWwxOucxMSZ+cs1bHIdQLBlF9fkfrqBHvtse4
-nf3EhewpTmXPcAPn2zVsG3hmh0FnGgzF+RHExcoYwTZY3mXeBLHF5WZ8+Cx+0HGcSh0hFm/j
-RFCZf8W3fAm/wRVMK+pgSlkCpsjh/IeaweW8jXDWe467vAQigdqCN7A7EnfH3M7gK5i84kbQ
-Xszxy+KR6Gtc88dtqvWjGG2K3mFf+UdNX9Pd7KFM9juHqSyeoVzyHh1Ws+iKN4iaeutpp5zF
-bcQFaIE98DQ8gbW8mNPTHEptV7r+uOl6ZKr53daxZTlCZTAhPMNRYHA5VBPH4Zi4hSRLy3Sq
-gEomy6vBWETeosKimW0oDtjRMqBCah+vl79xXpkfYspofCmqys5iqKqAl1QSqKla8SQ5mBeI
-FPDOfcweuA1mO3+fRTVsO3NNX9C7gvZGBbHsab+gfeo/M8/93GaJP1VH/P36a9DF/GYq24vu
-3XWlpuYG9dF9+GpQFBLqtPhIC7HGEekTq2UUb1H/+6nkYZk3VNsrEdoYLupVjPpZnQs3VMfD
-91XC8ECvbmiJV9z75qhrv/wFo4SmjVCA1nBz6k71KLbtSF10XkoVXKb0fjLoGYmDsyJNRFN/
-t+geRInfdFwsaB5yCVuFi1J1asMDzAp4FHzAq34Jedw/JHsGB+Wfuo5c6Cb4FytxuSWeSpe5
-NEwFT8zDsnKEY8357nzSi3NiAdYRXbGouI71xDachv2hKmyi59TFVqWhtoJ7QufgHEnxC8cX
-pXk7fqc/MTvNgAm2CzS1RaCr3UXVaIIdyM3MONjhjPmLtq5l7sAk8xykvQIR2/l/TuCIrgKM
-EqvgjHgAOcVDeI+jYQ82hsqiJMwVNWCXy82H4EMLmAFrXL8Owb00Xuyj3XIfpVSJOJtaw3FU
-Zujq8lM5JhjqcrcW3oWjnELcsuXkOL1EDvRLylAkSkT/GAoff/zOT6P3UT9/IE3Wr2weW8Ge
-oQ52E+ywzcREe1HGsb1VVftCdaITqhHPcJPDYjk0EEWhCP7JOWA1raAWxHYrxaeDlICq0Go6
-azvyNtsRJtnXsMB+hpH0O37jX/CWo/828isXUoKPqkz8j6rMDVVDzqWWuaS+yj+p1jBDzoMs
-MhN+EE1FAedh7fCL3A+kxkJFLxqae6VwuNoB18QW/oJXqDsusjWgjanN73QVaqUnmAPBEJ0m
-mKCr+V90JFLV1PUzm1bBEy1MGT3a9gk60nu/A7XxO9MtR6Sngp1cRp+HGzqraGVWyw02cO+j
-q/eTSO59UI3U59A/8nu4u7wVniEzhaVS4TuyZaiNnOe1l7fVeVld1lQ1xSdZE4+KGNAYC3Fr
-jku/2LN2tH5A54I+cCm4jWuDh9gi6IzRfly853eHfUE0NzcFuSJVoJWc0paDCno/3PBnYlN/
-j+jvvxNf/QAvBHchrckBD90dDuCN0BDiYCscjM9EXXzvOrKYOgsn5AsoKCvin6INFsEkmBeK
-wmQuyov4PKWCs9QTsnJS7MclMCcfht5UCh64dHzppi03lYbNVJJX8zIqDidsT8hmP8JHcwo/
-mMIin52Ih4yzIPsW/qYo3M8voT0khI0Qg1Nib7qDK6ip2M0fnT3fErNxpFiCe8QnGC46QQk3
-qwXESz6LFbgXxmQfa3A6mZ/3yYQckbncEy/HpdQkbi8n83RcyET9Ya2Ziz+CHGK6/wUbRubh
-lOi+GPyYjcWiU4h/I2nFqyAxJrEJHc/dNIXcs34LXc1aMdwmVRPoq0rvpqkKp1HgfOkZnRbN
-uITwOQP+AjVhE5dgj3fRCyrGC6k1J6ZjvN1mhKH2NFe3xXiq1fSQFnFHSAcXEOCDGMd1ZHs6
-Lz2apyaT510kUpm5kerjaPcd78P87hlkcB74SsVXf3rlFTvSC6n2WENuhfmyAmRSbo/VbP5N
-zqXH+Lt9yAPNcqpjLlMu99676o/ULXhnm/kNzLXIh+AXv3xQ25HoLt0qOGZ+95PYURFrjkdf
-tRBJC3392i7RmsuOuqDcaxqIau4jLnBpf0R0k5PVOJU4tFH5ocuydfi2WBP+LMZHPZQUdUk9
-D3fwVCiLN0PGU3VwgXjOgzAdf4NPdJ5L0XK7zQ7Tm2ll0Aiq6wNodQzxVCfGxfoxv9SKX5t5
-pG1ZekvHbEJ4ZJJgM10CUwcnwAuOw8egFmYxrzG9Y9G9dgeWcM6ch+v9/9d3nMaG7r4bQWY1
-Aw7J0hBPJoFKcj18dzM6WT6HSo6MHsBF8mAKxYer9II78FLe7kj9O/1rT9o2tqQVdN5uoM8U
-y+XhfroGSLExo30Oq82/8MZlZltbGvfZqbjSWdNXmwVLcBcYA1v4HzfnPcVPMF2sxPOitTgj
-pHgl6uMeGXG7chl2yHbQWazlTniQfsNfCcQZui0GsZKbOafIyS2wOHXDmfYcfrE/sKaz22pw
-kpvDNtsaTpodUNpUxzQ6hVjpXxLDIo/F+eiHeCq6AbyLvKFDwbP/fQ2i7UDtbF9eamNhBsom
-t1Asrz33ClWHzaFHcM2bBQPUHi4hc/Io0df1RB8YAQGEuA5IysqlKa5jwc72o3s+WXgQ5eE0
-bnJv0mzKT0WoBhVz/leUDuJHe0T0tinlPdtf1uY8MhcMFNOgjuiO/QQ6+7O4WgwRteRtGcji
-ni/PevdFda8l7lLLIcqrDeO885zPa8ZPZQ0WIhkbl1jJ6YUj0CGmn21kttv//RSiO0FSXSlI
-ENQKTvtLg13+In3UH2/v+l35mN8csvgtYFMkK+T320H84DsEwVMoahLDa8dsmaAqtxC1YK4a
-LF6Eiqo6UUXU9Sgpk8fIKGrFmCwqxnggK0V9U3VCwsupMqqC4p6YATNxFf8Drbg6fKOrXJ4W
-U0xaaVLTkyANFQ+a05HgFGn9jsrYpFyZZnAMbsu7OET7XRJcw2w6pygSnMO0QTeMoztjPXMF
-W9qKojglEMk5FeaBAzwTl1Jj+a/zgR/8wFsDLb2sbk6Rf4i6VFEspsvYlBvicz4Ox52VXqeb
-dMHGpDb2iV1o01Nxqk9raBRNpx7u9+O2HSexzeGyicKNpgTOMQrXmqEQy3oAlBt+5hv/+18A
-/A3m4E8wAhM525kNu+EejoBe0sNHztJ2eutEL+8JVlMBjJOfYJlshGPlNHzrsjyvWAIFsTI3
-gMc2FViT111dYZe9AE0c9851Rv+C1js2G8un+JKtCgXNCXgbZMISQXeEoCXO919CQr8lREde
-8Wa/GnfUK8napu60OtIUMY5qyOP0SUbokHpI9bxzNNwL8Tc1jI/K7LBajHDUW9JRhuZvnBnO
-0wRQdAMu2Qkw117k+rY9D3Qsc939OTMlgOl0h6NpJFfk07yeu8N9/gFDuQ8ib8Sr9Bye0Qie
-zC4mMQ3MEanFOrlYtle9ZXwvrVjtlcW3XkO84u3E9t4dHKQGYCs5E/4Sf/NhzMSnIKnj/6zc
-z7EFmeM2lzlvrujfTRs9xUQH6e3tYI29Esy2bYLS9py/wE71j1B3PynU9N9AW38KXPMbcpTu
-TndNM+pDyTgZ1IMz+JPzsPaYWf2CVUMfIUbUQ/gc1RTnxXiI/7nrQIyZeDpqBB4L3UNf9hVl
-8JbIwm3FEFsEi5kGcFDHg3/0Al6uD9OvJrBpaISNcCdr4V+393+Tmwouycvhnt0D101P2GPy
-uDkpAg1dfr1ys9nKTMV5tjkepzS4l2PiF0dSjUUM/FX+DG9kD56g4vBOFZe/ySHsycc8T6zn
-4iKD69Lz1BDOUGK+Sq/tWHpt7tvapoSda3LZVvaAPWf70iGbgde4hj9np8N7Ow26OLZYa3LB
-XPOz48wsUNE+49F2k9v4Ky5bpsEA2IGlRT/xRg4RrOKKAV5rXO2FcZk3Bbt6hcUFlV4skfdw
-l/iAv4sXjn2nYkNI5XigNwziIa5bZ9IszkR/QG266p70SmjuErM9uyfAs3ies7I0kMnxRRr7
-kpOZBVxOt+BRwRdKFHSnZEERqhZMd5RUkrUez1ttNh7JI6kL5qCWsiU9UV/plLeIm4VyQstQ
-C2jldYQD8iTcwdTOzd7DTBoJHtWAWXY4xLPxMdrl8zh7A4ZSPhjDa7g8tOAScJC78xjXNpfg
-lm0HmW0C+GSqwCq7GR7QG9f5n6ERXocRYjPUlT1gm6wEBdQIsOo2rPDeQ/LQv5AuNAaKeL1d
-h12HtDIuDhX/wm2sCl+gL3fiJVTfPYuG+ge1CHLwpeAi3dDR9k9TyvYxo62vn9EQ3Qxq6A/Q
-RY+ABXoDZ9A/c9pgBv/te5AjOMsVtORRpjQdtD/RErdFFcUo2KMOw7bQay4XdYMoahapGF14
-R9RGyBi1A6eFs4lzoSeYw+uOk8UoN0Mhsca2EGvNB5dDy8GzBTiBm4WVZj6tMGH+1RbmwZSU
-F7gu6cP/USt6xpftN0f4mfGQPQu5aBLUo35w3u6EQXYYFnCePpH/EsPgA0bDC+joPPMKXuUD
-4g3PVPM5c2gWlQ91t0eUNZnFGPuIR9NuysBZSfERdxY/29/d6xJdME8daRaHLC6jzvMT6s/5
-6C/KQ8/tEZrheqKVHc0fDHJ6s4z+0YaE2cbHTEkoQYvgT7gIDcUT+CFi4TtRE0vLzlhDdcRj
-Xi+8ElqLa0M5RHfvozBypLwu+ska4h8REkOc6bSHE/SGc7qNfG+ywhFHeS9pJR3mWTYbzLcj
-YSVlwTsumWpCe7zg/CUZ56eXlMNU5Fh6M98LJvKt4C4dDUrQ6qA0bQse01Q9jKfYwZwWblMD
-4dEg2dfOkt1sZ/nF7pbnqYUawVNdr6+Ql/gQloP5LDAnvcM8tEqk5+FiLo/FZI6++5CG3+gV
-vqM27iTv4yq4CT0hJ0zgInCY/nLXBLc137gpF+eVFE2ZaCgPp8KwxrVAf/zBA2U3PuUczzhP
-P6QywTO1CqZ4GyFRqAPM9grDFdkcBrh+6cD1IT7FgGF2Of9i4/Fus4Wym72UxQCfM2V5oS3K
-/9m7dMWuovk2NaezdaGKeY/LdF6ZU5eXZYI2ooY/HXv6jvuDITDP3OB/aCuNhvh2MiYyWURH
-E0d2todUWnoV8mhg1AR7MWqX/TkqJk8KX4FY4bdYOmRxg1qGRURlrMRhRCswocmGyggcYFpA
-JruGV9hOXIz+5Vg8EXZyRsfe8XE+T4XxVM/1zEBI7mazki2E9Zw9ZnLWcZneQQFqg42oiRjC
-vkiA3URFcRueipYcQ/5HyWQp7iLL81a5m+rKOJRFjHTTV942otW2l51I42wZd98FHTNMpK02
-CY2yleihPUnnKD4f4ni8l1PzGddjG2xJuGhyuD7fgddMKuxl/uEcZiXtMf1psSWaS2v4A5/h
-lViKa8s9NEml4KMuH4qGE4pyUWnk1CgrnofTiUfeISwka4tXUEjW5wXOKbLKebaCeGnGYwz7
-DD7ZRq7dBNSAuVweiQ7jeBqJk2kGFOMT/MPxzVveR6l4nM1IhcxKW0inoLtBXv4eXOUYuhp/
-DKJtlDYmorXZaA/bLbzFMYxPY2VP6qP+s3G8hFTJ20/z1WiuIn/wLcwGDWAS3KHceNnuxoX2
-Pgr3qlPoA3rcWpThR2Iwj5TN4LOcj4NlJVFB+PgfXIH40Ibfs0s56E67XN+3hG6UhvPSWNuK
-ppqubExDnEYr5Bnu563mTqHNtDGkbcdQNfrP8W87rxKw7AhTsAVkcFz0h72APUxPUdAcwPTm
-Ji/SJeh2kMJZUUx+F3zjzq6ritMJns3JOQPU5Y18ws3EFFHLXpYVTBk1VF+SUXqROO+409NN
-OLapTfPsWxvLpc8kaGO3iAcmo7fY2NBpkyxK2SlRxWyjqL/sznBGuhaK4rleGVAqBSYV9+Am
-v+Jjtiv3MeUhqYkrFpqaco89L2ZSBuzuXOm9nc3lqDNU4U14yp1RC04q1lNhZNsLBjjuWmnn
-wWK6D90YsAeXxtTcD7NyU3zGybEC3oTrIoe792jqq1JQM1WKXsooTiMXuT6vx3mwFk3hPva0
-bW2Xm7hUxKTlteY677B/cl/qTJforZvW7bSVs0B+txsV3DXBccXPlBOOunPbqXdyF72E++ja
-vF4voCrmsU1qX9u6tI0GQx2+J6rwJMcSB72yfDQUzRPDxvVHalE96pxoFl4pynsFxDRRUNzn
-O6IAXZQxKZ3KS8XkRrsHczjWq2zTQ07q6xzoucuVi9BNdHCW8RP0xrpQzeUsUS3ITMUgsbO4
-pfY7ZTUn7b/BZ1M46GNqBRGdVY/Sbc1Evcc2MPV4jq2AnSmOzEnXZVdbWRazIbHJvoSdzh5T
-wnrQUAkSY2eOgbsoMSanqvjNvsXTdEN84s3yFGRQOR2x5cAkKgsmVE3xhaOS+nKCKCJGi+TY
-CvfCd17r/JbcnO6mkzTQVmJtXnF7Gwer0S7xkhqrkTTUq24Dr7qZ7pUztVU3W0K25Meuz1EI
-vM9DoZvdz+N1KW4bTONezo4r602wXTeHRTo+fNXV4L05CqkphE04MTaDbI7p5zpjGComu61L
-ZrOrKuaCLG6ai5RmNczQC7mbHsU7zGl2BM7fUdvTkvUx1Sko5tUJznqv9d3QWTs7PIkgXJua
-eUlpnOxDJURvXoibIOJO/SH/hQupPk52OfjW9MLY9hq+spPwGM1y3ujzD/odwjzNZexaMc6R
-4p9cEe/QEdfvWfmoecOtzAj83a4VaZ1x1oNibiLX8s8YTU9xOb8UryGG61Rf9YRC3l3Kr77a
-zuKjfQhJnWl+cc1xyK6hM/Y/G0URM4gGmVw8z1zgryYuzHGM2Z+ecz7HkLt5BxaEFCIRlHOv
-rTmmzcN9dQYeFuzlysEcuBfcg3hmK/9sZ9poW9hommfCmIx2yWocIzSUy4ez85xwet4bvuEu
-hbnDcYXxVoma6rPoIqrJA3BfDuTUaiM1k2Q1drVvHLt0hFduyrtAXIzgYFcvuTBaFIZfxP8S
-ZhUdoJ84tf0TjpmKeNa5e37zjGLqDybwK5rNfm07J/ibeptHVJuSUFNO5Ij4D5MUepm38NHM
-wFJ2BBayDxwtRvMkm4xHUE8axHHoEycm4QyqA2xwHl6bt8jdkMMDscEb78h5t3ikvoufVX3p
-/x9H5wBlV7aE4ara53Zs2xPb5sSa2HYmtm3b1sS2bScT2/Z033v2rnqVt3r16qxe3X1P71P1
-/9+XlhloMnjxTG5vEbUwragfbsHckhHWui1c3SXk864Zj+AB8piLYXc+RDvceDPdFfK+uode
-FP7hHXaNvWkusrGuDSaWrJAV8shfyq+dJY7NzSNCu9yn4ASuEMoIwVAttH4R/NOVhc48Xf6S
-7xKANrgN0praGMmrikNMG3AYJhegjvsER3zByP5WKux3o9R2Iq537dW5a8lDTZVvGN9tpkK2
-oTnhx/JW+se8FLZ7IKvbH4jDMQLFubc5rpNXzOWAnu6UbOCD0hJ6ynaMI1EpxNsxs4zHupKe
-6ksR01biei8lljcTXtJCyIqvJRW85sSwUBm8i20JTWy41HZzpTXvlCTyS6Zo42VUcsmOY6Uy
-FYSaJjH28/Zi98AebBkwmNS7L81pmbbPVZdJdriMDBxyOfije+e6usrukX1tT9nKLo3rwtvd
-N9nPfyiJtcd8mAJjYQjywEkYxu1gom0OA/0ZcCu0FWKFbsG74CmoFyoM/4XaSRnbl8N4v3so
-p91f1IbTBW5x9EjJ5WqkhRIvMsH7SMkheqTWsCGQGkt7bzC5KUgV6Acuxm54HHLgammLN5X7
-3vF83YWU5j0mMX+bUXTIbEPPPAerzvAJRBbLFwk6X+bYoFzxl0sS/zFHD/3+S1l53N9BdP+G
-OrlX9rObwbG5sTx03WWriysX3BJOzF30aY3m2x+ymXtIFE4rOd0ofmcj8Uh31S3ke+6oVOBH
-8Lcg5cdP9JqaG/CWmnleUe+5Fz2QMNAkEFefRnsTvb7mpslDXyg63sFcMAImSw9pJih35CS3
-gbH8FP5Unhjv7tJ828EMs9tNSTfXIP+gSlyWkHvgQPdJCrjvrqb74e90hUKtuE0wr1wNvpBH
-oY5w278Ps2w2LOlqYEwehZkkBnWAldQYfbqODc0Z3GIcNDWrpBF1V8ab4ZLhD9sBjU7ZSRcT
-x/EfkF2y6vzn50HY3y2n4W6kKc9VvIW83Dvr/vR22bGmom1BPexX+GDja3q/lkNuoqTmCH6q
-1P+PdOK00I57QjoJhwkQxMtYzFSgMO8uPjavIIWJDL2pgSSmuXwAt7pEynzt4bNmfSr7XsQO
-UmN5xldlOnfGizyGRsgAkxSqeEXghNcIEgSWwRNvGSwxzcAjAsK/ZTvc5GkwnJ9IHW6urrPI
-Rud+fhze6Y/gkq6DfOGucF5+f+VuJ1aHPVhMyX6FZMadvE9JtSy09LNAklAe2BFcJ8WDk/lY
-xByXLVjFbQrtd57rxx784uPkuIS3l895M7hAAORYIBbUCUupXjQKj4c1wKuBgpjFa4l/0wSs
-jO1RIAWWwhi4GwthGmqNw2mlTsYPrGri0wJj8YxZqpz6Q6/mb8gM1eEh54Vy7px099OLF1rM
-pYLDOUPwED8Ohri0f5+X29TcwaV1vd08W9rdtAvcRr2yeRxVFI75GPfhYjxAp7GDXe+cf8wN
-s/+5pkrhH1xaac9DoL9812u6Tisom6nrDTVLA9bYwDLvdcALnA+c8HIEsns3zS4TnTKZKlCJ
-ukt5TA+dYZ362hZKLCfoqytKO+15zGcf4lpbU+fiPpXh6GYVt9cmzoIlOT08Urus49bzJ73G
-R3atH8flDR1wjYP7eFewvjwNjRXPLpMUSs01OAkMkGZ4Bn5ShHJFKSJtxfPGl71K95fNE7fd
-/Ok6mmouv0nO2+kCt0Hh89Jad7COkupiTMtbKBpnNNdcfTPWjTAZXVfz2oKJ6xpTVTcNE7uW
-cNX+x86Ku+PWOe0oFwvWclFYLTWhDryGr3ASO+IymoRNzd84zZwDMsulCp3mV7iA1+FMbodh
-jJjRZYYL9rU69n5Xncu697JfnWw0L6doUs4MkzOmEET1kiJ4+zGRtxPreyXws3kNi2kZvISo
-YKSiuuxCTuE+ucJurJumvFifd3AGSS+rtT0iw3SJBQlhkaTBkpJPT3sezePe1MaloPn+bNwc
-/AWzI7LAu4gkEjUUnzlUy63xn9j69oht6M7bZ/yH+wDWOTrPY70sMjvQWRqFvZaJYVshfthM
-bBUoQoO8gdTaDKKJNIjy0ghqQCPpLI2nvKYKTTXz9A48h/LeNDjkTYWf3kEY7e2GdKYo7IEV
-kkaTb4m9wunsBv7Pn8ir/Ir8hx+dX4VOuUh+fTfGj+m62Wwum9vrcrrBHFvPOou2exJXAc7a
-QZDXPpW2/ld+F+rCuf1hHNLsfWiLKef3kYyyRkk7ClTCtVDEDMK8gaVUMOy6KR823ZsbuOrt
-9m56qbzDXi9z0ttDt7zOlNFLSjWoPGaA5XCWzyoZtMOazLjPLaYbtpZpZ9eY2ba+eWuf0h+u
-FVV247GH6wp7XW15oyx01xW2t9zqUCLeF+zPTYMreE6wFc8Ihdwv3+Oa7hVv4JKwU8rhZ/WP
-2/IQk0MhmgWPaCdMM6Xhvuknc80r9ukZ/01VpQLtk460Q8rQcn37qnrHe2JqyEP/SB0aKQWo
-s9SmbHKaFrClq64/lXd1Mbk7L2EuBT+xIbvRPrPr7GZX3KH0VPI/J51xFYzBs1BDX07Ht5Cc
-HmKAUpiX8Mhkkvmml5tDZewAPOEfglt+YxhoI+SiyyrdNYfPQFY7FNf4N3GFrUjNuID5LvO8
-53AtkBB/BOLgR288DjcDKAvFN0lxKuWAhJhKHkpf3iXrOA6QxFc/Xi5/yDtuKfn5gwS4IyxS
-4zgizeUOIBfBDpZwqv8BFvnvoIffD+aGjsvzYHqJHBrGC0N73PVQWncglNUFQ3tdJVuaP/AA
-foYb1MMq/v6eXEjsnYReJhv2Nstxn0lIJ8wiOmLKmn/NBZPG2266eEtosBcbr3sZYZ16bN6w
-D5AgrBn2DiTDXF5HmEMiXTAlfIOpsAZ2QzR4IimlKsfjcPvNNrKH/ar2YGiobRZSw/OH2Xm2
-vH3p5toMvNMtdMnlss0LUe1q6OMPhbuhOhBQXi4ZLIS3I8IxezA19QhlweT2onx1GZXreslF
-TAFRzUxI5u2HC14IYgZWYO7AZPrijTSNvOzeD1PAm2/umrxmknlJxUwPmkpJqS0Oo/9kkFnO
-3bx17oeXwt33irtcHnEls4AHUg1eiXNdc+ji3nB83uCu8QT7hlv6LXhkaIWrGorszode2GV+
-Bd2tmy6J++p2uNXuT96rPHuSQcbAAmXA/LCKSsNceiUzqYbaRTdeaG66Wt4TV93rwIPMNOmr
-xrFGXa0UpsS/sRJewyJ0FtsbBs0qeW0W8ysqzw1wlvrHc/5N8Qm5jJ7lZ9edo6nV9uXzvImT
-SC4+LPndDlhmd2ECl50acTzaKf/iGuiIubEdzMU7DJpZ9WiVbUkjbSTab6tgdvX1g6651GLh
-jBJF6oFo61/h5GY7p/Nu8ACvt5TyZsETMwU7mbd4nw5jWuqP2XAdNoJqlBAmUyI4hmmhEjSE
-D3wf8vBurMST6T5voiKSgn5xdmzI26WyUmQ5eeb/A1dCrXFZKDpuD6WFLqH2ci+YSSoEE0v2
-4HG+Hoyi+VlK5/KCLea+2KDb45LJYe4FU6QrJoEArYG6NBZ70xuaQA28KZQ8MIt+eNepkNfB
-9NfZJDMzsJLahsWnD2EdMXmkxXAhbI/EC0sn0QJx5b5JIOG0i6fSL1ecarpe+NOKTLddOInt
-5cL9XK6kzeQW2pf6tN8WcMm1D45obsbgn+6Q0ud1O1du+euB/C74X/A1LowoRwPDR1Gh8AWU
-KWIfJQ19pK72CU3i/GpecbGGUs01XK/k+UhzZhY8pt7Y0cSiTaYOTTLLqIJxlM58oximMpHp
-gzHMCchhUkIH9cCZpgQ/Nl3cMS+ZuxYQWyHMt48D5dxC75omTBMlku2cng/wJc39x/4lLuzn
-kxz+YVng//4L92vlun3ArR3ycDfQ9XDV3SpX1lXmvq6QMvIq+ZdLynm5wSc0pSfhEQ78/goY
-1eX9NIY7mKgC3jj1lcQwxRg8Rg4T03b6iOVMDppvalAicwK/4XS4DY0lJEe4huzmV/yNE0p+
-WSc55KxM4qqy3h3jCu4eV3PbdDZnAbhUCK4eXnB/4SAlvGh4WhM0OlREI+/A40uQ232BcjYf
-dvTLYiL/BpzyQzLeJZAzMoY3Yz8+R1d4mJ5NHG+G/DKDpKWpIRE0XA5RY2hFG/EIHqacGNd8
-BqEH8JoidD5L4kO8ih9gFh2V+GYLxzSReRnddanoi2uMn5UXXrn8nImv2d28128oG0Of5GSw
-FSQILoZtEW305RFJG0ooGfzL/z/nzOrNlSzzafuBl7i5PJobcyU5wf/JfekA4dAItmJ+SE9j
-YCJVxUhmJI030ZXe2gaum2Zhg0y8SP9Sw0jxqGakPZgh0hU8EDYfU4edhQKBm3LLpJQatJhj
-o3M11LU/SVk7Vhb5UaWTf4oP+se5qr3KC+0u7mS7ciw7hY1exTK7is9o/nzgYvaG1A7NhFkR
-jXFMeHPqHd7feBGpvW0R8b2NwQOmqF/XOHuC8nJGqiQL8b3O6FA6DP3NKNhq6kMVzdEflAtv
-0U5cSxewOs3GP6k+TqRGOJ024Ao6ghEUhjPMMmnmNeScgWeuSNgltzlshlsXqOFOm6xuHOZW
-cqjlDI9zsVwY97E3OKN6Q0m7RVbbndLQPZfq7Ms9PiAJlL1qS0i77BPHE6M9V09S8C1Bjgex
-OQxmclDfrgXs5tw4ng9ibX6oU4BUQgpTVyhFQ1Gwg2ZSU+2q2WYZfqUTmJ8eKeFvwhqQFkvL
-HNjJTaGLUmlJzgxN1a0X6yMV1HmqrN6cHj03FZfbLbhRe/mLjYllNUMXu6kQ4YpBHZ4sP9WZ
-DCxwBbC//YX9/PcY15+J0/wheN2uwSqalkO17farxWYnJV8zVnqZd1zbHNU5u8/9KI0EaIy8
-wchwB3fCCRyJp7CKOvJnymgqays9pyTedbxjTkI7c0+e0E99n5RKLttdOXrvBmNj3iI7uL27
-zIv91ZwpNIFTBZfw2ojPvC+ijVQPDpH3wWRyNbScM9nu3NHNZOf28AK3j6O6zXzYHuM7FqWr
-my1r3FHY6SKwAI+n2rKI0uJ2Ok35TJj3wcQLlPa+BZwJD4tv5kdi3BlpOB6PdARHR4pL08MW
-atd30VwqLZ+wvWb8d2X3DS42zHO35bH7JV9cemjkukAXOwIu+WXhuL9RoiqRD1IqvWV3srXn
-XXs33ebk8r6R3KGLMim4AloH5+DoYB+aFixgrgd3mdmh4+anP8accyHqJQNoh/ZmbwwzFzGT
-2th0SoErMQGm0aYMw08QB1tDKu2dEIyHRZoiMWAHTZdxpoRE9Z5yTa8aT/RmuFdeCVckMN5h
-YJfbYFq73Rhum4Lnrslo11aSanM+5m9uvSx1KWChekR0/iH3dZM3S1w1g8/SWX7JE+XNRFIY
-MuprH3JZOcj7Ne0OQyKehQXdU0zoXuJN90NdfhfuVy8rKZWxpczEanAYp+A83Z0SuIO+QHsa
-BWMxGoyDe/JeP34pGQDbeD7U5WFKcPVgqkSFabBS+mA+eY4JJCEllWd4QQ2nFe+BmBwBZ11k
-XOXGwgnXXWryTCW3iy6L1HNFpZGrJPfsCImi+1/JzwGZ/b3QyubAWlxKz+gGxMfC0BYvygZs
-ICcxr8SnY0rGc+ES5sfk2BRDSgmJ6RxuNg1oiXeTVnhMt81b6qtOEsdrhaxcuDbQWBoEIjiK
-d5Lr01z2cBTHhTZ8hhNxVvfOjfIDnCDUlAcHx/O0YGe+HZzCnUKfuLKfW9BGl2a2G3fWRo+h
-7tvLb8OfQoXlfOiLlPDzQAGbCaYoi7zlJ/BOjuMMuPL7dxiaFfSX95eXw4OwBiZOpE1UN9JS
-yhhpLfULa0U3A49xfaAH9go8h4neIVlA0/gLhFwn+M8VhHhMcMs9lBauONy1MTCzHYUj1daq
-+ilxu19aH1Gt2T53c9TD/+Jfdj/3su/5l99BMvrHYEeoKi0OFTFx/aGmqK1q0rlPNN7NVH7q
-QZPdbFrIZ2izPKZ5sJY+QmFaDtuxuLL6PXkL38VT+n0A+aCVTuYTiYpX5CiKFKLTkpUySzoa
-z0QFuACl4Q3aQRnMMLfJHLI1TWRbmKLZxBhZzWwZW9kqV7RNd0p06SP/cHH5pnk0Qh5IAqgN
-R+AZpMRDUAAJKmAiaYjluTuOch21Yf/CdC4Tzvr/Xxl7CZZ/QHtJgCcE8Lt0grvyQ57r/PWH
-vtAaR8NPjA3/4SYZiodlGPSAtDIdi3BtGsXFabC2dDw4IAjxJZJO7BxYptO9Qc5gQ7mKCWUN
-vuIWeJYPwT2uCY+5CQzhfPDAdVKbr6q0WtbNkAY2NrzwL8khv5as91tKTHtFxtj+MNYZrCP/
-wHpoqVdfhDvj35wML+hVxsW7sACDMAIXYzFsSt/U7h5AAVMHX5rIVNbrQk29rDTLW4ujvAu4
-yCunJNic1ipXNTWt8QodgmdYBd7DQ0kB1WW89OaR3NhVdh3sPT+77aTecTyYyO0K1nHzQ7nd
-Wn+P3eh3s6X8RdYP9Xdt/dv80dcc8M/BAb8PjtfM3+rHo0P2LQ7js9gcotJfuIaWYQK1o4Ap
-bs7RZ3386wEf84elpzlhi6h62EfaEbhIIS8VVfYyal96UJ5yyleIJi2gpByBpPI3Aq/H+rYg
-Gr8G1A3dkPahCEnuF4V8thTkcB00lXz30RV1fZXj8stJ91YMF4FfbgBUdy+gq22P3/wsFNlG
-M+ftDnPCnTczeLn67xvTBap416CCdwxOmEvKQVOgBP1QG6gvjfAZH9U8iwrtpLBklswcwXFc
-cWlhE0A6+xmq2EK43kbCvG4+XFIvL8b7Icjb8L1soOLQlt7LImwl0bCcEtsmqYtq1+hzFozJ
-z7QTdsNHFx3Xc1/cK2txAOTB85ALcui0BOgS5zfP+a4xMtB85XW6CbvxhM5nXq4I9fi+nON7
-Mlm+yn+yVHnPyFyZriSwiGdBUamvaXoV0+IvKIVJJAaW5ofQmD9BiH3YJa3gjKySRDBIfM3W
-b/indkFGeE+rZIhSTl38/T0v92SFlIZsEg9OcwFtrIIctMtdO9vWRbdDXXn99w070RVws115
-tdAPdpwLt1/dU/eUE8lN3bghcBKKYF6sSw2xlVmBz009GmWymMl0yOzGByYXPjWxMcIUwvem
-DF41YbjdzIBVeif+M99htHcR53tzyWiuxjXX6F+MRvshshpNBZgnB3S7C0pJN4Q/+HmcDe3z
-N4V6hN6GJgeT+RWDDfxOwbL+k+Da0K9Q89AZO1czNba/BOb7s5BsXJpg21J9d4qmcmFzV/aa
-CHhkLuFg3YaYZiL9S5WMZ26azqa119zM9mKZnd5beu0tp95egLaaBpjVHIVYBmAPJdCcisZ7
-4bs9JDltL5nvP5fwUD3YE7oGF0L/QCof4b2/WSLsHPnuRshM5f13/EzpP53ckshSFUbzWrjm
-BIa5GnhJyaoyR+BT7k+phamUDDGj5LC5KvG8BbDUY0gQ6A2dAo+lfKCDTPRSSRcTRQSFR0ME
-F5OP/Np95rL2OB8JzeIPwTK8I9jdPQ+mcp1D51x1/zmvs1EgMr/XXVqJcSANPYbU1Blf4GZ8
-gqu0z9pgCvoXQprGAVos2ZUqCtMg+YlT5BCGyxX8B/pq+3WERthERuIlnfLl7NFeLkIfOQ6l
-1I9aQrLjn7IKeso32SZNZK+c5KESiyPJUxdf5vBrndRGsBKeywvNzU9wROnooJ5gWRkKWSE7
-zNfn/dAdnLb+QLXwBlQarupstqWYsBIzgoftYQQMhfMyDQrr4xzmwRCFf0pHl0m22Klc0abg
-2jqjyW0bG9m28ZPbV6G0Npu/2Fr/kIvviklZ7qTp/kwb4TAkwSOaTd3Qp7u43wSogNeXCntH
-6bmpa+qbrN4uOuuVoeKBF5gvUA0PezOgmJcQwk02uGh2QyXTAmdROM7EfjQW1hNAVfomO3VG
-30Jf/exvupo8zp6w8W0mP62NEYphOwYn++mCEvor2DH0IuiC/4bqhNLZ4f4SN8hGkh62FeS1
-+3Cd3U2PXWzTRCy1g5gmBfY3J/G+yU0xvIP0xQwxM41vxhnydpppZoe5SGNMXUphKtIovZqX
-2AiL4EWoCdUhuuSHZW4TFLapsIhfFW+H2uK0UGXMGKqAd4LD8GfQ4OPQW2lu48h9N4WjavL/
-1DmaBWPkG5yUarhVJ3yCFKMuMkcnohF9kFeYBr5iB/ibFkNScwSOm8uQwdsNrb15sMGLC6Cz
-mTJQWMZ7SSWTOc/tsJ06RGrOxuxu2a3uH7+06xeK41oFu7iTETfdvYj17l5wqGvq73brbXMe
-6zpKYa6qyRPSbq2AWzEJTqP8algB6qfuf06zojReMu/hLzMJNlFlqEt/QBALQWe8B4g7MN/v
-n3SRcbpDVWmFPFaT2Is5YDMCtMORckwbbqHMllIcLn1dQ+juCE6565yL0/Fg7srbOJPkkmcS
-lDDYA5MkJ77n6rhaE7u2fAY1EqiPB3U+j8E7WA2LsRssoh5QT+ehrdEzoyRYHhNhYbmnZDUC
-XrvEcNOdlrhukjz1hSP7cbiMb+1P/4vf0Db199rx/jfLfrhtaWe6k/Yt51eqQ2aoL9fgMYyC
-4oRYRLPpjvGpvjfTjPNOmAx659ua66Y/JfYO4AivK770UuI2byYEdTbLmdwwho6rO63GHtiY
-6uA5WqOWuke2UBGJSrElDoarJfXgAlzBvbD97VR/vK0ZemB7BVO7uMHoLmewpF0TLOo3DO0P
-tfO/hkI23HdcyD2HVy4n1efvBDLRPJa8+qj7vbp019Pu8J5Qca8a7TL3MaPO4xyyFJMm0TOs
-iPGoCJSlz0pzf8E2vA6P4ANcl2own1NIY9eHq9jfvl4VzoR6Y6PQUQwP+nAnWAkGhBrADf8A
-tHBVcA4vxQryUnvpmMxVsmqC7SWkfFaNWkNzKgZDKC5MVcetS5GwMp3Hs9RG6SakTPwM0ng1
-YIzXDz57WyBhoBjs8KLLE2PdMprjPmr2FpNV7pySQx17wD0K+XZwsKGtH1HB3g9fa2NF3LOH
-IjbZD0E9KX+7S+Ym8jueL7chGvagcjTLXKAa3hba4g2ijd4d+sPrZ+LoXp7B7LodNygJLKPz
-0oXuSgblgbu4A0piBKTUCSoq96GYnIbd8gSy6YmUhpFwQ5bJUNnOTSQTf+f8fJznsuPdfIH7
-c0lupuawhstzTtnIv6Sovt9cmYcr5BwuknH4XMroZKbGixgZ2+jUNCGGjHQbGtIyuEjdYCZV
-h/44FDJCAC33wezcFf9zD+GhiwXlXT8lmgc82b/sODTLxvbX+Ud847e2C0OH7O99XR3q53r4
-Wfk/O0GWc1RMDS9014pSSzNO7/9tWhPIYDYFBpjOgYMmQ+CWmeo901PIp/l52jsHsQK9Zak3
-mHuZ9JyNdnIHTZZv0BXGgDItLEMDmami/E0XOb4+l8dz3AWacx9p7cpyGxvLlbHv/NX2Smiv
-fRzsZpsGY9tdwZz2fCiKE/+Vy6okMJZDnBxiynksKnlMZYjnjcORXnUa4V0j9B5SBzON4pgK
-dJ0O4nwqhTupLiYxibCjiQsNTVK5T6N//x8PD8Rumn+TuLSM5UvuGA+2uaSLf0pWhXrA0+B1
-SBe8Ca8jrsCoIOCRUCeMaydgTZcQD/JqaAv94D22VJKaCK3NFdhk3sIPkw7fmqH4lzmBUygR
-xaZk9Fr38oE65HssiGmpJXaipHieDkJ90wbOmE9y3RSRyaYvv6YHbgPWc07+tSW5sd1uX/n1
-/Is+hvLYtREr7PrwH3ZYeEWXKKKAyxj07fbQMrfYRvBUjgHt4Tzkp47I5jP2DyyiH4FSpk2g
-vVnmdTJh3nDT0eQ1O/U03uBFyo4DaQ8MwcHQ+vf/Dsg+zcih0E3OyTUllcbwL29WXxmtZlQf
-rnJlSK+uWFNN5ZDu7WrbkdM5cQn4sUskcfn3V/6bQluJj/OlLF2SziY5XDAdobZydV81+234
-FmvjE0qHE8xhWGZyQHuzVB5oYv/CptrL/8klWQg3+aNa0TP4aA9AJdsHNvoP5V0oqiwKJWX0
-Rf3D2FS2kv+H3RbKZduHvto1oWz8t19CbthssJqTYhPYhycwPkXQeUri3TEJA0u8y4F/vfRh
-h7zvgbNe0EscqGp+eOsxgbdPr644HKALuknt1Uizq7dl15SpL52hsWyUWrKDJ0pxfiwVuRpM
-5tOwkRfpKRyW4u4Qr7Q33Gab0A1wTWxS7uRPdndC+20+/7otbte5mW45v+C06o9ZpBx2lyaU
-Coqa5HjCNKfxppQ5ThNMOupnvuAlSko/lZdHYl4KwhPdi9F4RJLiLDZYxJXDA3YEBtxi3K//
-zsSt4Lr7W/a6KtyTH9gSMsX/LFNDkyFy6C5UCqXE96GRONr/hUVsTyrgNBG5J96Ab1CNfsJn
-nf2/jEerTRI6brrhfOMgn2H4QD3wDBWjCtRVr+ImWoiPr6EFFMYYsBMLwkclMMapEo+m8E9s
-46bga/sWGrs38s5N4CuO7Vvts8d++9Baf2uwoG0VvGObBKO5wcE9NmtolT3n73Qv3QD5KVGU
-ml7jYCLdyQBdMdNpqDfUXPGaeSv06ZdhE908pCr0BIM4BJ/hKOyiLrFAyfCtTJcBmn+NpRgv
-lwn8QeKp4Y/Ue7REBnNTee0ayXq3QCq5lbLeLpJ4tr2wH0uO2oqCfFtaSVK4CkngCy6XnVRO
-uplE4EwvLOd1pXxeODUwuwmpAQE+07xsYz5LXvNTdtBRTdic8kaCvIlryWr3SiftD+hpd0iE
-H0Wq+tt4a2gwVwtV4tuh1y5gwa22n/yttoS/0WbxI+x5P7fep5dCXAirSXlaDUfoge5dMjOP
-qnp9TdHAXO9GYFJgeWBmYKf3UCd2uZfXHPem0UQviHc1RYaQlY/qls8kH6Occpn4nNvvbrju
-7oOr4hbwArdF3rhl2tE/4LxrDrtdN7nujnAYx+ckXEppdJi9yNFtAcloO8gzW0XYfVLaOc+p
-ILf8AgNX8BYMp3r4mu5gHLOG0ptGJoPpbR7RDapJ13RzE+B83KAeFl3bKooMljMusuyx2aST
-PSUn7CzI4HJhVX38XO6jgLvJaVxyfutuq5uPcdFwow3hRT8hTffX43u/HB62O/CdW05R5IN6
-cnOaCt0xDR6GDxgJj1JkyqLbkcncIs+UpyhmBmY2f2METcdaai2t8Qc0hRRwTupJQigkMdVJ
-Uqm9Tqc7/A3vuf3wzq6UBTaT3vmu0s1Nl3I8npvwfTWE6X5i9kMxObGflHv7MXiMP98t8Qe4
-IjYW13TJZRUvhqvqPDchjEpTJ/plHCUMNDV1Av+au94pg942JdEVuqdWmXIT5MdPUBAdHIIs
-8FmYq0i4SybLXC1py12lj/KkLy84NezjaLCAPWjBf8Eb1wuyKB02saMlvv3Av+xOPqjuXBPW
-SAA9iIC0cBMiQ0dl7Sc0Bdt5CyhOwFE/NeKP9Iha4wfaCqnMFrits/ReqXcJTJU3HE1yu8ec
-wn7nhX4yae9nlab+B87pd+IEvnVT/DWujc2pJjTbjnLP/eOujR+Fl/qHeK19KFE4AWZW71so
-j+m+hJlHkFh9faBJ5MXzEmh+tgxs9fIEyum/0fvsJfXKeTm9KCaS1xiTm7NSF1PIKkkuXfgL
-r3ZDeYR74jq5jO6U/WIL2wWugH2ojxKSmS4M2nKYrFQnmMYVuTGnkmZ8Xr5wGxknfyiZZnVj
-pYRrI/35rWSESJhfraY1FqLy6qd18Tlexxq0lIqawmaDKWe6m6k0lfLgN7DSTK+gJ7+QO+6H
-1FWT+Gpn8RBbhpPrCee3iWC3fQ7J3DXo4OJAuMsmm3gdt5Z5nA9G8j1IwDlwuJuBxsWjz/Yc
-jXGHzCS2Zpl8pHnKTsVwIOzABuo+HTG/OUOLTEEz0dwgNFZnIRH2xP2wG4Yp3X2VrzJCXksm
-uScHOCR7OCk81Tu/l59IH74kYfxdhrtyMMbVg3M6BdvdURnvUsoUl45vKs+04D32FsdxATmm
-rfrGPef+biHH1JcZdLN810a78jjthjlmN94yI2iqqWjCyXjjqbVXhWJ7NzCeiYNX8S+9nr1S
-EOpJa0ikznySs8DfPFWqczs988MyhuPAa83Q3tJS/pO73A9q8wM46g5BP5cNVrh5mqe5JcLF
-lRe6Fwm5hDzlq/JUNsB2yItNsSX+wt64gs7hMN3VmN5C80jzIqE66WuMwM3qYwb6wzXJANOk
-i+7BAj7DC10Hbmbr8Hp/Grfwv3E8v5UU9IfJZj+2xLbDdUOT8XPNtYm8xr3h4c5xNZdR/nJV
-YI+z2JpjmmzSzLyREmYdeGY9VjCXKeAdM7u8v7zIgT7eR6+e199D74ym12NaTBH4EIPwClZI
-FOjCa+SaqyYD3BKO7x65traP6+d3cwn8oe6eP9H10sdNKG10gr7wKL17HbmAzHZD5Lk7LEZb
-Jg2EyU/dYYEhXAUSS1rIDmeAYTg2wLbUG7OZrVjZVKNi5iuVNp75qc7agGZgd1wKJeCBJJXW
-2lvxZJTbySdtZQ73Q66Y7iX4U/i+X1+audcym5tBb5kFz3X2F8tYmSFJpCE84aH4jDfQI85l
-bvAZyiuldEc/Y3v1vIfwFtPiVzX/TbhZ+/ILjsTc9BVbUW3KT0/xpzr0LhwFcTAAmeGymkOf
-318f5omcguPITdddc3yC5OdKUp/v8Tt3gee6JNqg/SS9eyhHXXK4qHNySg5LYUgrZ2Uax5cO
-uuXzlZJP8nb5R126P2eEeTwR4ssXuCjFtSXuKeXuoM9YxRSgP00j2q22FJ9u62vL4hggnCFf
-4b1y1FLOAKd0L4I6jzd4rmzQ69iqOXaMi0hsWSOLdTLrQx5Ij3lBuUbSwUo9xaaSUTz9TGbr
-NgH/CWfU5cvzZPjM/0BPmQFx1NBPQFJcgEdwAu2kD5TAbKHjlIOy0BAshwJ94AU4OQZjZAxk
-1ju5jZuL9gAXsTn5Yygr5w1d4Teh5dLVXpd5rpMk4st8y3Xmjm4SP3X9+Tkf0KkIqOV/tElw
-gluN53k8BaCn+Qdum7uwx0TFAWYzHjVHabY3zsQMTDczveymjc5GQoplMmI+sx7eUCewmt7j
-oKt+Rt/dBl5iP/J3v5S88RtKLxsQaxvzH+6Fa695+vs79uLq2bznfurBpeSkfFQSCnF5KSMX
-paoshkdMWI4PQAzOBIs4MXySeNgMu1JJqmLa0zjlzAhqjDGoFe7VvTiNgkuwLcbCTLBBPvNs
-N4Bf+2u4vn9Xr+ECo+vKnV1CzuMKcwqdi76urdLHSSkrD6W5dl1W9cBJWAoe673pQIngF8WA
-GkpUjUwBCKc10Erb+it2p5W4Uj0nM/2Bc/EFTMXdkJyOwmy6D23oNDTEcnpPs6nzhrujboJL
-wb9cJ57DGfmpTuJUHuOuudJc2VWXrs6DQvxOokkBaSi3uYVUlObSFppLd/xHGygahEFi2KOM
-1IR7SnTJKqxcmB16ww6pjPUlPg2WcVRZ2aszfqb/cBdtxZQUgl76OSxSKmRZCh8kTBXjDnyR
-sjBO1mlmjZV17pdkUqaq6P6EqDxHT+qcJslBtYEFsgnW6KwVw/uQTjlgrDJ2AJ5pF/WHXBAF
-CkByWCd1dcJLQ1dtgfeawPdkK1yEjZgOO9MuaK1G8Ax/Snsl/nJ4BVor5xbDCzIaCuqcF9JT
-WSQ1f6e+3S8PbQb5adcoV61RYqgpi21U6GgTQj+7VaKpD3xww5WJT0lcOSinJY30UovOit/c
-Fwx3Q2kRo/klx007HOcxvvf+wS1eCvxu4mlm3cNy5grNNG+073PTY+X/R1ga26qD3OEQnnL/
-Yhy3EbpakI/+KXfQX+CcX5tX2OS//xqO3HOjuRxfdbt4lzPaLOm1iavqjDTWzMyi9ymDDOVp
-8pYrQCzIg7nxHA7VSfgBWXXyUyLCQFyt5zAPe5twPGB6YMCMgJN6JnUgG6SQ3dCe10JJ3i+1
-eC4HOAFXd935mI0m/9h8EtU94SWuFj90X9xn9aGWXF03I4P2TmG4jMNlIW3jm3SDv9MDCVdi
-+0Bb8Bvtxz00FbMpZe5CVrLYYP6DjSYxvqMm+BkL4VicAXNxqKzFsTwQs/F6SMUpxONp7o67
-Yfu7LK6QPtowF4kjcRO3il8pBf/pcmmzBrmtZtknAbmgDdJAOSC63o36kgmiwxOoAxnxg2bk
-IJkOSyQV1AOATNgYeuBziIYTsDxEp2MSi/KpbXXBx1iSVqHTxHwH++GonJHaclgTNy3ngF+u
-FcTiRFCOa0gpvsOJuYJUZdCmKAI95Lrc0pOPp6c3XuexI6bGYrQc21FT9bp5cAk8eK17MUUO
-wEGJg13gNYzCAlCaukgYxZV0+KdMgnfyFEbCcuwG2/GynIAS0l/5bh0PkNPqwq1lsnRUglrA
-+Xibm8EJXV3Zb8/JBDtQKtmD/Mnvwu/8GDLeZofVzqnTI46UGjBepuju9pA6EkNPYAc0gr3a
-n7HhH2omnU19OWs8YGXPyt4EfOrdxF6BCVgsEAXTe1HwOs3G5ejjaViDFWEjbJLncpyjwDt3
-Fqq4uPjMDod9trvssF1+/+ywK+XEfXXTeQInVDYuJIkksaSW7OJ4oVzjSHCEU8BxvixRdWKO
-yTPurE2wR/ntB2TGSrgQj+OfyprToTbFgrOYBSbqnG7FI3BI53YDdpL0+IYRYso33qB7GgYN
-3C25aMurXa3kga620u1EtvyTh+okvNI5yAee9IGBsg7Swz4YDQ9gIpTF4nAJr0kDOq6eWQOm
-UTPMT+2pAK2i7pSEGtJaXIs3sC90pVHymhrIZhomD7GdOk9sWQHdeRxs1lko5lYoORfjvx25
-mLzcbueg9XmU8tNl95Bvu6/8xXWR8vxKTyIrXJGJMAq+wgj4A+9LfowsiXEHn4XS0hXKQWq4
-rvm3RNM0MzTT5x1wAT5CV6WM7lhHZ3EA9oL2yh43YTHs0SmZy7EwJr+AjFwOBvJsucUN9UR3
-yT+SFR5KYpgn7fV1y/hPbs4z2fEw+f1XcmNiPEyoDNke+ul89cTE+jInTkeP5ipXzsSu2AGj
-4DUIQmXdkTl6T9riXPBxgUTgMa6FC7kHlJGbEhWmSyKYKHVluLTm/PLZneYiPETPfST3UNKp
-ICl4MXd3cTjMFVLu+8X93Cx56VZKTC4r791t3u8u8T211BpcAm7xSagqz+C07IMcMAWmwgFI
-qF76DatgEcOwymsKPQIvpWCgIHTyauE5U5SqmZR0TM25Mx2AjOpjg/ARnIM7UEbPspNMk5ac
-Sya7/OLsVIns3sg0d01OKF/NdZVlqWsuiXmitvhEuS9tJRp00O0Yp5Q1V/PmnETjAsrsayCe
-nIRv0g5WwTMJwT8SH0+Jg2TwE4ZACmwBcXGmbtMB7gKjuTUYqQ37JAzeSwtlyHX8p3Tm4bor
-H6WElIYZmkaT5PdPbbXWnkROAOP4A/SRs/hNWmj+tNIJc7hFpmBRqIwvoa76V18coYlUBRti
-bN2N6lhA+zwBhplDUNqUhEd0Q/JQT5mP+bSH00k9tFwSJ/MRWOcOykDdh69+Gh5sKylPjOLo
-XJtT8Wn31HV1BfTlJBnOSXWaM1BG6UEXOBGN5Y34lGfqNUzCzjpvC9W0I2t2VpOXkE2uap9v
-gcHKcK+hEPz+fSGzZINUlkfqW9nhFNRWpogFlTTFnutnNkzJsKR2SH44x2WBOSXM4R1qVQ1l
-mxsjdZWU1uhGnoOeyotL5Bzc59rwjlvAK0mNKfAuLsNXmBnbYE/YBjW01V9Dabihc9mHBmEP
-eq559Er77CRm0xkhHESXYBeVVyf/W7l1HL/k7644P3L1OSvP4C5cmUvzOHfeBe1il1r745g7
-qJ0VT0l2G0fjOFzBJf79/UF80aGSzG2YLQ/hqSSDwToVX3mBrOKe+vqKmF5a4yK5AajbcVCp
-Byg99DG9oaf3AqZ5udB49bCv6Yj9zBS8Ym7gNvMBH9N43I0XlDaTgtKEzJcEsEuaQRepCLv4
-iDxwRaW5aykrHUFrPaswTcUKcpbjykc3iI+72NyX0/EeqcTPITu3UrJIjZ/dPzCVx+rHUR9V
-5l4KLSER3JC7MlHJbKW6wF1ZjOekBKZUoorG1aS0iyoVXQndyt5SRHf2rrrVVinHpSQHl5QX
-HCEGYmEWHI/b8RKsxcFyC9dyOzrMUc1wqWEqwzJaAkVxKJRSzs8JM2UjTJWUWEH3oCxu0ZMo
-pjSaC9bSUnhMiJ/05QZqIQWI3VSspXa7TW1yHo+C6HIKxnBT6Okaa3d15As2AzdV5n3kdnMM
-3sJ/cRVOLetdd8jrbmBLd5RK8leqKhPpnRhl3buYAZJQK8hHo2E3FlPLnCXdIJrOZnSpj7p3
-OoWZ9W0i674+Un6opb61WvewrgS0+ypABs3HYnxWz7yO/GfLSAHNhm/uO2zQ6Y+p7FFYYuEy
-GQyzNIVXqEMC3YbB6lbLIQ38qTtwD87IflQH1Xa4DJPV7TboyZMy9gJMQWVoOW2nGrSI1uF9
-JYCrIMpEzbASPFDWPIEX5Qzc1vvxxSXl/m6Lm+FuuWj80/XTPu+uzC8urpvkluuOjuKDLpGU
-4Re8nyswczv+Q/pperSFvdJUGaaJ3vtoPB1+/96DhZpXT2QV7IIk+AXi4UbdrAWwGwqppxag
-VJhFZ3KT6Y4d1YD20HnIQkMhjIZAOboGTSg3XsXB+BpmY0ql4bv6cdNCMciiPF1DlFiUAWe4
-NvLC5ZR4EtCs3M5PZRKTJlsWji5HlIHDnehOz4HK/AkS8mNlpKnQhOdCDkmiDd4Fj0MWfAXT
-4TS8VMbJKy1hJheHsuxpyq6QjZxIhuidj8wn+LyrpY/0XBrxIykvQ6UVbBHA7fr5vNTO3kTR
-4SbFgTF0QrJREQnQJ45BXzkFJZb7WFWspuxXifj9/VSaJNGxo77XUrhIdaCV2SETTHXJYVpL
-F1omR/CwtMI6Uhj/4tRqkv/CBFcHXrov4jQ7e7r5MtrOlsR2vqy1vbWvcktxpZeXmt2fJLV2
-eWxOhUV5OO3lhqaikJklKWmqzMHOMhJbyknsKwlpoaSm7/IDh8BBPAPjcQQMw5A0wk26O2s0
-OxfLUR6sH62LEJeRCppFQ/QM6vErt9e15XCbTm7aGzLYDYEunA//kMPYR57iPNmBaaCFEr1A
-DloLg6gjfMIS8EbJIUwbdJxs0lT+IHlkBBSS0jhNfmInaEdd8PfPbbWgLdSWduuUNqGLlJk6
-UwlqgZUpMcQi5uKYgW///t8XLqXeG0kn8aPd7H7ZTS6BcncdndaFLjrfd4+1Sy5LTKmmj5fh
-/7+tb4JSTFvIKQmho/ZBR7miPvRFDrEvs9QdD3JI8kkamKs9uEHfdqXem2OyDP+Cf7EF1sDe
-NAximbwQMDVhIHXQnZsBMegFdKbiOIUmYVzapOY2HIdDHFyk/PZJHeUxxFSaeiM5oL9S7Svt
-0676KLmVlKvwVL7Mw7VnLlmAM/Y/qa73M6gzXEpnOaHOZVzejot4OU0QR32V/o7ABGTpDg+V
-UatzBK/Uzpig71EKxrtEENdVkrN2Fr+0LdSLb/FQPiC91fMqwUMlgIE4DcfTKDxi/sAF3gVY
-502FMK8BFDCvZC6pndAETkZJeCxG5UmwWEltm1rieRggMzAz/NKpSEqFITtVk7yUj4vQcleX
-FrhedNANoJOuBnVzN/GLJTxtY4Dn8sgAt43vuLl8xu3lqe4mP3U7+BY34PcSl1dAfj6u1D9T
-6WwbvJVmuFcaUyPJZdJIU5NZjtAk5bj88BhvwmTKgx1MF9xptmB68wiT0gFMiQX1jBdABp2k
-uVJTNus0vnTV3Hw3wm50ke1q99FP41rboXam62ETSWqXEVJwHxAepGl7CvJCLVwHD9HDP9Tp
-ktNovIIllWLmQ2E8IQyJZaFSUkoYq6acH7Zpcr6Xg79/hhk64TBoSAchiomGvUwJTauquN3U
-xJqmJdaifpqus7GnrMZiSjhtXSX4aYvLSNubz/phnMxnZ0PZeKLfmfvb29omrSQnv5UkyiU/
-tOkGA8ppTZsgxODk2IXjYwz5T8lLYLlkwF36fESi4FPN8DgQBfNCODRX6pgOJWALnJebUE8b
-/yf//ntztWCyzNDXx8KtMAbvwGF8AOfwLTi0UIYAy1JiTEd/YRzdqbvKJjU09XrpR6orqaET
-L5M8HE3W6paXkGRKyFfcSKWSgW6Me2CD7pT9wL4tCW3dfIzFi+gzFzb7pIFJD7eVMl6oMfzS
-dKurZ3dZd/ydfozj7hQ/tnV4mo3ND21JXui+6P16Iif4J4TzOywjFem1lKBNUIySYxsqg9+p
-Jf5rWmA7LwlW9CbDAnNBNlBkiUmd+Acm4RfYjqfr+4XDH8rR22G3ekZJ+ayukRuPuX0YbrPT
-ZFuO1ttf+N72wPs2Ck63j+FPuwOy6LWPtAukiEsmP11K6c9LZB/nhX+5HcSSSDBMempWZNH+
-LCJ/Yk7phbt5NVp3DFe5WxiD0+pnvIT+lQLmMLwwS7Chp2bsTaAE3myqaFZQLaX9jvj7O3/+
-1UmYCMM5u/J8Np7kZivZBVyAy9i4PM2PxvX89LzNb8Pd7RSu7KZoS839/9fc8kJlyYQpIBJ9
-hi1qfF+pJp6i91CYesIMTAYG38kguCBWdstBmSG3pbQ0gY9cDb/xCBog200+aOQtgczeBBhu
-6sJraqR+eBBuYkU8C0OxlZTEjPwEGrlh8NgWhFE2K6S1aeCu/03e+MelvF0nx+w2KeqOyjE3
-XAZxZHW0PZwHVvEhuM55sKb0x5dSSzszXC3jkk7vS7gvCdQQCmNC+BMfShksImlwlj5KUV4O
-o7gNNNOzzaW2N0fTfg+E2METXodPuDhFaJrklzc4RR3jl0SiKdoVFXALHcLWtAO3YUfcBWXw
-kjTEGtIEk8lH3c+YkEbe81Ul5GyczR3UBjipU1qVx6i/l4VcchZOcANMxVdwo9LZXLcEb7mB
-mJkbYgcuiHOY8AYvggriKesWl/3SjhvLUZdDyrvxEnClobx7BUYb9zb70Fdua4YXwKBySGzq
-qfe4kFeLxnjtsYtXG/7wOsprs41nmIQc2xxyI+iCe6j9lESTu5Oy3msZKJ3VQx/wNajIG/CU
-a0Jl3Ua6YIfQ3zYco9pWuNAPh7b+TdjtX4c1diW8dVngNM+Qm7qHvfgIF+Xr3IxryGU19DoC
-sFUmyCUJ0/a8xx3VR/7CaFKVyoqlOdLQfJSxpgYsNbdht6mDl8wivG1O4kYTk9KaudSYEptN
-mNEkws3UFK7gGJkGSs+Skme7M5qfe91Df5tr7E9zd0Jj3fLQZRfJH8ZRbAtp7X7IKY4DADEg
-gDVgh9rfO82OS5gY5+Hv74A/qKQdRQ5pe5RWu3mkPPtYfu/VN66B97kZneBa5g5HmJRSyBsh
-yb2zcst8kmnqiDXMB3hLRzERNaJTMIsyKEfPc7movR2Ly/2nEN1vAPND52RoqLx8DcWTM35V
-+cdulZnurOxWOw6XNspfM+Ufnb3v+Ep8XCH3sI1sxoGyBf+Vd5hNCTM/9KJn2jSNlVGC/Age
-cSrYzbulE8+R9txBOfyNks6f/EKeuljwwvWCPNwYB3NHWskZzCvupo5RVbv/iZpDb93MQtQW
-32MpzKsOWFTZsYcY/Mmz1MGS65lekGfcUZ7zd97Jp7kuZ5B77om6fj8Y7hbCIDcShrrtsN7V
-xu8uA3XQng9INxonF/GyJFWD76NZdFTZ9oKaz3aXV35plzywNSSr6yZz3QFhvcbR2mg15A8s
-DdcxIXan5ZhC7/UkMxWPmjyYRHt+nNcEXngepA88kJB3Qsp7UyS3KSuvtV02wFdepVO1kqfz
-RteF0W3kpbaElLZv5YI/Fbr5KXCW3xP/1Ax1tizmd2UwzHXHt7Yh5nN39YTqwjT+Q2c7Jxzl
-DNCXv0l3Xirh6gC7ZaluYlXeAY05Hq7g+viFp2E5OYf7JZVO3g7KjnVMZDprbmt2DjC1vcum
-q3fFpPJmm3QmjtmORfStcuAoiaXM9h/XlFea1mftCj7gV+FQqCZvCc3h76F7vN9/wMvsQWXB
-vbze3dEczSZfeLvcl5ywD5ZBTTTYHXNiDgzgDxgGOXGPUvhbbkTZODtNc6OwkjPYzOXEKc5p
-yr+g7a6nicRrzG3+x5yQJaYjDDHfIZEZh/kJ6C40phqygIAnUUZXjk5ZQ+PsTUxll+NKvwR2
-8hfBRl+kmt0iMd0czdB+yuNZJbY85BtyhdfDLx6lnJybGspMWi+XKBMkNbPV0P9H0lmARbl1
-UXjv82EXdrdiYncromJ3i40dqBjYgd3dhXWxxS7s7sLu7q75zt7/wv+5z9xRhJnznbP2Wu/S
-YZhLW538NNuZpq+M/ffdwyPgkv/pXfHXe3JPcqm3bFBfm4VOukPop3uWWtjEvMSW4Ou2DedG
-M5wvOUwOXWxe6FF0pslmFTSq/IPf81w+iXZ/kNeDy9dKX84qdyiDZKIKOK9cMk1/2Jv6ymam
-9zYrPUHHP2zzUbjdRTdtLfZF2laXQC6MrykvjWmKeCO5DRWDA1XXubpAv0tZ8pcz9Mg+IAN+
-XCf+1FZ7gbZic3dMYGL0i3z6jj2ayKTg5eYaz3KiealXGW4bazzNihVAv71G0l5nMQ00qegO
-kz5htZf5P0v8y+6CP0+Q2bLJThcfu10Ou8W1pPtbV3vGUi5PGH34G/N9WqJHPLUp0P1EN93R
-XAi+v9Pe48Eg2ozIjDraj2KB/QdhddkkgEJljAZiQlvTa3h1De3Mo5D1U5BBh3WYKUnVnAv0
-zunAVb3ec1mvcsY6Jcx6J60p5hQykaavyYbbEr6PTD0Gxh+qqalNzHuA21CpZr0luy0t59yL
-ks4dqsM9f7W356u+8IzSIWhL37D6Yfai1gDhN9LX6O8DKQNP0K68VxpxqGTluZKPx8pgLiQn
-+K39iJ1IYhpKBdNbZpsCktF5Y3c5f+wnp7+McgrpWvNZf3II7eb/aDWfQOdKjT5/BHs91Kic
-MN7SzATaUXzL3UpVXB/a5vGifp6itN+DvuX2Jz/bkvJLXRBvXTqmhWgG2koYL9cBZpTGdaar
-j7Md9w/0vUlAV00WWmviUHtzWt8isVPxVGVahqbQQS/LC7kuC2Sx3JQ3dqOmsWtovZuJD7np
-ObfNxqvsVP6LeSkjz8wiieNU1aXGl06wwWongiUu8GsoJAonX0d3caBM5Na2P5Ntjntv/mh3
-UEEZDD0GY8W9qaKtS67NAeJNRz21IsXWOXCaWNxMGkM9pXizRoJLklOUrtLiWN0puMIbeQS6
-HYcmUF1+UoDEw24LnZDSXEKj+a1uMlHUzmnLO5ypvAv365zMfAmTH+B1FH0phDp5JactzkqN
-58TTLaaqBJlQu4rFzURJbAdZbrPbBhLpHpX37gUoYK/sd7/KI88mLe7ZQnk9EznK85vD3Hjm
-p/uS49hITvDvncAC4DsupZU1FEMM13G7L9NA8asoQKdTpHahlNSSmqNFTqHTJPSGfvIRKoSM
-9/KK1oJe+zWlV2kq5uXLS7wymEdeo0y4Vx5z2+mITnoEnz+TdoJDvUC1B6SkTpZU0hrMVE2m
-uxMks5tRL3lm6XbPfL3n6aI13Fb6Cr61xLamEvKLNkpqzqkb6KI+x/7W0GqcSQ9wbvR7Kye5
-myzi2XYOv3TP8RE3myllu5gfdpgJkR5mrbQwUdITbX2zma/fDSbchNNSc5RSm8+0ihtwOn7J
-5aiWSagFzW27lR+4SjndcbTGM4fqey5RCc9uGuqpSPXd1brRNtSiOk8Ho/P583TaCN6IZqLP
-fFyzGoeGm4V0y2TlZyYxL0Iz94EDRvAldKbrOhtd3qOltI9ukB/STObIJPTQvFpC3qlFGk+z
-IyiNTU9f3YSU3V6l9vY9D7GLwB9TjSOJzXPZgQYcyZP4KM8wwfzeTKTdxkfrmZs2tkljn3Jc
-dI52thtvth/p6L/X7UTDS/dpHhFdKQ3Aql2opbagAri/IgtpjZyjG/Ka4oGbP8lWipDaNE3e
-60s5ABadgoafScNooaSlYNkJxvut49AEDSU1hemdqUoTnN70xtlElb2e01Ivwxe9hB573aT7
-XiNoptdX9Tg1tZyzCtzyw87iqnYObXNDtJ87TNa6kTazjW/n2W5uYlnviZYPf1VX/03L3/5G
-8H7PJh7uDuNLbn0+6ubibW4afuNW57k44+Gylv20J4djthZqbQ7UoZjTXjxJk/JvKKQNGuQS
-GkyfobdwHk3jTT7K75zRAc42HeJ80m5OYxrjbKOjzh+67JTnPk4ILzaLeBxH8DKayd6UGmSQ
-m8LURdp9t1elqu0qL9yWssfdK+PdjprJTQFtjKKJnnHk5frTfTcHrbf1MMvL0Scu0hddQJb+
-6nZQxmneLn3gIT5cU6pySTnMsaWUeWIbmWc2jVH7C78vZKLtcrPNejt/bXvnoLTBZD805SiJ
-6UkdeC54Lhtn5c8cTp3NQPU1rp0ClX+njO5/5O3upNruaxrixkazfEdv3YV01fpSIn2LDv1F
-z1NSysXJqC+LRnE8YtOI8kP71U08Lgv9P+Ye1JS3q4dy6FuKq1eoAjpzBx0PJz0jq2SwtJNZ
-slEiJESbSH+aa0uixQ7n+W57zElB7mGr8R+7m9HNjBdoZrs24D10nFxuC45OTGrmaGvzDn2j
-N3w0RG7DE//g7FbySWShj+anArJPl9lNes1e0lCw+g85pjfAGgXlqk6xNaiffU+Mrz0hu5Gf
-BUFvlcG1K/SxrNVuuMpUtFc3waWScnNpyz3wWb6azKSl7mYPEuIjrTD3aIzZTtvNVqrhPKGE
-Xg6v9jpLe70yUVmvEhrsBMl+zH1x088uYQMi7u+W0XjuO1vWTWlT2K1uCTTjMlrafawKFzjr
-WUAXPT/Ix23KEe4uzmavcDew2wqbmlPJVzojAVwNLdJfA8wFyWlKSyRnlJYcJf78CE3+LaWI
-+entlB07ZKkuLeB29NT4UTqv6xrqVUtfOan0lwnRyqY+vUarOcZxzBTOY37RUY5DpTmOvqBm
-soFqSd6Yrg0yLyuFqYzNT4uhy5FuC9rjxucn7io+5Y7h8e4Z6uPmpy1uWiRVfUoqFem3ROoZ
-TaU96Ry6xynJzM+kMPpCPD4lt6iHvESelcWsbedQW8GctJdNecnlbJD0zi25as7LIXNWMjg/
-Jcxpq/WcP9rRTKFy6F616Rxvw2kX1WAzVxLhK9vzNzeaermnqYf7mR64X6GfjfCSRFRNg/SJ
-DkDKB2Fip3LMTxlnDucEfJqiqCRNoDy0m7pgr2L+TbUcyKaRTqGGEkxgL5ppN9A+24722wV6
-wi4WP3lis+oWm47u2Kf0A+3gnB2I1R9kP5vCBKELJ5cokwsrLYMJN7yXwjgbfeGHGvSPe6vp
-V3NPzpmlYPEI2cbZNAH8fDNlAhGlp9h0TxtqsF4Qj7zFLMzWMFBmXRlJt217CrQ5qbfNRr5g
-5I9o6Z+kODeUD/TT+tFQWakbtYnuQzeKx210J43QbgTypdM6gj9oeZOHRpheFIxEmgWNpnI2
-0H1nNY33GkLHvIgmejXSz85aSeakk2wmylbkGbYtDbP9tbsdLw3sddvOjrZXbHW7T6677zW3
-+57GeMpwBzTV0m4oRdgIuiodOA+66Dt5zEekHav8pSbqUmOtzi9lFDeQHhxXsuH+CeXUW1SJ
-EnBGLsQd+AHV4uRUj4voCt4m6aHmnqap1jGf1HIraHM8ziyCspkMfID38hrKaNprFmTtVo6W
-t1RR89JaDdcH2kO/ahdNg/SpjxMcR5WhgW7ucUrs3iQHlPzTk5odtwKHukXQfl5TXyRTczD7
-NW1J37UoxcNulaXsOoMWySc8QgXwf1tOKBX5hE3G9dALrrvxzRr3lUlp+zhJZYwTWxs4YZrS
-CcfZntNRyPw6JiEnMIfRv3xMfypk6mBC68s4XmMLcBn7lfLZ6zTDbqKM0ocmSHOkYzCl0XnU
-C2e2X/+jj9qfUoF+clIIubqGtusJmqmL6RloZjFt0grcWLtxZvXGnnYE/x3S2baXxrXBms2O
-0r+2sZbTb1KflmL3W4kfp5XqfN/68RbbAr2pF5+xbbkJ+L+yHgFhbaXq7KGYV0sOQs6/xuxn
-cjLRVzNDW5gNOoQL0zqkW34qijW10BL0HNmeTGth11JQeV2v+9HUM0ph3W2n6QSbllba0eQt
-4TQebLcB90tkPDy0OGXQy7pUY/7Woo/movpajXJrMGXRw1RTM6CdduCWSA4P1eRBXJs38D20
-jH1mANV2IrSxU0rJKahboYmlprCuN5NlsAm3Z/g7MuiB21yb2bkST9rKASkqzXStvabGZqRL
-bj5QTi7aYDtQFXkMsmsIXfbgTZKKL8gcaqpVwZmNKZT2UAZqyJX0Nbwzs0mrx/kzpmg8daDe
-0MRDfa3D9BuuICsdhmq3cEZ6x6e1CBpDLvqsO0Eu3/QDlaFUzOSDZuXHS2U6nucDD9NMpg/9
-YC9uyz48lbz5mqbhXNqS/dFdS9qz3MqdwcndrNwVGn3ofqFEoCrHbmMveEsN2wY+s1UnyWTN
-AyfdrF80Hi1Glj1GBygJd3tnGxCBqwrIGPaS5xyMrL/l1jURbqQpYss6+WSx8wCd/reEOp8k
-i9NeV5iY9+30IOmj4VF7zRBVvi71ubjk5FNIl032Od+x5zi5FEAb608t4P63ZCwaT1quRR3B
-ObnZn9bQL61Dz7UCpcGOjKeM5AFzZuKPcp3ySiBttknhCV70BX6VUCrRR4tpFy9wX7Cu1vUy
-kL5iBobY5lTEpqSU8JqCNj8vtvFNSelgjst3LqiJeYc2pJHQ3kyeAN7dT9dMKCjL0F8+o2vB
-Grvhr5+QcbHNPH7Exbkr3GIV9ue4ttdC8NF8ml9jXt/9S9vZ7ORrk9E1rGkz9Oil49HYd1F8
-2UzRtg/VljhUUEOhz9uSG3MT01Vn6TZ8tLX+At2s4bq0CQnRjm9QFbY0iVNxElOIw0wFXmW8
-uYOZSrHNHT3P2XUP90MDf2if0Rz7EGp0xUUzaiRZtSdot5Nc0FmSGdRTVz5oBplL++UabdO9
-1JBGkD9yeqdWp7w6iBLrBWqg6XmO5uMO+p02Ya1pJZQ6ShvqCrYeQl0pKY+A6ubTLZpKYC36
-AR/Lwyf0K11F4hUkP91KhyTm9WbxoLqk2NXGmIH7OO0+JoOcNEfksInWVmhN4ZyUI+g3rVLC
-FIRwMuTAbLvQ1EInKG5TmwR2BU9ye/BLTyde66nPqVxvtIBV9A07O0Au6wLQ1Gp5qtHC1Fkf
-aUlqrz/AKC24l7RGR83JeeQ3TbXJebe7gOu6vcwxt7ITS047ofrGaUQ7nWbk73zW02aHNjDJ
-6Sq/B09O43oUwUO0O5+RBJxXvtMqtMd2diMvtFu4muRnbw2lUPhJM91Cz0C/4VKJE+lvTOQi
-2o89SsTjyAEx3ANnH6X6soCq2eqYsky03DahOvIfjYFPVZSkFEf8NEB2ikg/9KQaIJQ40gm+
-2Yl72xzcFivvgpmcZftyHKnHd+QynKEaRVIySsflqTbPoZV8jgqbHXTRjKSMSFiFOtaaPVzD
-jOCP+PMe/J+uphBM8gu0s9qUVpNi3dnhIGnlpx6zKaiqpEZHSkNB6PeZdQx8dBnlktbkL3v1
-sryRsdpKPmpzaOiMdNFA9PxTSLwnekxf6jNNhASpTwt1Pl3R+5icHDyKm3BLU5XnmOdUxDSk
-rbxeO3MCrcKrRCgIZNEEj9dKJmpD6Y/7w7pEqtALWUrpdSK1Ul/6D+R7E76zV4uDKUbROF1C
-l8AW3sTQ13JtjHOeT/n1Ad2W5DxDSnCEFOWympCjwfou3H2NluQKmKJy2owOYTab0iztDJ2d
-0Tv6XqpTFzmDLpiTU2gj7qxz4J/5zXt5aFaKcXZAp4V1A7+Et8yly2hMo2gI/9VrXFoTmSB0
-1R3ortXsBU6JPLjkvufqbjpzyJPSzPDs4/ceX5DzHupvQymD9EALbYP0yk399Kxe0jrY51NS
-jbpJW6opIVRaVsS80yp0Ec597XCz3lZ2ksM7u8smZ70Mcr5JbnDoafNU0Y5i3qGYx3MdfgY/
-qIYZvIBEbqtVQbghHCpduY0U4lESB7sRB/6aj+NpRy6so7kkJrAKGsk06DYxxbynTlXtQfOk
-EaXBCp+COe/bcXQOvLcDFH0UveSLLUrlJRUdkM9aTyfpAT0tjzSpvNDX8M5C8NK6cN07Ng2n
-ttUxXe1x34ITS0YurzepKu2iaBBuYr5MLdmbY5nG/35aU7DTlKc4DTi704H7mU7/XrFVjY+S
-S/VoG1KtIFhjq47SWaDKaI0Pxtoh+WmSXNF10lAvymfZjVs/6aMt4etrkUe5dBpa+ykZpwOk
-IJr9QVmnwyQbrZdilFTjUif9qGPhSlP1EvxuHHqil2lHPuYQ/NxD6/knZeODVIWWoSGeRcfN
-wGmkFk8E5bqSjJ9KdnBLEHx1M9+wJ7mYzIGTlcN+JuVRUNgkeER9OGVmbQ6lddGFelW+w5Hy
-gEMq0XZpRStBe9Og+i3wpLTahXdqefBNPg6g+ljLEJ6MRplMz1HMz2+sIbGpmPhRL2hitxyD
-s2yghBpOBfQv2HUKs35hgfr8NYe5Ar/qRU3R/p6A+A0n4axUnPvoUL4th7iSXOFwu4Gz2w7/
-eux+tzQvdoeiQ2/m4+5srmgL8pV/PFiPEqNxfkEm5pEAOiy/tZEO1lXqQW/dIfd0Kva/pmyj
-m6C4braNGWR9nWIyzKmgTZ3fmtHxoQTOexWzQPeZCSD+aN3FZXB9A2gBfNBB+wnT9uCuTfQG
-03ZSNvEhSYOGVd28kYImh0ZzNx3M69AcX2ksLkpjqTvdhJ/E11taShppzHsDvHRX62y3GFre
-aspvz6CXbKLu0hnaEL0PFyn97/0i0ul2qLotd9VIaH41z5cq/MDepib2JBW18bk/ePStzcUj
-5CF29Sz1gVuc1J5I7wVclkM5qynJR43SBxObF5vS/Jurczv+Cy/vRK+QbLtogvahIXDfTupH
-+dSbbsoMHSm5tIWU1rGyTT9IETS/QWDUEHqN1roW/rlDAjQpmGCAtsC+rlZv6Hq2vNcQzNVd
-nHcAMrUpPCuP7kePKWoWam7TlKL4G5XitLyPjlEtsM4bTYZn70zZ8JkXZSgvltU8SIKhxwp8
-zbZBb/rAG+1e4yPlnK2SBK7hZ16BPDdDRePhq0fA/Y015ju7i+s57SIxzD5WsyJ/poJRb4Ab
-P4J+4mtKU0WF++ph7qgT0YyGckqtx+k0Gl7bnmqoP3XEHtTRyXDrjtRb0lN/OHkWjfnXyjU0
-mPphN1Ob3xpoNmpVs0jjmUv6gavSRd5FreEF0ykcXj6ORssiOmXPUhv7mUrbWFzFZuY6thru
-u7CPHczJbGcuYFPzWLuUXtk8mIov2kZUgyU7VhyfImWhPpUkWlRvymbsaXGwyVlqqUH8Vj7z
-VmlvEulVc1z9neYU7kymvU5H6uqkoyvmraY3j/F50ciOIzoL3NOaHmkSakHrwC9NtQbXRttp
-p3G5NdKslF6mJPqcEmh8zq8OZn0onmmYdsZKimqkja11bWotYhtpOTtLO6EDHEMHaI7dTo3c
-f6hZuC3N5hC6hX2Zx3XgiS0pLg0Fq8zHrm+mUtj99dBlAJjc12Y0VXGOk21TZP1+mg/qSonn
-36U9eCnt5Uk8nJOZV2ilHZGotSmAB1MSHklxuAQ67Xa9AgcqQul0AlK+PFi0sw5C4gyF942E
-JmfgzLahdV6G3jbqNCqqX+Ax2Xm2vKT70pJK63XNi6/dIMM1HXT7wKanrNKLjssW7Gt8XoxV
-xLxGqSD2Lpsm5/HwrLw0AVNekcIoDvnSC/VB9z8MH13A49CnM0hxE1/qmJyy0dSRzM4g8Xem
-CjshMtZUk19cVIajo+blPlhBP7D+YHkC53RAHLnkmazEvi6yGzQBdmG/tILjZjHFdZJ5JAPM
-fjiIlz7iLjFprO3NTWltUsg9tMxM7AtfeCrR2g8MvkcXgXmeaQAVpvtwo4qYqkIczleomplD
-W8weOo/9nGfWUALzREtxDpC/hbLaqeIRuogPvbGNaaftSDdsXfKBE/pLTXpvL1Bd24gfuYH8
-1XWph11PF+wGumIfUKT9SaftMdCTP22DI2TC1HfVEN2B/MxBkdBcGz3AebWTGaQnjS+88wTV
-cvZRqBOLujjp9bdZLE3NRVnCzfQ6drMuErs21YVaQuBuVagOleGNeITGuoNHanP+gFMsQSfR
-k6/h0Q+C64pSdq2M9TeVQ/LY1pQP9pH1kWM2n6SSrzZarkGjeWQrJdLSnJPG8V26y7eotWlG
-u9EkRpvDupfT0lqc62qw7XspQ+PAZ77Yjy12DiW1wcj6B/zOjeAp1p8LgrzWykSOpW/ROj2c
-nCbwbjpHlbkBhXFr6owO9Yf8aBjyNwt9hO/dA0W20sOams6hwX5HbjaALl/QVxnIiySCT0sb
-9sK1P5ChBKKh1uh1kWiD5fSirtSZGgEPqw0iPC514IAHeYzM5W3Q8UV5QZflM6YqPv+VGO6b
-BuJ7pZ+1Ndwhs9aiDNoVqSL0HzpGVqnt3LTfHJa/zky01ZxaxmmpaZ0c6PyXZLLZBUd0cYYN
-tZzW1EdyQlQ8mPZgu1oW2ITSWQ7bbvrH5qbhmJFnMpFILW7P0cQemEDt6TTXIMcjGZ3Z8tQ0
-ksWmtiQ0EyULe5Cw69TKMFoI1rgr1bFvZTkB1eCY94YZTtP5E3S6gVdQCxOX5pvN8KsQJFVh
-tJtnkh+kU1F/ofVUg2eNBiOvxqxf0CjJCtqYRvfkFdpuNv5lfbmqfUvZbFeQ5UctKSe0qSSg
-e3YZEjQ7R7k1+ambnDfYe5iuLzQR6n8MEslOsfk+taeMJkJbOQX0h+PKIeelxHGOSKAZIylM
-gMQ2ZeUjt5XlvEUysY9upj2gysZw/980HB21Db3h+KR8WTfxV6y8QcxHQYSFoN8CSE0D5m9q
-t0g3aPKnTSOB0l8qYn+/2vpIpEKaFuwxCxl6GepubnpTkGlEXcweaDO2LjK7pZ/5g6waqRX5
-LHJ2N9h+Mwi1ELRak/2lm6lnX5m27moT141rVrnz+ZIN5ZuynsvoPfDwVvzaizMhyY6pB8oo
-SCmoNwUjW59IUQJd0TNV9N+f+o4/63e+p8vxXDP4uHzgb7Y++KeY6WAnIXEf0WUbSSx/kE6B
-PAeKSauBPFHf0VqdAkaYRHH0Iz2Sxv++D8NfV9IKfaA34AbHwIlz8atpOgMneAqO9c3GxTwt
-5622vEmPFjJAOjoLJNKZIUedMFkLTfZ1RugnU4qSmtFw+8xYdRXtpKMllVYTK93R0sbJKWkm
-c+W37SPnbVMpKP6SVjtLFrDnO7oqY3mn5DTT5J6ZKkHOWpnsLJcScOO5pr885oNSHu3mBJ1H
-AwumINBHerSNCB1pOusIs1jTmVo0mdNwIh7G19E+tqL5VwGtjddt2DkP1OzweDlE7aQDqDIL
-pZA/OkGOqp9Wj/k3TSlBb9EqVtlGdNX2o+IygVpKN0okKWm8vaTF7FutY3vSMjh4tD3HN62/
-2WTnmd32pGki68woTW5uUgH+waVoiemvh0wsnWMuS5BZJC1MQwkwseUHX7U9+bBNh0eoxKVB
-mh/lLZ/RjTyZ0nA6XkVDeQxydAud5uc0BSkQl1tQNzqARuiHDhFPx4AmNqJZPNJwm5PYBtJ+
-tw79cRkZsFXnSXOw8S/5qjtlCdizPT+R1MbRaVjHTVNc0jozbAenvV3iXLLTnVDxmHj6BDkZ
-SsXQ/zJAPXFNWXvIvHK9nU+uazLZdaa4LW3K2IfcxkbxNvuW40o+k0tym1QSyTkkBdxtHyXG
-hM1D/41LATHfrwZtzgDddtf7XA0T5qUFebqcpZ/2GnW0Zfm9u573uo/5o/uFJ1nhdpLAlNaE
-yLc4ph7FMSPpD/eic+wD798H2qmv2TmhKjppFIVIA2ohkboYiiquHUB2f+wQ2mLvUgd4vY99
-wsVtFBrqFidA/LzuSXGvqjrSmazjzEk9zaoBnINOUEoqAFqepP3RxjKAj6/LABksOyWeZNI9
-dqCut331krWSQ4LlgFSQxWDnZZjeaRxX/cxJ2WzGyRUzX86Zl3LU5NX9pjpyv5tmN6eRfN2R
-MCW5PX9Dljc1Zam82aAHebpm5nNQr4MWGZeW0jttRchGJH+IvgG99eFboI0rEo/vSAuK+fff
-P1IP/TKtpsC5Z4TjlNBb0knDZZ4GxXz3Lsh8nm1AXnY8rXZX0Cr3ML1383Aj+4uj7FGTHac9
-FidMusIc1JjX3S/kMD5MGcwObWN2wis91s/MsgVMDZzwLzfInHQn4j7QTLX3uJBU5u1ygyro
-MrI6ko5AhVUYPM09aATaxjKuQOHsaidepW9B3W0pC9Izr/ZES7BoFn24vSzCOgaAl1NyNjvv
-389M+m7jaahUl4T6zkbrCzSfH/Yae+w088kmds7Z8c42+9W5bJN5ZZELSL2KTmYNNWd1OA+k
-1vCU+hrGU+Ube0ktM9oGm+dua1PZLWhOezKZZZ7cuC9qCrmVzEG3jqluK5q9lk0+9JBLUoMP
-6ie6Qr1oCfrtSX4ng7mBlMRz10ErmcL57VqOcLdwa/cnt3dHmgPuO1PaPjI7bSDI8BTceABb
-HQHK3YqpPMGbaB03xzlb+O4+HcOLkCJLtDx4qAey8xIU2lYMvGMeRUOXe+1TxlmZXnaF6W5v
-mH2WnaZSyvkrtZym+sz0gYsv0Jvk6g/kxVjdSw3gxflBBHH1t34H61oZCCXkRaY+lqm6ALxT
-DaqML+k0E7JpGhw1vb62czWXxKFAWUc9pDd2KolJqPXNDW1tRtBIc44OmRv03LwFU1bhruY4
-n+W4xvBB0Pl7WqYGvWGgLtaR6tB7bUf10YVa0nLywD976n6c8DR0xzS0SJcj0YbrbNBrKiRR
-pKSB13xS1jDtiYmKQkZ+05rWh2a63amIu5tqg0Gj3Mrcyu5kR4LNBqnq+OoZp79GOFP0qdmm
-+zgVzaCttFwL8EPpzyUkiiNsFbSN3XChSJxmBTPHnuA3SKAOcoy/yS2w/lx+hhaUHesMQEIO
-//d3vWPoJ2XC9czThVQbGTpSy9I3DaKsILztINUHclHriK9Ok30yBv7fiZpIO4qNyTphfWW+
-nWsn27P2hq0vfWS8ZNRCsky320e62xakMLkFEjzGA0DkI+i7KUhvTG56aVZRCac6r3fW8iln
-ArdxkvNGs4jYdEMeLaH6zJyaazPYFwRVlc9rS+6td7iPbjXjtLcTpPOcOMpOzE/0mW1dymyL
-0hl3noa6Rku4Q+WRJ6Ps8HyJ+RnPdol71Q60q+0AaW47a2abj/zseXpgm/ByOcuxNZe5LaHI
-o0j0mihTT9aa39LfhGoeM0y3IeHj8gh021AQ7XMuQ6mdZHTEWaLWuSAJvIpKLK9C8toZIBHO
-UingTJb6pisIcAmabT0wXENKrv6cANSzXrzMPeRfDpyMt83jrLPjnDoy2wmS/I5rJ5ntFoEk
-M3iTpOMU2pe+ywT0phmyQO7aX7LLToFO09EGWUzzJCc/sMeQCbVMIzcMt/ZmpZve3HT/8HmX
-zRpX+IR7nBtjilIg006IB7wbgSw8rH/U1UvkTaf4tg7DNR4wJfSsKatJnNm62ElEmb3qUA6v
-bxrsOOADsQ94gt3G15Bjw2Qz/5bSnBzJF1/34RHr6FGtpI2pOuYuL3R+EzkzWvLQWEkPWv2u
-y2SB9pG82kR+ymhMXWwN1S36BNoqAHLsBco4iOaTnlNTVza0gvOCMKuAj+/pNpNS55sQccxA
-aQLCe0ElKYp20naaRovAnCHUCf30Pj1FanZEI/8MKomS8iD6D5JTXamkseAAm6SR/LC7bWWc
-fgK7zg6yyaSo9JZLMluy6DhpgNXth5oj6I184jB4Sk5K60yig2YK1UEGVTAvdbl5pgmdapTF
-OUknTRIuZ3LyW67HxhzkKqas8TEjzSAeacZQsLmCHRsKls2qS8xc6Ww+2zccYIuByAfSc/e+
-GqhP3F/y3J0qx9zictr9ZbPaKLvPTrCNwM2nZIpNrO9tI20lV3UV1rVWFvJgSWf80IzzyF1M
-+CbuKCd4g6Q0P6C0EupjgnU8GP8EHaLK9I7f6TczG6eXBDPSSPyc47aME2EbO2dsM+cZ8sKR
-MLj7b54gk7mGZuJuNJ62gbh3mAyazdkqPk4fyeqkk3bONHvO+e0+dza4rZxtbj/zwD3FiewW
-rgVNbLF7uYAQtPpdvZGyfWNoVY/aI1QT6XXOvcbV3Ff8xuPhW56C5qenrUnnNjeZ3KTGy/2P
-U7vVeaUbi4fYZ+DKM/DH+RSf6sKR0oHdfOgAt6KJJoTiOAEU3/mk18GpS0wHDTEVwa0pkc3H
-ZY6pgh0+Yn3gcLf4lZ3N86Q1V4AelkDfG2K+9xB+uwBN/Rmcvw3lkB20H41+jG1Gx21iGoKZ
-qIeu9VbTUjL6pO91ld4H28TB19WnB/DBlBRJvjSFmqLnHqFc1IYb0RPuD3quSIf5ulbn9ugB
-qfRpTIpzL+3Lx3Uye1NDDoSTbqC5BL6i0ziVemCXWbpW70g27SgrpaFUlXmSVM7Lc7tKVtsc
-OPtttieUEGkDJYWkBKvM1yXyQM9LPMqBazmkd6D4mL83LM6z0L7z0xb+oZlNZlpmhlK02Usn
-zAnabC7QRfOTUjglOLMTzFvNar7AVzic4ppFWgfMNc00xsQv0Dtmot79x9qF5CH3BAkms081
-t/XVeXaFJBZFh2tj44q3TSd1bG95Yc9KL3DeQmmH5hGmKWSXfrZ/NIHkonJSizqC9CZLcbSN
-OOa9XDPxNbuTQU/gvO7xJD1Cv/SqDqbcmph3yW7uJPXMd7vTNLNPjWP/GF+bwplrC0F1OZ2N
-cOASGt9c0rY8iJKxLyfnD5yQx5pd9Mm4Otyxksfrs53tlcnW9zrmdnKegGcKgLXr2WymMhiu
-tn0OQvM2L+xyKijVdCqSPqO2k1NaRppRlN1PX1zi5K5/zCvNObHHsvwNMMU9Dc14D3jas5KH
-uxV5sP1JM+U89cDO/9HcaPB9OA/78wueS71ArMNNkCYyEzSED2tpXqFr2VenmrPS0DmKTmf0
-I+i8iCmu8+CXFUDzOTjm/a2+C05L7uhDNP5MWNkYzS4/1GOD0Z5vUz75TF1kFW2WtET6n3bT
-YXpbx4OQNulBitYh/A20/BY0fUTP8kL9ReGah8ASUOtmzYtmPoDDwcR5tTbfllr8C921rwo/
-10DD/94x/wu/Qi94r83pjr7CM9zRDvpVs+pHTYPftcX/D2p77NR9O1ivWOha3kt7+S41pbB+
-sf10pZ2uc2wPfWjja3c5LiKutIGnj9KBtBhEfku/kA94og1tpCGktAadTGiV6cb5nfXc0pnL
-5Rw/vma+U27zgXpwVbD1GS5Jec1rrWX2aHUzUEsbb01jFsoTDpSNHC4DOL8mgIqa0HxQVqje
-kLY6UMpofUmgFfD8+XCfUjzy3W6WPbahtLX+ktVukNq2jf6yfnRFsnMD3YsUecOn5RwHywR4
-ahU+L49B6oFgk1fqQa9JQfm0CB2SbVRClvBau9iUsH5OXjvUWWH7Oi1xsp8li1Ncr5oGGmZW
-ax+QyhQzkceZ+YZNTucrJXfW6U4zRkaDoTehE3o5v9xKzjO3ofPWbe28dwPx6/zODzfc+IPg
-z9gn1FBe6GFkViIV204ToDEndOtRAc9pOv43F3/6O5DHeE5wKdfDl92XnMoO4yw2Pjewv8hj
-G3FavcrVKZXJxj95Ifr7fr5Ps7kxleOE9ImY7lEi+GkC6g4FfOHJ2t7EhofOk0pmKpL1nbxm
-P/3GBfUFn5GhHCo7aSKo+a7cl5I6SqbpTDDMXPT+WhLz0xT20xU7kGJJRuoqn9XReBTTwxJw
-KL3mMCpteqGFFqG5fF9T8GJdSgu1BF3QX/jvhz5UH/hqI+qlFeiwPtIhNFqrcVc9xyPRpcfo
-Dq6HFIunY9HtJ7CjrdkH3bUOcmGIVqUV6g1934JDt9GJulQG6S0bpu3tdQ2yjeiUPYwTu0qD
-ZDhNAlEvlw76REgb6z05rm/kDfIpUr9KZ/0G5VTUk/D5QFpFZ6gTHyDlBlTffNWmRrS8CaZK
-5iO1NXmR7SU4koP4KZgvJ4WY/XrQrEUKHdCq5rJ6OEofgBiucnOdz8EaG78vjZYaqgnQSh/r
-B4mA2w/QAWCS/cj02PYJEn+fJLYbZaM9IXkwU2Ull7IE6jMbrpnlr66QLkiSl9RXm0Htw3iW
-puZt4MfPukQrxfz9Px2UQxQsf6iotOLE8O1U0sDUkilmpaAL4j6HHkOfLub80DnOdprkVOak
-Tii3MHN4HJ9H+0phfms9008nmxfyzKST6k4u28/p4dZz8ripnZLuF1PEPWESgiYzuet4o/sf
-TcTaAuWkxIr5/jYdbkvQLvc7xUGGn/KkN1c9vuas5wfP96zlGZ7+nM6dwL5I4/aSzHTR55yR
-6vJIMN52WkHf6Qu14OK8gS3tQ0Ku4JNogCN1JI/TVcjs6zxHf3A7/c2J9CXvlZsglBM8XcZy
-pHz59+6KW6WbrpPb8lXCZCFSyI96ygycejAYohQFSGmaKoOosO6he3DLajSaJiC5r6GRleJt
-tIDj8Tn+RHvRJjrj5OJwYr1BCfUwldcp1AQUUFXnaxF4bk044Xw4ggULtKDjupia4TNfSQFe
-Idt4reQ196W9+SNlzBM5yvvA+pFYx3epSv00HXnRXu2O3/WlDFKJNtmqdN4uoTxw9hbynorL
-WPplP+gP2xOMl1NTaDK9gT7oj5Ovj5UUoDGaA0xSCdTQColfn0ZQNjpFREU4DU3jHrSHL9Jm
-TsK9uQjH4hY41Tk8haJBBcnMfCpoBlNKU4IO8netynf1AyX892qe+/DiQ7i1wp5cBIEHaDN9
-J79liayXQtJJdtsA6W4by1A7Ss7ZM2IkqX6zNfSa7aWf7BxtKk/AIg0ps26kAD2Gpj2b6iJ7
-hqIBJEdr/INpP8JjNQEo8haHSE/+ZQvwV9uSG8NlHshk6OGReYSmUZLGmi7U1Iym2mYblTdx
-2fJ4Hs5J0bInmgJ0x4TrJyj5iJkiPcxRm8G8cy3XdbNBly1MYreBye0+5tpuMl7k+lIp213L
-S5QM0QwymEbZaHrqRlJTdwmx+4k8njlc0c1pNri9TXY71myyk01WGWcGSaB5JN7ImjnoHD/o
-ErpIKS5CI9A+LnJbSm38qZj5oGnNKP3EhfUXNOlj/koec0yucxOpzc/tCzqGDplDLtM3mU+n
-1KCh+GtRWi+ulpW3+trmorX/XvN7i/bYB+QtUbRAtlA5jYI+H1B7egF/PkB1uD1tYKZHfEV/
-giq/I8Wv83Rdzil1IK+R5piBjPxStlOQgvZ0qrbQLPpYPss5sXCYbLqEksKDdqHBNAdbBcAb
-JiPdHspA9taY156D1LUzN9XPNFFnUpTWAM/80cIg0p74yv9oulyhXPKEfuKaWC5Aq+OomqQB
-0x3UQ7JJAzVaf+tT6HKtnoMDV9bOaFcXtQG86YcuQiMbQdepNN2BUt9RY8rNa6kLXwcvnaCY
-d6uMxYeI+DmVQDpN5/l0lxvSA25N4/g/isNvaSv9pjl0hcbgcQpTcgrT5XpAaml+qazxpYtW
-lWE6SeohkT5JBnS6jfaITLSunLZJQXQ/JFLeSmLQVAEdrDnh7mWw2jWaBrOfkU6SB9o8oC4N
-1HRcUbugWW/kP7IVWTOKa2kTnq+BcKKl/ETf8kfNaL5rDuONWWoNZr6BdGgK54zimpzBTKKp
-Zpd+Na6kc4aJRR8LN09sRjPChrOxfXiF240nuDX5oPuS0tt6NMxG6QXbRHMi37dLO+mnO20F
-UvcV9XCbsY+7mku433mo28mccm+aH65x0tsDpqvNZWLJBrBbP3a1Ax+holyML9FU7kxfuBg1
-M6VotilO881nHW1aa2ezTsqauJLQrLG/eLz9ztvsCU4iZXiM9IMPHcSJVQXVvZfkNEvqk5+0
-peRSh+JJdcomvamCHKPy8LDcUodLSV00y4pw4Rocl9pyL6oR826j9IdK0VDerynBuxNw+y/m
-Z62bZprOpNJIviUNeJ18oBnQzQToZrSsBtnm1otyRerrDvmK0xwBrnpAc6UI15TlnEMSmzrS
-0CyXNuamlDY35CWfkmbskYU0Rd9AmxOQ/D00nOrpvJjX/dNg8VBmKca+Uh7qLgxKyM6Z1YCt
-z9EvmUCxQG7+elYna2sN1wQ6E9c7T9/KL9wW0g9JwTnUl0cjp/+CUDtRYvhlBR6MRPKnplyW
-qvAAysN3KTOX5nLckkdhzzfxX2rFb+ANSbmmluQwiYNkm0ArxZuuyys9Le9wddF6XZbBwTtq
-Ya2kf6S4jpeyml5Kocen1VTyHE3vsBTFZ0fqL0lKhXQo1Vfi2tqNi2lPsG1cboirDNdu9Exn
-wZ0/UE+thXQazUYHcx0tD6b/Tcf0Ee1Xhx+gbfSgAK7OPhzHfIWTXqOqZicVMkHUwDxGP66P
-s3kuvmYN0qonOlly+UlLbFwubktzCrhyLXuADtqklAXtozbW20ri6yq5BBIJlNEUYVfyc7e8
-GeIWMAvdQ+xA2XXsBK5oz3N6e49r2vV81wbxImnM3bQrFwTF36DS3I4f0y/s4kpwVH5nkgY5
-GdXP2SOfTTPZYBLLIKO2oqkhr/iqdOHGaFVTccWBmNO/YM7DklefyxBpobftG3BGV5pkL9AX
-m5Fbwc96gAKKyhzOKv15kqTkurqMfmo1qkT5qBuVQLLVBPO2ReoNpqRmOBKwGp2Fnw4E87fm
-jdKZq0llTi97KTecORDnsw5e8gbtJRcSf6BWQfuPDW+MEH+eKLf5puQzHbUcOmgyc+/fz+kJ
-gm/k4fvCHB98EaK56KaGKVP2mHfR1tXQaG++AlUvkYxIl/3cS/y4n1h461f0jydUQkfQSr2m
-X+BQOcFxNWi39KLnSI5XWFW4HMcM7iT698qR6/RJvPmU5oM203Et8uZKVBK+2Zcrcnc+woYP
-wT0b8g71UDE0Iy/tyNk1nNuCp4aqF+4Hkg9m6K/402N4wBEk42wQUpDs1nqSQ9uit62WjZJM
-T8h8PStx4AvNyB+9s4j8oB5SAidUPOYd+amdTqZOGkKd9ThcuQJvhk+u0c3cXntAt7Hgn3tp
-O/goPi3ESYzHeVSjMNCLw1t0Ju9F8/ygJU1a8jO5oVFfamjyUlcTm0INWqZpBPK/J0mxT62p
-jCTGLQMFSkEagzOaAFLvj4wbJNfkjLyTrmD41ISWgnUOoTW2ORWzSC97lrLZUtDmBG5k93Gw
-fc7HrEUOfuQ0eohv6iTuRO3QMX04AR+kmZyf2pgVmtEppl2dn+LrvJBI81qamcdSz1yWzuak
-lDOHJRIu+J3GgugGykndIu00L/rDASRQAcorA+Cd4ZieG9REvLB6H24kuTFlf8jalVRbKuP8
-vGgG+tEHbUNp6DbVoly8m5JxW14PBk9DE8wMHW4yaxJzHQ19j6Tmg9j901KYrslt/Qjnyoh0
-raeuhOlmuayjQb+h0ommSUvaKUXh6iXID31gusbnA+hNG/USd9FrXFRncQBawxadDsfOQSvp
-rkbTAk2PeRvLqfQR30VOzJd4JhDtoYPM5O2Sh7PoPhqhfrRLT+sxba6b9Sf4egquNxNOI9qe
-pjvY40zSlfuDKfbKCGTndB4PxcWhrRxAC/+9ZqkmOD8InXMhVcNzHpK0mNRWePx5nBQZEQQS
-GaxbMI/z+aIEcmdJgok+hWY5hWL+du6NFMMs/cI1z9SxGl8v4/lLUzFZS6nlGRWWa1DGNOou
-rage1BzzCtWNUhA+MIAv6U5+qR+wD4IGcYWHwZO66Wvotj+N0iyg8S/6U6+inf0HUuqhmTAr
-y/ibfGbWeKYWbpvBdl+0u3mPdrdEB5lS+hVXWJUz6AbkT3FM+0MdpnO0n/bGbaqO00voB7hS
-TUWTNS6NBXMsBBWd0onyUa/Yv9rIOpTRlqVEdjfFsX7sbWdzORvCC2ySfy60VdZQaT2NJuyh
-dpSefWNe52l20HV4eFkngLI61WidyU/Z4Oen0ZIngv8aIH9yww1TcgtJwN3lE7r6dkxEezxS
-RjqNTl0cemhCedCwd+PcqmH61Q6mT3YvyO4DGaRAVrTkmPf7vS8R6CovwFo50YxycAU+RRGc
-h+7zFL0MWlzCebUpN1Bv7gyfbqLrqJLWRb6e17baREM0vwZrdW0IMiyJ+2qaFR/Ljj1orOt1
-OFK4j+bDV5xHp+nJ6XAFmTCLecAyNdFup+hweo5OXwWsN58y0zdyQWLntYCZoztNd31heupR
-s0jro2mH8wK9S2U1CX3GDH6Qm5IV7hXztzrLdYuNBR+YTd9sPB4qJfm55OAvonQCO3NAiOOC
-98ZpUn6uF9CeWtFX/QolHNOCdFW3o1NXxp+s59kazQn0Tcz3sXMGyWUSwAdySE1TSshUkRDu
-KCdpi+SitBoV833FYJPEmg1+WRo8X42i7EA6C7bPIDVwOkEcDTJRiQVyL8rl4ZM9kR/DNJZp
-p4O4OHIjO1w5N/pSSS2JXW1C47Qscv2jZqVVWNM0bQnGesvfkDy/tJbZpLlNef3Lb0BHJ+QD
-75ZbfABZ9k6W4iyugHG7/nt3HNVd+l2PQ3/rMTsr0O2icSaV0SSXQhdzKBo63YeUW6eMqzgq
-fzUM/pFM6tEAW5KS2eRU3KYAEdSg5mClk/KYvkJhGTUXz9PG3JsmcRDPZm8TwAVMzPvz1aZR
-TFQTxNyWD8Y4rIbwe3jYIjlMS+UIeCw9j9JebEHWJekXZaCBdF4dGqZbtRW00R+sHqnb0JPq
-Y+pzSgO04m7UWxbRf3Ibiv5CT+UMdDyQ1mtuKke/kTLvVegdTvQuVnVOC/E7zclF6TnVxvz8
-0H1os/n0kfyRaCmtmXWTtsSu1sfuZMesptHX0Go+tIC6aCjZqTVFaicqqC3oiXQkj8wBhUTT
-VrDhOrXUAUTZEq3onh6infSMhqG1/OEZVMJkp3bmhk4yR3QGqKCysToP69hEk/SIesOzvstC
-6Qmiyge+jsTcXaaHdgP0OZnKyWpQ4wO4XDwW+QU1r8YuFaMqcKaD2JnUWFVyErjeZD2giTDP
-J+UcXKIHr5Ir4PjEpo10NA3liRkq/s5DKe6017nmgs7m17oQDvdbR+Pcx2sxzB74iB7b8uie
-9SiWDMc8PKT2mOYw3YFsOMc/ZT5fQ8azfqTm+gwN3lJVXPsHeU7HwB/XZAa58Ie86Khd9Rb0
-2ZH8kfKG8+ljTqKTTVWNNAO0l2mLfpwQ3XiPvOFloPpoTF4dTYCvaIoVJdW3WhS+G6wPdATc
-sgv+ZKg+g5du0l60GO6zVxPyQzzDK5zG1X8fb6+TwMiDcQ0hqraLDrVVtL7NqZG2jvaUO9Dv
-SvBzzLuKjYAz1WRFp91Lxygr2mU8zo90rY6W5MXBNBXZl5sO0y89RS/1BF3Xi7QFTXA0eLAz
-uKOvlgEHpMF5Tvn3nuHXsI8bwGjrQZXP9D8th30YTgVlJv22oZQSfam2ZAINiC6S5yDVXUiC
-PpqWioJ+CuklGqwR0GgDJH1c6kjftCj49Lnex6lM1gFgzECcTQfdprM0iJ7qG9DSR6pIMygV
-lcFslIaGQqg71hAMYhiLHQvDvA7BM4RhZk7qGfWh3jqabmC6psg9nM91srrjX2/ux1OoJ0+m
-2jwEjTuQrnJT5EYP8jJj8bERBOrCLCWkbXIVlH1O34hHL0hZ6iftoMtuNAR5mliXw5cv00x0
-oyLYpcfyDh5wHrpZRJe0KT3U2LRIV2F6M+ooHYmO996+oDl2HodZ4U02i3luM5mcUsCMlsbm
-hzQyLeFjszQZR8DtTqGTfcEU5qAE0NInzMYhMbwFDfWbtOPuoNbNuoDH6khOq8VA0ffxOWv/
-7cZtJM9NPUqt9B4dhj67Ib8W4c+QKzRPy6ArZcX0p8YVwpD4sp4EAZQ2ofDNeWCOA2h8kdDX
-EF1DlbUVJv4OTsEPp+GRAuqPVvwZyhxEZ3Q8JSJ0QPqrnSkJBVMIdaEXFABiS4H2e0lbIlmf
-ahAUWg3nkUSXodEW0V4SJg1E7Qj5Y9/IQGg2MwhmjjaCl0ylZXqMVqPb3dPanIH+/w7cR7UL
-MqE2D0eXEFDyCrpBDs8B4VenOOxF5UGs+7DuQmYH/D9SXd6tofi9wcfnQyvp4aRhegC+tZGa
-SQAlQPuMA1qsLVP1KlpoB90ItWzSV7pWb2kEciEKa41pKvdwBue1jO7QGtDkdJ2rT3S2JgbD
-OFjpM52HvZgM7S3XVPDYc7juVCYVeOAp5mUTFLEG+3gWJ/FTh0DhP/STdtPd6sBzrstEdIhj
-6LexwB1Zab2kQDv2gqcmoEzk8+99ne/SKMxpJC2hdxRFRTgFh3EpPoreuInjUmEkyBjqph58
-RcxpK6ioDE2nRnRSK1EanPEl8UFXCqJMyNASeoO8QXI3xJf2Q9O3JAJ9f6mW1546SA061hBp
-To78pSN2Pu+x3/gCbtftQT5lF/Jju4S7yDSQSF6cSA/qSXO0MVmpSA9lLOXXOOg3ffgndt1q
-YVz9PbjBIUqIHChBKbkU+lgC8tBROEZnfK6VbDxDsnOBGF+3dyiPjMIeMNxgBnphG7hVIBwK
-lIQWPwaNP4oH6VWwTgT7YDZb0lH0pczIt/m6U+voHrDUZ5yhN/VCcrXAyVXVCUiyg7oBO5MI
-K2hBBbGT8WkmPG029mokbu3oDnbpEqZrI2ZtIFpHRf2jCfUGFBGOWR2rOWS2vrOXNL4kAWvn
-xaMnxGMd1K1UC9d3Rzz4aACvlmMgDR9TRn3NEFDgYfXjXHQO5zeOinEXmsWN6QAXoUMcjzbz
-bzTBlITWhR46hV7SOpzyRqwgEue1G8Q0hQZIKuqAmegtr9E214ijeyRU44BNWqqrQ5EQgcjo
-QlhrfvBdH01DD9QLnngRs91fu1EqqPGHdAb9hdINDabJcLICfAxM2EkfcAl4eAE9gdtypEE/
-bqgFeCsmzodK40y3IulLYALuSQU0/ZuySq7LMSmq7+HbXrj62PCM2CqaDRPQXwfAueNwW+rP
-S3GVc2kcd6Ux6DXzuQ0twYx252fE/BX99hh8exgloLqUjvyQL6Vxn5Di0e5/pz0K+nmG3FRK
-jzQ4I/EoQEaoI3W0gTTRHGDlFLQPzM7ygnrZL1TJ5uJ+djFftalNQQlAtv/hoyDZ7NqcosAB
-YcjLvNwbfaa7BnAwWtxcdLsTaDDv9R05cCkv/P8zpv2p+iLploFuPlMBcvGx87iucfQTzfqI
-9KUX6KtFdT38vDq8dAs4vZYugtLK0AX9RlmpG2YhjC9qb16l9fgGnrUG/C8CTngW+o+kILhP
-ep1GSXUsHqcONcQzVgHzJ9G6+lemwFUTItGHI9lmQ5kl4fhrwETl9BtYNIB26kzs0xZKS/vg
-L1fpkbiYFF/ebRvwdNuU59lCvMM+pmd2OJWFg1zHVG+HQiIps84AVXiZKMlizkkOEy2FzG38
-+okcB4kU4bZI9/0gsDTQHhyEvqDv1kJv6Q9WCeIQpImiccyiwRQbtFodSvHndZKIJ8hROi+9
-yAdc0grMPAinE66psZM1NC86YiNwTCMy+PV1+aRWonQkmCAtrUCnnKUdaCJmdDHS5CausAAI
-dSq1pMfQQQZug1nfL2XBbH58XjpxIzDiOd3IsWkgnOMDfQfxR8OZd2hnMFsT5EkFTaaEpr9P
-kukCaaxr4Gcn5at+ksLoCzOpsWbh9rqX/TWJyaNxTDm9AJaLALVcwUSmNxupmHlND9j737tf
-FKLK6Is+6K930TSGItGz0SPwwzNth2T4jrxYEfMzTNBBQ+UDXZSVONtXmL/MOoyWyHQKkmCo
-NoQS4jMibUoeZxtxFM6ohvjwSXlEpKvxuANpqtZAXjrwxHVYWz39jL39H0dnAWZV2UXhvc/Q
-XRIC0khJSyMtHdIp3ZLSrSDd3SAl/EhJSAhSIiEConRLdyoCZ+//vfP4XIcZZu495/vWXutd
-3DvnbtDGnkUX+CzU+6nspYH86S0h2x7yDcy9CopsKtVIkcZSjf4Xn+SJ6b/SHX9FS6/wv1hS
-GVrvADFeoU3P4siK6G58MzYMnk5q48hp9bRfowfMl5HyGb0knoyEgm9AcgOCkT5V2zB3OTyd
-XLZLvsy+80lWi/O9a7/ZdvvXrloiHolWz6pfJiUvotRTEMYDVJRa1khSgdL9lZyzOZrYSgcr
-w0XB9nBxINYiSEA/3BNO0SFhEr1A6/vPjqCDjD5Yp1lU9Cu7X4SlgjBsEpS25sFsSxu84176
-kfHmM6W/1JS9kMURkmMdjDdD6uDdfWiAv+F/pXDttRJF6v1lcfQ/OlAJPm/o66WW75G2sMQG
-f0gCpGHVRpFtA0jCv60/9zOQFW4gMfGBQmhzhFSBRBPAcU+sE5l2njwZ4qe9G4813BNCHu00
-k8/TA3ZWJ1u6YC3TlMLv6lxvrP/5z7SQxrhZOtbiLnu0m8ff5IflAHR+AqpZS2Nr4dktqRey
-R6j1rrXz40zHIKsrKe1HeRqW0IJ2XH+ymkEVXxjsoc0XkxXBT9IlyKePtQ98PknLylTt4AP0
-L2Pm7Wdxq0RP/RsNLmWmWnhGjruOjKOHFKYnFbXzMh+9lqK/uY+iiyeybvowPKdvwjca1x6q
-h7v1ftheX4R/y6dWRe7YOggtt0deZZNfT9g2TeH/aUdayiTfo1O8iW7EgZJIFekpz3Gsa5D6
-C+b4FcT0Owm8mpXe68kkJ3m7jkR6BPlshbny0853898sVDrem+MPG+Wi3ZOvLJaOsjR6BQpo
-gjtf8eu4zUjJrinlGG2+TvCNr6ItbaMttQiy+bd60Q6Rj+lkrR3ydbaamR/pX1lJH2mPbYad
-ICvf2abotT2FL8RDB29gtcPM3Wr/iunqSTo3jMrqQYwVVjxGDrsYdSlMEPUzDL47rK0nwnny
-vt33g6TOL37JbssYu6iFrV3wNBwSff2uNJYpmGKvNZVv1SGk5grvKN9DICeguUxofygK2kp6
-fAd9N4FOrsPsLf03MWuoN2yPxvYtWt0/0fGswH6vI7EkI1zyL9+/k47Vna9m9NbygI7w1J7R
-AI/DmiP8Ks3hH39sT8nc1xBoIhIhkTTACxug/shVYLrhRstkO4Qf+ReAy5ZWr1k9PWcDaQlt
-tYcn1mqygXUdIJO1uzSn2fwt06GCmfh+HyknWelRG+nhFf1rC3y03bL3fB8+0NqGyZHwrJQP
-42iWsI5OCg9rNSsUxPGP8Y0tmlbus9Mf053Oeqlgl+8MZvusoIKf0zv2mEZcXh7ZFf/MR9Fl
-/7OG0pRmHsPe01KWVZ+TZEfpYd2Z7xM8fnIt6S3x/80w5i392I7o27CFbg6PyrSwltwM48gu
-u+z7Udl0tB6DvlNGzYap2y/62i5zxov1lKXU+9ZPCtMlFqLlRDKdtRmG57Wnp3T1CrKRv0kn
-v6Lxn+htx+GX1/BMFdlMz+1Iuyjlq/RDX6eRf337wJNqalwko3fiEePhdT/5Dtz7S2biKBS1
-WwOfoe9siuZnLb6A+7r6Rs3gJSGRkTIVjU6zoj7fbts4+8W62gHryeSvtrL+3H5id4vLIJ/G
-46+CZXvJVvJ2WdDXG0Xds/VRNWxV1IqwXdSHYbqoqPBWUDycEywLH2k2O0v6TuXs+pM4R8LR
-OgHfXBxeCk6H/wWB/RQUtMbBcLuv/1hLHQbzP+b8CkKXdWUovNuNWysvhjP+5ZOgyEeek7Pr
-Ef2q5rgwXAY9IJl1Ou2tHLvyDr4/i/4uwtiGGyaV+7TR9bSXUk7fpTklx93GQ+whe5xN+nrA
-PW/jfnvR8Wv6XLjtN49Djv4AuzVEk7lsg9awRbrNatEjEunf9LMRklBzaTw9pG8lffBYQn0I
-T76Qw/KfVEZhMciXs16AvvUtWoq8e14vK+GXwmHeM7zrtcPPpXv4iywPY+vlMJMWwbsOQRDD
-vbRCdrIUT7lAxw10K5nY07toPO+GhxfiOy9IGRsoPzJvg1DWp/T4yzLS8+ti/0wP0N4eewvu
-oxLrEXKMg9D5Pl+E4mZrb+usxS2TVrW9MpoGdMFWegFWY6DvsS2+yV77Ydz5kQ2X93yC5EaF
-mbn/5J5bstI0GuBLX9MDp0Htk7w8t3nyP7j0IS5YQWLot9CeaBMmNZA1dNjDHPcGTepDaf4N
-tLN9rC2Zntn2nTyzVjSRojT6eHLHD+Ieg/2d1EOXVT1JkNe7B49tVTDflgQ1rWyQzaZrUdsv
-/c19m7WBlf6zzXbU/kfKr7VLNot06gxLtbEm9NLd5FZO+Z0EvodzHArel1ZRQ/xY1GVLEaOj
-FYyRxWLEiGs9o+LaqCC1ddX81kQa29e+w9y6+0/WQIZaek1j3+ha2mN3GuXI8Hu9SQL1tkcq
-vot5KQsDbZSTkF0ieeZNSc4RMocEXYKiHtDAW+MMe0jV03S37+SktJArZO1m8mcwTboFDloL
-feRHH+/oeztp6QM8jdfwCvy3BSItSZdZLMoc/GXj5aEVIefPcF6D4KSsfp8VUI45t3hYVS7i
-Mw/CGpLZWsh4WlgJ0i6d5NRnMkEH6j1dpQWC77VGcEhzBC/1N40VVNdLuhPCKoDODjJhA3Hn
-0pD9MztlY+2VRVld7xsu8oThFn/3bgtaPeIXQvfm9onsgxZz4Uxb4K5mMlicLB2hRUnaVTZV
-x9t/csqq42SRK149gnk/oNsXwK2zMRUFpYMOkcV6V+ZqQa2hn+h++VAzMbXLPC4d75/IFMIt
-VSHtq9DBSp+M1gZ6Vx/q2ZnKe7bdj8Gz28x8smWQ5pZIaqHbQXgTHdz/sOx+xpZC7/lwxRl4
-yP+kjYyh0faks86S2ME9WR7k1t+CdDoCin4veEWnLOkv9WdLFSy1d3rQ+kBjEyQeqX/XnuN/
-P9sLO2wL0cU0GU4ylbHUQW5rHVS1JsFQixsstwm6wpLqMDsi1VF2diYzpeWUD+yoV7YhPt6q
-+FErQgdtDY8fQu8f0FmS0atneM7gBZw5x9YHcy1v1GGbEnXHRkf9ZZmi5tnSoAmsVoE86Wy1
-yZftks3fk/Xenf3aCycltb7k2lrtEi6jSY3WQvaVLre5etmW6CvrSVcK9GPvHn3NlJm4xE8o
-8yrznFS2kZ7LSNL6dMAP5IpmkXhBKXw8tzyXm54eN5mBGrpzxENYzWG+2Rr5Gkvrp6CVUvTp
-cyi1A+u7nKMZSSYVl1UeU77g/mvzsRv+sAmfv0+3ElliIsMsITlfWpr7eNj7BslRiDY7RPEa
-rS4pgjNSLWihlYONGjs4qtv1iE7Qg9pNV2tmbUQ3Py6PaFwtSPpn1s+n22DPaVN8Fz7aKazg
-5cOUXjnM6sPCbv4gPOS98Yj79ooZWonvVoS1M3kRqLoC51UQjivHJK1mfz/T5H5Z+3tUkE5O
-6AkZqg20kI7Q11JPD9Mdl+O+o+SsdOXWSXbLZJkih1DTAbpfbaZ+FK6131p6W4sPpcbgMet5
-Php8Gn8erdG5Npo+Ui76fXd32iCfELmOgaWUjdyqMBlx5RIUkUhSaR+popdlvH6giYM0uirY
-Lw+CEnIgOODdIMmPgm6eMGjqN7SCj9SP6Lbv4W4P8atfotWeir79vieE/8/LJKuvH9pn+jR8
-I/fDXfIwvCJHw5o6PtysncK/dH64RlNZcV1tKyW1Z6GRXPLmzuOQjT/6WBy9MR0yN605lg/X
-27ZRj9B0tlrHYKetCW7briCH/xiU8NXBLesX1LeEQQwbBFmdkLf2AT1qElNf1m96Xtg+Gfe2
-Abd/z47qgrBGMJW8fx6mDPrCPftsLI2kEbeckEoC/dVjR7+HcWy9INX5U29NJRN1g3+jnb22
-NqBRdfe97N8knKqxpMdTZto9z2F7PKPN8HHWwD8krRf5b7T2o7SBl7acvD0Me74vu/GryOya
-tYerP8Bd3nkn2J9OzbH2YTYKeAap5N/KPIdBSdFbvlpPeePgpl8MKsl5PKNbMEffatxgPzu0
-XfcqU6fd9VP9j4baSerrXc+qE7iHMv6H37TX1sv62dtwgE0Lf7VyYWzPH77nQ8I4/k/oVsIS
-eD4r6Hmso0+1RZDBb55a/vElEl8ekA95dCX7XAltxvU4QXq/omN8kKaXHDpH3tet+PoASaFF
-5JQ0lGlyU76UARzDt9pI6mhB2OdfGuJK7y/lfIP8aX8wfSuklRWmtRxAh/38dyvtiyyml7eb
-9jJ8aGfCpMxNAS9nVf2JtY327VsyzefrDn+tqaVgsEYGBHnxzNoaJ+qGxIjKJDuDqV4pmOxn
-9V+fDXENofE20fIeR2eTVn1piGetEv1trc3zmrbDS9htb2iFpDf70NmuSSGLq1fD5DouzK41
-oOUS5GyTcLmuC3uSxu+ji1+luE9hxoZHX1miGLS9lxzJoaW9Gk77ieazMtHXzInte7WuB0GU
-ZwvqWpHgz7B88CwsGYyweLTxdZrSq2gMDyW/H5MdPlmq0xm+kXHeFUdqKsltvkwJk2m7sBte
-2l+vh3Xx97I6z5rrW5upA2Dj9+SFrpfrGkeHaQK9LXdxhHvcTybtJ43Zk1raCvI5wv7F8rLS
-Aud5F+71W+Fsfxx29kdhSb8RpvF/I+8AbuWhk6E09Bm+yhtFXl9pzWn2h0jyFyT3NvbrE3lu
-L/y6JZbH1hbHnCDp8enrcts/19nk7EwfqH/4HOjulU6Q+sFZaRkEGj+Io0s0hrbGQ2rx/wK6
-Em2u1oNo4jtIiImS4jS2g7SuUh7poT94Aqvh/TiqLGFiLxo+sbHhNNsWprRF4aVwdJjdroZn
-bK99RZf71WcxG/9IabSZ1MfAv+8Hh2n6ZUSi+uJT3SR+0FY+1imyktX5UvJrBymgFeUF7raK
-DB4Aj/eRtDJJ4sJC35LwiX23rLY9ssDWyhHrI7csEy3pDFr5n9Nm8fJpPiYc73fDET4Aj/3H
-Unsl+i3rZgXxvqLa16sG9/xOEFMeBnd9RfDEewefyqBgg0wL/pD+wUJ5P6gGg6Yh4xJJOzpK
-Mz2MPnt5F8npR3DM/vhm5NpkkWs9dvJjfoK8Tm7/+ISwlTQL/5bPwxpaLxyoacJ2euZdLr3x
-TnVIGF8nQuCLvQK8m0a7yM+QXXPpAdv9QK79R34m1LV+XUr6Ss5ohXQxjb4qf2s7Dbdv07so
-7aewiV4KZ0XeT0ib203tbhPhpkBv2mgZ4YWlCC7wZ4SvaaNDNCU/3TEcrgXDcbo43KeDUXYb
-Tx+oXNZaMkKHkldbpDVMNVCfS3f9Tcqy5zH0R47thXTBK2LIZTi7EdT2O3M5lTXcSF/+xz+1
-pHDjJV8UjvSvwlq+ImzhMW2Mf2sjvZZnI8tG2T4U/K3/EB7w++En0tV+lBf2O5Q2mtwvIAUk
-pcyRErjQAFbjW6mhi2WmDoa7W0k+dFEuWAFbPJEZmg9vr0dPa6lfSlsdKx2ZqYa6FvJrT9Nx
-8n0fxHCMrnYbP/wftPLSFngKWL9/mJB832rtwhH2bTjYHoTjrZLNt92QWRtP4TlktN+Dtgfr
-Zv+dNuvayPPR8hsG8aQiGr2ueTmutDBgZTJ8ncyWeLoSNx0m8SHPM5zHGvxyIQ17r6zzeNqN
-HhzlqaHZ9dLD6kpVyCW91ZFH4adyMHztm8Ixvh+/DMPI+0+WgI6awKbNYfiq3kvyeEG44pIm
-80ZBeZ8ZLPXJQQxpEZSTkkF9qR00l15BR6kTfC5HNZ9k0ed+SH6nvR32D2luJXW5P5XO3kMK
-+VM4f7RX9xwo9Ji99C+tnHxo/eVuOFfWhduld/ivlA0/19zh71ouTB7MDhMHRe1PuG+s/sU9
-lZDHUoi1jYt/ZJYomSkb6K098NDq/hutroacxmU64DhJcR4Pi6DHyVrH1mhZON7Dzno2bKSJ
-rTFUWUU/5Wc3+Ho5Q2e771s9pRTwNrLV9kk9+1Dz2ggUvklv2Fb662ZS4ajml8daWV6y339B
-+evpydM1ifbQQ1JcG8o7eesHSNtvSL6S8h6KTwRNkhJo4C87TRpd8aP46LSwn88N8/qvUJ5a
-SS9mA72/jSPpP/H8rP04/8QueAErLnNh7/z+WlbQI0/7Do6yM/qsArM1gu1aiWl5iRsklk36
-igwJJLV+KOk4kjy05Ex6TuAqHSN5NY9k0HjR7xWXnNkqrktw+H6SSzPS63+nC3/jJ6GN0b7U
-WnvAEX0VvrXG4UabHvYh8+tYPStni62aZfAh9hZX+UfS+Uot5afIrtXaEKZZ5ks0DrpsTh+Z
-KDd0hfTTH+QVXD4LfbaVxVJW5ktivPKa75I//Yg88RM0xpNyl49f0+4e201pbYk1yvLrefLr
-WLhctocpZGy4zquFE7x0ONnXhjNg0PEkzRf0zfwo/Ir9IIstCgdbogvtk+AHmxSctOFBAq8W
-dPC0wXby/jaJ9x+ZnlQ+1zJwaVfpql/QDYrKLX3hW8meVHrHKzP33/on8jmu8rm3JVPayHfW
-UA6EDSVROEJevTsu3cIUGsvyagNLqXXttlSzvRL519wY7M8i/PMD7rmTNNO+UE0DvCo3Ok1A
-H34JN/xBMv7P59lq7wLNF8ZH/w5L6diwO45cSruGIZMYpdmsEt3oC10ARV60bziKm/ScVd6J
-fUqhCWS2JpNDeoHVnu+1dKK/p7/4++jyU12AX16Uz/Sq5NN97D7KoR1yb7TEuKT6NG+A4ovj
-JK9kLRzywt9n7b/zURBjEpwp8nsYZaGbzd4Pqs9p3/jD8B3OtMny2HWbYPX9KlmV2j+nRz3E
-pTbbLH7qD5/oySSjNJD+7PEyesUJbsl0MquQDf6/4aNY26r0sJg45GM5L4lU9CN9gxrv0T6e
-kKPxdDc7EE9ek7UbxaSlbJF8HF8xqUrGpvCdzOVF2vd+uWFDpL5lkVPhfp8dNvS94TUrbj3t
-uGWwxh7FfKWxvlLGkmlNG6eVmNyWthzeH4+HziQzfmR3fkb9g3QXXHoU2rxEysUicyqTLUP1
-gYzSzfBFIXkq+2l2i+ilG709XXCFlPffZYb9LDfDKTIw7CMNwqFSN5wpDcP5MhR93A4ryBSO
-oDordAPa+Ugir7KtRoeoguMOtydy0Q5qfm8TtPUvg6EeI1gIdxz3nholR5jbwkFeqRAklUtw
-+mc6klyv52m1i5ch49PCxvPIo0d4S3MfKglhyJc2SW6jor2w1gTuvZsl1+GWXTdZVv3DEuov
-dkvmc7wz8PybtlmG+iZofKIUJDMueGza42vacFYp6q1lG+ucmL8JZLHv81s0jk9gkqPhnzI1
-zKNTwgS6O9wo/4Y9SY3eUtimSy+bIG+sMj/5kvX508+IsI41JYEOkbfShybeSP6SdnJFfqID
-ldTCOk2baj847hGa/EwyahJJqSXxoiHSg7b4tSaXmuj5Ik2tJW0okdTztz6Z45zl/3orWm8q
-T+zXrLftMwuX2dmwL85UjdSsauNtHNo1y0S/n+FL/B+f7png7OTo/Cn38Kd/KT/7r7KGHJoA
-z3Tz+NoRv1yId0XWe76s03+lhCbWG3j4FUg4jj5Gw/H1b2ZpDcc7S4oyXxL9O4CRK5X0in4N
-0wg4N3IbBRWNlXc2UJ5adTqJ+9Nwga8kT2+Hl2yObbXKzNW3PpNu14i/TWgz5EVYUTPZTh1i
-J/UEGlXvrtm8KcfVQe95b10qzaHenLoV5t1Og+ysO3DTcexfM6nFTlWAzFpEX8erkR+UbBDa
-P9aOfF+nH9sePRVO0f/xCMfDWJrezkJs03HJJHLMmvp7vo6e/ald90IWW6pbXGlq+dHpQsmP
-cgrZaO1rq/WlraSjLSfLt8Caf+CTj/WSP9OXdJOczHYVqLgI9Bv5zcIbXpw1ToFDnfYT/jVr
-XskrMbO70VZuLYPCi9G803tr/ZdcvW93YeUd7O8qeutKGeLzpIt3l95eGj4sLVPwpraemJ9p
-ys9m1j50v7Xw7FFa5V8w7mW/QhfrYYnkXpifplNRZjB5l8MSkERxzudT+YJ5O2w1paMXwX1T
-SF+8ZDZ5M0M+II16QbW/RO9xZi2vhXSAmiyG81eQhsPJ0ZKaA1daJFvJzknSSluTZKm4bYJB
-mvlajmkTk9lD26Gm2t5M0vhBv2zZfLuNsR2W3I7ZaxpyKWjue2uBKj+xZN7EAl9JPw28JDQw
-0+f6LVYqkHhynu7f3zdKMnT50jKSqXlww/wcSyUtC/mWgj1ryjwdxYTslS/1DC61Q8ZyZANI
-9shvnb/ESeczT5XkBuc5XBZ6LTp7b7xhtyxlrQfZKaZ1gXRCp1VtjWQgZ5Py9QJ83t32+3q7
-YPctoRX2b8KFXiX8QMqFy6RxqDoyzKW/RX7PxkroG+ui33PmRcjMhXKWNRuqbeDftXpAttDJ
-+uopSagb8O8uMkGKygrJI39Ifvw+uayWn5jAsvD1cXss31hbbWtj9DOroOXo8kVsqJSzxnBp
-GdluCSTwbV7Eq3lN/xNP72mjvai98Ty2VEpYAW1CP15gPTSut9fR/iXZHnGO7jTayGskXpJo
-p+SK/8XtAnpcKcuh8CHc4xz/yuPKDF8uB+DgR14O1y1EInzAT6XX+OR1dhKB7xVFKWv57pbe
-2j/xCV4GVZfzpPIJ2iwDxX4K3VbHleviHp18t37tHXU8vjXMO0rkWqZLyMOr/rMnoTvHi35l
-W7nwe48b7vb2YTyxsJn0Z+V32nj5Bw9tidrfcFvCqqXU0VKapvGe9pC98pV0kiMka+TVW4P1
-O+/PIxXWKf4YwvyLfnZX7ohqHTpSpC+N1as+RVv6t1oQ0intpbWEf8sRRMkGW+ktbDbE8Z2X
-saXe0rp5O8vrVew9Pi8F0Y3x5/aLt2CyZvufMP8ekmGRN2Aq1+Es1+Q8SbLADso4myM/2UT5
-0A9zloVhqgmaFSLJL12g4to6FRXE0n3aUe/rF/qjJtCP0ekG+UQay0eSRT5kd2LLHNIxl9/1
-BSRMTLry+jAz7bEXdD5Dc9p8XHGiprF6WtnOyPeWTFLRFtp6LVvkP4ePfGbYgqZwClZKrxvD
-wjonLKhHwzLawzppfc48tXyvA2Q+qVKPFnZLhslguSCf4u5VaEwNJEqLo8dHaHEJ6viaTJ/t
-5+hIJ2VB9LVPU2s6H6IJ/Jrmcw2q+Ro+vyU/4JKdrItPh4Czu9Mgj+LjX9Cuk9iXMHx3b2aR
-Z4XPkQxzdBdd6YJ/h3eWIF+uQ4EnuL0hfSNXtvgg8v620sarcjsJc/f2HZ7Xn3tsLyWJfIE0
-8yi95nW0nTSBohOyqvOhyFo00hrSXloxWYWi3/Ektbznjf2k/WFRfsqGeyl/5eu8hBxBo8M4
-r/jeUg/Rxv+yGEFmuktf76Yr4MXVvgGPSEUaNvQLvszikOkix8KjvjncRCP+x3vZGEnporM8
-GZ5/XJLIGHZwDHR2CFeMq9WgywGeQNfaI2lp12UdU13OY+GQqfn+JEzXbckg62WUjKSX9pAx
-+jkpW0KceftX99Fou/s4+mhOHW/fyweWXs6Hs/1IWM4fh8XoPW3R5xhvz60h0z/YtvoLew8O
-6AmjjOTsS0lq2e1xpBIT+R/38Kel023WUCdFs/Nb6Ukn2MXXC3hALxmj5rfpSo/0iuzTlrpO
-F+phWOSMrpJZetHjcjRfkjwxIZjtsFBLHyZnrZ/ksHEyKbwkdcKWOjr8W1+GhYJS9iG3HZod
-wixrX9AP/sYbOrGON3Cv2tZKjqDPnmFnaRaukpFhUj0TjtYSdl5X2lMS8DweulorQuPb5Rrs
-2RjSVRQaTzpC0N1xnxZSTNLSGk/SvH/iFjP6yornIegT/hdZmC1I6iWDt5YxKO1/4jutNPI8
-aTmO+6098jfWjwYZwEvLrScrOMIrw3K16MOj2Kfb1kFr+nR+orXOhi+nMcff+155hnsVIxGr
-yo+kZSHZ4+N8jCckpf6FZwvDiIO9PPNRUZZ5ddnlXWH2xeT+SdrdTXR9WNLiQB9oGonN+R3D
-6TvRy174Qpvns5iP09bDq3hXv+614JVUpNufkM9a+yDYaS0Csx5Bba8YjOR8JsAL/aOfh1np
-Q1x8s4+zW16dvK9il8iCa7BLFihrhhSkFffzj1BTSU2Mk1fkGCrIc4kre1i9sdBFQzRcRtya
-ifr/JI7H0OR8b1H/WAe6y2809byynG66UKrpMLmimSRXMNFTBq+g9KnWXTtZLvr/DWlsA0ie
-Z56CtY1hxTwrLak/jf2uHfP6np016SN/+GTW5HOm/D+vJ/M5//Z8tQoNIq1/j3/uklU2i1sF
-OWfxJaMXkNa+DedppKf9mH4kL0nwy/qUHh9XF6HT1STBBjrT13SnRLrHe0Veb8iKVPH2fs56
-+de2yStZVklpO+Rx2ED/Ck/r6TBecCd8oYntB61vffQnKw5DnWM18qGxuhzpEPrItbCyzAwX
-ybQwp54MN2kZe6Z77LIWolEu9nYaSEFtKv+xKhtkN76zSR5yJt94BljujCfzjZ7Ct3gev+I1
-PIv08L4yHTfb7knxrNr0zIHQ4Vd4bAc6VCE+f0FD+E7qeH0Rjy+XyZmH1hmveoZ3jrHO8rld
-oiclxqnS47pZ8PAs+gMekl3uywzZBUOMJwWr0ij+8f98BezUme5fxvtxHDNoKlt9FwpZiypO
-WxPyuQ/dZihNaTokv00a6WHpqWtx/xZyWZ77EpS8VF7bdsjnWxErL3fCI17KBjkT7wNIvRiy
-BU6c46XI9zsa35sHl+3L4DcrE/zOBF+1FSpeT3P5c6nh49Bpdpnqh5n/9jBwDJ8EYf/KWT6Q
-XPhKP8+oMz2DjkOrA30zj90j+nngz6HjtzBqT/xCrKs8Cr9GYVtljYm+g4rKeuPIa+d1HC2q
-s86VUBvKB0EsecYObSbfR+tpaGyQVdXMFqUXwhmyIUwv/wvP+M2QrmMvvRi+8Sc9KJ6coT3t
-J21P0Kbe4voZJDtElpO/zcquJpPK7EoGL8ixj5cnqP2qJdKbuBttS7/i+GNIXW0LGw+XJ9pP
-Xus3skZ30tou4xc7ZCeuNUxu0rYm+3aIqRkTkcDb+K820sezN7XNPL01lwS2l9aYVL+20rrP
-yutxy6n7zVmpX6UYe7YN4sjDunwDIf4KrSbWjjDeBjun2T1tsMDTBLf8MqQ2UhNIEs0nw2Gj
-az6KvG5AZt7xR9afjKjoaenen6GS/n6J3bzJkfwO10Re9RdfYkg/6cFRfyVVNZdMZ4V/0bl+
-mga+jLPMpne9i0z0yHNXr5nu75j4JbS7LfZaDloVPQl3vrIRWtsH6TncuC1U8YNUIuUOen92
-tow08ZzyMZMN8dPJC9PJk0pve+wT7YHftHjSGRJ97CWlOlTcX9Kg0Lf470Uyc49X12/hqa7w
-a0LYbgW52t7iaRd7JdNttWyyGnICAskEiR734f4TCl6h7eyTIKF1DVLZp0FrSxxssAd6zU5o
-DM4nLw7fwlPoKLL+f8z/Lf+RrOyPa/fwh9IHCujh7+tgMn6Ln8azltDjvoDSS0s+/0BmW2ZJ
-RZP9MZwq3cKHUiRsogXDLTo5PK51bDYNKL+mYCo3SVfJAEd31bFQTzzfoIvtd61nQZDPigbZ
-rUqQydIESWyZxuVMCuF+i+gbBfwbFNnPP5QBXkNGeFkaX2b5lh36wSO/OfaSOX9Km4wBFxel
-+fWiZU2WpExbQOvORhr2J/FueT6tRR+aJgt0OZqcSpb3lobk/FtSdQWM0EyiUPpB2tkSHwXH
-94Hnp3smGOmtTUMpJb2n/4ELDbCU8rF1RKPHJQaemc2+0p42jLXMShufCCveo6N1gKZT+Rnm
-JAU9vZ+29xe61OsEu71W8LPf06P0kbeR30CTVSjsI5Jlku/kiE/Iz3Ya2l/FDn4s9226xydV
-C/u31swXQ20nbb2nhv76eTF55U1xu0qSiET7HD/trcfgwJ8hq+9wral8xyJ64zX/wfFw347q
-PtBW3hnPHKsd+O7Jnle3+RHSqK488POeXIb6Z9KQ7tvED0p9/iZyLfQbtI/N9K3NllNu2mt4
-4Yz34LsnuJJlRZjmhlBmfbK0oLTQf7wvxFhVG3He8SNZxAR3sy+h9L76jG74KDyEVvpCx+XJ
-uTdMXA93Xw19XQ7bad0wUZA/HBN0C/cEZ8NDQRFbFwzDT49Hv0fMaDrLy8hzvXjzR5IKdi+p
-6aS9xmFPf/Ht0M5k/dRTaUW8qapnQ5vx6cgf45PDpIX9LGlpsY/DKBjrQz0R1tMrYRtNYfl0
-sB2QmJDKTHSUDv2vlEak/l37Sb+Em1LbZ8GFsHawKcwYLA+P6amwMQ33iryzQfIj519dAtr/
-7+T2Ivx8DKk+3wsJpM/+3Hbhe25AJ4uZxCokYEDjvm2/yBt7Ijnp8K39b1nq++mQu6Q2hLce
-Xn4gKfQNzvNUFpNqn8sTKUd3wyWkMO6ZCA656oe4vwrc8x7WsAskV982eyv73EdY4MdtvTWF
-ymNLQ5srzXmkgZZal9mHegWnLO478M98ZOQmv8I8NWC/FulLP0Q3u8d6xgieo9W/fIE+8Nj6
-ibRkbg+QsJ94NjjsvsyCpmZZCzkJwWbzZ3BaVZ8KYXzriWyb57BzMNcrr+2h/4ZOk8ptfOwW
-KfbKh0hS2U6WnJdssp9pG0i/Sy8hWqoiv/hasiegD5TAY2rjN2XYyyhtw/z+Qnepyeoeloqe
-RpN6RX1gTXSXNdA5lkk32f9oNglktI+MJuB15MpYX4hr/OH7/Al78c5XSyz4Obb8Rgoso+18
-B+c9lMX49DAbrxNxx4U0yXmk5Ex7T5fYetReUQ7ZcTrax17NR8Ltd8LlMjXspuPDHMGP4e7g
-WZg8Koelj+pufwQnrWxQHlJexYq9gZCbyfdyVRbAEj3knBaW5yTGYb3sI3SDF9KefkNyk11P
-7CPZbTFlIh8b2TRJYy/k9zCLDg2zafUwpXYM38jV8CeZBJNCQBDdjOh3ZXokF22aDrAsQQEb
-GGS04UFJHr+lndVe1k0jr9vbgNKzQRC/4ob1yI8ZYjDuOW9Jc60og/CDOt5MKkDO9SGt/l5Y
-5nJbDId+RQI0w4Ua+g+wxzDopjv3Mlc2+Fk89wHrt535aypZNbnM1PgQaF4afXFpCruZ7GeP
-15Kv18nVT9F4pP8vknlWSSbbRvwro/9sB+y8zbd79o2l83609AFWX5ZzvLHQ2EQeReVrKStV
-0F1+mSeZJSbZMUCT8Ejp8OyPpKKWk8fSjXb5C+0nn8aWvvTUnloeN3tr1/DMleihD70sH539
-IO5Xlmbyo33lJW0Zu/jKr4UfS17LQw995Dlo02N8t/+JVpPjKhWZ5y9oznOkshxk9s7hzNvo
-KW3oYPGg1L9pHM+Y18RMazpYNwMeWBx6H8J6n5dblkV/sUJ6B84q6luguK5QU3npRs9uhh+3
-8DTk+kUf6Ksh0/Xk2h08KgVt7nU031+SD/2a/M1qXI48s8UcZPHIVeQ3RJ6J1Xw2Wh+E+TWw
-jfTodBDs15DxTVsA28eVneEKaRX21KphtWBg+ATPyhtV0+JG7bHVQT4vHHwPv5SUdnpQkmpW
-OLeqjpVKWleKMPd59RXteo8n1zH4UXvfyuptxgWvcDzx9A9LDj2+k6J2S2LbBbkYHuXR5srm
-sLycCP/2BORjZ6sMqT+zGbS4GtLD/pPhNkb/Z/f1B3s/mGTxg162V6dbW31oObSpZ9e9eGxK
-Sab1ZLV0wRGayyF0uYKMX8Gqfct8TPHR0tcHwHm95TPyvI7vk8YekyzNrb1pEIP9Rxnp5WQe
-iXvM/2JtH0e/svQR99QZir6owyHBA65BfpmiQ+QhHFhb6sgxHOkz5uCs9YepB0gxSyS5yNcc
-dtAy2AzLYtutJedy2RKSTsnZr3zkwhCc/SYsVVbSQLef6Pfynp6Sn+QZKoxoNIo1fIwuTkgb
-tHlG2ktZTRZ55sj7axevpRkgqCesYJSvly70oGfopjK5W4bUfe4vbYX3sWG0xcg1Zhf5R7Ya
-Gl6Gi39PN38AYzaW3nRQ87f0/n9kFjz1hcyHzieJ4DbJ5Tr3FpKOV2SUjJVp8gFeu4Mm0cbz
-aDpo8bmlgdRFX1rAsSTXBqTzSJr8arg48p6sj/0IHjOGbtLWD3gjEqY2n5dgitKS8AnoqTlZ
-s64Q9FqfJXv9FQ2/oValB962fTqWFlkG/0xujyUOE53OfvAaFt/nW2tL5sfCnd41HCltwvq6
-nozPZXODpXY3eGMSVdEfBHN8d/CPjwnqSuVgvjzU49JJ38nvTHcJmOKwD6BbjNDWsHR97wBP
-1tD0XkTNMuoze4OP/ip/2VJ8dI5ksXlyOBwqK8Lcsjvc4R5W9c/sga21xZbSO9hykrKG9LGn
-8oO1Q4vzNKEvZD3GkG8daPqVmILc+gh6ee63oq+GfIrsugXlJpdkUoH17yC/4YuT+JtOzOwA
-/53GfEku4Y0X0eZ6T8e9JNHGfkyqsVblWc+6Pt7n0S/eh8nWymZPC/1FzmqEbvJZkPxcGuxQ
-fexltbw8kgmQ/mopQnqc9hE4RlvmvKBUsz/9fNjMx4evrUP4h40Pb1gcU99n2dBoV/8b1sgV
-fXXwy6jiHV38HP44Hw10lTXymfyPezxE/kbehTWbXvTius8L8th5dIaX07XeDX4cR1vqjNPG
-IMMGo4d/0eV4WlF+nOqqtfcpVtBLWG6/H9byn8IJfio86XlxnvVWCFJswyyug3viqOAtH9Kl
-P8Wr20hBMjCbdhCXJui0tRSTobLbZ9IklzGBB6J/k6i9NdLRJPFhm6RpvKv25Zj+4jgzSEot
-DaEXkK2sfzkS/EeI4WM4/6jl4idfeif7xUfBHAdpUTHxZSYVTX6kLT2Z9oIWe+JhTfyQFCHz
-k7Fvz62UXLG//LrVcbffSfeONsbTQSwPwt5yLfxb4ltJbWHj9Ce7oym9cdDbtwSXfX9QXzoF
-B+WQptC0WkIX4AC18c2MuMEzHmsH3fdrL6ltvQktoKcO8V462pvBpKU5noyaiEk8YT/IAquG
-Mx4i9Qoy74utp+Wxr83DvZbWMns7eH8tRHDRvpbI9VQy+UCtAJl18qu6zA/QGAZHPxf6pRzG
-ZUbQpitIH0kg3zHBP5LXU0mhyO+CuT+3U14LsjrqGcnQSVIInkzMHlz3X+GpXrKP5vm7J8R/
-7vt7aLK4fEmbK0+rjlyjpX7kHe38HcpuDXOP1czSW7uRFCvg0M0yRZZKcVL6MWywgH3P5NVk
-mCUnFw54//BLH8jMXQmbe398TGDUejzOSHj85+j3OW6JRw2WDTIEPTaHAzPIOrnANK3wadFT
-NdVXyCwoY6zfpn0WgAAH6yA66jYo9RXrkVQ+1ViSUI0mmkMmo/kspHUfOswE2+3fhXk8U3jH
-coShLQgbexb2epDVoSOvl0t2Var7C2Y1oTaS4rpImuhuKaO/Q9knZYxskTJ4Z3Kc+74Pgnx+
-JL+fSyWPiz+Iqv8r9yyE3uNpLE+v9SDUA95SP5by2pdV6SHnvQJrkZvHKSuvrBu+OUHSsJIv
-oeVjlhcWSsMsf0wHGCAFSJKa+EY7P8VKr5Y53l6mQbED6QpfQCx9/baN9mk2xavYXP/ANnAm
-1/lzSRlsx+Qg2VrUSwaHfVFQQUYHgyVe0BPPbCC3pJOslV20yux03S/xz2m60WdqKTgiFd2s
-GEnUnsnv75+gzTbaz9uSkklY4YFk/iUv5x29mGekWzyz6v6TlY68Xtvft5t2LTxhj8P4Xg2S
-O27jYfGCOgd9nKRZB6irNMk3WG6jxdi6kzT8RX6W42TSTjxhEIyZVxp4YtY/N5PfivwdTpYM
-pS91o3d1koV83IHXPYWUPpL/4Nyt0OoQLyU1aPjZ/DuP8in+yM76U+stGcnSYfjnfXy7qNSF
-IdJw7s/poUdlNGo/yOPGgk4L47TFOd/4esHWSF3LJ2F4xJ+GczwDzPKFLfXdtt8DD3iUVjzi
-TinPmfwuF5mxuZJYi8hCmFYi1+n3i7bEN1kCuWuzWKl/JTLxW2jUvT2G1vF7TN8jdJxR07IP
-OaJfn1AEH50kd0jS03DmNj9hc8jyCT7cFntjO+Kl8a9KllIGWAW8YYaUjv73lXaaReZrT5mr
-X0trbYobp5O58i/rEpv0KY96h8tGX0gyTJGH1kOmWGs0MVp+IXmrMB+H/JK+L2e0Fl7+lVyA
-XnvIWeb1mCSU2bIHvqrgieg2T32w3cODrvhs2xt9vdN7dtoLkvHz/DeBhunVt6N/k3kMdNXa
-u/swJvkXr++vvKRf8Vc20edaVa9ljb2IHfBm1ki+t+uQQm1m9ltd40f1nu+H2OfoQMj5iJTA
-O2NpXaVBaFXpBwFWpo3G0jNQ0XaLq/esJVSykTM4pKFPIwFysbqRV/M0gZ5jS+R3lz/D4T+L
-fv/cK2FamGKhfR5Ot43hPctpnTiea+i2hpSBYCOvdTrn9VnNltpLSurPEqjqScmta9HFSJKl
-hJzCC4dIOc75QeTd1elZxbwz81gP98nFaiaG1t6XJBDARDRcEseNKGS/nESpdf2BP7D1vj76
-3Z4f+VKLJ8vYzZk0xzG2TlZHv66/G2fTWgdIfjX0VJP/99Az0k2HSW2mJjOZ8U5So57Tdk92
-2h128Qj+MQmnqYuPV6TNDJEUfpX5ya7v2JPOeO84eUt7a+7x+K4D5MUin4dHzIUYI68YmWTn
-+TwpCTkAB3qFh36m/+M4jjDt17wp3llby0pqHYxHzJDc0guFpiMXttHaGtGeYzL/B2y5bbZM
-Ftdvh+c9Pce21/7Qaf5pUFrKBrPlDUmwif4wWFtLFS0Fb6Rk7p7B4X/Sltkb1HUAx7vMrL61
-ZRLH90h6/0ua+h35iZ6UUZbAJc3lW9rWGRkEP/8g8diXg3xeDXWf88S+nFVd41+hzWP2O8r7
-K/p1samZglRQ730vgkMXk/H+MT6SET+54OW9mVfxk+hgiM33L+0PiEXlW0hhhbWnaR+VGF6B
-hJ5FWs+gkTdhNYvqM2mgvXSkrtZO2l3PwU+v6SFpPQ6dtax8ab+gzUqa2adod1+pQ/1/2tW3
-QPSbdZKP0t2o7Lx/KWd9D1Pyvh/3RXaJmbiJw5z0d+EavxQu9D3hMV8fZpFdYQ/5N5wi/Zj2
-Mr5EiqKlbPpEftMEGjMQPY9KB2tzyYX+3+EwN2SCH5TWfOfH+HNKbyTJccQCMPnnfBzpLciM
-fqxBR1pmZvrjNt/llUj9+xzDZvvNp9s+GsRJr2pRkHE9SUpzzGMxdKRVJA2+0BM+WvvJAqZi
-GSk4UFczI99LLXlBq22gZVmp7L5Y3/ev9BGEthlFr6XZPrN/pBWpuJXGfcRr6ga+d56X0O9J
-y9uR57DY3+wQxjtv49v9iQ2nHXb0h2EXXxOOgBzXoqinvhp1F/IZstiPyzl/iAqf0q/+hkj+
-lJCvKV5+hjkejN8lJj32kH8bbJP/i2uP8hmeBfZehqIe0Akjzz3k5lgaaVyZhANv1f98J5M3
-lWMqA2WfQSud6JTuk8nXld7J/6HdtJHapHBdvyv1/Dp+ulZGe1NcJhXKjE2fysbUlidZispi
-icMxXYCG90DbK3wqNL/eq/pSL+09vYPX8Y2k9n8oP4/UR8HbpR797BMYJ4qp2OhNvSXrkJXc
-jEmux/IkMHXk9bOZoq9Y01WEZpci+nc/P9Cd5GoxHGob7pBG42kFDfRDbpc5onlQ10iyIPLu
-qT9IZt8FJW7k9p2k8x3wxDMSs6xO9yE6ns7UB4JuTlLUIMFq0BHa4vDTmKhTnttSy6mQRkkn
-yxfOlCLhbJkdLpAKtoo53SAxZaNchdEm6o7oNvaUpvsjyhhCHrXTlzSlWV5HI1dPi4M278E3
-b6yTfOJrZJFHfk/jvDyhr+/CVyJXReyIbw/wzT7Bt7CC06JfQTrbf8er6ttj2kQGmRO2lIbh
-VskZxteCYTldFjbQIdaaJjUA/h+FM7TUpyKsxURZqfnkhr7242R7Lx3lkSscx9Nz1klP2H2N
-7dmCmv4UrhmpI7wYDF5YZ5MC63C+/azuSY73JOux31uxg7+SxEVsnG8NO3u78DNvHbb3XeFm
-b27pJaH3h0fXcxbHo9/n9mdUFFN2SGO6dUvpwhmWouHFkOt20V/Y397QM8Cw3SDib+GDFejq
-Kyb4MxkIf39CRziuuzxjMNGrBf28VjDUUwVzma9dqP0Mx3MWDW33h+zPZZgvyn/z3Gi+ENov
-woz09C4o6SOIKja8GhN2TUK7SxCZVM8PEbTjNoPJ6ctRJZVrvsr/YL+voMw40g9yGOD1pRvN
-gBSB6ROJoOePUHQ82Gy1d/Mazrr5IcvLrpTwrJ4ZzT600qTRHLlp22lQv0rkijJTJI5ehUj+
-gZFMxkoKbYFSm0sxOt5L6S4d0fxfuPRsn8QZtIVWIq9VW+NvJPK8+1KfCBlcodG81Q6+gdl8
-AV+EnHcW7+dzrJ5Xt74ezw76hjC+fEqDjxMWQhMVZV04QFrg3+8sTXRH/we3+Rav6q1bJHPQ
-RdoEOSRncMf3cZ9D0UQ/HcAMDIREBvp9VmAC8/IFbD1BRqDusb4Kv+wqX3hWiVwzXSLv02GB
-hHYHrfbyx74Chvgt/JxjqMHjN5eK4XfSLoyrY8Oq+ifabEcifAhZ3kBhzVmBr+UDMv6u9CdR
-10ouSUYzGEn/PK0f+3/qljD41fIF26x58M6+CKZ50SC9HNUK0hafKqYTSaWmsNAwSPJXjuu+
-0/VoqF1h7XTkRywfExb2CuEszxMqM9tQ0tgoesh0mcyu/0frKx/tC83lR8lJosREoXElj+RH
-u42lLaxSkI/ve3N8dKqk8osQ4BuZG319r9IyXY6RYRv8S2h6Ks7TWytDSzGg+GU0rMgVyprB
-QR18AWvTBK208lk+F22dJHHueTkUVxKvzib5JBakeQkX3YKml8Esc/0P9n8fXPuDZKDxN/Sa
-ctEvotYO/j++spJE+1o+Ys4q+hy87xhfvyajfIusgvh+QBmRK0xm84W+xr4mw3p5fvuSLBnj
-N22VD/HDMOEjOmgKprKo/CefwXZdmI9vpJDOkQ/hk3w0g2Kagi70CDp/6AvI9upyl0ldQx9t
-QW8tRxfu5ROZgwUSD8dLIH9wVq/o03fkNyb4F+h9KW26F5negTyf6WfCG74kzCtVw26SMPxe
-8oSPZXWYWetZMTXLpcvx8WZ0yTzaEt9MLD2Csz4u2M/MH/InetwX6M/eHv+szgxE3q20sTby
-TtqONG6Hrzb1z2HgSnzNaeEjpZY/xRl6eBdPSm7tIzebwzO3mYuvQtpU+NRLh4mkTNhXKodv
-pUvYTneFk7WEfYMbdmba6unf3FslVmI0E7tL1ssrulERveA96XzzaZH7oFQJ3vPPg4y+LfjI
-TwXFfF5Q0vMH+fGsdD5Zk3krzelx6FGfyzqc/IIvgTGT2jY/D9ucDTf5ndD9bdhaMtsC6WFj
-6EhFmLg7/gIejFwtqQE6KyQV5KUnxEuP+0jfiZIuM2vJIOvS7HULXHAobrYcLf0m7yDil0xu
-YjkkHej4t6WdNNZmMlrbCesjb2npo+DEuBJ5rqeWx6ebbLVf/Du7T8adw3m2+H3/gYQ/74e4
-1zT6uzckD3tpJtb5rdXUwNPS6q8xCd/jA5FX97WBgTPDw5u8g3wIbe2zjrIGCv/L2kpSPD0v
-x5QF6okJcTywFfInbWG9FZDhlkN6sierLQW99AK7tNDf0lXTyHH/iKnoKd1whs/pcu/T6y74
-OD3oLfU3qPwE+74FtpqAX/XDH0f6OYlcleYgHn6B+3jgBViNGZFr0cin8lDawMeNYID0OO0Z
-j8+RVvWfvaFd9WnhQy8U3vSs4SXPEd7xzPhnrrAyepgoT8IdstJ2o/bvmNV57MVC2Srz5WM6
-yEnmo0WQW9YFiWVt8Mxbo9FXiqvoZ95cs3hV1qi41sIfJjETq/wtLTe7luTrqb2IFotuvUPY
-0bjoYiYTmcQj/+ozwK+Hx71bmI9jGMKMbJXY4SNJG+bQumEj3RB21pzQ5Bb7SMvQeH/AKd76
-Eckqm6UG3X0cBHVZkjC3Z2DubX6bJlktmOFbg7YeFfWhJ4yK8uNBAm+JPh9rPZ+ALrPD44vY
-x+soKrH39Q7Wz1NxS49vlMYrytkFz2mxJZdllT5WkmxvwXSPkj6sw2mZKefoIHOlrpSBXV/A
-z3v8f5zP/+DEy3Td7Ox7KynsA6KvRfoTXhWbSaorJ+U72Sv/4rYZ0GUsrY0PfRb9XHgGqSpv
-yO/z5O8CvPIT/5GuuNgv2EL8bB2c/jMdc58flQ0oaoani37tT33PwZwV0TfQ+WWrq3etLezd
-SRv7JzqW713umaCQoTjCezSf5xZ5BjHyOy73ZIfF1DGWI/L+ctqEua/PT0Ze/Sx2UbaHA2Ua
-3eMgvtXRfoJTtjOTf/hLeUwrvEdG7WDW+3uPoKJ/GeTyEsH7fiv6X8XTeV+8qA2OVkFP42on
-fCne3or9bgklj5f3ZRleMhrWbUAClSd7akomJr0ILt+KeRkpfW2kPAwbwXfJpHZ41f3dDT/8
-Lpmcf1deCoe1ZGVYRsQqSA164k5ItgfT2hCFF9Fyck2feJXggA8Mdnnkuvn1g1WeLujr97SK
-76ebzNaW8P4Yf1/nwoCTvAm5v50ecpbsHUfzfyJ7vY7g1+hyIMyZ1ef4GVtOP1vrw1iHLmii
-usWXZNZUDof7ZUb4vs4Pi+n9ML22thdy0G7IC3tNZ8ygBfxjXeJZtQjNaAcp+5+MwIOqwzzx
-JZXu8d50wscQQY8gpp8MYvnfQRofH6TzG6peSC/aFvnDGsg/UOJHsFZD32WdvZX19zI2B/78
-y4tGPwM8Sn60zTSatSTRKBkq7WUiq9Ek+oqLmSQdSZ9ZrnhKvOGR30WjRkdOQn/KIKu9IGf7
-GTv6Fd/7o9SW8+jzNHuxDs6bDgusYFdOcE9npA56rcPeZWYvN/pEOsg8P2gb/IRt9AK+BCqO
-XB91CrQ4CRccCfn19qLM2ArW+wr59BvZNJTbB+jyrFT3zZKHHpbah0kx2s8MGqjAHNWkKtzR
-1HvQzOdJFB1rrBXV1NZYz4WfkFFxdHX4N7q4JfNDZ/0TaWF7J+ftuCxEWS2llMSDmSfqRv9b
-u7Hvabx6sMO+DHrawKCFVQ0G2L+6yDbpVpumh22Evkb5n+HMB5nSgpzvUPxkIXy8nA4WuZLn
-ce7ztqTGSbfS+fL6ZBlmPeVA2EEKhfXk33fp8ajjXiCc4xVD9B4+8vbhp3IjHC1bbDXNejtk
-ux23WIoHd5Zbkkbe18PeUaeguf7s/UB/Qwe9pcN9j37hk7QmHl+cblyLfJ9Efh7xT/UPT0IP
-uYAmN9IMRkgimmIDyKkpu5EVerrsO2hKudnVqfYzfvXE37O0Us4KyVA8axFzssDqy1RyabEN
-Rp9zyNlddMezNMHr0hUfPeGXuK9TTOIajrAVVJRcfoInp+hz+COuLAhEWgbH/Bj9sIi24idq
-+EH2b4Xcsk9kDGqsaKFVsV02xy5bMtQ63bvDYd+wn3Qx5nMiqpjJkc5GTxPJ5u7SSSpKW9TU
-ncfqKcmkEh8foNJvSMCy/r4UpwV2wUMjrzX/02vTD1riPn1osSui/7V1NOw8i9XsKhckC59d
-8qokTR5IPQU6uueVyfGC6DTyOrCG5OoKun9M7r0hZzyRBrZbskf30OYa2nT632RN6V00ozfT
-vN5f6/oS+HommfuR3qYfPfc1HqDWAvjmULlmv7KOz6S1vZI/ot8VfivM/618HW6WW+E9+ciy
-a1GroNktv1Y2l1N2Qv4XaRA0oRJaX/bSQ/MH45n1zLDTb7YwmGiVgg52SVvabO1lX+lEG6RL
-o98n6D8IYZ7stS6SwMeSCufJifQqmkq/oOtHnmPpjnvV1lIo5bVV0RU8Zi67LcvCwVIQ/375
-TuTxu5iSPEwidcKEsiKMkpQmstRiSk7OaS696xUT3VIGwa6dfBjn/QbuyRe89iTB376Ze6+l
-1T2Z5uPWFEdb69WgwyJ6yWMzZ1eYvOOk21HWaL+8Bylmlll0mcFSGC8pAot9RGvOKtNxoVkk
-0VZPTxploIPkl6xeARYqxzrmwMfek36WRSZZbRllg2CjUTLQ2slayylur/wLqPAJP9NLJkSu
-HSev0avoRomrU2H2r6WRdoLzUstk5qaWvmOH/md5uG3Fofr5eWvh262RL7bWuNZgVDEdx1qI
-F65FL7c9OdOUCferii8Pkn/wgIWymFwaJNkl8hu7eSRgkq/DeD/RO2Z5UzI9K80kBlpLJ/Np
-iZecbsuKPPF/8dRtfM8IOskIGUNDmOfT+Vol/v6CF2LF88KNl/2E92Tti0Su4AWNXqZ1t6BT
-LJCvaFtd6Bc5/Bta9B05RjLftsOaHk+j7ZD5c8msOjrOH+IwX3NERSGhJEL2eU86+0C5ZL2k
-gg2Tq+E6+SG8KovDJzIxvIE+r5JXUfpzWELfhdW1tqXSY7aVGW2Oc5bG5VpKWZ0rTXQp61lZ
-+kbeG1gfos1xaHS4fRfMtM7BNxY/KG8/qoVfqYcdtA3MEYc5WUNXSiuL4NYa8Hc8duUsjeV7
-b4G7faCf4jH/2V6Zab9INjsie8MNMiQcJG3xy370ktVhFbkS9pCYNoL5aRt57RketRPq6eOV
-pRuctir6mvGzofzZKOiANPHEGsvr63XrD/cM1HvWjc7RTHt6aXwrCdx/Cxc/jctcxzFfo8bX
-HNvvMhAH6iKNpQrUlY7PHvkaOc1938IbMstubybZ6JoX8M5Hllxyo9VaTEdR8uilzZINVlOm
-2XPfYHvd7JBX96veFb9p4M/w4Ez00zFSx437qaSfyke6j2adVMtL5NUBafRP+OKY70IdY/jO
-ZtxTKSmI+nPySG3tsa+GMH7HT8/aIn9kZyDAPHTM/jD8ItZ0iVyCOg+SzOv58zp651L+1F7G
-kAJFZY+fRkuDPC29eLLkJzE+pgtV42NnvH4yFP69F4TaaulW/1DX+07ZSQe/jgYTQZwpcdYr
-HiVfR7/iMPJbaa9tE3PzxFMwdwP8KOSwn1voE7yLNMCHSnAvudFhAvLssg3Vg2TqfZuhleHD
-ZdHdaRNE1wyizUoPeUxjmuKvJYQ5O9hZCcMZci7sKnfCnhLHxklqmySJyKiYdKL8ZnTFd56H
-JjTXJ8mvHgOq76YqS2nqUzWWVtJlelziBAXkw2A0Of/MEgXjLSqoaXc1i63Vf8JmehQy2xP+
-K4HdopEdl7HscUWSYhUrtp8/XWD3U+LuHVD5HC3vY/WRldF1HNt46wGDfiB17KHHpxfuDM/4
-ZHrS2jCGxIK5vrSqctoq4p8ZZQLuGchNj/z2588SA2+6SbYM8a2o/RjuBlvYY0nn+6In8wcS
-8Tg6u8iM34SRnvoZJmU/Prk5+lnItpJQC0rzaIY54SPpfTU1io5QgsYwVIbLPolcm+KRP4Xf
-TkgrXymlUFJmHv1faylb6ZUD7bZ3skk+ycr7cUuPRnPRbdpy2+Pp8OCq9OUpflhO0czfMClx
-pSG3T7lFrt5/ANeuz/rs8BlM30qpb7OhmX60gXrya1hQXpAiH9kb70OCnMZfa3k/zuUQx/0v
-/dsklCe01nus8UvpwZ97yzYYspr8wuP9D5/5AuXUlpocbzlWJLO7BLSY0LLibrmgnhwQUVwS
-5wCu1lXuei5JJSmkOLeqOHBZOYKWhkCKZfzm/1k6C7Aqtq+Nr83FDuzuxk4s7O7u7sbGBrsD
-LOzuLkTFFgvs7u7uZq/vN/P/Hp9z4ephZs9a73rjMKG58egl9RrZ8bKOg01Xw667VdGyMjDu
-VOkHRovjwn/YJuYA/DDfTjEL8HxnbGMyqqdZRC5JxTZn0YWvshbHXYPEdMcmA5+XJJYNlmvR
-XeR+dC1JbItJTZtQutlI7WMDdIxtgYqMxl981vXUPxq28ZFepr/MMUdI66nNdNPDtDarzW85
-ZjrJaXPAfaLPNnPKrjQT7TSYt61JYzPBoY8lg90rE+1qSaGrJQSee6MjyOpl8PCGCX+hmc1L
-0v4jnUfqL0tiXQaaEsgle5s88luzo5k3ojPJ+mgj66JjyFXye267An0/jb7OxjGk5viWaE5Y
-qTUzuwzE3IUZPksGvSReuDJv9UN3hsoZnSffed3XPiSD8rKCtPgIpSuOD24N75SUOfJR18Ei
-D/FRucxostNcfGoYnXsB0xSg18slBKYbI2tMa7lhkssucnpT+vpDYuJen6BLd2waeWDX6BNb
-Uh9YLximMN8P1mi7UtNTzVLochN9qf7aUZzn+F3CBX/AFf8HojKwjqowlvM8lEBpA5r+2RIy
-1P5SDzpzOTpC/zCl7WwWibS9qNIWaYXqrGcrccgF/I1ZLd5mjWRjhZ6mm5zFTYyU+ZKHOj8k
-n89lMqtrBrJbDnloh+Bun0oMji67epti6HopjQK7VyQQLj2pMYyQ6jLhwfPLdGpVVMuSEEpJ
-a346WL2Y9RhyitcLjUc/M5MqWuAlNlHDF+j7E7F2vdy3Pdy7znuBoj/2iJwAeevsJrnL33d0
-n5CcDw+Sj59KwusUGa8FTuu9xaHgK7vxE9VsNSlnLzjPItRVtou+sJ3UU/sw95Op6QktwMQs
-wzPnlqxmiwyEO0eZQqaxKWNymGomgellPshqNP+M+YfXI32ZoySqCaxhrA2ECf1kiu0qs3gd
-tMPQrPlgYwN+aKmMZWXLSfGLSE4LJZFskad6VFbRZxRArqPfbe0rOmP1Ppj8GT1DfO0amWaD
-5KwdylGTtdy79DrXbY/GY6Wju6vpa3VeBbQb3FILXFaSbnTFB2eTAq4pph3IluXkBK7rosaS
-ve5d5tvKShhjt6ZE3QrB5klNG5JNNhQuO0c+HOWOS3pdCfenNYNkqGknJ3HhHh71JYNHFfH0
-yCw7zF3mfyz19dWiTMZt8m2IZtcucGZ5ja85qGdq/WZz6Ucc5B97SLNoKjpUXzZqd3LLaPLY
-UvLxYmlLl2swN9lh5/j0OJYcsAnISF7Ske9bWdWxNg7VyU/K6SFrSAWOY8wpJUwbaWvmS0tz
-UnzMQ3HuEvEBj3sIbLaTcXKDo6ykdeUk/sPflqf32ch1qUFNeTg1CNd4k+zzCnY8TBWHule1
-tJcYspZ53i7h+MSt4OkIavVJT2oefHgrOYciCX0sTgrrgAYFokkhZPENYHgnaA+XhHBEJGli
-Kho60u4Gmy3xpEYS4RIK4Da66Vn3Wu4u4rjRKvCTB1nkps1vrtuPaNIayap1YOEPmo389dU2
-1cO2pm62vfSWXadVYPEo5q0Ene8t6/Fi0fSpgbkt0015M8csMC3MYRefAdLQeMt3eam7SRLB
-zLa/rLHNpLWtKM15jbfV0dmqrKsCXrEqfq4VUz2UowohiWym8yGwWE0ZzL+0o1715aWtCRbL
-Sync1x9y0a1oL/xyObh+sgyyx+Q/Zn01zjCrDCGv1pJBTFAfcNSXNDoBBlgFvrZxhAslmXaS
-triuJaBmJ1l8H17pov7Wd7iDt1T6iKtZuUm0jcU4V9naZ7B3EvxqapMSp9iAzi3XPUxQCN0a
-I5XMUIk0AySzRzMp75FOinic04Qe4/SeaaZzTB3NArpnyAD9hisbpe1hzDyaQT/ApZettR/t
-L1taU+lM7UGfL6CJ6ckmlalcbdikFhm/Ms43J3P7GJ3sq3/0s12kIba2jrRldI4N1IPo+ys7
-1rlKA1QVdp+M3Y5VLZf6MEh/s0RmmWCZyte6ZpfclFDmP4iprCxf8Evz7G7tgYt17i/b3I4g
-1+2VrnaZrLQdJDmTvA6sestpEL1GdvHdMdlGTyfpLAljHoR1ZRfHh/eCWSey1jm49clyido/
-k1YSjjfpit/1xP2uZ76bwyAptBE8GhM83NLe9qbWxUf3c1jHflI/XM9DHUK+K4qXTKrtJb2L
-7J/MUgyTG3WIATt8tY1wOwlhtzNa1X1unZ8u1qlg+x7zUlYyygTWtR622y+xzE0ZYH5JmIlt
-DvF1rrlMVlosiUxbZjUjM/cMF70SFaui/fHxrTTQ9sc1rNKd9qHmh6/2aA1JjPIUcp8CGgbC
-wiUXzJEL7kgADz6lb2dJgzfhnESylgw81O5i+q7wfZi8sWPwcN2p4wS5pfuZ7gt0cj3oqQva
-3+AhFoPLjuhJIZyWtZlQ24Ty3aaQeujSGXgpJ3upAuvk4me/UJ1jIGkpbDYMXq2mzSWBNpEX
-6KpzNWF8faqN9ZFuJx/EY5Jay1P6ltH8gUm7m7dyy+yRtB5zJbXHVHkCt841+aS0OYRG1tFm
-aP4NZr4zepQOhCbi6Avxp4UWo8I1SSp+6twvdxNTE8k77ztX7qKfV/AeJzUJHvSwrtO2OlZT
-awNNCSO3RdGi9Lv1puet0dDhHPkOWDe5WYTzOiGfzQMRj1dywERKbTNWXlDj2eSaQlQqlKr6
-6l59a7fi3XbSjQhdad+A/Mykg2by2Q4mJw1iTjrhgZtJQV5fQdYRpiTKuQuC/KbqH+CePzqZ
-nOtHvQfLTPLXGbzvO2ryDc5+LTfkPHM8k4SZwfm9BLPvSY23ocZzYb5ltryut83Zc0cSThXY
-MLP+B5O24Ci3wMzO+Xo+OK1O8g2fvoQ57wwjt+Wrc/fFEeqLq02Dq4kP8hPIRLjzC3M3Bub8
-jk7kQTeKoeklTB5TEhea3lyS+6xyNgzfBCedzskbulEnaCNULSFdeWez82rPGo5rJtZaBpXp
-zJ6Wk4Bf4guzMtnlySZlZQ+4GYwjZa50NEkzP6kwEXk3DmiJhbokY4qroD/BqPBDLWhSSmZT
-lCRQAX/QQOowt0moyV3UIISVV9cTGk+noKhDNIYupwK/yZz1ZCr736cpQecWHGtvEDmWfdyF
-WQtTy8rSUmPi/bf+/yd7R7UivNudn1kLFv7hXXuimLdxOrlNK9PMNDE9qcIQc1XGmo28ZktH
-04E0rrDGdKahvD7R0ihQHw3TtXTgAHliBXXpo6iWdkT9l+kuDWeej6jzycBf3rGK95YDRx9t
-GEy5QzfZhXrAjtVPdoLWA6+RzG41uckMPlVjEkkTuHOnWSc/TLj8NstkGz7Uh8qcJDUEgKyW
-eICC7jM92sJTZTQxaziHjwuz+2CPhChdVemAmo1Bt8bhfua5zxdpBx7rgtMy+MqSdKUqfekA
-+4yA4UdLZ9izFz5kkgyUq+L4iTSmmyloyoHROyjsIH4mt/zVH3QhCg1ZwfH20eO2kA600ba+
-/Wzb2TQkyK56jEn5aO8zvY/A6FneuRM0ryGBLdHY4C8l7qy+e4+lpjja9qTZjmSOrnQySJ0n
-UXaUec41BGj4UvhyvXkl3alFVpginumMH28lGUhON5m0quJ8HjeGWe+jT/GwX5mS9FS0FLNf
-XbvjNGaR7PYyiVHU7RKZ87Y+Zw+PyR0R7u88BjHt1fCSn0H3Ns1IFszDOtuAjvmknkMaxk9G
-yDF9gPeJlgiNRcp+wZQulRxSCWX/jkvZDyOOx7vXhCeTMl2f8GofrYfEY+JKaRzphWMJgg1X
-61xQ6Dw97r5+ZWqzwlx5ZYH+0lq6iEmqAq4KcDwdqNBhHQmrH5WG8ocMX9rskCHmo4SYTCbI
-5DRdjIdJbq7LBjnClB6B0cJJWCtB+2AYuRoKnZ7Z/0PCfQAaT+khJsN5Fl08ZqUw2CkBGmLI
-azpzS4vy33e2tV63efSezQrXVYYth8Gaa/Cwh0HWQ10AklPj3IPkAHU/KF9lBtmojRQ39aSb
-aYG+15Uyxkueo1NzZSDV6+be2+gFdZlKb2pqbV6VQE1vmPs0c1MIThqEM+8JVnPx9QO694bq
-xCbzJydX/dX3VMkL7qmNM17tfDZoCnDcpEdTiRok5fv34OA2R38SnloM07aWo3R6OVMR4F6d
-GQRL1GQePttXdj0+ZSEsfsl+p8NvdRgzuUhb6wxtqn35b3tw2l8vc6Qh7lMrnPOjtmmkPaIv
-6aRz15CDelJKkye3yj+046/0Nf+R1eOY5eazDDb78DkBUsW0hEsryxtYs5lc0D1su5p68ycV
-R18adzVER7ifTp6nKld1JLXYAFc8AxOZ6Uc9NL6jpKHr36nKUf3He5/ToxfwjnN8KVB75/5q
-ZaQizDoAvt8ONiNIMc6TL6ZIMvpSDE53ngJ2mUQUAvMtoho3cNJp0b9CsG1CHP8tXYiCz2A+
-R7hXm1WRmeqD//jL/sJRvSBW3g+8+tK9nzZAL9rpYGKb9sS3/0H5e7KnzTjw22h7EjPCvS/z
-dLMXf3ePOvyWX/Ke5LRRmtO7jOIhP9TIdS1Nuh2K5w8En1UkANzv0ytw+FPW4DzHMI1739QS
-cker4+uykBkPoDuVQIuFJ//aauqFesTWtOB0uO7Dcd4k19TBfbznJ/pIG3CyTpbIZ5kmVubK
-DrxVXvJQOK4tWN/j/TbjETpRrVL4AF9Jow0k2jaQnOotQ6nzXl1PH6ay14lUZwR4bMQkZtaM
-uBsFNfdByQMYPxZTVAKf3wgObcNx+ks5cwB/m96MNH1A6XDzhmk4j4qehDe3MjdD0fa8sgz2
-GUlSSo/6rIEZq2obzQlLFQeNlZj7rFTjOex9whaUdzYrfPIe/trCDOGytInGgSPSwrg9tSVe
-ubB9ocOce7/Q0b3aFdV9Iy2lqRknPUmDWYy3u6Zhcs4MkRNmnozGb+ZEVx7Ic5xfd3Q6L3xV
-Dcfo3FliN/q8BlxO107UuybsVIXJ82O7x/Ey6UX5v6daBC/zApQsB7FzYPUI98kk20Gnl+t3
-48otiSUvcaUHqcwkCcBjdMYBJ5VrpO8b5N5AOQ1bvsVNvFJ/mGkrWnkJRVlNtavDSWnYXhXY
-YDH9OMv3ofRpKglgNPtYDjL3U601+hquf2JzawL0vLhO0sqobRVmtLcuAD0h1DtQYpg+UgNs
-1jUbpKa5Iu3NaQkww2UYLqOkuUNSu4P6/cK/eOBtX7GmM7oSfNeGQwqQKvriDD47uoQ2Tid5
-tAFR8enjdW3IZN/jnfXg8he2HJxy1CbUAJRvrZ2nyUlRY1jTLtzRVlz7er0vZzWPieXeRT4C
-fI8lpfQH70Nxoe1wOon423W6BTXsKr4oQi1SRxvW1oCjyYc3T01uLU0WnE7tb+sRfY2W7Ien
-AlF/fyZipz4myfy1xaQZWHXu65yQXpWTUlT/gkTBSplMG1PX5DIV4aoU5hMzkdLcAQ0ncYBz
-ZBaeIB+V/gcif+OZlZq+B/8nqPQysDHbRcgat0dT4RDn2Q4x4OZrdjsTWF9jKsyCG8ynP6za
-y/adXW6LaZC9pudtf/pyGDU7CELwenKXWuYy/+jGGNPcPHTuY2kWyEyTW5z73EagtltlJ6/h
-Ol184KSUpGIf93yflXD6TY4/2lXPNzBnchDRROaCqcVM9QLmchxeqj+qN47qH0Ht4pLASuFq
-yqH1xaUbSj+VZH6amf0LKo1xnF8mevuEvHac7e0H23thy53qZLER4G0KqDjK1L/lzzV9CW7v
-4R+voy4PdD457xn6/oaqLYDLcuJGn9gU+sX+tmXRnqmaBQSUhEvr6jnWlAbHEoKGJsRZVcFr
-5jENzDMpAj59zExpaQZKL1NEKptr+k7G494HowcbmLmPrCwxacRDprGKtkzFYBzgCfc3p7/R
-grskwsFw7B/Wuo5Jng+P7YA19jAX/iowxBN7l5SvtiIKNImVr9Ni1Ks/9Vru3FUVbbkmzl2I
-AmH0uqRLD7Z3HxR+otoZ+a4y+KzlPj9IwKeB+RrCIZtw7of5yanaD6zGwtHdIJvdxG2cZ9/T
-2HdudZ5hVRl8TOL4n5BV8rlXXztPWK1NOnDOq01impr2ZoLpaHqZLCYVk3oSd7VFpqD5w0lG
-dWQVU1oYP+ZcmRFO5f9qZ9hoFHo4ksTXDy0bDT+ewt/nxOu3h7UqSEWQ8hJHvNymIj9Ze4WX
-oGFx9Lb1gkMb6B370vE+cGceU0g6mzFgchOzEiXeqHtCnO9rqWO24r1qssooPYND3cpxOncG
-nU5faspsJqYWnJ0OFJTWpLKUGY0lMXAJoc7vnHF/relZX5R3Cl2c6d6r7DMO6DQ+6ApVSoXe
-DYYN9pMHz6NdR8hcu91s+Ex+wOZJzFx0NA5qthCm7k92CoAVp+Ib/HUeelCOlO1BZWNQ84qa
-TJw7y55mrxHuE6MeUa2H+MkbKNc6ZrOmpqEiP2yYfWGv2cQoySDe4ZyFXJGcMFau6iE6E9u8
-I300NONMABlopCliepiL0sn0lR4mj7Q1VnMZ5w7ZK7ULdaaX5LIA1OIUWhAPPBXG+Tl3zWko
-j3QIs7WKzLAZPAWivPn5+0fai9lsAb835CgqwRtZYHO1N+x/1LEmynJEM4ERP2Z1Gh7bOYs2
-XN7pB/GUVCY17BVXrsgzHOYF0HQPtHuCYG+cb2kZwJG0Yc8ddKD00fmsbQ38OZWkWU/iMqcF
-QFA99tCII6+g9eGVSkxmU5RsNLOzG+S81KXo6A7pxwycce8VnZL809rg7UwtKpHf5IO7vssJ
-uSeT5SIpdwXcUQEcPuBI9pJD7pJxs5Kz61LTCkIuxMk8J9/dd6+aFrlCvcaggL9Jgb3I80nI
-0nFtfK1o0+pMtOSibUPG7QWT+OsdutjXuSbQRGtvg+Mw/rIGlzUU1ihEnx7KJWq0FWYLQdNn
-kmfHwxt+9KMmDJFZmoC+gkxLQVbRg9k9SNV+oivKDH+Azd7AZrGoVkFeFUkp+ZipWPiaH9Q1
-MV6zPj0IAaFRpLHX+IZfOF9jvkoss5+vzeGLDyjUEtihH3tqz3rbkHM7oksDXeeYmGSRFDdV
-lWNfAPu9ZmrjOve1dtEcRWYeps9sXRKHcwVoCX1oM5FiPfFAP6mEcyfLrFoSpzYRzd0Dk79E
-JwuZFGawqQ4+O5g65NNfTG0YnnOp5DVTmJu6Mp70kFfIgiD8juZgNnpR+X0kizewnie+PDlc
-5y0V8NGJ0N+bqOsquND5JKs9NalPLijJlCbTls71fWTKclqESVuFF00Amivi6UpT9Sz4gSyo
-ma8clnq4jbKS3niygn143NGwwRCwMBdvQyJnBi/jmnfi/ALBYj0UqwhpLS98khfEZWPvSZiO
-f/aBfsNpe8LbmcFScV5VYJhOzO8G9DaOtJcO8OJCXO5h9vQZtqpoZpplVOMOfu8WfVlkeklZ
-U55/TSbOcwsdNFTDI2eCsf+iaF/cT+1W4qgWgq3NYNT5XX4KXGlGavbT/ZQiJvy0E4fV0vbV
-nHaqFmRNfUmIETYlVflrO8CbB/Cl+ZnT3dJDchs/EnorFKwNHmckmhoCp03DA3aUNVS5vlRG
-vRqAybocexn2Uwglc35X2I2EEiyTdK3M02m4JF/Y8xJrHcLRtoTF/FnbSrLDZhAzm/2NpgMb
-QFNi8O48q/oS2z/NPmdLI/fe9l1xdv6wdX9ms4rsIk0slTPuJ1Px+NmlVLIBeawMf2qA0wY4
-tGogrJROlrKgrAFz0w7+bEyvfNh7JrqXGy+HI+Tdp3A6W8jHF2xcUO0LbxxHY7uigvfkhXqQ
-+iyoSGx+Sj0Tn678kznmrdTGbd3CbTjn8aXFaz0n12xCCTtrXCmkI/B1zjkG++St1ifZfadC
-n7Qxmt6c+jm97goHtoLh8uCjrrFaP/aZCa6KSV0yM2+dNa/7vHnns68E4Dk7W3E+tVsqf/Qu
-+eQLaH8mVi/iQ4+Ts/fKJ7sARmwPI6SEQ88z7TOpqKPdqaj6cztVztu/cs8mN3H1lJQBIS1R
-nMZ4XR+6ngEOzYkjqofqDoM35+A21oD0CHr6T4fDGHtwtF9wmCVMSdKQH6+JJjf6fkIG0Jfa
-ppEkNfXJA4VZ4w1mpZl2lB+2vny2FaUGLH5MnXsv1IH3a8NYOcivd3ATgbjeAiD4j72Cck/S
-E7ambrQ+OsFW13Y47zp2iPa2I1D22VqKSoUx67mFtIXL/gpDlkW5OuHB25rqYGQ4HIaCsOLx
-eMf0IHAdP1OW6lu7iuy1QjxwlD4w40C2s0w7y1YwspPVnoRHP8ASaeD1ouQZH1554Exv0FxW
-TvHO7HRuEZr3FGTekifMwg8yUDSa8lvWM7NH3Ke3RMFp65n8EXLWVpIX9i9atAMtHw1vDkaf
-Asigg/GZddhqap0gv+wk+WmbSmzmNDET8R8YfWYvaRTJ+KzNp49sNAqaUr3J6I1B5mzW+J2c
-H0ANU5gHGkTdL+D5r+O3Tpmrspv/n2m+qa/5qrulEP7Sufa6ipTAy2bH+ReDtWrjZ9rrKPHH
-JYbgXE+RiAzqWBZt7Em6H8xsd8SHluUdyVGe99TwDNXcivasBBNrdLL7jPGzuJ33oDotzFVf
-ustE9DsUzbiOY7wNP52kdptlkPNELl0i++w4ErCPZNXDOgM2PoVDuM28/dC+uIsJOghtny3l
-cRfp+P+Y1OGXfa4fSUCfrDf9S02GvMikjOfPOI7kFUowDjVTmDoL7PBXjsJQMcwjtCSlKWvy
-mlLmBZhoI77mseY2m/ULnV5Nf7uBjea4HD+qMB3GWoSyTEY5WjKfudhifJxxbPTZAxw/wQuu
-Izk5z6XxopdncVlL7XsbZBtpsI3SGdZIkH0Kh27FE2/AMb7GNVeEx/vLIyY2WhJKRnNDc5hz
-+ontTnGZ4oabgq9QyzOw9jaYbBIr64yvqU1nnU+lKoPgdroTd7mZ9FJXInGXx1CvcHBwh/1k
-RHV7ME/zUY8V5PB1rP0I7hvnLgkMyQG/W4sE1ss0Yz5TS3XzUL/jZBeiFw1RpYK4/ey4iORU
-/hFrmYSTyQc2/ti3aFVR/nUhr1vy2h6Uk7ahe9fhVXazHrYb6Mk6FMx5kmRREsAfvPcf+LME
-uA6Gr+5oH9T4nqSXcnibJez/sekt70wXCTWl8KA/WcdB3QD39+WoKpBREko85k85MnHvCxoH
-zs6vF0j9r3Aht+QATvEuWhKP+SuHSncl/8I40lZSg/A/zINV5zrReczwNNR+Hlq0DedzS+tI
-OrDclx7sRr/PwY3H4NswqQY2a+gdnOMVkAVf2Vpy037XuDBSGw2ivmPwMc55bt1IeHXBYnEt
-Id7aC/R2kEwoWQZmIg0pMDWMlJF5LoKiNeQ1lNWshDku08c4Eulcr8RaFVdpyaj/ZCZssUHe
-ke3OwVXBvKriR+MwQV9hoWimMqbzHg0CK849lYYzUyPh+vH4mllM2SL6vFzSkCh+sJpL7Gkp
-aaAVfJ2d2UhLEqpCNpqgre1Ore8+nypYb8Ch3jDQILTkovNkQUmCosWDy5lfma773XvqTkGl
-w8HDbbzETT0JOufQzR5aCkwuRmFe0Ju/koLJzqWrpIUOg8Hb4vnKsrpEIP4N2vOGmUoAfxSR
-Cax3jZQAjfnxCwVJhBXwVa1lrwykGgOkvKknNU1SSWOuq3M+dJD7pOYRVLcFHqY86l1LY6Dt
-UeSGFczUFPAxmB43wGdlYVoNLPvXLoMvh0u0rSkPbQrZa5/oUrtHV9sgPW0H6A/bAk2tjffp
-gENYSnp+CYvFR8l+a3lzUReZQ3qIuTxu7ugRc0o3mRAdYAZoGvcpiRPoxTqtLs6nVe90LZWp
-BJ6cufhgX4AaL+OcsdYIBM3ExZ5lVv/g+3KhEq1Rduf4x4DRstKbaR9HgnKePx2AJxgEnnux
-xS5gszMdbS3j0MwN+NU9MMBaiU9me2dbwnpl5b0tJ5dtawmzI+BO50hrUJe/IHQ/OXMp7nMh
-r8lUqS36XQw+zcOrPDreFP1uCIp9dBmoeAhOM6J7zl3kmpCMh8Ic+6Qxzn8Kqo0qmrVM7Ga6
-tZec6tz5ZRMJbRpH4Yd+NKOHvvxEYnTV+b3sXvC/3T0XtTBqXg49bsgstkL3a8pjsqGX+aQJ
-SNaPZDdzvoIOTUHz+2tM+HYjK22k/UgAc/Cc+zW5oyz4Hl+OYjgMEMG//aPbqSUYXzhMa8BX
-HXFybUj+xcgMzjna1zVaQ9GdsaT8vHpVIu1LmWHvySy7X87YWZIeNA8hK0YyObFBYy7SQ2l8
-cwt5Bf8+wSvFlJN05hBHd4zJei2jJKfpKE1NBelKGm5vcsFTJAIyqXMW0WW8zFimvgLuPgXH
-8ZPMcIEVzGW19VGhZPCNcwZTtJ3HvmfgrcaBlSmwS7AkYk6sy6cP3ftRpKMv2TmGgmh5Zfil
-PUoWgNNbpEvQxelse4o2kiCNAlVVzWBdbWrpeZNDz5mkGmqS6XyTSXuYEprFdNHDzE1VEY6z
-AVMzBc1cJY/tDjj7Ak7QE3yWMIW1gvMkaONcQ7tPR8sXtCYpNUlDbxOBvD/U6i6YPIwK7sfx
-3qFzaeGq9uJcoVCbHBSDd93Hxe9h4nrrQUmIrzhm58o6O0wO2m7yBu70wjdlwG1mhYdLcJTd
-OJLVOoBOdSfNj4FHtsMpkWjoAWXWcQ8D3LsghPNynuC4GA8Yip58hMnyyhEUKhMuuZ30kkD6
-MxdkbsV1nZLjKPxCUNqNdTEJZIHU9Na5NvSfNmOmnCvy+rl3gZrg3nsyDPTNlacwUz763cL9
-XXpJJjKLLJDP8H+4RqMWN1GNUbBZftmBdw7VnHCqtwyHcfrDPjOYs10w/X6UbQ7Ia8UElNBE
-TFMaeCqrlORrajCr9hxImATT5OdIo2waGcUEd6A6/raHrLG75LZNZrJqCzNDGxg2jjYsgiGb
-M1lVye4VmZ48HFssiWt+aWzjRTIvg59uJfFMQzCZR2aZ/2Sw+az58HZfWP8TvOYbHNlDPNY2
-cNkBtUwg15h+5xOlh+Tzk5oExn9oE8h+20HC4cuPdjurXyUddJZ79m8MnO1lHPotm15SwnTt
-8aATyWGBHFkfOGMUenZEnSc/9NJWJKiR0g3HOFJvOL9pMXl0hXloz5mddrc5YAebD9bXZNOU
-4PMj6F9K+kpFAh2H40mOj/lmv0gy/Ya3ecJEPad60ZIKvMXT/0xp/n8xueQ3LJgBDooJ/u7D
-qbd1C71dIpnpeCYU8B8ovKcH5CVeKRfcGYDX2I9XPUnXw+GMY9TivtTXl8xqqOSAv3PBkMVw
-3TV1JKlqDulmMQ5yuHvN70zmNwRPvQDf5tyLeCSJyHHoc7UljN+NOV/gXNkGem+A4wsoZKR7
-hl8X+LA63ctPUs2BkhcFn7VgzYYS4Vy5CCJD4ZrqzM5ZNGOYew3HbjLHUTzdJfTrtbyy/+Sl
-/cUq7+Or93J8jq8ZLP7gfjDbni0Z8Y/vtJQ5ru1NqBYwJ/QE/W5PRQrhC/LIIc1GPvGEBa+T
-Yp2nJp4nM8aGbarDgq1ko80rofaWPrbzQcForcjM+aMHm9DGq9rGflAfG1fa2tKy1Y4lpUXR
-iz9kV2Oa0J/Z9OEJc1QUhRiJFoSjF9/lrHib4/jKtXBloNQ17fDW1aSgKSTFTWLy8QttZ7Zr
-NTQ0rvHVSNhwq6Sl83l0PhxezXmOjbZDn2brc3sTz5wW7m4M/ibKaYtDsxdRubNgdCWd6w9O
-GsOjjcjSLVGB1jKL13VQ/pv6v0THwrQAmInNFH/XJPJeB6ChG6jJJtC1DGTvlMP2owTb0may
-7WoW26Ym1KYxZ+0VWHIROjtImqBLOzUWnmU12/PVQDh8NplsFbPgXOF3R3IyYan0Gd9fkTF6
-miR/SuqRk7rBR86Z7N50PxtpMC++LgsZxINs+Mq5OoS15mS6e0pWqhcDfT/P3ExkD7XVnyoP
-Zz78qEkx/v8Wmjha/ch3o7Q57DgI/zlJ97kpazIIXKbO3bNmcZRrwegmkBgEF3XlVR+v1kGT
-MmPeckZzyQtNhgeLxdcsMH032HEzqzwiPWDNDriNoqDUUtXnbhUbSAFJiTs+wEw10WtU7Bsc
-pXLOfpar9o68pVKpwGcTjj8Y93wSHP9AkYvj+ILdu4iKtDBJyJsZZSpfW5jXms4chZv2ov2R
-KPN1kL0TzuisRdCNHxppH+tC+1WH2zgyxEbzfYTetP01lXuWxF3bWpfZXtrdTtRy9rAWIvNV
-JB/3Rd/X27Tmtk1lPPQzM3OeVBoFF7xExcT8xmP7mgjwOBtPOVrqm5no+FIZhr/uY7qh4/lx
-OT9g3OPw6lRNaurwNRVr9MBBpEU5aqsXbHcetztFm2gpFOmNHae77XndwhqibANq0Qc35k99
-RlKbYPltw3Bi92QDDvq1PsW5n4WRd/L9KjAQAj9MkBH4iwVo03g0pzlqW0muagty8XjmYi6I
-HylzbVuZaTvJKjtDtjMBK2yoTEJbp9neTEJtEkc+EG7oVQT5YxzTXwcNL0hWLODeyfqFtCFN
-9dMf/Ntnca65+qgfUMW3ZPG7MoNE3Iw8H19WySP48jW4jE8aSSelSBwp5AMu6xedKYpXHY/2
-hLOfQ9RopizUWqwzMZz/GXw9x6XcwpsdJPPPhif9cCvt4JHO/M1AsmMgzDgdnVkLe94mN+RE
-wZ2nh8yWqSjMQhATrjnE+SRplbZDp8ZLR5zwGK2PP0xPUvICJwWdc/v52pvJrgD7/8FbRmgn
-9/OZhXiTrkx2SmbvGhpy0iYxz8BCXPXCFSVEP9KYjJoZ1kloftPVUbJazuMdnpFK3kp2iW1i
-gIE7OtKs13lmuE7AO7UxPbQoP+FlOsF2+XU5bFxH9lgm1d7XMHsZdjqlJ+0yEn8DOPSb9dJ1
-tirIHaa97XrtZK9oTftXs9lcEtt2luR2i7Syb51nwZq2mtXc10qmoowggW8yX2S1qWtamXkg
-NdRsk71miuw0g2SLqSuLTHzxMwfVeRJzfFOVCSzIEXjrEZLmJFTTR5Q9vbd++sHm0DjqSRL9
-Znu7dxLcby/oJvtLj9sM8h3Wz6BjJDe4yKGxTCHNbtppBrMFJv5Popn7f0K+BBM/wOQr/P0V
-OeH+twcoScs8O/ejmwkLNsBvp6EPX9CQx7a43LOZ5bz1RiUqyBTyxwibT+bbb3rN7nfdrHNn
-2oFo/Bzc0ll0MxXq6yet0A9/uGOxvoM3PoDLHyAugSklOVCNLGaUfJWxaHxXFLycDIJHR6Hn
-/mSJFrCWLzxTjBWVl4Og4Qxs9lXfgatDWhnM4IpwJgaUeLlPTovr5tZl4HUNHBmmp3Esq8hH
-C3itZXKcc7DP8+cb+CyA2+2KToySo9pDFpBee2pafEpy0OUN+/vyKorXT8hkvcMbfNU9pJ2t
-aNdi1N/R2+vuOT0rcEPzYdjZTPR4UN0bhWuJrjfWHKah5qeTSXFBgq/xMi3x4RNQxh049xd4
-v+KSySyWh/Je5ktqU0sKmJhS21zSIWaNBplhOszU1cLGW+/i4ufJU9vL5YIdNjv4/KKnwOUl
-G6rnbDhK7lwhuEZfwaEJyBQlQEp33WiXgNELWtF6SmFwUdoukWb2m0zHnT23fUwznWoidI5J
-LqNMY6lhVkt842WeS6B5JCf4esJcAJcTxd9kk37k5KFmnXYzKzSPmQ2nt0LDPOlKqHufwq+6
-Ht97wy5WD1QsjWbRjPrTZneeTaUX7VDdAMMPsAmlsa0rfWC5Q/Yh+CxvZrKGt7rAlJMesHUu
-c1ViGWMSmTgmg/kgMUwUqDzIDJ8mG19DSU+gVSQ78vJ1dK4TiPhl88txW5BXWrlorR5jLcF8
-7YK2dAGf8+0BvWMHaFL4vKxmAKPpyZqFwFU9qtobNzVO97mfiEXpAomHt6kFPodJdrNIPkgY
-6f0C3HGRtLQVRu0HQ3ozOQ91CGpbXZprcRJpLXrenbTWHYxWxRskY4Uf+NcX8N9v5zxYFCAD
-ySMZ248HUjOgEbXw+t3IpbX5m/hs/TW4iyXV8Pod0Yn+JDB/JmiwvEBxImxLnHkp+UutvfQ3
-Pu6VJtK75Izj1HmpZtOhpPuu9L63psTVNnLPpnDY9hwov4DDCWclS0hvE0ixE+CEheDQ6eYi
-cDhEa5jmOsC00nAyyWs465QpAhJHyy5ycXncTBKw6SUNjCd5+JqW5l0JQM9dVGg7iXOiexVZ
-Bnj9ofUiE/7Tq/aHfqcPv3GXV+wj1PwoPZkBThtrPvA5XXPrXl67yf0H8YBxZK8NkeU2h9lg
-/cwF2w4uzwF/WtZtwGcK053XHvksP+WA5DWzWMsk6UKHuhk8i5khhfGfnuYLeWQHPnMSnNkM
-7vLAMa6wlaWrzSQD7FvdbLfrbZj7ia2v92xu/QSf+4DNVdrWppRydhA+eBOO+TTT/0JqMrPL
-Na+JBRYGwpsRctW9o+tLOOuyZDZHJL85CF5P4f/O49QPofVzZRJM2gW9NeTWITjUGKTY+7YA
-zjo16T8jzqGQjLc+4suaisHa/vY4yWycVsOZz9PEYPMPqP3Hu7x0BA5xD0nrmGzHoXji0VqQ
-LRZJS7KOH9miu6wAL3MlocwDRZP4vi7I+Uj2naelYbS4eIK4JAP2CN5GoCITcRF74b9fcGEO
-vHJe5iqlDGe1q8DjCtzJTJLMHCkC8kvKPbp/lVmbgWcsKANJPMNA00g4cww8O1lag6hE4Pup
-7Q5OK0lM5w7ROPGs+NGEeg4MzNS3thpMgD6jWum1CMwwFgxcxuH+0I36hhR9Ft48yPyd0Qhe
-P9lyWbLHFLQ8nJx81HTWVaSeAJNKesJTrU0AaFxDxS+wsq/yl9T4WX+x8kccyXnm6CxbcO7/
-dRDHOp01VoSrfmkFjjgBKnDX3sB/vtAX9q6mAIUFNZj5GaNxeSXAeVch7y3TOvqB71JKXfJv
-Qy1JYhlKXr4q5fAYnfAYc/WTHMbV3sGDfYQ/kspNevOC3H4LLg+T0maeJGKCjskwKupPf9ry
-fWbY/iwY9df9bGkDM7NN/tideMCZssiWkDmw5GHbUq1NRY2i4c4PtiksP19XWdXxtossJLG8
-sHOkmvZEpWuiSPWo3TCy8E4Y5iEI+U1qjgc20+N885nOvMpIElOZ6nTFAwZIoJstO0hpevpb
-p8gi8nEp52kAdhsYnSlf7SjwOlJ2Mw3rmJ1H1KoFidE5xzQVmIyPt3DOolurTXWNe35MPXoY
-AHudRw+Tk6EKosfJ+e8TkH+C3HZVc0tcklBZ3Gd1MnFuUBVHOvF3VcGaxeGdQbMvq3Mfqu3g
-dj+c+pp9pZY0sH07+PY8zOk8DyyP8ZBfsOV+SSXLJZPs4HXaufsMeO0m7cHCGrT5AUh/Q/4/
-hj5MkLyg6zHp8iC+5ZGNha/aC/b83StHnGfbdIELxtuy4KGMFuDvCuNtU5KjvfUEPLWHta+m
-Oms0m9mtVc1eUu1CbWT8dJJpr1Eo4UsSxR7TQqqYuXjtFajEHHhzMrWeT88Pk8PeUOOfeN47
-8hRuii9B5C7n2qjp+M2ukhE1qIVr9teF5I4Z7HeDvsN3vrAv0dGbrGiL+5uusfiqIbxjMmnv
-KDkplnwDMY7fK6RVZDLO5BJs9xuuT0lSLwELNSeh9pSmqOc8qvgdXSuJ78plSkik1KBa7SQf
-XXA+eWrMu6ry3mh4cwmT2JJc0gReH4o/mufeWTuAKehNRvKR2O7ne9PJR7V0JCidrjmZoLzM
-TB4NZcIjmPQ9VHCaVuWYpugSPabRek8d9riEVxNTUJLhePOYqtLcpJbpeKGl5qr6mQ941Gz0
-taU0kCmk6XD08AcaWsCEaW0ToKVMDSVd6xJQWEmS6F/2ekpbsYcgZnefDqMuY3QFK+rOinxh
-0yoklJlo4XtSSjYJA1MRME4ESNtGep5F5UeReyZoGnzcC/RyH87V+d3IOb0Pb/5jL9nIbVXx
-oW3wxv3B40SwO1uGsL610ofMX0uM8ZZKJg7c9EHrmHvwwhUdJ6fBsXOHk9u41cRspSEzMVTe
-oenHydxLyd7TtSmusRnesxzTEx92uavPbCSZ456eQAHeoaFCrd/Zi+SPE7oHj3cer/0f+K0E
-RoLBxC9tjEMoq6/oTgEzCh1fSqVWaSuzTMeb7brLPNS9JosMNR3hhFmyDKffCD+VH+7MAiNk
-xHsmg7XIDvD6JFBeR6ax6rFw+Ch8by9yXF19Amt7iHOVmnN2eW+yYDD93AyHH0G9b+P4v/DO
-P+DyHR7rFo7khsbi+zjU0AcOncjXhziWXHBfM4kECT91Kil4sUzntQfVPIBihrqfUJQkiRSS
-66DyALWdATZ7oGmNmO+SeKo4cEIULBOi2WU46/RjOrvTpe5klv46wHkCFTWNw6xt5k9H+KmS
-TsQNNdEAMLtBY9JhL7DgAy468nWM3sHbe8oxjQljPaBv2/S5c64MvrS4maVVcDqtzXSc7yL0
-55i2gH+8TEM5RfcXyUcZLTlNc6lmEuOej2ghMxa34vzOaJQOZ+Z9ZZcmJacImeGvDtafdOsJ
-K9qn5ZiO4joALfTX+DoJFzRHG5ChnDvf/WXC00gfKu2cpV1YXzJjd6lrFDwbjr87wHvP4xK+
-kJdTweMF4HsfeYr2/2RyPsMu18DlCrHUNB0ZIwf9z4CHimf+6mcSz0VS+TLw2QqHCqvCRc59
-4KuAzXzgICGe4CcT8FJ3wD0hfDeCvTck/+Rkir30NQ7lpKbmXxPgPd/Z72CygETZJvLBNoNr
-S6Nt6dhDXJythzj3+TgA6ycDiw1Nb+1kcoFRtcmNJ5mwGP82UXfJY7TLOVukN+46hBQYAS5/
-4GdSm/eahLo+k7nk8kBtQF0NryN4+I3uVca99D+Yr6iEag25xTE84vub4PQSGe8O//6N2U8I
-02agnjmkkeZBu7xR3FTyzH4kQ++nIzNhqwD9pxPIfwtR+z3kyvsgIYk8AZHZcBtZzEY83xlq
-ehmODJcKKHoaac2xlaZqPlSsEohujH9qirrVgLWKw8G5UdhsOLTMMo7jGQh/FEXx7oGAGayq
-E+rZEf8+iJkP1LN2FLllHL5khd4isT20v/WxTUz2TiHZ6PMQan9NH+GuwtjHFJ2Bsl0V575p
-vbWJCda+ZqsONge1H+mxnfmnlU159HIGWnkDLCTECeQyfjjWynjkjByX1ZNyQ3fIcg2RjqSQ
-kpoC/tnHBAdqa/izOtm5ALUuq+nRgPSyE2U+BBetQPVHoUh+6E8fN2OesK11La5+hW2jB+1w
-VbsR9n3haAQsXlsWul61DdXrhzouk0/4SeeTOmPimy90+IZkNGvJnS2prSfzdEJLMTXJyS0x
-0Asn7d8H+TfJ8R/RkhQyAxbZhFu4oI/VebLkY9g/ghlfjTIu0Jrgsjj7LgwGi9GVClpXmvLq
-S3cCtD281pUtdKDH7VDK9uS5uuS7pLIaz7EHx3hEyutpUs152OUG+3nOOt7AXZfo71y6WdfV
-gSl0fg5+ZRRc05AUmVFyoSb56VBznPU01rWdKT7C7J+Gn27iHr+CkqSSVfKCqrLumZeFmM46
-eMPq7D+Bc7YNTrwKPx0LLH63Fd0zKaJtShJURhJ1RRh4FHq2n4l9hmeL1pvw1R/mXtHx3yDs
-A5PziPpGyUr4YCNZYDfTdwTMXYQ3H/HuJ7wiWIWTFgbDpP4SAzf4V3sxf+XkANoYQs2nutdm
-bNFD6OdNPWNv6QTyyTi7RdfYTbrXHsKJcuR45/7oVIh9gE9xrpd8yLovo6rhsMUq+jRJO8PO
-B6W9JsK/NzSBOtLs0Hnml25E+4+AyEhzXnaau+JnbuIHrrHW2zIILcrJsUTCDj3xctm0viRF
-e4qiKr1Zz2zqvEAToZ152EMxepmH1J1cgsnES1GiMN2Fa5us63CsPdEhHyYpJ4paSo/j9BR8
-1uLnJ+BTNlLrk2jWS7JRUmpRlbkOlDdyHFaPZ86h6CuklpkGg05DK0fLNBS8M++sI5/Y51/m
-MQva7tz7si74qAOLVod1fGUDM+qcL90GD1EZPneu98uGPynKXnvpaLzQJHgmSFswxX6ks95M
-cU/81gB+ahxz5lzfstn9BNkThfGWjvQ3HY7jsa4FowtgqMm8cybudg1VCMVN7AKby1Hx8SCz
-I3xeAvaJA07v4TWcO9XPwl/3pastqEwj+tqBeRrD0W/TCzBKBNU8SQ0ew2XJ0ZIG8NUQkD4U
-bLXB65TEK3jBavfQ9BXUtwPclQ0G+24DYK6R5NRJWhKdmMQEXkFhEzA1PqSShiCqOzw6GsVe
-gNPcDO4OgMtTsg4GWCd3cMaX5THq/wFPdZX9rsaRTBEBv2/0NjX1MPdxzU9ISk9hqFtMtHPV
-/mL2E6DtUNO0HMUru1gv290aZU/BRLdJ8h810HpKO+slLW1c8cNHBZP3DtvDrBQXyVSuR7di
-ovP90J4X0kUbgM8gM0kXm6M60/zUGSaDLDZFZZGpKP6mifiYAShrkJwgIc9hda3x9Rn5/zc6
-Hz+zUvbpKtmMn1+IE3NQP4bjnqZ9yaDtqEUxWY9TnwnOeqrzFCXnXM7RrKM86PDUQnrf5tHb
-trJ+soNxAmvB7GXYK6Y0xs87n5qfhXdi0X9fmUXCmY/yLGGyg0hEA6haU/DamGr24O9H4Pp7
-wrKl0NF4eFNlLfHQqgT89zvcdJOtX8FvvMOBxJZUrCo2ap4BJ1GHqR2Bk5tDf5fxrgMwzR8c
-Uk2qFAjvTxL+neMchfcKJsethlHWgpUFzGoAqGkCQnKCvDhon6c45zvtweffQmXu4aH3g54x
-uIG6+IF8IDs+ynOTPQUzsW3YZ31eXdjjaF7BTOdKpvcIvv6j/mDG8klFcnVVdLQEXqcQalKO
-iWjmno/SH3w2BTGpQcZZ1jvGvWoihNpOYt46MHs+Wgal6kIyWUhOOKPLOfpHsFwM5zNo+Dg+
-KRVXy7a7wJazQP0+KnkNl3yH6l51P3/Mb46Jr9kg3iZQYpvGOOZiKFkWl0uXcky93efuRaJ3
-qzWJjIeJAlHPYB2OCuTCqT0jP4fZX7rERut0+0XHwp3DbbgOtrzHdtO5tq5G2IZ4/Z7w/GTU
-dzlr3IEOHkXnr+plsrCHsZrFxJPSJpm0N9llNkoeZjrJFtNfepkekoL8eR5umkMHmvE1Pqg4
-rM1BeGP8WCPw150eBrtP3HyD17+lG3ESAfiq5jIMneyjJeCIzLz3Kwg5pH2pV0+dytdBpKqK
-9MaDlTm/a3hpz+L+vtO1BDIQHZ6EV12uVeG+2Xiem/TnrYxF7adTxxn0aL77nOoiqFAm/iWu
-vAM/R1mHH/qZVK7Bku+Z6QQwYUrcRjTu8iaVOEF+PEF6O4bL2EUl15N8Q0nBN/AoDoK+amu2
-MQV9nQXPTJJTsOIbVpAITKZhOjyZhnfo/Ed8YSKccWmpxlq6wfPjYbdR5PL6bp7wBqelWVVL
-MNuZLdQA5RlQdQ8yoYWxDc7rPU7tkJagL2VZyQD8onNn1ZfMzDvW+FSd+2WkkFwklV7oxGz3
-ToI1+D4hqeU59b2N53hAMr8JQkI5gvF4/LbaT1tS4aFk+nW42VP4wbOwgnMX7hCUbh7ZJBSn
-+BIfkUQMHJwCL9pQhstWdOovOpXMvMXdRYHRXfDoPnzVFeeJbEzdVXRsm2SAS++iAMd0iBzk
-61ZQMInjacu0tdJirCE+60+LPymL768OI+QmGf+z7/Gdf9H0N/rLrub/nWvFY6GcScnaLVj1
-cjQt1D3f7D3rzkF9nHu0xDUppKVpJc1MF0luyjE96VlJdpxeA/zdADJTN1TUB32PBVMYpiYH
-3zVC2ZzfTbeTV6SRFax0sG5hgq6TmS7DfEvh1cbgMz2ZMymamdu9WnQ1ua89E5KbiS+NFswm
-N32mG+lBeFyO8Qm4uYcbS4bf90P9nGdG7JR5MNgwftq5k2wEXicZOlefVXYjnTtnQjn301oD
-Rzmf4r2BVw7wjnrg7A65db6+pSNvmcnbJMow6rAcb7ZL79jPmgjtdJ6KcZIsfp/ePYTThMlw
-PvkKpWuf4OOH4CyEY27E9irAhO3wgSPAXz8qVAX+ysHx+4LVsWD1FH9/GUadAx+VZC0GvfGE
-+dKgkLGo1x6UuzpKHAOejsfqynHMveje/5K6c0XgaTCVkPU0xmt2BTnl8QXx2c5X3hlNtkkB
-y2XCzySRTvID73qDad5D/pn5//fWbQY/diD3TYe/zqEFHiA3Ifr/SHdT8b7wQWX23YB3TSSR
-7WM/F6j1Xd7riVY0YR97Qb8xF8jGYvKbGCane2eY7xKH1yv0fitYbUaa+o1COucQrsLV7caN
-nNW9cPQqdz8bqLHztITY+KSq0lBrSwLWf510ccp2Inc2ZiJboVq1Yan0ZMHvtiZo7Y6iHmdG
-s4Gm1qytu1zUPqjfRPduad3xmFPlGPwUSYVfw//xjHMPuIRyncoGomS55QvezeGkc8y/B7Vq
-Qa3Wg49IPN8JvN9Wjm8NmNlIHzfAO1OlBcf82+aS+zaLeMGjbbUsWE2Bm3by8x7+RJGHLKyV
-jD18An8btQj9ao/Gj+bdAdKf7wdreVBdUCqDp0psxR8XdYPjKEL328BMznUjPuC1Eornzxwt
-pLdDxTnnNilT8omeX2E69+lIuLIbGlqYOsaHW3LDKXOopHMHoX7ufb3S4A3ygflCEsz2Tjv3
-qOc4doOs3nKGlf1EddOicc7v2DxB4Ufc7V/2nZO1tKIeo+DYEVSxESyTHN28xTTtpmo7wNAZ
-puA9rJhUuuE6U+MpBdZLxb8656SWIK3ldT8TKko2cJ7TXZMt1IGfW+FvesGh3dHVqq5/bYrb
-bU9FKkpy8u8vfF16tu88c+YO9U3He/PIBzTjAHvcDDaP4HBugNpIcDSPr635Wp/KO2fMPNbr
-pP6vqHQW3ENL2H+ahOJIs5tw6WmOSxNzggx1EK3ayUysxV/Mobr9WJkPLP6VnHBSZ7GHQPYQ
-TLrbSa2j8PXO/QJ+4TByShn4qzlsMwrXtkS/Oc8bIwe2BaG+MFEWzYF+NsAJLCGPPOf7TFKD
-2VmEo7oHy8UESTnxv/XxE6PIcCGynBXOoe9D3Tt6f9da+IBGTFdX9xnaB7QN7OiDR04Aq/wC
-LdHanxkPgT+W8/8L5Qhb9WcOy5BivXG5PnpVaukS1thMWsOjHeH8AfR1JhMY5jyxji1lw603
-Z7vjQcMq9rGZI5lL+u8ARnOTcmOQpn/gqV5rdpBdjBp0xC0soceXdBqJ+DCMegTlW0gXO4Gx
-AhzPf7D7bffTVnILujYQf+a8JuLJVsHd4dTpJJU9A2qu09vveNaUVCCjnIOxXoOtz+KcP/yG
-rWekIuXZdmE8bTRe5RTcEEr9b7CKxLjdMmheNf6UZd9lwXk9MnALFLkKaTc5/XzM8R7l5/bA
-0aFMZjj9OQ1/PmJWEqF+TajUQimlh0DdDhKl43xri3OPocean9rkoFeCq9iPO+/MFOdwzxUw
-4ku2Gol2HoBH32oc9pWe6ckG76diRQoanGeY36V2t9Coq1T+LFxwGGd4FAd8hVn9AFbjcLzZ
-qGANEnsgyDvEjH8Ei7HMbXTd0zyQBGYvOX4xDsZ5HvM4VlabGXkJ1objfCtoZ/DeC7wvZhKd
-67Ov83ULPBYAO4/QLrBsEPM9EmwUJ1k4v9NZRScG4EeqMi/JSKXOcwKf2V6SgvTSA0RtgZuO
-6zzWul7O6SaOZTHzM5ZadqPDtemGN5ymIOIRrPuIlfzDVzh3vs5Nks3NsRbmqJxzrvvBGENl
-Oz8TCb9cIhtdosoXwedpyUy1o20w3M7a7Cg5ZyeJAYXNSH3OfbayMrWDmPZt/PRlEu5dquM8
-fdg5mpoyA3ZoT42LgQRPEHGT1HfC/tYrOBiLk/F176PUE6c4mVmZDMM7T4QfAypGwTN9WX8r
-+luepOM8PcZJxmN0LI5vDAwyjNoNBbkL6dEreLUO1VgBFs+5z696q57mhGY2OzW9Oa3v5T26
-4Hym9ESzw2xvwVYoKWq+VpGlOoZ8MIuU1J+9VWJCMkkY87oD/Z0Jy/dABZujCs5ziurjGzLh
-i0+DCucKvoIcYw4dBMqmMIdTZBy4XKMDQXJ3pqMlelUdtsyHhxVWthcUtob/kjFh/+wETaPj
-OJZADQIX++HJ2/TKk3pWZIpG4wCWg2fnLhhOfZuzusq49qxU5S1o3w6/Bbv3tjoNt36Gt1Pi
-Jrxh6xK8rx0KusL9vGYOji9Eshp/vvrKdzTjOMw0AFcQw0EP/r0mqbIMDNoRjzHHxecmlGoP
-c78X1OyiXlsVZ4tf2gMWDsBw4WjKQWYmklT6mp+Ox8RlA5fF5DYYvWIniCeMUE+f0v/n9O4M
-nm42brsW/bS86xh8v8q9g104jm09ni1cH3D06elOZ1a2SHa4n35uZI+z+IlOHLM37vmd5jDh
-6mNAsBmp6UwzjW+KsIfUulbiMEMGroxFxQtoWwmAjR9qU3iuNF0thKI6d6FogEuvjG7Epsq7
-UQYnWTVm4jqiwH3ItLU5HucOfntsLdliA+SbXSJddB39XEv/ltGLxbDgctCxhGw6kmoXou5R
-aOoA/tRlYjuRieagLvvo6Wn1wzUNgT8j9DAoXuo+D/4Jnv6JFNe70gr+DNYMZr+WMFGa0txG
-5/8xESVA6AiZrxuYxD1UazPuYDV1WONe0d8E9VmACl5lWt6S167wjnl4mobS1X065l887gV8
-VxC80YC8VJBJLYdW9NL5vGsY+akRjFNIBtG3ZWjFW/dOwz1wArXh3rr8pB/ss1Kd604H4Q3G
-wqRD6Fo31GkoKSAMpoqNFpZD0SrAGw4rxodVM8H79eQlju4abH0c1t5HEgmnCudJ3W+ZtHhM
-dk70owQeszwptLT8w137mFhS13xVb/NPz5P7OzO/ian4PRzTXtJCsDZX5y4T7UBjN7Y6iZVu
-4nUcFF7GBZKJmIcj7HcTGrqBHL0H7o1As+6Bzf84zlL0dwiavlXSwA7v7BV5aY9KFvo4gUm4
-h/PwYNp+o1QvweFXupWJHFPVvW/EdLa+g6z5RjtQpQn41hPqXGmxmD0slZV8vxuPnQwnsAyn
-EMd8BJsnNZ7xRxeT6AU5aW/IVntfLtoo9Gg1KHOUayQ+YBle7xSuLRItXARnN4C508J8sdma
-wT09Ib2upW5d1bk6NS7eM5PUJQOXw5fEB48X7VbZZ5dxLCHM2kb3DlnR7DGubEHZu/I1hTj3
-4ctFbTzcJ8CsgW0m4Hc64zubU8+eugCU7ONfoqj0d3Dg3HMojLwZw5TRtKaWxjad9Tu+6Rtu
-4ztO4jr8M0YmkHVuO59Hm44c6Ug1oPcPru8dGnAQ7ukA83ymunPBZgfmswErq8VxV6YT1UFT
-f/esEiVV3aMi65iEEbwG6nb3GdELqHMQCjiMLDuQDDGfVV+FpVSb0Rs/VHMYWjpcEzpXm9mj
-mhyGKgRnVNIvUl8Tus+C3w3nxEKT6uHbBqLG/ZjTNu4zGpvC42VhZ+fcn8v4wYR0LjmojMG6
-46GB+eSeVMffFIc//2POYDl5pF7GQ7KRot/itQPQg8T4s9NMyGodRRKLoEd/cJK/Vfg+2k7B
-hw1HnVag75fV+a2Sc111dzQkiDVsxLOvBveDcUO54fWnrmdcRE64hjZ7gJzYhklEfVfAEP1k
-IX7yKtz5Gg28SPJagZpO0h92Pul2NxO6x72ThC/VbS3Z2Es5nQRy9+NAbqNpJziiQXi9ODKb
-Sr9EjbOZoprTJNG/8slelXv2ury1v5gGL9NDf5DM9jHho8FoH/odCKbnkyXmyixqGOyeIR2P
-rf5BcQXuMXidB8xPEEmgCLnhrS0gp2x1CbVDZINdyWuPXLOhsF0YniPcfe5eDjQ+NbMfB68R
-29Uh555KB9Dj3VRzHa48hE4756mu5FgPU8Hz+gUsWHAQhzUXlENs/YmN4Ii/MafRzrWQTO9T
-jjSKbc+Tm3CTp3nhPnHsJSzkPKP0EQh45nzuhj/pIM4ZLOWo0nCY4SwY/YjvjmSVg5isXJIU
-lumHh4yBj5lCvj4oY5j1iqhKSRihNQlsMr7GuXf9ZnzzFlzqdiYqVBvipBfAn1Fazf2c7Ibe
-syQu24jqniSJJjRDNKYZQ1Kdh4M6x94zstrOVHgoSO3MnlrIMJh/MOp5VL9SpZ/ub9y9cJon
-cPFzdays599fOfftoxNpeH2C2S6gDDf1KF3ZTYVHwsEFWN0TWNO5p5jz+Vxr3EIF9C0PHOqN
-96xFTppF9x4wVWlhspLwfyXJC5NV0aEo9iq8xG782ByYuq4chZMekuxiwGxJzW5Uy9GmIehB
-N/xkX40lgUx0oOu8cWvsLz8ILUv3usNhM9GgOXjNwZoXhSnq1tG5U9hBElBckOUDB1ZhLlrh
-oJwptlSqPVgMMg10jMmkzUxc9LEAvDpcE5swMlOk+xTHFuh7PerQjsp1Y8YbkRxzsNI/eKk3
-YOcPuTo+e/gKNpfg4LKz3ijbRsJsoDwGk+nARRl4ogzzUhznUI31DdQKshYPcoaZvOPcU5de
-O/dCTAZfZWBK4zD7zl1vdsOZm+n4afD5Gv/inK1yU+vpITxdlCZQ5xkkg8lz4XBnBBO8nBqP
-go+HUNNh8gUnkt+UkqImmaQ28eQPvH+HKmyTWiSoznDSMPydc/7ebMkK8uLjQFKgOCVwlj1Y
-4Xrc1g9ST23S+Cw8yComaTROohz6IOKw5Uz3vpuTcXKt4KHScH0Z0nAP2NP5/a/zGZwnW8wi
-v21T+WdXSyr9wNZTmeq45epwen39BCefcs+V8YWlpoOxXbDzSTzGM7gvnlmpqc1dOMRTTqKd
-i8m205mWOaSqtRznAffzmPMw+lrctVP97fjzMziPy+AsEqQcZmYOoEBHmJqT4PM0qzvO/4ei
-8Wvca9SdO4teBr/R/G0S6Y7aD2c2t7ANS21akco345AfUKvfuLq4xkdSmgy4XItSOVe0bNTe
-zG0BMOo8O/I9HH1S+9InP5JlO/dOJAOZ2oOalK3HhzvTw87ldScVPkryDmMKpjCjxfHwV/Cr
-g3FOxUBMSi1mkusQk0Xn4D0nUK0mpjtauYB5vURt/ugDMHgSRxHkfqaYWnLh59OQyNKTjtKT
-fb3496/4jHO4tJVsO4Dv+7G+IfRkNNrnT6ZoQFLJhG/7ZfvIG9hOSV6lyXwzcLS3tCxVLwF/
-lqLvhfHVaZ07oFBx58xm59PuD6StR2w9EjzuJh0sY8rHu/e+TwLarWYl7WaFd51ndg0BS5Hk
-7mJo4Bpc2Q/mKbnphpOpi9rlgVEzyTr2NojV+5LZ49NrPL97NvZ65hCdk5rwZjaUKglTk1E7
-gsI6eN3icHIutDSV+LPOQGrZB19fU/53P9g7dGMx2t4Xt9pBa+CeO8P7U0ndE+CQKkzvC5tS
-VtqKsojkecbulZgwvA/s0BQOHQjylugdfNgK987P08DeMXkGh19j5i6jfif1Mnt7Cw++wxde
-I7Mc5e8i4NFbaLFznudRJnw0tSpDNkvKccUU5xPYPzDWU1Bxwb3SN5gpD9FFVHA+bLaBtHUM
-vj8Lap26zqTKg1HCQSj/ePRiPtva7J5R2YxON8EnOb+PqiuFTAUpZUpIUlMad1EaZs2Is3gO
-024mrcxDS1Yxk5thjiDmoD6vBOz7qSUR2hX6zIai9p80LhXNCPOXoNqtyJazNB+sr+5/x+Dv
-zvI3McBiGVNTe5kaOgoO7WrmanGzUROYZfoL9Dh3ajhN1YJg3eak/sJMbDY4KbN7rXEHHE8F
-WDUh6nOTSTwAfo7jaJ7CcPHcZ2D5w6UtccbVONIy7LkKma0T75+Bzw5lLddhXOcuczE5+gTS
-h2loB17zo/A/2doNunuVLd7hdY//3kRnr1OBq6A6khnbRRUc5vJDQTqQHAZR4zV4cufpst70
-ph2KPBmm2UB6O07fL7n3QvGVleC2p/skwQUczQWO5CETcoHtHsCZHCLhRbnn0NYlBY1H48KY
-sktg/hap5j2smRrd8HXPsNrGHE6hz9PRr7V0w7kn6Vb32YmbtAvfV8Jt5dJLeM9P+sXi7GwG
-Mm9h+WzrSWa4sqlehPFTu+enLdIkpFXnaq1O7h1LulKV7qTItu7Vz/t1Cxz4j2qXIf80Nemk
-sknI5L3Sx3KKNYfrJvAaAp574RCz46fvgc3t1HG1PgOHp1jTCjK7c2/SNloRBu2iQ6neMla6
-CwStBpMj8Z0dtS9dG0l3OtKNElQuDck1lVRitvvz3014wwvgNBI8bAcB5F08czMJAyFheOip
-dMgXLv3h3nvEjzzSAHbJjn/4ZPfqKTtX91mmwj7TK7akPLX9SOG94KoS6NE/3n0DxxThPkl0
-In9zAIfgYcprNfJFH9MBnIZofXNYC5kzVCtSXzMVe5mOKdISRLJyVjXQPQe2BBVszxFMwrOM
-RI0KocZXSIWLXZdTH+RVxc80YZacOxgEg8ddmhIElKLDDUlbVXCrGehxDDqQAr6sAEs0pd8+
-eJPvOpuMvsG9d2IKql4fNDaWxyAkhjyBXU+gIJF6iz/bSfpbdByT6oubygmXdqbOD/i+Gdtd
-ADMuZX/T6PlkVDGEGi6jllNkAMczjSPYgXt+7FxlYhKgVm9V8QbXyCObSaYTmaoOJHJfMJEN
-XsrE1vLCTcWYyVwykUwYAmrb4aN/uneZvICiPUU1r5GRVoGDjuSR/FpKk8CecUFxAjJUEraQ
-glSXnrSTF64sr7+lmVaAP6ugWB74uRXMa1PYsxQ5yJeZKg5je0lvlH8J1YmCJ5/wr3dAymFW
-sZkEskPGwjXjcNTnwGo6ieBnZqD5VanVLyZ8m5tK1mkjmLwWnr2hFkFvi+Pne8DvW8Cn8/n8
-MX2nE+lWI/dKn4boa3O4ugbM48tc1oSP+7KK6ei782zvnuJr6kki9y4slXAXPrKfPe9yPzP8
-gB7eJiOHwx5BzGUbeCgnDvCbe/XVLN1tN+hG+0+32oZy0PrJDVsFjMYgPTxjgj6AFA/w/436
-h+Kz2nNsOVCXHJrfNNYaZgLzOUeT49o/44heygYyRxz5C7c9xXdtloV85w8PdYZ5err3y/8J
-1i7gWhajIn1AVXOUrpN+w80kRhXjuVcGb9a7TOkDuNV5BrFlmt7hI8/qZ1jS8jcezMAnpuYK
-GnEM/jiv5cU5F+ob7uklk3wBHTgMcx6Cew9z3Htg0yVsZSLbHUuFQ7QXW2qIfxruXlO3E+Vf
-4D5VKCkdTMz8l5YWEiDDOYJxzPsMpm2Lc584evyHPPxXvtPbIzjAAD2Gaz+HL78ofrqHvQWA
-jyri/JanMpUoyYwUAZtFWFtmkvIHuruJaRzJqkahjyvpy3E8ziESfBBOtINWJt1V5d/yozAJ
-eMd/1CqD5pE6zPUgHNZkmCBYE6FYz+lIKDO8iFoEu72OhYP2gukLSE33vrKbmI1IkHcK7O6V
-lCDjLvq+Wn/KNHq4WO/CEhvlNN7Nyf4bNDfVd/LBcaozRZdqC3xHGeamEuzZB7+8CtY/CnYP
-8q97WOs5XGIM8FkKn1OLJFmW7pYgZzpZYwyJejn6EywfpDW+KbvcZ23hklXWSwNeQ/Dzw/ja
-GBSnIaE8AxcHUZ558FQ7epIO1nlie2mk7afX7EZ9aS2v2uTlfvidNnBpZlLEHVbiZLmJrH0k
-6X4YyWsYnmacZjfLtTy8WdC8hkc+6yUYyHk63StQ+H8snQVYVc/zxvfaXzswsLs7MbEVFDux
-UOzCxhYbBQsVVFDAwC4sFAVRsVBMDMDuDgyss//P7P/3+Fype8/ZnXnnnXfO2TObHcWRzdYb
-f3aS/UsZbQP83R1uH8V4upNDM2PbvXoK7DmBuFxLZB4gcrcx83nYR668LSFG5SrcFxBp6bzw
-mj3+lSf4ZXVOLRROH44yFrYahJVdYPiuxtKPqR6fYvXzVKvrwetM03MzxdxJOQFGD6Nt/PD/
-ZLLWXHjhKOd/z7l+cI57aIsYjpMEZxVFN/cHp5Px9hjQ5kH+XIfKfaT+ore1LmX7Qt1/jTy5
-F+RsoZo+iq65BQu/okb+xJl/M9oCaJrWZPhR8OgYVQOcpCHHXEGvHadCvaZLM6IaYLYtlUFn
-alcnbQdrFYXBWoGSvmhVZyrTYtQCWXWEqo3lF+sctqto0AQq0R1U3nOp0vx1KFk6nKo5jMiY
-bvbGlaz9Vrp3cWZv7H8CJX2cDLSTcR4jGt+rUF3MdlYXtz2CYxPJbLLb01gUVBMwWgtrtWBc
-0nWlPwh14zcTwaoo5nD8dICIWsMcZhNFi1BVO/HKDbLDJ3gss5rHTD3wjYc6pRaoTLYVqpbN
-U1W0kQXB4n5wOgeLjjWqpJRyAQ+FlSZb/yJyU+CQO3DjOr62Ii+mWOgR64UOt/Kpqxb1kFVN
-WVYGNE8yGigBPfQd3VGQyChIlv6A945QeW0ifxzQybLjl+2BTmu7w/cX0OWnTZfp34yzpq2M
-agxGs9k8VLRho9Kw6AfQdIHsu4v8txj/DAaH0mfbG4xehEs+gpfnzDoGLjmADjmtu5GX98Aj
-shemPdmgMHYupkZggb0wVAL+SCaDXWAkWxnVQjjYE4xNAaejyadtlB8W78Qx6oP9PthxHec6
-S96KMXsztNLLmN12bPOUXJoDJZcLPMr+AO/QELnNPaMV1ESzye2tUU858PUfavVM6jZVRQbb
-P+Z+Rl9Ui6g1pG/0RmL4uV4OIoPRYjPwVVVs8Uo/QlVeQ33uxY+TdTHVjJirTp7sBBt5o3P2
-4+09RM1y7cLs88H2P60nOj3jqA2zDQKjM6gXF2p/FP4roqCGrZBqa2ujStvqyBORVDvH9Enq
-jSiUzFbOOMow2Su0eRJZ94vuxzgawFnSwW0cHFMP1m0LqueSA0L0W3TzU9XarPntqJqTt32J
-1ysmez3FIwdRhx6ow+bokLZgVNY5RBgETTWq8ZZeDZM9gPnKm+6a4/g3D0tNIIe7kkl7knEm
-qhfYj2jmbyv4TXcl+4H1I35ag9ACMNkbFNx1dM8tLdeHp5BTh2GxZpzFsu7qKOub3m6VU1FW
-B2rmLiozyiIfDFAMSzYmoqaBkAvogjzEWnuVTK36HcVuRwYvTGwq9ViytgrDX0Hk+gPosivk
-vrtoILl/uFv/ZwvU6WwgDUV8kM96md0xYqlh/ImaVWT602hyi/MUUCP42offdiGCO6BHupFB
-xqIRNxIdCfgrDXMsCFcUV5fM3cZS5rn6tua+dA7VkSgYivIayCjqi+Igo25BMwzQwczWR3eE
-vSbCoSvhgSDU7z6s+4ifKsEso2C9WbAzigmmL8grRffGv61AWz4lcz4ANq9QMcWi9sPJnzt5
-xwHqx+Pm/t5ravpCeKgEePitS6F9q6o1qOQx5J/2zLUWM6uq01FPFVBOVH8d0HydUHxSifiA
-gSgtd683omAWoQecyJrSweWrtURlAvVtdbDZe/oZ/JlRleKVkwh5hn44w+hOYodzfI0lgiKI
-5BCz344d3pdujxnxQybquRpYcqLqq7eYLugdGG9nPZnKazqv5dR6q8wuk5NROz54QDqzjMBa
-7bBeFzL6XBTRCeL6DtF+Cf21x6w7TSYrpYERynGmhqoLGtMPvF2FRVLwzC/y+GNUx2HVXnnB
-VB2J24pg1I6oTw9+U00E9cReQ4j5zvytABrhmllnn4qCeK+zYjXp0HDaclCRVnV1zsqt4qxU
-cv8X6qa/+q+VDf1TUO0B4X+pW2pSI7iCktn8FIglwjjaRjjRVwWQVTfpZVQBu/D2TemlQCxm
-si3WmW0h1P8XtLI9oda/j/Y5TvxuAnEhqM4oIvUZkfpXy/rJEXx1BlfUA1gmN6q3EVUiepsK
-OYwMhV1gqS3kBGG0YDhvO/bfgsZbjJU6oUv/A59yfWAC2GyBjZuiOYfCXv6wwh4iMpi6ZAkZ
-dAXvioRPNb9zBH0jqMyn4u9JoG4kaBtGjvSgXpqpspOpypOXnNH9U7B+GAi8ht+f8s4HvPMS
-jHsA5lpFZTYMrDqo0WCwFKrhl1VapdXVwGZZ6sucVIA25YrFm/C1BVj1QOPvYMY30djPtfRn
-X6kVGqwQTNaQWrUfL29VF26sgbpvSv0+Spe0haH6nxDxuZWWuxU2V2VnG0Hl1g8s1FfSi6A9
-/Clr675h2UT9lUycBl1mR4VVhfM68RoK4udS161RrWBmF/jGnfw2i8yxjNhawSh8DTdKdHvp
-y8SP7Cl+D5xGgdodWG8/eeEeHpInUxxVB2KhMzHbDYT0Isp7ozP6oT7HgNRFZM9AWHMb6A2j
-ktsIe3qrslizDGwqzzgWNGvGmmPHovDfe8Pcv2SvNhRuI2UPTyRaw9RatOcAq4XqYVVRC6wa
-6NGuqgKcMgqds8F05GjOvP+C7njmeF7L7ooz4UlP9PFkstAScsc+lZGa4Y8Vr/LrSGJ0LzXj
-SbD7nIjIZhutC9s8+BqMVn2hDzGuCaoCoyyu7jCWFURub90YhnHFJ1OxYCD57TS1QSLKVzrW
-RlCze6OlRxAZw6lWpph9zioy93Jm19ZnjE3iOQAmkh0BfVBMq8wzmYdgzkvkozvoqXhqpEhs
-L3c/j5jdcDITf5nQrFnR6KWpfjswq2lEdyh1TgzRfgsrxsGru8lMS8hf08hVM/nNTFjcnd+W
-U0uZwQxy5TTVTo9RNWG/arBgFTBYnPHkARvSv6SOrq3665rMpJySpwll96p5VLCriNEDKJAE
-OOoX+aM4usQF1p2JIgxVJfVRlU1Hq8Jk5H5UY1EoKnv11uxRNUTZbIPgKjdGMoZ6Yya/nQwH
-tYXLM4HUx+TJ10Sj9F6pRSzUg0vLqgfY6TIxtMLsNNwQa7fE2g7wa3789BVdmYjiuAYyI1Ef
-vmC0O6zZAst5gPkTujp5ajiR6QkXtAcXabD8JV0SddWHM84w6xnToIbJ1eBkIe/Yzjkvg+Uk
-MHobf50FvxGqMq8K1G9yJ8MFDdIKhFelxiiHNRuqpboXUT5IHbc6qglozwFWKeUBPhda3mD1
-otpj3VCPrbXKgepMOo3/BkOyS1MzZi+78VZVq5hzTarlfPCz9PTqZq7ULeQTy1AHIaoE2KwP
-ulzg0g46u80JTd5bV7Qt0yVs9/Qv8LmLeGrCeO4SieuZ4VLz5M5lvJbT1ksXsFVHIVTVZ1Uf
-1O06UH0KBo6CsaRn8H7GE49tLC39wdMRlWfN/UXZceeO7ody9cbbq3jHGGzeHBXbyKx0+ENm
-z6GkQ/gNLH8SDbEXrX1aOxJ789AQ0Xq96UZ6n3rrjZa+e+tRo5fJUp/A5H0qUR94oCFjtyej
-lsbmVZSsDliPH7pQzxZgtL+13BkZYXqbHefIO3UpNFJJIqAR2O2ru6thKMwBcEV/POtF1XrG
-PKHxEK2xF8btCpr/WHXVXWuQ+mdtBkVJxM5ndEsSEXiIimQDdVworH6I8RxUR9RKtRiekvVp
-cCO5tSkZtTC4fcHRzhB9V/Q/dFpGoi0PuU92ZP4FGz7UDkRFW/h7Kplnk85OvfcILbxCz9Fd
-ie++MNlmRvkCRH+AWaOJqgCsvN1c6ytLFFSmJiiI9TXH+wzzfwJVL/UCvDQXrPfBHw3MXgp/
-id3O6EE39RzufIN1E1HON9CdD8DSBzz4EDuuoQYoyNgDqLgcyMiZUMYfrCjq9ji1wjqvXK1I
-1dE6qWZYV9UFKwEtehKdPlt1R0n5kpWekDHqqovkhyBeI6h3XHj1IE7GkXWpvskdIUrx8w3L
-TcVbs9R765zKobPYyupytjrUVB2p9RdQ616m5s0A75eGe6qafWIfUAHOx/6uVMgDdSvbVO1k
-m6sdbRN0ZZsbnxwJM69nzNeJrac6A1Z/azorBvFVrmRWhN2bojfs0Bv3se1NbExu1m6g3lfN
-gZEHoaxbYe2mZKmeoHIOtg+DKc6hTuFe0FOSXO+uJ8A025hlItGfzhZP3ZxRvYefdpPXR8Ja
-zbFxTdRvZbUH5XcXpZHF9gH9fR6eCIP9AnQ0euKgWbfvBzbmmXuBcURCGKolAh38HUaqSjw7
-YLvM5PnzZNINKI315hmysqh2ZzLSFJhto7JDPTiQiVYSN0/g1N/o6wdwfLRuDZ6ls4+LufJ9
-Cd+HqkHk1V54uK259jyN7OIJTp1RKfmxt0UMpAEr2dUjZnvQXB2/pycTHdMZ8wI00EJ9l9dl
-RrKNDO4FHmfh4VDtDhe041NVTD+Oo2D1NGybQl1bG5y5ktk6oLeLkYn+Yt3MZDlH/OBB5TCJ
-T3fhPXXNPZN35Nkv+i6RnxGVksb2Qt+jotvJ+JbCpROUE9adCDdvVFP1CVWUSuY3eLSRjTPq
-M+qNdUkdsC4oXytCbbaCqJfGoYEagrwcqGbFGTPD5dlgvU/ExxHqQS+ONJIxjGaMw1GK7VHy
-xWC4byA+wTqgYqwQdcw6qs5aj9VH6wt8epnKehoqsho5OQ9ZsxiqRfYEyAwTRGvNuSrZ2uva
-tkG6rG2ttrNF8LuDRJkvsxiHwvfCEqfQJWmJtRLwQUYi+y5q/byWFfV+xKsndhmEdweCTXmm
-Y5F5brM/NWtLPp0Whj6qQ8HlTu0OSgegVvujCLrpMsqRTFBdr4Xl9qAW95CxQvHqWvSnr1l7
-2dGsdumP9uyu8ti6q+y2znzfgHrJDt3/EZ1zR/eg9qusdoKE6dTBbdCbZWH6Ysy3LJmxMj6s
-zt8c4ddhxFEo0XGbkXxBkdjMjrAj8OIMsmQQURzOWORO+QxixpVZefA6pwcTGW3J7eWoBXLj
-C3sivB7fd4NFpY9zG6xZDibNpWoQO7WxczOySxM+VVQJw/0Bh7d47UXprQVhq8xV4kP8vB5s
-bYJRI+DaOPAXi96R/VF2wZfnUIc/mEUZjlqb45QmUjLDzzZe2TlqcV4lqaFzwPCpcPBnPQnE
-jOX3s1BtgabjzQBQ7oVVD8M0T1Fun/DPdeqQ9XDLUPDZgqgqz+jTEnEXQMp0/RKl9BnG+6K+
-WJ94vVCvrVh13fKDP93AZ1s0UGeY351RDMZXTui+4sz+H75+SSRf0+OI+PHw0xi41APEz1Gp
-1iYU7QlY+ST4XKfOW0PVfctFaWswjLCKMW3Gf57o17LE8nMU2W1G/Zqo+qrz2e7AtBvhrFHk
-9h7waW/01lD9hNncgQ0PmZ3PtsEdx6lAErDjT/2O717Bn4nm6cAu2GIS715LfbqF8/mDi2ko
-aTeqjq7EUEuwmp+4Pk/9PhpNVRvOqsnxOoLoIdRZfRlLM76vBy5cibbt+hTZ6wyctMvspz2f
-an4PXHUXVf9K1ZGdWKgBfsIuz3V98NkJ+4+DMyaBqk7k8Hwc8Q1nekxEpPDKRDynY2YvdA/Q
-MI2oOs4/qdOqMn9HckNjWKghWGxGXndCc7YlrzQh89Yx1yWO8XMcWfQT3rajBqmkelCRtFOy
-G3JH6ujx4GYVfw0ETYvQgn2o+qrhrwKwZxE8X4nZlOHv0n0mFpxuJrp3gNRYIiYRZZKAlosh
-TsLB41EtnUUKYd3qfLIzSHcnErryryK2SEOkvsPmL8DpU7KY1HmHOO4qjiA9KebpJ+D/HGe4
-DP7/wNWN0VrDseow1YuZjYGNN6BoEph1NjJAPWbTjVw6Ft5agjdDQNY2kByAzxfBKgthl/Uw
-4RFU/CVwcRsldZ94voeaP69OgKqvWL0gOrYyOaMOVW8rsuBAjjCbOFmJh/3Ag/SNnKxeWUPU
-ESqu9VZftdVyVTetDiqX6eZfnvqgMOoxL3PLCiv945jvseYj0HRPb2K0oejuo+iwBPD4Dv98
-5FOPGc9F4mmnyfFbdU8QUAPs2KOsMqmccKgr2FwIy88HZSPxvxv16lRmEMJsjoKTreBkMrZp
-Yu7szwEf23UMlgvBT4uoIibDrKPw/zDTZXofdoikLtupljOzPRz1NqoqHXarhf7sphaSSSfB
-Yf3VcLDhQZYdT+SPJN4GYqn+fHKw6qJHqdbklDaMxYkIcKEeccN3i8mrx2DshyAjBe35D65K
-i26RXWrl+oOCgb6jEFJQhekZk3SdaUkN0JkZtma+VcGMdBvJDm4ywxmZ8EZWWCMvvikGs5VU
-1WG5rui5CVQK08GtPN8iXUPkWnoGtF9mqr88cG8u+DUdsZUKS0ic/+T87xjlLWwbA3Iu4K23
-WtiyLdwmuGxPDNQ3HbSam7vt2cmA6VA5sk/gA6L9mNnnVboi3WD0r80zKuP4S090RBuTpf7w
-twzMJg35V2GrXDBNFTKn3O2swjws8qM8D7QLLOyFH2K07Di1Df4+wO/CqUO24/sgFGIA2FnH
-2NYyD2+wOZVIGcfvJpNP5A67mxoNk46jmhgPJ02mBqIexz85iPzfVmnYtyCKoTwKvymVWHuz
-i5Rc5dyAWjxArMZglXuM8S+KW+5YD1RJsN0pYuOY/kG1kwNFl94mOJ2rV4PT3qCtEb6SPag6
-m54psWYnrDyM7xnzi4XDYnhHLFnoMO+ab/CxVpU2u3atAB9jiSMX8n1ljkBtrl9huVv45RJY
-OAo+1vHJuaBruV6qIlAvD7DJE+LymvZGi04nphfARuvQFRvgoankuGZgIi+eygAyMpt1hOXI
-8/KsSDkTQct1C6K7O+fsa9aQeOvm6FMHsmZjrN6WGTcF+QU5+nNQKjtah4O/KCqLi7ofGbEm
-ef4vnk5GDTzQE7HcGtB9GKY6gy6IMbuwvqQezK6+MfacoLA46CxPzq8M41Xmt+XNeL7w1eLI
-ecjOFcnPDVCnjWGsWqC5uFGkyaA2CYb9C5uVM10ihvN3d5A9EEYeB6IXwtfz+X034jKTktp8
-AogZAMu1gmkrgKasWPAdPHlJzyc7zSf2pR/7ALR1Y74vx7hrguH+5pnaB4z+PtZ/CAZewxYf
-QexXrJZq7sC1J5raYoM2ILkn6PKEeeQ60joyr4+KNM/YeeH3tWhruESdUqPUcTh4m3lCbKAa
-gRpzVv4wvj/MNwdW6w1v1aDyzAl3pzG77DWkXsxHrKSB63PyqodyHYT+WoStdpI1ZNfk9OZZ
-sYvmHuUI0+XqAnwqGfIUauEUqI8217Zmml6cB9GH24mArTDSLoPRaubq832ze+5njvce3F2B
-nwN0PRiwJ+w/EeW6gMzoDWYXkClmgdFJcOgAskU9fpdWPSanfdUnwOg+uGwrmmsDxw/Ua+DN
-7XCVv/pMvpc9qMtihQpwaGEVbPbTsanZeH2A+kO2km41z4mVO2DpBt54oD3N7kx5yHPV8FsH
-YmIi1l5L9SOIX8WnRuN9ZyX350QnyhNJGUF7Os6nQetvLTy6CwYKMfcRkvVcMqYXudgXbG7E
-vzvRzvvw8WFwHYXSjWMeN3jPZd5zEjY8CmIu4pFvYK8a3CSdTjyVI7Pogx/lTv1I1CpxDxsO
-Bde9GUF9+Da/rNTmd+nJlXbomJJ4vJwaxtx7kzcbkTFKkzmK86rM+KsqwX1+olfwmZYcIR3N
-zugSVANZial/1mT911qu7ZhLGxjWF46NRwmkMoM0KIMfjO4DauI32rUwTCM7hbZGgTXFWo74
-oLM6hKX2odI2oyJDiPbDqNkn4MVeBVAdnqaiSlTLqVq3qifUAufRXyv5J1esM6J+4sDBajw6
-GI7ozJEHwk9zweEytPEUYrcDutmB3NIMrPbH6rMYWRBIiIbrZQdkWQ2fH71TEI0lvYvr8bU3
-GnMWdXSgeSYqRkcw+0PE1A5y2loidxLjbyKrHcBTFFwcCC7XULtv5DdheHI7v9uEzltFbC9l
-ZivI0MFon0NE51nU1GUy+VVmeZPZ3je5xY7c9xk+egkePmKtr/DzG8bwBOb9gO7JrHbAkafh
-yntwzFNySTx/24Bu7gUui8vdXc6cRGUgV1dDwYY/rLAGn8kerF66FrZoC1aHMzMfYkhWC4Ry
-FB/O4gFWXUGCk2E/qbRlz87X+POGDtayZvgYOu4Cmvkl36dhNjnII7mocUXpScZ8pIfzjl7m
-Xu51PR68LsMiIbxvNyM4hZp6gUIvCmd2BXdTwJgP34eQr0+g+m6oAeoWfzkBO8q+zINhzvYg
-twPIld0fR1IPDiCrN2eEFeDWMvBTXbPPekUy/1e48zwo28P41qNlvfCuK9isrOfpdDIWa7j+
-bY3RRfiLC56ajG38QOhB7POE7FAU9Sl7dPZEW8g6iJpwUAUVZq5jyHP4efBzerPjyWywIk9t
-XSO/SHdZJxWDhrmn5oHLReoDY/9NZZWijqhYdUxNU2FY0wdbToCDeoH6Ovggh5K7omWwTlV+
-bkqWaooWq6WlY2UxeDUt1VYqEfadXPIBPN7nnZHE+gYy/Xx+nkMG9CNm9oGeUyZ2hsNlvmol
-CjIEzXGGuEkEYUmM+Q757jFzTNXX+HQkyDpk+n9HwoiJZI6coKYRebY1nqwDn5YgUxTlfdXJ
-Dh3B40gsMAFcD+RrA/KArF+xiJPscFpVGKMFLONIZFbDg+WV5mtGm4P6CIfEkzki4MytcPts
-orOFmsx4hpKx3GGOsdh+GbVBlB4J5puZ+5vSVbYgsVKb2BjHJ4/Cvg94xcNUgXDbaLzUC5xK
-vDijySqbHoLxzOQX/swHqnMTYV/xr6wQjqc6vq/78uoGh/YkX/bgt87gWO5OtcaGQ/CIL/yz
-hcjbhm+3oazOwOJZYNBR+C4CxN3Bw/GwYTTYiDYrNsurJPCWRHTEEX37YKjl/M2TPDGJ7+Q5
-9el4vj/+r0a8puW7V8z7NnOOgtG3oeRX68F6BdhcpV9aS/Uea4LeaHXXF6zW2p74GaEXmP4I
-spbrgn4G3t7DRT/wL+jD9s05e2b1ENSeYb4bdSkQlctUmAP4xGz9jXrSAX3siWJZb9bsOjDy
-IVSqC1Q22wplb/PHT7vUGUbooS7CKPLsLhEIT0aBuHWcQa4gNqJOciQrDgdh/uT9LaB+KbiQ
-5yAGY/9FsHc47z+r5fnaaLNaN44cm4dIdEd3BaAYtlDDBsLIAaolbNNG70V/bgK/o1A6co8h
-BYZ5BnO8I24FmZd5SVeGEYZNvpARf1OVWlos+JHZyjXSP3goJxViPjjku+lZ50itX830M57C
-kXfpJVh7MXMaQ3brZLrc+MESz6UHr82mlO23vgOq5ImdvdjzEOo7hAjoqzzBkQdst8isbB3F
-WKaC0jnwnVxfHEokjWHUASiZ23oonxyBRyZwHh88vIsjRmLLQ/BnAPE+iVjpgpdqgN0caMQ3
-6LCzjHIbs1mHXgvEV4HE+CxmWF8Y3zqiT1o++rK1CMbaqh2xRS+ySE8sIXcKfLB0AnYtii5x
-IQMOJCJGUdHJ80vLVRO1H7Q9IEYy2e7qQrZ9OostQr9lTDdh0ltouscw0QOQeZpsuQpc90Pj
-VcDzKaimU3h0FeeYC+aWM99tnHmXLiV7aVtD9G5wGWa1048sD0a1DmY9iFqOxHdnTXfi5vD6
-JDTnXLAuvR7TMddYkHsSHL7EmtIHqSq8VBAby/XNLOi9tvCT5K2bWCgZvMQxhtPwVSw65AL1
-0H4052Qq2Cpkhs9gTVZdnqXCOqVvgJzrMN0u6qBZZB538DrI7JXojy/6830F8m056rQBRMZe
-Xg9h8Mdkn8vw6gUw9Rk+lH2KfNCYp9UYjlZHX1b2OppPHqGGDzb7um+G/wPA5lSUzBCy6hTy
-+S6+PmJGKVhIrpZch5OfwJa58Xkj8OCo7sHfl4hMeW7uilkJXZy821B1g7Ocqf7GUK3v0w9Q
-ayn46w5++H8Vcw4m/YI/MtvqqKy2SuSQjLDMY8YTpxcxVieUwh8wuB2d6A6vNYfT2vEazfi8
-wedykOIDA6xjfGcYW4rpM9oOBpgJo3lj/QW81sLrsVRkX9Fhn1G7R+Eyd/JtCfJuBl7p+d4C
-4Q/hwTDieDh5pw6xmYfoVhz7Bwrvk7UNrF7Xn60fOhdqqgMVwBpqnzNY/DLWj6bOPKvD0CMr
-ibee5IdcxGoCWWC/fscYato26/62I7ofOK1lS6v+kB8T0JxX1BwyyDY46QK+TwbVsuvjIaJI
-rvhWAi9Pseh6GLQ9FrCs5jraaq9DrNF6u7VQX7GW6AxYoBMxFQYb/dMXdUuzA/JpGCGGqvEm
-aus9VUl6c0W7JD6TDtvlUUBF4cpMeO4HWsDCn+VgQXey4AYqmUhyxFm0TiTzOwjb7yLag9VP
-kFeYrNcV/pmLTdcwrxUgZiH5fR5Y9cZzvox8CWeez6fnUHnPV/WxSClYsIDewytUVaL66koG
-Woj2O4rifA1XVGBcU4mDKHjiJZXuF9TaJzKz7JuRyKcPqbTY4z9YuDxs5EyWGITC8SSfrOIV
-btYjnoBV3jGbLErutj0ko19D/d0gEp5qe/JIGsmqROkeoncaNXRXsNFSX1Vd9DcUznvmILuM
-yd6U68kaq9RStPchGOYFeTG77avOY/tk9is5qF7CsHfx+wV48zB5NgiNsYSo8KZ6XU/cHNBb
-zH2h+/z1tT5t8kQSuS2WaDoLn77iVcbsy7YQ++ygOk02PYTOUls/V13UJzTebbLWerURHt9K
-9l/NyCeS+dthVTvVA44soBmz5ahfW9VMP9BC2KEgI8jEudJihbKwwQgsv1NfZJzPwecL2OIK
-aAzAHu2Y5S98d9Q8w/NELYYz1+hUeCOX7ZaubksnO42rFrZ5qrztmPpLDXJFPaUqvAb/bobt
-5T6WPZkxiRntlJ7TKJlquqlOtLpqf8tTL7HCYPUEnZOs3A+28ENxRRFNX6npyqNeWoGQ5sR4
-DVBTCVvWw2ctUN/NsEADKrPmREd/uGAuNVMQPpQnUw5jqWi01DmqmVOgaKdqAtqGg/PleDMU
-9tlF5joNj3/VM+CezWDyFsj5hF+/gOY3+gRHO0ZERWCNCLh0r3LFGtWlJyUclQ8cl9bryP8b
-4VBfaqgJRLS7+qeHMaaRJuMcgS/ew595bB11aVspMk4+/VNlIE6eW+PUeauEumHd1dlAhBvj
-CNWLqQx2gc178JQFq+YF7aUYSVlGUhh2SEcOeErOiIS/1sJdk6lV3OD9XmhQd6LXi+pwG3EW
-x+w/6+Noz62w2yI4Y4LaSR6MhceuGy1ekOz7WveHhauYa5CPiO+3xPQDznfedDf4xzi+mSsJ
-vznvC+IhhnjZhcX24p8TKNNIaocDujsI7sFYu6OLe2KH0foCmSyZUd+hPrmEdjoJLvdQi64C
-E0PUQxhlD7HbjVz6TfeGqx2oisqDxyKo0Nz8JivWyE3GLw02G6FBu6K6R5tnC+egYmbCUZP4
-/FjidQhYFfVQB57JpWRHvc3m2STqG5j5Hurqn2ghWz3V1jZftbadUcVsTxlBEtx5CNadTkZq
-xryzgex7qCjpid6QqPhqrdLXrdXgc7X+aQXhocOM7qZuTCxOJD6lt8ljosrSx81dJnvOWhjU
-FKDeymOuFLSGP+uBg+pmZbsPGSOaOuCdSqP+Me4vjO4W3HlMjQOXPdB6TUFfLe2iqpBLyqEP
-pYt/K/LnPC09/+Q6Y7yeAcOHE40JMPQTtFSSuo6tD+r95PYN+N4X/vTmCL7qj+WvHllb1Ctr
-v8pDVd4bHt2rpTvqFEY3Vs1UQ9UBqsY3cFVB2yld3jZFp7G1ppKoRi4oS3wVR4cUJjOXYLZN
-9F2U3i1G9BDm+gFPydXnuqZ/ThyxeY+YfEpueAp73WHs58gtEWTcM9SQL3U9rNOQLNOZ+s0D
-JvRDc0ZRD/zAR3WpYydRC24BlxFUluFki0B8Mh+8T8BGA3l3O5i2vqzGRsnWA7dNqKmaoUlb
-mCd6SvFzcf7JvdckFNduzrtSO5GFy5tdBGQvzdv4LtHsDt+e2mwWKIrTu/HGQbWM+IhDKSai
-82OxyHaiYiX5aqrZ1S6MeY6lru+M1m6G1q5KxW6Htv0HImycrRLcOgqNFASW5ZnsVWB0AcwQ
-qKdjG7mG7UEu7I4KLs33z/h/G8j1IiMs0fFwShKZ+yNVeVbbRFXatlqVtB2EO2PQx+Eo1rko
-n6boRMm1Z8CaN1zYG4ZohM51wLKtyO8dGZkzVZt0d6/EuyrCmU3w1HA4LRSPJGqpQjOQyXKA
-zkrEhxOZvSeI7MQcm6l9qj41eSMw2UoVtrmoirYWqritKD8/AVmbQNIo5tZalwQLqfo5XHXQ
-Oqd3WKeJjMu6LjbwR0090B+17EpUnTzfxzwBWQi2KYU6zYZt7+mlVLULlQuKxw7F89HaBTY3
-qdfWapUetq6GenM3Z4vhrGEovEUw1Qg0t7NZb3saJjuMGgyjmgpSZWC3dKA8C5asjCpwARuD
-UI+T4axVxOIRYvAW2fKx0SwFiJKfaNmboPYIyn0zI15D1l0Ei80gw0wg746FayfDMj6obxjN
-rOhtqNahtUJVBzirMqOxI//lB2OV8GMDrCrrUuqiThvwuy7mqfky4LYWfmsCopuDrIbmuv1E
-PtUAi6QyiuPEghd6qwPatBQ888+aT92wRV9FJV6xUvUby47Yrc4sequ/qO4ORMQ0dVUtMUrv
-IJwZAIdMRo02ld3XdCfwmRfd9VqjSmCmKN3a9KOP1ANBwjgQsYBIDUHlnAAF52CQY3wmUA9Q
-87HbAvKpXN+9i+f+gxeq8H8LOKsniJjCd1uIravkjseql+maddB0gehPrSF9njow6zrMLz1x
-eBnvr4YXxoHPQaiWQfw0nPOO5OdhWH0g5x+EvaXT0Cwdj+1vUkE9wPYp/D0HCJNrblVRBw2I
-lK5E91Q8v0Z5qU3Yc5N6i4KobNuphthC1XTbJNXHVkrltsWSnSeS7epgsUxo62Trg95nPdI+
-VpJeYSXqS9Yds0uQHyNL4GsKLJDW3HV4CxdZpub1JSZCsEwY+AxBX8mdH18Q5UdOX69q83Mz
-NN9gonkdnHELHGflMw1gz07KDds0J3LK4OmM1HOiv3fBbNNQB26MazRstwI77wNRR4iKvXh1
-p1kd4wT7yJ50OajS7sGUW0HlIjw3H295w7azyDGDyO/t9XPdxTwVUFQdgGVf4LmsZjebtkRu
-LbPCtjdYkP5ojeDxWjBKXSV3juehlPfAS4+ppdMqWfHtgwbbSTY+xMh3oU3WgNgp+LGz6mN2
-00nLUe8wovWgRfjkl7VSn7Ym6HBrFPicSaW9mTrqHrGTz/jIBioLgc9K1MoN1AcURRL18g7G
-MxTVIz2+LF3RVJTR6IkQmEc6Fc3mJbtuTAZzo4mIIXDKYOqnkaZfZVvGXlttgLX2oXHOkXOe
-ojcyMOdyqjRxVYl5V2S2VRlzY2rfboxhDFE2D93rC1t68ft+ZJRqjCwdPnlhdtqVCjzGqJYQ
-FPdGuHQD9YsP+BvPfHrxVXJUF6KoLww9iKw+iK8DwfRgFJB0Rp1u7talw2vSCbs22JykZmHJ
-Hcz5nnqlctoeqSa2qyiMcFh8IRHTmkj5ibbajB9k9VdRPGgDfSlWsn5hHdM3UbtXrQPUhrdg
-ctl5typa2xFsVEWPZcJ2j4zinQRippneyxPQlUP4eSwYXIAGXasD8dUmODMU5SKrxbyIxIFm
-/Zcd0Zteyd6Xst4mH5b7BO4uE/sH0FGy0/dJcPnA3F+diXUnw9JuZi+ljNj3HyiQfRPkquc5
-0z3kBLY7zOuQPonai6BOOUEWuqg9sOUUo6Jzw0ay01Ju1cD0mM1E9szHUYphBTuO/MV0J8mF
-js+CVspNxFUhmvoSjWvJ8+fIGomMMxGOjTedC3uoMObiDUKpL0H5QvVVu4GissqZ+FB49Jq1
-iXphLby5Uf+x9pD/TpoVKnP4+3ydH9t0QC1PBzdLTBfMkWCjJ7aR1YdO/N8XvhtiegC8AnuP
-OfJ7ckaK2fm2sPHBAfLuDnwmdxoPgMLNZJFF+MWDqJzAz7Lj43U8opQfFl8Ja0lv4s7wfWPi
-Se4mtVczOKMHZ+pGvDRlpnJduDZnKkRGewvqjpla8B6ofIqifA5rX4elDhD/st/LetP9LC8K
-KA9+/wfLJ+tyvKcUNWE9lFgfbO8N8+0HQWcZZTxM+BFVXF/tJXfeUj/VfWVvu6Ky2aL4/jhV
-Yjj6czWVYi/sm4kIigBlM5h3V45Qj7kVQD38sHbrJ+Dzg7VT21MpdwABU8iSPrwCOPs+vt7h
-7BnhjCqqKGcrYJ42K4M1qqLGXZjnZI6+CktIz2IfvDzb9H7fpecy1snqBLXKOax8VX9nRpKf
-34Oeb+TUFLTSZ/SnBS5L4bnOKIFhqFXZQUnuM/+lXnhOhD4li78BoW8Ym/TIjWCEm8jhwdjs
-JIrvCfhNNf1G0ptrwB/AXgq4/keWlz7Gv/DlG5g1Ef/G4esINLesy17KexajVqX/5Anqy/vE
-8A90aH482QaemYefI7Ddbeq6K8T/DhA6G15yY84dVTiM64/imM34BlMjdUGHuujl8GYQmmw3
-6vGYrklE9YRzlqNHTuKzm2DhLnHynLNKf8RWzHsOCNqEBg0ix3rB7H3Jys2JLXmurzUM1Mbs
-uifd0OZzjEko3VVkuWhmf59se910tJNVKWWJgB4cdQo+mg1vTidjzQD/i8DjMuw6lXqpBT+n
-47gPsKhU3KkcJxuezMzcv8mO7/zuAfH+keOmNfdO8xDbRRm3HfGYFl5KRYOmgsefaM/XaO7z
-qMJtuiuYlntHq8ydsaL4ug2YcCf7TIer16KzD4HRWFByhvgR3b1dnUNj3FNR6i66MZLctJhz
-tYET88LAipz6j6N+1o5EeTFyZjpsmEa6hcJHbchOoznXNO2LOt+u+4GK4YxoI3OQ+/3l8bkT
-fupJNI7k/N7kja1w3W7Qto6ZTiMuZSdwN+wga4+aqlBibi3Y3E08PuFfSZDcBd/IztcD4ak+
-RHgPjudEHq0AxlPBuHRk2I8vd4O+A6bz1jXweBk1FGuuM/zGli2ofAaiMlvBg9ngljfE/XfZ
-gxMOaojWL6tyKumwKeuaVzCrUJTSFXjnO/jOYTqX++pm5M+BZAFZDzARPAwDFUPB4CxGtwFW
-C2Z202F1B8Ym99M+U4Wk4/uCWDQ71r6HevbjCIM4myue9TDPT1yhbrpFPryi6zOm+noZ2dlL
-70Hff2R8eeHFSsSSdPodwWsxGWY+zNwXRVgd5itBlNYBV87Ypz5crkHgabOT81bmvhh96k2s
-byOznqcyuQ1Dy372JxnJZbS9Dd93gp1WwvTB8OZM063+va5AlihJJVUC/OQgx72Bk6P57FbY
-ZjOvo7DILfLJW+L7OxknBa/J7lOvsPQTLJdAvSQ16GFeR6ngrsCfL3Reor88nCPK+Qjv/gX7
-yFWA6sqVaBuMn0eg22diqU1E+Gl1DB18jqx0C4V/HzvG4f3NRORIPF+Xuio/PJMF5pU188+Z
-3xG8vhhlOwbGHqnr6IlE/SSif5guAzKLYO+iYLQ6eOhFLl6NDxOp7ItgwfbY050olSeDx5GZ
-54OFAPDpR7UxAozVxOrZ8GkWPCH7w1YipsqTc+0ZS1Z8npVPF2IOVfFHE7PSqyhqLJeS5wjc
-sNoAfO6smmDTNsx7Eky6lRHD+WRzBQ/9wr7vYfF3aLHfZKtMHEMpWUEufeOlL0BOqqRkIu0g
-Kiqc1yNwkldNZWTDdA01lCPPMGsDyuKxliBvCOMdZ9ZKOFJHtWQsdYmiEoyoCL52AJEejHkH
-3HaReJT9LbdyVl/mvIBaeQbKqB/KsJLywFrSIa4RGC0Fmiqi6Vzh2C16LV6cByY84cTpuh7I
-bm92Df+q/bHLBrw6AovkUXL1UFZTlCBH/QaBiWAkntxx3VyJ3YXf3qHBy4DJVrBAT/h2Cjl7
-B7i8ZZ4Eqgkya/NTKzzehaM7w4ailiwy9R0QdVJ/gnPTotrKwI6yVqyZWQ0lnQnyoYSrwqp1
-+EtBdPYzarNwYmsLFVo4ejNKdyLm2jGX9kR9T71TT6dGitSyI/VvmNNGBsyP5Rw5twcYCDJ7
-G3ZV54nuIyByGa8BWK0F2amZSgZH8uTSBhjKhXfl5//0RuOXxSOyluMyx18PT4/TmeTZX6sK
-mT8bOcqyBukcZPrGvGMiCPMHdaF6OZ6QZ9lGM+OuRHdb0NYarzpyjvKm13pVsCldNmQtoROj
-cIS3q/HO0uC4HGeuA2e2IKLaUs/KGhtnsCB3wPqoG6jSjaBnOPHdEvw5Ys3eRJMXkbyZ7B1O
-LB/HP5dgdIn+HFihJIiR54RTTK+2EmiJzzDNVd55DM8G866Z8H4vkNyWn3uTfRaCid0ooyPa
-k7poNOzqBkYGgLKB8G53cy3rPNhOxDpSDTcxucIZ+3UjftoS7w7k/vowlLNKAAOPQNV1YvOA
-uUIyFsXSn4hxJUo6k/ub49dGVLsu/JsG60SYcfRHnc0mH2/j3Xe03KHvw3kcsGEWcvNDtEM0
-1dFRbHGKEZ81cekHqnrCWnJFPBQEfefzZWGocrzszc5w07C5L5hYClcMM3tQ9MdLjWHF4mYV
-6jPY9he2S89Rs1BX2XOGOsy3M5q8G/q3DtGdCWu+AcvPmcMbVPlDrHWSqPYFBQONfvEEn/NN
-Dw4f8sEuUBvNzK7z81stz5uVNr07OoOJjuSd5qCxMa/W+KgXNhyLz5aZvVZLqLPM+Ahzlis8
-7XhPEeyagb+marlj4YN3ZE+reqoh0ViQii0HFZi97qxr6FboqXrgthR5NTe+zgbHFMEercDo
-HPwYpdtxlDqwiDxLWhRbFFLLqUWWwjfjOGsbuLUYnJNGbSMKDhGf4fhhH+p0P/wdbp7w6W52
-nOlkdspoqmLxiR9sMIRMVR82y6PlGd4/OifcUROv9ISLpmCBFVQD0gviCmf/CKNr2OOHHgyy
-BhPvnVUy/JXK5/JwxCJqBT4YiHpqjZed8PZoPhEEkk+Y7t39OeMg0O9O7A1W1/g+C7OpzGgq
-MTO5F/cV69wz9zld8GNbPCxX9GQlrwuKTnpi/tCPzXXvIJ3VFqQz2bbrjypMH6OOHMzZLCJj
-E7lPdk5yIm66oJPdGIs7/OlGDToEBEzDpsFUULfhn5xGCc81HTFd8U0jNZNIWQrOg6lDYo1m
-vEWm/gQj/uGzX/VQcvBEUOXFqJfCokvxticYbQc35JFr4Jztlem4nx5N8gurvuY3F0HcRl5z
-YMglvKK1dCH8i3U+61HMaTqzlNdws47+NBGxHpW12PTdcCEjyY6c9cirHVCrU9HA28FIAmOz
-cZTK5pn3fESInRpN5AwG9/1RSm5UKEPMqqpLIPYK2emiuWvyhor6H9Yqw78unE+6cSwn1teo
-SXqZakReyoAtPliV1S/rhy6O0nHWS1Gc3WGe8qZ7ejS/lefqK6CQG+PTumTfSqa+T6JuzA0a
-nclKI4icvtRPFRjhG3x+Su8gPh8QuV+Z8QdG+oyRPsG7Dxn3edO5X/YGmgWXD0RBtTbrTQaB
-qNrkCnuYsgjxWR/PyLOQk8lKnsx/BPjsh0Xd/rfuY7VeorbrjajPnehVWZU9Fu8VhDvOMKvF
-YM4D3w9i3C6coQ4+rYFPneHLKcRbmO6FUugPLnowB7nPlQ8m+4cXZeV5JpBXBsS0pRodBjZn
-EBGz+Yv0ye/GyOsy/gIoqN/6G0f5S2X9EJ4Jwa7d1XiiYq7Zj+AK3HICztwNHtYxsnloZQ9m
-MgplPAP0rYdzTmq5SnKT/4P53DTqKNnjZyo6Zo3+QFZNNrvwfoBBs3GWSmY14U3Gn9X0F/Ki
-BvHB8wtUND/vZWR++Frq1h4gsjrzyQAzJpJdtusqnPv/91VpwmuYea40HxZLIZrjzKpMdxVA
-Hlis9xAb+xjtQnKXrCxKJp8sp8rrx9jlykV7mMOVSms8uWw589vLfOLRDB+0nE/BVnlBRWMw
-ORqmWsXoQrHtFrPy6IPeBF+to6aT/gZDibO6ZleeGpzHnRkGgoWrnP+Z6quvg1Hmg94pjN4t
-ZfLRdO0Og6+kTorQs2Ftf/LjLjAabnr2faGul4zzCPu/poZV6J2ycHY3VLjcrTkBLp/DN3/w
-p8XcUxnHF2L0tdmNPBUN74A9J5rn+1vCpCWpklNRDadB1EJyS3dm2gxvtKTK7GhYJ4qv+3ht
-gY+2wEcnUCOfwGtDNUsvUovIrWv0LrKlF2fvaJ5GzAjSqpH1Zc+gkcTVFNVcj+OoffAPygf2
-/Y1NiqNIKqJLSlP5FsFKufmEBUKewuSXyLtRehY4n2FWzl1Cn54Fzxf4/GsQLKseJvKZ7Vj7
-oOmk/5l3P+edtzlbvJ4KIvpwPDved1RrIv4VHHoHjfFYzzDrlWQvnbQc8xre9gUlvcnprRmZ
-M0fvwlh6wHkDUCfzUaDn4Khcar7uAmKmmV6uP7R0wvJD3/iQNT1BQQ9qq9pqCZkzhBlthg3m
-/m9t5x8U11ldCqTlh1/sYeRCvLKpDVg5AmWbDDtbjKOYkq4Wt7X0Fp8AC3mqncw6Fks9pbJ7
-R435gkrlKfngM9jIylhKc5wycHB2UP2RGHrIWd5jsazUy9I5rCz8U4oR1CCS+4OFYGx5h3m/
-AoGXYJfFcEQjsmEa6TRrert34y9zqA7CVFMdqeph29b4WKqfvmSYXozAjaiYwbsDTaekKCJ/
-Iy9fVH4QNj4Pej4RIXIFQlZNyXOt/5ER81D3ZkfnftFn8OED6o53nP8r47YYQ3ZbpC5gSyQL
-ZlavGG84eWgmc2gNPrNg4UuwgS/2GYw/XInMwVRBY8gpI8kmfRmNM3VFY0ZTC71eDtYpIN2V
-GHNhUOREXbYM5XAHjNiRRxqRybqA0gHk8NHYbhJHHYUa7EjsVyfnlzD7eJfEf13wsHQy6mA6
-7eZRsoqhNzYdip+7KOn02Q7+78ccxpELp1DnD8O/rck+pYjyLCDQ4mhf4OyHehv8cxD9G0Bk
-jsZCzchg9vD4Z6NnK6gdIHXL/65v3cO3n8DsJ33fVOIXyZLnmfMjYi8dWd8eP2SE8RPwRQjW
-94UPtvIZecroC5j6BV9YMEMxRt+fSj1IbTR7HYajQTerMfzkrtaZHeYaoUUqEzVlyedwKq8x
-Zp+3csylBCrEjrlp7Pocm18xOxIPRz/5wbQrsN5wlE1DRloYXZiRf+9MX9ZX5q5IZ/2d/G4j
-9m0wwzd0x2uY8zUq6icVX07YkjmjOhaaneunwAV+MGQwx1hJBAynhm2I14qgYux45WIcaZRc
-y8wNh9dAddUhV9bDFp3MPZ+eVJDN4fL6ME57xjMZS4bw3ihzPasAFk1LXZ1iFPZ3Iv+TrsaZ
-6hLFhWGq9/hM1vPuRVuGEx9H9Us+/UxN1EmwQDLZ6gUzf0MdkMiII81u5rUZeUPy0SBywDIi
-fI2KJFZXEtnT9RP8dBVFEa9L6DM6DRruh+VJ7eaBGl6jyxA3VThvbVRwa/LBKDJuMNx1l7yU
-EaxXIqc4oYiHgJbZsKsP/vAhzr3AlazPH8lZ+pNX5d5UWVP1D2Nuq4i1teTERdQ7M4ibaYx0
-PMdyQV//Bx8dx2pzwfdk06FDcomsTXnCGD8Rz1pLlJYD403gr0pklN8g9Coq5BxWSgQP3+Aa
-ybavYCjp4XqfGfyEDezBQnnURlF8kBWFn5l8VkjVIgfU4FPN8NoozhECf14l+z/XhzjfLTDx
-iU9kNPfkXEBid3jTXe0zex7KlaW11MJzyVNuZAh0DXPJRazFwb8LOf9APDuESJ9N1RNgOgTd
-Rd0mwpC3GFUckXzV8L83nvVklG3JA9llVaaWLkPnGM1dvcTcrbM3PbK38krCljmYudyT6oq9
-PPC2N7rXDwU4F493A6P5iaGHei4x2odZVzPxuhFMr2SG8/UR1O1GdMISfiPPaSwAwd5YcR7Z
-bAIjd8drA6k3RqOJZ5BvvNE/AVginO+TiYuszLQ6Ok123JEu33lAQW7VHl/UxcOye8RZaqG1
-+pTpnL5a3yKfPOb1hOx7l6NdVqt0FNg9qN7qIPTJLBiqE5YtqGTvmvGgeyQR5Yyv7EH1B10W
-/vhhXdcvrSs6nT4Fd26n+t1E/XZY/0dOTIsWaATvbkZVZlKtsH8FjlQYVBXn2CWxTla1mJic
-yJhc8XJHZtnT9CQQzSn4yWZ2Rv9JBS/7JaXoRL5/x/cJWDsMtprIuORpnRzkpwRGtk43JaqF
-3T6aO/0b4LEz5Mk4/HMERg8yPFWOLNWA6HXFO1NRAIuIbi/04liO3BertWdstck10qtf+g9u
-5oiziDV3WMWFGK1DBVcCFVGIo1Rgjm1h6jEwiw/zlj0iIrTc07yrSxI3o2FHyeRH+LqTufgR
-7XOVK9XbUNR0R5BblHN9BssJpg95IdMrZDtj9jVP5LzRy/QDdO1NuC8WFRBhdkH0MM/IyR59
-GUC4rD0qT3zlR1ekgqNH2ou49IPBhZP9sckqYn2H6fPQkezTGc5ph+UbEyW1QYUDr6ZUR02J
-odrwfUklTz6eIKYnwsPdiY8+RLsH2dmLGmy1ngBS3fBvXzA6hGiagA/Gg78BzMKFUXRm5tPh
-V+mWIKsoWqJ0ZefOMWCgr5rNz4GM2Bt09SYq5JpdEdjGjqhFz8MLYeZ50cX6CJXCHrh7A4hb
-TNzOgOWmoeemw1TjyABdQLbcH08DA9yHgbdSbbmhxYvjk79WOvXbitU5sEc5RtuQ8TvpMLTo
-U2aUWfUnzqei7rdhlTscUXYzKqEO4HtZi+AKk+RXsaDspOmpOZtsNUAvUN14Z3/QKPsV7ZSe
-8GiuqlhqEuy+n4yTyG9/gcIMtuU6RQWipE+Rq18bJHyivpE7Kcew0Er8MhCLSY1RzzyJVZRc
-UYnc70TeGAFPz0DbzYYfppEVppi+u3dQVVf1fJTpdLOWL6+qpWSnoF4oiJGw+QL01XZVUJ9W
-z60Idc3yUc+stionDOMAs7mgEPuitbyoX8+itHLAyy3Nzki/YJaKaM9OYFW6Qncm2zthhfb4
-xIX834DvslPDJhCPIcx2Bp8dQR4cDBcPxwJTQUIQmvgexy1J9A6BTXzJsSthujnEkHQhlp50
-LeEoe/WEuMhmrrQMZJ6diTlX4n08ceeDXcOowy/xvXRRaIVv/WCKiyDoJhF0iFHOhzFcUSgO
-MFReLPqW/HFWRxJvs+DwdqC0ITHYBnz2Z54jiBo3oseZsdWDuR2oebqiheYRIcfIV6/gzTwc
-1ZE8PJaI2KAGcJYpJoOsRFt48tM0ohb1pw6D0kNwaoBZsXIBNvTUsgfCfBhgAkq3B7ViGzDa
-ES4bzDyGo4nbEZ25iKqrzMwPxh9KrLQBd9Xg7cKMPS/sUpIxOYJLN72CaFuEKvc3vT47ML7x
-6JNoqr8i5s7oOrVCrUffLEDV9lbHGbfsX7PN9Fd8q3ubu7HrGcdMGGKxeUa0PJZKMc+iNABJ
-3WF8T1hlI4ogkkrkAox/0jz5eopPPId5/mGXf2blVBC5cQV1oi9WDiAL7UQl7eEIa9Cq0nXF
-Wa+G9XYQbds4nz/aYjk6eC1HDDF9Cc7CUP/I9XVNR65wtMUcqsYOZJhi+gaxeUl9tY6qNHyy
-DChwgSsmUCutMDtMXSPDnkW3xvCbG8TIN90B7ugOb3VHabmrdOSOnHjEAZXSx+R+6aSUBSzn
-JppLwHcliLzsZJ2vHO0huLiHjRNgRNlJcR+2CCB6AolLIoK4l2eVsyu5RtqXjD/I3E8IJvN7
-kwMXo/g3kK8P8rcY8H8FhklGDWh8K8+DjoYrfck+SzjCGCKyE/5ujiZ0NDt1yGiWoV/moCtG
-Ei0tyEa55Hl967d+Zn3XP623Oh/4rKWvg90z4PUoGWs/XjiEnj9ndoJeSg7aQIxuJoJkH62j
-+P0IqnEbKPBV18HnJV4hfD9KbQHHWxmFN3NxBw/d8cVYeMUflg5Ft3kylwrM7xkWOYPGOIWq
-PgLO/PUfPRRvtyQimvPqQ3Uo93on8Lu+vLeV2fcsmO9DqZTOUDHJlfcGZNQJ4GYNnglQg9Uc
-MsoAtZo4Wk/s7sY/cUT+C3LrC+IhlghYCTP2BEtl4LQ/zPkm55Hc6kG0S7+FxqCqO6w/Q8fx
-zvNgNhjsDFC3QKGC/0qo/eTv7ahv6RMYj1WTOMItKpmT5h5hYxDkjFrqQc4YC1evVA2wWT19
-HOQdV2N5LeTlp/dyDG/4zAVbZQY/sUSQF3HQBA7PTlX713qoMqCKiumL5Pq1IL077C9XpuRJ
-6VdaOiymAXFliMzWMJQb+PT439XGviCinemyUBjNlwFLvAUNslojnJpuDTw/lUgbDiuPhTOX
-cLz9eimcOIds7cUsZoN2L6JH2P8G9s2FRmjKObrDdrLX21DmOZN8HmBWqPsTVf56Fz/7Ma9J
-1OWyzsYFVmtNdpe71jWM4vKEN70ZjS/RMxMN5crsaxlLzoaL3PG1M1VNaV5frVQdZykVY8nu
-mBnUPyuFeuMGfCQcuwG8bMIK4eSty2SdZMbxDI+9hE1+6pvM/S4YuEn2OKN2qf3UaJvVUl6e
-4HUoWd+Z7G8PgyeTrcN0e2JsAD4RdnRkXv+RQe+i8qPw6jGyzD74eR36djYRMUrHgdHbxNFb
-4iRFDyCyu8D13eCoEdoTG0qP3/XmedxT4PacqdkaUFe5kT+W4ZdwmPMEuS0YRh+rjlGnxGGZ
-R8TUA/TEcaP4TzEv6YH/EPb5rdehE6brnCjTgnirLuMYDIf6mY6kh8DmCT5xBja4Qd57SVaT
-TgOPYJ0LzCLGPNWxCQ4L4K+B4Ha96SBdBd/3AI/eqoXeTd44DkZPUumcIUtfICfKMy5Bpqd+
-Vioze1itIqq1h5oGEw3TD1AfGcw+k131d+qlK/wuyDw5uA6ttdvsFPvYRPdPRpBfPUbzyiq2
-KnBcXdRSFSU7bjSFMVuC3cam27PsQHqYXBHIe7eYp1xlx8Gj4HIOVh1MjTMMzSd3gBahXpai
-9dbpbrBhJ7SH3P2rDf7Lmk4l0vnGC0scIIcnE6NvsNJN0+/iGHlyjx6Dj92J/+5wUzM4qjrx
-Vxk+q8MxGsOmsteDPbXTa/T1HvT1eLPffD6Vi/O+tUqry1YjdcLqoKKszmCzpbKscqoKdfkA
-8LHa7Au8kyjahKeCOFcwltmJAjtBFN+GUb7zNb+K5ix7iaZ1ahxaZx712EK+n2V6FXozi7Fw
-eC/s1BGObw/zNDNxG4o9N4HA7eaJ781kkiAy1GrUz0Ky5RRUuodZV3yViJZne2RvcsljcSD0
-BJ8JI2KC+G472JTnOT6DcTvj2zSMxxGWkL4n8uziHkZwlLx2FqtcJc/Fqr9mr80R+LG8Es1T
-BOtVIDZkFzE38stE4/9p+GOBea6lqbqoZZfasXhfdmyoBrJ/ogBvwpdneEUy8v3Yagv1RDAs
-ut3s/fCeeWVQB0xfkGFUO+tUP31MtYS365lXJFjdqbpqH/JJf5R2ec7wxdy77Ahiha98QJDs
-kvpISV/qlfo/20IQIE89hOplRNVEkNaHSkd2iSqgbMRdTiq3IsypKPyWXxUgW/whG9xldpEo
-gv2mr1M5vubjfJnRVemY7S+y1SO9G/ue1gsYvfSnaYz9HWHU/kSvL0pIrn0+Joung2kqmtXv
-RdVksB5ErXcGLn5ABD+FP69xzP2cYwV1lycVxBDybTdG2Zqqvzl2dyKrd2OErsRMd8bXHAYt
-TC5+Ss4MoOZzlnVc6LnnViGVZJVSLywHlWJ1IX/0R9v0VtnIRnJd3gXVPBe/iaLJCrp7ow7W
-MUfBplzLPEVuO8a5D3LurbDISqomuerqScTOITZ8id7VzMOXqJ3GKAbCaK2xXWnYRuPJh2Au
-DoUjTwufgctlNeMKuGgCYxxpVmzkIjN+xeNR4FH2tPIAheP5pHRUCTE9Ke5oWZ983qyevo1C
-SDY9RfKZfqWliU5ZCzGH+NzK6yDcuQ3LLiM7Se/kMWZ/z1xmzVRpcCtPkG0mU81A/0+kcvOC
-J2UN0jay/wmsnGD2Q5iLhYeYdS5yrfE5nPmEOjdRbzUdco/oSXh5KKgcwdhmkKVWwZ3+MMNc
-8k5vvFsPhFcGVQ05Qw/YeDy2W6IX4ltnIisb43lOJkygerqll1AjraZmDoOJLsCTL0HUV14P
-QNdB2GouuJSKqp1Z4V2YeWTE13+wmaU/oS9+k5ukw2J6fvcNjXyXWDmB3tyOVzfB72tBwXze
-NwH2HU80LcfK0Vj5A7peemvkVKN5hw/YPwADXtbz8Pgi9QKcZjF3yhqQJUtTY2RUMeDgJNF9
-kNwYRlRvIKpXUnctAS/ziezJzKKfOk39dB69k0j2+WxquA5EVTm+vmGku3RpqpP6qhNZtTpR
-ZGe6olZQ760G8GgP9dMaq3JzpLqw5EDz1E0vENnB9GLpSKU6g8y5zOxecYCXPLuagAp6yvev
-GMMnRm3D3wXMHc3ZxFYAnwkktmagBVrBC7J+TJ5Ol85SP0HXRzz6FNa5h+Uum85+DuCxNtV9
-SSyWl3pE1n/IFYc/4Pg68b2Zzy0l5ldhud3MSFYtxYDz42D2FPi9w7tSUSvZiMwsIFKZvZhG
-Ma6JKpuaDpvMIntOpy4YxzgHMUYXYqkSuSXVrKRbQg5bAQOs5rybUI+71DVq57vMOhHcvoQB
-/jJG6WNox2f/mVUVV+GcPWa/0zAiaQe8Kfuv7dXLiCoPOLQHo3chYrrCuD2xphOorwomi1CR
-V8SnPdBKy9E7MWavhjSM8SNx8gzE3tURsMAdeOsB+LxlOhDK3nE2MoAdiCiAdXOjqzKrcmAw
-I2NLi6ez8PdsYDYNkfgVhnkDwt7ATC+IpZtE8H7y+FI4cwoKago/yw4j/qYPyAribB023Iw/
-ghntChA1E7tMIppmw/6BYPQ82Pir5X7UEP41RNuLj59S711Bt0TocLMX9CL0tRdWXI3tD8GZ
-V/+3j/s5MHkAPGwhK+yAWyOpjaXvmTzpeJf4SNLe5MC++L42OC1AtZoO5frdGqg+WSPA51SV
-B1+0oGqZhV+OUWO8gyvsUAt1iEtXonApr+NUlzdRX+c4vj92lVUYTozaBcu4Yd2RWNbdXM2N
-JxISOdNz2PgNL+nb9xxV9xqcytPqWRhxIdRCMTxUwHRwmYJ68kK1yU6hsk/Pcd4jTJsICr6a
-PcZX8/nlvHM5eTAIXJ5kXi9BaUbTk6Ek3mrOGFvzUyPOWY8ZOFILdCY+BhD9woJDGccQs9Nv
-Ufi1ktFB2VV7eMGTCN9H1CeTzz5i5aec7Rx22M4R5JrIbLOqXVZWVQfRGZXEzHGq5n2MYTMe
-XkalNpVRSt+Gqfy8yGTLN1qujbZAWVVjDA3wcC9iWXp7TsJ24xjbdOrbUHTgE6xQkYgaBpP6
-wpFBjCUMJXSELHke616kEg8HlyupNCaBzcHMoBtZqiGxWJxaOjdjk+tT8lS5XPWXnoHf0B5x
-xPEusmCg2f+pIHwu6z/sYKusagyons67pFO/XOn/gcaXfUsrgQVnomiCao4G9mQMe4iXO6ii
-n7BRPrJhI9XMXENci62PGob3Jq9OBJtT9HJ4eQrnGGK6scr1meVgJBi/HAST0nPhCq+78NZD
-2Pmh6Yzw1+x9pYmTAkRtFVUWz2XEOr+sAfDoMHL+GFVaT1etwOhoojoUNL7FVo3Jiwvx/G5m
-vZ1MvwQFMhQrdoKjncCaE3Z1NiuuHpLHHhB1NxnXaXBwCKV2lJg5j978/9VcP8nFck/iMhk5
-nlhJgA3j+csR6ra1jHw6NdxIPZzzD6eq6AJ3llYp5P/8xGYRJaskAnkFo+2DzXM21ag/8pLx
-ZLcpooasJlyRSkz+g4VlRZ9cZ/lHJshF1ViCTChrS9OrGmbl42+OLt3oGhBdAxjdPPCwBcue
-NB0m9/F6pGNQARHmvlw2VEEGEJoW76RnVBnM3bNoWHQH7BSEbTegQ4KIpADUxlI8PZ1qbzQv
-N3ixF+PqBKadOGdLZtoKG3UyO83Ks9zOHCcvo5BdR7fjA38Ydjvq9DIq9R2c+U9fxeoXGcMR
-qpzVxNRwRtIE9SJPL2SnUsnKGHOQMf5jfHL37iF5VNZW3UY9PiLXPCaepXeO9PE4yN83mR7E
-34ifJL0Wj5yE+V9QG2ndBxboDG8Mwmuz4c8V8JUPGngRtllnVjuPxJrtiYcqWCQ71UYKiugB
-rwtk/4N6Fb7xN5koUM/ColLbdwdNXfm9G/4aT/6biub1IPplLWFNqjsb1j/H7OUaZju8WJ7I
-KcRfCsGfhcklxWDoSqjJdsTJQmxzg1yX33Q862SeYHOAM6S34HCstI542Q8mg+FC6RrTkdzS
-kHE25m/O/K0nUdYHTu8FV3XgPY1MjpEKNw5MnsASkfy7DqK+wDq5UStVsEcT4rSVcqUO8eXn
-02TEZ6i376iAdOYK8GVGe4RcEQoPrTb7HZZQ8ukTYPE6vk2ChR+iZaR2fYlP3oNN2VPvg25o
-9sSUXXdeEJlPTNVdDSxUBq9ZUS73seJueGqtvoTXnsIE7xj9KzybRFRdxfLhvHsuWbSBkh1S
-OpM3HIkJOX9aJevVN8Hfy1GgXiBzLl9XYGuORL7/rAPNvlI29FhBKi4HswPbOGJ7KBgdRlTO
-YW67zVOHqdQiX/jNU1j1MtkxAl9EU9mTk2EGP/PMZUsylANjLo1X8pvOc/J8TVlmUpDISwNu
-XuDZ6+ifa8xVdpJ6h31kX9147LgPP6zBH95wyhLs6W96yFxl9HtNz7Xv5Fe8rluq9uCyBSqy
-r96LP8JB0F6yTiDxKbt9dyDjlCU6MqumsGkbzvP/1dNKmNUTnM4k5jbCLmex033TxbcRHm1J
-RuyAhTsRea1ML8JTREE4aiwI+6w0/dujyUTeRHcvxtIQ3qoJumqgJ6Q7fUeUwVxQHaulcphi
-VKR0/mxAJnQlUpcStfvA6X6ssZRodSVaGxCrDYgfF3Od9r3Z0UHWLErsVoa/C4JL6bb7B4Xx
-En47By7Xm72e/uiOMElzmKMFnNkFr482KwPKolAKwsDyrPQfbJ0M5iLAZCCKeCnMspCR+sI7
-65n/LuZ4EoteZY7JRP0bvn4lO/1k3rIrkfRMkQ7C6VCZvxjTc2x0E8ze5Cyi9fIx2qZgoS+W
-GomlZoC6ECx7lWrlDT55xFGPcTS5IzqQTNaCWr8Mx8ugKpA3yoKD4nzSDoWSDr9/B58fTWeC
-8Wi9acxyMbNew7wD4S25arUC7vIBL+v5PpK5PQNH2qx2/sF3SWaPZemCOYIRTjDPC9hAZDEy
-dm1mUA/7VzZrwiqb6zOy16kD6BStLatyPnLWt0TFB7OmyCKTyJNXvzn+I+xwmtjYASZDic+d
-YDfSrJyrwJnKkQeyKenqn4u/tDW9+0eRoT3QGHNB3GpiU66874GzpJPgR8n7/GtF1LqD2qlE
-8UJ8tATszcMOY9CXLui+yuBSumqW4PvqxEY1JbvPhROHUYwwFpV7Hn6RXS6iYSrZRVBWM7+h
-qkxD1ZiLKM4H2gvg8RKwcU283Qw2ciLSWnPWZmZ9sOxl4EqszscSG1U1tYnfLMVSE/jbEHh1
-GNYawzuHMequWNQBjJYi7xeDp6QLX01z/zkGGz0FnTYVgCXGgL0+jFz2C2inuylHGNcR9HQB
-aZOxayA2jTaVlDxh+YLRxIIeeVJiNfgMApuR5hqsGzbtbrRvPDFyER8kyS5E5LLMePwfc09m
-dsLE8hTaNS07Dv7GMil48BPZ9xPI+sB5nxEfN+CsaD0aNTLf9Nk/Rl4/i9KWbotZ0Zy1mHNT
-5io9OMqi/sqC0eqmR+wjLBmHlo4yeUGyQwKZQboPZkB/pCfi/umV5PYgs/tRNvJfDuyRQUmN
-KE+i2BFV+bF3dkaflZkWRhXVZwyyu1MHGLEGiMxNFsuCPikOfzvwry7nzsfvv6BxnoKv9+Bd
-8b/sMJOOyJGe81Kry5qyGM5/DkueY/6nsMchcssx8pDE6S9iTHZmLGmyj1wNXYtKW4SVl1J7
-yP5WEXoc6OuFnbqhaXrB1+2J0KqMKisWSUXffwB7j9FKF7HFXhgmEOQEMK4Q00NTg0Othc9v
-Eg+34XOZ5St0zmd+98UoZE0GukwkL2PM7vB4H+JsDHNYSMSvAc2BzGKzYdra+KkZMduAfF2R
-Gre42Td7M9bYxmhC8I4fkTsN7/Tj1UaVAqHSm0Cb58QdGWMzdcasz3FkHPXwfHEw+xk8HOAc
-07DGANA2CCSPxA5uzKYNmbcus2vJaxSR7c/oj5vO6Lfw7SWOIXc542ET6WG7C2YJAkk79CAw
-MZD59TZPjKSB074xX7mmkopdZN/4tFTlH+HYBNPhMDdWVkqusMlqK7mWnaSPYBd5RnY1mPBn
-LJuI+h3w+HFyyi3G+AMlXZgodCR/dEW5dOeonbBBBzJbd2K2D3Zpb9YwPQaPFzhi9P+ec9zF
-z9LTYiWzCAMZV2GKT8xJnj39RRZPYZw/zRWg63jtFB4+xUxjqbZj8YPUehd53zOOlIMxNzJd
-S0/D8sfIT/L1Hl9FV2UBKfmYfSFGUMYozWT0wTsY4gvWk+dTU/V9s/t4LbjMhXd05lhN+Vmu
-8WVgHO+I5uvM/yj1UChj8Mdz/mSrzUT9YWxw0dz56Y11nYxOb4ENRPXNxvOe4MOdeXTn2PLO
-DkR0PayXTUnHNj/mvAxO3KCvYOknWOI74/mnhdF/4oN/4CI96M7C8bMws/+I5CxUV1R+oHgx
-Xlxnnqj9brqsnsaKH1D2xYy2ugmKZK+/rGjg0mosynOl2c97gQqGPVdSO85RLuaZMTd0Zwcw
-IU9ONzLPVMWRQ6/DAI841hes/M/wplzbDMA/XnhnCPZrwVmKcZb/sGk+LNgWSy7Dq5fAy1vG
-9BsM5QKfDuB9MLXebPhmpqnWPuOXr/z+Bzb+qyX6pb9rCbxUzTyfLM90JWDhRKM9q5Dj84DX
-34zhPQh9C/5fkC/iQa10llwD+4TgqVgtfXHiTKe7Z1pWO/zm5//QfdlBYj7VG9boY3YQb873
-LamaW5jqRK4uf2cO8qzEZyxuAymZ0RFp+SmFf6/ggpfg87OONN1F3pjdAl/gNVGkBcj25dAS
-NeBuWY3b2uSuu/wsT5XllV3dTe/vHcTlejTdSr76kVO3UVdcImd8hX1zmmroE1lCMocFG30w
-d2n/cJ4/ePY3Fv8N+v6Qx2wwf2YlT7l8Q0P9MM+426MQ7cFHCdi+KhhpZHbbPY0Vf4Dqcli2
-JZ/qgh3k3tZslUmt4SzS20SwWY1jShfVHMSpvTn+L+b5jfj/yKyf8lXuX1zgd2exRgxePWXW
-4h0zSvMaX19jlTQo0kLUpVWUO7E6AFabSYzu4BNxWOyJlh3BE5hlLMriAjz1jCyXXfng8VXw
-5no0eBBcuco8HVALPDaDRVugfP5/lXlL4qgXf+/B99KLqA75SOxRgkwj+9MkgbiNYM8d2zky
-ltpwaSNipSPWHQLDzwUf23hPPNgQP6Yjq+QkJxfFN3X42glrucEZPZl/PWIiJ8j4AbZSQKgC
-QVlN5//8+DMf0ZSO0b0yHUqHEi+9yJ6NTT+G//fHVbPbVCYUbGZqUzs1w+ibnKYT2nVsoRhv
-ERioDO+Wbu7OYG0aqNmgzqHIbmhZ612VEdhjiwJm9XUlRlUF7NcB943NczlfUDbvOOZD0z1M
-rvT+Y2bpidzMpn/GZbAka4LCOcNmPByCXw7y/WU+l4wXXpm9tW6Y9W4uIGYWGdefGn857xxv
-Mr+sXL+GF+/jxbeMWjJodj6fy6jwH1qu0ktPRzusUYTILUwU5yDL/QQ1z/B0MlZ+Sb3+F7/k
-h6Pqwh9dje59rMcy/gFkpZbMrByYzEk9rE0nNdlrcgU8MRkOGIkdhjDz3ligGfqgGO+WKLiB
-T3ablbCZ4UDZK++d6W8dZZ7JjyO/XAZvV/hNPP9uo4aeMI4vvO+vnsn7x5NVZlDDh4DrO7zv
-Pzwm+zdUZq7S864+vnBlpNOZ/zzwNZ646Afu5Fn0YbDpaOoEVzWeWn0W6PUy+1J34x3uYKY3
-sdbAPOn31dz5e0HcPCBu5EzHiWNfPC8r1VuZvaqKg49cZGzpNpeipYv7e96bAxVek0wrdxll
-x6d6/FWunzaBo2ugKaVvSQJ4PgK2Tpj9G4tif3u8IDsEFAG/hWE1WaNnYfEUuPwnSJA6QVRf
-TtOBYS0cGgRG9qA3TpnOdKXMnZskePs5tpFcbYeWcuSdo2G4ZWa1Uoz24ShjyKXyVILsQFSM
-Oecjw2fCIl+Jnoem52ghFM0foyMyqifmmt4jfo7k+CH/e4piBWNejQ0C4KkNppoVVqjPSCsS
-fcXN09SDGfs4RjYNb0/nk6OJoI7mXvlCkOgBgqWzkfSsvaulYk9CO17Hg/GwQiJz+8x85Tp9
-WkaXakYhvX2TeEmHX5vpQCmaYjfnDQGfwVh4N2e4ADN/wfqlsWc/ZrWWOUQxo2scMRa9tJuf
-V3IGL+J+LMzgbNhIroF0QiM0UbKCKAY/XyG6LjHXkyir/UZ5vwOH1/QOfQi8huhgMsh6vcns
-5rwSpl9q7mlnNE8uHoHfv8AUlYiB9mCwnalrkojkszBAGPj0p0rbhG1iiJNvWq5hO8COlUFn
-JbJ6JRSIdCQvZFbGjPlfR4X21A8VwGsWlKkGR5k4svCEXA3OpUaAw3ZY1QWm9iCKt2InuTP4
-U9YTm+dCnvCuaOwfyPkWE8k+5PJNWOwYWeYmVn9vcnkOJVcJy6LK6pt7W7Ew5XX00UstXdby
-wRivsPw5PBVuegtkJ9aEM64z32hwcQJ+i8QHkXj/uJ4DU8/GhsOI0sYmpxYHYZ1gM7nzPZmR
-j6WaH2t2fd8Oj+2DM6IYz33zXMxr8PYMfL+EO9+ZJ3tFZRQwmS6V+IuHS4JMB3N7clce89xB
-DMi/y0we8fvHaIwnzPAtmdIGU5VQsjucdP/5ZNbwt2EOncgsbmBzlFk/HUx1Hcz8dnP+ODz6
-A4/nZV75mI9iprJ7uOyZKsruu6kD42GI/bD4Lhggmk8kGL2VFxxVg5FdyF1j0XlLmL/UgVPJ
-f7InWUVyZ37yZm4Vym+3wcjb4bCtpo9oADrLH12/B/12Ez30BxYsatTGFdNDvT9fh+A1Nyzn
-olbBRyF4NoZ3yt4pT8DnFbC5F1SuI778yfJb9EX+v0fmf8x38kTJa1DyyewP1ox5SOeDoWSH
-0dhjPGMYz0yHEb8d4aOaILMgo/4/ms4Czqqqa+OHoWOIoRm6uxGkG0RSQVFCxe5XURHEQAzE
-RElB6e4G6e7OoTtnqGGAAWbO938e+OR3nDtz7z1n77WeFXvvFdqPjUYrlUdLVmO9UBJ6RvIz
-Cb0REegMtAkzUUR2fjCZAr5cxZ88h3zE8vxk1keqHhmFzGZ2NZkzyIoqz+RyPppqCSziuUPB
-wQ+uD9g1+Akp/h2cDYH6o8HwIqh+IlRfg1VwbzqabHrYC3n/AL3TBd42Y7VSAVmJwrIlML9j
-WI096I2DfOcCmlnn+49W0FOR77k8dXUouVctu3ZYqKquHNAKyX3K58Pr4cFM6DIy/AIvtb87
-981HlncygnOh6mbt9UrrDhxKEajT5W0s0TZwOomfI9CjE63jc8K7XPA/yqu09Y6i78jPATxF
-Fd0V5d436I5W/gxc9+H5n/Jp9Vzsia78kFUj1gnuv4f09EOmxdv50FUZGKfw3+LBZAT3yYxm
-yOtTCWXpHUEmdHpwBOk8jHzuYMSq5TsJ31CxYX8xvn+QyUVwXxEcyXC8IHrmSXjaybUda7Me
-zhFsQC8cBXEHkIDZrg0wD77M5duL0Tjq03MerqRx5znp4hG8O4RrDLZkrvP1a8CjYlyp+cxZ
-+LA1XMvKaTWjWg2HNoGN/VDwXCjv/Uqok/g0SH0+aFAN+rfyHv4vyOnfaGd5RJvRO0fsQWkP
-W75WcfwQxY8mharv/T7XJ8xHHVj6PM5xfx9MdHDu0W54sognTII2o6HDSK7BYPE39MefjHMa
-d44BH7nRdp1deXkrXFqO3ZgZjuST3+MZfxJ8BC56sdYcwKdHIXnz8F924CvdwibkRXJrOu/4
-HKOPxwLc5DrL7wehhWT5NDJw0yv5VLyfAulLxYopJ/Sphr5sD8q6oAU7oseagqkn4Gs5dwKs
-waw6wNUPoMO3jPaH4BtsSB80wtdQ/ldmMBb6KUrqCFy+C1Ujka5oV+06BOXWYZ8Xo1UWYm+X
-IA+LwcZsPjkRZI3hvSkgX5V3joI8vC1XTmiKDeoBIlQf6VuoMhDqKu7nJ3R1T6jXBt4UCVR3
-/lPsch/swCB4ugAeH3L3pEXMbQ5zm4NN+c/1PUpjeXMhs6nQPvfQRDfgfyy68zqWNMSu5uGu
-VZGdpiCuLf5RZ7D9JhT4JGgf9ER3dgl+dS+Eh+ESxjGfOQ9HX3wW9EZOvkaS/wQnU73LEIdG
-VHexFfB1HZpuMzRdhS2bxYp+HCPXScok6DsF7E7Gt5oGFkW9GOvHK97HSIXlSMDLjDW/kuDu
-Nb51FP6r79Bc7Pdo9MQw71uV5y5F4F72QP33VmApdoTqmLEfmp8BA/exulmZR358TkVW5Qo+
-xv9+HXq0DBTfMYfnTESWp7oXqfbxyoK6mo7pW4PmUT2ViliwrmjfD/Dg3/FJic5BJ6G7h4Rv
-gccXwUOL4A2+9azzI9RBKTb8HanbBC/uhkvA/07euQIW70GDG4zpGBpnNzrgIPrggmvSpQZl
-6Xl+NtdVG+A+NEXxZOsiQx2xv12ZR0fkqxl6s6a7pqj+V39k5hNQ/zyfbMxM6qHDa2GZFcOZ
-BWSlBoXZka6yjk/f5woHd6DULvA3H0qPR5sMR5/8BuX6g6ivee4A7P9Y77q1d+ZoPJY6Nf67
-fKPaYKErct8Hv+g3nv8374x2XYLl4Xf4OC8F3bEf7XlGD+x0P/A4Cp0zG65sgifS36XRMi9A
-jw/dg0ERwDHgYTtSvZTRTXIWfYgVvYV9V/WaZOyn6FeKz1WCduUCRSwoNrQr1udLVjoj4c9c
-7OaiIA6dsTH8C23zuWtWTIYvQ5jNT+5Lrv3ehdx3MLKhHimD3NmgoPcixtsL6QAFVdmrJtSq
-4MpSce7pWwytlAcqZ3H/o7ygqBrUaOYI0PTBy3DvHZ6rvlfNXWntD8ezXGT1dIvVUxAoB1vn
-cqoqF8k9S6FVKjmGKQd3ycj66A5a/jjXdii4zbtRpbgKIUOFkZ0CjDEbWE2NDVNHGPXKrMg9
-lL9YDy+hElgohJ7IFfzJ9Tso+Q6kfYK8dEPLNmJFX5hVVCJj2Q2nZ+GpjscyL2CFtQ9pveQz
-EnV5yu7Tlxvo6XvOWlTlGZ2/VECOy9j/P8zrg+isfcw2Bq14Ed0lTEegtSLwWVLgk0TisZRC
-ypq4A81aaPIfWvY/ZrSUu8xFCqYx8pnY13VQ+DLynZl/hbjyMPK0gXZ0rjOGrcjDFDy/we6N
-sNxZh1+Aqi/A6R/IxgrviDUAiU/hQ7yKPf8BbTU8+IXZj8LnGwZSvmaE3ZC0Bjy7NLYkO157
-Crz2m2EHdGdvUKk4lJhwLtzZgAZSlOIleBTD/Tcw0tXI3zZGeoBn7WTUK9Api5FHVQm7gAVI
-AB+XoYneW8NsD4Xa9a/PeIojI1nhR2rX3Pwdqv2IBvw6+ADkt+NTHZDRD52bf5m5XUE64nl1
-Cz6cglvred4MRj0Syv0GRvvhx3yOnviacY2Aisvhy1Eod909QcvzpNZohB5BS64evP6I9eYn
-0PRdMPoydOgMl7RSq83dooI3nVe/PnyHq68rul3BSzmPxtrt+miF4Hdt5teUFU8LuNLGvT1v
-uevzq2Di+eA8dLnq7gQp4OID6Jfep2enGFs6RlIArhREcxYA4+UYSzM0cBd7jVoDTIJqg/j2
-L8zmV6TtF570M9T8G4lcCcevum6z1qNxUOgIlNFfZ4BHeUHSB6eg0zXsaBwUO897p7zHmc/9
-deOh7GV8dNnyfaH6m/Z0r5kq7o7WAXw1wMZXxhfW2uoylFzk1XUW75CobsEypHN72Iw7dIAK
-7bzXq+zASO6TFmQnMb4E73BORtP/hmb5zbvyu/C1TmF/UqM3q/Jc+elvsf56HX3xPJe0dlPG
-oO4AVbHwmXhnLzQZ4a6QBbDpmbzTIMs4nrsMgRJD4ckC7nsZrBYKdjlyrT1oboN9aBwMhHry
-2Gdgu3bzTe3CnocX6iYWH6o648toh/fRl+/zxPfx1j9jPduP0XwWfAhvPwU9r2IJWgZfgfbX
-QJv6Sz6LzmiJVm4BRbujN/7Ci9wfHsU6H2CUq8HcCPypT13/U1UZdDqlrNaS6AfVxKuIPDRy
-Te9cPK1yoAoWuZHvYljQRuiGrmi8l9FXLYIfWem84rizR9mJFdDAqouVGHbniY2YczP4/xES
-v9D9HTMEBV1h5AC2ea3P/75ATvshjx8gf63hpO5SCL7ne9x/VFUk74GiADwVQH83hOfPstZv
-6yibTI5+y4keVfZbOuQn1ndIH3wLqrpzh27g8jMo/hd6bCKzneGOotLld6FHavyCDHD0Ibg8
-h2QdhDannD2uE+hMoCUWXXaIf8dBx0PWqqWRnzaM7zXG/QG07Am9+qB3v4IKH4G2pwLFT+1h
-RXkBL1G7T3XQlR2Ri+ecp3eCGSSAlyxgqBj8LAWNCwUB47+Ljx0620e9LOPQZAdA4zJkfBby
-s8RZTHGuTHDT+9VXwco1xpOW9WXp4Buooejt3t5NygV18oMgWaHSUDWPs1u+cGXsu+FbeGZf
-ORI2Ert3zztgKRzzpW6ky8H9DEY7Av01yFnM+dCbBcBlMexDUTBQANSVgEbNed2b0U8Dm6vQ
-FDPQGF/wUz3JwBYc6w01XnddytFI1Pdoxf+B1VfhdHdQ0APEfwJlh2LJVodTodgkZjceOgyG
-hpKmj6FgP/TFBGymMknVBXcLMzjIlQSXtX59FmnoHPRCa34POvvh3ajO9/v83g1prcd4hJKD
-6AXt2PdD2l7l2U/zszFPaY9sfIZVmsnKV71U82L1nnRd0dWMcjN+74mwB3R+D0v0JnxXxeOa
-tqv3Q3WxKYvursLrqvC+Ap8piV4qzN8LornzQoUs4CuCEShn+rzj7QoGs+HHD47mqoQdaY/M
-vgk/XofqrZDAkuA9A7rqHp+MRS4Vz3EEXhxzFeGAO8VABfXS2MFoL8DHlOAmL89W5ENteNgW
-hPcAdR/C4Y/wBd80P5eiT9Y4QiANnzuC5pvNPYaiSYeA0enojm2P14hpnbOjfOk26Nqq/q02
-MyrGbNM7Sz5HoEq4igKMA40xoGcVY57tOszalZcVvusKRIUYVz3r0rvYnxTucqSa8PFo74U8
-rz96612o9757GOfFs8uJ1VR1MMUXH0YmFzCyMeByPHSYy0iXgKJ5XNopnulz0qLwJYsjlm4x
-tySeGRloP1M71F8GzwSDkZBJPHkadmwo3vcb6NRyXNpf3s98lzGOsdC9LxzsCAVr8rQnwuro
-0Sj+din8Fy9rDhhdia+hTt06FyzFSBty1Wc1WwLapnU3tTifZCW4Olga6JWFJxbChlRiJVgz
-+Bk93g85fR2KNmJc0cFzIOdprHJtd6ScwvN/h8tf21N4yLrwMl60In0vI/vnQOpeNOty0DOH
-b8xGq8xj/b4ABC2GLmuZwUHnKmeAgxm4e260SwX41ZiRtEZvtgaJLXxKei6Ud6dI5SewdaVY
-22QJdIqZmTsV4Nklg054JU9Dg258qje4/ANUjUN2V/mMsiZ3fAIpU7X40u7zrModOrE8y/yP
-Q4lz7hZ70Wejae3nqLqwqtHu4A5LubP24ifBq8mO3inrawp2cKYjOHWGdhg86ZxC2XVneeZN
-dHtqnlfIlQHzoGVSecf6Jd55BorXCLS30Y6ndcf2d0V626PNmmAfa4CcIrxOj2a+xb0VJxiD
-RB6E+0eQ9fPQMh5OPEArqFrpHZ9GTnRvzfzQoGTQBi534h69XIk3H952Riyi+l4e4O4r0Rlz
-vIpuAZU6oDOfC/4Nn+X3VuBTdRMrWzfcg7oZ0c5FHLNcGDzUZszK5PySv/2OJhmAl/E2vlZd
-n1N3Z96dwWdHVpVt0Z2N0RkVsdqKBY/DLmz1maR05yoQuoUV9El8jQQQk8zrBN45hyU6jIQe
-hJ7HwPJF775FItFF4V9Zn9gPcT+Nh6wCb4e/cPWBBi+jVWozykwgSBSaAU1/Ct/Hln7oqvGf
-Y+m+wSL8gB4YBC5nsFY+xMpEWYjl0N9NPf/FeO8H4M9lXt+ATvHo9MC78NJmWp1l8y5N+kC0
-f473X3XWRxwrwFieFoetvYaujTOOVDVlDeOXnhnDs4eA3kdPagf1O6PdXgRdHaC28lVKohGi
-sLWpAnkPd0DVCfCtaJ//eG891xFe3wATKcBPVhBTBEoriqYlM33euyOqH9cHO/cbY58FAvZA
-+evOyVV8zTyjtzL2tS6zrA13yzi3rBZ3VGWBfsjbcGRxMNcn4FN1arMjOZfQXht4yix4Op5r
-AiiZxzy0UrkE3lUPKTX8COGcPKeAT6mLa250tzq6S7/EIOnr+OwCvjeO0Q5k7p/Ck/9B1/58
-YzrUOorGSutxT2Fek6HWNDTtPK7/wOsqJGO5+17X5apk/XGMS1GuORyF1xof4i08vB+Qt1Ho
-LfUt+Q1d2gO9VSpo5xyDBV6jvoNcvAcuu3G1ABuVwGsuNLUyHvYyhznorZGgbzAzGg5OxuLZ
-zOH3DeDxBNKo+uupXW85nlnew74kw6+MzLWEVxwrsGHrwi+R1wHYkoFg6Fso/Y4zGl+Auh/j
-vfQFB73wcd5hjdgpeA990R8aTYJaGxzds4//bwJFS8GSLN8s+D0Pai3xmaDOrnR6dwPenuad
-81idZOyDzmEbugL/TWZ3glluYxW4OPwJCn/lfcddaG1F72REcnLwqdxgrjBXZUaqzuhPQe3W
-cEDZi8+CU8XttOdbLaF2IySjPt+ux/fquIr/akd35GQ9FYYD0P3D0UTz4eMB1miJyFc0qK8d
-fMcdeqPhvmBMP6P7xvJt9Tpcju5X9NcxrEcEXkF5rFBLMNcSj1mVc7Vbf58R3ON7ITQN8NIe
-hG/xt7ZYjOJ4wg/Qgmew1MdCVeJ52V1zYxj7LsfJlMZzUHUqVWFaieex0LuGuezzXnD8jiJc
-T4PWrXxWVmo49mMAP/vCj55cn0BT1eHUzlocWkk1I2pB//rwoSb4rIhEyysoxaXYr9zBQkdr
-Z2e9XM7r813hJ0j4Dzyvn8efA1mTt1KKqy4I7cY8v0GrDId/qtE1inkM4Q4/84Re0LY9GioP
-Mqe69Iuh6wxmMx/vfql/X4w+XeXawLv5RCw+iGxaap/rnmMtcMNnBzHcYY97SD/N+F9j/H24
-foT2AxijTiS6I+u10GxZGN2FsD9UGgM+Z+ADj8O+/oh8vMbMGjie+JzPaTaA0NFQ5Gee8ysr
-1LHIhqpJHHU3yyNQ/J5Pf9LCp7RYi5RIwB1ofxw6rYXCMx25/wE250uksh9P/Apu9USGukOJ
-RqCgKLonI/o8Ap9ONXozIj+Ki4v17kgdtF8TV0XU6eUJ0LWfn8oVGeb+9eo704NVwUvuwPoL
-mB0IFcZAoe14z8nhV2jzl0B7G8bRGMQ3RC6UXfGpz4FPM7MLIPiaY5lVEVH1xRs4rrEuPGzs
-yJBTPOlY+DYU/8T9Y6842qQBEqLe6qUdud6S2XdCT3YECW2x8c2YpaoOFrXnk2i/U53XTjsa
-NQv0SQMN7vHsc+jsnaDrP+zoHPTlbJA/i2sK8xzH3FWTcylzEsbPuZPGLiRJvQ8mco3j9Qw4
-tdTebnpHtSkuYzQ4GIYMDgo/gyK/YxFHoBEHo3m+Raeoam1zUFAKmmfDnqcM/sAy/IfE7WLG
-2xnpcpA9DdlSzax+jtxWXMY59JbOfo6CicPgQXsUV9GhF6H1bpA6l7H9wyf+Yb7zGe9B8BHw
-rDIg6imo0gP+92KmP4GLP+HSL4yzJ9x8BkrVgN4F3H/+ZZ7zJTpnODSYCXLmgeJxzP9rbOOz
-Xjuux37qFGwB2nMunt1MqDAVf2Iien1iuC2cDm5Vp2xfuBmU7kavHgIHypnZhXVYAcpnsAYZ
-z7PHhf/jKR96XTKH1c4i9Lpq8Ms/zOOqXQXddfxd1o/dGF0TPKQK+OlaJZdwnHh1sKLz1evg
-dSnf/gVMfsTde0C355HvZ8PfWFf2Ryu+gnxXZL2dCBd3Q5n5cH44uqYPXkM3rHZrxtmGd7sx
-oz7hxnAMntJ2VoHqh5wZzRgN2grj/RTjX1FWEbmDV+DcV7Y9qiG/i/lsRa42u2JyDVsMxV4U
-BX9POGLpHPbjEnhKYBzpmUlR/OU67jWUFazHOnYjFfc5DW3Xs+6Z7b5ZL8KpHlDqddCjVdsb
-6KyXeZJqQDbA21R+VE5wE3rP9yCWdB88OOo+1bpWwxn1h/gV7vRxdcMMeO7V4X1X5t8Xnfor
-Gvh3bEd/MNqTp7wOlhXRXZtxRQXaFf012BSuw5Jc4roHB+PRCyfQMGvA2D/4Sx+gPyogv+dd
-bfFBOIRrNLScj2yvYEyL8QTngtRF4V/MbKq7Th7FMuqEeB+yvTHsjeb7Bmn7gRnLjvaHm+8h
-K02R1RxQMI6V70HX+v0YCg9DJ83jG6tBzHJkZCq4/B0ufArSXgRptUC0dhovuKLnFsYxCpR+
-wth64CG/x++/OkZ8Ddp7HXdeYenvAqU/xNYo8+I3LJSur9Fwb4HVZ5CI+t4LDRlPPrD5BNRp
-iwx3wRd4kVcdWL21cj51V6438Oxeg7ut+FwurM8+ZjIEO/MeeqWbO2K8GXzIDOUj9cbD/Yon
-/Mm4F3i3IQH67cKjncIsvgF93cJ0wVPQsw3YeB/pGo8GigmXYF138s7lUKv9B2E2xw7dRVvf
-QYLVb+w8EnwQ6d0GRhWZcJD3VMPyHnowwvEse5C0tVyKJrjoOtgF+VcBvVqFtX5RZpAebN5j
-ZA+wuzrpKMpnK4ODWuCwAR5GczyN1vY4vmVuiuv8D45eArPpwE42r+xVPVhnEIqb2wP+tqN7
-t2O/tmHNNsKJVdgzRUQvdMZ1OccXf4m2eZs79QAbb4DT/6H7v+Epo5CtrUijOg02csXcDXBq
-WjgeW7oQiq0HqxuRtwXQRHr1DSjRkKcXQbelRoIlgTuwsEt43lyevBCdtRJrpO7Y28DldrTn
-DlYBe+DYAUc3KsKoL9jszew+Q6d/7Ephm92hJDuzPI5HuhDdMzVUn6MhSPB0kD0DrP4Lin/m
-vd7c5W2er9hN9SrIHSi6eTPonIR2GQ4Kpcm/RnZ7MoovwingVZUR/sWGjvC5VpXgV2jyB/pz
-OGMajS0UVkd5T67q4x3uXFCjLHalHn5dHdemrG8rWhh0Ph10Dr4Gof9i20eiW790/eko0FnW
-NjcB2VoLHwciBS+z0urIPF7BT+oVfv84juQJuFIIfmdBxhIY8SYu9c79H9q0FxKtTDWdPJ1g
-FjFI/Db+sjVUH96t6NCUcKsOGHoV+vdxX5iDSPHxcDIyNRvpGIMMfsqKvD6SndlZfso8kfed
-hD6+gx5LxSqkOHOpDQWr809xqPdYR9yAkiHfycl8izkvJA5NOh2q9MITewO694J7Q1z3WJqt
-3ePMmhbuQlgWG1IfLDVgXNWhX1EokRHk3IAfh1wv5U93NzzPOkXyqJp9Ot2oyqq3LKuayu4C
-MhNMLIZSC8DoAsfnXwgvI595wERzrvfQID/AqZHBSFfqW+O+6vfDWfhbX+CFNcCGZWEsqkeh
-/dtjzGclOm88dB3vmkQnoGMS9jYvOrEUM1HVzzLorHrM6BX3tF4A0iZCQ1U2+s/rtgw+dS/g
-mLnlzq3uCB0+g49/81q1R9S7eDC68is++TH+8TtQrzM0lA+o7kDxjv1ZyTUfDkwHkROx+qPx
-e9QvaAma/Bx6NY9PqYc6G7AR3mxtUNQAvdkae/IsuG0W/A3nVsLRG6Hy3k8znptcGZhxKeiv
-ChSqgPcbOvRfbP4oPMBf8Wa/Yu3xAfjt6N1snfq0g6/10Qx10KMt4cDz3L2bd1b+4fff4cz3
-yOIfzu+55tzlRyOfAAZH+5R0JL78ELj6t+u43EL73IfT95GfeMeavI/0DkCW/kZqp0HXpWBz
-FYif5boZK5nLZu5+1hFld/Cu0gR33I805B6X0cCHHTVUAgzmCFRnPR9cLozeyckrxa4fQW8q
-N2G8Y3K6BD+CjW9Bz/fhu65vN9O+dgs+29hxih3wD94BG9r3eMEZVorYXsqTlqErVadqJlIy
-kadPYkwzkYXZ/j1voP3IQc6+ro92bIpmqo+lLI1OS4u3cMb9EluhOd50FZ/+aJQfwMZgLN4U
-PMO1eIgX1PuUJ6vTSiXHB6XxCUIe3ino6KFN6FJFMGovfiz+72Qu7UnM5L3ZcGM+eFgILhT3
-PInZjeWa4VPLKvh4abAn6lWuvwyEBvJCPmB99jkWazA/VyEvceFfIPEbbJLqaKgWWVEsStZA
-0eb1sGEloFSyK02fcLeZBeEyNPpC6/Wd4Rz+rn2F39BL/dFaP7iqR1HHxqgXjHA5kr9Nc6be
-UaxrDFyVPU3vffwy6IbG/GuHpWmFNasXfIjXORKtuQDeTOLdzxlTo6AF/H0WqqqGX3dQ08kx
-VzrNG8T1A8jqx1riO3ToH8jjGLg1iyct5ZmrnNO9y92/BrtX+9ZwKK/lX58FVSnQCbm4a0Ww
-18E1v7QqOIyF2RXONUZHoaUHI/tj0HBLw3dYoXVBl7WAT2WhjSLUj6MNloAA5XaP4Z1F7sWa
-5HPWBMcCX3PGyiLvDOWDH7XgZFfsqWJLv+DqCV7fQ0O/zxrwAxD9GhxoFqh6c2PvC17hk+pd
-cYlPqdviPFZhOisaDnenYUtXgNV16DRhVl0ZFcO4DJzoDGkRT5yO9zEFLi51b7h9YSY8hKrM
-pjkcao3v3glf6e2gLx6iokAXoa92osvPo99VQTGvV1K58LhCaHTKfdW6cc/nvfe62LFzJR3J
-v42Zr2FMy/DEl3ItRn/PRhNN4vX48EnGWgMaF0ECk/GlD4Dmubw7ihXnUDyqUeFQPjkBGk1n
-FnO5yxy0wjj0WX+49CJeTlUwqr4jSWgoVdw4zj0PeI8ib3DC1uyeI9z3oX22olvXo3+EgAVw
-fCxcGAi/erkaQXqupPBzx7ZcC+WrHOR7j1ag13mlncCMQSHmXg+cPh00B4Pv81qZJJOw8ZPB
-51CuPlydwWhN0BvNGirC1bZfx+PuitQ+h8buAn1fYxX0Et5VE/RRLqzbVSRmL9d297Qdyesp
-3nPa4Xr/SxmLup7tZhzXvHo/D7IPurLap+BUtcRngs1l8GAZFJuHNExGmv/BC1KPxregSy1G
-ITt7CWrvxXqsdS43cuWTxZRo2Qc8LQJrFxmoWtk8NMwU3huFVvsjrOtYxr+YwzjkbT5jX82c
-doORC6FWZU9BmTLMWfVMksFnPOM6iwVW/PBStNoiPLX1YPQIGvmso6nSgIsIkB+BlKTCv0oD
-ddLyewYkJxPUysD8kqHLZefA67SlDFJXA7+9adATGqp6TT/wOdR9n7ox5saOz1JnOcUXVcd7
-aYdN7sKMOvu8X31XL4OP0+jCLVw6x5qBFVPPyi2MbSPonocWGWlL0YgxleMzkYwz3lWKLsOd
-XHxaMc4DQa5iK+ea0hPRm/+gv8d5f6uve08lQbNo/D71dWsChZ5Gf6py0ZOMsCj4TMdobyN7
-l/E6LsLXK859WoXFnsU1iWf+DXZ1gv4G2ut5MKi6d31Bxmh3UDmIN3sSbJx33J9yOTMjEyWQ
-iXLY7qJwJG/wNtbjW7T3n2jMoe533YHfOwZvBa/Cp36siP/lExMZ4a9okjehQFvm0gYPSzsp
-jdAF2ZiXumqvwCPbhJ98NlRVzD8Z9b9I61hkahSyNQIZGe9Isyvea84Eqqqi+VSRtA93GQuK
-NkLXY9ztAJRbBBZ+Rz4/xvd6iRV1a58CRqLjKmPd27gi4DkwetrRwPfQlRfQlfIqLjrWZzDP
-GcqchyG1qtjzJ7gcgT2d5NhGVaB9mZ+vIRXv8f23kMEO2NMqQSe880/47Re8tH/A4XhwMRr0
-/8b1sbsunXasmmpJKpO9IHPIB+pSc/ebrFiuI5HJ1trKdN7mSi3TXBNM+RE6n2nubNX+PP99
-VgvvYx2+R0PqXHcPn7uBFk7tTJ077qCsjFztoL2IPLdjXA3cZTcTmj4eXboHFC1GY0x1Dmyx
-QHk8qmH9EU/rB9rHIb3rXcEmJ/RT/chkkHsSis8Hj79iqb5hTTSAtfowdOi/eFiqzzQfGh2C
-M6kcU6KTpbvo6AQoHTLnNN7TLIfsKO+pAPYsXaCzqovOxYpkPHm4SxSeX2LYG/z1gPsd8Nvb
-4N+8yPUpaBwCArRLtd7ZXhmhaWpXKovyubuquyqKtiLPewmO92Uc37ovZHds+7tcfYOewV+s
-6acgO7ORmnH4JD8iudqJ1O5/J5/bzGaE09ANyhBY7EoY68DDXnB6POzHyH7n0u7tZEYq7TIU
-HfcPuFkZKu9pIt8e5Ajt97k+hVpfgKLv+cRfWJtRPGEET/qZkfZFp32M1/OG63c0ftz/uqR3
-NHcgdZuRwNXoqWnc9Veuvkjx91iRMWBzCV7EEvg/FiwO4Poe3TkKjbSceexn9qfwMGPROqnx
-byois53RXD2h+efg4X9o6TfQfIoX6w5/usCxjq52dRqkreGayaV1wAT0ifzRiUjkBHee2QxO
-tXe+A66ptuIE7jA0/Ii1yKfY88/AQy/k5n9Q4EXHAE93J84okB8RqAdLNHa7Ejq7ISPtgDbr
-yphegg5d8E6fYSzKNGgC9hpgc+qBz1rIRyUsmTqBFEUzl3SEx0h3XMxmG6y9Du3QvQw+v0O6
-/sGOz8JCLUGfLuNTi7BH4/FBvuHOHZF/1bKOxL/LyM9otERZPP6yoChPoLPLEkhSPSjXCuvT
-AjvxBNpf8Z1pmWFi+AvU/x4ufIle/AxM/g/N8R6vP4FLP/NzBlp3u3NOtoPKzfBwC17ZHmil
-c4ZU8LwMSGvriNSI4DN8nU/wRaUzuwafsob/Hs9zCH8ZD9emIHWj+c4vSMknSO1zjLkao5OF
-fuhoXVVenssTJ6Kx/wGrI8CkonP/5jOj0C5j+DkJuqvS8CKwuZZPKprwIb5JMeRMexDtg5/h
-/wA02TB8Tp1xqGpkdqSkGGu4QsGXeMPdfNaRnVVP9kCVIIJAMUo3nKW6wV1T1YP6DE+4jDZX
-j5VSIL+Dqw/3B3F/uL7Gi/CjlWu/34TCaZhhDhBfACtRAlmthO7SSrUuVwNXO84QtOdpOtt4
-xxK6FyuiTmPLkNBFrs6RHc2TGA6ACr1ZF3yFN/YvUrqHcaSHazXhfSe06Rug+X8g5jMkUTv4
-H4LNV6BPa59GrQELqj+SGu3xqB6qqi7s4dsn8AZioU8Cd1HG+00sx3muA1yr4eFkcDqQNdnH
-YPJNqP0uKP8KVP3jChGJ0EWnFEf4xG4ovD3sh8SNQzaX4jWtA6vLuaby/m/M7H/W1rtZ1R3h
-6efdV7ww1kvRo1mhTmSgjiC1HAWXAS/wPp86h7e1nWcuBJuj4fLPzKEvT/yEv32Mzu6JbPRC
-Y/XHuo7yDunC8Aje6Q2fkG7A2hzG0qju/T38wrQ+I/0PW6m9MOmB+3gZmb1WrIhHqqzQ1sFY
-7NwSMDofH2AUHPwe/vVCq3/g09MrWI7LIEtaeTcWbQ1ysAJ8rrcspECqC8KTmj6HWgMGNrjL
-U1os+mmfyq1Ex+wLB7kXu6LZooPeWOCvXf+pBZpGa03171DH9N7Q4y3w0Rq8CDeq5lfPdk6x
-o2exBAe893fStnQP+DzP/FPhd5YCNc3hUlfnCCxCb23FQity9hrcTmQOIWNMgSf+KI9fVjUM
-lRuc2bVlizijs7bXKNpPfYjfd8s1GHRKVRubq7ilsmhkVefOFrzi+iwZWDmmRBsmgNTT0Ggz
-Pu5sLMJIPJjfsQi/InmD0Z3j0OWLkZNt3OEQ3zoCHU9Cw5vIeDbmpDhOnTrXBaNVuKp53/0S
-37qO13oBOdkGVqfZqy6HziwBNosHL4Ptt8Hmd1iR2WDiNBTJzEjlOzwDr5SX+hue6lT+tow7
-rsB+zIImqtf5kWtRHIUuV9HGiXAkGbkRfRRzm82rtbp4Fw1AZlX+lh06XcXmb4TbU32end/6
-uy/j7c31Jcj+PgzA63G8vZXhONbLa7EsV8BAOjChSI0UyMYF8+4Mmis+VN7BGDA/mVEshntb
-vB6r5b3sYqzcVevpJ1ZNY/FGx+B7DnE1/ajgO3jYy6vaBL51J5QPWBBKKRpZq7eryMANKKu4
-obLgoBnPb8/IW/G6OvIahYRdRJevdI1LeYYP8UFSYuEeokfjw7+QoImgfTXrX8XWnnVXyhJI
-Q1moVAPMNPbOeYBtuwMVY33+2ZEnNMWLLAx9biGRu0C9InrWs5pVN/BNcHElKJePuQb7qnPQ
-E47Yre6YzwSoqtonifgJ2jnPA+6L8pz8jkcsAGKL8VsJZ2Lk4V9ePqWcp5Jw+Umvowcw0//B
-/bfAxadQYxiSsYk16j1sWxEjbAkrm4nW230ZaT8076fQopsjh7eDrG3QcZdrrKlKpXK2joBW
-aV7VMtnJ6M7yvJt8+gZ3Ouu99/eg0zs8/yX0ZtvgdTTA03CkFVrgVZ46kJWhanLshecJ6PBC
-+JPqFdGH5/+F3hjJCP/mucO4hsKvQdz1OyzRR9iRF5l7U+ZbBaoXdSSxaibFgZhY13pTTqfw
-Wc1V0ZQ3qwjyitiQauiVOu48N96xCVFYrOusRLZjSeeiNSfCm+kgZblPOGK4jsEnneYfxP6t
-Q+/OZJ6joOsQR0NUAaPKK6sIDqoxshogoDK+ZynwWTgYjEUdwM8PXf+hUNDOkQ0FeF0Ea1cM
-DZYvKO+dMPkpylDbDyYOuPJ2dWigqr9PQpfyUDoHMnLf+e0pA+nvRcjUCND8PXLzrXeg9jGD
-I/hqZxwXdhv83uH/yuC65apOxZGOalzquP089q8HT+ji3aWVPH0tMrwGm7DReQTKO9eppvpW
-rHZVkKfQ961AX3OwVpt3S4PyaHdbzOF4QfXSKOuztXjwdM6nf/Xw+BSTWZyn6a45kOD0jnOo
-5hjYpfBBORU/grCvQfr3cFH5gysZcyyzyOdckU2McivY3INnvd9RENJfHZDd8ow6Gz/TQBHV
-X4x05E6EI27Pcx3yKZm6gUTyzQL8XhW5bc4dOrrKzniwqZ61r4H05/A1XkBmP2Cmv/G5BchJ
-DLS9h03LDh8qQalWcPplrg+c0zQDL3+hu+pNgqJTeO4wLumfjkjCE4Fk67LrDebjTsW5quK7
-1vfZV350ZyV8rerwpgp+ZxXruI34GmuY7UKeNAm9Mgb5mIElW884jobSkfvh7lK8879B5i9Y
-2WGsm+eDzl3w/iy6Kj78BgooL+V3kDMBLsz3Dk0FqF8Ajzcvzy7sbMKPkZ53WLP1wOK/hubQ
-67dA5PPo1gZwuJIzRgLHkzTH0rRh7Kow2xTO1XP3va3I2SG0y1V+3oUX8VicC6GqtOkcfKnr
-Wly3l/o30jMdGV+P1T9sP2ELdnEn125X27jCZ+Ls2Vfijk/jOXRE77eH4m2gSTuffR4DVYe8
-4xRCC8U9nnTc5hOOKFEWQhJ4TQ8OdcZbmP9XRAPUhSOqw1YLrBaD2hkCZZQ25Xt1vCO/zPVc
-n+FJTzte+mSo8+pd3F01YRY4j12dXJ/EUtfEkyhtP3S/850T+Ot1UHMZT/Uk1058iqUgST1v
-pjkirwBUzwDaFcUc6ZX1bSzJXeat09/7WOXrzD8WKdZuWiko2s59N4dztxHc7R/06GDQ1het
-9ype7EvYwz7YV+VhHYQGqtGhaKqSyEATvLlujFb1lN9zxYFtXEfwf88hN3Hhl4zjA+fPhkhc
-At+56LpjTXm/PVh9ir/V5DPluMrA99JQMLd1ZzOe8Cwz68wTOuHJtHaepOJCtrkyXhyr1i1w
-ctbjfZUprOJnwOVp4ZJwPO9NAqv/gdFjYCAZfy8nur8Qcq+atEW4XzG0Qwm0RSlHRGRHf9Z0
-7f0meJ4tQeOjLnzqQ9HQlbgLBOor3A0OdHYXq2TmfRdJjmOEqpWrnblYkHQF1J9lPidc91P1
-Ci46Vj4jdI5As6nS0jnGFeMOEBvCOXgoI+CM8tImeGaq+XMEnG1xfTVVd83E3SqAnpZQ7lm4
-Lktd3xmdu0Hjevd9jAKzOcFrDnzqzM7Gz4ePlC1Qr8qyrvSYmSuvryd4XZe/13XeQUXQ28F5
-SPfRM+d5yg7GvyjMBcczc2V0luhm+H4CvFwDRwmh1sQ6bTjJu4f55FF8E9VKyeOarKnwmFME
-T0OfRtDmSd7Vbm9Vx9OeQXcqEvcu+HsI4uORwBPcYSff3o3luICshsxbUVbRjtzejrQvwW7I
-U/gHH/Rv7+41ZR1UH3+zlqOZP4a3w7jDBncRjYVih70nUAvNpu4fH0Kl3s4Q2u/dqg7wpTuY
-/BRefstYezFmxYA+yU/5PqrnWo2n13Ud7nior1ievNA0H/9XfG5hR8DdZBxxYFN4fYA+vYHm
-PYKN3Orq0cfg8k6vTw6Cz5XozcloS7xxVtJzQKk6bKwHvaouoGqtUXjoRVyhf6UrMariSC3H
-3JdEQz7BughvxogsiW4p4GqoqmJdFe+vEtgtgXeay5pHo+mA3HfxDuUFV1vTTl0LpKems7Ri
-QU4qcK/KWLmxHtmZcToodpvRHgKbS0DnOLA3CkswwfFhqiSQCvrdBgFn4NNx92O+zMhvh9I2
-VxyJovyBCrYtB22FKzoCbK91aH5GkIsrkvfSOvo9lu8opv+KK47XBEOVGHlpVxLNwbzKI5Mt
-mWsX1xLKFLRwRZI9zo4sijUtz1UBmSmEtUkHUuIdb3kTDCQxriTn4yve8rrPX5OhcCbwrozb
-7NArA5QNAtUIqoBOLYJOym80K4tuL1w87mpoqvaYMlCNufNw9QLUuYGuTmnvIgaPaR/Svxot
-MN0nYM+Bz6cdj/Kbo4crsxYpzs8s/E1dSM+hfw8zmj32+xVf1pD5qEpBY5BTl2c2hBrt3bMg
-f/AZuucz7OQbUKQDY2jM+4phaQ1vOztCPB3zyOI4yJLYVHlDuUBwVueD5XVm7X5mtRVub0c/
-HESiT5tX96HJebToNq+Lddo9n5XSlHAAa7cf4P+f6J9prJk2gdSToCCOvygLMC1zzIf1qoA0
-1bcWT8J2ZGPlXoiRlkWLVA1auSZrHSjdEIw2R8+05rfW/K5qf8oQbgG9tfvVElmsD08rMJ9C
-3ElVsYqBy+LMN3egqk3pXI95v8/AdmKD5zDqf9FCIx3JnAbdFAUu8z2uUZkFbKs+RhIjT2Ju
-Ac94yD2uhUUd+7vD65MCUPwRXfY5n7IAHFceR3aoqysfr0vw2fJ4gRW5W1k+o7znwsy3mO2F
-epBHMjedj2jvogZ8aoH8dYQDHRm7at3URRqqcOey3KEE/lshcBrtU8ylaLdl7sV9G9/qGrS9
-gyepveso5Dg7OjmL66kpyzwdcp7ISNXd5BTf28e1BS2/nvtsdpxpHlduOo5ePRWqJ/E9dOBl
-eH3c3r1qXzRkFK2xD53dj3MClutXV8+vw/osmvX73fBXMDkTX2lHuMF1+xJZIaXnWbm4gzRR
-Ce9hJnC3u9Z0HZ0x+Kgyjbq4NoDzDV3pJx+6KBeYzA1e83MVxXYqRqQw8qv6WklotBuhukko
-HkI9qK7iragPyBkocsh1CQKwmgwm/7831UI05VDW6F+zju2FZvoSXapa11N8Fr6G/yvuZhXe
-gEa/Db2yHYuzg7nGhN+io0dBzylwZxxc+h1+fQ5WX2Vk7axfqvGXqnyiPNq2rCthn4Nix8Dn
-MWO0Idisaq2UCB3ivfIuhs7I6w4r0mGZeY66UQdc6sm7zz2tzjKqREaaB75XR6M3cLb6au6z
-Gd9gv7NF80DPLM7WzIulLMQTo+Fmdmx8JuvHY+jKXT7DS+cOpyu9q5YCXGYxmuaDjNl8fjHv
-b4GWR5GISyBEUTxpHencEDQ9xyzf5HrHtRvqI4/KCm6MFpA/WpW7l/NqbDVzW+POP6qYkwEK
-pmE0qkwbAQ1SII0pXIdeklkMbpbklfpJZ0Crqu7JZfh5+nF/ZfUO1Ty1ulvr6nqpkKoIV7q9
-yiWUqk5KSSiqjJXG0LCBK7MuY0QzsQOjfXKbi/VZkuOp/sArmoQuWoUuOOC8MMW8K65dubj/
-+ZRT2XsFmVt9dGBndwNpgO5sFbwC8rojmfr5Bnx/E230Cl55Z9ddVa3HLNh+ZRWmtGXPxshC
-Z5+patNuJHQ3GvOQ839SIg8PQkWcHTLaDoDBVejKadj38ayMZ4Z94Hxv8Nmfn3+B2XEgeL6j
-g7eC+e2O+X8HrPyBbhsBqv6Anj9CT9W+/4vRDMHafQt1X4K6tbyyUCSlTruqQOsn0J/ao68M
-Siqh7ypYW52AzqrGqdqut0DAfV6nCeQJpmHFlww31YFGq4D7rpa1HwnTCfUeo0k7Knmcz7QH
-LBwF38edLZEGBEYwSmXfRdqzVGW4SNcku+uTjby8qyq4GeFyKrzGJGaaGC6GQv+5elRG1i6Z
-8CLTwdNMIKyg8wVvIFmJ6CCdB6V29+8W0L8JeqMWXo56ZGfgtxvuXynt1QgpqOtsiR1o4dXM
-cRHjVm7QNucJ3mRWN3nGDfTeLedeV3OvsvRIfDo0qjKhVOU+B5+QLquMdJWzDO60B6uVvz6T
-lpmpf1Ia8J4yUDVZ9U9P6RrNivxXbPE+tNejaOs8+KOZsev3sUhnWYnsgd/bkPxt8Fr6aAU+
-1FJ8wA3IxDmekRY+qmp+SfRNaXy5KiCzGah8CRx+ws+v3MW2JXLaGn+vE+91QWJfAKNtHKFZ
-FC2rrLs78PYsY1Tfh02gdDn+2EKuJa6FeBcN+gD5u4kFP87zdyI128HmPrR8TPgj17dwvh86
-agDe0t+uXXaM7+x3nHtaqCIEdABdqrX+E5QYhob6F505FgyOxuYNBlNfuc+1so4eooOyYLPV
-l6M8NC6JTc+NXcoAn9KxJswCz7IHiom/Dw0eIFfxrhObkddZwHSmQJWVc2AZMvCJCF/JfDId
-OM/F01V5pYLje1bD1VVY5I38bTfUP+R93OyuSHDMGX75Av2XzqcDsiO7bFMyO3N7E59cwO8z
-3Uf0uim1zREjaeBnGu/o7PRn8zt+6rgzq57hfi8igV3QDfLBO8CRFmhQ1S3LZh3alDs0AY/1
-uHMV1yJSd6hx7ntwHwQkoEFu8dxbj+vP3gbBt1nt3mU2QaA6U+V97pXLlUEDVwSN5GcmKJLZ
-vFYVljioc8O005rpHhpJGSk5gkuORMwUKEMxExxQfOFdV89QbYoJfPJHfv8ObTkYfE54bDUn
-8e50uL3WNQY28c1tPhOuiOSUw+8o50yDtmDw5eCt4OPgNfSTTmPKBpPA3xi060DHYDbHtjRG
-UpU1WxZdU8yzO4JcbWfMOo/ZyNzXMJ4lXLMZ9WxGstiVlw9yHcf3jAtVjflPfkrDDwWv/zDS
-0Wiq0cxCcRnzXNPpGPM57N1gVQB/Bpl8g/n2Qqp+hHZ/oUOG8XMQ9PzB556q8ZQFycnL2HLz
-Kg2fvuFaguo5dQIqqrb8SjCqeucLeM5aV41KgaQXgtba+a8DBksjc5I6nYfdRQslc6nPnGoi
-BoFqwF1HA55Ar8iWrsXWr3Bl4yq8rsP9m4KNBlyy+xngVwI8Us+lOLh8AVwccC5QWnzqzCAm
-EoxGoNkSkNxYdzdWZ4C5jHIhiF/BXTYxsoOs5C6FzyN7bzjWs2DwNjx5ASQ1RqsoClG15x86
-9+4V5KZDMAnf7V/v4iiqLoMz+Neh31Y5BuC4O9qldd2ZBEfhqJtnFHSLcnZtVu6ew1XBK9ju
-p3H92rzQPhraFHSmeJLrBgVQ4zp6Sb7oXrC7EdSvYrbaM1UlXEXX7Mcn38MndqEhFQd+Es10
-k0s1nySf99Fo5/FG9/CJLd5djkVLBeiW7DylOHJSnWc2dZeYHlj0fuBwKDZxEiObAw7ngM3R
-6NZvsPTdkNZG2JZyjDw7+usW2NzKGCYiR4PA1CBs8hgkYCFWcT2ysNma4Toju+qYyiWMbD4S
-pCyV8dDrb0Y5BI4NYTwj4cxUPrcS+qniszK+c4NPdYBRF5CejPQbrv7Yoe+wwv3hTF+s0tuM
-vw1+Rg0wWg5vqAySV9xe/Am0xmnucwpdrBO5U64osRmsbg1VwTYFn4xA16W2VjvkehC50aNZ
-4VIGNHBmZpmbJ0S7xmx9r1EifUKT2XmZNcH2o3r6M7Gr/4DPUeBV0SSz4LxqqMlqb0dDXuRf
-Su8n7eQJa9zvLgP4S+uagru8lxUiwSGUUxRLOnxQ7UMVBlU1fLq1I+zC998FE59Dg74+kaiO
-/lQMSksssuqstMT2tnDdsnl8awxU+BMJ/4X5/MWl3PlVzmC+5e4dAfKXE5qpgkQN5K6q/cdE
-fIrUeE25+HsR0F8QJGT3KWFV69fAudTV0KrFXAlYuePpmEEOZpKXWWR3rt4W9wm+hO45DY+P
-wO+d0H0NnFWt7gVGwjXme8PWfIMtrerxXERuroSqei7fQbnuqilcGnl5Egv/lHt+f2F81g0m
-8LfxoHY4NBjIu1+wcnqLMbeCZ1r7qUPgXqi70lUCL9suz4DrE9FKir+Yw7hWgYrNeBubGdU6
-qLISfK7wzvEDNHoQDGcuP8GRX6DbGPC6gp+HnM2Y1tFQmaFLCZ8ZZsHvyItuL4rvURqvuDT6
-oyj6PAcyk4JL9RMv+4wpF1cOdzA6iOe007WucuMHPcCXUO/N/YxJVc83OT7pFiu1++Fin/Zl
-RlPn9ro+A3SJ5N6K7ijlXrxpsKe58HrKQZU6rh4e6549OhN9AntUx3UipqJtB4PbP1ydUCty
-5VVnC7S7o3z+FMhbpCMsVZN3qbtgPdIh09BCU/mpGPdFUGmjtXsy4y2CnLVjPp/xxAGM5Qfo
-8AVU+dBxUqqYXhIZqsR4q7pHxnJ0xgR8lcHojYHM6Uee+Iej5lMgGSlZuUR6p0X9UxLQsap+
-ng0kFGfWlaFzZfeVi3KGYjRauQI2uhnYfcY7pZmZf1aokAEOpODJygFIa20q/2YpeJjKDCaA
-MHWZG+adwgvYyl2sK1Zis1aA2A3OTLjLa+0xpUCSc9qbl1ekSKRk3k8H3XK5CnoWaF0JSWyO
-Z9MR3/NlMNqTleJA5/ooXr1yMAAsvMcn5f/I5hW3pUuG41fB5T7kRBEfe8LJ4HAOT53PuBTj
-uBYaHwar19Dg8VBd68G1WJep6LMJYHomun8RI5rHWCZBs/HO486HXsvjyMISXJWgVBV4Upv1
-TzvXYS6PnFQGn8XArU5Yb2JdL/m0SxU9qrpe8Uau2aBnjuvX1HIU+wWs3BlGdQL9ecHV3Xb5
-hE6xfKrsrWhd2cIoPlmA5xdHexTxGErB/YrwUDFJdeBaZcaSk3/x8GQ/Y1+JzpwNFyeFnZwP
-PsbR4IX4e7ZA5yMJ3D+lK7jcRhIOQ/3VjkouBDYLOH59GjpkOp7QAka3yXWE02M7o52Tdw8N
-fS/sDgo+4y5fc5/PkZt3+PkCd2wBPiri56h6yBlr5QB8PkRvpcTGR3kci9DES03bXP65wzEJ
-8tRzMBPV2RNGS/j0uDAIVIas9puyue+H+okGyEEadERKrOwdr9ErYD3KQ/NSvK/uErEgbQVc
-HoLsa03xI7pqODOaBNenYLvGgoVxUH2+u+to70IV0pUrtx1ubwOje23B5LXn5qkZ4XoKVj3q
-mVnQlSY/A5mfBM8ilc8ziteRStU4GYS8/OFTz9vI0DmfXkehA1LAmZuu+XIVqsaFv7v+4pnw
-B/A3yf0YVGX0BpSOAxOqG3cT7ZiAnrgXnrCuTBfMYFSyhUvQdsuh41JnI+RnpAXhqSoy5Tc2
-a0GrGoyjGjwRrbQr1taVeO6H6v5VDDrldOc31VjfBS7XuWZGCa78tpNrQdBGru3e81H9kCsg
-QOdGR9G6B8HTVvfBqMM4VB2zEp5CSVAZDQUi4VfASO5Cu3j3UqziXLCUaNkc/LUk1KiEJqyM
-fFUCGzXw+xqAvGbMpwHYL48fFAWyFXF9Gn7uRiduZFyq67YE6ZztTkhH0OKbkfXtrjecxvmQ
-+dxBIp5RxvPzJne+HL7AWvFL5vALP/syyo7ct3SgFVxGPpWFOWVxDNwErqFcY7HrK1xJTh6n
-drpyY5+KMqOyjk0oCRajA8X/VHYHh1joIFwUQGOVRxpLQIHs8D8STKrbQhPu9DJS/QqvFQFQ
-wB15LoYXXFPximvCjoPjv4ONX9BDw72TpLNDnb+tYJbLWAkudxXGlFAoC1cmrwfP8lN1KWsx
-kk5crzOG96DCe0jA2zy/B7qqM5q0DT5dI9CqDtiFg5+Yt2K0v2Lm3fAsKmHJItDH6nR7wL0W
-5FUcQp/HMJ7zeL7XGU8sdFa04zZ7e1d5fQasXnA3wkxo3mh4VhkcNkPDtYavzdxxah+cVwzK
-PVczVK+TQrY9xcBhBfijbhmqBlPNOYuqyHkXnXnRNjCTd3eUy7AdrbUY/k8A8f+6w0VOaJDX
-XR5OhFUdvRrhqkNn4KwqJq8G5TvcZ68ZeG3F9ZQ7bYRgrzCUeYIRPQFXS7lzrerbxoXKv8wY
-pPWu0WbuOMPVOlRRs6F7451ASpQLF2N9HASpjG11oz3FGBRLscGdrO95t28LVNM5lHpmRdqP
-2wPnLiHRadx18YDzzaq6+uh659/2Rud8zKc6MNoS3tW8gwaI4FkZ+HRmMJoZDa3zzow8Kcq9
-fBKQ0BDaJruXTDH3FtVZdqrgaaTtFXDwHnd5j5m9gYZ+0XvgVfFwazBPRQaVh8aqVaj4D/nE
-T4IH7UWo5885xywcdJ/encxiJrxXt+MfseF/uzbrSu/I78Lv3MnvR/mEsq7UJ6GCa+kFPKUQ
-lG0Ghd5FkgdA2yGMb5D7d+bDoymLJ9cYfPbAin+J5PyI/ewHLnpB7Y+cS78Temj1rzGtR17W
-I/NbLffq3LnI/udWdPkaZGUtf9+JB6XMtwuM+hbvpoNnZR2rcQMJvIEkqlKT+tKfxIqp8twp
-rIky4S/C97ugLgtYKg0la7lzUQI8eoj0R7jnVE6fdlzl9yPwcLP3bDK61v5fzPc3ODEI7fg3
-+J3G37TDdNxVau65Ant9LG07qPMCVO7OrF4HNW9Bl1dcXz4Cqx4FxQqDZ3UNrubomBhGdsb6
-TPuE8lFTBqrpVBgdXAT0FHEmxVrvFeYJDtq+q7bHbVerzsVsK7maxB14oi5hqhJ1B1omIcNp
-GV1WR6pttJTddlcf9RZQ5T3FAhdGwxfFSpdlfV8LPdHY2U3nkJtr9gfUiVTnmfegdcirZPfA
-09/iQ622412fqgSU1OlpS58LJroqj2Jmf+LncHA7HAr3Rx+/jF6tAxUK4ukoJuqWu3jlZIYl
-7TstQttuYDzq2qk4hXXgbxmcXwwSZcVngsnJ/DaFn7P4u7K7VoGH1VBiFb62cvb2QK0rzC29
-q2LGul+xqpt/yjj7w9+BYPIHtPvn/HyF6ymsejUQWjToDgJe4nvPMOKGoFo9SSs552oXM1zl
-Gu/pAnnB2m+dilws4qmrXPd8DnKyyBEVex2lctK4rAgG2rvX9mZk9HT4PndWF893oFFXRtkE
-7qkKpXoVBdBEUp7kvblSPF8rjZzumXAG2p/CEz/i/V9FJarWajZeq05nZribD5wWdS6Dal1O
-tFd2j++c59sxrvDWFOw8xzdehvOvuEbLASQvFtlN5fVPZZ/aZnZ06zXr54o+X5b+Pe/usqW8
-M6WKZNJaqpCguPJIMJYKS/XQERUPXTs9ExKRDZ7nYkYFmW8J7zTIPmi3QX2jj9lK5vUe4mXm
-rwzBm3Bc2UrJUDRg1RGGuuZ4pz0NspbR2XX73DlTOjZ1EPu45u4RrMJ+RxMXdGfTy2DhNthN
-jZQXdOc/9c0LAu3Yfc7sfob2/4LuKVB6LGP9Ccl7i7m3Ap9VwWd+x6yU4P5FuKcqrVVCPirg
-meXBq7kLJg/C8w2gcj3j2x6OR6JU92g8K5KJ/D7WWYgnwxGMYSxjnc2YVjl6IdESVZhRt0En
-vQ8NvoAmX4IBVTj4Gtp/iVz0RHd296lEQe/VF8dDzsvoMmPrU+GFPASbt0COYnF3e4VYJlBe
-+2SkfopXRCeRkpOMU9cR5GQfNmsntN3ufmvZHJuyHv6vAQdr8RK2u0es6iO/yDieBQvNHQER
-DS3KOG/hrrvBVwpOOTc0FSO/H6on1RXvBGd+jIQ00CuVu9dvBivqNrqE8amuvTpYqqrtdiTj
-HN9LQoNrn7Y2SO3IpRjDbmikTo4I2w19jrjuQTV0irKrUiDP170PUAAkl3IvOUVq7maFfhi5
-Ue3wWPcXiHCnnLSgUPVvpQdScj0EN4pGSwxVzTRtoIoiJd3LO87PeQo+KE7uST5R3v2XlDtz
-E7Tf9XnhLTTfCWe9HIWm59A/CfA6ZFWZ5Drx86Hsfz4NUTeGTM4VVj26jYx1C3fbDpb2OwKp
-nHuGpEHb5LMtv4G9UsXAeHB5M/wbCRuPfEwGyRP5+yhG/yt2oRdzecHx5zpZKwwfFBtQGRoX
-teewmnEsA/WLWVnMhbZT8fKEyeFY0WHoq1HuFh+Bf5Ua+/WAv13lb6cZ+zl02DVmdcdn4vlA
-lmLi2iITL7Mu+gCf4jP8zt5QrBfU7Okc++zBqyCyPfr0Se80qGJAKt5J57O+OEf1Z0T7ZQFl
-OtkrwlUCehRD1+dHjhTrHsE44vGMz0Gzg+iqjfxF1dimMLOJaOCZ0OU/cLEh7IGWU4T1U9Ci
-nqsotQWVLzI67Q805nlPIFFVXJNefS/UH/UiiDkNj9QZ67zP+bPZAziEVloLveYzxkf9aXJ4
-bbwFbO5Fto87Y1nrgtPc7RgrKsnGYuz5TP/szFiUY6WeMepjWtj9ja/55CjRsS1Znf+4zXF+
-ZVzH/zgycB5ZvWjJVxxHSe5QGe7WBAs1uEr6lEVRCY/qi10BF+fxs9XfbjPPXO3ay4rBae4+
-8zm9Wk4NFnSKpV2B896HSsF8rofqzj0Wuk7Hq9fp9CZH+KvO0np8qW3uaXcYGhxxV4Yq8KYs
-eC1urB53vZ0a3LlkUNqVymPxZ46Dz9POnBqMPIzgGs78hzHqYcz7T/D5JRhpDy5zB7ldi1W9
-yfbY+5At0g7SyXAw1nEYT56E1pjreuppglFYqEFI2J/4LWPA5kyuee4dFMtnDmPTdzL6A+6F
-rOrNxdFNxdBNyq16BQn6mVGOYIX0Q1A/eI2/tnNdx4Ks2AsGHbl0TlbIWiEGKd0KdXRmH+O+
-zEd5xkrkQnnU05H0OfBsOrZkBE9SZ5UR8EP9k84yhkR3rdng/dEC7ocz3RXAPnVstqrlpfdJ
-ch3Hcj6FB/4KGJVV6QrVmjrrSfkTZ8DGJehzzt3PE5jhdTCXYI9B9muTuxTk50oF8q95B34P
-Mr3JJ1mX4KPOI5Z5pdwAznWCyi9gFYUPZWr3QG+87SzyaFZb5fi/dt4LGJeqAnjM+QcPocR9
-1w6K4bps3y7Ku3OPOsc35HVtn2Or284daKKIPfVoUJxFNDOpyzPb40OoF21LxtCQZ6sHaAtm
-2wL9UBMpzRc05fv1XFda8UtbHLuVIxjG3H92LU2dAyorarV7BKlW4BpXCzzOuM7z6javM2Lf
-iiB50ncVnP+dDfyXRxfWRoc3Y5RdGPXXzG4SUrAcaVoKL6bw9BHoLkU0/ARi3gcnddyXsTij
-VKTrnXChZeSkd93/gM+/swoaie2egazMd65jymAkPtggqP23q7SkcA7JTncoTka2Ery616o6
-kfuoI2h1r3JzWRZe49mPquKWCn4Dm32ClqCiA/hsCWUqgdrMPhOKhGdBoCpva3nCYjiywF7t
-Eo9HOTgZ0dvyPQqgEQvg6+VBTjKjLe/7JOs2ll0WIJ817TYkeju6Ywv43M667Dh29QG+ZjR6
-o0pQAappz7sgP1MFigp/hk89z7daeefnKneKdR+KeNc9Vd/Cq95NzIqm116uvD5FganmTxAI
-k5vA5Fb09050ywl8oST0eWHuWpcxtUTjt3Ju/HF33XoL/+ZteNHJXRlKwUXtVcme5QpiXMMd
-HnK/afBhMnNbCmXVCV27h7fRU1ce56Ap90QrYsWYZMeeZwUL2W3Tw1CVGDuhr57jbq2QooaM
-pYGzHRNCZbQpXrGofby69sR28MkVjHC+d6pyB+olPtg2cxc4WOHV70nQcgr+xDC//eBmn/fz
-laP9qI/nTut9xTzmA5HqzprsnPWazE5ror6McSRrz7lcSxjtAjwrVZsfi976LWgYvItlV0+X
-m65WeB1MHsd272KtsYlL2dnrwcEm8LAd3+MQ6LgIBu+CQZ30Z2NtUhBclGEe5R7LS2SwzOO7
-jGxfcH25YujtqtCnCXa6C/LREy2lKltf4Bm/i656HpvaHEw8CUoqImPFoXAe1xzWXrUiaMZz
-1/FIxTS8h4WMZD3+xjFWPomhOsZvY+7qxTcVPTEcuzPae1o3oN1DEKXICPlyJ92R+zm03Scg
-61t41hvOqSt1bfvedaFdJ5DyGu++widbowsrgv3swTL7lslIa6L392WptR5N6SjioligclA3
-2r0j1TnyPGNTpexLvDrpOl8r+E0dTseiw2ZBiy1op4vgIwWzzonWLoZnoQjSxuiKp5ER+drV
-waZiNDMEyl/Yzd122P/fghbeyrwVZ33bERG3oJB6P8c5FkIVkKWlnnT8e+CzpytwZhfP1Lpw
-P1KnWgK7kcDN9nmfcsyRZtEMHdeF+3XH130BmnZA1lVtuSZrvLzoImwvqBzPfJYxkn2uDCw7
-dYr57neUV4SzRi7Cp+RQ68Qt3vEMHauk+pDqDlEZ2annftOJrE8vhAOxSuPByBxkdCbaaRSU
-6Be0xg9swiwUK1LcMYE6zxrLXf/m6cPRkoPxOAbxl2H8nIysLHdv8NhQqFF3a1UfWYzu3oDP
-sxu53e1K/aXdH+8YyLjDOLPbStxFdhWnWQY9WRff8ymw0Ql8duV1F+x5O8bxpLu7qL9PMbSC
-sg4exXlMZ1R/gPh+3PE7ni5PYw5rcmWF70VejlhXL4T7s7zLXtIdgbSrIl9R689INF9BZ7o+
-AHWp0d/Zgg/xHt5EUz0dNEJrtYYGolY79xY5BLdW+dwnF3NM8pms9k0vQ/Urj+vGqydGNq/q
-E3zypjoTyY6TVHfORDB8ik+v89mUvLbzcPVeOBtJWuXVTSe03YvcpSPIltfbFl60DJ7DenRn
-hF3Rqu19WrnT/WDT8PoSc9znGmJT0ccbmfsVMKpsmxSu45fVUVLa9wq4S3pomRlaRlnDnvaq
-X11rOsKdzuBS2GzBnVUzv5bj17VL3og7tUPfqRJ0J3jcFnw2hAYVgkmuqJsumOQTDZ0rnYW/
-e20xH7gftfp9H3a9bOVKnOIvO+HJZnSoKhipR15Wd+e46Y4UDZj/c3CoN7pjFOOcjaTPhA6j
-8DAGQIueYOR55FQxQwmOzNez49GZx6Ck6gFMCceEQ1iL/wVex+B7LsGm7EWTXrYPtI7nLXN9
-p0KuRq7T373uv6XcY+XoRHPfnIxJFfvyuQ6qOl0/y/Pf4fl94MjnILaH61u0AJf1oGhlsJmP
-/yvKagdIn8QddGY7kFn+6q7wqYOfXGlBcXHa0ZqEphbnp7hGmnaCk/CLrvO+qtNoNzozGiQb
-OimjtUoj6PAcT+jm7qKq0PIM1rkjVHoBLdPdHdliWC2odplkcLY7UqQIFJl3DW2Y0qv0Lcjd
-VjTKQffl1nq4iE/XdGqo2PWjIPQQmDnAt3Y/9kJXORu4kOtqHkU7XgEz95ljFHOvBmc6oiXe
-xDt/DS62cwbOYUc7ai9Fu5d3H/ei2QUS9sGJ0+Fpz/EB40oRqGKRTvaSmHMun0jLpj+0B6uY
-u+JwqIGrhp3EvzkHRk/jZ5wC/TdC5RxFg4ScWJIHPFe541MZ4WDQO8z59U2Q+4rYSe1FxPtU
-9myo3QhFO6u70G57xgn2fM5bXrSXcAuOXfQa8r4tWaT3tnRSmZI5h4zngfN5+sCbX+H7MLg/
-mKs/PuBb6I+nnFFfyOu14+6rfAE+H+Haiy7aguZajq2ciy6db8yucFVcdTG95Qi+JXxnMejZ
-4B3gUs7HUvcB+dQnjU/l/lVAS9UGg42wHqoC15R/T6PBn3cfmWbo0RrO3SnBqDIFj3qZn+RO
-m0C59M0/WO4h4PRPpOFP+P8Xeklxm2Odb6ndI1Xy3uvYqIv4HReYx2V4eDtUvydFLkf77KEW
-OqK667HWQCZrISNVGUFBRhIEypKt7dXCBvyuFegu1bLdwJyUG3IBzXjNGdrxaIarYO4kVD/s
-TJeqjLUe3lpN73ppH3yda8RkQHIVca+OV0nuxHXMsV950WHFuWMRR4rlcyWOPI7P0V5aE1eV
-v8KKZb+jevNa95xk1trbUkSOVnvq03PM+cR3bSFUFeR+qA6WV+2FKNJTa3Xt3mtXp7b3m9V9
-WF0FT4C28+5iXMpdZG7hWUagb/OB1Co8oy6jf9L13JbAy43OPC7j6NIVcGKNz5MT3J3mISPQ
-FY8+uAntE3l2SvSi+g08sO+hTKH7oEURmIneLyvhLKb06IXUUF05g2mwoVHoKkXcKFOmJJKa
-x1VIasG9klyPukWpssU9PLtTXBvQj/Px72ahORe6lsFw/iKrusmye9GafZ/l+lE02FUk4wpo
-Os+MzzIXdTfTOa96smnVHg0qC7M6Ko32egIt2hRstESHNQC3lbH5JeFROfuCAe+dBSk7HctY
-BInNhYeuTr5JeMfnXX/wT0Y4nLFMwOOYB0bXuIPcFnCzxyv8h6FqCmZxTbPcUL4AOqWYsZCX
-5zyKPGjguoDqbXHL9dufAW3qGNDJp4qqgKk9YGWj7PUaXd0BdCaiE7yTrnYl7VaT6wlHL+s0
-exP6aiX2VPk2qxnzJlC1w1lbGR3FHQduHoK4VMwytc/R0mFhMqMn1BHqgWP4amORn+R1bZ/x
-6zwvHpoedIW5AH9KWUaB91sf7XumcKat/Lt71lEJUP46tLuA7BwHZepEq3OAo0jdWfybc8zs
-BHc87C7yqeGcencpyvGIV5L5wWURY3Ols87LcMm+5ggUxaII8PuhKoekdlZGENz3yZDi4RV/
-GQRnnWsRwThCXqVEK0c6Z0On66riq2qAOZixIpQywf307u7TDrq0d/5ggFVLiwbLCJfSwytl
-f+hkKw6tcw65PI7uUa1uxRVvw75vZG20CV263dG9qouyA+2+xf1jrrgq7y33J8vh3DTFOSmO
-NIox5cFuRTkntRFPUa8M7Ro1ACuNsbnNfTKQhZEoe6ysI+tK81tO/hrBOkHdNA9w12XwcxIU
-Gcnch0GDwWDkDyTkD68kFSOv6m6nfDp00x1D4kKtVAJ3nFS2bBT0yOtorexQKZdPyqLcraoG
-1KzjbISTaJWzzsVt62pP2vnZ7QonzVzBb6/PnjPB8STuf9VeVQFXkVT1SHnhy90vqrZrQM9z
-dms1tE4e7pQOLGQI1G37OLhVnGKC87RP2VfNDJrUa1rxczWcuZgYKktCGYPVA+VyX3SPtTxo
-JmWLZXPNRGXYRgTpjHDFcCna5e5jS5/DlUQue9e2GojXXmNH7vIqT5NnWwd8RnGnm/YitUe8
-H74fs0+0BUytc3d71ZKOdl71XHA6D0lcyjc38POwMytld6PgVsog2hHw55lFDD8P8a2T7tio
-GEHZ8/z2O5OQ9lQgI6f3QFXnOD9YVV+mWu7QlNGxvKW4lClamhkWs+bTydNJ7MJx5+2orrSi
-h/9j5IuwZkv560r4sRrur8eSCrsHee+MpUaeRhIzSnDMfZRPLwoyonKuYZHgWhaZoXkeZwml
-df2opoyyEb/X57MNGW1znxjlAZFZGFU6XqX33khWZCcdM7nhzojZ8YBSBGOh6QR3YriI33ET
-qUkKlTPwLzpqEohcgtzu8UmanhztaB+dS2firtGO5o0IdEqijLT8zkZL5u5J0P8GnDzmiKEG
-8KAD+qKH+4us5fVa/r6Bz2nNdczZMKo5dNeWQr2B67uC/jo8AnU9XcGnl7jvVY1gBned45Mu
-xcwqou3RaYzkOjlUlGccXLvjs9Ni6LCijn2IBeU3XI1L2fGlnPF2ks+ecrZtBceUxTG7xFDR
-PDdDncyXYjaFmU1uz/uaI/1aew88nhncdSUkdYSLZAbKgYlArz4Ak9fg5Eku7cep5/ly1ztU
-LKgqgRb0NYs7rnTeZ1HuUMoVCQJHpipTXl1RUsGrVMZqZqiZ0zuvt6CLztbvQJcHzizS2j0K
-/aDKD4qnzcilDpL50R4FfI6rDLlHvmlRRy3rtPSEc+jjvDNyG+zdRi+eB6PKbN3B/w8yduX8
-X8G6X+b1ef6p+5l2M+449j072jGru0SE9oGzckXxnCyMNp3zvPIwJ50gFeNndUbbjG+14mcj
-x/3oSkRfJLEuUQ00ZT0WAFFlmEFp7pOPT2RwJuYm50XkAIvqkJzbu69DfWKUFE52x+6UtkKK
-IrriVWMa9+a8x1wVg5TF+fK5oEg655dHwUHFxpf0yed/jEv1RtTDdI07sLRlNdPaK92N4HaH
-9a2qYxV0pqG0XU13/zoNopRxvR4PYR7r8tF8czB3VK35cYxBtcc2QuUD7lZ2CDoeg34n+esp
-d5JKZd14Bt6rjupZn6m25M7Klm8LlRXBpFjdKDgaiaRnDh7F3Cl3S7VnHljKdA6iPGX5bJUd
-Yf6QsWkNlgQHUrh+nfLHkhnJbVd82GJvba0zXhQJG4Ot3O9ItL/htyK1p6OrF8PhTeDzqDNR
-6zk3Lrc7L9Vyd4XajKcJI2wFh9uh855xXv8R+xPNLflap6WBm4qxyf14hZSXEWUPHrgaSAbn
-CN13negkfIUQuUmFDKZ113V51+oImgrpVAeoeOiojPVDro1+xqc3O9GXB7w/fZ/vapWoWIMA
-TimCIiV0SRsUMBojAvXS0ZOUe68MvJTQMgP/0gc6Iw7cbee4YykqOEbyKDOI9e5PLddQ0Vl7
-enRrLnzFksy/EnxRNFshxpcdpGRBL2V3xNoo5j3eJ5u50VlZndezxp2Jk6D9Q6gfOG/iDFi9
-5BVlBOO9x8gVY3DB8RVVXf3qhuOKa3ndfBIteBR5OQpGjuKPqjLuEVa9qhl9HdsbIDnZ7NFm
-ZMWlk9DrfPIIOnQzkqZOmeoWIo9tJdydzTMfxXBfhusxrDQ3of8V5zWFMU52Jr7284ug+esi
-WToRbwlHmyIBTZh/C+Sghb2fJ7BLVZ19nsm+WVPXMlA1w3SBKrG2dGW9ePwN9Ta4yh3jHJ+e
-KVC06/1QfbZieNZeKLSD1xtZ5yj+cbb3bPaGQ7GOA+H2D/BeUZPasVWMyynueNO9PRTfVgWE
-VcE6a9VbmjHkcoVgYfNpPtXG/aZVxfi+6xUo578BVzWkrChIU0zjXZ99XbWmu4ScXnFXmqzO
-hdnrmjdZkNNs3FHd3JQZp+9cBHcx3rlSfNQtsKvczzjeUaVBSXoyd81onXk/zOW+qYo51N53
-WvctUieB0H1Wcwfqs5nBelURjhGB6HOGJ+x2xeQ74T6PRz17q2D1yrvGrnaVsoHPAq7kXt81
-VlQjLYP3PxTJr/42111bS526S2GFirNuKuRq99NA/SRXPL0BxW9hrdS9WlIYAepuI1nySo4y
-n5PoTcW4xqFVrjgeVV69MgKr8rxOSNO7XB+5h9mt8B1m+Raz7OEeqZEgI7erEkX4BLISf63I
-/BWZW4hPRcPNaFflUF3o9cj9HGj/JzqqD/z+HP30B17zvHAstmkCoxE+Z3lPOZlx5YCzJV1T
-M68jyOtxb+3aP8ea9sWgm/OtGwRdeVpXRtEdnL7IONp6jX6Kb+52NZBCrlJwkzVb4JpyEfy7
-6EynZJ/xbYUyq/COFCPxO7rys/Bw+A4Y/Qh6fQ+VxsDxxVByk3OQSzlOVLkBaaB+fmREvX0b
-MbJ2jlYoFLwM117iGc+7Y706ONxEimMdp1gbWlTGCpVwhNeFUD1XMqKx7kEZraa2MJ4VzhhM
-FShv9Ii7y6pj+w1XPVMvZZ3h3oOqYaicVvVQ1U5zgnWqvKQHWKVEVs2q8aPonWRkL7Uj+bN4
-9ZmNn1GuypLHOaFZkSl1PUjkUzdc2yYMbzsaJoMjqy84S0QZtpmdyXyUv8c63yMv3yrnqon5
-0aGFkc7i7n9VDDuqOoopA/k0qslTAHymw3Y+hN/3w1/dj169Hx+425FO2k5hxc7D/YvMVbJ3
-ibletfQd8BllQqhz9Fhm9pCZpgpUh7k6UtWWMXTjaa9wdWNmnZhPG96VPWsGV8SZes61kXcf
-jX6PRpqinVWoigjKmFVPx73u/n4aXanuJhtB5CJ+jgmnhj+HM8JvQOW34ZxwEH+djHe/1rVx
-r4XqgK18uHzIqCpQPAnnn2Uc7/D/z6BJb7RoL1eDiAy0t/0xGvcVR+mqG6uiaxPhYlrukd7I
-lAW7Db/OuvJbVrzjKDzjDPiV2g25yfPjwp9Awk/OzjkTDmEUf/J6EHRSpuBC1y+UV1kYvlQH
-kY3hQ3NGVt9d2XsiJ2/xpBeQ1XZomLZw/Bm0TQefS20HozHYFNVm1P68OkWq3sM9pPMOcpKI
-vkpEK95y7uBpOHWc0R5mrDFeCz6KyVS119vWhAWcvx8YebH8thX9tNCnlrlBd3rmnwxP74OC
-B7bxKb3/rRVa6BWa+mgU8hnbLcd252G00V6HJKGfFIej/eRzznxXb5szxo3q8lzzbl1DOPyc
-u/DlMRbUIboEnCnIlZPXEYH2TYozLu2C5HAlgeWMaTXfX87cFrj6nHpBbWT2O92f9hhPOQxS
-Dziy5KxPHu+62/kNrjvO9cjiupnx+J8R6Kh8YLQKT6uLfVXfR2FEvZVroy1quW91UVv4os4A
-jkTXpQPLSfYfHkLrG8zxgjMyQ/gQCwL3w+vV2M05YHIsvP8DTH6Fhf8cXP6IRE3l5yHsSgBn
-CzqyvABProFMtHAu1vPuOt4ffAzmacORpN8Y6RdQ6hX3twtZq99wBFNB7+6pv5a6c2kXUtol
-cCya4leUATQXb3yqs4Luhn8x+x/h6Fdg5kuwOhCpHgPVFkKlDY5JVtxQOZ5UDXmpyOyLBR2Q
-xO5Q6U2u1+HLi6CglftjXXQFa+1AqCJudceYBo7pC0HPrVCxguqBrPj83Tx5K7zZZx9yA/jc
-AVeOwKXTjOM4En7QWeOPfD+twgpxp3KOEk90RnIe16S+iNQdc1RTWuQhJVovhT0YVdy6HMrT
-vOb4nsbIxXPuPngCj+OUI15VISAf/lw2x3il4C/as1ZlttvosnOMWT1qtE8a6TPwMoyiMvqy
-pvtHPQ1NngUF7R/X8nvC0bgnoFgM2niPK9WcDtfBWV0bmdMGd9JT7a/9vFYlT8Vp7HLVpcvu
-nHDLGD3D569DC+1oJ4XJPknP7i5o0fj+5bGe9YMeYEN96Dvxuh18eYrxNOC3iiBY/TwyeH8h
-gyPXi4KYEmiRvF6N7XcsV0a84yzBCKg0EfmYizVdYM35A1r0TzAwGv9zItidAjbnwptNru2l
-qpn5vPJQl+7azL8Wo6gdfMgTvwWzPyE5ijl7DR3Szj00UgTaN3wBXnTyeeUO+xj3kI8z5m9J
-NGveQPV5tFM3G9TOQncswhNUPwLFAQ2CTn2Q48+h0UD+Ng5OLXAlCWV3RCO3hQP9a8lzuzHH
-rmCyPfR6Grx04OeLjvZKjSQrauA+UhDBXzI5g19nmhl9pnbAvVrOuifGOZ6iTrc7nZFxxbrj
-Mv9Uny4RrX7Pdbuv+vSgptckWW1Bi2EVsnrvOMI1G4RTYUI1a+czo5nWVQ94SrLrWeR0ZRpV
-CdgOxjfhDe9Eux/DM77gLo+quH7fnTAUUXHbfVIuOlvgCKO64mo5OUBhISxGQXdLr+HzzeKu
-mtnKWNA5V3pk8a7rF+TgidlAgeL2kkHheWzoVrylJXB5nnsBq3/yCbBwENTu41UMIzgFZ1Q9
-QxFxx/iOEKrI2xTedYgM8vjkKiVPSYHOVH0FnYg3Ap2trEnzg9GsgVYszzK+F6FTGy7V9czm
-HayifK8KGrSeK2hudU/sIqzc0qKnYhnPHnC5BB06GYSOAQNjwn9B6XKQEMOrq1y3nYu/k3Eq
-8zv/49pbZeG/6m+VcU0fxS68B7U+4P3XXBn5Mn7ecTB51H3gK6KdcvH9JK9BU3n9kOj1sfYp
-cjrOX1Haa1wtIRN6NG0gLP7pjsqpgoF8biTadzEe/m70y2nvVGV0x+m8rhaehnmr40ES6/ME
-dyXvxnqku9dDysZSBZ2UgfpGKS460fVyVSvyvL2t095ZOw8mz9gbDsP1oHGJ66pfAaex3kFK
-dBxDCuRPsS2B6zI04dULzPoFJKSR683onVzeZVPkYwxP2+WIqTvhYZ/03Xc1lsxgMQp+5GHl
-qrOWmu4Weg5Nd9JnHmldtSHGPeUinDsV69p6l11TKK1r592CGinhblbvnZdzhmQOZDUKnmRC
-XlOhs5LxZR6GdfhcGSRT+25XQNtWZqbortnG46MYbs1YsRR70Egx3sVVBv569zq4B2bv2vPc
-yev9rniW0nWqC3P3yu6gqk5PmeBEAa7ySEptcKj6iM/wTEUudwaLqqxYOyjC//NCp7y2ONdd
-87Wduxsu5B4LmP8y9KdOO3WKtNHdwI9xrUbTT3VvuG3uX/87ox/GGKd75ZKZmUX77DwD9FCv
-5IigIfNuA786O94qO7oqLSsmdeCMC1UhWXsIOklWFYEkrMttr2vD8IpPGnOAMUW0iZvaobmH
-7RCNUrAmSe0qnTO5FGewCD2zAtlaBR20C7ENvp7yjqGq7cgrzgI6lGfwIHzZOVuqS6/dQa0N
-MwSRxuZdd0u86eigCNeHPMmzLnrVfQx6SwaVkbcKKVLlWmny5UjPNteNTu81j/Z+pP+0c1mB
-OTXlrq19bpHGvnleV7orz3hKwJe8zhlQnbEbfDPWlfEUM3vU65xsPnvTdYinxCD9x0DdGcde
-ix7JSEvgCmOqFnKRsd8KT9o/ULSv5D2Xqw1ppzYrGkw1KB6G6kryrPctUvvkqRY0qMTvRW07
-Mrgju7LTlWG4llktQwYWc+clyOcGZPOYd09WGxlpkBzV6EjGtqdwLYed0EkRFwnu9nfK/W6U
-N1LIEqnsmPSMJho5rexq/5nhidbKWi3lxt8rhA+qPpVlnBmrk7qkx7ugG5Gi/3i9An9Wp7Nr
-sK1LkOEFjGQ1lDuE3FwO57qGzlXnPy+2H5bKFDzmrpmZHLWu2oLad9du/Xks0xk4dClsid6q
-DwpULbYyNCvlU/z8UESn21mt6yK8c689Je29aN9ENkwVwG/7b3FQQdmZ65wxn8/dGXa6ylh1
-vIMm7n28jZ/aW7nJ+JUpoljxSuiS2q6nfw/+3Am7Op70XtjAO8La28yBRo10J9ujjglOy9zF
-m2Rb9rtwJlMwB89Be9UTGcskx0zmhjrFAtV9P+pqNf/H1Hs/OZrfd34PgAbQ6JxzmO7pybMz
-GzibuIG7FJc8SuKdRLFk1+l85bPPrroqV9nlv8f2Dy5XmTqZknkiJYqklrtcbg6Tc+qcExoN
-oAE0Hr/fr++za3EK7N6eHuB5vs83fMI7ZJnnA3oGruhf0Jy8DOu4hV3sOV3LM+A1ZlB4nsIP
-toGvUL/uPwuSrJx4hVsHbYlrSmn0KmDKjWYxMuKmrm9RP3eNyvqkrvIYZ7OHqloHOkJpdMca
-mm2p6AIY0X1FCI+Jpf5U1/tH9OfsimolX1/NiH7rBAoVQVPukn7zhGZfB8qlt/RJ1/ABvYq2
-UYYR+qU+9ddakx/oyr6gd9ISWRnazmz12Byixyg+XoRrdIAq8xSqATP6XO+oP9BT+mPcFFvw
-Z5jQ341rlCZhBLxKJfwJil1W8Lf+6wtowV6HlT4CjtPepKuoMc2jL24nML+2dK2ppPI3Bpr3
-IQz6af33Zb3b6yiWf4mS+wx4JNcJuvV0pvRkTqJH2Kr/PtZ4W5P2AOW6dLTBHrZGZnwQL8IO
-b6Jdu46m8UNypy5U469q5n2q7PsjzbrPtTM+iP8rvc8PdPcvapY4lvF3znt2lEWaVxrr2Vgr
-pCdyvSBFLnaIz6xZdfPgMyLNd0eeRWKqYuyaxgf6+9/i+7qPasffaJ/6KVWFjsiouLvs/j10
-zLv07naRntEnzOoOZ3S/c7qWC9rHXiBPmdBVdTB/T2mlTLGeVohl+lFiusGqb43WmIc1fbZV
-fnY1/ptoKW4Q9T+g03uDuo7Z+SN0V82c9Wc7NxnU9ZhH+H3Nkv8aD6gV7Rc78Wt4B1X1nBp0
-qN0di6lfTsLqvqmfXtdXq/depdvdgbvAgUYorxHv1042qB2tC22A9/XUjPS/pnFc0DVZrcu4
-/ya+trsaT2vDtoI+92i0a/zbNCc7FX926awtkAUN0m0Yo2eb0s7ehO/jjuJlzfPntDe9oJzk
-eb0ugsB7SByejawWbM30I/3Z0zVuJJxbcyzbE85tHznpok6gW6g4vKS5+bKu+Vm95vS965vj
-qMnu0N82szNDpjCICpUdyu02sAh3z3hpa4PdgXnbgV7mV7DCrGDwPtW4Lv10VrPCvbHv4fG0
-r92xph2iFSbYO2hKndccfUGj/210MAdwkXlef3teM8is33HQABE4oy+0Fn+l1z9pXL8g+vxK
-I21mxq/pCJhJF0Xuov5Us+b/1Ej8lL+r6apaYBkdgakahjc9npziZzXic/puWvNyRjPUysTn
-wZwEbeLTODnsa494orG/DQ/7PBoBVlysoKe0yB97Idzij3U2P9GnWlvVdYND+lZH7MMzYCIa
-KEi4gtqgLmKN/u/pq2vOP0Ztsh6/Q3QYfsu930WtYuuqr8dvJcrt5rIaI9itp2a8RBmVBGvE
-tGhettDHeQ/sW7d+ltJM3kFfxphKn3XuMlU0Y3dRQz2IrSNZx2PpjJ6UMWqhY9/Qz7yiz2hc
-rqDCYoburq7pMfv461on39PMelX7z4xWWZuuL6KS7H6FO2l5nGzNZ03D43YtLoM7S1bPo4pe
-xBQKClYsXtPLXsOfa1cwU8JuG3v66h7JLsw8swZd5ztEbXgO3adVXIof64l8ClNrG2+nn4H1
-Lipb28bzaD52J/5mfFZr+tsav7f0LF0l+Te66/8GHb4OIu63iGOCS/wZxTrP4An7hv7mMvU1
-a224azhFnm+eqz3tP4IntaE82OoY5tCbVfHXuu//Q9//b3oZtfs3Goufa3T+gb5fJ52jTfZO
-128Lev8WtG28h57Rp1zS/Lygz/V+PqHZOKmZOgd21V4Arl+X4DS+rF3uW/p6jvjbvGbXDazh
-cR9E+3uaj56XV7VT3daeaZbDDn1mq1Ean+F5aTRDpOddQAVqAB3PF0GZLendreHq0Xuip2+l
-6gbV+3at5uPY1+EuxZ/p9a/1JL9LV6+i32hovmX0KQXNkC5cut5DIXAczd1PdO/2hLul3T1U
-Rm9rNt7TCD1BCcp+tZugw49jdw2WtCtZjd3cxx06asfak8yMr4HPOK3PfkbP9Vn2TStbm5u/
-rhm9rbmyExtT2RtV8XCxqmdf0tGwNrBPZNdOx6mmnvkmphrSk7Z+hUfoAHbmTMLc7CKWdpfl
-DpG8ebGHZAUdCbd0QFec02srmRN/r6v9qe7qp7rm/6wn8FNlk/+3nsvPdGZYxcA7mx2YzuE8
-NI/n2r/T9f1H1NUvRv9eV/VjzYofgNF9M3pN8/NVnSff0s+Nt3ecPqQrdSdxAj7KdY34R+Dm
-V/U5D7RO7qGp26brbtM8zEV2bfrf9f3/pfv5e336hzhouCK+pZF3770Rf9157EF7oot1MIhy
-80saoVfAu/dofnaBLemOLiRIiJf0DC+hR+6nVmYndh5fZH4+pNL6vp7wu+TMyxqju7rK67rO
-+3BSzJXto5Zfx0XlHOe840lnR0aFvKxPM6bBe8cMKOdFEENGS+6ihTsFTmFdc9RusQWYLC9p
-3jqjG2D2vqBV84ZG69v69xc1Y8aIkJdQVEiTwW5o3HZRZbqhK72D0qPrXWucAWXyqBuoa/eh
-HXmXiGpbv7eC/515HL1UNm7p3UP9YlC/PcDPisTqVpafAL1hFbpJHMFP6lnbP8gZoXm8U2Cq
-JrT2Z7QjTHJeOdobIa54Te9gj6FZ2EWuNTuGewyzqqgrKaEAeKgIwd/56S4kKImPOEd3QaD9
-Qn/3S7iFZe1V62hOvqf5c1OvTZSY74GROa+xfQ3nm4ZiT3dPL0b/TvvFX+iZfF9f30Sd9SW9
-XkAN6VVqkuaKrjLK1q3oB3G0DOJoXVd5H0XYVmVg08rRT0W/QMG4LfqZZs3P9Tys0/sZEWIU
-WRmroettRdnUiD2fCeXEKbAbzqRV6ic1jrMasxPof6bAmkxr75zW91ZKc7+6qid4QNS9SyTl
-tXxfY/KVnqH9K6+yP21rvOyVvKwRfAyCvIP+yAZz8wXd27MgpB3f28HoTdCiHdpLXJUsat2t
-wa/J6redSRXBDQxSod+kzzVHlcG4Y/dVR/AvKyWYRzuIlbTTG0NuDs42XSLjabfZgVq1clvx
-e/5cd/CYvs+m5sASe6dxegXYmB/rqztxX8BXvqbV9rnu5LpG8r7u+jFV1bzOxxz6GZvsraN0
-5Lv1JO3LNKlrPKMrc5/2tP5/SE86BxLbPm+XdN0X9Lwv6e+e1ahfZOxPJLuCFcDO6D66qSR6
-l9nElWuTfsM21boS3epHuoOrIDraFccMK9aeoHrwm0Rt529AIy3H/0Unm9HnVp5c49T9lG6s
-Y/fLuPUZ5TGg2PNFvd6J/lzP5ce6lh9pJryj+3ldz+tVvV7TM3pd93oFDv5tNFSszpLWM2py
-dcYsO4KY1hi+qNF+Q3PxZZ3+F1Ft+EBP0AoBH6KlUkoQHnfQF4h1VT7jc3qqfZwx/Xr16lMH
-OGlnycxS+vyy9injZzfp2a2ReT7BI30LV5uqnlRTcaYdCBrUwuep35ubcqzfqsCIOErYDUOw
-G4xhPI6fhfthhskp/kwxU0/repwzD+gKjIQqKibw7HddwAzBL/Wu16mrRXpqRnIHvMpJai4F
-nUT56M/0L/8E1kZWM6ST6Lov6qJSsAL63Wu8XffVrp05Ha2j4eIOsK//SWw2QRtrYhOm+4ae
-uTUan6CicRfe9DWw2uYC3dQ1reG/s6r3q+lftutzR8B+jxIvGT0wxvN0JeIHuvef6Or+ij5u
-u37mDGNU/288oZ1E39BvW432DPhfY5CtU20UeVcU9NrdY/Gqv4vTkXlpFV1PSs/deeAoPelf
-ad/9faIG9YFG8V3Nl/d0l75qO39ugOv9ZxQeV/SzIr5ERUVUWe2P/Ro9a0mO6YpGdI3DGtFB
-XW8frkd/REXFXHvXu427+lK7wF2dKevULtf0To5E72ttXaNz86qu4RW0np/iHjWO/u6hxtqV
-Hz/NBRgBbWApXYlwpczI/iwxaC4KijzGH4XcZVIrd1L/elp7zYh2kNbIGnB39CRX6eLfx4s3
-0v1nULz6Ayo83dpdC9EWehXLOEwe6QzNgx53d3hPM6lJP3OOs8zz8gK6eqPaPUa0jw6BWu0D
-G9iHqqpV0L7Qe3xBHa0EM3Ib99YFUDADKEDuKrqP4z+Ht9qnld6rZ9yJYuYwWvtjjMpy4ljy
-FM+ZLrT0rHftmq45BJ5lef2kAE/hER3oXc6ED/UUP9A8/Uhz9HOtka/Ax17X7uMa0Q5x1nps
-bKF15ztgT07qXu3M+I5WzE80z/6tZttf0oXJKu+wa0K/7nyS3XWGatVZVIam9JMTOrFm6E+1
-oInYqlGNceGzjultlJivapZ9xA5oFaFBFEUeap+6EX9fz+W72ptc0TwJL+qB7uWuRswZ6734
-V3qOPvl/A06jBJ/JuIFIV9dK7dHdWyt9XERztFNPJ6vIr6JRXol/qHf8nk4X69hN4czxaeI3
-ssWsKunz1kAwuqf1IqpqEXhZa9adIxc+0sza179eQi3R6gtn9PUs7pk7seutQ+RJxmUOcobX
-NG+M534CGmpWnx+cPH6HanIh8lxz77SOY8DvUXMY4gz5iPyyT7+R0TXts4vaYWFAc3tAI9ZD
-vWMLBd9+kKPtOATmozMgDzq1SgdhKV3WdcxSqZ9hfTzRJzhC+Z3e+Z/1+R8y59e0Ky+jgDQF
-emAXX77voJYUgUK6qE84CW6+R/9lfMqs5vsZYl/nmq6ulTWbrC+9x5p35LKHa1DwANmgOjYP
-TmATZewVenQ3tDqNNf6lfvKfyUkL2q+CrvR9zZFNMI6uhNnRthT/Kxy2y4rpyvGPdf8/1FW+
-oet5HqW0MfReTqPJcAWPCP/3KTwEO8HdDOopdmt3sTuVs4m0xqKklWKn3aATHumzx/S6THfA
-Due/x8vSHhpva/Tf1Fx5Xvc2qk+v4+Hm3fYQduk9WKk7Cad/m9jc6yzSeEZwR+a0V76me/kB
-mOnbipo+1pn+O43lb/SpvyED7dGp3QXK9hDObFU/qcC5PkVmMJRUh0Y063sTnLx1P2tkuq/r
-+b2ha3xJ6+uC5ulJ7bkzMFeN4AicrWzUxkm5DGdwUnNzUtcwoc+3rqo9ge2SFEXL+DXatfQ9
-zZw/aO7fAvU/zHlovNqhnl1Vu6u9Ha113oL+hTE0/uo6YCVuBbF8EiX1fkUR40Tcl/FnPkUs
-mUcDqJNK7WP2UOMu6vTtV/RsKrFPaCNTSmhpfRsErR04j7Q+W8CZzxK7DGv9TaFF9BQ+puum
-HeAC/DwOqVdvsnsU4zJrqwhKy7yzPJnJU6KoimbmE3TC91Cn+AfUPGc0QnN4pX3MamyD6Ws/
-joKejufoSRRGN3XCbWjG7MWvMW8zejpdcDefoRvlGXpRf55njjpOPUnd70DXfV/vYX+tD+AF
-uWJmfndRO/smuVIH8dyvtVdZu/QftMN9EP9Id/oj3eVbILN8lprlGcdFauiOV+eJ+KzZ6xW4
-g3fvYzp9BV1tJ84XvZwBZT3lRTy93A/zvLwE2+pdvfN7RJKj2j8HtB91o6/YAtcjFY2BWuwi
-ZhzUWpvibnv1rDuit6kpD+iMG4J75Dr3D+gQf6Do9wOtq5soX03AgfCT2tb9HsS/0xX+ve7m
-Z/rM/0ez7u+0Lv4Rb8AddCIasa/iAWpEo/AmsuyFdv44ZAeKwFDt0E8yN7aLXtpduu1pzc10
-ZN+PCaKJpvZzs29c6yujWer9dJS6ghlWc/r3xjDPkROto4tQw+OmAy3gA5CBJ/j3O1R2nkHJ
-y9Ufx5yuHLsXNI2z0JGuJ2jp5/TJUVQm93WGV0JT2bj+FXDTPdTwjLQyWusa66IItuE4tr75
-57jTzYLefaTY4qle7u3cQJnSmNl9sKVpWCZrutolzpBh4qUSuuTORn1WDNKbeQnks7XzZvBm
-69V/1bSrzNM5elXnqOfDHHPhCz2Be0k9zGrQKdDVt1CLc7/pVe2bRgN8B1eH+xqTe7o2c/Os
-57JHh6mOu+CqnvgCuYL5M47NPAKpaJMI9yDpBT3FI8x+M93osP0XPbG/0+z5hXa/97X2bmrE
-HTft6V6NmzpGzbEN/lye/WGSLMAa6Sd0WrqCafT125oJVs3893rS/51G6T9olP4K3YYFzdFl
-Xfs6Vd26VtBDnZkf4sKyGf8MbHUNxMJ/0bW9T6/KLG6fgrVENcZ+Pbu4lrRpjrcz84x+DAzT
-h6hW28ukl06y6wXNeIK+i+ffKVh0npuboPMG6VA6c3EMaD7iiN51Ts/3lH5jUp82RN+ojZ5X
-Xk81QlFmFtW+Cvq740RqLSCwetDvLKG6WkVfpY2Ktmf1EUordmdORe4YmePnLs467PFITzqD
-n8Xv0PrKRDfJ0cwCbEHx0MicSdjiy2CH3sDH9LZ2uXu4nnbgI39Ns/560jtzrn9M5mXWViPu
-pAI6CC/Akcwgsecp/v8ykXNGu4z11dd1llr/6SuN1Me4xZzDZfexVuUWNdhR/a7rVfZZTWm+
-b3JGPos65q+1bn+t8f2dritEiN7f2/CUqDJXu4nEr+mqPtLPPtEI3dRKciXCKPZV7aibINM/
-Qft6Bsbqu+gbWqHAvdzz6AQbkWufpEfg3c3iidC57wBjN0ineAQG+SWtv3NUNd7R/P0LjaY1
-2v57jch/0ut/0rP9H3Qff05mbmyna6OfKhb5UH/sn/W5YufbaCla99g+YvYY+VhfH8TuX5W1
-toog4r0D2U3WfBJjtIvklkORscau1x5oz6+z36dBS/WgNOzoL5VwI4ooW01qFndp3HK6syzc
-pVjvmsW96jEYmknqre47ZeDcubLdB2LTqPcJ+i577KWuFg+CVDCOxLGQNTXa4ZyY7VBgdXST
-vbiT5frMZlKXcI32hubSJ3TjmsodOvFIf5Bor7eQN1hf3dHrET2eK7rKV6nO3wdlYp/qPr1a
-QYlf17t+rvd13m+XwvsJk8S8mLre2X1BYwpGdZo71x/RjjoCi+9Io7OsHfB+/Mec1Df1uq7X
-V/GfaZf+sebBH+uTX0YP3vPdGb6z+2EqeF/op3az/Uddz2/JbsfgHCwx1iN6Z2Nz2sChLKEl
-NKl/Mwby7n2U8g6oBR/BfVjTVT8mA+vQ2hhMVCbGYJJ8jDfSs3CwlzgFJ3DArsGpd8/Y3bI0
-Wc4EEU0vzlBXNF/fVlRq7OB/0Pf/McFl/ame15u6o+f1TqdQ81/RFSzQK7+hK/kDHbFdzdED
-7Z3l+G/17v+vdhi7sQTtgxWYh1toYM3zdI0W6dD79ibqqKEnNUoOOKCRnwTJMIz3kv0ZBsAU
-OGtxxDuPQuYxmLfruK/EoAuMxGvos7q0I5zQ7HtGz+wSLOoGc7Ud5Qxr8fYQZ9Q0L4yFDSeL
-ldKcG01ROQuf26nv26NB+jjt9K2P4IxvUCkra5+zMk1TEcwxzogf62o+hk9W0Nj3wqCOQJHl
-9SeLC+GM/uuCPv88SOs7MHY6o1tJr+4Lff2Dds0P2E9jEGeOMjxWRs8eoi7bjtLCQezdPEWs
-NKT7nEbrvgan4CeoX+/G/7NG63/RLvif0ODfwGnczLNJzQUj02pUpI+pO9r5yupHVjdzn+bv
-UTqb0fVcwnfO7MRrWlPXcY0d0Lv2wrR5oFFwXf2RZsMqeAozPvdxTGyNjKf/Uu/g6MEO9ht0
-+86ha34TjueYdpo+Tq4jKu7r1N7b4Ky1abzGEhT6OUUw5+BH/BvNEFeu/jVKCa541NAMshNE
-Lx6duyhf3SYbXFNuuK2XGWal2G6zv1Ms9Z7m6SeJ+6O9vANP4qlmqx3WzGR4jMLgIHtDGpWI
-c3pyVxRvvKbd/FVdkfMfI1AGNf7dcEgaZPU57QbmNq0rtlvAJ3oLFKtVYRZ0dQvoRrfhaBAR
-vbay+/l8djXDmn298K4bzNEOlIPbQRcMgD8bx4N7UDO2l/1pVCt5CE/KJpFKERzFvD7xESyQ
-Ja2SlQQLVY3NqL+r0VpMotwyGcckPJg2OuirKM+f1o4yB07sPfaiYTx3b2mePsKptgX10DX8
-dq3KYL2mftSNa2hee6dPgQUyQsl8k5f1ZF/Ty6yrd/S5f07/0Yr51opaUaS2pj11K/4u3L5d
-VBFSkdllde02Ge2FWUWJGWUTab1cZxjSWW+l9jmQkI/w6u0jov2Aun5W1+y1ZFRCBo3wdTRy
-a1zxSd2Fte9f0d++qr99WXdupcRv6fUM+8gGerjOgWOYCeY/mX2ZQe32UOsjVlTQoUxwBG2l
-s5oPxnlfQYVonDx/Ss9mnP3W56L9SZ/AfHEVxQzOr3Cg3kaRzHPyI+oanUn39xAs31PN1HXt
-d8U48Pzz9CF9spuH3atd0zV356QvwIt9TTPzZdbOICdsL3ypBqprroc7h14ETxCqOCtUdjbi
-LTgYrtw6dsjrORkHZMVEP9UCfOUMmfaGZtEqGeQgZ2ceP5LTusszumt/+nD0fc3LP6Em3qG/
-6YALGHbpbbzdrFm6oJ38EVXND/WzDzTKH+td7S+6qNl0QPU46NOktN5zdN+MGn2s5x7yEOvF
-jeEafI36+BRaYndAXXVS1aqDLu/Gj+gwcdg0Qi0DctOzNE1tZ4gM8khRRFl5UqhV/aXu/3/U
-qP2v7KdbKOa/wdzY1XgcgD1Z1+p2N+N3Gj37fhkd+wWMqA6UHu7C7g4+a5+ie+4+zqD2VqOZ
-0lQrrC+yAdLYuZ7f12rBjlqNY6vgq/Bqsr+/pWt/U9f4ij7fjtRDrLYmceCWntAOT873OkC3
-vpXT1LgjI9KHiW6GwZqc1LieRo22Tu5uDIz70tZF36eP0tQcaaWecw33BqsP13Snlfh9FF+9
-p1hj4K5m5V0i6Fq8RCZk/qjjyWdRjmnXnjmJZs3rKL8aA3MWTNSw/rsdJcVxougGHr3+/Icg
-eLfAb9wlfjBecpm6VJeertEaRu50aK5mkj5KQEunQC8ZubeNDtUwMcSE/pwEf3Na6+SEco5B
-OqjP6/NnwOF3cFKn0IcJ/M4noAXu6Tuv1Qco7Hrncx7eHrlHtIByUS9o2lWNlf1ynZm7Nm49
-kWdR1ArZxJS+Tupn3mM7qDu1odNqZFxQizei9pA4eAfVrT2UlHwyZFnF0+w2/XhyfVfX/ae6
-u59orv6lnvqfawyMWHaf0aN+AifkZfiaRgu4v3AN5m6KLu5XKLM28Dm/DrK8S3fRgoaZvaDu
-agbe0PVcQ8ezHttr132YRVhmzn8b9Nwm9KQv6/WGZtA7KAC41+BuiP018iCPjmDWea2OaGVb
-STdD/NLHztFF/9c6vNMgt4wF8anXwh+v/hiUSC9+uE2q1fbQKdHf3dTq246NFPwKbYYD7SVH
-yhfi+J+oBh+hOHIIDv4WSORWNH129UyaGqlWzcduzYQxOPx24rBm3Avaya2g6CxujtljBHAM
-uzhGX+eOZuQD/VkBAbFKtdiasJX4AYyMJqfWPfj8JXpIRc3psn77iCh+DzcAs+8n9STH4Dtb
-6+eyvl7Rf73MyyrWvVTerMw7p99z9ntAHH6ItoZ5MCtU1BZx/lqHB/u53v0qyOFR1OGLqMat
-0pfJscPeplrpeXpGz/ykZvUMjh/W36+z83qPLKEiEGoIwbPc9dcNKrFrmi3utudwNXTnyznd
-afDjaV17Tqs9H72hf/cqSBi7GtRj9/38nIdwRuhEjWMNP/Ed3c8qJ8NTTihjDMp0t5v6dHel
-VpiTZeq6H4HldzWxoD01jxvnLSr61biEC0hMBnoGvOseWO4zuo4Z/G+6id3GQWxan891vlm9
-RojaW4nYM/TDZlH0OEaVdUR7fx9O4I3YGiOO0w40llv6qUfZ1bk16g5Z6l7uJRhpUFbsWYtd
-W/oY79C87iKt2ei5sqbfeaS1bo7EfXzY6sTkO+ionMNt7YpmxXfxtn1Gc+E5YtGTikSnQUSc
-QqnJ/liuPG2jm9UJovYh++eiVsYC+PKb+oTl2B4gN3HmaYM/EJgm+/RQzVLegom5RU2pG97z
-gPYVK91eglfUrmdqvbppvSbQrntR35/XdUzq6Xehg9JHljEP1yKOrSJ4nxzhIX3dKmvkscYl
-sEC39fMVFJLN4O7V+X1KM9dZtx28TlIhi7/xE3TeUyNv6KN6W+Ecd8U8hg/WJGtqwe/YPawc
-uM4qfM5igueua+bn8KZ8UbvNq6iI2F3evEbngJPULSow44x8tk7sFlj5DSrwi2DHKyBcjdc9
-Zl+0JuKyXh7VVfSOcjBQreRwnae9z4zYJ9vZJut3NGMcxazG2PisQTQATuGhOoqntLVWL+h+
-zqDNZJ3pXmL+LL08+yV6bs7S7y7GJ2D5ZFBNqGiENnAsGaArfiNRFHkIdvkAf56m5medOssn
-IJL82kfz0/nSh+iArOnJrOBAW2VX8Ht7PxzWVXgdXYCNOasxfEGvtzUzf6CfvaOfvKFrfAl0
-T1pzeA8m8hhVRmck98Bg3NH8fKRPXFEU7Kh0Pem4m5lqbsImCJ4iTMBHYIdadYrkQewao7uC
-gtsLeq6vapZ8W1dnRRgzNb5Fz3saPNEgCoZv6jeMZbtMhbau2bOPIpI7XjVy2SWwyw/wRFig
-x7moZxd0rXc5mz2vh3QP1qztI2Y6otNn37UIZHkX6qwlEMhjPA9Xajt1VR3ketbUyKNLdxgH
-vZUjNKhzemJGRl9A1a2T3akH7Uhnf9OgbDrgml9CD81z3DujZ2mTKsgq2I8D9MDvJloIu9RI
-Qt5mrlMXzKFdMK/2pKgS3SyDNnysp+vXPJHcAR3EbXziQsWwE4SyY8o2dvwJENzDrCT3ri/i
-5OuffAtMXju9fO/5zoCGiMIr6Cy5B+n1cY3ospPujh3BvW+Y7buIzugiTLtIe5UrPZ4DSwk/
-Y1tRdpWc9hFY8zXYcquct8Ypn8QF0t3VIe1KoW/3lubgDzQ7vqPvjL0eI4p6ExX+JvjG8yi0
-3aAqbpfjp7i9+ay/R8ayobm6rtcqnfd5KkKHKMCXcSNbpgc6QydnIfELnQcz/Jr+OzhT2Fs0
-B99qAB+JqQRH+AooHaPcKqBXBlHCtCubkcXuod6j8tcE6XJfn3gPJNU+ygtWFPA1PWV3soN2
-iOMclbToHWfQ7DGOsKbzt6KRLsU5/AjtWtAJDqYTXbXAe3R9KJt4woRYe0vPbpfMohc+Y0HP
-3D07sw4uaE5aK8wMhzm9JnFYtVZEQTO0m57ZDn2mskZtCWbDJmee2Yq+tyWYV67bd9M1M1rG
-caYrGkV0NILbniPWnGKbgp5SCxqTrhAUqW06D4p11XXQwEP0SXwezdIrstaqOUKD9B3MJbSi
-4vOwdTvh9eXQAmwjvz8A6ztAV8e9hKvgHI+0M5jB5CrTDjMuvDbB426DzH1Mj2mDymeIzprx
-Kn2VLFzfPc6sSXAPsfI5u0WkdW2d9LQu0NV6U2vou5oPb2v0jOV4lWrNFhiPLpSg7ffhmoB3
-7E/xdjUCbCv+Ofxb86lK+lkJpdhqHLSTXH2YTLSb39Bd/QkObHfiH+nn34ePvh+7F/Oyntfz
-qPf16BpOoAOXw5v2ssb2AutkS69tVNyn6Z434m5myB1y3O7ofe1wxnt/xvzcwEMnrBufoNt0
-8V2X7mCGH9IBnmRu1qlbD9I1KMDFbSU/8tlepufivnBEtW0FfNUwWNcNxrUFl9YO+hIjoO57
-NL9dpZuki2uUyQlqd0P6u3Y6Ia4S5FkPO1QQD5M80r2iD8FOuLZgLZbgpPUp+78/3R03x8EP
-9O+v6tl+pq+f4dPQHjnbugP+eJPYp8j5aU5BgfVgTkRWV2WtTMf6k7Bdf6gr+66u70WYQ+b0
-TRGn9qAYO4zazDpaII41W3AyewjyrUrkf0efsES1352+Ovz2NbC6R+QMC6DlVpLdyxnJbZxf
-OtCgvorHuZU9jGu/CBPVur9jIB6sVDSrvXJW89OvaX0/DNfsIk4o+6BLu5mfT+gJbqL68XM9
-87/Wp/21xuBv9fNfaFTs8W6s8COqKN6PDqi52avqJWWc39UY/khj+JPobvwXup4/1p2+qRl3
-hX5MKzvNjMbMnW8rf1fBcQVeURolkAHUIMv6+Q5up2dhHl/VLPu91vVvQVK1gim8qTGyJ/IS
-VWDH5EFN09wf9zF79RqAGRL6aCOgQjvoE9hzzNnAse65Be+xCliqrGaH96dW1I3vgAUwJruT
-U87u5l0osQ0T513Uy6em8fgj1HdnULM3wjsbTZP11og0atTJXdMsRB/oin6pMf87Ounj0a9h
-GI9pBg5rBO07bIbtIfvOkNb/KJnvfRR2c9F9vEPzVCSdNa2gv9DQ1zz8kk0UDWbgvhzjofst
-jaxrJo7/X9GVXdAOOqZ9wdxDx3dN+tMTOJ09AfWWB0n0RM93iRjDUcYqJ/kKK62dk8hx+gG1
-/zoqWntwpyuwDWPq5rdQxu9DMXeR2obRRNOclOY2GOkxmJw9VmQzfs5IXUeAF9GHSYFS8klY
-T2L2kD9/pZerWf+oz/x7uH6taC39lrkRRfdB4Wzqv+yReh+mknX9v6sR/lNdz19o//mJ7thq
-f2+gSZvXim3TdQRfIO9CxtjUcWTJUh831jDNep5kNpU4Xa1afEpj9iz8XvsDf6q7tV73Y50g
-y+QOa+iReJ5uUW17wHPsYLQ3yJJz9BQ6E6+GcBW5qABTu4aK+6bGc4l/144L/BcgPryj9NEh
-y8PC6Up6YOO465mBM6D1P4hatjVfzZU5r7G/oHcOvMMUmp/74FnNuD2h9XU++lscOS7qdUbf
-W1l+GvdzI3meouywh0ZVCx6Om8QYbWCTgkfZsF7jcCNXE4+5BXQErKM7oZGZABn3VCO3gQf4
-Kxr7lxIX7XGdW/ZUNxb0SNdxoD1gG52aAZwi74J+2yZKXuM8P4wDM9jK1c04dCDyRK1lfBg7
-UcNzvH6MF+0GbJwGWPwbrHOrUp3DL9pOFhFqEz3aLXs0J3t1lvdoBXVxXZNEUAVqZCl8C7No
-khots4kqpFkj98kdc4pHc9E/61OsAfYueiipyB2Dr6htrXHODKCyvhB/T3v3n+kafqyZZfXJ
-d8B45zUKbRqVAqyzoIsaaxyP4J2aNWGlvmYc9pga32UTnq/VjC/rCbyou3sJzw17qP8BX+BO
-ruMOLgx7ZMqHqF4tEA9n6SUYJ2Ws8jAVvkISawbEravvLfjCHHJCfYGXU6STt4B/3wOd7U9Q
-tx7Qp3ej2ZwiqjR62BmSOyxWdQy6BdYwyGtnyuirMz2r0ja1KxbYtV1PeAqy5ALuoL/Q15/h
-XnpS++gIakv/pPt37PSAXP3gmzpYJ6vYjJt8gn1w36xIJJCNnlJTaQc7f03X+4VmmrH0t/Hx
-/ZZG8DnNoAvEVf10bUZgtbypK3xLd/WqZv95MAD30BauKGbaB0UZMrh76N0doy8RovNDMBqu
-fuRg0QXtHavddtMNdDXd+rZZqlKLoLKCvo+1VbroAwyB4jyNp2E7eBCfmYNwvK3MUNA9DvBf
-myCWKihDeX006H081Rj52Yeqozs4DT29Kp3W3+v6vyIqXucE6MZ30n1gY7uzinf6IrvCfUc7
-yutaI1fgR46DTnDfcAK3qkfo7wxQvX2AcoF3cKOZWuABD4Jotk/5FgxmO46fA+NtrOWH6OQ2
-8Sx8TK/XK/0QrJsrQmnwSVa/t3doL3iSOsxAz5djVn/EKbpNPc+dCWtLZHRNBV1bFxmC44N9
-raMK2v69eClYIdsMfHdV1+m5zujraRAALdoB7KRa0K7QpvvuR93XyPcDRTgLROjTIMY/xzWn
-U/MzH/21xvjnqAMtKTfdJPtd5Exr5xONPjKnupvKgddGnipQYGY8oZ/jyKED3PB1vIauaKZd
-0Yx7RnvuSeLRYdTmJ1CTOKuruwRv29igee64QnXkrsbjHs92i2yoEe+SOWapGHbAgs3R98tF
-baxw9wyM2nSHxdzdQ+pxHVxfxHg3qDR3kzf2cqLPfVP/SkXBF8hZQIaIy7PfGeIqeIMW9pod
-+mbHsOhrdNNWmJ/2fKpQ1TJ/wgx664I8hl//GKTKPrt9VVeQAQPriuYZ5ePPRW8p1nlN39lT
-Zgos8Cy8lV348+YqnkLFf4Wzy1XTXriC7s05skmxu1on4Yl2hFVqtN2o2Zrb+bGeyj+z4x3E
-V8FSmAsWkdlYOcLIVeObIpTDplHgzzCudd6lE8+YJ9RrHL/ZNagFVfJH8E3MqmrCms+BwrJm
-5dmEFT/BnDWey8yIBd3PJjXyOc2ak+wMRqq7czaLUnpKM9bImhIRWCca2bdBvxxrvRuNH8ef
-aC+4BePSPTtXeTvo09p1toQe1DDVf/dyaqCTajBh23R+dqHjeg2cbx/KEb6ufY2177yHLsko
-HLcBOjJjKMb2gCIqw9+vUS0MbMplYqanqPLU4f8dx55z3sODNm0rq7+Kf22/3qEXVfkseB/X
-qDL0iTN0qiKYErP4iTdhVAY8Tx5N4Vmwyxk0xNeormZgDVSYiUF7M6DpAuLTsW+ZefeQDuMd
-2P12FHmk0buvzOhu/CFeR4tUGrKc0inY+17b7km9rKj2h5qjP9KTeRM+/yU4nllYoeZ4TNGf
-W4a9fE7P91lipH09/5BvB7RGBA4qBr/RE22Ru+2DoLmGV21TV5MHJfoh3zsecddzVu94CcXM
-XdixQbcqQxTo/zVwBjripNgkZ8+h51Uh2m8lxgsVv170hDzKTSov1vXtp1u4Ag5kBIZOeI2z
-9jwCc+h8zFLZuaB9a06r9gSowho4qSNwDe543Kc3HRgsT+jk7sUP6Dm14RayCcJ0Wl+HYREY
-/epozGsmpndwAIfXNVX3gCNqWV5/Tc7SEarJ5rXZ6cI9hDaqYpMJArIdf5pCghQv4oqyAp6/
-RMblLKcMH8UozkMwJz26i2HOky1cPVI6EY6pJVVwBEuhazfOajV+0/zsFiqulzQ6s+h8FbQu
-2lBUDqonE/Sbi+hoHMK6bGM1NNmTHetsMdvW6a06knuir9ZF+UBr6GPmo5Xw78Cjv6oxvQ92
-YZG68iznRE7PwvFtYPO+phPkDe2hL+B1dAHsdnB68m9eQjc80nhVUTk9AaqmSs5pLsOw5kYP
-eBSfXxtkh/blMn//Dl5wh7GdiN7VfXyM3kMvPji3wVieYOZb7TeFBkMKfEELmI8mblppVuLX
-yNkyvjBep3mckZrU8zN8rZEBDOPwtkam1gP7YgnGQ4Hql5XV++gddcD/tEL68xrzU3oarlK0
-4KBgnkY3WsJxwhHaAPFQJBM6QLd5BRWVwMS5A58yS7/4CNxAa+TdZBtU2R4q1E+ojFeZHRt0
-9ArMoAwOMkNUSU7ifdSGL4vH/iJ6iWYm7RK/OI61okoEezyTYD19mpToDh6Qle+QsWXwXnLN
-y2o99zl/U/A1jJMqMOvrPMVz5F1WWGigcf4M9e1+9BVm4Ry6FzzOTE7jQDKma+xFB60NvM42
-LPw0HewiGI8N9G8e4gX3mfbL32sevqvvrTT7G+1Z7+lvrmpMlvEp26KK3Qm/4zj23X9L739F
-z+KiPtOVwFE0aC5q9V5GhW4MzsQZciTvSY5IgrJvUPqx1mSNM95IhFH2pCIOJ20oiQU8wAY7
-xjGZoRXQzFn9ABydI69xlHg32BG9U8acDRmYsseJ65/VbWKcq1LJ/pHWNR0nfhKVJMKJOGsc
-+8zr3RZglLbDCtqlttrGjLEKlE/Mc5qjFxKM8yhxzkiCD5okr7cDij0hDsA35aPABGyJdsGU
-l3C8iKLARknT53Sveyv5rT1d8SZ72rbm4gZ73BJ1FvfmWznh7+PK5Gh5ECyumQ5m/YzDgMxq
-7EMeZ876FfRfXO9zBNQAN95B/yzmLK/AqlpFA2WDOryrOo9gsDs7bsCFfkxHcYUqQwQnMShw
-uxvylt7x+/rkt9Cj6aVPOIcz2CQMPe+kxqhkydaH9d/mAnUQ4beDT/ETqoLD30NzYFdPfF/z
-cgcG7+9133/Amfoj7Z9fwDH3HvqY+PkhiJFMEjUOoOdqvUzr45wDjTKn2HOGvOhZzvdT+psT
-OHuO0X8bo3PRSjfYmfQR++WQ9qhh0Iar5H2uT2eiu5zsx+yhDSqbrkY+0r+4p2dwS8/ilv7l
-faos1pGo8LsxlZAyczHDTGyCUnWH3X2SDRAmg/BFj5izZVQvjYSK4wP0MtMJtzCrd7cGRDZh
-iGfQ8OlOvFPO4lbcSTf5LHp2k4mewQQ1KDtKVOJn6T4c4fLiLKEAfyCN+5v/lGCMxWBH1qnr
-LIGxWKcKvwHOYB5FtVV0OFyjvIWawYT2W2OURnHqKerrvnb7fe0bNZT0jZQzH9AOSFkUmy4k
-PhrntAecpPIZgVYf4iww4nJX774MZv8YTNDHurJ3Nfq/BY+8oX1qXjv4I7JKZ2hmt06C3l9C
-denbupbXceDr5Dy9jDL5OY3EOf05r3l6AWWzXjhgE8wJd2lD3p6OQl/ZfNYNGISfa57+VjPV
-2p2/Rn3F8/J93JKvarXcJPq8rb+9Q/0jTeXAMUIXlUyzNCf09SSM8Wf0ed9G5WBIc9V6HVfQ
-Y/aMndB/9eCH4wrtAIiMNhS3nmp/uo8z0B5x+qKu7imVhKqeyT75Twzy8D4ItgGexVGiEmAn
-sgp7YpHce0QjNaZVPUjcWKbKGnCjrbBUtsm++zmlq9RAK7D0ljg3V5JZYAXdu7DtKqxj1wBT
-VCIrYE/OJtxsnx0XyA7HOFPbOEufo+5k1dQ0SiSz8JRcV+ghA3ePtY8qrzlRu/gO7dE79jO5
-QeZXUhawQfdhR7vEHqzRP1BTySe4+/Oap8/hKPcEr9xBVIutUpHXNQzjVBtrr7QCcZuupRsG
-52V0PHt5nacbmot6wB9YO+g2kZP9HAvRrzQG1nX9lcbkXT2Zz3R1D4nvnrBqh7WKT1NhnI+v
-JGjpF+kqp+moPsNstErGHLvUHLvorGaL1YXdg5/WzwbAsJi7ZvXUEjPMHLp09CXrwh2i1fiv
-NTt+pifyT9otP9YYmBM1j9LFH3CktYeIqxlplIBb4Hi2ohJ1EfWoUc5xo6C/ozt+SyfLyzjD
-usduXafnWbk5npQxX21kK+6TlkD3GXVqjss9MAjrrJ8KDqdLVDZjrZA8eXwFFn+frqEzYYE1
-wIiNokGxoH3BvoSuPDdwgu0jErV+olE7c0S9FfQUYzyIN+hBPQINtYJz/BJf5/W6jz67O3Zp
-Kv5bfH4f1bw0J9QJMmP3jp5BgcTeUXbMGlCGOMgJ5xj8BPihPvr3rvJ3sYvWUdOIUKy/i+Ny
-LXnZBcudW2eo1lG/qiv9Cs34At45n9AfPRF9hhbkoO68D+yCc9aIPCTsSvYdmoIJGHx5ptGM
-GcV983LCRJsDa7apr66rfAFy1qqYWc3PEh5NVtz7TGNyhwjvIc4fBXDV/vw7+ter1PrtSfYd
-XN7MiR3Rpzi6m9Y6nkr2UmtfTHPOTOIq2Eef2B3nGt1V13Jz0aeaae9pPH6jcfiVZt+vdfe/
-0yd/qtlxW1fyRFe0qBWzqN8y62QXrNdjEF6BN9BB3NiuJ+MMdQptyAvg9Z/D18y+NOf1kyk9
-tRH6V45NZxJ+nPfxA2Idd4D22C99ppnhsaLPWtfubeSr8b1m3XQlrPkcjqyt4HaMr25JKhgV
-nVf7Ol3Mx9jCMfhZ+mmH1C47mMfDCbqsj+r2KjUU78t7qDpugQBdAXNqlolRpwGHYk2lNOyF
-r8DZmvdvR6AxPYtpqjiO9Kbxf3Httyv6gcblj9BH6mO9ms37fIJsPI0OeEy02E3v5ynutW1o
-SFkR5is9/S9RzlnSn9ug2OxKm0I/9UM4IB2aG1aqG0Bj9TZ6IT1kbAXYhz36lAEy5A4ykpPo
-8g2jk90PtnUEB5Q2VBoug3e+oWzm99oN/0Gz/uc6IX6hT/ln8J1FXc861/OUvfM+iM9BeiUf
-aG6677CMN8Pr2i3e5pUGg/SGrubbqLWbzTGL6t4cHTdH50YFTpKTHKAr04eK5fv6XOsMvK81
-az7eR3hjL4Bc+pgc/apWyPs4ZW+hhfcVz7GGakITZnAnde9+uAETrJCXdf8v6+tzupKz4KBf
-RotvhjV0grrbMDnREShm5yuH5FpWdl5HIWQBnZojnF6sBPBr/CCaCTfCvKFWcNypxFdnGn30
-WCNT1emyg5/rFZ3cr+jZv6b3f0WfF7R9I+aEvR4D58mZSY3u9RPO9G0wL0/Yweo4u5iX8Xe6
-ll9qfr6PbrvXSTsdUKux7FFXHgHTNkgNJw/i0tWUt+CyzOIf9Ro7x6BGwUg3Y53zRK5D9EcW
-YCCN6zWq5+P9o0q06SrJHY3FPdhYVoO7jf+AvfmsVN6ueWpHY+s9j9HlWiKuNipmEm2DLrS0
-ThB99YG6HMNJeozMrQ187phO5TN6B3OantMaOZ0oSVqZplP7Zzsc7080Cq7qGSn2iOjrMdjA
-fljW8/pXqzqptuAD29vmTzUu1ob/EfuolcSsVTquUTBixYilFlwD0olO/C7V7RF6IvdBZZtT
-f6xzvaGz/Ej7575m4hoKXF9oXO5r71jhtL2m5xaurIznujEEIaK2V/w0yutnmJNnOctf1TVc
-0Yxx1HEKnbMQA59mBRfYvTpgSu6TFezjxVOC43eTuqZdDKLot7rKX2o3+Uecg+qx3QDvs+f1
-ckdpOKCuUVU0roeKyKuMzLf1/YsoDm3hlf2a/v5FOESu0NfB17XTqzyg618D35AGa/qAunms
-tWmH9xq1fzNpfwvbOdK86NKT6tdeYeyZ6+xddBMK7APTGocRlB7MrHkdb0R7SBmLPQr34jJI
-LTN3GzhiXoAhuYs2u7N212OtTb/HWn0Cw8y6rXaPfaiRuk4fL9J+FcefJ12jZdC25gAbgWHu
-8iR+tTHO6ubBXdLVnAddn0fzrS1RFqkkWVTg9FmZ2AzYc/TK/6B18496Tr/AOaFd/+04cB8X
-q0XOmy347d3ES7tocXpnsE7OO/iEteKqFjih3dE76JO0aZY4Y+yEwevo2I5HRbL/LNzU+5xQ
-TY18JVF6Nqepqrs+0B2vgZa/Si1+nhPOqIt1dAMfgk01o2JYa3OSCtaYZscJ3bv1yM/rFf5/
-Fo/xkyA8jfQxgjco/ozRyTqg9t0K/7VCrXwb9OCW5mcJV3uj9G8T/3vlWvssr9XchQ7c/YSJ
-4D08T8c3hsdpFM5bet4/hA+0lniYrGjuruucX4sv6fuzMLTMZSjHreTyaXhxe+h/pMnUb4E1
-tRZ9E2bib3AiymmttOoasvhP3Qbj3gE6Yw8H5n5QzhPoW7sz0qcnYRSOVfCMszfO0d6ZnptR
-5NcL8JX2wW8M089yplbCYczu7dYb3uIsXdQMdU/CWELrMdvn9jj+A2vFPo7TYMs3yASHyBXr
-uBsHNHUblZzxRI+gk2pJP3FZDaRtT4I36QPd/UDX8pXu5ve6u9/qrr92t/gEhcvW6BoY6VA3
-LtA9CswC85CtxP2Knoj9b/5Kr/9Wr3+r14/w18hq1Waovp4EN1njHKzD+6tSXVtB0bigdRBp
-PVSJPd/TZ9nN9V1O00Od82uaHSErCHjKFfzlSvjA7NAxOQfupYNs6DQ6maeZpVZ+PclJbi7Z
-bOJU25H46PSgSXZM1t8EWVsDk7VNZnzIProNb7yFq7wJNtarqUVfW1EFvkOv0/2UERDGLQn6
-akp3ew6F/D09c+v3PoaBdF5fjVt5Ubvuy3r+3yJGraPxHHpUFTrHMSPeQmRuJ0H7L3+iv/mA
-CN3ulK3aRXoViQ3ryY2A07zKqexO4jRYwI4E0XpR93yJynRF11HGWfBtHA22tJeb62If72P0
-CU/p+7MgR7zqq/QG6uRr5YQ5Ow/qeoueTk27l1VumigDXIcJ5u7mqE7kU7qOs3SOi/reX7fR
-Qz/BTtmNSmQX/je9oGR8ujZhZc3BzlpNIoRbmq+fEPsZrRJev2NumlnR0C6yT81rD6WXfY2V
-PYPtw9ND/vu23v2Hmoc/0uf+Ma5J1vg1F87odEdf7gYvaF4H1fUyPcxjFEd2qdWUdFKWOLGc
-lxnN+SGepWkYgzeofB+CDtmkUlunxp3TqHdzr2kUlc7gHTyLAvkI59oJKtND+tMJmmVMvz1M
-3pxj1eZxHKuRXZXx5nqM5nNRo78HY8S+zVlwc3aptJfGHWoX3h/OoK+0wDkym/SGeqmW9ZMn
-BazGjGb2Rf1LYyOMRX0+8b09o3/lJ2Yu1DRo1wOq2L1UyEJvqQoT4xiH4WXWiVkrGVSg3sXH
-cVxZw5Tm6RRaxEbcPkFfYwbdgyjKR0H5YZ99ycrgl/QEriQc4Nf1Oa/hD13RU7LHudVjGvFF
-tN1bYLBWwU/ucSUp9tAdYnOf7TfIT/fgLN+hKjuAIoP7ZQ9B0o2DuFvHf3SAPCkHVqsLhEkH
-vbSA6eiHy9cEHzpLv7II+7eg8erQHfcp/uxHs/BLnAKO4MJdh3FyTJfLnaw0kVoMGnqWylVB
-eVCL9spY+XukvCirk6MNRuEVGAzGnVsR6JAObCsc0Sqnu9kFZivdRfF7W+e5ecplfV9hNd4E
-R5VBu8eR2Bp+nBEYlBR1U8cM7dEos89Y3FnY/SNo5gcfmPw36jnj6GbnUb5pw5u5RJ5ehh9p
-Vd09ZuhduPtFGMSLiZrOBoiqfr2GwPVvJ3H3pp72JgjCWaI2f1IBnJz3wXUwu316aic0azyL
-3X0/pf10BqyUFS3nyTDP4tm3rXffRMu1G1/cIpyPBmgdM2Uy6HjcQFVoWPPTGjXG9DlPPatP
-Oqf5MMdpeJNun/sGVVTzhnn2Maesq7JnNFdf1Pu/rfd/Wz9/mXp9FJ2i7mUVNdfFUmArIrSl
-jsCm5KlSVMDcr6KRZ5zWDtiRRdhe3aCnr2v9BNZinihhn5rucBI1DLESU+jFGCnfhsbsSRRA
-j8GpntLnOQYeAAP3IPGFechZa3XZIlWUq9rPrIm4T7xeR7s2D7MrDWLE8Y29Oc/quwvwXbKa
-HWn4L5foXrmPYXdZxyFGUW/Qwe+LjKp+yJqzTtYT4u7A0gno/SJ1jOsgZvL8iyJ1j066uSW6
-9ENU+LrRBB1JZms+QZoNkiG64t7BKppC672NvvOU7mQApptZ07v4HqzB+Nwkur3OatmLfWY9
-hIvTDw/qMYpLU5pRM/qXZ1CZiRIeSExsNY5+jtWnR3CbtCOR5+dd8O4DqOYvoQYwTvawzZ42
-Af5oj9roKKy0eVjAxtq1J/xN/+8w0TRYIWo38ncA1O89tGiMj35G89aOkp6fBXxQ5+lPZtiN
-u2BXB3WoOfi/voMUbMSXiEGLeDcE/OsxDNNe0FUx/dfgfFODQWM3nIh+ivcZKxC2o8hXxLkw
-Zr93Xv8VcXuKrts+DOmgonHACdFLT8DP5RRekDEZ7ij1ucCkOkMvyUiUZcbF87OdasU1Iu4S
-qsgl8PN7+GW1Ur+u42XiaHYSXa82OulD7B8NfKKmqL99jQ+tccJY6ddKumZ5dXFfy3SwSyi5
-LSacpgp6R4/Zvazj52pPnrPyUOPn2H1fe8ERp+lwUhEYpU+eAVfZBQrBCFOjQxpoU82iCtCM
-g0ZSOLfS6CcckZ1a9/k2zggbMGge6L8dWXwKSmxAozKgGTNApX0H1aczuqILxNbOQ410Nl82
-opbZjifWqH57Unc4DIbceFT7jq4RHU7izrBCj6YHRRvj4lYTHed11mBEv7KJ9mMbrM8K6CbH
-G3dRee6nE7VNDXyUc/UWzq+TrKlt5kEmYX2mqex2cIUxqLIT7KdNWCyTeOMd4ZHXj45XCpx4
-G/3XepwDq9FkNw76bzXisxb4oBEK6Zt6PYbDUOfseQBSPSKvM/Zwi3dI0cd2pdjqbBGIoRxY
-gDP6arz4SV45+kvuvZ6hMrWH4pG1OWtUFBfh4jXpLkewYPbR1sxxNh/j9Z5BWyCgqNs51brY
-V7v1s16QYDsg0TvZCYqsMTvL9RCLrqL/EroUq2hyl0BuFjnNdkAhZKPgD+/u39ddFjsd2Nu4
-n3zCcy7mtPBqOImnnc/yJl1G81RPJvrIc+xw7tYEra1WdMSqeJcsJhjYG6iguJ5UiYMicWei
-Em2NhSF8F7dReDRKZJp3T8PZn8ELpx/9vGzUz/5eoes8Akbb+fkOqj3d7E8HVEG6wCvWWO0D
-qOEs44Y9DRfaHUvz6nbRGc/DQyrRF9+Cn+6afL/OdOdns+jk3dTIXEMzpx/MqWOqmFVZQK+9
-AGYpAqPjM3Wc3maT6qQZksMJkqMzCjolQcc/g1bEMTOhxmxogic4AkeQIsZt53zdh6N6gDf6
-BtlCBc7qGry1wHXaSnzg9sFI9NNr60/m6DlO3TyY/2fQ6m2Ab3U94QRrNyiRxugbmacbXKSK
-jFCaitgGyOE29ugyfeIMqytC98IY/xRdu3AmNZltxruUcQkY0AiPoKt8D03JDiqfSzjExrgK
-7qBOU4+P0DxvAak/wt7fgIU+xtwzF8Pfl8BtnmBX20f/Zxwdu2P+fpQ5UiHumoH5VkCD2VlV
-lpy9iltQhVWxTVbqU8O+Dh+hL9cBZ+N9PeePdL1XcVyZJnJcw+VpDuemMA8KRBhjuuqTnE3e
-7zfxJRlBXzKwbAfZ65u4sA9o9EaphGyRRQyAuCkS54XzfRt8p19tIIkO4ZoEj4Ys3jjzxCA9
-zOgtdHwG6Jxvg+XKJc+pN3Gh7EUxppV+5gBKfqFPcozGeg5VuIA6z+CJuA9iyVGCn6TxlnX9
-qeGk4d/wc00TlYa50oRvYV3NKqrgZlN6hron59y6lZW6gc/dBHdv7mE7Hmu9dFZ6wQW2RUH3
-skz+OAcTyRy7NXwKrdrRR73YTMJW8q7QF+4CLRvQxJVkpEoJbtE/MTq1jv5TEaaKrz/Lv9kG
-d27P40kwkfdAVbehTr7GTpEHaebxyXC3zqvTMA3NfMgRD8X6l+blHjIfZ3WXngPOwE7rHeb0
-iSe5p0O+NyN4lpygBY7kANpKedzHu8D+HjLSJVSWjGE8JNa/D9+2nbr3H+DcDim2cw1nUtnj
-SeUoJzVPJ9E+20gqp7XYCgjHnBxjVKTNcdxgDnbhJ9XG3jpK9aMez+LvFHqhQ/rvIWrSVs5f
-1msV3FQ7Hg1LVLzTnG9VxsTjuYH6chfn0XKSVe2C4szCLfR68W55TN1rWD/voVoUnA5ak9y5
-nXy1wdnbRAmp9V+g+9LslSV0zcPe2aAOVycyOiJ3i9F/jJmdESg8q9g+BFfVAMFbhkOwQM3e
-s2oc76ZD7YqHIJUmyeDSzMpuKiBBT6SecD79bO1tthJf1J2e0dhMo0hgBaQuIpYGsabP7SzK
-wll28xoctkxSa3fkHhEf7LP/rYBxSoNtvQc7upN5eRtXHL/cPTNvtRVc4SEOD00Q8y2sX2PQ
-Wtn/c+giunpT5cycwk/S+sn2O9rS1x1i/nNEhQ28RuzINcZe6lzFaDvHWTEqTN2Mvz/ha+R/
-A1RfGYyhc6UIZtdn+MtZbd+ePFOar6eUi5hvdBpVy9u6/ifgdZvkC44bC6iyraJb0pk4zU2w
-nqzd6bpNBt+QLnhleSrU1jv+er3Nkt+XQC2OwUNe0kz0KDlv2mL9VhIPqEdgh/NUsnc5Tcwv
-7YGXWYRv26e7HiPStHpMlb8fTPQbe9CcTHFKxWDc23l5ZmdQ4/IuFDzjt3jHNrg4no11NDCK
-8NNWEySy9QRXyCqDz8J99s4GfwqcMTs4dRlVPZe46Z2j0mrlu5j+5wkiNKt/u5czBEZ8DYSc
-GYnPogK9hQ+cfVfCidCh8eyjjtqHv/w2ijwhmwz9Fkfhx4nm3jJZt8cuBVLvKdwB8wNaNU/H
-cG39XNdnXd6gLdiLi6kjoQxqL2lYNmVqWW0JFiiD51E7O8Y8nn3uYPnuntNOcgVfxSf0ZAJ+
-sIlP2ySrs0wvZ4S1OcisSPGnyrXncIGIqYdXqO45/+xAnfmRMlzzM+9pdKzjbhUw50tWC7Zv
-y10wn86Ty/QLduiN7oHaPaJSaY8S8y7KceiWhP58J4yDHJnlGfI459Lb2h+s9LdKXXSGnWYH
-/ZUQc23gBLyDZlwef4AifaYMeecmXUH3TAa/Qdx7N29wgrhreQqG0iZ6kwXYwQdJtTUCm19N
-NEwikHZ9IBn8fQn3yy6UKrfgLUb0PRfwLzukXr+GZswKKNFFnaFPqNZakyKFUnqO/GWD88Z3
-domKaw3N2bnE07SPlVuAZ92vP+ahV1DpmNbnBe3tIq/JRIt7CpWu47gffYugAejeeRf8liZj
-PsIqPNT17qA95fkZfNyzKLZf1d18Br7FzuITOivNdXT3fxIFmh26irnoKDnHM8TxabDTxiLm
-oqAFbzUjYxTSaBav0rExP/Mcz3RBT8A+wYe644ApdIXrAl21ffamUfDGQeM4xY7RJOo/ZufL
-EvVtJpWdDeK3IaJHa83dRwtxTK9JranZRINuAh2YZfjuB7gzbybqWwfsK0vwSOus4yp31g7C
-sgXG6xC1RnPS67rmUvw8fKfF+AUQN9towJ3kHFuhjhqDEtlK6jzeqeyoaUexgkajn7pskcjm
-BDhQY/0q9Oym4N3EcahuVth5AkqpBE/DuXQW5lgbuZLj+ioVa8fNfdRiN8ifexINS3PGanAH
-blMHtNbNIdjUR6BZtvHe2SGfKKIgHJTMtnEqN7PrMv3xchy07I5BG54AQWXWnLlJE+xYh6jV
-Degux/CQ2OE1xs9WUGFq4w6ySWZuL8MKVZZRKq3rROO9Sa3OamAVYqOgJnGdLqk9kQq4PHyi
-f/EVnIcpPM3vg2/ppX7bgNM2kOwuGaoWocd0SFRbY+dYwddlCF/2p5p7xg5sa+8poWX0PJih
-UNOzs/F59Aga9A57ku6AORURGWkRZRQzSSpE8BH1CVdZd4j+ZrQvuiPpPfSc7ucEqvfOmR8R
-l3QSO69T2wtZ7VGScVXouZRRHzyCzVUD++coLUXE5y6HT42yRsLeyyWcxC7Tm3+se3GP6S6q
-jNNU3M3fXCD7dYy/h2t5jvrHNufmELvLnsa2yMwaR/WzTPb7HHr4+5r59pTZw9OxE87GJvec
-hj3dzv5exxFomA52GZ+FSToPRUbEZ1cWV8x7uAJau89164MEh7hBlXBJ63UdD5ANuk7e28dg
-O29o3zQvey8+S6Zglx0zj4zW7QEdMYxTesiH68TpJ7iGIhwG9+ODbso6eJ52YqoqO5wrTFba
-7+NaD+AHeq35vCqQveSpsQXXiyNdZw33dLsOGp/4FZyxYe1B09pXT+kOT+MeusXa6iAXPOSV
-5aSpw84J7OJGfED8kKJqukKVahCW7xqnxWl96kWq5enoRX19GYbeMR5tZ0FDegXv0AVqg+Hk
-OWNWS5Oeu3uZQVHUdZsOat9r8BN9Zo5THbBL9VbSjdyDyTVG9LvOSnUtrQV/ljIzMrglbROZ
-uZ9fhOVXjzeI59Jwt+vc9Shc8HUqAic5/ayn5jNhUU9zkfP+BN2NFeIb7/BmaB2zJrqpYO2A
-9hnDg7sCh9l700VGZofq4RAx5wHKOmFXWePsaqcG06D3Es4UX1sBPxPneQd4pIzT/VlnzAeo
-vM7ju+UKQh1m5dNEC89qM2Z/BD7WXfIOe5oPouiyiBL4Se2G08QijjmNN+sHtTNKHGmtUrNs
-nDtOU6s5ZA/sg8nk575Mp7wThe3qN7lQ0E519F0CzdZPtSi8+mA/O3aO49ANi9B13ebsi0Ao
-XdVvfKF3v0pecYL96CncMfdBOqJFdEZTVANqvCI4DhX0BK2CWiTeTSXX1AbuqJYgY5oJIy9G
-I+M5esxF8Jbu410i99gD2dPDDul7M3chcK5W8IHYQgVznZ6mZ8O0Rn8OV+ZlXHjty3eSWbSF
-c4er2mPkxw2qnb1EyHvUN5zvpRIsTJka6y4qYdXYFaJ6UpnIoUC+BXPXlcxpuM1PtMM81f08
-1tp6QCR0BrTFI/L6AVZzjGZrGseECb2LZ7U5zLO63lN6RyvFnuX83MflxIy+Xl6hT+uotgcn
-qo1EhayW7O25pDbfBRa0zp2egxm9hJfZlK5vNDlJhlC5ewpnskyEY9SI980qCpfuyRsr8CXx
-+pTmqeenEVsXyI920ViaBH3bSuwTOIojSe9gFu/CEBlMEWG7G7GrV5EVN4iWY5U9NPQKamDA
-OkFmuNPvcz/UuvPkGqEi1gTFcUC1PWgvNxSRtVLfNtbnoT75ASfXKGf8A7x1OlHJ3qca7/3T
-fY8mp6NPyRLnZjMOTu5WjciB8xhhnX3NE7ayYBqFsWd0H8YNPafxuwRadR48TC9ZjZFIt0A0
-BM3nRa2jDfir61Qj2uEBLZIjneJ8n0fp/1m4gFWUxZ7XHZ/Xa5q8uAqOLFSTqihLVL853xtw
-3Kpx0K0pUyk4QLt9m7pHi66xlYghMGdm9fUMr8dwG2b0s7CiF7WiXeGskMfk0BEYpY98jBr9
-KyCiNnj+J4nWSvDtB2BpBjWniL1gJdmJN/C5qmpu1VEdyFJbCDN/jLpHibV9BizmJliBE5ws
-3tPso7JDd9A7UimJw4M+cwkHr3mqD9apGdHIj4IbWaKaOZ3EJCNcX4S3Sju1jZGkatRPH6bE
-vjJJzrjNaTDIHlnjX40lfEvHBQWylXQUmLD1b87+NJqnoe+TSSrDjmxKoC9qeJEtorwYwbNd
-pZvaFz1OTot11IP76RJV2aHdbyoQVRyBOuvCVX4v0TUsok3STgVvkDnqelkGl/cLqLbYA2gR
-752z+rQZ4oBFPWuv4Ds4AeRxInqIluU2CpgPNT/X0MC7S6d3OBlHP5Hn9Dxf1n/bjfBFXYtV
-tc9pxZ/SJ1sRY4LYOYsWSAv9qXwUIs5Qtz4mjm6C1ttgxW7AL9ogj3Jn0ErAXWjUPUUd1mfZ
-rD71jD5xCq3PEqs2n2gx9qI8HFQLG+REIXc/onvelXSKAqc3dEhDpXobjy3rmFk/Jo267Bqq
-0zWubo9rrfFsjSNwH3QG5Pcx2LczZDkboGJmiE/qnJ/tdHE809fRK1hIeDcP8SWPYO9Y2/5L
-zbCraKud4smUqX8NgPjJJOpo/Xi873LfE1TNavSnh9GiPAYJ3gsOaohKfg6kQA5PqzR1GZ9L
-eyghDFLRWoUZ2wMaYYcIvki1qUi1xZhKV8lW6KCG1zLM+gIOB1v4hnbiU3QMq7EHjEtAnY0n
-6sLjxPalpENkfEoP7DpXdo+p9A0Ra9oZfZe47SwntOO3dfpjJ6gaGEHxkT7lU7B7dlYqo37l
-vHMdTKNrtVc1Olf1Lrc1Nx/GL2nWvKF3+56ezPd0ra+jKtCn1TsEiirLudRPflEmou7jeR1Q
-EwoI9CO6L64G1sF2HhGVHjA6i1QyWxLOcA5c2R6rsp/Oj3WWM9TVc1T6e/A66WcM+qmipkBp
-9ZPFtlEpyFPfraDrVgfLuoeKd4xC6grzNEb1eINzrkzGWEEtIsuntcEPa09erextU3qd5e7z
-WqF2eoqJU0fo6zxOcEZPqIBvg6vYjwMWKEL72Dp/H+NlM4Mr0gZ9nwJogxRIlgoo4Y7ELyKM
-axz30KlNsTb7YIaMw13qBgHVQ5V8CJxWA+yt8/gOoq11atHBeXqVDuUBsdYhs7QIcm0Lntcq
-Z+hmUos5BO/gLntAJg1S2QpojtMgOxo4UV0EB+0arnf9PC5anShstXG9dXrGwRWnzvrqgjNR
-RVdhGN1sxy7z+t7s7M/BEXZExpde1Vr6CmWxHXSgn9A/XsTnbUJRwEWN6cv6+h2N+ve0rt7R
-+ngLNQH7IA9QB7GaVNCaHWW3ikHnFOgPBndc70ihL1gjSgl+kPvgX6uggpZhAgQFhIOkU5En
-yjZ70HeUAgEzRjU/wsexLXF58nM8ogLSm3ji5dhDArbOUWWcYHuOEp5UEfRWDA57F3eQFRSy
-92ASew8N9XS/c/0bTug0SCOzY8y5DD7bR+CvX8CdZY16yjA98nn8sIrwTe0Xcsj8vKWru6En
-dI06+DCc7DWiwggVhqBZEbomeXKaKnO0m06Xlc9nQFKYeWguuHVpBsDo5cFcTFDr3gUxN07H
-d42cuJNqcei+HuhaNtAM3aVau0N1cIHXLqqYazBlF/Dk3tN3PvV66WSVcfW5wCmdis4nmk3G
-CJ0FSdePCkZ3oujgzmsMPmSANZYGBdEgArZrUJ05MkDuuYYuYV+CnrT3c7deBVRDb+N67Lh+
-GR1u55xWtprQTL6g9f6iZvEr2hmucLK54pFHq8V5Zg5s2Dld7RlqIjWYSIXEgTQPmqxKZbcl
-0QpJEQ/tUCs6BuewwyypcbIeJKdrlp0z1DLPsF5rIDPHQJO4g1egf19i7xqmrt7gruPEBTUN
-0i2o5BSTPbQGEsKZwBp4kxTO2kfUrEIVz1iJdhADK+SDrgmdBrVaohc5BYKgC5fpY1TY34BP
-ta1Yah3dqhm6MHfQDsigz+y4LkNV6iY4e/skZlC0NWbUNag9ovJddqsU49WSqEIPg4y0fleZ
-avBJfeJ0wv/rg/83ivZ+PpqgT7jNvAz7UYnOTxucx4PEGWKP3C0o4FVR8DEKuQz+/SbcVMd7
-+/jA7IMiLFP/nEJtbSOpApoVEYFkuaixmKMqZm2cObogJfRPZjQ7J8B+9oD6tFKZ1V324YK3
-g/qpojW2jvZwFpXqL+iq98B+DYyyPNyVLc6/NeJ58ylGcd+9jsLtJe2lZ5OayBgd1sDj7iE/
-G+U8KYOpGudv2hImeStcuW40GIrk6a1Efk+ouLhf6XpZ45uMPqLnU2etnqCr567DInqjQ+j/
-uPrjynABzeQyFbBxKmGbcOyCFkzo2QbNy0ZSjw17d4Yz74BOfTux2Cb3XkMZuwTOt0yt3z44
-L2rlfluvl9A5MFNqj17UMJ4wQ2Ad56kOX9b9WAnhkiKgC3D8t4gde+l9H+CJvMQOVcLJYoUd
-oYpD0BZcn4AObU0qsTH6RNN0qZusyzN6J3fYLtE1rOFR6nFuEnVPsEZ3cZ8x7naWnlOR+Rkn
-yit7RKVZapi79AgPUN9f0pzcQRHxM93/DbqdZSot3uGCfn4ZBM85uqzL1O1m0QbtTapiY/rO
-Op3GBj6DXo/x3imdMaGX3Q7vzhmtFSi7wFet0wcs0XOKQXzYp/4Gp0xW69t8e2cJwT3HDA9X
-Fwc0J4bpADxKfEzuUo/voadUBaGVQU0il2A+rFMyizOOlXyMjO4BgZHmNyugXoN2l3Vo5pmX
-vfrcUTQH58Hd5emR9YBqdWawg9PVeKI6PAVidA+dK2dHVdCWhcQ9d5AKaJXYuxOEZZTUPgKK
-ocaOfADS9ZidbJnr6WCtbICRaSG3GEJNpA776Dzaprc0H77UvLhOJWEM5a4qOgP7ZP8D5JwL
-zN4XdNWXwOQEH7kRzY8eHHGsMmallTKnxTqKw9YfW2K2msPgyPwYzZ88uU4Wj6GLurJXdd9v
-6Z3MeL1IllSH4eq6eJ0cvZN7L3KuT9H/PCLO6mcdhxy1CDIkote3gpvUOgzLDbwqb+habpMr
-R+BxDoiJaiDJBsH8+rUHrnIoqR6EiNis/mlYfw1lKX5F6EldZmf1GdOjGWymzBzeoRWQGD5d
-jezahOm5jBr8HRzSmiiN3Ex6xwfwmJrMjuAtuAdrsD/BVXbjLL+bsE3L9FnSdCG64dW1wKDp
-0XO1W9agVpC9Cdqp4uU5VarsSEX85Qa0xwyhWHAnccfYomIRkDuOTIIqnXeAder+Q3g/BQX3
-LKexK8FZULUb1HZ62A8Dm6GN+kqBil+DsS1EW4k2pZ9IHa3DB6AiwhzdBXvah+JmF1oO5qfb
-2WuHndC6tRe1Ri9qJZ1lveyhnnfA084mLOI+ukMbnIBTqPuEfK4TrMZBomW+DIr+iKx+nt5o
-BLJmBXRNhh2/AL49Awv/DDqIJRw8X9B9XKDPUMRFMeCtvsYpdVCDqiZ4yxQVjV7Gw2s5y1r1
-/rmO68wRugIL4O5dt7mduHXNg7hJ02U5JFM7RrVxnAp7yLx7weU3UBbtwq2nFy+xMtXmC3RF
-rB/Vomi0ANN/GtxK8Ng5JhrrAr2yTs3kAC0zq1pt46j8hLiigmrgUdJ9j+glHIKzaAFTuUpv
-O4WvzgE47HBa5lmPKeLeLrLkrsRRdg4Hv07YocOgnxuJd6ojqwweiHf1LM26uAdmrpd+luPV
-LNlnJ8olA2hJ7yYd7y00c1rgGZeonpZhWRzHwXcjRxWuzvxsJVfqRJHkGJxtK/WkI7TJg4LZ
-caKUm2Hv3U9U2v0UclSrjKyqMcPCTDPCYZnK3BT1/B2yPa+QIvp2LcS8zbibmnoGzb+eRE07
-5KeHnGKtuMneQH/EynbWsgq83S18yUaTaDJgd6bIf2r0Pz0nz1J5WQJv7X7uMfpxUYJVLYAq
-PiIH6UTJvxf333ZwJh1R9l+o362jb7uGSpN56lbd3SPC2E7GqJ7oB3YlZ0nou1SpeXaQdaYS
-XcxuKt1lzq3Qhw0Z22l0+czUbEePZRpsVQE/1iqdw+Aetw3fbRPnyt0kLi4SgzfhSJdQmfQ9
-f93R9dnuzKFBXWGXuHmLuRDw6/v0RLPsC524YkyjKWWfjDnUdFzbaRCNZxIVTz9Nz4sFsJDd
-sMMco6a0U+XQZutPMHbOdhpEqa2srx0yJVf3S1zNYYJEr8MPDNdRoPrTDZrV1acjOnxt5OdV
-MqODJNJ7gkpUCnSoc2HvlzlyzC4Q1YNR8H6Y5vwp0i8dgjuyTlzjyLnBiBzEoS8cXG2sOR9q
-+e3g0jM4irWD2KuCaW6geGxf8lughTpwKbtHl2YMHXJXP7NERfYNDN6HF/R83KM3/m6Wk2IN
-bHyVesNhokWZSaoSeUauBXWiYeJBR4Vec44gdzUbgmfbGsp79r5ZxyFpD0XuMl2T0KdM0/Uo
-E+tP05MzjqFMDaOVnlBXFDykp2BJb4E9nyBjM7ewXXlyH69Z5kgO/nrobRXZq6qoqu6h712C
-M7xJjrbD+mkBYeCzcwN/5iFmzWOq4VlqsjtE6tvss3vUHNaYKe10MV3daEd3ZEYzzO71IxrT
-vsT7qpF0TnepH4Tnk+McXQET2k4NyHivNvhRxq+3cp6FanOGvMBY1AoxWZE9/2FSPVwgh6mT
-26fZH49BuwS3hQZzssDcDMy1wwRxvcb+4KpmLgp6tMO8QtzeSVVzJGGnnaIXtktvvpXa6DoZ
-f+iA1eD1uA6UhsEVnMr7yLHbcX/thRMSx4e4Eh2BafpS/9Zabzf0+ffoEg7BydqhL94PxnOA
-7LcHDpf7nbNoGmzinuNoJmK9bsFrqZJVuzOXoerm/LQbZ4MJvI778WoIrh3bKCWsoFC0yY5V
-ZE6s8TrEw96xTwvuknugiU/SydkAcTAAHr/GODuua4BpH6ACb1yqI/UUDObnde/P6rOtuXcK
-BGsN/WCjcOxEfkzVYAs1hQO0WLyL7lDrKrPjdCbeoqP0WB/jMtyNP9o9OCZWzatQ89pIGHtG
-fLfTfzBvzL5BXSAZpok0h1B7bacTN0AsXSUfOUb5ronPxT5KpIN0E1rwlQ/exDkQ6l7xWVa6
-Z43n2RFonzpnjr07ltgznVcHR850FHaNNBpBKZT7s6ikB3T4ERrG1ord5BlsU6UK/exMNJRw
-ZdrxSOlF/yaPpuQs9c0qrl3HoLn26E2XEq2BRsJqa2cOtnJiDaCdnkO3fZZPqHH+F8ExGWNX
-5Rx/jM+EnYtaqSjNw5Dsi4Jb7zjv4i5YD1VDRwlVUHwhat0AyZdmjhYT1lOTjKEFpuwwaLxx
-YrygC94E81YHIW8HpHXWSoOuywoI3R0yxRY6s7sJ62qbWH8AXtw8bMYuUBEldugMuW4rMcsR
-tcxJcLtBBe9FfbXvxLP6+Rn6wYGt0M8nOB++g+uzNRyCev4OKLdUovB+DFeqD/XNh1TmXKXv
-07/oiq7q774iOqrhorWKZt0a2IE0OVAONPdZ6pxt1LMGqAj3krt1ct01Ir1jKjgNzr+IXS1D
-jF7QyOVAC3SgHdyLK2Ufp1CBXMrYjFKy16/hrr6frDXnyVlqAAEZm44Cf7YJ8ybHOb5NRSQ4
-0z5F8c4V5XWYPh2o7hxStx/SFYyRzY2gw9tC376P97MjaD3B5uxSi4lR0AgetZkEtTpCB9lz
-sgN1oDFiPUc8+2Q6dWbmOv6n8+TD7s014gegwtqIGErwyHweTnCWtCT1lywjVkI1IK33auDM
-UwSpUE6UztvAMBdQuhtC8WCQedlLzN+ESdpMGEU7aHU28Tt6TK8gpoPpnDgFZqvEntVFlWEb
-lG1waLoLTqCHLp6xTdvkIRHj05roKDyrq3hdz/ENjd9Lel3S558lSzdHowQCp4DXxS3UPdrY
-BZe/QZe00IeNEhZc0B002uaaXp/p+y/wOY/obto35UuNxQ36Rh6PsGq6YbN3EBmNwLXPE//O
-aRwnmLsVerxpYtNqwkeJonSCUGjBe6sHzG0nHM/TGsvg2duG23nweN/HxacE/rwIZ3YT7moO
-xkslwWrFdJA62DWbSby/B59vgR7ibtIP2WKVVeIwsqEDleck7mSH6iK2GOHJDpNHxOjDH3PS
-hDpPFa7mMed5FtxGgZPD6pzn8HTthiHUTYdnm26RtSPM07aXwQL75xE58SorKKL+WwHTMYZr
-RhreVT9YqQaclYAEOoJdXyITrONbWMJfvp291cosHdQawlpvp/LdC3u4jRx2DxdEowqsylrn
-HNkkZiui41CLQ2zSgd5jjApGB25jT1GCGICzcx3tohZQGkZzVuLQQx5CT85KD93owtsjOmg/
-W4uwDIZlGGTRGi6t3XrXTu2KdsjownNzl65cIQpI4Cq1hTyounVqmlaa6o0+0G+8pzH9AGx/
-jG7QPTIZ9xVc2U4nJ2AHNdc5vZdZMrPExYFd3Ec2UyQbStO1yrBbtjFu7cRnBVR0elnzbcSp
-Q7D86qApfMakOLv2k6dTS7S8wz6QIXPKg3yIqdy3kHdU0QQostM6wtqkh7iOZ9IWe2+JU+wA
-zkorOK8OdCTtuzrKKZ3DK6glwfuEOn6Fl+dmljigHTfknm94lYPM7DbQw4OMacCZBCz6PLWP
-FL4wARm0n3hHVVnv7cSLx1Rp+hIkUHei2xc4ohugZZs8gUOuPYqCCnpLko2F0ydUw9qTSCkd
-pZO4PUKL54iZvZUok7uHFvqaEUrW7vA2cPRwvtOAJ9OBOsE9uouDCUZ5CO38BRgtOe4gS5bR
-BjZ1Bhcavzw32tDSN87Y3a2pBI09jNrMNookvfAPNljNXaCbqjDzfdVH5OTmQ7Xos/PRx7q6
-3+nzfqP/fhctuhzV+qXEZcA5cAS/sVXPshU3nFk810qotPTipFvCzyR4mhQT3sM+UWg3dRbX
-jHoSVbZBWHlNUPx2qhlEa34PpHSOGV7h/Ai1rGYcJ0zKLFrwreDEinjMZKPg4tcAnV8hs99g
-7z1EyyZk+HWUexxJ5tGCK6N8FHj/LVFgcoT3Dy/v+MdU8tvoXqU4L8Zx3uqBtzWAYlI3cyRm
-VnURPSzh5mK2pvuXMR7NC3QBgl5wGcZAhrUQRqMVtew+qttV8O7tYM6DlmNM53Ef1KyjzVDf
-PKbi2MuOXUg0OArw51ph9HdQYTqEkd2kU2uEfIyH9f//NU2kXonDagzMuW36q61ksAvgAHuo
-Uj/Sc1qkqjsMT7+Ka0YHu88A52cG1Nocr6B+dxKmyhHYlNEEExJUfVw5nk+6LJu8YzfIvAOy
-h2MyuTQeqO66/1KvX2hUfg3vJBt9qtdVfW+n0w262O3cfSd/2sG49jI/a6gsnWIfLeOHNcpa
-WcPFdBxtgyNUpjqp+KTAHBWiUA06pK/VC4dxB0T4IH3LoHLTS40t4rcLjHvg+dYTTuge2UuG
-imad7HwP5NNecnKV0dStgkMpxcHHbxvOQ4FTJJzYIUKushqiKJzfx9T8vEvFqCWMstf20Rcb
-BoGRi0YS9mIPlbwCJ9Qu3Ja2xIu7W+dip87EfHSXXM3ncnj/gEvJR1+7Y3Um9dIuzoRKHCXK
-CoGxt4eqRFeCou2jm3wE7mcYnltgMx/TK8kRm1hh5Ygc/JhuYY1KUVBj8t3FcS1h2xxSiQgs
-nAZZrFGgqwmObhGm7CTOe4uaTWt0wLqT2CIoybUQQ7hmHHCnJ4h8WtHkGeBUaVDRN3PlLMiJ
-ItoSs2DnVuH6jaBYckBusYN21Z7ObusPpxNOe6/mZV/0vq7nU+KNQUUJA0QHK2SXreTiLTBH
-s+iL9YCVrYDFsH7RGZhou9S/xqlgb4DhPUkfPjDTQoXce2Er3OwD8Oo91A7ual4+RI1pAm6G
-d7hj3O66iaeCRkEn8WbAe++xD6SJSauMeXC530NDyntllnj4iCpeDSTdJvze4J66R0RX5vdL
-VIBqPN8u4o0CGIZOVIpmUevpIB88gd6E9TFS5P+9nKl5ouJVEIHGdbaAYvD6fgDKOjjfrLOq
-ggNzA92usFen0BaK0BcKXPJDTpHguhLq3SeoxpbBgI7CJd6BNT/K2B6B6krBcs6xrgOzo8Dp
-skktqpGMSiOZlVW+lli9TXbYA6rbVslJE2OuM3MC48mIwaCiEZR+2rj3FFXETiodFWojBaoN
-ATM3SPYWM3etZzOFB4SR4zU0b0bYN3fJWdvpvIQTb40Olrua7aCXbugOr4GT7cYR+C66EZ1w
-zQ54ygGLlkkwjwPwHKpUw3pg/NRY10Psn1vsnRMwkkpow53ga5Fz3+9WpmrUggaFNX0WQUlO
-okmzigPANF25HIyEAidwFv5qkzitH+7hAXHUIVFliKbqST2y8S++z5Dnl+l5x+RJSyAzzFMP
-mpEHsKDWUXvIcyamqCy0knmMUEvsxjvrOV2FdchfTPywJ0EIHFMPj3n2GZB0RirdQGu+Dza1
-O7ePcWn2nhQ4scXEv7WUvKrsbgWi63ZOTveiSmQr/cm6PwMSYzF+Rl/NBjhDdXIHPlQ/Vck0
-jMcKJ2UB5bhtqgTtnIObREQpmFoHiS7NCpWmJmqMm2AMW+nVrcJq8uk7Qw04Bf7HZ2gaLa1e
-lAQOqJKGvnLwNimAgz5K+h4R/PEhcKjB/yxoTBzBQ+ing3JIVzAPqnCNakkVVloWjwvjDe+j
-JteL/oJ1iu7ptcC520Ec3KSbmUpq0U1i2DznbBP1jRDxxMREI/Rfj5iXI8Sl23C3hmHNrYME
-ch5eBWnWk5znQ5zx23xmL5nWEdFhD13jNvoxDdQVzNvupKtR/4a9Vk9eDdg2eTKMXWp57SBH
-a/AJt6j3VahIBKeFfXpoVaqphyDrWpgncRwcawfp4OTw4j6rv3lGV3ZZV3gx0b4YpfOcYc0W
-qDV28NSMTjf75A7o73G0pB/DAkjjBv+Yrzli1S0yynQUHCy9/2WoK+U4qxqwnkfhEVsnZF6f
-/yh+Xu/o17P63mqrgU/girpP+FYQjV87jwau4iAciy3qpxnYMwvs6b6GDDWjoCSSh4u1Q6Q2
-BUq4xCwK7IdQpW6yR1rdpgOFlhW47UG1YTPJ/h0jZ4iN+4hPW8GrBwXJOOkhHyW6RetwCjP0
-mffYXWrwf0MM/JhMvxds0gIqD70Jo7MF1IqjuyYsnCN2pAbPu0BlNo5D9641QbHnGdc8CicB
-9b9HjasD/usqGVCoNjeIanN05YOelqPTgD8ImVwVLYWgqZfnJ4fsDMFfLlSqCtQEOskSmqg5
-jSevAU72fforRRh/IS7dxV11jTNkI9HsqpDZ7nNfWd7ZJ7zXunUnXSO5AJKtqLlQwnt0DjWa
-vURD1/eTRd+jqb8p49F+irjtARpqjpf62QPcl5uHOedKTxNe1w5qMzmc6g6IGQPH7GvtlV7q
-M2tEPsHh4CE860t61wt619OgUh0DGOnQBwK0A7xTB6NcZsZ0o4+4Ts5j3es0FXI7cj9KEGSO
-mdeYmyO4q9ZBQwyBAU+jQtSJzmHQwVoFrR52tyW6hF3wWRporgTuXcRcaMFnrsB3nZz1NbAW
-PWQY2yhPeUV3onNxQK2kynrNgyQw8nGb6tQQbNU1OkQRfoqVOPgSNONQKw65bYa15N2yidvq
-FMqJDaKOwjfKKWW6whuwz1qZo0Hnq4t1/jXXsMGzDdFMa5JBewcLilYF9sla4tkVlDKD6lY6
-Cp67k7CA/LWZKPcEFNtg4qGcB0O2iit4qI9us28u46fpflCRunuWlRI8P6vMkBxxVR1Mr7t7
-p1BAW0Tj+Zzm5nm64hni0inwWt5pjca10smcftPsPe+dQzzFB2jh1+mCLaNLWIO7vQqaMegF
-HMbBBTh0HgIXohutkuXE597+Ibd1Pbfx7zgLisrnfl3nfCsaDsP4eg9yoh5z9cN0p5bpVDVB
-HjxG2SKLVsEy2gw5ss0ylciRpOMzScR2BLLF43OM7lSKDusaOK0OEJZ7ybl2TA7cDVYoy6kX
-2KJd1KGySWcv8PL+P7bedN2S40gSi9zPdtfasZBg94jsbs0/vf9D6JPU0xo1mwSJtequZ881
-5oaZeUReUMCXLBCoOjdPZoSHu7mZ+Q6YRODoeP9XdCpX+I6BaRt0QZdA8dbI7y6ByR4xl5Hv
-8yf4/+2BGm7FFwh/MTbewoUmoK89mI30ST4i+wy7gRjgz+A/nVCPZMi6fkDv9S005Hv5suzA
-NqAL0glq9JDDVEJBPTL6eyAzExiLoX5YI1YtX+5hjQ7rt8gQ1+BSfCd3ok9gPP9/wHCf/H9g
-DvE92Fo/wQ/nBOR9QD8oQ8VVAP3zeBMNsoQzsm/ySf/y8raCjvCvqD3/GzzWRszF/g538g5s
-10sXnFrCRIV/w/n4GXrXoEBdYqZD6Bz9GW7pIYY/oSP2qNhN18wCPdFWKvYz8IXwPn8ABzDM
-FV+hqv4Zn/5H5BoHH/qI/8fLmwlzcf4F3HmqrUb1eu/AsyjAQaMv+oD4/QN6XBdwqH6CMvkr
-qP/CN5tQD12qchvlgXaGk2Lg+PRwVv8FCsMGON0K3BrrFCzVNW7wd+7o3HDEaXWGKiNoCXii
-XMD58gt0qW/hH1VLrXQBb5Ie1f2FJlaHiTItmDk9MOGAXFRYxw06byHmfwJqcEbniq4/P2O2
-ZNDthzxrgAaM3kM/o5NzBhvlSVNvAm47QLnyb5jksJfHbqgY//rye6gny93PWJfMLxxO0SX2
-1Vfg7l25P6FzsXT/+8v3+DdwysOpG3KUv8BjYPeyLr+IOfYFM5t+AnvnAA+KMz4511qo0K+j
-b/czWFMrxPxfsOPewvH2F2Rm373ce+iZ/Ql38BHTUX4Ph/8wf+Bf4dzZgX+3AMvzr+gmdmCh
-/4CO2BNYEc/AHOgZO+J0bHD+hLwqoBPPnlNp9+BSBP/Z71GBXcgp4/dwvAu58QocoT++vJvg
-uvo1cr4CzMKAB4ST8Bka/MeXtxG6aWGCb8BkVzjT71ApfICij2/nd+i2OvTSFlDInMCT2gHv
-aMHH3Hq68GbStYe6eYWa8gqsiku4A/VAWAdwEDtwi/4CbnwOB4i/gFt5jerjBMXqG6A1t5gS
-sQY6sgGW5ZHZTXhrZI3twAyiU9gl+tKc7HGLU69DXfdHoEsPUKsG37oG05z/A04ve6g/A3/r
-Aayfe5zbAQ+ll2IPz+dvgZns8d6/gQtm8OMIqPD3iLcXQKFCfyUHC+MGjrd/ABu7xPyo/45T
-Nrjx9pg5cOuoxQyuwg/gt/wXZuUe0XX+AS5uAxib9D0u5UE4Yv/Ujnz6yZNZOCD+/4ST8Bb7
-J9xrhhmI/02TZv8Fs6j/+BJF//XlDv8F2qCgljzg3GyhPfsVOrtnOFeyX9qjh77DeizcSco9
-TsAdoTy6A29jj7w5ILsndBp2WBcLca9C7+v3wByXLz+VPsv/rNz5BhH5IB/CZ11H4ElPQDTo
-g3+GA+s7uPkEZKaNvPhL7JUDVvfPWN13+Bb0PM0RM1jJlXB3e4eKaI1oukA9lQHb2AI7Cfyi
-MMGqQL/1ZznnPiJ3uwKHO8d8hLDG34EbeAG19LXYQiOezQAvmjMUQKMn7rtAhZ4JXQj7qgUC
-F5w5v4H24y/o62UvkW942R0dZsv9BTnfAZyp0KnMxGkO007eATt9EhbFqVVfv3zSV9B5fI+a
-4K1q0hsgTZfi2X6Fc32FLusfwcpe4818hWfUIU8JFaHH1Nq/gXEblJgH7N7PQDBCr2RCVX+C
-/w49eOjUeqduz99xhoV/zoG0HYBMXwNHX2LaxhUqkm8wOeoN8oxPkQfMrgKjD9ntoTY3x9AR
-mWboPtIh8Ij+7ABPmAO6qsR+znB0/wl5wNkf5XJPzdAajIgVFJJvX9ZjmC98AwbBOyirj6ja
-zREll/avBPbigK6XqMY3yDHPYBiH6wL41AEoiwMv8gwv3a0ciTrPer8Sn+lipmm9ARO7QEWR
-A3+4gIbqEYyykGU00Bj8BLePBXI5KoQu4LG9RHX3Bm/7UhyCArX2Gufa2dMDlx52PNeXyAbC
-biXy+AZV5VFscKrcauU3oRYZ4V3948vz/QHPmG7Bj8KCz1j1Pfq+F3A/elTP6VdpX39BnHoH
-vSGnT79BTX0pltMnMBvDNMhLKAR/j/qIzvsb9D89fs4ZcwuewAQf4Sa7R61cgfdOFiJdsR+B
-NP0KjmvgGR3A+foJPI4MSgJDUx34nDU40IE78HtoqsOU9DfIQj9BxXojl9sGdRbfdIWTuxUy
-26On0EjXzvlnLXqwO5xdz7j7PfTmvdhXdKk6AH+/BEYR6pcese8GfKor7I4FVNc86U6oQz+C
-195qms0Ejv8abh45EJcRmFwJ3sOT4lOL+D6iknnS1KNnKTjpoVXL05CelFRzvwMiNsqfkvq+
-z3BbXqBn+wTvkkt0X85Qj93M7qMGmlhDt7/BPy+QvS6Vq1yCbzqi217IeWLAuV+pb7ZC1bCV
-XvwE9S6dr/fgdhSo/akK7pBxPCBmUYv1GW98RF61w/c/gJMYlIMlOmo/Awm5xS4IfNYBylBy
-Iq/QY/wEVsYlVAsb9L9vwRktcAqsoitbg+eTAb3qUPUzegRk4AlPq3L0kjtgIvcWXL7PQOvJ
-zaeDhEWuDhVCKfRkIxXHG7D+12CafATT8Fbe8W/AcuqFu/CZLjUFoUEsOKCWdY7T5Ee5ph2Q
-b3ZiTU2oTDvlyAdkSLV8Tpd403vFjBZuDWu80Wv0FumUwpO7ALvqPbDyHOv3Cu+cHE7eC7sc
-nOh+kHPFF0xdPcJTpEW28yu8LApgkJ/BMQoeVnRCNfX4ARUm0ekK3Sz2uAJq9S3csXp4JL9F
-FzE8m0KrkPMhMkT3Aqf1G3yX2lFzE1gSVDoWjkixA6elEm6UubPed4t/poP1HvuaLMMT7qjE
-7z+JJUZvxYMYRs/IYKg52SGXOeh30KnjDG5nQBbe4kS/Qj7yBplNDf3EBidTIY/e8Kz5Hd4h
-d2mAaCyh/c/Ao1zhT1DLtQVzn3Fii2yulSfWz5gDd48q6jP8y/Y4eXucwNTWEsXIwOu/wplG
-/xw6zeTYJxfQsa6RBTnMUvnacUr5rVgbnI24g854wm69R4Sc0Ht9Up1M1f4JtYmTu8QCnjIH
-nDxrMEn22AE3QL3JNiTbZYE+9AWYoe/ggneJKBvuMHjUfqsZL1dAfZ9w6p2RBd3pLT2CDbZF
-dkFO+ATvco/nsIXnzRI+1T8IN/8V6qoCGsSd+jmVo+cCPXJPiK4f4arRwFnkBtkrORkNav4r
-nAUNsKIccxuWeM+VUEgvNHAAf5PIJ3tGIyrBcFbm0k00jloAopIDeOy1OtIFuAMeJ+1R50Kr
-2RVnaK1/Aj7+gNO1Vd0wIUsLP7cWm5GZ51JYxQLfgiy9C6C/kzBS6ohuwWTfIKp9QN+iAU9o
-jW+4RO9yAgOQCFZASsJb+RmYD6cz34Ef+YQzlpXUDhUoWdcX8hZ7CzztGXMIrnHGkk20AdJx
-i5iVOyLcmaNz+Fn9v2f1Suy6x+nSo1vwpNzfQa/vVLWO6JMUUDVNyPnYGXwWH26HaaXvUJcF
-d44KufpbxPQ3yEsDx2WB65N0Xhu82xNiePfyzY+YnBSeBjPfARzmv0MZySk6zJzP0iffI6tc
-onf6GWjHAj2qByAgnBNB1g2R8xWqlwqxkFrfHJkjfUUaRB4qCi+xw6hZn3ByX8KDagAH6h00
-ECdEiBApGpySIyLIAciqh3vADieVzSdrgMOWWPEV7slDCXGKiMA9OG8Bm2aH8QfULjvNuOL8
-ix6c7xI994VykBXWag5/w8v4fXL05CucUR4ZD3WTOc6xT3gXG8ywf6856lfYmw06UHtPJ95H
-zBR9hg5nC54739ER7LwHsChOmp3Sq7po0d++QH/2EajtOzjrTnLpquEmso7r9B06MaE+PYI/
-F1SXEzSSnMxyRpd1hzq7VVSnixp5VpXyFe6uHPvrgHyxRlZ3Dx7IBkynPdyp3iM6roDY/wEz
-3IMD81eY3H2FfjizAfLJQ4egABIWsJ+AGv9POfl/D1ewTM4JOfKAsE8y9Pe2wCOXWJu/AOFY
-ggfzPerTEjn+FphuDox5oS4UuYBrMDYrdOsuce4UUBI2WM05mLiFuF0TctUP0Imc8CtVpEdM
-puZUq71O6l61RoWo3cM37xrZFpliS6z6Aj+DGcKAc3KHU/0OaofPEYf7RVnfHfypWk9mM/dR
-AxyNvTHecSk9h3nJ5/j8Gh0Gh7X5FuzSEgh+4Gr+Dtqod8Ar1ri3Cu93RHzqPafLfwHSQO1c
-qO5+hkZnxPVZWUCI7iW8BLbgBQbFwiegD4/oNHyFpzbinOVElIt4pvJsD2jNCuvhHlncCA3+
-L8jxWlVyXjqtGlnyDrwk1jIh/oxwYvDIN5x45he4HoFfX8oNNPQp/vTyu/8EtIkzDb/FlGqq
-QC5R479Bn/ERaooF+os/o9sZOgk1vGX+Hb2d0JEtgNo9or6pFBXPiJM14uhnILPBdXANPszf
-xT7eSkNLT/81nAkqnNi13twS0YUY5lr1pwP2sdZ/YV90xOnwEXnsGdd7+PRSkRJOca4zh2q0
-Vae1Ry9+Dc8TD+X4BrUXtRcjuiGT2JkHOLfQGe4RWAWnAf0CZWUH7uEO1S49JEfPiBHuOcO6
-MvVsJeUI/WMz7IQKsXGDsyN09xow2z8gB7sAfsyzZMAdLxw9hmtFonC+juLekbf3BNeXQkq0
-HpHUIf9/BNfiHfpUP6Az/i065I/Y2e9wEuWopG8QJy7Ab2nRYS9w8j2ro/iAKi3Dz37AXski
-yvCIyLiAzvUJSOUF1usOJ+cAJKoAX+8e93MLpu8dPESDhzldib0P7jJ/FEr6UQh62Dkl6rcr
-fO5ndPzW8FD5Hh2vNfyGggrgr4iMF6iC7uATwPnBGWqNPeo11sa/IG4uMNvxF9T2IUde4a73
-qK3XQJxGVIycP3TGp5U4pWu3lKdGA1SVZ+OEPvNbdK73cMx7A8TgqOuAKrFRhtmh9lnj9G8x
-C+Naa59vocJnZ+i3Zu4kJdUzFGZEHul5RS36AR2vA5516O4WqK/3yPGugKP0yC5rcPz2qg/3
-6P+V4i1lQNY9FIwpF1gBe+TEI9aBOVTtxp+5Em/xErjmFpFnjWzqDhGhVkyp0VHbI1PZY8Wu
-5BVxKyZ20N/+C/yZgiP1CfyUd2Ac9nDQXkBfSlxpj15tBw+AX3yY+bISN2KD2MTd2eCN3mtN
-/AqmI7UIz0D0SrDiAw5Ug9kbXJV2wP0+wEviCd24f335Xf+KWSAjepbfOk4deIf3VYlBcg2t
-ICPwEuvPnGj//PI7/wwm2zXu415qCsZ1zhr1nq5rFd7JDjvpBnv3M/hTt2AIbYGZNOJPVaif
-2BUk1jjh7wx5XYG3yLmTG50bG5zOAzDzoAN9JwX+EpofTkPyEbXcALUaga+sHSdbcVU4MDQX
-YnS3iAMlvFoYiyrEA2ZMuaNGmL7l1jsZ0ck8osK9hLfOM7BiMjj3cvl4xq65gvpiwInHeW17
-1LgFzv3MkftZOTJ2G6DOR/FTDvieX0G3vYOT0+/hl32H05ozMlrswJX4ImewAWqszXvMVgo6
-3E+a4va/wcvtHhPifwfEcYfaaSMniw4YTQ/9zwO6N+xe7YDGbvD+g3fUz+iGX0gz8+7lv32A
-588d0JsKsWsPvjV3Z47q8ATGzQc4LgXPwy0mQv8JPKrgyfwZHMYb8Jhaz6kzOSqGM1bUtRiO
-n+D29ghXqa/kYftRvLkVajrmxA45xiim5Qq7/ISYsnac27nBSn7AWZNjFtYWNUsOpP4R2Sxn
-MuzkAsNVSievJTAZMoBugZQYXjuJu0cGXakKkhyKSlypN6hMM/Rm6R9HfZCTU2XAHDvpWz6D
-c7qBHmoLn8VrXDvPGUIddJilI1LQaRXtwd0MPh1XL09oAw7/LzjD3rx81zeOkzobYFu8Sqzp
-I7C3kCl3wLl36OftlJVwat8Gn/AI7P8bzYH8Z7zJe3Tv/wRvd84Q+YB92nlOlFviO9uUyBYr
-PPStydQIk9x+gCP9d3DO/xGMnBr8JPasemBWR+San+HuHroZtXhAN/CQf4av1weszXvMWFq6
-Lzo9n3B6bBQxOcE1nBoXqIVG+E5+B9bNvXifYQLN35B/fILb1a/QSC1xHrdYCx36O7fQ4ZC3
-8x28EJ/xTL6Bi88TVt8GJ9kgJQVnGU5yhOiAtr8R0mlYZAUlzQOukEFNmO54hydwQq2csMUO
-6IRznAPKTJWzQTn3qMFJnyOPGzSJIVQQJXr8FeIk65QaVcrScebNhdjJnKxGNVuLk5rMxs9S
-NXxBRfEePqnBoeUeMwa+AipzgfnfDZwSlshF7pHD3LxkPszvPsNf5gYnzB34gGRt75B7B9y9
-e4VffYazpblV79GXOaI7+IT1cANv63s4tvwzNDE7/29wqP8J/Llwb0Ev/UmeO2+Byi3Ep3mH
-7nZwF6LP4XfwfuS01uAj/wHzFb9HBreCA8N/Qt17hp70Wc7hgWNWyoEnxMcPUBGQgXuNNbFH
-3s+z3ZwZnpH5M2cphBSuodnOMAnnPTpGO0XDX8DZCfMCPoK/H7inP0DhnKEaOkKVOmJ9foM5
-KYEt/wwdye+x2jnL9QMi70lejyX2KrHKDdDLcG52npNtOvFs6EtJHe4DfHi2QFTv0f0IUzhy
-xNEz0NS9HOdOinSF40Rnr5/JSbZ9RBI50S8DYrUBC9HhIgbAyU8LsbxDH5TTSTLcDRUt9IT4
-EazHzcsTuoFLSTg7gqNrjxlM/+Q4we8t2FiX0HMPcJmih8UXKJm+fXlj4foKM3R/AUf1Rr21
-AjzVvf5+RsejRwX+K/iBd/BmeAJu9IDuYYi2G3Dfw9zEL9BI/FHzAf8JsfRJ/LkBsxc/of6+
-AC/lCko5MjHCBAqPXPM9sNA78Gc/YU8Fzfj/xPosMF/7L+ACTFCfP+A02ylz3OlceYCS4BYc
-szvE91soAB6Q7TbgXG5Ra1pOvcKZN+AEWzhODfaYPfZe/rFk1/zt5ZP+4yU6/l8v9/R/v3zi
-f8KJt0SlNkCf51C7vQcj8CE63v4TYulOc56O0GosgfZda7eSP0d0nZiFh6qD7mOjtNRHTZHj
-1McdvCQZO1ugykeoGzt1IDqc2SXOK4875CS6CmfmE3S+b5B50dn8Bn1tJ8+aEu6e4X8n9EJX
-UFSM0GV3kUfwqN7gL+BX5FCpcob7N5gfsAP/PPjvBYfyf0b/cqUJve8Qn3qccl9jPsz38IUN
-k0a+g1P2l6hcXuCcesL+PIon/4gu+s/AVx/h0/AjGPP3OOdD/64EOvAYXaf+gHXKeXq/h87n
-SZwqB7ee9+i/vH95Cuyuf0Q35gOUSYFl38EB5FafePsSBYPm6Mr9Py/v6v98+Wlh1tW/g6fu
-wKl6AgfkGafsG3jV7TGl6SNyzXvsm6/AsKZDXA5GU4d6pATq2HpOu+2kZhmksWH3Oqy2E7LV
-JXKM/4QDWZjOcgHN+H9hfbLmPkm3U6GvzWzlD6iuwhSecDqU8MP+CMe0BbhvV/Dyv0YvolT9
-0aBjViDKcSXskW/vcYbtwcH6GT4qj3C23/udXCe4Li07W6p3WEuL7/HtFqjHqVh/hwjHTOQ9
-ev6Bk+LQ0aVWbSF/ixX6yA4ZwSRE7oR870E+U7/Cs2OCc/33eHOcRfwFOR+n9U4+IB/Bf+J3
-cAz6JO/qfwIPPTi7bpEN/Q5VywNOuwaZw6M8iL6g/3NEPypg/T9ghsvR/wUu1Tus1520miFD
-z5DnP4C3cAWP81AH3GFdBj7l76AQCf6GNbCp0O//+uX6BLYSvUbeAe1/D45iUFoPniz3L/D9
-u36JV5cv63IFjXbw3PgfLz/1z4ifA3gyLfS+jOPvMY2J64Lx6gTewa1OrLX0LUS6H9GLbKB+
-24tldPI2zZ3+PktE5s/QHd5iFkzwAfkrnDuCRm8FPcevYrPTr+IAHWVwmPgK05f8y3MIazPM
-tckRHS/Rr2d37AJdPWJ2t8gziEiHU70XU/SA1bkHjkhUcQ8uG7v5R/QLnbgz9IQ8e/KdHFD7
-xvH8HvBfLsEx2ImjGn4l7+AKa/eMs58zdFgXMwct0f3m/OYO0fMAB7JHYJ0BQwnzIcIT+S9k
-kx+hHv4FPnz/BEfowHYPzyJ4eLwFR23j/iAHiD9g/sAEtd9HnKFP2EMXOPWI/gQOEjlTP77c
-QXC8+itcZzus0b8j23uAi8gOvRo6v1XAUb6gWniLmLXF9MNPcLf06AK9BcbP2PEBa7XCWR/Y
-fdaTukZm8hZny0GYyveYXXWLNfrvLz8lzFv9D+gpBqD+dJQ5oqpfo6q+A9OSM044WTn0xd87
-TgKncynRixqIPD1aqFaitjp3nPTh4ZXL3lZAATg5+AYzi/4M7vgt2M2f8aeJlzggIESwb/T9
-P6DnVYF5w8iUAy+9BLeoARfuQg5PS/z5ARNOJpzVdBQkz+SM+vwR/KdeUfMAJCRkwDmQ/R2Q
-0AtoYdnpuQI+WAMB80BS3mEnM0a9BYOITunX4CKcfaO8t8Q1IEtgD6aL7misUQ5gVQQc5Rdo
-jyo4ovwNT+YTZsB/Rp7zrXynQ7T8Bj3hK8Ql6xQ3cMv6BmyXDu59n1DdPiJb40y6ZyHcgZkf
-OIk/wOnugLPkJ0yhuFdN8gB+dAZ/eTLrOPH2DtztW3UG14g+Ycdm6A9/xHpcQgP/UZxZnu4f
-cOJfiRXUKS96BBJzCV1mcKj7d6xNB/78r/BOauMzCvnZAj+X3iusgHucWO+wTnrwey7RQSar
-nujMk/RZVNayr1Y4OqxXWDEHrM9LoOo/Ar3i/IF7XEtE4b0ncziTOrdUl3qFk7tSf5wcohXO
-TKfswYmbU8tpqMTJzs70UTyoLbgLO5zvO/3TTpUqea65eg1XwkhuwKepkEe8R8VMfccIrOYa
-FdoWFeMVEJh7+bFSm7JBdtBipTfiehVAiQ84rfZ48h16dPfAnkOl2OAk+TtUTUt4cD8jVjEH
-Pb38Omh+QoH7Yh3yFt62wS1lgivBt8BzBnWwOQfqQjj5QphvCe7p36Q/M1+wO/iu/ozrGZhO
-yA6oPL7EJzxijTC7IbviDZhzOZC0DfgmFXpR7+GL9gYn/gZx/ltMK1nCreETcKdW/pjPyB4K
-cKT/Ak0a3T/vcO49QVVKh6E7OMqssE7ZE7lGTd/JYeSoHucOrg5LZGNOHV4/c3gwbx5q6Dug
-+Cuglr+iP74Qqs7eBjX3OTj7Ad0uHd0tQza5Fk9oFddlDlZFrfVobkA5sMdR9XaGf1crFymw
-Rp/ACtoqD23lr1Ngjz0ABS1xDhywshg/c3B5NlBsXyFyO+jjrqTdeINnvEcm8h66lDtk7B8U
-SxuwWJ4RIcmOfIJegPy4HnVb6BH9Ck1EjZ7ZHbSkb4FaH+CG/y3yvJN4gKHqLNENvEYv8BKe
-bCVqsm/U9/gK+uFJE073qJffwGPtR+T7oUM4oF/6GcrML5i8/ohsNJz85hnyKO+4O6jGyKrY
-yWHqjHpvFeMD8aQ1PO6uEDvfo4oP7Ch2T8lR5q8FJnNeIyt8AkbmwIW9F8OTfNezNF179JKI
-eTzpnCMjNbDTPHQcT8DDcqyqE3KzFVYi+9aculjhHFzL/acUzjfgXOPUiBOiLyMbeWeF9FYN
-qpFeK75ERFwgbyMCSf14hjWZo1op1AkLdZADy2ZE1kdvwh45CNH3e1St9A++A2+QWPgDcAvm
-Kuy6rLA22e25kJNRJW/2HCf9DVD6XqzgJ5zxH3XR1ZfuTQt9twxxk/zjE3bIDjU7Y4JzjAkN
-ssRHRLpb9yQed4sci95cA2IVs7cc7DSy6C7B7q3hBv1JSvR3QOla3OMt1NbU8hV6EvQAu8d1
-Rj7+hB10BxUPWdGPyEJaOLzs8N6XWJsHnIjEnE94syUwG2MyLICl0BfyA6am3IIt/QH8NTJO
-b6EQK6DDX0mDmTubWeDRJyPf9BF42AloPVdvqPC+4F4PQCKe4ekYeF8TWCCtOmyj1keBVVqI
-XbHGey3lvVc5ntjsklQ4sx3+hEd+thAjbYMTggxasrkHnI0LZ9O5OTm2Bt7egotjkTtNrqLT
-GSM3/Ts5ma9AtL5HbFrBLeWz2OlfpE9+RBW3QkfwhCq9wU5oxP28hgLAibk0YEbJR6h89+pe
-PIjfuNdEjKNyauKNB2W+W0TQnXyiT/BFo48Cp4NucabTaeksH8EeaoBrcaevgPQvHCeHXkov
-fY3svESVQlXfhD99CW7TKC9aTvaasPLuUP2chMc/QVX2rNxzi07FDnkI49cRXdQCWQp7dh4M
-eeJtFfKsEvj3Jbq3S0UqxtM3qOGvgbXwHLpF5rSEmutWzNSFULxKXdYCemFWtg/i/P4qzucd
-nl+aCnDQeXQGU/kAnNAJr2R3xLiGG+UiS7GCVjr7uZLIJKvFQ7QKN9zPpJ6Mw6nMeHrwnMjd
-iZ0wYK8tlNcx1o5SU1EVepZHgkf/PMNbOcq7/Qt69tfqrFyjYvsCXsFCZ8JSDOLwLkYwXEug
-ug7zAwKT+YPmhfwOaDQdhT7K+etSmc9CmhfOhuGU4Xsx4B+BZXHWN/ngnENKfyR2Ye+B9TX4
-lg453bXy70t4bq6hGV7CkZOqDa6HBfAFL58SotJlZCyN6L7U4kc7dPOpm+kwi4RV2xYxKeg3
-HoXF0QvsGWt4i7y9mzlr8t2S7ZVpF5eI7UT8GvhEXuEuL3HfrHBvwAdeYPLoe0wpuwKWTY5V
-h8icYRcQXWLv9RFP8ggO6hYn0aP0BQecjlspPUfPE9tJtVChjku6EVYpNVboEjr0Gsj1tXi9
-G9U1a0T3Hr6pYR+22J21esUNcpOtsrEd2Bg30rI0YmFk4uMw8+zB8RgV6Sc8xRrr7hmnG/k1
-D3CCYlXzgKzxjdbuSp7DJSKNA5LL8zGwIn4HpKuD78ZHxNCQ43HG7xJ99TMyJa+uy4S93KEW
-2iIebeXHPsKBY4uft0Z9+SzmFXHXNS5qYis5ndAJjz7flXznK7Ddb+RkyzjBjJzaKfOl5bN1
-8rMt5Xk16P46YBw92DFbnJ0tkLdH8EtTTjjB/eHZ06XVOuzUaB7Rl74Am2Ly3M0ZOptvIv6x
-AA+5Qj/lGkhgA+bvJ6CGDRQpoc+WSUfgfS+XoBMq2BNy9zvc3aQZ5uwFPskXYy9diYez3h7c
-AeohO7EevHfK/yplkWtE+RJr8xbMkT14vNdyJGqAUw7od5PfdoEO6x7XNbqqB1y3YKm3UKTV
-zsUOtheq7uUcTAbS4J14ZKWjN32LavsN/Hnu4Bz6NfrKP8GtZo0snVFhVNdhD4bpGp20B/jA
-fIIL3SQuUqZdNiKW00H+jFNm9HQpnvxZfaKzZoPQ3+IZLBUqIx+k0zui3riQIx81UA2iZg50
-7yt4VITqqED8pNrtGr8jxFlmSzVYnxlWaaauVydXxa36dGQr0PGYTtg7MEROwDSeodW4R3/p
-hLXws7iK96g0GROcGNUrR03ODbivWyDBgXn8tbDJD8iKsujhUkXNNTMV23MLnAsNYmjlyB+3
-6ELeeWACBM0rleDsR3t0EpiNcLoyd9BW/emt1F6dcsvMNeLUN9jP1D5eu1Kzo4MubQsE5hLx
-46TuOP32GJVrcCX3Yqc8oga5Buv37DdygCvj+uTlES17rQniOE4a/gLnW43Iy2hILs4etfF7
-fPIzcs+FuAS1sIczIi91AFvg72TIMxOoHedtFOqq0Sug11s/ysPwCB0GHSnIKqY/PJ13H8GX
-JK926zkPOsO5uAJqcek4ZzjgR78DxrkCcnMtx51LdDlvkPPz9A4c0tH38n7PsOPO6PIP0A3v
-9VxaTy+zs7SHR3FMW+VIz4ikHj6KX4AyrYR0N9i3nXrRF2IAvAMuySw8MJVCp/0boEjEkJfa
-b3QFX6L2LcSlrtVp24j9H7LAHqdJg7eyReW4BJfoZ/nZ/qQTj/5g9ORmH+4e/5zhTndY3eQ5
-n1XHUTtmTIjJc5bJSvg+ETnynlaIwUfwfVf6nWRNb+AqfQC6dQUOJTXwS7BCBs85XDzZuSo4
-P4XIkpO7Emsqqtfo6tGJCbkFhrdGZ2svHK1D3lGhPtsgE/HipJ/kjvcIB9QVdiPzid6fdaYM
-2CHO8VwaxWro5W/ay5v9WU4CrI9L9ERYD12hqgr5ThV1bjfIMQOm/TX8PoJ2/cJ9i5ntt4ig
-HrkV1aCWFR2hGw87dpSHImfRcZ7Gs9yZeAeWeexVuQWUZkKOwr2VoUv4BZgp0QV6NC8cseke
-p92tOG5EMR510hzhWfwJ/aUMrisVYnqjSoSZiGHlBVCZWhUK/b685xT3e2gd2a8nH8scvcO9
-efne7OUacKd+xxaRjm4IZFtyztWI6J8Dk0xXqUqb/uoHVRN7rKJM+acHKlBjtbboBNxiRTPH
-Wws1ol539Fyhlao+1loJZeqVXxM9Y16aI0c+IV+6Ep9gNauArnWuhmjbAptdoUvC6mUhpQG9
-NDr1uqgr7nSK8rsTU/P+KGbtPXASznJrNVVi8FTskgV/QH/jAo6JNpPzFu7Yt5hsSyf3S8xC
-fCvvhRrRdQU9douLEb/19EBukVnusA4nMX090KPApAwY6BehbltU6ie/lzfDXhX7QV6GT+iP
-brCbwqfnwKE78ImudMJ9gnNw4IIe4KEeKsdPyEwq9DmusOLoetwjVzdWov2V4f2Guo66AiL+
-HjHqndvLfeIJP22D0+dXfI8OCvwn8WyCv46HG/vzTPkygKvLrLBwNp+ZbEkyJnN19zLxXleI
-X3t0AnP9TssKSkRbzugZUKOX4vHa96ikWF6CDUJXzVyckFL8cD/LrAZgDi24licwUVZYn4Nq
-tQpV8EYOoRX2w4W4zhWeJdH0I/KzHdwhtjjFc2QknFVEVLaM+6PVWn5EB+SInG6LP3uPGDpg
-xZBnbXMDb6VyfYe/AwMozI76+uUdfwLavQEnitMyk8uT8aOoliwdnVvP8na4Q4cq9LN7+RQG
-r5Iz5lP/Ih8BstQ59f0I7vNStSjxqR5neth3PZ5GI77GVVRL7BAzv5NC4p9f3tA3qOIa4Q4V
-nhHn+pLreFBMb6UGDvElRySldrZCjkrc5AwvyA/IEI84xyqwEx/BAKOT/hlswXto4idUqXtf
-ihNSKgaOqruoQWCOS1ZZ2CsdsrIMVXrnuQoZzSvlxQtdtaPmgFGRrPMSkc10tGR80u11GfGz
-QXFzh666qQN6ZP8nrFRmYBWqmhz6sAvwKakS50RI1j9U/znhcD2qnB3WKB0rqMgbkbOuEVNM
-KcxZTAewf1j7cvplQJnuUX3s4TexBfeTnxOyiQa9lzfgJoVZObfowXwA++cNuu1vHOfCs3ov
-cb0FZybUVUS6uYrGiBo9get7wjS5v0GpfcYM9XBxjQ7otu/wJqnLOsnhlhlDJbbhpNkInK26
-RkZ+wETv32Fttpi2HmaWfweFWQOXpxvEjgzrgBqxUGd5fPutb8VpdKhgmB1upKq9ET56C3TV
-g5WxcCd5sXAuPeeL7sGSfARLku48B++F2zPPzuSBUag3lAlJzB2drtjnKYTnNtJNbGbanmXs
-RLHypNrxrN7qpPqrRLy7xB1XqL+W6jd5RY8d9AETdpPxw78AIyPqbF5iS3zOWvN53qLaWCM+
-1RGJzcHo6PAtiQJ3cgLjNBfveWZkyp0y6XFbdFyCum0EDv6AyBkQZVufj+qxHn0hhaXhHVdA
-W1gJfdDsvvc67T/Ct2aNyYDfgNNVOs5HJbK4Vi7F+SehAzGhY/k9Zl8d4JP3P16u//fln8ME
-rB/lSvlFyNshdq0Tx3/Atx3AP2TVt5Xy7QnxM0S0T3BpnV7O9hxzfb5Dt/0CnNBbxwl44YQZ
-xPrmrIxRk4U8TrUO7O81VkSli/jFJf5d7jgBj3FrxP3QK4xchl7+EIOqwQ7TOE7yIMjUFS2h
-Xn8AwrdABsCuIZ02csXLtVTmN+p2vIGC74jK3XJZsoA6IcudpxNErj4FJ5pt0N/ZiPtG5gp7
-3qPmJJ60PjkF+Um7i70FqxsZOS91FtFno8BqyyNSMOk9cW061XNhPRoedcYzJqv5COaMQ5/7
-V88JZI9YpXfY52dVTjxLjvI+NnU856e8jfyUDdyKwmxBy0TDrx/hrcSYeo3vwMq4cJzEtUO+
-2QHNDHzPv/kwFfT4sjbPL1eHWUN/h+8K8ZoHaAuZGzIvJJd6wrpssYpy8dZWON+JZtyAT048
-6Rv4wYR7XmJdXkkfytyPWCDn/NbSN1Cx3suFK0PeuVC3nHGXeBDPVFbdzBUnIN175EjUvB48
-tWiT9LwhX+H5YQzw4Dn7MzqIS80/qMFPOSDbu9LqWuH9G6/8BkybDvvwVvrxDa4dkM9r1ddU
-TNTyS7QJS3SiydATrbUuwmyJEUgzORCt2Dh0FTafLu9ZOa4Ui8mRMn8bVpol1uGod2Ud1Ab7
-IYvdsSX2/gFsw0Ic9bPQjh1Ony2Q+Z107U9wkNpLi1aivuzkuOdQS1yJ5/oBrLlQwS/B/30r
-18SgzP4azDryfy/Qj7lC9pPrDR7g5zUix/wJZ3nwyj5isuWfX57Hf0JHkcFL7wFVQYWM7Yj8
-bIwc9Aq7jrUgMwBichdAWjrtqRyY/FtHX5Il8sgKWSfnMNHx3Ouc5WSpGqcjVRfGaLwSs7dx
-l3oOa52pmU4mdm6ewQeo5XOX4x55ig/qcT5KJU++wYDJcmGCfXCtDbMOfsL63KCrvFeXgV2R
-At24K/UX3qIT00nht5XzNdfmBTqHnSr5TKx0TgrPUBU1wibMj7NHD+5ZteseGG4mfgxr2INn
-LuR0Jle4HycWCn+lHpzT2C+wN0L2QxcZdr3WUG4O0JwTDdjh+5bi4Yyq0nut1R06xlvk8fQW
-IIJzhvKKs3sOciwIPZnJb6KPjoMHDd1ML4B8XoO9dgsHxTeo+DeIOxNyfqtRS+U7eXRU+BUO
-nV7vKXAtnWaYOnAcT4ifdNqk87518vZYD41wRXOyZD8wQ3wjZyecJqzCLQra+TN5Tl0fgTJs
-8GR7zwxvgXhD//QSOSjVOpdY7x5PeoFz9Cxk9KhshBhQ2Eu9fA57/BO9KbeoTTvEp8/CLn6E
-/o5zDn6ExuBaLgZ0KQo9Ys55q1w4E76C10HAdR+ByH/AGj1ovpu9q0xZZqMuQyO8KRdjhf1N
-YtGsW+ks75HfHNR33Ml7z0kFwhrN5ijQOfoCHaIBz3+F/RoqpVJ74gZR7iweKBmIl/KfqtHT
-4LMwt6AW7FPy6/boIR9xN8zyGzzjHXbxDfoFJ7hGfwDmTSdAMlNqnJfXODnWyG6WcomuoWGm
-Q9Dgl4pHjFjec77Fs+LHTzjPK3UHSrhAsG43NlKnvXOPK5Pypoqx9ISYxdqAqkCeM8SinTRa
-uTJYy4/YK2hmu+5Cv96gJ5aDf/VWTkM8W9k7bfWUn+Wo/uhrRV5Orub0pkE9u5NwK6LinVDn
-Fq47PyMXd+7vUHnVL7/SLfsOfGlqo8hmXSDqXThO2PoArcAj1FwfoPTcYc1+JV+jS2E4GU4I
-MkFzPPtCOKfTDprUSW6RNZOZnOMsOQIdrPGUe28z+XJgsmv5UFEnzXh9DXZih31L3dDScZY0
-HSJHOIi8ATeACvFL8KzJmKTTNXGbFv23Pf73SSgj3bPI0z9KjbPVLibW/TV0X3f49Atkarnc
-vy6lCbxFRKUe7y1Ollx+SS7mxA3ynT1qc3MlKcE+2SkfOQnhP+EZjqgA2X+9hw9WJS15IZ8Y
-Yqy9b5QdOUVNsm9t+qcTb808m3jmcvUuEJ9yOYFxslxwAP/a0UNu5eh+eNacwj1OJrojPoLr
-U8v7gEi48UDYY2f3fqFuGvPPZ6B5HXCK4KL7o3LQXzGz5L04u5/Qs+zQ7Wqw0uhCxJ48tbR3
-UMt/g15EwC46dXDYyzdn2Exuu86Ru2dPgFhnKx/KQRhzJV5eDSSdO5uVTYEI3Cp+cYVdxF7n
-UUwpToKjl91bRPsRHHWyhc+IcuR70u9hFNOUCOed50SNR/WTTn6Qtp4OC2upGQOz+WvwAgLL
-+R5+A7fgKj+he7bEqnudFTk5U9M54hIxkzgl1YrsHGTOsBW6gqyR7Z7kIkBmTzhzB5wyDuyR
-L6iYCq3PBij9WQqVTDkE2d+TNw4l6+kh8u5YW3FdklNG5+4LsAbpGxzu/T3UjitUeZfyAp7k
-o/MU+WZXmurWgCu9RTQmul47OlyyU0Iss8J7Zkw9i904wK2Jztk1Zmv9gj5U0L+8g+MCGfmc
-1l0A9W3xZt+CR/QF8fMd+hFH8B5tTupaaHwjbIxOtkvEwEHd+0Gc1pPWAedN26yHK/k2NEIH
-iZI22JshQ6bXU/D5XsHb5xB7rsyeSrHIAk/jG6jQe+DFb9Ed3WunH9FzyuGY9KBu21Ys+aN4
-VZ3ysArVao8nQpePO8yNewev7s9QityCV/XkOX0rQz+CeAtnAHf4mZdS83EFGVPzJF/DESyc
-S7xxuhPT9ZlOPcaz6VBNEQF9BudwDZXDr76Un5ITK4QVY4Oo0SMPXwhhmeRcSsbmESfYKaLv
-g+esywFV7jtkds1LzGzgsPkBWOcGJ8MItsUVfBZ+xfvgJNknvxTXixUc/TBsztSgfsgRZ0El
-JXGF/O+IGmQU87rEJ+1i9+saPnY7nFILxw55h6y9xu+krv5GSi56QHSebhsL7KgLRP1G/aEM
-UXzyeTxDeuyTAU+D87HYTSU3e6M4sRbK6HEeOKHnJTq5P0n3QxfGXC6MxFvJCyvgT/MJ+kjO
-ufoG3M9WU4josJbNpin1qB+fPN0euvh27eQ9Ib8n++QOPhhvcOI8oFZaI6MddH54OCQxbtEv
-e8BT2uhTajHai8hXYTypcBIP6E5tYs43Yr2ugJTW+K9bKTzp81UiC9ih70q0Kbz9XMoastFy
-R1+iDtqqDOcoGc3GF93hn45ytfLC3yd0cd9gjTaarnKFvLqWq2U4CXpV1A9QT1Ld+0V5xlnZ
-BCeF0lWPjEhmvtYnrdz0qpdXiDO+hp7gGdnUpZC9elYXTvI/2EMzWiHffcKZGvLg98LSbh25
-uQ0qQDoGkr1KNLvTeT2KCcHzJROblO/DaV5RrpyAVWbmePqFHCZ0cIMq63tUtB4V3hbr12ud
-kze9AXs1hx9C0Pl8AOthUq03Yb0skfMwfk3ytzZuJU89ejqNWK10996CW7eGH8ajlExn5DWX
-js7tdGgq0Htg3btU94Zq2VbXSasprajEcnTyNCHDfe1sVgYZWDt5bey0yonJWrVETKcQ4nKB
-Z8qJAUvkeaPOVnaOT1JrP2JSwR7X1nP+b4Z7p2P/FfZJJnzwUmxQznUPbAub6bcVT+PgC1UY
-aZKt8S3yyIDohVlM+nWQzmJCp5LrYQRLbO3o0mq6N+/pqz7Km/wg/f+Dp97JKpgOZypXE11h
-yMTK1R0axRCxOpGYJGNoIWYEcR/6eVzqnVwBk+JnedSggT9glUyHavuz56yUJ3UFR893vwAW
-0nk61o3Qnb0DW9Chu3ApVknlyCMYovaBPTNjjExiqjLa0NPyUdxPuj6ukR0OqrxLYBRUqi7Q
-PeNZlTlTi1G/lctTyccZAewVllK10vdngZp/geyIOdPkiRjTr45TgXdan2etgVwM3TWYSu0s
-P5hijtDoDDuBQcwpelQ0mUL2iJrV1CCs7OmfVqIfuELGVshjk0qaG5zzPVbTUv0ZOxm4Ngvs
-sEE9Q4t985/D/bl09AG+jp/agYe1dCexk87iZrTg71Ap1sunnIxz7o3CcY4jV3uOe6YP7oSI
-2IgpEt62rYJO/f5R8cUmBBdY3QHHvwDzYwHMgJrOBVDhA96HRzXzGV73R7g27HBnz4juDbix
-R5y2V+gkkB1O5hB/ztrRhXktJJp6Umqke88pfOz6lviZdu2k0d4KrT6oAzV46qNzIIr0fyde
-uEcVZ34gxIQO6heSm90r0+Osm0rchA2Q+xo8ojfQ1o0REVvKW4Pc0W62181lcYlailH9Vt9/
-40xJyy5weB9ncLNOclxLnYlnzR3pVBUyZ8wce4mVuhwXOqG4NgPq1OG6RsSj6y6n3+a6P9NU
-En8gP53ONuR9NNhbmXo3ObowG/Ci2Bm03q3hpQPUBGc5JSQm1yF+cqhyuLsK6RPoAbfASXIW
-WsK1POgzOyE1A2qgW+Fp9D4u5S57gdwmdzyJW9Q/G7eVk92d2Bv36OmQqTt5qo4XUoMQjeYk
-+be6+ORysb7XUNKVyp9GzzzfzzQCLb5v79l5dXJ6JPpoWH2HtUnsjF4lnWoQ8g6pew040QN6
-VMxvd55enkfh8SEyFujRraWkKFHxv3FJ3fcBSoAd6q8GNTtVvYwkTrxgerlS6f4ef5LegJfR
-I4V6iUG86BB7Hj3n+T3r3XJa3xlnPDM7ulbmUsP10tpOfiVG/SVWknXnyNWgFyA7MV5PyjS/
-5PmG/crTjxkac5taTKJ6Fq820sPwG9DlmTPbdn5UdX3Wvjp7zvwdfC5coI5MfE67yh29izh7
-jtFi1MnJOqkV0n1WP4eZ60peTEu3ED/hCnuUc7RrvRObCeFR0eyRz9MblAqhZ7kS3Me1eoHM
-qIfGY4MsZInPX0Bv8RZK3xzTo9/gd7Wqzo44wxvptz26rU94LpM4N2Q7hzhILTZ70ytw3U6I
-+At0cfZihT95eu7R05VdlUEchwXOzBp9+bfojVaOU13O0C4HLcYt+B0P8nJ9AuLRIXeukGkc
-5Zq503MgI3KNe+l0OrAGqxyV3b2yjq3n/ArLFzvlsp0yY7qpVKiubLoO92YFnGYh7WypKFuq
-E9+IOZSJp2bM7FrKUi+chDqMgLkUYFSsxd031YsphE+xJ0bWBk8hYmKMph32VDirLafPdUcV
-dgynTvjIOGZu1M/qlxrRlTk7VU6sBZaK7Kzyklr5pPNsJ6bT0U/qip3BmqMO8BGrqIGG4D6i
-whVOROs4l+jJrXC6XwExbzRXqEAFFeLUO/R/qKqiQuIevgJB3TWAGbqLzKhW6PhJ64Nzz6iC
-2SHa5lhJD0JcTGtxFK7ZA7u5BsNlIybrO+yVMFdokj/ODnMS3wI3IWZTIlt40v7sPOetNtLM
-2/dfCJch967DqcD4aZozer6Mck1pEfFTxBkQ3TNlI3RE6IQEcYZgjZhEFT39N5jhZOIUU59W
-Km9cqMapsbp4AnEK4iA2Jh1oUv+aDJRRDK0z/nQTHYrJYh/E1xqUxxNT5WqepGnPxAClsp4V
-u/njlVrFrDtM7V6rhuCZOKJHYZnqhOzU0JZauSf7yeSuWuek1145KR4F5O1XXAtgunRRWCBj
-C3GNZ+gKPh6c0bmGN1bwq/qIOLWVeoq9qRWeJnNO55h7D9gRJ+XnZFcad51a4BJrkJV+o4rK
-5o6xi2BruZOvfSPXhhvkmwU6Xh+gBTpBv/ZO93UF7N9cpffgZbX6+Xv1mzhreglfoh/h41/D
-bXwrnPUsvTp5Ng7udO8cdfvmhr+O5wf7T6XqnFynJk/sXDnpAquJHCZ6Y+TqdrZSY9ItgpOa
-n3UCPntynnudrqyPmEdw1kwvz5ujXGt2uCr1xXLF9szZLKs07YT87A1woQF1Ti3colHPloq+
-WsiweTwUykm4orlS6UuWqd9mHu298ojWc0I09RCMqaM8eUwn7sR7z/AePgMRreRmTk0nz7c1
-Ms0GSrU10Lww0TKc7UFz81E53hv16IhmsGavwGR7xBPu/FEazw5IdisGN+deMqd41p+2aRas
-kTZAX+gUdYOsbeEuFM9rdT8LeY0EjsUIRD9geNRgHZCHL1S3ZYg+Z+zQI/K4EOEdELhwcWpG
-7jirj9NT96pVMlUc9CmmGocTOejCyj5LF1VktZAHnvuTmGScXlrJcSt5uF4hz+/El37W07tH
-Bk80cC8coxUGysg1Cf1ttYv36oM9o/+UO8vaidSVziYiz3HFlThIxlIma4jrk55vXrg2Pd05
-08dQk7XjXL7amV8IdaCjeCLMRXrpvNlnG2MdRmyl0fpklK7F3qrleplJ+013+IOn46l58NiE
-uWuc6cFfMJO7jIcXzS2qqDPW51LPZJJfDHm+re7XieXAKpG6KWalz5F164TXrbDiOQ3sCjlN
-Jme/Wig3Mc4lNL03eMucObJUfsMpf/QjXuL9nLST+fPNZzpwsOj8PmCW8S/gMvPfPYhbHOJA
-pWreppm9FUL8Cfkusy46BIxCLE0BRBcN+4RSmZJpGOj6waq2FyM4+Uv42Jc7Sq97EOeTE7F6
-ZQP0iPOoejl3Locj8mf0xsgibz1XWKmzeyX0aCMG/aWqXnNvWOieqelhDkp37BUQR+fIFGTX
-sXaDsJFW0bKTz0nnbe7qDn3GHn2m3tNDjBlu7Tgtu479Uk4m7OVONYF7Ta4PZ7b0nl6gFZCb
-DXK9G6zRXGtzADZyidroqHN9K/U49SWZ1DxkAWc48TrhJKx4e30H8m8ewRkcPWfgNeosXQmH
-fYv+VoXpVpeo1jaRb03mwALPqRfv56TKt41dDkYec+7YgwV2FqPl15ef/zN0aAMq8ydplZ51
-xofsK5f+jXPpqDW8Bquq0Ay7IWIwC3HCkk5/hfefyaOHHk03jn5sG2WMdVzRg1bUURjbLmK/
-ZNQP0pmZW8YoleLgObOJJ8M9qmCy+NsZYrwEIleDBXyp+yLyRScX1lu15gyQyb6MK4lc13zm
-vHTWHT6LR83qe5CjBJ0VGX8OnrONLDbz+xbC5ErnhLHZpBXzg9khdpJBPvlcK3sh/m2OOmzt
-zJOUnT8qZYwx1b26CvVAvE63SYiuExNrmu2xI/6mwxA1M0v03M9CMHvk21wRFTLhS00LpKNc
-Le+bRgqtlRh4jbgF/OaT7o3KnFFOQTug7I/QozxJhcYpm71OgREIEnu3pZ5KLswlF0+uFM/Y
-6bl4MYAZqzK5E5qajF4NnBZq34KTp0pVIRXYyCedMc/Ak+jgbgzQU9SjkhlCj8CwLgPz9Wf1
-ZJ7i3bO2o7tdKVUHJxZfIH5WchlZ4MleSgO0lhcaq7pG1Xw6y/tZzdOi/xSifguN0UEI1lkM
-dfolnHymHIWIALNVuptRgV06cw8dhBQctVfZrcrUyyMywukMmXxI2U1ZOvObnMDOWKrDVqkG
-mOLJpraSqjjz4ONPOykzOeJiDXXAqjlgx2dSJDbOCzWk89FbIJ1UA5jXeYNfWRM3Wqd5vE+e
-HIMUcHtkdJ1UgCfUbUffySd1i67lWZ22QfF8nPVs+E0qdS8ugaQU8osrhRjSF7N2Ni10jf4J
-+ygXUtrY7qIaIPW23Sx2TngydAsyHfmodbnHKjjiDNiLrX6vPuEd1uaAP9F6m1PPWrsWpk+f
-k6W8uS/hIZS4tjW6HSsxkTnfN80pH9EHXegyfwKqAZ/R/91GF67esxdumpdSagB2IY2p6BQz
-eRn3LlPNxEjXiYnD7JUchMxxwqV1IdPMctOh8p+5ihvhC40qw0ksd+PwjnpeR11nb8rRFmfB
-VrG0R37ax34zEZ3Bc0dw8utG6OcGXYMF+rucFUxHrFLOPN6vhL+VYj/Ro26v+mUHDIzK6Ae4
-cT3J0TDlxVTymlfLpH1PlLB25uRaRTya/nYXiPRrVHUbZ44ije5vpd62eUoxM+QancTgOMuV
-3bqR5Nk+I+pzBXB9cn+1iPyP+HVAttqqr2C7qlQsv9LzYr1ZazJNjvzp1plDX3L/rJxNjtko
-G1mpY1Sqs0ae9Mlz/t8BUaZFXXxSzOmgR2FvmvjDOIuJ7GfU2tvsLPJJcA2bMsGrQzdHtuwq
-tbK5Giu9m8ZxqvoGPWDm20180vw88wU4K7tPbIVJkWGaqR17oFATKrxe+M7B02n9AM7bRmt0
-rR2zQmQv8FyvkJnyqedwVL0Cm2iAN/YNcCCrQHY4wTkvmF21vSZmURk54uTcKo5upVQjNl4A
-1WTvi5ypXE7s3CNrvOMVTsq1Jlw0QK2N0UMWYa5O8iSu/OjtvPHevITIp6Q7bYd8+QmOjFu5
-6BsT4Akqhk6+BU7dr0rdT+aNdFRYienHbvBbR77ttTjgVE/WyjzIlnfRjWupaFEJheWd0mm+
-Rcw8y9t9QLfuhH979vSHJAMzUwQz5gb/yRQJlVZfpjPX1iRx1EyVttNnMIoyR7DcNdPaNJfJ
-Svr8hITV+nneU6ln2JtpJIg+8I2na8L6POG9EDvmxJSTb6QCbaRfJ5ejB1eIbJDCmXss9ZRX
-6m+9wzXAxz30ZNfKl8gXMveVreckjXtpzekAwOpj8vRJCEyGHNjXs9wiyUulyzLzkKXea6OM
-jh6MN+htLKRfaaQbL6PvxjLWGoO3CaJ8L+Q/nxDT6VZ7j071GSqvO+lqnjUho8Wu2koluUe/
-YOXo9nYtJtEF9s2V9AlvwPNP1TjxBFYbC+WEflbRcAovc3qvszFTd4kKKYuj5lk6CvHOpUWz
-WYhpXRbiBiVPUfp+2srvce5OscuVmFxFzGKLuLZzxc5K2ckyXuzamSd5KQ5JYlfzJw2eUzZH
-uYyxgievplcVMIqvx2hrfeiVkKMVUKODnG68sHN6zRXKVDPNWDcmVj6rCAzpm1CJ0AFlK6Xf
-s07SrbL8gyIs6/l7YKM1XFUfpJY5orvLeWnGzKrF+yFXIVf9VEFjFbwn3iAbWSgr4PrkGjVH
-vhGVhJdu5Ow54Yx+kMHl5ii/liPUslswprk+Q+1cClGmt4KHPmKNk5ts1DXwuoDevhE+QizW
-NArER825dvCG/BAhHHXKWj5bq67LHf18RuVu5lduji3E42v1Liap2LnSmljNGN+193RTmmJ0
-5gwQzkmic6rF4UL92Eaow0YZ10LRYoMzbKPTdYHVSYyAqt1BFT331xl5SYsnvgU2QnXIozKt
-k/ikuRQAS/E4qNRhL2mBGm7wzD7MpZGzSLx8mAcwBm/BqnFYI2uhEo0iPXVv5H5MqoNH+Uax
-Zjr7XdTJktG79Zx6fqfe6DPi+cJx+pNhhrnydusWVeq3k0+5cea/wVkt3C/p7dR6a+H5T9rR
-vfQJO7BvqKu5E358RPfj2XMW+L2i/B5cISorQnQvpc+4VmcjKLvfY30ai4JajIUioxcex9hH
-bXOv6MLV0YlHNWKN5tJw0k+gUL993rMoUSENnlWaV02dKUKTZ97JP+WAnzyKIdAKDW3FFwh3
-wY4WK6FGTzwXamKM4DyeGxtl/StE0kY1UyH2j/dtjJidMugDMr0WWdUDMqtWbjBkMOTO/NFb
-naXmZXbGHq+1a7jOVo4u/kTzPNbmdWQMBp4VfQDM29qctguXXCuZAx/FNyOHjBWcU9eWbGdq
-7sw/sIluG710QeaK6XT25DFfr+PZw4mVpbJoOqw26us36tkbK2XycxaK1+nTo+6gg8gR956L
-29hIGcgT03sq1BdAxJyeUu6u444e0f1aSTNSxlOTLiZUr1C/lTjJg07aVrGT+MbkzXW30vcw
-3XA9Y9rUzgkLYKaZfO9S1jB5c6gYECP2flD2aneRK+uoYlwoHXGljdjhl+qIrHQlLMIcC6iR
-ntTzYHerwxo8oV5/AKJzgAuWIWWdJ/e1ip0gulQu1NuqXHIQKrWDeF9rdArZBbFsKryRRXwe
-dGhrtK5z3ZnXSZOpg0COR6t14NzZm8Y7E5fdEJZG/Aqun/QpxPlabwwn5miZTiL2rjNlTOxp
-r5AbD8iPbRZfoSqVzzCt+8mb3t66YeyLZEJvCq2cXD0S4oxNrMzYs7oQO5p8e/7E0lk30ypb
-ZorWNbBzeZJegopW79NuzFSlZM6wI+8NdazFYiY2PUkJ4PVGybYuVCsNnh6uZz3DlMVyAhnr
-fv8K3a9VvxmKxFO8dOZotnCcmFNEJIK5LvcWUSwyjY/KqJ7VrXlW7W5cL95TpzOEHH/md2PM
-nZ0jS6EG8kzM3EuV4X2t+EgPCpubOn8Do3ai8eHmfpnO2ZyUpOcslA9x0jnXpGXqtoZK6ZWM
-qZ/UTeOs+hz0LCzOLBznly/xq/1zuPdM6h9zlDN3JsMEWeN7ZUOl1qa5wpeRwVyqh7jUGbqM
-rKoO+36pSFe/QgRTdT1Ffh1dWzihgaeL7QEqr9mhc1GhkKl6satEPkws3WIH16UXZ8Vq+1zP
-lPwcW82m2W29Of147X4X36x1hSyKNTq37NRkvK3/oZZ3ykJZj53Vozt5OkwcdWpxNv2onWff
-ahI3+Sj+2RB/TqVIxDdXam02jmq1+bfixfVoHYxSrKJSvebkumBohb0tzqSwP5nN+tLU4xcx
-AptHVScs2vj/5xmPp9P/8/6sk5LZHOMpveQ2yqNs8gu5oklBmbBNmxJhT8uy4PmOs1hMLl2v
-XdArs6CXAHGSVnvR6aRlBdFFFZjhx3RS7GZcemYBhj4YMmRrtNROJ6t28FXEBSzyWi5kp1wj
-Zk5yMB0UH0yTl7BRH5/FfJWO4qhyZnyjN13qaVZaMbniDlXSplJIl0XMs1i5nfYrI29yoKy0
-+uhCz6vRDjSGFnkaVpXxc5Key/hEySXApjdzj86VJ6k/yl1mVzHDRXg6L1D3etVJg7r+5vPR
-ooZp1e0h+kKNms01aoVXWr3cKaYSuVprja7VW611f8ZqTk/ZsFOurELvIlOt2qkb2St2nrUm
-D2JknsEWNC5AOj0qcQuWYkLm8r039Q2xhsEbO2byaXKX3c8Y16up/gbhVuwEmau0nRL21DNl
-Y5WixzxvsKkhY+RbD56nh8XcQpftepvZVKkmq2NmTLQq3S+/+yiEk3rkEvvSLmoac2Vwk7gB
-hjjbJADnuE5HXyui82QoYm5p2WHKZrj7LL8uY5S0eJ1WLWNHwiOd+sX06mZXjSdVDgyYTq9c
-u2mHtDgdBnF5WvT+jnLtH9UBtMkXTvGF82LIyrS5MelMtDmGGe60AHOjVAWbqbs132N84uxp
-F/ISWIgtunI2/eeg9ckVY+flpL3Txk6JMTacanpDgnx82sxp2OnJ3JyHwWg36M+xI8dnXQCd
-TDUMva1Kl7iNzCs7cVI4xYaMmVFsmQwoQav1adxpxo3FK2bGFPmtS121M01/4q+S3US1R+LV
-VqiUn6GSK8CLOnqbXmpzJY3n7cQK4f8vtesm7Qhmfcw1e+01w90SymvneRY7GrbjU68iVeS5
-drvN3COimqtHkNg9taoCouzsBB0jI2an6ygWALV/jECc7EZs5iK6G3C+0dp5eQHV4jcvnKnU
-G3X0aq3PebQxDOAkLII+fjVw5bMw3LOm/tBHweLfoLprD15pJb+yVLWnc8lqgsTByF/lHtZp
-MiScf2UR9c8UKRfqB68cpysu1VdZO06zM8fvSZOWbG8P6k6l/KpSXr1y9NRfOTrE22yxpUs6
-8oUqF2NulI7313rqkZ/Ac19oJg01Cebs1fqkueWeyGc8DPJDKp133DGlsg/m7aMylVRNJsUC
-d7/xcPkUB7FCTKtBza9l3TwnqMoka4k8NfJY1qpnKq32QTk3OTHsBp3UYTlgdXbCsqi4IHup
-EZNrjlzRlcMUtbVUtezoL8TnqKRCyoXceHVGWG3z/R212p7lIMIpGpfC72rVx7xvZvtHX6mD
-V6sCKGJ/3zw5S+ditmGXsV4S4vAaryI3hGchp88WeKusdemAb7xe8jipIdoJIW1jRmrzMnqs
-3oU7qIdz0p/upXWj7pondq/+9FnTDU/i4Tr1l5gfnzzn1gYVUHBVpXNQAQ6jqYxPnpoEY7Jb
-RzhN8zM9D09W00yysk5PKddbZl4zCQk3Po33xh46aT210ucyYzZNZQtEICBYty4Hn+oGvOla
-qslS1RYzOMbOTv2dTu5ZnVQFp1c9kRNOqFy890rVCvVlU/TpWomVuxELhf30lZhwXKGcbGM9
-vD4i52RrFppOZVNR11DnHJCT5o4eRa2e+1FcmuSoT7+ySZoAzkurnM0z5jRdH89Lm4xkdfHr
-M2yQgsspXytUaS+BgA2atX2UJ1DSEVHrfNbnDsKIK8VIashO3tzJl/r3q5lr5UoKC1ub9Aww
-1Jn8ps5TexCeVph9F/yx6JHVSHNZ4qw/CsWxaZNzfghPNOpgrA9DtVep08WYVJPwCiqi61cr
-N/EEmKeO4v5xDfVyMGiw33o4Dr919ABjf5DsWPJ4SyGXmbgx5MMcPCfxsEPRi9VDng/P/SF2
-dI/6znwHtRuEyRRga22gDwzduhtdV9Bab6Q1Z6ZBZ4lS9Sd7DdOrXsMznnAFXvqTMLG95/TL
-k7dJnzv8qcydvenjEotrzsen3r2c8RzJFWXtb/onpzw1zZ0jn5NcykY4uxdLvpXT20EOUuZR
-tVVM7yKGWijv8sIlzsIiDr7WmlyjF30Uo/44W58HrE/qv6jBKoD0pt38gK52mPjzj+tzL1wv
-nMyVzoGNYifXQ4WolSsbNceNVid3JgyqUaepEqqbqQpPs1e8N96KXScpDTib8izHtw49wcCI
-4hXYJ9S7rhS3fETtvaLvIHexo7ibJ7kRTlD3HyKuSE7xEflVJT8PogsFuvULrcsLOPleq7N8
-oTkDNVhIdJ8aorancDbFmH1SMnMcKnHqfHJ4Dgf2/RdxpA7qTg3RRf8s1M/WZeraFWDCbNSl
-aZQH2yQor0jACtfc1LtY65cztN4w91EYBt23VvKPvZQf0AYrrhN+6F5l2ob1DELrRuErXO1U
-Me6Rz1zDWfEA16VbeExTX87Zsh3OmyO4GRnW4v1M7fsobexRZ5uXVqIU3mgdstoZtmSR0qpy
-Kl7Z/07IdulsOkXiAI6qT61bd1RtevSmx+1nfQL6NoY5lHRsH9Q95btqXn02s60WcTFdB885
-oE/eHABb6VxtDjynbvTKRAqxr5fiOd/Aq5HX9Yzzyr6+qTYutEaXQjas+zRqxx3FbQ0ZFN00
-JrFHj2KX0v3M8mPOJQhPq5whtGSCF2Kykt26QJd/5cgP5tOwy0dO3qjuBNU4Nj8li/2q0lGP
-eiUHxVtFuQuc3swia/kKzLvJ8/7XELlFy3jGs+qk93K6Nlq3tVxvwtsfgK94zF5/1hmfnGXX
-ct2xPkrtbBqb1aaJ6eVUDZiT7GuMzCrIInbSuOsy9TL6ePdLdaoa9XUyN8Tv2YsDZsjPUU/u
-AFapzfle6vMzN0bG1tl7xeJeXK0DVgB9+o9yoCYDxc7zXhlIHnn4DeKT8bEvIyd7rQkaV2B+
-FOAfWOZjvZmEDFs3lzvv6NMkELoUHMXbMnRhL4Yx3XuIIpXig6Su1+TJWq/EaabflKEamTrd
-adr06M0fpdb6qWM3dvSTeFPM0wKicIEVxVkVhmeYZ1XC+Udvc0Qnn/rz/QxN7tDLpXaIa/QK
-WcMz/BkXUr6Gk6yPazNDJrSVAn6veM6pAoyOubM5F4ZUmmrFuj6W6zFPNpwj15q088MwUvsE
-mwVEH7GVWCgX8EalW6Uxebgj6elPf71LZOucILDBuW8dSea1CS3nKu11todJdo9gcJ7A2ydT
-f/D0AKJTSKfelyEUZJI0MyZpLb11I547I1gmHgInWqxjRC8iV8dOwUGdZupCO6zLoxj6fZz2
-dvLmMUKfQu/JmrV8biV0YaFsn2cHkbfXa7OO3Q9WTF48hrNYuGTjsIqahKMUQHt6MFeCmw15
-aB6nFXVekzfOrCmD+SmdT6yB3A1awZOnD9yA9XktR29bl7WuUj4YPWKJx9n+7AvhBWQEtepu
-sDNEHlyu/kFiApH1memJW3fbOh6GjVvFUygjJa9winfPFcvpGl5cJ06EoKMkVxv3vGEX5mxK
-H56jnDq6iPM2kSNgpyk9n4jJU5NBLUYnLt8oH6dM/QhWcxY719BhLORTWEn3WWgKCxVPZIdT
-yW7xc5rViHxCRP8n8Rc7qdJbVU6tencnnzmb/HsW1maeatxBW0//DLpwc4322peF6oCVS3qg
-OsYW3sWkfiirxklKKaInduLljn16+g1k8hqgSx/5gl66N4ub/SyrzdRtqmOPqIvsMM6bpf8W
-K62dN4eAzLEP3XrOlaNHbK033KgvWyjKGWM/OQSYM6tlnjZfMmWVRAasY8S1eY7VMJH+Vs+h
-cFRYknE2iY+XXPxMCW5VPncCz/rUGyS/f9CJTO/WQkzxxPjpsTqfwdk6Rp3Qkzeuu5OynV3y
-Uj2URng/V16h7JJ9gZXL1REMqNLamXYkQ/xsdPbYLh7VZ2XXf1A3gM7H9Co46cQ1HvFvT9zk
-PLyDhoDOmTvtT4uhzPwZQRbCEcgSMjUmtWde3ciTtEknrDCuLL7f1L2mdti03Lnc7y1bGyJ3
-L3dJC/h6nhwrzaOnVyPr94UcNwugedapNKRj9LxXc+rmLuQsojz2bIybMnnjxzD+s5vHuVbW
-h5z31NlLJbMzdyedS2dfvWKd0SPA3AoSYkVuhrnVsvojTzRkN6aqpca11e5Kk2tLl2aRJ3ax
-TV4ZpM7pNAfORdfdA+6UzLJMVZ31yKyPSp01+wJEkAqd8NTeGfKYujfsPDDj41Qdcnx7qbwy
-9S6Tate68+b0P/i57zmr6kauY/RUsxzHPMetY5k5mzAxCmM6a22ehN8xu+hQN1L3Yd2k1J3k
-HB/2JCrswXmP12beG1eCEYoYojH2pvgty5jzsgNSY40e1BFrhRSPyGZO3iZGVtq3lThiSYNj
-PUbjk0yeeWWt92IY2+TN56hQ9zl5+djshEpnfKHOXOaMW2MuzKazWEQUi5PI1zrnjTEwxN5Y
-40zbwFid67Nzde1Nz9LqJNv5pGinQ4g5URUuzblONV2uq0INQm/mG2QiTh7khfwTKmHAtX53
-HnuypvlqfXJRtRmB7GU32mFNzK1Y969UpVfia0yzuuisvv1evSdOhdk4Ux13qi6ZVZ7V8zgK
-vzjg/Ez+oydlxInHM2cfNy6baUnLV9dSXd5GVxl5SUTlvHrx5txxjGuSDCzLqs7edM+TeppH
-cUDoqjO/5tOpLSOZvHlisWa3acqFVkwhNO017ywTUmGnVqMIkTvTtlomUajfQuTEe8ufVurQ
-micWOSkL/S5yDXrtKuMkkx84zK7k7EPOD3MbYklpkivfYSf02qm2M/ZyiOTGvOb6zOCoeaEs
-xZi9XnuVeFmh3WNxa1JfbFK2ZyxLOjX3Yl8NWom9OtOc3ElsLzAAgvqQE+XCZMTzy/2wqjbk
-2Vak1T5EtEZNLhiU24zKbbKon2MG6FxyeywQP8iAMf4ITwxm5nYtIz+evJJCOKT3id9N/kEm
-TxJ65cxnEPHdDeqd0UUui+/rqPy8VXfcGF5cZ8Ya5j9lMcLwnUxiCplO9Le4Uhnr93SVkUFi
-rDSuVlMMmJK6Uu+O+Bb3p6kTjPFlXW4q/FtvPnNcp+Zk6GK1dlI2zHPd8HnrHVq/39i8k1zh
-zV9zRN/qrbLktbNZt5Z5G8N7Hh1MAWB8l0yYaKGMmln6Sf32s9aosXAKvfelyzX13M10yR6d
-yLXqjkZewswmWIEZu3AnHeRe6NZJOMFJWPhB+elJle34inHB9bmQdnujKaBNdEBdiPVkrELj
-wSY+Wa7dWrg0ia3S+cq9dFI3uhNuPUVc+qBdZ/s6cYeZ41vMTp5qSXfQxdOVbkmTWEmJGWve
-GVNkLWdurmIwLg3/VEKv2FOd8x6sP2DR2zjxXgyU8R+upNnuZ/ca1oy5nm49HfZbP58ZbYoF
-r9mdRFjeoO/P6XMr5cF55JoOs/3vnE3YPovLNp+uQHQwsaj5hjLFXJvCkWZzUQlJnCto58k9
-cHJTJ7uo0c6jW6C5xJylvTxLr9uqr9tJIznEa+9tSpFTjpc5c8OoETVXQHzX0WWAMweIcHB+
-cKl+TOoL5K/WqPkOp2+f5reZWpb6DvpeHMHqoeoo+UPwL2Mg1IrZpU6w5GIw94urnGlceB7T
-+9WirH1T032ZHmrUT7Z8z356jkrDOfNsnWfh1glJzFB21rJXP9H+i6Gn9Ko9IcJwBtezp3bo
-IPRmUB/SeN+No6OTzXgK56pNVqA/1VldFDtLe+W7Xsop55JXbqkuQ603k2stsspr9e/nnMzM
-JZcDU5PT6d06VZnmnQwx75xnFJOYw/b3STjwSZireY3sVcUfEb1GbxPeGKVyVRpENDhzwFhb
-a7FyzD/C+hLUmmViZzDO5M5UJLZOWScMYs+0vps5Hg1Cgo35bPPmUxwjTmA6itIlfiZXRu4S
-Q7qcIbGl8pYiRk+vfGH01tEc4yekLMHPossUPymhWT5ysrO48uwv40SbS4Ah4pYL2mzPQu68
-9OR/9rm8t22mCCNwIWQ2xE76+A3yXO/Rq1o7qqrMAalQ7ZkUD+MMN3DgUpzUF+uVr3ON1s70
-zIP4CpaVM88xN136XC2xGip5itFtceFMTcNnZRPCE2uq0ylvfoV7oMB79QS2Ovvp1MNKPvXm
-rcaxFVfFPione69QIYZall6Pa12rV3VEpj43WQxJbWDoedLEnuI1iA1hrB6ixKaRnHOHTZlS
-xL/zyG83TaCd2oXebsJQ7S7s7E2u03Plh2mLbKWPUROQnv3kTSPHT7BqrVIeUrksnv7zSFuo
-8/Q64+H5O8G/5Cj8qReTmlw+MgTp32dxk31UKpLJCW8i+sfMchQLw65OWTG5cmXkIaVTrnKm
-PvDa2z7uM2bfDa7S2SQH8362qQ62I/MYQ6yXyvdOr8JWp/xZcfQE/utR/4+n/V6ZKJn5tVCE
-uRLL/NEX4iXk8sKYYvVoXoIB7dhgJ4+ejHFGu4Sok/03ii1teuaDqjl7O/zVe6uSTup99Vpl
-WVyP9s7NrSdFtzRpxbDdwVfxvLJIztOY92TseK7TQZyXXicda1FjD6XO6ut46RSjU65KjCeL
-Ebd0Nm3tNOP3UsNCF9q9pz6wE+8sn/U7qP8fwJvlRMpOejZzH55jEsZiT0/dKjbTdbXiNNq6
-tPjZiStrGEXyiSkUQa1CWqh/uRJqUMVVmetvnnleGAm9imwmA9fmAfFzJ4+zQ1yfh8hCKCJ/
-mIpxzh0zHU2tKon1esBHOcGKc/nYC1wLkbNp1/NeVnLKswxtUE/L4iY7Fpw7nIvnlcUKKTml
-J3fAfIYzGP/XWF7JH8YqKJvwymdPjovxY1tvs8VYz9mcIXNFIKpi750V11z3kZzUGEdz9Qoq
-1ZeFGKpZ9AVhP+YceejWSSMeeVIPp4u10Sj2Uitugz1hL8y1F/Mx6d0qVTmmy567jtAZI+HN
-5xnebJrRcEIU8Qyvok6FvlrmaGDdAlMkvt6xmTNtYeK7mXbBelV0RW7B3ttidtQePggH5X2j
-EOEK/X1iquaAQl+oUjwU9nRzt4gxiYzohUteAmRFJGenpXDdhTM+Saoe0pnKLslefSVDQK33
-aChY603FPa8/DK02BZKTPsWmaaX4ydiZPBVzOZ2O6lSwguacjBPYIUvh7sk9YBSqOigPmKtA
-U6ZgCoVCuVCui/M00iRR7oLC2YwW62IlT45RuecghG1QfdnpLOm163oxdxJGYqut0D1a35I6
-ACKR83q+9aZrsyy/EvuIPpFrcVI27rdepbY25zmT4UD5bKU6l3pXxLzoxNJHleBWDrsnsUyd
-eo2N1iZ9Y3rETlY+nI9qDkWVcr0ssthKZ578dENJEwFNZ2hZOxXVprDlmTqPVwu58qykE6kc
-5/zkziZjzidRzn0zbLKJTfajasU5mw9JpQnZ/NQApE6B+eGzo2E9T84qGXUN4jowNplCObGX
-X0c6Qxh+6zbJfv4VOj5t5Cwu4qemLNbU7GNcrVynVrta/4PVX8oa29nOM1/6pNoeXzEwbF3O
-dz+zmUx8f7pq1VI11eIbJ8/fQuoLH7ls1g9JisekMDQeLne2aRLMdZcVB3VYnTwsjSnEia3U
-Da0dp88z96T7m80vNKXqHAO3c5P+uUtxRJevFB1UWK2kSqpV4bBKMI8y7gnzVDqCA1OLv2E4
-lBdTyrx20vpMMdR8LXN1p730jb0UUJwnkktjx97JMItRNVbyoGdADLxxNg/W0H52ra3zwmh0
-9skx0ur/QrkNZ1d6VdwdritFgWWMzk6sDfNMSKiDsQ3myKxVPAl5TxnlOXaJLNZykl8LVITx
-apTDGTP+1hvHhxFzpSshieZdS5fIZewjM0dtZ2dAOgfyuF4N95+E+fEUoN6Svc0WWSgZGNxf
-pabhLMUVvoJOgU9tpTo1IYb8Kz2hpOCxXJ8d9lVUcgSm2e4V44rnvvUFC0fGCWvRXm+t1YQF
-8pobncbmyknP9ZMwyvEVs9MmCeXqQY5SkHY6qY/gONearpTPsBtqSwwpTY5AhgLYDInOJz+u
-FvdhXtuTtEim3iaCVUhjknzKRnmU9eiubNAJogKMOgBDJPJ4WV/MC+sfI0pEb442ZqpzRwtj
-BWUxq03TMef6+sQIsRm2ZJguXT2bK7KU4zOxzko15xT5IlXsQbeziG0TmdKabCLWy34UPRw4
-P7XTLqFKuHScQ7YBJ3MP3nDgaDKG0QPYJtPOPWuZN5DzyXvJY1bOs5PxcgttCKcE7qMmlkxI
-p35geGOhF3eL3odHn+5SsdTWpvVAzeuuF5I/RrfHf5wsa+p3Yl2mjFqA+bbH+ky8C+Kqtrut
-Vje2DpWe9v2NVWz3MESeYso/0iRD69/XrhTekUl57ORIPFfnmI91pTov5VHm9sc85KgdmrjC
-NufV9Dut4udJ35JqxkGc4pOw7la1yeQT56BSvRXuMLAqb8Fea+LaXGhtzj3nOU2jErvCNMaW
-GSfFeSsWXhuRhULoyNzhjtWixUsyw02/tpfPK1cSWVTsQ1t9OmoHW0eHrOsMPY69r8T+42TZ
-Z6zRtdYoZ9a1QmVKR72peZzfOqcJ6B5My6A1W6tuzlTlW53PtUkFurGijXOUK+9z4nOM3pyv
-mlgpzGe3We1tmVEWn1iatD75NKWJazMph9h1O3qbXEh9wiiuis0pboS5cLq0cWzolL9CRFop
-t+OEWCI1lZgFxung/BvOhklcp1EO7nTDNP/NIuJKlgsYk9z85XoxPQdvOpVGlSzd/jxmANsO
-svN8jmT36o+evHku0WXKpign9cQiXm3M/6iXSa6N3pOfSH4b+U/UUF5ojfKfD8r9zuIrmttS
-r/O01/+zt5HH3UqG0gLzkcP1jF95th8Uuzp1Emx+AJ2uq9n0c6Kpq9gLHxSTrJIxZbNh1Z2Q
-TOJN5t6b9AwL5cU278a0rHM3HT9jRCSMPWWafnaKjvIu5l6xKiPNO2FmTUQ+jywBOh7R2cMc
-/ZbQ/nKKqU3oWSvaFurqG7+FyIYhbqHHNAG1Tq6+jIouMg1GPT/zwzZWinkymN8xZ7OtxDPa
-zGoPY2rVsVOdXOPMScr683wz1itN/eTRm6+hzfdZOvMNZA+/Voaeqpc17uUoXx3OBV5oTTZC
-BstXVZXNxp3XzjZfmiuEk1xrMKeD1vLu5ZMfEEOXQAbOylOonzE1ijF9M3nBmPM62WyFS1h5
-mgJsaoOzcMCkhmL/PbFQbSbkEHl2hepKW4Gpm5Q7c/Yyzk4e+43J78rLN7BXJ/ukCvigHK/T
-ZxrKa+g0nRCtA2cI8kpr8gZ8Cs7J2ajiT85d7OuEfIS+PpzczP78oJqC7OLkCGksj1RNz3Fa
-0zBmEZcaxVud952Sb2TChHLdUyE8zPCoNHHD+p9zt7akZ+Pq7zUp1gmzboSeroFntuCMbsRp
-Jz/YHCJbn5jM88sy3jnGN6j3w8z6LLQyaLlMb8n4uYGL7Fm4vdUB9B/kyUeHzjL6aJUzJDcT
-GmF+4Jx9ZBxYKubquDb9rEfiYudniH33xFmaX9bpsXm8J6Ez1iHYam2EmfVbT4+Gyfc+sY3O
-r/ZMpTPe9FycapZcvNdahxfI7bg+L4WONs5c2ljvdkKCt/FKqJE5tBLNYC/O3LWMO5W8DOfr
-k8hLrW4KZ0kYAjhENojhpSfPjslep9g5Rgk70/lTEo/GYsSc281OwiCM3OGN2xy1Qki1lxMv
-M4F6VnGZO7ChA6Ncvc31MHNpApz1b8xpcVCtxOfIiS/zer3TznRSxZS/YTPPV4npilJP3Dg7
-r/WgK9fJ4/csVed5ti4S6m8OsKbYqHVV8SeZkxp3Ab3y6KDB+dOFeBpcF2dvXHbTMhkD/ORt
-xnXyAjVvzWyGfpLbbjMuyfUhd3Lj2F0IdzTobSTOchY1WSf1vqwnmzAmi2TzODLHTLNX3dY0
-vWqSM7N5Bg/KT1l7GQfTKsDX/KekX5j7jM5Z6i5GyGW8cscJahvkd3O3fa89YlqtU8yoRuli
-JtV0aWpH6swm10zDWMgrPHtzl+Kk46O0AaaEHqSGZl1du9dstGJ2GVfmNeJuvPSVm7THWvFe
-OWe7nCEVac70fA55Lp5LHvlwpm4z5dAJ+XMdZy3zHOC1kxrlrOop9bwMC009xHTWJB4YEaY8
-+tpdxNzGxfdSiztDht+gXNcmrLGjdY5ddroB2UnW+1Fvwhzg5oqdLO7LhAxnyKMS64xqoNRx
-7sDJ3ElLahPJTFHZzxDoOefb8qTkKDB3gGWkZA5unDxOKaMWhbPizfvKMO9JWdWoeOjjlVwy
-k/+v6ch4h+S92uQGe0O5cuQF+ng2Pcc4eF5oImtS6+Hk6l0ULs0gJ/JX60+udR5ZB9W6QQvp
-JSuxwq0HmgsbMv4yVX9zTJfOIZNy+jNwEtZ3j8ijw9R5rtfjq07hvLs6Cd3vZuzKVk+AKkOu
-hTR9a64At+5WOlP5FlpFZIvKXTy5zUt5zomxnmL6m385Zxxemy//ej6xOds65fvMjjpvPuud
-eO3ktpMnPAjZY438W+ZJiqREUc3xOHkjLp05C7JSLFV7ZKrFjMc7xfVFBuYQPdmIQxkKw/yP
-cSJ1iO3PJhVNL9zYGHqVcOelK7RTvc75fsZkMHzi4AtnDt3GRbTerWH4aVJA8kpPqOZRCHEX
-+RNLYbisFE3jah4JFjupG+Gkr6RepwKR11E9rz5+uulrrTfeKaqk+rHQ6WaO4kRjs4iAXqiq
-telwcwYV2VyGWhFBG3zitSZ+VKksxXDpNI8gzVzLFDeLqCTjXNpSzMfku0PdAHGKg3pL7C+Z
-kwjZuWe9dcYvc2jkPISkNLD7s6yKHfzfOt2s9UzWQuBKZck2v9BmGA7qI9hPSr628z7i8ApR
-SpOyx7hbUw5iGs80M8SL/WU16VG5wM4nNedZzBubLGAMukaxZqEVblw347s1wvIbZxrRU8ww
-bJLJQuthrmDiKW1KeJuqtIbzJafBURXdal+R/UlX8klocPrLWBHc2+Z4v3Q2a9HLRdYcBIw3
-av11nkWt1ufJG/fT0GZTWuVuzsefu/pOszeRYmep1UF8xHro8zVa6Pf3QiPIkaam9LVvSBtZ
-cYNcilmBpDosi7ujEXNjqfhpTHe7KjGN7FxPvoHm+TLMOoT2/YyFnmrn/lWORYw3+dHziVg9
-8FvGcHKdz8S/bNVn2KEOKWN+t/fUYXWx5i71fN2MLcd3y2uIfMdaHYoqssSMa3LSrMGkb7UO
-nLlNsm9MRshZbnuGCtuf7Gc4lamE//8YAK/dIpJfbXLNmJQ9DsJtB/UfWAEcZ90o81i152tx
-Mfk6G8Pa/qv9m6SWKsXzILpVia+Z9PPmW5apD2DaOUN1936SR1kvb9I2KsSMAWgRft7TcOI4
-llFT+fpa6myna77VAnPshaeSOQVMfv6k58oyU6JaHWD59+vJNkmRnRzO7ewo9f29cktj2NCv
-PNUexxg/mTXmYnSWzuZnpIk4lnnxtDO3CF6NmH3mO8rrhDygUrXh1XnuYm1XQlF69DZVZTmL
-utwJlh0kzlYR1+scKXTONCGGn83XZuKZpJkyg7ofr7XeFgGS/0TqI7z+ab/9az7zYl4TFTrb
-yeFs9HvMb5U6zeRjYzNIOUnc+uPEHMmWTXHqNY/MorZNE7cZlwv9b6W4nTRjdvqk/nkWV9yg
-syo5HqQ5Q6le72drM1VtmTN3QkbJxtk8WMY9y/Ps5/eqhehWV8S8k8ghUdhBzApjSZQuMfnS
-7BhzRpzvidTVXEQWwsHT+Y7u9RkiwkkVaupYm5vIWbXSFDPHRhhz8jv1PqlSh4jIzz2giKEZ
-hrNQZpO0FjafqNf/prklr2vidJaZT14dK/eEaaa6OWEhTs+uFrY1R03muNqoPplFotS1L4To
-2txW84017oldNp8suYlkzrwfU51uqqCFo4pyrmdMMze4PgxbNeyfZ3pyOkkzsHrdva3R1+sy
-j6d58ubiac6fbdzFlEmYj7q5iZgGy7RZprUwZNtq79ezhzJF1HRV8Wcz6x2Un54QmQvx8QOK
-OKkCJbLXeU4oYEXYedPaztXCcyzs9TwpQwXoV2WeGgtVJLl+56izh7mRRUivrDJNKUi+KCkz
-Tqy03BlzcowInLEsEzemiM+G3dR0dlqFbxmqnaMJwU3dBfOzMVZzqgPTxJ+5ajv17VgPFeKx
-L6I2qdSuNew53ZN98hjv7vWzSJHZphDNHS2MYW0KLeOx2Ty+Sj/ZcPcinsPmyjsqezakalD1
-0CvueD1hYzimWJjP6sr5uWWcs9/6fxWv1gSfW6tOC6fJ87RKqjNmN5M3H9rkP/ZazTWfJpXH
-tWnrklzoInbAFopaySE84XDGh+tnOGXSxifWvbFAk9vEnKFWxF1sGK+5vZvCpZw9C8YJyxRG
-VRxDPDeSN55NvBu9uUgxC2EmMc56U6ZCZz/VZmPazjDFr7nL1LorviEyXgxnHVX/zKs6P+v7
-cY2k7pehw5MUOYmFNf+UpHrKXl3zSRcJRX09v8u8U+Yq4ddcx+If1mX6K4vZbTrtnXal9UXZ
-27Jc6aRqg9m+sdJGb9PG0/kyVy+/zkzm38AcS6wvwu5sPjtFkwI5n+3U+d6fa0Lm3P/5VLf5
-05pinTp3SJuzsRvlPLlLOU9iZ42zfMJyCtslltFl2qOmx05+AYzQyX/Y8s3UabczLtPuMHcV
-2zH2Xl4rP6z+tiwpm+1Q04oaGjjFFT3E72CTaRNWP8a3mGbTpdg3VyMYej/FvvCcU26rzCY8
-NM7mB6escu5mwDg0n4SVxTU6r2YTDmhq2rlK0cUzdr4+5n4Oc02UrU3Dn1P9bBmFvYvC2TRD
-5qujUE3TD5nu3J6Fm8W+eW2ZMMP5ZLA5y89cpOzt2Twpw6rStMk56uSc5Ve9YnivvOa3Z1vu
-TD09eZt4Z/Oict1x6rC/5jFY7KxiRfvbmJXW5hDXZWKJGmKTOeNm23OZ9LvnfDKb9TGKL/ha
-T/G6o+XjOZ10jBY7LcOyyYGWK5XKGNOZVMzyyWL2zX7rxj2vCl7jBknPblnN6/nB6Zp/l3R3
-VvckT3ZbV/YWTfGVHNRKZ3zTuePUfKWk/ZVcUFKknnvmzCcEpcnE+WxV2mdZVWPvOa0ci9iM
-B6m2nTMErfY2x2vjt0/ixc2REPPQHGNXI52WyeUiixmFeU/M3VISFma4pU2I6+MpbnzA9FO4
-C+deO8mtJ8Uf68f/Fvm1p+xfPbe5AmHyKfufY3fZbBUWypXSNFdjGs5Xm52x8zjyOluzrDf5
-zDuXeJ3zPljqnqasKvm5pP+SMrZJGaL1JyyLThEl8fP+8crc6yxl3tcxl6osIrx21ULMjGOe
-uCBzbX4ev4v1n15XFHM/3nnNa4y4OdN8XoGR81655KdIh1k7yW2SapqWk/7KfvOd/ewnpOma
-qSK2/OB/tXcl2o0bSRKkuu2Zt///r55ukdjnBQNxZBYIUFS3PMv0gy1LJFCoysoj8ijYCHoi
-1WWuORk8Wxpr5Pny04CQV3i1d4ZNdZrog+J9uAOJHi0rfTbLYXmnTvveI3hTCx/AGlz+wmx5
-eqXae0r7NXBGlnFofuW3m3UGiQGtqnY6s7I0+udv+bfsPa210ajbRr4qz0iZbT0gz4Gn5ptA
-fwK/Xrwdajv4sOijt+TJoEsKL5xg+v1mYUIDs2sL7V7OAftdLHc/T6jouNiF7j88a1p5itrA
-zzvVT6XM8r/PskMy05DnA+JUAmogRUfItfrJq32S9oF6ELAcVZ4qEjWJnPJ3RyebBalwzA2Y
-8PWGPiVvfhcZQImNfaHeztl8v/O6lujDg7Ok6QXPJjNyBvjO3qtC8WvHB4nUvssduZbk9POE
-HkDI5UbfKJ6MTvnpp1EjAoS470Xm77L6VOr58C3VgqGuTIuIfI+RezRNKblcbczqd2sdsmZD
-uHVJrlF+ZFboeYLnr7rf944jUOm/fJ80K59RMqDN11vG62X+KbMMuxPZGWpJvK0y6v3Gu4ww
-va3Sk53EqCe47rNYXXrVN3Sb6rruIfhexCeBGIHbqP/Tf2AnLJcxlBTENZfoCzoh6CnsnkNF
-v9rHR9/wFGtI/ay/w/euNt4cF2xDPc1Xu8Dpc5gfQIT+50zckzN1XX3Iq4zttN5Hz66FNwd7
-EkgpvDvwjuLUtN55atfSefwys7PCEj9CdtySm/PXzStU7x7zeZ4YW2enzJ+CyMxrFJQaAbzI
-vyreq3iW79fc6UBCmff5PuOMW62DYb9mShtiqXzGSf7issufiLxmnIy89LPHKQOT+OrLvdx3
-cS/zImvOXcdd6HlRC08rbkMtOpv1ih5f50ltfMTYVfNoJovWJNOCA1IMvBrYFavqOYPw64m/
-Y7UpkShTl/nkiXD8JHwP9GFa/MD/zOj4QGztx+1aMAxdT9j4F4uA/rHi5pc1+w3eEZD1eWZk
-VvuuIJOAfaCv6x7kXn+7YSyo7aunKl/X9YR1wuwfzeLJPUA7RPmU8kHPi0fH1W9rFHvBfE+T
-nvU1r+uIXubAWsmtzCmiT4+MEOQpstf0vHLz6YYzMPaMzo2IUCBi9E2klO4c7kHKDurU+bZ/
-2BXqcosBXK0nCD115VLWZ5wm5h3zZC5FNBb+/GO9qFvR8/NNIuHLPnmPkame51pCfl5X7+Ht
-hs55LyasAGxs5kKiFxQ8gvOkHqJmzzGCNItWVIJu1iyTy5pNf7khnctbIA5AK2m5A3VthwWe
-Vh4933jzj1tc/Y+brtd4GfjzIjppiSP/R2aTVgtPBaDsVERWNQQtWGZcss/4H7eo6pL78LbK
-dPVIqD8m+f/FX+ZZSZi5623cjIX/mFn5ejUuRzYp63WJ4mp0lJILn0NX+H9N9I0pdbU+AtJc
-uym9z8wdcquM1rTXmXNuve8OJD8xi1OjE8ix7Kiv/0dbgHVaiIf8Zfzw4/ZG0E7AosHXGjV2
-bCMtE8SFEBlCDufCC4jyw6KZZ/Tdeb/teu4RzS8CqnVZcwwd1SO3wHp5X3mTNU3aA27JHPx2
-m19GPsAfnDlaf9Qb7HaF57MGi6eVIZ+QOXzzOqpldXF37A3yps4vMBz4RyfzP7/fJDC70L2v
-fIremDoKRj8ZHUBUA1lgzPtgHIB12EB+mRGLOLkjTepfquWqZwZp3G+e0UUPT7/cuOLHjF7+
-2Gdq86kEqYgtcg2YDfN2e/7bqkcXa/T77Z0YkZ5NDr7LszUTRP0NdgyjZ3JZdRr02lInjO7J
-i/5Bdu3SE/B0k+XESk6TypNvE7K7iBoR1+Kq8ty5i1l77+KpML/wsu55pTp/3AvcIzih8+02
-k3/e9hh9eXrgzHzI/kGpU92ips+M/CT06NCYm2e+fLuhC0RpvgkCxjxPxVbzbcnRnoE/z8i8
-YBd91F4so3cfLMl1PLtAv62Xx9e/3zSZxvvoezMjhbVt9OHdj18kAUav+YewXxfrH5nfS77Y
-cp1uPR7RFaN2WIQ3ojHhacpMGqIJ6HP1fhsHagYwoxm7qVkmji1Rxml1yZ83y+T7TRchP5M8
-+n3VMEt8l9dPQecc10WX+/cbEsDT3JmXkhL4erNVqCfZm1+5LfeZZn1DTimakfEVIjrgi8tM
-LwmVO9XqVJ8+Y16wSOApwarHCQMa2dQzVMil5M1cR+z1S+wu8CisQc3dRuUj7E/qd+TSYVRq
-iy0RXPotnvnGmQdOdrk9nV4zq/TodWpWtfekzdwJ7HuiSqcbN5I/tSs6fSX0+kbHV3aBvZoE
-U5tlnomH42Q+Xte18tIxHiL2Hn1RHZvenuP9kAquNZhti7x7rcPVSLPzJT0VjUQ6ks18lEnq
-lNlRn8ijy+CUHfhr2hDsqIzcP/io6P3989Yh5brWCjK2wzo3VI9zxVH/p6jzaZVQmb+p9qHy
-KGQoMmqISOi5E5QLjKEyj+8qM8t51N3EU7R01H6qCLpjo7sWpZf60x7f8lOccc1iowDDw6rT
-5/HIksa3umj+8m+1mqiTavSXuciKPiQXabYbrJWaPbNIaVSyozO19hHIKM4s65MS09+Jnyfy
-Od9mE+gOq/Ag/xlb86wOxLMWHfXtZtXRskPd1b8mYqNvMvOKJKDv+M/bKGapwLmuPHpZ31SR
-W3jJXUTkbYJuZ08G6iKtaGK08rIiRowGajbgKWazw0XcN8peHtWK9TWrmRWOi5ziU4yose8r
-YpK0ozQaROsWOV7MoNHs0nf77nXlT83nY5YrLvrHneR3lCd3iHZBua5cgNjJzzkxVI99UjIS
-p4VEAlqrqC29kPNU+y17bM5zEmENL5b9Va7L6sv9XMdIS5vR0POETnE4hcmjxjjfjjF/rBE7
-aml0SjOppgmaVHnNMwq5W5DvhBNCII3SJlGJwk8oSukScpIxkzfVqnK8X/0r5V1GQ5CJ5+iz
-WgTsOQbMlxYQu2l4naTuJ+dPfVuP3dAiYYcQxpzeZ+b+qy6lftCo9vcbIopq5j9ukS9EZRfe
-PJU9o9bJbKNgniVO1V0qwN//zwL5IViaorxegcOILKs/mQumaKLbbszngiSAN+qcp7zj8k8R
-TseD8bZpo2jEW2eH2jYrmPl5VM1dVk9Uezbw3KU3eW+PTukuQraTZo3oJ5B1hx5yQDsutkM0
-3qS5vB4vezN7l1F55jpwrhjFxyq4t6XdBzCLjMZ+E8yeXPpduCHRH6f5NtOao6hWx3XttvnX
-DcN/v2FpatMQ+4aExLM9e4mot6NQtPyw/zW+Ms/aUbvmtOYoeMHfHu/P5S008vsu3OI9rrgj
-GfXhWW6IPyvOq7EzVizSSncLsL6Vjg35ccgSBjdf173qGPjbikadJZ6r+bmOQqml7HEkoFOe
-c3Kd6S0rvnKe0J3cfflvwhlvwQ2MgpzX/8fMQLp3GCK6wTJj47L6S+BP8uYs65QVn5ONYpKR
-9ZS+LfWN5x46Xk+pXO0w/UY+KXOLlSfcJq9xqZO9O/NHl4rmxaNhfpT67d07OKldjbdnheNJ
-uCMzDJB7zloV9gtg7lolRxMy1skKT82GQgSH2qt6Hh7fpu2jVie9Tuwgz/nVcdGfJ1bPelzM
-ro6J/VCZG6QyIvnTr5TwihZfZo0GL9zkno6jP56pWz2EGutOz+E6K+5PvB9YgOJVzKbUE5Tn
-1XtBnZ7vVR05I6YuOdQ2qb3ikkdTZ2gMVvFaYt+qAUELl6ZFChwHXjHz7eaVN7EHNE8N8Wzk
-sKAbBDuuaK4mTxZxDupiMVdBF2brXOC2sOYmXW9ZRNfGv1FJRu3tObo+T2rpYdZm0ym+uhnJ
-rV7rm3AS8sRrHgj4E0/6KevzQ/iTMtS9F57VjNPCyZtOOfrOt9H58Hz9S1RZOZ7Z+/C8l97V
-vZGrzDT0OeegR2yQg7T0zJ7Wbi3/c7v+PSHPiRka2vnFc/q9Ag02r8ZnNWb4c6aXyZwz8Cc7
-xGE9gHh0GtZ9YrXG8mKditrhRP9ROQlP1v1+SLWrVHCr/mPOVZcBwtUDosazjU5rjQZPloOf
-xLpg9bD1LAjuPO/roJaX7q4RntChRcTgXAonqU2LE6m1S911Vr/pMhNVVNvivL7VNLHWm/1v
-l14ZSyfO5WfkBDEHkPUliMr8Z7WttbMQvLGr6RDuE9fS4DjtkfDn5LmA1NQci8rMHqFOWwvW
-JiyjrPFkhQd4Qrs28rlvE6oiLzcJj8oJ99DOzaqnj8JzHZcx+V9QEVl7Qi28mbFgjDPx//Qf
-HfHwSjG3nqCdxjinzu2yzpoVSmvT/XatB8Ru4+jUtgGPakc2nE+MSCZGihpY7y2mPtnFJBRH
-pfkD50Zueoay53Y6fyoC3UWd1RYfV5woyoLz0d9Ddrq2W5D/pVPkj/VMxG/Gm57zob1zUMOq
-1Ytap6NW3GWVKm8Tz8U+rxJKJZLa+byXRjaU47L3RrVIaNUzLwB4iMfY1GbxLHUiippZPQtv
-wOpP/av52zgP4+8ObOgz9O9pXvt1L/KTuYyse8huhIpjce9wHLVGlppJ89QyB73mobuHVMlt
-H90PmgkIi53V5KxS/iky9CJ2Hs+q0XMxeQ4OOVl9PM20UfSD4/WYFdBjWIS6csSvQLoP1UOh
-l+a+pGvsaltPtzf12CKRPc15Yfa/95kD1g4Lhp5GxkY1D+8S+8p9d+bcUX7WbnKeUaMRU+8u
-ormq2kuBZ4N4Xo1W/yAThVnnfTRgTPQRvAMU/Vbt4ktZtfCpVsV5jyDwN21uPeelQ3coszIi
-rxGEmvtT70Fy6y4lkkoDahatkvXcc/eaaHV6hSqrahavdTk5Fp0mFtydyBGi2FqroBzRyY+q
-4+C/ax0POpv+KbzplR4nk0MqDx2PPsnlUS7KLmoHVlBSl7/FLPaxgG5Vq+TSUxs4Bxpj+bHy
-pWbUJi6q+Fnm5DKuydUlN3K1tWrGUfUxz6TtqhE67n5FRDwXRKMUPddXixW9is63yAC6/LBO
-UFdjnudVc2pG4o8ZSM1JJKTzZs0I5EoiXoa4lffnohzzfiLuf9APZ+4k4mSOhtM6RgwTO1Ar
-KStvVvzbUV/MaKKnjLawnonrMfb0M+qYCEDFl11qTRPyqN+MS7Weo8ctK8KF2I13cwACoCeL
-kD9Pq/xXi26a4LdVrDjtd8296/e6rwxjRm53oo9j1RLb2pDIs/fsgv0Ery5RTV0r94A92+bN
-9N9lHSW/hVVlThXnkTPX5dpmdDvlAjRDVqfmPx4b3OJPYiVaYat1i9qPKjVB+vQ1ItXFUTOb
-frm3ys3skaLdEfX8a0UzaXsqL3gFPuutge4B2fIaCsjP6iWdzCrFLnbu63DZyrNp5egc4rcq
-iVOu4P3OxpN+8pFyGL6T8s+9e7dGPMui8qhrBO3OyLMytS8S86qBVHWykjvqKlKT+d60pNNa
-0R6z1QrVs7UTKXVrBl0eULEC/uyix+TNk+15X6fMj04PirPM+GZ3uS7qojHalZs2Uoey6mic
-L4lsMR+Au40j9R5wzEX0dyHC7flaPBlz+bTPb9cxk5KIc5sWReeNuMd3mnDOomZYsCebv32P
-5qcPlT2dambDacJ580DUXd7Qb+5QR0pZdicBf3JGdEzJo4owK8rcIUtK86zabbHVlnVkNPVt
-cixfbaTOG+k9vy4jVpGm5C36+Nobi4jfWXhS87iIXsJXVquVlb6K3ypiR2S0zzZzmZ3ylnuS
-sROMwTvGsfsVaysXntC9pmjXCCfVLv5EfbXb5mUdi57jqrWFXFd2TlaJdJpYpYwMCK21wKpx
-vzA6mv6ccgS8M8/HI+rqyA+zqChr3GbRbGj1QhTdSfuL+LBLx8uMLgM8g3r5HjKsvcdQJ7uz
-a7oj63oGJrNKuB6o4NNMdJU9itqRYBEoTyoSoJnW7heBP5m/TJTEZ7lbTSf6Yu8y9p+zRh6I
-qjMqSZz4JKtF6cTuPVh5SHaPUnS1Cprn65XnKa8SdU97xi2T5d7c71V25h6e5bnd6pE/yZfs
-eUw0eYkY07/X3H692HcSsQDNaQcWxM6py4kjOJcUufXLfNJ+JWrKu0KbXIMDiUAwmyD1h3Ot
-18xqtxnkg3m1NyPTilSf5K+cYX33sS5dPp0ZHW/yTuoX9vYz8RxW23g2cCJMGv3gGKqNphYQ
-O6cSAbyKrFFr0Dv71ipdz8T2qED1CbkO2r31fdVfRBAwFvRsY/YFOlRdZsSpvM4586do8yOz
-mSdsM0bp0Ty8D7z33vtClQj85J/yM60FRJ+I6nuuYud1vNmspd9ckUa3+bt4iGsXX58p7qXr
-mTb0yCJV30X9kJ4vtYfNZHMwm51WeQIjTT9ecS1aa+wQptI7cVyP92oPCp7po7F91fy612uf
-B/KmdsrxHibL6evoP/FmGh45i99lLL6zNSsDnKses0ZLvepTpRp7Xr1Numc9AwIXJKdj+FoD
-Rn5Snygz4T1ntJM/GfVJ3IN2Xpev7tVR5BxGR9jxE89mzMw1xSgnbky+m3Q9/CTlimtyHCeZ
-ae9C011qlfIb3FGnRmbqlT4A9so0qXZkjQxX3/M9YEnpOPQEhms87adc7KdSrZ26b2l7EeFx
-z9nz4lROjPASx3A0X5TxwIwo0OartqEieOzIo11UayRkMt7UyubOwu6RnNxRijelvJxDRmjm
-v1ax6nsxQuodkfq8lPOUmRcZ46fXpXX0ff+8LeRgxAWK8Hg2NitoGHP0SKn6+bNxZ79veb+K
-67LruHaQ9eiDrktmDzh2o9l0Z3kzj2EmN+pvHG1l/iQtbM3oVcmg3VJPE/r2ngfrXHn0XH6v
-kYr55pd71w/GK5ldTg1GG+pkVrPaWJ6jorivywvVuERwZtkrGSPJ+sROhnH3UIN6DgxPTtBd
-9Td1tt4o0t3LImLKRIzcXk+drlaH2nfcF/p87V/vnqlqD/iGnrHWx2pdTmGOVW9RY2XOh2pR
-PSvy+5R2i9s+lGTVnji3c8C+Ckv1g+ckXdZZ94hX2lVqbah9lSebaM5N9tSmhGQmR3ZTocc9
-7iOB2YdMYVWqrqHXQdYYWUb3vZs5n5IywG17ReA5k94pDveip9ONw/lTd6MjBOlv3a/Zu85u
-16pNk7bvRXbc2ea0z56lt8z3JuZ+tQwtHY/rjnmtlFpOkZ1u/fy7OOrbuurcrW+24h7LV48p
-8SToth43oG5h507FypN/lGdSj+ByieqZc9R0OCuxYrZVR06TewDVi2BUmLv9HLypd0SlOk9s
-IYLZ2ZB8t5pZU7NA+IyrjU7jU+zkjRNaaVfgDu7jQQYtVTHwTBEnYPY1s65r/FVnUGcNVeI4
-GfOv2XOl1E88TbTemNuMU0GQEac+up8op/XM3v/1epOhIHrTl0Zmugfda3rln/M68vPKoxoH
-d5737Ly0v90C99lwaewet6KFWa1JvnFszk/pc0lzirnNrGr6KJ01cl53EOUUzmziRf7052uM
-3hETP+0OHdJY206JB7vOvaRF0uKby3hwCi6w31l8+JQdmrmVMtTrYN3m8lwp950VS8guDq7J
-YbenT+loua8G7R7Nz/CMbPXiHYdXPEb9dEWPuo4JKeVr/VNiON5dEStaM7sxjqxIUbnpJ0z2
-kR1YzKg2RDUXeZOnyem8bj2bGd7sOnWKy88p8l3HDGyeYPJD+BO257twBEaVOc2oWqtaNFFR
-z9WqePQc65getNZjzsanmZGsuIuiDM5L8JKYW5qYc40TJe7seGfNGlM+1UxePS9UORnrQmyR
-79XHk2setFakqDekUWLFvc4b/Hm6VXZixH12SeY8+Mk2qUdwtpfn/XMu2HuU9pWfxO5Z5pq9
-A6uYVVZ6Pz21xftkQ25N8hfFYNIjGHnPKkUQT88cpB6X455CHy/FSNWCV4RDa79w5mie5eiY
-1qgKRH37U5FERFa0mtKr850vFWsd4/y17tn1PCJ46PWMsyjfbrLTMa37e8Pt3dyfPP2claA8
-9REailY76108Zy+jtYk7a4xd41Ue3SLu6Sdca50G75L8eZIr0T+vL0z56VmP5E0/1z1RkIz6
-I2Y3TXq25vttFbWHgPvelS/BJ6PIyamsSZ7cdjVZgTXRenH651wjrgb7o6utP62fYrf7t/VC
-ZzyPYbper/hm6o+M9FMrqFV9nq42hxqb0vngmowRvoxiYe8pwtXl+YEjMf66Vml5sXbYO/Q5
-f2Y82v0Y2spElbx+JCP/bmtqXFvr0dT3HGGwyn25v30FfR28Yip9v8rn1SvPDERkJ7m+56jY
-R5f17V39k8oTl0IVv2IUrM6h8qXrwxqfqvnN3RxX3z/zMDNbxKuzsnNQ0iy8qXz5Y7U4KEny
-Pbo8HB216l3mB1wNgVNpqJpXZZBnoNZ9nE/uLPK0N1WiVIwx4+TdqvQS2XGTvoaUMaCKExBP
-dG6uPT5GK6pr6zx6jTvz77q2mIfeq/M57qOjXbZ75kNkXkC+Fe5M7aay87xqGfWmsz9M5sR2
-0lsttaz8qKeq5Rz4VXMmmG+TkRXF1Bin8lXpPPtxDFVXKCvwuQKKh1ZbWWPq6E2qeePXdT4d
-S6orx+fWEVZ7G6P2GK5q/3E3i/F63F+xvFx/qATBm/icMiOQcfisC2ZMOD34mqPhI+HMpkWW
-mTp15tOXqFY/fnJZ2/kMtcpuNiy36gLPbfTnzrYT3EPLWJLG6Kr83hO3pWVWeaHORtrBHq/g
-UxLDvsiYuEfqCtS8m3683e/Pt5909+jaZ9aER4Y1FuhxF0Vi58KfauMplqYzpUir7urMpK07
-s3v7urfTT07drvyZOcN1p+XvXUvWelNFtzRLQrUY773cn/zvz6ixW49cb2v2tP4SFak22gjL
-HsWsXQL5u3USs8p83TWOvNWIlqMyVUKpfZK7jVZ0h/P6CD0LwWXm9hzM8Q4jrNytCOXLfKdr
-c439rHz2ZT5NnVzNcbhveo4ZHdsPo3VN1CDnjt9TVId1EDWfM1dUscF9nObP9nyT1Iw5p86X
-mhlxLyuwasKaA+ZofN2v6YmrrMyLWRQqRyGvUvKNOGlsG+XfFVEiDpD5ZRh7b6OOZF1yz6n8
-Rtens2B67XFPryhvzs06JG/maa5pY+RecMS8Pte938yKV3/M7d6snuh4pFpKWTfZITHubbJX
-mGd18y26zP8uEvT3Z3NfVetxtLZjqUyrsdspczwltUe3jpSBuP9Unt152ymLHI/ux67vrN+v
-uoMyK71A4INaGTOWZanryLNVW9MXvUaOR9YC0CKsdqfb9mmx9VYLvGWVOeRJzSJ4WyNho2yK
-aaJl2CHMmi19njr8bcSf3V9G8rNKbl56tw7FUh71T+rqqh/klRs1Kss6qBFf5ltukb/faFeP
-Z1DtJ/fte92Pn/q8veuc1pyP0r0Wz5882Xg8q8W9+avoeOYRMnvgm5zM9mZ3yRrCKjO95wP9
-ej17crwmyTXb/InfdYhGd+eRjZmfcCS9Sna1yvrsgTqKKpddpnekepY5UyqV6pzk3utzbzWj
-ZppUblf+zGqz1CBeb6N6xBExHw/jrMmjiZeTc1V+olsm+mCO+NOxJfZ9qFl/XmNY1w8aatvH
-GdmkW7IK+xbX6NPMfNCs5ToO6sUOdUpktJNu2/yZOqKz8Le8/uTNrGVJHuX7axST57TqWdfp
-K2r2fGZEaj6sYl06LrUe62xrxEMzsPTa6peRsYXTRB7lN2qd3yiu3Nn+icj6t/p71M+5BM4q
-O5VTmr/AGatyKt+775FEC22b6l5zyzQxSo2a0PbwmfNeD9V3Ul1SPSbtDeenrGTeWs2g77I8
-657p8oBz51ICO7bke2cO3kyOcD6tvNlnPijmPPZaRlT52WsFEv8c5V9pZy/n0c67HVl9I2xe
-+UZ/18l+9YHUKhxlYCDK7bzJSjyvIR51Reezl9lRmy+7HnF36yzWShj3i+/hsumjOmeRy3PP
-qM3Rzee8om71rp5JkR0WulOAaROPtGFdc48YZf9hrV1RrCG7eGZ9V9cPs7MKPIbI/gZ6ikTd
-ZVlj19sbiV1oBgZHWxHVeeYuZWX5ZWM8qkMSy6Lnr/LJPaneAtHdrd7mZU49k/4IVlajgN5p
-rM9SqbbOvPJHh007isZOc928bltrOXq+gf5zkRXRc/h8Bdxy0joSt6D8Ulye+/waO0LrNLU3
-S7WgFWnoud/tDu/gU60TzknypJ9vrlqp+kTqfTOHp8oo9YtOLWfoemnlmGf5Z64Gx0dP/9xe
-bgvfx0nc0uL71/MRpkkje4nB9J5EhwvxSpnJNfF94zjKWfiz6zLNelQdZ8YWtNeBntv7bjvE
-36qTOeQVjVHVuvLMz/Fd7Uh9ntGaXTDqflCPr/ZU8Kyl0fqMVlN1as0l6jAdWiwpcR3b3qKR
-vOs9za2Zhh2qtk5nkdKGYY85r09xOVFll+96texphXitn3Op6qzs2qOSK7sxd7kpXhPIThD6
-5LP9tZNXLs85Hj8bYFw/njumtySdL3teUJ5IDtGslvRRkk/UvvFognMF3rxb/ZH/UrGwlAKa
-I+AYWr4rRqP80F0uN1VOOJ+SP/XEZFYBqBXCkfb8kOOptoZ23NJ95PNGjyN5sXYY6LrEz0G0
-29hlt/Zf63hz7OX0tWBVOlWftX4u40iOG6vfN86oSm+w2qvIzxvbi2nVu3TIk0mrHQErpEby
-xnxad0/nm/hasHOLV82mnVdnSPes1xtmd5YeU/BZ8j2R3lrvI3fjmm083YxVKd7H3lxr4JNd
-xm5yasUH79k4PuOJVehu1LtXtKLPrhzFekZ+SOXRsaeUfOdZq+Rf7cI38rA8p7PKzOwM16EW
-dU2SR2fjyOus1h9IUYVOgo47mHQea2Ypq3xxHtW47cgP3n737ncpQZ1Xk0frmlQ5lli/+4F5
-KbI4B1dUDap7ETIK/JDIDhE8f9ve7kxprhJ9y/rwXanjUV3O8Yw0mq+H69R+F3W/7+0inT3l
-lM4qHPFpjqyfxey34pyo+fCjvXmPXGL6vuGb+jNdduZuqXcd2VnplbrszKw/z3tX2flm/DAe
-Q32298Huajk8bpe4CLsJ1RPgUq/cW4fKC46I9h3R8i41z7za8SlT9Brpe10j1pMr9l4zbyuH
-PUbJPVW76z6ofNljb2Me7fkm92mNIFX+7Hzi7TH4G+L/ERfR/gLgELX1uMrphail4RZnUpUv
-3Xrg6V11Xp/FrhESj8MlvyYu38nUTucmf+o5OT33pf7aJl8/92x7Dqo7MfXGFp5afQrFBjzD
-S/lzmX+8O3tEEfVM5HOsRX0U+InP9Fiun7QNK6SiKNt1sGf5ZJ359GU7WeX+Y1c96rbQPCe6
-N4rupt+g3l1vp3HGOr0+zsBNq2BkM/Zyb/xsrJhn3On9+tgTd1HnWSYSdbKnquU9TV08rPbo
-7v6pRD3Q0SzP9l581Rep7w+J3mOJ/umucrXGbnw9apeLyp/4BrHUmlfU2c/0Kok1JUqJb1T+
-czyxzimlTdpwSR0q5ZjXyLaoGWQdj/nIt8fA1ar8yRi479OusqbHE7qnpk855gSPkDCiN9vs
-6mhyx/Rrq9zsuENf3eXrMObP1H6eVzZCllPybyHoPkvKl1mX7NT5Gj6DyRddDCbno75VfX7P
-k9vSMjGG5E/HyzvPees+nU/Y7cjcmT77NfZdY84675npUO/ej2GEh45k51Z2TscPFZ9QuwTj
-Uf+2G7vaQPUpc1kTl1suP0ff61erm4/u2bXCCPfqfJwkf6JjpGkXVMx84YgO961P6KU75VXH
-QdUScBma0XdHodMC67OytnlzhNcv86m7oZOEYz8krb8tnjrFTC1r4qtfLff7fDbm6S2ZdRp8
-P1eIM99V4s1lzFP5hOtTXQfly1pJT61Fui+hR8/frmQaW9+OgKckzxmqtbYcXaexvJqorksv
-d7a09V7SjMAq86jPsr+q7gpfB/DXdtwBs7slTfjbqpfrPNTseKUxf6aFqf/1dfA60OpvOofu
-pb6qz32rahFgXpw35hhDcsoltEu3eyqaWHV62uCc9eqLdLM+4oittalyS3Mr036t89Df/xT3
-HT23t2bGOxFPrlqrlwwj6tHgbobSwnb/KPfrPkpJ1POq/m3fuo6tnvv2d2r8Oh8+opQbvi6d
-7PJ7bkmxe+u4zR+6b8dzlfxfd+PJPqn+9VX2qc+Bx78VlRxFIHI0+3m44sWdv7m17t2c6Ggw
-21v7ttOo209ilYTPzva4RhbI6Om6Lzs8puPFbg+M5dV4Nes4RjR+z7P9nFpfP+X2nda8kROr
-3EzMUU9gzErC/XPA33Vy4h5v7t+v++Shfhcrs0+m8h2OP60fcY9od/7IeCRd5G7Pe3SfqmPo
-rE5+uq5wv2eUL7WHQfZRUIwxs0yzZ5L3Tx2jY1Vn5aX+es+f1R7eWp1HqFux9Cn7SODWTtym
-ntPwG7cs3RPdb9vnjO6ZA97hfsb4/dm/L6/8k1s579UHnWfNQ6CO7/PfR3t1xI8jbq7ywr2B
-YzSSPJXjKhrhfLn1jmPdMB5J5cXx58Z+x/hStLKXxNV+PrbXxiPrdM7YHux0e5Wj3pcEVBGU
-rp/XKH+qzmSXa9DHVTiDOhfbGN8WVR7Yq7nTl6qYULX263N9xB1/9OPdK/m2dVd9dn8XzMuR
-GVY9U5+fFkuVyvoGedoW+sFUGTqb/KydwrruJb1GWJ7t+UzbVkFdy2618udO4rpNoOOpvat6
-PZ9+/hF9tY96XtXd2FOHkh6zMuoo9u5+/8Rp8PM9OtlPifx1PcZGex2zlfq+z0XoR6ISJ6Ml
-fRxyrO32aMHevuv1+pae36Pbj1H3nWO2zJa83zeuka2xhzhje59Qvz8a9cj26mXIaFdnv9Kt
-We3tz8x7w2d6DTkay30+rX8dzcV2rN6/9Szafo97mOJx0v24z4bId+e47z9pzA+jp/SyZPy9
-pJSlqVO757qlptb7nujXeI/ct0XHFsA0PcJlR2TTltat/N5pdbVR+nfZHqk+aZInjTD/+3dx
-Lso3Hknkal+N81ofvWPP3ZjPPhPmvmWk3Hvfhjqi27vR+xuM5uQ+7ePrOhd1RG5ZeQZUytDH
-5ChlgcvOXo5uvcX4Lf2ue9ZkpCnzznvjMroDt7g518RthpShOd4c3WjUnSzdkgA9x3+MR48Q
-VqPqC0d+R9Hlnkf376WK5fXRv0coNXFdk17ubK9L8uYe/uze5P5bPWsedOTL6GmZbPHlOMrd
-7bLH0asR3eNNZq6dyqpAfh7TFt3z61PvoVFHZyAj5W5F5VO2uKDjzY5Ht95ym9P26XaO5v7M
-697cr0dyTe5ZDB+JA4yenfyZ2YRuFT5mv/i7jMdxHyE98u691ZRZCPt5p5MRlT/3cd5+ur9r
-7s9J1SHbcbuRvOjl5+Oy6R4lf57l31sSfe8o+s9X6bUd3Tv+TqO/dFy1jGu/bKOc6GXnff7c
-/x6+PuOR7OWJ+/JzbN9U/L/jhP28mZ8caR3F0ra62KilcZRSC9yTo4/msfSfh/ysPt4jll3a
-NI4K+XuN7rg1h91OGWHvR1bF373K0Rx1h1xtz1LP6d3Ykrv7/Evfm+MxHJVi/S7bk3no6OW+
-nXDETuNTOkR9W2bquFQXdKjlnhkb6dU95BptdPeOL1SHqC3ez8UR6+f+u9RZ8xFuo0Cq4feg
-f/fIbZ6KRW/bL/ul9HgO+4x4jO1xwuiP2sKPUa9fx2Prf+5meEuGbo9lTJ0835bxueKjT6ct
-uicusU31nVPPj7Gpo0/a4tFHJQBGrD/h39Wivj+yaXp0LvvRK1ft2du0nKoNei/jptq/+62h
-7ncuS7tvdDaxS52eQ++Pa5+Vojxad9AxXr3Hny5LHyEdbZ/zO7ZpfSQfoVP87Hr+qO5JOyxj
-B8f20jENNdKXI6uncuKjEmcvccUf1exjUjyiz6E4PtIq8UdWypa18QwaaeU9szde0fG7bN/p
-6NiP2HPcJ/Xpn8WX+uQqS5/Fn5PwZ2IUvU06HidGp1HykSTd0kvP3PM5U72OVErJM9ov+7nn
-kfGOdsE+27S+TTeTz+NY58tnWaMLwadI/Izo7hH+9Ghux5fjyF7aS/nznjEc+X1P9TnjHbJ/
-/vfssioF1bLYypnd//zOxn+eJbrFl4+ujq7/ufDEHnuwlyLdb6+bPFrtJe0h9JiO3DMDlbo9
-8rGnHNMEfS7z9m7Yp5+6MU3N3/x340+BL/Xn41Jz69OqWbuOe8/wV47rwpON63O00tbTlUf3
-Sb79OvbenbpvdbY0/7s1v6NasTrGMR2zxkdvdd9Ouv/8Ht39KH3EBvk82378rOTPSqonXF/4
-3epd7xNW81jWQ46sk6FdVcljlDb9nhW+z9lV8/q3O73+q3jjY/ScUVYeGL9/1Wz3dOtRPh09
-lf/dx+3jnKV7tH+0x3m058s9xJV5zqp/1IN7Jo3n8SgH7be0PsqTuIvapH738RjxjWr3j8a9
-b5S9FTO+433r4Dg97pl85Kn77vCRMfHOW9LtyBO2uf551Hk0ey2Gnj8/e9Tgnq0d1Y3kiHQ/
-Rr0dMfYm+ydUT+D+XhuPtc6A8+e+mP343sf9v0pHn3tc3us1tpqfQWkj9aPb/9znjnDfSo15
-1HXSvvU+7jHoGOrFfz9CH+XVPfSY37QV2XvWuD6aMfXR59979l5vQXkgfd1nr+997n6W9/K4
-LN3/1Jyt/WPv+PM59Dt5UmkPb+7bl8/0a4/TZz79OH8+9uRHbedj/vIjo3r+Sj7XIt2zKnt3
-vP9379NH/9c9/WS//Til3dzTc551jD/70XR2/jbteauvIlEfo2ciq59t6/mTjn16PK6jCMGY
-Ou/4I3evnuReDfD74zkfp+fuq27tj/Dp/bqdZ9Ijdz72No8+rfKk/u7xMRyh8RN+FccenbHj
-8uqRMYz48jP5lAjXHnp8fT6+5x7z87fleP1tf/d9ltLjNEaRxvS8cTyCQf56T62j58zB+B1G
-b/gsNNdHcE/rj2R3n/nyOPXaZY83+fmW4z36lfy4702fMR+jt9q7JjmWI2MCfqh46FgCVC58
-5j7xMXV4Jp6o/62j+1r0q+ToZ+A9FVfeO46Pj4VckBnm27xZR5N8+Rn8WWn7KZ/Pp0eRr2fz
-qc/8vmqI+89/lvX8LLl9sn8fs5y2+PGoDN/6/2fQ47J19K0j/Jkz+tE3rBoL0vMZ3l3KhWeM
-9iP00dn7DL36NT2LR97ymbuvx2z282V9frf2H/HunskHozEckZ3/nfQsS+Uz6Bl2Zo3PfIaU
-/wj9Xvn0q+kRxPQ5SMSz5vmzdkzHn5+Bjn1N33Wbvu4eeSZC9rFRdBjNr+LRZ1H6zo/ayB8d
-g/73CH0un35ktn//rv8VuO6v1umP2sovegbtjcXdp18Vc3iWn/58ev6I9qAuv4J+j9Qb8+Y2
-ZvNZUeF/Mn2mxfFxehTV/ho2+Kn8VN/n80b6zBPjfi99Nn8+tgb/LbP7N3X77F6Xmc8ZwT+V
-foXndmwtPisi+Gza81af+Q6jvIevoUO2aJQ5ojSKGnzGOI7P2Ne0On4NHY0x/36U4RF6ZNRf
-gxu+xii26bMwyGna//7/HHmZdBQN/Wwt9KIt6vDHozyaP38lGr/LI3z6ot9N/79WYe+u+mfP
-yv9XW/WfR8mPX1Xqkx6NLz8vLvfi7OfQkcy3r8+Xf1NnPz3i1X2cw148+qJKvx8f+brR5xd9
-HXrUKnlx138PfUWN/5mVFL/jDi96jL4ib47onzTWF32c/lke04s+i77y+n/lsb3oRS960Yte
-9KIXvehFL3rRi170ohe96EUvetGLXvSiF73oRS960Yte9KIXvehFLzpC/wvPcNpm
-"""
 
 def get_snd_success_stream() -> BytesIO:
-    return res_func.convert_stream(_snd_success)
+    return bundle.convert_stream("snd_success")
 
 
 def get_snd_success_bytearray() -> bytearray:
-    return res_func.convert_bytearray(_snd_success)
+    return bundle.convert_bytearray("snd_success")
 
 
 def get_snd_success() -> str:
-    return _snd_success
+    return base64.b64encode(bundle.get_stored("snd_success")).decode()
+
+
+def get_snd_success_compressed() -> bytes:
+    return bundle.get_stored("snd_success")
 
-#----------------------------------------------------------------------
-_snd_beep: str = """
-eJwMl2V022gXhGVbFliyZYYkdrDM3G27ZdgyMzO3Xxm2zMzMzGm7ZYaUmTFp0EyybFmSZfr0
-KznJOcn1fefOPNOjfdu2Yz5LgL4t+rQZM3lmhhIAABEgBlpfAADlf2IABJRAp/Y9e6UIP2/f
-pW3X9j3b9lII33caPntMvYbV69arXqtmTWDU8JnDM4S/chE8J4nAUqgrehCaj79AQKKlLKqc
-hl3TNJJf1mcQr0wrVV3T1mqGW+rrJpiva08aNiunEqdlXaDyIBWbHV9LL2K/+wLB4c7O5A7r
-b+/p0tueBSWku27JG3f50kWe4VbO+8N+1D/RNTkw359D++mf3NtI99jTeGbSJzKJcWktcBV8
-Unpb9hDuLN+OWoinsrEqM56nOSbP11UjLhoGKBubWqhSUjeqV5vbatMse7UjUt6rpmo+4BgW
-hGqIfwOHIqV8gtoefuIZQ1ntev+GskeexyWH3TNLzrrblE70/Ck75tXZh/pnOesFkp4nwTcB
-jJkUrh0pjIyIJeI1k8tEs0UnwZWSe/Asaa5sOlxb3g6NERrshfoZzmo7KzIN+USmKU31JaW3
-WmpWaa2WMbp15vFavXGfsr5SjHWBc8GxiemJnsxLbjoJ01ZXl8AP2xrf2LJCzz+lTT0dSyd7
-Rpd18Ha05fomO5qTkLs8VehzhYYEq7BzmQr8QP5dbEZiaTJdHBXVkbokg5EP0vbYOTgo748+
-VeJYJ81NfJfufwrekKPUppxWZad11Zyy/KWbnP5I9ya1uuaUtpbCgFdHjJJS0Xz+d9Qd3Mac
-9HYOOh160moFfH3KJN6C0jeeGWUNveVt832VHQl/ddf/AgHPuOAE0kE3CF1gIXYQ7+RDsVeJ
-Q8lUsV00Q2oCPyDtoZtYTeSaIku2U+XHWmsfy5P6m8RwUx/VvNRCtdpSrK2RMUz/0FJLV9PU
-RDVA9RibhUyXbkxWS05ll0fWB/LoNI+BquKY7L9mfevdW1bRe17Ywx2r0bfRvs6/2ikOzHV3
-oFzeeBAL/BM+Gipk+7IT+L+jaXFpMi+5WlxO3AQ6Cx5HA9B9XIZSRBusSN1Gvl9XhfjbCKl2
-plxTk2nTtRvS++tbZzzRn0mDte915YgJ8vLoDDBXzEfPxBbQg9nhfl3onusPudt+x1dg3eb9
-25rt/WQ94W1lz/elOjuSftfOwGzPSWq1r3VoZ+BwOB5CuJvsKf5xdHN8frICUEdyT6yBp0mP
-y37DekUj2VDVLHywdqSijaGz0mUyqbukPdRA6Rd12ZlVDA/TYX2bFL16ofoMfgztD30DUoCn
-3Hz+M3UwPNZbTE11tiTttn2+e9Yn3svWO96Tti2+mQ4pOcQ1JLDGjVPrPQ+oe77pISbwNryS
-bsut5ypED8Xi8c3AOeAheFRyFOkEdcUfIhJle6ytZqq8v34i0dc0RWVPLa+ZZfFrm2SKDO8z
-xxpQy0FtFUMBcUcBy65KcyWKeG58THgE147Mpne4Q4Fmjmf+4bY5vh+CPkYJXx/YN/mvOUUB
-ldsVGOIGqYmez5TK/zE0jarMdAnnc9sjn6NX4qsSQdFY0d/QNDBTpoIVirvoK1V3XKpbqKhq
-PKiEUjeo55jraCtnVNLXyLpt2JaxSf8nZZlapEmVV5dxUB/RJ6BmpHp0THAyU8uXF2zqEgUe
-2tv6z9mm+x7ZFvie2Nv5Fzv3khZ3fqC+2x2gXQ8C0z0hqqWfC92gejOecKdIb75L7FyifLKG
-pIV4NdxKehbTIm+IsGy2Zrb8mf4M4TZ9VG1JO64plz5Zl5850TA464dhtUWpW27IUBqINrK/
-ICP4IN400Y7RRLoGnPQDzy1qu3MT+dY+yN/AHvM9sk/2W5yzyA+u94EK7myKdjYIgK5ugRoe
-F9XeHwmVD+5l/mNuR/pEn8XEwOfkExCX/IWmQOvlmegllQZvrlumWGR8oByV+l0dM1/Wfsq4
-o3+UVceYk6k2HEi1aJKa1/J52G/4o/iP6Bs/Omamn7Dv/Er6s7sj1UqYg7ef8bvte/2/HY3I
-8a5BgQHuClQN1z+BuGM0WcHVOfDVkxb8hxxHrwj1YqsJunLEtsYfi34DS6HqoEvWEW5NzJNV
-1rSSr9PvIo6bXqtapJ3WBCwbdCcyVxmysijDTssoXbrxi3K4cgoWgjdILyV/Jkdyn/ixwWPM
-ZV+nUE93INDFuYJc4vD58x05JOaiyJ5uMnDTtTJwwRHzz3K4/NNcXQMLvb2DQwNEmKG7cj8i
-J6IPE2ziomSKuA1yRnoX/4nwyiLssLajghA8UpR6Sr3PPFO7QdDD8awMY6fMhoZKaTs15XTX
-FPWEW/WCgyTV4lBiBTMtYqQuhinvm2B5d0lgjfMdqXGuJ886faTP9SWAuZnAS0czMsdO+Ms5
-XvkfueYH+vr8wUeUkjnLzI/si36L7QM6A0OleyVW9AE0VQHJpqtf4eX1fxObTAdUndN2aEzp
-O3WezBOGPVm1jR3SC3QZpg2qi6ph+H70FnRb1ER0mh8cy6Wbc2Wkkx7nnRLUup8Eip00+cpZ
-TP7nmhoY504ETjofkpTto2+n7ZRvhsPvXyncyz6/OzQh1I3tw13m+8QrJAaLT4pw+BN4DctA
-MGVDzKt5J99naKc8nTJOPcDcUds7Y5R+UpbP0CIzy7Ar7bcmomtNDFZE0JXQArBhcnTyJxfj
-F4Tasb3J/nRPb5XgSPeXwDZX78Br4TNvcGuota65gTH2Nv5tVqVvru2Gj3EMINd43lM5ATRc
-J7ySa80no+OT25JdwVKxGM2EFskHoQtUGXgX3W3FdaNFtSDVrBliqaFrlNnF4M10GOKWX7q5
-Jk61X11JjmNf4SOSjWIu9jPejP0VWRNcy7j9ztAIrz5Iu6tQ891lgXx3HWqNW0c9cmSQT62g
-b5DgZzl2l6+ay0P2870Ntgs2ZnqxTyJTYoPic0X5QAtBn2WyTbCG2ClzqlvIV+nfEhtMrKpd
-Gqlpl56lH5N5zzAuAzHUT5NqG+vfE42IAlkAPiclRPeBMD8l9j78mztMlYan+XeEhnurBgd7
-VlFNPdOpup6FVF2XPnBZyNtvZS28W62vvKx9nH+/2x9oQFai69G5bOtIq+i4xJ9Eb0kzcQqy
-T3oaz0cuKk9hY7UNFC8MO5XHUw6qZ5kvaJtkPNLLMvsYZlom6uaZSlQVNRPlNfD5SAvpJsnn
-RCLRKpIZPUV7WSrQPlzfPyK02dspaPPkU/eFvc92xwNmxw6/xjrZu6EszVvV1tzX1DmBHOcd
-EGxO3Q83ZxpFhkY/xcYD3YFKgj5/o06ousKLitWb8J06hMgzNlXtSG2hWWb5n+5YBmT4kT5W
-b0y7rjmo/0KUVzbBhqKzodfizyJH7Fq8iK3Dnw/9xY4LeOmq/jGhgHdbcKK3WXCr5zH1zfmL
-rGZr5OtWRnl8ZQO8newJn821ITDN/zA0PFSFHced5rfEWyemi8+LLHAEPInVQf4jcGyI5oj8
-iT5J3Dfp1CfSqmtnp7fWD8qw6TMszXXHTTL1L02xfLS8PfpZyOOLwDCgdfREbAszKPIymMuI
-Avfomv4Fofq+j8Ic3YLd3UWBw/ZG/qNl6V5D2X3Pf9Yv3hMOp/+G5wO1KVA/vCp8grvA14u9
-Tz5L7gJTJfXQsdAa+Rx0tKoSTmkPKyzGX8p4ikNNmgkdmLFNPyrdpIfSLmlEBr1SrPqIbZF1
-hVuBjHhFQpacFFkbrR5ezxVRdZmZ5Co66lse0vlKg/M9D6n6zuHkVusj76vSWZ5FZU5PoZC1
-I1zyQNDXKuQK3mQYtgFfOf4tniFuJ3oH7QE7Yp/hvsRFmVjzt3y0/hAx0HRfVSftm6bA8kZ3
-N32y/oY5pt1gQtTltTUVEkUx+kTwzwLRfNEygWZL2cV8Bv2erUPdC1cne9Kcb07ooHdB0ONa
-Hahifye8xw1PQWk3z0rrJO9sx3z/ak9Pqk/gEt0mnMUN4m9HJyXbJyuAR8S3kaCUx1H0hfIR
-1k3bXDHdsEDZJGWNGjEf1ELpav1qyx3d9NRNmrf6FsoqqhZ4OgYhjaReydNkKlDGn47dY85G
-hof+Zr8EJoYrkX/T7wWm2eg5QomcGDlJ+N93SrM908s2e57Zsn0tXVvJZ77bwXPBcsxJ9nQk
-L9Y+vld0C6gJycH9sl7wZkVjWW11Ab5Z14pYZByr6pi6SOM0j9f9smj1cvNbbXuTWd1Zu0qx
-STFZdh7pAKkk/cXB+N3EhMj86KnwA+5UcDezQMgIj5CbZd7VwdOu2oH7toE+W2k7z8xSl1tu
-jXkCdsDPu/8EnpDN6Wv0bfZrZHDUKmTJQckAcW3kpnQc/h6po9yEvdNkKmSG6Uqnab36btoe
-7UsLqp9ouavbn3pV082wQylW38Kb4QeRTdAusIHAGYNjQ+O1ueH8B5plawazmM6BQrqvf21o
-tGcmtcRxzv+hLOlBS6+4L5Smekhrrne4M5P87u0SvELdDN9hmkWcUXfsGzAR2Cz9JiFkFlgt
-cNRn1T18kODT04xLVD1T92tgyxqdJr2BfrI5qs03DVWn6AoVhwmHjEVLoSWgWDI5OSXp4BvH
-0tj1EZgeyd6ivoevCRplvYeDzVxRsrwN91Uptbr3lcx0W8oWeMICA5GuHoEz/pOhY6EU9h13
-jy+LD0zcEX8RzRFY5zM2CXlKdMA2akBFSD9LSZqOqIvT7gq6qKV/bvHqstNYjcoYVsJC/q+S
-90BFyEjpc/FFUSzeJfExMjDak3FwG0NJphe1Pnzd/zRUydOKEju6+6uUbfG0LqnjflWy0R0q
-U3l7CPq84tlFbQ3E6aPh1dwrvn7sfvJVcifYSdICvQLNlOehY1SHcYOuJdHOuEHVOvWaRmU5
-o2uYPkR/31xXNyblttqhG0H8p9yDtcKuwlGh0xCiCcCeWNP4C24NfyTci0sPnWc2BqJ0tu9g
-UO16Sr623vaeLJnnDhRHXT1Kw+5UW8ALue6TN32y0IXgIuYdm8XbY5/i70SDRKehYrAcloU0
-I9Kwyhq7/JR+oPKWabP6SdpNLZzeTG+zwPrxaRW0K4ytVf9p7ssnKCjUhJohJbhMPEzoJg2i
-9WPX2DuRH/Qr9u+gmeH89pDUU5G6bE/1XxP62q3iX65yJdXc7coue07bjX7YU4cqJHfSVjqN
-0/HfoynJ2UkchCSfkXlQjnwP+pdqOQ7qqhL/GBer+qVe0TS23NRNTZ+rl1r66t6mBNRz9A+J
-WUL21sN7Igb4MNhOXENUFMcSGr5PtIgxRdLpzixANQ+X8+0PljqPkrOsM70thf+/uPg/18eS
-0+4N1r3eKc6hpMJ3Nuim9AzE3o9UjE2PlxehIiO0D8yVOWCXwi0Lq+/JN+tbKq+blqm/Cbuo
-kt5BXy69vP5b2nBttumgaoO2qWI+sUU2UPYDmiztLHkDQMDlWFa8fOQ0n8Ic4aLBg0xVUkkz
-7mrUHOEuR5bqPD2KL7hOFLOus6XjPSHbI19TgUMi/hp0OHSTrRz5X7RtQpvsJskV10AqQifw
-bmiRsjn+SRtR1DT2VQ1O3aHpZzmiO5k+XT/VMkc3M7WhZpihlnKn+hq+Wo6jq5BZ0tsSjbhv
-UppcHO0bq84ZeDCMcx2oXWGt71bwtPMYmWUd4f1TrHJLi9e5mpdMdjvLOnrvOERkS2+ToJY6
-Ga7NtIsMi3KxicBGYLw0E9TL5sHTFGtlR9T/k3fVi5TbTR3VX9M2ahumV9a3T0/RVzLP1t41
-lamG6C4qlijLY6uwjfApSA9qxXYgGkcSk/ktUSElI2tDENtJ4Ic/bjPVzP7Tl1pqc4uKF7ra
-Fee5mpVW8My3TfbluqYEBvhfhDqHOrJLOFF0b/xY4oC4oXgp/EAqwzlkuFKCj9S+Ufw21FFV
-Sp2nqSP4xfr0EfqZltm6O6mDNC7DMmVvTUX5TMVedDOqggrBZ+K1wP3knZgq3ivyjH8Zns7t
-ET6jwbczuMQ5hnSUZXtPFVtdH4rGuKLFLdwbyzBvG0eu/56njFoYaBfeFrZzd/mdsYfJqsAT
-8L1kAVofdssHyCqqu8u9ugDRy9RBfSltm9Ys+EVLYR/DzKe19VIaq5X6ysR41VNsL94c+QOX
-gUMkT0Qdko7EpejEWAan4EG6BzudrE//dMsokz3XR5bcdv8q6uFSFa9yuUs+usU23mt2+ciL
-vvqhDcHLzGV2GH9P6KzPREdEV6E60g7Yv8glYiv2SjNJMcVAK90pvTRKywzd0vQB+pOWHbo6
-aac0h4xBZRvtffleopOsTGaF2kEXJbQoF7AkpIlF/K7oXMbLFVLfwpV9R4OTnT3IZ2WQd3nx
-c9fhokaua8VSd3bZA89de2+/3DOXyiXf0JfokdzriCz2JXE8WSZpJ7mO3IGayv3oLlUIX647
-T+iF7NqaNlOrENiin3AjueYn2qspM9SP9cuIDuoG+Bn5FwRBt0q3gIvEC4ALybvCnTzlVvD1
-6UXsWLIZfdbNB37atvtulZx15xa1djmLpruulFxy37P+8D5xPiYb+tggFpzAVGRVfKNYbryH
-qIeoL+QBEaw5soIYg13RdFeMNZQpmZQemizLPN3B9Al6q+WebneaW1PZ1EsV0zZT/KsMyIqx
-E3B3eCEol2wSVU7aEo2ibWIPBM0XUrGwTPCD2s6m5EqBbToXH3PNKcJdqwR9WkvHeibYfb5T
-ApM2J7vQzehSdlBkXXSi0JtXSj6IJyBdIKl8EzpOdRwfoptIACZatSRtmBZMN+gnpLfUO8yg
-LiPVqh5iMCu1Ghrfo/gPVciWQKek0yV7REeAi3E63iMiik6nL7ELyFb0XvdXgb97+1aUDHbP
-KXI7TxfBroEl9dwdrF29dZwVyQPeQcGx1KfwUubfyI6oOX4ZeA48k44HN8rewmZCig3QSBVZ
-hivKvJSmGs68ULc6fZ2etCR039IGaPeZAqpduoiikeoJdh9fjXRBJknN4HxxReBm0hf9EEtn
-l0WUQQlj9K0OVnZC5LSyU576xYNd/YoeO7sXT3LtKZV7xPb1vqruPYGHQke7HlrCvuHKR//E
-nyVgyVxxEk5Ir+Ad0Kqqafhfuq4EaSRVC9L+p8XTm+iXpf+rt1gG6xanDte4DbeVzzXn5WOE
-fp2Q9YevQ73As+IFopWJ/YnPkUHRx/RvNpfsTN90Pw+8sjXxHStp6d5c9Mp5qSjf2bMEdJez
-qr2ko8jfyksEE4HlYRlTNWIU5m8CLAUGSquAtWS74I+Kb7IMTakcMJxSnktprnGYN+iWp5/Q
-g+lV9bj5uDZpGqCupl9FMKqJ+BGBxXuhTaH60p6STNEMYFusZXw9+ygyUmCdbr7lwU5Ou3+7
-wBSDi6u7phWtcvYvLudaW3rX/d1W22d1NQkM928JtQ1VZrtzP/lR8dWJLeI24g3wN2lnvCb6
-WzkBj2sHE8+NCvWwtL3aqGWMfnv6Vf1Qy1WdN/WTZo2Qq1u0XRXdlLWwJJaKvIIzpBcljcR/
-J83Jv/lDUVGYZd+Sbelr7gOBm7aEd3tJ0rWiaK1zb9FuZ+WS6y6H0An2O9b5SzwPqG2BuuHt
-4SLuML8h9iTZHrCBMclbdDa8VPFaVqa2yX/qbyj3pwwSdnFGdyA9T986fZB+ltmr3S4whkcf
-I76qOXyHwoN2lXkhMwSAeaII8CW2Or6RLYi0ErhW75sSxJ3P/IPK+npqFsOuNkUDnRWLaWeP
-0mXuzTa/d6eLJXH/P0If+MPQ7FYei3dKNBSrxY3gC1Iprkf3KvviL7Q9iJNGQt017aA2YZmi
-v5z+TH/Q8lPXO02pNZn2q1rpHigyVDcxG34NuYw8kY4WfHxPcmyyN38zGqdj7GWyLr3dvTRw
-wFbiXV5S6lpQNNm5vmiWU1uy0fWsbJNnoqOX/4hnOdUiQNMNwke5pnzf2KhkJrAY/Cnph/aA
-UcU52Qz1e/l8/Vllp5SemtPmQ7pp6ff0zQTPOGrW67wpcfV0Q3/lOs0k+WRigqwFNgOGBM8Y
-JW4sqhXfEv/MfolMC8qYWr42QYtzv39CWS1Pq2LS2auonbCLEmeT0knu4bbP3m6uH+R/vuzQ
-wuANZh47ll8by0jcELlFd6HV0jUYhWQr6+KjtQ2I7kZGhaYt176x9NfvS3+ov2Lx6famtdSu
-NzlVVl0W4VVVwD/Jq6Cn0L8F98+SZANbko/4d9EeYZjzkbXoB+55gUfCLi6VcK4zRRuc54u2
-OFNKjrhOle3yVHX09LfxzKHeksX0RXollxupE/uWiCSjkksSK1IRPiVfIqusPi9vo1+rrJpS
-X3PUvEa3Mv2afk76Qj1oaadbmNpBU9v4RDlT65HPUYZko3AM0SNyaR3JQdG3+K/4QI7gfwcb
-MGt804JjnS/9l8omelYW13GtFm7k72LclS3owmT77f3tfEVqfWDoKbWOucHU5j9EnXGF6JIo
-G2ojlWK5yHMihlXUokRd42cVnjZR67Z01Bekv9Nb0i362uYd2u4p/dTf9JcIseYtLias6GcZ
-A6VAlyTvAC75TzQ7difcgWsZmEaDntuBpK2Cz1nS2v2l6KvzseAZipKnrhllZzyfhTx74x5L
-NSYf0Xp6EGeOSGPdEo8ED58sWYiUQQPkLWWcaoa8or6fslwKoTlvniCw1gX9pfTN+oECb7Gp
-2zUvjGZVuq63op5qKmaRb0K2IROloyUfBf6MxNtzqfwdYRdDfBODfznz/KuFXYwpbuT6X9Fm
-Z3ax3CUqXegOWD97zzrvkb+9ZHAVNZX5l9HwB6LP4jZgrSgpTZWSsnXIfaIIK6/1KFobH6hq
-pY0U+KK7PjWjVD85vYV+uzlP+zxlq3qgIUxs01iEfG8j+xtrDdeHXkmuAGRSGk1E+4VR7jOZ
-TW9xTwyst+V7F5REhSzb5pxWtM75vHi1q3bZNM9Oe6Z/k7seJSJ30fZQIy7KeaItE/8ll0vG
-SjYhPmipfJCsmnqnfJZ+lXJTSntNZcsVXdUMkaFRhl/vs/zR7UgDtZNM+1SvdPkKpwrAb8gJ
-tBi5Jp0qKRPdjJfGGcEvOgZ/h0u8CeqGo6tfVsa7w0XvnHhROefbonPOqyXl3LnWlQKHzyfP
-eO8Fh1NdmQmMlD8WfRvngeOiClAXaXXsEyJX1sTXadsRd42Z6mtpr7VH0x/r92YMNtgF7yIE
-fbZLTdPkG5YoDdpTcp3yjmwJtgyuB72QrAQeJG/xJ6MhehM7jNwRMro/kVpbMy9RMsmVUqRz
-5hRZnCuLa7oSpbWFbA/7prgzKdJ/kP4T6s3xnC7WPuFJ7pBck5xH/oFPym/J+qsD8vP6IuWH
-lBOaqRZCPzNjpGFNRh9Dm/TWei5tjLbIFFN11zcnlqgH4/UUrdEc9Lx0nSRXdD++Pu5ix0Zq
-BXuF73tnUZscb3yu0tXuP0XTndHCUsedosXOEyUG9wHrVm9/5wFytzcSHEidYKYwU/jT0caJ
-BKARV4fypH9hrdFU5SH8sPYy8cu4QugjWboX6UrDq4xThvIZkGGYZYXudGoPTS/jbeUVrVWe
-qyyV2bCp8ARoseQw0C95l8+J2ukE04oEQl5XU9JmvemxF3POUOFNR6Dwi6N1ccx5szTFk2nn
-fNnuxtRZ/2v6XGgn95sbHfsr0QbYITGA95GL8Et5BrZB3VdB6duoslMlgmeN0n/PyDXwGfsN
-r9NX6teaj2qXpjRUqwwriPaaffh7RU/0X3SF9JpklOhhvEL8OevjSOoTPdJLBco5Ovpmlirc
-I4pQ5+zCtY7yRfWdaEmJC7ZO9X50bCUtXnEoFnjMVGH28sujMxJRYIC4I6SEpmHb0fFKLw7o
-4kQX0yd1f/MMXbeMQYa+mW7D44x/DGB6nq5H2jaNyiRVLdb9peirSsXa4rPgbdBIyUGgXHIL
-n8/vps8xP/zngzNcpH+8dbpnUnGec1HhZsfKwnsOaxHrHFOa6Sm1YX7O1Z/a7Wfoy6E3HM0d
-iI1OLAK+SHqBBOqHqyhGYpz6gGKoYa1qS2o7bYP0U/rmmS7DmMzPhsYZd/Vx809tLGWOep/h
-DfFQ8w6XED3Q6Wgf6RJJimhs/GWsB7uaG05NpZ96dgWW23nv95I3rjeFXx3uPyMdFwoznceK
-812XyqZ7Vzh2kSUeNPQx8JZRMEf5+dEFCVg0TjwJyoTOY2fQe0pIPkJnUt40ker35l26zxnL
-DY5Mo3F45lLDlXRYLzOXaL6bBqka6JcrPqrqY3PwkfAGqIFkJFCWqMJv4hX0IKaGf0jwtvOE
-/0xZZc+5oqXOR3/6ON79WedoUPTS+aok7O5nK/KtdlWn/vF/pBeHznBObnFsSWIKQICdwLGo
-Fz6kGIst05xVMIYjqrpp07TO9FI9m1nTmJlV3hjLMBvyLP/oXqbS6qHGdsoO2hz5X8QsdDza
-V9pKAoqisUMCg3fmLgeq0FJP58Bj2wWvoWSxS1e40dHkT4ZDWljokBXvdtUqq+Ot6BhM/ufJ
-Dz4NHGdymMX8leiYxEDRUPEPKAeqhN9E/1FlyTldK2WvlGqaWRa37t/MEsOGrEVGKCts6J+x
-Rn/T/D/t2pSQ6p0eISzq9dhCfDU8FKovUQIvE3ciw/kloUxml88cTHMO8ENlv93yorrOyn9U
-whwdHZcK1zt7lzxwx60XfZ1dUqq6/xK9MLSWi3MTY7mJiUBPcBD4FFUhCuIgJtWSio3GqKow
-rUR7IGOA4WLWOePvrDPGG5mnDCvSfwr+uUpjMj1XvtDOkU8hdqCj0I5SleQbcCrWN/YPw7E5
-gY+hqe4AabG1984oTnct+NPEca6g0L7oz1nHvqJproJSk9dr70Ru83wJ5gm7aMSs5kuiixLH
-RavF9eDB0DY8ht5WTRb8e4/yV8omDWPprA9l/m0Esn8aZ2Z1Mj7NyNfXsrzQgqnN1TpDZcKs
-nol1wtvAauiH+EKyR6JFpCDCB/eECd9uaqfjp29J6VD37sL3jicFT+2/C3SOgYVTnaaSu+6f
-1ge+Jq5Mqo7/K703dI2rHjkSCyXOAxfAk2AF2TBkKuHGRmnrEh5jU3U9c5bOlrHF4Mv6aTRm
-fzeGMj8aPqRL9Uzafc04k1/5UztN3pEYjlZBk+A78Vygd4yMusOb2MfkmJDavZbMszo9acVv
-nbX/iBzjCm7bm//Z4xhV9D/X1dLy3k/2oeQyjyP4OHCT6cgc4pPR/YmXohPiYfA86CmeIiNV
-awT/vqpUp17R1Eqfra+UNcbYKBs13claY0zLzDCcspiEXrJVPc4wmGiuXoL1wOvCAHRRvCKp
-S4CRvZGzwR7hq97OVG3HRp+p1OiuV7jNMbFgt31TAW1PKezrtBVfcF+x3vBlucxUjv8TvTV0
-lasdOR2LJ24BV8CLYFXZOGQhEcbmatsSIqF39DZ31qGZeQZ1NmFqn20w/ZVlMdbLGKmfaDZp
-75gqqELaf+WtiQ4ohr4D14nLA2x0bXR+OJNtQ7LBTS4T+Zd1nmdf0Qjn/YLDdrBglJ0q6O2o
-UtTKtaUU9+bZe5PrPGTwe+ANM5a5z1eMvU6wogKhj1yFQnhvWUX1S7lTH1b2TuU0C4UcnZt1
-1bghu6/JIGhja+ZcQ630mbpA6gf1DsMIora6F5aJu6AL0jZiRXJrfD4ni+iD92mL90Zgjz3i
-XSow97k/Bocvv7rdXHDc/vBPlvNE8Tb3KuFGFK4KVHk/SR8NlXLdIo5Y9SQiYkBQukT2ACkl
-OuEe7WFikemmOt98QbcpM924LXuM6V32RNObrNnGHxmP9Lx5tFaa0lIV0A6TYwSKnkUmgpD4
-dHJAlOc/0uuZvf6hwWLnCv/yMo/bWWh3mAsa2+fkp9r/Lajo+FlYxzWkVO09Y59ArvVoQ2RA
-zO5kwOiUWEayn7iRRIpo4CXyG7KH6kqKFYbeKj61r7ZCRqrBlC0ylc85aLqRnW76O+uVoM9H
-unZpIfVWQy/CrcrCzmIHIaW0WDQwkRG/xu7k2lGd6J6enoFPtlPe+8UdXVyBw94nX2k/mr/D
-PvxPpnNy8SH3dOtjn87VjOrox8PWkDRyKaKKH0/WFc2TVpcqMAcyXzkTX6F7RqSm/FQvs7zV
-Nchqbqyds8Y0NmebaVL2BePcTNAw3rJPa0nprnqu7Sa/qihDKiK1wQmi0clc/i6vojsyHwXP
-0jvb+O+VXnNXLrzjmCHswfYbtCfzdY75hdkCh4PeLcKNbPbIQgqKY94ykujdWPnkdXFTyUSE
-gIPyXFlzTZZCbxyoOizw9++MZoZP2XVNhTkFpqk5U01cVnXj2Ixy+vVpjTUrDAuIXFVtrCm2
-CZoJ/ic6FC+NWZmu3LhAJDTJTZNOa3PvnyKns0rBZvvZ389thvxe9kiB3VGpeLS7l3WTL8Ol
-o+b53XRl2sehPBRXArVEIWlN6VbMi0CqFXia3kU8TtFraqSn661Zx4wFORGTvJwmRZXTwgRn
-HTRctBA6OGW7aqZ2iryJwoqsggnwCJCd/BQZw9cNecMx722qk6PEB5T2dK/4M9rh//3Ltub3
-V9u7/JB9SqHU1bDU5cmztycLPLHgZCrE1GeRaLV43WRlSS+JDakHT1ZYZbc04wX/vqxSm99r
-W2SeMVTLOWKqV65zyuscp6lz9mnjpowl+rFpQzUVDVOIOioxdkHWGnov6SciY0tjjRgf+5E8
-ELK6jpITraxnqsC7X/NH2yf9vmJjfveyhwpCjsbFc9z/Wg/6egl+8Z/fS4+hg1xHXh3vCTQT
-1YGaS99hIrSR6gDeQS9V0ilNNWPSe+j1wn0S5WqkdBHmGJqzyNQk67nhmEWpyzNNUSm0NeT3
-5FsQP3RZEk0+S1SKYPyO4O7wWO806r79pG92SYYbFjJk5e/7tnq/82zr8q32BoVBp770nee2
-PYcs87wPLqSeMH3YQn5wHE2OlpSXVEZx+KbihSypGaD4YbyqmmC2a48IbLM655tpQ7lNKVXL
-NUw5nR02Xs64oG8p7OK7vjvxWPlaZpKFhJYaBerGsmLzwxtYJdkslOX6hzxTdsRzqbC/Myff
-Yv/+a4Zt0W+DfWfBVUeoqK67p3WYkKmOwGP/A3o9/Ylbycdiu4Hqon+hBlIzjqEbVHfxPfp6
-yhapizTX04/qR2bXNvUqtzlle7lrKSdySkwDskDjQotaN8bUVLVN8wfPlmcizaGqklbJ+omJ
-3IzIDypGn/f8CUjsJt+L4sOu2QWf7Wm/p9i4X2ttc/Pv2/8p/O1sXvrUw9srk3W8RcFfVCFz
-l03yefFqyUeSLpJ/0SawhBBjHbQHFTmmpOqauZHOmlnF+DqnesqvcqUpi8otT/mZnWHamXFQ
-/ytVp6mv/6OIEI1kjdAB0vbi/wGzoueiTro6m+eXh8q7epCY1edZX0Q5VxZIHRfyD9vPFfzr
-oAsbu/qV5nm22T/7W3nKBwcEnoTvhLdHGkcnx18BrYROFALbYHOQespf2EehKytNkNpoztdO
-yKhsqJg10Dgsa7JxSuYmgyn9rK596mv1fH1twqiqiNXC3kNBsLv4SsIeP8z9F/kUfB6e4KsS
-nOUs9ReX/fFULp7naim8S8fCtc77Rf+5upae9ZTY+vlT3BOph/479JNQey7EeaN/JXYkp0qq
-SsYhu6Fa8nz0uYrHIb2dQFIuqC+bq+lqZPzRqzOnGq5mKA2G9Lu6ZOoQzVVDFeVD9Sy8g3wC
-MhSuCHYVlSWHRh9Hz4cL2X8Crem+nkjglT3ou13axhMrWueqVVTZBRaXuJIlYz0y20Wfzbk4
-UN+3LVRG2ZgPzHD+e9Qa9wDjRQXSd+BOmQjJIdTYBE1EPspwR1kttb+mjdDTHekb9GkZ+/SZ
-wgz30n5roka1arT2krwb4UMfoXapU5InSk1ciS/hvkbKhRozVf1k8LgrQE63VfUpSzn3sGLG
-tbi4tttW0tXTx1rFd99xmbzv2RI0B86G39JR7khkYGxN4n5ygkQjMSEtoIN4R9StrIGXaO2K
-48YlKlVagWa8ZaauRTqg/27Zp7OY62njpl+qn7qXiixVG4zCZsEDobmS/4DFyZrRC1FHWMO5
-Avfp/t5rVDlnwD/aushbVhJw1y8550ZKx3hcZb+8r+xJ/xT3GWq5fysdCN5gd7Nxvm+sdSJL
-tEb0SnoJbCa7BG9QbJZtUreQt9F/JD6YmquvpzXStrS00E2xdND1Ng/Sfk2Zos4xXCEeq6fh
-NvlPZDcCCcyZJToS7x8fzT2JjA1NZB76B4SWuPcHdttT/bPLsrxUSQdPTukBz+qy295S2zJ/
-lssZCHlPhNKpHczu8I1IPb4kZk/IgPWSHEkUNkItcRLpozyBmbTVFecMh5UuIdOyzAO1fnOh
-doJ5jHZ9qlPoAKuVfbVr5G+JbNlH2QJomfSKOBsIJdz8yKg3rOZqU0n6l7dBsMB5jexvW+RD
-y1K9c0t9nt5l/3lr2yz+hKNGYLXnRnA+OSv8MDSea8j9G30b25oYLzoh6GI3mCobC9dXpMlw
-9Rl8n05DRIwjVNdTm2nKmxtq65rraP2pVTVdTTVV53XLFeNVQ7AbuAs+C7cFp4oPAM3jqngb
-7lFkXSiXSSd/hTSe7tRoh4hcbK3tK1c2xzup7IP3s7XUl+XYSXZ051Mi/wxaHmzGDmTq8S/5
-OvGOydrAA0m6hIdtUgLfgoSIVGyDZpmc0X8m0BSXKiWtu+ZZWp5Gm1Zfg6Tkqn7q+xMe9Xx8
-saIRehV9JD0H1hBvTl5KbOUHRj+FW3H9qJHhxr4PwUWuBYEm9in+8tZqvjtluO+U9ZVvpb0C
-2daVQd3xrgntClRibtNxDoy4o8PjPxNPRA9FCelKkJBVgePyW+hxVTYu1U1T1DeeVj5L+Z9a
-mdZfw6Q21yxJyVK/MWQpG2hXyVXKxbIlWA34PHRTck30N/AiVhYjuKeR/aFiZjrZlD7tsVMN
-nffJTTaVf6R1gi/P+txXy/7Rv9Q5O3DIcybYlCwXrhz6wnZiz/Iro6viH5OjAAisJpEjn6U0
-NgQ5QbyXgZpUeUN9LyLF1E8Fpl5Ub0iFNNdT+qs3G+8qR+omKNaqDmIN5fOQfUiG9L0wBZsY
-lGjON4i+DHfmdlCHwrd9jUMN3QRVzZFJtrNFfJzV6gvYjvo/OCLkCredKvQ1pHdSD5m14dmR
-I5EWsTdxRTIq+i4CoYWgB0Xh/+RL0cqqn9hQrVwx1lBB+c30XSVOPaF+nDJeXclUXTVJX56w
-qrfiHxV70FGykdBTKSGBRQ+SfWPbY7/Yo5F9IQdzgpxOK7wtg1+cTQND7Df8g2wV/a9tG/3N
-HXvJ9a6/qN3eASFz4HHYF+rP+VlTVBQriucAJ4A6YG+JDimR/sR6IyOJS7ITaht+UychFhg9
-yo4pldSnU4ar95o2qHoYvhBZ2nnyTspcGY7vhrfB/cGgmBB1S/yJf4oU8RvDqdwGak/Y5hsR
-2useRr1wHCJT7If8btthv8c+gvzkvBtY7jkW/Cgw1szgCLYfA/P9+AexIYkZybHiHHFH6AaI
-CLo4IF+DepSPsZjmt7xQ/4OoZhqvqpWiVd82nVGFDW2UNXRVFZdVe7Bc+QVkOLpRagP7iPsC
-VZJF0RqxvezkyHZhFz/IU/Qs74ngJNfbQGXHZLKbPeF/a59MtnHOCWxza4O7fdVoGbWaeUAj
-kVPc6ejOWIfEZsAPzAeXSRohIelXrCNSj1gl660+iLfTHVZ4DOOUO0wrVA9MW1RrjbuUDfVf
-FGrNErwb8Qytjr2AfkAXJAPFGwBnfEN8X+QRvypclbtN/Qq38L8LmT0+6n/OLgGrwPyv7PPI
-T46mgZuurdQI76TQUfJYuFII4khmC/+JrxS/mchLHhP3FY+HPoCwrCostHD0pHIttl+zWj5G
-P5bYbyxQzjCNVH0yflGKDMOJFtpO8o/KxzIHXgbnIYXgdPCtyAi8SvyKhqOv2AGRaCjBzA7Y
-6X98qMDAfan2zrTAXMczkhRmGOTqSG3zlAYXCO/xnqrODgjvjugi5tiP2JnEMaCOaDCYK/HD
-EDQSa42cVQyTXVL1x9domypMBhdx3FiiPGF8ohxkuEiodGXyqGoH1kfg/+EyTtoSiopRMQAU
-xqvEf0XW8yqmArciCDH1yQp0be/s4F4XSMHOVoHXjlGBM84q1DD3v8F8b3uaIicyvUI3uCCT
-ET3L749PSBiA+uKN4nzhhceh6bAVb4pWUDbAymv0clr3Q2E2VlF+Na5SGo1fiZb6fopVmnZ4
-OeUrdCAOwAMRE1gPrCbCgH4JIHYnWpXrG9lL12SrUm3ClJDbMTcavOcMBp44LgcUwgx9XLWD
-0z33Qh38l8I7qAI2PVyO/86tie2LMYm5wBhRK/CJpBCOSSdhacgHhVlWoopjt7TP5A0MPYit
-xizlIOMfIqS/qdikJfHxqrOyt3IZ4kabSouk48R5oj3JO3Ey9iuylG/CdOG+BPsy28l99GYv
-GuJdN6jxTjlVwVmPkrqi1HN361AHX5weHoDYvFCDyEB2VVQZdQnO2RU4Kr4srgMFwIuoCk6T
-69HmSkam09zGr+sGKE4aVhLVjdeIqQab4pxupDyh7o3dI8qQCngtaBwyWbIVPAM8BWJxTXx1
-dFukc6Ql0431BDeGN5OJUB/v7uBj1yFqrHMS1dvpoTq7wsEMzxz6hq8v8zYwmatDH+e/skxs
-Q7RrckTyrChLEpA8gzTQDJkJYeUxNFv1ENNqx8r36t8qrIYJxGVDTDFE/0yu1TKYXnUNvSKv
-CCtkc8BW0BPRVHFa8mriaCw9Oph/z/bidtFrmK5UmNb714XqeQYGO7veU7nOJFXL9TR4wg3T
-Nu/N8BPyMhsLvo3MZWQxIz8o8TV+HtgjColrSdOkz5AcuAsuQ9cQr2SL1VPwRjq/PMvgVqw3
-OBUX9SLFF+0cPEs9QUYpEGQaNk36GH4jjkqqAM2Bc/HjsRHR5pFuEQMzn3UF/4RvCf551Vsl
-1NPdJZjtqhas7LoSbOi+FTJ7a4Vv+WH2OSWPpIVrRk9yM+NtY7eTYoAXHZfkgBlwJeigTIXY
-5Z/REuU07IKGxQF9bYXasF9xVS9XdNB9wCNqEQYq3yGX8YFQJvpWMlf6t+it6H6ifmJS7DXf
-gz/O/o/bQT9n5lK9wlP9CH3fQwcTrvnBxa47wVT3qtBBzzO6yDeeuRboyZWEhvCd2Y2xb/zr
-xMyESKQTV5asFjq7E9HCVfF8pAIxT+YT9DlHO0BeTl9BMUzYwwSdUr5BsxbzKdej3+Ut4emy
-N6AL6izuJfmRfJFcFO8fGxytHJkRqcE8YKuGmjFVA366j++R4F1sEHOXBKu5J4c6eabRDXyF
-4ZfkcfZZcGcEYc5G50V+x+MxFNgO1BBjYGOwL5wBbZS54c3yrWhvpRaj1EtwQrdDHtJ9l/+r
-ayCXaWnstaqGLKhQIfexW9LeSDvJH/AXMFS0OEHGe8Qu8IP4XPYAl0cr2I/UtXDQv5ge510a
-euY2hga7h4UQT3XhbsaE3/vF7B6qgLtOf+flHBtbFM1KAsnWoiXifpL30jZSGlHDHPYQea5o
-JRutysXuaRx4Hd0KeSddE3lb7d/4BPUVWSGRhxTjm6H9aF2wCfRF9FW8KDk12TleLtY9mhJZ
-G2nOUOzI0AZmU6BPuMTXnH7lWRv66l4Wknn0go/pw2n+RczZQEPuYMjIf2bSYrX4JolD8X5A
-imiceA44CNwBV4bWyPLhXvKxKEV8kPVTp+F1tWJ5qTZF3kU7Hv+stmB7lMPQr/Je8G2ZVjoT
-fiIuD84FvgFtE9vjLWOL+Bn8WfYL56KHsxWCOcy/JBxO96XQpzx3Q4M8OG305tOnfDhjJQ+y
-J4NjIlfC3aJhbmi8c2xO8nJypUgpWSipAXWXEigEf8X2ITMVUlmpshcWUU/Aa2n/4OW1i3GN
-Zi7WSBVAHyrkyC/MK72KnBO0OUZUX1w3GU2UjxdGO0aByLFIDyaLOxH6wcQDt8IL/dfo7V4Z
-nSfMgHlPCpo4EbaQEHuIusYtpFfx+9hFsUJ+Y6JaYi+wTrRD/BCcBh4UdtFb9gKO403Qf4mN
-sluqO9hwzRzcr5mBd9Vcw76pRsvOEZeQOH4FSqKrwV9QF/FZiQWYB2CJ/vHysTH8dP4q6+KM
-4Y3sguAYJkQOCd/xraSHexvQlbw7aLd3fHiW/4DwHpW4PiFXpBPzWtDmm/jt2OckDLwT9ZBc
-krSBJktDCAbvxtYgmYoCdKpSgfVTc0JPa4t30fzE/lK/kI1WtkAj8glwRWygNA2pJeFBUPRL
-5E3kJaKxF9G/olDkVGQe04QLhCB2MhUNK0k83MU3l97jXU97BZ8w+xsy4sB+dlqwRaRBGI82
-5yKxKVE+cTxBA07RLzELHgGPwq2gGrKX8C08B1USA2RG1WBsvdqL0eoPWBs1iL1Q/oceU0gQ
-ENdBqWhCooQKRGLJs2Qy+S5OxJPR9vwIPo+luN7hXNYZPMhsEPrfar+DHuzLpZv5TGHMHw7v
-J6uyT4X36ElP5CuyLWP1+PqJrvFqwGxAK94iKZS0g1ZLHyME3AKbhZyWX0VfEk9kC1VLsXHq
-y1hDdV0sTZUm60rsRWj8LdRE9g7sBN8UdwGPAP1FRxMzEi9jp6NpUa1AsleEPOst5GqcasS8
-I4eG6/mL6IM+UTjuuxiuTt5iMMrEjQjdjaDM0miIGx1PRPsniWQrUTWxTiKTvgTXwP2hKPoS
-noyr0dOKmrLlShx7p5qPpas7Y6NV82UOojz6Tr5QmHOXdBKyUTJbOk+0Qjw9eTi5If4h9ila
-lW/LP2ft3PzwLbZG6C4TCfwOp5BVwoRfFIb8s8JF/r7M9MBmdmtQG1GGX/Hf2AOxj/zqxPf4
-LMABdBWXSOTgLOiM9DuSCTfD5iCr5EfRecQWGa+sgN1XtcBmqm7K/lHuQ2cqTIgJ7wqNRvuC
-i6BO4q2StsA1oH/CEd8WaxTl+Tfc1sgmpjfXh+7MVg5OYGoGToTf+BuGB/hHh7/7DYwpkM1y
-1DKuHZ3JlzHW6KPIY0GbF5NXkxtFF8TdJf2kNHgZngmJZV/gzjiO9lFgMo64L1Oo5FgT1XvZ
-JKUftSn2IC9xCmotI6SLYUJyBMREb0SmJJRsJ/j30WhBpCp/lC3jFoXfsENDZcxgSsfcIv8N
-F/tHhHl/UdhBPmUWU3F2d2iZ4N31onc4SXx/1JVYnngDTBXutD7YDDwEPZOWIhXhytgEpL38
-XxQhmsn6KK/KKOUt2QZlpqw3kUQWyZcIv78vXYd8ktyR/hTZxK5kGqBNTIiPipXwVn4XtyWy
-kBnPTaJnsVOCJ5iTgUB4Grk3XIn8Gb5PbmVQ6ghbFoxz5cK7+Sts99gcvnyiVxwE6gh3ikrm
-SbZIIel7eDKEya7DDfCfiEZxDV1JNJfNVs6XrVTWkJ0gOqJGRRSOYUOhpehm8DV0SpyQPAAa
-idyJVYnacSZ6Onog0oFfzOoiC4XevibUiL1BLWCaBejwNtIbfkX+j3kW6MUODq7ixtEi/g1z
-Jjo5Mj5eL9Y8KU7iok+ie+KZYHfwLpQn9SACa2EtELW8PnpU8UO4k9qytspKstfEenStYhJy
-HeegibJ20h/wNEmKdLNouPhe8loSSGTGx8Tu8RF+O3czspc5wuXSd9ifQZppQHVlKgZAhiX/
-YXYFALaMQrmroeERW5jmh3OnY4ro9MT7eCtgCxAVtZLskZyWGqQf4KlQHD0Ly/DryG35VFRK
-FKO/CJnsI3ENLVF8QHrIVwrapaWfkDpgJai/eKZkJfAOeCGwRXb8ubCL9ZF+/Dq2TuR0uDH3
-LTSFzQ7eY94FWjCNA22YZYG3zFIql9WG8jlduCc/hQ1Hk5Er8f9ii5MTkk1FGeJi8TFwLPgF
-eilkKgrLsfLIDzyGNFYsQVsQr9BDxBVUTijQJ3IaJrG10EXUBlaCzZLFYCdRoWh9snOyOP4r
-1ie2m2f5TUJnv8LcE/KshG0QqszeonYyrwKDmCuBXEGrE9izwWncVPppZDfTI4pE4rEj0QeJ
-DomlAA1UEq+S3JC8kmZL/8AToRC6E/6GLUe6y1PQWYqZaDliIxpXVEEBxT/IVByGR8uWSWHk
-o+AVqPiPuD3QCziUKIzL49ujR6OLI8OFG+kYKQoP5WrRh4XcTDLTqX1MQpihH9VE0ISZc4Xa
-RgrD1/lKXOfYaT4RbxF/kCxOThLNFifEX8BZoFPYBYXEoVKZFJmJ30HOynPQ9YpB6CtFQ7Sc
-Yquwn8WwDEuHfiFrwFHQZ/FHiU7UXjQm+SXxLr4g1is2iJdEZ3NFkftMmZBnam5zaCzbKGhl
-ZlK3mQUUwTYOvmTXh15xHcNafiK7O/ouUl8gI1fCmjgIzBD9JXjWPYkEskh5eAjkRhfA27Hu
-yDf8E/JebkYHKCqjKYo8RCO3w8uwy9BytKG0HrxbcgMsFdUR1wGeJnclJgktoFX0WrRXZAl/
-iJ0leMEObjVdwFYOtRc4I8D8pCC2Y3ArOyA0ibPSmyKfmDCvjKyMLYhWSSTiBcklwCKRX4xI
-sqWzQTX8SNCFF7okK4Ih/F8Ek39HnstFqE3+Eakpr4TkY5mwSvZW6oNbgZukh8V6CQNcBPon
-+yc+xyvHxsVq8znRuZyM9zGGyNxwZ85CX2C5YG22X1DGzgsOYluHCIGLZZHOTFd+KPc+msuP
-j5vi2uSm5H0gKOourgG+k+RA5aVBeDB0GR0HW7AMpAa+DpHIXyCT5XmIQd4DQfB58L+yTtA6
-pAjsCXWSBCXnRTtFSqBzckUiPa6KZ0cfRodHdvI/2O2RScwdTh/GBcZewSaFOV4FO7JtQ1/Z
-nvRF7mP4feQ8Wzf6MfIkZo6NSCxOIMAv4KjIKMmWWKSrBZ5+KT2BlEHVZbfgPlh9pBG+CPmN
-70Ec+CCkJn4DtsquQ9XRydJycFBiBYeJt4rfAN2AZslyiafxDGEX3fia0btcJt+D/SsSDy/k
-HtMu9npoIVshNIztGrrJaukJQuaPjHDMcZ7kUmOW6Ln4xHjr5INkPhATDRPrwfcSUpoiPSXw
-RSu0HrxRyJJlWFWkKT4Y2YN3QZrhf+CGmBy+i5LSEngn+FSqlyyVbBC1EYGAJbkqoYmnxxtG
-f0d3RO7w5bm8yA8mzB0M9+GW0T/YK6H17KrQKVZCV+WQcJybw2j4ptyUaEeejC2JLUq8TqgB
-SLRfVEGikhikE8EP0Anp/5DL0Fd0KlwkK4bPYlnCDuoJb8PBM7E+cA3ZcGgVUkG6CbonGQE2
-EVcW3wZg4O8kH/8c18eWxUbzfaI+rptwqzOEN3nOdQs35YbQ39iy0C1WT2NcPn2T0zCnImfY
-In59pHPsWPRT/Fd8aFINOIGa4mHiamCehBJyZBOcA0lRAK4s2wCDWD58EhMjboyE12BL4CWy
-GxCOHpM2h3uDdaUOMSyZKnIAkWRJYlOCjf0V/zsKxm5HQvw4DuEbsG0jFuYKZwk34kbRQbYV
-TQgdZTv3MDwkksH+j//J5UU/8/X+z9FVALeRdM2ZBTHLDDKFmXNhZqYLc3JhvjDDheHCzMzM
-DBdymNEyW7aYtTTzz/eXai1X2da+ea+7X3eVbEs+8SoqjeuDFvACbEmbyU4YyPzvfZUNFHNl
-c5QZ8rGqFWSf3JP/q86U/6NeJ3+h8shWKxmZS/6NYWSL6BI6mnoBj4GHuDH+JBVIavG4OJ1f
-JcRyG/jC8B3ubSiGex/cGgkFqkdWBmIj9wKjIguDGu5cKMjVj5QRzPxKgk1BaoFm4eHADUZQ
-f1JtmRN0kM1mZsjt7FPFRdlLZRX5atUMuVm9U95B/Y88T5Ugz1L2kf2t6M5elUUzN5lb1CGq
-J9wFvPg82oGsYi+pgVBZfM2VFbZGWvPzwuu5eSGK2xT8N1IYaBd5GRgeaRPMjjQJHeF2hc/x
-HbgwccoDpc7SKzQBNwFT4DE4gBaoFLYBc1rWm1UpasnKKZ8Tn58i363qLIfqPnK3KkleU7VC
-JilOsOPlG5iNbHt6Ne2D8+EOsBa3xFckTJzvO3Eef1+ow33gE4lmxIcncZVDocjQ4PYICiyM
-1Am+jQSDU7m0cC/+RGSuMIt/I84Uq6ONaBfeCTBYRvWgejHbCS4ekJx6iV2uGCybosyUJalY
-+Q5VqvyZSiPvrzoi66+0s5w8wLSQZdI9mCVUe6oa7AFy8Ey0B10XxxK96Ca+5PoLpyIr+BPh
-79z9UE+uJGiL9AieiLQOPo68DDbmnoQQZ4kgPpOrL14SNkp3JS96gXuCq/A0JOei6rFlmLOy
-qmyxPMAWK2bJTiqfymqoHLK1Kr9ssuqm7JKyvGyhoifrl7VhUlkTUZiXsBxcCtri5niRpEe/
-BY84mXcJzTm90CTSnf8zfJdbFGrDPQ+6IjOC3yM3gmVITnnMHQrv50tzdwUXL5PyxX7Ijq7i
-H0ADz1HdqHHMStKLg0xd+Vy2tcJEssZU2RXlUVkZ1S1ZZ9UxWbayhaxQsZVdKz/FZLMbaInu
-T8mpFJgOCoh+X0Vnxe1SFWGD6OSOCAWR7zwfrsmXDl/iBofacZ8IJl8Hy3JdQru45uGuxBO2
-Eerzs8Vo8aGkQQYyzL/AW3gWrqNzqbIsxcyXeZkd8j3sYoVOVk3ZjZx/mkyhmi2zK5vL6ijv
-sXqFwKyXUcxzpoD6Sd2AbrAcJOM+eLRUD30RKklz+D/EIdwwYXLkLL8tnMy/CZ3kUkNduS/B
-P7jE0Hzue0jPg0gOv5jzC22EylINaQoqg+9jCsrhE6ohNYUZRuewwxm1vAzxDmfZVwooG6Cs
-KHtB7m9X1pbNU1rZlYrmbE35RGYtO56+SHekHsMUWIQDuCL6hNaRcyUIj8ViLkfwRZKEuMg8
-ouOY2xXaziWF+nEpoWnciVA+ty+8hQ9Glgp7+ePiLDFbGoHScWswBqipg/AunUm1ZH/QC2QX
-mMXy9uyfiotktxaz45RK2TVlrGw9weVnxXT2vPwxU11mpSczX6h11HV4GmwCRWgabiYNQveF
-PtIMfow4hdshbI+U8J/Cw/m0sJ9bHtrDdQit4PaEXnPDw335dZE0Qc+XIQmqi3RWWoxWkS3S
-BYYAolKoLcwfdB5birHLPjCZ8k7sbMVuNqJ4wvZVZrMTlb9YTrGFlSnURCs6MjHsYLot3Ysa
-AxvAfTgDRCQjniQqULSglwBfVUznJgmDI5/5c+F+vCrsI/e/yp0OveAahavwdSLv+JXcRaGs
-8J/oEe3SI5SAV4BOoBY1Fb6l11F12NV0B1lnprrcynjlLdmFirmsS7Gfraq8yjLKnWxnRT22
-qnw/c4f9SKuZHDLFz3ASeAj+QxdxI+kY+ioclc7yN8VHXInARxoJLSJX+J3h5rw8bCc6+omz
-hI18dngjT3GdhTl8W7GSOFjySwvRdXwKj4IfAE274FImTF1m39GHZNOYyXIHYyD3XKkYyeYo
-VrE+xb8Er33YbfJsprOsOnOH6UNDehBVF/aAS3AbEJKa4JViI9RWaCe14yeIc8lZH0fihNjI
-Xn5WuA6vCfNcfFjNHw2P4ndGgGDjvgmLBKtYXwpIHDLi06A2aEN1h+/owVQS24qOkkXofNkS
-ZoM8j9EqktiJilbsMcUwdpaiC/tMLjAXZBOZluwl+hD9lrLBD7AyeAV2ENUpJWUSjnyUHvMu
-0cVVEBtyK4QdEVrA4W383HALvku4In88PJKfECngN3J7BVZYJZ4SN0kD0RGkBLfxIfgelKd/
-wVVMJrWZXU4PJTvCLF/E7JY/ZIDCxnRW6Nj+CgvrkHsZpXwl84r10O2YivQhqgXlAF1gR9wf
-fJRG4bni36i3sFqaTGZyh1OJidwc4Z8IFLjwHn53eBB/OTyWbx15xDfgegnL+WTRKOqlG5IR
-DcYJmANlwUKqMiyhUykt66JyiB5tlWmZcvLRzCb5QaZI/omJV8hYu1zPNpZ/YarKRjJvmcd0
-A6K166GMKsDRcChKAUAqg18JNdFnvrMUz68QF3JWwR3pKoyOfOGD4RnEA3bn60WW8DTZ+2X4
-7cImYYpYURpDNtloNAJMww64GPSnF8BtzGBqNhtPl5Odo+/J0pnK8mmEsxeZ/+Qe5rU8iR0k
-V7MLZDeYNmxV5hU9ma5MraAWgw3Qg7aAVdJm3F7cgZoLJ6Xp/AfxB5coduEWCq8iIt89spGX
-R7rw1SID+VeRe/wTrqegEpLF1aQX6UhL1NuMG8FS4BJVAQImmgLsT+o6O5vuKQvQH2TdmKry
-Lcw8+XvmDLn/IrmF/SkrYj6wk5lZzBO6mLJRzaEfHsQ8qIAQtooM/k+IRgV8fakpv0i8x+UJ
-LYiGvo/w/LTIUX5sZDn/ndRwkqsnPOOtQinxknhC2itVxWvQabAcx1JLwVB6JJzIlKbKsU+p
-a2w7uprsLL1GxpNaGjJaghGz/BrZczeYXyQrXGMEugvdkX4B51MNwFH4Aj0Ey6VveKoYRJuE
-RFTC95Sm8edFFdGlI9xloQ3XSYji5ORZLWQRTPzHvxRcwjixtVRVOoewpAbFaDD04J1UIThK
-34Bjmb8pLxNNj2C3049YDaOULWDayezMZFkvtr1sO3uNnce+ZHhmK12ZqUlVpZ+AeGowFkBp
-lIOTpM+ohfhZ2i34xfJCY/Ejf1KYR/x4Bf4LX8ht5Iu4xXwHPpPHfE8hJCAhVXoqjkR7pCN4
-OvoBBmKKag0YOga+od/CbqSOqwykdWQuXdkiehXbmbnN3mEes2XZcSzxWEwse41exsynLtPV
-4V2CzevwMjoHLkknyUzOoAZklzwVgDRHGCJWF74Jhfw0Yf//chLv5o/zQKgsDBSCQpYQEOeK
-Maim1BgHpL7gPhoLt+Mh1CjCVQu8TD+BKqYv1Zf5Ru1i2tJvmKs0ZEszZci+l7MUu5xRs3fo
-88xlSsmsgHXo3qATVRP3gvVQPzBJ+gt/EOeiQeIpKUqE0ndhmrhNoMUewnkhRhgnmIXuwlhh
-nqAQvwi/xM7iV6lQLEAbJAdugmwAoY/wId5BTQMVaDNcRJ+E9+kqFKIPU9WYKHoQs5xewzDM
-VuYfph2TyZylLzCfqGbMK7idvgFeU8ewF15EKmiXSoFuJNvkEM3YLj6SRouVpFriRZETeop3
-BVbcLmQKD4T/hDqiTygUm4l3pXOkc7WkA/iJtBIMQyOgHmdQt/B16k9goh2gJT0bTqfD8BA9
-lcqkXVSInkhHMyLN0TOZVfRe5hc1jInAQloEjWgIZlLR+DDshV6DR1IY/0k0QytNRHniR+mh
-2FnaJBaKg8RNYgWxjVhOjBWnE1cjig3F89IScR7KEfvgHlJV8EkSwCh0Ccpxc+oQPkzVBe9J
-3vNRvWA8/Q02ogdQo+gcahM9hd5Ly5nB9CjGSo1hKlAJTAfSi9HkO9fg+tQrNBM2QOfBW8mG
-l0lVcG9pFWoiiVKqtEYKiZWlR+IXcZ+4XrwnjhAt0kDxjDRP7ItuiLFYIf3E46WtIF9qBqeg
-t5DBtahNeAyVQXT0MthF1YM3qPvwF9WBUtJZVHmSBM20jrlJdWQqkUmNh5/oPaAL/QFfpOIw
-Q61G7WAptBL8lF7h81IK3ictR1skFZonHZf6Sh0IIwNiFemsOEFaJP6S5ovj0QFRi7+Lt3BZ
-aShYTXoB0SK4AmWTucRTe3FZqjqoTN0BTYgi/Um9g3OpwdQBSqKOU4foKZSJkVGlSQ0u+iJY
-SUcwRbfFo6ib6CHsjQzQTDBaIp3FVuI1iqR1qEDKQJ+ll9J1aYZ0WMqQnkhfxGh0SlyJzolq
-/ErcjpFYHrSXLoFTUkUYj1bAzegRNOMvcD9+AysSH3oB/ISNiDK+g3HUWKo6FUsnU5fod0Rh
-+8IQfQ9cphNAG3oBvk8FUVlqF/oHDiOsb46qg8ZoC+6JlHgs2oXGocZoACqWmpHONCO8nIyy
-xQfonlgKPxbX498iBEZpChgofQU3pQqwDNGu3WgGtBCvcQb3hHVAD/gADCHeYT50wANwK3Wa
-JMhl8CFdCxbRj8EjuhGYQN/CYaoJnkwVoZ/wBmoE96N9YC+SgStoBv6CKFyEjqMc1JPkcQZd
-RseJp2ooBVFQbESYtAYXiVYsk+qB5tJ6sEH6DuySBnZHpeB/KBG2Jkr4EhcT/2UH3wCAo2Ap
-SJHpXKQawA60Eu6mb4F9dBcwmrZiOf033kAlYSPlIN38jgLgGxoNnCiPbKfxuAY24rr4KaqA
-5xOnXw6p8A2pPO4mDcUWopdaqRhHSbXBH9IiMEF6DM5LQUAhHRyCtPAdKgGd8X+kjhugPbgH
-vpBKxsIw0FMUvEXlgvr0UTCW7gr60iU4iV6B71FVcC8qhPJgLhoJ81ER4EkdadiLu+CteBRu
-Ty4K/4mvola4HeqB/5PmkcRwGTeQ7LiMVA5UlMaCDtJRMFv6Aq5LXlJHGAxGWeADugA64E3g
-KV4NOoPtwAqugLnwFShPPQQvqE2gHN0JNKMDuAK9A5dQbfAWSovrUhx6Ayncn0w0n/z0BLAM
-K8B5fBPfxpPwRVwa78SP0FpcG+0jafYhqcOG60tmUFpqDapIs0Eb6RCYKt0mW+AhoNElMAb9
-A3JQbzAINwfZJCNMBMMBA1eBU3A/6ENtAFnUCJBCp4Oy9HsM6VX4NtUVj6VqYQNVHx+HPXFt
-OBffB2dwV/ALC9iJL+FsPA4/xnH4MN6OdmMWncZ7pWd4kFSC60rRoJLUBtSR/iaqu4Vs5f3g
-tbQblEXziINsA4y4NEnhqcAI6oL9YAioA/8BWXAtmEtNAb+pRoCifZgn2v2SGoOXU01xQ6oO
-zoft8Hw4FmvgVryPTLQl8JDUFyDdKMAz8SuswQ9Ion6Lw2RvHJb0YIz0B+HoGNBS2k6eb4Kx
-0jNwhODDLp0AbdB4cANVBpWwFhzGGuIFS4NroA3oDnuDIGwFZlFJ4C71C7+n/sV3qW54LZWB
-u1JGrKZSyG5tjnvDKdhDZrENOHF3oAOx5PEbG8AqzACI9WASqkB63gZck0aCRdJqMJxoRU/p
-Legr/QDzpXfgqnQZiNJ0MABlgExUjOvjj/gy/onrgRDOBFowESqBinLhGdQDfJpagK9SzfAu
-KhZPoCiCCy32wdp4DxyN68NjOAt48XZQCQwErUE50AUU4XbEV7YHv9Fg8vqzAJbWgRsEk6vI
-2cdKP0E/KR+MIpqxTroKHktzgAGlgr/Ra/wbHSD43kImehC3BddwNnHqy+BJrKdW4ZFUb7yO
-spBLQpMpD2pNCchMlcVv4XA8Bx7F6TCEf4C24ACYCyaBzaAx2AlseBfxMafAa3Qf9EevCBe+
-gQdSMdgohcFEiQPDpEIwTboHdkhLwHvCndLoPl6JpmI36oiH4Fb4F+5JMv1QzMABeD9sj6Oo
-SrgvxeC/qWI0juhVd8LTylQpzBNMXIEX8TAIQTwcCLLBCXABfCJ5vhi0JNrzGrtBfSyCqwjA
-VkgCLkkiGoHBPFJHPykL9JIugnEEp1ukVPCdcLkO6o53oCTCczWeh6MxBargnaAhbgD/wE9h
-BVyO0uCBpAdjKScaSvGoE5WIK1ADcBAexuehjahvY1ARbgESeE30xgmOgDDpRwScwwAmYgXc
-iWhYGSFyLwS2kT02RLIRjN4HbaUV5PMmYLOUhfOl6bg5qohJXsIxmCXaE0/YUhXfAzUJ9iqS
-vkfhJMqHmlE5qD1VglpRNK5JNSBcXY2/w694GywP+sPVoDLMAgoYBfNADbgLNIaJoD1cTlwZ
-j3rCRagtTCaK/1aqAddLSXCE5Aa9pdMEq33AMsmNH0tTcAKi8Sx0j2yAvag33os+48toGHiC
-OPCMbN9HKAdeQAnUMVSDuo3+oApQdaoMTqRWEM/lJjzpBubA+6AdrAQz4DzIwNPwHbgHJ4IH
-MB/fht3xKfgKrYQD0FAIUGN4VYqFcyUrGCBtInOpBSZLL/EBqSN2Se9QWzQbnUSdUAxujdbg
-oUgBVqPN4CRKgHfRKrJtPkJSE/yGVBRLetAEK6nN2A15/ITweQO8BgbDNFgPzoYWeBby4Ck8
-D57BeuA6PIv3wlJ4FjyD2sM2KBX6yTwuSK/BEmkV0c5ahKuf8UGSNHMlJ6qFVqI1pIYSVJco
-fwv0gOzoemAjugXOoirwATnJY3QfZqLfJJO5YWkcIri0wxf4NawA9sNlYBJ0kO73gTXgURgH
-P8F84IAryKUkXmEpfgCVeDs8QDx3S9QchqUoeJfoxE5pJsGDARyT9uIPUhyOQ9vQX+T+NxCF
-YrFXmktUtwBXQANAe/QZjET14Ry0GK5CZ+E5lAndKAs2xNlwD34P1eAi/BssJ0gYAofC9vAt
-rE+8STRsTb0Cf1L9QRvqAy5PdcAC6eJ9OBUthYkEH19IP45IO8F6qSzB6kl8TUrDPmkjaoRi
-0Fr0QiokjqAtPiWdx6+Jvw5LB4AFmQjLxsIx6BjcTlyiFTlhHcyRJOGDKvAFzif7pgTMhiPh
-n/A3bAqrUxY4gvoF5lOzwEQqgNtQf5EcaEff4RK0mXiaLjBLgvAIeeVFUjWwQLqCd0nV8Hvp
-GEpFaWgGuk9y1kapGV5N/NtxyQJ+SLuADhlhMzQZTiNu+Sj6BR0oANtiCZ4mNcSBT4QXR6AH
-TCCzaAozYWlYllLDftR3MI1aAUZTRlCPWo5pSo6fwz2km41RA+glu/wK8b6rpQrgH1LDfukP
-/E66jRJQAzQNZUrv0WqpHp5J0sJqiQH3iZpgyQ4aou5kHnvhdfQacsgOuxKtukx0Ig78govA
-JZgN5sG6sB3cTRgiwXjYhPKDYdQFcnUB9am3JAO2w5nwI1oNx6IWxKXy4KN0GBwkGrFK+oA3
-Sn3J3s9CIWkk6oJ80kl0UFLgRdIEvFR6j09IDYBNOgvKozg4Gk2Bp9AV6CRuuT4Owx1YhAL2
-wEHgPbwLDkETHEseTeFLWB7GUkrYinoNelAzSB8owFDz8DsooB1wJfoTliOdLSB+4oI0gtQA
-CU824j0El9+lw6gKqoGWoy9SDsFEG8Ia4lSkKOCWFoOqyAvGoV6khqPQhX7AuqSGNeR0RRiR
-XVsAj4KrUCJa0Qm2hYdgBeiDGliRzKMttRE0oqoCNXWF+OqaeAu8hfrAnigWqtAb8Jl4nNNS
-MuHIVYLA5viX9BZVQIPQAsRJb9BNKQMfkuaTr3wmzKkNzGgv6IcgPE5eAaEDsBf+DM8RjmoA
-guOACz4DL2ASmcRIOAGegq2gE6bDFIoDNalnoAy1AASgFlwgPJ0IaVwd7kUu0BEdB3Kihq+l
-eJID7hH0dcYPpd/k7n+jFkiPNqI7Uj7BZlO8WdqHb0k85qQBoBl6BjahmtCONsFW+AeZBUv6
-EEU1ADpqK/EeNvCcTGEtHA17kjpKwQIYIF95AGKoRSAEU8BNuA/PJurfjGDTAJuiTyBAvPdN
-qRPBBQ1OSLvwHakstkv3CUf7ErWISHZ0i+TeU8Qp35fkwCFNABXJJp5D8tcXdJXgQUvtxq0p
-H+5PtSY+8CBoRUXI3RrBRyQ3jCcfa0IXFMn5TwARdgBayosdxAlugiHUGu5CZeBIpIDlSR1O
-Usc34rlc0keciIbi9shNFHM1KkAVUWvC2DVkHs8ILrXgidSLaMVh0A4J4ABqBn1oNuxA9sUu
-4vG+Eb0qBe7CjWAbOXl/WBEC2B9eATvgOnALDiPnLwsuQw9xP4fwTIKkIfAnagm3EFwOQVbQ
-BR0CrVAvUB0ZQW30AndFk/ECVBp/Q2/RH3gAmoMN6BVxiFUILucCJfoAmqI6cBKaA2+iy7AK
-dsF/CTe+4BxYiWyJjeAw2Z9DoJw8UuBt0BKuAaNhX8LaOLAaZhF3tB//BZvh7vAH0an5pI5a
-KAli4q0+E818Jw0ns4ngKDSNbC0zvobOo1TcEI3CED0mWy2BZM5OIBHtAIOQEyxHpeEzNAom
-4xNwKGHcGQyoMLZQ9QGkdoFMotvToRPICDO+gNbwP9KZv8HfMAHsgzmEF8vwDGjEc0mCmwAH
-o0qQQYWkhjvgC/HeecSH50tFGEub8Z+oHL5FEl0Cboq24x+SH8+QWDCF1HKbbDsdca3rUApJ
-TGmgPigFmsOWJFOPAH5qGnhKbwItmDmgLdMcFDJauEzGUQbFP0xDZSX2meo7u0bzQHZX21Fe
-UddNjrVhWWftMFk5zSl2jeoWs1Axh64ti6MukvT9GdTC96Qz0nW+mZgT5vhKwSvcTt+gyDrP
-H+F97jehH+4W4UueUpHX3gSus78mXzU4RKgfXigu5K5IZcRUHEW8mImSYBQ7j66q6MY2VjeT
-V9ZJil7GF6rTUW80dOwfuiax6bq+0as1b40flBW0o2Wi/C61gQojg5QhfAz/G47xrw4Uu0r7
-BtmHevbbWrm/FFpd9wpeuroUfHR9LizvSbdf8K/3COHxwYMC5AU0AaVS9ahtzHn2qgwq7yp4
-9TjVD51HfcY4VFsr6qjuQgxl0MU3M7ZOrG9CydfN6amm6EeWTHNMfDt9iaGi8ox8EVUL3RfW
-BQ8H27s2e1bY9js65hcXz82ZZPtm5Yq6WIfbROvV4u05O+3z8gY6RxWedv+2qwIe302uFreS
-uJ/GVCY1nZ0t+yafoFyljNFo1P11HTUrDDO0H0xHdW+jpuqvx1Q15MTVNn5I4I1fk96aqqfU
-izqaMiYqlDjO6I4CmsFkFqVpL0rgR0Vq+777btlnuVYVptqf5gq2f7PL2/61trHtsSYXf8h+
-WnIo95rjXf4R1w3bd2+m62nIGNwvtOIHYgc6Tpnof9gZsmPyGcqJynQNp5qva66RDIe1i83F
-uivRr/X22DuGygkPjH2TLpiyLVFRn1K7Ri9MiY76FL9Wv97YXjlEcZz4dodQJXQlaHNd91Qq
-djhe5lcqKcm5aBuWPdCWa/1uW5pdtcSUm+QI50HXl8LZnrv29YFj3i7cq1C69IfQECzALei2
-9Cf2H9kb+VrlemUnjUlt083QHDeGtD2jeuk/x8wxdIvfYTyZuNVksFw1L0stH21I6xM9P7mX
-qU3MQc08LStryrTENYQLkap+yn/BcdB1pGiOnclfVfwm54XtUXbY9jo7VCzmPLJ/yfvoNBT+
-dC8qvuUbR3oxwX+Zvxv+KAWFz0ANrtLzaAe7RfaffIfyH+V0TYx6sv6CZqGpk65X9HF9Spzd
-8DEhxtQzOcEcSpkU9TBtTHTj1ELz/oQ2+rkmnXKMcgbJuj7hSVgfWu2p471SMs85uBCXbMvL
-LDblbi1ekKMp4XP+tM/P6++cWjDeHSra731mfxzo6xkbWR5YJSyJDEdnxaFwJgjSmbRMZpKr
-FI1VAeUA7S31WsNk7XJztm5+TDPDhvizxrpJ50w3LefMrdLioh+klYqGFrfxZ8xATQNdoiyG
-PY3rifO5cYFqAb/T67bZ3jtGFqCSVnmdSirktiezoOxV8244QMFnV6DwsmdPcaFviLMk+JdX
-jDQOPhB6cmfQWGktNMJiej+TKotVdFF0VTdTndJV0RQbi7U/orrpZXFfDImJ1U2HklPMrVIn
-R7VJPxH9PrVDVHTiLb3G/EKZoVpKK2CGdCbSI3zBu8tX1oFcoaL5jgoFNe17876XyPKS7Ivy
-GjvUBQ1cWYW1PMdtv70V7ZJ/uet4SONrwT0LeoXvnBVdkhbALvAFrWHryFYoJihshKv/6Bdp
-3pna6ZzRb/W14nsak5P+Nf1neW9elDY1unr6xegVlgOmJbG1tfH6OHlp2VMwRjrGPwr2CR5x
-N/W6Sjq7ZhTNdfQu+M/eJ/+FvWb+SEdiQZHzdaHH3dq20rul+I3vkf144JULh8r6pnFCsJkY
-z9fGovQS+uEgxsMKsh3Kisoh2jbqssYh2rVRZfW+2EeGMonpJmtyX/OjVBDtSu8Q80+aLcqT
-OMtQPuqk6m/1NGY91Rq157dEOvpf+584K3gWFx9wbi9s79AViPY5+R0dD/M7OWMLy7nvFOm8
-B2wZvu3Fqf4suxCQuQeEt/h47mJIFN28g+TXfdRAejg7Tp4jn6hOU+3WT9d0M8/SPY2pbWiX
-8NXYLLmsWUjZGvUjvW/MuozVMb9SZpv9cVV0uw0mxXH5Y8jiT8Lk8KFQO+883xzHVHeRbYXz
-VOE1x5aC846eBS2cqGCza0LREE9P27/eITaH98/ibN8ve0HA5O4TzvJV5auEO0hLCGfDuDY9
-gtHKtiuWKkzaKHVv4yJtIGqwfmdcKaMi6aHplSUm6mzag+gfGWzsX+l7o78nNTOWip6pHqep
-wm6gNXiSMJdbF3gYSHNX9+rsH1x1bQuc6wppp7ugg7NKYQtXi6KP7h62Ol6Tbaz3XtFkb9Pi
-Jz6zQwgsdG8MX/Af5qtFnki3xa9gJmQYkX0nm6EaqtTpaU2qua7OFZNiuJ8gGK3Js8ynUvmo
-dRn3Y2qWcsQsSHWYT8bf1v1pPKr4SzGO+ooPi10ii8PlfAP9c50zPWkll1y2oifO/woPOrcU
-tnLVKVrj7mAze+vYVnnzC3973IWlvcbiEl+co3kw6M6IbAyME5py+0h2KoKYSmRPyH/J+2tW
-qD4ZaK01Kl7viUs2bkr6Zpqb0jRqdboU/aJU49gRGb+jFZaTxiUxtKZEm8VWYYtxZWk+PyD0
-Lejz9PEVOpQequS4q5JN5xpS1Mk1uqiuu7btnGet7aRXVYQ91wr6eJ4XTvH2K17rv+xICxm8
-3bn3wb3iHv43Posb0nuZprJBSqciRrdOPcL0Vrsk5ot+YcIj4/3kVub7qR+inmf8G7Oq1JWY
-9LRs860Ev+6zqZSyvaoOraGOS3f585GTgTOBQvcPb0+HxvOymHH3sn11vS4a406wbfYcs332
-Li7a4K1dUMXzNb+O50HhD++J4uTAQac2PMU3ju8VviaNFxPgcTiS2SOrLV+iLlLWMIzRzI5a
-qjsWt8DQPamaaUjKYfOW9NHR1lJHY85mTCJ7dafxTuxgzX79EVlruQKuxN+FD5FB4W5+0a9w
-X/W+tDfxbCne4B5hu+g22WZ6Ztiue4uLtL6BBVs96/LWuSflz/FYC8f4+pZQQezqHFEErgpJ
-XBSeh9ZQ9+kD7H+KvoprWqRqYmqsXRXTQL8lIc5oS95nUqTVj9KWCkS/LlUh5mzaCfONxGr6
-llFflNGa1kwME0JFYhn+eah26Kt3uJ92LfZWtQ/yjChWexbbxnsW2SZ5/7K18LUubOqdkrfA
-LeTOdL/OFz0viv7ws44moWjvea5GSCstFv733tRPdJLslCxZ3VP5WX9HXTbqvrZP3EW9mDjU
-qEj5ZSqXfjCqU6ms6GoZ36KOWMYaU+LOauYZhsuXKaKoBJgm7eU/RSoFFwffear55zhPekvZ
-Czw3in97KhfP86YWT/SdKjL6puSbPYtyw65OeW/cVwtOeHsWtw8kunaHm/jlwtjIOPRR+gxT
-aCtTWbFFrtFaVPON9TX3o2vo7sfHG2TJJ41RqR3NXLoy+nbGoGhbalXzzMSq+t1Rf6q8mvLs
-GLYsOImOkpkUhz3+tKDBU8Nf1Un7Gtn/9ZYueex9VbzY98t20pdXEPK8zpW5W+T6XJ68AZ6i
-wl2+FPuhYKpHw9ULThIX8j+wDcfT8ayLTVZtVjzR/VbpzW81jWOf6goSlhhwssoUn/bOXC8j
-KrpDeqOo8payxmpxvzVJRkpxUqmnb1PT0XZxEt8iXDf82/cjMMXdyB9yDPT1slfwrSrZ6Xtf
-rPCPL/J4n+Udd7/IWesam9vWfTk/3tvG9sgvOPRho282Xyv8VdosVoY5sDwjyLJl+eq/lCMN
-S9WXohZoL8UN0muSiLtLWWJSpleKyk5fEzU4dZtpWiLWlYnerpLrXrOMvBw8C7yiUhjEVQvt
-DrX2HQq0dg/2xzqf+W7bv/qyStr45cWZvkkFlzwdct+5Lubcc9XOM3rMha19NUuaBC3uXZGM
-QInQnauHT6F+1Fs6jn2nOCtfqfUp/UaHunrMV603frm+YbLeODX1nWl/uiHKmtbTXNGy1fAo
-7rGmjqmnoo36Gf2YWY6/o9vCBu5AJDnYLbTH+5D4389+5Fjjf2p/5W9WcttvKErxVct76q6Z
-88B1M2esOy8vxftn0RG/y/4q5PKYeDHYTuopLABHwWD6Jcuzz1XjFNP1K1T55vkaLraTblHi
-b/1LywrjnbSm5qPpl8yjUkWjO/GjLj7mp2qMfrbsmaIOdZrqjKKlIr5SpFakYqBliPWiwE5X
-l0Cxo25grL154J6ttv9q/g/Pwhze9Tb7k6tRrsyjK4jxVSh2E3xWiaT5+wm9IyvQXWkTFKgW
-TIzitcyriVPOMqapb0cbtEviH+m+JfUxaFLLmWqmzzBvS8szNbMsMjSPj9ZGm7FiruYhU0/2
-H5gGKkg1BQt/PfQsnOwvHWrqSQomuI4Hxjs2BcqVeP3TC4Pedbm73Qezd7uq5zRy/5WX78kp
-7ONfYP87NN9zhlsV/Cxm8QBUBj+pbuw0tpsqTx7R0ao/zYJ6YGym9ldCf32UBRtsqcdNr9KM
-5rcpS43/JZ7S9YmRVHpDnuyNMp8S6Bp4O3IK97lG3OVg4/Bfvuxgpjs++MH5PXDbPjuw1Kb0
-j8o/5embY3M9yn7lapCL3JoChS+++FPA7qQi732pgjvcCv0htYJ9KRc9Sj5LVkNzX3HIcF/1
-PuqgZl1cU93HxDv6YssIo5i6zrQ0VTDuSv6kj4m/rhlqditaaRl2qrwzVFJ2SSZh/mDkbMQX
-EEOF3t/BVe5+weFOOriwRPAvLsz1Hss97X6a/cDVNmcg6QXveVI40N/EPiSU6FnARQe3in/y
-Z/EyPJ7azojMWuUYeZpuoXKyaax6ekxlrT/+jC4lub4hP+W18UNqTVNCyhfDnMQuur9jAqpN
-hnLyk6oRdAr7HfvwBbGRYOCrh02Re/4joYDnQ/Cga0zQbT8WaGBz+dj8zR4hu8A1IPu563GO
-y70g3+adZzsaaOV8Eq7ry+XHhE3ogqiGr+B5OkfWRHZB/Y8i3TBfNSyqr6Z+HKfdkjhdf8GS
-bHyU2tg0MPWa8UTyVf3I+ExN2NxQmaxbzM5XFME/6G2oM7ohhLmZXMPQm3C0/3JoiSc99M25
-IPhnSVRAVvjJK8/d4lZm73BNzU5zz8s96XlTwPualBQFM9yhSP2AWdzEVcFvkQ/y9AZGp1TJ
-b2hLK5NNZnWTmF+arPhxurLJegNKOWuEaXGm8SnPDGJiX13N2ArqLcYt8jy1RC+R7QTT4Fbp
-rRgn3I/U4WoGv4eb+dThZe7xoXRHvaCvqI5/Yd4tT+fsEtcm6wlXYfYp9+68Zd7NRYmBgY7o
-8BBvEn8y1FCixfLgD/iWmigbww5R35T79I+V7aMuqWvHjdbuT6T1LyzPDd5Upelc6hFjKUum
-PiYhVlsS9VbZVt9d9lxpJWn3Ir6KXWJv4d7//95LrYA33N9bI5zgig6ZSpoEVha88E7LGeoe
-a23iems97vqWE+UpVdDOt6E4KTjBlRJZ4K8vvIn0RjJUBtahv9I9FMNlMdqdiq3G46rX0f9q
-Fsc3031PEvUvU84bw6l1TftTdMbJSS91ntiP6t2muYpkrYL9Jb8Fs6jHqClqK5bmu/MrQl8j
-M/1Z4U6eN6HhjthgcdFzX++8Uh59dm1XC2uOc3X2L1f5vIseeVFL/y17k9BxTy/uU3C5GCWs
-wg1AB2oyC9gZqunyivrjyiPmG+rzseu0dROb6BdbNMY3qZ1N91N54wRLXcO+hH3aq9HzVe0M
-KfKQ6iFdyB4GCdAh3REvCO8jRdzk4JFIS9/m8EwXH9SXfPIPK2jmrZ3zwpVgPeacbo1xTctZ
-7b6Q/59XW7wzUOQ8Fvb43vE1IkgaImWD9dQB+oa8mWyXZoeiqfGpalv0Y82A+EW6R0n1DfdT
-fhpx6gDTjZS6xpNJQD8wrrSmkdmusGs3sB8VPSiRnopnYiANFijhfngu90+gTyTfkx9a6/gR
-KCn629c275k7aM1zploPO/tnn3I5c5d7bhXG+EfYo0PtPdW4UcFR4mZ+Ej6P61LZjJ/JUU6U
-b9WdVurNj9WW2H3aowkd9Z5kxtgz9Q/TiNQCY1NLdcOVhPPapJhzKt4wSV6grsKY5DXgLGon
-qoMmiL3503xeqB/X3S+GWbcyNKjksX9TQYq3W85RV2nrRucoq9LVJWeRe2r+Ve8d28rAP86t
-4em+2/zm8E/prHgV/IDTaUpukmWrRyvmGzaqPkWt0xyL66SLSUL68ilbjetTE00LUqKMl5Mo
-/Z24bhq/uZXSpYuVJalU9Ay2I1CTmYiiT+jKjeHvBrXcam/t8Dfi+RW2Rb7WZJdlkV44sg45
-ddnHXKtyZ3saFfK+1yW24Ba3L7KZcPUqp8Nf0BuoYOYz0UpO9lPbWDnSNFC9Iqa5tnRCWPdP
-8lmDlPLbWCf1gLGjxWRgE29pr8cUqH4aP8op7V2mt8IKP9G98U5cUbotTBTiIor//Y3JSH93
-1dCSki/+7QWVvO1y7rj01svOetYKLk3ODndG/m1vb9vkgMw5OJzrHcXT4RlSWbEF6A691HzZ
-GnaEukSuMqSrRkSV09SJc2jPJR7S37fUMlZIvWtskPLecDSpRJcfN1zTJWqBcp5+luy5ahXd
-WJYPSuBWVCKdFGvxZYQeod3cU+/qcAnRC5Xtmq9jHuUJWWu7WCvvjM92uf7NPe5pUSj3/1fy
-LrjIfTWyMHBDOMTtRPdQe+iiOdqhmC3br32qSDC5VOVjPmruxq/SJSS3MKxOmW58ntLcKLP8
-1AcSrmm/x+jV9UzVFRu0nViZchd1mKkNloIMdE6cJX6LePnpARzZ4j4WulBSPfCsYIp3fQ7j
-HmYVncusg13tc866e+af8E631Q4wTiH01JvFPQ89El8LU3ARsFAce5u5o0qSt9MPVG42j1P3
-j62l/Z4Q0oWStxkmplQxnrH8ZRiUdFNXEjdZczTqtdJiUMuPqPszreUlMIZ+jKvgsDTgf/+H
-ILyT7+BrF+npfB8cbsvwn8wb6umbvcU12NreNSQ73X0v97KnR2Gx72TJP8G67mYRVSBKgNwT
-iUUDQQZN02rFQvac5q28lBGoqkbb1Zlxl7QNk5brb1veGuJTHhv+Td6hf5BwXVsY01O9wnRT
-Ea2LkV1T7qJnsgPgVDge75ReSrM4hfgw8Jx77G4R/lyyP+AtuOt9ldPefcZaj2jnCte6nCvu
-jflbvPtt8kC081ronncRdzTUWtwjFKJzYA28ypZmpqrWyyj9T0UHs1dljn2p2ZNwSnc/eYSh
-UUqMcYvlb8PEJE5XKt6qMUSPUd0zfJFP0HRiqyqCVAKTBRqARFxLHCjtDVcW9vr2RPY6PcGz
-NqNfyqvjuZI9wHXdKncdy37mcuQ29wwn2WhLCQog15XwWf98fkWkkjRLeoOXU/OokXKW1Wkm
-y9cbrikPRl1Vd4zbqX2buEo/yFJo+G7xGpYmF+ndCRV1vWNd6ibmWUq1Pij7qdrE3JUNo15T
-88BXgrDB/AlxWDCeb+7pG25snx9oXzjLq8t1ud5Z3zpfW42uATnV3JXzGS9tm+xv50gOvfbk
-RPYEjwir+Y7oIJbANeYgvVaZIGuom6k4Ytqh2hCzUNMkYYpueXI94sV5w3XLVENmUrT+dnyq
-Ni/6o+qxcbhiq1Zkxykf0QPZJ3A4xFguKVF8ZKtQ7PsUee7kg09swE/nJ3sOZTdxrbMWOgdk
-H3Ety03z/CL7zFf8K9DNtTGMfb34nDAt/Rb34whsQdlkj5mT6lLyVoZhyplRQ9St4jpoCxIb
-61dZ9hqSU64YipMf6mcnpukUcSpNdNRdJacfJP+mTmUfyOPop3RnuJko+Uu+nHQwOJsf59kb
-7mc/HRhWeNCbkpvo/k04kmmt4Wqd09YN86O8D4r+9vvtptB4z9NI7eBSIZnPQJXwU9CQGUSb
-le/YTG15RSNTB9UfMS00QnwrXdfkGAOdkm84Z5lh8CY10Ecl/KWdFtNI/Y/JrVikOy6bolrO
-TJLtpfpRmeCmtAXtitiFTn45R8YWooolX4V8vedOdg3Xdut7Z7fsZa5hubx7f0Gib3/xkUCx
-s114vU/Njw8/Ev8SR+J/iINcIlvP9FJzMqxvoGwe1VJdNq6x9kdiQ/1aywHDHynPDTUtEX04
-cb7udtwyjTeqkypskCkKNV/Yl4pP9FkGUuWBH0cJY6UHwe38aM+ecFP79kCNwhXevByle6fV
-75xnLedyZjdy789jvAOK+vk32QuD0Z51EVego5DDBSQR7QLJTB1aobzAvtIqFa1N5VVdY9I0
-GQmldIuSvfp6KQ8MfssIQ/vkFvolCeu0zpi5atrcUgn00fJClYp9KqtKj6RawUlSPiodqSw+
-97Xg1jibhmbaqvjP5rX29Moe52pmxU5V9iFXlVyFZ3GB3re7eFaAcuHQI99F7nJ4pHhDVGIr
-vAqzZC2ZQ+oLstqGgGJkFKtuFqfRliQa9Bst8w31Uq4Zqv1/L7bqHsfd1LDRh1QW4xxFhna0
-LFa5kMllDlEZYARw8LekbcGffAvPm3Ap+/VAucL93mBOqvuhFTmPW5NdsTlp7kd5nzyzi7T+
-8/YFwZqe2AgT/MQXcHMlD6oAEP2VeqHoy47U3pDfMxYpb0eH1KvjZbqCpJ/6E5brhpmWMQZ3
-Un9994Q7Wn9Mprq1+YZymf6Y/Lj6AntQ/pYuQ1+EJhSLX0SaiVP8Dbk6LkuodDHvG5qv9uhz
-qrlKrDec27J7u7bk3nPfKXjsPVdcKuB1Hg2t8w3iuobjxBpiJmoON8MMWX3mqeq6rIFerhxs
-LqduFFtX601opD+XfM4w1+I0nCKcvZaYrXsdZ9QOilar/zMGFGZdsayOimN41k0lwakgRzgi
-rQ6d4qt4V4Qpx4hAqLCt9w7JytOyLzprZ392Ts3JduXl7fUMLsr1DbH3Dd524/DIwEu+MrdM
-qoW6gPq0hhblu9jtGlohGuqp1NEtNV7iMcYnpRj6WXjDWMtVQ+Xki3prQpIuM7amZlhUJdV3
-QylFKW01WYzyD2YkkwOr4tL4HVdP7BewcJRbCGYWf/MV53vdc3KiXRWy9zp3Zddzdc7d465S
-cMJrtRkDIcfe0GRvf65MKFmMFrJRDXAOJrHdmE/Kt7KJuvLKB6YO6g8xPbU3E/rqTyW/Ntyz
-xBsbWqYbtiZV0PvjR2qfxExSDzCPVT7RT5D/Us9h+8pb0fWpo+CH+EwaHL7Bl3g3hPc4Jgcm
-FPX3xufluy5nP3B2zM51ds0pdC3OO+C5W5jv21AyJPjSpYwM8n/iy0e2SXWl4aAJlUSr5SfZ
-++p4RWtDd9Vyko0Oxg3QtU8qb5hmURqfWzINr5Nf6O8m1tRlx3XS7IvurMowdVQM1Q2T6VTd
-GS2bBc/geFyet4i7AuFIJffn4M/iOz5Hfq57Zo7WlZy90zktu66LItn5KtntDWyxgZqOM6Ed
-nr+5dsGWYhNej4fir7A3M50prfQRv9VS2dvUT30gZoD2FulFVvIzQ7kUg/En2e0jkmP0voSe
-2uLYCeoNUbOVHsNW+QvNATZP3omeTe0CWeIRqU54Hn/Q2y5c01E24CqM827JPe6qmr3C+ch6
-xnkz+5orK3euR1P42veuuGeQcskie31Z/JLweem8OJ94zyr0G9l19pS6tGK4YbDqR9RETdn4
-+TouqaeheUo94/UU2vjDojYUJi3SZSSc1ZTE3FeNNr9VTNX/lN1S7WaGsBy8jTWY4guEzoFD
-kXuuKcEOxV19HfJnuj9ln3IusLZ2frT6nMNzRrgT8hd5DxaF/XvtW0JazwjuW6ClGOFScHts
-h1OYlcxYJSvvrBuo5EwL1aNiN2h3J+7Wv7aYjOmpI4y/U54axlkW6oXEp9qSuBz10miv8olR
-puiqzWGjFD3oqdQscE4cJBWHEvgG3m+hy/ZL/gGFJzyRnKaujdZaznTrNGd09iZX/dwxnuEF
-j33linsEhziNEYUvyCvCX6RB4jlwEw6mv8is7A91O8Vtw3JV1+gdmqvx53U7k9cbfCnzjH+n
-djEeSRlquJecr4OJCdpXsbXUbaM6KasaWsjrqDOZUywPi7ELxfNnSS/6RPa6EoLGYt4r5pVz
-T80e55RZk51NrL+cd7JHuIfnrfPmF5oCtpLHoZHuY1z7wE5xNbcAs7g91YX5xYxX9pDP1l1S
-NjN/VT+JLdbKkwL69injjZdSHxqXppY3lktx6V8kNdQ9ie+jGRYzUrXRNFJRpGVksxW16ZtU
-RZAtOkRNeCPX2tswdMSu9dcrZDxPco47O1qvOu5nyZy7rA1dF3Mqe37lH/FdsvUNQme9yAtv
-U6Ek1BANF8vBn7CA1skny8prnIoYY131+ehOWlPCYL0/uZqxfarG9Cr1pZFKzTSkWRroJyUO
-0XaIm6B+HTVNudlQSz5FPYv5ws6ECtASVeOL+QGBZeFDruYBQ3FlbyBvtGtU9gtHQdZWB8oa
-7Ryczbr9ua29kwud/ukl90PA/ZgL+V+JrbgHOBNtI76tCttYeVXeXpemMpt7aPbGjtd5Emcb
-WqSUGO+m1jadTd1lnJ4y0NA0+YJufMIXTb3YEtU48zvFfl1NWbqyNt2PZsFk6bi4NFyDO+B9
-Gcy37/QNKPzX/SmnubOVdahjW9ZdRzer5OyUE3APy5/hS7fVDo5ypEaqeasI/UIV0C8hCvaH
-b+k9sr9kT9QhxR1DL/XY6GVaf/w5PWPZYVyZusrUKG2g6UjqZKPP4tWPT0rXTY6voQlEp6qW
-GQ/Iy2oOMv1ko2E/IEdd+fV8h4AxPNr1yH/WdsDzd94P5ydrC0eDrFhHkyy/Y5N1pyslt9Cz
-qWCHf1vxjFAt1zKuvX+j+CyyEi9Ef1FyJpodoLwh36BrqZph3qpJjXup25nkN2hTF5gOp1nJ
-1cE0I1Vv7GAZol+YOFdbL26SOjlKrfToLLLSyjwqml6GHaJafBlaGXnsSQ56SjzewQVBV1b2
-Q0f3rIh93++/HH2yLjsHZl9zL8pr6fuzyBD8zy6PvPLEC3+ETAgLEngMn9IN5VNlyzUJyo3G
-reoOMb+1PxISDDaL3vRXmsxsSP9qGp2WbTyd0t9QKnmVzpKwTvNXTAfVXuMqOdAMZBiZDH7F
-G6QTnI5f598UOurs4vcVNfO8yt3hbGy1OE7/ljku/w46zNYTBJ/YU7Xgqr958aYQcO3lGvkP
-iD8ia/E5NIrqxiSxN5Vv5EHdRFW++ZNmW1ycPia5rXFd6gdT+fQK5trp603RaR2MkmWPvk3S
-DW04brv6cBSlbK/3sqOVR6g/6JrYLl4RToZqRTZ4PgUulVz1JhY8d+3IPuKAWQX2hr8HOAp+
-n3NmW6+4xdxWvkeF2mB1O4y08WiFZ0EsHRKKwCJ4hU6TT5Jt1VRWvjTeV5+LSdBNSpxgOJ0y
-09QlfZY5NaObeX/6cBNMcxi2WMrr1ySW126NvaWaYXok36+Zw4yWKWEAz5fmc06utH9cKNpZ
-3t+sKMbD5o5xDskqsV//9cF+5tcDh/B7kmtX9nNPSv5CfyvboFAF52huj2+M+HekD16G6lNj
-GJGJVt2X/6ufrjof5dSsjW+pr25Zb3yQVsU8OWO7eVOGxrw03WqcktrGcD55si45oZamf/RI
-5Ql9Fdkc5UOKo6ri/uJm4XNQDG92/xs4VDzcq8of41pjreeI/Jpqb/LLYQ/+auJkrW3dDXOt
-3vKFFwJvSi6HLZ7n/PfgE6lEuAfCcB99Tz5G1lPbSLnPZFOvjO2ra5X0yDA1NctEZxSb32Rk
-mntleEyP0v419k2x6isnvdfmxFZQzzZh+UTNBoaWecAQ/L//b7mZG+4DoZ6Oc77NhRvcM3Ky
-HMW/B9h7/Gpn7/erkeP+b49zcnZnjyZf5f/TFg4Odhq5Ep9F/BBJxm4UT31h/Mwi1St5SL+X
-eJza2u+Ep+MssSZ72ivzzozmUe8znpoL0s+ZxNQKxnaWrvrVCb81m6IzlY/0Q2SzlfeobxSP
-0sQGwobgv+HmbkOgQ/Ebz528V8521t32W79+l8Bfw8jzA0dm1keXkDPRaytoFdhW0jNc7J7B
-7wzOk3YIS8A6OImuK28tO61JV74yvlMvjWlC9sVOQ9By0DQ8bas5PX2w+VzaZFOtVKUxmDxY
-b0vooL0Xs0t12LhIjtQVGYm9CJ7hutIh7ht32b8nZHbt9j+zvfck5E8gXE13TrKWdk636l0X
-sw+4TXnPvE0LGwW0JV9Cq1xbuOn+puLNSC6qjVbBpXQCs0dxWbZC20GZarqinhuDtccT6hiK
-kh8Z16eUMrlTLhg7p1w1PE0erh+XeFUrxf6lXmbequivW8i+UDSi7JQdhcWTQpnwsshG78pg
-R8cz319FjTyz8oa76uS8cq7Lbu8qlbPQnZvb1bulYJPfbkPBEsfmyCxvLWFg6A7pRSfwE3yi
-Stge7HuVVT5b3031wbxDA+Pe6W4nXjOkWPYYY1KWGOmUTIOUfFyfnFRL1zC+uqZN9FblCsMx
-WWv1EvoM2wz8xLQUR1z9ioAt1MhdOtC8ZJc3r2CaOz+3h2tDzmjX1pxu7se53zw4v8AXKaod
-XG8/Fv7PXY8fGLgtduDq4GnoBpxDV2C6KQ7L/BqzspWxj7pf9AJt4/gV+pZJBYavydWNLS13
-DfeTX+v7Jq3SgYQPmo0xM1TNTFfk/bQ3Gb1iN5xFTUcvxFFCs/DCSMD7JOh3tPV3s0HvmfwR
-7sO5IVd87jL3k9zrnhX5s30VivYExpbkhtq72nFHfTeFLuEo1FqcCVrB95RZVpm9pNom1+oL
-lXFmjYaLsehGJfzU7006bliRvMYwK9mqX5L0VnckYYD2Smw79UfzFUUr/S+2ueoX5WDe4iH4
-tWjl3NzqQM3wXPelwL2SMb5DhbM8BXkL3Q9yD7ptuUs9FfKD3v/j4KzCpLi6LlxHqlqnx30Y
-CEETCBJcghMkuDvBg7u7Q5Dg7gT7cNfg7u423jYz7V117K/nv6iLvqpVW9Ze700Pycnw9bSb
-gxmuVmF/4X6tdyBAE7WGgvO14Dr6hNobKygnrHONt6NOmnfG3bb+nnTWFpfKI5emtYxypdkj
-h6bFR6LUbxHrktKspeOvmkC0zdDWWgY3MPwMXKASX0y7k6ah/eFq3qLBke5XPqv9kudAdpPC
-F5mugr8yJxWWyFrv+ZZd0zcur3Zgj/PPUN+CnepSn51I4dL8PzpCmgmOQoviwcPNDQ2rbbNN
-o2LWW35I2BzRO7lp5PhUa1TbNBJZP21AZKfUgbZRyRnWmQmXzf/F/GQcZOsrbzVNglPxEp1G
-jtNvKtCu+8eFvhWkB9o4Q95+uaU997OaF17MnFDoymzlKZ19wNsmd6r/F8eS4Eb3kfAsj0M7
-HyjFftP6CA/fDBagJ8hpiFR+srY3/hg10pwRO8w6MLGhLTFlYuTi1P8iPal9I+emrraV1Hf0
-nL4f/eIkU/+orso3yzIklEvScxBga2lbMin0ILzMOybocLfzH7P38g7PMXsOZd0t/COri8eQ
-PcJ7Jkf1VbFnBJq57KHPBYr2zleNpoX/5PvocqkKOA3XyR91Loo0fImoZNodXd5SIz4+okvS
-HlsPnQeqpTaJrJp6ytY55UTEX0lFrPPjiSkver7hfMRHXMz0A6yGh4ki4iGN1JpqPwY+haYU
-Hgmkuvb4uuXleT5nx3o+ZFXVNYQ9pXMq+srkffS/d9zSPeVq+K7ng/YsQGhpLUEc4zVAEdQD
-DTEsl/+xXDFMiLxnKhp7wbI8YXFEpeSrti0p8ZHm1Ge2AzofNkz+Yn2cgC0rYy8bT0VWVrro
-e7pfeSmdBTX5afofuR7qpFJvfGh2PgwMcET5auWe8czN7uhJy77quZh91Fs/N8G/0f4psMT1
-X4gX/Kd+9H0gKJzPxlBZ+iqVgiXltri9aYHSPmKn0Ry9wbwmbqr1QKLB9m/yfdvUlAe2mSkd
-bBuSe0RsSbxtuRZ3zNQguqXh14gT+LLRCDkaJYqKIG2grdFmBZqGaWGZ4G1XSf8v9rHe9znr
-Pa7sfz2JOe29xXMn+oz2iMB254fgxfyL4RbeW1qJ4CvaVPvG13Iu3YKldRboIT8zLzCssi01
-pcVMtIyOrxOBkkba+ic/sL1OXm2blpwZEZu0yXoy/rJ5Z8wsY9iGlJfm/qiHclc6CRpzSt+R
-NuEZ6mNfs9CSguqBXc7mvv15Hk9E7mLP0ZxMT/XcG94NeUX9Fx1vA0PdB0LbCveqlfzXiDH8
-hpWgPtFUSoEtcEtc3zhTibGuMf4vcoG5ZOyf1t8SHBGtkw7bmieftE1Irm3bm1Qh4nrCfEt8
-3FDT0yiTgVon4OvGF+B33FAcE89pDJmkLQnWDlf2lg/G59fxr3Ds8tbOe6G/P8NTNXel15R3
-2nfK3jwAXLbQ23xP+GevTJ4HUthttazIZvWBF3RDBfIk+b1pseHviAmmuOjmlklxfmuRxAjb
-5qQetorJqbbvSZ0jpiS6LWXiFXPFmBeGvbYB8k7zW9ha6SQ9A/msHttOToX7qm39LfXc0CPQ
-wLXB94f9T++RXIu3Ru54757cnj573nl/gaNvcJ67dHh74Q9aMX8V6g7V5RppIZmlLlDGA3BQ
-Z5KLlgHGRpHVzedjfJb78b0iHuo6rifZbJ+SVuicPMaqxt8xd469ZUyNmqt0sdpwVeNK8A2V
-FmPFW0q09dqm4NhwP+/kYK/8bf58R7LvaF4H7+XcAd47uTbfvrxK/q6Oi4F9rpGhCQXN1HPe
-P0jzYBtWQmsjUnl7wEAb9E5uI283NTKUjUgybY16Y86PHW+dmLAs4nNiRkS/pH0RnsQ31rEJ
-Qyw/xS03NYseYXgXES1rpg3wrVxWWgU+sBpsG8kKT1RP+ieF9hRuC+S5vL4Yx1Pv8rwF3vJ5
-Xu/+vM8+r71GoMD5Jjg+f2N4imeJ9tG/hC4Kz+WD6XSpnjRSr0U3fNPQQPnDEm/cbXtgCkaP
-tHyMe2I9njAv4m+dnecnKhETE95aVsSVNhtjyhr9Nqc8yDILLTTEgAnoPm8stlArmaI5g5PD
-2d59QVNByP+fc51vk93uPZMX5budd9e31+72N3aOCE52p4QrF3rUHr4M8jr4kK3VjosB/G+Q
-DruhZ3IZuZ8pqJy1HjWKyLbmErFvLFPjv1vvJdSKqJFIrUcT0q2/xv/PHBH70tgl6pySGjEM
-TzZZ4Ab5llgE9rJubA2ppq5WywfOhGp7QHCze5r/nWOsr7v9V58/b7evv32Jf5O+HxNdg0IZ
-+T+orzyQlAjk0WvhG3wBXS01kLpBByqGZxrc8nvzMUOsrZOpZXS+2RjXyPo4PmA9lECs2xIG
-Wf+Jr265GbvSNDh6nWG2bYicbimKxhk+SBvQWb5M/I9OJAe1caHL4Tk+T/BUQdvAOJfwtXZ0
-9/W2T/Z1tZfyF3E0CWxyXgyecA8Mdy/8TRvvK0W/BBU+R3svKvNt4BXoigbJ8fIL42sl1jrd
-2Dkywjw0Zp7lbNwia1TCZ+uihIVWKeEfy5a4NPO2mBbG2KhqCrUCPNt0EzyWN4kMsIC9ZvPI
-E3Wj+irwMGT3/Bhskv8//0Tncd93+0z9lgd9R+xO/21H4+AiV0YoO/+Y+sCzkdgC89i6cB/x
-m87sWeIDnIxm4oBSSmlkvmGYHVHPdCHqsHlC7GdLi/ip1hp6HSom7LdUi//TvCz2krFb9H1l
-te0wbm6ZBc8auklO1JS7RVOaS/pp7tCGMPMVBH8pHB7IdNXU+eic77jd49tgP+dv5nAGjjrH
-hs64K6htC22kt0+l54JveWNtu5TN2sDJIBeF8RS5sxEb1lvGGj/ZnpgKo2MtzeNclhPxKdYy
-CZst++MXmnvFWU2zY+obYqJ+k20RJdFeUwTgsiISYDyL5PWIRZurxgS/hyp5BwTX5UcH7jsb
-+Ss4qvl32e/4c+0PAg5HudA617Pwp/xN2iHPOPrW35w3CBuk1+QwGCMqIQ7346lKuvLBNMtQ
-OeKGcUYUN7WONVmqxy+0FE9oY4lMmGBOjv/ZNDN2taFj9AV5he0Gamy5CY4bHosPyMleixL0
-PpmqXQvlhF/4JoQSC4sG81yJgQeOy/6ndmPgkv1hYIQjP/jCOSD8zm3ThhXeJ6N9S9ilYF1R
-R/smfWQD4XBwF+XiUvIfxvnKTss9g9cmjEpMOXPvOGY+FV/UYkhYbh4VP9mUHGczVo7poZyO
-nIX3W9fBBqbD0jr5JT8A4tk+NpHsVl3q4cCM8BfPT6G/8oOBB856gQ6OyoHv9sOBeo5/gp2c
-T0MJ7i7q8AKmNfQepcMC3fndcFD8QeeD18IFG6IGeLOyTf5mKlCKR1Q2dowaa4qJXWjOjjNZ
-jsTfN8+Jd5gWxf1rLIhJMNyNaicbbJPQO/Na0MtwXqxDIbZXdKFHyBPtbKib+sGHwjUL/9M5
-9FagpHNYoKbj30AlR9tgjqNnqLXrVrhrfl/NUWimWb7zLC7UUYzVvkr5rDXsDLagvTgHfzdU
-UuItIw3NbfuNbaJfmv6N3WUOxJ0yt4iPMt+O8xtXxy42PIz+JA+KjMLTrbVgLVN/ab+8kz8D
-guaw6SSoxmpRwUfhDt5NIV/+rOAgV0Yg6MgJLHH0D2Y5fgt5nJPDB9xMzS/YSA57a7GTgbf8
-S7inVJneAfOFCf0HG2G3PFdONJ1SGlnfGYZFSqaKMZLZGjfA/CUOm5/GJZhw3FPDjpgGyrao
-Bdhg+w/aLAXSA0M58RtezlZIMfQFPaFZ1VFqx0Db8BNP7dDT/OHB665qwUvOFcF/nC1Dia6+
-4ebuR2p8QW8y2JNPE/2zuDcohEftDyDbBmXpIopBX3FlRVI6m+INc6xljcsja+h78k2f0Zum
-m7HCODX2lWFjTF+lRPRpHBcZhkusdcFR02zxt5LJqqJx9L4oQ+pSTV0ZLgx/9GuhPz3FQmvy
-LwQvu/KCr51LQqed08KNXdfUWe7fSceCF/SApytv4n8hYkKVgE37Cyaysai2NBavReNlxTBE
-GWvuangW0U5ngh9N92Jame7GXjT6Yo8bJsV2V4bFPMB3olLRGttEQCzvRJzpD+6V8+lReJk0
-Ev/TVpNT6s7Qy/BBHw2VKOwXmuPuEMp23grVcK4Md3L+q1Zwmck593L6qsDAu3ini6jAWwmG
-bTCexKIanKBVIBMnytfkjcb1itE60dA4sqvxdvQTY/XYecbbsYcMO2KnKbkxVnlr9Dh0KfId
-+DOipXTMfJdfNAxjW/BvtB+oTbysi/aLtkytHnwSHu0tHu5a8C5UxR0TVlzHw8ecm9RY13Pt
-R3dD+jz/FGOF6WKsb6pUKngSJKqXYQpdhxqLfviInj5LK5/lNaadiss6wfAuMs34MjrJ+DZm
-rKFo7HDlcUya7I7eisZFWeEo2z8StBYVzUyPWRflCG2ELpAIKU9bQitop8NL1Ff+zPAgz7Dw
-4/wR4VLu7+EBrr3qYNdxLcEt0775o9ivhY/5QG8J6Y2/J1gb+gtO1hqhcUygg9IZbMQ95f4G
-pFwyX1PyIqYa+kWdN3yL1lkppruyO6aEnB5zFsnRlWGXyCtSpYje4ow5hocMKsVyFC0Ercge
-vldTtSgtKbRI/cunqIMKP4Zb5pdW090P1Xuu01pJt52k57dm/xYc4js9qsjwVQaDg7/B0moy
-Uskt5OcDcUmo4f76nuw0JikfLTeUE7YKhp1RXuVwdAXFGlNEfhP9CEVH94QXIj3S14g9Ypdl
-IE8z/cG6KUPpKHSU9JeiCGbztVaqVVsZWKP+7m2gPivorTbK/6ZucP9PO+S+SHrlm9m2gkG8
-q+eYGOKzSycDKqgZ/gA/aYvQGpaEp0t78XyULq9QNsp7TKWVDdYjynfbeaVRVBnFo98Na3QE
-3hZ1Au6ObA2K2bBU2fqSB0wX2GTDa3obp1MK5hHOw9omMlsLh+K1v/3H1NuebeqbAlW9k79P
-m5G/lrzKv0HPFyTwJE938dG7SvrsPwzSQmvhUrU5UuhTtI83x+PBWdwdJ8sdDCvkjuZYJWDt
-rtyyWZSnkS3lBlENcMkoAedFHgK9bP2km9aa4q25OD9krMpqKNPpbpRB/FJ34mCZ2mRtvqYG
-S2vZvkJ1qedHDRWe0loXLCaNCzbShwWf2ZvCUqKtt4uU4p8I0oL9YddwCjqubUYpjKFjohse
-DvfhFjLHjYwj5DTLI7ljxBX5mq2svCTyd3w1shQaGpkDVtv2SfUiZohllqF8o2k06284RoM4
-gU6Da8kD8QP5l97VaqszNRqoq7X0NdW6eM5olQrHkNsFQ6ivYC07XPiZf/BESYN8P4EqgSKw
-bugDnKj2QzfIf+hnHoUvS13xRLQTd1UEbmQaKD+x/C1vjvhFPmcbhetEjkLlIxvALTYTWB7x
-WcRYn/BW5pesvdHAEpVR9D/kI3+Av8lEXo1UIZqWGbqqFfr/1XZ687REzxzSvrA7rVLYS9ew
-RJ/LsyLsvS3t9J8Di4KT4b6wgjK0Qegndgr9LSiKhb/h+/gfvNPgw+3Mv8mjrT/K7yJW4722
-M+itbTucbRsFTkc0lCZYy4tP5go80tSGWQwH6Xtchm6E10mqNJqUZdVJWDWT/GCW1tsPyWzv
-bDLA04SGC6uwkp7f+UvPeJHlXSQ1908A3kAN+Cx0H75VKyIHmYRM/CJqLYXQI1gLT5fX4l+N
-brzWbJDbWo/gYRF+VBARhl8jnoIeEVul0dbxorhlEF9tGseeGc7St3J5ehNdJ6vAaKLyGoSQ
-ROIKE61UUGh+X28y1RtLL3gI3eThDHiLi+fe+pLqqwpGBmSYHNoPA+GiyKWNQbn0GNK4A7UA
-P+DPaAheqVzERU2FuJLlHt5prYwnRrRBxyIqwwERqnTGekfsthzm9cyn2H5jDn2vdKKfcB65
-BzeS0dKf5BBrqKfgX8mN0C/k98AwMsaHaUfvR5rlecSs3td8n9crtvhcUpb/MhgRHARLhO1Q
-1lqgfLIMvWZ3UYEAuAtsiP14OV5jeIJzTM/xfkt//Ni6EXWN+Bu2iWgP3ltjJGTN5S/N39hg
-E2D3Db2pX3YTFW0nz8AI0lK0IWNpM7JUbUa+BYeSK/4s0sS3n870Lmc9vPP5ee9GMdq3S5rm
-nwJeBMrCLqFT0KIWR5+1EWg/3YX+5h/QbSkRt0A9cK68CfcxnsaDzRPwW8sDdNz6GhZaD4Oj
-1pGSVd/RaEsJ/sJUmw0wLqJ3lUiq4WsEoVXknjSZVOITyCAyhxwNbyYdgj6y3L+NjvJNYKq3
-J4/2dRbLfd2lHv6aYHrABd4EZ8DOYR9UtNboEpmPxrKzaJzIRy9BWdwP98K5yiRcwtQTvze/
-QyGLBmdZv4Hx1gMSs4wXlSxdeVHzUPbZeJyOMVSgn+RvJBGfIelwF3kqtpPy7BgZr90huSFB
-Xgbm0+7+xmy+L5039UEx2acK5M+Ucvy7QWKwHhwdugrVcBm0V69FE7oTJfCP6A8pDj+ETXAn
-uTc+b+iCT5sgTrY0RHZLHVjCGgUyLd9FK8s1PsJ8g3UyhWiM8U/6PwXTRPkFaad/TVNwlrzj
-d8gv9BtZpCL6a6iPni0Bq+9/xM749vGDvpWC++ZIR/3twcUAB1pwBfwzbECa7hdryDZUg71F
-1UQEXguq4kTcEC9SfsUnjWHUwdwTdbQMhTcsrcB+S0mpnEUWg8wqG2Aqyqoap1C7YqPT5Q/k
-G7pHYuBjUiByyBRmo9laNTotPJUuDAJWInCd9fNv4uX9U0VP/wjpq7+DrsEMPwS3w6RwMpqv
-TkaYnEBT6DtUmmuonmTF26ERK3IuamI4htJNlVBXcwcozI1AuuUH6YVZFnV1DX+ZEtlg4zj6
-u8FA45V35Bx+SX7SN74niKXl9UR9lS6mLbW7tFi4EhsffMd6BPbw9/5x4o6/tWQJVAQHAtlg
-S3AYvBJ6B4H6CxqqDUSPyGzUiG1E8eIAagj2odVoCXou6/xsUFATUzf4o3kImGXuJQ0ytxHc
-1I531X1ilvElXWgYSmcq1WlnuQrV0B90BJxEl0gHaWv+nTpJPNutdmX/hZ6xPsEpfG2gsmgS
-KBQdAjek84GZYFIQw8mhkXBd+D58o9pQcVIdjaIdEGcjkVPMQIlwHGqOW6MeSjKyGHfD4qZ3
-4LwpW3pv+ip2mr7wMiYvm26syf5nuEwfKqPpB7kTPYu70X5oDH0A1tJn4iJdybJpTRLDiqtD
-2PQQYX2Dh/nDwECxMVBBuhaQQJPgfpASKgcTwrtgeVVCfbQmaB0Zg1Q9b53n/0MPpP2Iwdmo
-jNwUpRqy4TxjJdjb1BTcMNWXrpiqiuGmuvyTcQQrZvxI/zDMoKN1zxqu6yiPh9DLcDn1Smfo
-U55DJ9Ik9ovWhzUIf2cvgyt5KNBC/BOIlv4O2CVH4CDYF6wFd+hecTwchb6pnVBRMgtNomtR
-Ct+BYqTVqB7sh0bhVDRbuQmLG8vD0qbu4IhpqHTVNFxMMk3mTuNuVt4IWUfDZjpJ+ZMukLvQ
-XnggNaFFdCo4TdeLHDqcpbGfSUdWVr3I1oU68OVBIMzBi8IRWCT9HOwMHgY5OB9aAK+H8+E7
-tQ4S2kRUTdewi+1F3cRO1AFMQv1QRTRI/gBLGPrA1sZ/gcN4R4o0vRLPjN95a6PCtxk6srfK
-exqtLKSt5D/pANyHtkZjaSTcSBdJN+lBHqQraBm2SBvH3oVDbFdoE/cFW4hjQZt0J5gtVQsd
-BGqoGbSH78FPahn0QZuAsslelMAuoqX8Omom7UYVYQ9UFHPol5fDroY8UNaYAGYay0v9jTWF
-aujI+xhWscMKYmF5J20rD6BbcRd6BQ2iF+DfdDq4SHNEPg2x4sxJerEU7R47Fu7Jb4eA6Bg6
-K+qFZkizQ81ATDgIMsNz4HXVBXfoM7FYvyFL6Wl0gz1ETcRVJIPZ6Av8AZ3Dx2ErJR32MPQB
-uYYFEjVsF6cMl3gFg4ctUzqzLNlOm8s76Hk8j1rwUloF7aIV4C36WbLTEiKalWA19Qs/h21V
-GZsYXsefhxqIjSEuzoceSKXCK8HX8K/wnHoaLtHSUXcyXe/HJVSLfUazeAaySEfRDdAG/Y0+
-wNpyBzhLOQAaGd5LqwxEjDckiEhDXT5PWcpcsoX1ko/T73g67YnH0xNoNv0It9Hb4AZtIbno
-IJ7C+tPubJP2iFVU/+QNw1bxJHRXXAmtlESoL1geToYd1H0wRYtFL7TxaCW5gYZTF5rLQugb
-f4omS+NQJUhgARoHh8ivwTAlBlClppRu6CLcykS+TDmmZ6sUtl8+QxvLE2gO7keH4dH0DlpJ
-8+B/9AjwUiLKMsoGs2h6n03QOvKGqp8vDO8RNcLdpEbhNLAx/AFUUUfDXPULXKTV1PdjBXpO
-7qPzNBtlsneorViBXFIRtA+uh80wgCvktmCwMlt6qewRn5WrfL/iYK2UJswpv6Gr5GW0vjyM
-ftFr0Rmv0y/RHboVCloS1GENxQzWgL1kk0k7btJyuKwuFuPCv0pNw7nSkPBu8CZcH05XT8B0
-DaPDWiv0hz4XqfSUnvnOoal8DkJSMjoFNsKByAhf47/AV/moNFv5Ls4rVrFTqcU7KSuYX05k
-G+THtJm8l6p4N12Or1KCHLQySmMG2JX9KW1hI3gG+5s24X7tHr+kdhaucK5YHJ4hTQ3/AE6F
-L4Jq6i/wpToPdtPuwy+aVe9JYzSNDkD7WCcUISxot7QLtoQl4RO0HRAspDtyU6mcMkvUUE5x
-ReHstDyF9ZZ/ZEmyl2bgz3QvttPfsYVdQ1VYHuzP1oFN7Ll4ztwsgdeh0/lHLcxfqpNFZVUT
-3vAyiYTLgnbqMfBdTYR/aSN1DTfhKJ2Vq9G2qCobjEbwxui98MGhYBn0wXhYBy8BP8tfpYty
-Cckp9xFv5F18q2zgneXNuobOLB+XY09wKtuOS7DmuBY7iTqyg3ACKwa2shbiAZun6+BkPr+p
-IfFFnSt6qYpUSd0qtVUrgcvqEVBPi4GHtHGwCHkLr5Bf0HLaV+ezHugp/wE1kG7D+6ATLI/e
-gib4NyDwUqmPfFuMkQVvJ3fiReTXLBfPYNdwY3ZMf/92XJLppMCsuB1rgQYxBc5hXaQDbDnP
-ZUHagu8jt/gurYkIqw/EQbWntEsNSDnqTNBbKwD3tY6wFLmop6Mk1Ih2QbFsIErldVF/4YDv
-pemwGURwDpoKBuCXUgGOlcrIrUQxeQtXcSS/j4+wXXgkW4Gbs+W4AZuJO7KmeCi7j6ay13AV
-GwiOsSPiCzPxX/i/dDOfQ6LFEW2xqKDJkqoukxQtFnTWloDTmhMwrRnsQg7AN0SDM2lx1J3F
-oyn8PXwvpsMWIApuglvBLmQDbXE/6Sg+IG7gID+I+/H5OMD64ROsPV7MeuKp7C+8nHXGh1gk
-vsgGoYesDsxk+yXAVV6ZT2dzeG2azWuS38US7V9RVrNJVm2OVFULSX9rfcBr7TL4QU+Ka8hc
-+DN9DN00F+axl7Cc2AS3SM0gB/mgPJoFFFwgLcdNpNt4s7iKodiOl/LJuAbviTHvjHNYf5yh
-aypkNbBfr4VHn08fWwlU5hNG/hevxpPYEh4mOTyd1BIbtHWiiwalLto06R+tUHqjdQcJ5DYY
-S6rDANkKt9APcBizwxn8EXwslsPioD7sDHNAEzQCZKGnUi1cQmqGF4gKmHArXs0L0e88B8Xy
-IFKZDRP9EewT8rO2KIu1hR+ZR/rMpgqVVeB1uY1t4kWpm08h9UQS2SE8mlWCZKZUjbilv0h3
-cEgniCj6u34J98J67BlM4S9gfXECLpCmwYugOvwPvgNjUUfwDZ2WZH02QmieeI+s4go6xY+i
-0fw0asCfo7I8DxXh75FFdxsPuwbf6rt6g/0kXWWP+Te2iZXlS/V9vaDPaEWSIDK1meKx5hFO
-bZCUSj5JbUkfsJs4QBodCM/S83Ay+wIX8y/wtbgJS4LNei26wjrIBZ6iLiABn5DScIKk4FUi
-F/0gHqAbOlFO4rdRc56FynAvkvl99J01RddYV7iHRYM17JTYxybo3tWFVeED6Xx+lrzlTUkN
-EUEOCgspLlUhG6WhJA6cJltAWVoEXqNz4Fh2Gfbk+oSLR/CLdEx3iznQjMrDfegg8CELCKHh
-0kv0TuxBPcQoFOBN0TZeBfXiTVAN3kuvRQcEuIJyWS/4iHUGJ1iSdJi5+TOWw2I4p515M7qJ
-PyJ2vkCf01HkpFhGfpBuk5WSQhUwgC4CmZSBcawdLM4XwgSxG9aUdsOuYIXun/2gExphfTQP
-tEeF0q+ov2RBOSILThf3YFFxA77gGXAXL4bm87ZoAG+D6nMGU3lT6GXVwSMWK91mZmHXnSud
-N2Dt+Va6kpeh3/gHUl+cI/vFVRIjvSPzJZlC0JHOA5eoW79AtSBl4yAQ62ER3cNLg7UwAHrA
-KdAFrsJ+4JnuIs9gJ+kp/Cyew3HiK4wVBvSAd0I7+V49FdxHXflB9AsvgRReWZ9PJl1jj8VD
-do772QVWjGfQP/hvdAm/ST7yMfq+dCZ7xACSIC0h66XnpBioTfeAK9QKR7HecBDfCheJK/CA
-dAvuAgdha306TsJX4DNsBpzwlhSAv0th+FZQXUeUPh9tUAHfj17qs3FCn9G5fBNqxz/BH/kV
-fVdnSxnsT70Wf3LE57Ci/CltyZvT1TxP78s50kJcIpfFO1JbstBrUh9aH9zVU0EbBmEcbwSj
-xHBYTJoMi4Fh+qbWgL3he7AaDgDbYIFeobn6U1zaoW/zAThfvINtRTVUVaxGP4qbCIvj6C2v
-hXbzdnAY17+OU1GUSyKVF+HFeDdWkd+kPXlHupMb9L3NJ81EmJwVMbSc1ILulDZTG2B0DFjL
-7oCR3KR/ZTU4S2oFB4Mm0ACjYDd4DoyDncBUSKSZcL/+dJbmQ5P0L3z0//+KOgQtF5fRCH2H
-6+rpGYggvMQzwCh+TKrI9wgbP80B/6Cnnp+ZjR+iDXhjOosr9BoPkiShkfkiieaLjrSTtI1e
-kQysODjFpoLN/CbYLBhYIRWDbUEKvAXygAfsBQT0AQyk689nCcLtUhrsJ/0Ff5WcMFYag0Li
-GXokstFSsUqn3TvwIz8MFvAtUj1+QMTxa1xlQZbPujPA39PyfAztxWvRjbwkdfHStLVoTk+I
-WTRBukVnS7WYSwqwNuAz3wUeiyywWzLB6vpb54NnYA/YDE6B/uAG+Bm8BQGJgRt6tdZI7+F4
-aba+Ozb8u9QTx0gt8F09QQ8X1yEWO8EOvlFqy7eIRH6Y57FcPXs1YRnsPOWsM/2RF6d9OKIn
-OKBWUZSO1On2q9hIh0glmZAK2ALwlrvBFdEQzpEmQCMYD3uADnANKAdv6pr84C4oD9eCWXAg
-kFF1cBpFgx7YKT3CB6RsXF9ahq+LY6iimANX8m6As4bSWlZJNGGNuZUtYIx+p5GsJ63EzHQ0
-e0+es+ukDn9IznCX7iPFqVP8TTdKNVkjkMI/gQgxEPrFG3hcSkBVQSJaBYLwDbjz/17WAZaD
-m+ELANAEsBoVAZXxE+kEHq1r8ItTeKCQ8ROeC0voPZnGFkomNlS8okP5GbqNnaRh+oWOoj+y
-KDqVfSMF7D6ZomtQRC7ZKeJoG6kfNYJ8egVcYX3hEe6B28RoNFq6g+LBA7QYzEcfQAoqCnfo
-OxMHN8IFIEOf1Y5ojpSFiktj8TPxGI8WL7HgQ/FCvgRJfIB+HX8DYfqjdJ/Gif/oz/ySzo0f
-6G2axmrTIew7eciOk2Z8A3nE15JO4iApFG/JVulX2gq8owFwji2Hh3gCWi0WoV7SZcSlPWgy
-6IIygA82hbPgFghhPpwHuiEz+Ip2SaNxS8mBw3oG2iA8uIRogXfxBsjME+Ek5pZS2T0RpJf5
-R/qePaPxzEGH0mSd27qy3eQMm05K85FkO59OSog95KbIIxOkYbQcqMY+gpJ8OozRXSlfzEEH
-pUOoGvgb7devfAK06146Bz6DNlgZrQcH0U+gIn4mncYzpAg9m8bJl8QhXFc8Qvv4YYj5HDCb
-dZcqswaC6c75hM5g1+lN+pqWpoReJXXYYrKZ/UUw70dm8Bn63p4mL/S+bJIu0l5gPYuF0/k5
-2Es0RhWlbeijzms9wEL0HNRGTeFHeAyOgmmIgPVoCUjEZcEu/FZKkudJreR0qai8Q0zFRjEB
-9ePN4W2WDDoyjzCzLH6HMraZVmSb6DR6lvpIDt1NfmXjyBrWkwhdy2K9N3XFZ2KQutHnUgJb
-DfJZA3iLf4brRXfURtqEPkjrUCswCN0CP6Ba8KWuYzIsh+LgUXQB1MSjwB1cGpSXn0kN5K5S
-Dv5PJOMIYUKdeDa4wG5KLdgx4aLn+Wb6iY2lcWwSHUHXUpXco8dIqt6TWbqGEJtBNuo5ubvI
-JyWlybRAqs6OARPvAT/zQrhXdNM5fqGetuaizqAP+gp+QoNgHiyEa+B0VB1asQPsx3tBRbkD
-mCp/l/7U2eURXio+oav8BmRsExjMxkkqHSQ20Am8Fd3IqtJ3tCltTkdTO7lA9ezNxpNFbDRJ
-5vPJS76fbNH9dLD0N60MGjIXMPDV8JnOBfPFNJQkbdancBWqCMag66AR6gK5rmMfXIy6wnI4
-ET7Bj0FzeQCYLL+Qqsop0hzcXCxDo/hMeIoNACVZe+kw7S4a0IlcovuYnzBqofNpPVqKrqEf
-iEZPkinsgD6n+4ib3yDnRTJdIe2mf4IWrCQ08XfwHv8TjRJHdG68i7ZKN1EdcALlgmVoA2yJ
-GiEOPeg83I9HwuayAZ6Qx4Kz8impnvxWjMI5fBxieuapw+qAnbS0lETLiJOkLl9ERrDl5CE9
-S9pSmWaQMXQV8dJhZAfrRMbylqSlGEd+0XNHKhhIKYhhD+A7Nhlt4HbUUKThXPEzXiuVwi1B
-JDbAz+gKXIFGouqoDP4MP+JRcJD8CuyRzWCU/IP0FhcXEKdyCyrPMBxBiZ4gJKkbKSKKkfa8
-NNnHOpB0tovspQm0Kt1F88nv7Jbekx1E6N5hF9fJR6kYvQ320s2wLeuFIvRE+R9vgPuLntgs
-9cDnpKZ4OEjCJXSKfQfHozUoFrXD/0INJ8O/5N5gkjxFSpWniQl4FN+FhrKzcAm9Bd6TF1In
-ki8UUlRQ7S/+o+7cA0gL3Tlv0ra0PXVTIz3B7pHNfBVZKhbq+fwMGQOiaRudDdJQK/YEGXhj
-fEEnkL/EXJwkTcSPpc54sa6jHryOQrAPuoiCcCKeDCPlJ6C37JWayX7xDmfy8vgh64Pu0nnQ
-T7aDbuSiVKjZxV2tvMjQFvAfiItNJa0ZI2foFlqbtmUvyU98hO4ZZYhFKk4gaEec4Cy5CTvT
-xSiZFcWZbBw+wVfjaWI9biDNxzbQEb/TaWkL3I8G6tNRGb+CdtxIr8UssFJeIbWT54hbeBA3
-4rasBupNO8GDZBAoRxZL37Wb4p0WISAZzJuQu7qDl2R16Q76Vu/LSvaAjODDSU/RjHSQ+pKW
-4CCpAstRC8qit9Bx1hDP16mws9il12Iffq+T2nbQCXeCBmxAh9AN1ACNxldgABthVfkHkCYn
-Sccx5Wb8XmekB3Qp9JDDoCt5Krm1GOmiNljc0+7woFaBNyDr2SViYX/Q3bRA35jLej2O8uXk
-mFhMLkinyRUQS4/DE3Q5Gstq4Xp8N7aJV/ihcOMp+sUoC27gR2Am7gvLYA1eQWtRTZSAV8AR
-+CSYh49IbfBy8RH15S1RNXYOVqRmOJy0AJ+1XdIsLVoarC0QczXBz2jjeDzJ0K/JEFaPQibo
-CupnxaksXDqruEgTEE97w6n0TxTF6uPL7DMeyyvLKaKvfFBMkGtIveR7UhG5BbiGX4IWeBi8
-hCRkQ7PQr/At+hkEEJReoFt8PprNyqPW9AbsTCrB3do2kKb9AN6ph6UMtYqUoB0Xw7VYEdQm
-6ZtRyPrS3qwdu0RH8Jp0h+6fX6THpAjMI81Rc9oFv6I/yRPYfjmV58hHuEGpIbj8WFyR+0hd
-5KD0Ev+rX7Pe+q5Y0Rq4Gy0CJtxJKo8NIkpn+NeoI52LKhIJ9dL+hI/UF2C82g6MVB9JB9S6
-kqKtF2u1b7y1nnJ+0LNHAsumlXkNOkTcIv+T5pEAmE4qoQekLe5O68pm9lp+zNKVBbyRUlY0
-Vh4IkzJQ2isTKV3eBcbhDvCY7l6v4Rqk5x49b9XAfcUvGOg8vZ1uQd1JCaT3AD5Qs8BgtQto
-qj6WxqoNpOfqPtFN8/NIPWFkkmPsOTWz76w7tYjnpJG0kCwCI8g9qFcJlaBe/JEelg8xmzKJ
-11PKiI7KLVFZ6Si9l9/qF6O/3hM9NKKt8EdUDpWF25Gs8/01QdFAnU8AO4YOkQFoheaBj9UB
-sJP6GaSqPUB59Y00V/1dgtoOcVBz8fG6ju70IOvHwnQZb08f63c1GWwhg+E6shd9IzfwaPo/
-uRRroOSwtcoafl8pLZ4qB8QKJUVKUTZIk+WfwCF8G/yHeuvkZIfTdY4sKW1A5/g5VIedRw/J
-LrRQ64vWqIWQhMfBI2EC9odnA2dYk4aofaVo7YTI1uf0A+nAXXSrzm8f6RhRiz6SnpKycBeZ
-gS6REzhR1/Av7ai0ZkcUD3ujzOJvFYPYrqzQ65EkrdIvxmXcCzxDNv3Wn4PHQVM0QrqKioui
-+Alrj0fRnrgEqY9LaG40Xx2FyqsuGK2OgXVUJ/hXbQGqaqulHO29uEl+FFd1WnrM5rIwP0vr
-SpF0DlhFzsKu5AuaQtz4I7ks96VVFD+doCxim5VI/reyjNdREsQN+YJIk/tJLbECeqIjoK3O
-1qXAG5gj2qN1/BKqzjD+Skrj01oMzlRvo+FqT1RJLYA/qTPhYJWCb2o/MEM7K9XRnbKUfm9/
-ZUt4T36A7RRZNCS1pq2gg6xET8hJjOk+eRRtqWTSTUo7dka5yk4o5fhkZR3ncrToIO8U83F1
-aT16Jy2GM0FPkAyTpJN6OvoD9WH3kIuk4DVaHbxZ/QHHqI/Rm3Af9CBcAIE6Ds5WX4JSWgLI
-1PpKD8gZ8Z16uY1H86aiDlsqraefQAlaAX0ng/U6jJCTaSVlAt2u3KaXlRR2WZnJdigfWC2l
-Ht8g3+Of9dRvxJGSDT2SVLAIPJKq6aTthBX1O/aIVsVjyCLcQVuJd6s9cU/VhLupe9BCtTjK
-UYfBQdp84NXWSKvIZlGbLuS5dCg7ytrRebw+6SAGaE2lx2of0FftDGupsWiGegBxNRJv0rrh
-TmQLLklP43i2DdfnE/BaUQuHpc9oCByK7qKvuodXgETuCL4pTaRVBqtwGT6yj4Y82tfwG12l
-XCD/yM3IAhxBhqBYkg6rksfSaD1ZPSMTeBPakb3Tr+tW1lv/NVvrK96o06QR6inQWH0I/1S3
-of+pyThK64M3aptwbXIBh8lunE//wmV4Ol4mziIjqI6WwzOQofKwqbwYjFJOSKMMe0SccSxv
-ZOzPFONJ2sNQh3ZWHpK68hzyC55PVHiUbADfSU19Jgr4THqROek2Op5tIPH8qPaG56t3RHf1
-g2RW/cCkZsPa6ky0Un2KsGbQdVTAfUkTPIzWxjuYQIIfQpulQagJTEeP0RlYQa4M+ynzQDvD
-HKnQ0EhUNdq4xZjGRhgm0HFKgHSSV5LaekXTUAeSBWaRddIN0lpE0Sp8Nq3DbKwx/Zf1Ib35
-Lq298Kt/SWPULaCmehdWVteiripBF9WGuJo2BT/WNuLzZB8O0oW4P6+Mc8QT1B/0Q1+gH3bC
-U+Fy+SyYqOySfjUMFucMxbnTANkdvQ4/G86RmkpnUl5OI2ZMtByYTOxgHQGgAu0q2fU8KPNS
-Uhfxq/RE2iPtg2PBLf06WgwJeJXpoPzS8llpHfHEUNVWyjjdNtzwIiJKWWk9gJGlKKLGgWCh
-slpkoWOsCPhKavDftdbkdrhDuFGoWSAuuNz7IvCkcHqwQWHnUJ9Cc/hdYVb4vqdQjfT9SDb4
-t9N/gg350zCSfiYp8D3rhB9KI5TXaLUxxpBhHmLuE3EtQkRWjH4fzWIvRmtx2yItcXWtH6KR
-8YWtGEqyIF6o1FavQa//EJc9e7RLbi3Y1/nd985e1FPN/iC/t/2ry+b4xTnIleXo4inu/jE0
-t9BP5vhSpbnBB3p3ryl16WSTyrMsx8C1CCM+HblZuR49ztQmNsb6IO6zbVTCu2hz0rY4Q8rB
-xJGpnVO2JjdLyYp9k/DK0jn6JvxsPqSWxCM979kaR+Nwv+y1vhffXxRc/cpclb9WcDq/lnLc
-+H7Fvj0rYD+em+7o5NznGOBZ6I5Ua3qniKbBjrpv9Dc6aHXLAtE04iT4LdKEV0QVyFujLxhK
-xKaa+8QNsNaMX2kbnVA/+lTi99iiyeMSHCm9kz+m3Ex5nXAx6UwkikswFEbksYqG8oGN0kn3
-Te1m7vPAsMyLnvXf5uZ3+NrdNeFrEefZb1MdFTOXO9rkfHLMtocdZfOHunz+uMJNRPhuSkVD
-JeVa2iYjYsmW2mJqxBYwPvIDKoh6Jz+PGWjcHoctF+PLR8DE+5Gjko7E/JNcMb5aamLS4LSj
-KT+ndEwJxK5P+NcSF70UXjWPVBNxec9L1ssxLFw5O+xb9r1D4aivG93uL37n7q8RztnfHzo2
-ZdV3GvJ2OV85f3YN88zJjwyX9q5nVQMQvgrly9u0oK5joqWu+BixH9yOzEB7olsr12J/NnWL
-v2DZlVDbVi6pUfT05HJxb1OsiZPSyqVEpc1P/Sfx92Rv5NC4SMME2zcWMJQIDAHL3cPJwtyB
-wdTMHt4q38oV5H+R3D9+ve6c962U8+fM9s4DOe+c1R2Jrv356e6//Y8Kmmr3vRm8VUBGhvAG
-5a423KRvpfWN6GHrD3tEfcFHYnIMt+Pc5tSE8RFzEltEaUntYkuksPgzqWrSg7TVqetTfksd
-Gjcx0Wb9Gu2E8ywv1Cd4n2csdzoc4YvZnfwpGRcK076l5x/5Oto1/dtQ58yMFOey7BHOrLwz
-zoWuIq5anjPuecFWhb8Ql7eZ2BtIQpvC3ZT+5DdTMe6xFEhNbGvRyahpSsPY06Yy8fOspxJ+
-ixyS1CXmVnJ6fFLqw8T7aa9TdqY1SWuWRJLPRDnicg1vbGd4JSMILgV787eR63kbgn9mLffu
-/761YOS3Ze6l335yJWXofch66SS5RV2NnB1csQUW93zfsXwl7CssT2f6iPgtOAUlqgcVOzls
-esJHWE8AzbYcH4w+YTDEXTPfiJ+m12J6VIPkf2MPp0xLaJY2NrlHkUBqcuqc1Otx4xInWe9G
-r0RLLRs1N17h3ceDzmrqq5zL/uaZbT0dvr/Nv/Qtyr3ue7zrbmaW82hOtOujvaurpvuKK6Nw
-q9vh71qA1ZOeO7SSv6dUEHyDslSj4SktZXaL2Ihi6H1ka2V7zA6TN+6m9UvCtciLSS9iOqac
-i7+bOi6pTpFfUu+nNUxrlHQr+WzU/+JSjP+z/SRqG48F74BRBZnkkh2G/sku78vMqF74v++2
-/Kzv513TM4u4zDnU+aO9hquOa7zLVLDQVdLb0W0PdC/4V33oKc+G+z9J60Jd8X1tj4Ewh3kM
-yIp4hC9FWY0DYxtZ9sW3tx1N7KDPZpW42NRQwve0wmRepE3avdSXqQfiaeLciH4xx3CKlZOj
-clH/TLHHHaXdzrsV6Jjd3tsr83hBYYY5/25munt79mpXh7x5rubOC67Z7h6u0QWyq6+3rBsG
-hxQsUz956rNPfiNoEl6FV5AEI+WDLVPhEluGvD26malJ3GTrwYR9kWrSt5jClMz4jLRg0tt0
-c9qh9MZFOqdoKZ9ilIR489fIJNDLtCMcgDU8iI11/hQukdvEXyMr1hPKcOcnZB5x18t65ZqX
-M8y10r7apTrbuHq4Ozn7FgxwHvMWdfcOTiyoojXy1uOXAqmwlfpJ/kLHmWZLV6w2XCbqtqFt
-bHvL9/hlti5JH6JXpBjjB6aFE/unR6duKzq+SL8imWnFEknSBVuD2CPya+sz2kY575elpPyN
-Wqq9eXBy9knv2ExcmJ/ROf+fzObuPtkHXE3ytrkMzmWu+q7uznLueo4dBcCZ7IPub8F5BUby
-2ltFbAv+qrNBZUNb/slcEg6xqTKMeWeKje8acTPxQlSTlLi4WmmRiVJ6KPlV0a9pK4vmFolL
-HZw6OrZrwj/milFzwf9MWrguOuAZzDTnrvDJ3FN+b9Y2z73MJQWPMqvkB7N6uXvkyu5GDqP7
-jjPS9daZ4uCuv+2ZBQWOyb6i7pWh1MIwcfgqSu9D/fF7Mt/oE+2sTpQc9cmwLfYfy+4EKXJi
-8tSYV6kn4vcWWZn0T9EVqeeLPSwyOj2uyE9JZZOvRS6LPajUijjHriiHA1ulUgW9ic0BQz1y
-hvm6Z30tvJBZo6BeVtl8JWex+13ecDdyZroSnPccJZ3AXtc91r66sJZzpv+Om4e7eMax7oHz
-oKcap6xlFcwPgNn2UX4c/UCvRa8IkvgyalNK1bjVaWUTu6TLKaWKvUgrLHq3yOnU0an94y4m
-3LY4o97B9eaRWjvc2XeJn3VDrZ09FBiX89qblH2kMDerekFOdrX84nlH3Bsczd3xzsnORo4X
-eWnOyLzP7vb20Z4FzluBu/ljtQzvNx4Zao5akH8Ne8VOy0s0OzLDkBR7wFI2ITWSJi2N6Zp6
-Mr5ikXlJpYsOTR1QbGmRwemOtJ1J3ZNvRlWIK2osb1soPhiyQh5w2vOJnnZNDPvznvmP5fzg
-PZDduPBhNsmvlJueP81+3L3JMck1177XDvXr+slROg/kh+zCc9N1KXiwcDLx+CWppLoaT2Sf
-jGdBtvWBnBl1yTQormHEwsSdUYNSCmIPpX1IOJG+L/nfYm3SthSrVORkmpT6KH5LwuaIlGiG
-g+ZXNBPnBOaKuoUZ2klnfnB23jvfzpwtHk92ZOHsnFB+w7x2+R/tC90V7LHOE7m/5nXPm5VL
-HGfztuf7HdV83fLrhpd6Y9n94HtgJnOUjuKqeTAqtA0wfI9JsdRLmGjrmvwx2pNqjs8v8j0x
-o+jFFMMP99LMRWun/ZVsT3oenRA3zfSXrSQYZjyivoGTfQH2V/4ldbnjt6CWu8y3LWeDZ1JO
-tcJ1ub8VtLXPyh9j3+Dal9vWbsttnZuftyu3hquNfVlhUde/AVB4W2vuPyUWhVfjF9Ri8kr1
-Ipx4QPRjoxrXzBqbdCjyVUpU7Pe0hIQt6f6kysX2pH4vujUtM/VgSmr8zoQaEQujLfJzSxdW
-QTkVjAG1PCtplutC+Jp9e+Bhbh2fMXepZ15u+0JoH1PwzM7dHfOyHftzMnP75Kbmxjh+yit0
-D3Xc8D5354e8nlxaLngfjNCmKHv5efN2+NW2TDkWU9n8NX5hxIWk/ChDarG4u2lS4qL0zORF
-RVnqhiLbUxsk7U0qE109bqrJZ8sDf5kiyE+4YqCfGFJYlVx2XQmVdRT4T+a98o7Ma+vpZK9c
-2McR1meju+un3Dd5k3Iyc+rmlchd4nyT5y4470SBNQVJ2hMf4dbwK9SNdjCOlxZbh+A1UTWN
-IG6jJZSQa5ubXDlmQGrx+KgiInF/+pmUUem3U++nJKZsiBuf0Dfiv2ivPNzq5WUMN8K14d++
-R6x3AdCqul4HExx/+NPtY7297emeDg61oLSjwF2QO9sRlbMp90jOl5wudk9uY3cTR6L3gLtR
-6JynLs0LFAcltEz5D97EXBPOsMUqtWIWm3rHn7KWTApGtk6BsYHUV7pnXE5amf4tZU/a7pQN
-iVKSNwrFXTeViTwGsbkGjZJ3BGdIincG7Zcfo55yVgymOny+C/au3i6OFM//HGMKEuyDXZty
-cvOysk25e3Kb5gIntg8p+Oac6N9W8I960zeR09AfqDp9Y6ghlbKm49JRDwxzY7l5XMKvNk/S
-4OhbKX/E9U+rlJhTxJe8qUhsalzKtuRmcT0T/okwxuxUoiJMUqTxB60VKhEwiBhPB/LenRTe
-6BwSWODo79viyPFgZ9fCVMcl947cBMfd7Bq5nXJG5kD7vFziyrM/87R041APj4nuCTiksLpF
-LsmRuTisZjMrL6KnmT7E7bcuTXREbk/2x1RIvR9/Ke1E0pQij1MWpG5KuZ5QOmlt1IC476Yr
-kfXRDXMq+ypfDLUBDXyt2JaCp+pj1/1gtLOvf41jp/e1I80z2uHIH573jxPm/Jw3MHtgTrXc
-kznnHavyGhfMd073/1FwV53ne8XfhC6iIrS9sbx01FoBb4/KN3yKrW45nDDDBpKPRf8v5Z+4
-yLShiTWLRKZsT4tOjUreljwvdlJCUkS1mDFKh4giUj/jYG07WhpoJeZ7lpOW+X+EuXNl4Ltj
-mu+5I9tzygEK29jT3Bk52+ydsg25xXKG5WD7vtxy7h8c5byL3KtD/3hu0ReBSyBFG6vU4h/M
-1aDXFqcMiJlsahi/03ou8Unk4uSzMS9TRsSb0yonjU4rk9I+JTf5dPyqxJeRhbGDTYMiI9E6
-cw32RU4Jjwf3fMtZjcIK2iR3m9AFpxQo6WzjY469HoOjXMHX3LfOs9kH8wZkK7lTc3vnlnfW
-tL8tSHZVDNwtWKtl+DYJW7g7LkHvGi1SrvUbWhzV3zAndp45KuFwRJGki1ELkifEnkmpkHAt
-9WpSqdT/kt8kDk+6EjM7/q51cvQS5bV1vVTRWJdcRTuCZ8RJbzk6reBHNdW9LvjKudffwQl8
-UxzPC1fnXXBbc2o7/s7akTsm25MzMS8p74RrtuOe57W7VejF/3H0VeFtY13XRwyWZQhTU5gy
-T5mZmXnKjFNmbqc8ZWZmfsvM3CljkqZhJzHItlg6v77/Io9j32h77bUX3CSBtboenmZhUYR0
-mUtYL7KFP0owboEORCZyE2O6O9rENXLviS+IzE04FDMzcUvcnvghcf2iy8Z8dB6JOMc2cKzD
-d7OZZjEyUwkja8O1zS8BUU3xVpTTCgrDKfmVQnmeikK5vD6+Xdm/8+tkHs59lFGQ/SGrVs6q
-PC6voVfIPx887auqvAh2MvOl2piqZVEZsAd3FevubECdjRjFrrecIj/2rHNn/NgIMyEyukbS
-aqsLzIu7EFct9mFkj6g0fpDrEJ3GHUYH01WMJHy43BhUDn3Wd/l/KT8Lh0gVCiaHCz2bgn/k
-oYG92bcLn2bU88T93psj/fZm27OZ3LGekZ5bvruFK8I3A7T2NdwABJUOhGrEs9+RXfw6YoU7
-lX4fhXCbYos7DsVDV9HEfZHzkurHRBSJjmuZmBUbF/sqerN7UsRIrp6jBvmC/QtMJBO1Yeh0
-8Zk5QtinRfiy5ccF58Vm+e9CS/PmCKVyJvq6Z/rzM9Ov5K5Jt+W8zOibcz4nOe9ogZb/t3DN
-V19+EdxhpEmfUE37SuXBTdxhLNXppmZEVmKnxTSzf46r61yR4HFnJS6LQotkxsxJehM7Iv5g
-zLKoYORJR1XXIiaHW4n9S2PmCDxaOQquh/oYhn+uWtwbI9crqCD+7XGH4nJbBP7KUgpX/l7g
-kX+Fc5jfg3NaZC3NvZH3wVPdV9RbIcwLT1WXGAeKqa2JBLMS+x55zHcnbrsX03j0atv12NX8
-o/gOruaJPyL2Jw2OLlmkeGyfxGBMl1gxSnPfdWP2+zxJrWZ7IkPJ8vo6dJVUGo4PltEp/25l
-R+Fm6WT+8XDbvJjgyuywb2fG3IKi6S3y3v86nlMyA8uNz7mfl1DwT4EvUMZ/R4oPlTOS5eno
-n/pSigQduEPYISdGNYgswraOqWB/ERfp3Jdwzp2UVDGqc5GxMWlJ9WND8UxMp+hBkVecD5xv
-2escSeyjd8HT+EU1EWkgBozuQlWtqc8nSwWUtMxzPrQr53Rga2ZX76H0Tx7nrw65ZdNv5YzK
-TMtNza2U38Y7zVsy1E24qXQTi8Bxag98gNmZgYiNn0wUcW+gl0fNt82P7c+nxAPX3sRhERWL
-XI/KLtIr5q+k5JjDcWWiNkWy7u98S55kurCjsaFkLfMWOkmZAhPD6/TJgUR1jzdBxgpgWMqt
-F3yRFeHf/ftYgfPXirwHaXgu8XtK7q+stp4nnoqFs/w//PXEd6Gb2g85AfmltyG3g+62aLzQ
-0YF6GlGNTYoBdi3utKNkotOdntQpsl1yt2hXMh0zLPFHlBTTIWKj2+N4w1Xk3NRg+ihyF9+i
-D0dSpf7m/eADbaK1k22F26XJHns4MgcTnmVc9R751Sofpv6Xq6e1zo3ImJo3POd5/ukCwjdO
-eC5g8llxtnFMfYfONAkaQRF7Z6KfqzOdEFXSNiPWY6+WMN3ZJOmuOzJZi8SLro0+XWR4dNGE
-jZFto8+5Xjnr8zG2zewiIkA2AkuwFlpHcEOcaGQJNu28T5EHFuwQz+XuDRbLGu4/nl5Y4El9
-mzcltUPu0l+XcmtlzvOgeU0Lt3gf+puG/g29UKbLzeBAfSdOgRRmDnaLv0AWuPczp6NncVpc
-VceSxK2uzUW+R7Qqmh/VqujV6PdJJ6MOxzWNWBEZ65T5zVxbJkh/wiYR58xE9IuCwzXhvnpB
-oLg605sp7fE4w/eyUwKxGfO9F9Ji83+lPMg9mdold2368rwHWT/zZY/Dd9D/WKgv7hf/09aq
-7ZAO5jnyIxKw1SG2ObvQhyKr2vrGQvvYhH+cd5Meu18nS5G/is6OPpLcPLpJ4oTIXTEHXC3d
-vfhj3Gc2lupOfUDC2Gf9PmgsZxqtQ/O0C/6WyoeCw+LD3IXBUGYVf4P0GwX9Ux/kPUsZlXsk
-LTO3eMZVz7Oc+YU1C0X/I+FCqJ28UH5vNNUbYi/hSboe9tg+l6ztnsS0jm7BFcT5+AeJDV3F
-kydGcMVGR5Urlhz9rUhE1Pf49+7cqBzHJOd+LoWtzywnsomp4CR6TjsNJ0gJxpHgN/Web7A8
-L39g+K+ceGF0xkXv7bRB+ddSyuU1TX2e+98vI+9SZouCA3lDfaRPFsaETos/lFFqS2gY5/HR
-iIO9hXv4p1SLiN1s35ge9ifxNxxLkr66zORwxKBiw6OGF60R1SlpY4QWm+D6HVGcH8vnsTbm
-LJWPzcehOR6ZpN4w+4rD9W4CpWYWVpJG5QWDNbJ2+oumVylUU/p6SqZE5F1PXZOXn94mv1t2
-qHBDfueA5i8IjRG3yblaNYvhB2CIDKFNOTepOvPogVFHbZ3iqvCTEgc5SyUvcfcoNi3yYLGq
-UauSO0WmJAx217fcHXX/5I5wz5np1GVyCrobO2/cA72VlmbVcKZ2xf+HIuX7wlNy1gqJGfG+
-cmm/8vN/PsyrnzI8b1vaMk/njBMFxXL3+KYUMsE3wnqxqRyrPjTmG/2wu0CiU7Ci/C3yo/tv
-plqMg/sWP5J/l7TVOaPoe3dhsdGR7mJzI+sUaRBRJb6eq1vUBd7pzLB9YTHmLqETH4GIttLr
-AyCfNZYEU9RD3u3Sx7y4UJuszX7frzKF21PGetb9rJ7nSzmVJ/zqkV8lK7OwqSc5sNi3LfQu
-FCW3UFdp72CKuZCIQiH7BwEdgD4S+YC9H9vD7k487jCLAHeXYsUinxZzRsHk6ZFXEr+7R8Vu
-co6LSLW35ylbc4aiu+Df8CPwI9Jec8CPYjk9N/Bb/lbQP8zmfg6MyxjhbZvWI//Xz5F5aErl
-vFJpYzwHfu8vqJxz2FerICrYMbBR3CByKtSmGjuQe6A+VYgt4fLICa6bDBo9hPsV94gvlUS6
-Eoq2jvhY7Etkx2K5kblFLkR0SrjoehFd3PHD1YsLcVOYGLoP2QtrjGWYo8A4dYsxIzxBLeM3
-RcWzOMhlJ/n7p+cV3EgZ7RlnzbE6hfW0/PUxv2bmTK+ZezMAC8uE/wiulJfLOVqCWQN+x8aj
-E5mlxAF+BL01It7GxW6130n44qCTI93HijkiBxdPj/QUbRhpJB10g/j+zrZRZ+3jnKnsVlsG
-dZN8iXNoGjLVcMCpsq5JwhZ5XCEfLpO7JfBHRhPvpdQe+dzP1XnYzyl5VOpzz/B0d+GHrET/
-I8/KYIpPFuuEh6pv1afGLhCD/E12xf22flSSqxhrRp3hysZr/Mmkkq47RRtErC1+JLJ08UOR
-3uSxEYsTJ7pKxhbyvSMqcyv59sxZpjH5E2+JVQBTQS1tlnEnXFaN8p8V93n+DM7M+uw7+etO
-AZoywnPjx/q87z/7eNanNSuYmqF4i+U2FLjCPeG6gk++JjXSRxlzYDPsKCrR14mW/Gq6a0Sc
-7XfM1P//d/Px5CeuE8X2RMwp3iuyWrGLEdOLJLr3xxc4IqLH2Ae77rEnuBwqjTLxClgNtLfZ
-G5ryH3qH4HX5XGHzcL/ctECnjCPe9NRv+W1+VvI0+FnOk5C6OL91+v3CJVmX/DU9gWBJX1lp
-VmikGqUeMn7B5+AWkYG1sb0nlzhnMJOjcmzX4srzfZN6OtcXneReVTwlYmjxcMSEor/dNZN4
-Fxr3hB8Z2Y577jjMOGzvyHYkxGYjpZAaOjBniVvUE/4oyZ2/I/g+q7m/8FedwhopBZ7MHzGe
-1J8fPF3SjhTov5v7ZuSMFmoV7A53CjyUX4ghbYYeB3ugtdA4uhGxyA6p0+757OCYj1yXBNzx
-tEhF15pi9oglxX9GjCo2IOJ7EcFVIaHA8Tx6o72N22G7Yx9E88wBohWehpaCv+FiZZt+PFhZ
-+VV4Pzw2d5TQNaOd72vqjoLGP4Oeqj9TPaGUhAIivZG3SlZk4FteudAjbzkpKlRa3a0UMdpB
-O+AIFZ3GniYWOtx0nchubK3YcdzChNH8wCL9nElFL7t+Jqe4tCTUhSYsdNSI2WhPjphoszlK
-Mz/Yp+RqcjgeQL4gX3S/uUDK0MoK72TamqNjbrrgzWjq3/urlndp2tDC8b88hTt+D/f9yNoc
-eJNXKSQXPhdnCz2UDlKa1kbvby5B8sFpchI2y3aZiHB+ozpEBph3MR5bfnyOfU7SbceMIped
-25P+dU5O2OPoE1uMvxrZmQOu9mw1exLdgkknYoi1WD+QDuppYcMpolrIT8plC/4IX8hZIlzL
-qOUfnH7fWzN9s3fp7zm+wsxSgXa5A4JcwY1wjJ+VN4aGqu2Vy3pj0wEHYYuQ5vR/WBonEZ1d
-xenaUXXZNbENuNUJzfnFSW8dR5M6ORslfnc8ibvBr4ouZ2cjBtgmOgYxh2yNqT0URziwzahu
-vIbv5LB+LhihPvBWkxp51oTo7HLC69/t/HvT5/ka/P7sYzKhPyf7pTDZkxdq5sWluUIJxSm1
-175qM4yv4DF8TsShI9kW+Cd+Ihlw76PHRZ9nl8bd57jEwzyfdM3RPfGhY0g841gZ89ReNbIi
-9z9nX9Zt70/XZZqSIdyPRYNWCK3NMlnxqFYi8Ew+VOAWF+QeCqZkLg68/l3af/u36LNlXvMP
-zS4vbM9LCFUt/EN0BUrIvcLV1AylnX7UnG3Ow54DnoZofy6eWOhsRpWO7Me0i+lvKxrf156f
-8Jv3J0xyrI1PcNSILcdXjnrO5bmSbev4dgxjaUxZqiFxHH2OPjCiQZrcyyBDq9WJvldSy/z2
-4XE5WPDfzKqBLRmD/Y0yD/vR7NOBq7mdgkxBvfAeX3FpedCtPJditZZ6ecMLhsEZxFHkf8wj
-7Kc9lXjqkqjyUT6mUWyO7W78LUs7PvO+eIVPjBvOz4nubB8ZkWqr56zDitx0eiCzgqxAtMbH
-gQvIek0y74nl9Sihu/Ku8Kz4Ka9NqFd2JaF35kd/hcwt/k5ZdQPTclYLYz29Qs8K64ujAvHy
-+LBTvatE6W3N2uZvdD6oTZ1DB9ke4TMdaWSZiHR6ZPRrtl/cLa5aQlO+cUIKr8Tt59/HvLYj
-USs5r0tl3/CtmMm2v6lFVHciH/2ExpmJoKvSxdgXmqXWs9pG2YKO4Xa5RYMjsqYG2mS+8D/I
-LB3ol91IyMjNDmIF78IjfVekUsFDSmfpkHZTO2v0Bt/hN9yGRjBuvIHdRVZ1MfSByJ/M05jT
-tp7xf9lbJQzgt8RP5FNiP9sHRD/ghkd0sfVynmdq2v3UNkYiGhL7sXnABNe1FiYurdD+Eb7J
-o72jxOmeRiE0Z4zAZnUPfMpsF/BlxQl07pJgpqdrOMFbVdocYJUlYVV9oih6U5OHb9HaSBzV
-FKtiq0hUcRSlHrsVujDqGvsydja3Mj7FPid+IF8izs2r0XXsDSJFWxfXJHYM/5SuZysg21A3
-8CtoRVQzJsM2yhX9RohWl/sXS9sLGobTchsEy2TfDlTMqhK4nnU40CfnrfA5b14otWC4WMTf
-Sn4UrK5+l2rof+jNzB1gLAjiq1HAzMID3ADyoLMu/T3Cx7yL3merGlfNDuIT+dpxyfysmFn2
-iKj+XB93HrvT0Ym5y/1LNWYWE2E8HusNJoKb2iWjukRrAWG+TPjKiXXzY0KenD4Cmd018Dar
-R+B7dnXha+654I78NeHL3jlSrDBMMcNDtHLqGGO+uQxmoucQijqHBdiVxBl+KIW6Exkk6jp7
-M6Y/NzDuiL1HXDQfEXvX7ohO4TZHrLPJTpLtaOWAyrblZHWqNX4OvY5Emrq5Rmmi1w4fU+oE
-6ktTCiPDqXm1gw1zUgNNsycH7mRjQvPcZsEjHjO0qdAvXvX/lFuH3qpN5Tf6YP2teQL8Bj/w
-fPQJ/QRfwm0hBUcP2nTnMalWXywbC+xS7G9759hM+/3oFva9kaW5+u4z7DNHNEPZe1CzmdpE
-ReIOuhuQwKbXNfZJq9WpQVJe77sX/pj/Irg1t65wNXtEYHb2psDUnFVC7zwmJOdnhT3ez1JJ
-4aHyK3xT+6mcNzjzPOyH3rcyxiWsK7ua0OxDqRauBKZL5A02LmYo9yL2sv1XbAX+VUyaXY+i
-7I8i/mcb7SrBfuOn0gdtM8jVVAQO0WFIf3Od+UV5pq0Ll1dWBu6K9wr3hWp5vgu7cw4GdmX3
-CNhywoFFudWDzz05FhYfxa3+JzIbuq9mSff0kHbdbAkegkX4c/Rv+hxehVtL7nMMpG+5efZk
-1C1bOKaz/Ulsbb5cbD3+WPRO+5bI6VwHd5D97WjPQG4M1YxJJjLw+WhXcBK+1T7oK6Wy6oLg
-GemSb2w4vmBREMtDhUY5Ta0Z5gbo3BmCL08KLij4EO7hey7NEx4pxcRXGqG+M6qZP+BSVEBW
-kwrWhc0lUuyvqFjXeiYxsrHtVbSfG2rNMDZ2J98xpiI/PaqavUnEY5vPWYTtzHekRbYY+ZXc
-hA1DX4JMo9DYqlTXVoUvyRcCQ0S7t3fouOe4UCF3SaB2TvPAgZzcgDuvXLB7fnqI8H4Qff6X
-cs/Qa7WY/E2vqGeby/7v1vEYbCOdSFTkeGqJI5Pe4t7CTopqxh2IeWYfFruZfxYzgW8Tvcu6
-07Yc4T7BHnTk0Be4FNJLT8SP43eR+sBrZmgV9RfSYSU92EGq4v8zfLZgdPBYHiEEcvoGruYc
-DuzNPSNM9NQK/S6IF7f6YuSDQoRaWYzSMTXRLGeWBpOsnDOQrIejbHlynB2ndzivMesj+toq
-RqvcrZhyFifG84+if9ipqGtcgbuK7ZxzARPBH6SusaOIU2QG2g2tAQRjjvFQ8agvwitkWugu
-rvCOCTXNfy+k594LYLkbAuNyWwrv8rYEQUGn8F5vC2lmoKXyPNRCmyW3MMbqbeER0B25hvfE
-RtNNiVRbPFXc8ZOu7F7K6pGVuT9iztqzYibybWMa8h+i+tnfRSi2ra6ubJJjJR3JzSS70W68
-KD4deQNvm3u1eP2cdFYpDI6Spvn7hisX7g728DQV7ubuCWzOzQzMyssR6uePCu0rbCK28TeX
-mwVbq+fENvoAta3Z02wLxqIt0IpkRXw3oxNp3B1KcfzNfHGXsPWJ+sZ9i07g06LH8d+jsuyV
-I19x5d2dbEHHAaaj/RrFsrOJOqSKFkPbA9rcapRRI7Up4iPZJ+wWj/uuhBYXJAZLe1Chbt69
-wOq83sJrz/Lgx4Ji4c4+RkIEmxIdtmlrZcZop5OwK8CQhriCPqe+4k7bEbI2P56u4qrM/opA
-uGDUCfuF6FV8qei/+Y+Rx+xkxFBOcX5gt/EEc8r2iyxHj8cb4feQiiBo1tHb6PPlVCUvtEfa
-HtgQHu19GtyQ30Pw5G0MHM+7Fpjq2SGwBWqwvvdZ+Lr/izQ5GFAOiaxeSS1hkmYdoCGd0CNE
-RzxIlyFjuSBV2nGZwd3TbGsia9gTo2fyLaKf8JOi6vJSRJI93r3b5ne8s7A4TyWyDYih5Ea0
-L3obtjXD+kR1onpfLCp3DOJilL98SCnYIuz1zAscy2sRKMwLBKLzawX9Bf5Qax8pfQ80Ud6E
-Fmp15duGrOXDEHSiH7HSeE+KJbewd6g79n7MI2c2uz5iCvcw6o39RPQIvlu028o38fY5EVdt
-4104K/AoLdguEWPoKth0fAEYAO4bQ/QG2mEZyvFhQfwUKBk+7N0WfJnfX4jzvA3czysjzPRU
-C4r5/wtFe/eL6/zP5NZBTZ0nVjWi1L5QNCYiHmQutokYSOTRJhnBzaMTHHlMwNXRNjXyNAej
-NtprWHo1Kyqbc0TesVVyN2e9jrl0bfsIkmAT8H7kAWQaqptrzSn6e7Wa2kEqL2Oh3uJH/6PQ
-5cKxlj78I7T0TBbGe0oHZ+cPDtUvZMQlPlK2CXGqHKqq95dbmZzeFOTDauhBLB4nqCdELbY1
-1cp+i67gLMpmudfYHFEvOD2qi/15FGr/ZHlI4wiJreOaxjzgd1CfbDOI4XQJbDO+Cxy12PlQ
-P6exymZldfiY1EAIhoPeqSG2oF6wk+eIxY1CYZ3na1DOrxe2eW3SUj+rtA/S2r8iY5RUg6bf
-eAGuIsfRysQwfCrtJXbaJlPreR89yDWODUbk2TZFhbjCqHL2CVEXuDqRr21D3GtZzplNt7bn
-kC72PD6IbIguRA/Cg2ZxI1XNVDtKn2QtGBbv+9uFjxW+Dw7Kf2bhsFnY56kcPJDfIdS5MCP8
-r++NlGzpd2z4hjZNPmRw+gT4CDZGWmFubB15EX/ENCHfcT+oE47pzFB3Kdsmaycro+bYp0ZN
-s5+LTOOqW5kz1jWSXcQvolfZupPxdBDriQ9E1oJH5ge9r95YKa7+Drvlc0JNcYVvVeh9QVKw
-cX4/weNZIkzL7x08WXAitNw7Rvzu7yWvD7ZXb4qt9QpqGfODocO/kSzkMX4WQ+gOREVbiEzm
-99Me5wB2RkQxzhU1wT4j6ps9Nmq1nYt8wDVzz7GlOS4w0fa1VBbzJ9GIPIROQWV4xhxumCqr
-zZXS5AqhLFH2Fw9LheuC7/JHCoInUYjNPyYE8u8HpxT2Da/3tZRihKZKfLi9Nl9uYyToxeBn
-iCO9sHR0P7ka/8mUJvO4d9RNxxJmhKVPMyILuR5Rr+z1oj7a50Z2sGvuVtwD50U2ij9Hx9jG
-kocoL5aBtUVKgRPmHL2WLsq6cjAclKYKRcT+vqmhuwVksH1+I4HOHySsy68UvFawJLTJ28by
-suryrWApFZfi9fVqvtHavAizkVVINaIZNoROwyfaVpN1+VZ0quWb1SOgbWvkSPv3SK99fORD
-e7eIGPsE11ubyCtMTe4DFctMIFYRH9BfSDnQzNxl3FYbaX9J0UqZUKJkD3QJF/eeCkYVTBR6
-5NuF9fnzhUkFS4K41x6u788R04UPsh5+rv6tnNWjjFnmLdAbOPGaaEnreyWzx4gf3AxqoKMP
-c8/V37Yuoqq9SWQjPibyb75nBMe/dvH2ZY4htl9cKwaw+eQFshMeh21C/oHp1r311K/JiLo5
-nCbtFULhB76aof6FV4XEgt8BskAKHC24J/wujA699f0INxWeSMXCt5QR8kUtU1tnzILj4Bd0
-APKVqI5docP4WNtLMtV+ga7sPMs2dp/lZkaU549H3ObrRGzgi7rf2is6e3An7a3YIOulBKof
-sRHfj8YiWfCi0dKYrH5XB0rH5bmhC+KtQCBUxtc/2L+wmvCw4FeAKRwqpBQuDnbzJYfHBEwx
-HMyXC8RUtbx6X19nbDE9YA6QscHof2RZfCMTJhK4b9RE/gVz0Pnc1tO9xvKOJXyuextfz83y
-d51vuKV8Jhuy7aL/ZIqQMeR07CH6FEyAZc2a+nmtovK30l6cJK0Pngrn+KNCx7x3hKmFNqFt
-YV3hfmHR4Cvvv6Gl/gHiU6G1PDtcXV0uR+kPtF9GJDwHG6NrkbJEL0yiHMQ+9gdJ2W/SbRzH
-2Xauldxcd5b9f+6/+O7uJL6lq459gGOHzc/NZjqzxamR1A68Bq4hXjASXjby9IPqbvWmtEqW
-LSw6Cnz4o29HsKh3vbCmsJtwrzBbWOCNCGX5LoQLA6uk8aHRVi+rp01RJf2acdLUwd8AxRuj
-n0mIrWEeEyR3jGrB72IGO3fZVFd/+zZ3D366exL/2PXDXte5nBPtq9gxtgb0CfoOsYsoig1F
-V4CykLR4cUpLVFYpncSD0oFgIMwGJoSyvaWCLwunCacKdwolvVODf/o+hAr8q8RawWFyYbi2
-GpR1rax+yZgKp8G9aCdkOVECa0v78F/sB7KC/Qnd2XGPreU6znVxE/xS9zy+tLsib3OVsNsc
-/WybuGTGw5whDTIK/4jNRraCsDnOWK9PV4erJ6QZFha3xAFCtbDq+xDs730nvC9cJZBeV/C2
-t3oo2v8oHCOslXaF+irzpGhts/pUf2HMMw3QAUhYRfQOCfAxTArxxfaOwvnHTKTzmu24a4S9
-rbs7X8M9jJ/jumj/4qjDLbeXsbj5lqpEt7e6yD0UQ1uCL2am8UU7r9HKTaW7GJauBfuLdQKe
-UG3f2WBtr2bhEBU84v0dvOCrEJ4QeCE+Cy6W14kV1E3Ke+1/+jwjGzaGMloCeUkQ2Cw6BVfY
-V2Q5+3P6T8djVnWe5BQXxSe4l/K7XaX4bk6Ra8S7ba9sL+lyTA+yC/kSa451QOJAuokbW/U/
-1NXqWOm6/CEUJfUU9oSL+DuGznp7B5tZM6y3fH6Q71jooz9RDAkvpK3hycpy2a5t007rl8w+
-5j2kNNiK8+iflAc7yrwiPtmeUM/td5ndjlO2PGdre39Xcb6kK5Jv6axg38UvsY3k+jEKI5MD
-qLn4WpxF1yFn4ApztHFK+0sz5I3KDDEgOUKzxSeBsmHZx4VifJODLt/+4BZLSw/4r4cHCO2l
-8yGvPESaqTZVgV7R2GhEgPrwG2pDRhOp6DvqDE6zG0mEW0Cn2IeyMxyluUHOkfYNztf2Ms7O
-dsyBcdXtiSxny6au0OuJamRTbBrGI6tBgXnS8OmCWl4bJK9RfGHa8qrj4oTAuDDinxta4Kse
-OuI7Emrv3xreGfglbg12kx3iZeW1zGmHtEn6XNNjdELWQ4j1QBaScdhnWsAL2CzyA/eJ3slf
-Y/MdXblFzrr2ic569nOOvlwt/jHbgHtG4+wucj81GkeILmgy2haUgb3N9vomfYciqrw0XNkT
-KpQ6CRvEBf7+4bW+PaHhvm2hp77y4Qf+cuJsYYr0OvRYnitRag+1u1bNuKo7QVPzJ4qAacQb
-5CN1HAsyh4iPtsPUdvsuJsExwYY473PVnQ3sDx2vuIP8alsmd5d5wp6hZtFLCZUYj1XDJiCN
-wWzY2zhqbFENTZeGqavCX+SawRFSjYBdzPcZofm+TaFzvm+hkf694Y+BB6IYdMirxW5KH2Wn
-Wk2XNBxOM14hpeFEXAJvybdoPv0Qf8k+I1dxd+hy/B62n6MCl+Kg7LcdMoc4SG6PfTx7yTaN
-Xsb0JCtRTfDNeFv0OjIIvDOXm6j+Se+tNNa+i/9TFoWayX8JueId/5lwgS8n9NX3KdTK3zPc
-KdBMTAjOkBaEL8s15ELFptXVvhv79V2gqtkW88IHxE0kRB3EcpmjxP9sB6mJ9n+YPL6Z7blj
-Iac5crhtjmHcOj7Zlsb9xTxiB1Az6W6EQAzGErC51o3shknGD6OVWk8/Jh1WG4QTFdLqzOUC
-XUTJVze82fcw9NonhZZbM4UDD8XEECJfEBso85RFaif9u+aC3YyXiGGOwJ+Cu+Qp9CP9P/wq
-+4RcYmFRhd/JTrb4iTsxe8jh5do4NFu+fQyr2BbQ95hpZHdqDr4d34juQs6AVeYPc4NWzvhP
-/kfrJHoUMjRcRgRZnO6/GD7rywwd9j0IJfurh2sE4kVHsI000+qR5eSXiqQW1a4Ya/QJoKRZ
-HMuDh4kXSAr1FvvOFBDnbCI12Z7GqPwWW8DxhKvjjLDnOMZxubzNVttejUmylaKe0sWJUmRt
-rAbW08JiETT1Z4ZTTdJHSDNUM5QtfxQmS0ggUnzpI8JDfP+Gtvhuhrr4x4efBVaIBcF30jSx
-pFJd+UeVNVO7aG4ypiJdYTJeFVlNVsVu012Ju+xo6hDXmxlj4f/CsYab66xpX+XM4BTHddtp
-3mDecD7qGPudqEvnYbMJO7oYbQJmwk3mP7qiv1cGaAOkl0qRcDc5MlgoTgqcDy/y54bq+x+E
-Jls9vm2guJgmDJPk0B15mFRcDStbtQV6kuGG981jyGIQgw9Gh5JD8G30CPIU24I+y+nMbH6h
-7YJjtnUja7gY5xVbC0dd9ra9B/3C1pncxEzEaeoiWhvHkLbIBDjMFIyj2kQ9WslQj4nDlQ4h
-XSopHBVXW3dxwVcqPNLXJnzJp4Sf+KOk5cJg+V7omtJBitGCymL9pI6Yc+Fey9v7Ibl4fWwF
-VZ1g2DhqAPeDXskvYBs739pquPpzU10hG+l6zv7niGUAX5z6YatPDGeWYrvIX8herCPYBb6Z
-V42Bhqa+1HrI1dRz4fOyK9hQ+s8vhzv5yoaXeMOhzt7e4RxvY7Gjf47Uw8p7H0I11NXSIa2v
-+ofRybhvtgPzQWnsL1QmBuBX6H5kHVsdeo1dZbY4ltoCzpncUtdcbpxrn22LM5HFHBVo1F6a
-vM52wIvRG9GWRC7ojPaHo2CKcdzqy6x6VB0vxSl3QselKkJPsba/Txh6C0ODvUnhGd5f4WG+
-GCuTLpPbBQ0lIzxT2yVr+hztX3Oe1ZfHIirSEv+ExVM3iTvMSqoiV5OZyt9nmzqzba1c9bnN
-rhO2Cq5+bMixjE7mp5Jh22J8KXMHfUO6kUJsBQRIEbOieU7/R6uoKfJlpZvYV94bjJdaBBzi
-Id/08BnvxHB/rxRO8ZpiZX8fubLwXDkeqq51l/bpxdRoM8E4AGNBU0RDdfQz8QpfTW8hEVtD
-uqf9LTPcUcb2yJlqG+g6b+vkus5OdxZjvvMlqZdcOWIaOwRLpW4gMUQlUAN9bnaDk4zdOqZH
-qyvUTVIJJT+UIg0Xropz/b/D7X3/hm94X4RTvWvF97770pJAReVxcK/aVeR0KC+wMgEGn5pW
-z0RaoPNwBG9EPSaeMBOocpxCT+aHsXWcg23VXf/a5roKWJtrD3PX8ZR6Y39OLLIpWJjuidYj
-X4Nh2Cg4AySbe42XOtD6a8tlnxIM75d7BidIpQMTxYtW5s7yvg//z9tVbOrrLu3wn5b3CIkq
-H16unZby9QlqH7OX8QO2ABOQ8pZhkuR9/DQ9nky0KdQc+2hmtWMn+9NZxjbclcc2cElMM+do
-ej6/lKzPncMvMnbMJFcitfCSoBfy25xs7jeeak31Icp7lZSmKxtD9eXuQjHpsr+7+NBHi4N8
-LcR9PlI66K8jDxEOKkdDnFZKmqDfU/4zFuiNYD94H9RBO6AMkY+dorYTDrYS1Zc7ZD0vxPDO
-D+xbZ5BNc/ZkazrdzF2+K3WSm2t1+w/YJqojmolng1LoftgZDjf3WO2msXpUc8u11TfhAvnf
-4APpduCZuNFfR1R9f1q+dkFc478o+QOc4gvOVpuLqdodua7RT9tuFjdJgCALkXcYhY0jT+OP
-6K6kwn6mku31mRy+Dys6PrCdnKtYzLmBkXmMrm2vQmrsNHwGnY3+JqYj7bAyYDsQzCzjqjFf
-G2hhIahNpJ0KHh4tq0JvaWFgnXjE30hs658uLvJXlWYEBstFgs+VWuFq2hppk86pPuOW3gPu
-gC/ALLQN+gfxC1tJrSUeMSWpkG0HHbD/Yvo4TrGM8wYb7bRbmecGHcfLZBJXlrjFLMf+pDj0
-EH4dQGQlbAAHm8f1P4zx6lOtizxKjRQrKanBKNkllJQy/TvEFv5N4h9+h3TeT8u40NvC4q5a
-WUzSj8qTjE7aA7OqWQxUQf5BaFxGN5DL8HQ6kixiW0bVt7+nffwHRrT0soszj2GceTTpGES1
-sx8mOBuJL6e3oSGiK9IHq2lhUQ7+MFzmRO2T3kJZpLmkJurLUDHlnhAtNw90kEb4TZH2/yk1
-8P+WGgSAIgvd1ZLh49omi5tV1WImZfwFHeAEIDENOUaMwBTKj5dnJ5Mtua9UIu9gRjneMw5n
-DhPrbM1McbC0jZ9AAu49/i8zCFPJeHQoroNzSNBqqRlmK/2qQamj9DQpQjsS/q4sCl6UnwbO
-SCctDOL9okj4+1rcrC3bhb8Vd+ixOkHkdUxpabzW5pufzBewECmJXLM8OpFKxtszN4gRtkZU
-F/s++gN/irntiGY55xPr9Tl9iW9P+bhDxHHWjRenz6BbiakIwHqDlqA53G6UNptofr2Mclij
-pDFqaqiN4hXqyAsDk6Rj/tJSK/9f0nS/XZ4YKKeUCS5Q+4c/ad+lSONftZG50JgOd4CHYAkW
-j5rEMqwsjRM12dlkCe4/6qndT+fzm5jZjiXMTMdD+hU/nfrLnkp0tbXB8+kUdAR5BMnEtoP2
-yD64zzxtVtJPGRHqPzov99WkcHM1EKyhtBAaySUDJ6UV/k3ScL8g+f2P5PZCruV1JbWLYje9
-uzLSqKTPMRvB87A1aoBCvCdannqJVWPaEwm2q+RbTrd2UkCn8E2ZWEcefZ8XqfP2naTXVpy4
-yjzG2lBb0a/4JmQ0ehykwsdwlJFittb+MwYoe/SR0kRtZLiVujkYo1QTEuTegS2Sz7/O8g9K
-Lgj45dVBl3o+XFf7Q+6kv1d7G4+N+WYKeA2vYxWQUuQ+tAVdCa/H/s/qqgnUUnsreiGv0gJP
-Wjf7N12H70e951DyJ3saX0/PwkqT49HH2DykN7Id/DIvw/36DfOEusG4LvfRz4sVtXMhSVGF
-N/LjgCHxgVOWv6ZJtQJb5RHCEaVR6JW6UvRoCUpQFzTCZGAjGIluALdxL0JRw7FkJgt32VqS
-L7i5VCT/F/2SP09jjqH0eX4tddLehzRsdiKF+YHNod6g//d/jQ+iOvgDFANXjSZws1bb3KlQ
-xkbpq7YgfErdFpyhJArT5TKBbOmC/5v0xN9L3hxorSQFR6n1wv9oNy29WKhuNdYa18xrAMLd
-WHskljyJdqeT8FHsXKINd5n8z36ZesY3oys6GtIOxwWqLX+VfMMtJ16yA/ApdB9MJaaja7CD
-SDLyAVwwKTBTT4ZLVNPYIT/Rt4lbtZ2hfmq2UFm5EOgrm34gv/RXlusGMiz9/q3UCgnqGlHS
-KikFeoTuM6rBZNgQHQyy8VNIfcqJDWZm4D1s1wjE/pqszm+m3vDfqTR+DzWQLyQr2T3W/XzA
-mzBfsDzSRNfitdCG6N9IATwNzhpf4VntrflR2WwUSj11IRytxYReK4eFq/LlgFNuEghIfQMj
-5SJCO2VLsJd6NDxUKyIP0T+oA4wnVmf/D9yCWzETALIb+id9F6vORhKKrRE5xF6das7fp7bw
-b6ih/HBqg30TmcitIKqzi3Gc3oVdJF6gQzETiUUqIf+Z/cA5fTR8rDY3c2XWkMTPGh3eog4O
-DlbqCovk9YEkeXCgk/wiYFfSBbe6P5Sk/RZj9EkKatTWdaMyTII82s7qy0uR7+RP1E/Xwl+x
-44m/uBnkIns1KoqfTf3Bt6VO2U+TW7irhGJxE2duYu/JXHQ1XhLtiA5HIsExkGf8gj5NMGPV
-H0Zd+ZbeVtyozQ/1UYsEuygNhcvyu8A+OStQVNkhcGo4GK3lhd16c1nRU9TvxiXjq7kbeGFL
-jEYOELXRN9Rs7BlzHJ9v+x/xndtAXrLbKM3upO7bT5ICl06ss2XgD5kAdp5Kwv4mBqDVsSMI
-jvjBZ7MheKxPgb/V6SavDDFKSG30WuF4bVtQUmYIZZT/Ap/kfQGXgglvFWfwhfogdF9TxSP6
-UmW60UHvaraCbWBptDU4g/dEvOQiVKVPY4/ZW3hz7iLRyz6S/G6/SH60dtHSzpNFuNrEArYL
-vplehE0hH6FNcAdaFB2I4OAq8BoMIPQqsKlawZwmlzDWiXb9cShHHR30K/8KQ5UyQi+lqfBO
-MYRD6uDQUq2P2FW/LvNGH+25Uc3cbcYgi+AlbCIIEnMQP7UXPctcwMrbLuA9uY0EZv+DLGnv
-SL7moslC2xLiX/Y+/osmcIXshQn4GTSMYiiO9EcYeA0UMWQ4yGq+ZxTd+CEJOir+p00LXVLH
-BLOVL8Jm5YrwTCkeHKtWD9XSMsJhjZEP6NPVVkacAY0M+N5cgZ6H7/CD4BV5HVlFf0Bt7Fes
-k+0NXoXbTKzgEHI0x5JfbRetG3USg5i++DXqIpZGODAdG4WWQ+8iHUEcMtQcA9bra+FXdY3p
-UFYZlaQ5+uRwH61MaJjF0W8KE3ytVAzWV/ODAbVd+KRWVeqqj1QC+ittp9HfHGgWgNqwFlYU
-VCHKIgGyNTqf7ot9Y/7CfWw7Yr3Nb3XnKuRkG0feZVcTB5lveH26NL6HnI/9wP9DS2AJ6FRk
-NHIW3gDZRiGsr4fNrWrIeCsLOi590RaGH6nTQqT6I/hAORvUrf66WZVDrbVFolebKq/Q91pd
-JKB/MQbAQ+ZRayeHsblgBLEbkcibaD/6BbaF+Q+fy54ifGwZ0mAbkSfZAOFluhPp9F58M+XD
-bGQT7G98JZqOvkUaIQnIUtgffDYmWXOMMf9RRxkn5N56mlhHmxTuok4JfVdygmnKp2AXtXtI
-VyeGj2nRUis9UknXW2vLjONGY5MALlgKVSGJc8hF4k+0KtUW20D3wm8znYilLCB/sx3JdLY2
-OZ19TJxlEon99Hi8LXUbe0DgWC28ObofXYmkgzcgFobgMKPQPK2lGU+Ud/ob6YzmFHerT0I5
-ih48pVwMZimB4FT1aShOqyFe06LlHnodVdZX6ueNPHOZmWz1TAc2CzzCDyPNyBfobioV+0xn
-48+ZO0QvtgG5mu1LDmBd5ENmFvGNfoYfp2LwmuQg7Dy+D62I/UTWWir+DvYCxc1hcJHew3yg
-tjZS5Yq6Q7Jpe8Kl1ROhC0qN0EWlcShJ/RC6rRrhIdopCdePKaf1N9oQgzdrW5deGtZAKwAB
-64zMJGajz8l1mE5twWlmPvGQiSdLs73IGmwV8gNziuAZEQd0I/ws+Q9Wi3iGPsVItBPaGrkM
-1lmI3oILjYdmlvbA+EN9oPeRz2mPxavqjnBRNTukWl2sqZoZ+mZ5+lKNl8ro7+WX+nN1qpGi
-/2kqJgtDwAdvojmgMy4gJ4kA+pVMxQqpu/hrejwxgHlE7GEeELOYIUQ2fQ9HaDf+iZyITSEs
-T8Urov9DVyEtkQLwALYB7c1FMF3fZ/bXbhp3lQd6dfmO5hMlNULcph4O71P3hxEtWlyvxUlF
-9S3yCb2HWsGoYuXERLO/acBYeAXJgE2x52A3fhV5TGxHP5HTsOdUA3wBfR/30mGcYb7jt+hp
-eBQdxEpTczCRYLDD+C50AFYJdaP3kNOgE9LU6jX5BgpW6pUhq7U3FystjDi5nQ6kfVoXsYdG
-iSO1UhYfnojReqE0Vp+iXNNLapjh0Ycal808YyRYYYaRVrA/Vg5sxiORcwSC3iSD6F7qHtaE
-bo3vpFdYuWYuXoquh0+hBGw+eRrrTgzBSuCRmIjeQC8jPdBB4CsSB0sgn4zGYLreAWpqXXOR
-EmH8KRfRG0hWFxQ7aPPEcdpD8Yq2QYLaZ7mxPkCdq5vaA/2M8afRHb4wUsF8syU6AC7FeoJ9
-eFfkPNELPUt2xuZRdpynF+Ot6dN4EXo9fozqgfvIRFyxustvfC/2BOuIbUcL0HbIbBSAFOSh
-iSHTDR7YdBL+q/40ilt7ESVRqywt0V6KY7S34natj5WBxspO/bPSWB+qTdBN/aa+w6xrJIEf
-xkLkgHkDXQ9fYuvAG3wb8pY4il61eDqJqoSnU//gXmqrNcMkvCjVGO9NOvEBxGesK74aq42V
-xSByDb0KqqBz4USkvrkA/NYXwinaMNNQ6hqnrJ2cka5oDmm69lpcpRnic+2uROmKXEcfrQ7V
-vdoufbFBGDzcbSwAHc0XSCmYicaA35gTScVj0ddEBLaLfIvVoprjC6gp+N/UILwkVdnSTQ37
-SjzEgvgCjMBLYxp6G32PtEWPgAvIdJgCKpoCfK6rZi8tw/Arv/XHcjVdkj5r86Rn2mBJ0l5K
-la3PeutR6kx9vjWDqGfqU8zBRhpUjErIWbMb+g/shI0HzfC/kOpET9ROlsHuk1exGhSF96Ii
-8AZUPpZvve9FLsPWEh2xsziDXcXOoDvQtuhQ5DtSFlRHfphDwFTjH2hqG83l6kajlvJGr2s9
-c4t1m42lhvoAaZoeIe/VWypX9WPqKz3SmmK90cmg4GuLnwPNY0gkvIFmwfPYY7Afv4wsIrah
-rS2dTre4WJX6ijWmHmFJ1EbsBjkMc5C1sNoEgjXHr6Clsf6oB0HRY+AfpCf8YHk8DeZYd4JZ
-WXi/0t9YJL/Sr1ne1lCaqJeR9uiHpFf6FTlDj1V9+jLrRnS9njHD3GekwESzOHLerIeOhaWx
-RgDBSyEfcDe6g/iItiR7YLfI3ViAPIgFyanW7w2wuqQDm06kWFlrFzoTa4E2Qr0IgvyLPIA6
-mGQ2BpHGLHhN22YOUi8YtRXeGCZf1H9KW/Sj0l3dI1HGU7mmEaV2MOZow4wf+lqjkfnD2AGb
-mR/BVTMTaQ0fowZciT0FLfADCE6MQ28SOtqW7ITtJkdbGDTFjpI62om8g54gVqKv8HboC0xG
-9qP7kVFIT6QOEIBhDgTnjDtwmG6DcVpDM8vKwqZcxRgrE0ZxOdGoLY83Psn/M3zKZ6OJlm2s
-0hXjpVHUUs4hZnVw2qyD4DAGXQI/osXBAuwzqIxvRbLxGuhiYgeaR1geTr5Ga5I70EhyqDVD
-I1TEi6AJuA9Jwi4iOLoICVi69R0GwQlzJphieXxjvSHktFWmXeXMUcpDw6acM4LyL6OpUsq0
-qS3N4loLs6newOxs1DP7mV3MIXCW2QMcM8sikpmBTIXLUR6Uxh6An9hUZC0eQiKIVug0C5fb
-RHf0J1HcejWRrkQ2cgZ/imRjOxADnYjQaDfEZXmaCZ+AT1YeP228glP1BNhcW2j2VWPNe0qq
-MVjJNjorxczzShtzmtrMHKJVMdvoyWYlI8ksYtYy3bCfKcIt5guAwlXIdlgb7QBUNA55iz1D
-luBNUQexAV1G7EM/EDPQHKIdeomoiFYjeHQpnoZcxE4gz9AlyDekL/IJOJHT8DyYa1YDLYwV
-EOgfzRTre7NqjjFXeWBUVHKM5kqy+VapZO5Ti5rztEizt+4wm1g7aWg2M+vC8WYFcMuMQOrB
-DAvZi+hOcADrYc2QhlQj6lnaMdjiRyv0HzICnUnmI9HkG2QycRo5ii9GbmEjkEdoT+Q2UhVZ
-AwKgCdwJFCMSHNdHwX7aU7Oj2tXcoLjNaCXBLJD7mLWUxeYvZb55Tv3bXKyNMv/Sx5pdjIVm
-Z3OL2RbeNJsCOyxtpSYFKQIy0DfgOzYYOYI/QroQCuIjAkg/8g4yj1yDtCfHWdraDSlB1ED6
-4H8gc7FyyDq0DDINsSGVwQeQYU4G2ywVaqjXgVA9b3JqX3Ok0tKkldmmW7ltrlQ+mA3Vlyar
-PTIzrJ/X+gfzqZFpPjQF857Vj66A8XAdkgZHo1PBXxiGNMDHIiJ+AjlMXEKqkKuQqWQvZDRZ
-E3GQJZBZBIfcw1UQxCCIxDiERwnkPUgFS+AmUNdMAh59Kdxp9aTF6gaLFxPNNspWs4ziM6cq
-laBTrQdfqTXhdq0qnKzXhL2MprCx2QJWhR1gafA3pJAr8BtSHDxC94CLmALm4BUsHa2G/CQY
-pBX5Egwm94Dy5GpwkVgKHMQS0A3fAVZid8E+9CeYj6SCeuA2MM3p4L5BWP15HmypRcNBaqH5
-TCHgNKU3nK+cgxnKazhDvQ+TtZPwm7YFHtBXw0nGfNjOnAwbwjmwKjgAnYgPYuhAwGPPAI67
-rHuthdwlKiJjSAjuk2/BbfJ/YAx5EqQTB0Et4iiYhd8EB7G3YCP6H2iPXAIanArOmzzob8yG
-jO4xc9VdZrS60drDU7O9Eg//VjrCNKU7HKu2hg6tHnyj1YJ7rN1NNRrAkWZXOBnOh5PAE8sZ
-/wRr0BPgCOZADuLdkM3EQGQQ+afVYz2gkDwH9pIrgIMcAf4i2oFteHNwB+sIrqP9wEykGygO
-KoIvpg9uMJbB1jqACdoZs7p61tyseM16Sk/YSPkf3KFkwRKqH95XC+BMLQe20rNgEasZYWYe
-tEEDRoASwIGMAiXRx6AtVgLpjY9GuhNTkWpkdeQVeQ+gVBvwlgzADuQFeIhYDPPwsbAoPs3q
-MzugG70FH1vJbw68AhuZa6GpV4MPtXTzpvrD1JUYuFSZBQcqGXCzUhowal2wW60CmmjJwNQi
-rI7Lgn8NHMy2GsEs6AAjQVXwFzIFTEGfg6VYEWQF3gmZS9RE6pA/wQFyNDhJcqAP+Q5+IE7A
-+sRmuBvfDnOwW1BD/fA9YgcbQDToC11WHv8MU/Wp8JLWFD5R+8JEdSe8rRTAK0olICuNwWC1
-PPihsmC05oU2/RM8q9+FY41zsJd5GLaCp2FN8Bm2QoqCMegisBz7AvbiQbCReAjqk4PBOhKA
-ReQDWJ48CK8RG2EjYju8gt+DAKcAhrUAH5DhYDeYB8bACaCUGQt+6PfgLe0E/K4+hnVUEeYq
-5UG+0hSUtGaYrgJrju+wr3YTpmt74Qx9GWxujIfVLTUvAWfCiuAS7IvwYK11r4+wyyAfPwY+
-Eb3AONILj5H74CpyJqxHjoK/iFFwFrEcFuCvYRxeHEC0P3iErAarwEnQFC6zElxlsEDXrecg
-YKpaDHxWOoB/lQlgizIcPFZqAlbFwAT1G8xVL8HR2noYp4+DlNESkmZtGAE7wlZgNdyI5EAP
-Wg80xXuCcUR50I58D9+SC6FI9oafyE5wK9kLtiUnw1TiAqxMOEFFfATwoifBfsQDOgIdpJgP
-QR9jIVC0MeCzOhWIylowSjkGaipHQGtlBpit1AKvFA02sHC6qm6DnbQJsLzeBFY2kmETMwH+
-DevBe2AZLIOmwwNYEkCIOFCM/AILyMWwO9UeDqbqwVpUAxgmO8AdFi4o+QRGEEXAO2wEGGfd
-Fov8BFvhfwCY26w8/jf4Q5sE3OoS0Eo5CL7IV8Fd+Sj4Jk8H0UoTMFNxgBwlEw5T78Ji2iZY
-VB8Jaxsd4FjrZu/AhbA68hq+Qx1gAp4MfhJeiFIb4FOqMSxJx8KaNA0jaQq+pBJhF6o7XEoe
-gz0IBXqwlmAGusVC4i7oA8+BA8ZG4NDXgRvqEbBPeQs+yTqYIPNIBzkEusl3wD/yQvBdbg7q
-WrO8V77DR+peWKiNtuZoA4+ZPWAD8C+k0HcW/wV4gPgGY6nlsBpdCn6nc81E5qUZxTww39Nv
-zT60bu6mOsB55ElIEyiYhg0Ev5GLoBL4D3Q3H4DV+jVgqM/BSSUAtsslkQKpDbJfaowsk2zI
-JukeeCtNBsXlMuCQnA6XKfvgDfX/cXQW4FKWTxufmefdE3sQkJISpaUbpKRBKQkBaenuRjqV
-DumUBgnpbhDpRrq7Ufacs/s+z8w3/+/iegW8YHd24r7vnxdy2skXtpiscjmlrtSXIrhEKpg7
-Ulz78Dpqt9SJqS9lYxN5q77/6diVPCt2vtbzB3eKecwto8vIW72XSp4vc6gDPICdEK0ZNJv7
-B3r7z4HDyfBI4rd4PWE4tkyYjQUShmD2hNJYI+EtzElYBlGJ9eB0YgD+Cx+X5v5keWfbyTzV
-816wQcbSc5nnIfSLuiGxMR2leOw9fhLbj/MF83GGIPDO2Lfus9hoLhhTj+9F7eISgXwyzOyR
-s1gNArBWb/U+tLRBvBQpjwPD4/HHxEu4OCGaKiYkoVQJNzFpwkQsobWMSXgOqRKnQDBcDhpF
-EtVbtkg/N0OKyjopgRekuXkgLQOHJGd0fZkfs5Nnx37FWYKHXK3gEJc+2Ngtim3lnsQsdZej
-k3LjqNm8ySsrsSYiP+JiGCFBXORq4z3/F6wXOYevEjPRlYQ2pJxGF+M70fz4L2h2/N+4P747
-ZkqIxQcJ6yA23Eh1xIlnt8lGt1QWaR2XNDlFeRPk06jMcjd6IFeIPe3yBCu6dcGHdl9wg+0R
-XGUfxt6wsbE13JHopy5H1DLu742XI9QdXkI2fMsL0LcvsZhfhKaFx9MXif9Q+oSkZkh8SpM6
-/jo9CA2hJ6H0lC1+NR6Oz4/nEo7B1+GGetfPZJJdIv14iGyFFpLKFJImgYvcJToffxk70DUO
-PrDp4/raDnElbfm4gvZEsJmNCp6wd2M6uO+i8/KIwOeywWSHvzEp7pctuMqlpp1+M0oIr6EW
-iSFKl1DIfB9f01wL5TbTQ1dpfKg37QwRFYkfiekSYrBt4gxI0HtZ6y+Xoa6VLJCCkoDCdb2N
-PCoqA3eIae/uxJ6wt4N1bNu4oO0V5/sZ4jLZIcFBdlxs0H0ec9j9FPU7/+r9IWtpO6yHSTid
-P6NxthttjOwnSUxtJiT8ZMbFTzcvQzPMr6EGplkokTqHptOeUCrqFD8Vf0lIhhgeDn9EPkgv
-O076cDE5CB84p1nOPwcy8Nzo1q5+7FY7L5jLto876++MW+/PiTvoZ48j2y443BaPzeHmRv/n
-DgXe8y2TBJ5hKrwit3Gna0KH/Z1kwxlMi8TBJm3CEVMl/oXZG7pkWoQmmJKhIqZR6CSdCX1L
-W+KPYSCxKC4Jz4Ef/Tgo4+ZLFykj5/ERF/da8+Co1a5XzAObGFvcBuI2+3PjOvp74pr6w+JG
-+h+Dj/3o4FA7P6aUOxOVja95ZeS6+slJqIur2Me5tjsdjNygJOHKZnrCEu3FHXMn9NJ0DO0z
-WUN9zOehjKZTaC1ljc9JDRMW4LNEB8sjrWGovS1TubM8hCipZabzssBTtyc6o+sX29ruDZ7w
-R8e19m/GlfPPx9Xze8Ut8PcEv7DjY8/bq9Fr3M3ADj6td7UX42GRnMaRrinN9M/R9XAFUzlx
-jYlJiDfl4jN5e0NJvBah86Z4aIT2Iq25HZpPd+JTUM3EgRgOX4BDfiHY4FbIFcmtPrKFf/Y+
-5cVRVd3AmEH2Xexx/0WwjN81Lj4yKe5lpEFcMv98sId/L9azXWOO2RlRe9wk7xGPplQwANJh
-S76OLWx7mhN5SZHELmZOwh2zJL6gx6HvvTGh0l7RUJyXPXTM9Ai1MQXjP1DXhG7EiedxTyQr
-zrFDYAXflxdQVaqZ2TwpsN/NjL5ov4197/8aLOZ/F7c7sihuZOQ3fYrF7Y0MDBb2v4m94U+K
-3mlnBq64CSaFjMOyMFDyY1f3CKf6Q+lhOI1pnLjWZE3I7v0QP0B7Mc+rHJrlxYb6eV+GinnL
-Q9fN2vjWJmPiKTodTknL/Hq40s2EO9qNchQlc720vDcqmZsTE2WTBzP6sXHdtA/ByIa4l+G+
-cdGRJ8HWkZexCZHeMcf9RVFX7WIvIy9R9l8M02Aq99e9KEC3I/epQni2uZ1Q1rsff9grFJ86
-sDRULPBNKE/gq5DzeofWeyXiS3k/J2jSDT+j85Eg7bK58DJXgy+wsQw2DXl9oKxbEp3JVopN
-6fcNlo3kitsc/jmuT7hP3KBwmriD4SbBKpHssVH+iGjP/hao4maZNbwIE2WOJMGp7gnu8VfQ
-Z5G2ZkZiFq95wl/er/HlAvdCowL1Q9MDcaH+gSyhrwMbQle8I/Hfe1USFxmM7KNH/kl8ox6U
-HW7Kz3SK93rr3IGo4XZQTHP/YmzryB/BVeHP474Ol45LG46L+yY8Wn8+MbZmJGNMbr9e1He2
-ufe760EBGQcVYCJXxHU2PUX572l0+IzJnzjLK5VQMvBr/IbA29DTwIjQy0Cr0MnAqtDwQIf4
-uMCahC5eifBv5k1kFp2wU/AcjwQP2+hefM2tA+QqRJ/zL8TsjLyJvRKeFywV/hD8mOjFJSae
-CZYJ5w0eCieLHRYZFd3PXx/YbI+ZdPxc2d8qr0bzFCxv+9GySDvzRbim9zTh00B0woZArfhP
-o/4IFYuqEcoTVTWUEPgzNCewMj5JIDqxtrcs/KNp59egH9zXOFA+g8P4gtlsccGoAfZK9Pd+
-qdh6kdzBSeE9wZRhjHuWaOIiiX8Evw//E/s4PDJma+RE1HH/rpfO+TRSufu4JNW8lcEdwCb+
-VtoR3mCqJE7yiidUCXSNvxDYHfoiqmSoZFTyUM6omtqXJPGDAj8k3PbeJhpva8QzS20i7udb
-QLhFapiR3ClQWT3iE3sxxo88ik0dmRDsFH4YjA4nBF8mHgzGhTMEe4Q/xqSINIz+N9I7kN6O
-N73cGjzEW+WO7HAX4Ll/DKtHztC5xBNmecIi70p8rUDe+FOBlaFkUR21hnGh5FFJ408EMibU
-CvyWOMcrHdlgxF9LL90MBOgCBaiSVFe9KB513T6I3u/nij0bMcHoyC/B4eHTOou/goXDrYMd
-w6NjH4Yzx8yJNIua6vfzTtj5lJp3QSXZz+Xhui2A+fyitCJcytRKzOT9kHDLWxjfJeBCfwXm
-hOIDE0IcuBm6Hvg9fkzgcULY6xYu5KX0K5k7tjxd4a/wXwhCCvOSk6te3IyabxvGLPLbxx6J
-pA2mjowNrg7/GewZ/lWf/2I3h2/EFIp8F/0+0j+Q4C8yBd1JbMe3pIc8dM0hrW2EgyPtKJz4
-kzmWUMx7Hf/QKx/fMrA/tDEwMXQrsC30OFAl/migUUKPwMnEW16bSDIvo/3SIKekFBCConRZ
-KnirOGtUH3c0uqk1sW39O7HTI52DieHtwYXhHcHe4QbBkeEBsefDKWOaRepGFfB7edXsAhro
-9sA0PsBj5JodAFn8cTgpPItyJI4yXyZU99rFP/cuhhoEhoaWBkaGrujdPglsiz8egMQOAWVq
-L7//3vj2A/l8Az/H3VDeTJXKgaacIvprNyGmmF0QW89vEFwSORXMHQkHH4UvBU+GSwSf6Y2U
-j3SMvhkZGjjgTzMX7Fq861bLGZ7v1skOfymEw+uxSeJqSpowzOSJL+KNC+310oQyBPhjp0CF
-0O+BV9qXNAkjAysSUwQaR9p4+e1oU4THUisYgvOpKxzy6smOqJLcIqaoWxBb1XYPDvHfB59G
-CsQNj2SJKx3ZHMwW2RdbLvJ1zAztRV7/e49sC3pt28MZ15AX8o92sPwaGar8MUlz72hqFN/U
-rA+l9oqEVnoQSqvaOTiwLrQ7sCj+YCAmcVRgV9gExvtVvJGuiVknjegZ1sB0XmHIFvWpPI1O
-cOVj39vsQbIbghX9f4NbI36wRmR7MFkEgzGRYzFlI0mid0QyBHr7+U19WxNLuXqSjuu4CPfz
-fTkYTos5EnPR8/i05sv4J2ZeaLJXMZQsUCb0c2BS6GygdPzrQLuE04H4xI6B7ZEj3lz7xGzk
-l/QI7mMa8zfkC6yUYPQo/iWmq5sZ29WWDv7mLwq+jfwd7K41pI5UC74LN40NRJ5FN42kivIj
-Ob0LflXaYRvCQvcdD+XatrsM1V4cSZyBFRImU5n49mZuKJOXObTZe/ExTyBJaEbgl9ClQP/4
-W4EnCSsCK8I5A7/6HbxFbohSyGDKSh2xjlcL6kTlERednMvExrmkwa/s5GBf/0LweeR6cEhk
-VrBU5HFs3simmEaRqOjjkRzai29NRdsZv3RdRFwr95iH+I9kZzgEyRMjeC7+PsXErzUjQ3W8
-nKHrXtZQvcCQ0J+BovF3Al0SzgY+DfcJvIic957YD+YT+Zeq4EPsqr3oGVgrRaMn8vyYUe63
-2Nm2UPCSPy5Y0l8R3BcZEWwRgWDBSGzsN5G50RMi1wKf+Z531S9Df9qWMNu14SE8yPaRbZFR
-YMKTcXrCEFqk2Tc6PmwWhkZ6/UIJ3obQT4Gv438P5ElYr5rVJ1Ap8s771Ob2iMua5FCK0lM+
-/MRLD5cDRmpFR1znmE9c/tgq9o/Ydf7b2AJ+Yuy5yNbYWZFA7IzIg+hTkcZRZfzV3n2faZWt
-g6Pcz9KK57kKcs0vDrkihXBxYjoaknBfWWS0aRHPJlN8M69o/DZvfnyCVy8heWBQ4r9eOPyb
-t8j3TRNXwhSUxpQEu+I9GgyLvBGSLWosN49e7qpp9nweU9nWjj3hD41t4bdVr38VEx8JxKT0
-90S18/MFHvsLzDibiqq43pCCN/Jt/mi3Sl1/EewPD8MeiRVoQcIDSpPQzOyK32KWx6P3OL6e
-1zVhglc/ca63NNzHy+Z/5u2xk0xrvkMpIS0dxSrY3bSCRK+7fBM1jktG73HvouNc15if7b4Y
-3/8nZpK/NKayb2IK+RL1g782sMIv7KWzf9M22xC7uD2Sm5PzWx5sT8nryEYYER6JwxOL0uOE
-v6h3QmFTJGGiqZ7w2qxMqOJ9m/izVzM8zpsXaeahtWaQ62UifIqGwycUR6VwuqkNz73G4gKD
-+FLUFtcvOuDio7vaBjH3/V4xff08MV/7g6OL+x2jOvrpAsf8v0wNO4Qi9lM86EbIeI53zWWA
-rQro58TL4ReYLvwLLUxEUyaxgcmQuNqUT0RvcWIVraGtVy/ygzfO/8Q7Y2ebDGyph9Sm8zAZ
-y9BWmG2OyUHvPm8JfMYDo9q5L6NP2i3RpW0qzXjpYvr7m6Kb+TeiBvqbAnv9dl4u+5U5bh/g
-GNcVvuMHnFzauefyzj8ESyPDcE84I+UJL6Cdif9Su8Tipn7ieDMw8bK5k0jewnBSb1nkpTnt
-zzaey2gq8WSaJu/xPyiDzagHrDGL5YT3gLcHivGIqPmuZHRQ+XiMzRKTznox//j9ov/2x0Y9
-9JsGMtl83gTrmRxuB952JWE67+DvpaT7DE76F+D3SHe8H/6I9cNN6E7iMpqf+JGmJ9YxhxIX
-mPLhs+azyC2TxT9gKtjBpq1LY6bxAroiMZQbG+Ag+hXWmkOy0QvI5EA9bh61yn0ebe2q6Hb2
-bPRHf2z0Lv9y1Gb/UuC8v91Lb5eYJbY/1XdpMAX/Jmc5pf5zrm0A1XyBxpFpeCDsUaVwA3qT
-uITOJ/r0NLG2KReeYt6Et5m7kR3mjT/LiK1lUvITKi1taAgcwmPogKkQpPJ6i/X287lACp4f
-1V4z4GH7W3QZOyz6se7mMT9b1Dk/VcD65LWz/1IS7cV5VxV+5VNcVRq4AHz0/4S7kUqYN7IP
-t4ZT0Y/aj7zhjVQ47Jmu4ermXXiU2RdZZLb6880m29esclnMet6srp6JPsEOWI0WQGdzVZp5
-GSVnoCu/Dhx0v0cldSmie9ps0c6/GnXQzxW1yy8SuOrn8LLbrGaPTU5D3XEoz40kgd+5bTJH
-3a23D/hnZCSWizzAN+G8tCc8QnPgA7ofLmoqRQaaF5FV5qi/zazXbo53jU0rfk0NpRV1gj9x
-Ij6AtZQclps60sNbxIUCH9xHzYCTolbY01G57Zqou36OqFN+ncBDv7qX01Y1f9jq1NHlw+L8
-QEI8kzdJY9cayloLvfzB6PlX8VAkOY2PVKMukak0OHKF9kSCprhf2Lz1y5sjtoSZ6DxTgZeT
-cF66KwvwNryC51gAHtII2WAecWvve/4ysNedD+R2xaO22TJRbe3jQAVbOvC/r6zUz/5krmvi
-7uuGYz5uCQ84l0wS4hLw3p6BT20VnOEvxR/8G5jBJ3oUKU5nIwPpRWQ7lfdf0XU/mZlnM5lG
-Lrnx3Tmay+3pe3mK+aEa5sdZmrkeSSpTXs4r70zxUnGdwFD3MPDBfh411oYClWzfQEH7p1fR
-njBj7W2KcSHc7d5Cfz4mOWUpX5cpbgzMs6nwgz8Wl/mXsasfS7n8shSK/Ez/RnZTbv8DrfAz
-mx+seocrZ3a4FKYWb6EQF6XDMgu3wR3YjRlhGbWXxmYvk5eOt3lDXd3AC7sl0N3uDmS0PwXA
-7lIHemhqW1GayaK9KI7l+SuIllRySFJxf/jKZcA+9nfMaAXZL0FX/Wb6vmOU5zfQFv80xdin
-NMOGqYRLoHPuAn3P/egqWxwg3bA0/A2fYxrwsbOs00RcxlTma2af6+V94556F22GwC/2P6+b
-7en9bHeYdfY1JXM5ablrjY2UqtLKZDkpq7knXHFJ1en1Ru07XGNz0FxbhnrY76iGbUnVbA/q
-YgfRfvsLFXdTaLsbSZm5Oo3nt2hkOP4uiB2gJ1TBS+JRZZlDBzmnKcPHzRFXy6vrlnu+Xeed
-t3W8v+1mc9MmUgb3Dc1wv2Ju/hvu8geZKJkkO7TgPbBROauw8kWcO40B5fjH9hFut29woTW0
-xqam27YQlXV1tYYOWsNPNEz38plm3+7SRyeRCO+gFexXzmpEBeWCbkw9E8tnzGj3hZfEFfEO
-2PdmkW1j5thttNsCpXH1cY5bB6U5Qd5yed3NhZwNArwdfnG58Ac3Alu6vdjBXceG7j3WdOmp
-jatKc11feuVWUwO+QPv4MQXlFNWTEbRBUlF2mIZHQbcMi0IUjZS2dJb3UTb+3Ex1HUy0G2mW
-2bqmh71KzWwR7epk/XRvoaBrAWfdFZnM1aSKnOLX0pJnAnAWPOt+w3vuJQY5I6XjwvQZ16Uc
-PJjq8DyaxLvpGl+krHKDmstB+lW60375iHHwEw6C3RCDViZhWbmB4zhIN1wVqu6G0wU7m3ra
-3lTJxlBZ2xt/tNdhra2hNVySK66HzOeU0lmOciaYzGehE3fFJvwCR3Fluqzvm1zGUzYZQ/lk
-KlXVSXeXhTRPltJRmUf3ZTi9lmLky378HHJiExgNu+CqZMZM8hP24B540g3FSm4R3rbbcJxd
-jo2Vun60N2GQrQvH7BWp4rrJM5dDfueP3EcdpCAc4ZtwkQfgS/4Pv5TvVXXG0S2ZTgYGk0gH
-CktLAviBkkBt+hSqUpyqQkiQ7shivCkZMF7GQ2F4L+OglpyEtXwHkvE9mOQSoIDLhE+VPnfa
-ZLje7oajtgoYd176uM4Sw7llIyeR3hLmopDI1yCVdMQycg97SEk6Jv0oN4yljtBNSacaNdb3
-rAs5qT58TrUgA5WBFJQFPqCBZfif5McALIGvIVa70Vfp/zInQnH2YYMzWN1lQeNK42mbAzfb
-a7DdNoWH9qKUdrVln3vN9Xk7o8zi4zKG+8BMjsJjPEpv7gm2kOL6GdtTPehKE+B7mgqlaYbm
-2+VQQlNMyf9/1sJXNAte43AYhSMhHpbDj3AVDksAv5D0OIA9vO9uQEd3GFK7nXDFzoINtjz8
-bg/L7v/96Re3nAe4IhzNH906vv2/r6DrcsFjdwK+5Go4lDfgB47RnfueCkAX+gOaKe9UIIby
-lAMrUAOsSL3xWxqsP+6D6akJHsfKWBNr4w7ojplhPE6Wcficm2FNjtO92ANd3CjI5mrBG5sg
-V+xQuWHfclLXnHu4h+6t+80N5UEumwxy92Wy/spTDrEot8cDfBDbS1L6CsrSNX3/CpiD+mMG
-WotZ6RVmpi+VfopTZipGsZSBTuIzbIUH8CZsw9qwDs9rDd9IeVzFlyAH14e/3BsZ55ZJXVdH
-Cinx5HHtuLq752a6Di7BpXZdOcG+YONGSw73OXRy0+GOew6DuBAWlKHoqRvcgQs4HI/gNdyC
-SekI1qPLOJue4D6K4N8EdJBe4m+0DhspEeXX1PkptYUb+EFGYjuJw0c8GPrxe8nK4+WOyyML
-3WHu7r7lpu6k6+O+d3+4DzbiDtlGfMCe59u2jaRyD7UnlSE5z4Gj/BImSin8CbriZzgYx2Mf
-7foE9GgXfk8P8Vf6lP6golpDBdpDOWgG3cJu1AtbUAyWppXwCrPAYJwpryCZfA8L+KyU5vZy
-3zHPdBO5uUvNNdzvSoKl3Az3zt5yp20pPmOP8gPbQNK4EzLSfQXpeDyc5FcwQ+toDO3xBfTF
-ClrJTNyPEUzA5lSQVlFzuks9KGDakGcy0RP6A69SfjxOh2E0VYHktFGG6I6egcWqQiV5mrxw
-KWSZm8bdXCx/78a4Zi7GjXOL7ElX237OX/3/14D/UqrYJTLfRquStYW37ojWkR53ST38BTpg
-BuyMc7WOrLQHN9M7/MrkoFGmMp0y1eg/k5Femn14wVTFveYGjDS9IWDeSFNqI9PwGW+FkfxK
-SnAlibg1fMol59XuZ+3EG7vfdbJvXKJfkDf643me78kaf4w88p9JB/sNZHfTIFbVJomkxljI
-hWfhC+ykkwlQQVyqF5LTjMMZZiu+MOcwr3cWK3sLsKhXCzN5iAnmL5hifoZHSmpJtR/psI5k
-08xQV/7mBfwrf3B1ua7LwfvsZ1zCpuHDfi7u6tfmOv4M7uAn8DK/lqS1M/WSrsoBlwHO8I/w
-SAbDSRgLA3E8pFN12EHPoawphGvMCIyYo/i1F8ImXgRrexcwpzcPw6YzLjYl0aeHkEPTeEFM
-Dblgi3wjzWQYG9WD9VzcNeNVNgfnsnF8wAfu4sdyNT8PN/MH8TT/Ir/xU8l0W096uznyMz+S
-uZIZ5kBdaIi9IYyLYQ69gSymCv5mluB78xZLeF9RZ6889feyUEPvhdaxAe+agfiDyY+T6Ags
-1budB9dlvvSU4xwnKXiFbsW3fN0S/2jvuTf+BTfLv+Ha+Amuk1+Cp/vz+LT/mkvbfJJge8hz
-pdYwEwSgNNyA9jAGJ0AeOgMnKA/WML/o/G9hai8dNfYq0nCvFPXwoqiMdwqdma+z6oBPKQUm
-oQ2QDCtDNNzS3DJMWnFG2eP2cTbXiVfaovyNTcvP/CCv9pPwbP9z3ub/wI/8WVzEHuJz9hlv
-dhnkELeQG/op/oILMgAJUlJVWEl/QkaTDUea6XjRPMdYLycV9CpRPi8PJZgIbjansYlZi+dV
-UVPS51gY90Mx+AGqyHsZxb/IXZdWvncb+JZtwD///13Eu0f+E3fAf+xO+R6H/G+5uB3NW+wW
-HuFe8GguLHNkiMyA/VIXWd5gORhBSyCB0mF9M1Fn/0JvIr/ex09kvPb0wJSjRSZIdcxtfEDr
-sSw1xt74Ecbrt3mSDi7wn5KXy8kid16Vsztfsbn4Fyuuin3pPtMnmfVdfluMW9hhvMluVmW9
-y3k4teSRRpIVJstLOCJjMCxpqDzMp3VAJjX+aHrgArMNT5nX+MbE0DOTiBvMefzJLEejezuA
-auI+ZcSbsBqeSE2Ik0RpxsvliPtOKrgQP7MbeYUdyu1tE72T6pzdVuOSthV3tgt4s/2L87sH
-HHYo/6rjv9PrOqke3QkXai/OSEf6Ak7SePjU3INaJi8ONH1wrtmCK/VeR5i/8Wut6yWtxFE0
-G19iR8yBWXUr/oGOMgF2cDn4gl/IHDdbirlqunsoh+0ZnmVX8VA7gUfZQbzaTuGHdgOXcjv5
-hjvA2/gcL5FH3BfiORWmlvGa3d7iSKlCbzVdNoLNune3yUMwLTGzWY3ZtQam83iSzuhtnMXs
-qm3j9NseqIR3JB4yyHoYwk3hhfOgn/tTirhW4jlNi/Y9H7THeLddyBftZI52C7iOW8hn3Gye
-yvO4l6zk72ALx8MpTX8f+RQWkMw0Q/XQg1HUThn0FJymr/ENLcZYcw9Fve0yOfydfGxIH/A8
-HsJPsD/mhezYSK7ABh4FGTknLNOE2cKNkPKupGR3JCncVQ7qvn7qpnIJN4P7uMV8TuvozAu5
-mKzSK93Gf8IJzo2veBh+Lmewi8TQTfmKymnqWgQdifAXaosbdRePaw+2aA8m0SH1sy2INAlb
-YBWcqEywVTYCSnfow/kg3r2UpW6demZvraWWJs6C2pdUWk8853WvuJaL8C9O2LpE/lNT6CDl
-5sIQ4QMQo2kys3TG72QLzpUH+F6i6GtNW6OhE12CRf/785xUHu9SNfxLv19OZbADFcFHmFS9
-5y6Ugi3QWybBFe4KNbgq3FZNXuLey1B3QVq6HfKt+02Kuq6Sx1WWMq6wtHdfqW4nlSb8L2eW
-O0oE53i29iIKL3BDzU1LNFNfw55i1eFya+Jurfoxh2bCGboIb+gd3KUE2E0OJlEc5qUgDtQ7
-naG8ul1d1chR6K6u9sLNhqmuL7R0DaGCKwP5XXrIojVldLsln5sgDVwv7VUdycnZ5SE73iI3
-uR/s1xq2cVvcy5vxGr/DVJKSmkkBmqPMdU0J4HNYQW3gCE2HfbQaptNOaK39yag6Px7/gz/g
-AxyUfyGBQ9CI/4Nz7iG000xZ0K2FTOqXWbSeopoCq7uUmkzPy2xNYzfcEKnJFSSRSY7LGZ4B
-i7g0juS1OITjcTwXo83chP7jVpRfOlE7GUBrZBS9lymUHyZQE2hJwyA3rdBEfhmGoYWd8JkS
-YiFNWzUwDzfH2a4ZZnbf4n2lgQs2Ld6zESB3FvK4SdDAFYJx7pYcd3O1D9XlCL9TpV3AzaCB
-povcvBS/5H8xLxek2tyYpnELJbJ6lFLqUFOpR5ukoVJKc93XGtQLsqm2El2GfRiHX2IxrAiN
-sIkMxJk8Bf9T9u7lfsb0riGGtQ6xUcrjl6G2ZszBrhSsdTfkoZsshbmq/MlvubXM1W2uwx8h
-C0/HdPxBa8hF33MdmsCN6AqXpc8kDzWWnLRSstAHyUGFIaveboCmwGPcCzt0H8pjdhwC3+Ec
-6YZHeSKm57n4m5uCBV1XdLYcRrQXn7nXUM1tgUGuPax20XDDaRbhDjKU00tqpcTL0psXQjGu
-rb/7OH7Bhoorkf+ktLhE53JHqTWN6nkj3ZHlSsfP5QvKBqmpAfg4Fu7gEZiChG+hBH6mmbWU
-MtsI3oMf3EEc7dZhGTcSc7omWNoVw3ZKSzPdIdjtOsJNrQN4h5TnLrKDk0pbWccFoJ5uVCqe
-ignuGX506SiKq1Fu/pGa8nc0mcvTCe1JcilCrfTZLPnpfz5TEuJxFOzB61BU1bsDdMPhsg3X
-8zOMYcGJjrUXD5HcAYxxC7Gw64kdXCGc4/6BQ64zPFJdTcrrpbXuRYiv8B5pw9OUL+viXfcP
-nnNZ6LprSmE3jgrweOrJ/WgLdyHRHflRaululFNyzU7VAJXeLuFD6KGOfgAGqXbvR5L3WE+p
-/bxLQl3df5jL/Y1p3RIs6fpiN1cSF7tn8LcbBs9dCvB4mxTlxsqJb9TRB3GCTuigdqktHnCn
-8IiLUfb/hjxuSpW4Po3jmnSKa1EG9ZVeUlppNp+Sc0pqqvfxJ2xW5c6NzbEZrMAh8gj3cBL6
-Sqe43yXTOl5jBXdMqXUR9nFdcL7LjnvccbjoflAOeiXv3RS9kZx6HertUo3TgO+uwnnXCk+4
-rXjNfdTJFqVMWkMTvdfZ3Ilua0/yKU2Pkr50XXpQHmiielqQnoKmYU3Ks7AI3FfW/Zy26gQL
-6kRPuMLU131KddwrbOj2YVs3BHu4L3GAWwO9XW7oqto1Rr3/ijvFXbgml1B2SAp/uL/hN1cN
-52kHVztf66lK1rWnQjyUuvA82svLKZ2soCGymu7LIvoWhqpuFaWvcJny00m4i4/1kr6UZjSW
-e1GA29JMfYVKLitlc4l6s/vxU+1HMscQozMRy/Kp+0V+dDHyTLl1Fwd4jWxzU2Giq4jj3Xac
-5dLSBtdP92Ol7ukmKsJ7qA/vo794HWWV+fSLTKJ/pTv9BMXoCvylPpYE12Ee3ZSGUp3W8GDK
-zGNpvetLtXXDMrvSlFb3JIXuSAq93bQuAdK7fpDX+dLRjZQH7iPP5w48WHzXDHa5dLjMTdY+
-3MStLg+ddh3prRtEsTxC72UiteVxtImHEMnP1FJnc1p1vQIko70wEosqva/ABxJNX6myzeIx
-lJ4nax3DqLW+SiVXjfK7pJTe7cVPXD29m+vaiybwubsrfV1DzepH+Bl/w5eUbf+A9a4K/u5W
-4BK9siWuEW104+mIm09X3QadzVYqxytpJi+kjzyHOqivvJJqNACuYzRmwxlYC5LQOOlFT3i3
-VnyD3rirNNnto2ZuNlV1zbSOGMrglmKcy4bWLgJ0maCYWyQbXbR05D66n8SF4KCq23K9k7nu
-OE51uWmW60qr3FDa5kbRGTdGb6Y3NeLmtFs1Na/U1Jv9isrCPbyo/NIGZ8BT9ZEGujnraDrf
-1l4806leo45uG9VyY6m4K0cZ3WOtYYDqaRgS7c+QxhF0c4Mlmp+oYrTm/RJQX7/kCuM+twzX
-u1S0TPdilVugXV1MW91SuqQ9+ZQnUDueRGd0V6uqr50W1RBIULr+FvtiL3iPK6U+Of6NuvFW
-euS2UC83jwq6PhTUy39hQ3jZzsPTNi+etDvgpq2s+3FW5mrW+J73cj6pxakgmq/CQ9cST7lb
-uNv9qD1YT9vdCa3hAh3QT/XCndIL3EdT+BBFyQ6apB6bCjLRcuXJIrgIduEh7U6sDKQBOrkE
-neAYt5ZKuWmUznWmaFeEwD3HaN285DqTL9w29ZWKmgn/kmL8jfzH+/mEpp1JkJ6z4L9uAV50
-n9EON1p7sZ1+c4f11c7QDHdWFWA/peW9NIoPEMpy+lV7kRYe4B+aNkthXdir6Syr1tFZ3XgO
-peMN+iobqJ9bSDV0srldDUrpdLntanxty+JTexKiXHX4SXXjg8shf/B67ic/cC7Q99CEVF17
-cVtd8Vsa6Ebodq2neu4GdXcfdV9jTVLObSZzMZNZUpsDcoRaac5AbIKzNXemoofSkxrIWr3q
-k1SSL9Nxd5y6uTWUQ6/trS1C++xtnGT7YXvL0NoOgdn2hcRpJt3ljvFkbsrt9WKy6ExO6s32
-UveLoWGui77CamruHlAH94mZ63KaN66KacXNzRuuZX6VpKaA5sCrcAu7YQDfKy3/QEdlBpWT
-bbSN/6LCfFgvfj0NclOpmN5J2KanQ/aC1tEbu1iBoXYwXLQPpJWrKTn4PHvSWT3+Sx6tbpcb
-16qfDHeVqI16WlW3g4q4x1TReWaw+8JcdxXMj1zdvOccZq5cpipQSTPfEByD+yBalb0jbVd1
-LSxXaTW/UqV5Sn+5f3RPd1IW7ew/9huaZp9jfdsLv7GPoYutqHs6T7UcpDkP4zLyGYscdeug
-v6uLpdSVU6rqfbSd6JadRXfsQUri7lEnF2XeuzxmFucxNUQoDpbRSYihnlhHiWA79Kdv4LD2
-418qKp+Y5RxtcvE73agL6m3zKLVrSMdsFA3UW6lqU2BtOxDm2UuSxRXT7LWBD3BZHi+PXAGY
-qemwnmuj6eSiJoNoem3z0iP7I3m6YY3cEvrHnaYh+gkLyw3VreV6I18rFyzGcxjEb2gB/Eol
-YDvt017kl+u0kQ9SdV5B/+nvXvj//5U+itjuwAO2Gq6xB+CSzQLF3Vi5oDo+nftyHQkqD2x1
-faCDi6jK90DjNuIDexr/tv9pgs1Oqr66r+MoKe+kw/y3+to2Kq2f/p3mz5GoaqR1tKJtsJxq
-wDXaL/GUTZ/V/Jwq6J5edxu1H8O0o2Vot72G42xtnGo3wFUrUtc1EOv2aS9KcXetyChZTtMa
-0mtaHI7/2K240z7ATTYn3bA9qZDuyDYXUe3Kar6SzOaVJCjXz6a6GKCbOBirU1KcS8vgLCWH
-kFIEmG38UVXmPu10e6iEauhhW4Xa2GeY1bbBDPYoNLKp4IztIL3d3zqNspxMTrsT0l1TYXYn
-8J8dgrfsMTxvX+IZ+wW9s+11P1fRbr2XZhxnMuh93JFnOoGZ9C0G6SL2xtJkYTwthR2UT+l6
-prymt3yPuvIxdeYlOo+eqqNF6Zp+qt9sRxxiL8JKm0t9fpTMdM+5HLdXMoq4P2SlKwtt3AEo
-5IpiGjdW08BqVf6T+uNPdKLNVddXaPZ5RPs51nSSaPMZ3KP9MEb3IqC8Og+B6mEhVY9GSiv9
-6aoMo5KqpQe4u6a2ZrRLvaSwS6n9OIU9bWNsZi/AJFsOXtrN0skVklg+qrzaTukgNZ+Xc66J
-5p27mohKYBPXB8tpMiinr9BelXCTizFf8PfmD+5ivpPG5q2kNWP1Thi+oGa4T7e0PV7D55oI
-S+gFD5VW9Jj7UyseTZdVjcu7HnTAVqDm2uGCtifWtM/hd9sUUrnLskY9vj4/5TCP4imqHpk1
-Ge6Baa4UttJ+FFGPTenyURr1tJKOaayraZwbZubycFNN6pp/5S2NgXYUgRdYH8fjXEyNd7An
-ZKGNmjVIBtPP6m/OLdP8t4j+tcNooi1Hte0/+IP9ERfYs2DcNzDS7ZQMXFoO8mluKO34sfr8
-IFjnPsGumpzLuE2YyiEFXH9NTHepritsdrjepiKPV/3sbBZLelNR9fMkBKmAzmQQFsRd+LvS
-ylMprNf8g95IN01rI//fmQqpr+21JXU/n2Jlq7ncfoSjtjvkcy9ls+ssdTiBP/BMHq3Ulgau
-uZ0wXfNfWzdL67itdFdD0+MR+k61c7brZJLxdLOZx5l2UsMk001cBt9SGjyMnfAHTaFXNPlk
-1hTWQorRQa6hO9GC/nadqIJu1hH7tc7Dx5x2KZa2BXGa3QZsi8NQt08ysWZhfshDlNhSqLdu
-UmqohTPcDuzo3uM3rjx9pTtRzAVNJ1ffnHO/mp94pvlUupjD6mktYBrdAYdfq4oPwBS4BvvB
-DdwsgqhEN4wzU5Dz00SXV3NGSlqsd9rALsdvVbfG2tvwznaEti5e/nW/ygrOKg3kED+TptwD
-2Hm4XWl3tNuCjd191fOSVFoVuIV7ovuZwxTlGuYBlzOzJGBKwVI6ChkoO87HDlgIp+N22InR
-cBvryX94ghmbsUev1R17Oou+vYPL7WbsZ7vhBJtSWf4PqO7Kw2F3XVpwX0kqyWWFrOLP4Rte
-Ao9dJlzuOmBvN1Gp5gKWdV/rTsylKe4ViStgFquf/SCFjYEPNE9V28M4qqR70UUZ6Recoln4
-ouzGvHIYN/JRLK7PFmWB/G4tHrXTcKhtj51tdq3nCgTdIGXoDBDQxLeLf5KfxPF9mcP1oSxf
-hJDmvyOutebQheqvUZp1fqa16mfOFTPjuaspLF3NXSlr+sMreq3qUBATdSvG6W4kwmAsDRNx
-pMzCN6yV6XPfzcc6bibetOO0B32xla2BA//3//HYXfCNawFbVbW/51WKKRVkjG7He+nBHSAT
-31aP/wp3Ka/NUcqbrplnjeauxy6b+YH7qK9PV1/vZwpCEfMHnKEwVKYMeADz60zK4AD4DtfL
-jyjcDvtwN3zjeuNPbiA+sf/7c/C9sbdtjj/b3KrKD6GSmwA7XEGdwBV5xr1krESJyCLuC5X5
-g+5GLc1+Q5VNdiqjZFL/mES33UNNLtnNHq5qWkgBE5Z3NBh+o+vwGQVwCqZVas2mu5lXM+jX
-mE6q4Ez+Hr/geppYGuLX7kd8pRpx3NbDI3ofbEPQS3nxqWsAjdmD17xRJsgPkhQSeASs5v+g
-AzfAr3kcZuBVGMuvMIkycw5eTK2VNE4x0w+SSI/khGbw0fQn5NAb2YqPoCLehb/hH8gH12CS
-3IZoeQLz+QUU5rdwUpmstwO9/CBmcoR53QN1zi1Kx4MgK1eESRwDKeRvmS6jxZeK0hY+kRNw
-j6NxP2fHZVrPFN6IEzgpLVAeuagckE+20GJZQgiDlFerUE/4iD1gnpJ7WawBR6AS5IXqsEya
-QWHpC+d4KrTX64/mK3DMhWGWS4FDXVKcrXVdUEqP4g1QhYfDSq4MKYWlv/wpV6SjlIGcMgve
-8ik4xBZmc30cxMewBxeg0fyrZou/lIqv0mg5TmdkE0WU06KU3yNyDd9KB33OAUB2+BJmyHf6
-uv1hDq/STbsH+5VCe7vaWEyvL7NuXDn9cU9XEFdqf+LdFejCU+A5l4BWckMeyyjpqJ/iFLzn
-5LibW+FkPoW9uKCy+xj6VXnkLF/VBHOMush6miWTaYWy2jxVhwkySR+Dy6URXJZtkgQKSS04
-qK/9vfbhnfscV7h22N7NxUpuFdZzi5XOf8VjrjPGcAXspt1/xbuhgzSAJ/JausIvcg8KSi58
-rlu+nv/EYUzqjFX1GUi/8DTdjbH0ifSg4uqaVaQ8lRWHueUPzCIVsZhsgW7yGeyTOZJa6+ih
-MzkBPflLzMSD8IpenOYJ7Ode4Bh3Q/d2L17SG07OLfSTfob3eCfUkqpwTC5LaWgnM3S7zsEu
-TqHzaI/f8V7Mx1FUgitr1mpLKzQ1XFOef6vM+JF70GvORy/4Mlq9iJLyJ8zXCoIwT4ZAbnms
-/aiGP/FKjOOIUmh+GqFq3E2/H+lS01L3Fv9WTUvOw7A/58JH//sb+6UKXJOzWk0zWQBhfg7L
-uBI25uX4ub6CuKrqCj9TIe1HU01Q/ZRIh/MqfTrQCI5TUp6Cx/kZ5JJisFYWS17IISthD3+K
-DXmI/u4HuM0VVI+vT/VdI2rtatI0V1gzehJKzjdwME/Dj5wXe8hOeK/b2Q0OykXtTAadSVuc
-zjuxKgt+wl9TomtN0dqH7NyZSnMvqqh9qMAVqCy/018zFjtyIuzkujqJXbJHKktF1YEDsJSL
-YQv+A7NzavroWpAqkRL4GPLdQCrALVUBytFavUJPDmIbqY8n5B8oCPVgKmjqgkbiw0suguO4
-O+bhxfhKM88ld1en+xhvu//0iaWbDvQ5g4/dSPT4c6zB8+EoJ4fGslRCUlfGQhqJxYc8Ebdw
-gMZq15rycqrK+6m5Eu8UXk97eTa95AGUV8rSQHmgNXTBL+EJDIFGcBAuyCOoJ1F4iwthZ26I
-UdxXvWUGLnPL9dq34kR3FYe5lzjIXVYFWKj/ro7W+AAqcAO4wxfkV+kqhfTq/9Zra4QH+D7O
-4IbUgf/Q7t2iMvxGe/BIp3hK69hE73XLikshGiFH8LKUwxKwCWZCJtXBufIc0koyXMKFdTdr
-4AXXSd9rLA5Wd+qi291Mfb++TvsHzSKtlW+nuuTqGhNgNCdKSRkh/0ph3S7HJfACX8S13IQm
-8XHqyUHTXunuF85njnEqk6i8oLVSe1We9ZKKPspkrAnxsBF+hH/hqCTFUpIDt7PenzrCIXWC
-zqo4X+v7feFGYFK3BD23AYNuEmZ0VbCaewFLXFcoxDfkAzeSgwIyEs5zPtzA53GqXtZwdYD+
-/JXppbQ9kWua05zbBCVMJVR9OmkNG+VLCstSVeCkuAkGQhCfSHH8Sarp5TTVebTGBNcI52vP
-lbBVdapjIddUs2Afff+OmF0VsLR7qIw7BJ47J7/xcGku2SQb/Mf/wA0ejEd1L7fyfGVGn9Zw
-CbNJk9ItLmvSSypTXR5RL9lA66Q9xQtSVRiGq+E9fIotoAlelT7YSIbjXR6hu98GfVcG17gv
-sZuL1TpA3/8TZbhP8Ll9AI+s3rX9Diq7+3LVdZd5nFy6yT9cCvZxvDrkWpzFtWkaX9KnkJnJ
-7c0W7mfecWuTR0qbHyXOTJCLyjDDqaDS9zwYiGnwHozBCrAHN8kJ/EqfNbwGc2tS2O1KYguX
-GtMqyz6wYdhiPZxh38E4uxOm2n5w0maDmm6vpOK6mpmEX8hp1c0VPEu1oJ7exBuqwz+Z6rzK
-NOXDWssO7cdEk06Jor4kNwvlMLE0oO5wEj9AQWXOyXAJ38grbCLP8BKfxpp6aSddJfxR3dDa
-R7DDnoJhSlcN7BmoYn+H2ra9/jy7ptmzssG1ksXKewtlN8+AydwLW3EpVZSnqnadTEE+aMrz
-YzOQ75mzWkd2GWB6SiGzX55QFvhFqTNIWTRH78RrUExpswtNlC6UoJ+iu071qduHnZTlSbPg
-VmthkH2s730LStmtUN72gDY2J+y256WRayLF+SYXlF6cFwpwSozoJZ1yvynlZjeH3QTzjzto
-PuETpiuvNTe4mykrOcwcuaWuPIH6QVZy8DvOwmSYl3rDJLoiv1MFmarX3FL9I4a26z1UUQd8
-bwvhNk2Nv1gHPbSWHnaVzqSxEo6Bsm6GhF2U3ONhSpsZeSvc0MS2UHX7Z3ecRrmiZoHrb067
-ySY7jzTzuJFJqmTVV67RLZlBDaEqPYD72om2mIGuwnIqA3dopfxD6TXTzOV2lJqdvtpKTUtt
-8KPNhfutwdk6m/E6j6m6l9vta0nqRsgqF+be3IHryztXHJa7GO3gcayoXPade6M8UNWsdH2N
-r5TZlzsaX++lvya357KTOsEA5f7s9BvuwBLKepdpLhQyTkopm6dS9jitqtuYbmhnO7vxyq3f
-4DlLSplXYISdoftQCGbbU3LVtpSa7h6z+44v8wG3VX5yEyGrXneiZYy3UyizC1NLV8psdw10
-P+qrZhXT+4gx9+WGJratlBxH0Vbl/kZ0EBOoKHYxi+BXA9BS60huLirxllRP3eT6KyOl0kR/
-ECbaodDIloVy9olUtGOlg80r++0prufqcAY+5yx3dg8kj9sLzo7CN7YAJXX7qI770qxwzUxq
-HmjW8ABTWVqZG1LZdIe8JhmmNFvwNtWlwfSK/sOOpj4uNCthiPlP8piKsosmc1p66AYoIxn8
-W4mqqW0DQZsHbvp6jf5seeBXlez2I6+yE7mji+P6PMfVlKquMsS5fKooEe3FKirh8ppZbqwJ
-8i6zkE+ZCnJI+7DCDIbxJgP2MPuximlEH+gZdaefzDFcaqLxV+XxvGa4/Kn7mVRduB7Wdvtg
-p20EpW0M3PXPySp/mUzzu8liv5hc9UHK2r38xDbm4+6tO8IL3HFp6fZDcbdAlbaB5ok3tFf7
-kJ0Xm995nykqu80pWWoaw2jzGrqb4djAxFImM5l2ElMWqmZ6Yg2zGYz5V36jwpKEevFPuMcd
-hDSuMShhQjp7Q3uwSX73x8kCv6Hs9XML2UQeaddwRVeei/BdV0p+UwZtoZdd2TE2datpuctj
-Ajza9ObNJoF3m8my1mSBaWYPDNPu9zEP8EfTmdKYZ7SEKhiLbU1FLG2Gw1XaKQ3V/bdjZiZs
-54bCQfsVFLYP5Li/Uob5faW5X0na+Glkqv+G3/h/8iRbl7u4F64fz3STpJ6bDXnV+fK7itTB
-3ddc1UBpe6nq93FTS06bt3LYTIFdpgDuModxq6lJM80lKmdKmk3UzSRgM5MH0fwIw2m4PMTV
-nAOvq1dlcMlUrw5KyP9Z5vg1pbWfSxr4n0g3P8J/+Hc4i13IN21FPqUzucHr3UsZ6p5AV00B
-E10XuuUS6RtuadbycpNfjpq/5JRpDidNPFwwY/C6CdB58wvNN4mUzZQ2A6my2YDGXIcpZIUo
-ozTCcrwMerpMqo8nJZvexFa/nr53MantZ5VGfloZ7Qflhn+bO9rxXMLl4WI6k4qy0lWDMS4v
-TnKvNeNOUMKL0lzRyjDPM9Nlm8kNh8wxOG8a4VNzHUO6mw/NBZphshs01U0Fym8643maCHVU
-u3bgPha46VpBUudLW7tJbvk9ZLBfUSr5OaS4n0pq+VFax0N+6v/vq0nk05lccn15qhslHdxw
-aKcpYI5Lo6l1C7Xl/OYf/kUV4JD5BO6brZBg6mFK7ybm9epTfu80scltxpuW5jK11N1IbTLi
-PCoGSNU0ZzTmSTDIkWrkCkllG+g80kgV/zVn8y9zPv8E1/F38Ax/FCexufiSvahVTHNPtZp/
-RXUD5ruNmgyaac56SY/5B9NZFpoAnDDL4K4phR/MAYz18lAabzY585FWmwImzpQ131CcaaM1
-TIRYTUDN8YzO472LhvxusUy030usTSKb/Hs8wj/DQ/3T/Jt/lvf4OzlgB/Bcm437upuuD69w
-fWSiaw2L9U4eu0dYXTPuVn5F2aWs2ST9TQVYYK7ANtMcL5pz+N6UJGuW0xXznjqYNGYfxZj/
-cDflxArUDDbheInGjdwVHmpoKOT+lPm2i2SxReSKn1q26G5u9OP0+wif8Y/yl7Yz/2WT8ip3
-yM3niW6cDHPNYbXyIbu/sCU3+H/SLS1fmL+lvWkCi8wbuGS64SfefSyrM6nm/UnJvKc0UXty
-nk6RoW5UGD9gA2iK3eQwTOTv4JBLUM/6UwbYTuLZ4nLIzywr/Awyy0+it3qXN/njOYP9gq/Z
-/W6P6+6WcRU3ROq7KrDAaQx167CNZo1rmv/bSFJjpaVZACuNvovZheW80tTf20R9PEtZvSxm
-oklvztB98mgY5UOH5aE91pC70J4HwyL3FbzXLNPaDhD+398G5edUDf1EJvo3eaTuxWY/ORe3
-ixzbMu6OE7uL4+0E9ZO6MOV/Ccntxt5cnaLkL9oiRUxnmG4y4QvV7speLZrtXaD9XgEz32tr
-sns9TF9T1Wykd3QLe9E7uIxvpQj+y39CCu1HXfdQNtreUsBmlDv+K9WJkzzcX8RN/frczH/j
-/vCHu5r2C5fe3bUhd86e44hdJi3c/3F0FWBRdU145py7i93dhd2K3d2dqNiJjX52B3a3op/1
-Gdid2IFid3crduzec2b+8ZfnuAq6d+7MO28gLn3FaxSQrHgL31E3tYzfqfYQonPhGX0f8zr9
-1Vznp3rqtNaxzmy9yVmmUzlDdRudRxh9p1qPydUa6I5L+KokvRA4Z32c0E7jf0w2jmOe0BnZ
-jYXuLOrmNqKa7i/bw51hn7m57Apzz4TZ/aY+XTK5OLM1vMielbsYg0spq6rE25WCfPoWLNBL
-hSfKqGDnlNrvFNevnRH6grNYBzvT9RYdrJ8r1F6ZSRJ8inGgFgZIds1KYaIM8SDKzOdqpjD/
-Ed6Olt1Y6g6mnm5q6uiut5vdYraquWXi2n/NIzl76ZHMpI5tCWdsOqxKF/C+uLcF/ER8TT1d
-ESP1V4zvjFUDHVedcJrr2854HeFM0mmdrrqHzqbXibpFY3bxXhPx3v8z6zxILm6yg93FN0x5
-7m/eUhGzg3zuCNrjFqbRbrSd4ra279xfJtzsN+XtZuPaa+Yk5bHTpRf1AcjBIeLok3AJdVXU
-eiOkE+Ucr5Op73qVau+k1uudXjrSmaM7ybmt++t8wmG91V41A7OpRTAP13JmPEmHBOlVoZ09
-yU9Ma55hEnNjc5XimIm0z80svCUb6hawpcx1c9esN9PsRlOTnsifKmlv81y7AGJtFQyle5iK
-26qPfFGdg0J6Ai7ROZTj7FXtnDx6ijNA93JmadZTpBdt9QmZicGRKiV+wDzQH2tIZpU7EWzk
-hXJ2L982HXiuycT1zT364Y6hzbIfm92FFkxeO9O8NcXsTfPOfjbbqITw1zSbH+7Y+1CShsjd
-EI7g/qo+XFEJMJ+OxEW6mEJnjWrgvFVdHKULOFbt1o9UZr1YDVN51Q7cjFehNP7gz5Cdd0B3
-CoYL1s+NxVla0bX9pg23MRn5l3uWTrsh9Nb9bRuarfaudOIfO93mpd32DX0W1s1KDaAJfROU
-T8AMopKHuJ9qA1fFd5fSjXGL3il64mJDJ6eq7gSpzzpI9dXp1AP1EHOpSdgYC+NgYFjNn+A+
-XYGitAi22PZQ3ZaDXyYjrDbvOcgsEo3LzRfc7RRgalCYAXLNfRthb4sT/WTjsqbjnJj6Qz5K
-hINoBX6kdGo4T1aWP0se6y5c/kQXwxLOeGzu7JHdvYtH9EcM0o9Q8i3exzBUWBvzQWUM4cri
-NXJgSvoKa+wZqGVXw0/TH2aZzJDZbOEXwmE+dyPVMbXoqElADexX+8f+sJEEFMKKEoGWjBJI
-1XGk7IqPKqsRvEF94WTi+2brYwBOFqzqdMfKzlL8Ib5nqL6Ir9V2LKHGYFdsgrOlhpNcCz1S
-Ry9Kgz/tC+HRfdBK3H4cWwfWmjeCj75c0vykrmYRRYn/LGbL0nFbhtpTDdJcl9ZxVaoA1SkG
-BlMDvEVnBWkF1Q7JQ/Egjg6BSXovvNIM8Z2i+FYHY7geiPF0NxyiquBxzIB/ID6Wgow4gYPw
-LRXAweTFTPRI2PAILBTkl7IN4bJ5x1OF1ycZ0ThznUA60NuuEkT8R6MokhJLel3FkygPTKXN
-cFLcWxpejAOZ8BQPUAHgqrowXM+Dy/ocvBSNO6jjYWedEP+oH9BHXYcojIIAvAJNwQ8bOCmm
-Y4Xb6Tk0pQvgs/tFIRaL/2kOy43L7c16DhHNDTd1hVMqciVblU/ZWtyYSvEzCuBBfIu8cEOQ
-ZSgrBvFqqSOb2sgH1V1uqVPAHd0IMjkjIIezAr7qzbBKr/ibBCSxdoVrGApJcTk0gsuwip9A
-Yr4Bi+kc5KEzcFjwUd5uFy84GNqZApKTfnMT84BnSnb+IKeTvcLv7GEeTiM5MWfmdZJiS0sd
-l+AFBaPmxxjIvVQFyWgdeYnkZp/kg/TOV2adGPbpNNBIHs8oDSlVUmiJjWEJ7IAnzFCVc+Np
-qoDNqRl+saEYbgdifNsQI0wc7GyOQ4iZKfk5FG6ZJlDJlpc600FlusEXqAs35x/0jPdQP4gg
-I2csbiGP2kcRSp5Rf6TTOjundBpxLieM0ZnM+3Q419QTebNayN+FwUtLHaPgJlzmUliGB+N+
-WoOV6SJes++wuX2OV00k9jUdsZrJjrXNdxhhLsFVs1X6NEnqqAw16CZfpwbcnl/QN15N02EE
-ZcY+FImdqKpqRh9Ve5qqp5JP76Mizl3K63ynb1rzAp2U4+rCkkiG8zIkcRjrIAdUwJG8CT9Q
-LHanHOqzbaQG2Y7qnSmvepufGCi1pDG9sbQpgeNNXHxpHkCw4PeZzQX9aREjx+GlvIJKQgO6
-JerYC+MSqli7URJoE8nyj3VeCnJaUANnDBV0NtBLfZkGaUt3VB3Bz2UOxdGwC4qjhjMYylnV
-C+qgOtNc9cZuViF2vrpq6qvuxsVSZjuWkzpCTRHcZwwkE/xOEJfjodM8i3JxVl5Dp7gi9RBF
-ioNP7Vo8Z2upHZJVDtll+r1N6gRSPSeYajszKKVzhA7rL1RSF+E5aoVgqDzkxB/QGxbhefao
-IK6nNtMYlZdWqc12lUpr+6sFJo+qZV5hkNmMdc1wHGeaY4zJj3nta3HA/0AWQcQmqsuV+Cq9
-4oE0C4KoEDp0GS/b4Wqrzav322P6sc3ueKmGk5vyO3XptR5EwyTfP1c+KqnG8lQsCnfgBeSH
-friQYzAuJ1ThVFEllZ7MF5cfz5ZQ/5oA1dc8wN5mP043qzDKTEGvDcbu1sHbki8b0gO+SzVl
-X2MoPQygY1CI2uJba3CjdHSmbaZX2Dv6iE3vPLIZHLIfJFsv1M0plV5II5WlR7icy2ATWAS/
-QMEAwcYldCmlmkaNVVoaqubZYSqJ7aaOmcZqtSmj/jM51EmTUH0xL7C4nYfzbRIE6gRDaTs7
-nJLXcoS4xxr0Fn7ZibjS5lMd7F3VxA7UPexDPcVqZ6PUEGO36D+2ji5EJ9VoKqgk0+EWRmwH
-/eALfPr7/1H5AP4mxnCqoOJSZzVCkmgcOedMN7XNtFVbTTOpqZp6a5KrAna37HNm/Gr7SQcu
-cgKuxvv5sVQ1neJgQdqFN+QOImxyPd+u0ivtZx1p/fqgvaUv29n6qw3UOWTyoyiFSszhGMV/
-oB2EwQP4xtWwPy+ROl7iKMotu9Lw/19JacxIdcJMUOvMVJnPDLXH/KOemyIqn92DU21c9AvH
-TqG9XJyL8Ac+QyugDdXB91ap2faQ6mjb6Vb2mm5m0Wlgv+uGNkp3tL30ZPtbRdshqjr9Eg3s
-h/v4NQRDW/gIF7kPVuInGEV1VUFao2bZxyrAJtC7TC49wQTpAaa8HmEK69XGp16ZaaqyfYo7
-bDIsTbXgJS3mNbK1bWRC8fGDjRLkhKlENot+azbrB+aHjjG/9BlzSV83U/Qfk0UH2dXSqyyq
-NkWIgqTCpzwT5gFxSdnXs/iaaqquFKUu2zS6tG2hr5mhepkZp8fLmWwG6/Wmpn5kXqtCtqZa
-YsPEE8yBnXSMe8pUskE/4fG78t7aNp26bw4LomrpeWajnmFO6Olmtf7XdNGXTUKdwC5VXWwG
-Zex/eIWKCDYOwFAoC0F4QPpQhsPUBXJVfeotyD6gKwnr/Dav9A3zUJ815/VVs0R/NRV0XmGl
-4fYWPrRPIZi+sp+y8CbuTQ3FPX6EfHY6bpAtb2pOqBKmsg4yU3VpM1s3NP30JFNK6nihcsgu
-b7Qp1UDajm25PJaDk5BQ2CMad4sKlWCfOkqDdX66pBfb3zqfdXWs+aAvmev6uNzNRdNIfzfX
-VDGbSk2y+fGjLQPDxfEECn9e4VjJSvUksx00O7COaaSSm1cqkWmq05oxuqAZojuaZnq3Sa6T
-2t1qmrB0VfqGBXg6pobU+FV0bT8mhnZqhiSsNNxVL6Bz+pcl3dcGOGntF/1aJnrBrNDRpol+
-Yd6pVLaeameH4D47TRzfRj5Nj6g3Z6f4MNSuhUemEoaYJ5jQDFe/XFJo6upkprX0o7IgLLF+
-Yo6qqradum09KpK2ClvVwkFwVzJSW/CqB7xR9eKS2tBu3Z8SOA9tMaevLeDktYkdsC/1Z7NG
-u6a2zmLPqVY2nlpls6G1JUXFQjg5zxXmuGZrQw5xbTPNWJSUrV65e9RLN6v+5TbSyU093USQ
-vt28VEntLDXVllMV6TNmFm9kuAhegyhYjGWhpjrGT1VT7qlv0F1dmtI4O21Op4lN4iS1sVJD
-lP5ghmsy6XWgDZctjJIdeQppKYEoejUuxCPpJJ+UzJbefhXnOguLmrwqqdmmkhmr0plkuqwh
-NcZcUtdMuMprK4rWoODiBFbhQRgX0uNF2ApjsQRklYS1R/pRWj+nFboBXdV3hPlGC9tUtKd0
-ZrtSp7MddU7rV9VsGzXELsaT9op4o+TwHzXiwjxdfPkt2wwK2C+wzizERqaQymPWqsTmmQow
-31QuwUkHc1x2Z6Yi01Ett2VVJ/EjefgQfuAWuBUeSYbuCanEyR9TYdxcR9NRUeU/epNN41Sx
-gY4xGZ075o/gY5u+JbxhhMvK2WO4yALGo/Iwj0L//xocUfzEhkAemxAXmyhR5Bbqt3tCnXX9
-6oibQD90tU5knqvm5qD0ZKmabgeoVpRP5eBo/MZ18CScgBlYDerLXLROKW6kE33R0TaH09BW
-dn6Z2s4pU8rZbrzObsHHNRNXJ7T1Zetnia7dgvaUEH5TOZ7P/1Bh2GPvAtopOFT2NYP04q77
-Se134+izrtKx7guV3exVI6UfSWx3dcnmUXMpBptzS8wEl+AD1IEdeIP7qOqcQq+kKdqhGD3D
-ftXFRI3YeJwP5ovs7R4d11bVFewG2bZf+MnWwq6Suz/TeR4t/BkPqtAymGiL4mNzBruairKv
-89RTwelTd4dyzBJVzPRTg0119drkll6AqkaHkCkEj0paHA8joIZsLuEO3iKTKqYXi2PLQAf1
-UXtVj7S3dUsbo2vb/3QDcVE97VW1zBZWT+0kLEP3YD2lhUzcRHzXQkoBj+xywUZuXGM2YE3j
-FXyWU3FNXVVArt3eFFNLTRpR5wA1zPoxO12XLDMPp3IFrCH76sERcEBydAcVxT/E9wTrHbRY
-V5G9jbX79F67Wc+1M/UYW1+Pt0/VCmGdaLsD41NS7Ezd4ApFirL+psNcTzz5WnsKEtoauNps
-ww7iHGuY1CrYZFTTTCpRR+f/r+gyyH4Xf/gUt9E2bMnd0Atx8RBshC7YWnrhwDw1SxxqfEkU
-S2msrkjTtc+O1edsV8FqkCj1E7XBdlKn7BXR9lJYiiJgKX3meFyRx/Jy+s1+OwzaWz+8MJ1x
-idmJw8WVhJvfwqkG/eYPVrafcLmcdPReajiH1UTfH3BhHAYxklCGwgJxYEnVLUm9IXxPfaR4
-ejZl1NUovY5DcfUT+0FdsHvkNFcP7T1Eaozl6DzMonzwk8Zzd35NtyQx1YLj9ri49dz4wgzB
-o1LHGXMFf5j7WMY+wIn2Kl63F7CEYHInHcDCPBG3cgksLPM4ABOgMFaHCPHDSdRa0bXSvF89
-ooeC4PeqHr1UKeiS+I616oltqV7ZN2j+/js0vYOu1A6O0RHOK054AS8il5NQb5gje5LLFsJY
-M0hq+RdBHMnfzZ5kj+NVe0TwcAKnUZQ4vOXYk9tKNgnAprANLkBPKCa9WINvOJUax/+ojJL0
-oumFGkPfhG1fiyc9p37ZmeqLzSuqvBVTU0GsTpHSi2TwhQZzG34nfrwHFYP39j8YaL2YwTbH
-72YufpV+pLSnsYn0YblM8r2cauKTN9NuTMbDcATnwY98EbrBELgB5aAcIuzDTZxP1eAp6itd
-EG/+TfURva9AH1QWuqiS0GSVmDKpDJKAylIZHED74QxlhkI8g5exh+PCJBoFSC9gqg3CsqJ6
-ye1yTGa3YAl7EMPsITxk96GH9mFb+g+P0jDMKql9Oj8HDXNkU1vAG/HkHYXF3uIabq+a8yGV
-XLT+BqXWy8Q59yHU9ShGlaLuqgh9FEwMwBD6LDrSCny0j9txOj7G0yg3uHY6dLcP4IfJhNtM
-HZxvQjBSUs0nM1g80BCMtKMxGY3HyeL3mCrjUEmqv3kfjJMqGFrDcCwl+mp4htrHf9Q/XFWX
-5r6is2H6JLUTzc8nieK8sH8l1UZcbk/KjnNpMtyj+xwkijad59ELRioHvewUeGkuwBwD2Mdk
-xlGmKJ4yVTG/bYz/2o6YlMLEaf+DyO3xH9mPN/wFOktyfgiToRr2hb3C40UlVa8RLv+tRnJh
-XUZq+UWF9QHy6mm0V/Wg0qox7cS6lAfb0VKYSVZySYjoSAyFcQPBxlWbCOrapvDOLIb9JgZ2
-mq/wzCTH8rYYbrVNMC31x4k0GX/ICeFeeEJmkl/SwGrYDxqXQDvhrmjZlVJKwQLhr/uSalGX
-YFI/6LE6TOvVdOlDZzqFtamanCjoTPlhBc3lN+SnYjycJnEcusNTbHZII97rjtkOR80TSfwO
-ZrG5cJatKRveDfvRBHxKc7ABj8Wd3BRTQBIMh2j4DsuhOo6DVdhGZpIDOqs3wuUb+Inqzm9U
-Lj4n/LFQHaIqaoaguys1wyZ0B9pRY5hMJziaCojX2U4duaEg5K31wkhJs0F2IaS25yCzjYU2
-4thP2pLCcm1wPY3GBOJvQnkhHuHB6JGtaA2xwheRgDhZftcdwrEM3JWPZFKXOFgt5OGqtXjS
-DFxRvSGl9tFGQVV17ECvoSlNhG6UWrhzGT+irOI/o2VjR8hMUlNcOGlrwUI7FMJtBKy3J+Cz
-/QCNKS1uoVpoaRDWlJwazuNkHh2ROVD44hX8B8fgOWyArFJLH2wlmpIDGD9xCbWbq6qBnFsV
-ZyN/ey+ekjQ6Q1JYV9opKagpDKK3vIX68meKz6XEhY7nvlJHEgK4aYvBPtsW9tvJ8NoegBL0
-DaZRfrxNXTGT+N4OPF+y6ni8IzPJCokFDXfhFOwDH8yHUtjj/97rLCpAdY3TqWUcIJz+GPPw
-Ovwqs9hHAdKPI9BHWHLg/3uxk29TA07L8bkTX6D1HEbPOZ98BKkyxNqewHYxlKaLMF7s8Dlh
-mQTcExvxCJwtfi9aavBCCmwBt2A9bJZKZgpG+0EZrCs7mw0OIvFTvC1ZZRWfwO4yyULiRr5S
-CjxId2ExLRDerA8bycdPaQln4zrcgxNyJB+nZxxKiSTDF4QEVBPiUGcoIhs9lHbDcXoJHk4t
-uAzCBVwarwtvxgMD9eA0LJO32zAR/DAMMmMvaISCOuGOLeKAtgmPzcbDor6TZbNriBvxCMPc
-ouFwWFQ8in7wc1rDabgpN+f0vJBf0lleSW+4s1RXgVCuHw/qU0apuIowSxhk4Ehoz/dhtTzT
-Pf4KXvGbReGgJPcI6cQ80ZKFwhvL4Q8shpw4A5rIznQRvDbDklBc8JoEz/EzGM67oTiHg+IW
-8IEC4Tu9l/3YwOW4H4eKvs9nR7LaKZnSHNrG/WmT4CRSdO4E36BY6VUeqMq9YAQvhUh5pst8
-HGL5MGQSPITA4f9XsQ2ewXn4DL+EQwrhR2iND4TTt0FNSS7ZRetceMCXYRSvhcI8GAzVgI/S
-eR+d4xQ8XrBZm9tzUh7GV2kMz6ah3FHyUgPqzl1pIK+VVP2GrsompYbO3A4ieA6cka6+kGeM
-Bw+gBryHcGHwHZILokXhPwtCc2IZDMZiOBCTYSe8Jb2YLZgpBVel+ggI5d6QmSuIr0gg/Yjh
-7zSZvVJDZplMCX5LFXgbBUlGySNzySoZNhevoVqyReO4JF/k4ZwZDnF3eM//QgBcgRzCFc1A
-4XxIJT68MN6E2vgWWmBSbItVpIrOKMyAybEEXgWCsdKtNJIoN3I3qMmlwOEE8Ixu8025y1vU
-WjgjB38gl35RDH2mxfScwug+9aaHNJN8dI1KSo1TuBW/40VcG2J4scziLsSBeOJxcuEA2Yo9
-0BjvQKjUMBzj4WisgMMwFLvhcCyHIehCDkkt76A+7IJHPBoGcEPxuzmkDz/4urjNSzRaaqnC
-zyil9OUz/aRD9IZm0BMaSs9oivz+FOXlxDyEm/EtnscVIVpw8YUfgQPJMIPcf30oi/OEvc8J
-Cp9ACPpETQKlD82wAfbF4tILB/PhafgkHuQApBZXtpObQRsuIjNJApbeSacPyhnLH4UzvsvV
-fhLRUzpPF2g1HacFdJp20Sv6Qjm5CI8UBL/gVdKL81LHI74HH9mDCSEtSsoVLQnCjZKcj0st
-b6SW9DKNmtKFplhD5pEateD0LkyD7ZBLfEA0t4XRgos6nAVys8sp+Txbmi1uqwu/oNLSG5ci
-pYLF8jaH5ko1u+k2vafcnIVnSWYwkl5CYAVvga38Di5xfOGMdKIluXGx9OQE1MMv0ArzCyJ7
-Sh2zsRVOwZLSGQdzyEc/iy/cCXGhP+wVXISxA1X4hvDVcg7gYEFlID+UPlyhaNou81hIITSd
-GtEi6kvH5D0BbKTKWoLPOVxQrj0e/vAZyAbfoIMkkV2QSCafDvPI1etjefwH6+FqmcgJ6cRh
-rCp1ZMCKgpjf8K/wSl1xZT5OCPv4qnj/CG7J/WUvynAijsNf6IPM4hJF0UpaRoMpnLrRVBpD
-G+iEYCS1OKG+4gyj+CNr2cxiwg4txf9PlR25DCA7kUjuOIdsRGW5ejB2F2QOx8FSz0CZSDD+
-hiL4n7BZsOSWuNAYjrGCyXxcXN40SUMdOA8XlRpActET+k4HpZJwOkmid9RautCNvtFsqsTX
-aKF4oReyJ4HwWTivAYTBCqnkFpwVJlKYSvpQHAtiG3kcI1hcJliIFMbYgWlwFV6Cf4S1yuPf
-vb7LM2AO54O2fIfLSmfzC28HckZOxU8ooWhrKp5I6bgJxeOc9IcSi/dJRum5KAVzP9rA5yQ/
-FeT8sJbbQAZRi3CYDY9hD2QULNaSXvTDtLgSE+MljIufMSFqlQbjqYTow+vivobARMwM+UV7
-oiCca0F9fswFeKJkkJKcXfYiszicNMLW2bkKFeeU4rre2EC+YLPwWVuMn9tunIl2iBOzwifl
-//8dp37zbBgjnf0J50QpfsBczIpHhCXfYi5MJ9cur1JgXZUea6t0WEh9gd+C2/XCK9XwFl+V
-zWggrv8mu8LNj+XObwsWrwsrnaMGgsms9Pdr/77RPeujKOvwXpuNY2wwa9rCweSFGGoJDXgR
-POdT4refgRcJBgsSjgseP8o2JFDBWFRVwcaqMLZSebG+yoPFVAJEdRT2CKe0wOf8HsYKc2cT
-bD2k4bxDOr9SkLhK8LeKatJa6f0x+mRfU4xl2m2TcqQtzEdtZ/5it3BFUuIBmkMuXg4H+Iow
-9g94KYzVRpCwBdvhPUHCLwzHVGoIllEd5fpNsI6qjWVVUUyrYuEBDhcX6BcfMJEPQGIuAZuF
-pbpQfS4rSCwo+M9H7SgPpabK9MoOpBP2X1pvhSvsc1pp0/BJ25W9onedqRDcpTnQkZ+A5UzS
-4YYyheGygRvwFN7AF/gBGZ9jDnUWq6oNUsM0rKi6Yy6VFX/LbmzCxMIjY/mFqGgX8UtPOQ/1
-5O/WIxPfTe9sKH2zuSgufbeV6KYdT8ftLtpp78qJI9hoKPPYwS0kv0XRdCjDb4TzimAnUYsv
-sEh4KUqqeItnMY66KxP5LFdMqG5jJrUfM6sl0puuUpsLMdgexuBRzoW5+AgspwqQV3zlU9uc
-j1g/HbBb6KjtSmeljnfW2kB6Y9vSbTuOLtjNdMV+pC+2PheQXoylOvCWToqq58UvPBknwA30
-YjLVSVA4H0eqrbhAncSp6hl2UqAKqaTKj6nVYUwhszEYCWfwPQ/HItLFSbQJvtpcMNlu5uq2
-EuezbyiXXUh5bU2qYuPTGPvGXrY3bHI6aZvTYRspGMnKxu7jatQW1pEfUovrXsE/sQi0VGdg
-lSqLV9UE/Koi0S+TeCo1rFNaNVGZpIbcag3mUUGYQS3++0o6vAUTc2tx/5/hiu0jGfQl55bt
-S2qJ0ts1VNDWozrWoan2ln1tj9rKtN3Ook32Je2xjfmhvctZ6B8YQSnxDa1AQYn6yW3VTFiq
-kuEhFYrn1XI8ow7iJnUVB/z/lRwDpKLkqh8mVakwrloOH/E778Ry3APnUULJVQskYySA+nYq
-BwryMttDlM/2pAo2O4Xa7zbKPrSZ6IYdQJftScFITtmP1ZyXSsFoegLPaTA25Q/i/BuoHrBC
-WOCCaopPVDi+Vv/iPbUDd6tjOFDdElS8le19L7v7HL/BdckqG3Aed8FrlBpziodeIRmjlN3O
-P0xpvmZuU4yZQHdNJfKZpFTZ+uwm+8smpj+CWNdeowRUj0uJIx8nu3GHSmMJPonruajKK/lz
-F9wX9CvdDdPoSZhJz8e4+m8t+3CWuoYF1XM8g29ET57jMUklxLOwAFfHUPoA5+0/0MB+5t8m
-lE8YH20xEbTVNKMTJhP9MX7byn6x0dKTIrIvS8hnk3FaWsvNJS+sJUQ/RWBbzqBu8GzVGj6p
-e5BPl8Amuid21xOxs16ElfQ2BH0V16hPwl5GtFSpAvgH+8NV6cVs3E9l8Ye9Bi1tPXhtjnCE
-Kcdh5h51NjOpt9Sx0BSgtyYNhQgy79oUVEs47ARloMZcVRLBONoDF6gzZuDvOI7D1B9+qQZB
-Mf0YOulsOFrXwMm6PfbWQ7CoXob3laQf9RBfY6woqR83wzu8zIfxBQ3BBJQB29hNcNdkhclm
-KbcxebimuUn1zQIKMx3ouClLxW1u2m+zCI+loghKQllEPw5xLeoDEykXXqRozMYt1Cy+qeJB
-kJ4MvfUrmKoz4UJdEyfoXthAz0GjomQmbwWVAWqEcMZ9CFRJIJ7KydexCk3E8TYTxpplMMME
-QCszhiuaJFzWHKJWZjBFSA0JpQ+LrbHpKdbOp2cyj8d2Pf+Q9B5ISSXXnsNd1FGl5vdqAbfQ
-GWC+Xgjr9QdYrQNxom6OVfVkwWkUhqkf+A4zqhaiaUehsVRcU1JyGtWcYnCO7Y5/zBuYZxpB
-B3OQG5oS3MhcoT5mHG03VSmVzCFCashDX+06em3TCbMt5U82PySlh1CbZuNcyqtiaZvqzOn0
-B26tB0B3fQ/a6CxYUTfFeHo0HlZbsK16IFyKwt2Z1UsIUk2ghFrOqVQ03USgoTIPL74yw2GD
-ecELTBuebz7TBrOSHpqOwhlFRTVSUnph8qkE9JZ+2rr80x7neNQKilO8v5+Hk7zfUOXjG+o/
-DtL5oKteCX31F+im82JtLflDj8MTaju2Fi6/L3hoLvwdDTlVJkiv6vNXeYZNuM3WxFT2Chw0
-1aUfR3iqqS11fKPDZiexGUEdbGO6b0uJwucUj5lKPE98GsGJKQBy0CGoR8NxKuVRD+mYqsYl
-9VEeq0vCQr0EpglGQ3VKLKarCncOwkFqozic2+L9jeSj9KqU1DGEk6kIeowX7VzMZPNhpNkG
-w0xu6GO28iBThxcb5JvmuPD4eFpum1BaKkTjZT8ei8+oyn/sCdGybpCZcmMjeocraKEiyqH7
-8zQdywd1Rzig98Ny/VNmkwdT6WDcomZiTsHGNJlKrGCyGWRWazi9ukw/8KfdjSVse9xsvkFX
-Mwiam18cbKZKHSV5o/lOsWYrNRLGvGSri75nE68Rh+KKfkxka7NAQnoGxWgnDqR/1AXKrEvw
-er2Df+k8EN+ZDX/0fbikE8mulsGsugeuUgvRiu+qgw9wpejHB3YxHb/FIDqAnew/eMhkwOYm
-EoqZYlDEnOYKpid3N4G8zrym3+Y/4fB/6L2oWGsqLd4rB1XjzPSYc9FyqEB9sQ9VVQdI6zS8
-Wk/hpA5CdacfVHFOQTbHD28Eo9N0NUwoXDpA9G0/rkA/bMNqcACH8h6cSYtwje2C900WbGBO
-QlzTBL65z/mTO5EdU5GDjJdHmhh6JTjtZUfRB9uRuov3+ii1hAt/V4Eqwv4d6LfM46LsyHjd
-hJM757iPUx6mOCthmPMUGjri/YS/puoK+Eu1xiqqv/ifSXgYFuIfXoHJhTf/fn6ypK2CU40L
-2UwE/HRLwnP3Jr92x3JcU4GrGMXLpI5Udq3syTiZSDtxYOWpnPiKj5yPDkBZWigKMFAdpBI6
-Hd/XM7iRExcmOSNhnHMN2jqAKZwMuEYXxRS6NvZTXXAXjhdPvEJ6sVP81UFcQltwp52GX0wD
-7G3+QKCZB9bNCa/d49KPUE5qMgt33KUdoikFbX9R8+pUhjKKFwYayL9saQBKhYFksBfdlK2f
-qctxVucoj3bKwBJnDUxw3kgvEuBn4a7uupzofAvxPmGiY7NwnWjpdxbXxbuwFC3GLrYbnjCp
-sIPZDXlNLUDziL+4Y1iZwpzfvKOBZhM9MMOpnW1BL20QhVI6SYRJxJWlomXCFxMEm31UDFXQ
-ZfmT3s8DnBKw29kMBxwLy5xAbO6UxEe6uvBnY5yv2uJ1SWZpcQCGwjBcy4PwELXFa7YoJrBf
-YJJZCmVMafCau/zCHc3P3GJM7ncqbA7TeDNbdHUATbTBsqk1aRNVorZcg/JBCMXH+fQHX9Nd
-VY8X6ygu6hSBhc4K2Ol8gpVOSuwr80jgZBJdyy5alhezq2KSDsvjaclKyaE+lhVNb0yFcYSN
-gzfNOehh/hFsZIZYN4ZvCD7vuzXZuolETx7SCnOAstoI2mcnCHf1ldzek85zGG2AuYLw8xSu
-UnGIHsQpnDu8wgmCh85kuO8cgL3OWejuRMNzfRXK6ycwQfzPEfz7IxXWlSwWxqVwNJXE+TYQ
-rxof1DL74bfbE067qWGLe4n3ujP5qduMA01WDjd/RM/u0FZ7kBrTCjI0jU5yOK2EeaKEOylM
-vaPmuiSndObyducDJ/RUhoyeceB3ImCPsw5KOttgpj4Gl9Rt8ONnyIPxsKf8vIwr4Uaqhbtt
-VXxsArGC+QwP3E2wxg2Gya4XZriHebc7jH+4Fbm+ScinhDda2dPitNZLYp9BjXgMZYWxxLCI
-PuJpeqTi8R7dkbs6h/itkwIyezpBUs8c6ckqGOpsgCd6F+TRZ6CjqPkcyQkXIS56IRsGcmEs
-SsWxic2FEUZhdnMJ7rozpQ+V4F/3G+9zt8m+hnEB8TzzTCJOZd/TDhst89hKv2kpHeY54lSX
-0GhxScOEK3rp8hzkzOe7zhsu7ykNTT2DoIhnBjxzFkAL6clavRUeqxMQoG5AEUnQXQFwEifH
-GeJtltt0eFFqKGzuQLS7Eia5LaGTGyAnike743m/W1f2NR3PNj+ogL0pXuswhQs6a/MqCoQ1
-lFxqSKaeU0qdk316CO92znIZTxoY6mkPAz1jobRnKpx25kJ6qSNYbxdcHIdVeANOw0d4yRrf
-UhJ8bVMjmSRYzfyA4+5ZCHWnQ2m3ChR0fVzNPcpD3Gkc4wZzddnZFyY+L5Mk1IRuUWI+Qy/5
-KF2BM+Jvnvz9Nzc+ppvxVGcZ5/A85/GevLDM00pq6QSZ5Ex1usI13QdQj4K0ajYUxfXQGI5C
-G74OTeg5tLIfYaJ5Dc/cGOjnboYc7ghgfyVANyFkd19zZ/cUR7uruIUZxXFsWz5vK/JUCuQ2
-HFcS/m9qhb+pv2BivC7GfZ1unMuzlDd5bvBLj4IHnsSw2BMHUsuveziO6Gty2K0KgKR4uAmD
-4Qn/C9fpLJy2b+CW8UMK4c1J7lvIJLU88K+AU/7OcNVfHIw/AdRzH/E5wUhvM56L2DZMtixf
-o5R8kr/QPXhMjsyjiLZUwcnNKTzNeZdnBif2RnMW70f+6PnKIzyf+Zbzk+M5ARCo80J+1RyK
-S4YsB7uhCP/9ahMHk4nfLGly4Ew3NcZ3Dez0X4FJ/lkwxd8Itvkzg98fy/3dA5zcTOKnpoWk
-9CK8hhLxLH5B/8IpuirM59EXKND5Rsk82fmEpxUHeZdziPc2l/J+4sueWC7o+c5dHAVjdHYI
-V40gHEdAOKyDUXwZOtN3yR+JsJ1JjyvcFOhxLSz234aW/iVQ298EuvjTwzr/J04k+FjvzuFQ
-05Wb2yrCmLm5CAdwELyk9niLlqhHdEYTXXQK8GJPB87jjeBh3kdyAHJ5HVji0fDYSQSOkxdS
-6VaQQYVDOtwGCWUq3+gXXLdJ8YLJip/czFjWDcBd/sfQyr8GCvqbQzF/YgjxP+I9/h1c2p3A
-sW4bvmyCBBcZBZUePsyvxd/copzi83ppQ3OdgjzR05XLe1fxfu8zfu5NCTu82aGINzOM8WSH
-tcKnW6WGTWo8LBNsjobj0IrvQz7JxwmsgZTGQnX3DazyR0Fu/2R47qsAV33f+aPvBJf0/8v7
-/aO5pxvCdUx5biDptDVl4HacgEcC0Sn0cEqdnRs6jbm1Z7L04Sgf9BqGgFLwwdsMhnsbwEVP
-NfjmVAOfbgE/JC+9wxlwC5bAIV4rbLMdhtr9MNQchBXuFnjqnwZN/MHw25cJrvju8x3fJk7s
-X8DD/RM4hdtHNCWYL4gnvmJr8CWqxXe4BifButxDhQhnjuXbTiSf9Nzhvt4AuO0tCx+97WGt
-NwSSeOtCPU956CK+p5duBKGqG3TFAdAK/oGqPEbSzFRIbWdAPhMOLd0+sMFfEQr548JH30W+
-51vIP31jubp/JJ/0D+Jebn+ubPpzWTtEHFY4F+P53BxW8CbcxAGio7WcJ9xG9rGYNwecl+sm
-C+gH7A2DBd428FF6kcJTEjKK58ioa0EK1RQQm8BrbgpR1A6W2q6w0HSHzW5buOcvDeX98eCx
-7ybv8q3kfT7Bgm8St/JP58/+mcLnc3iLWcB77CreS5v5Am8T9t3BI9QBvqUvcIDnGWvvH5lH
-asgRUBZKBtSDt96S0MibFsZ54kO44HOEzgo9VEmoIy4rEGqDn1rCFdsLjomWX3OHwE9/R6jq
-LwPXfYkhwveQl/v2coxvJxf1H+Iz/iM8yT3EA80+Hm338mQ6yNP5IO+F3RxXbeYOegsvEQ1b
-57nAA2U3fnpdzh2QFsibDsZ6PXDe84cfO654wQSiqXlhN9aAmdAUunM7qEQDIJ8dB2XNZGjr
-Dof5/taA/iKw3Ue8wHeWN/siZSabeKB/HadzF/NXdzZ/NjPZ9/d/f9Myjg//cl1xSmvUJn4j
-OSie5xb7PZ94rTeuXD8vYEA52OgtDAm8maCcJz3UcnJDDV1VUmEHSCK4eMNhcJJGwkY7DXaa
-uXDTnQHa7S87Wgs++NLBAenFPt9mfuNbyg38c/mFfyz/5w7kRaYvr7YD+T8axVt5Jt+FZZxb
-reV/9D7e4FznnZ6PPEqwaaSGXAF14Ku3IfT0locNnuJwyKkA+2VH/lP9YQyOgfowErLxYHGt
-Q8DIPNKbgVBLcDFN+iAGBHZKHxb4pvNGXx/pRVce7G/NudxaHGCqio7U5KTUlFNxHy4KU3go
-RvBVtVu8zQ0u6/nBhb3J4IHcf/GAplAwoDvEyI7kkl1t5GkIwU4INNNhUFJNBK/w9y0eBJHU
-B+YKLpaZbrBPfM1TwWZBfyLY73vAQ3wRHOobyMt8ndnxt+M1/vo80K3EPU1lHmTr8zjqzst5
-Cj+AtVxWHeb5+gFfdwBiPVnhgrciNAnoACMCRkPFgHGwzdsfnnh6wStnMNzW4bBXLYZRuAIq
-wmxIIHv62g6FR5IHv7ihkNStD3X92WUWP7mjbz9X9I3gVr7WvMNXlyv5y7DHzc2/3BysbW5O
-S2W5FHeQqYbzdfyPS8l+THV8fMyTE05768DQgN5wKWA2HAxYC1UDlsE47zSY6pkGYc5CqKdX
-QxK1Ds7BQunkCGhF3aGCbQWVTG3hivww1m/4ivBES99cTuVryEl82bi+Lxlf9CXi8X4t3Km5
-v0nBU0TLNlJHli3i4niV1ymEAPH9TT29YaR3CbQP2A+vA66AE+cJHAi4A4kDDkJW778Q17MY
-7ukFsFjNgpo4EvzcFo5SOZhvc8I4k0Y8ZhxY43/Fj32Hua5vDn//047v/Qlijy+3zKYQ5/MX
-4dRuEc5tKnE9G8zDaTzv5P2MknRDVSq4qstDGk9XqOINFzyshGsBWyBhnL3wKGAn1AlYCF29
-g6G+pzukcnrKnvaRBBIKuSEE3lFtOCGpaqcpCgfdgvBQtDOr/zfP8l3mIoKJ5L5eXMZXj9f5
-qnJdfwXOL7mksCnOVUVP21AwD+YJvBx28X18xFm0ggZOIHT21IFm3l7gDZgIXQKWQCeZB3mX
-Q2XvRKjtGQYFHPHj4rEO4SLZjrnQmMdLyu4N1WwbaG+awUy3Gtz1Z4Aq/ncyk9082zeY5/oq
-8w3pRT1/ZiZ/Mn7kxuNrJg3HyDwuU2u+zzPYQBQXV2+5i04iebQ0TPd0hFDvOHACVkDlgF2Q
-IeAwLPFuhmiZxVVnqezpBpistkED3ADZRcsS81hIRj0gt20H9aSOSW4x4W/LNf0nZS6jeKev
-FF/wxedMfj9F+mOpn/uMGpm3VM4yFaHsXJiDuTIs5t54iVcpl8+Kf3rqtIFnnsmwwRsJaQKi
-IWfAI7jqvQ/ZvGehoicKSjunxFucheeS1PfCWljFU2EthcIhweZ90xTimMrQyE0uvuo25xUN
-vS97ccWXgLX/E/XzP6c07k16716jaKljj03Em6macFY4n4Oz/BNdzqzzQwWnA9T1zIKC3p1w
-zntFePOt6OpnqOd9LBpyGeY5lyBcX4JukgOqSC8KwTQozr2hDjWBnrYWzDHiJdx0kNd9ysv8
-q7mwv71cPxOn9v+mDv4P9Mr/ila6L0jyPFW1GTg31eF0PIkzwhkui4a7qpwwRdeDf51BsNyz
-AFp7t8FJ7znR1fsynztwzHMBXjvn4bPU8FidhxO4F7ZDBOzlcRBDXSFWepHWNoFWpgzslT3J
-6YpK+qdxN39NbutPypNkHi/832iY+4YKmvcUazQfsX9fJ7yVaNlcXgjRvA9/8x2VFr7osvDD
-aQ8xntHQyrsCwr2HoKk3RjBxAQI80RDo3ISc+uHfr6kEhhPggc2QlWdCXeHv0XaAaGpnSCd1
-THddji/+cpN/HE/wV+MF/gx8y5+AG7su+d23tFvqGGotNRKfVZJrC3+P5Rq4mzupezxEGx7j
-5ISengaQSjxFb+9i6Ow9CMp7HtrKPGY5j2CN/gpL1G8Yj59gLDyA5XxMkswacO18KGenyEx6
-gusWgjA3VvZBmMDfnyP9pTjGn46zuQ5vc19TU3OTtL3395UqaLlkgPHcQDoqHcGjvFq94M06
-Pqx2SkI/Twh8lYycyrsWXnoOSV3H4bBzDmL1XYinX0BC9QBS4nkoC7sgjBfAThoD3+0IqGT7
-wCpTDRKaOMJf1zijG8Ef/V35k78iZ3DziK9IwCnNJ9plXlKI/UZZKAX/orr8jGfzc7jIn/Ar
-/1TJ4LsuDXdEryZ4RsEdz1K44dkOkzz7JLMfFE0/LxngNqyQfLoJT0A0bAUtnFFNNHWi6Nl5
-2xMy2AYw1qSEj+597u5GcgJ3CL/21+JYfyEu4KbjNa6PiplndNO8oZlWc3sqytU4jCsKwurh
-cw5RzN3EQwU7NSCXpxts8YyXOpbBHs8G0dJI2OfsAXROQwkdDY3VYQiVHYmQGh5KDam4I9Sn
-NjBLanhisonXecWr3H2c3Z3Jj/ydOdpfh98Lb9Zyc/E16Udf4+UsNg1/suWEtwbxCd7LF8Sp
-PEMNv1RG8ddlhTNawAzRk2cyk1eeubDesxByyhnhrIZDkpMfq63wBVdCYpwJlWAYDOQusEp8
-5zXhz9S2CoSaxHDKfcKF3eN8zb9SMDqBd/uHsN/fjYe5VWUmgXzKZOFpwp09qSW3kHm0gNPC
-W894ivrGSwQX8wSfIZ6ycNfTCPzCo7c8PaCPpydcdAaK3k2CAqJlZdQi8ZwLob/0YhVPhgs0
-Dn4JNoPsZJhiOsEr0ZPGblx4Lzwe5T8lXvM/RunLcLczpzeFJAMk4ak2MXekHFyLG3FJ0fXS
-uIVrqSNcX1/hCs57TuQByWEpZD/zwE5PaWjpqQrHnMbAOhTy6+lQXa2CVrgJxsAOOMy7xPtu
-g1K0EybZA/DerIO2ph/ccctDHzcNlHDfc1H3ILdyZ/Futy1XNBn4iWBior1Olem+oNPQRw7i
-K9CLz2I4R6kIXiu+c4DzmBN6XMlGaaG1+P4M0pO1TheZlXhbvRH6CWctwVsQA/chLTyCPnxb
-csAVSE3XpI5zwGYpjDJtwGPywQ7Xz1NlLtPdv96/rcwiCy8xLyibPU7H7AkaRU8kEaXidNCM
-NY5jHy7l5+L59ujr3M35zPecBKCkF5+dKrDOaQ7ZnFAYq2fCFbVD/M0JaIinYQ2clB05Cu14
-NxygHZKLdsJKuxjS2BBYYPJCFsN83Y3hne5SPiA5KFYw0cTEl3k8ocb2Nv2xH+kwpRNlbyEu
-fho3Eq9VSTxfOn2H7+lvHCo1HHQkF4nGrnRqQVnB6xbdG+LraRCi1sBG3AgWNkE34c5LvAHy
-8nqYJxkxLm2FCYINaxrJvmaDDOYrv3IP8AN3EvvcFlzdpOddsqf5pBdH7BnqS+8oL+fgWPF8
-F2AS78DlHK72cg19i1/oH1zHSQqDJJv3cCpBTqcZ7BFM5BBMhKtIeIZRUA7PSAUXIbNMZhqf
-hl90GgZSNPy0OySvDgGwFWCJ8UIjc5aLmClc3DTj9iYz75R5pLZ7aI7dRPnojCDD0Awux42h
-H+fBGeziRj6gLnAb/Zmvi9dI5uSHTE51+KmDYaXuKzVMEZ+3EZTMoy/GwDu4CmFwDX7zeRgg
-PP6djsNI2g2KxsN0Ww0y2/gQbWJ4qZnO001jjjBZ+bb5SPntAZprV1EK2kE76Sk15mzsl14c
-Eg4fhVu5qLrBt/6++pgOhPW6JpzWnWCHHga99Qxw9FqYqKLAxfswAN/DN/gEk+E9ZIDHsEHq
-KMwH4bjMoz5NgodSwxCrIKs9zR/MJL5r6vJTk5HjCmc3sadps/2PUtE2WkP3KIgz8Fnuwj0g
-glPiGT6A77mBSgGXVXm57w7QSI+Axnq2aGgE3JUeDFQHQatLMB/vQS450dKH/qKriWA1rBPf
-V54HwBVqDe0op2jKe15gd3NNO5Yz2oacwObh5DYhl7GfaYi9KjoWQ0EUK9jMw5U4lK/weh4I
-MVLHW96ODpRXgRCpqsA31RJS6q6QRPeH52qwzGIUlFMz4S6ugjDBZnLhi4OwDlrCfPjII2Gi
-JIo0UsdqCobCVFA0BSHU3ucCUksSO50DbCinkwxUz+bkhTaA2cbh6RTI6bkJR/IYrifs9xN2
-8EI8zvnVfd6sfrPWiaCUziR5ND/k1qWkjmowQTWH1KofrEfhSFwivfhXHPgqqWEujBDfl5hn
-wzKaAbmpL5yUmXS3WSC7tTKHa9KLtZzdjuDWtgFH2oycmhSvowAuz9k5huvKnvblP7IjU3EJ
-J1S7eKy6zdeUj1n0Na7OAW9UcdHQKv//TqJHsQdUw4lwBZZDZ9lT5q0yzX9lFjPhLYXDfMFE
-eeoPP2xN2G3Tw1j7i/vbSzzRRvAGycUPbR3OJb5mEv0mS59pMiv2QE5JVQ3YB/15AE7he5Lb
-i6poDlPfeYlKCatVAZiiKkINVRdeYwsYjt0gIY6DSFHSpuIrHOGrw7wfBvEaKCb9+EHTxWeM
-gkGCjbKUCxxy+Zn04Y1dyYr6ck6qx60oFy+VPnyl75LIFF/jnFxceHMJjJdctJ6D8SRvwNf8
-CpOJhykFOVQLyKl6gUcwcQaHwBA5uXEsPBMcrJW3brABcklP3vBo2ZE20I2rQ0Z5xluUSnry
-luvRUU5IK/mnHSY1NOZMVJqrCxaH09/vVBSX83BqXiUTiS+K3B8iJSvf53L//x65GSEGq8Ev
-uefE6u/nl6dAHDnXcAxMxL5QFDvBa5nEGugFbeUkhQ5wjmvIXeSAypwQDHlgP/l5JD3mynSE
-PbRe+jCL/9g+nJ2aSR/q8WLx/a+pDNfhynyaO3EZmMcRkgFc+M5NMCnMwxwy91JwE+vDHQyG
-G9gOjsscpmMt4ckg4agccv2s0BMKQGEoBZ+4rPSgOPTkbBDEKQE5DVyi7LCOssIYSgRNyXDh
-v2pJV7gdbeUZtJyjaDZbGikusw/vk2SYW2qYAvv5rjilQPHfnWRHwzExLMUMsAJzwnLMB4sw
-j8whA5TCuBALf3g7fBNWAGgBqSCdTOMqFxG2KwJNOJ/MopDk1UpwjOrCSqoCQ6kwNKKMUJ0s
-d6WrgoWtfIWWcvz/K1dP3sMdpYNhPAvm8kvxekXwDofhR45AuQ56YJvUshFTwzpMD3MFI8EI
-kAg/8Sl4IXXHiieKDykgUFJlSejBVSA7V4MPVF00tangoQeMFv/ZlzpAa2oAzakYDCevZPo7
-jHyIq/IaSaQT+Kn0opqw/nb4+3pR67gunuCJeFNw+ZC3id9aiS9kZ1/xcHzHPeWxvNT4U6a/
-Ho5xe/HIeeCL6F86WCETrcyN4I94zdMUIjzRA8aJDx9Bc2Ues+UIlkgQTGXhveClhCTiIXyY
-D/AiNtyfa0MH3iS+RuNIroMLeDxu4i24hw/hIY7EYzxb6hqK0dwDb3AtvM1xpcYDcJO7wVMO
-BIR3MoOl3FJyYT+4RyNgCY2EnvLYgCZLNloCLWgFdBTu6kkDpK6acJASQADf5GaSRlfyLP7E
-vbi8THHF/31ND26FE3kJruHzcv2neJFv4D3eiY8lmzyTXnzgDviZC8jjU3jFE2QeReCr9CE5
-rJRZlOCGkgvbwihqD7WlH/nk13klM1egoTKLsP/PZLLgYx+lAODHUsM+XitV/ObJ0of+wjB9
-OAGOEp5ayFG4l//IvaZTbzmZ+sOvBQO7kXia7G139HNJjOUv8Egy5DUuAdf5A7/jfzkelJOu
-RFNJ6EWVoYBcy0sVgYUvkwtflaKOEEItBB8VYBOlhU/0hmvILCJEr37yUql+Gm+U7U6GM3kS
-rhZ+OsJ51AP+H0dXAW0FtURn5ly6QbpBkJYGRaRRBKQbUUQkpJHulg4JJZSUkgbpkO7u7pJu
-uOfM/M1frPufrr98d+6ePTsW791bU15YXYlBuSQBPeBYmCNqQ/mZ1QUmyYDRBlqPDLIK32Ob
-zbcr+J4EHFIB+xzEWpD2hCK0OHxGK0INdIEWpOhnOYFFHa1IEzUD5nhm1eyELbc9lgKs7k4r
-cBcrcJeb7CwftgJyx1pLsAESj1rBN/Li6yN+i+583/pjPyV5h92lpdYfzp2GFtoBzNEdDI9n
-URuviSifZqL/Qk7aET6mbaEMnUMfiWgbeGpLqo+bGaEF6LRGqJidAwo7LdhmcHwlEtFiK8gr
-wcft2ME5qwfP6A0cukpiKisJSbGPreDCYD5vFZA53sJr/6A5VhyPW7bSpiMJlMRmdqiAiyno
-SfiIloVCNC6Uo8nhW1oTetLVMBj5sxt9qvXBzzx0C3pa007bFmCRmzbZOODAmGEIPDyGnLFW
-6EFLJA4dkBS0Co8emOdzuWcx5agd5HXYyyzoyVjbQ0PhvWOwifn2m+21JHbDekEbfUhJ00Mu
-ahxKUKVQhxqFzsi+wzDXMMzSmbJqDRqo2eilmrWxJ3YX839L1+wkPKMhX7E7728AfFyD570r
-cfGI0Bp5BD89YMVkITLoGFvD3ewH3BJzU5sAhcpNg4DqUvDilC3Tl5ZJk8O/C1Dz8CW6ejPM
-MZTah7n0J/LvkTCf4uoYaojd7IRmFLd0QCAh5UYamI5Ekpqv2gLcYz65YhPlJnLmLXuAfz4k
-h2yCLLEGMtKySQe7z01sDtewqlwV3KhjA5BD0tE0WwB2pLLH1gde8SbkpQmhAlUBHwpiF5+H
-6dQkrKTBYQ0tDwvoQRhN5bU5rcS95IDizQO7MiERzIQGFwP3z2Lv38sp2y3HLYY7ZEncNnsK
-DHbLCJsq7a25fGNZpLodev93SFwd/PgW+j0AzrnMeoLvh/Uh8kpcvO4c6KZl6ZVvRnf8CHxd
-gk70L30RdtHAsIlOAZPy0LN/wdmK2Oph+5LqAJEHlAyeJciXL2wzcEjhTlppt8WKu9mW3PW1
-e1LfVsinuJ1slkxSQk+Tocemtn+pILS/ia2FEyTGXr6DR+0O76xyyEqvfTU65QfQWb+Snvkz
-6AD/UcPwlObja2I9SaN1PfLgQpqMNJOOuiKZVKdKnJ+eczIaKC+xi9OWx62yEm60ZXfNgEsx
-Oy1J7Hd5o5Xlrj7kazqQb2lCfgOHyIxMUs862kDbrn9ZGj1uo4OjLLiR274F5viTLvhj9NK/
-et9FuH5IzktDAs6sz2mGXqQMdhDsXoZc8P73bGpSD/h2ZolJCwW379YBi9H2FWYo7YpbTpcE
-mfOVbpFb+qNcUPQPHcS31VNM+wksOwJfTmej0fnhPeG2FUa+vOhr0Fo/ilb6XbTDv8BuPuDU
-IQe3CPn5fMjC32lcvqtvqKddp8T0DxLrQHT+WpRQPqJF4i2DO2LN3Szr7TpZZ1feGrvUVtC9
-1idyTSfKcc0iB/UvPqbpMMcQSgwFr4g21wl5apLtCP9azvDSNvq8NNj/RL38Yhrpb9EKn5hv
-+Xz8cSjHc0NFLqKFeI9m4MaWEEnmIY2hdZQf+fU6V0OuzYDu+8iauk021P1iA10da+0yA4+n
-6twRXSZrtbzM16M8V2vxct1NR5FcIjbePrUL+gP2Md46hgP2zMejhcBikp9OM/0N+ten48e+
-AucKzXhE6MJJtD3P0IacDQ7+Ps1UIKOztI36Isvnli9pK3wjhztuzdwE4FDTfsIuaruTmsvN
-0QcyUCdJG80rzXUjd9QiPBaOvQsqGNvKI6100x62LGyweCFC03xNau7nUCPsor3/lH/zbfmI
-H8sfhr94XpjPn+l4PqJduDmUSignT6erVI5/pddciWYIUTpworVrbyNcNhvpLmsvN13ruR81
-gyunhyWftpDs+gyItuEGimaIVHkViT6PzdE2diSsROeL0HDfiEr61ZTLx+eSvhF38FN4jd/K
-icIZHhsu88d6gI/qQm4DV0hENXgJsKjEs+gZV6bfJWpZ3TLw4Uf706W3ae6cDnDTtI5rocld
-Bd0uRbWRFNLbXE5/4Ba6j6bDHW9hhmK2HPn1ethkmUIszNCAPoZGpPDCeXwN/tGP4fV+Lbh5
-jCeEK5xHT/NhXQ0FHgUcvuVplIpz83rajmzdTOLTa9kOXva2Wa6oLXVPdLpbqV1dLy3hamAf
-JXS4FNAPpPD739TVV9QNyXKFjrN3el7LWHLtY1XDNpvrE1Ih6JX4zRTHp+ASHlzw0/k/v5Mb
-h2v8MDzh8XqD89sOPoQ02YZasOMkPImXU36pT/vhYV+5zfaH62g7XCbb5k7obDdK27jqmsnl
-0K2SGHohupdjaQHOqgOQqPfZRDSa69pIc9jk0N6u+F1Wz39ECfwEQg2jjB6o+X94r3/Gn4a0
-sjMUlh+1sMSzVLLAnvEXtJWvUWtux548T6DxUoTSuss2yI2wTe5j2+tO6Uo3FDspq0Uc1E6e
-h+/kOrZ6LVTlN1DhTPrEGqPNLNWRGnn/XiKWMSy24T4B+NCNYuI2UvgqXMvP45X+DmcLyWRx
-yCOVNJ881aQyzm6iVazkHfQTV+eYfIxnUF0pRxeh31XdYpvivrPVLpEtdjt1KOao4GrpQ+xi
-kKTWeBJfh3AyfYQ0UxZpcrRN1yvvP/dUS1jfMNzO+uvW2Jej1H4R8PiAC/lOPMhv4Sf+JXcI
-qSSmfiRLNa3UsBd8x3ZzHxr9/9/OGstHKb50orHyISUAFu3db/aX+9JWulc6wy3Tn1xn3EdZ
-3STptSr2cYTfhrLYyUzKpv9ZAy2O6xiJnnsulLGs4Tf7xb+1jP57ehw9Tq+in3NeP42hW8wh
-tYwOn+DVlJZLmkv6v38HY7S9tTSKK3IO3s3b0cFb015JQyXgpSNdd1vh0mGO/TrJDdZGrpLG
-cal1gbwMxeVGWMP3Qlp2SAkf69/2s77Vg/qFfmgjQz87Aywq+yr0LrqRbkZzcsSP4Gr+DG/w
-SaVE+FROhaoySCtIfnv/jjJP0XRXYRv1eAw/Qh8fDV4Uo0TujnV1v9oaV8QOuvP6rxurU1w1
-rebS6HN5HIbKsSCyP7TgC2EVhfDQimpeG67d9a5uDF/Za78KM2SmM9EJNCsa4fnRNnw1up3L
-+piyxReTWqEO0Gwi2/Qr6YE58tJdcHMyD+N8nF720Ar5icq7lLTb7bYskdZWORLLKkSWa4pI
-S8ySR2u6t+GEHAmlZV2YzBvCKToeUBEww1f6ky7QlSGuPfcdrJS/YOujlagjsGgZzcW/RUfw
-u+gF7ufTSJpQQQ6A4RO0uXxr1SQrZZMbdJN/48FcRNLwdlmHG/2W9rj4lC2y0mpHvrQakSua
-OTJU97vPoFs+HJXdoZTMDO8/QfkczQ4xaHfIaTG0mX6na8JujRfy2fd+up2KJqA+0UHUNBqo
-X7Qtn4we5to+vTz0deX30E8a6W+SxyYhWXaTLVRGevF/wKE3z5KEnNLNpaGuNN10FyxjpJXl
-jTzSRJH+utdl0ybubLgs04Bm+7AJypMA7lyRRkMdDoe5mlffhdnaNKS33X6qFfVp6EB0Kk2M
-pgUOE/hM9BV/6SvJeT9UeoclUlB3CdkuJLp5Muv9T/FwCkkuf/J0ycCx3Gz60eWjjW6rvXWV
-LWnksLpIAz3goqGtWx6eStfQWr6GC3wWPuYvwk/UNoy3xWGNxtRo6KvNgrMTfrhVgG6eiI6i
-cdGYPCTag9dGz3Jmn0NW+1ZSL0zGnf4jh3S/zLMt0o0myGdcTZ7yQ+4n7fm6PKYCrgt1d0xr
-3Fg771LZBTdD/3EFcKfnA7uJ4OV34OXnoQ1/EjZTdSSIviGj7QnfaD7dFZZouVDI/vWbrIov
-/f/7OBvNzw+jk/hT/4DX+k/xCrrIf2Gm/AY3amIHJDctk3toGVM5p+STtTxJivIVWUuZ3OfU
-xO23Ma4WfOSUjnVNtIF7hxn+Cr/KDyG9FAUvM4VXlDOURMLuYL+EeXo9WGiofcMNjRm62q8+
-NhXz4+EhyZn8aC7sn/N0X01yhd9lRzgkTfWFpECSu2xBZtIhqcUD5Bknlx9lPC+XWHxfBlJm
-56iOG2I/O8Kjj9ZysTSJmxNWS+1QSVKH4/zcl+X7fipRuGgFQ1IbGL7VF+Fc6KetQgrzfqVN
-88jTyLqf+CZcw5/i331JSRSmyIxwWvKouH2axfW3j1xJirhHSDPjuaEkkXPcVKoAj220Qz6l
-l7LW0sNDcrm5mtZl1EeyJMyROuFLSRZu8m0klZP+Il33RShu6Ga1wlbdFvJDsXaGS/pd6GOE
-vLnMr6C+vjT3Qp74y+cR9aOkTzguEWU3RrO7gvaJu4c5ZtADqcjj5RSnkkIyiluKpzHSntbL
-Xbsp31lUjugbKakXZBNmqB1qSozwio8C4VU+AR7d6Ijfb/GBRfvQTZ+GODpMl4ZcVjccN4cO
-uBPZ5m//O+/wyURCf2kTzsiDkMy11TLOtKlbhETZiIq6CN+VGdxDEspjriyN+CfZi8xZjJbK
-X7ZfEtpB+VnXQquHy0+hrCQID/kAkspfPj0QnkyLfNQu+6+taPgbalVUv9Sr4ZH+GqbZl7jg
-GOE6XYaHXfNPOEH4Rr4PG+U9wxtoUSS3Rq6PtXC5qbI7TXFcV54vrzmblJex/L28pY7SjIbJ
-+591KGpzZLqOllj6vQwJGSRj2MPHfQue45XG+sE00b+zDf4bvOot2jlUUAe9WIA7qWcTkLMa
-hcVUIJTm3GE3VwnFZBw48TbclS76IVJTDdfL2rjU1MJtpGLv3ytfrnFXKSn3+Fsw9TvZRE2g
-qM1lmP0g/2kVQa4Bq69y9TCGX/gCSI3H6Fffin7xL2yyb297/CVNH77XaSG1FgdD7+hpYLEs
-VKJh4R51C32QtZU3h7ZIRgelr6bCDNVdS+vpXtpoN4o6uyyc3/3Nx6BZX0s5WcllJBnnBy+y
-yx7LJJktvvRDtrwdlvOPoSVTSAYubKRhcOsOnvAYZ+N9Qjvlx2npUEKPhxTaR2NoYXsAd9sX
-ZtAKYLE+nOSrYFQ23ShDNSlmqOsa2nCk+4WuMc1xd6md68hp3T1eKAUkhZSSrpxXjlJ6YJFc
-frbYsl/vcXbdwJNCT84YcvE2f5z6g5P1fSoq55f+/ze0Bvo1etFX1R9CKk2o8fSAio6x/0JV
-OhGEj4YF/AD7yKqLpLvGdpcwQ2ko0d/2j8sDx1xH81xFbuz28zvJK12lDm61ihSCpw2jrHLC
-Eksme8SddT2fDB2xD/Qv4DDJ16em/rWV9BOsoM9mVf1yHePLatQLWPkuVNQ46iyB7oC7DaBY
-aCpZ9AzX0W9lrh6TWFbAtbNe7rQtd5XomDtIe10dHu/O8WeuguyRnpJfOuFWq8hN+lAKkHJP
-O8L7dSyybWn+NdymDGEwbfMZoQA7gcFPVsAntkJ+hTb21XSpj6Ufh9fhdEim4zW31rJ8mo7y
-63Uqp79xWy0my3SdxLQP0Sz6IDFsBQ4P3Z/0xqXnk24qD3fxJbOrJ5OlqTznz+UrTiJT6A6f
-t42cyQZxey3BhzFDhTCMjvms1NPvBg6dLaHPYG+juzW+b6uVfAZd6X34MnygIXyu27Q2WsE3
-2oLaaGEeiWa/VX+ROBbTNbWOaJy7cRsxIoMoV+QdZY505bvuEY92X0sS1106S3PZy0XlA44l
-1eks/2Izea/WQ74N1Cn8Rnd9HjTe7ZbXt7Tn0WR2JLpJT0Zba8Sn1W/9vXDPvwhTQ079Vutq
-fuugiWiw3qVZuowPaWNJYHeRZxq79bbeJSOOdKZCkav0eaQep4js4z0utzRyzeWAfCtZJbd0
-4ge8kpbwPWuLBpuZm+suWhmaUcqgNsVPQ2qoZE+iYtuiG3VVtDvmKK6ZsY+pPoaWCZ9CM3rq
-MZ2rS2yLjqIzeBWvNKFks4XS0rK5DUiyiemKa0ZZIv9SxUheLhH5nRFJeYErJ7ldHRkBDb/I
-bzgLr+MG1J3HWn40+gsUQ/tQvZCOdsGtawKHEM1mm6O39LfoPJ0NLC5EC2pJn1qPeDS20Etr
-6lLNafs1IV3W2/RMl3BS+1Yq2nMZA526bsdcYaS44fR95BH9HGnE1SM7ORJJI5NcRXknn0I9
-Y8sg3sNraBBfts85lj2hovobdYd/n/RXwcnh9iBa1v6KOusW3akdoyN1ZrSOvovm0wG+uBYL
-HaEWi/QikvhOu6IL6Ll248RWUErbcfkFjf86ePkZpYxMpEaRF9Q78i23xj4+imSV7a6RFHNN
-ZKh8LLv5Lr+j3zgzenMle0VddAotCYXJ/GHr7FtZLJ/MNkUP6cjoCO0TraZ/RuG20VehOTgR
-O+TWA6Gn/q7rtQuaYgOKabnRQe9yKxsDh07pUtBw14PuuhNUOJKLm0eGc5vIPezkU7nuOkgr
-10N2S1WJJ8YVeA63py95gj2kDfoLPQwZqFBYab/5ipbF39Sj0d90RrS+Dopm1UlRH85FL4dy
-/nQ46SM6Bhmjoa7Tj+2tJqY8do++sSU81RrKbftPSlEz3OZ+94bSRMpzrchEbhu5yzUjhcRF
-WmAfPcS5htDwJDKCV6K3V+ML9oi8DqMcmoqah/m2GRr5qT+kV6NddUG0mI6IxtYx0bthR/RU
-+NAfDIv8o9A4fKHZdTmaUSw7ZRVsOfWyLrzOsoujzVKPirhlNNXF4MeuMueJjOIakZNcLZJB
-PojUkxWukxR0P8go+VAO8r/MXJNz03WqYj9jH8GWhwEmIY519b9rUvDvZPR1+Cd6MKyKrgEO
-y0Jevzr85U+GCiEHlHuG7tf49ps1+f/fzufEqznN2amN9KGbcpoqurw8w3XjK24Zx438x2kj
-+SSK+5zvBkpx10uWwMuMr3EpbsOd6SnNtN50RGNTXKhP/ZAKyX6uNvRlNIl/Ge5H94Rr0ZXh
-TXRF+MxvCfP8+VAwpEeyGK7TNaqNrJZlpgl2nfbZSI4LV2pMU2Q1vZVEXNV9zxPcTN7uLvBl
-l05Ou/rym+stRTHHJmksWSQiHdCX11BifmwT6UPLSE3RPZeE4pYs7NAZvrF+5eNpan82xPLb
-QyK/FTMcDr9Cr+KHtDovdNX6elOTWHk7ZENsBK21T/CdjnNxqo3WuRU5O60rz23dGF7s9kG3
-Y8ktV152uTbSGZyIhX30lnRynBdzas7FdegvGm55aItuMKiyfR1O6g7fAvoYXzP6Q8H55YH9
-4pDWrwvf+WPhgH8baocySDjzwYqk1tp+sJz0p92g8zaMs1AK6U5jsY+XUpyrufE8xZ3mfS6F
-3HG15JLrJzPcGOxjgKyVLyWlXObvuBH/SYfphFUmZ6ftE21uvcMLveaHaEefXXP6y8DhnxDT
-LwkZMUMD8GGTh3MgW1wIv+lYjWuVrIPFoo22h95aV/6E4spQJMiL9ESK8JduNI9yx3g9vOsk
-cDjp2sss11dK4073SFmo5m0eyC15B12id1aPctp1a6zdbWpIaC/9LO3tS2ke/wA4rAQO00Ma
-/0f42q/CbZwP2UNCXR8aaXPdrhmtkJ21cTaJzlgVTkf3uSW1la10QVJzEdeJ+7gtvMQZfKOE
-HHQ/yQI3WGq4PnJRGkkN+UAWQyeeUTrOS+OoiSWlcfoXuufnljkcBSea6xfwijR+Q/jAjw4f
-+wGhmR8V/gEmucKVsCZkh4MNBhJvdJu1sM602bJzLNrHtamaLKCNIpzUNeQ6yHUD3QvspIhM
-de2kv5sAXk6SvdJDKiJjLeJz/IpqcDHaSB0sL83TtXYzVLXiaFrLfTet51NpDr8vZPW/hoqY
-YaAfGU77hfDyi+FEyKxttJumtFu61xpZR9piqXEb67g6lZBpNFMe0EP5lD9yQ3Aj+/kbFxv+
-WVa+wD4SgQ9LpaN8gimW82uOz73gYXdwo3Xpkp6ztNrB2oUEyPl/aU9fQSv4V6E4OFHTTwyj
-/YRw2c8NlcJB/Imp32k1FfsbPprBqtNIe0CXwMuMlFh+pG640X/F8Vupxhnd78i5VzifyyKZ
-3DcSlYHQiMFQiZbQqkJSig/zNCrFj2w+fWLpqbcutr2houUNV3St76ntfVat7i+GRriNUX5q
-OOVnQyO2hYXhZSimn+hRtKHOdl8/oMa2mDZZaY5BB7kqfSbTaZQ8oj3o5C9lGPZynFO71Mgz
-DSTIcOxiirSRQaJcX/pzTFzzQC5Ht2mS1aQLetoyAYsewOKpX6DjfWX9BrdQGxrRFdz8B3PE
-DUtCl3AmRJHxxmkdeMd8PWHJrA31M+YTNoHTUiJpCd1cT8slJt+Srzm++40zuRvAJKckdt/L
-HemLKboh9daVNZxWPuLlPITSQ3EHUzYza6GTbBX0KlU4pXN8F23ks2gpfyVUx42MxC4uQTPK
-hlNhV0iqTbSeGnLNfIuNC+8LnbgB/8hH7/hnet9u5ovRJSnJsV0PPP96PF5zQmSr+9CH2dhG
-CcmMjPcAPjqRF0EzI9SLGtgzm6lD7G7IbxXDRd3pf8E+Ptcv4ZlfQy8G+hPYx81QIsTXdaGK
-fq1T9ZHe1vFW0orSQjtECak+16BzeFVlZS32cRO6mRA9tChHXHOO56axyRG+jj64RByS/1O+
-zwf4Zx7Fdygbf0kzaZZloCe6xoppKxsdspn6q/qr/xM30gpzlNfWvoD+4wtpqlBJR4ZOmlKX
-6Ur9T6tbNntqnWwk7bcPOD5NhG5H0DTry1jo5lrc6nm6LsxvoF2vpA1fk1m8TnZwBySa+Ghj
-03k4p+XSPIiO0lWrRUXtjvXXydCKelY4pLD1/oy2hG5V8D20tv8eMzXUp9CPZmGA3g+rdIg+
-0Gy4jV32rf1Aa+wZxaTOXBJ61Zoqy1QaIzuBxU26A81gl5tjuMb8REbyHlnBQ2QzfyjLeDWP
-5uLw8gX0hGJRF2pqQquwYdIfrEnIYRf8Q+3rN2g1P1Zr+q46zLfW6/4nrR766dHwl/6IdBfT
-EtgcK2dl4KMn6IHV4vy0h7+lvDKOustmWiyX6aS8omdI9+/kc+ymJW+VcTxY5qIJTuctUO3y
-XIc3UUxkvElgdwa6qOutsLaxiSGfJQ6vdZnfq939DG3nB+kk3Ow9aFjtMAjZbjb08rQ+1Xg2
-wj6zTDTQVtIVJObC9AfSGslsqgoPGyAB/EzBuyQ/+nBtfO3GM2USQ705q0xDounG1bksn6JX
-VIlG/v9vmJPbH9ZVy9m54PF6d+ptP03/9L21Pzx1jG+pB30nzYVdTAkzNTlmWKBprIw1sJM2
-236kCD2kltQUTeIAX0fjToznKsh/4vXvk7L/v9X70phPSzNeJK3BiW85g3zCKzgWF+HdtJA6
-gNkxqLVNsx1a0dIA5b7hvHLYqvPQAdtCM5r5959puFev+Cv6FWbcGXJbDf3J7mF/feySxaNs
-NJl6UELeTL0ww1X2VESScS9JzmskNmZQQmijqLylc/Ka5sgLagjOvuBV1I0HYv6yVIee2Cqb
-ZIngzK31A7T+F1o+XNer/iL6zgV46hUd51/oaR/XPgsZbEUoZUW1o+3RBVYPSFy0uPQt1aJT
-NJ1K8EGazrfpJdJjGUmC/ccHD5jvCfFraMdNzLESjw5ym1LBb+fxOMrCtehXMPO1LcX3a2hr
-4M5J9Z32Dbc0HvBY409jH6e0l7+uC/1r4BPHOuCGH4Xa1gt5ML7ttIn2xlJTGZoKNGLzJWr3
-/79pyca5pTT3kQq8F7jHdAU4p8vDOVw6Vsy1AVj8IDvoGf9CP3F5OkfPrASUe6IVtf9wd+V0
-i84KczV9mKrrwYvOfp428Ou0iz+PzOU1f8iMHFjfSugfdlKvI1ulo5fWDIq3Hok1DtheCrfX
-gBNIO24snXm+fMeP0MIzuRLvfQxewuDpdeojyym5tIO2fEQx+JT9hMy+x9Li6g9od2jhmTBY
-q4KDd/0onelnw1M36RDsZCf2kTcUtkWhFXRtqR3Vt/aTfQocu1M32kmPKAlXxZ8/kZcecAe4
-ZAfuIvWhT0X5mWTgBC4Wi7tJh4HBAPmTPpRW9DcSf1a+ZRNosr0C02vYU/1bN2sina8DwwLo
-4zo97I/rH/6xTvHxbJvPbSlCFRseOlk8cHKa3rOPLRdtsO+p8PufqqWbFOGsUJ8q0MJ6fBOP
-HFKJ28ClVkkC8CLQG+jXJdmNzLGYaspAesBfURvkoavIylXpO1tmMaA+m7WjTtRrYai2DaM0
-XfgTmXODbgc3DvtnGgnovaGonQgtrTa8/7K+tpZWEu7Vn2rQHlpNicCIr3H/bTBHZ8zRnnNK
-Pe4kxfgfycIXwYdzcp+WyX76SebTB9KZ/uRClIZv2hjkkneW176xs/qvztL8+ouuxBx1wgRN
-EhbiTnbpcX9NH3ixfNDTceBELP3dRgKLFHCw6daLktE26g8krlIFLsjtuD9mOIi9JJfq3ERy
-84L3n5IHLJ4Di4uyD3e6DP1gON3FbTTleHSEVlsxqmNT7LW+RJJvgrxyJnTXNqGvZg7joVsr
-dDdu5KB/o8FnttrYyc4wxL7QI3ZG01EL7OORzaFWhOSPDRcDL4dwa9xIM04pNbmBFOLp0I1z
-uNO38pAeywnagszRGVkwsbSh0ZwTqnnC6lMn+8eSWhLbrl11vD4MvbV36KN5wzh95VfpMX8Z
-M8Syx76QlQjf29wwxTLrWVuiWaiUtaIDtoC+wgzbkE+ycS14dDveyD+wcQ3+DB7aE5qxUd7Q
-f3KHXmCGU7KOfsUMn0oX+hddISf2MRS55JqlsuK2TSfrUI2LJDs5tNYymCUueHEL/DyDXfzn
-81m28K0NDOPtZdhn3TQOxbCvwezxlI6OQSmScgzM0IQH8QL49FPugRtpyh2Rb1ajBzwVT4nc
-VWK3iQ7JROotrSm+FIBuXraD1AVNMDaSwSLdq620oFZGdvlK64emmgL8vOf3g5cJ7aD/yh74
-X6wInn96iEkptDz9qQOpoP1Lu0ypMhXnPdQJnJjNv/BCPoP/zSINublkAieuIoMvpHSuJ2Vy
-VaHh6Wi1PLFqss12cR9Lx9mgFXt1k/XUxFZRO2tRfYr+/0vorJ+FNRonxLI7vrmd9evspneU
-MlSmduEXuhjWU2O9Qfc1Lg+yfP9/55VJ1Bo5fhCuYyBv5tocF924puyhiejrp+UzSuzi00fu
-jiVzu+y8zLcBMt5iSnv7gYvbcnquCtWuZqN1kfbTjODF0rAFWEQsA27htV9v130Kuum/Ixdm
-0RfhFM0LLymVxuCpmoDzWkreZZn4a/qID1B+ZJWPeRzH5su8nT6SHvSjFMQ9PLfLssMibq7x
-+78Fk172q3SyvNLS5vBX9o5SY7M3dJ5tVGcLtQvSm+g5nR/SWMvQxkqHPfZRyE7pQ2fKEZZT
-7XCD/ggxOISk3FIT8W2Nz90sAfJqfB4MN30DvWjAr6GHG+g1MkZxyUsdgf1C2WJnZLrdkOF2
-QLrZJGlt5eQHO8G10BkK2HQSaMUZbWhbdD/8oyZmeB4S2d/AoU9YbN+BA1+HBsBgGjUIJ2hU
-MDoTUnJ+Tcu/aTJObYn4L4vH2eEfUykuXNSoLh+jOfCou1yRskpCaiSXbJz8Y0tlpi2SsTZC
-+lp16WqeW9kQroyMmNEa0APdDocuZGt1PVSrrt7FnWSDPna2ZeGgTQ45aWDoTn3CFpocAh0M
-H3EKLc4/aUE+pTm5vmXmM9hLJXjIasyRkP+jRkiQM5H5LsCnEgrcQfZbK1lkXWSS/Sj9rZS0
-M5ZvbCF/DlYlsdl0VpPTbB1tA8HPvnCQ3zDHQU2D1vkYc5wI521DKEkLwhRaGh7S8VCEE2kz
-rqud+W/tyBmtPc+wlpyQvuFuVJtPUGnOxHGgFhswRzc6wWVIJAHlkwv2hazBY4LllzYmUsm2
-cTr7lq/rtf//HsV3egpJs759CBSK6mgk2sq6QtNqUgthsN0O3o6GdrQvXKQroSwn1rFcTTfy
-RN3LT9+/97wd5ZO4uGK0GmnlDz5PbTkVf4Ar+YdGcivagL56H76dSCZbRmlqaSSnkbzQE/yv
-juMhmpu/0KUUX3PR9bDUToaSeMYLuJJfwdImehPtsyV64luLo0PobYjNPgzgVHqNK2hG6aJF
-ZbUWlyRWGGzLKidxdTmQ8rrQAl5LlcDQ41QEXaANJ6HZvNFOc3t7Bx7GwfPHkLX6iAfpTq6i
-vTk52HUTrNsWstHqsM52hFr2Njirrnv0vY5Wss56zWpqd8qvjtPpYM6gT7iIlpLa2lK6aXvM
-0VISWB1pYUVko8WTeHSM61JX/p3e0CXqA0VPSQ14nU3hpnYQTH7M51X5d33HTfTG+/eL5Afh
-e94Y3tIkqNDAkIGGYY4VUGiHVN3p/bu+6VJkqcFamurpOSqkrTiL3uWPtLJ8omOlqi6Wn/Vv
-2aQz5APrhznqylpLKzHRRKpSNZ5Au+kMfU2p4RHfcH+byTntDF9Rj8uKg1cRQ1Lqf3wxrOT5
-oT73CQ+oeRiER3oaEjaCAa3sM81qe7GR9rYcntlXd9DX+h3nAYrptalk1lWSTy9LRb0uPfSo
-7NFlks6GSlurIpstynFpDFdHgvuN+tIViguv+gPdubht5Mv6gsdqcimDjfqQXLaFJzw8/MXf
-hDJcKpymT8G+GiEWjQ1/23Pg0UWTW2o7pXtsunaiZpqSC+lyTqoFJaK/SUw9J8n0gRTWG9JZ
-D8ouXSKpbSCUqJRssttIC224Pib4C6n8Nd2zKlC2Pzme3eUleP6a+pm8DWVlWcgv7YLnEmEu
-pwzFOW44QKnDN1Q5vLIF4Q/LrpVtp5p2hZJ9RP31NFXQXpxSE+G/Hi2Pw3/yPKRzMTWbK6xp
-XV+NuBPAJQcUsr81kHP2kPPhbgfQXjpNpSkvb7HBXBo6eViTSXMtIdFQRf4IX0rNkEOSh+v8
-0PfgSz423/OT4VTZqXPYZS9Ce5ukad//nLjGpl91M3jRmrOqAMWhcic8kushj3sQSrj4mtd9
-qUncVL0vT7CnStZcFpgDN/pxU7pFG9BPPuD91o4r2g4+oAmkiZaRF6GxjA9NpVz4WmKEVHLJ
-r+dDvgKf8Efota8Hlb5v28JoqwMdjWk3dIvN1HbYR3pwYgOTlpUbYbWcC7HcFczxPOR0mTSx
-a62PZJvukjTgRi8rKBdtJxenQtCOGXSPklIZHmOTOJHdhPtlkY+1ouwLNaVLqCQFQnbhcB4Y
-tOFb/jW98QOocEhAU8MiS6c14W1sHWyTpqcBupeqajvOrCwaBsmj8FCehYKO9QuXXou7epre
-LVCEIN0njaynbLAU8gGN5xb0ktZRY3Sk/VafS9gCXqkPuai+/7m5gvJNKCLxQzY54l/yMj+d
-5/kC+LqDrvhaVDI8to1hMrCoYInN9ND7T5ugMfoJrvs6+NkdnHwpcbSai6c93QfaGbyo7X7W
-j912fSfJbYF0sApyAMqQgQpzGzS+DfTK4nAja8S79G8uiTl2hhTgQy556fPKPz61/Oov8Ajf
-m3/1yXmLn09pQin6Pdyw/PCUm1rW/rKINaaDmhRI7uBW+r18hrvIqHXx/JNdIp3qUmo3V1or
-uwGazO3XbZIB3OyOGzlgdTkVWkFL7GMzdbakfAbM+kLX84Hwghtgjlc+B2bIJZN8LBnrN/B0
-35h3+Ffg5miaEPLSh3ra9ukQG4CWVBhJ8Cqd0lE8V/NKB90k5fC6c2ofl0Z/dUn0Z/CinKuh
-Cd143Snn9QfJA5XubQOQex5TEqpLzWmrbaaclponaydOppv4T2hEkZBI7vvM8q9PJ6v8fd7o
-p/IpX4oTw6k6h970Alo+RE9aThttZ6ymDaB0lovv6FFcehtowzP5Quu4PDrCJdcBLgFwyaE5
-3Dfg5zSdKjehJ8ih3Ms+5x22mJLTB9QB2foI3dX8XE9/4dPhEH8X3rL9/zOossmfPrFM8cd5
-lh/A+HeOHfZQV2hXCOlosp6wsva+NX5viyiPNeGHmlgW6T/STku4cjrFZdY1Dr3IxdG2Li84
-2hS3+of2lzsaW/LZL/yzvaEd1oTev1NDb8oPRKdpeU6iv/Pv4SR/HN7xTZ9S1vu0sgj8XO5X
-827fgqM+CdcLG+l0aEM/ajaK2B1bgT9NqTe2WhK391Q7yRyN5X4AFwrpPy6uLnMvwkAn4EUe
-ZcwxTWZpJrmns7ggNtDfBtM5e4Am3cDmIl8n4RLYydawhauF5/wSM2wGL2Zjjj/9HV7i/+Qz
-vgpnCy+QpP6grFqNNqJpNLODloJ+tb1U23pxLCST1XpaWus3mGG9i63H3H9hObSrn0uqpaFd
-t2SotpMjcCgkVmSO87TeylAKWmg9KZndpj5alZ+HOdwt3ATuiWUDZhgHjvb3JEP8JtzqT9CN
-ZFw9rKOz4QdqDwdLbBdtu8227uh/H3Nmu8/HdaYM05Kuiq51H+oL6PddFw0bMUNfVxbc6KUr
-ZbNmkxg2Gak6Bk9Cw3hoh6wKGssKmq4pkI468K9hI2cOz3iXTybjfXrp4yPS1+/nSbjVoz4H
-dnWYVoRu9JXmodv6H9i5HF28lz2gz+HKL7WOLNa3wKKfK6mncBvXwM31mKGfK6b5XBvc6SJk
-nic6n4thHwNsGJ20J5afGto42q9PqLxW5v1hGjeGVr7zImt9UvnNx4RenOXZfgwf8SUx332a
-GH6lbFqRNmssqmdHLNgMdODWVhmdA2zSuTJdi4EXf0EjTrrsug33OgGcqOHq6nMZAU3bqw84
-PpJkDTtKf1gJemGz0DPi4Fp6ahx+HZpy/7CEk4U7vMnHkVG4j97g5gD4yCzfju/6LFwDWFzA
-rXbV4pTUorbedlhLGoNsXdP2cxzkmH/0Q7zmpa64SiS5xo9ouAluLnDZ9GtXR0/IeC0NzZjP
-2dFPulo7OmIHgMVHaLEj9Bm9C9XBiQVM4SlPhVbU84WklM8uFfwLbuYX8HzfkJMjVc4LK5Bm
-mtJruMcsu2R1aDb2+4OtQlL+XvZpDNdZx+IuH8ND4kZuhuvufJgBTyuDOXbJ95ofO5vMQY1q
-oMcvtBMWm0rin/6GE2XXLPx36MGlw36+Cr2cjOf/2X8kXX0MGe2383bfhbOEPJjhEnY3hu5p
-ZRpqiSgXnbJDNMNac2OLLYlsjqyHj7eGbhfUI/CRre5pGOJeh0/gaSekltaQibqLL2kpzmGb
-qKt9QgdtjX0EtRlMC/Uy5dZivCaM4S/DRb6DXczzH+L5U8sYf5f/8nPgqU2wjxR8NexDohlI
-aaws/WNCjWineRpkM/hTKwk9Oi0TtKH7GlqRAXcaDSvdo9ALt5LbFdWN0PdislJX8jvNy2Vs
-Pg23jHTexsEFDK+tk96m+6E0twM/o/4meJAAWKSU9t64n9/HS/1wjh8q44bicmFgd0JHUBur
-RgkoJS3H96nGk5GdKtlweaUp3V/6i/tRt+N518PThrnEWgr8PCf1tKH8goaxXb9m1V30yf/v
-a4Xts8yWliZqe4qL7z0i5MTuB8LD/+X2/gZ/Axxa+UM83M/k49hJ5VCBb4XE/Auwy2rL6F/r
-Sz9SJfS9+LSEd6JVtrOH6B4/u83YRze95T7DjaTCnabS7K6ALkeazC29dB78Ji1f01Fo4WZN
-rL0tscsqVF2b0O6wk74Mefm0/4X7+l1cG5jU8rcxx1H+w6+Alo3hP9ALKqJ53lbCtR+kD2ki
-7ac61A6ZOqkst9XylX3hbsM/xult94WecAnh729DBfjJecmm9eVLPcLdtCzmWEo3wfAPbYx1
-RErZiV6Rjm6HvvQ99OCur47b/IPL+oNc0F/hMv40t4Z2bkfW+Tr8zG9DeZ6DnlTartNVW0pD
-6Gek+Py0n6/ZTzLUYrhsNsgd1qNuiF6EZq+BZnR1uXC/X8DnWqCrjdKlvAH58L4Ogxe/svrW
-3KYivV630lqMloWplAONf6mvAwzGcU6/nHP4NZjnL8w1kl/5ljwZneALfIfH+hbucZRK0Vx6
-SJ1oChegEnLFLslAa+M+tGPuiEbdMOh3bV0F7W7nqmlS1wJeNkiTyvtPPNuH9vtQy2EnfyFB
-x7RR9r2esa2hCH0UptN0r5Tbf8V3o735bHQy34/+zun8aB7ou3GG0JjPgcOTNSuYKGx2gdbT
-EurAnSmdZKftaP6NXUs77eJZ+sgmzR7poxRpoP+6+toBWiZuoPaEtt4CFuX4rP5G797/1puV
-s2+Q52fanfDSKoQGtNJvo0I+LV+ONuEt0WG8PzqFn2OWL3AjJ3wnHhbq8pdagtnS8hp7RW3p
-AGXjKWj+tairMCVzf9nvrpI9dy/0g8jfqq6H7gYGfVwHzYDMN0t+RdtYhPa7Xc/TRS1MZGPt
-Y7unrayUrrbpISnFCj1okL9A6X0uYNGU70T7cQw/AjsZyqtwIzWARQytwBtx7a0tPlLjbdqH
-7PozD6QPpAQtk9tWyg23ZS6fPXGX9a2bqaddb/0Ds9RzvyAT/6ZdZb7eAxbV0X4W0x2NUDxc
-SUlbpf0sJnJTs1CcDvmZ9JV/R4+jpXhvtB2wGIZ5RnERP5A3+Lb8fajDqbUkvkNWJBThwnSe
-7tACmsAtqZikpjOyxZq6722XS2Sv3UF4+zTc7C/IW2PgI9PRzebrd8ggx3iHFuCTOpQe63lL
-aXnBjV76ux0Kry13aEJT/BbK6OPz+WgF3hVtyUejXZh8R9xJE3a4j5W45R/RSFNBMfeCF71o
-FdpdfzrHpWiAPLV0bhp2UtkeuFgWJ3JCX7s1esithq9u00LI4KvkpGaXGzqCn+glUs1Lya2f
-lbAj2sUy6i7rFrLSRd+faqKDPYvG44PRQnwkWp6fYp4Kvjj62YfcOSTlDzUmn9Y3UO1bVIAO
-o+8upRHcjz6W0nRQnlstN8c2uIbgRiZ76V5DM27rbDzquPt6RR4ggzzR7cgiGfiNdiSBcqa2
-rMjyPXWAnQhnrUgoRrP9+/fvPE73ozH5UjQLP47m5Ow+O48HZ7OGhLwvxOCuqlCbZ3QMeXUA
-VKsgL6TL3JUGSQFK4a7bGDferrsqZi6N3XNBt7inyFpPNIV7rGPloRLm+IGf60Y4cxJy1s4y
-oVfUAhYzrCfu5KqvSvX87/Q2eopOR9/RxWgctmgC/trH5YPecfPgKT60YpM+p7Z2hzLRWfzZ
-SWN4FpWRn+iOZKGf3TG74QZb1sgXli2S0VwkNvSDrLeLahQ+86M8h68+0w+Qlb+lV7rK4lo8
-K2BNtK2tDJssaUhCA/y3lNDPppPRE3Q8+gQ8fa8fMdDNYkEvYvMm+FkLjcspLMK77TV4cQOd
-dw/9x1NpmjSgYi42bXRrLG2kjX0eKWo5I8lMHdt67KaCe6i4I40vt7Qh39I/6BZS4zMtb0ls
-upazp2GEVQtXbbMvQqX9IHoa3UFXo4/oTTQWZ0M37OrT8COfivuG5JweeX0vuPGzvYCPXKRz
-tAU3Mpm+kCb0AB24p9thjx16eaScFY2ktZQRsbvuDbLPc43rHmkHeaz7GLtgrw0pBpwsk4lV
-tdo60haECxY3FKC+vh8l9Vsxw0O6hRli+aTQi+Q8xyfmTMBiaSD+Sl/iwm7RFGh4eXTuNzSV
-VnAH+kGKUEz3yCa7+SaRtvZxpDSwyGiJInHtpDNt4V7C3x/pp/IMDeytHsGNZESS72xFbYe2
-tiS6zH4MRPvBi4p+LPbwL52KXqY70buU2D+gBv4/2ulvUvlwgc6E09RdD1N620a74e/d6A/K
-z4OxkwY0VTLRp+6a7XTzLFWkm+WL1AE3SoAbuaBlGa2A+8D+kMT2Bhstx+ntVyTO+7iPUtbG
-xup8uxIeW7HwKc30fSmPX0PPwc+n0UuUAFpa2p+hif4wxQjbaVRYha68gHboDGqK/B4Drroa
-k7TlxpRJCtIeIfrOHbAT0I1Yke6WJNIEX7+Ct5S0Tq6gPZccyKc5bAsye3LOb52ptB23ZpbH
-plh/PWunQyYqHJrRPD8dz7uTkuNek/mDlMNvp4Z+LS3zCylD+J1mhZFUEJlvt/agJtaRHLWh
-NfQ9teEvKD2w2P3+M3ncPtsC3XjghmI37e2ta2KbXTVr5JAIpLDVkI9tOeeyRJzH2lIZ22Ot
-oaCz4as3bFn4kGJCP7tDMzL6uaTReRSN/gGeTKGvsadFfihlDn1oCfzmC8xwR3vSBOStKtSf
-EnF3Osrf0Qj5DHeSlDa5+8Bgn+WNLLbikbGWLNIFczW0rzHHTnTlLJLJenByO4bNZken6mwd
-7B9dYq/DIysdctM03GpmPxjcnEBn8bgTHQ9cxlErzHbZD6O2YQgl0uG0TsdTc5tO6WgeXaC/
-aDrupI50I+eq0K8uAz1wzy1F5IB9GJlj8SJ9bJura7Xhc8clvhWX1zoJHeolXdG60K4Vlt2c
-vf881nk2M9wz9R9RV9+QPvK9KZEfSSn9RCru/6Refj5d84uQx/6mN2ElsupmdP390M8T1JtO
-Uz7eR5d4MQ2W/pTWVaYRLhntAU/vuGW4057Q9C/tB5fKXkPDO8hhPcOb4IrLdS5aXhy6qy0s
-m22EvyfUNdY6BDvjS1Jb355K+dH0KZ6/il9JPcCNveBI4XCC1oYz2MdlOqN3qaU9IkbaWkDX
-qC7/S07G0XypRwVdKhrrrthut9Suuj52FHo+1mXGjbxBHzinedCffuVtUOFd2hgzbIZmJAcW
-LXSR/RteWc5Qgv72P1NzP5Vq+SX0jd8EHPbTOn+MkobjNCQcoVh6iEbqcUpkp2gyNCM37aLj
-tJj6cR/KKRVol8ShUu4o/GQuuNDP9rsGNscVtTouOTL6a20D7bzIF7QSn9HVdB+pN6X1hW6d
-0hGWT4/a5JCMEofqtBza9Qs4Ocj/ReP8P7QaOvYWeHyDnH4y/IvMvoMOojtUtt10wjZTB8yQ
-gYfTQW5EHSQXeXlnTeAnU91Ke//7aHNca+zjC4vlsth4iVgs+FkPvqr36ao2gHbtRsLICSyG
-6Wx7HG5bi5Cd3vgmtMEPoMV+Eq0AH3b4dfQMc5SDXqzAI4duoz/RalLYDmTg9ZSRFtE2Godb
-/Ql9oCwtkJSUzj225u64jYKnjIbHfu9+suSujC2TlPaxvEUnua4ZgcVUXFoK6OdoaNdb7W3N
-dLudDxH6NpRF9utEV/0YOufn0CVg8Rz6kSvsp0HhID0JB+hbPUiHsJfStp022Br6kmbRfepH
-47ge5ZW8tAIZNL67YOXcVmvgpltF19niA4v1mKEqfOQon9B6yJ7Xab92gBt4JIw+SH5PdY61
-1Pt2L3xMvUMb+iRMpExhKaUO26BVh6kkdLsv9PtsOE+f6FmaqmeA5GFqhX3cskXUlUZQMm5G
-f/OnVFQS02y5Y/dljyVzCy2NG4jbaGBrBahLVN/yeR3NuzQ779at6Eb1kLfuWBX7AX3gnB63
-upqcLoc6NDAMplrhTyodVlCxsIlKgQ/N0ZMXAgcf9lAt7GOJbgeSq2iAzaWYNIZmIJEX40p0
-gLNSZQm2QM7ZDdlk7KbaG+lkB6U8emwSKyj30c+Oals4cwJwdBFyTnkqboesEzrBGluvr6w4
-0vne0BqveyTVC7Po87Cc8oUNVDTsoO+wk7nhEL3GozpwWIVZsthamm3zqDANx520pI5cHvea
-Hr3ghe2QI/ZMlhgh89yTevaPfGht5aV+IKd0LXBohFkC9jGNMlo+qmuLbKKlsTM2Hlh8oNXB
-wV70c5hEVcI8ygOdyhBWUwHM8kPYiv9vK8X7/ycfr0WjWEwNbSY9gK+Nou7w1kZ0CDupLsnp
-b3lkN+WQqSyEh/XDTDWsl2S0zPJG/8V9NOfLGg+5bynutApVtPPWw+qiwR/Tu1YHDfZ+qEyz
-Q0vqFnpS/TCIKobRVDVMo05hIa2Bp8bB8/+gG+Bna6moraB1///Jiil0Hfzsyk3oHRejJtCM
-6XLZtsha2yqjbIY0hpfmtDTyTveDF/34kBbD1wfIfNOBRVmqbidsKFrrVruCnbRBOk+CKz4Z
-utL8MAIcmUodgUcfYDAvHKU74SwVRrMaphfohp6gWraPztg6aoGc8QZq3p+r03POSOXkvnWW
-bfaLTLE+0tpqSwnMENfOwD9+5eNaBx0xOT/So5TEBlMp+5A6AokF9oldQeZJSfW1MsXWdnQY
-vjUVt9I1zKV2YS10cx+tCyfJ8PhaT9JscCOG/Ut9wNHYmOF3JPKPuCHN59wUF7yoLDusk0y3
-/tLF2ksVq4h9JJIXuNPzmOOs1uV7yMDOjlBO6wFexKdhNt422Qf2DDk0J26xHj0FFv+Ao0Ow
-i3bgaDfcxoyAnBluUga9QS3Qujfoacpge+l3YJEFmrEEOymIzjqP09Mrvm55ZDX0YaTVlW+t
-vBS09GJ6F1q1Anfam/ejM1/SWMifOyi7Ncccz22k9bQdxqY2UYtTWW1G738f7UiYQouhG3Nx
-HxvDPewjYAbH9TQGT1ICy54BzWu0GnspBH9fDo5+xJ/TEH5rO3mDPeWhllDqWjL5yBg4XISH
-LeWZOpCnYSeL0TT36kN6CW/NaaXoeztsM62R3bCHmoMm6Q9U7/27uegqehaO0fnwFDqSjN+F
-gpxZSyH/luZu+ikv1Q/RsiJcB/1ov62mCtQHWv4p5eH/rDv/bku4rp3lDPaMH+pL3qo3eazu
-5ja6gJvrSHyHVpilDB9Bs0hk/1ANA8dxK9eQvD6mCLb0j65Bxr1Gn7//LBDNzBZKcWy0iMza
-gj/DlTXQ+twXCWGZJsMct4HmP7TL+lAx+gSp574FmmQl+SvrzIltFl/Tzbxed/I43cjt9G9u
-pn9yZx3Dv2sXaEZNTooMWg9bnWFVocTXrCB1s/5IYTvoJLAeo0m5iubmjPr+pwjqcyo0u5za
-lD/VGlxdi3BHbHUWePqfzqYvrQ0th/qkp9s2EC53jMrbBxzb6vAVvO6tugh7WMMDdCV30iXc
-TxfyHP0DjXcop7RG3MgS8p82n27YJ5STDiLPtgTnk9tNOgAc+msqLqc5gEEJTqNfcRatynkw
-U1HNy19ihhZ6jv6Adj3SPlTNKtEmi0d5aJuNxt1dQBrLzhH7CT1sBri4gf9GN/wdnegPaPj/
-WDoLMKsKp43PHJBukAaRbgH/dAoiKJLSLd2gdCPdSpd0d3d3CyKd0iWS0mfm++0+37PP4S67
-e++ZM/POG7t3726zv/j4MU3tq7S2d9WJnkJP+1KJCw9/J/t8mDTw7RLdr8sG8mgLsJjHkmpS
-y6kJYZrE9CAJdaWyeJrL7qMpO8HRZHlibaSGfymH/TH/TvHR8p1fxgll0fvWTo/aDLC4Rcdz
-3jF2WWfbYzT1BXn1Dj58t7bybrrA4+hNn4xTSCU/ykIn+/p5eYgjm0iSq2LZNauV57wNNDXz
-SGd1NLOV1XyWTivac+mPrh23iZLV68sY/1Re+TavzJXMpIaHcpHK11s3zj9bu9CPpvaHtrWb
-Osz+5eMP4K0T+oVP0E5eQNeChOdegW785b0j9TqJPyP7fKo9ufay4DKX9dUs9hu4GKc5bLDm
-BaOl+NyPKNIMO0TNI6m9ROT36N07ejWJy9Xss7cynil2stH6A70oZRe1ND2ob7GD4ejaQYsS
-xPNLWsdH6zxPp/dRg5ySC6ewjRrq+zuJ7ZlA9jfalb341kbql7aAGpaBkTn0ZTC5uTq1Jddq
-8PlYXNMldPALf4VLGOp3PYUXkL32mwy1V9IERH1jw6h8nea2s9TxBkQlCGZx3OP9fL5P+3lr
-jXi9RxhUakgSmSNr/Tb5LzkbVFIPsxdjQXlbkF3DdtGXXZqf93PYCGqoDnaTs3UX2O1f4XN0
-zI8ykWoeD2/dBDe0X1rDKt9YB65gjqZgX9Pbff3KYgRdLFmwyeIE4ve1gs/WqV5I8e2SWapK
-Z7lDDh7lUbSIF9QH9H22jaeGXfTjGlh4oGntlsa1wxrVJnNbiytMCBPtl43Wkv69hnO6kPne
-kscnkSSroJsZQJVwJffDrXovvMH70YPclj5obxmDrRYfjbumDXyorvKU+oGZVJRC8PAFfy+D
-vARptiuMs5g6LrHlUYLqljQowjTTmwTx6GxMmwiXfKuV7Q3Tny63LAd8vtRnekY0Ya19Lw1t
-DW45MedtpDfDcXoh3KgPwstU/5EufhKMtLfo2jnN5mO1t2fTY7jplGxqF7lPxhgPUsr4j/rG
-poHk0/BkENSzdEEpyxJktVRBEnuvsW0fPNYLxGXl8ydwsk0ko9/zwfjYa37N8khPG40L+Fei
-oltXwt66J5zNsVcvhQ/0E3OmG7I7D+CNjVrUG+sEfy2PfTjJ93NZL0c9kfb0ZqT7ZbiBB7qQ
-83e3b4NaVisobFWCz6wAvfgkiGu7NTsTb8TVzoe7Xlo+1GCpr/I0HshClPl7nFAsGPivsLYu
-DIfouHCpzgjP6M7wtf4XRuGq3qOK5/UpfF7Bs+symCq+VCZ/v2BH53kVGG2OJvS7uKL0wVSr
-CZp+DmpwFLAGQWr7Mohvz+GPuSCvnA7E1R/Hk2Tyhz7M66CKZ6yItLJpkhLWuRp+q4vC/joo
-nKP9wn06Obynh8N3Gt9esyvX0PkFmsm/12F+S554V2kgn8pfsp/d6OXTtKDfgd3SBxutDhMc
-GLS2sUE56xdktnr04fMgFiycyXpoba52muE/8Yvf+wh87EuTyFepTWZb5EwYX6eElbRN2Fnr
-hOO1JRgdF17Vs+ETtuwxOnsC/zkKLcmr+/245JPW5KxPSXvHfSDO4KyW9OQkiCrBAesfTLfp
-wc82LahgA4IcVpV+xAYjG7SSVdGh6O8f+IHMftHBNU56DW6pjA2Sl+E1HHNG7RXS3bCt1gzH
-6M9gdHF4jpnchssu6BZ0Nq030SEeVZ/CdU3xCJfktZfSlT5Jm/t1Tempg8tWLVhBD4bYxKAh
-/ShoXajh6yC5GVezEJ0vznQPkjqLS35fQDdiRFTDxqSzwTjYszIhTKCNw/z6XVhHa4XDtW+4
-WbeFl5jJPXj1vJ61RTBDA13k0TWVrJWp0kTi4Nja6kXfxaSiBQVxa2+tT3DY5oOPVUELm8e+
-DgSj5YOUMF8O9rWKpdHBNkEO2luP71Xw0utsAenmo98Ia8uUcJnUDx+QsFJpvrAWtfyuvcML
-ejB0mDhBMJh9eYy+1PVR+idoqC7P5bwslnLaCPcYW97Sk5JBXVx0Ml8bXLLjzOVIUN/WBNnt
-F7BRIIjOtieHDYrZOWlnhWWRjfH79rfl8io2wB+EN316WEbqhZPli/ASySat5g47at1wp84K
-3+vb8HMeLWeAYgV5QeFiX6BZpZ6ukniaRffLaG0nt/UTyRnM9dY46Hkw7eFgs/0B4+0Kctnv
-gYf1g/thENwLJ+vHMAn8NUAq2lUfSgWHbIwl9k/tZ98dXvLeYVEpH44lcV+WXGFerRT+qsPD
-m3o5TMPmfxX8znSjeJags7/Wf3wLZ+6k9/GvVfWCLNVOOGnzgsEkHH0hXxDctO3BaNsSFGc2
-HnYNLoTZg6PhCT0X1tWX4V+SAlx8H/ms/Fd2ztpbHo9lU31HGEjvsIlUCDdJfvalVPiztghP
-6/wwZfBfWDGoYs2C1VY3SO75g5FuGl226wjprCaZtakekh1aWWIGF0kWnXwkSXdzsMEO0MEd
-QSKbHdwImwYHw3jBoXCRXguzaIhfz2LvvL5VJU9ssodW0r7xO+EqnxYmkoZhaykS7iHxZtDK
-4QjtTy+OhBmDdFYp6A0TXLcydDx5cBBN+UamcvaqWkBDmaxj5bEmlvzBPO8elPJVwR07Goyy
-w0EJcPEJO3MzzBmcD4/qnbAa/vgoG/E/qWATvL89t13W1mJ7DGvlW8Lj3i3MImXDvvIle1sG
-DusQrtV1YfQgppUF7S2CQ9Y8yENumk9mSCtndab8pvG1rHbS23JAW0vs4JmXC4Y5XOXz+eol
-QQebAm/9FLwKcwRXwlN6NWyhT8NH5NemktNOeV3LR6ZZaJesCAh5FP7qi8Pn3pn0WzNcTPJF
-HeDRdfRCwGVN+rCKOuJ4FTLcZ8F9evGjTNSL8r2W0Nf0Yij4jCMZgzneOCjj44JHtjiYwJ5W
-sJFwRbXgYxiSUaZpHEuPa5gmxS2GNLU2PslO2Z/2gyX192FbXx8e9p5hSvkhbCPfhoeYTU79
-DXxegrPyWFq6WzR4aIWDSp4q2MWeFJS5uk4a6+eaVvsxmZNaRxIET8HFZO8ffO2zghc2M1hq
-w+DQOkFFHEopHP03+L6qtlYaWEb5mT2dZC/tgHWyt5bECvnZcKjPC8/4gDC5dA2bkzj3wKUZ
-QPMvaOopclHU4JmlCcp7imCJf9QEckx/YR7/Sm39VhPpRCr6S8tJDLpUOBjnjYIi3i64b42D
-eVYq6IjfqGKrtZxVIKudJz/XImef8U72lU+xbdRRw95bIivpt8KRvjM8yVwSytKwmRyiH2/p
-R1EbrsOp4zy6mhF27O1v9bJHPCt7lq6U1hpX82g9vSm/a3/qSCfRg5NeJOjrDYLs3px9rUU/
-cgeD0Pyf7VeyUUbc9QrpBWOPtpm+0uL4RZtg0byElfIoNsjPh3t9Y/jBF4YlZRWb9Gf4HhTV
-QoEW6lQc1G38eAF833g/rm98ujaXpvqn5NJc+o9018mymSk91zuePZjm9YKK3g126QmXNwlm
-UMcvdhuPPkh7WwLtY2MFJvbp1tx3wha3rJXF91RWzm+H/XxTuN6nhk/817C4zA7nyrEwusay
-JmjZUp0J+/7DI33tl8kkOzU+8xhIHY/lCy2t9+DPMXKCOuIGj71SMAser+yTgpg+MfgLPVtl
-Banljk5G2yfh+Cdaa3LaMd9o2XAXc+21lbBM/iasC3+O9on0o3cYXXqErWQ8CfwIHBrHBuCo
-t+g8O6OvLeK3EvbodhxFXmmnS6SIJtC3TGa+bNTy8lHfssnLfWhQz1fCXduDi7YsWGc9qSFn
-MJkUPhV3O922yjxLjRfv4mftMuzZ1FJ7XKvox8K+1LDKO4QPvAFc3jKcJ+PCaPivurD+7+Tn
-g+S0M2j7SR3km/SV/6YdpIXekDxaCiYfr+PkspZiV/8Dl4t8blDbdwRJqeM+XuMIXmcLPng9
-iWeVfaLL8Fqr7YTvsZx+3hawKSUtpb8Kv4a3fop4nTFvy0xahVVkULhDdoSpNbrhN8DGYtur
-H8ivtX2/7sJl5pYR8FZDODw9WnJGpms/ucVH4SdvHwz3GezJiiCEv/+0bniwL4IlJM85+Jwp
-dkDGWXaZZiN8uf1nh62f/WtZqON2WN6Xh318YLjbO4ZpmMmvMjf8KHfxogVwjEPQ9L/sb83i
-t3WwgxH6UU/I+VJNk+gn+qMul2VaDU174yXAZ6+gZCRnzEdbRwVjrHrQA5/zE7mxg8XXjtZH
-etsN+KKMb7Ud9shq2mceG1X5Ixzis8DFL+hJ/7CX/B7elQthadziGBLVHt0BPj/xi1rdT5FJ
-NmgietGFGg5LbLCxQWrBW3M0kH90iecLqnqLIIC/9lnvYBK81dtSBp3p5s9WjV09I33ta3LJ
-Gl9vGf0GepbYW7AjWa0Hc1npJ8Nnvh0e3x9ulEdhShJ4e22P11tmf5IFbuB/72hHv0JO3K2f
-ywTqqK3bJaYKbqO8/gCXv8aLT2dfS3ud4KW1BwvNI569CId+0DZ0tbnl5VgFd34mv9po34SS
-3bdl4LOxVXJ8H3qy3/eHSWUDmnYA1XkRlifpjaeTB3S5XSEF3tXcfk/7R77m+xLNI220t6TR
-fbJH4mpjGF2EbfK4wXdeNXiP99tiw4MR1pk+FA862RP6MBi+iKajrKcss9tgsxrO8zq8Odx+
-8tI2z6PaBT+NlqwPO3L8iRfNhefsilNcoqNJV4fsiEb1g2SSjTrLx4CAH2DtOBrxqr4XpJFk
-0xgyUNejdE39iyANu3ITTGxES2ZbI3Y1RTDHtusSK6trbI/sty/kjs3w2J7SC/lma+JtQGsW
-W++Pw3vwRnY05BfZF16nF7n1f+xIZ/qxnD25w2wyOs7Kx+sR/Hhqyagt5ErE8yrEpTDYeOTr
-da7HC5p67SCXDwMbk9jVfsE13MFVe6rX7RcO1b+tqzy3vz2OV/XsZMRvfYj96EWtl78NZ/q+
-8DQcnlyWhD/BnUckOoj+juqHWgvdQ9I0G6rf+C8605vSi3z04j8ZJyvklvwoRTWFTNHz/kp/
-x2e08cFBcXgjpU8NonvbwMiOH2yrvrUS5KfN8sYykdt/Iy3H9WK+zCp7A2vkKaybXwt/R0vO
-s7NZZWc4UJ7gEHNbMrbrOzrZhl78wq6O1h4+QM96Hc0GV/ws12UHlcTTsjC6+Xbd5wmD8V4z
-aOEDg698ND3pGGTxvEFWv6RZvbWm90eSxn8kI57yfF7OS/lVq+ARf5/7O6vlcay9Xw0n+8Hw
-gh8Os8EV/eQzOyKNLar+brn1nH2viehBHW+lq72yRpPPtYo8lAmyQK5JQ5QttfTX2yB3s6cL
-JjCTn7wrXN4mqO7FOF5qDSZZkYxfzBdIXk8reXwKdWT0L/2U5aWOvF4p8tV9m/nTcJbfDP/1
-h+xrHJsrX9sj6WOf61r7lh1pSy8Galfvqye8PhPIBUs8l5kg47F0kBKoyyR1f8hccgcrvT7+
-r0XQzr8lp8RHZ3dpCa8Nsu5LHG8r6vfcrB1HHA9xGaENthj+jWWmjnp4r4VwRxSJYU2kgG2Q
-DvZG5ls2elFN43pXreaD0NWf9CXZOR972kFuyybyURTtKNW1mCzGB78EpzmCPV42+N0LBf09
-dtDSj3DPDpqfZJfIJ4OL1PLQ5vsttvQaPH4ZvwN20bbKls5zWWNPa5s9o6WSstZdusP6i5nJ
-X1ZYo3hLLe7DyaojyWed4M/v9FtJrsPkhvxBHSlASSv9Gn1NTR3PcGYHcIiz/L329QP6o/fU
-0p5Wk/pOMntVOW3X0bMe6HsOX40XXwWX77IRdtcaWwYvZ929JCz/vZWTjsxkuv0ru+0LsNlS
-P/WpTHcNfLEQBAwjrzYgK2bRaUzkjqyWvNpTBmgFOaQp5YPeZWc34BBH+BltRqYu6d9oQn8i
-1220rLfP0bMtPtKa+kDO2t+e2Cjbamv495m1RmFq2nKO1MxigEywv2SLpdRL+K6oPpZHWo+2
-b9BjeIwY0lGL4zF6Sii7eYumg6WyVsWdp8MPP/Z/dKM/4KsjlHiK5vPqGpPEfwH+XmLfyyi7
-w7lHeF8S0SBL6OPtpm22jXie39CU7rYYZ5oETPaWGXaSPiTSa5HPfR0Efy/T1nDncp/FWTpz
-tmIoaSi/yU45I/0kCWmpln6KntzEASz3P7UXilM1whXBcok9tT6xP2Qvk55ryfBc28gjP5PP
-iqHxcf2Y3TBhQt/6BFh1ADm+H9gca5tkBdg8GjmPxhobTHyF5+xPbt8HRswLsRVCZj0sa2S8
-vIK7Cur/pIfGlJV61Q+z0ft1qC/WFmDiOy+m2fw/CW2RnLEKstme4H9ncf7mvsYK+D425KFd
-QWXXWVtUf48Ps/R0rA8V76IXr+WSZdf3zCSnd9GWHMvY0ydeWDOiYnVhi2lg4ooMBJ81pKZm
-l7FUuFpPRfL5LFium9b0Evqlv5OYvkquWD3ZZoEst7W+GBQuw+1t4ewX7R0++JT9QGXzqEPo
-Q2PQsxIUPZTj9pnesqpMtTs7MpAud9CdXkHfw0BfyFNpyzxWyxh5Bnfl5SM/axRZAGds06VM
-r7/P1LpMr6AXAZtv5a6tll3WiM2LLbPtsM+xyb7UWvpe8uIL6vif77e+PtXOem8rIJ1Ack+m
-ONpi4MFL6ja8xj82jK4OQM+a6hYvjtuNp4XkKl1Yya72YWu/g8dTyiJQcwaXfENH+3k0dit8
-NVKTwzBPLQrqvBZ81mb7PuE44AvA6DZY/L5FR9v2s73DSLH1LR+cOUG+shtSzdJoK6uhg22I
-brJF+o5c8DXedxKKcBNcZEJN24OLnSA0ttYCm2lktt7n3Gv8mfb0f/VbHFp6X6viPfSq5dHN
-dk2m2iAZYdmY+jWwORNlr+9/WzJPxzw6wuX72dEMks+GSka7hJYlJ9lV0h+tD85krp60lZrS
-Z2h7Jg0zaix8VjU5LvNRk9dSV76mht8itWSZh7iyGEEhbuP43/rI1ugx64gqfqbD7JB0s5Z0
-OgGdPgIKfiETFPIE/hhdnQ1n1meDclrEX669LvEtk2awRlocB/8jj/I7XucB2aS4T6QXjbni
-z+Hw6zJA5uJzmktO0NqbGg7o4sjfZU4W5PZPA7ePeIo/9YBN1BX2jU6wf+QXGyn96cU4u8h+
-jKGGrzyKv4QnFtoUb2jPPJNVlwD9eBM6/qIIdbTR0jZWu9pi3cU8kjiJkxr+8Eyc9a50kyVy
-Un6STGSzHiDlEEnhk2AoOlIZPU/vaQLFczzEZ52xn3SLpQBlm+lBNTbgjc+1Jb7L6jKP2J4E
-R97Q29o6z26J5GPYA10/JY/DxBoNPc+Cv6lmM0l3K8HnAq2Mnm3yappckqFgV+UAdaTECben
-ji1sznvqyBwMwIuXR+PTkrBD/Pc1prqDjZ8OE/YlI3ayGMxlk4+FHVaSBC7YKUsFV3X0YmCT
-65cH4Szq+Fcs/EIz4rMq2jgdYcv0Mr0oikuYDzajSX5tJB/hq6MS6AypgfubA1fc1n+ZwwrP
-FbT1TEFBV7LiSX1JN8/Z1yD8CQwwUoZbVo7TPoOkvsUK+yWSUTwwUc9r2AZPiZY+x3feDC/I
-szCFJgabhawbezJGV/JI0by3tvO6+pfnBhPvZLAcknMyW3JoN+mjX8lBeDMITnq2YBQeowq+
-K5Pf4l7LmEkbPc7GrbL9MgVmHmVRySTrfQm92Iee3bcLMBeO3cvanx7PCjGLCXIvvCLOTDLC
-Fd9bA3a1lf5pTVGEqiSOAvrBE6BcdyP/euUbWYTK90M/KsgVdCRhcJ5MMtU/D1q54VTP4PVm
-w3qN2ZX4esrWyVZwsRql2GKr/Cgcfs1SeHQ/HKljUzyv/ecfwqpyI5xJHeckqgXks4zgogDJ
-vyis86XW8gxMPjZb+UA6MY99uJzkpNZW9GMDjuO1JpH0wUXywHxPHfQBJ3X8D/h7isbySrDw
-S9lp42QWrDQevphmY9mMknDnP/bWJtnX/rXNdaFTZ8JGcjhcIlfCm2A1Af3Iqw3ZsjVWGQas
-gEKV0KeekSsPdDbe85WclnK6GA/eRf7WkpIiEMmP18oTjPUkQTO4qzC+OBYKcMXSR+aREVZf
-uphKL3LiKDzGQjjrsu23rN7RhnkGdvWfsAZ1LJPz4QN5GSbT5PisCO4aabX1Hjxa1cvrDs9D
-L+JoZ/zNEVQ9NRmxvfaS7XjxjxpHMoGNL4IpeK12/ga2PUL1o5lHCd0HI8/ANQywlByHUPHe
-6Nn//Iw9sKQ+xTp4BVAbz75kR0bJ3+FxeR2+leSWSkvRi+5WSg/Tj5z+lU7xLzX05FobfC6T
-mziMo1KJrszQtnJV80vc4LVnDLbi+Yb+/zyy+WT9zyqiIf/J7zZZutr/pBmeryNaNtiq+zx8
-zgU7Si8G0ouv7B+Pb5XlXTgHbF6SFPaJFoVDm1lxnWtV0JG62ghdP+hVyMsF6cXn5NS4mkgf
-y4+6SZbivG6RYGMFtz1xMMcFfF7V/6HzoXXRozzSLDsBT/wk9ehFPTvpHWwUvq8iuTmmC060
-ofewfV6ITY5rQ+CKoxLT3srn+L1iYLIlfVgV6cPr6M9eUy94GXY1pw6RVHoRfOTUM9JLJ8vO
-yGf9RJHEwQ72dBDz+IEdyeBz9LnVg8ejw51rpLfVlPZ4jK62g+3sj88owZ68sS8i/s6Gt7SH
-ntvKSkL7FR3ZJ2ntrnxpLlXsU3JiZnjrf+hIMdxLAZJHBrzvp7pAYugr9qWMrpPR4POI5mZP
-7qNly93R1VtaCW1PhzN5YYWY6n2ZaePBRAn07BUJdRPc1cN325ce+D2ribdY6VUsmqSzGvRh
-LDqyCV07I+m5Zxl7L4MsDihPQ7qis/4ZbJ1cK8PjC8GpU0cN3SDztLvcxfclBhufsydJg3H+
-AQ9+Bv87CX2voCfsHf5mngyBMwZZXPnV/vD5oOEUvi85itLCh9tWsBFLkth3EoY9wedMMLKZ
-mv6gJ3fxxCaX6UtJT6/zPKuKfKkNSMq7mM1n+on20lNyQn+VeEElyRtE/JzgGjhd6lGCznjh
-Ij5GHYQdsjvw+CgZaMXR17e4mjX4jAZ+zqLgMRayJ5XARnzc2KOwlFwKW8u5cAS8MYd6NlHH
-KRkT+TyyGKSc1HrY86Ic5XSMVGQm/9OaGlVX6wF2tbfkCQpI6eAt2WwPujrK/yPJbNO0pKkH
-bN0W200drdH2NDLJ/qKGgSAzqytO/Dtvb9M8nd0lr6bl/F/LifBHjl5yNfxVYttiqYMK7LTb
-ks1NJnpSZpJHG0pZPSilwGcqHal/yw2dLhmDH6RckEjKB5c9P71IAofeRY3n47t+0DfM5KzN
-lgNWSQ7h+w6Qj1AHdiSml4h0PTVxpMnwv8/CDHI9LCwXworU0AS/0RMPNgElXE3COynV/YFs
-84A0mFb7Mo/rqHtxfUReXiE3tY18GuSQrMEbsHGSnLrMH+lw36JN8MHFmOanfoys2lWeWg7y
-6l3y6lR/a6U9mz8io07EBVa0C57azKPgNd6F6ZlFXnxPacmBY/3JOskJGyNf+Ar5jUf6xx/J
-N/i+uRJfP8LkPzCPBUzoDpkgVpBJEgXOrtzxl3oSfK5G00ajyC08ppbyjZLVW0pqTyex/AJa
-NtQzeG6vBIv+gs/YAj7veHL74FHp1rswLkcySQyPfGslUeV68tz6SSWfI8v8gARweH3S4Uby
-UVy9hgdfIavYk9uRXJ6WI4o80xd+iZy0DubvrlM9By7+Ao8wTAp7KfncP3osX+vxvCEe/BOv
-hgsc6K1AbH474SnoSVxYNhYdS8Fml7U4MtJyknZ/4N79wMUSecyjlZSoOkGS6h24K79ekkG6
-VHZTxw2tJPdIb5f0Mzmg8enRa/9Jz3lOXelXZbCPkmZeRr7xKJLOD1LHL57Q/+c5/A65aJYN
-oI6FnHMzPLrXC9gxL27nvQGJbrLFk78tv3zpzWS4T5DLvl8yy1v0PY1uRtE+islXeh4PvBjf
-1ZucWEcWamkZTy29NYXUwZdmJLPdktn+u3TxulLVM0oW/4/d2Ouv6UB0Lwo2Xlst32FD/Tfq
-6EYd7cgGrWH7rvRkmr330/aZJPEK0sh7MY/F8tQvyhfMox29WEYv/sGT54BD6+pA6UINvbUo
-WS2LNNdEZMdXnh98iM72vfKTD5TvvSLYSCOBP/UnIOGtdfHUYKMy/xuOsmzxX5lHX3uM93nj
-PXECY8nx2y0PXFFDinh/GeoL5U8/LknkP6mKno0GF0fxwjGooYQOliYk2J+1iHTCqTfVpPBq
-FBL+AxzaYT8nc+nkAK8pTTyDlPLXnt4PeVof5QX9W//RY/tE0sFe3OAV3PF9WP6hD+V2Ilq7
-iV78S5L5wvNKd/9B9vjPYHM6uNgrPchGq/Bc92QyG9uZuVTj2ovQk5xSVTOTl9LhlhNKEpzi
-33KNK9jhbWWWF5b+nlDq+T9e1nd5BfakhVf0sZ7UN4KP0zDZJfTtImr3J2n2BHP6i4/f8lT+
-wWt5WpnmxeWS/yiJyYbfUUE/suoGanpMSkqhraQQvfgGtSvHzpbCiRTGpWbRUiTKrHJMopPm
-7ngTQcNlhieRbv6Y82/2Tt7HR3pJX+ZR/QBMdpIajvtM24P/2QBm1+JUN6F5B+ncTXbqo8/3
-5DzSV/IZqb2m9JaR0kV2SwtSfG2U9gfwUYsM30hya3tYrQs1tIVV6sodKSXrJa0MkQ/g86zn
-l8WeiJ256z19hQ+kkinsygr/SD46bUtJsTNwY6N8EalhA5g9b+M9hq/y0v6XD2Gahz09M6kj
-hbn+djJWZnGckOHykjPE0eHUMppjIseMyNtYOkD+kaZMsLhMkoTc545/I6s9s/RylTp+Gq6Y
-5I3odTeudYg/5bx/WC9UvyOpvjXz6UBy6UuanA6CDnpnUE16kRdeRTLJQKkuM+UXWSjLSQYn
-ZAYJYYa8YD7/yTSO3+U9ePkog6ihJZ8vI0slmQyTR95ctns5GeJZwYb5937Ma/o4ulGLuWTw
-CfRjLDgYwvX3Zj69/Aq8+sYm+mdMr4pf9+FUv9dzy0umm5prL83VtZQpMgKcLOTYzHn3UMMR
-MtNf1Pa3TJTbzO082X4P271Y2Ds5511kvteXn72Y1PJ4UtsveTuf7SNAyXTP71NJ8mP9PRz2
-ECf0N8dD+hPV58Iqx7wGvRjmSWULV3LbO0lsriyf/AoiRnKmoZx9jKzgvNvoyQnOeJur/0+m
-ymvpA35ryiUwulfe+yI57mNkireXjiCsiceWNn4KbPzm0+jHLM41FSYbA38Mog8DcMiDweYU
-6tgKy171OuCTrslW/15ueiuJId25wp5SjRT/M+caSVemsQlLZT65aZ1ck7XyiNk84HPXpAqb
-HfG8s1c+g44ORBkbw6X5qOWj94VHJ3CNM5lOxHfKh3sy7wEW2sFqzZlRG5h+oOfxhXz+MO89
-8ZVg44yXlOegPb50kOwwx9f0oj5IbcdZepNjJ8Bl6+Q++3lZzsoOcu04OcVcdkkGcsQjnyor
-YMFePEJjzwU+3ngz3+Ft4I4fvR7TL4rnSMdZ43hWepATxSkLdn/2QtRRlwn2Z9PnwMLbvLec
-9rly13dK6H9JUvlXcsLrJeH1upJBf5FsugQWOQBiz8l2etGNmeRkVnd9j0z3dVLDp8Pl3VGH
-8pLU46Oz5z0TXJCG7U3itT0+tST0LLBVGs7+uXeA51d7Gf+XjWIC3kHG+Dz53U/Kcn8sOz0E
-cXH0mafS6GSVz/FAFfDH/dCYZXKROcyUW+DiH3jrgexG1/r4ZRThqMT2VfieYfIBTxzfk0lG
-/5vrXsv0R3Db0vP6d17YC7BHOZlPLrg1PypYzv8nDcBlR18gvalhCDXgtmWBR9Hd1HHZE6Lk
-EZlaYPOnsMhJGH4GateQjJ8UDv2Din/1t1KNe6ajg9F8rXziv8incEgOcFqQfhTwxSBjAEdD
-mKy0F2cy9XAh46njDF1JhCJWQ1tHSmtcU0d8Rjd/IgP9P5ns72WNu5zwj2juM0lHhqwHKiay
-r4ekfeS0ouhd/NZi/0TBoxTHsaX3U9SyWPKwu9+jDs08urSjjtZgrxU61xJ0toDVuvjXPgOO
-P8M8YksV/xo0dZMWOIXmvlWa+h/c8yz1nIGNzzCjU+zPfthxI2y9FLyOhU2a0JEcOMPHHg3/
-B5dSRy1/Rx13pagfkoo+jV1tEvkXCKb5e3bkJHu6FB4d4b29rXdnL0agu+up5S63yaQmXNEQ
-XNTz0fIDKlnJ13O7gXo2gPhN9GQdOFkCv86DSyZJV9424FLvSxz5RE+j8XM8nvZhgk38JdO9
-LB14hFHsyzIwugvk7/R7dGIv3DGPOobQhzb+ExwxHAeyDu29SU3xmEd+6qhJPT9JBR8s5ain
-ko/lYxNxMTCXT4GhJ8tbtrEE/DEUrTskBdkU8xh6wuPqEnoyNvJ5uw/56pOgaiGOobNcgMOu
-UMdRtmANPDYFnPbBdbSK7EhL+lEPfNaJ+DsFzKU2HF4J3iqFIuTzrniPflLIh+MmJ9OjWeBk
-Hpuwko1YLbXgrIXwyR0ph64lJGXfj0xWn+paMLLCX8lmMHoUPr1CHX9TR8QrDi31F3ThT2+M
-ihb30WxIJ7a2jjelFxPZm/3+jT/jMylAVEn5DK+RxPtIcv9NMjGHQjBBfbAyCad7FfTl4uwD
-6MQxeDyUBtSQWTKRqtKT/lPoHjCyxZ/SuSNygC4e9tbUVEwm4B5a42hK+hUYdKt/ILd8RNXS
-enOvTi2jYbV94PQdW5Rb0qBIMZiJ23yJ6rsloV+T7P4CtXZQFk/vgIJC8o59PSFH0ZiXkf2I
-LYnZ6E91vSfSGR5dx/lzzvsHurKQHe6DxtVmXwpLZq5UYYdbOJ7LNs9foe7ZYdjW1LDIizGX
-zP6ZxAUbL2yo3LCVcs2Oyz2y7HuLRRpMpQ09my71L9Vx33Xx6MtkP7rfA6eaB1Z947n0KJ9d
-ROIdT1/GgpPf/AYYXY+uDGNnGrPDReQd7v+sXcVpLPWj9OKV1YA/inpX9H+jx4X1X1lBuWg/
-yW5bIJuoYYf9KyctsT6znJrDi2h3L8tGlNIv4dLf5KFcgT8T6veST2PhTy/4t/Sigs70r3Sa
-Z8WfR9OFfp1NXyf9qKOaNyQr5KPLhrIfwuWM5YyN4dQS9CIDLB8bln1paeWSVSdDD5bltkyW
-2SHZaHfktBldjK3feGIePYm+c6UX53CoE+WZlIfZo0lBvUiFO7ySrvGKus6L617PoGdIvxfZ
-24Nw6QwfIa28ASjLRsef+nOc5yvr7sm9PFyeCSWLgdv6h6x0xtLJZtL3HNLvVPtNZtsS2WAH
-yHDnwcttWOhfOQSv5sDhDJcl6Gpr5pGTXij++DEZ/p7X4bYKlRbVONT3Kd4slpyRW75UFrF1
-rbwSG/gp/H6BOqa4G3MGj3VQuGH+n231q/bA91tiWWrFqKEux08Rz6aVA7ZQ3tpGKemHZTz8
-/oLjB9zxYhnPVBqgsHnJBimkLOesqinJ2el5/wt8ckGJp7nwQjHkAB7od7ikE49SDNQ7Tmcn
-SaUvjrQc+Skd7BnApw9sCf70gq+zaDLNviA7fS+TrB1zGStnmE98OLwhU94K+lOiaV25wv3o
-ieOEMmkVclJpqaRfkVtKSi2Ob7SEfKH5JBF88gx1PkYSnS3FvJ38Z7lJZQ98ts30FVYX15UZ
-RAgKdxNPesDWk1eekKEySB+rwNFOxtg4WWnr5LYdQx1vwF0v8YUfpSxX+Dvu5hZOLIk2pBdl
-pIIWlgZaQJrp/6Se5ie/5JFcKHFccv5dVHEzKjWIyZaVK/bBV9oKEkET9iSjh5E/67uEL99t
-i8lNV8m1iaSvlZSe1khGWD96MYt7bYbLjrJxl+W8P5Ai8NZk3N8tvFZKbSol6UNNzt2Ca+/I
-BrWmhuochTQH7iiOPKEXO+GNYSjDtxIFt32cZLTeWvkhywJG31l28NCc/83ho+d9gcWViVZK
-Rlkz5tFf1to0aliNa9qBo92PFzuG8z+JI9wiW2U0nFWfOgqSmTKxqxmkomZjLvnIcEXJTsUl
-Jri4L5/ITjmCKg3GC5YgDYZ22f+ySWxDbX9BBZ/hwH5ggUf7M7LbTXvhp+xz+KIMXFFbjll7
-uU8tifAelSMd9gS5h6bkhyci/PkGEsN1qYwfL4e2ViMvtZDPtLek1lHgcgK5ZQR5tyUcm1UW
-wP69ZDS9KIYPfBP5KuIT/bo19XdWBveXF3ymB5/xyQYf7A+/ba+oJa6cAB+XrIS8tFqSCjX4
-gUeZ7OPlOluXiXTQnFqmyygyyS94z6HyPPL1+heAk5WRRxydD8MOkojvVJ0k7SyFv/qhjhXA
-ZzzZS2rebtPoR8dI/kzrX3klGKwvO7uanb3hFy2qHIbDDlsROWcRnN4e9h2AF5rM1q/Hp++V
-QqSlHuzIMrLLH2D0ERiJptPpwxz4fDZcMZFa+vKxSmzUJ9SxDk1pgv9KQq6+aP/BCpv9HOnk
-lTXylOhpef+CXiT2BdRwmgz3wneyrxssqWyzrHLKitLB7ySv15OuuOvd/ivuZiL6PgzP1QN1
-7Yr/HUgfJklGepGXPuTWFbw/B7f8C56wLHrzBnwuBht1vTp1JJDHpPjHNgGWaAkuvkNN8+E3
-kvuvbMxasHEarN4lXz/3rSb0I5HcBStJPS8zifgdyrYwYT9yU1/O3oU8+zO5sX9kXkuiqyWr
-7oOvjsEhB+jLcvDRA4/8BTx7HS86hl6UxFFF9ecgcR1n7O9J8Tn5YYu6zKMP85hOZtrs18DG
-EbtCrr7nB+ncOfryxj5F33NJSzL1SrzhezDyDX0YTo7bJoNxxTPB53ZULuLVIO5x3KWePyWN
-LoIvmrJLichPu0g67bwNriW7GLzltooaBuDGG+F0yuACM5PQYvtkKlzKFm3wiL+Ztcn2k/NP
-+0mw8spekqiSUkcxWeu1JAr+twoIHSMd2cMRcPlK9PUMqemZ5FHjeENProCRRfBnA/YovpzG
-A86R7ri5Mp5e8uMmyvpyOgGz4zGG4YOnoq1zmdIiZrLU93KsgtOX2kpfa1v8hB2hT7epOibY
-yIlKfgVvfCuNSbPT0bRjVPMGvCbXG5JZP1BLVM2ur+GMM+B0ssTWiuQGkYOywcdJZ6/K5sfF
-c5zEbc4gGXTzXjDGELLJMLR1kN9lUvsjfwLWzefgQiJ+0rDRpuOMNng83FpFj0ESzEk+KSUl
-pSKobEJGGg7+NrGbdyW9xtGs+plm0VSaiZ6k1eMSX4dQY0HcwAMc5Cw0rU3kazU+w+1tZS/G
-4cV/wntW5shOYomGzt/l/Efh9G3W3rfgAPbZCNhlFjXuxps+4isSoZA50LSC0gh0TJZmsPmv
-7Mke9uEpOEigcTUl1cTRWPpQouo6iXh9MKYDz11BS+bAGQPhriF+EU++ypf4WHJJJ9x5JZ9D
-HSM9Jt15ZC3BZH3w0MBPW2t4rBd5fyKueRsO+h6ZIpr8g0vIK59JGynAvjYAG79ynoOo3Ct6
-nwB0fKovyLQv+OgjmPMitW6Vz2GV22SlLXRzhb/1zX7CD/oy/h3jh0jOa70Cu5rN21NHNVS/
-BPjIz74UpTcV/L01wwWMItPupBcPce1RJaYkhrkzSU8Udq50ph/L4dBbcptu3GdbHrGp/0jE
-T55OUcl42SuVZDaep5ucJoWtI6Os9fu+gyoO+AoecQL96Mq/NamhEF1J5QWZTXa2OQduvQiz
-qEbG78pOL6TeS+Re5/6J6XA6qc5cepGbp3GetST5nbD2XtTkAIxxhK05ShUHyDAbUcBZkh0c
-PcYH74E/NzKT3R7xmqLn/Sy57QSbsYaUNAz2aowLLI225ILRsrDNeZ3kjRdqAbNM8qp8bW9S
-Z8SV/OOfSxr46Gt2pRnc1V8WUclVmCMaCpIC9kyom0lvO+nSDnZ5nVSgZ/F57xqccdDLkJvS
-yEU3v+MPOE6TmNYznfHeLzI9ViYZ5KMXaTkSeWFPQC9Ssku50Jnv8cm96QUbw1UlB6PZyIzf
-goyesNgaFOUmSVZh72i6hhp2oagHZAKV1AEXafGJ9+Hx/TDwDi8NytOgtVFI4o/8qh8H/8vg
-rBEgtTnnLMM2ZGUuSWCSmOx0zIjNoF+Z/DaqE1N6eyqmmh4uz4qrLCKZpZ58xb7Ww3d0kBvS
-D4WNcKVL5QjnnkINjaklC1v0jAR+AHewkay0l/RzwQuwv2nkkYtc8hu+ybfTjcnsSEf/kWuu
-icY18BTemawyDl7dit7dpztx0ZP0MpTzb/HMID6rBFKUq2woxdD5GvBGS1SjF0idEPnslhl8
-pBVu+Uv+9xE1Po4qryJ1r0FTDqEI1/x/8pCu3mJnjoCRpVztb6Cjnzfh3F+Bx0w+lB7Mphf7
-PBapOzkcXhjGaeUFSRh55Zhngb+ySWwpjpP5EYyMlLrsSjs6QKrBmw7DidSCVTPQj39x8Vt9
-H05+DVcR8XdvOrEr1fFhheVPT8ntO3pxDpSu8Jkoygy6MA90bIx45hX+5zk7k1KiMclk5Nii
-5OnWXkOmenHQnlVueCb0rYAkh8+/RFfKg9TG4KQfaJkKqyyjWzvkrJ9A28/KL34aDt+J/5st
-y3AtZ7wpV/IVj5BSXvlLeOAwCjPFr7Mr11GaO56RtB/HP4l8jbDXVhzHWI0sX0O+AuE/eQaZ
-DU4PcL9b/tgDzpUJXvqKvtST7/CEpelFdnY0Jgh96FfYiQeynNQ/jfS/wPdw7bPwYH1RpHok
-rXx8bTRJLZfB/XIQ25cJ1eD8X/ordvUjWSE2fiuDPMXvmJWTtF5CvvOM0pMa5vtNGOcydTyC
-UWOAwOzMpbQ0hduHwCVzQcwm6jsid/0S570NHm7Cm6fA5no+NokauzGvatwvG/zjOKA/celz
-SfZdubbKbHFOsJDAP+CPE+I/c+AzSkhsasgNFurCn8NB9Uo/BvOcYmr3QU1MvHF2HrMobFoA
-R5YBXMQGmy/9L67yNud+KOv9b9mJm7/sKznrr+hAe8kDA+eRFJKR/f+Uz0YjObxjX5+TpV/A
-GR88useSiN8Tf2VfioCkVLgUNpjp3gJFB30Xb9f9D67gX08nSdjcvFKTf7vR5XFc32Lq2CWv
-PcJv3WEu9+CsqySbQ+BgGf5nFF1oAf+RHmC1FOxdDBzAO5T2Kf7niRdhJqmY0Sdc5dvIXhSW
-mGxWNviiGkjqA9OQZKhiA6xzFFZ9BKvGktySCtVPDXckZGsCWPWFH2QXb6EhL+QwCe8Mtfzr
-xyUevcoOnxYGz0WoOq9EBVsXPSHbHA3VVWlEz0swp0wRV8hexvaSEo8jPbr+DZhtj6b8ym4t
-420f+niFLXvmr6k6AVWkgj9SgLsEuMKoMNdrktW9yHT3kKz2AExcZB67JSlOPjP7lJ0MnpF9
-T85HY8JmH9GJ/3j81/CXcM0JSTKZJCe7mAFvkw2uKEkvGjKvPmAiQguXUMsO+nKKfblOfU89
-GR1JwSMnRHej0u+X8PYN3whn/cl234CvruM1/qC2LfRjFn3rLemlKkc23o/CXK9z3p1o5izO
-1Q/P24SEW5kcUMpbSSFvwW0lqcmedmQmg0DmeFh3FhqwAkXaiv84wI5d8JArecN8HtHFS14H
-3h5Ol9ex3afwOTeY/DX5y0+SbrZT8TyUsT8V1GGa+TkSgtV/mf1pLwKzlZeJ3pDd7YpLGyL1
-fZTUwX838x/wn+lgnhf4k3P07QQs/xdcc8t/B9cLqGMLt2fZ42eRr2y+gRQxHY4axF70greG
-sq9z6cduMHsNnL7m47HBUArYPj28l50pfSnRmeojajhGDSu8p0xgo3r7TDz4dPnR+0tzryxt
-PTXO/qW3Zl+b+TWOu2Sc53DeG9zkM+q6zrSOgJeVEX951atJN+bSHL5qwa70AqdT/JlsBiMX
-/IL855skLjv1GZjOI99LGZisOtNqigL2oCeT0M9V1LGbRzlIHzaRFUdTS3Vm9RkYfocbuI/6
-3eb2Ltx/FzdyFcwcpi+rmNREWAdfwD3a47sXSnk/I7X8CZv+kk4/RVsiXkv4iCjOMKUMoIYI
-P/sVipRZ2lJZX+qYxPRWop+70a9jqMBB6ULK+sm7cZRgT+JRy4vI89ei/7XpSW1m1Iizd2Ey
-v+FlN+NanvLRPLBMeyniC6Q0eKjLTHqxrxF/7/cIc/k3EqdTmUVv2PdHNKiC/AT7DgQxk6lw
-FRu2j688FfH63vRknwxDmVFesPEF3Y3FHr1Cdx54SeoogLPOA5cVIvFUwp91xJvM81ZUWR3G
-LUv6L0lGq4C+NoW7+jOPWWjLXnTmhu9H01ayu9Plf7iVSvimprxFOFsyMI5SUYJL3Gsj7Dud
-ngzhkX72n6Sefwun5JSMngJOiQmnvYXv/8av7saXzEYDBpK+mrND3/k/OLiCkg79SuOb2fxr
-9OSNNPCYOsBj6Xx/zx7dx/NcwFcfgUm30I/5zGMQalQff5+X1CP4uFOeUBdxr6FcQWse6Xsf
-KDlwTLHYqVeWXB7aB79hV8lQm/y+/Qr3d/T/4VY7o4x7cY0JcQcNUeb5sPFZSemvpIDH1nr+
-KY8YV9dSx1U4LTaevZicxC3tkNFUsBrPdBYufgOTJNb7nkU3enYd7Ym0LSj/3ldQQ1eJzi79
-Q66/Tg3n7YKfstV+1ob4v9YUX1SOKnKQxBPRC7OSqPNolPEY9bySzz2BfuMZtJtn0qWeXC97
-NI0jb0HmE+mEc5xMT7bQj6vSlUxRmmwRW/6n57yELvDc2tujax1YsCDYTeQN5JnllisWRU7Z
-RT9AEt8d+XP1+mTvEp6eBNwcp7bR/7NYcscayA1bIP/aJToYos5JtZGn1+meSv9iLjHkA276
-KTXcAalncWmb5YKMpbKGklRzSG5968X1sBfW37lHDxBVw1fzKJ3pRQl5YAnkInn6pG32g2TK
-o9RwiywTh0RRHqc2noru+FUrIH/aALlg2+S53ZJPqaMMs+jHsdOFMzxDWx+QLG7DHNdkPTn8
-NM7xCdiIrbUlg2alF2+8oB6hgzOZYHc/AK+PQNuqyzvLzBW+j3yexUGbSS/ak/PLkvGy4dfi
-syH/RX5nJIYcsZqyzybLaTtAP+5IUn/LZJUpf4Ah/5FPSHcl5W/pwjxm04X9vN2DR2JqP8mm
-1aSMppfq+tyr6l4voFM8jpLT0JSFzKQLMykr1/BCp+0SdczyQ2Tdq+TLaCCjpL+yoVR4ztdZ
-eplpzTimyDrbKufsT3D6N/24xdZdxnv8CUudksrMYrScxzGfJlPsljS6QMrqAGmuNaWXZpMB
-+s476Ekvz2Yl0S5seWmfzxW1ox95mMsT8LmQeTRmNpnJuO8sgZ+x73yV/eZj7LJ3s9Tys/0g
-Q62PLLdpdHAt3dyHGhyGy4+gHKdwSNfpw1O68VaS6X/ytd6R1npQhujvMkXbyXQtIMPVvZEe
-BdUTYL368EZm+OsDO/I3O3rcxvtm8vVqi/iLkjftuu2xhD7ffvBRNtt72EPvbNlkiNWTZfYL
-NcxmT7aiRkdhopOwwWkU5BqYeE41op9oFM2nb6WGXpdOukUG6gjOX136aAqpqzfZ2RXgsweO
-rQx9+NQjnvP0HDzia5nFHvBwwN7YVfvLolFVSZ9jg+nFCY94HuhIKy2LrLWcsUES16eRspbh
-y9egrathyM3SWk6Qpm7x9lKS6BspQfZvrOeku66TwTpUBmlVaa+pwMg9UL0eTu+H1n6HWmaI
-cHrk3Zfsx1UrxxQSgsa79t4OWCZfbo18ss33wXbL+9unMtaKySqrTi9a0IvupKyBKPcg9H04
-rDAThd9OJRfA5EMppv9KU2bST/+QMWTwsdqf9ytKHerIqI/9rmwDE0PJSLXR1oLkgTQ4jShs
-5lOLDWddNrNNlsZ/BxcjYLEettc72AtuU8kkyy8H7GuwWZ1eNMFrtMKPdSDH9Md5zSLj7pGc
-elWaUcNYfSqL9Zas1SOyQueBjZ+lo5aQ/BpXnuHJFpFf6qGMiXmkE6TrgbBDEfbC7IOdsqi+
-0lL5FOYx0jr7QKbVF+QMht1mWVo5bjnpXn5cW2kyWwV5h4OrRJqci5I+JkPk0k304JSM1kuy
-SP+SNbqPWhbJOHrRgZkU1CzyCiQtx8k2po6kbNlpvM4IVLMM+SE6jH0RZGyw/PShvI+ztj7W
-poPP/dzeBCNvfT+1vLVPpLjHkZE8wkUcU1bSSy+0/BDaFYv5f0P/u+hhmaB/ylw9KbN1DzUt
-lnZ8roQ2RddKybZIp/+C/H4s8vs746iivLfzGF6RGgpH1jAdxhht3zOPjhyTOTb6BDvlK6jl
-oj3wT/E/P5J41nt0djQBLP0ZfBnxjLS2YG+y9GQvZulxWQcmNuhRmafb2JNZUlt7Szq49CoO
-YDz3Kx/5nYeDuMxF3ok68tAToY7LVppNLcv5qvoCa8f1j/NZtobbI8zpMsx6yxV3Vg7XPgmX
-9ACXWELMJ+K+b5JMsmhz+VFHyQj4ap6ukWUcM3Wp9NcpkTVk1gZgpzSsmo20EQcv8Dzye1PD
-fKd/TW6N50P9nnWl5118ifX0aTbSx9tierKPXpxhPld9qd3wCyhfaraqk5/BG54F3+fwt7dI
-SiIJ0a3vtJb8zPlG6m8yUWeA0ZnSVSdKFR3IbrSB1arLGupoh/JkIsX8TWqeQQKoRTWpfC3b
-MQ32/JUaxvokmwQWFoPPXeDiuE9kHsvtNDVE/N3gbdSwgUyzgbyz2fvhyM+AkBSqUk3zSG+t
-K+O1Oz0YJr/rGPhqFHjtL4W0rUSjxmNMYjhOpIzkktCT418FN/oAR/MHm7oexpgPV83zmbB5
-xO/+jwGXY+xPj/j7T8u4PUU9cchR9XwNVa8kl670RuSOtbI/4rf6/EtNBE+VkL7aCI7oDD77
-0pNfpK32kdLaES5rBCaqwizlpTbqlwDHfAx8DyKRlQBrUXG+F+GFtbad3u/wAcyht/3Bjl5h
-HtfAxXnU7g8PbY9X4PzzyLkf8EA18JHLZT4OcKfnVxKFJgETRWUGfD1PW9CPTuDyZ6mp7cHE
-jzB8DVnHZneQb9mtr+Qm2et3T8Pex4DJX/oduw4uz4CHP+GIiN9CvOJ97J4PZSd+Bw97+NgL
-5lGYHDoGP3oXn16CbZ0ko+HBmZ5Z93gtfeK9NZn8qgXhqIoyCSwOAq/1tKXkUFSLlHAAXAyl
-lq85FPXZ6cVxG9kkLyz+xkLw/9AXUstQzt+d64/4K47d2YlhqP4CO4ba7mKfV8MuM0i4o0HV
-IK9FN5fLr7jAFZ5Tz3tNjSqdNSfnLs8s6qEfrZhHe+bRQVJEYrMZLN8Epm2KN2soH0hpG70w
-bvgz1CSaPLGnXO91OPM8PTjrP+NEf2IvelHDb7ig9czrLryRnX3qDcuc9sGeBT3qTR3HSGsx
-dZsXwuPW1cTyk+ZDM8oxi5rsR0Pm0VTy0JNY3F6njqXkyfbSRnJSz0NS62z68QNIT+xxUfi3
-+Jl/2I0H1PGAPjzynsxkOHXMhy+O2zYPfKF/66NItt1hjNZelHQykox1WobjgNf4F3rdK+on
-0gRv1VELoevlpBEY+QpcpmcuAT7jvHQmZffGq/cBG13ARnPSUmXUtZDE98/lqsWTNRYVzXJ2
-9D2zeEFNt3we2r7XtrDLc+nFQDJbS9+FR49LWmog5ZhJPVzfL55W1/k3etubayz4MztzKYun
-qAePRfy2fT+8eMQzYH+VnTKFmUyX4ujOax8qi7wj2bMmyagYzi89up1IxlhM6W8ife01GvaA
-PT1Dj7b6FXY4sQ8h2TZnQyqQqyOeWf+lj2HLzlJHXB2Ox97u9fSBdyYZ/EId/bUMfqsOvqsj
-/q+f/CfDyEm/yhjqqMKRgPcPkeJ7eBvJw8a9seJy1HLIAtzXeEspv+HOp6BdEc8kOMje/AMm
-0vpkr0timkFiu+G5PbOk8rakpBWSiz35gbwzmH3d4lXwMU3R7zb6BfxRkRrayuc6BJ2ZLBdh
-76Ww58+yCTVZT6JewqaPZ1d74kAbyl0rIzstr8zDmU+njpn0ZKk9811w5g3SShw2tBR96ONF
-Ya4UMF7gZfGMI8iXx0iOQkLJSUKprGe8hQboag64vDK46CzFdYKkRE9ey1Y5KofRstOw12mJ
-hRJvg/VaoUSpSWp/46HWWkEZZRmkG668s32EM26Di3144Jl+3Xp5MqZRgx787rHB5n9WiGw3
-BM94iqtIoOX9ax3k7eCN4WSPyZoZ7qzIXH6ShuhIXnQtKl7jDG+TccjVyC4x8arb/YS0pI5k
-PlbOWht6UE76WC5pgqeqF/naV8/wV6fhrOV+Gs+VEDWvQaaf5QlIja9wf3fow21SwVtLrOm9
-LLmvrU7yoeTiiWjKeHoxAF/TSHvIF2jaB/pwBHf8G+pbVf5FUZ+h6velNxuWB+/6JPLvDjSV
-CXi5HvaFtMFTdbBoYPQBmnKQHf0dvuoMGr5lKqlh+9d8xQ1rSVpbLjftsWjE7w37t9reW5Fc
-+7Cvv4DPHpqf/agvRcFELF0ml5hGxHOQO8p7ySfR9Zl/osv9P7b9AvNYyyMOJe80ApNlpCvp
-tR1etys7MppebLAFYLOrf4Gr6OxJUdQHoPaYlQdFo2UP87hksTQ6+a8MnDXEu+gB76sfvAc7
-0kxrwBWDJJ6ulcv44mUgo5sk0OKwh6D0+zyZDiAxFsORf7RZZMAOMp+ZDGVPOrOvXewVXB7x
-2wFLwURvT4cHasGWrMAjv4TNC1BDD9lhW+SEvSLRZ9as/p22Rs9WeDc4tJsmZ0fLSiVw8bnO
-kUe4820w+Bi6Uk8+w31m1aeeTjfCut1JSLg8cRtMzqgnK6wo+EwnPbnaCGz+inZsxm89IbXl
-8nzeAfZchfo+JdPmkY3WWbbbRjlvL3Dln+tXXo5dbaEH6ccH6sgmrfQH+ZaMmAxs3qEbm0HH
-cFJ8DRQ2rWRChT9lgu/A5ylS2hwycBe6WxXeLEAvUklz9K09vmoUHnwH3usjaeUrHOdgvwmb
-b7dYstiqgOiI5HpBLls8TQRn1fCG7GpPvQBGY6FlBeHx5vDFVImPD72K+16Gy+iCwhYnxQc4
-9iOeXEf4Sxj4MBs/gwzcVZZYDTizsDSzZOzIc3TkIDr7G2eu5Vkjn/v8yNZHvnL9DCsCigbI
-VNsrm+2DPLZsmhOu6EYe3u799ZUPYle7cdU/kA/T4cOfRP5kMhUsXoTNqagpmdYtL6nL/DNt
-hyrn9kNw51Sw0UlmWCXpbtmlLRzeDVxMxQeesDoeF6dXhWrG4br+woEkkU5Wk65NkdF2jrnE
-0NDy6ndeQ6d4e73ovTQBO1IaXeuG11sjn+gjdCwlrrgUSl9H/8f2fPA64LOUDqUfZf0BvdjM
-dIfR5fpwxpfSAk1rxX78YlNJ0HXoQDJ07ApZdr4tIsE/8Mako8YguqutlLl2F95IzK4WAxeN
-4YteGp+sXg4d6Q2Hr0PX/xGjIydxx5NBS0OYNT2K+wDVWQnrt/MomgtsvLYZsj/ydwKLSkeL
-Iy3xF91sDtmkGX4zPfx9B2RE/F5eL9vt9elUTStFtThL8LnP7khs9Kw++7qMR/7Xu4LNvpyt
-A7z5LfkotcYmNRbRXbDYCGqoSopOxhbd8Ao639NoU/grO5zxjkc8zDym2WcyEJ8xOPJ3Rvui
-ZSXAZmj5fJ81h9FneCs753UsvjS0b2C5XiT5JfLQTpN538kwz6R/enl8cCP9nq4P5ur3wgyq
-H5nMnzDIHBS/nfymBXBjgtIcY7PGeXyt6+ckh08XsyZyCg5fYe/IQvt8EZnkABntmcUCmcet
-Is68hze1ZV4eV/Y1ddSyEjBsO3AxSaL5LvL3v7IUn/EMPs8j9dHSOmhYKbqQWiOe59KSTRlH
-SlmG41mNI5ujDsMdperxHlsboyl5cAofrRqsmFKW2d94m4V48pb+F/Nwu2LZccY/gIf+XtDW
-epaI57hYYqlipWUwqD7JRKkUpxCF7SsINhtqNWmPljbSK2hqRk2mzUDHZN0uW0kqh5jJTk1N
-Hf+wVVs9N6z7SKqT5D/3ZvLIssKKT+jDGvJR5wh2AhEPLQ4b+z9vY/W9qI3w9LiejLjBkrBs
-J/Cx3kg8PlUaoUwbuapASkZ6vZFg8xT5Oblm0PoaorJ/yXYS/GlS0x/6jWzUFKSmJ7DuNqof
-7tvxGd0kreeXe/YGT7HV18DbW62Yn7E39p+tt5Q40ZLMoSU1TPAUsGpO6qiBC5jIXO6gysV9
-lkz0q+SjFJpbysPddXWDfK/vYafSGk8H6GNZowc4P+yECzxIep8DRlvpI8+gm/1y5M+uq3tF
-SYGbvMeOHreJfsRqw9YpUNCz1DCBGhqwMflIkGlwoRlIC6VNYZVsdK+yJMKPt/V1sgtsxGAr
-v0dLx0p+PQt/f6avpbmeIyWR4+jQOW0sp1Dc9aB4CHryjR7yj6Sa1dLVW+Bm0+PHb/vz/2Pp
-HODjap8vPs/Wtm3btlO7KZLUSvnWtpHaSpHatm2mSJG6KVN3n/l/7/3/3n7uu8HuPnNnzjlz
-JnthN+hr24s5qIjG4rucOJ2aTCidtYqFBXS4TPasliKOzjj3EDrwX5S/MW46RFfIT33AtBGF
-2TC+OUsXj2+eMA2cZkoKkRNMrffgyD2iPAk+l5h0MCmqpDThekFO6zBiKSqB+kWrMbPm1yHo
-VCUtzvRYEwfui1721AZgMx/6mQknXNhuQTcOMMFc1hdgtZTGkFlaQcLV+cTmAH7/sezBVf1m
-Pi5v9jGhrIcXc+Qy0+stpqXTTCurTR0UpbzkNjnlocSn437UqnICNzlTT2sX3EwjbaH1NIM2
-1ueo5xrbTnugF1XJUH4QU8SO0SbkZaINonrr0PezTPJ/eG1FSeReR/0Ezu4hbvc2veMkjNnF
-1Bgsx0yQ3KDLXsaV72BKGu+eI1iLWAvjgJIyQ77TJCCcLoGzbEMkdZjma6JYtZhg66LmjbUR
-HClqu4DLvlqJTtsLLd1GHBZ33ERDNUTTyG/qUhmfPZ71z9HNY5vz9K7dMpUYDptZcpdcPACb
-p4hhIU6sNd0/IRPDIcnHvBZX0skTfaAbdZV7jE17raK+mljb6gMbgPPrDk/7k4vh6MQELYmi
-+dqpOpeO+8iuwH0cIvoPuMF8Qodg8tpAJCfkA7UpaDagkYskBFxewYWGMrFeY1pzzp8dzORW
-FIw8BUnTJYdUEI/80tu821qdxDs2x9/lZPtmB+heO4z+MU593DsmTdecdppWpB79+Nke9COK
-LtKWeMFt+pWaOvc76Me845xvtx5Ps1hamGky14wBj/2JoQu58JPjeK455KIZk31M6rJH6hN7
-CUkvCeSxPmUi36ODed/aTKTJdILeAwPz2drZUeRgqGZHxwujaK1sIHoayBQ9CG8+U2cwpzxV
-r+Zlj/rgL3fjt3+whyVgy0AzRDYzmVwlD/dwPmepx0p0vDP4yGD6yhU88QjxYw8qyjdNLEeY
-u2bqfvXTFVpQg/Qn+7rH/evraK1FDHlZMw+1qQNOxxHDFeLJqKP1P+ZG5wid5JJMfJn/lsh/
-uO5hkspVr87wtD373wZctASfvuhmAH3N+avCQPzPcFklg6QZE30i5te7Gofp9bEO0iPkYgOe
-ewnKNZdczKSHTNTSxJKPWMrZPuCkGzrSFfz20vrUcLVugedvtJRk4R0bMf91wmH5wcOm6GMD
-Wcp2nO0S3x+i688lhtbwJbmZyaQyj0imSnFy8hOenSaO+fpcu8G60nhdQ06O2fnoxTQ4MlaL
-gc9itrc2Rkenwt+bOONM2hUETdBT5DC+fNEG4Gy61IIjdVGvKlLFlGZCKiFb6efn+fo8PWSb
-ac7k1pPfjZNfTO+bmZ7by2Rw0VleoVx7NbpMJg5fPQc+dzGNrMffrASLC6lJENiYBFeGoh99
-8H/dUdgezr0rdTYMD9OL7lFHHWDKSikEU/NQk4zudaam4bt3mizkozDaXV1mwpPWxqnZXLnK
-sydQxUoyTqJKS7mpOaiJ1aEgra5e0pTUJpS+sZSp3bm+UT1ceW0m1wC4Mhctvc3ElEb7oy8T
-dDc19OoNLS9/nfuXU5NEzIJRJa/5px3YgvATW5jatpmsaEUFHHo7vI/zF4V5slOWMskHSTHn
-k0etLdfpJsEalc7yhSn9tTpXEDxi36FbH+ih79Crh1oDd94NrVpFfp6Tm7wKfnUuNdmqsXmH
-uhKh0yRSz8tb5p6HTI8PdAyT4xb65zGm2P3kZwm16glvC+AB35GH9WztwUZW6cqr0THNSk0S
-SiN6Q3KNJjdwojPx3W3YKjDBliaWRswl4+wafOAoptguKH0HXaZ9iXoaXN2kPeW4hrC9o8L5
-zE7thpdZxsR0mFiO4/U2MSmMA6s+cCQ6nviYBMtgmFIcRP3j1ZdA13ItLb20gJTRPOJ1z9oo
-KuNtMWlHH69v40krfPgoewQ9C0LXemsJNHaYBuhxHaBRZB57souudkyPyEFV2cncgQaZo7ra
-vR7cB92IG5tmyoCLTpIOTXP+ujIHhNaXtXSTGfJC+8h+bS4ztJr4aVnJqSXlNZPSRrYhzIW+
-TEzN7Fcmt7NMKwtw6D00Pn2vgVbVOdpQH2oPzSjT1U/W6CpZqy9lheY2y7SrWavLzS5ycYWa
-fNUQ8Op8elQZfHrB5l5UrhezbF7ZLt9xwefZi+XaVfpoK6lIXqJoHbx+LZlsK4m/mwuPtMCH
-D6Uem8nDG1tdc4GMnniBvVoODffVGjjQqTjyazJJk5op2pxpaQ5TwmFzTi/i8Y4wmy1w/9Iz
-kZ67V26i9hPkGd3kmRi5JmQMbM6XYToSXPTABbaV57Y5uajPxFSaOJJSl5dMj9s1mB7z0FbU
-1DDJV6OjW3HpaNlge3UdRCYPSjf9K9TLjNbe5GOZOa47wedmJvpp5KEV82Jqc4QInsoU+UYv
-/iVR6IA39KZsxLdN0nnSgZyU0V5Mbh3ltm0nwczHo20BPJ4BI5fxWDPpt/U1CVE00F84wY/M
-lH+IMpk2lkI6UyrpRamtUU0Lprb+TI4LdYY5oQuox3h8TVswkcuslrdEsQ62tpdYIDYuM66V
-q/pKtuPp5yh10tW8UxBz13i5b/vJVneqTydzmBQ2Mh/dtI3op4m0DBPsf3oRNblkP+sT0Pzb
-dpGEulIy6F0poPFNHa1q+hHHKvh6ixkkDj7PB1c6U4QZ5ZT8dY5eMdVgbWK88ltNw7QkZiuo
-muGe83qAvVqHr5zFpNKLqb6MLLV/mBJ24o47wI8UmoOMtNNdzNUbmCt3kYsrti7T2hgxzL/J
-9ANxZDTNtZ6ZrN3NEe3D3rYxRdwrXcY2h+WGRKJWGXCAZUwGqUamypmbmp3pILZZoV9kqD6U
-enpO0jBBvrFBcozpbYPNIiE2FJ2YCi5L0vsjcMb7UI0l9hCs+cEsk49n+skDO1s+2VMSQ38w
-+2U3bZg7grQtU1MrE10qmXpMbAtAwX3YkYDOX5oZv7FJhBv5wDNvaCGzX1NQRTG99K1UYNaJ
-C1ae2Al4/pqy01omlq3g0lc9GkcL6wXc+XIc10z7AFVPzORaTY7b/sQRLF/tfXx9bFNZi5pB
-2ogs+5JxHyaW/OhVNONcb/OPLETl27lnOLVC6ZuYR1rRnNKsZgOvHKvfpDlzTnY9yVS/Qq7a
-nrKfPT1ow/UG2h1pa+OPPajEJbr+Fqb5YHcyyCsHbAuePR527ZM/9j1zX2rTiHcezwoHtb75
-rSXpIynop2/lDD3kH7qZjSmpnIkvVWFRGXKRnVwkNIvUK/1Q4GrwJilYde64dAmenLRx0PST
-MGIQ/MinFahJHyq0FvV4qOttQtnGtHbcdpVbdgGKd5np0UpRzWk6MUUvJA83qXwyJqfW8hPN
-Pi1P4GkCJtdCTK5VQU11uk4pc5o4NrlqE8X4a4QUQX2i6UZ5agexh6V590gwsYX+EaAFNC2O
-/Q08vWBPMFP+YsspZ5m779sRoGmrWPtUMmtcU08LmCFo+Sb045VmMNnQzI5yXVbTTe/jKgzT
-WhrYk9180cwmTJOby8y8O9SYGdSkAxgtroclns6Vz7YNE2R6UPeIeWm+Zka7q+PU++BCVtLl
-b8IcD2zKLXfJ2jM7TD7aLeDzEfiMZpqw9khm0t2ajJX+SgG5J4Gyif4xnPmpPijJLulNbMlh
-fvEs54zmG5qSZyc2M8Foew0njmMowEyUoLF8h41Gb+IHJ2khomiqzt3CI8nOE6bGW3Tdu+6V
-fZoxRU8Cn4ckAZUtTJWb8e6jiWUvGvKJPcyDv+lCVVbjKm6ID5zNhXYlZkLxsH3SRFQvsdkM
-Rkfqd6mP+mTRraw9mHyUZxMyfZg4+msxpkNfTUBEH3FDD1D3WyDnLl34oe3kXHubyK9Kava9
-LHvmRwwzqfYZeq3qU7zuPhki02SbBOCWy6LhGZkM4jPdejUJ02sqc5KcLCServpbSuk95vJN
-8ssOkC+2HMj/Ry/dgyfsj0+uhO907j/8g5qEw+QwsBEGT8LsNPB5HNX7BMITm/xUvBHvOgbv
-cwA9+44aFZHF0pN+ulxq4lRzyAscWiTTkflfLtKbLajeSF5djzgykQ/BuXxCyz/bEqL2G11s
-C7NIH+aGiswPqfBaXn76EeS8sXXkpR1KDJupSSg8EZMOFSqNOnekHov0p9ziHRODioYySia5
-R+MXhS+pmVpjSjywkdE81cK4ktJmHo+dYXspXpWE7vQXDf0ONkQToM7nwMU4bQZGx4HU/ST5
-vb7FgYTZCvKIXvLIzkEzjso3+5KuKCYLqK8JTgejzLv0Nn59K3PyODDqCzaKMx2lYnqIgXP/
-B0ciNJe5DaN2aXEzDQ0LoDOW1QeSUYMlkXYmnpzk5qUW1zVM992Y5cq608s9eqsHFuWE1XWJ
-pT8xLIEnJ8Sjz8DGVykNJrvQMVfC/ie6TTKgFW1h7DypSlfLKa+ZqgwOOYWJInnoKWXNfa0E
-moua6cTVXj/ieQ5JDnxHGq2A7/BqHj0AIoaqP7P9FFR0P/UIBxdxJBQHcM82BaPDyMca+WDP
-SlQNI/I3UktfyHDysB//8VMXkIF+oKIxc21JcJFZXhKHlXiSDHeaF7UvTX8tYYI1Exn04nlu
-ol/OfVTbSCpNyzuG0kMWM5d1wm2W02BQckv/gs33dLxwOs4zG0gu5kmEPQi77pOL1ziW19JZ
-Q2WZnpL7OIdkMhSlaE5nLwNCsuCzksh7iYN2REU7voGH+6j9PlzjDKrZUZ9LVXprHh1IHCXh
-7S8twt77oBS93M+98zO9xOOnP3Ag792/uPlTlwk8hoCkc3TEh5JLnzh3P5Ux+OJD+I8fOhSO
-tJBuxLCAGeAIaH0osZiyo0li81fzmJfk4hy4CNZ0ZhgcaY7fKIMvzaX+1CUrneGl1gENXZmU
-Z/LVYc3KlBpN40kkmvXO1iYP3YljKl+HoC7HJaVelpLu8bJ7ZaEuxdkNJ/O+MLQ83SwH6pVU
-ToDNx0xSf0SY2r6Si4f0tqOo/yL0oz/9pKkex3tNIpY6OMvY0hqODGL+WKKt9SRseU+fT0AM
-+el8tYihvTymlzyzi+DqTjrAScnL5lylYzwxHNMR4tXWUhrl6k0elkhCciFo12+NlF+s+QWP
-8Uwr00/Kmm0ozVRw0QNUN9VFoKuV1NGU0kZvg4c5Og/l3E9Xe0J3M2AgPftfHN30AZ/t6WnD
-0Iy5cGS9q761cG4D6UhbqcVbEJaD2dRfcsssOLqbWtxAUd+zxWCazGF+aHlqUpnpoSDOJD7Y
-CJf+4MJfB0grLU5WvxHDDp3B/zdqDb2sGfUj02RclDUruHCmGB90y596DKQe02HVUqmiy6Q7
-TnYJTLuhnUChj1SDJQMkO501hRziJ3epySfiiWOi4Tl+UZNwsHmBGDbgQ6dQzb46mvWrSgBz
-Yy89rWPoHotQrb1g8z7Y/I1eJCOOPG63+UR//0Yvicp+Z9FZ5GExr5pPDFPkCrOCkIWiUgf3
-XUYm0mFX0UP2SnK5BHOegdNf4CMWOh7H3NFfqNw9mY3C9Gc2aKc+0kyTUY/HTGEbdATIWIBy
-7dOizGXp9J8m5bdJmSyTOmeiagu8RSBIGs8r58ONxbKOelzXiUyj/9FB26EUdemoFWSmFGRO
-zIyOp/5fHDGZD76ChQco3UGYvohZaRiv7My7+mo2cPkFbpxAsebwr5duJ46bWlp/MqMlh0H5
-cImV2f/mkk274QqGg8npOLc57M1U9mq4hDJxGWnmHp9TG7Z2pCZDqMkMWLNKYhNLVHHOznjC
-zPqE2fmqbAMP83SajNYAalIMnMYiL2E6lp46X4PoaIP0grbXt0zuscRHM4HeosxD1aUmcdRH
-8TuQ/zE6Dq0aLweI4b72hgXtJCW4KAVPG9FN2hNHH0kjo6nJLOqxGnzsousekjD3rLsVsoFa
-zFRfGaGF2aM4xPBKR8HOIF1JVSaQlf+IqpuqdtTUZCwfs2FZ6aq1eWwGJzrIXO3LtDVIzrrX
-fukKG1u5R9HlRLfLST6pJZmIJTk9JYF7nsEgYpgsf3WhvEev7+psOa7DZDNT+GKtyDSeXiar
-1Vn6TJcTx3Zdp2d0LiiZhG6O1qRE6hyxU0iGaCmirSQDtJZMZWZcz14cQR9ukZ/3WhetqCBx
-wUIatCK7pMN3JaMyCalQImlALvyIpR8+w7nr4mjyMQBEB8hh3m2z5pdVrLSKXhaiL+DGWWLY
-CT/WwdMVMGeppnCPwVpCtHM1A1FnkfmaG30oQlZLyB3U/y2PP4nTEm90eJGAGBJJWlZOy1cZ
-iCeLOH8prMN3ztlF7XlmAJG3kIdaQy7yTod4Z+csVefIt9Oo5U0ieK7X9ate06hM/EnAfwq5
-SaRXeNZJ9OMYmn6Vnz/XNBLBq39qZnDpbOlRp9Rsach8eokET99A/m/4JeQonuQnKidPSSUv
-OcmFG8lETlKA1TjkxENX9uoR/a7nQeRt+slTfacR/Purn/ltJBF+0z/87ieK+pucWZ4bi3WT
-okbOfmdlv3NSj1zkIhdx5GOFwhKOGj6jjuFaXj5Qr1/kLAq/jwteEsKZeDwrqjziHc+z14dY
-6yDbCbrXJda4x3rh/PwryPCq818M9igGkXjYovJuOBe0Oh51T41CZcPl5uXrAvzMOWuuMCsU
-lU+w7xlx3GNtHBaPhalANrxQEvBs5LF+0hv6CAycZ+X9ehwknEenruAzr1GTh0Tykb21rByX
-KqdlvRxgPJfzV0a2Mnxdj5/7smJHuNCJ37YiF9V5LEDGE7N9Zb27YOg49drOYwjZ30C3Wk8O
-16OF69jrFezrAr0LFy7weBJ2nqOT3+a7l/qA9b9qdNZPwQqZ2asMvH9i1o3GZrWp+1fY39oL
-tRxIfYdSlT48uzVbZfpGVjRK6dChbMeo+CaNjx9MLMs1EVtsmOCRYOIIpr4riGUZmV/Ffm8l
-phPk5xr1DwWDH3Be0eiLqYggpxSiO2Uk53FRAi+Z/QpbP2g9kNmCuvoTjz+rNiWeymwO7hLw
-6giNSX+LDeriyw6wvR0UbqcWO4hrN/u4l7V2EsdW0LeVfd+OUjjX3rpMV71OvR7Ag4+8Jgrc
-SkRuM7jnRUcnnu8w8S3VfYaKPkUlXmkXqj+Q3AwEJz2oVVtqVYN8ZAd9McDuRzjzWDOCi2zw
-LZucgzvHiekQPNsFwtYTxzKY6Zydtpg41sGKTaBxm0bhefGdo11dHv4jnrjsWzJw6ZwjmQWU
-MV9rE57hXP9iNCtNIx+TyMFwVu7mdveExOzwJzmvSs2rMoLLTPDdORc4kZwAGwfB/Bb2exXr
-LiQGRycXU5dVoGENudhEnMd4/m1cYDirfnMZYVjhsyZ043gI6x6h2OHan5pMcs8sjYU+JwQj
-SaUDa1ehmplQ0RggO5L9f+3GkVYuU5MT1OqAG8N3Nw8ziGE8jJhEHLOJaS6YWeTiKQX6lJk4
-csgbXvsPrsQCD0mpRQ7UsjIV9ycXI4hjIausp3rrQcMS1h/HugFEUAaUpqIyf3nFS83Fe2Xn
-PdODi2TUIbasgIFB5GIc6w4Fl0OpxyRwOpd6LCHOjax2iuc/JhdfeIzunlP5he8eaUGUtBp7
-5EccQ2D+HPKzjhg24PeXsPY4MB2ARpaEsfF5/IDW3+SVR3ifray/ivdfiP7NA5NBaOM0eDoB
-NE7Qq3x/m1qEk6OfqEdsFDUlmc/KXuZkhfRgNDY9+zvK/IqfhsGT59qAFbqyp6PRkmk8Zwrd
-wpkCAqQE/asoGckNozKA5mTwLq57BvIl9v0ifLisd9AmR62OolUHUaqDugu92Esc+8jNHp67
-n3qcYB8uoHvX0b97YPsRiHCO9X5LLb3gJy14LE+WAohuDEic456ZXB6fV5EZtQxuqzCZyEYO
-UziTMjU14OsbKAiHjbdxDaf5/wF35S1sS4hjFpo1GXyM0UhcRhyZxD4spNuuxdvspBedIDdO
-bwtzzzP9DFci8QQe+JCU9bPLdikmh8U5X6CahLBNIZ7OxOED14tTq8xwODFRRCHDP5j33pOB
-MBTiknv2/gY4shF87mY6Pqd9+E0PsBEIT4eC6Wmsv5htPXu+F26dpZ4P2R+mNaKMgq9LJgPJ
-gzOPHkRdT+IiDuM6NzAhTub7nkTQnAgqwZ188CgtNYyDGv2hFm+pwE1dT+dYTQ5WaV+UtBXf
-+RBHFfBSiVVq8exW7HFPVhtFfebDka10vovk6gOPqWBgXXg4hv3dg796zEz4xTkXmJVfinN/
-nw74u6b8vgJeIge8TYzueanqK/bgGn15Hy5mFSvPZR6dqm1AZxXm86JkpQAVKkCcJeFtbfLe
-AS6NQPMXwd/9rB9KHixf54KTrcFeEOufZr0IpsEoZqJENbOJI0huyiRZS5aGShsiKU+XzUw2
-YuJDIsj2TTC5F/wtwdlNoP6DNAC3XZutDBUpgXo4Z3CW41nOEbh+YHAIWj8PPOzi8TbbT3iW
-Dj2vQ65H4bd34vjDZLp4mYCimbXMomv5fhEzyDhq0oV+W4V/GWGwByS/Ys+c80t2gMz54GGk
-e67of+xtc1Yrr12YSQczB80hFzu1ONytCZ/8yf1wYlhK7znO9hK+xaMOpcFiL2kia3CRt3D6
-vx2nbzZJdLONXKxjJgwimgHoeUNpSSWKk4cUYML5NDLcvQrLcnIxQZeChuE4/bYgohJVyafd
-NQfZyYmi5qfDl0dLmuEw+lOPOay9V51P7JOA9AzgrBj1aMzqvcHiFAknD15W9Zj1zDwrmY1n
-kKP+MhUH3p0O64PW5KPnJYfx4lxVQDfDkvn0zzH0dSeOTszmAVqBGPKjoDnIRXbylRf8lNHX
-2oDouxLDRLxBCHp6FdX6rnlRqBr4jA7MGSNkB/v9QJYxh64ihuXyQWYzlw6VA3TXlUwEk6lf
-oOtJXqMvN+kKR3HUIXi6OSBwpHu1oECyXo04shFHYqKKSReJSs7ikLt0aFhxdKoZHB3h9pYE
-7E168lGCHDfjvfuRgalyH+X+ByPim1WS0CwEHxPBayB1qSf7ycVSlHw4M1k79LYce5IKVfwB
-P27AibWgoh8TT2WqkoLa/LW99YOdpOF2nb6xJ/WPfaQp4UUZIu9EDAvQkIto1x9ykYeJxx/s
-LYaJ18W5mplzRehlko4YUphpcGWgvKVq18nFHmo4F173J4sNQVZOeqHFUd1DqzbDh8E6kDx0
-ZRbuqJ9sVw21g/WGna03bYg+t8dUrXNd3PfMqz/Qtd84ZIVp8alHLlBXBzZ2k+PE8ZWaJDFL
-3auKZTNLJJWZBW+HyTuU4g5cPkBfW0hd/qMr18Y3p6Ivv3GPI1jJRDoKPnbURNpEn9p6eso2
-1r22g+6xw/SMnauv7DZNCJor4jsG4gV3oGWvqE1K+nUd3nsU+rSXerwVpw7bJbvZK/nMHslh
-trp5ca5S/QqmXkVDtxP3NDqiH70vr6vhZ8jGKioyROtrS02CYj20JXWXLaWrbXVdadvqZjtU
-L9qF+sMehDOhMOgzfszSfeODiWwwpJp0JQ8reGfns0Kl+unMCclrTkkBc0yymp3EtVj+gtE3
-OPOrTGVbUJlxKEY9uJKYmtxDv5cRhR9YyKDVyUNR3Wrz6Rwep9oaOtsG6AY7mtqs1ihoehky
-MJA87Hav2pQa/SlBb2gFE0bKRbghZrfkMaelurkgTc1ZaWYOSU30qxAYTW068PuKEopuhYCN
-nvikHPSRp1R3KYrVEn4k0Tp6xRZj3Vza3ebWNuSkrW2gfd2jc2bpVbtf46L4Ddxr48bDr2Wk
-uqXdGOZRkdtuLfZLZdbvYK7JQHNVhhNHf2rTGnxUMIPdzxF/0WvO4sEmwdfy6OcnOmkwfcwX
-bUjCu1+whXSiTa/NbUqtZDNpBWKqZxtqb9tfg+1i+HJK86Ab/VGbI3iVKLCjunteVw+5ILPQ
-y61SxZyRnua2TDT33CMcZ5vzxLJd/OkplUwvSWNqgVOn98eRLq6DvY+n2M97Tkeb2uo9W0Kn
-2zTayMbXAjaxZrGZNbctp1Wsv/a0UzTE7tOP9gW9JZpMYGa/zWSdGSXsRQz7icGg19XMOdYM
-lTXmuRw0T+S0ucnjYVlFLkbDV19TD7xkk8+uJ3TO9rmBP9lLPYLgZyf9zHpLbQZtTAwZbDyN
-YVNrVHKTBK44R+p0s5vAywP9bY3UJoZlWog9qQ7X/EDDGHQpWEqBxWHs/zbWv8oWZu7IE3NS
-zptgWWeGywjTROobJgLjkcvUYoA7/R8iE6vIwnCNThfbTi782P/MNq1abxb95i2uf7yNiWOQ
-VrQrdKS9QM2+aDIw0ZFZ4jC5SI5290S7T8gENGK9tDXHZQn7f5Z8PDP35b25LI/h63Ezh5/3
-kF6mkpQ0KeUn/nAD2umDY3uPz5vJ5FGcHvIIjZgAL8rZbBrHZtGv3vwa4a1CHP6ayj2qbZPO
-tLf0gf1O/eLKMLQ7lKmsBDWZhT6/QjNLm10yjnWPmIcSbp7JH/LxF4y+5efOHWTWwpEBpoSU
-MYnotZG6mI5YkqnoDhNhP1x/Em2HPjlHmebWlOTjgzer3vMW1tve2vrC21Vj2qla1e6Euw/0
-vv1Jr4sn0+HIZ9x3I3rINmdCNiuljTnKWrcllBjUhEtizyNJ4DlLLGvlIfq50/hQs/TUzqsv
-0e/R7pWaDsH7pVrPvapbE9Yoo6VsfvV68+p9bzE9563O5q+PvCPJzyrycU7n2nf6wjpXqUkp
-q1G+mLCkG2h3rrqXHXwOhqeHyUUEMSTwvJB0nluS3LNXjGc2OAmQ7aYg3I0pOc0Hvejet+EM
-2ul0kKnk2DnDu5Z2sMXJfwF9SR5Oe8vpXm9DPeLtQRxTNBEa3oRessL+0O/WuTp0ejnNXFCA
-bCykK3j5f2uzT7ZSkwgwkcbzWEp47kpZzwkp4FkhiTx95QW4CDFJxM98VY8J1flMFzllDw5m
-IUoxgD7RQsfaypoPjH4Alye95TXEW1/XeDvqbu8oDfOu1LT2PHF+0H02mqQkF+PJxQ8ms470
-qWsyXoqR9yBq8sRcZ/8fsf5j8fFcl+qePZLHM4N8tJNLpoBMMDHQ0rd6Se5qa/bkE75/rHsV
-/S5wpD48LQ8Giustb0ndATZXeZvqOm9P8jIVnO5Ax+7pLPD50cbFk2fCHZSUyvis7XTqlGaB
-DEG/r1KTeJ775CFM6vFYz3NaintW87P+8oBcLDbJxIdcRFCPcXKOvdkFOudpVZTrEbkYZKto
-VnIRDib2eUvrEm9NnettQxwD9YZ3ETU5oe3sa3Xuf5mVVy/WfDj6GmShE/18krSEq7vhqtfc
-kPzkwsfzUJp6rkhNzy7J7pkikaal7EMvehuhpzzXPcy3tcHmE6bRPkzJ0enpy2xdLU8uvnpL
-6UFvWdavqWO8rXSSt59u9AbBlQPU65mOtyJvbXJpywTwALfUEHd/Cp9VwMxDs3fIa3pZVjBZ
-hxj8wEU7cFEdXKQEF0/oZYtNUqlhvmg4Tm0Q9Ygl23F08zQ3uDhufeFpdY0OT85SjyVgc6y3
-jo7yBugi7zC94l2hSeFIVxuhl2wsKcdkdUALMAVXk404rVRmjIzE4z0wB+HFZalFLfw8D6SD
-55I08myXnJ7J8sm0kC3uUUOqYp7pAtyag82DePB6ICPcdtJR5CI7Ov4UbG6nJkHeMjqROOaB
-z6PeCfB3i9aFIxvsL7xQQmbXrBKNWdDx9x/w301NkOyBq8ZzRop57kgTzxM3juboRXFPsHg8
-g+SUqQZ2kuM5vuhJOlFzvO87+qkzj6XA9e62jbQZ9YhhC+tlbz4NRjung43p3gbUI5DY5mtO
-e1pHkIunYLMhc/tlLYNaNMHD9eF958oksPnEXJHU4LKC5500ZmvuCZUqnoPUYwaa3oq+lh3P
-8Uut3NJFsk8Lygqc1ngmkM761dZBn4tqUfT7nTcTOpEFXOTXcd5qOoNc7PNO15/ew1qTGNba
-pJKQXjZJa+GW/HD/Q+hlS3jvw+TiDpr5En34KHXZ2pKPlp7jcHa+xPYEyDWTm1h/aFFzWW/J
-Zu0qc3GwI3QiuEypdemXJbW2zanfWX+PN7tO9hbU3t6qGgguplCPU97tmsA+xf/Elts2t/ho
-FXLRAs/ZE2xOhP/rZCEe77O5K/k8z8DCS+lGDH0854hljRT2DJAfpjL9Nh7a9kz/4VBmyxq6
-wAz305dyuL0btqb2QCcS27x6Ef2e7y2iA72VtKe3pY7wDtatYPOX97I2RDf32pSSS4vKBjpi
-TnKxijk4EfwYSj3uohWpwERVeNqGrRs89fdsk3IeZmdPczlmstJXv2tic1U3yzatyERxHVwG
-4PX+2qa6BN2sgrf67S2EbhbRFXB1Bto5z9tdD1CPX949WodcbLAxJQFucZxWEpEWTJ+95Sm+
-txpz6Wo8znt6elr6RylyURuu1vWcApvLJYanj5xzz4WPSw95pnQbDZDl7lQxRXtqVrz/ObjR
-hzxktVn1Df30mDeXbvCWAKP1iCEQTZ+H1zmOF/ugETaRtARV17QOitVRduNxUuJjBuIxz5sw
-EfCQ2RPJ2p/BaJgU9Ryjh8yDwwHoSX58n9JP79BPnb/+zqaTDWAW90WPK+limwePmZ7ap9Fn
-3gx6hjgOkI9T6NZr7wj83wbtB0+v47VKwI8Qdf4C0A5vMVQicVuN8P7riOG1+Uwv/SXZ2ArC
-kfyeq5LUs44+1h8fWB4Mx2JWeKAriaGsTNOb8DOQSSsFTvIcnmKYTaplbEKNZZPpW296/EUB
-Nh/95O2DB1xMH7uAdv/WVPQPpx6/1I+OPkIuMRNnA5eD4cZR85eaRDNRPdFNQs8/chCOThyT
-R2YG9WqG70yHD3mn2+WgNpIgfFYf+NFYC2gJfUYOFuE1m9vo+L2Y6FMS+JqFflIG39dW0zCv
-tmAOWGffq6F/dEIn7tANq8kw5pvFEgO/6WtekYso5pFJZP6YpCamJ66J6/kuUTw35BX+Z5fp
-JH3QzSwG7WU+7iVTcWydmY9rMhPm1X/kYJ+NqgOs11a0RlPbBPjezMTCZGz9qMVM9OwY+P1K
-7bK59+japd2Zeie5fyl6LqelKDGMJgeHWf+ZSWa+mTjmp/lJ/7qNVgXLftMFXOaU4uQhXHbo
-NBmF+rdi4iwHMrNpWk2AlxT891/byaotSwxZ0K7UtiJ+wl/z22na1B6in39gfs4gBdGqmdqF
-iXuMtJGl6OZe5pDb9NNIWWpimIsmtnlhPCYCfETQW1+gI2eYQ4JMYfx3pEYxh3SLTGFeb8+k
-WR3fW0BLazqNZN19NjZ9JB7rpdaStqDmsT6ai7m9CHmoRwxD7Rs9RB+NrZWlAww7o0MkL1Ph
-DFlPLo5JYfOYff3OPlsw8Es+mrfylfkswoTIfeaQraYc9VDNaU7qXTA5TALohpXd+xG10TTM
-4XHBfVSdZ2NoR2pTBf9biN6al/5WAM9bkVnIn1loLvx8YCtIXu3ITDRK3tARfWQz0/Ex+S0P
-pLb5xhwm5gxxvCAPX5jNvqFjb8wE/Hdd+nlCaWFuaVyzWPdLd1BVA+0ugNPLwISeGFzE0SPk
-YzwcbUUeypOHIra7FmQeK2l3aH37GMxEl222kPy0LaUO08wGnSpxmdJ7yi5mzvPM6E/xLt/A
-4C88boR8JwavOSA/6bMvTFs5ZDLT919pSbNZ38gQnSGNcUgl9DyY6EYHSQ0u7hLDImbTTszJ
-ldCOfGAyux1BD11JHBfgR6ROtunlsq0l6bUH7zJenugSOLINdJ5iDn8ELr7JeqPE8E+seUfv
-uoZebqJ3DJVbpoIsM4ZcnNbYZpruwCE1kDL6RjPjsBJrPo2hL20UXQ8/e9nk1CMva9dCH5wz
-8CZpYXJRz4bhBePLbuqhtrs0Iw97NFjSyEHU4qrck3DJg04MAZcH4cZzvo5kHookF+/MFLlu
-6qNX8aSruaLZzGy9TwyjpDgOPjXeO6Z2UC/T4E/7FH5sBJ9DmFNb2rL07zZa3Y5i/XVg4jae
-IqpssMUFLyT5XJatl0d6RMrITSayl0TxC/8dyww18cwOsHGNWTnUHEGzg/DcvrLZpKXXPdJK
-ZoV6patuk0raFOf6A1Qu02jMAJbp3GtDweZa+DHUFmFWbQhX+rLNx+se1/72k86xmeS0bSLR
-dST+Zrms091M3edQ8AcgI0KiG2MaE8McYjlmvsgd5sJHeOF78OOkKQM2rXaEHznMVA2TNjpF
-SjvnatFPk+gwjYV6RyGKaGh4Il2ATvRnTmxv27L+CDQ7mO9v6gw8915bVD7bDmRysozRNXJf
-D0gRppCJZOI+LMlBPQJNQrOGeE4yH17D81wzs+UE/moluh1IH3XuxvJZ+vLqmriC3PpFkzMl
-x9KGKszgXhsGV7fSPybafNrb1sbjdsPPTNWBdjd99IVuscnkia0JNgeguvNR4G2SiFx0kSeo
-VqR40Ks66OYE4tiEZh4xt5jTN8peMxgtq4iniMJsek7/4ml2gYsA+BFX0ug+cNETlhZCtbz2
-p71GD9lATabjMcYys46zA5hbl6KpF/E1Xn1sC0sS7Qw2Z8lK1O+LnsVzhoGL71QlpklvUprW
-JrWZbGKaleYNfDlB/5qDhrQmD+mlvHmqMU0wviKQqlbW/JJBH8GNWfoLBHwGkZ/sF/vHXrDx
-dSNcXYLvWopurkY3t6CbR/Gaj8BFLBxzVZ2A3wzBuZ6WbPKYieyb7Jdo5rckNaWIoaeJb6ah
-WYvwO/PNIpliOqIjufFA7zWJ2aoPZIDOk+rMQpn0D3nYor/J+ldc3leni9on9PTD6OZ6eLrK
-9qB/BlGjQ/zsLXqSRry2nhRlLwbC0WN6DM26K86Vm9bCj3CJYrLAUV8T1Ywx7/EyZ91rLE01
-3WWAKS4NzT/NZE7oe/rHZnpYRymiqZh0r5CLifDDh/XTwZVvaPd1YtiLdm8hDzvpYYfsdj1j
-H9DrYshvW0JyUI/2ONYNYOKLnpEKVGKyvJELTIdR0cyy4KGLeS0jzHkZw3w02AySTqa21GQu
-TWfCiGEjejVEe0sD9yo+YXRS5757vvSQfBoflqTUMGI4hffca9vpAbTilF2tV+0Z8PBZf9iM
-ko4u2JhczNNgVytyyS33PlGH4ekP6lKAXtaOHjaUeWQ0HB1khhFDA6ljMjKrvNUfuIGTMpKK
-NmDKz6MGlB1h/0eokguD74xHVjK7V6O/YFuy/8P1GjE8YB4MJ4afxJCcGKriFEfrRvrpWYkn
-odKSeqxk/VD5KfHND3HudNvOXJdu+OAOZrQ0wVuVBRNpzG/4eYoYZtI/2mkT+JEKfjwmB6s0
-qvZiSq5OTjKpcy55GX3N3P7IDmXtFaD2JMh5xTMSkofyoLq7/KdzcYvOdV+ce3bdlZF09QPy
-mn8vJQm9vRhzQGWzAT6MkvzMpClMQZQkGlm7Ax7WsBf96R+10e48zIWpdA+T5jj6WBt0owx9
-LQ1Ow2hT8PEfay9CSQ7hRx+TpyhEnk+aaEuyOVZ26zqJ0KOSW67TT5/gLl7y1UsUI4w1r0ku
-swv9moEn7whiy4Oa5O6VtzfgMyfiK/zET4vRx2JJFn0ADkI0qY4ihrZkopwWocvX0th0lhhE
-l5T5NateoPt/4HdJwUMF6afdZBXYvA3CYtPLa4DNsay/Td7JDbLxTR5KPHNGkpm11GeEWGlG
-xQrxu5jo2gNdDDYHgc0GUl+zSwG8RTo9h2IuYLU+ZMFHc2guLQU6GlKXXlQqiN/sokq3ieOf
-Vma6b0f3mUJGj6IVkdQjP2joyZ6ulo8o6Ee+eoUHvk0O9pGTOfjs7mC2CtlKRed/TwYP4gam
-qK/4oldFVajyFeqxiFUDwUQd4siJ74qN4/mFr/hlx5KPDVTtMrF9JRcZeGVdGYtLO8C7Reo5
-KcC7B7L2Bla6wfaRf7Hp5emYBzKaFSiY87e22vICh3xWvlKPEzrOPT7PjxiKqVKLq1R9Aezs
-BE8qEksG4hAtpB9sfX1j+8PLJbD3JGh5RQzxpTXTy3jqcZD+8UMPkeU70osabKEKj4jht3xm
-Tn0h2eFoXrPFvZZRbOMwKL+ckaiyRu7pCFlPNgdTi3r6S3PrRbI9nzj82WM6CvucHJ7mZH3n
-Lk0d8frTUdY94CJUK5G59ppHpoPNY+rcj3WLlJTLztWqZDtrvyAGQx9PasLRhOvEsIfHWeCj
-IzGUlpOShKntLXg4BB6ma1bxJ4ZS1CKDrqAePTUOa8Sh9kn5f1Z4wfxjWxHPKLixgfiuwJjP
-2p9JcgGz4EkNxPvPx3cfkACYtwBcXiCOt/KFXLyhk9wHk8fJwXL3ijl3pQ5xZmGK/gfDb2hN
-CdYsMki9Wk/vgbbt6OY4966UibU4rtO5Y4Rzf8qY7n0qnc9QVzEtnaFer5joY8hqeHqGbEaQ
-1dRkt5YclYHuJ1PPmQ1fg5CnRHHTvTJLpKwirhG4jua484IyReKA4Vco3lEtJHM0kXRhz6qB
-ify6TrOwWlp17kZUmlWduzWkI8aMoLWQzuarXeTK+XTzowaDi+NaVJ6CrBgyWgoTR1vWm8ZK
-++DqDfb6CdG8da/Ys4bHcXJb/GQPbnA2Ufehik3gaTH36JtJeLwOeoeJcDv7PV6LoVdFtQJf
-52XPM2orIurP13PQ0p3k4Qp5eE3tnONQMtLHq8o37YrfnYbvXi995RDafQEOXgGpZ8nGPvIR
-zDYFBncnytqyUPLIf5KArHzRknINzQ7Rv6z8SLugiE3gh3NUQQ32uRZIaQBLW8OHXvS1yWBl
-LfEd1SHusXQf6f+xqEduea71Jbr0hh9T3E+qp8pO9vcgDnwfPNlIV1uEYowjL92IygcdKSjO
-HQnaiEhFapJBzoH0dfpCJ+lZ7csqHXU0itmO/a/B+iXIUQHtpwX5fQVdCTr26wAqN8c9ju43
-+pZcnrnHPzaVfDC0hUxgtUVgby3avZ48rAQds6nFSGLpSo3qyw66zFTJ6Nxzjoh+oRGPNQHY
-+ALmblHpXTqY+TRQu2pnMtGJqvQAFwNhyWRysRKd3Et8l3Uk3X8lrzoGPh9pNpBeRTKzZ3Vh
-qXM/pFWw5Czrh8py4pgDc8fhvPqRm7ZkqRqVKyydJRNYjgevvuEx72oE+3dVl+g26uIc6d6N
-tZ0YChNNTlQ8qw5HJ2eBknXanKoNARcrieME2hmm8cSiGRmlJv/ag7ehZGIaTFkIMpfSxeZS
-h4nEM4g8dMT/+bjHJ/WUrMSchMr808RkMxIdvEsl9hHBYlzFUP0Pf9NHq1KHknxXBNdVBEWv
-qDuoxxl+exfsvCLy7+A5pnyC6fHc41ia4yl6yij+rSPj55jY7+G27ssw4gmErW3kOF1uBc8c
-LOmpXQIpRwwZ5QUoP+ce/XVW56FG43U62Q5kEmnIY0VqVJIVS/CbcmCyPlXrps9djm7CnV7Q
-aBKuzp0ECtIRauC520oPshEE8vbRUa/D3Xvk4B68uE0MF6iAcxbRJJ7tXM+glnhQ8Qgcyh39
-Ro7vwvwD9Mpl7PcoVKsD8dTTaXSwRazvxHAQ5lxRP5g0nCl2qXvE7S9e59yFIA3q4xw96wNC
-/alIL5RhsJwmlpuugvXg0R9MNITBZahXDjiaks4eBxX/h6d5CT8ug/Y9YH21e3eZWehSfzZf
-mOhDVNWJoTLVqsGeO/eE7kfmgkDSTvfYTq++ZU88vG8mGFeNmvRgEpoNDncTzUUZwtp9Ua0u
-9C1f1L06faMg2cnAMxNIWTGoeIRGJxfvcJnXcDU7QcUiGDiCGDqyUlMccF1iqwVqa8KGJiC4
-qz4kSy9B6QcQ8l2falT5TS6SkIvC9Ibm6OIwsLHCvWvYEPLxHz2rhxwjF/ukATkq4x4/50cu
-qkosuP3bZbolCy+J4BLr7WJd57P9sWChJ3nwZ7WW/K6hHtdG7j1UH8Hal0QaAVK/UyEhm4nc
-Y8tTsmclpRHV9wMNnYmjO5rRmVm5LY9NZBOZWkmkE8FlB/JQA4UphBNIh+JFl0tUeJ/eJ+/H
-dDk1WUYWVsGMEOLYQ05OoQ+3Ua9wsPJVB4HJObiQ7eDhssYG3cnZm+wgrRT75cPetkAx2sHO
-ANZthz41o2/5oF4VXW5Mc+9+kJDnRecV/3hlBDy9T2VP/S8X63W3riGKteR8Cyp6AOU6z/7f
-ASPh6PZX7U4MY3nFCnJwUD1yE/1+Q29XPF8KkOZcD6UF+z2IyswBqStZbTlYWEwd5hPDDNAz
-mIidY31r8aoS6FV2OmFiuco7H9NnxHFON7P6FvZ1N7p0FE5e1gBw4AsCW9Lt/KheX9afzvrO
-HWjOkMmnYPOvZiKGItSjiqueo+HCcrbt5GAH1V/PXq+EkYtRtsnE0BN/1ZhXlXFjcCp6i3c/
-ha/Y517fZTmbc0ZIZ+JqDBZ99AnbezD6R5uBw25o1CS2Tej2ZfLwgb4ei/6cnUmsOlF0IY6p
-VHwD2yHWP4qWOcdQrmQymE8tJhBDoBvDP/roT6J33uEhMVwGccfQ4r1uRZy7owzi+w4grw2/
-aQeD/HlWZ3IwECzMYNtEPBfIxUu+Fqbi1PwrRhzOHboGsO5sJtR17vql6eZF+D4PvMjsaoQ/
-z6/t4tLCrB/sCbMh3vEp651zzwI5Ric5ASbO08Vvk/8XxPCFeP7Bz6jSl1eMpwYrqMdhanOf
-n/8Ep0mYJwow2zSQbOCyoMwDHdvYjrL+IeqwHi2ZSx7GE0NfwSszi1VGJ3KKl9c6V9dx7oZ1
-FwZeBIlnQOYZ1PIKXAylk70jhj/anvWdY+L6Ur0xZG8htXCOV7yOI4kgjjhkIwcaWJV8dKIy
-k+iQq2DLTmqwl++D4eVUSQom48LaaKDFqcUP9yyNmOKcWfCCjnDPvVvQXhiyChzMIKbhMKYn
-vqG9+xf5VKyfiYkpm0yg6yyBl3v4+U1q8ZFYnBhygffqkszt01NYex35P8D6J1h/Hz9fzqQ2
-nuc5ZxG1Yt8rw83szEHxqcUfuPcS/F8j9/vJhuMupoGDQeSgC1xsS7ba4cx7uHdfLyQT8bhL
-6J274OV1dOIDXTAWOc3B+1elJu1Rz3E4vmBJRx3S4C2SEEcsXJagEb+0H+u3InLnfIFsxBEL
-n/eJeoey3imysREeBDH3DuPrrmS5NTVvBIMbEUMA6w/S4kyxRZhB84CH9DjV+PL/9/P5p47+
-1gJnHcjHOPRwDWsfhgcX3ElVdS95ny/vdAD62EqeMNk/1cwoXRRU5iXrX0UD9vPVSpRiKusP
-xMt2RkVbg7emxNAcHeqkpWQU0S9iwxPjAArybpldVCVl3QLspw9bZ3IxlhhWEsMhYrhEpa7y
-8xPowRrWG8X6fuhjFTbnCO2oxOEg8jy9aCePS+jR49h6s7UjQ03BXH0QV599bkUe+rH2HOa/
-LSDqDDGEuef8pGDF2GDSOe9C0KkYrh7OR7l2MfueAwvX3Dtx/XX/kjGbyHuwfm36Zh5mwZjo
-wyv2+zz7vY2vnPMNxpEL53jqdjC2MbHUA7U+8KAxbO7Gq6ZSixC2U8T0RPNS4aywzTkzKxmK
-QM7gaD94OBM8boJ9J3m8xu+vko/D1GwZGBiIt20Eop1PFRMwh32AA5fAwDawsAgsjgEd3WF+
-C7hSx70r2Vu238QRD2xmph4FZS0Tywmw8ZDthxYmhtx4gmyockY00LmjVnZ0OT+4LMC6ualH
-JmJIxCxiNYQYxvPKNvTM0nKaPTvtHtsdCjOPukd33wKTd+DlXTB5x/Uv9clNXbBRn8q15BW9
-iCGIemwHF+dh2DMef/J9bPeMnbwodi46Vm5ykR99LMCMnpu1MzMJJcbf/NP9cHEhdejNFFtT
-9sEn5wjDPaxySE/DjI1UZR7aPYp4usPVVuSiPrWpDTZqg+CGmhZ+FEenajKpNCIXzeGGczZO
-YzpyLapfQZwjseoTTyDbTBR5GzGdJ7r7oOYh0Tpnie+WizqDddvLei0nazQ17+ackXObrrUX
-jVxGTiaSg97UxZf164KJGmCiGtHWwHk0puv2UB+ZqS3JRRverbXLtl9MtnHxK1no1RXpHn6s
-PxatXEuNTqHRD+BLONGGEfUV0LSZV49hom6O8heiunFkG/xwznu4iqu6r86Vq/rCE1/8dE08
-ZHn4URoElyHiqryiuXvdnWaynPWPMAvf450+agM6YjVyUYIukRdn5fSODExAKdFJNBWNCOdZ
-r+HEQzBwkjwsBd19WL8mj5llJ6g7RgWu07ce4WzD8RAf6Fmf3WPrS5OHIuhVIfS5OM+uhlb4
-w65JTNRbqcUlYginHn+0DviswOpF6eJ53XNKHV8fAk/PgJhQmBxOt30GF66Dhx3EMVk2a1vY
-XgLlTcAevQULDkLXkYfJ1KAneWjIVpY4ClGxfPSG/PStUmhWA3DYD2VczBx8GGzcdc9CqUM3
-rAg7i1KJPHAkm+unlxHDESaju+jHazTiI9x8hX+6DqK2EscEctBWDsC246j/RRBwD4Q+c2cr
-5y55jclHUR4zgstUxJECfqRnzinMBNsIxR1CHCu1rhxje0BuvmpV966SWYiiOnjsSRzz4KbT
-O0LhxhfQq2DTY17rd15xDze0jZyMZv3G7plHZ92zJs8Qh6MVvYilOqzJRF6i8fjTvtNI+0P/
-2OgSH3zmRxtawM0JxLEdnN4kji9uParCyLI4u2K4/YKympxcoi4R9NBoBm03USW1+aKJTJhG
-olMXyccCXKo/W245RAzHmDwuMANewz/dYvZ7oImcs0zsI31un2uY/aivrBJHMkmNblahJv+B
-0XXEcJ0tkhiSEUMR+OHcx3EQ3FiDkl9FI76Ti0QmkWQkhqzmm6Y1zzSKuQlGT+l6ahHIVhRM
-/EMnzoCLIHLREb0uSy9L7tytwr7RF/a9PrTf9CkxfLIJJRY6nY9XtdEKMlerkcVqzIFV6GEV
-mLZL4O4LMPHkwEdlYA7HuYGUxCaeZDLMWua7pjGvNLq5A1/P6RbW7k8eSslR3MBptPsqtXjA
-LPycWrwFCxFqwMV7ahFmI/SJ/a5vbRTx2uSSFqWrThxD6GfbwMdj4olBDPnIg6NVfflqGXW4
-QB0+4bPim6TkITZ5sJrOfNa45qm+p4pH2IMJYKIudUnG146/3IJej+arFmCzMHEkYvtjX+s7
-+5Z8fNY39i+5iSsJ6KmFcA9+9NK5qN5Ztm/Ek8Y927qwc50/ekcWPF1aeUyV/tE3EhFDCnKR
-mFxENy81Aladhg9BrN+aPKBqGkkmzqKVi4mhH3WoDz/z4XUSgRZLLb7YX/rRGvlu40k0sJnB
-vYNjEfxeKZS3NOwvgVYUpYPlgxvZ0O20eLkkchl+fqOPJzTRyIVqVvNDM5p3msA8JA56FryY
-6jL9OF3hvHt+8WG4McP1M5+YwyM1A7O/hy730Vp9CTde2UTy2aaXKMSQhTUbsP448rCPx5fE
-kQB+lgAP7YhhBvt/HF5+QCPiGK+mN780G9zICkdTmQfqhaM32P9l4KIDucgFRiKJ4TQ9fZ6r
-Vd+Yw/9qNjQqBr3rq40mL21seW6TyDubTv7ZHJICv1mBOPqhNCHo+SO8RSzWL0I2WrnnDsaT
-3e7dq1SjgYW05p8610XIar5qauKIYkI1FN1ahzsKJB+FqepvMHGBTraMOAa49z35qKWYRtIS
-SzS87k9q8YU4vsNR0QySDO0sTl8PII55bBd5lz/qnPnkHOuelWk8Hb0jqZymd7wFtR4TXRKY
-KGxejUkcv/F0ocx9W1l7iHsn3oN0hqOsfpop8KJ7/mA/vFULcFkOTGQhwkTOuc70sRiaVOLh
-+1Ox3wXJQWPwOArN2MVjOPhICEudv9g4uj0QXqymQhepSTizViTK/gdP8QsUf6J6ofiKg9Rg
-FvVoR0Xz/O+c7zvMX1uJYzpx9AGjzUFKWSqVFVwkZd6Kg7eOzfyRAJVNCy6KUQdf8jCN7Sg4
-fU8ukpCL4uSiFbgYSy62oqTO3bzeEM8PHv+Qlx/E8h6PdRd270btplCTltQkJ1rh/K3kDjFs
-p6fOQjP6otlN0YsSYCQD+UhAHNE1nnuX0TjwNA2vKsm6HfA6C8HlJR5/E0smfFUNdCIQnVhC
-DztN73jmXm8oEf0jjkBVYvms73DKN9DvzfB0JHmoSz4yoJ8/8DdXyMlGGDsFrHajSjXduw9/
-1iTEER1/I8wAHhgVD83KChZqw41haNYuNOslXEkEQ8oQR3u0YiY1OUg+HlKpL+TBC3rFeOSv
-fKcmr9Duu3qYmsyhd7QnjsJgIwZfPyWGg+DDOUrwPzjbGJwWgbMp4Wt0dTST9wKfUdCLpExx
-RciFP/VYwHaJ+vxBx7Lxry7rDyCiNax7HlyEUYePPP4EH7+oxxdxjtkNJxf3dCd8nUwtfNkK
-UJsYbE+pyUH62Dz8dh84WxvdykE/j0/FvJaaEsdP+Ko2LTzJIaWJowcxrGG7zd44f53MQz0a
-U4+ROK5N5OIC22Nq8x7+fiUvX4kpglnkmTjHoD11P/kfBcsaw5fc1McDXh/SV/dRkzn0lB7o
-eVVyko0eHx/vJ3Dmj/3DFgWMJJbMzMd1eeVY8uA4lPdgI4V7DdpC7jlyC5g/DqEht3h8hdf4
-Rp5+wOFvxBKBlj3BjZzArS5lD3qRTefKymnARyQT2VXdrSFkZAw9tgW6XoRZOSX+Kwp4/WU/
-6Fe0/Dt5iQZfcoDRFuRhBpg4TU91jnPPwkRWl742mElgDT3lJDE9gL/v6S3fQe8PcvOd2nwk
-hlBiOAJG57F+NzxXFdkA6lYSxwowupZ5ZKsO1QPaQE9oXuqUkH7/D4/xGY/x1op8Ah/RUN38
-7p1najGvNyKzLVDLVqzcTNr+77zWTcRzFsQ+JkcfqVYktXI4+wMUvWNGvUUedhHDVNmhAXjx
-kqhgfJmF650DSpfw/3XaQXfgew/h9c7T4++Qhxf01W94nVjyzWaUxNSgCu55GB54D84xgndK
-J/5SU3yZhRrIQli7lziu0WvDycknahJJLn5Rj0gcyUsJ1ctkMYQYRuLmm8l0ED4GVzkKho5n
-JnHuTbocD74R7TqIZjj3hgoFo47vU2qSCi0tLLnJQ0vmkBnamc7UF2UcwN72IwvdpQddbYY0
-kY1Sm1mkIt63sDylJm/R9U/w9R3YdO4YfQLvu5oYhjH1NmWP8stAlHoILmcscQTpJF1FHNu0
-DFNKOjQkhus/f2oEfsu57k5MKlmQGSCArrgAhF0khp9Mv1mkN9joSDStZA612c6McgmcPAKn
-b/AbP8jFP9D8HZ/znD5yntlsLdP/CBlNVp07NQ2gkw6DrZOYjRbSUzbQXw+h41c1Jkz+Zr9q
-OH0tzGaTD7YCOtqYuSBA+tAZQ1j/oQ5FIQexYqAEUJtJ5GKDe822suhGXrCRCt2KKlHNR3z4
-Pf2Kew+Vjcys83UmLqE96xfDtcTE0T7Rke7d1MeSi5a6i1ngHDPAA3jyjjise920CFsQfFaX
-AuSiPXEs0e6gvbf7F6o81KMBUfST5hJEVrYyIZ1DV+/A2zBw8ZZ+/4FZ+QW5uIFe7iUXQbi2
-7u6RuEM1hQymc4zEhU+BJ0uYlzdrazSkPPXIQaWSwaKYTJMeelpc+mhufHcz4phMZzyknXjn
-rqhmJxDQThrClV7E4HBlDbnYw1xwAj/s/O3iPrh4wLx8E606iXNdL0vdYwr8iaEMeUhBTr4T
-xw2660bwOZas+KHrVeFqfnKRhorFYy6KjeKmQWnKMx/3BJ/LyOZlYvgB81MShzMpN5KWYNS5
-R1c9eltValNCdsKT4/TY8zzzHO7I8Xwb0YkZ4CIQXNQmhmzSm67VF/Ue5v51cwXOZxh8bUcc
-NYmjOP0+Gz0lLeqSlR5ajjg6aj3eoRnO0Q8F6MQ02pnMO1dl9yeKtuSjpYynQs415FYSx1bc
-0BF6zBnm5jM41iOyVzcws08jF93hRnVQlll6oeX9Ue0x+FDnCl3rwOhB/MYlvGiYFqCvZGCq
-TU0/y47HqUr0PcDoPG2Dz+iIi+qCMnbG+XWkCgFkws+9lp4Tx1zwsRrd2AdGz7t3zwzXq/Sv
-E+BzI7iYSi46sXYFspuO7S9d9T66sUPnkxHns5DD+I0rWglsOMeXZMV35cAhlaWv+4GNyWBj
-JzW5Tz3+aA86VyCqHQhDexBBV+lDXpzz1aegY4uIYxMdZy897QA12QlXV8gqFxcd4Wll9iqz
-dCbj3ZjMBtLVJpCJ+S5SB6DnHd3jGV5RGyEHKaUeCtNFK6I2dUGYL9ntSJa708UD2VuHK33I
-R28UozuVaU+GnM9oashEeu8inFmwe72NG7oShzJTFsH0sSCsL3vWBWx0xFV1dz/5uU0+Duhc
-tGOdzuSr4aC2K9hoqdGkKe6oLex2ZtVZ9JDNZPMsCHvExPcJVysyHKc1Agc4HP34j9W7kQ1f
-5vhqxJFLljLdh1CTLeAzWIJ1NrkYyrv5E0MNMlwI95KKvPwjH2HE4Zy/vwXGLIKz4+j3vYiw
-nXusS05eUV5GwpOFaMYOYjjvatcI+aCjxepYnOcYVHsIVQiUcmCknnslfOd6AinQEud6zjd1
-IbmY6uZiDIzvBz67E0MXnGVP9GsQbm8czJiDM14LRvbpSubpaVRrMDXp6f6drygx1AKbvrIF
-TJwmD3fpCC9xLt/YDHlIgCNPDz7yUpVSYLQ+VeoGT0bjimbRS+aTi9no1hgy2kdGMC/2B/GB
-6EZvkDcIpzuOKSAI3q6mo+7GcTBj0+3m4lJHaSKUJRfMqgg2m6A67clFD96xP5PfENzcYPjS
-H5z0BK/tcVjN6SB1cBll3BmyPYweQheegg+fDVen/K+f9ZDh7FF/2N8XHR0E8saiYbOIYwXT
-yQ53VjjmfuL+kXw4XS8zcZQmF/VlJloRDC73az930rlJhZ/Q2965x+N0dK/0nkR8WL0Snb6A
-c5dlus0fNOKxm4sgdGu8zNb/eLcA9zi5QLjSi649iIyPI/NBOPFgULkPtl4ihueoqqUmaXhm
-cSKuSzX96Kk9qckA96pjV8FFKLl4Q6//Tp08rJoERc8OLsuiW63ougPA5lSiXIjiLoTl08HF
-cNbrDldRfrDRA8/TV7MSVyz2MgI03NE9uK5LdJXnINWiaGmIuAQq14AMBpCxXrKOGA6w9jm2
-2+zVM7L70blDMFrifBqWgVo4s1tdnFA32DyGGIKIYb5sR78XgeaJ4GIIbsmpRz9cw2BQNxn9
-WkguQkDjEaaDmyiokxVlrk9N93f+buCoflsZj14uJvdbeJfDbOfJy13q8AqkReIFo9HbU5GF
-AjClJnlwPjseiROZR8ZW4bmXsQezyPloshpIHM59bH3AaTniyo6mxsTlO9c9uUJX2UVvX0pm
-xtFpesEif+rRBt3syquGs2YQ+x5MTnaznSWOB+jHB5gnYCIFzHD+6lebWDrDlvH8ZBVZ2om6
-7KaKTj9bzHoTZAKvHol2DYN5zvXsJmkS3vkLffUGzNijR4nhGurxSnurQa9S09OLoBk1iakZ
-+fAnH11lK+ufYI/uUeEI4hB6SXJpTQyNYUht8lCBWjh/b0qKB/uh+5ibt4Hq5XjfqTjH/vSS
-1vT3WtSjGPGkpiZ/4GkocRzDk6+HI7Pdz+8+a3cm/TZoli9s6kIvGwY+Z7m5+I+JYjDThXPn
-1gGs0ofu2QPdak8WWkpTVKsX6jUVtqyGOVuZVzfRBZ0YnJ46kLX9QJsPe1aWxxzUJg51+YA6
-XHePh3HOGr+Cjr8ijihoVkY8Vhm6TgOw0Y5Mdocn/WUtPN0N2s/zGMr378mL86lVavJRHJ40
-oq/2oY/MZDZaB3p34FY3yybwMQesjoZdA9mbfnTo/4hluIvPZLzzd2K4jxs+wjzg3G1jFpo1
-BM3qpHnJR2W8r8NuB1EdqGI3HGQPlLAb3qsjDPCHK75Mp00kLXpR3nUdxfA9mcS5ZtMhlO0Y
-7n0vHNjAWvPdo0DHgY2xoH4S/SSIjC9jNghxj0U5QzfZSHcLAq2DcCB+VKw+uPBhHmtGH+kA
-ogaQzUmsvYxtJ1+fZf1QMPON3ydxr0ZTHa0oBz/yUo+kxPADn3NPjxPxTniyjDgmgI1AmcYr
-p4G42ezpUo3N7967f9U4TEUuUpNH9Pkv6rjktvTUJmSsJczuRPYGsL+TtSWvaoMCtEYRmzOv
-NZLXaGsUVCIbLK1OLjrTYSfx3Vr3upPv8RjXqAv1Zq3puOhB1KYDKGvKY0W+z0yVo6ACb+jp
-18mGM8+vQT2mgNo+1KQt6GkBX9uB0R5ox3D2eQb7voJ32A5mj/P9TWJ4B5/jEENetLMOHOmB
-O55GhdbgxbfQzzaRtTX01Tnowhj0qxfrtyUOH7hbmL1KQhw/mIseEcEZcLEdhCwmO6NRsx50
-GX9m9vZ48V7UZSSvmkU+VlCbbe51H1u5n5uEEdcfYkpDPkoRS3PQMYiI5uDWg5mZQ+DqWuaS
-xbB8Gp5riMv4+bx6Hu+6iD1d6V4p7AP99I57/MNVGBuGhtO1qVYgNemsBXED5UF0HZSvKblo
-wyv9YJ4fvqcdWtqaVVrKL+JLTRxlyYc/CBlDt18KezaC3s3wZC19dRE1mQyqBhBDZ3DZnFxU
-IKZMvFtUePQWfN5ELw6jYE4/m6a/tb8mhB9ZqEtR3Fll3EBddKM5KG/DXvjRqduyd21wt770
-taYwsz7sqAljy7nHIa1idt8FVw9RtX1oxiaevYRcTKBv9Gb9tmw1eKdcYCM2NXmHdl5FMfbg
-MJaBjfH0k570tBZUrAFK35S+1h6M9qMLjSeOBex/MO+ymxgusL3l+8R4zjLoZwD6OZmMbKDD
-HkbRTqHyJ8jWbvjqYGMGLO9HDdqAhxpsuamww5F34OIKerHLPUrpok6mn/TBY7QBuY1wQk2J
-w9+dLiu6n9ksRj9CyP8+tvNsz8hDdNYvQC6aEsMQ5vfFfLcdZT9ApfaCz40oy2L4OgFE9WTN
-puC0EnXITQ4SUItvYCKUSpyhHjv0AnHchiPhTAo/tBN9LQCMdiWOgaB5Ml1wCXsQ4t6f2PkE
-qgk9vpl85jEpqul8wtqKmgwlF/OYnNbCnBCc8hpxrptwjhj2o/hbweV69iaYDK+Bp+vIhXOH
-oZ1w5AAMOUZGzv3vWIwXaNcP7aExwGhKYshJHkqAqqq8ugF71FIOUofz4PMR+vmP+qQHERVg
-SAAaOorqzEU/l9NLllOxuSiL8zlJf/fTWSeGVTBvOXu3AvQF6y/dBBp3uF7rOCq+hTgW44gn
-gtjB6sWlJ6QDZwaTReBGRfJQlzy0Am0B7F1HfEYnENgBL+5PJ21NN2uMx4HX1GQqXJ2Oso4n
-F//hnNuDi3rEUIpaOLqdClzEIp6fdNKX4MLpI5eJ4SSTknNvMecI3EXkYq57XaZ0RJ0Ph1Ca
-9avB/Ia8Y0vy0AZVbIdetKX6rdHwFu61LmpTEz+q0xP31QeXHoi6doAnzXhldZS/CDjIRh1Q
-NdC/3q2Hl3p8R7MiUItw0BEKW664f5F8D2K8ZCkBa2cAWXlBeQmYXwUP7sPWAP/ZEPQ3YvJp
-IL/JUUL3Ht9VYWpJlANuucc4/wRBz0HTDfbiDN7/GO92ELTtpZfud++bFYd3jsZeGTD8l/Wd
-z1HeEMMjMnSN7/6Pp7MAzyJpuvYEdwiuwYKH4O4S3F2Wl7As7r64u7u7s7i7u0uQEFwTLEES
-CJL57zrw/bvX8CRPZqarT52SnumuPoM3OcWZZ8m9rPLBFXpyDR92BX5cQLvn8WW2Vvsx/v0j
-LcUirqeHm76gUpqfKpINVuYvNhemMHLk1p1OwbRjHIfJbo9xHOfnkxxnsMgzRA6r83ABeawO
-3xOkCUOqaPTZEykz4K9z8NeCnFUKXlSgR35gVJUrqxE5q+IZKuvdcwp8Zw5QKcRPJfimBHZS
-CDnywlFvepCeO6WDVZk4vOldVu7uTSve9CgTRyrkjQ/jfiBDCFp6gO+6pTq5qTkzM1fkoDe+
-SF6YnhRFjuL0pBR/K8n4pDhRoyhWUQBPkYOomhq+xua3r0SBYHB4yB3uqMKmtZOG9rLwmR3O
-WC0vH3riw9+txqXNQvLkjo7qKH3RPNLbcOO6quwamlnRZE7bjwmm5Yf1VgG4CPIVpZUi+I4C
-9D4P1pEF203GWDoaDPnCVSFc/ZjeBGkuZUpkyQw2efgsoKq2VrHjPnngfe4UyPcPwOspunkD
-b7/BkOh8Ex+Jkzg2B/0YujkAejuJANs4ew+ynEBPNzieccdPyBdDdWvTqdZtZqTKrPmk7+lJ
-CDK8op9PweIxd3nKHZ5zlb0dfAmiLzie0bOnYPTMTc7vDtd9wJptRmwg/LgBk89hWce500GQ
-NdvZy52Ogs0l7hZI+6/RVwToxwAFT6JsGuRIy2+p8Wwp+EtipLRqtCnRUVbazfenfdtHsQpt
-16DHxrKy4ORLi6nRkQOnPsCQZ/A0CHmuI89ZsoHj3OUgMthsm4NgcZI7XYUf91URq6zeAbv0
-MDaYxEOKuHi1WI7NgfyF9Ydz33dk+a/h6XN68BQUHyFHkOZT1YMvddGwH6wvJJu6hl7uw9Xn
-qqRpsyAfYdV36M0VED6LDCdp6yze8Ap3uUP8f8jxAh8bBle/aXZbJj6TO1Z/OZTW35AzvKFP
-X/AIMTjTqkNnpq/5waAcMtSgzfogWxcZKqLpvNw9JZjEQMZI1TZ+z7+R+LVYcDU5viITXM2N
-HIXQUwmwKA3TynB2ae5sda/zoVGbtZeB7DMFGCWg11bT8xejja/06BNR6oO4kpO/lkCW6vSk
-MXI0wyPU587lQD0HLSVFPybHd9vDk6wsBL4+RyePkCMQtKwG7B0kfojtPobdVj3Vajm/QLZX
-aPaFEM9KT9PT05Rw3BOtx+N7qw4dBULfsIUwJH6FtwnCz18lgzqpd23NnB3gsYu/HaLHp+nJ
-VVX0jaV57OH2tg+WpaCfmWGZD0cxvd97jC4CuTIAn3aDnpgfOYv9HuNOxqFdcMnqr57hbg+w
-vS/cySoWZ4UfZZCuCah2oM1exN6exBp/8o9a5AKlYF8+5MiBFjKBWWqYlxCmRWM8bHOwQ2HW
-K3TwmPgSID9alSssalUm/pbVm5ml4GI1ThfipZZiW1sUE2LT8k/69AmNveYOD+j7Vc0xG42k
-E2l7BHfowdmt+L0O31eCL1YpOxfnp2EsbvVfDclg9H4fKa+jgzP0ezdSr+VYxF1n8ft0vp+K
-DNNh32wwW0RvbMbUKWR56VrN5dh4+p/YZpjbETaNQWML+etavMBK8vIZGpFuAp8dZJr7sZuT
-imRenBsTuw/j3wf06QLfHEb327CVFUg6g7ZHg8EQ9DIE6YdzjAWXKfy+ANk2ItdJePQKXSbU
-+pGYZAM26n7BmOm6uwbPvIPsfgfZxApy4/EcPUGwOTmAH3rKz9/TIqsHnA4By7v40zN8sw8Z
-/kPCpWAwjTaH0bM+aLO3xtn1GUvVY1ReF2xqkNFUoEfF4Y4PviOdk5Wc0I/RTDsseAxYL0HC
-/+j3Ts7cQI4+ExQHguLf5EO14UkJmJWNVhODwHe8RzBY3MXaL4DvEWxhO31cBsMm0s4gyWFP
-jRo4A8lJR3BM4uf55AAbweQsmL1B9sTE3AIwrAHs6o19TOEvK2lnCzngZjBYzlWTuGNfEPYn
-461LplWG6JFT1elDsHjzP0mwGi9Y7QMeReBhaa4oDwZ+jK1rM95uzDimBWM8e0rQijGVjYLq
-wLaKIF8QbmckG4vnVMDm2sL7kfjL+USETXBhFxJvdSa7y8h2J+m5xxzytVX0xN62n8dLPcdT
-/ESOxHDTSzNYjyPDemSYigz21Ox/YN+YK5oigz/tdyUnHIRmp6CbNXDEPPMHLC4lnr0kNtcS
-7zOIe8+B3RvJAw/S5jF6tAvJVzpjwGga47klZJdbuLNlFUHYyFciWwJ8RXqwyKXaav/Bx1n0
-sT92+hecqIcO6tF+MzT6j3aFaA1nm8LPmthwKXSZG16kJAdxkToEvG+5Q4iKs7nTOhi2nbtt
-BYNVMGoGvRvClZ3oaTP04Yc+8mGraYlJsWxeED89xmfYvOTN8GK6nipXcJrjiesjRyMwaIUM
-nTj68/M4vNIS/mazt2wOcQyYkQ2Lr8RvbWDYUPQxFw5uwLNso/8buGIJxzTJscjtDKuawUI/
-ZM6P7OmcKMkRxk/Wr/0aq5R3+oJFQ+yiHG2WRvpKsK4OaLaCYd3druDRGvbXRidFhWUyuFkU
-z9ECTgwGpUUwfLcz0z2DdZ9Hi8e44056sByGT6SXfbn6L/CooMjxHiv1IKtNjlQ5sKziMKkK
-2Deg/b+c7LSfEUblxPsVwxPW5PibVgYjxwL4cUjZhNU3jsaI4Tm8OAs3t+Ar5rsn0UEgZz5D
-iw+dbu51pD/s/MvfjKf2VnebYm4BWJnUcRRHboHDdjgxASvy527F8XJp6X8C0E2Cx8kEs4q5
-k9HPGKcLI6MJet7gB6ezcYcYTi6kqQuz+oH1IvzCEfgYyEgwBM2+RYYnHJfBY7czEvuZDYf/
-k8y2+4KtnglX5pgHHMrC5rqyhRLIkBppY4JDDHqXnFFhXo7q/NwRNCfAj//ghV3nAb99yHUa
-EvEG0JPFoHSU/j5AD6FY9hewMFkCkOEgnm+xuLEKpA8rm7J1Hz/xFbb+8Ah8WMx9+8Gaeli0
-L5gnp734YJGS9vOAQxWOdsgxFi+9BlnPwcb36CMFfSmpla0n0dY6eDgD7Ee5d9HHa7zdSzC5
-DSeOI9da7HUSfqw7SNYFC5ulnwx/Ea48IStRpyhsqup0xkf5wT1v1/aE7Oskdkc5GWi/kDvd
-qctnD3c4rLf3Co2J+UWVf3lhZeX5zR9fNAobWIdtnkeOp3DxDf1/jiw34MR+ItJS+GLPxP4B
-t8rwwptIFIN+vOI+Z/AXK9DJv/ijBvQzHzIkRcuxuCIh7Wdy52Er8/Ah07nr751IT+JPQlSt
-O4ZjWXt9vJ6hNBvM99L+bbB4BQ6v8ID34OZJuLERvcxAvn7wswm2VBifkRx9fsVS7ytnKSa/
-3B2Lrw4ncoJuUtBLBJvS4Pl8QbMmn53xjBOUMbTFf5dFq6nJij+i40voZBM6n8FZQ92z9q5X
-3OyKHO3Rz9/uCactcvSQHH3wOPXwOL5avfGNLDQZVp4XxtRAc22wg95ObvQfn7N/RC13oqI2
-o5cdjg8eqA6y9HJnodn+cMmekebBTm2v7Dt4t+18Ox3+DYADnZGhrRsO2786LZClMXg04ftW
-6KuHOwFLsD3gyyN7etgViSQWQ7YSP8eirRZYUQH0nwiL+xa10fkctcd253NSuYewnZ1Oa3o6
-Ftvdyl3uu7YTSGLG1M/h2n49a5sLDw/R70fc6Svtumj4m1MbO6np3uTnfU4b7jyQOL8AuzpM
-y0/I1iyLt/FQJe7gj48e5JQlS0kJi76BwZuo/U5o1DHs9biTmTtUBtEuZAu2T88xYslbsrwU
-xPNSsKQVvBwFmpvA4DoRMJQ2HY96bjSP2shTA73UgqMt4Ggv5JiGXW9D9lvE90jiWXqNKrei
-1eEgWhdvnxlP+x0ZnkQdcO5HnXBeRZ0Gj2OOF1hU4m9d8aHzVZHTxpHRyXICwNbyuTFI2B4s
-GqGP2u4v2o7rUdWN6VHZjaQHwWj0BljsxlZmwYvOjFMqwPDU4Gl570l0PBuG/yObXIZtbHZe
-Ru1z7iDD/ahzztuoM05sPGIevm+EFYzQ07Wq+JrUThx8cH5iQlM4MQI72AwOt2k/gnbjelRy
-E3iUd2N4lNXvz7n6Irz4DzsaCxYt8BK+2GkMsrV7xI6NbnvsdLRTDbTSguon+BAYddQJiDrr
-PIo673yJOokf2+uUghcdQH4OWJwgMn8gQ0mF3yznLMe6B9LHVvis2sSPqu5PPE9scIjhUcH9
-AYrv8Yj38b7HwGwZNt2f+FuTSGqe7xve/LLmhwygJzOJY6scT3oUihyP4eVjZHkXdciJDpLe
-MLwavOmJb12M1znrGite8u8e1btrzx1mkI0cAPsgeBAKJl/wup+Q5y38fILHuY6H3o892zvJ
-7uiyCrzwcjJop5fT2Ohs/HVb/EEh7DEutml77b1AJ2+jTsGT404ysChAVGxEdB6EjazEc19k
-NPHJvaM1/ZXwAz3hxVJs4yx4vMLzRCDDT6ciHKkEN2ojVxti7GB82Hx8/QFY/pSoaLX2fdFs
-A3pjb+Rmws81+Mod+IrDTjB8eBl1AVzOO9G4Mh14FKOVFu4wuNyYqGFPj0LxfYfBdTp+qBt/
-aYLeaxC/KtNmefc7XtflcODID3oQCrvv4cdtrtEURuetGdnlAwtb8XYDn7yMPnZl9FCKTM0T
-pkfABdv/MJTjJz8nxlazgVN5fKo/WIzC327ARq651xn1riJDGaIMdSI92YPmgtDDJzD4BRbR
-PPzc6B713SgsIJTzApQXHyBTeEwEjcGYygfN1NceXTPRait3NXF8CzrZhxxHnY/oJIIjOjaS
-HPlywd/K+HfLhSYyJtqh52aHGTnPxKP3BOOWMLgu+URNuFCD/ttOltXcePiOOB7+yNEXHzYV
-nW1CJ1fQ4SfsPA3WanP329CvkUSehU4FMsVU6OQnPusjerHjOxyJw3dpYHcBbKQ+uWA/vSFy
-yLqvoZNVRLah+K624NwY/tXDf9YFi9rwojY4NEQWf3TTFywmurfI0f+DjVblrqHy1sLEpGaM
-KgfB3Lkgug5+bkUnux0H7f2K2ut48HMC8EkLJ37nO+2079k0xhF73SdaI5yQe5dFo93BYiFZ
-6zEkDeJ4w/EZPnwF5XCi5Vvs9C7S70MfM/CYHfAXpZHC06mBH++mmSY2cmiMneZjFJGCM00v
-sZElETikhrfZubI0kbk5OrQqLItBweZ7hLpLiEv/Eu39iRGNpJPTYBAoW6nrhnHXL2jxA9b1
-hN6ew6bW4i9G4HGaa2xXCktpg1Sj+csyztoGmnuR45CTHi6kIFOznYnTuuvxF2bHg9B4M7xP
-PpjuoN2b7i13Ld5rGNlrG2VrI0BrLXw4AS9uIccT5HpDjHtDvH0KgtfQ/k6ytenoo6uTyKlC
-Bp/RacXobiS5zlJ84nZi2kHYfQQeHkWOg3BkF8d6cq7ZyjtKYwlNyVD6wsi57kOX0bn72p1I
-Lm0zoRoQH6pz/2rcqRocrIU9NHQfE42fk4M+Qm/XNW47AcufWmarNXcFHVt71pdv5jKy20oO
-c5AeHcW6jgqPHEjtTc+yg4MPfq0kvKxPFO1KljTZfetuc4+5ge48LLYvMeEv8K1HVlgTi6/J
-neoRN5oghz++uxf6sZ3el3PnQ2j3PnZq+3N5OZXwFZmcDtjqeKxmNXnfbrR7kCsP4cv3OUXo
-UT6uyEeEKEgmVYr4X5setyOmj5KXuOaedze4n9zx5NNd8YN/gUUT7KQJltaMO7VibNQeu+3t
-XiU3v4BXOgSj15KpTSC/6ciYrLqTDzTqO7Gc3ox0p4PFGvq3Bf5vpb+b0ct6vM4KcJnBMZQI
-1QEN1wR5H/xsfGLPa5A46Qa7y7GWUYx0u5EhtMV/tsYX/A8U/el3O3jaHd0MdU/hU/bDifVE
-cZvr05Xe18JX+DolkKYFLBlI9jqbDGgV2dI6erQORFfR7hKOmRzDYFpnZGgI04vD4TSqJLzb
-veve518PRpbZaacGcnSl75Ph4hrlEu3oe1fi7ABi3ESYv4Je7efvN7HKUEaZiZz8YGG7BX7A
-g11AurWcMYZ8qjOxvRkSN0BHDWBRQ3x2U5jUGt/WjSg4Eg+1EG7uAYu77hnsYw1edLze1rZB
-yuGcuRBdbOZzD3LsJafYSVayETYvJjOZQGvdyBPrMKqylSTJYMZnrrzOlduIttOFxRquXM1d
-loHJPD4ngG5/zZXtAYLDVSEoGeOzL3gKex9kO6jZU7fBaKsrEakdOUxbUGwHNzohSx/85Gi4
-MN9dQCsT8La9yDetPkFh7fJUlJ8aOkF4vIP4xMXYyWjO7MPRiZ87wJUuMLkb8bYn/vJfYsd4
-PN1CxlFbyFrPgsUL9yy50jpi6mRynX/hRQ8k7gyyneh3F/xXbzzAUEYUVo9tLR7hMCONACLy
-OzKbWFiIN9ZaAU7YmtEB3HeKsuiR9L8fn5bz90EX/bGNf9G2RczxWMF8xg0bGdMdxTIC3RtY
-ynbynNkgNBSkTNpOXNGeNjvSm57oZghWPoXfbV7mQVq6BapvGJFGhxFeYFHCiWIk8QwtnSFG
-bcYW5tH+BNofQU41nKuGw9thWNRwPMFYZJiBDMtodYf7w71ANH1tle7gXBa4VxrWNqLvXUHP
-ctBp+JBZXD0dGaZwzlh4ORjtd9EbfdctgwTeMCMB1mo76d0mNhzirLWwdw79H49+RsKVEcT7
-YXiWwYzohiLDGOLoDHzFSsZ0+9x3IHHdDXP3EsuWkV9MwZOMxIcPAvOByDFElS8n4rPHa5fR
-nXx3AX094Y7h2Ed8pwjcTA8WMZy6aKgtltMbtGzUPRg8/iUD6M2otzPytIIrdbhbBbAogPZt
-368E6OQrvuIJaJxHJ7vQ0HLiyCzOmgxqE0B3AneagoXP5VjFsRs9/Z7RabOzmqCFctpZ8ncN
-kkiY/QxWXcYn7aPddZrj9g9Xt9bsCpttMhUrnKJnXrn4Pq32btutihdP0ckV/MVBPMgmxgQr
-GCEsxMvPg/HzaHMRPVrFsQXNHuHzKvZhb9Pfg4XjFNf+Y96gYmvLqxFHmoLW//CurfFu/+Nu
-LckCmtDvutytqmZ6zMU7zgf55YxDtuhdUzg+6zEWa9VV7L3DZrLAVSC3BE+/ADnm0+YSvNFq
-PreB7nG+uw43H5MZhJGP2O6ZqYjsufEcpfFbtUGqmd53H9C8kL/oWQvkaQxXanNnP9oujWz5
-Vfl8s5tE9TNuuPYc+zYR/hTRbTdIbYAbK7lqCWguBtllILwWu9nGcQTNX9Nz0VqyU6tKk8RJ
-zpjIg1zLKkk8owc3YfhZ7nBIOXld2FSLUYMfbZaBB/ZM1ocjo/Zz2k/LF8hunhDbTTNxsdwM
-ZEoF+WtVzmpK2234/AfU2nC31sSO1rTQQi0ZDr+4W0K8VgbyG3snVhrrrQYWdUDLnvTU4Y41
-9L55P2zbQ9zYBQY7GNluJ6Pa8UeG0/gL23P1A/7TIWfxpK/eMKs4V1TjisYcLfndKts1xSM1
-ZTzY0HkJCz+h3V9kSXHxFqm1I6jrFtK3r+hzEMd1cLnA72c0Ei/MHfIgk+3JkhoGJuau0R2r
-vXSK3PsW3HzFmMjWJsZBm6k1D+AsvTqvt/f1YHw9/GQddFCbntbAPv1osRQ+05c4lhEkkpBz
-Rue3b7QVhpZe0YsHyHRHb9LtrZLtc5GWO3kiVxxaiAa7vpP1f3SPwgZbxR2oChy3keMmHv0m
-cthTywDksDf29+n3E45gjlCOb3znOOWcmFhEfHiZjPF+BrDIzre59a4yVO9ccupNcRAavqs7
-JoVN8Z1LeMezrot/+O4ecD+7+8ixjoHCFeR4iMf4gCxRHPYWLQvt2i6ulcioa6j/YeASwfGT
-aBzNKe/ExjskoPdJya9S829GvTuOdLMhQzY0loXMIz3tp6J9T3BICAaxVNHtFP76KHZ5ABz2
-4jN/7zX6zH2EFGEcHmDuqR48c+1ZdGXnNX1/A7sNg89gEMl35qei4yOs9kd87YabCp3Egx2/
-sLvPHG8YOT8F/yDtcJRE7ykDhHI08PjlXgL108hxlFaPIcdFdHJfFUme6/1oHFUKe6l3csWc
-EOw1hHbfwbIw2o6ACz+Rz4OcPw7oJ3IyY6HJ8d6xsVPbU/MTV4bofak3WGTkSKOePcJPP1Rd
-OMcJhI83sAmrP3Kati+giwB08QxmfOawXWATcmYGrvBBJ/ZcvDQaLoMcpRgP20rlQtrrNb5m
-EGQChVT8a+xwQCaC2GCcCEYe2+/0qfbKTMwdYtMzl/zhKz4hFJsMhgfPkOERRyA/33WDkOSt
-uBmI5h65KdFHdrAoCLIl9Lwrwi2JTRTFJgqqTl0q4oYXcmRGghx6XpCIv9hfPfAZP8Eh3LUd
-QhOBYAzu8INefyJGhNBrs4UgdHLPPU6bB7EHqwFyUfsBB2CxgWjsCVe+QqtvsdUwrC6c9n+A
-R3SnJJovhj0UwSIKgH9+2s+LVrIruyiI/y6sfUZjwxTbt/kbGIThD96Bfwj9f44UD+l7AP22
-3O4QcXwnuf8O9yo/XwOP60SR2zDlAfx8qee4WfWe+xv9d2g/DiM/Tz6tykVmpxD456c9X/7N
-jUS2g7Dlewm1R7LtNWrViDxBMiaI/p4V8Ej7Dj9AhhvYwyX3BKw4QH5nc9KsxsFl/n/E38I4
-ywNueuotWgRYmCeMzd0T03YaPq2qQy76b20X0kgsJ0cWfk4tHPJzdo4/OCT4M6fB3m9aPvkA
-TdwEi0vYwil+Ok7rJxh9nOb/C+BwlTNuo4+H6CMYi/oCo36Bhe1CnUh7gtszmrza+zoPbebn
-t4JYRSH0UIDDVyMRT9iSgHNiIZGD7n7ieb7ChQh8Qbh2Cb2Bd7gIKqeQ6ihtHgeX02jBGGGc
-MMY+4Zq3WHMEvXDANy7aT+Kkdez5uBdHVqTJiVR50U5+jgIglA8bzeOk5PtkYJAICRNwflws
-JiaIOPTH5c4u/ftBi9/BPNK1mgK2r4zVMjsJLudhyXVkuoO0jzQPxK6zHZ+TanfhpLSbmj5m
-pD3bCdreM/rCVHv3WhjPVYC2fDkzj+w0LnEkHijF5Yo4cDk2/YmJRmxWRlw8Vhw8d1y8Zlwi
-WXSyDosgn9DJWzTzBm6GIc13zX56hwyR2skyJUzz1BtWL/llF1/0hXj8Bq9uM3csVoUiSyQM
-jnJtd9XcquYXU1jE5epILOS9aj6mIhtOQyxOhwzpkSENGZgn0Tw2sfuXKvhdR1/3NZPE1e7l
-P5E/rvZ7tmfa34kHH2FpCP22OSUBeI6rZBT2LuOe4mZBfGUezblwYXQsNJNYszA+0uYzPKe9
-kTuPB/s9mysXGUV28pb05Co2E9B2ho6AmWHIEAZbviKN7Z3runaXdGCfTftIfqb9t4ooJYkJ
-ZYhL5TnK4mFtjk1+bCEnGGRCB/YUPCH/RtH2OyJZkHarzqmqpodofw/t74Tz25VDJeW7GETW
-b2QVYfjQd1hHGL995Vt7/+aAgQcy/NLeW/mFe7DmoBUXFtf+1Jx49Geez3fuGk37VMcHiV/0
-8y0yBNLmZdo+hbZs9sEBjv2qKZBDs6lOoPfL4H5PM9CsttcHULCKZ8YI29s4iqt/0P4X2n+r
-uTXF6VkJ9FAC7RbnKKTZdTbDyyoq2hyUpDDCy/lKGy9o7yYInkJbhzhzH587+X0H3+/izvs0
-K8LersUE1XDX9rsM499fIBJX+yq/1z7R+TlK4LnK0k55YlEl+l0RDVeAE+WcK/ztDncNocWf
-eJZEWGc60PDWrqgvtK90AbI6X+1uvAWdbNKMl6xkvRm0t80eYsRR7PGKcgnLNAM1Dy6BcoFg
-JP2gOYiVOWoonw8my3vB5wN+v0V2cx25AoRPbu3cGU/7Wv+if6Gan+hLFuNLDp+XfDmnxnmL
-0Npisr1l6GoNyG2GE/s0QrfY+RY+/N73PgVszkbfCtOutd8QTrYAl/8RA2zX1FbI0Jy2G8CJ
-aqBdDmwKgFdG5/dO9D/o5zv6fZ9vz2mH58KMIQpoND6Lns3UOqGMyJKK0YennhIcQoZr+ImX
-+CvzaEn1pv6h7KAKfW+iceZbxnUvGYU85jOI3+8iVwB5vc2HsxmqH+ldHPiYEQbb3L8SIFUO
-zlWkrxXofznGtMUZW9rOVXkYoWZlZJgWOTw1x3q3njQbG2ze2z2+DUDau0Tuh+D+nH4/Z/T5
-nLH1Y8bd9/gMYBR2jdHIJY0Cqmr+k1WN+6K9gsO5v82cvInlnIRJW7TuogIj0dKMyIty+Drj
-NP7OzBgvLTpJDk8TcK6LPsw2npAPm1exOwSQVd6jv4FuJz570+d+2GM/GNSd9tuRt7bQnN6r
-9Poh2H1C/gTwwTRZnF5YFZ+a8K62ZlLM4Mxx4DKas8ch4xQ4Mo9ovwpebFMt4ehg9wkv8ZSf
-bmgeTzHuUFV9vea25+hNf//lb//yc1/a7YYsbThsl8yK6KcAnLF8Ox7e6otm6FXhrHrouiGc
-bAQXGoCBrSwp5wzDVkeB9iRamocnWEM+uQPPZJnvA+K97eqdDBnygY7NzWmkPl+h/9fcoeAz
-HGmH8WlPbLqC1f/osY2KysCZ3PjY5PKTNne3ImfVon82Z6kuXLQnZn5OXzDqxZkDkHg4LU3G
-Gyyg5xvRxSFav6m5lA+w2hto7RJSX2FMfRM+3HUHo5MJ9HcydjER1o/i5wG03RGeNMZmK4BD
-HjSRHD9p1Y1faHZgDWJEXUbgtehzNacfZ3UGg45wphsW+C8ecSxeaQ6+cT1MOEj7N9HFR6Ko
-zQk167b5MH/Duz7INBJZJiPLDGSYhv4ncAwG8U7ErSYwoAJZoMmQAl/lwolXim418Mv1wbq+
-Mx20BqOf7jCtE2faatYB9HY0HmE2MWId0eogCFwnD31LjhkPXuYC+6q035qjFzIMBfcJf2SY
-TtsT6ekwfEY3dGD+w09zma2Grr3LTodF50dbFYnVtbC/unCyjjMELLqAz9+qrJPJ6YouBpHX
-T8IrLAGLHchwDlY+xmdGkdl4gWRZWNKC6NpDVVvOuFPh6QJ0tARM5iPPFOQZit12Qo4GmpFg
-sT4eFmrZbXE0ZnXV2yBDZ3DoAvadnH/4vRnfN0WW1vj0bnjYYfipWcStDXjKYxr7BIDMaXnz
-4prptAKbWOaOxavNhV2rsaT/iHobkGkZtjIDXgxEF/aG0E+5jCd5YA58VSVk+B9xqTdXDqOv
-I5w+SPw/rKouXq6GZokVcvxBrg+cnEC0WEFGdxBt2Mrbj65Fd6txuBBdz9SsvElY0UJnubue
-yLONKLwdHW2ApwvQ/Eg8U3uiVQ3yh7yaU15QT9Ae8a2tjrW1SVNhUT+Q84fN9dyeTlXuXB1u
-NCV+dYYTI1UB8oa7h4zXxiBv3TVYzDyYMwVpx2GDY7Wyfa4z111Fr7YQfe3tz2btrBYMV7/R
-2zhOE7K/4mQd6fk3mlMHdDrA7hHY/kw9jx6GBjuAXGM0a2/jqsG4+ni3v4nf/5JFTSfz3agd
-7tfhLefDkkl4UquFNBj7tBkUQ+DiBPCfjy7Wu7tsl1a4uhluLiGujYGJHcliahK7fRiXJdE+
-2P+IMce0L+Birl7i9ESOluBSC6kr432qklc0wsN2AP0h8GA22e42dxPjkcUgMwPGjsM+bL3a
-YK2ensDvi7GkTXjY/USaI/jqA/BhM7nuPNAfTB7VithZBj7YCuDoTiMspztaG0sOOVfzVvqj
-0dZgUQeOVELGinjCWviLv+BEL1odT3a5GlacUJ3UZdjHXLzZFGzfqnCMANXR9GIqnFjg7oGf
-9hbqCGjvxFeswBrHEbk7YBdVsc3sjETiOjYf9x+segS+ah7sWkWP1tHn1U5D7lSV7yu7/vCz
-rHjRCV85HF+9EJ3sY0x4C818xGqTIn1h2m6Cxvo6vdFHP+4whHYnIMMi9xR2cgTb3Yxe5qGX
-f1WJNiEoZIUXZeHFX/BiMJY+39mKFmehwYH0oA2sqme7dsHZSlhfdVppSmudtGrvrrsUKz3s
-/oedLmLkMQUJh4FFT3xmeyRvB7u6uBtBda8z3j2G3R5DL7vRyyr89gRstDMI1GSUbNXmkmg9
-Tl80NgPU1jpLkX4UV3aCUY3dNWAxySkPepXwZ3XwW/5g0Q8fMZPR6A6sxFbffnQX4M0mEvkH
-IW03YkR7dxYefy0y7QKP4+B0Bus7Rgtb8c4L8FmDwaKlqpjnYOxVQSvVX+tZ+HzYvAEL24nu
-9zgtsPDq7lKnLNwowxV+eKSGxPIO+KvhZJjLNT7eQwRZy8jH3oyNw+IH4O26uOORYxk92cqd
-jmDZ57BZe2N8CI9kVZemg353/FUd+Jmf0amt1rcKJPdB6SBXLkQnw+lBB+RoCMMrYzdliAhl
-uaIaHqGZVlB+wDLvwsyTsMPmFawijs1CY6PAoi9YdHZnI8N6pwf2Mcg9SwS+iD89i072oZMV
-6GQUfqsNvKiAv8jslMNyW4LFALCYARarYNMWvU9rRk+qwItS2HAxvEAZvEF1fGcrLGIAdrIA
-v3VE7x+2Yzk2q2AGWclwLLsvfe2JDL2xzYFgMM69jq1cw4eeIkptI97Nhp+9iB91QcEXZiSW
-jVg2NBoW29zGzX/0sRdO/OeURMOFuXNRWihP9lJfe3dEuBOIYFtA4qayi034rPl6R9IePto8
-z+WctZPPE/x+he+v8ffz2Ox+uLGSWDKGnv/NmK0Ctmq7zEeDn8+xnJNY0ApkGOEeRB/HnAZc
-URF+lsC6i+I/S8PPGniF1vjwIdqN45ZWNobgwxNgA5YZN6XNf2l/NizeyLGfO50Cm4vgcY4M
-9jAjmI3EtBn4jd6q3ZocXhRkFNYADfWBMTMV+abCph4wuim98IOfxd05YNHnDxZ5kS0BWg9z
-J7tBMMKeVhxgLLiebHg2mcgwrKkr3s9f7zm3I/FR+HEeH3IBn3aSLHYXo5dlwuIdPbNK27nw
-GFXgRTu0NJ6Yvhrvsgc2HSWWHqffe+n/UqcQNlKIbL4U8awGcd1sdSgIrCbnv4gcoe5+ZaDF
-6EELeDCAdmfQ/hoYtNNpq16dhLdH0ckesvq15B/TyHd6o48Gen5UGna0BItBeLT5jD1s38hD
-aPMYvuIg9rEBXkwCh07opSq/5wAjqyQeoaqxB4knj117Dr9Lcz6q4Ts70OYoPN4C2L2Rs/fS
-o2NY1XHs9SBybEMnS/GQY4knHeS5c/F/NVXoCUb3p2HNMhAbhhxtOWqDaDnuVgwZi+IvypAV
-1YQX/uSdQ5FjBdw4Cx4h+I2EWpe2CD2PJsfqSexuw93M47TUG/2z+PPT8OYwXnErOllIxBiK
-/2wFI8qARnqnHhbTk2+ng8V6ztyD3g+h/73wYC2cmOzkx8MUoYWKZDGN8dQ9GPnMIJrbk/cg
-/Je9F/Kmj1XwXe3oxSh0sgQZtnH2Eac5MvwDN/vD00nwdSV3PaJ8vAs5bw0kyOmUZHTanPHY
-QCxoHnexea+7uMNu7HQTepgHJ4Ygiz9+y4+8y4eepcHy4mJ1P4is7/HfQeTwp/Df64llk2Fy
-HzKk1niehu4OItFh5DiJ3ZyAcQeQfjO9tR2nh2gttD15zeGkhZ/ftLZ0NHF9EZFnIz3ZwR22
-0vfl2MgE9NEDbjbCd5YC4WygmxyPHANfGwEv7KlfgKoSVgBvf+0z1Q1bbQWyTUC0BbzoiBw2
-C3664vwatD+VnlsNhzp6tlkCXjQmE+yNjUzBfy+D5RthlM1zW03/p8OLAcjyF/GsAnrKhQdI
-QUv2Dj+CHCcYNO7Bi5N4tHV4+SnaA81mFSym/c1IfYCYcoz4chQbOgBeW8BtAWPjYc5P13bE
-MF6kc6oTU2228FCwmAUvVmAja+nFKvzFbGx1KDi0hSNVyHPywM2U9ComTPzqHtXI1J5X2GrP
-/WQgy+HbOLRr+YXNj/gbVDtiGwPgxxTYthrbPcKdA7G8z+Rk8cj0MsGLwqp48hSp7H3/PPzG
-v7L2WdjIVHQyBNto51Sgl7XQfEtG933w4TPBYhe8uAcrIl17A3ONiLub8Z69qbU36MZPfxD1
-RwddwGAocWwOMm2lh5eQ8TXnuXjCFOgjN9KUQR8NyYK6oNURmgPQHsQacVTFu5gcfkSHusjR
-Gjn66tlFUme7xulfGSUH47NslcU+cs75MGwQlm0z5Zpij43AoyVepzscGQcGq/juBEx7ilVG
-MSZKrmfv9l7gI6PK62C+nQgwi14MxGd3hMV/gUcTrK4Jo7lW9LKzMuzs4JAUlnvQo8+MUF+R
-996Bm8fBwkZ0k1Wxpx93GIV9TgWTeaA735nGsZE7n8FGzSKNE0kcPyJZDicfo8NSWExNjSy3
-gtIceGAzK3qjm46MA9piH+3wWTbP6V96PJFR4DLGqvbm9jZjRHu6Glsrb4/hw9eAx2TuNJA7
-9WDs0w1M+tL2aDBYiAXavJrzyGEzwsLhUCwyi5Tk4FmxFluzWZW7tII9PWDRUFCdwB0m0v4I
-GNYLu/BXJYbhxJKZ2Ml6fMYp8h17ohgJR+0ZUk50Uoa2GnBWe6QegP8cBy9mgMcC5FqEnS7g
-ypngNpLxaifiWR24kQ9MksDRUPRt60V34dkXgpatJRmAfdhM3w5g0oE79tDMm/rYUFn440u+
-7gUbbC2szVIOJvu5xP3+0xyIJjC4IygOwFbHoM1paHMmnJ2JxqdxzijGaT3It5qCRyliSXr+
-/wXOj4hEJzWLsz8Rejy+cQ7SLyTfmQ2zxnLXPtylNTLUwkZLMobLTatpHGPFT+zE1oNlxW8V
-pRdVYXgz2u0Is/rB0RGwehx3+T3zZDEyHCDbvs3d3tNqDL0LSQhHP4FkgGYTdGXEOww5ptLe
-PO42F0wmcwxS5jBBlliJzK0gqGbG6pM4H1x7cxKsJ9DZiNtF4KGfqjn9g700xxaacbU/d+2l
-KksjiCMDyPs6IkcjrrZRWUZsJTosDXbLkaE3097Y6/DlC7GPqWhxDJiMQo4xqpvVBX/SXPXh
-D0iHWclLEpM7fyfKPtEq+lz4rZJcUQMf0QJ9tCdD7Ek0GIBeBoHHYFD+l4yuK3K0pBd+IJBb
-6wkyEGFtXbetm+2CvY7hrAXYymo0vI7+r+SYSw9HI0MP+Nvc2aNV/756V2Lvj2JpBdAZ+LkG
-ex2LTrqCRTM0XBMOVkWOOkSI/ynO9aJ3HbBZq6FQxXlJdPyF5ScjluWGF1VgTBv4OYh2ZpAx
-r9BasInIMZGsZBqsmkdPVsLRHch7Rut+spE3JyRvDUcf9ttB8aIyDLLaO/8Dg/bI0ZWjBzG+
-B96wBz60I1ptSU9qwm57Pp1WK65t/Wpx/FZjVbTaDIOW433n4u2mE9un4XFn4XEWgtEaouAO
-kD4FknfA4h0I2H+JuUNG2cgmPJs9kevJ3Vpi+bXpWTX4UYujGUdXfh+Pbax2q2tPicdkK9+J
-Skm5lw9Mqc69O4DFSCx6Pn5pHe1uAZPNfK4EgxlY2BDssx042JPr4mRsmUEzrpMARNLDbh89
-T5oHewdxRhvkqIvEVeh3FT7t5za0b7tkWp2PPW4hrvHCc8ciioSSJQW65Z2zILgfX7GZOLIG
-j29jgmXIsQIs1mIvW8HCuHuaO9mK5Vcw8ZveC/6Al89UG6EIll4ONtVA/w3hQRPatlF2U3hh
-2DTE69RGw5WxgKKqY/AUL2w78KTgp3zYh1Xy70RUHAlz5oHYWvq/mWMT2KxEhlnIMBwZOpEP
-NaDVErA7o94tJgOLzEiWj/6Vop9+f7BoiD4aEw0bkxXUQ5baWrvYgx5M0dpKe/uU1Hnr2nrH
-18Rqe754mii0F2u2bGwNbS8jQ7T5rytVK2ojLcxHzpHOFdj1gDu+YxTk0ofE6NVLb1KOwoml
-2IfVQLLZzjWwg5J8Fkbq4lzhx99aaq2WPYPLCQtTYN/Gq7eq/1AO+/DHBwyjzwvAfwv8PIIM
-p9HHSbDYB1/W4aemg1lfWmz2Zz5VWvz/L3B4jETHuMsKeG9rdv+GA9XhZlE+8/J7fjxuafTw
-e15yfhjvDerJsSurRmArfwL5i70hOIg32Qbua7HPZWQlSxmfLSd7Xos8O9DNUXyGVQp8AH/e
-0OIP5E8IGhml0ZPa9aMGEaghsasFOa8/7bZS3dp86KcEerK61/b0dhQ2vZ6M7Qq28YmYnFRI
-2nPvI+h7B/FiPTa6jIxoMRgsYVS3HFk2krFZjdBTRKNbRIZnru31aLsj2uy2SHgZyG8H8DgW
-T6363F9kK5WxpoLYZS5k8oEXJfh7XeTowihzKrLb2Pau+02Zmu1MZPtTNOLbPqqJuhzsF9Du
-PEaX891L0ssmsjarnXWOOHcPeYOR+yeaTaK5Gbbm/7z2Z2gCFrZetgvt9aTdbk5u/FYOMuf8
-8KIiCLYgAlk9xOXYxmkkeO3a/mtXQOeQZsH9Aw9H4quWIOlOYsYpmHyJuGZ4HENX25B1IVgM
-xUZbw8iyyJBB8yKs5kADNNaWM3vCi4HgPhxfNQxe9kOOTk4eeFoULKphn3/T4mjyERvNXAaH
-D/ybkMzEl17UUw2oacTSMWAxnJHMSGSwpw4z9BTmKFht0oj/PpiFateY/IwkEjv2fr4Oke1v
-1ROcgpfvRuxuwFEKL5eHs7PzNx+4UQoG2kiiN5ywSoU2t+y5e13jGmOKabQDGIxDhhVY2h7y
-yzP06pLWTy5Ehs2MkY7jR+7Q0zf0zHGKMZ5K6RTCc9VGsr+xuz7KnoejtXZkSXW4m8lRCL0U
-gRvlQLwB3OyGn50OL/cwjgly77g/GU/Y3M8S5C3NkKEfSE2n/bVYtMlxlN+PkN/twX/Ynhqz
-0d+/znNkiKRXicmPcmt19gtVsuiMlVv2PIrsaDyxbCxtDiOe9tJa0lowqSUM7AknpsHLHfjL
-ANf2rLxIjrIPhNZq5nIb5BiIDmxW8TKOTTBtC/rYgD6W4i9sTf4A7LQVGiiPfWRlPBVX8y5r
-6m3CSfps9ZtnwIlByNIRGZrze33N22+EPy9PfuHDXW0XH6u9Ego3gxhPnOabHUSV1X9GEr/l
-sNUqizhWoA97mr4QnU3V/OSLMPCxdmspoPVXVhmmJJ7PZia2xdpth5wh3GU0aI7Rs9cWeLnm
-/K013OkCgsOxrCX4K5uD+gBefHVvkCcdghcblTk3RludkXQIvJhChjCfKxYQeWbxtwnozebl
-tnNuIK/N0viFLpOTM/oSQ6oJIatxuROvtpT2J3GF6aWr1jL3pv1WjAdsXWcR/p6JVuOB32fG
-uQ9UzcELGyzIX6qAZAu92RhOnwdxh8H0f7TWl49EJ/3wuG01w9Tq7XzkOpsZYXPsysDWRnzb
-Hoz7ornhnG1VASeQqY6h7YEc7ZGpgfbUWAADdoDFVe17+QpLuYbv3E90XYOE85B0Ml5vFB5n
-iPbKHqmnIRPR7gK0+x9Wf0SrkcurTpGLtaXBWosx0q4HOv+QofTFuw7XTP+loDlVmh3F3Xqq
-yus42DdXeVAamODh2BMHq4oTB26mhhM5YXYJMqCaqrlp78r6c8fBoGuj77n8vAFdWbZ6HQ9p
-+rDoYXNhC+BBbaZwGydIdUeHY3/jueNkVWIeDxYjVOXVn5+r811heOmFn4jl2Ntwm5EbC/tP
-rnkU87TTRGW01oCr/JG8O58DyHkHavXvOnKbA6qWXZdIXJKcOzsSJMd3R3fKwlSbw9+OrKMP
-dxysSifLwWA2Mk3k6nH8bRJ4zYGbq4k59jzwpmuR9JV2+LO5NJlpwxc7KIP+a3FVC7TXXk/I
-rD7rLD6Xg8N21ZWph/8uCRbeypqTYx8+mtvxHH9xm6zjDHLsQg5b+bBQlX+H0rue6KYVPa2B
-DEWIilnwOgnRaoRqFiUDwSyqQbKUmDADfdiYxyrdDkMnw2G8VfOcjbWvxhvsUp2fUtpPLhQ/
-E0taCVNVpvpI9w9/7UUbg9HeKGxxHFeOhaOD6J1VSmzIXcpoVtMVVXr6oZ1Ik8NNmxddwFmF
-DLORdBIyjCb6DddTOqvc0JWedOSObYgQjVTx66abh16kwH97wM1PeJpnIHiLM84hwwHa3IwM
-VplwITLM1iivO+xuQSuV6IkP56WGl9G0OjwR7MgIU33AojixuwrY18dGbAVIW/Do/EeGztyh
-Lb1rquo4l7QrXhpGHzHgxUdQeUYPApDQ6tQd1iz7gehjKHccocq/8/AVC1WHoiZ/s3zXRpWW
-s0diG6/IsQJUZaQo0ldCJ8ae5iD4N3J0gqfdwKYrPWmP9f/FHepwbgmwsCpCccDis2au5tMI
-4oJqm3fDPvqD2lCkHoEsw7UKYRV326D9EsppNvg9MppQ2wcFSdKSY+Xk6gJoqiQa80PqOsjQ
-GBlaihujkGcCvZgN89bwtz30+hzXWPWczzA8AX47u2pL3dJ8kq5IOUCZ606tdxmplfxWFWgj
-f7d5/IeR+bLqisQCzU94z2d/6qEdwv9sgLk272YWmE+mvXHKmFqqauUcPlcjm43mzv4ZE9qs
-lXig4a2qczZ34SH9tUzwIrywyg7Gj114mW18v1k1xyvT23zoI51js9NfYR8/3FfaizoNCGXm
-7NzynQuRYzY+aRq2MJV2zZ8vUNXKFvjuBpxbmSyxAB4qPV4iDrmF7RUYjD4eI20A1mTzHE7A
-gwN87kQ/W7GbTci4ERys5tAh1dlLwIj4B/H8neZGpsKTZ0GbeTjDYmpZbMFPVj0bns5Fk4u0
-KqMhMtShF5XpbSHtK/7dtbmWNqstGNt7xNl30OBl+YsujAespnZH+m4rIZpwdVUssbB2PbsG
-ik/gxBfiWGzGQanBNgtX2txEs5NCqhtkFXmWI88yrfGoiK4qcpdy3KEkPi6vRrZh9CYGXssq
-Ofg6Iao51lD1Ey3fusNxg/Yva11WY5hkmiypWoO36Plj7aVtviKMeP4CfdwFofOqY+hNlMsF
-ej703Rdc8qOHwshQjO9trzCrmJhf1The42ci6UdCzZkP1zqGqvDUnmC3hG3/gyOtsQPTUXP6
-Xo8rK3AU0NoGm8f1Aiw+u1aL5x1yPMb33FStwnTaiX472GxGng0wfx0ybYRN22nloKpZFeHc
-vKCf0XnPnRzN+7QdjMOR0lYbvFEdxybI0Rw5moNLI6Suy1V+GmlYtcL7tPhC69utMtJnefGU
-2FwazkirHOMQMuyhrzuwga3oaRu4WN3JA+BgbxyugIXNrXwFql/deLKRDPyUT2tLbL++V8jx
-XHGtEbpvQC/r0IIfshRXrZ0HqrWVAD3anNPfM6pT8E0a7pua+6fRvNkjYPK7+l5a7CY9fMii
-uZvH0Oh5ZLsFJ2x1wHv8pkNuk4ze5OC3Elpn8wrsX9D+C817ashhcxarI1dZxo/5aS2z8wFt
-2k6/0bje6nukRg4vzsqAptIhRzrln8eQ5zB9PcCxn+8OoCdbg3MGea7yu2n1pWp/fVe9u/Qg
-ajP+ytJ/s9faYGBz9mrxXTUYVIm/l1T9wBDXnqiaXcVGAhccbGdUq4EWjI4f8XlLT0uttqRl
-QCm1FuoEnyeQ67Qs3Au9pdFqDatwZ1UMo7D2JPTCKuwVgAfmzSqQ51TkjhU04ysEa3uHNj9o
-/YvNEUzp2C7B0Z2YMNvR3M3MSJVV1WxeIEuQKt2lw8JSKucwq74C4lf0e0oiRXLOSUBvPZD9
-C/+HwHDb0TqIO92lnQBYfBsO3uewlTLBMCoUPXyGD+GcE6kKQAlVf80TO/fSfsE/QSmcq9+7
-Vlsom9bZBOoZQkr6nJQ7e3LXpFi/tZSYHsZxbDbWK0b5oYwsf7j3+eYW7Pq9tig3n/ZkzDiY
-R/NVw7QfbVYnCr05TlLNG7WcJA1Y2OzuvLCjMH8pqnUjn5HnA7K8QY4QcA+m31Y17hmx/zHS
-P4YBT8HgKXp4phztMdq4zW9XweMyCF1ClsswzSp1BqFFq4j1GWR/cUSnVZsDnhAJbHZcej6z
-IlMevRVJrvUKhbV/u9Xd/IFevoLDF9eqWMVGnhjIEU2rZO4zjrznhjOefOfeZUR3X2vIbvHb
-TWSxKnG3wOWu4kNirkwGe1ORA9m4LQMIeNF6BrxLeiTycjI6WZxsWp2QjZGM7fKXVu9oMiGt
-rUZIIp/4yXXp8XdasxmrkYwkw7Um4QbfXtP42tYg3EGOAEb8Adj9beS4x5WP8CLByPEFNB3u
-GFtVPW0tQEbu7UXPbfVYFv7NgRQ5tUolL2M7Wz+TXWfaMxmrsPaVXtkqlddgYG9qraZmAJ7u
-puZNfgCBF+DxwH1E26+1jug6El9H8ptcdQ8rfqGdnhNrjmRMrY9Kr32Ck/KZmjYzaqWnDzj4
-oJNcjPhtxUYqsEkIOjb3257XRboJ9RT0NXc1Oe7Ryh1au4Vd3HIf0vtbbiCj7MfuacY0J0Dp
-hNbZ/XIvSOqY4BGfuyQh9qek/+m0bi0zR07tIJcDHvhoD7dytGw7tFqN3CLoxFerI6KhoR9c
-/VnrIqLQyTc4YDM2g+n5I62YuaNKwbaTm60R34XF7OKsfchwDBkuwaSHqi+ZAGtIIikya71S
-KicfSBSnp2XJjSoiix/f/t45zAs5UiKHrWuJw/nR+S0K7X5VDVLbw/uT5rnbqson4P5Ue2nb
-XtY7VOX7I8dX19Yn70dqm318iyvNl/yC3YnEjHj0Lz76T4A9JEGGVE4lcKlKa9XQRVU0VAm0
-SiFvIRiUm/MycF0S2B0DRL/TRhiMfEmfA7Xa9pV7FLl28M0G7VPx1l3HGZvIV3bgx47A4mta
-ZfMNm/qBv3HxFlaNN5ZTkvtWRJaasKM+iDfCIhqDgx11kccPaUsJL8POZliad43p2GqL11q1
-EwoG78DgLToIcTfy7UrQWQYWy2HrWuTYDmKHtRr3CzZk9cki8XU/VHGtCHKU1zvjWLQXn3Zt
-H+s0HF7IklH7dlRErqLSWzKxOJGe48bHi0UnJv0AgwhVaz5Ff/cL/zD6/8FdzedavtvCsRdZ
-T2jkHYEM4WAYrqhlKy+KaF2hS07tEuU8VLWhAZg3oK26eLFqMKCsdJFUK6RtFah5WBd2fkSO
-l6quGoX9/cQefrrHOfbQwhb6uZFjE8cODpuVb6sD7A3zC9dqn37GSj/ihz+RGYcTbb+SYXwl
-l40k0v8i+ken/ThOLVqrollrSbDTRHAnEWgk0UqRKGw8DGt9Tm8CYektfNFlOH+KzwMc9kbb
-3ihvhoM7OWz1znnJEAFrPyHFe66y5+pviGRvibTvibIfwOI9clj9Bluj/oOMyIELMZwy8KWg
-7DOBVszEBxd7sm7vWp5q7WdqVa28oMrVnmQ/nsiQiCwwDhlhTMZf0cirbU3wD+zX6vL+5nIs
-sp10eK58iu6vyTJCyDaCydJDyIDekwF9JguLRCYX+aLDmziyoZTIEBsdfefq9+QiDzluIMdF
-YsFpWHZMT3uSkgEmQYYEyBAbLGKQ53s4VlHillZ9RqAJiz+2evSV6ixX+LP+1FbkNwCXRnw2
-Rlf1/6yHLQcetqIrk+0NCxYejnkqq9ObXnU6L/N5WnWgrV5CEjLSpGSBnmSkiTji8nNsvo/J
-eR5EO3sWYnb9BTbZLP9gVaGtyFGb/jek/SbI0pSfm0kOe0r82bW6psXgia0EToEsMcHkG/d/
-AyceatT4O+M6ij4O6ylLcrBPAQ+Sg0dSrUzYo3kncVWp+LGqSNuqvAitM/SmvaIcVTjqCYM3
-tP/atXmCzfQU7p3WaJfXilN7u+PSejT4EEfx5zltBSDDeY6j/GwYHKDtPehmB5zZrKfEtmY/
-FZlxCjibBP7a2/6YisQxuG9aJLJal5WUkb9gbPmc0ckjt61WrDxktPJ7VUAt5CsDC3MrC7C6
-mDHBIiFSplTmdwVeHNdIKQN8SI8MNlLxhhPZGCl5O1ZZZAN/30WLVjP7KphYlfGPWIjlJRm0
-IiZI9a6b6k36Lc21aa+dwm5rRwDbcdwqw5UgC7CVX7YmL4ZWrqTSCPQO7ZxXzbnM4OCl3VB3
-Yv3/6WmkN6PGLIwiMyBHGvDwRC+2btnFq3/Rmw6r6phLq6asCsANRovX3c4cPfi9F3L10CoJ
-23koDDki4YaDz46Nt0gMIvZcwyoeZ+cKq3/tDRaZsAOTIbMq8q/mWIIstnPGUjBah052YTOn
-VDvbVl2+1TrttPxWiPZrcqe/ODpx9EKGvsjQV5VNnoPNO2QMR9afZKvRtMIwlmPZTWq9obXV
-dVah8YSeEXshRyY44U2b2f+srrK5elmFx2aQPIQ+LoPFEyw1XM8j7nOGreS7AS9uqKpLF8kR
-4PbGE3ZHznbYsdlLVWzF5uRbFbEEelaXCL2mItO0WraZkSOjRiLHNXLMqkoNNpJeQ9a+ls8N
-qmeQSe8hL8HPh8jxAd/pQT9TqZK6vRe9phVcrWBaWw6bw2pPRG3lTCOu8OPcQvQ8I8xO5NgY
-PoYqrIeA5iP0HgAe9hbrourJ5gFzq1tfXDVrt2n2RxG9XTquJw9Wt9ueRHzDUm12TiDez2rT
-WiUEW5d0GllOwMeTjKDPYB8XVTmiAudZzfjMcDQJrUe3vYuRxkZrtvbuMX29T2/uqdq+rSYp
-Qn9LcaeycKU0nC1O/Mgn7lyg5wHo5Ale643eMdxT5EmrqubH4d5R/MIRfMdRbPMk7Z/T7giV
-wKMEMvio8uxXWvfAmyfSisev4G7Wbh74OZ9PaOuhxlz2DKQMvrQMcpQEl4LoIhdyZcCeEiGn
-SxYaihwPQcTqXJzUmtW8qrS7H93sx2cfxpefwI+dJ4bc0GiyCC1lU9VYq2EeT6uJv6kGuMlg
-SBVGN4WxumJgUhrpy6u6+zE+D2u/BVsZ6a3x0G16/1jryl/CT6u3bvs3HAbVfXraXA5WVeGo
-BYp1VEHSKq3aCtD7sMueKYXDLI8/IxGrZZAXLRVRFYJXWpdoFWZt54iK6KYySFegJ2U4iqCL
-XBph35RV2NrL91iqZUUX8KTmefeK1bZ+0p4HleHnSmBTWfUfL4DoLc1HyoKtWJ3nOGARTSPo
-XKpz8YkzwujvB6607CAEL/iYngRwXOLnc6pTWIwjp3z9Db3ziUSOFxo3/SAjio8M6bEiH1VK
-tkrqG8FjC3rZxR0OIs9prYr1RQ4vWvMEizjkW7YK9Ce6CJd3r0j7lWXRwUTGZ0TG+1ofV09v
-wi+Csu0bflVzHZJo1PKK3NRGapHIEJu2UmLZ5mXy4VmKOCtocxVXrefYDsIHtCuA7TNho9r4
-2KkH/vuH9gIoqEq09qzsA229R4vvlRk0RTf2rKoJHKmHbqrQdgk9IwqitaeaLxaGRu7Di9PK
-wqxiT1q8rTeeLg8eNx9HQbx/Ib7Pr+erNsfqmp7KJ6BVm8HhasW9D1iURhbLEmsqS4yk/99o
-/wue+B3e5wU/WxWbB8hxHzmCVBckOVjZG4Y32p/e1rW7ZOW2J1BKMPDC03rrTdkiWljOsY6r
-dmhtbzqQTabR7SfXopmt0I7u5NE7SYdRisPIIYr2furtbRv8ajv62w6eWkRsgsepDi629joH
-d0mKHD/wWE/RidUq2sM916teUXraz+LMwvpmqHZRHsmzUjPLzCunUjUR23EgEp0kpt2sYFKM
-dv20fiASPXyjTdt/8CNRIMTtgw/pSd87IEdL9FNTlTReoMvXMPwNvAhl1PCV0aIHXj4h7aWh
-7UzORLAYgxxjwGCS3s95I18GvLA9t4qPZqOp0mhM2k4vbn5HhkjtPdNSFegi3W7I0h+dDMKX
-/IteetJeO2SyLK6S1i+GgoWtF//ECCoCbv5y/4OfizUXNg0ypKd9L2cU8ozhmEz7c/h+FVft
-QhdnFYd/KC+IBz+zIEcxPquqttgvok4UmUAUkfAXMnxzB2sP5jDk+oCO3imbs0w/q6oHvEUb
-Nor74tpe9Wvp2QK86nT6OwF+jIJ5w2l7NMck9DAHPqzm73tB8TJY2Pr/765VQfBwcsGPsnzW
-QT+t+OzEZ1+O4cgyFlzGgslw5OhDm4ZHA46Syq5C6NFbPEYoNvKVkZOjfbOmcdcxtDlYe/ym
-4Uirn8cg20yi5yrO2a8dNaLr2VF0oruNlIuR/dWEra34phty2N6p45FhOjLMAIvJ4DCS9nrD
-1db4iKqasfUaawuW77zMqGQ7+C7mnlPhxmjaG0i7vcGiJzL043MIfnUC8i1Eji2ccwZZ7NmZ
-7UORQvU2EjFyjO+0QJ5OyPMvcoxBhqmS4ZM7BfzH0F5/vUd+CYdf4GtfgvgLtPoSXrzFTj+7
-69HJQnQyjTbGwo8hyGL7lg5EhmHINAE55vLdemQ5rBmynqrhEJORWSZGiDajwkbW/sjRHTwG
-YTe2Nm0KGcAUeDgOTg6m712RozltV0SjObBTe/P0Hg9+Ha+xDznWgscC4REf/BMhRxJkSO4M
-QpZhHBM1EyUlmWQK7CQF3ic12k5L62n0lMtP+5fFdzri1/ujm9HoZCpyzMBmp8KJsXBxELJ0
-5mis58uv9CQ7GnI8A48z4LEVvSzFaqYzRhmDzgdpz+W46CSB0wc9DIKbE8BkIVzZQtvnYNYz
-7Md1rcJaZqc47KjLmLEto/g+ePaRyDIFzs5GL7PxqdPwHWNBrz9sMp1YjLHImAz/Zc86bpN/
-HiT7XAMytpZ4IpgMRZY+sLc79tAdGXpz9mD6PknzqLMQa7Pjy/PQu7zE1TzYSE78ZmanOTlx
-FzCxtYoTJcMvdx5YzKP9GfR9DHroB6Nag6S9d8ipqiA33GD3Dr7zobsNORZrh9iv7nBk6A1S
-ncCiHbrvQPs96PsQfNc07b3mS85hT9IL0YpVZMnrlMaDNkGGzvB0MPqYhA+Zh8aWYhtLaX8+
-sWsaPnO4qknex1YD4edd5TqfkeEmY/fdSLNUa44iwSGa0wsJO6ALf3jhT/vtwb63Zkrlhht5
-VR3spip/2Lq3vE5hxvD21KkjLDEZJsOH+ciwDF6uQAdL0MFsdDAeOWwm31/owfaFyYQc9ozx
-iWrEvMRG3ruz8KOj8UMDsJUucLQtOPjDg3/QQ3f0MARWT1N1NNv/xd6e5Fddr+xopAqI+CNR
-X3QxVlz4pvWsK8BiOXIsBI/pHCPgYxdwqY88hZDH3hh8QRf2THY3/FwKMpMZQQ/SbqBxkSGx
-0wrEWiHH39rROKMzAp3M06yUPGgzD61Y/ZzsTlG42RgZusDJYchg9rkApEyGldjEMmxiLnY6
-Acn7q36CVep6gg9/BPKPlG2dJKqtR6KZ+IxR4GCVXTtgq63BohW22Qbb6IwsA8FkCleuhZuW
-tb3ULGh7Kp3FqYE+2pKFDuCbCVjOXPzVUni5EttYjiwL4edUfOdQZOmAHLX1LuoBXieIaGa1
-ip67u8BiGVhMkX1E097o7cHDHx/WBr/RgbN7aw3M77i/C91YDbTfWOQGiyyO7T/ZGTwGYzUT
-8WZz8BeL4Mdi7HQBHJnO2SORpafeWz5RjQTbx8jWKoToyfQjdyfcWCobiXCHoRfbsdZ2GWwL
-P/5BN13kS9MTX72JaTbfoIDG+R56Jp7XqUD22RK9dEeqYZIjOnbqwtHv4BIuPz4OGQbCC8sz
-7J1yMbRqWVOUe4VRSYB7Cr+xBd0s1prNr3DDdbuhm3biaBKtBerJFcOxkznwcysyXEGG9+Sn
-iZ2Cqudk62b/Ri/98BejkWMazJ2LLPPgyRwwmQ5fx6CfvtrRxHaCCsTirQbbDbQQwP/38FtP
-8Fuv4UaoOwI8ehK122FF/shi69Q6opt+yDIOji5DlsN6w5RPdR4y4bfKg0UL7MT2Qx+GXiYi
-3UzG03Ph62z0Mx3UxuNDBqGXTqoZbjOF7untnlVmec5I4CyWsl17+D51p+I7hiFLLzxrJ3TT
-Ht10Rnu2M+dofPcC7Z6Wh6sLER2K4rGLOgXAozZ6aevkwFYzOyPw6hPwYVOQZwryTAKb0eAy
-EP10wYc0V62Ze9zF9ss7i2VYnbOz2MlFYslN5LjvTsNyhhPj+oJUDzDpjrR9wGMY3JgGFjZH
-66h8p2WbxWmxKHGkoFOPqPY3dtsTOQbz7Shi3Dj0M44YNxI8BuFpeyF5W+1LGEjebjvqnVRF
-pw/uYZA4hu86CzeuwY1A7T45FPvtCx49YU8veGq7+Y6VjdjOKgW4Q3HiSGlaKIvXKkUcKUJM
-LeB0QD998aVD0dRI9DMaOUZx1jCw6I+9dIYXLbXi5IZ2SEuruYH7aPGAdn3chxzriPRzwGMc
-XB2MP+0DV/uAxQB8yAjiyXQ9JctHHLFRRTm8QiWQr4gPL4PPKKq9nTv/kWOQkxFZ0jhD0Nog
-fKrlgJ2xlf/haepoDwd71nESCzhERD/g3nUPYSe2I+gld6XW/z9CjtfixyDkGIIcY/FjM7AT
-279yv54/WQZbSStVczrl+L8EPqOg0wa9dIEfvbHg/uilP3lQP2JcL2ymE1LbGpiG+CyrP+TL
-eDG1Y9n3QTzFQTRha9zPaq/WZdjMTGxmIt5kNFKOIsaNQycz8KNmHzZX7Jz2SKmIBVYBCz8n
-H3qpRPbZCCz8waIjWNgumD35aw+w6AY/LS9vrT1MX5B3BqLRK3oOlpBRsGXgD5HD6sAdgqP/
-gcUyYtxspJsCFhPIfSYSW6bjzxfpiaXtq2bznsrjkStrx8lM6KMoWqmGnTSBn/603wFddAGH
-rtiIrcPvoP24I9wWesL9lPH7PXpjz6xPcfejqhF5F1s5iyR7yHrWoY9FqsTw24dNQB9TYPJc
-4slKzbPwgVWFYFgxPJHVcC2M18qjt2t1ab8FvutvfGgHeNkJGTqRe7VDjjb4jBYaO30kx7H6
-WI+4WwBYXMMKLuM/bRfQWzD0PvnOM3cVPmMBMswCqenElplIaxVwV+uJckY9jQmEH/YcOC4W
-kpkcpygcqAr+ti6vBTpoTWxrgwy29r01/svWkjYCj1posTK+y/bsygUmKZ1AvXl9o/qAd8Ei
-CDt56m4Gh5VwYgE2MhdezAOPxfj0NXrbkgj7SKE5DzYzwoGDVpnRh1hm1YZrgEFDjhbI0lKr
-mn//3BRcGiJPbfyGH5iUApO8ekJm81weElfvo4EgsHiglfY7lfPYenNyE3zGAnKwpfj0tVj1
-dnL0o9iszW94Ri++cRdb3+SNDoopD0+BTpIr12jGZ3Py4aYcjfi+HnLUABM/mFQa6a0+WlZi
-vs35+YkEVi/xDp/nkOEAfmIr+liHDCuQYRkyrEBr69GLvWk6Rly5ghyP9JbM3k+k1R6TNhYo
-SXuVaa+WZElJu6k4UtP/3xhVRUfl0UsJVYr+qRpi9m4lOncLU23fe+QZ9xkTWN0We/P5ClsJ
-dm3P6f80dvumt6/HiSlXtPNOPPSRSDNsEupdvL1lTsz9PYnxScj/PJ3qyFEN+aqgKz8krYg8
-ZcGoBOdZ9Y6cmiP0Re9XovCc7/QG2OomPgePV6ruupdjB9azg7/a2+j94HEcWS7o7aCjWWSh
-mikTD6Tjwc+4yBGPeJKQ/iYGk+QcaWk/o9ZvVoI/FeBPaWQqqiqLCVT31Z4Wxsbi7T3ia1XR
-fOZahD0BL0wvu/h5u/b1fa1czCKOVeG15x22D2Qw8nxzrZaUVU+Mj60mxGKT0d/UtJ8eDLw5
-cnPYPuQ+yJFbtlwSBGwH2VzoJoNmCLyFF09pIYj/A7l/IF48iH4/AIMH8OMRxzPpxyrPHgeT
-S5rTYe/RXaw4BryI76RQzURP7Q9rfa1M/2vwTQ3arQ5C1fFlVfAnFfGnZWi5CFf4IHtmuJEU
-fjqOPTl4CC8CwTkQXgThP2188pi2n3C8gJPByGUyfEQf9ow20rXdNO3q3/uoxXe8VNE0EXaS
-VHvmVoEP1WjP3sobJpXxJxVotSQyGg550EdGxm5J8aXRwCKMdh6JE0/hxHNwf4X/tJrxIeLE
-blqzuk8nyDUuYa+30cIjsHgHij/BI74qOcWk1zHpY1xiWnzaTQQOycEgDXaRAX14aZZCGfRk
-9UV9tJdtPO3YFVNzFO05yiu81gtkeInvDHGtSvlOjh20b7zcBxeOqqJ9uN7CBml2QISeJ0XX
-7q+u3ioW4iiDTFX+vIWuo2olaZAlgzhanqMEcuTXLJakmmsSn2t/cN83qjD7nn6+pb8f4OUX
-2g5HhnBkiQCXb2BhO3BYHcevcCICTX3hzM+w84tWdtpz13zwrKR8c5RbE6ztjXhd+FITTKrB
-V5spUVr6SA0vUyBZEq0rMq2GCt/wP7s3R9BeJDL8wjbs+Ikcv8DiJz71mzhxk7atJrI9J/3G
-EYdsKy38sjlWxTTH/KtrcaIBProhfa0P9uazrMZPeVoupiqoGWBJWqRLCnJx0IjjWG1hq251
-DhmOcOfdmh3wnVgSiY1GIsc38In4g8Unos0HeZgwJPFAhmR4jaz4wELcrSyYVNMz12h/ZEiG
-XlJLJxXhZgnYkI/PbKqwn0Y76f7Azt7Qz0C9H7GZEOH0+xttf0WGCGw0QnrZr799JvP4qBlO
-j1XHMERrJ8zWMyKHLziUQDeVuavNlmhAH22mRJ0/vDCfVYrWC2AvVkHEi/9tLlh0JLF1slYN
-8DbtXaStYxx71XYEshg/PoPDJ1VnPkfLVh/tHhx+hj2FubYG8CnR5CVyvEGO0D9y2DqI6MSP
-hI7V1KlOe360XY7Wi2qWU26kyYF0GWFwctj5e0ffJ7DUZpKd/yPHPtrfTdt7lJFadWjzme/g
-bwjnvSDaPFHl18/uYz31TEa+kgVu+P6pSOyHDL9tJBWfmeBmdvThg6+wKj/5kcbmneVS9LEV
-mZF6Cu2QS/+En5Hw0/ZJikCOcD1vs8z4GHKclg1ZvTqrFPwULB7qbcJPPuNrdvhrRgfv9H6i
-jCp1x8A2EslfWAwpT5vFtQd5fmJYPs05S6kK+2lgUSKwiKXVlQFYnc1eOQEuh+CmVU03eU7K
-T3yCl/YexaplP9M+5G9ceyd8G59j83Ht7dEzssAQ1dmspN1nYyNDMmTIoLFjCdrNrxrFBZAh
-vzKBxPAjuqKZVaeOQ8ZlOzXZzAxX7ygOwrxDenfzlfwrXM9lb8LJe7DoEZK8RqLPro0vbYWT
-1Si4r9ytEHLYupQqyFEdflZBjvLaY8F46aM6yTa+T8/PyUAljmPzw1M5VmHgIfmkvcE6r50E
-YpGVxyTHjubYjLIzGtVbzVfbAcMqWFtOdBupriGtzY20ORc38Z22o9lj1Zgtj14qgXRF+G/5
-hOWjvqqUnJNWc4NDHqzHIqo3Z9m7r1T0IBm9ScLoJBGjpATam/4wvD2mau4ejGaj5E+CYIIx
-4jWI2NuMSNhs9daTO5f0Bik3mWgBGFZKM1o+IsMvRm5xwcGq1GWg1WzgkEs4WHaRUPMyc2FV
-2WBVJs1TtfnBZ5HJdvA+glzHQNqedVvd2QB6HaS6ryHI8AAZrklTVp3XU+/TT2sHalu9XJwx
-hu31WUl7GTj47ATEONsJPitS5FYlldRIlYSoFhtv/kOVcfNoDcYNvRXPSttemk99SPJ4aofz
-a+jmLj1/pBlxD7BY8/Y27+4AyNlck31aPZFH+69f1jOJ8rDNZq2UxlaK6Emk1crIjT6Ml4Wx
-0WLYRwnNmf3CVS/1Vjw3uWR2+p4JOdKRY6dGN0npXXznunYJ/oUMtveb5UO34OVpvjkAi3ao
-EqkXsuRQBd9Tql5gdVBtrnlZeloCnRRQ/DJ9+Kie+e/q5UWwD9sJozBMKogm8+lZ8hnudJRe
-HfyDx3FV80zo2PrPQLB4gnUGYx+heI5vWFI0VcjdyZm7yaUPYKcnsJFLf+ZVWxXPr8gRi5aS
-qXZ6Dv63UUta8DCmxHNsHaA9hymoJ+K23/t5IZpdMyYO4JEPa867VYOIDy+s8u0X/KWtjL0t
-DxLlHlJV2BTau3uf1nXn0x60N7Qeo7ywiIQnMWnVEyzSgUUWZMiBDLnRhw/R5nd1+9dcaU+4
-rtKTM5pPb8+rsmh/i9PaA9DTuaPZCRa5PmCfj7QK8vde9Ic1DykDRzausJFrYdVDfqi1hWXx
-RlYBzN7f5FTUyIJmssFLq9rto6re4bQfQvsPuPoaHuecnuxkFC+OqwpEUs2Uvos1PtNs9o9g
-8FJzFR2kjs0ZZh82Mz8zqOXA0n01v/yJnvCU0Hv36Johmg1vnUEziLNgn96q4u4g2Vd5/Rxc
-kY12zNozOhf+2KrNPbgI627qqWxC+BsbP285/2fNLI/Gt3HocyK0mBzE0nNFVn7OKURt1c4z
-2reKohHaR9sb72RV1pMR2xIoQ82oN7A/VOU7B9Zkb3dz4rNyqC7HRWzE1qVcBOVr9DIQmWyG
-4lvksLmXv0DE4YoY8rRn8XRHOeOg3vR6g0suVda4DdvsOfs71enOBR62r3haZEgGHr8ryefR
-3k7fOOs9THquGh6252p+7pBH7/LParaKPYW0dTuenBNbe5BGaI9xW9Nvnuy4Vm8bN9NxZNXK
-4RPIcE3P+Yug7SJaHxIDv23zudMphiZUpp5ffiJSFa5La//5QK35sZkZ+Wk/N0dWOOKltQZW
-6ek5PX+vauEhWqMbXZw4iT4OSIYMWrmymx4c4g42x+MevHipHLSgap0m1A4cqeCEzVO23RZc
-zvimWRrmZcvT13KgWxodFEa7edFyNuTwwupt5k4CoR8CDl/ct8olbGVsTM6KpzmbO7SvfVZn
-Kzjs1tsjm1dRDCxKqI54pGu19bMr37Y9MMw+C2I1lglV0NzEELeq6v3cJkO7AiZWu/qsdJIF
-XNLSWmJwstnqP7DQd8rUXfe6VkzHAYckquz9HyzapBU8Vv28IHcpimWXVD33L7IRH6KnzWlP
-hX3aTgu2L8RPPFo4GchbRgxPyQ7v8vMVIs858LF3P6fkx21dShKwsJmPpol3epfzizgaXVWH
-DvLXnciwGTZvAoctXLkXXZzSjJnS2Ehp2F9cDPQEiwywIhfsKKR51f8nwzu3Bmdateka9Lky
-2vw/GbJpbc55cDC/bTNmXmle2VONFqKhubjwMjH9TimfuQ0L26ZqRIVVE+oqd3rE8Y6fbZ+B
-eJrZ7gUnkooT9q6vFDLYjIMqetoYpArjVbiz1TQpSvt5tAbIZu1chX136fkz5HjP/xHIYRWg
-bCcCy0KSI0d65PDWaipb0b4fLpwGg5taj1QW5pXQPge2K0lq7cRgo+loxLBv6D8UTrwGg4d/
-Zg5dRpazcOUkbDqpGW9ZtBL1qmYx2WyVz6DxQqsOYsCY+Ko0vxut/V5d5stRFH6WUr0yu9Md
-zZgth50Wk2cwbtrO4r5YrdlGBST8vbLrodsYGZoiQ0P6Xws0K3B32z0oB3LYmqSkzk09bTLr
-eKEnFlbN3HaTSgYv09G2vTHydVbS1jra30bbh8T0ylrvaTulOHrGlFmrUHJr/x6T4S3tPaf9
-B24L2vhLO81aBe7jYGOVUY5z19PyoWk0G/aRZti90wp6e5qVAL9k83htJwSbyZTXWQMO67jS
-qrLvQ9tnkeGOZjCXBIsCWgWUDDRsrUteRdj3Wi1dV3NWbWXqZe1h3pQ716X9SuijCL/n1Nqs
-m8qJbQXDJ80Zj8YVCRVhDmg1fzbJsBIZVqLltbS7RVhUQNZyWrv1Tm+dc6iafVpiqFX5t2pD
-5eGaVZpoxh3/h9790f//wL+Z5gueFEcLwr7syJAWWW2Fjc3bf6tRU3ykTvFnRytv/IStSi3o
-rNBKzDKaYbYLTE6In8WVtXzkTh7aoyMu/uKnVo6Vlm3eV90ef83ZvMhh9ZfOIofNWbzE3W6A
-4l1V5ElGhhANVD9qbZjl+6mU5+6CvRvp40psYwn9XQIvVoD/BuTZK0uzukJ5scKseEebQxUP
-r/lL+8nYrA/bzaoRWrP9tzpw185amXoBOS64TcDGdocviZx5NMv+LVhEuF9lJXEdq+V+Sjt0
-eCFDFtq1ubM+zgLwWIwmbabbFlo5ojdIeUEyu54t/8K/JdI6NfPmHzTzoyF/9VeNlgDtidZd
-dXyuopfrbj28gcUVm5lps6hsR5/v/P8aXt5FjrMwxWLof8iyEr0sQpYFsMje/C+h7XUce7j6
-DAy/o/k2WbCItHpCkUaePFJepC69ao1P7kJbvTizN5h0/1Mlvzm9rYp8RdSL51jCW60Bfa9Y
-HgPtxcdvWxW9VPTbdiPIqPq888BjIe3bLLstHPZG7ypyPEG+j/TGQzu4xNOuKUVV9cPmUT9R
-XV7bmcAq4/cBva4crcGkrryezZR9oHULcUH0i1bMWRyNA9aeil9r+etvGbyduWhvHv1frBXD
-hbQT22nlOblVzcD2nbBdWNLJc3xBH2/Q/RP4EAgGAW5/7jyAtntpfvFVOGurYu9plmpWMEvs
-2O4fNgfVkT5Ow4td3HMdulhMH+fQxgzNaPNFjoLOcjDYjDyH+P0K+nis5+y2hi+xntfklN+2
-WY5P3X/AobdqxdxwB3F2f46uyNBaO8HdwY5sNaI9jXijp5BhxNEH/HRROY3NukznLNNuBJmd
-mfgMm+U3m3YX/X9e+Gres63Kfefayslk6COOdlCxOoq28rUNbfSkvwPBYgjtDtTegVex12vg
-FKAZj4U1vzlEK3Nt5fozvPj1P7FjMzIsly5MBm/tXTgTDc4HA9tRY5vyHHvjbMyyXS9S4DHt
-OYnp4zM+MxjMbbeMQFXTMzkMjz6aA38TH3oH3gTpnaCxO4WeM0W477QDhe0Mkoh+pnTWI8dS
-YZEJXWRFL7bPqQ8y+MLNvFrpfxFf8kDre9NoZa8n+vDWu7V3xI9nWjHeTdVHbqGLm39kuO62
-4ue6aL+s6kM9x8pDtK7xC1g8FRYJhMUW/rKK9s1G59HWHPmLfMhQEF0V0Fxzy1xvg9MLzg13
-bV1pLO1HYrMXy+qt9n18ha3kv4lernNcxV7Mj1/Hl/3Wh+1TkUNYfJDfDFXeH1dVWGx26Vb6
-uBoMlnDWQtlofnRUEIwK6Y23rbC/qDpVXtpPJlKrtV2utH3BXyvaNqG/Nte+B7ro9f/6ehfo
-Oq/svu+7L+ACIAgSBAgCIAm+REqUSIoipdFzpPF4JjOZpCtps5J46mbFnTp2E686XV1dnZWk
-SdrGnthx0zh24nrFjZ2kbeLOylpJPeOZ0Yzm1RlJI1GkREqkSPElPgACBEA8iMe9uPd+/f9/
-53z3XoCSpfURJEjcs7+999lnn/34b2zWGcnoHTrYnXn/KSq5x+kF7tObuMNlUjezCzrHXqX3
-ZIxpqr8nvfwd5llaJ45JRo+DSmLkxVfoV9jNXLm70qcGVajL4s605P2heP5++l9qvV8GXcEy
-OUdPxC+Ig/+5+OAqmedFr+veA05GLZ3DwwjnmPtS/jDS8M+0R/+J/uVvioZ/rvVdkftV0fVN
-bhE7pWUDyTid1gWdqVW05Cl6YGy7zzPr9cta/2/p+TJ2/Hz6c3TSX6eP5gl6jBYkhVWdpqn0
-olNS66ND/Kt6x/9DnxhsxSHtkcPw4/ckdVcF+270A251Q/q0Prp285LHEDfFabqz7dv8Naaq
-XJC9Oi9enJduXGDKzBf1xl+QrbJX8Ih+ert+Lpf4PlgQhT16v210y/9fouN3xQ9Pt/nftO5v
-av3f0fP7IAoc0L9xtndEHN4mLe8WR10l7R6Pe8j6T2udv0IfyHnx4L30b7Nfz9Mb8ovSmS8y
-49C9OvYKlulHXGPCWqc0aAvzI/9QNDjLbvy3XxMv/qHW/keiwdXJ/0I0/Vuq+zwhyxnfTeQn
-1+ivnGcK4KdlKzxh5pe17v+o9X9FX39Vz98Xb4w19V+DcjCl82yO/r+AfOgerE76mr+vz/1/
-9N3fZdLvQ0x0+fvi8v+s9X9NX39bsvmXzAV2t8MAEYdrosF7fZPke4BohjHfLjFZxTT8qvTh
-K6LhH4gu49L9kqTofq7Pi29PigbHQZ07mdWvAZPYdnMn84d/XZzyTOa/q7X/nvTyK/r6T0XD
-73Mn2AmakG3tTdGwKho2y2YeFI9fElf/kngeaPD676a/Fvnxd0Tb36Ra3PM+Z2Qv3Em/lrob
-Y4FbUTd9hD5L/wXzFw4k/4tk8fe07v8kW/kVPb+l3/8rrfQfmIi1XTs/3LC9051zGBMNJ+nN
-ugqyxX/D+XFOcng3/bui48vixS9RXXiT/q2n9TMH6D1O4MYt6hHcP7eD2aq/I1n8r5L/VySH
-XxUffl379LdFxx/oe/9e1H9XNHj25mUQMip0kQ1IHx7Re36SSspzzHr9b/X8bfCaz4qG9/Xn
-Kzpnb9JX50yT4wqjoAlsoiPiA/HgVemb+7V+H7Tgh6UHpuEx9OGfUMH/kHxO95YNaC91icMp
-mb0V+jwn9DfXZFkvSd7nJfez2O4vgzB+QTy5rL36ob430ewh8xyR/ToDfQJVmGXl2aa79Pl7
-5G/vw054b/wDPb+itX9df/5t/d2/Fp2Oe/4Q7IIGM4ec23M/uee7uc/j0/jd52Urzuv8uoAu
-/B19/8v6+7+ps/bnRMOflya9KO/MmM7bE3eFDElCI5LaLp3VY8QHvD+sF78qHf0V9NSdBGPi
-kc+XAcmjhxo03/Lvyeqmsv6uaDio7zyrd/4zWvdnxf+/rue/1+//luTwP0hWv6wd/fOSxV/k
-7K9rj3aC0mfP3RMQ7fm9Ljq+Jq7+gdb7TcnlH+rdf0XPV/Tnf8ze9V3RyBt9Oj+K+pmq7i+L
-+nVGVLnC+QbYST/NnfQSftYvI4er0PDfMaFrSmfZguisym7mwQvo5/YwRNfs2/qU7+ix3H9H
-NPwGU9LD8xui5Z/p+/8nsd8B6U8PtbPj4sWyuFGSXrri/HCTFxelFxd0bl2QPtqGX4p9hbdE
-wxSVOp+kp69TflGfPAKjN+zUTzvat48z6v+WHvzvnB2HtE8Oig8+0/aLR3skjxH6YR1ruq69
-MSt51FIjBVzXp3ygXXQBTGLjZn9Rj891T6D6Jez2NemEUYxm08/R3+ho3GbmLia63c5qrUt6
-kx9rH/yR9sW/0qd5ho7Pjn+svfJb0hFPbLP/9XXt5x+Dr11lct5iegvcCeNw7NeajiF+Vj7u
-X9BjVJ6/wTlqn8v++ITOljk6Pl4EGW9rslM7tVs7ZVnr39C6p5nUdxT/wfcfn6O/AU+MtjYm
-2kZkr/plM13T7RqKe+QO6ukVsJZGQfl4i6rBL+j5GX3il7STrKO/hA96W7yYlc4si86EKaMH
-tDccCzPqyIzWfZ9KZ6PvHBXvj3B+/lPR8Fui4XfZozslD2d1eunkuAzu+aT26TU6Ph2XGtPf
-HJPmvkgPoWMVntB2jjvJL+hNvyT9+aJ00/3qn6SaZbt4sUe8eIQ5k7dkbc6Im9/Br3xC59Xj
-+Hn/nHvhfvbNH8bpkpaHMTVukHW+Rp64k27H18CqeRI8px/pjvq6+P+W1n9X/LhCz+uXpJd/
-WTb789LLp7U3DhKVdHT4CZ1sn5BmPa1P+IT2wFPyLU5KDx7X+odFywH5O/b/hpHHK6xY0V3y
-ru61zvaeJS/ao3WHiUx/T5/0fZ3ZP6Kv8q9Ker+gT/f++K+00n9BN1IxeZEKozGwLDeJhqo8
-DXs9Z+kbfFbnxNPSgSdFx3HZ7Efou/3X2qdfJbbj1YznMcdkLs8QX0xP0TXfS47hFUnyFWJF
-X9Bb/WVR/CXxwn6N51N8SfL4Gcnj85LCM9obRvvYTre6EYGfZ46b+ym/od87PuHYjX3d3xMd
-f8D+3UV/+Hckj59IHhfIdF6STJz7/JF27itEA533Ma7TZ0ST42ieVudpen9DevHXpYE/Jw34
-C1r109qhT2hv7Ekel5Y+S/f8HXmKnsX5fWJnz0smz8henxAdR/T1kOzVHu7wf0z/sfO793Sf
-vKYdYjyWV7VPXOP2LTTnsHba8zqdHcf7GRDn3tH6H0S9WBR/UtmL3uQTzCl2XPAp3aYcu31J
-O+klafcn9dMvEEs09vK/AYHvUXqR/7104+t6W+/Tt2QrLqRT4sUHzGBdTE3Zt8kcuIPZ0wJe
-0p/dZ/qz4tzPs0+uMWnxZ3WeWy+MI3FMvHCm0fVnqdaeJqryEv2LL4uO/yj9+Kro+Hei4w+Z
-eOlK6FHi8p5j8jbojTfT66kr3V2/8AqoCv1k96zhf6z3/bbO1v8PzMZf1F7+RfaqK6LX5Pd2
-MbP4sDRjJDmhPz0n6kLWwJ2x7gr9GhMWnwVB7N+Kjn8nLn9V9v0/Mld9E/gNZ0DmuSw63tLv
-fqBd42zn1zhpHgP77Jt65+/p3V+jT9766e7Av6IT488xT7yfWoAxZkZ/Agxe8+ID8MY+pTd4
-Se9tuTwjXXCs4lH9/gB5zG/Ku/wBuZs58F4vp+fk57wK0kgivdhKz+vXxYtviReeK/8aPeJ/
-TZ/+82D/GrWyIdvZkzwpLrhCZDDukSVpk3ttzxGBfAnd+Dq92L6THtFzUOeLfaxt2stl/Rvj
-77jjNiDC3E09F/Z71A44SnqYT/gefdneq3+V+5hR8IxtcV/0JVp1s+Th2QCHpKmPixdPMl/+
-Q+mk58W+Jppcef1tff+bsqvfoAp6H9lfn6evkkNyRdkdUXFRp9kZ7ZhXqW1y9MM3hKP0ZP9Q
-Z+trouMMCPhfJBbtGeu1aL+dU/IM5SOypCelLU8zdfyq1nfO43U9P9T3vitb/rKk/DLIy7vp
-jXdt+xvamW/rVD+vvXpFFmxc+rkAGs+3QQPZzxt8Vzbjh7IZb2j9c1Sm/yX5Fn9enP8s8909
-KXpM/z+q3z1B9N6T14359YEe5z1+LF58T5/kHPK34MVePSNawbmKfPITqr5uSz/fl3a8Kf38
-ofTzFVH4MvhnR0XHi9rVGS9+Vjvwi9ILY3x8Qdx/UfLwTJUDzDQ/zqTxRuyD9jT2C5GO18le
-nBAtj4Go9m1Q3wbgxU/EC9utC+LFZf1uPP2xbMYr6OeWSPFJsgbfpy/9L2qPGKHxP9Ob/lm9
-8af05ic4y/ZIQw8zVz0P9qxvzy9KN14g8nYGNHKj6x3XnjhMZcAr4sUPol6cYt7nuDhxUZS4
-lsj1NC+D2DxIVYIzOd/hTPtzTBx9H6yNP0tVtvOKzjHuZL77ILWwnn7+HDUDgY4X6Y8/q085
-RebgqN7/kN7KPrpn/JQl6TVwgs6LE5clmVtMWvyWzlYjkHyN6ojj4otPhD+jt/lPmYj7IV3W
-nyEGaLykHdLNg7Jcx2Q7n6JG2cg9S2RVXoIfRmY/J17Ya3kNnIvd3KN/oNPCeC+nJI+z4oJn
-eV+VPCZkLxbTb0hjvgZCywFmS3w//SlR/AXR8J/I3/uC3vKzYIV3SQLbRcE+KmaMCLRJulkQ
-L4xL7PqrCc7XpyUX1xTYc3qYipEf6Cxzjf+P4nSXs+jmBWau3xYv5tJvUy3ijohRZj3/UG/y
-ht79HLGMz+sNPyudeFEaYEyoQ9iKh0TDETKvheQTMdv3LPiBt8jVerbzMWnVw+CfuNfBeAlv
-SPKuOLsgS3WZGua3ZTVeFWe+J0v2bf3ty5z++0TxMXocTtN19ykQAef0du4J6sHfHAHdzZ2N
-J6WtPs+eF6dekFV7nsiYc9bXZSuMK2H8k7MgVWzV05GcBeHtHhRcp4fudeatL0g3a+KF9+oO
-8eIg86ffwBK+KLv5AnGbir7XoV3hLte9oJdt4Sx7RnS4dt11NZ+UTJ6VZfkEfuhVfGKjhuwE
-o+g01UOufPMk89tUld+UhkzoXL+nfVoRHUV48V2qNI6Je09TrXJZbzcuGhal7Yk0oVcaMSrt
-PMis+S6qdp5t8mIx5mhvEak38uRhrblX72/0/F4yja5guiJ53NSvE+DN/Vj74xXJ41ui4ZvY
-zt34fT/Sp5xigvFzdLQbMWNNn1gWHwb1v2fbP6ZzzIh/z8KDFWrQXGv0Annza6BOnJA8TMeY
-+GH0wx7RZRyNeVkK156+Kx68BnrYmvaHEZP69IyCX/ldMhdPMx3Z+NxG7FhK3f29R9rgeT+9
-8v87oOE5KgKMWXBflm5Wt/4J9urzEVfjmGg4IBqMKtNL5vca2Iu3tH6oHDJyVpp+HfyGPk7/
-r1N3ZGvnCebP0nX3oWia1xslVIkMSR6btEsKVC49Cw88J3Zeu+guM1eMJflJKjU8e/xdMFZ3
-iQ99oqEgzi5rT0yIGxdlK98UD3yGfVN7449E5R8xpXavZBKqylzb8A7SPUpNjnENy0jDd8Kc
-9kdNXFqhtujTouOz0DEDjuaLOk8sk5NUE32gfeq5aI6R39QumGJytbHvfA/5sWj4DtVcXeJD
-P77WN3SmvkL+3MjBj4ujR/R2hyTxPWAKbpX13i19eFi71lgFz4uOn5Il+Qx0zImGu6LhNlHs
-k2QNLtFFs4PKoWvERJekD+OShTEA34x9Fd+UPL4OgtQO6cVeshY/pFrlBD2+1/RJM0x03011
-+g4sRkEeRp1KlZeo3Q00WCaOHD9PzeRlycNdPO8z7WObaOqkJ36aCo2r4srb3IUK4n+Zyrav
-SYMdEf6m9OK71IS54vAY+dIJeSjLqTkwKFvRo/2RTx4DL2GZfeEZQJ+TPD4n3fwM9ZofihdX
-tbOvkCs9ID4EJI7bqSeQuJLL3TCu0HhNVuwVfN5Nuj1u001mmOicvbNXqCx7THpxGNQl47I2
-ROdmaedO2ahHxAfXFL0Qafi8aPBsemPg/jSW1ry4Ik5eoRNzjD70W9LAu+CVTVJNltdp0qnz
-qksy6BENfaJhu77upu/8O0RDnNHyJ7hebJ90cwTMsh3M3kglpVUs2adEw5/S86fB+c944Sky
-17Cdj1Hje02fflOrTWv1kHV1HdEZso290oHNIFf9B2gYBe/229RUGOn8YbJ7zvouiYaiNLOf
-yttUFK6Qdf2kePDT4ADf0zMLLrGn6QTdvE6+9iH9fhjs3buyCouSx1rqiPN5WfOfaP3vYqe2
-gnLm28ofUem3V/t0P1MPz+nrdXHTmTXjx/dIO51jOyg+GMvVd+RPsT8tk8CLT4sXL+i9bWWO
-63Ek15G7Ae1fV9a5mszUXAGLwp7GZr13H4hv/y+IayNk57+jtX8E0tMBpncZl3ZRNOZBViyD
-GHuYarZF7QXXDS9Cx+dA5JuK+9TYs1eJoBqzaafo2gK+5Jy44RqinPhcBt3+h6LhZfya7diK
-P2bS4X7py0Hx4pB003V7zmGNSS+GyMQPSTKu7DsiKT0N5s0CdvNzyGOaDNLzouEpdPOyNOsK
-M3W2U2XoeLcrNBrSiw59vjM6m8mGf4PqHeMg74k26yC1m2fY6YeoN16STMyLrURaG/qbZfHC
-MQvbqXtg77iq6zPU716nZvMENusKemFM5l70Yok47w1R5FPlTfHgB2TZtkcaxsCHfhnf4mG8
-tPdArd8L7nvQi7L0IiU7dAyvZ5YaVduqP8UZMiE7eoO7ke3mMSogr0vbbultp6SR88R5nRUy
-sv1pEBEH9N7b9f7D3CC9P75F9+chspxGAXNtxYz2Tk273f1ZQ1RaLmn/zUrud7VHjCEzhT58
-BgxxT5/3/rjG/jio3+8SH/r190Xw6yogGV+mrt31yoPULr8sGr4RkfC+JTq+H9HpzoovV8ih
-G5HLkz82SR55yWOVWonj1Kfa7w90/DR7dEI03BJ9nmt0HfyQvWCZ3AWLtq7z6x5IHj2S9Tbt
-kSGtNQIG9Cvc2nxr2oW37rrRd6jkH9UnDOmn+5nnZUyqQdHgnfuwPvdxeg2mpBvmSeDLc6Lj
-KVAkb0ovb+ltJvTJruo3imwVzPK7dE30U5P6jtZ+o4mR7ZrundxafkytpqeHeQbAkD7FeP7u
-bMpLL6pk9se0/sN6jssGmI4XQCC8G73TCenlbU7iUOcyLY7PSxNXU89pWNT7OAdxTd+9gDe6
-U++9U++/i4omVxS5Di3UrY7q37gnYEB64U8w0mNNP72gv5kCxfyo1jAe9XPYqcCPwAujXNzi
-FHQmbhd5pGV9gucplsRJozRuF693Se575D/s0Znl28oYaImmxxln45m/i1eyldqKJfDKjbe9
-IMrc6XpLvLgJbtpTWusZaJmCnqciouYRqoSn9G/nQV3fpP1t/HdjoN7h/cYkk32SiRHV9kPH
-j8jy7ibrdYrOikH9m36t1CtedOgOEFAit+hPI/D5FrU0x+HHJL28T+vTjaNmGo7qeVh/3it5
-eFaGsdaK4LeXwaMf13evgi5iOoy0t1cy2EOWx7XVp6nJG8Ir+ZBO0LJ4YdS2iiQ6Jw5NiVvj
-+smAJ3QMJM8p7c0pZh8cR1b+uztY3V3ixTYQ6BtMEFzUZ1pTbumdjRN+gVzEPhDNThGL36nf
-j4g2682A/o1R0jdJjka7rEs7l0EQHUDvb+unx8WPSXDa3RMTuggm0InHkMckPUzG7w4I2Eah
-72LPTem7N0FU3Q8d7zAxJdBwivrdIbLvF/STV0WDcQhdFWeE4RJSnQFdPOyTu+DZPaG3e5Js
-7B2mMriCI+jmFL1lnqTYAzpiQW9iGQdE1Wt6f89ceE/0nAFd1dj2rhUdFF0DsvFbsG9GLZrW
-6ivsslXmiWwH3XZS/L6rte5iv1xTfhKe3BEvJpigckh/t1c0uDpjs/a40RFdbTJHp9cwaJFX
-mFLiG9Nu0TEKD85AwzYw3C/qrT9kHkE3FqcuqXaKmn7p2g7xebfe6CHQ12fEj2m9/zSdBEf0
-E9aJh8DGnNUnL6Zb6RBL0YsVau22o123pTWeJXFJMrBdeE/ff1frG/HuAreXPnDcx/XMio4q
-uFgN8cL1TPP6KeOAGt11RnKZhieHyU5PUMm/H5lNiwbjCi/p59w9mEucS3edhDk0iW0elaUf
-xT5eRAYBy944/oGGzdKyzdhbdyt7txufdguIi37HaTLzto0PMSdlSl+9L9xXN8WEiFHRu11v
-3ycawnyBsv60FQsyQ4/9KDMX3K1/lQz5Zq29iaoB14te19q39HUKnS5F3M2qOLMoimclk2nO
-B7+vbYJ15AA02U757+wluvd8VTTUmCyTyDdZpbbBp8AIHaJTdOEZR9/9BZtFTze66MqU2/Se
-dyfO9y6C1tYheSQ62augmw8gWa8zi2xG+Oq9MwN9XmWbeNbH3q5GTrrSpAd5eNLNgv71nP71
-HG+1RW+wiRrRSVE8SZ9hF3KYpS6uB4z5hjS8yMm6AtL7ZiYZ+Xy4h5QHeGY5dfy1X/9ma+K+
-XO+rwIt8Yh3vFVUD+u5QfAYjXf5Uz9D0baELekzDNHT0cAa6B92Wr4Dt8XdmsV+eptEH7kDA
-ydsGHffYR/3Spi30npv2BIzdFL5uYe2w/gD/apH924l9nObm1InNnkIe/rsu/buy3qZIFZMr
-iHrY/4v8dD/zVJf0ifeZUjAEty2z+9jtLUihgW4Gmbgud7P+dguPebAAD0par5C4ymkKOsog
-702zr/viLuvRLivRuWz+9rFXwpv4Cesv6OscOjHA3I05aPVbBKtnbPWc/qVt8SY8jgUwxnv1
-r7vFhzLVRdO8fy8cnmPqyIB+ehteRZJ4goVnSKTQYEla/7ZRxRI0bJCe5Cm8AZ+Cm9BuTwu4
-r9VXdBK516gE/73+Ih7YVs4382OeSTZlaJpDT7awSqjD2gIHiqKhC2os6/u8RR/cCu/dz9cZ
-zv7NvM0MnO4EMdO8WJP3ncP22He7j1z6kMl9/cv74toCSNXdaL816z7WZjt3oVT0FOBFObFk
-jAPay84P+tGH/7AY6Zrh3tHNM02HUYHqz0Wdhu7z8Y2kxJr30f1gC+5r/UXqM8vIy59obTNK
-sifHJqBtDjKhuCfpBHvf3dyb8J+W8cQs4d4o4R7Wn9Aq4/rUO0xOcP94Q7dke7/36awvoPPL
-2AHra5npLUto0Sb2TaBhBEzvhs6aHD1fO8SJrdyXN4mqHnZdjV3sk6EbPbyHtS1zF/wQTNyS
-niL4o+NpLZ0G9X4ZriTs/1V2nW1qR7IKLbZrW8HxXkl3gYbbkEXOJfuYGN0JykC4t3dTR29b
-Wk/L0LGERgWLf5u50J06FUrE9C4zf69BH577je4zD8H7pcrZUMb3qTDroRddXJYMHDta0alQ
-0QnlLoYkeUi6uRc6zI9ubmlF9m0n9nmJ06YLa3NLb3WN9Ysgh7r25iK34zXR4aos1+GsMt88
-z9nQoqMHC7MCH1yj75o0R/EeAWmzlBxiPkUPkbXAjx667I1mXG3yokt64C7Ekt4/0PAe1R0p
-PeTXQBZfASlhRb+vs2dqoJt24IFU0HrvzWHRYUSGh/R3j1Blkk+MG3dQK48xD2AT+tGFXLrQ
-j2rcabPgVZeoT3yfHpIkcUTznPjwvta+BpL1SjoHpnUVPAzv4ELkSRc7bwX7vgteeH6sO+Hc
-N9ApWrrpx9tFPVCv/jfSdzdIK2vop6eqdIAS6uk2l4j7p+k7zACo0Mt+RXv0NlVqS6LBvFiD
-Fz4lO9GwNc469+7vIMZbFx3uxSwmjr+7B+5hrbxXu3VEdAxARw92zGjGdTy5EtNdppiw47rw
-evqu3vVcREW4RN/VYuoJRHOiaUU0uF45Zf6xvdqUM7OL3n1PeAlTf7w3Dmol95E/QgeWOwTd
-LWnMg+5ox0ogpKbcFvLMrrpDzL8Wp92sMPHmvNY3lt8NfZ1KPYWuktqm10BKsReWMG+qCHc9
-ccjzlvJ6b+tkZ/IovbqbQJU5JD4E3egm2tetvy+Jhhx+WAF0DNsn4wJ/AA9Mw319dYf9PLgP
-d0THPfFlOfKiEXkRztwknpg5ZsmP6rP3apWDzLd3B+8W7dd+0dDPvIp+/cteqCjDC39CqNCs
-610rWs8ycKR7DvSSi7IUnn90W793F+8imvHRdJTFgz691xBRTfenev1+clQPSysP6BlLtkHH
-Nv39ZulFF/woiafh3LzHflySffD7G0HFaAeT4o1rcNzVPUM/85L45F3iG0balInnFrom3Niv
-XclO/c79b6F/2qg9zl16ouyg+LQV1J0t2I0yNFi71vSJjiJO0dUfaDgvGs6DxDGpPTIlWU3r
-17l0PsqkIk6soRtBSwtoe4HqwCF9/hi1aVvFgwFocEZ9P52KA4lncg9EXnRDRYF3WaUrdBU0
-9cta6Tx95DPQclHPVbBpjfl+X3/rOnafKKYjZbfk0HJ7D44adTBzJ8hjK7OoHqVfdIgO1r2S
-Udiv3UwTMTfMyzV90oK4PMmckgWt79zxNIi4Z/XdCyDOT4uOOeiYg44alqOOZBpEF3rFj236
-zFAh2ItOHKGqYCQ5pu8+qucQk5kG6LIeQEfLoroIL/xuU6DjLOj977H+aWnCW2QKx5mIFNAP
-PEllWfyoRLtRRyrWrh72aVF86IKGw1rnGHVZw3pGk6PQ4T73Qcmlnz7vPtHQyS5PpJvORa2A
-0HNe65wW/9/Qam/ou2+BkDLJXrmhv5sk+lph0o9pyGH5fAN1V09eNHRIFt3Mm3pC8jCS0gmw
-H0bAgHiYXsWtosFTxLqhwtptL2qaPpYVvfNiekarvC46Xo8oLWfED+vpNbJV96Qx9+M+WdVP
-Ot5Vwc/uFy22V/s4N3ro3n2SmU8jyUmdIEZAcC3OAfFmFByfLfg83uEV/Lo0zmUzetJcekor
-mQ9vaP1Aw23pxe30Nn2bM6J0gb5F9wIV8bkq8m9qdPbYZvrsckXDCWgYFQ2uDtsrHRmTPHYy
-wWyA3FWfNMkztTydNC/foiEaVtN3QOyZTV+l8mhCv3eV3C2qgD4UJyZFx7z44a7FRuq4hD2D
-VdFQTY0Bs4dery66VU8wo21EdIxJP/eBk3JIv98tKgaZO+ypJps5U12fH6aUVcFhOUXF0VT6
-I9HwutY+LW24oOcak6ru6G+n8TTq4kcBL8kTMDw1ry7/Jqd39dmxGcwJI1tZFk8wK8w0uE5s
-F4hGfaLRU00a9H2U6AD8ED9iCZ34idZ5lcq4cenmbSoLLusxFTPkEOfBTk+IhK7QSeO7j33+
-3Zxh3XpvY69aL4dBSjlKNdKY9o67vC2PQWZAOTq+hhfvM93zSapNOt6IyD2nta7rby7pMTKX
-52XM4fm5S86n8AJ3g24imVXdPzxNuIhfdURrHKcybSQJuM1jyGMfFceBjh6mDfbiiy8wb8A5
-9DXpoemYpzrvtNZ8R3RcAKHMujkubbmDxbDH40rsBrQsSrscezMKWF4rGfmuL9qKUT1j1OwF
-vdhDd/MoaFeBjgL3JM/mzIuOenqNvWrUnhnRMiXbZbwcoym5ftG43rf0Xfe9T+pf2XqZljlO
-oRCp8R2ok5z+YenF4yB9jaEXj0saj1ERNKY/eb6ckSHCaVIgvuIcTCOdwL9clFw8Pc+2O9Bg
-1LzLoBndiNrh6ue7TAaY54xd4nQrxDvxCPPxBpgdaFmc0Kphdt4+6cZe0WGM8R2iY1B0bMYT
-zjOxLeVcvy29vyIaXHfzLthFtyWjm6A6XYEfRrq6o1+n2S139e/nJJ1lTjb7nwXOqD3SicNU
-YgV7dRJ+7EFHbbcOgloyKG70cW+0v1VnZmuN6eMZL97VCu/Aj3Fs1kXs1jjT7W5iQy2Ve0wL
-vx954dOgL55lRsI4IoqMXHMCzJrd0pOAgHYI9JYhUWOJ9HE3ySUd+J2z3MFWUyPEWDfOIRfX
-hk1JLyaZWX9Nz03OtGl8nmk6BewRL6aO7DpiPsg9zOdIX8Sp2S5eDLNXjlAxN4KfsQvtDJ5f
-MekhluhI9QT3MNdBLYHodFZv+m70+S6LlkDDlCR1F0Q4TwaYpxN/Fs+gk+iIbUZRe6Rb/N/C
-WXZS/MjO9sPUEI6KM8Oibgj7WUps/R2DdHTOtSaN5rTJsxF5LdRm3ZEsJsB4HMdu2Asd17+Y
-EA3Gc5shw2cbOsK9tJNapON615NUfA+Lpp1gK/kcGQO1xIj8Q8zobHDLdtykrLOkoHtyXfsi
-0HGOSYszyOK66LgFBbeZbzNDx8Rt8H2qdBvPYok9gXUM/KguqpufoEJuKPLBqEK7seHDTPEb
-Zi5kkgwwI3KO7n7fzRrifxUa3oOGWWrxr22gwR75LDtqPHY8T2N1fDdzFt33EONZnRC/T+Br
-GW/Me2M3Nmsk0hDyq4EGz4mcJG6R6K5c09oracC6n4/3gElkMcHJ3qLBvSMr+m5NdBbEi83c
-lR2zKGpN+xee2zcYZ2wGGoL9HuU24Cl2Rfp5thLPcWRsAr1IU/cLeZLP++L2B+AY2d+cpDZp
-Ehs+gU7c07PIDdq593tEIbYyocT9Ql2gWj5OvfUgsy8PU/M8InnsAEdmq2joxjvbgm4uxUzK
-OGdJQA70PrlArdw96LgBF4JuTrJLJsSPOyBQ+jzxWbKJ8yzzc3rwMayfj4PgOUQF+n7JYad+
-v13/G521xI2yj/ltjqNMET9ydYUrXsJ+vYQtvSfdND7HnTY6bmO55vDapyIvlvF1dsoCHZTW
-PUaF9VY9A/jhgRejVNkON3nhDvh+MBKWybA5fpGXbhgrp8I9/SL35Dn8zQ+5F03IXoxztt7R
-M6Nf50GSnCUm24Ov47t6B/1s1osnxPPjVFv7PjIML3ZjKQa5kXiSsGdCrTEJqJMI8m3sVtAL
-y+MC+um9ehcdvS46bmA3zI9JThKf8XXmlzvO28C/eDj6nU/oPZ9AL4bAo3uI82MIi9XPTbKf
-21ydqJhjOUVqoa4hD5/vtuML1HJ6r17RmlfBpTU/JvjfKJKLqeenztGZ6TfKdPOY3vSk3vFJ
-7MV27gCm4wC221oxSP+hJ6CGKdc9xHLuiKtG+LoYYxeebPSuPt8Tgy9KHpe5F403behUlId9
-0Bwzhyv44LabR3U6nNQan8D/HcLvOwr22Ij0Ylj/7+BmVo7yWGWGXBf2O9gs07CML/52vCe+
-B1riOHeB63g6t9mzC0QaZkTDPJFc2wrP3T1GL8KW5Fmt86xoeEqr+ow3EpoRRT29d5u40aVf
-E9GR0TCF3UwjDUt0ppwWH9yfYX/nAth8t/HDb0LDBDfnVdGQ8AnODNa5BzxK9WpfYgxvozQ/
-zdk+Ai/sV+xCM+1j9WMrKsSfHessJTexm2vEcDxNyL7naa30Dv7OJLNqr0S98G6dptfM2Ldz
-3En8aaPRdj9Ov04/vHiae5GrvoelszvwK0ZEhfHIOhPf5kJuLOzRcJ625HFftHiC80zkhf2L
-CfFiPOqE/c4gj4TchHlREy/COXZcdDyFXrhraLv2iRF3dxBH2YXNGqAb0/vDe/Q+2a4S++Mq
-cTWjRS6l7tnxncB+cJhPcSf6WuNYi7tEEGa4D5TAw6yim8Y4MwrcCb3tU6BHDnI3CjY8xFFG
-uR32U9VnT3U1Zr2mqLgxvlhNe8L3xEDH2006HFu6E/2MKU4T11iG2qlFMoPbuJvlwcg8jkwC
-arZ77E6KFvf7OaazT7SNiIatYO/2EnFYwVb4DHHcPdVaRlxdZRbxae7v89HnmtbfTeFzBeRC
-Iyn7HjAvzb4f9cKVWMVYXd0LKvezWu9pznfb8UHiXGNYb08p9iTSXqL5C/hZRc71S8R717S+
-kXCX9QRk07fZr1ORH5PcSgIvZkV50Av7N85DBGytnsR9Ec9qvWeiXB7XyvbL98c5xRkvGmQ0
-uqhYuc1M6lRrBdRXIx+f4u7s/dquo5Ogat7h7j4jiue4I5oXO8WLQ+KFOzE+QUddX/IcMtkG
-duUxYn1hXrNvy644LeD3+n7YGe1Fjnpv1+C73/ENqpyNSp3RcTf6oCHed5eo+BwZrR5yZLV0
-v7TtSESqflqf/xy0uJNrK+eau3cOiAc7sd698KJOJq4ccyMleuTPMR8koM+63/BN7YTTUUfP
-44tPQ4MR2hZi/KDMpPVVYvCPgFTtvqFOre9utiCbk3r3o/RKeAr7ZmYF95BD20SWyZlpz4K7
-BnpnPnkn0vEmPFlBR89ynsxwrn2IZ+H462ysZ5vnRByWTPYznS9JTtKJ0ZE8E3lyQusdBTty
-K3mBYWKum8mv1jjTu8kG3wClvpC8p089IxpOiQbjubqn6+14J/AZfwV0b/NiBny0OnOLF8lG
-j5GXSdPj0vynJJdnIz+exn70EUtwPNxT6UMd8ib9y272yL2YM7wqXpyPvPC81TeYaR1Qo98h
-BjonOowMHW4Bs0Q954nke7rrqLTMebKj2icnkYnpMJJ/t2iyLxzyAgfAOerhZuj8SC3q5oT4
-kNHg3ow3RIOxQ1+LdJzmjhT8Dc9FuMmJbmSyEF/rJjdjXK00NZZt6EopJc+LF8/THeJOlR5Q
-9w/pz7tF2wAUlIiU3meSnLG9csn7YDmZhkb6ujj9qnahZ2e/Kd3wfIrQN7IoeSzhbS6QJanq
-DWrRx3JuqKB3NspskMdzep6hs66sfVrW33fKv3DOIE+EMUes1beZRPvD56nzVEmTFz+JX9/U
-Sme0lvNG74NkX+E2FhCg6qkrfnrJy+TEa1e8F+Ieceern3zyNL1EeXBVD4A1kRIbdYVJnRPA
-qG8JdvMiPbgJfeJv0F/nr7nkFLQZjbie2rZ+COJqg0yz/3N+aBD/P6Eb+wSTI3N06LxAd0hC
-N9kxzv1EutnAF+lOQux6iZr7BP8/5OyMfuy1C6LBuICF5E1oSNN3OfcDDXc4SetUIpTJ5afp
-LuxmEvE6EyZYPsfXRvqUnmPkNI0k0GCGtCOMRTBAkmSO/HWe/KVREj0v+xR4YyWeU/RfOqfp
-uWQ+c+t08/tEX6Eyr07F4w7uhY30MEiJYd1neOrM8j6h3x/BH0yZVzwYY/eZXsww89520+jL
-Ja3ZQQfAT3iK+n0+0uGYguNva+k4HpZj8WvkMfuZttvQPm1onzbSk/T4ubsx0PIk/V0pdnUv
-k0dTajI6qA7MEdubALuoqHct0ctlHryu5zX4kUcv3hYNF0A0qKUB5dMRpJBP3aI1RnlPnyG2
-m147TZ/T1+fpEDHeRkM2taG97AnzKbUpXVSB2XvPU2N9XZ/2vtY8KxpORT68rucN/fmtaMcs
-D+N63mLOek06Zd0KOjbAPm2QVz8K/92pE6ZpPinJH9PXRzj36/jp/eReU2o+QyyrIL0ocoZc
-BL+gU2t26d2N61DmzxfA/chTAzHB7GhXgzTQzk681wY2ay/1BcbWWGPqwXGt4OeInkP6s3Fx
-hpl4YdpT4pI1fa5t1l2QVF1vUdY50kU3xHt63tVjJOT34/lyjanV3tepdKIh3fQ+dWzRMnFO
-Yo11vN6jetwd4ucxqr9X6R/ZSWzY/z7oZoHqwAKx+BkQXsqyGV1U4F2ir6xb63fTleAahKvc
-owMv7uJdNcghJkT0a9zVd1D3UZF+VFj3EaZDr0hnV0AN3Knvb6dWqE4FVikJedBV8jMl+jJu
-McO9B6zIS5GWy8zvDnUpjnlNgNFjzz+hNjthen2disMhrTGm7x4Aa3lZdLjHbUm/v08Pyy7q
-dBwDrOqTXTMRMsKrxJ1L1MHcogrRa5oOVyb28vUK00I7mGjr82YGzyohVuy8YSc01HjHnfgX
-psE8WOY5pPUPUJuyDK+2UntWb9JQwTsp4mfdBgm7RYOfy/r9VaoUO9FfR67mQGizToWcdpkK
-sEakwXpRlTwCL7z+QT37QH9ZouaulzqiUMdSx+4lfKb9zVAH41lGZWTg9U3PNfCigh92V/9m
-gdqEItWJzsGWufHbDjbQO+vmgagHXv8hcW0/E8xdib5EtMb3lnwSstKrZDUS3s/747r+9kqs
-Dr0siq/Iyl/X46rNcWJe5SREdttpyHGj8V1oROvvRh7GyL8vGhbEi3lwsPfobYepnQ65nCI0
-1Mg+LjDftgj69LX4/u4Kuah1PxCXr4hy46ndIgYZ7m+hTr8IDaHGwfnTBjbAWGH7Iw8OigeH
-wDGblzzuiU+uKJ0nwtyBRF2xUCfjNSPOjDPxIezPoJOmYQs0XNNzQ3RMEBfuIuZUIZNeICve
-TfSjgf8/yh51bVSgwXO3Dmn9g7KKe6liDbWFAZ1tlQqSZexOXu9YQvcuYxd6qRg2Ovcl0Gb7
-m3RMUgtqbnai3S15JERMR+N0bvPhYa11mNlf9/T7WclkJlaV36PurwwvquCP32/qRAdTe4ON
-6qWa/X0qifuZaRlk0kvF6HyTF657zUV51KPNrEDDYcn+MemEsWUfjXTsRyauIl6kas8VJz6N
-gzxy2p9F9sX70gl3K3nyQ6im3kZltfnhuSfjxCG7qd5NyOrkY91LSr/QPr2b9+ajouMo+Ijz
-+hr4cUg/uUdfg17cJw9do1erRuQjoB+VOCuMZXdWOuH5ke9R4T8guQyIT9tAGZ3mLbrxFEtk
-QAviQ455Ir6DHMReu2NpUevP6+s90TATK+xd2XyP7hXHqBvUv61xkwmxZp/nZRDKzzVpGND3
-BsFevKrf3xQ/Jqm/7OVOWwCls0hEahj/zTRUtOay5LAID9yL+hiYg3fBxdvFrPtZpOoa0VWy
-47U0+Lv5xHid5yQP88EIyOfgg7tPtotPnus+qDNmK5rlqoI8dYCeWF/Cl98tmYQ6OZ+dlsci
-E2uM//gIFe9TTLHZDjfvSScWxIVlaq2mwC21v+v7oPvku5vyOI9ODEonAg3jsS7aNfK2EF2x
-hmW76NhJjUODfmR3WGa8CDSEivt94qTr+bdwUoS81hLdjBV8tiv4T/avusDVO9vUie1MeL5G
-t4ox2Qa5hfr0LsWYw6CoGdGf9hDntc/rrsJldOIIOnGXvr/99HiM003Zjbc/w53ynigZJ3db
-ly+b0/t3MC8gyKRfOjIovRgSL4bjHJwhaqMrVO72ke9z1cQIvfEF7hfu/D0GKvZ9PXP0axur
-0fNOxvgE4xo7WuRKk3kyn5PUvdSY3XAudrueBvu5j4668+jFkHQz44VRLb0jtiCNbdTheVpZ
-h2jIJ0fwr6ta37MsFvXMSiaWxyS4yjvEiz76ae4yn2yBiPESXeAXqZnM4XO/Jf08zdQP66f3
-iLsghiINQ9SNJzEu2A8NPeJDmfrVw8zS8Cxo07GCTB4FQe2uaLgDN7dSSTyFPIwV54jDbXDI
-XS/ZSN/hrtEJ1uEZ9LOffXqZaQ/b0e4FoqkD7M7NdJduSnZRi9XJ3fgI97F6kx+m42Gtt49e
-lzvsMvfTuLqiSuVbqAd0XUGIJ6a6BxdFRxk6PAfo3bhHroGPN6S32k5UN4c2bCUfPSpaXDt7
-iJxpgTvhcenncXAXF+m2PMjEq4wXjo7Ya54hJuhawBvSjUvUKzqW57kevo91gaR/Fvsd9ulN
-0TAlqbrT1x5dCQq2kVEItXHd4MMfY+qI74XG416SPObo2d5Ln8sEqK89eKxTdMM7+jIh3bhG
-vWKF+++ZKJO3Iy+MFWub5X06QW/JMF0aOXJcIW48yhymTbr7OmdqxISE+TsnxLXH0YtpdHMM
-bt7Sp94mUtOQVroH3BgFN8SPdl68Fac/vgWK3ABdSpfo1AldOwt02Q5jqRzHHyY+1ktOyjFF
-0/CkuOUO+ZPi3OPYrMloK27Ta9NNdvIOOc8Z6gHnpZvOAVXSM8TxHCfw/IJe0bEldortkEzc
-NbRTFmiUzLknUG2mXmKb9kefaNiUHNU+OcHsnQbTLoxLegK7dZce9t30pt5itopvgBXmzISM
-8GXJ5Bwx7jXiNa9zN+5mjsIZJgt4tuiIbJaR3HeKy856eHeG3IprVQ8Rr3OsqpQ8TYyiBorF
-U6LBvDhMl5R7n27hoTjjUJM2zMUqgcvE1cPER2MyvS5e+F78Jnu1T3vVNmsYNPkpvc0ilf6u
-Dhxmyssu5pv0gzp0HMSfQhLiFFV48QR+hTulrFW36HsqU5F2G2yCSXDSnIebI/9xRrw4Rfyo
-KFkY/9l+ztaom+4TtNe6GwTfAhHjYfLSY+LHIWY4GOXGsWbHbnxHX2aO/KOcpXf0U+N4Br5N
-5MWLCrnoSbJMV6lhdSzXelFPHRd4C8xjnyVhj1xGmqP0fPlmZ16UyWiEep79kReOuZ9EL4wT
-X5VuLnGmZvt0SGtv5qZxG49mkQh+iKFfEi+MaPIOcd1Gehost3CmGXfkMviqw3ReL4gXa1SW
-mBeeebMDfJdDoiPkr42ukhM/HCdZYSrfw/jdoRdtC5Njb+LZraCVd8h2fQgd8+TQ35VM3iFW
-VJQ+dImGzcxyszy8y2bAQB+jwsXzPrfG/Phe6pn7mMD5uHhxPNqso9H/3i8aRpHHLXoyfeup
-gwB7mzyw80zXqetYbNotY+C8K4pNg+VhrNsboJePSePHuInbq+pBGs5DDpJbOEwst9S032Fi
-0Two8mNRHn36pIwXrsKaj3m/W6LmKrlz59GN6BF8DPt97zGdZlD+v/uKd4HesUJlyS5mpm5l
-wkmoHT7EnJPOaL/r8i/s892XTszpLL3LKbQFe3WLqs01amcmqKKeoHZgjlqoS9Q22N+y39cJ
-PvkH3IUCzuuM1l+KHTmluEeGmA61Tfq5hTrSx6QxR4ip1fD5jAMTUOTv0sfaw23jNvt0hVz0
-JNkd5zVuUF/iaaCepeD4t6eJdXE/vYbF3aFPcU/mLvZpjqrqEeyFKxF3iyv7qfl3L0Q+eRSf
-r8q9aC+dp+4ac8fYBPsjibxYivnoKeznPfofQo1FQszqEj08vquHicaTnGO2m2GfuhqtV/Lw
-aeZ6s73U/HsaTikJfSo18cGTjO/TAe+OYPs23W28qMT6mRlybjPUdF+nJyTMiLpID083HdeB
-F0PwYoHIiD3tUWyn0Y+GqaEOvHC9iVGIHiEXUCN2sUcycbenO+h6P5IXrkK8S/3dDRBvqpKJ
-7wPhXuIY0lXpxS2w6IeZ2bBKF8goVYp9aMVg5EUf/sVD1LUa5aROL9NeyWSU7vNp/N0yfoXP
-kEwvJsgyTZLnmafm+hqxXN8TO4ndXMfKuOd9COmuENE1sssws162caZaJn30Q+wDcSaXOJ67
-l/6ZZf3rBaab9oEUMUlEzojVoQviDp7vTOw3GNd3bnE3SmJfWZfOr02cPpPc5tw/Pkz00FWj
-HXibg5LENrCjR+gP6iLfspdcg3PbVTRpO/1/s/Tfl5t03NFqk/K6g58zSwWzLbr7EhrMwvkQ
-HGPH0Rw/8oSzAe4gIUPqyqftYCS77s9e+CC7toca+N3U1yb6WiPGN4zH7l7IWfp3O6Fjkmht
-ldrYu+T87sVK2QmklYB17ljKDbqd+0CWuEePauiGdUbFXYRlbiLOS/dRvTzMVDeftrZqdWgY
-hfL7dN32EQGaIpKZZ+r1XWYVL4sXC6JhFqQXT5NO09vMRHWfWRdW/w5xgi1omO9Ca+kAEbQi
-95F+ugu20JvUxV11h/RiBO2pIcEhfmqRT9hEdnImVnrPiI5ZrRrq2V2Xeg9vuM7dfYIdXSbm
-OaGfnKJfdAvdpytUxG2ldqYI3k64I/ZR+dZJxdd2NCfEdNzLPMDkiwW6o7uZlToTI8b3yL1W
-6YK5z+wXV5XPxLiS41sTaFJ3vOH30v0aeob7yKjk6ZDppbdgE7e0ED8YiPHOQeLsldhpfD/2
-U8+DOFRg6rUj+M7sLBDJWabDs0r1xixUeupvB7t7Gup76H51h3Lonw79pKHL1dXKPfzayw0+
-TxWe8yMDcK1CL6K7X0Pvtrt954lb5IhcL5HVWKNnzb0fztInSUbHXTqwO+hAnieu2E0nRIha
-hz49x1CKRFG66NByta47HvqQWBqltxY70Jdj7+oiXceuKcsnIQfcoPvFPTA15h3OI608tXOm
-xTUp86BtlImlVWLHpScD55IuekpL+lqmX62DbsZeqp0c+3RMvM4s+d7Yo9lFdHKJup0C8yyW
-04Rurgq9YitU3iVEmu4R6w95I8fn3Y3hn3bfaI2u/C6yXHno6IIOTwDoYk66qzhCHLiXp04E
-rIfO1xVq+0pEjT2NfDVmNEIfY4XYa8inLsCPHLH5BTL3xRitdhdsKQlZKccYO+nkcsS1mIRY
-XxnuhDhwoKNBr0BP7Fkt08dboa+3QIbM/bXOaoScQAXpJEhqMdKyQATOPduFJMwfLxL3Dlmd
-DjKPOWjpJApdgpoCXOqmIybh6QYRoIY0O0CtCP2jfvJgP9TI+zVin9gq2pLQg3g//j5EyxP+
-9RpZ2zx5gJAJbtGTp1OtyK+dSCvHE7qRQw6pTA9t6KVtfwpJyD+mZAeClNzbtAwNKd3iq5GO
-aqSlBrJKIfKlGLvbivRRFqChgGy6omy6Yv4m0JLRE/pYQyQ91Ag4m1qnOyrQsESHUIOvyzE/
-uEp+Lk3X1vGlED+hCB15JFNAW7qaTy524CZ0A5c3PJ30soZe0iQJn70SLcl96HCcvo4tqUTd
-qSK70G8YKgRyevJJ6H7Mk6PItLY76kc3skliF25C/qCMNiXIrgT14TPqaGvQhTCHvhatmvM4
-a+znNXrrarG6oNWbm5Cnz5EP7YjrdK3jRx66OqO8SvHpiF+L8R1MR9CLFP4vs3fX6GQLFsW7
-uRq5skYmuRH7UdtpyTc1JN/Ujw7WLvKU4v8doE6U2r4f8l4p3c9JEvZsRkNFfDANVfIHodqk
-Ch31yJM6FCVJqz82xycWeccifY1h5bBqBxau3Py1S98pRzoKUTvqrOLVqqy/yq8rULRGH3+Q
-UC3yZo1qhzp9uvU2vhTirg3v3Rn/D6uW6cftir8rY3m7oDdPf68zszW4XmX98H847Sp06SxD
-U+BQJepLkFStSUMu7pVSXDn8H9btbj7dnMZdoND1cAoUYoduyhut8dmrnLYrce2Vtme1SUcV
-nlXgR6jrSeJuKUYetCjopk+nq+3JvtMdedHZ5EUdHQiS8JpLbc8ynbCrbXRUo8bU2vQ0cKLY
-5ESQQXfzrcttNASulDmZy9Dun69jCdZ4z+W4Xrb20joaVqNMqrEvtkbVQ2vHFjhVOiItgY7w
-ZLxop6EDeYTu8QbWucFeXIm7NNODFVA3KlFjq6yfySLbJ2nsIw/cKMTTrdR8ghZ2tmll+LWj
-KY9SGx1hL67GvRA0sLrhz2uRjvY90mjbr2G3Ztapk1O/xBNW7WzbJ6GTvkVHDsnW43m/Fump
-sC/XWD+jI3sqTav6oEXNR+tValqwYhsNQVe64q8dUNjZtBj+L5z0gYaWvao17UVmWZfbaGvZ
-9iRJYqVPgbM/nPvl6Jt100tWAt+hp0lLGXtWimdKsME5Tqo1Ttk0XY0n/HI8ZV2N5BNmKdIR
-rHw4Zer4KXXOuBYN4WTx6dYTu/1DbW1Zvy+zXwKuQDnarmLUD58qOU7ZavN0CdVpS5xyQW+X
-4n7Odm4tnrvBB2n5ZZ3xRO3GK81o6BIN3dwjukGsCfu1wJkc9LSehtNtLXo4q5wu9aYcluiV
-btmz1aaFr0Z/KfhkmQ/U2ZRHCW3saaOhi3tVoKOI5EpNXtSbNKTRK6039WEJPmS8CJSE+0Q1
-yqQW/Y7g/3REj6OL20JntBstPnRHDSlFuxFkko97NtONBmdp0MtMFiusv8ztbgkrt54XpiGN
-upHtkVKkoSva0h6qnnvaeNGBTErs9MzrCZ5dZsdq0X6tPkDDel7Ummd9PgmVYMHbyGxGRkd3
-pGNTkxct+xX0M00fpGM1nvgr8aRbbp40wdJnO7YR90k7P4poXKHNhnZFWWzijtvFjsnO1sx+
-FaNu5JBJsB1rTY8jnLZL3LNXwA9ail7IavRPW3TkoCP4563TviueaJvAZDHebpn7dg+WLdT5
-FOFF0K5wXwm1m9V4kiw3JVNp0rAULVrLI2z3v7JzNnhb2SmyibWzr52RF/kok1y0XZkdrSPt
-tabFrkTPJztpq9GC1TboZ0ZHdr4Vmyd+ZsV7Ig098Z7bFe93xaZ+ZudKqFWsR36sRd9mpblb
-KtGKVaPdqkc6Wmds8HwyKkrR68joCDT0sIOK0V/ORzpy6+hYz49q0wtcaqNjpc07rq2TSa7J
-jY542pebVqNFR7AXpXhXyMV9kt2XQp1go40bq9E/b6cj2yMtvch4kckk3+RFZzxZgxXNeFGE
-F53rbHjSdsZmVITTvtL0xjI6qm0n7Eab0a4XLQ+sxYvODbx4UC9aJ30aaaito6HlCVYiEkiL
-htZ9KRe1IuhFZ1Mvym10dDb9vnKshSus2yMtidSad5X18lj+E+TRTkdxg150tT3dbbpZ4t/m
-N+yRpM1q1KPH8/F0tPy/tM1atO5r7XR0NmkId7RO5FWINOT4uVzkxvpdUoteaKX5rDTlUV13
-m25pZiaTfLwztt8SMg+wo7k/ipHmB+XRsqDVqBuVNjpW4426+jE3+pZmZPuk/dYY1i/Hu3N2
-X803Kch0M9PPRrx7ZNarEm/01Xg/yjzy+gO3+XxzlxTW8aP1f0f0O4vQkItxhHbL2Uhbe7VF
-RWXdU4UTG3dp8ILzbdwI50kRbrTu8BkF7VoZaAhxmhYvGmlLOzLLUYtPK65Ra0Z5MhraZZLt
-2JblyCIZpRjDaNEQEKGSDXQ0YuykFiNLWUxldV1sJW3jQ6abubZdkkU21t/dMlkU2mSRfAQN
-LV4EOjLfp9K8tzQ2WMz1utnaJdmp1orsBFkU2nZGmmb2YePT+Ag62p/aOj7k2qSb36CdgY5i
-XL3YtBDt+ph538GXziKzaZOKj6IjjfqQS9pPc/tKuSjtFhWFJhWZbDIeZPqYNG8h7V8zfjRi
-HX6IjmY++tq6f5mL3mY+nonheZCOQtt3Mz5k3m727tW2T16v9S2LHjhUf4CG3AM0ZM96vmS/
-a52eeX661vS6Ax3t62eWtOXJ1eO62U9lXveDvGjpR0tT8+tsUzsNycfQ0LKlLXln69XjPS5g
-jOU30NH6mp0JubZnIw35eDNd/9TXfWKu+ZPhHVs/lVsnk/BTuaTdhrdHZte/UctGtb9VK8Ye
-4uwtjubWcTGNa9Uf0ORcUz8abfLbGCX+aFrC2xXaaAh5B38v3K8KkZaMo2mkIaOj/cloyXhT
-f4Cz69+spcFpjDfUY06oHn8f7t3tmtaupxkN1aZWBX2treNui4bWrbHdnoXPLkYawvrOKmWZ
-nHaetLSsRUOm1Wm6no78Oq7W27JdIaqR7d2MjlwSeN6I718DGasUM1wZLYWm1m3kRcvChmfj
-+qXm02hGd4rrJNzSiXozoxbyhRW+tuippYXIzY22ox7ffa2Z4StteDo20NHO1UzDGpH6tZgr
-DJnG0DNUaaOhvoGG7Ceznd1OQ/GB9etx/UZ8m9Z/H0VDyHS26Kg2aWjpZouLG3dV650741Nq
-e4pNGtK03atsxJ20RoY10LDSfIrQETjdeoN2+5nt7nY5ZOt3tH3tWEdDI83uGJkf06Ih36Rh
-uS2XW418qqeFuNMzTco0urFO/h1tfGinp52G9pMp7PTcx9LQrhf1pu1qWZkQRWxs4MP6pyNp
-6Um2yzI7+lHavV4exTZ5FNG6TLNz0YYHOhptuljbQEejmbPN/k3rfGm0eQgtGqofoxPVSMef
-xIuNfPio3HHGi5YXm921WvJYz4t8lEewGWvR6qUbeFHiacDzjeuXk/VyeVAejbTd+j9IQ0sn
-VqPdyniRWbsM13gjHe3rP5hHz/yQzJsPXlotWvz2PbqRjkw3G228aMkjRPs7ovwf5EfjT5BH
-I21Z/hx0VDbYitU2OjK9aKzTi6RJR8s+tdPQaD6Z3Squ26OZJ5950IEf1eZezT9AR+sMaT+N
-c+tk0qIj4GBnz8fR8VEyydZfv0cyu9VuO1v6WWjTjc62d2/RkD5AR2EDHfW2W0S1jQ7vj+X4
-tOjIbGfLi82voyHdQEMaq4fC13Kb7Wy3F+tlkotZmIyGXKSjpSOVDbzIIv2BhvCs58PH8yJp
-2ycZL+wdVUB1bPGi9bRoWH+OtPQi7JG0eV5spCWjoaONjhYvPk4vWjS062nQi3yS1Zzk1u2R
-9TS0ZJPGaqr1vMhoyO7D9Q16UXmAF4GWatvdJNx+k6bNyDKED9KR1d0EvSklrTxD65bZ4kU1
-0tGSjWtzWjKqxHO/3uRFLmnPlJaaMml9DbU3rdqfUuTbn+TBr7WtH2jI6Mg1ach48eCZ2s6P
-TE/D09l80ujvBqvXfl9r50VlAx9W2vjRzou0jY71vAhrda7jRTsdSZLxY31s/aN4sZ6O1bh/
-Kxv0ImlGqVpnSft6mT5kcmnxIvhnWZzF/7XfIirNNTN5JJGOYNszmWR7JEmSB2SS2a92uXQ2
-9SW7dYWfaXFjIy9adLSqHVv1e7W2qECStHzwjXRs1I/OpCWrUtu9MPO/H5TJRjqCfKrNqEAW
-Kcp9LC820pHxIfu7lkxaOvpRdFTW8SCL0LR7iq3/1kepw3//P4tmXFQ=
-"""
 
 def get_snd_beep_stream() -> BytesIO:
-    return res_func.convert_stream(_snd_beep)
+    return bundle.convert_stream("snd_beep")
 
 
 def get_snd_beep_bytearray() -> bytearray:
-    return res_func.convert_bytearray(_snd_beep)
+    return bundle.convert_bytearray("snd_beep")
 
 
 def get_snd_beep() -> str:
-    return _snd_beep
+    return base64.b64encode(bundle.get_stored("snd_beep")).decode()
+
+
+def get_snd_beep_compressed() -> bytes:
+    return bundle.get_stored("snd_beep")
 
@@ -0,0 +1,154 @@
+"""ring_buffer.py
+
+直前N秒のキャプチャー（プリイベントバッファ）
+
+* バックグラウンドで低頻度に画面を取得し、zlib圧縮したフレームをメモリ上のリングバッファに保持する
+* 保持するフレームの合計サイズが上限を超えたら古いものから捨てる（メモリ使用量は上限で頭打ち）
+* 取得はPeriodicSchedulerのスレッドで行い、UIスレッドには触れない
+
+"""
+
+import logging
+import threading
+import time
+import zlib
+from collections import deque
+from collections.abc import Callable, Iterator
+from typing import NamedTuple
+
+import mss.models
+import mss.screenshot
+
+from periodic_scheduler import PeriodicScheduler
+
+logger = logging.getLogger(__name__)
+
+
+class BufferedFrame(NamedTuple):
+    timestamp: float  # キャプチャー時刻（UNIX時間）
+    area: dict  # キャプチャー領域
+    size: tuple[int, int]  # 画像サイズ(幅, 高さ)
+    data: bytes  # zlib圧縮したBGRA画素データ
+    title: str = ""  # アクティブウィンドウのタイトル（ウィンドウ以外は空文字列）
+
+
+class FrameRingBuffer:
+    """メモリ上限付きのフレームのリングバッファ"""
+
+    def __init__(self, max_bytes: int) -> None:
+        """初期処理
+
+        Args:
+            max_bytes(int): 保持するフレームの合計サイズの上限（バイト）
+
+        Returns:
+            none
+
+        """
+        self.max_bytes: int = max_bytes
+        self._frames: deque[BufferedFrame] = deque()
+        self._bytes: int = 0
+        self._lock = threading.Lock()
+        self.dropped: int = 0
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    @property
+    def bytes_used(self) -> int:
+        return self._bytes
+
+    def append(self, frame: BufferedFrame) -> None:
+        """フレームの追加（上限を超えた分は古いフレームから捨てる）"""
+        with self._lock:
+            if len(frame.data) > self.max_bytes:
+                self.dropped += 1
+                logger.warning(f"Pre-event frame ({len(frame.data)} bytes) exceeds buffer limit ({self.max_bytes} bytes)")
+                return
+
+            self._frames.append(frame)
+            self._bytes += len(frame.data)
+            while self._bytes > self.max_bytes:
+                self._bytes -= len(self._frames.popleft().data)
+                self.dropped += 1
+
+    def snapshot(self, seconds: float, now: float | None = None) -> list[BufferedFrame]:
+        """直前seconds秒以内のフレームのlistを返す（古い順）"""
+        since: float = (time.time() if now is None else now) - seconds
+        with self._lock:
+            return [frame for frame in self._frames if frame.timestamp >= since]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._frames.clear()
+            self._bytes = 0
+
+
+class PreEventRecorder:
+    """プリイベントバッファへの記録"""
+
+    # 圧縮レベル（取得間隔内に収まるよう速度優先）
+    COMPRESS_LEVEL: int = 1
+
+    def __init__(self, grab: Callable[[int], tuple[mss.screenshot.ScreenShot | None, tuple[str, dict] | None]]) -> None:
+        """初期処理
+
+        Args:
+            grab: 画面の取得処理（引数はキャプチャー対象、戻り値は画像とアクティブウィンドウの(タイトル, 領域)）
+
+        Returns:
+            none
+
+        """
+        self._grab = grab
+        self.buffer = FrameRingBuffer(0)
+        self._scheduler = PeriodicScheduler(self._tick, name="prebuffer")
+        self.moni_no: int = 0
+
+    @property
+    def running(self) -> bool:
+        return self._scheduler.running
+
+    def start(self, moni_no: int, interval_ms: int, max_bytes: int) -> None:
+        """記録の開始（記録中なら設定を変えて再開する）
+
+        Args:
+            moni_no(int): キャプチャー対象
+            interval_ms(int): 取得間隔（ミリ秒）
+            max_bytes(int): バッファの上限（バイト）
+
+        Returns:
+            none
+
+        """
+        self._scheduler.stop()
+        self.moni_no = moni_no
+        self.buffer.max_bytes = max_bytes
+        self.buffer.clear()
+        self._scheduler.start(interval_ms)
+        logger.info(f"Pre-event buffer started (target={moni_no}, interval={interval_ms}ms, limit={max_bytes} bytes)")
+
+    def stop(self) -> None:
+        self._scheduler.stop()
+        self.buffer.clear()
+
+    def _tick(self) -> None:
+        sct_img, window = self._grab(self.moni_no)
+        if sct_img is None:
+            return
+
+        timestamp: float = time.time()
+        area: dict = {"left": sct_img.left, "top": sct_img.top, "width": sct_img.width, "height": sct_img.height}
+        data: bytes = zlib.compress(sct_img.raw, PreEventRecorder.COMPRESS_LEVEL)
+        self.buffer.append(BufferedFrame(timestamp, area, tuple(sct_img.size), data, window[0] if window else ""))
+
+    def frames(self, seconds: float) -> Iterator[tuple[mss.screenshot.ScreenShot, str, float]]:
+        """直前seconds秒のフレーム(画像, タイトル, 取得時刻)を古い順に展開する（1フレームずつ展開するので省メモリ）"""
+        for frame in self.buffer.snapshot(seconds):
+            width, height = frame.size
+            sct_img = mss.screenshot.ScreenShot(
+                bytearray(zlib.decompress(frame.data)),
+                frame.area,
+                size=mss.models.Size(width, height),
+            )
+            yield sct_img, frame.title, frame.timestamp
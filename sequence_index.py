@@ -0,0 +1,138 @@
+import logging
+import os
+import re
+import threading
+from bisect import bisect_left, insort
+from pathlib import Path
+
+from capture_filename import sequence_filename
+
+logger = logging.getLogger(__name__)
+
+
+class SequenceIndex:
+    """保存フォルダ毎のシーケンス番号インデックス
+
+    * フォルダ内の「接頭語＋シーケンス番号」ファイルの番号をソート済みlistで保持する
+    * 初回のみフォルダを走査し、以降は確保（書き込み予定）した番号を追加していく
+    * フォルダの更新日時が変わっていたら作り直す（確保済みの番号の書き込み中は自身の書き込みとみなし、作り直さない）
+    * 書き込み完了前の確保済み番号は、作り直しても失われない
+    * 確保時に番号のファイルの有無を確認する（更新日時の取り込みで見逃した外部の追加を上書きしない）
+    """
+
+    def __init__(self, folder: Path, prefix: str, digits: int, suffix: str = ".png") -> None:
+        """初期処理
+
+        Args:
+            folder(pathlib.Path): 保存フォルダ
+            prefix(str): 接頭語
+            digits(int): シーケンス番号の桁数
+            suffix(str): 拡張子
+
+        Returns:
+            none
+
+        """
+        self.folder = folder
+        self._prefix: str = prefix
+        self._digits: int = digits
+        self._suffix: str = suffix
+        self._pattern = re.compile(rf"{re.escape(prefix)}(\d{{{digits}}}){re.escape(suffix)}")
+        self._numbers: list[int] = []
+        self._reserved: set[int] = set()
+        self._mtime_ns: int = -1
+        self._lock = threading.Lock()
+        # フォルダを走査した回数
+        self.rebuilds: int = 0
+
+    def _folder_mtime(self) -> int:
+        try:
+            return self.folder.stat().st_mtime_ns
+        except OSError:
+            return -1
+
+    def _rebuild(self) -> None:
+        """フォルダを走査してインデックスを作り直す"""
+        mtime_ns: int = self._folder_mtime()
+        numbers: set[int] = self._reserved.copy()
+        try:
+            with os.scandir(self.folder) as entries:
+                for entry in entries:
+                    if (m := self._pattern.fullmatch(entry.name)) is not None:
+                        numbers.add(int(m.group(1)))
+        except OSError as e:
+            logger.warning(f"Scan '{self.folder}' failed ({e})")
+
+        self._numbers = sorted(numbers)
+        self._mtime_ns = mtime_ns
+        self.rebuilds += 1
+        logger.debug(f"Sequence index of '{self.folder}' rebuilt ({len(numbers)} files)")
+
+    def _refresh(self) -> None:
+        if (mtime_ns := self._folder_mtime()) == self._mtime_ns:
+            return
+        if self._reserved and self._mtime_ns != -1:
+            # 書き込み中の番号があれば自身の書き込みによる変更とみなす（外部の追加はreserveでのファイルの有無の確認で防ぐ）
+            self._mtime_ns = mtime_ns
+            return
+        self._rebuild()
+
+    def complete(self, number: int) -> None:
+        """確保した番号の書き込み完了（または中止）を通知し、フォルダの更新日時を取り込む
+
+        * 走査後から完了までの外部の変更も取り込まれるが、番号の衝突はreserveでのファイルの有無の確認で防ぐ
+
+        """
+        with self._lock:
+            self._reserved.discard(number)
+            self._mtime_ns = self._folder_mtime()
+
+    def cancel(self, number: int) -> None:
+        """確保した番号を書き込まずに返却する"""
+        with self._lock:
+            self._reserved.discard(number)
+            if (pos := bisect_left(self._numbers, number)) < len(self._numbers) and self._numbers[pos] == number:
+                del self._numbers[pos]
+
+    def invalidate(self) -> None:
+        """次回参照時にフォルダを再走査させる"""
+        with self._lock:
+            self._mtime_ns = -1
+
+    def next_free(self, begin: int) -> int:
+        """begin以上で未使用の最小のシーケンス番号を返す（O(log n)）"""
+        with self._lock:
+            self._refresh()
+            return self._next_free(begin)
+
+    def _next_free(self, begin: int) -> int:
+        numbers: list[int] = self._numbers
+        pos: int = bisect_left(numbers, begin)
+        if pos == len(numbers) or numbers[pos] != begin:
+            return begin
+
+        # numbers[pos:]が連番の間は numbers[i] - i が一定なので、それが崩れる最初の位置を二分探索する
+        base: int = begin - pos
+        lo: int = pos
+        hi: int = len(numbers)
+        while lo < hi:
+            mid: int = (lo + hi) // 2
+            if numbers[mid] - mid > base:
+                hi = mid
+            else:
+                lo = mid + 1
+
+        return base + lo
+
+    def reserve(self, begin: int) -> int:
+        """begin以上で未使用の最小のシーケンス番号を確保して返す（ファイルが既にある番号は使用済みとして飛ばす）"""
+        with self._lock:
+            self._refresh()
+            while True:
+                number: int = self._next_free(begin)
+                insort(self._numbers, number)
+                if not (self.folder / sequence_filename(self._prefix, number, self._digits, self._suffix)).exists():
+                    break
+                logger.debug(f"Sequence number {number} in '{self.folder}' is already used")
+            self._reserved.add(number)
+            return number
@@ -0,0 +1,264 @@
+"""tile_recorder.py
+
+定期実行キャプチャーの差分（タイル）記録
+
+* 画面をタイルに分割し、前回フレームから変化したタイルだけをコンテナファイルへ追記する
+* Nフレーム毎（または画面サイズ変更時）に全画面のキーフレームを記録する
+* ファイル構成（数値はリトルエンディアン）
+    * ヘッダー: MAGIC(8) + タイルサイズ(uint16)
+    * フレーム: 種別(uint8) + 時刻(float64, UNIX時間) + 幅(uint32) + 高さ(uint32) + データ長(uint32) + データ
+        * キーフレーム: zlib圧縮したBGRA画素データ
+        * 差分フレーム: タイル数(uint32) + タイル番号(uint32 * タイル数) + zlib圧縮した各タイルの画素データ
+
+"""
+
+import logging
+import struct
+import threading
+import time
+import zlib
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+MAGIC: bytes = b"PYSSTIL1"
+HEADER = struct.Struct("<8sH")
+FRAME = struct.Struct("<BdIII")
+COUNT = struct.Struct("<I")
+# フレーム種別
+FRAME_KEY: int = 0
+FRAME_DELTA: int = 1
+
+
+def _tile_rows(width: int, height: int, tile_size: int, tile_no: int) -> Iterator[slice]:
+    """タイル内の各行のバイト範囲を返す"""
+    stride: int = width * 4
+    tiles_x: int = -(-width // tile_size)
+    tx, ty = tile_no % tiles_x, tile_no // tiles_x
+    x0: int = tx * tile_size * 4
+    x1: int = min(width, (tx + 1) * tile_size) * 4
+    for y in range(ty * tile_size, min(height, (ty + 1) * tile_size)):
+        yield slice(y * stride + x0, y * stride + x1)
+
+
+def changed_tiles(previous: bytes | bytearray, current: memoryview, width: int, height: int, tile_size: int) -> list[int]:
+    """前回フレームから変化したタイル番号のlistを返す
+
+    * まずタイル1段分（連続したメモリ）を比較し、変化のあった段だけ行毎→タイル毎に比較する
+    * 比較はstartswith(memcmp)で行い、画素データのコピーを作らない
+    """
+    stride: int = width * 4
+    tile_bytes: int = tile_size * 4
+    tiles_x: int = -(-width // tile_size)
+    tiles_y: int = -(-height // tile_size)
+    changed: list[int] = []
+    for ty in range(tiles_y):
+        band_start: int = ty * tile_size * stride
+        band_end: int = min(height, (ty + 1) * tile_size) * stride
+        if previous.startswith(current[band_start:band_end], band_start):
+            continue
+        band_tiles: set[int] = set()
+        for pos in range(band_start, band_end, stride):
+            if previous.startswith(current[pos : pos + stride], pos):
+                continue
+            for tx in range(tiles_x):
+                if tx not in band_tiles:
+                    start: int = pos + tx * tile_bytes
+                    end: int = min(pos + stride, start + tile_bytes)
+                    if not previous.startswith(current[start:end], start):
+                        band_tiles.add(tx)
+            if len(band_tiles) == tiles_x:
+                break
+        changed.extend(ty * tiles_x + tx for tx in sorted(band_tiles))
+
+    return changed
+
+
+class TileRecorder:
+    """差分（タイル）記録"""
+
+    # 記録待ちフレームの上限
+    MAX_PENDING: int = 2
+    # 拡張子
+    EXTENSION: str = ".tiles"
+
+    def __init__(
+        self,
+        path: Path,
+        tile_size: int = 64,
+        keyframe_interval: int = 30,
+        on_error: Callable[[BaseException], None] | None = None,
+    ) -> None:
+        """初期処理
+
+        Args:
+            path(pathlib.Path): コンテナファイル
+            tile_size(int): タイルの大きさ（ピクセル）
+            keyframe_interval(int): キーフレームの間隔（フレーム数）
+            on_error: 記録の失敗時に1回だけ呼ばれる処理（記録スレッドで呼ばれる）
+
+        Returns:
+            none
+
+        """
+        self.path = path
+        self.tile_size: int = max(8, tile_size)
+        self.keyframe_interval: int = max(1, keyframe_interval)
+        self._file = path.open("wb")
+        self._file.write(HEADER.pack(MAGIC, self.tile_size))
+        self._previous: tuple[tuple[int, int], bytes | bytearray] | None = None
+        self._since_keyframe: int = 0
+        self.frames: int = 0
+        self.keyframes: int = 0
+        # 差分計算、圧縮、書き込みは記録順を保つため1スレッドで行う
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tile_recorder")
+        self._pending = threading.BoundedSemaphore(TileRecorder.MAX_PENDING)
+        # 記録の失敗（以降のフレームは記録しない）
+        self._on_error = on_error
+        self.error: BaseException | None = None
+        # 閉じた後に届いたフレーム（停止を待ち切れなかった定期実行の処理）は記録しない
+        self._lock = threading.Lock()
+        self.closed: bool = False
+
+    def add_frame(self, size: tuple[int, int], data: bytes | bytearray, timestamp: float | None = None) -> None:
+        """フレームの追加（記録は専用スレッドで行う、閉じた後は無視する）
+
+        Args:
+            size(tuple): 画像サイズ(幅, 高さ)
+            data: BGRA画素データ（記録が終わるまで変更しないこと）
+            timestamp(float): キャプチャー時刻（None=現在時刻）
+
+        Returns:
+            none
+
+        """
+        with self._lock:
+            if self.closed:
+                logger.debug(f"Tile recording '{self.path}' is closed, frame ignored")
+                return
+            if self.error is not None:
+                return
+
+            self._pending.acquire()
+            future = self._executor.submit(self._write_frame, size, data, time.time() if timestamp is None else timestamp)
+        future.add_done_callback(self._on_written)
+
+    def _on_written(self, future: Future) -> None:
+        """フレームの記録完了（記録スレッドから呼ばれる）、最初の失敗を記録して通知する"""
+        self._pending.release()
+        if (error := future.exception()) is None or self.error is not None:
+            return
+
+        self.error = error
+        logger.error(f"Tile recording '{self.path}' failed ({error!r})")
+        if self._on_error is not None:
+            self._on_error(error)
+
+    def _write_frame(self, size: tuple[int, int], data: bytes | bytearray, timestamp: float) -> None:
+        width, height = size
+        current = memoryview(data)
+        keyframe: bool = (
+            self._previous is None or self._previous[0] != size or self._since_keyframe >= self.keyframe_interval - 1
+        )
+        if keyframe:
+            payload: bytes = zlib.compress(current, 1)
+            self._file.write(FRAME.pack(FRAME_KEY, timestamp, width, height, len(payload)))
+            self._file.write(payload)
+            self._since_keyframe = 0
+            self.keyframes += 1
+        else:
+            previous: bytes | bytearray = self._previous[1]  # pyright: ignore[reportOptionalSubscript]
+            tiles: list[int] = changed_tiles(previous, current, width, height, self.tile_size)
+            compressor = zlib.compressobj(1)
+            chunks: list[bytes] = [COUNT.pack(len(tiles)), struct.pack(f"<{len(tiles)}I", *tiles)]
+            pixels: list[bytes] = [
+                compressor.compress(current[row])
+                for tile_no in tiles
+                for row in _tile_rows(width, height, self.tile_size, tile_no)
+            ]
+            chunks.extend(pixels)
+            chunks.append(compressor.flush())
+            payload_len: int = sum(len(chunk) for chunk in chunks)
+            self._file.write(FRAME.pack(FRAME_DELTA, timestamp, width, height, payload_len))
+            self._file.writelines(chunks)
+            self._since_keyframe += 1
+            logger.debug(f"Tile frame {self.frames}: {len(tiles)} tile(s) changed")
+
+        self._previous = (size, data)
+        self.frames += 1
+
+    def close(self) -> None:
+        """記録待ちのフレームを書き込んでファイルを閉じる（記録に失敗していた場合はOSError）"""
+        with self._lock:
+            self.closed = True
+        self._executor.shutdown(wait=True)
+        self._file.close()
+        logger.info(f"Tile recording '{self.path}' closed ({self.frames} frames, {self.keyframes} keyframes)")
+        if self.error is not None:
+            msg = f"差分記録 '{self.path}' の書き込みに失敗しました ({self.error})"
+            raise OSError(msg) from self.error
+
+
+class TileReader:
+    """差分（タイル）記録の読み込み"""
+
+    def __init__(self, path: Path) -> None:
+        self._file = path.open("rb")
+        magic, self.tile_size = HEADER.unpack(self._file.read(HEADER.size))
+        if magic != MAGIC:
+            self._file.close()
+            msg = f"'{path}' is not a tile recording."
+            raise ValueError(msg)
+
+        # フレーム毎の（種別, 時刻, 幅, 高さ, データ位置, データ長）
+        self.frames: list[tuple[int, float, int, int, int, int]] = []
+        while len(header := self._file.read(FRAME.size)) == FRAME.size:
+            kind, timestamp, width, height, length = FRAME.unpack(header)
+            self.frames.append((kind, timestamp, width, height, self._file.tell(), length))
+            self._file.seek(length, 1)
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def _read_payload(self, frame_no: int) -> bytes:
+        *_, offset, length = self.frames[frame_no]
+        self._file.seek(offset)
+        return self._file.read(length)
+
+    def frame(self, frame_no: int) -> tuple[tuple[int, int], bytearray]:
+        """指定フレームを復元する（直前のキーフレームから差分を適用する）
+
+        Returns:
+            (画像サイズ, BGRA画素データ)
+
+        """
+        key_no: int = frame_no
+        while self.frames[key_no][0] != FRAME_KEY:
+            key_no -= 1
+
+        _kind, _timestamp, width, height, *_ = self.frames[key_no]
+        pixels = bytearray(zlib.decompress(self._read_payload(key_no)))
+        for n in range(key_no + 1, frame_no + 1):
+            payload: bytes = self._read_payload(n)
+            (count,) = COUNT.unpack_from(payload, 0)
+            tiles = struct.unpack_from(f"<{count}I", payload, COUNT.size)
+            data: bytes = zlib.decompress(payload[COUNT.size + count * 4 :])
+            pos: int = 0
+            for tile_no in tiles:
+                for row in _tile_rows(width, height, self.tile_size, tile_no):
+                    length: int = row.stop - row.start
+                    pixels[row] = data[pos : pos + length]
+                    pos += length
+
+        return ((width, height), pixels)
+
+    def frame_image(self, frame_no: int) -> Image.Image:
+        size, pixels = self.frame(frame_no)
+        return Image.frombytes("RGB", size, bytes(pixels), "raw", "BGRX")
+
+    def close(self) -> None:
+        self._file.close()
@@ -0,0 +1,315 @@
+"""video_recorder.py
+
+定期実行キャプチャーの動画（Motion JPEG / AVI）記録
+
+* フレーム毎にJPEGへエンコードし、1つのAVIファイルへ追記する（1回の実行で1ファイル）
+* 一定フレーム毎にヘッダー（フレーム数、各サイズ）を更新してフラッシュする（異常終了しても途中まで再生できる）
+* AVI 1.0の制限（ファイルサイズ）に近づいたら、または画面サイズが変わったら次のファイル（_001, _002, ...）に切り替える
+* ファイル構成
+    RIFF 'AVI '
+        LIST 'hdrl'
+            'avih' メインヘッダー
+            LIST 'strl'
+                'strh' ストリームヘッダー（vids/MJPG）
+                'strf' BITMAPINFOHEADER
+        LIST 'movi'
+            '00dc' JPEGデータ ...
+        'idx1' インデックス（ファイルを閉じる時に書き込む）
+
+"""
+
+import io
+import logging
+import struct
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO
+
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+AVIH = struct.Struct("<14I")
+STRH = struct.Struct("<4s4sIHHIIIIIIII4h")
+STRF = struct.Struct("<IiiHHIIiiII")
+INDEX_ENTRY = struct.Struct("<4sIII")
+AVIF_HASINDEX: int = 0x00000010
+AVIIF_KEYFRAME: int = 0x00000010
+FOURCC_MJPG: int = int.from_bytes(b"MJPG", "little")
+
+
+class AviWriter:
+    """Motion JPEG（AVI 1.0）の書き込み"""
+
+    # ファイルサイズの上限（AVI 1.0の互換性を保てる範囲）
+    MAX_FILE_SIZE: int = 1 << 30
+
+    def __init__(self, path: Path, size: tuple[int, int], frame_ms: int) -> None:
+        """初期処理
+
+        Args:
+            path(pathlib.Path): 出力ファイル
+            size(tuple): 画像サイズ(幅, 高さ)
+            frame_ms(int): フレーム間隔（ミリ秒）
+
+        Returns:
+            none
+
+        """
+        self.path = path
+        self.size = size
+        self.frame_ms: int = max(1, frame_ms)
+        self.frames: int = 0
+        self._index: list[tuple[int, int]] = []
+        self._max_frame: int = 0
+        self._file: BinaryIO = path.open("wb")
+        self._write_headers()
+
+    def _chunk(self, fourcc: bytes, data: bytes) -> None:
+        self._file.write(struct.pack("<4sI", fourcc, len(data)))
+        self._file.write(data)
+        if len(data) % 2:
+            self._file.write(b"\0")
+
+    def _begin_list(self, kind: bytes, fourcc: bytes) -> int:
+        """LIST（RIFF）の開始（サイズは後で書き込む）、サイズの位置を返す"""
+        self._file.write(kind)
+        pos: int = self._file.tell()
+        self._file.write(struct.pack("<I4s", 0, fourcc))
+        return pos
+
+    def _write_headers(self) -> None:
+        width, height = self.size
+        self._riff_pos: int = self._begin_list(b"RIFF", b"AVI ")
+        hdrl_pos: int = self._begin_list(b"LIST", b"hdrl")
+        self._avih_pos: int = self._file.tell() + 8
+        self._chunk(b"avih", self._avih())
+        strl_pos: int = self._begin_list(b"LIST", b"strl")
+        self._strh_pos: int = self._file.tell() + 8
+        self._chunk(b"strh", self._strh())
+        bitmap = STRF.pack(STRF.size, width, height, 1, 24, FOURCC_MJPG, width * height * 3, 0, 0, 0, 0)
+        self._chunk(b"strf", bitmap)
+        self._patch_size(strl_pos)
+        self._patch_size(hdrl_pos)
+        self._movi_pos: int = self._begin_list(b"LIST", b"movi")
+        # idx1のオフセットは'movi'の位置からの相対値
+        self._movi_base: int = self._movi_pos + 4
+
+    def _avih(self) -> bytes:
+        width, height = self.size
+        return AVIH.pack(
+            self.frame_ms * 1000,
+            self._max_frame * 1000 // self.frame_ms,
+            0,
+            AVIF_HASINDEX,
+            self.frames,
+            0,
+            1,
+            self._max_frame,
+            width,
+            height,
+            0,
+            0,
+            0,
+            0,
+        )
+
+    def _strh(self) -> bytes:
+        width, height = self.size
+        return STRH.pack(
+            b"vids",
+            b"MJPG",
+            0,
+            0,
+            0,
+            0,
+            self.frame_ms,
+            1000,
+            0,
+            self.frames,
+            self._max_frame,
+            0xFFFFFFFF,
+            0,
+            0,
+            0,
+            width,
+            height,
+        )
+
+    def _patch_size(self, pos: int, end: int | None = None) -> None:
+        """LIST（RIFF）のサイズを書き込む"""
+        end = self._file.tell() if end is None else end
+        current: int = self._file.tell()
+        self._file.seek(pos)
+        self._file.write(struct.pack("<I", end - pos - 4))
+        self._file.seek(current)
+
+    @property
+    def file_size(self) -> int:
+        return self._file.tell()
+
+    def write_frame(self, jpeg: bytes) -> None:
+        """JPEGデータを1フレームとして追記する"""
+        self._index.append((self._file.tell() - self._movi_base, len(jpeg)))
+        self._chunk(b"00dc", jpeg)
+        self.frames += 1
+        self._max_frame = max(self._max_frame, len(jpeg))
+
+    def _update_headers(self) -> None:
+        """RIFFのサイズ、フレーム数等を現在の状態で書き直す"""
+        end: int = self._file.tell()
+        self._patch_size(self._riff_pos, end)
+        self._file.seek(self._avih_pos)
+        self._file.write(self._avih())
+        self._file.seek(self._strh_pos)
+        self._file.write(self._strh())
+        self._file.seek(end)
+
+    def flush(self) -> None:
+        """ヘッダーを現在のフレーム数で更新してフラッシュする（idx1無しでも再生できる状態にする）"""
+        self._patch_size(self._movi_pos)
+        self._update_headers()
+        self._file.flush()
+
+    def close(self) -> None:
+        """インデックスを書き込んでファイルを閉じる"""
+        self._patch_size(self._movi_pos)
+        index = b"".join(INDEX_ENTRY.pack(b"00dc", AVIIF_KEYFRAME, offset, size) for offset, size in self._index)
+        self._chunk(b"idx1", index)
+        self._update_headers()
+        self._file.close()
+
+
+class VideoRecorder:
+    """動画（Motion JPEG / AVI）記録"""
+
+    # 記録待ちフレームの上限
+    MAX_PENDING: int = 2
+    # ヘッダーを更新してフラッシュする間隔（フレーム数）
+    FLUSH_FRAMES: int = 10
+    # 拡張子
+    EXTENSION: str = ".avi"
+
+    def __init__(
+        self,
+        path: Path,
+        frame_ms: int,
+        quality: int = 80,
+        on_error: Callable[[BaseException], None] | None = None,
+    ) -> None:
+        """初期処理（最初の出力ファイルを作成して書き込めることを確認する、失敗時はOSError）
+
+        Args:
+            path(pathlib.Path): 出力ファイル（切り替え時は「_001」等を付ける）
+            frame_ms(int): フレーム間隔（ミリ秒、再生速度）
+            quality(int): JPEGの品質
+            on_error: 記録の失敗時に1回だけ呼ばれる処理（記録スレッドで呼ばれる）
+
+        Returns:
+            none
+
+        """
+        # 画像サイズは最初のフレームまで分からないので、空のファイルを作成しておく（最初のフレームで上書きする）
+        path.open("wb").close()
+        self.path = path
+        self.frame_ms: int = frame_ms
+        self.quality: int = quality
+        self._writer: AviWriter | None = None
+        self._parts: int = 0
+        self.frames: int = 0
+        self.files: list[Path] = []
+        # エンコード、書き込みは記録順を保つため1スレッドで行う
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="video_recorder")
+        self._pending = threading.BoundedSemaphore(VideoRecorder.MAX_PENDING)
+        # 記録の失敗（以降のフレームは記録しない）
+        self._on_error = on_error
+        self.error: BaseException | None = None
+        # 閉じた後に届いたフレーム（停止を待ち切れなかった定期実行の処理）は記録しない
+        self._lock = threading.Lock()
+        self.closed: bool = False
+
+    def add_frame(self, size: tuple[int, int], data: bytes | bytearray) -> None:
+        """フレームの追加（記録は専用スレッドで行う、閉じた後は無視する）
+
+        Args:
+            size(tuple): 画像サイズ(幅, 高さ)
+            data: BGRA画素データ（記録が終わるまで変更しないこと）
+
+        Returns:
+            none
+
+        """
+        with self._lock:
+            if self.closed:
+                logger.debug(f"Video recording '{self.path}' is closed, frame ignored")
+                return
+            if self.error is not None:
+                return
+
+            self._pending.acquire()
+            future = self._executor.submit(self._write_frame, size, data)
+        future.add_done_callback(self._on_written)
+
+    def _on_written(self, future: Future) -> None:
+        """フレームの記録完了（記録スレッドから呼ばれる）、最初の失敗を記録して通知する"""
+        self._pending.release()
+        if (error := future.exception()) is None or self.error is not None:
+            return
+
+        self.error = error
+        logger.error(f"Video recording '{self.path}' failed ({error!r})")
+        if self._on_error is not None:
+            self._on_error(error)
+
+    def _next_path(self) -> Path:
+        path: Path = self.path if self._parts == 0 else self.path.with_stem(f"{self.path.stem}_{self._parts:03}")
+        self._parts += 1
+        return path
+
+    def _write_frame(self, size: tuple[int, int], data: bytes | bytearray) -> None:
+        with io.BytesIO() as output:
+            Image.frombytes("RGB", size, data, "raw", "BGRX").save(output, "JPEG", quality=self.quality)
+            jpeg: bytes = output.getvalue()
+
+        writer: AviWriter | None = self._writer
+        if writer is not None and (writer.size != size or writer.file_size + len(jpeg) > AviWriter.MAX_FILE_SIZE):
+            # 画面サイズの変更、ファイルサイズの上限で次のファイルへ
+            writer.close()
+            writer = None
+        if writer is None:
+            writer = AviWriter(self._next_path(), size, self.frame_ms)
+            self._writer = writer
+            self.files.append(writer.path)
+            logger.debug(f"Video recording '{writer.path}' started ({size[0]}x{size[1]})")
+
+        writer.write_frame(jpeg)
+        self.frames += 1
+        if writer.frames % VideoRecorder.FLUSH_FRAMES == 0:
+            writer.flush()
+
+    def close(self) -> None:
+        """記録待ちのフレームを書き込んでファイルを閉じる（記録に失敗していた場合はOSError）
+
+        * 失敗していてもインデックスとヘッダーの書き込みを試みる（書き込めたフレームまでは再生できる）
+
+        """
+        with self._lock:
+            self.closed = True
+        self._executor.shutdown(wait=True)
+        if self._writer is not None:
+            try:
+                self._writer.close()
+            except OSError as e:
+                if self.error is None:
+                    self.error = e
+                logger.exception(f"Video recording '{self._writer.path}' can not be finalized")
+            self._writer = None
+        if not self.files:
+            # フレームが無ければ作成しておいた空のファイルを削除する
+            self.path.unlink(missing_ok=True)
+        logger.info(f"Video recording '{self.path}' closed ({self.frames} frames, {len(self.files)} file(s))")
+        if self.error is not None:
+            msg = f"動画記録 '{self.path}' の書き込みに失敗しました ({self.error})"
+            raise OSError(msg) from self.error
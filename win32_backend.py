@@ -0,0 +1,49 @@
+import logging
+
+import win32api
+import win32clipboard
+import win32gui
+
+from capture_backend import MssBackend
+from window_tracker import WindowTracker
+
+logger = logging.getLogger(__name__)
+
+
+class Win32Backend(MssBackend):
+    """Windows用バックエンド（画面の取得はmss、アクティブウィンドウとクリップボードはWin32 API）"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        # アクティブウィンドウキャプチャー用のウィンドウ一覧
+        self.window_tracker = WindowTracker()
+
+    def _display_layout(self) -> tuple:
+        return tuple(tuple(rect) for _hmon, _hdc, rect in win32api.EnumDisplayMonitors())
+
+    def active_window(self) -> tuple[str, dict] | None:
+        if (hwnd := self.window_tracker.active_window()) is None:
+            return None
+
+        window_title: str = win32gui.GetWindowText(hwnd)
+        left, top, right, bottom = win32gui.GetWindowRect(hwnd)
+        width: int = abs(right - left)
+        height: int = abs(bottom - top)
+        area: dict = {"left": left, "top": top, "width": width, "height": height}
+
+        return (window_title, area)
+
+    def set_clipboard_dib(self, data: bytes | bytearray) -> None:
+        win32clipboard.OpenClipboard()
+        try:
+            win32clipboard.EmptyClipboard()
+            win32clipboard.SetClipboardData(win32clipboard.CF_DIB, data)
+        finally:
+            win32clipboard.CloseClipboard()
+
+    def start(self) -> None:
+        """ウィンドウイベントの追跡開始（UIスレッドで呼ぶこと）"""
+        self.window_tracker.start()
+
+    def stop(self) -> None:
+        self.window_tracker.stop()
@@ -0,0 +1,249 @@
+"""window_tracker.py
+
+アクティブウィンドウキャプチャー向けのウィンドウ一覧の追跡
+
+* キャプチャー対象となるトップレベルウィンドウのハンドルをZオーダー順（手前から）にキャッシュする
+* ウィンドウイベント（SetWinEventHook）でキャッシュを差分更新し、キャプチャー毎のEnumWindowsを不要にする
+* イベントフックはメッセージループのあるスレッド（wxのUIスレッド）で開始すること
+
+"""
+
+import ctypes
+import ctypes.wintypes
+import logging
+import os
+import threading
+
+import win32gui
+
+logger = logging.getLogger(__name__)
+
+# 対象外とするウィンドウクラス名（部分一致）
+EXCLUDE_CLASSES: tuple[str, ...] = ("QToolTip", "QPopup", "QWindowPopup", "QWindowToolTip")
+
+# WinEventのイベント種別
+EVENT_SYSTEM_FOREGROUND: int = 0x0003
+EVENT_SYSTEM_MINIMIZESTART: int = 0x0016
+EVENT_SYSTEM_MINIMIZEEND: int = 0x0017
+EVENT_OBJECT_CREATE: int = 0x8000
+EVENT_OBJECT_DESTROY: int = 0x8001
+EVENT_OBJECT_SHOW: int = 0x8002
+EVENT_OBJECT_HIDE: int = 0x8003
+EVENT_OBJECT_NAMECHANGE: int = 0x800C
+OBJID_WINDOW: int = 0
+CHILDID_SELF: int = 0
+WINEVENT_OUTOFCONTEXT: int = 0x0000
+WINEVENT_SKIPOWNPROCESS: int = 0x0002
+GA_ROOT: int = 2
+
+# 追跡するイベント（対象の追加・手前への移動、削除、再判定）
+_EVENTS_RAISE: frozenset[int] = frozenset({EVENT_SYSTEM_FOREGROUND})
+_EVENTS_REMOVE: frozenset[int] = frozenset({EVENT_OBJECT_DESTROY, EVENT_OBJECT_HIDE, EVENT_SYSTEM_MINIMIZESTART})
+_EVENTS_UPDATE: frozenset[int] = frozenset(
+    {EVENT_OBJECT_CREATE, EVENT_OBJECT_SHOW, EVENT_OBJECT_NAMECHANGE, EVENT_SYSTEM_MINIMIZEEND},
+)
+
+WINEVENTPROC = ctypes.WINFUNCTYPE(
+    None,
+    ctypes.wintypes.HANDLE,
+    ctypes.wintypes.DWORD,
+    ctypes.wintypes.HWND,
+    ctypes.wintypes.LONG,
+    ctypes.wintypes.LONG,
+    ctypes.wintypes.DWORD,
+    ctypes.wintypes.DWORD,
+)
+
+# 他のモジュールのctypes設定と干渉しないよう、専用のインスタンスで型を宣言する
+_user32 = ctypes.WinDLL("user32", use_last_error=True)
+_user32.SetWinEventHook.argtypes = (
+    ctypes.wintypes.DWORD,
+    ctypes.wintypes.DWORD,
+    ctypes.wintypes.HMODULE,
+    WINEVENTPROC,
+    ctypes.wintypes.DWORD,
+    ctypes.wintypes.DWORD,
+    ctypes.wintypes.DWORD,
+)
+_user32.SetWinEventHook.restype = ctypes.wintypes.HANDLE
+_user32.UnhookWinEvent.argtypes = (ctypes.wintypes.HANDLE,)
+_user32.UnhookWinEvent.restype = ctypes.wintypes.BOOL
+_user32.GetAncestor.argtypes = (ctypes.wintypes.HWND, ctypes.wintypes.UINT)
+_user32.GetAncestor.restype = ctypes.wintypes.HWND
+_user32.GetForegroundWindow.argtypes = ()
+_user32.GetForegroundWindow.restype = ctypes.wintypes.HWND
+_user32.GetWindowThreadProcessId.argtypes = (ctypes.wintypes.HWND, ctypes.POINTER(ctypes.wintypes.DWORD))
+_user32.GetWindowThreadProcessId.restype = ctypes.wintypes.DWORD
+
+# 自プロセスのID
+_OWN_PID: int = os.getpid()
+
+
+def _window_pid(hwnd: int) -> int:
+    pid = ctypes.wintypes.DWORD()
+    _user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+    return pid.value
+
+
+def is_capture_candidate(hwnd: int) -> bool:
+    """キャプチャー対象のウィンドウか判定する（他プロセス、有効、表示中、最小化されていない、タイトルあり、ポップアップ以外）"""
+    # 判定は記述順に行う（自プロセスのウィンドウ（ダイアログ等）はGetWindowTextより先に除く、
+    # GetWindowTextがUIスレッドへのメッセージ送信になり、UIスレッドが待機中だとデッドロックする）
+    if (
+        not win32gui.IsWindow(hwnd)
+        or _window_pid(hwnd) == _OWN_PID
+        or win32gui.IsWindowEnabled(hwnd) == 0
+        or win32gui.IsWindowVisible(hwnd) == 0
+        or win32gui.IsIconic(hwnd) != 0
+        or win32gui.GetWindowText(hwnd) == ""
+    ):
+        return False
+
+    class_name = win32gui.GetClassName(hwnd)
+    return class_name is not None and not any(x in class_name for x in EXCLUDE_CLASSES)
+
+
+class WindowTracker:
+    """キャプチャー対象ウィンドウの追跡"""
+
+    def __init__(self) -> None:
+        # キャプチャー対象のウィンドウハンドル（Zオーダー順、先頭が最前面）
+        self._windows: list[int] = []
+        self._valid: bool = False
+        # ウィンドウイベントの通番（ロックの外での列挙中に届いたイベントを検出する）
+        self._generation: int = 0
+        # キャッシュの排他（user32の呼び出しはロックの外で行い、UIスレッドのイベント処理を待たせない）
+        self._lock = threading.Lock()
+        self._hooks: list[int] = []
+        # ctypesのコールバックはGCされないよう保持する
+        self._proc = WINEVENTPROC(self._on_win_event)
+
+    @property
+    def hooked(self) -> bool:
+        return bool(self._hooks)
+
+    def start(self) -> None:
+        """ウィンドウイベントの追跡開始（UIスレッドで呼ぶこと）"""
+        if self._hooks:
+            return
+
+        for event in sorted(_EVENTS_RAISE | _EVENTS_REMOVE | _EVENTS_UPDATE):
+            hook: int | None = _user32.SetWinEventHook(
+                event,
+                event,
+                None,
+                self._proc,
+                0,
+                0,
+                WINEVENT_OUTOFCONTEXT | WINEVENT_SKIPOWNPROCESS,
+            )
+            if hook:
+                self._hooks.append(hook)
+            else:
+                logger.warning(f"SetWinEventHook(0x{event:04X}) failed")
+
+        if len(self._hooks) != len(_EVENTS_RAISE | _EVENTS_REMOVE | _EVENTS_UPDATE):
+            # 一部でもフックできなければ、キャッシュを使わず毎回列挙する
+            self.stop()
+            return
+
+        self.invalidate()
+        logger.debug("Window tracker started")
+
+    def stop(self) -> None:
+        """ウィンドウイベントの追跡終了"""
+        for hook in self._hooks:
+            _user32.UnhookWinEvent(hook)
+        self._hooks.clear()
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """次回参照時にウィンドウ一覧を列挙し直させる"""
+        with self._lock:
+            self._valid = False
+            self._generation += 1
+
+    def _enumerate(self) -> list[int]:
+        """トップレベルウィンドウを列挙してキャッシュを作り直す（EnumWindowsはZオーダー順、列挙はロックの外で行う）
+
+        * 列挙中にウィンドウイベントが届いていたら、結果はキャッシュせずに次回参照時に列挙し直す（イベントの反映を失わない）
+
+        """
+        with self._lock:
+            generation: int = self._generation
+        windows: list[int] = []
+
+        def callback(hwnd: int, _lparam: int) -> None:
+            if is_capture_candidate(hwnd):
+                windows.append(hwnd)
+
+        win32gui.EnumWindows(callback, 0)
+        with self._lock:
+            if self._generation == generation:
+                self._windows = list(windows)
+                # イベントで追跡していない場合は毎回列挙する
+                self._valid = self.hooked
+            else:
+                self._valid = False
+        logger.debug(f"Window list enumerated ({len(windows)} windows)")
+        return windows
+
+    def _on_win_event(
+        self,
+        _hook: int,
+        event: int,
+        hwnd: int | None,
+        id_object: int,
+        id_child: int,
+        _thread_id: int,
+        _time: int,
+    ) -> None:
+        """ウィンドウイベントのコールバック（UIスレッドのメッセージループから呼ばれる）"""
+        if not hwnd or id_object != OBJID_WINDOW or id_child != CHILDID_SELF:
+            return
+
+        if event not in _EVENTS_REMOVE and _user32.GetAncestor(hwnd, GA_ROOT) != hwnd:
+            return
+
+        candidate: bool = event not in _EVENTS_REMOVE and is_capture_candidate(hwnd)
+        with self._lock:
+            self._generation += 1
+            if not self._valid:
+                return
+
+            present: bool = hwnd in self._windows
+            if not candidate:
+                if present:
+                    self._windows.remove(hwnd)
+            elif event in _EVENTS_RAISE or (not present and _user32.GetForegroundWindow() == hwnd):
+                # 前面化したウィンドウは最前面へ
+                if present:
+                    self._windows.remove(hwnd)
+                self._windows.insert(0, hwnd)
+            elif not present:
+                # 背面で新たに対象になったウィンドウは位置が分からないので、次回参照時に列挙し直す
+                self._valid = False
+
+    def active_window(self) -> int | None:
+        """最前面のキャプチャー対象ウィンドウのハンドルを返す（無ければNone）
+
+        * キャッシュはロック内で複製し、判定（user32の呼び出し）はロックの外で行う
+
+        """
+        with self._lock:
+            windows: list[int] | None = list(self._windows) if self._valid else None
+        if windows is None:
+            windows = self._enumerate()
+            return windows[0] if windows else None
+
+        # 取りこぼしたイベントがあっても、無効になったウィンドウは参照時に除く
+        for hwnd in windows:
+            if is_capture_candidate(hwnd):
+                return hwnd
+            with self._lock:
+                if hwnd in self._windows:
+                    self._windows.remove(hwnd)
+
+        # キャッシュが空になった場合は、列挙し直して確認する
+        windows = self._enumerate()
+        return windows[0] if windows else None
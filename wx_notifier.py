@@ -0,0 +1,55 @@
+"""wx_notifier.py
+
+wxPythonによるキャプチャーの完了通知（UIスレッドへの受け渡し、サウンド）
+
+"""
+
+import importlib
+import zlib
+from collections.abc import Callable
+
+import wx
+from wx.adv import Sound
+
+from capture_notifier import CaptureNotifier
+
+
+class WxNotifier(CaptureNotifier):
+    """wxPythonによるキャプチャーの完了通知"""
+
+    def __init__(self) -> None:
+        # サウンド（初回再生時にデコードする）
+        self._sounds: dict[str, Sound] = {}
+
+    def call_after(self, func: Callable[..., object], *args: object) -> None:
+        """UIスレッドでの実行（wx.CallAfter、どのスレッドからでも呼べる）"""
+        wx.CallAfter(func, *args)
+
+    def _get_sound(self, name: str) -> Sound:
+        """サウンドの取得
+
+        * 初回のみリソースモジュールを読み込んでデコードし、以降はキャッシュを返す
+
+        Args:
+            name(str): リソース名
+
+        Returns:
+            Soundオブジェクト
+
+        """
+        if (snd := self._sounds.get(name)) is None:
+            # サウンドを使わない場合に読み込まないよう、ここで初めてimportする
+            res_sound = importlib.import_module("res.sound")
+            snd = Sound()
+            snd.CreateFromData(zlib.decompress(getattr(res_sound, f"get_{name}_compressed")()))
+            self._sounds[name] = snd
+
+        return snd
+
+    def success(self) -> None:
+        """成功時サウンド"""
+        self._get_sound("snd_success").Play()
+
+    def beep(self) -> None:
+        """エラー時サウンド"""
+        self._get_sound("snd_beep").Play()